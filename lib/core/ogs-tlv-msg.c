@@ -20,38 +20,38 @@
 
 #include "ogs-core.h"
 
-ogs_tlv_desc_t ogs_tlv_desc_more1 = {
-    OGS_TLV_MORE, "More", 0, 1, 0, 0, { NULL } };
-ogs_tlv_desc_t ogs_tlv_desc_more2 = {
-    OGS_TLV_MORE, "More", 0, 2, 0, 0, { NULL } };
-ogs_tlv_desc_t ogs_tlv_desc_more3 = {
-    OGS_TLV_MORE, "More", 0, 3, 0, 0, { NULL } };
-ogs_tlv_desc_t ogs_tlv_desc_more4 = {
-    OGS_TLV_MORE, "More", 0, 4, 0, 0, { NULL } };
-ogs_tlv_desc_t ogs_tlv_desc_more5 = {
-    OGS_TLV_MORE, "More", 0, 5, 0, 0, { NULL } };
-ogs_tlv_desc_t ogs_tlv_desc_more6 = {
-    OGS_TLV_MORE, "More", 0, 6, 0, 0, { NULL } };
-ogs_tlv_desc_t ogs_tlv_desc_more7 = {
-    OGS_TLV_MORE, "More", 0, 7, 0, 0, { NULL } };
-ogs_tlv_desc_t ogs_tlv_desc_more8 = {
-    OGS_TLV_MORE, "More", 0, 8, 0, 0, { NULL } };
-ogs_tlv_desc_t ogs_tlv_desc_more9 = {
-    OGS_TLV_MORE, "More", 0, 9, 0, 0, { NULL } };
-ogs_tlv_desc_t ogs_tlv_desc_more10 = {
-    OGS_TLV_MORE, "More", 0, 10, 0, 0, { NULL } };
-ogs_tlv_desc_t ogs_tlv_desc_more11 = {
-    OGS_TLV_MORE, "More", 0, 11, 0, 0, { NULL } };
-ogs_tlv_desc_t ogs_tlv_desc_more12 = {
-    OGS_TLV_MORE, "More", 0, 12, 0, 0, { NULL } };
-ogs_tlv_desc_t ogs_tlv_desc_more13 = {
-    OGS_TLV_MORE, "More", 0, 13, 0, 0, { NULL } };
-ogs_tlv_desc_t ogs_tlv_desc_more14 = {
-    OGS_TLV_MORE, "More", 0, 14, 0, 0, { NULL } };
-ogs_tlv_desc_t ogs_tlv_desc_more15 = {
-    OGS_TLV_MORE, "More", 0, 15, 0, 0, { NULL } };
-ogs_tlv_desc_t ogs_tlv_desc_more16 = {
-    OGS_TLV_MORE, "More", 0, 16, 0, 0, { NULL } };
+const ogs_tlv_desc_t ogs_tlv_desc_more1 = {
+    OGS_TLV_MORE, "More", 0, 1, 0, 0, { NULL }, NULL, NULL };
+const ogs_tlv_desc_t ogs_tlv_desc_more2 = {
+    OGS_TLV_MORE, "More", 0, 2, 0, 0, { NULL }, NULL, NULL };
+const ogs_tlv_desc_t ogs_tlv_desc_more3 = {
+    OGS_TLV_MORE, "More", 0, 3, 0, 0, { NULL }, NULL, NULL };
+const ogs_tlv_desc_t ogs_tlv_desc_more4 = {
+    OGS_TLV_MORE, "More", 0, 4, 0, 0, { NULL }, NULL, NULL };
+const ogs_tlv_desc_t ogs_tlv_desc_more5 = {
+    OGS_TLV_MORE, "More", 0, 5, 0, 0, { NULL }, NULL, NULL };
+const ogs_tlv_desc_t ogs_tlv_desc_more6 = {
+    OGS_TLV_MORE, "More", 0, 6, 0, 0, { NULL }, NULL, NULL };
+const ogs_tlv_desc_t ogs_tlv_desc_more7 = {
+    OGS_TLV_MORE, "More", 0, 7, 0, 0, { NULL }, NULL, NULL };
+const ogs_tlv_desc_t ogs_tlv_desc_more8 = {
+    OGS_TLV_MORE, "More", 0, 8, 0, 0, { NULL }, NULL, NULL };
+const ogs_tlv_desc_t ogs_tlv_desc_more9 = {
+    OGS_TLV_MORE, "More", 0, 9, 0, 0, { NULL }, NULL, NULL };
+const ogs_tlv_desc_t ogs_tlv_desc_more10 = {
+    OGS_TLV_MORE, "More", 0, 10, 0, 0, { NULL }, NULL, NULL };
+const ogs_tlv_desc_t ogs_tlv_desc_more11 = {
+    OGS_TLV_MORE, "More", 0, 11, 0, 0, { NULL }, NULL, NULL };
+const ogs_tlv_desc_t ogs_tlv_desc_more12 = {
+    OGS_TLV_MORE, "More", 0, 12, 0, 0, { NULL }, NULL, NULL };
+const ogs_tlv_desc_t ogs_tlv_desc_more13 = {
+    OGS_TLV_MORE, "More", 0, 13, 0, 0, { NULL }, NULL, NULL };
+const ogs_tlv_desc_t ogs_tlv_desc_more14 = {
+    OGS_TLV_MORE, "More", 0, 14, 0, 0, { NULL }, NULL, NULL };
+const ogs_tlv_desc_t ogs_tlv_desc_more15 = {
+    OGS_TLV_MORE, "More", 0, 15, 0, 0, { NULL }, NULL, NULL };
+const ogs_tlv_desc_t ogs_tlv_desc_more16 = {
+    OGS_TLV_MORE, "More", 0, 16, 0, 0, { NULL }, NULL, NULL };
 
 /* Return specific TLV mode based on its TLV description type and the msg
  * provided mode (used to know the type length) */
@@ -95,8 +95,20 @@ static uint8_t tlv_ctype2mode(ogs_tlv_type_e ctype, uint8_t msg_mode)
     }
 }
 
-static ogs_tlv_t *tlv_add_leaf(
-        ogs_tlv_t *parent_tlv, ogs_tlv_t *tlv, ogs_tlv_desc_t *desc, void *msg, uint8_t msg_mode)
+/* Instance of the i-th child of a descriptor */
+static uint8_t tlv_child_instance(const ogs_tlv_desc_t *parent_desc, int i)
+{
+    const ogs_tlv_desc_t *desc = parent_desc->child_descs[i];
+
+    if (parent_desc->child_instance)
+        return parent_desc->child_instance[i];
+
+    return desc->instance;
+}
+
+static ogs_tlv_t *tlv_add_leaf(ogs_tlv_t *parent_tlv, ogs_tlv_t *tlv,
+        const ogs_tlv_desc_t *desc, uint8_t instance, void *msg,
+        uint8_t msg_mode)
 {
     uint8_t tlv_mode = tlv_ctype2mode(desc->ctype, msg_mode);
 
@@ -109,14 +121,14 @@ static ogs_tlv_t *tlv_add_leaf(
         ogs_tlv_uint8_t *v = (ogs_tlv_uint8_t *)msg;
         if (parent_tlv) {
             tlv = ogs_tlv_embed(parent_tlv, tlv_mode,
-                    desc->type, 1, desc->instance, &v->u8);
+                    desc->type, 1, instance, &v->u8);
             if (!tlv) {
                 ogs_error("ogs_tlv_embed()");
                 return NULL;
             }
         } else {
             tlv = ogs_tlv_add(tlv, tlv_mode,
-                    desc->type, 1, desc->instance, &v->u8);
+                    desc->type, 1, instance, &v->u8);
             if (!tlv) {
                 ogs_error("ogs_tlv_add()");
                 return NULL;
@@ -135,14 +147,14 @@ static ogs_tlv_t *tlv_add_leaf(
 
         if (parent_tlv) {
             tlv = ogs_tlv_embed(parent_tlv, tlv_mode,
-                    desc->type, 2, desc->instance, &v->u16);
+                    desc->type, 2, instance, &v->u16);
             if (!tlv) {
                 ogs_error("ogs_tlv_embed()");
                 return NULL;
             }
         } else {
             tlv = ogs_tlv_add(tlv, tlv_mode,
-                    desc->type, 2, desc->instance, &v->u16);
+                    desc->type, 2, instance, &v->u16);
             if (!tlv) {
                 ogs_error("ogs_tlv_add()");
                 return NULL;
@@ -162,14 +174,14 @@ static ogs_tlv_t *tlv_add_leaf(
 
         if (parent_tlv) {
             tlv = ogs_tlv_embed(parent_tlv, tlv_mode,
-                    desc->type, 3, desc->instance, &v->u24);
+                    desc->type, 3, instance, &v->u24);
             if (!tlv) {
                 ogs_error("ogs_tlv_embed()");
                 return NULL;
             }
         } else {
             tlv = ogs_tlv_add(tlv, tlv_mode,
-                    desc->type, 3, desc->instance, &v->u24);
+                    desc->type, 3, instance, &v->u24);
             if (!tlv) {
                 ogs_error("ogs_tlv_add()");
                 return NULL;
@@ -188,14 +200,14 @@ static ogs_tlv_t *tlv_add_leaf(
 
         if (parent_tlv) {
             tlv = ogs_tlv_embed(parent_tlv, tlv_mode,
-                    desc->type, 4, desc->instance, &v->u32);
+                    desc->type, 4, instance, &v->u32);
             if (!tlv) {
                 ogs_error("ogs_tlv_embed()");
                 return NULL;
             }
         } else {
             tlv = ogs_tlv_add(tlv, tlv_mode,
-                    desc->type, 4, desc->instance, &v->u32);
+                    desc->type, 4, instance, &v->u32);
             if (!tlv) {
                 ogs_error("ogs_tlv_add()");
                 return NULL;
@@ -210,14 +222,14 @@ static ogs_tlv_t *tlv_add_leaf(
 
         if (parent_tlv) {
             tlv = ogs_tlv_embed(parent_tlv, tlv_mode,
-                    desc->type, desc->length, desc->instance, v->data);
+                    desc->type, desc->length, instance, v->data);
             if (!tlv) {
                 ogs_error("ogs_tlv_embed()");
                 return NULL;
             }
         } else {
             tlv = ogs_tlv_add(tlv, tlv_mode,
-                    desc->type, desc->length, desc->instance, v->data);
+                    desc->type, desc->length, instance, v->data);
             if (!tlv) {
                 ogs_error("ogs_tlv_add()");
                 return NULL;
@@ -231,20 +243,20 @@ static ogs_tlv_t *tlv_add_leaf(
 
         if (v->len == 0) {
             ogs_error("No TLV length - [%s] T:%d I:%d (vsz=%d)",
-                    desc->name, desc->type, desc->instance, desc->vsize);
+                    desc->name, desc->type, instance, desc->vsize);
             return NULL;
         }
 
         if (parent_tlv) {
             tlv = ogs_tlv_embed(parent_tlv, tlv_mode,
-                    desc->type, v->len, desc->instance, v->data);
+                    desc->type, v->len, instance, v->data);
             if (!tlv) {
                 ogs_error("ogs_tlv_embed()");
                 return NULL;
             }
         } else {
             tlv = ogs_tlv_add(tlv, tlv_mode,
-                    desc->type, v->len, desc->instance, v->data);
+                    desc->type, v->len, instance, v->data);
             if (!tlv) {
                 ogs_error("ogs_tlv_add()");
                 return NULL;
@@ -257,14 +269,14 @@ static ogs_tlv_t *tlv_add_leaf(
     {
         if (parent_tlv) {
             tlv = ogs_tlv_embed(parent_tlv, tlv_mode,
-                    desc->type, 0, desc->instance, NULL);
+                    desc->type, 0, instance, NULL);
             if (!tlv) {
                 ogs_error("ogs_tlv_embed()");
                 return NULL;
             }
         } else {
             tlv = ogs_tlv_add(tlv, tlv_mode,
-                    desc->type, 0, desc->instance, NULL);
+                    desc->type, 0, instance, NULL);
             if (!tlv) {
                 ogs_error("ogs_tlv_add()");
                 return NULL;
@@ -281,13 +293,14 @@ static ogs_tlv_t *tlv_add_leaf(
 }
 
 static uint32_t tlv_add_compound(ogs_tlv_t **root, ogs_tlv_t *parent_tlv,
-        ogs_tlv_desc_t *parent_desc, void *msg, int depth, uint8_t mode)
+        const ogs_tlv_desc_t *parent_desc, void *msg, int depth, uint8_t mode)
 {
     ogs_tlv_presence_t *presence_p;
-    ogs_tlv_desc_t *desc = NULL, *next_desc = NULL;
+    const ogs_tlv_desc_t *desc = NULL, *next_desc = NULL;
     ogs_tlv_t *tlv = NULL, *emb_tlv = NULL;
     uint8_t *p = msg;
     uint32_t offset = 0, count = 0;
+    uint8_t instance;
     int i, j, r;
     char indent[17] = "                "; /* 16 spaces */
 
@@ -302,6 +315,7 @@ static uint32_t tlv_add_compound(ogs_tlv_t **root, ogs_tlv_t *parent_tlv,
 
     for (i = 0, desc = parent_desc->child_descs[i]; desc != NULL;
             i++, desc = parent_desc->child_descs[i]) {
+        instance = tlv_child_instance(parent_desc, i);
         next_desc = parent_desc->child_descs[i+1];
         if (next_desc != NULL && next_desc->ctype == OGS_TLV_MORE) {
             int offset2 = offset;
@@ -313,17 +327,17 @@ static uint32_t tlv_add_compound(ogs_tlv_t **root, ogs_tlv_t *parent_tlv,
 
                 if (desc->ctype == OGS_TLV_COMPOUND) {
                     ogs_trace("BUILD %sC#%d [%s] T:%d I:%d (vsz=%d) off:%p ",
-                            indent, i, desc->name, desc->type, desc->instance,
+                            indent, i, desc->name, desc->type, instance,
                             desc->vsize, p + offset2);
 
                     if (parent_tlv)
                         tlv = ogs_tlv_embed(parent_tlv,
                                 tlv_ctype2mode(desc->ctype, mode),
-                                desc->type, 0, desc->instance, NULL);
+                                desc->type, 0, instance, NULL);
                     else
                         tlv = ogs_tlv_add(tlv,
                                 tlv_ctype2mode(desc->ctype, mode),
-                                desc->type, 0, desc->instance, NULL);
+                                desc->type, 0, instance, NULL);
 
                     r = tlv_add_compound(&emb_tlv, tlv, desc,
                             p + offset2 + sizeof(ogs_tlv_presence_t),
@@ -337,10 +351,10 @@ static uint32_t tlv_add_compound(ogs_tlv_t **root, ogs_tlv_t *parent_tlv,
                     ogs_trace("BUILD %sL#%d [%s] T:%d L:%d I:%d "
                             "(cls:%d vsz:%d) off:%p ",
                             indent, i, desc->name, desc->type, desc->length,
-                            desc->instance, desc->ctype, desc->vsize,
+                            instance, desc->ctype, desc->vsize,
                             p + offset2);
 
-                    tlv = tlv_add_leaf(parent_tlv, tlv, desc,
+                    tlv = tlv_add_leaf(parent_tlv, tlv, desc, instance,
                             p + offset2, mode);
                     if (!tlv) {
                         ogs_error("tlv_add_leaf() failed");
@@ -362,17 +376,17 @@ static uint32_t tlv_add_compound(ogs_tlv_t **root, ogs_tlv_t *parent_tlv,
             if (*presence_p) {
                 if (desc->ctype == OGS_TLV_COMPOUND) {
                     ogs_trace("BUILD %sC#%d [%s] T:%d I:%d (vsz=%d) off:%p ",
-                            indent, i, desc->name, desc->type, desc->instance,
+                            indent, i, desc->name, desc->type, instance,
                             desc->vsize, p + offset);
 
                     if (parent_tlv)
                         tlv = ogs_tlv_embed(parent_tlv,
                                 tlv_ctype2mode(desc->ctype, mode),
-                                desc->type, 0, desc->instance, NULL);
+                                desc->type, 0, instance, NULL);
                     else
                         tlv = ogs_tlv_add(tlv,
                                 tlv_ctype2mode(desc->ctype, mode),
-                                desc->type, 0, desc->instance, NULL);
+                                desc->type, 0, instance, NULL);
 
                     r = tlv_add_compound(&emb_tlv, tlv, desc,
                             p + offset + sizeof(ogs_tlv_presence_t),
@@ -386,10 +400,11 @@ static uint32_t tlv_add_compound(ogs_tlv_t **root, ogs_tlv_t *parent_tlv,
                     ogs_trace("BUILD %sL#%d [%s] T:%d L:%d I:%d "
                             "(cls:%d vsz:%d) off:%p ",
                             indent, i, desc->name, desc->type, desc->length,
-                            desc->instance, desc->ctype, desc->vsize,
+                            instance, desc->ctype, desc->vsize,
                             p + offset);
 
-                    tlv = tlv_add_leaf(parent_tlv, tlv, desc, p + offset, mode);
+                    tlv = tlv_add_leaf(parent_tlv, tlv, desc, instance,
+                            p + offset, mode);
                     if (!tlv) {
                         ogs_error("tlv_add_leaf() failed");
                         return 0;
@@ -407,7 +422,8 @@ static uint32_t tlv_add_compound(ogs_tlv_t **root, ogs_tlv_t *parent_tlv,
     return count;
 }
 
-ogs_pkbuf_t *ogs_tlv_build_msg(ogs_tlv_desc_t *desc, void *msg, int mode)
+ogs_pkbuf_t *ogs_tlv_build_msg(
+        const ogs_tlv_desc_t *desc, void *msg, int mode)
 {
     ogs_tlv_t *root = NULL;
     uint32_t r, length, rendlen;
@@ -451,18 +467,47 @@ ogs_pkbuf_t *ogs_tlv_build_msg(ogs_tlv_desc_t *desc, void *msg, int mode)
     return pkbuf;
 }
 
-static ogs_tlv_desc_t* tlv_find_desc_by_type_inst(uint8_t *desc_index,
-        uint32_t *tlv_offset, ogs_tlv_desc_t *parent_desc, uint16_t match_type, uint8_t match_instance, uint8_t match_type_pos)
+static const ogs_tlv_desc_slot_t *tlv_desc_index_find(
+        const ogs_tlv_desc_index_t *index,
+        uint16_t type, uint8_t instance, uint8_t position)
 {
-    ogs_tlv_desc_t *prev_desc = NULL, *desc = NULL;
+    const ogs_tlv_desc_slot_t *slot;
+    uint32_t hash = OGS_TLV_DESC_HASH(type, instance, position);
+
+    for (slot = &index->slot[hash & index->mask]; slot->child;
+            slot = &index->slot[++hash & index->mask]) {
+        if (slot->type == type && slot->instance == instance &&
+            slot->position == position)
+            return slot;
+    }
+
+    return NULL;
+}
+
+static const ogs_tlv_desc_t* tlv_find_desc_by_type_inst(uint8_t *desc_index,
+        uint32_t *tlv_offset, const ogs_tlv_desc_t *parent_desc, uint16_t match_type, uint8_t match_instance, uint8_t match_type_pos)
+{
+    const ogs_tlv_desc_t *prev_desc = NULL, *desc = NULL;
     int i, offset = 0;
     unsigned match_i = 0;
 
     ogs_assert(parent_desc);
 
+    if (parent_desc->index) {
+        const ogs_tlv_desc_slot_t *slot = tlv_desc_index_find(
+                parent_desc->index, match_type, match_instance, match_type_pos);
+        if (!slot)
+            return NULL;
+
+        *desc_index = slot->child - 1;
+        *tlv_offset = slot->offset;
+        return parent_desc->child_descs[slot->child - 1];
+    }
+
     for (i = 0, desc = parent_desc->child_descs[i]; desc != NULL;
             i++, desc = parent_desc->child_descs[i]) {
-        if (desc->type == match_type && desc->instance == match_instance) {
+        if (desc->type == match_type &&
+            tlv_child_instance(parent_desc, i) == match_instance) {
             if (match_i == match_type_pos) {
                 *desc_index = i;
                 *tlv_offset = offset;
@@ -484,7 +529,8 @@ static ogs_tlv_desc_t* tlv_find_desc_by_type_inst(uint8_t *desc_index,
     return desc;
 }
 
-static int tlv_parse_leaf(void *msg, ogs_tlv_desc_t *desc, ogs_tlv_t *tlv)
+static int tlv_parse_leaf(
+        void *msg, const ogs_tlv_desc_t *desc, ogs_tlv_t *tlv)
 {
     ogs_assert(msg);
     ogs_assert(desc);
@@ -594,64 +640,45 @@ static int tlv_parse_leaf(void *msg, ogs_tlv_desc_t *desc, ogs_tlv_t *tlv)
     return OGS_OK;
 }
 
-/* rbtree structure used to keep track count of TLVs with given <type,instance>
- * while parsing. This is used to link it to the matching nth field in a
- * ogs_tlv_desc_t struct */
-typedef struct tlv_count_node_s {
-    ogs_rbnode_t node;
-    uint32_t key; /* type<<8 + instance */
-    unsigned count;
-} tlv_count_node_t;
-
-static tlv_count_node_t *tlv_count_node_find(ogs_rbtree_t *tree, tlv_count_node_t *count_node_arr, unsigned count_node_arr_len,
-        unsigned *count_alloc_next, uint16_t type, uint8_t instance)
+/* Count of TLVs with given <type,instance> while parsing. This is used to
+ * link it to the matching nth field in a ogs_tlv_desc_t struct. The counter
+ * of a pair is the one given by the index of the parent or, without index,
+ * the position in child_descs[] of the first child with that pair. NULL is
+ * returned if the parent has no such child. */
+static uint8_t *tlv_count_find(uint8_t *count,
+        const ogs_tlv_desc_t *parent_desc, uint16_t type, uint8_t instance)
 {
-    ogs_rbnode_t **new = NULL;
-    ogs_rbnode_t *parent = NULL;
-    tlv_count_node_t *this;
-
-    uint64_t key = (((uint32_t)type)<<8) | instance;
-
-    new = &tree->root;
-    while (*new) {
-        this = ogs_rb_entry(*new, tlv_count_node_t, node);
-        parent = *new;
-        if (key < this->key) {
-            new = &(*new)->left;
-        } else if (key > this->key) {
-            new = &(*new)->right;
-        } else { /* found entry: */
-            return this;
-        }
+    const ogs_tlv_desc_t *desc = NULL;
+    int i;
+
+    if (parent_desc->index) {
+        const ogs_tlv_desc_slot_t *slot = tlv_desc_index_find(
+                parent_desc->index, type, instance, 0);
+        return slot ? &count[slot->counter] : NULL;
     }
 
-    /* No entry, need to add one: */
-    if (*count_alloc_next == count_node_arr_len) {
-        ogs_error("This TLV has to many entries, can't parse");
-        return NULL;
+    for (i = 0, desc = parent_desc->child_descs[i]; desc != NULL;
+            i++, desc = parent_desc->child_descs[i]) {
+        if (desc->type == type &&
+            tlv_child_instance(parent_desc, i) == instance)
+            return &count[i];
     }
-    this = &count_node_arr[(*count_alloc_next)++];
-    this->key = key;
-    this->count = 0;
-    ogs_rbtree_link_node(&this->node, parent, new);
-    ogs_rbtree_insert_color(tree, &this->node);
-    return this;
+
+    return NULL;
 }
 
-static int tlv_parse_compound(void *msg, ogs_tlv_desc_t *parent_desc,
+static int tlv_parse_compound(void *msg, const ogs_tlv_desc_t *parent_desc,
         ogs_tlv_t *parent_tlv, int depth, int mode)
 {
     int rv;
     ogs_tlv_presence_t *presence_p = (ogs_tlv_presence_t *)msg;
-    ogs_tlv_desc_t *desc = NULL, *next_desc = NULL;
+    const ogs_tlv_desc_t *desc = NULL, *next_desc = NULL;
     ogs_tlv_t *tlv = NULL, *emb_tlv = NULL;
     uint8_t *p = msg;
     uint32_t offset = 0;
     uint8_t index = 0;
     int i = 0, j;
-    OGS_RBTREE(tree);
-    tlv_count_node_t count_node[OGS_TLV_MAX_CHILD_DESC];
-    unsigned count_node_alloc_next = 0;
+    uint8_t count[OGS_TLV_MAX_CHILD_DESC];
     char indent[17] = "                "; /* 16 spaces */
 
     ogs_assert(msg);
@@ -661,13 +688,18 @@ static int tlv_parse_compound(void *msg, ogs_tlv_desc_t *parent_desc,
     ogs_assert(depth <= 8);
     indent[depth*2] = 0;
 
+    memset(count, 0, parent_desc->index ?
+            parent_desc->index->counters : sizeof(count));
+
     tlv = parent_tlv;
     while (tlv) {
-        tlv_count_node_t *curr_count = tlv_count_node_find(&tree, &count_node[0],
-                OGS_ARRAY_SIZE(count_node), &count_node_alloc_next, tlv->type, tlv->instance);
-        if (!curr_count)
-            return OGS_ERROR;
-        desc = tlv_find_desc_by_type_inst(&index, &offset, parent_desc, tlv->type, tlv->instance, curr_count->count);
+        uint8_t *curr_count = tlv_count_find(
+                count, parent_desc, tlv->type, tlv->instance);
+        if (curr_count)
+            desc = tlv_find_desc_by_type_inst(&index, &offset, parent_desc,
+                    tlv->type, tlv->instance, *curr_count);
+        else
+            desc = NULL;
         if (desc == NULL) {
             ogs_warn("Unknown TLV type [%d]", tlv->type);
             tlv = tlv->next;
@@ -693,7 +725,7 @@ static int tlv_parse_compound(void *msg, ogs_tlv_desc_t *parent_desc,
                 continue;
             }
         } else {
-            curr_count->count++;
+            (*curr_count)++;
         }
 
         if (desc->ctype == OGS_TLV_COMPOUND) {
@@ -704,7 +736,7 @@ static int tlv_parse_compound(void *msg, ogs_tlv_desc_t *parent_desc,
             }
 
             ogs_trace("PARSE %sC#%d [%s] T:%d I:%d (vsz=%d) off:%p ",
-                    indent, i++, desc->name, desc->type, desc->instance,
+                    indent, i++, desc->name, desc->type, tlv->instance,
                     desc->vsize, p + offset);
 
             offset += sizeof(ogs_tlv_presence_t);
@@ -721,7 +753,7 @@ static int tlv_parse_compound(void *msg, ogs_tlv_desc_t *parent_desc,
             ogs_trace("PARSE %sL#%d [%s] T:%d L:%d I:%d "
                     "(cls:%d vsz:%d) off:%p ",
                     indent, i++, desc->name, desc->type, desc->length,
-                    desc->instance, desc->ctype, desc->vsize, p + offset);
+                    tlv->instance, desc->ctype, desc->vsize, p + offset);
 
             rv = tlv_parse_leaf(p + offset, desc, tlv);
             if (rv != OGS_OK) {
@@ -738,8 +770,8 @@ static int tlv_parse_compound(void *msg, ogs_tlv_desc_t *parent_desc,
     return OGS_OK;
 }
 
-int ogs_tlv_parse_msg(void *msg, ogs_tlv_desc_t *desc, ogs_pkbuf_t *pkbuf,
-        int mode)
+int ogs_tlv_parse_msg(void *msg, const ogs_tlv_desc_t *desc,
+        ogs_pkbuf_t *pkbuf, int mode)
 {
     int rv;
     ogs_tlv_t *root;
@@ -793,7 +825,7 @@ static uint16_t parse_get_element_type(uint8_t *pos, uint8_t mode)
 /* Get TLV element taking into account msg_mode (to know TLV tag length) +
  * specific TLV information from "desc" (to know whether the specific IE is TLV
  * or TV, and its expected length in the later case). */
-static uint8_t *tlv_get_element_desc(ogs_tlv_t *tlv, uint8_t *blk, uint8_t msg_mode, ogs_tlv_desc_t *desc)
+static uint8_t *tlv_get_element_desc(ogs_tlv_t *tlv, uint8_t *blk, uint8_t msg_mode, const ogs_tlv_desc_t *desc)
 {
     uint8_t instance;
     unsigned tlv_tag_pos;
@@ -801,7 +833,7 @@ static uint8_t *tlv_get_element_desc(ogs_tlv_t *tlv, uint8_t *blk, uint8_t msg_m
     uint32_t tlv_offset = 0;
     uint16_t tlv_tag;
     uint8_t tlv_mode;
-    static ogs_tlv_desc_t* tlv_desc;
+    static const ogs_tlv_desc_t* tlv_desc;
 
     tlv_tag = parse_get_element_type(blk, msg_mode);
     instance = 0;  /* TODO: support instance != 0 if ever really needed by looking it up in pos */
@@ -819,7 +851,7 @@ static uint8_t *tlv_get_element_desc(ogs_tlv_t *tlv, uint8_t *blk, uint8_t msg_m
 }
 
 /* Similar to ogs_tlv_parse_block(), but taking into account each TLV format from "desc". */
-static ogs_tlv_t *ogs_tlv_parse_block_desc(uint32_t length, void *data, uint8_t msg_mode, ogs_tlv_desc_t *desc)
+static ogs_tlv_t *ogs_tlv_parse_block_desc(uint32_t length, void *data, uint8_t msg_mode, const ogs_tlv_desc_t *desc)
 {
     uint8_t *pos = data;
     uint8_t *blk = data;
@@ -886,8 +918,8 @@ static ogs_tlv_t *ogs_tlv_parse_block_desc(uint32_t length, void *data, uint8_t
 /* Similar to ogs_tlv_parse_msg(), but takes each TLV type from the desc
  * defintion. This allows parsing messages which have different types of TLVs in
  * it (for instance GTPv1-C). */
-int ogs_tlv_parse_msg_desc(
-        void *msg, ogs_tlv_desc_t *desc, ogs_pkbuf_t *pkbuf, int msg_mode)
+int ogs_tlv_parse_msg_desc(void *msg,
+        const ogs_tlv_desc_t *desc, ogs_pkbuf_t *pkbuf, int msg_mode)
 {
     int rv;
     ogs_tlv_t *root;
@@ -65,6 +65,34 @@ typedef enum {
     OGS_TV_MORE,
 } ogs_tlv_type_e;
 
+/*
+ * Index of the children of a compound or message descriptor, generated
+ * along with it. The n-th child with a given type and instance (n being
+ * its position) is in slot OGS_TLV_DESC_HASH() & mask or, if that one is
+ * taken, in one of the following ones. A free slot ends the search.
+ *
+ * The parser counts the TLVs received for each type and instance in a
+ * flat array: 'counter' numbers the pairs found among the children from
+ * 0 to 'counters' - 1.
+ */
+#define OGS_TLV_DESC_HASH(__tYPE, __iNSTANCE, __pOSITION) \
+    ((((uint32_t)(__tYPE) * 31) + (__iNSTANCE)) * 7 + (__pOSITION))
+
+typedef struct ogs_tlv_desc_slot_s {
+    uint16_t type;
+    uint8_t  instance;
+    uint8_t  position;
+    uint8_t  child;     /* index in child_descs[] + 1, 0 if the slot is free */
+    uint8_t  counter;
+    uint32_t offset;    /* of the child in the structure of the parent */
+} ogs_tlv_desc_slot_t;
+
+typedef struct ogs_tlv_desc_index_s {
+    uint32_t mask;      /* number of slots - 1, a power of 2 - 1 */
+    uint8_t  counters;
+    const ogs_tlv_desc_slot_t *slot;
+} ogs_tlv_desc_index_t;
+
 typedef struct ogs_tlv_desc_s {
     ogs_tlv_type_e ctype;
     const char *name;
@@ -72,25 +100,32 @@ typedef struct ogs_tlv_desc_s {
     uint16_t length;
     uint8_t  instance;
     uint16_t vsize;
-    void *child_descs[OGS_TLV_MAX_CHILD_DESC];
+    const void *child_descs[OGS_TLV_MAX_CHILD_DESC];
+    const ogs_tlv_desc_index_t *index; /* NULL: child_descs[] is scanned */
+    /*
+     * Instance of each entry of child_descs[]. With it, the instances of
+     * an IE share one descriptor, whose own instance is not looked at.
+     * NULL: the instance of each child is in its descriptor.
+     */
+    const uint8_t *child_instance;
 } ogs_tlv_desc_t;
 
-extern ogs_tlv_desc_t ogs_tlv_desc_more1;
-extern ogs_tlv_desc_t ogs_tlv_desc_more2;
-extern ogs_tlv_desc_t ogs_tlv_desc_more3;
-extern ogs_tlv_desc_t ogs_tlv_desc_more4;
-extern ogs_tlv_desc_t ogs_tlv_desc_more5;
-extern ogs_tlv_desc_t ogs_tlv_desc_more6;
-extern ogs_tlv_desc_t ogs_tlv_desc_more7;
-extern ogs_tlv_desc_t ogs_tlv_desc_more8;
-extern ogs_tlv_desc_t ogs_tlv_desc_more9;
-extern ogs_tlv_desc_t ogs_tlv_desc_more10;
-extern ogs_tlv_desc_t ogs_tlv_desc_more11;
-extern ogs_tlv_desc_t ogs_tlv_desc_more12;
-extern ogs_tlv_desc_t ogs_tlv_desc_more13;
-extern ogs_tlv_desc_t ogs_tlv_desc_more14;
-extern ogs_tlv_desc_t ogs_tlv_desc_more15;
-extern ogs_tlv_desc_t ogs_tlv_desc_more16;
+extern const ogs_tlv_desc_t ogs_tlv_desc_more1;
+extern const ogs_tlv_desc_t ogs_tlv_desc_more2;
+extern const ogs_tlv_desc_t ogs_tlv_desc_more3;
+extern const ogs_tlv_desc_t ogs_tlv_desc_more4;
+extern const ogs_tlv_desc_t ogs_tlv_desc_more5;
+extern const ogs_tlv_desc_t ogs_tlv_desc_more6;
+extern const ogs_tlv_desc_t ogs_tlv_desc_more7;
+extern const ogs_tlv_desc_t ogs_tlv_desc_more8;
+extern const ogs_tlv_desc_t ogs_tlv_desc_more9;
+extern const ogs_tlv_desc_t ogs_tlv_desc_more10;
+extern const ogs_tlv_desc_t ogs_tlv_desc_more11;
+extern const ogs_tlv_desc_t ogs_tlv_desc_more12;
+extern const ogs_tlv_desc_t ogs_tlv_desc_more13;
+extern const ogs_tlv_desc_t ogs_tlv_desc_more14;
+extern const ogs_tlv_desc_t ogs_tlv_desc_more15;
+extern const ogs_tlv_desc_t ogs_tlv_desc_more16;
 
 typedef uint64_t ogs_tlv_presence_t;
 
@@ -176,11 +211,12 @@ typedef struct ogs_tlv_null_s {
     ogs_tlv_presence_t presence;
 } ogs_tlv_null_t;
 
-ogs_pkbuf_t *ogs_tlv_build_msg(ogs_tlv_desc_t *desc, void *msg, int mode);
+ogs_pkbuf_t *ogs_tlv_build_msg(
+        const ogs_tlv_desc_t *desc, void *msg, int mode);
 int ogs_tlv_parse_msg(
-        void *msg, ogs_tlv_desc_t *desc, ogs_pkbuf_t *pkbuf, int mode);
-int ogs_tlv_parse_msg_desc(
-        void *msg, ogs_tlv_desc_t *desc, ogs_pkbuf_t *pkbuf, int msg_mode);
+        void *msg, const ogs_tlv_desc_t *desc, ogs_pkbuf_t *pkbuf, int mode);
+int ogs_tlv_parse_msg_desc(void *msg,
+        const ogs_tlv_desc_t *desc, ogs_pkbuf_t *pkbuf, int msg_mode);
 
 #ifdef __cplusplus
 }
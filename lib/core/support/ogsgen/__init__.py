@@ -0,0 +1,30 @@
+# Copyright (C) 2026 by Sukchan Lee <acetcom@gmail.com>
+
+# This file is part of Open5GS.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Helpers shared by the spec-to-C generators
+# (lib/nas/*/support, lib/gtp/*/support, lib/pfcp/support)
+
+from .spec import SpecIndex
+from .cache import Cache, source_sha256
+from .output import Output, stamp
+from .tlv import write_desc_index
+from .layout import write_size_report
+from .bench import write_bench_prologue, write_bench_tlv, write_bench_nas, \
+    write_bench_octets, write_bench_main, nas_ie_octets
+from .corpus import Corpus, VARIANTS, tlv_octets
+from .names import memoize
+from .phases import Profile
@@ -0,0 +1,239 @@
+# Copyright (C) 2026 by Sukchan Lee <acetcom@gmail.com>
+
+# This file is part of Open5GS.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Codec benchmark written by the generators (-B). It encodes and decodes
+# one message of each type, with all of its IEs, and prints a CSV line
+# per message, path and operation:
+#
+#   protocol,message,path,operation,octets,iterations,ns_per_op,ops_per_sec
+
+def write_bench_prologue(f, protocol, includes):
+    """Write the includes, the iteration count and bench_report()"""
+    f.write("""/*
+ * Encode and decode cost of each %s message, all of its IEs present.
+ *
+ *   <this program> [iterations] > %s.csv
+ */
+
+""" % (protocol, protocol.lower().replace(" ", "-")))
+    for i in includes:
+        f.write("#include \"%s\"\n" % i)
+    f.write("""
+#define DEFAULT_ITERATIONS 10000
+
+static int iterations = DEFAULT_ITERATIONS;
+
+static void bench_report(const char *message, const char *path,
+        const char *operation, int octets, ogs_time_t start, ogs_time_t stop)
+{
+    double ns = (double)(stop - start) * 1000 / iterations;
+
+    printf("%s,%%s,%%s,%%s,%%d,%%d,%%.1f,%%.0f\\n", message, path, operation,
+            octets, iterations, ns, ns > 0 ? 1e9 / ns : 0);
+}
+
+""" % protocol)
+
+def write_bench_tlv(f, union, mode, parse):
+    """Write bench_fill and bench_message() for a protocol whose
+    messages are described by ogs_tlv_desc_t. 'union' is the message
+    type, 'mode' the OGS_TLV_MODE_* and 'parse' ogs_tlv_parse_msg or
+    ogs_tlv_parse_msg_desc"""
+    f.write("""/* Every IE present, the first one of those that repeat */
+static const test_tlv_fill_t bench_fill = {
+    .one_in = 1, .more = 1, .depth = 8, .octets = 8, .random = false,
+};
+
+typedef struct bench_message_s {
+    const char *name;
+    const ogs_tlv_desc_t *desc;
+    size_t size;
+    /* Specialized paths, if any */
+    ogs_pkbuf_t *(*build)(void *msg);
+    int (*parse)(void *msg, ogs_pkbuf_t *pkbuf);
+} bench_message_t;
+
+static %s bench_msg, bench_parsed;
+
+static void bench_message(const bench_message_t *b)
+{
+    ogs_pkbuf_t *pkbuf = NULL;
+    ogs_time_t start;
+    int i, octets;
+
+    memset(&bench_msg, 0, b->size);
+    test_tlv_message_fill(b->desc, &bench_msg, &bench_fill);
+
+    /* The wire format decoded below */
+    pkbuf = ogs_tlv_build_msg(b->desc, &bench_msg, %s);
+    ogs_assert(pkbuf);
+    octets = pkbuf->len;
+
+    start = ogs_get_monotonic_time();
+    for (i = 0; i < iterations; i++)
+        ogs_pkbuf_free(ogs_tlv_build_msg(b->desc, &bench_msg, %s));
+    bench_report(b->name, "generic", "encode", octets,
+            start, ogs_get_monotonic_time());
+
+    start = ogs_get_monotonic_time();
+    for (i = 0; i < iterations; i++) {
+        memset(&bench_parsed, 0, b->size);
+        ogs_assert(%s(&bench_parsed, b->desc, pkbuf, %s) == OGS_OK);
+    }
+    bench_report(b->name, "generic", "decode", octets,
+            start, ogs_get_monotonic_time());
+
+    if (b->build) {
+        start = ogs_get_monotonic_time();
+        for (i = 0; i < iterations; i++)
+            ogs_pkbuf_free(b->build(&bench_msg));
+        bench_report(b->name, "direct", "encode", octets,
+                start, ogs_get_monotonic_time());
+    }
+
+    if (b->parse) {
+        start = ogs_get_monotonic_time();
+        for (i = 0; i < iterations; i++) {
+            memset(&bench_parsed, 0, b->size);
+            ogs_assert(b->parse(&bench_parsed, pkbuf) == OGS_OK);
+        }
+        bench_report(b->name, "direct", "decode", octets,
+                start, ogs_get_monotonic_time());
+    }
+
+    ogs_pkbuf_free(pkbuf);
+}
+
+""" % (union, mode, mode, parse, mode))
+
+def nas_ie_octets(ie):
+    """Octets of an IE of a NAS message table, the value being zeros of
+    the minimum length"""
+    length = int(ie["length"].split("-")[0].split("/")[0])
+    format = ie["format"].strip()
+    iei = ie["iei"].strip()
+
+    if format == "V":
+        return [0] * length
+    if format == "LV":
+        return [length - 1] + [0] * (length - 1)
+    if format == "LV-E":
+        return [(length - 2) >> 8, (length - 2) & 0xff] + [0] * (length - 2)
+    if format == "TV" and iei[-1] == "-":
+        return [int(iei[0], 16) << 4]
+    if format == "TV" or format == "T":
+        return [int(iei, 16)] + [0] * (length - 1)
+    if format == "TLV":
+        return [int(iei, 16), length - 2] + [0] * (length - 2)
+    if format == "TLV-E":
+        return [int(iei, 16), (length - 3) >> 8, (length - 3) & 0xff] + \
+                [0] * (length - 3)
+    assert False, "Unknown format = %s" % format
+
+def write_bench_nas(f, message, encode):
+    """Write bench_message() for a NAS protocol. 'message' is the message
+    type and 'encode' its plain encoder"""
+    f.write("""typedef struct bench_message_s {
+    const char *name;
+    const char *payload;
+    int len;
+    int (*decode)(%s *message, ogs_pkbuf_t *pkbuf);
+    /* Specialized path, if any */
+    int (*lazy)(ogs_pkbuf_t *pkbuf);
+} bench_message_t;
+
+static %s bench_msg;
+
+static void bench_message(const bench_message_t *b)
+{
+    ogs_pkbuf_t *pkbuf = NULL;
+    ogs_time_t start;
+    int i;
+
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_MAX_SDU_LEN);
+    ogs_assert(pkbuf);
+    ogs_pkbuf_put_data(pkbuf, b->payload, b->len);
+
+    if (b->decode(&bench_msg, pkbuf) != OGS_OK) {
+        fprintf(stderr, "%%s: cannot be decoded\\n", b->name);
+        ogs_pkbuf_free(pkbuf);
+        return;
+    }
+
+    start = ogs_get_monotonic_time();
+    for (i = 0; i < iterations; i++)
+        ogs_pkbuf_free(%s(&bench_msg));
+    bench_report(b->name, "generic", "encode", b->len,
+            start, ogs_get_monotonic_time());
+
+    start = ogs_get_monotonic_time();
+    for (i = 0; i < iterations; i++)
+        ogs_assert(b->decode(&bench_msg, pkbuf) == OGS_OK);
+    bench_report(b->name, "generic", "decode", b->len,
+            start, ogs_get_monotonic_time());
+
+    if (b->lazy) {
+        start = ogs_get_monotonic_time();
+        for (i = 0; i < iterations; i++)
+            ogs_assert(b->lazy(pkbuf) == OGS_OK);
+        bench_report(b->name, "lazy", "decode", b->len,
+                start, ogs_get_monotonic_time());
+    }
+
+    ogs_pkbuf_free(pkbuf);
+}
+
+""" % (message, message, encode))
+
+def write_bench_octets(f, octets):
+    """Write octets as a C string literal"""
+    line = "        \""
+    for i, o in enumerate(octets):
+        if i != 0 and i % 16 == 0:
+            f.write(line + "\"\n")
+            line = "        \""
+        line += "\\x%02x" % o
+    f.write(line + "\",\n")
+
+def write_bench_main(f, init, messages):
+    """Write main(), calling bench_message() on each entry of the array
+    'messages'"""
+    f.write("""int main(int argc, const char *const argv[])
+{
+    int i;
+
+    if (argc > 1)
+        iterations = atoi(argv[1]);
+    if (iterations <= 0) {
+        fprintf(stderr, "Usage: %%s [iterations]\\n", argv[0]);
+        return EXIT_FAILURE;
+    }
+
+    /* A TLV node for each IE of the largest messages */
+    ogs_core()->tlv.pool = 65536;
+    ogs_core_initialize();
+%s
+    printf("protocol,message,path,operation,octets,iterations,"
+            "ns_per_op,ops_per_sec\\n");
+    for (i = 0; i < OGS_ARRAY_SIZE(%s); i++)
+        bench_message(&%s[i]);
+
+    ogs_core_terminate();
+
+    return EXIT_SUCCESS;
+}
+""" % (init, messages, messages))
@@ -0,0 +1,175 @@
+# Copyright (C) 2026 by Sukchan Lee <acetcom@gmail.com>
+
+# This file is part of Open5GS.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+
+from . import pool
+
+# Bump when the layout of a cache entry changes
+SCHEMA = 1
+
+def file_sha256(filename):
+    h = hashlib.sha256()
+    with open(filename, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+def source_sha256(*functions):
+    """Digest of the source code of the given extraction functions.
+
+    A cache entry records it so that any edit to the way tables are
+    read from the specification invalidates what was extracted before."""
+    h = hashlib.sha256()
+    for function in functions:
+        h.update(inspect.getsource(function).encode('utf-8'))
+    return h.hexdigest()
+
+class Cache:
+    """Directory of JSON entries extracted from one specification.
+
+    Each entry records the schema version, the generator, the SHA-256
+    of the source .docx and of the extraction code, plus any parameters
+    the caller used (e.g. the table number). An entry is only returned
+    by load() when all of them still match. The entries read or written
+    are listed in 'files'.
+
+    An entry missing from 'cachedir' is also looked up in the 'readonly'
+    directories, e.g. the cache checked in next to the generator when the
+    build system gives it a cache of its own. Those are never written."""
+
+    def __init__(self, cachedir, source, generator, extractor, readonly=()):
+        self.cachedir = cachedir
+        self.readonly = list(readonly)
+        self.source = source
+        self.generator = generator
+        self.extractor = extractor
+        self.files = []
+        self._sha256 = None
+
+    @property
+    def sha256(self):
+        if self._sha256 is None:
+            self._sha256 = file_sha256(self.source)
+        return self._sha256
+
+    def path(self, name):
+        return os.path.join(self.cachedir, name + '.json')
+
+    def load(self, name, **params):
+        for cachedir in [self.cachedir] + self.readonly:
+            data = self._read(
+                    os.path.join(cachedir, name + '.json'), params)
+            if data is not None:
+                return data
+        return None
+
+    def _read(self, cachefile, params):
+        try:
+            with open(cachefile, 'r') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if entry.get("schema") != SCHEMA or \
+            entry.get("extractor") != self.extractor or \
+            entry.get("source", {}).get("sha256") != self.sha256 or \
+            entry.get("params", {}) != params:
+            return None
+
+        self.files.append(cachefile)
+        return entry["data"]
+
+    def store(self, name, data, tables=None, **params):
+        entry = {
+            "schema" : SCHEMA,
+            "generator" : self.generator,
+            "source" : {
+                "file" : os.path.basename(self.source),
+                "sha256" : self.sha256
+            },
+            "extractor" : self.extractor,
+            "params" : params
+        }
+        if tables is not None:
+            entry["tables"] = tables
+        entry["data"] = data
+
+        cachefile = self.path(name)
+        os.makedirs(self.cachedir, exist_ok=True)
+        fd, tmpfile = tempfile.mkstemp(
+                prefix='.' + name + '.', dir=self.cachedir)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entry, f, indent=2)
+                f.write('\n')
+            os.replace(tmpfile, cachefile)
+        except:
+            os.unlink(tmpfile)
+            raise
+        self.files.append(cachefile)
+
+    def fetch(self, name, extract, **params):
+        """Return the data of entry 'name', calling extract(**params)
+        and storing what it returns when the entry is missing or stale.
+
+        'extract' returns a (data, tables) tuple where 'tables' lists the
+        specification tables the data came from."""
+        data = self.load(name, **params)
+        if data is not None:
+            print("Read from " + self.files[-1])
+            return data
+
+        data, tables = extract(**params)
+        self.store(name, data, tables, **params)
+        return data
+
+    def fetch_many(self, entries, extract, jobs=1, prepare=None):
+        """fetch() for a list of (name, params) entries.
+
+        The stale ones are extracted by up to 'jobs' processes. 'prepare'
+        is called beforehand in this process, so that whatever it loads
+        (e.g. the parsed specification) is shared by every worker. Entries
+        are stored here, in order, once all of them are extracted."""
+        result = []
+        missing = []
+        for i, (name, params) in enumerate(entries):
+            data = self.load(name, **params)
+            if data is not None:
+                print("Read from " + self.files[-1])
+            else:
+                missing.append(i)
+            result.append(data)
+
+        if len(missing) == 0:
+            return result
+
+        if prepare is not None:
+            prepare()
+        extracted = pool.run(
+                extract, [entries[i][1] for i in missing], jobs)
+
+        for i, (data, tables) in zip(missing, extracted):
+            name, params = entries[i]
+            self.store(name, data, tables, **params)
+            result[i] = data
+
+        return result
@@ -0,0 +1,87 @@
+# Copyright (C) 2026 by Sukchan Lee <acetcom@gmail.com>
+
+# This file is part of Open5GS.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Seed corpus of a fuzzer (-F), built from the message tables. Each message
+# is written in up to three variants:
+#
+#   mandatory  only the mandatory IEs
+#   all        every IE once
+#   max        every IE repeated as many times as the message can hold
+#
+# The corpus is the <fuzzer>_seed_corpus.zip of tests/fuzzing, holding a
+# <fuzzer>_seed_corpus/ directory of raw messages. Entries that were not
+# written by the generator (hand made seeds) are kept.
+
+import io
+import os
+import zipfile
+
+VARIANTS = ["mandatory", "all", "max"]
+
+def tlv_octets(mode, type, value, instance=0):
+    """One IE as ogs_tlv_build_msg() writes it in OGS_TLV_MODE_<mode>"""
+    length = len(value)
+    assert length <= 0xffff, "IE too long = %d" % length
+    if mode == "T2_L2":
+        return [type >> 8, type & 0xff, length >> 8, length & 0xff] + value
+    if mode == "T1_L2_I1":
+        return [type, length >> 8, length & 0xff, instance & 0x0f] + value
+    if mode == "T1_L2":
+        return [type, length >> 8, length & 0xff] + value
+    if mode == "T1":
+        return [type] + value
+    assert False, "Unknown mode = %s" % mode
+
+class Corpus:
+    def __init__(self, prefix):
+        """'prefix' starts the name of every seed of this generator"""
+        self.prefix = prefix
+        self.seeds = {}
+
+    def add(self, name, variant, octets):
+        self.seeds["%s-%s-%s.raw" % (self.prefix,
+            name.replace("_", "-"), variant)] = bytes(octets)
+
+    def write(self, output, path):
+        """Write the seeds to the zip file 'path' through 'output'"""
+        directory = os.path.basename(path)
+        if directory.endswith(".zip"):
+            directory = directory[:-len(".zip")]
+        generated = directory + "/" + self.prefix + "-"
+
+        kept = []
+        if os.path.isfile(path):
+            with zipfile.ZipFile(path) as z:
+                for info in z.infolist():
+                    if not info.filename.startswith(generated):
+                        kept.append((info, z.read(info)))
+        if directory + "/" not in [info.filename for (info, data) in kept]:
+            info = zipfile.ZipInfo(directory + "/", (1980, 1, 1, 0, 0, 0))
+            info.external_attr = (0o40755 << 16) | 0x10
+            kept.insert(0, (info, b""))
+
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w") as z:
+            for (info, data) in kept:
+                z.writestr(info, data)
+            for name in sorted(self.seeds.keys()):
+                info = zipfile.ZipInfo(directory + "/" + name,
+                        (1980, 1, 1, 0, 0, 0))
+                info.external_attr = 0o100644 << 16
+                info.compress_type = zipfile.ZIP_DEFLATED
+                z.writestr(info, self.seeds[name])
+        output.write(path, buf.getvalue())
@@ -0,0 +1,83 @@
+# Copyright (C) 2026 by Sukchan Lee <acetcom@gmail.com>
+
+# This file is part of Open5GS.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Size report of the generated C structures. Python cannot lay out the
+# structures itself (the NAS IE types are written by hand), so the report
+# is a small C program that prints what the compiler makes of them.
+
+def write_size_report(f, includes, structs, union=None, tables=None):
+    """Write a C program printing, for each structure, its size and the
+    octets lost to padding.
+
+    'structs' has a (c_type, [member, ...]) tuple for each structure and
+    'union' is an optional (c_type, first_member) tuple for the message
+    type whose union the parser clears one member at a time. 'tables' has
+    a (name, count, c_expression) tuple for each generated table, printed
+    with its count and its size, e.g. the TLV descriptors."""
+    f.write("/*\n")
+    f.write(" * Size and padding of the generated structures.\n")
+    f.write(" * Build it with the include paths of the library, e.g.\n")
+    f.write(" *   cc -I<build>/lib/core -Ilib/core -Ilib ... <this file>\n")
+    f.write(" */\n\n")
+    f.write("#include <stdio.h>\n")
+    f.write("#include <stddef.h>\n\n")
+    for i in includes:
+        f.write("#include \"%s\"\n" % i)
+    f.write("""
+#define MEMBER_SIZE(t, m) sizeof(((t *)0)->m)
+
+static size_t total_size = 0, total_padding = 0;
+
+static void report(const char *name, size_t size, size_t used)
+{
+    printf("%-72s %8zu %6zu\\n", name, size, size - used);
+    total_size += size;
+    total_padding += size - used;
+}
+
+int main(void)
+{
+    printf("%-72s %8s %6s\\n", "structure", "size", "pad");
+
+""")
+    for (t, members) in structs:
+        f.write("    report(\"%s\", sizeof(%s),\n" % (t, t))
+        if len(members) == 0:
+            f.write("            0);\n")
+            continue
+        f.write("            %s);\n" % " +\n            ".join(
+            ["MEMBER_SIZE(%s, %s)" % (t, m) for m in members]))
+
+    f.write("""
+    printf("%-72s %8zu %6zu\\n", "total", total_size, total_padding);
+""")
+    if union is not None:
+        f.write("""    printf("%%-72s %%8zu\\n", "%s", sizeof(%s));
+    printf("%%-72s %%8zu\\n", "cleared before the union", offsetof(%s, %s));
+""" % (union[0], union[0], union[0], union[1]))
+    if tables is not None:
+        f.write("""
+    printf("\\n%-64s %8s %8s\\n", "table", "count", "size");
+""")
+        for (name, count, size) in tables:
+            f.write("    printf(\"%%-64s %%8u %%8zu\\n\", \"%s\", %d,\n" %
+                    (name, count))
+            f.write("            (size_t)(%s));\n" % size)
+    f.write("""
+    return 0;
+}
+""")
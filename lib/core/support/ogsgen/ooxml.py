@@ -0,0 +1,205 @@
+# Copyright (C) 2026 by Sukchan Lee <acetcom@gmail.com>
+
+# This file is part of Open5GS.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Streaming reader for the tables of a .docx (word/document.xml)
+#
+# The text of every cell is computed the way python-docx does it
+# (Table.rows[i].cells[j].text), so the generators get the same strings
+# without building the python-docx object tree:
+#
+#  - a cell is the '\n'-joined text of its paragraphs, a paragraph the
+#    text of its runs and hyperlinks (w:tab/w:ptab -> '\t', w:br/w:cr ->
+#    '\n', w:noBreakHyphen -> '-')
+#  - a cell spanning N grid columns (w:gridSpan) is repeated N times
+#  - a cell continuing a vertical merge (w:vMerge) repeats the cell(s)
+#    starting at the same grid column in the row above
+#
+# Rows python-docx cannot resolve (a vMerge continuation with nothing
+# above it) are returned as None.
+
+import sys
+import zipfile
+
+from lxml import etree
+
+W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+_BODY = W + 'body'
+_P = W + 'p'
+_R = W + 'r'
+_HYPERLINK = W + 'hyperlink'
+_TBL = W + 'tbl'
+_TR = W + 'tr'
+_TRPR = W + 'trPr'
+_TC = W + 'tc'
+_TCPR = W + 'tcPr'
+_VAL = W + 'val'
+
+_RUN_TEXT = {
+    W + 'tab' : '\t',
+    W + 'ptab' : '\t',
+    W + 'cr' : '\n',
+    W + 'noBreakHyphen' : '-',
+}
+
+def run_text(r):
+    text = []
+    for e in r:
+        if e.tag == W + 't':
+            text.append(e.text or '')
+        elif e.tag == W + 'br':
+            if e.get(W + 'type', 'textWrapping') == 'textWrapping':
+                text.append('\n')
+        elif e.tag in _RUN_TEXT:
+            text.append(_RUN_TEXT[e.tag])
+    return ''.join(text)
+
+def paragraph_text(p):
+    text = []
+    for e in p:
+        if e.tag == _R:
+            text.append(run_text(e))
+        elif e.tag == _HYPERLINK:
+            text.extend(run_text(r) for r in e if r.tag == _R)
+    return ''.join(text)
+
+def cell_text(tc):
+    return '\n'.join(paragraph_text(p) for p in tc if p.tag == _P)
+
+def _int_val(parent, tag, default):
+    if parent is None:
+        return default
+    e = parent.find(W + tag)
+    if e is None:
+        return default
+    return int(e.get(_VAL))
+
+def table_rows(tbl):
+    """List of rows of 'tbl', each a tuple with the text of its cells."""
+    rows = []
+    above = {}
+    for tr in tbl.iterfind(_TR):
+        offset = _int_val(tr.find(_TRPR), 'gridBefore', 0)
+        cells = []
+        starts = {}
+        for tc in tr.iterfind(_TC):
+            tcPr = tc.find(_TCPR)
+            span = _int_val(tcPr, 'gridSpan', 1)
+            vMerge = None if tcPr is None else tcPr.find(W + 'vMerge')
+            if vMerge is not None and \
+                    vMerge.get(_VAL, 'continue') == 'continue':
+                texts = above.get(offset)
+            else:
+                texts = (cell_text(tc),) * span
+            if texts is None:
+                cells = None
+            else:
+                if cells is not None:
+                    cells.extend(texts)
+                starts[offset] = texts
+            offset += span
+
+        rows.append(None if cells is None else tuple(cells))
+        above = starts
+    return rows
+
+def iter_tables(filename):
+    """Yield (paragraph, index, rows) for each table at the top level of
+    the document body, in document order.
+
+    'paragraph' is the text of the last paragraph before the table and
+    'rows' is what table_rows() returns. The XML is parsed incrementally
+    and every top-level block is dropped once read."""
+    with zipfile.ZipFile(filename) as docx:
+        with docx.open('word/document.xml') as xml:
+            paragraph = ''
+            index = -1
+            for event, e in etree.iterparse(xml, events=('end',), tag=_TBL):
+                body = e.getparent()
+                if body.tag != _BODY:
+                    continue
+
+                # The blocks before the table are still in the tree,
+                # only those before the previous table were dropped
+                p = e.getprevious()
+                while p is not None and p.tag != _P:
+                    p = p.getprevious()
+                if p is not None:
+                    paragraph = paragraph_text(p)
+
+                index += 1
+                yield paragraph, index, table_rows(e)
+
+                e.clear()
+                while e.getprevious() is not None:
+                    del body[0]
+
+def compare_with_docx(filename):
+    """Check iter_tables() against python-docx. Returns the number of
+    mismatches found, printing each of them."""
+    from docx import Document
+    from docx.oxml.table import CT_Tbl
+    from docx.oxml.text.paragraph import CT_P
+    from docx.text.paragraph import Paragraph
+
+    document = Document(filename)
+    expected = []
+    paragraph = ''
+    for child in document.element.body.iterchildren():
+        if isinstance(child, CT_P):
+            paragraph = Paragraph(child, document).text
+        elif isinstance(child, CT_Tbl):
+            expected.append(paragraph)
+    tables = document.tables
+
+    errors = 0
+    count = 0
+    for paragraph, i, rows in iter_tables(filename):
+        count += 1
+        if paragraph != expected[i]:
+            print("%s: table %d: paragraph %r != %r" %
+                    (filename, i, paragraph, expected[i]))
+            errors += 1
+        docx_rows = tables[i].rows
+        if len(rows) != len(docx_rows):
+            print("%s: table %d: %d rows != %d" %
+                    (filename, i, len(rows), len(docx_rows)))
+            errors += 1
+            continue
+        for j, row in enumerate(rows):
+            try:
+                docx_row = tuple(cell.text for cell in docx_rows[j].cells)
+            except ValueError:
+                docx_row = None
+            if row != docx_row:
+                print("%s: table %d row %d: %r != %r" %
+                        (filename, i, j, row, docx_row))
+                errors += 1
+    if count != len(tables):
+        print("%s: %d tables != %d" % (filename, count, len(tables)))
+        errors += 1
+    return errors
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("Usage: python3 ooxml.py spec.docx ...")
+        print("Compare the tables read by this module with python-docx")
+        sys.exit(2)
+    errors = 0
+    for filename in sys.argv[1:]:
+        errors += compare_with_docx(filename)
+    sys.exit(1 if errors else 0)
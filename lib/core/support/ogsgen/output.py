@@ -0,0 +1,133 @@
+# Copyright (C) 2026 by Sukchan Lee <acetcom@gmail.com>
+
+# This file is part of Open5GS.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import datetime
+import getpass
+import io
+import os
+import sys
+import tempfile
+
+from .cache import file_sha256
+
+def stamp(filename, reproducible=False):
+    """The 'Created ...' lines of the banner of a generated file.
+
+    By default they carry the current time and user. With SOURCE_DATE_EPOCH
+    set, the time is taken from it and the user is left out. In reproducible
+    mode without it, the SHA-256 of the specification is used instead."""
+    epoch = os.environ.get('SOURCE_DATE_EPOCH')
+    if epoch is not None:
+        when = datetime.datetime.fromtimestamp(
+                int(epoch), datetime.timezone.utc)
+        return " * Created on: %s\n * from %s\n" % (str(when), filename)
+    if reproducible is True:
+        return " * Created from %s\n * (sha256: %s)\n" % \
+                (filename, file_sha256(filename))
+
+    now = datetime.datetime.now()
+    return " * Created on: %s by %s\n * from %s\n" % \
+            (str(now), getpass.getuser(), filename)
+
+class _Buffer(io.StringIO):
+    def __init__(self, output, path):
+        super().__init__()
+        self.output = output
+        self.path = path
+
+    def close(self):
+        if not self.closed:
+            self.output._commit(self.path, self.getvalue())
+        super().close()
+
+class Output:
+    """Generated files of one run.
+
+    open() returns an in-memory file. On close() its content is compared
+    with what is on disk and the file is only rewritten when it differs,
+    so that the build does not recompile what did not change."""
+
+    def __init__(self):
+        self.files = []
+        self.changed = []
+        self.unchanged = []
+
+    def open(self, path):
+        return _Buffer(self, path)
+
+    def write(self, path, content):
+        """Write 'content', str or bytes, to 'path' if it differs"""
+        self._commit(path, content)
+
+    def _commit(self, path, content):
+        mode = 'b' if isinstance(content, bytes) else ''
+        self.files.append(path)
+        try:
+            with open(path, 'r' + mode) as f:
+                if f.read() == content:
+                    self.unchanged.append(path)
+                    return
+        except OSError:
+            pass
+
+        fd, tmpfile = tempfile.mkstemp(
+                prefix='.' + os.path.basename(path) + '.',
+                dir=os.path.dirname(path) or '.')
+        try:
+            with os.fdopen(fd, 'w' + mode) as f:
+                f.write(content)
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmpfile, 0o666 & ~umask)
+            os.replace(tmpfile, path)
+        except:
+            os.unlink(tmpfile)
+            raise
+        self.changed.append(path)
+
+    def write_depfile(self, path, inputs):
+        """Write a Makefile rule for the build system (meson's depfile)
+        listing what the generated files were made from: 'inputs', the
+        generator itself and the ogsgen modules it uses."""
+        deps = [os.path.abspath(sys.argv[0])]
+        for name, module in sorted(sys.modules.items()):
+            if (name == __package__ or name.startswith(__package__ + '.')) \
+                    and getattr(module, '__file__', None) is not None:
+                deps.append(os.path.abspath(module.__file__))
+        for dep in inputs:
+            dep = os.path.abspath(dep)
+            if dep not in deps:
+                deps.append(dep)
+
+        def escape(name):
+            return name.replace('$', '$$').replace('#', '\\#').replace(
+                    ' ', '\\ ')
+
+        # A single target, older ninja does not accept more
+        with open(path, 'w') as f:
+            f.write(escape(self.files[0]) + ':')
+            for dep in deps:
+                f.write(' \\\n ' + escape(dep))
+            f.write('\n')
+
+    def summary(self):
+        for path in self.changed:
+            print("Updated " + path)
+        for path in self.unchanged:
+            print("Unchanged " + path)
+        print("%d of %d files changed" % (len(self.changed),
+            len(self.changed) + len(self.unchanged)))
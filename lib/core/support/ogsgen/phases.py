@@ -0,0 +1,117 @@
+# Copyright (C) 2026 by Sukchan Lee <acetcom@gmail.com>
+
+# This file is part of Open5GS.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import cProfile
+import functools
+import resource
+import sys
+import time
+
+def _maxrss():
+    """Peak resident set size of this process in KiB"""
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        rss //= 1024
+    return rss
+
+class Profile:
+    """Wall time and peak memory of the phases of a generator run.
+
+    The run is in one phase at a time: the one entered last with enter(),
+    or a function wrapped with wrap() while it runs. The time spent in a
+    wrapped function is taken out of the phase it is called from. Memory
+    is the peak resident set size of the process, which is cheap enough to
+    read on every switch: for each phase, the highest it was when leaving
+    the phase and how much it grew while in it.
+
+    With 'pstats', the whole run is also profiled with cProfile and the
+    statistics are written to that file by report(), for pstats or
+    snakeviz. Neither is collected in the processes of ogsgen.pool."""
+
+    def __init__(self, enabled=False, pstats=None, phase='extract'):
+        self.enabled = enabled
+        self.pstats = pstats
+        # name: [calls, seconds, peak, growth], in the order entered
+        self.phases = { phase : [1, 0.0, 0, 0] }
+        self.stack = [phase]
+        self.profiler = None
+
+        if self.pstats is not None:
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+        self.rss = _maxrss()
+        self.start = self.since = time.perf_counter()
+
+    def _switch(self):
+        now = time.perf_counter()
+        rss = _maxrss()
+        phase = self.phases[self.stack[-1]]
+        phase[1] += now - self.since
+        phase[2] = max(phase[2], rss)
+        phase[3] += rss - self.rss
+        self.since = now
+        self.rss = rss
+
+    def _push(self, name):
+        self._switch()
+        self.stack.append(name)
+        self.phases.setdefault(name, [0, 0.0, 0, 0])[0] += 1
+
+    def _pop(self):
+        self._switch()
+        self.stack.pop()
+
+    def enter(self, name):
+        """Leave the current top-level phase for phase 'name'"""
+        if self.enabled is not True:
+            return
+        self._switch()
+        self.stack[0] = name
+        self.phases.setdefault(name, [0, 0.0, 0, 0])[0] += 1
+
+    def wrap(self, name, function):
+        """function() with its calls counted in phase 'name'"""
+        if self.enabled is not True:
+            return function
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            self._push(name)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self._pop()
+        return wrapper
+
+    def report(self, f=sys.stdout):
+        """Print the phases and write the cProfile statistics"""
+        if self.profiler is not None:
+            self.profiler.disable()
+            self.profiler.dump_stats(self.pstats)
+            f.write("Profile written to %s\n" % self.pstats)
+
+        if self.enabled is not True:
+            return
+        self._switch()
+        f.write("%-10s %8s %8s %10s %10s\n" %
+                ("phase", "calls", "wall(s)", "peak(KiB)", "grew(KiB)"))
+        for name, (calls, seconds, peak, growth) in self.phases.items():
+            f.write("%-10s %8d %8.3f %10d %10d\n" %
+                    (name, calls, seconds, peak, growth))
+        f.write("%-10s %8s %8.3f %10d\n" %
+                ("total", "", self.since - self.start, self.rss))
+        self.enabled = False
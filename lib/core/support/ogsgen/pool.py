@@ -0,0 +1,43 @@
+# Copyright (C) 2026 by Sukchan Lee <acetcom@gmail.com>
+
+# This file is part of Open5GS.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import multiprocessing
+
+# (function, [params, ...]) of the run() in progress. Workers are forked
+# with it in place, so only an index has to be sent to them and the
+# generator's globals (type_list, the parsed spec) are inherited as is.
+_task = None
+
+def _call(i):
+    function, params = _task
+    return function(**params[i])
+
+def run(function, params, jobs=1):
+    """Return [function(**p) for p in params], using up to 'jobs'
+    forked processes. Results are always in the order of 'params'."""
+    global _task
+
+    if jobs <= 1 or len(params) <= 1:
+        return [function(**p) for p in params]
+
+    context = multiprocessing.get_context('fork')
+    _task = (function, params)
+    try:
+        with context.Pool(min(jobs, len(params))) as pool:
+            return pool.map(_call, range(len(params)), chunksize=1)
+    finally:
+        _task = None
@@ -0,0 +1,88 @@
+# Copyright (C) 2026 by Sukchan Lee <acetcom@gmail.com>
+
+# This file is part of Open5GS.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from . import ooxml
+
+class SpecIndex:
+    """In-memory index of the tables in a 3GPP .docx specification.
+
+    The document is read on first use only, so a generator that finds
+    everything in its cache never opens it. It is read once, with
+    ooxml.iter_tables(), and only the text of the cells is kept: a table
+    is a list of rows and a row a tuple of strings, the same strings
+    python-docx returns for Table.rows[i].cells[j].text.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self._tables = None
+        self._paragraph_tables = None
+
+    def load(self):
+        """Read the document now rather than on first use."""
+        if self._tables is None:
+            tables = []
+            paragraph_tables = []
+            for paragraph, idx, rows in ooxml.iter_tables(self.filename):
+                tables.append(rows)
+                paragraph_tables.append([idx, paragraph, rows])
+            self._tables = tables
+            self._paragraph_tables = paragraph_tables
+        return self
+
+    @property
+    def tables(self):
+        if self._tables is None:
+            self.load()
+        return self._tables
+
+    def table(self, index):
+        return self.tables[index]
+
+    def header(self, index):
+        """Text of the cells in the first row of table 'index'.
+
+        Returns None if the table has no readable first row."""
+        rows = self.tables[index]
+        if len(rows) == 0:
+            return None
+        return rows[0]
+
+    def find_tables(self, text, col=0):
+        """Yield (index, table) for every table whose first row has 'text'
+        in column 'col'."""
+        for i, table in enumerate(self.tables):
+            header = self.header(i)
+            if header is None or len(header) <= col:
+                continue
+            if header[col].find(text) != -1:
+                yield i, table
+
+    def find_table(self, text, col=0):
+        """Return the last (index, table) matching find_tables(),
+        or (-1, None)."""
+        found = (-1, None)
+        for found in self.find_tables(text, col):
+            pass
+        return found
+
+    def paragraph_tables(self):
+        """List of [index, paragraph, table] for each top-level table,
+        where 'paragraph' is the text of the last paragraph before it."""
+        if self._paragraph_tables is None:
+            self.load()
+        return self._paragraph_tables
@@ -0,0 +1,65 @@
+# Copyright (C) 2026 by Sukchan Lee <acetcom@gmail.com>
+
+# This file is part of Open5GS.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Index of the children of the TLV descriptors (ogs_tlv_desc_index_t in
+# lib/core/ogs-tlv-msg.h), so that the parser finds the descriptor of a
+# received TLV without scanning child_descs[]
+
+def desc_hash(type, instance, position):
+    """OGS_TLV_DESC_HASH()"""
+    return ((type * 31) + instance) * 7 + position
+
+def write_desc_index(f, name, children):
+    """Write the ogs_tlv_desc_index_t 'name' and return what the descriptor
+    has to point to.
+
+    'children' has a (type, type_macro, instance, offset) tuple for each
+    entry of child_descs[], in the same order, ogs_tlv_desc_moreN included
+    (type 0). 'type' is the value of 'type_macro' and 'offset' a C
+    expression giving the offset the parser would reach by adding up the
+    vsize of the entries before."""
+    if len(children) == 0:
+        return "NULL"
+
+    # At least one slot stays free to end the lookups
+    size = 1
+    while size < 2 * len(children):
+        size *= 2
+
+    # The children sharing a type and instance share a counter, numbered
+    # in the order the pairs first appear
+    slots = [None] * size
+    positions = {}
+    counters = {}
+    for i, (type, type_macro, instance, offset) in enumerate(children):
+        position = positions.get((type, instance), 0)
+        positions[(type, instance)] = position + 1
+        counter = counters.setdefault((type, instance), len(counters))
+        slot = desc_hash(type, instance, position) & (size - 1)
+        while slots[slot] is not None:
+            slot = (slot + 1) & (size - 1)
+        slots[slot] = (type_macro, instance, position, i + 1, counter, offset)
+
+    f.write("static const ogs_tlv_desc_slot_t %s_slot[%d] = {\n" % (name, size))
+    for slot, v in enumerate(slots):
+        if v is not None:
+            f.write("    [%d] = { %s, %d, %d, %d, %d,\n        %s },\n" %
+                    ((slot,) + v))
+    f.write("};\n")
+    f.write("static const ogs_tlv_desc_index_t %s = {\n" % name)
+    f.write("    %d, %d, %s_slot };\n\n" % (size - 1, len(counters), name))
+    return "&" + name
@@ -0,0 +1,138 @@
+# Copyright (C) 2026 by Sukchan Lee <acetcom@gmail.com>
+
+# This file is part of Open5GS.
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Regenerate the codecs of every protocol from a single process
+#
+# The generators are run one after the other (or -j at a time in forked
+# processes) with the ogsgen package, the OOXML reader and the regular
+# expressions loaded once. Each of them runs in its support directory as
+# if it had been started there, with the default cache.
+
+import os, sys, io, time
+import getopt
+import runpy
+import contextlib
+
+support = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, support)
+from ogsgen import pool
+
+top = os.path.join(support, '..', '..', '..')
+
+# (name, support directory, generator, specification)
+generators = [
+    ("nas-5gs", "lib/nas/5gs/support", "nas-message.py", "24501-h90.docx"),
+    ("nas-eps", "lib/nas/eps/support", "nas-message.py", "24301-h90.docx"),
+    ("gtp1", "lib/gtp/v1/support", "gtp1-tlv.py", "29060-h40.docx"),
+    ("gtp2", "lib/gtp/v2/support", "gtp-tlv.py", "29274-h70.docx"),
+    ("pfcp", "lib/pfcp/support", "pfcp-tlv.py", "29244-h71-modified.docx"),
+]
+
+outroot = None
+reproducible = False
+verbosity = 0
+jobs = 1
+
+def usage():
+    print("Usage: python3 regen-all.py [options] [name ...]")
+    print("Generate the codecs of the protocols 'name' (default: all of them)")
+    print("  %s" % " ".join([g[0] for g in generators]))
+    print("Available options:")
+    print("-o [dir]  Output files to dir/<name> (default: in the source tree)")
+    print("-r        Reproducible output (no date and user in headers)")
+    print("-j [num]  Run num generators at the same time")
+    print("-v        Print what the generators print")
+    print("-h        Print this help and return")
+
+def generate(name, directory, script, docx):
+    """Run a generator as __main__, return (status, seconds, log)"""
+    cwd = os.getcwd()
+    argv = sys.argv
+    log = io.StringIO()
+    status = 0
+
+    if outroot is None:
+        outdir = '..'
+    else:
+        outdir = os.path.join(outroot, name)
+        os.makedirs(outdir, exist_ok=True)
+    sys.argv = [script, "-f", docx, "-o", outdir]
+    if reproducible is True:
+        sys.argv.append("-r")
+
+    start = time.perf_counter()
+    try:
+        os.chdir(os.path.join(top, directory))
+        with contextlib.redirect_stdout(log), contextlib.redirect_stderr(log):
+            runpy.run_path(script, run_name='__main__')
+    except SystemExit as e:
+        status = e.code
+    except Exception as e:
+        log.write("%s: %s\n" % (type(e).__name__, e))
+        status = 1
+    finally:
+        os.chdir(cwd)
+        sys.argv = argv
+    seconds = time.perf_counter() - start
+
+    return (status, seconds, log.getvalue())
+
+try:
+    opts, args = getopt.getopt(sys.argv[1:], "ho:rj:v", ["help", "output=", "reproducible", "jobs=", "verbose"])
+except getopt.GetoptError as err:
+    # print help information and exit:
+    usage()
+    sys.exit(2)
+
+for o, a in opts:
+    if o in ("-o", "--output"):
+        outroot = os.path.abspath(a)
+    if o in ("-r", "--reproducible"):
+        reproducible = True
+    if o in ("-j", "--jobs"):
+        jobs = int(a)
+    if o in ("-v", "--verbose"):
+        verbosity = 1
+    if o in ("-h", "--help"):
+        usage()
+        sys.exit(2)
+
+names = [g[0] for g in generators]
+for name in args:
+    if name not in names:
+        usage()
+        sys.exit(2)
+selected = [g for g in generators if len(args) == 0 or g[0] in args]
+
+start = time.perf_counter()
+results = pool.run(generate, [{ "name" : name, "directory" : directory,
+    "script" : script, "docx" : docx }
+        for (name, directory, script, docx) in selected], jobs)
+seconds = time.perf_counter() - start
+
+failed = 0
+for (name, directory, script, docx), (status, t, log) in \
+        zip(selected, results):
+    if verbosity > 0 or status:
+        sys.stdout.write(log)
+    if status:
+        failed += 1
+    print("%-8s %6.2fs%s" % (name, t, " FAILED" if status else ""))
+print("%-8s %6.2fs" % ("total", seconds))
+
+if failed:
+    sys.exit(1)
@@ -0,0 +1,60 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+support = os.path.dirname(os.path.abspath(__file__))
+top = os.path.join(support, '..', '..', '..')
+
+# (support directory, generator, specification,
+#  options of its own, files they write)
+generators = [
+    ("lib/nas/5gs/support", "nas-message.py", "24501-h90.docx",
+        ["--lazy", "65", "--sizes", "sizes.c", "--python=ogs_nas_5gs.py"],
+        ["sizes.c", "ogs_nas_5gs.py"]),
+    ("lib/nas/eps/support", "nas-message.py", "24301-h90.docx", [], []),
+    ("lib/gtp/v1/support", "gtp1-tlv.py", "29060-h40.docx", [], []),
+    ("lib/gtp/v2/support", "gtp-tlv.py", "29274-h70.docx",
+        ["--jobs", "2", "--sizes=sizes.c"], ["sizes.c"]),
+    ("lib/pfcp/support", "pfcp-tlv.py", "29244-h71-modified.docx",
+        ["--jobs=2", "--hot", "1,2", "--sizes", "sizes.c"], ["sizes.c"]),
+]
+
+class TestOptions(unittest.TestCase):
+    def run_script(self, cwd, args):
+        result = subprocess.run([sys.executable] + args, cwd=cwd,
+                stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        self.assertEqual(result.returncode, 0, result.stdout)
+
+    def test_generators(self):
+        for (directory, script, docx, options, files) in generators:
+            with self.subTest(directory), \
+                    tempfile.TemporaryDirectory() as tmp:
+                cwd = os.path.join(top, directory)
+                self.run_script(tmp, [os.path.join(cwd, script),
+                    "--file", os.path.join(cwd, docx),
+                    "--output=" + tmp,
+                    "--cache", os.path.join(tmp, "cache"),
+                    "--readonly-cache", os.path.join(cwd, "cache"),
+                    "--reproducible",
+                    "--depfile", "depfile",
+                    "--bench=bench.c",
+                    "--corpus", "corpus.zip",
+                    "--profile",
+                    "--pstats", "pstats"] + options)
+                for name in ["message.h", "depfile", "bench.c",
+                        "corpus.zip", "pstats"] + files:
+                    self.assertTrue(
+                            os.path.isfile(os.path.join(tmp, name)), name)
+
+    def test_regen_all(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.run_script(tmp, [os.path.join(support, "regen-all.py"),
+                "--output", tmp, "--jobs=2", "--reproducible", "gtp2", "pfcp"])
+            for name in ["gtp2", "pfcp"]:
+                self.assertTrue(
+                        os.path.isfile(os.path.join(tmp, name, "message.h")))
+
+if __name__ == '__main__':
+    unittest.main()
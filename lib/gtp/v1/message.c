@@ -22,8 +22,8 @@
 /*******************************************************************************
  * This file had been created by gtp1-tlv.py script v0.1.0
  * Please do not modify this file but regenerate it via script.
- * Created on: 2023-12-11 17:21:37.071241 by pespin
- * from 29060-h40.docx
+ * Created from 29060-h40.docx
+ * (sha256: 63ee8f5056967e44969eb0b779cb1d26605c9454573d362e6b8a7c65532b4127)
  ******************************************************************************/
 
 #include "ogs-gtp.h"
@@ -36,7 +36,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_cause =
     1,
     0,
     sizeof(ogs_gtp1_tlv_cause_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_imsi =
@@ -47,7 +49,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_imsi =
     8,
     0,
     sizeof(ogs_gtp1_tlv_imsi_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_rai =
@@ -58,7 +62,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_rai =
     6,
     0,
     sizeof(ogs_gtp1_tlv_rai_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_tlli =
@@ -69,7 +75,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_tlli =
     4,
     0,
     sizeof(ogs_gtp1_tlv_tlli_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_p_tmsi =
@@ -80,7 +88,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_p_tmsi =
     4,
     0,
     sizeof(ogs_gtp1_tlv_p_tmsi_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_reordering_required =
@@ -91,7 +101,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_reordering_required =
     1,
     0,
     sizeof(ogs_gtp1_tlv_reordering_required_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_authentication_triplet =
@@ -102,7 +114,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_authentication_triplet =
     28,
     0,
     sizeof(ogs_gtp1_tlv_authentication_triplet_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_map_cause =
@@ -113,7 +127,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_map_cause =
     1,
     0,
     sizeof(ogs_gtp1_tlv_map_cause_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_p_tmsi_signature =
@@ -124,7 +140,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_p_tmsi_signature =
     3,
     0,
     sizeof(ogs_gtp1_tlv_p_tmsi_signature_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_ms_validated =
@@ -135,7 +153,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_ms_validated =
     1,
     0,
     sizeof(ogs_gtp1_tlv_ms_validated_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_recovery =
@@ -146,7 +166,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_recovery =
     1,
     0,
     sizeof(ogs_gtp1_tlv_recovery_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_selection_mode =
@@ -157,7 +179,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_selection_mode =
     1,
     0,
     sizeof(ogs_gtp1_tlv_selection_mode_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_tunnel_endpoint_identifier_data_i =
@@ -168,7 +192,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_tunnel_endpoint_identifier_data_i =
     4,
     0,
     sizeof(ogs_gtp1_tlv_tunnel_endpoint_identifier_data_i_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_tunnel_endpoint_identifier_control_plane =
@@ -179,7 +205,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_tunnel_endpoint_identifier_control_plane =
     4,
     0,
     sizeof(ogs_gtp1_tlv_tunnel_endpoint_identifier_control_plane_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_tunnel_endpoint_identifier_data_ii =
@@ -190,7 +218,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_tunnel_endpoint_identifier_data_ii =
     5,
     0,
     sizeof(ogs_gtp1_tlv_tunnel_endpoint_identifier_data_ii_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_teardown_ind =
@@ -201,7 +231,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_teardown_ind =
     1,
     0,
     sizeof(ogs_gtp1_tlv_teardown_ind_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_nsapi =
@@ -212,7 +244,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_nsapi =
     1,
     0,
     sizeof(ogs_gtp1_tlv_nsapi_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_ranap_cause =
@@ -223,7 +257,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_ranap_cause =
     1,
     0,
     sizeof(ogs_gtp1_tlv_ranap_cause_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_rab_context =
@@ -234,7 +270,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_rab_context =
     9,
     0,
     sizeof(ogs_gtp1_tlv_rab_context_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_radio_priority_sms =
@@ -245,7 +283,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_radio_priority_sms =
     1,
     0,
     sizeof(ogs_gtp1_tlv_radio_priority_sms_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_radio_priority =
@@ -256,7 +296,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_radio_priority =
     1,
     0,
     sizeof(ogs_gtp1_tlv_radio_priority_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_packet_flow_id =
@@ -267,7 +309,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_packet_flow_id =
     2,
     0,
     sizeof(ogs_gtp1_tlv_packet_flow_id_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_charging_characteristics =
@@ -278,7 +322,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_charging_characteristics =
     2,
     0,
     sizeof(ogs_gtp1_tlv_charging_characteristics_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_trace_reference =
@@ -289,7 +335,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_trace_reference =
     2,
     0,
     sizeof(ogs_gtp1_tlv_trace_reference_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_trace_type =
@@ -300,7 +348,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_trace_type =
     2,
     0,
     sizeof(ogs_gtp1_tlv_trace_type_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_ms_not_reachable_reason =
@@ -311,7 +361,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_ms_not_reachable_reason =
     1,
     0,
     sizeof(ogs_gtp1_tlv_ms_not_reachable_reason_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_charging_id =
@@ -322,7 +374,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_charging_id =
     4,
     0,
     sizeof(ogs_gtp1_tlv_charging_id_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_end_user_address =
@@ -333,7 +387,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_end_user_address =
     0,
     0,
     sizeof(ogs_gtp1_tlv_end_user_address_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_mm_context =
@@ -344,7 +400,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_mm_context =
     0,
     0,
     sizeof(ogs_gtp1_tlv_mm_context_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_pdp_context =
@@ -355,7 +413,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_pdp_context =
     0,
     0,
     sizeof(ogs_gtp1_tlv_pdp_context_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_access_point_name =
@@ -366,7 +426,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_access_point_name =
     0,
     0,
     sizeof(ogs_gtp1_tlv_access_point_name_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_protocol_configuration_options =
@@ -377,7 +439,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_protocol_configuration_options =
     0,
     0,
     sizeof(ogs_gtp1_tlv_protocol_configuration_options_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_gsn_address =
@@ -388,7 +452,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_gsn_address =
     0,
     0,
     sizeof(ogs_gtp1_tlv_gsn_address_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_msisdn =
@@ -399,7 +465,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_msisdn =
     0,
     0,
     sizeof(ogs_gtp1_tlv_msisdn_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_quality_of_service_profile =
@@ -410,7 +478,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_quality_of_service_profile =
     0,
     0,
     sizeof(ogs_gtp1_tlv_quality_of_service_profile_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_authentication_quintuplet =
@@ -421,7 +491,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_authentication_quintuplet =
     0,
     0,
     sizeof(ogs_gtp1_tlv_authentication_quintuplet_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_traffic_flow_template =
@@ -432,7 +504,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_traffic_flow_template =
     0,
     0,
     sizeof(ogs_gtp1_tlv_traffic_flow_template_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_target_identification =
@@ -443,7 +517,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_target_identification =
     0,
     0,
     sizeof(ogs_gtp1_tlv_target_identification_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_utran_transparent_container =
@@ -454,7 +530,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_utran_transparent_container =
     0,
     0,
     sizeof(ogs_gtp1_tlv_utran_transparent_container_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_rab_setup_information =
@@ -465,7 +543,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_rab_setup_information =
     0,
     0,
     sizeof(ogs_gtp1_tlv_rab_setup_information_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_extension_header_type_list =
@@ -476,7 +556,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_extension_header_type_list =
     0,
     0,
     sizeof(ogs_gtp1_tlv_extension_header_type_list_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_trigger_id =
@@ -487,7 +569,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_trigger_id =
     0,
     0,
     sizeof(ogs_gtp1_tlv_trigger_id_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_omc_identity =
@@ -498,7 +582,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_omc_identity =
     0,
     0,
     sizeof(ogs_gtp1_tlv_omc_identity_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_ran_transparent_container =
@@ -509,7 +595,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_ran_transparent_container =
     0,
     0,
     sizeof(ogs_gtp1_tlv_ran_transparent_container_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_pdp_context_prioritization =
@@ -520,7 +608,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_pdp_context_prioritization =
     0,
     0,
     sizeof(ogs_gtp1_tlv_pdp_context_prioritization_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_additional_rab_setup_information =
@@ -531,7 +621,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_additional_rab_setup_information =
     0,
     0,
     sizeof(ogs_gtp1_tlv_additional_rab_setup_information_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_sgsn_number =
@@ -542,7 +634,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_sgsn_number =
     0,
     0,
     sizeof(ogs_gtp1_tlv_sgsn_number_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_common_flags =
@@ -553,7 +647,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_common_flags =
     1,
     0,
     sizeof(ogs_gtp1_tlv_common_flags_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_apn_restriction =
@@ -564,7 +660,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_apn_restriction =
     1,
     0,
     sizeof(ogs_gtp1_tlv_apn_restriction_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_radio_priority_lcs =
@@ -575,7 +673,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_radio_priority_lcs =
     1,
     0,
     sizeof(ogs_gtp1_tlv_radio_priority_lcs_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_rat_type =
@@ -586,7 +686,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_rat_type =
     1,
     0,
     sizeof(ogs_gtp1_tlv_rat_type_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_user_location_information =
@@ -597,7 +699,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_user_location_information =
     0,
     0,
     sizeof(ogs_gtp1_tlv_user_location_information_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_ms_time_zone =
@@ -608,7 +712,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_ms_time_zone =
     2,
     0,
     sizeof(ogs_gtp1_tlv_ms_time_zone_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_sv =
@@ -619,7 +725,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_sv =
     8,
     0,
     sizeof(ogs_gtp1_tlv_sv_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_camel_charging_information_container =
@@ -630,7 +738,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_camel_charging_information_container =
     0,
     0,
     sizeof(ogs_gtp1_tlv_camel_charging_information_container_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_ue_context =
@@ -641,7 +751,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_ue_context =
     0,
     0,
     sizeof(ogs_gtp1_tlv_mbms_ue_context_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_tmgi =
@@ -652,7 +764,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_tmgi =
     6,
     0,
     sizeof(ogs_gtp1_tlv_tmgi_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_rim_routing_address =
@@ -663,7 +777,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_rim_routing_address =
     0,
     0,
     sizeof(ogs_gtp1_tlv_rim_routing_address_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_protocol_configuration_options =
@@ -674,7 +790,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_protocol_configuration_options =
     0,
     0,
     sizeof(ogs_gtp1_tlv_mbms_protocol_configuration_options_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_service_area =
@@ -685,7 +803,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_service_area =
     0,
     0,
     sizeof(ogs_gtp1_tlv_mbms_service_area_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_source_rnc_pdcp_context_info =
@@ -696,7 +816,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_source_rnc_pdcp_context_info =
     0,
     0,
     sizeof(ogs_gtp1_tlv_source_rnc_pdcp_context_info_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_additional_trace_info =
@@ -707,7 +829,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_additional_trace_info =
     9,
     0,
     sizeof(ogs_gtp1_tlv_additional_trace_info_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_hop_counter =
@@ -718,7 +842,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_hop_counter =
     1,
     0,
     sizeof(ogs_gtp1_tlv_hop_counter_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_selected_plmn_id =
@@ -729,7 +855,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_selected_plmn_id =
     3,
     0,
     sizeof(ogs_gtp1_tlv_selected_plmn_id_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_session_identifier =
@@ -740,7 +868,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_session_identifier =
     1,
     0,
     sizeof(ogs_gtp1_tlv_mbms_session_identifier_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_2g_3g_indicator =
@@ -751,7 +881,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_2g_3g_indicator =
     1,
     0,
     sizeof(ogs_gtp1_tlv_mbms_2g_3g_indicator_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_enhanced_nsapi =
@@ -762,7 +894,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_enhanced_nsapi =
     1,
     0,
     sizeof(ogs_gtp1_tlv_enhanced_nsapi_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_session_duration =
@@ -773,7 +907,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_session_duration =
     3,
     0,
     sizeof(ogs_gtp1_tlv_mbms_session_duration_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_additional_mbms_trace_info =
@@ -784,7 +920,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_additional_mbms_trace_info =
     8,
     0,
     sizeof(ogs_gtp1_tlv_additional_mbms_trace_info_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_session_repetition_number =
@@ -795,7 +933,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_session_repetition_number =
     1,
     0,
     sizeof(ogs_gtp1_tlv_mbms_session_repetition_number_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_time_to_data_transfer =
@@ -806,7 +946,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_time_to_data_transfer =
     1,
     0,
     sizeof(ogs_gtp1_tlv_mbms_time_to_data_transfer_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_bss_container =
@@ -817,7 +959,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_bss_container =
     0,
     0,
     sizeof(ogs_gtp1_tlv_bss_container_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_cell_identification =
@@ -828,7 +972,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_cell_identification =
     17,
     0,
     sizeof(ogs_gtp1_tlv_cell_identification_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_pdu_numbers =
@@ -839,7 +985,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_pdu_numbers =
     9,
     0,
     sizeof(ogs_gtp1_tlv_pdu_numbers_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_bssgp_cause =
@@ -850,7 +998,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_bssgp_cause =
     1,
     0,
     sizeof(ogs_gtp1_tlv_bssgp_cause_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_required_mbms_bearer_capabilities =
@@ -861,7 +1011,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_required_mbms_bearer_capabilities =
     0,
     0,
     sizeof(ogs_gtp1_tlv_required_mbms_bearer_capabilities_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_rim_routing_address_discriminator =
@@ -872,7 +1024,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_rim_routing_address_discriminator =
     1,
     0,
     sizeof(ogs_gtp1_tlv_rim_routing_address_discriminator_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_list_of_set_up_pfcs =
@@ -883,7 +1037,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_list_of_set_up_pfcs =
     0,
     0,
     sizeof(ogs_gtp1_tlv_list_of_set_up_pfcs_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_ps_handover_xid_parameters =
@@ -894,7 +1050,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_ps_handover_xid_parameters =
     0,
     0,
     sizeof(ogs_gtp1_tlv_ps_handover_xid_parameters_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_ms_info_change_reporting_action =
@@ -905,7 +1063,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_ms_info_change_reporting_action =
     1,
     0,
     sizeof(ogs_gtp1_tlv_ms_info_change_reporting_action_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_direct_tunnel_flags =
@@ -916,7 +1076,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_direct_tunnel_flags =
     0,
     0,
     sizeof(ogs_gtp1_tlv_direct_tunnel_flags_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_correlation_id =
@@ -927,7 +1089,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_correlation_id =
     1,
     0,
     sizeof(ogs_gtp1_tlv_correlation_id_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_bearer_control_mode =
@@ -938,7 +1102,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_bearer_control_mode =
     1,
     0,
     sizeof(ogs_gtp1_tlv_bearer_control_mode_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_flow_identifier =
@@ -949,7 +1115,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_flow_identifier =
     0,
     0,
     sizeof(ogs_gtp1_tlv_mbms_flow_identifier_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_ip_multicast_distribution =
@@ -960,7 +1128,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_ip_multicast_distribution =
     0,
     0,
     sizeof(ogs_gtp1_tlv_mbms_ip_multicast_distribution_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_distribution_acknowledgement =
@@ -971,7 +1141,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_distribution_acknowledgement =
     1,
     0,
     sizeof(ogs_gtp1_tlv_mbms_distribution_acknowledgement_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_reliable_inter_rat_handover_info =
@@ -982,7 +1154,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_reliable_inter_rat_handover_info =
     1,
     0,
     sizeof(ogs_gtp1_tlv_reliable_inter_rat_handover_info_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_rfsp_index =
@@ -993,7 +1167,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_rfsp_index =
     2,
     0,
     sizeof(ogs_gtp1_tlv_rfsp_index_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_fqdn =
@@ -1004,7 +1180,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_fqdn =
     0,
     0,
     sizeof(ogs_gtp1_tlv_fqdn_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_evolved_allocation_retention_priority_i =
@@ -1015,7 +1193,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_evolved_allocation_retention_priority_i =
     1,
     0,
     sizeof(ogs_gtp1_tlv_evolved_allocation_retention_priority_i_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_evolved_allocation_retention_priority_ii =
@@ -1026,7 +1206,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_evolved_allocation_retention_priority_ii =
     2,
     0,
     sizeof(ogs_gtp1_tlv_evolved_allocation_retention_priority_ii_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_extended_common_flags =
@@ -1037,7 +1219,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_extended_common_flags =
     0,
     0,
     sizeof(ogs_gtp1_tlv_extended_common_flags_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_uci =
@@ -1048,7 +1232,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_uci =
     8,
     0,
     sizeof(ogs_gtp1_tlv_uci_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_csg_information_reporting_action =
@@ -1059,7 +1245,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_csg_information_reporting_action =
     0,
     0,
     sizeof(ogs_gtp1_tlv_csg_information_reporting_action_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_csg_id =
@@ -1070,7 +1258,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_csg_id =
     4,
     0,
     sizeof(ogs_gtp1_tlv_csg_id_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_cmi =
@@ -1081,7 +1271,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_cmi =
     1,
     0,
     sizeof(ogs_gtp1_tlv_cmi_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_ambr =
@@ -1092,7 +1284,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_ambr =
     8,
     0,
     sizeof(ogs_gtp1_tlv_ambr_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_ue_network_capability =
@@ -1103,7 +1297,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_ue_network_capability =
     0,
     0,
     sizeof(ogs_gtp1_tlv_ue_network_capability_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_ue_ambr =
@@ -1114,7 +1310,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_ue_ambr =
     0,
     0,
     sizeof(ogs_gtp1_tlv_ue_ambr_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_apn_ambr_with_nsapi =
@@ -1125,7 +1323,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_apn_ambr_with_nsapi =
     9,
     0,
     sizeof(ogs_gtp1_tlv_apn_ambr_with_nsapi_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_ggsn_back_off_time =
@@ -1136,7 +1336,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_ggsn_back_off_time =
     0,
     0,
     sizeof(ogs_gtp1_tlv_ggsn_back_off_time_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_signalling_priority_indication =
@@ -1147,7 +1349,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_signalling_priority_indication =
     0,
     0,
     sizeof(ogs_gtp1_tlv_signalling_priority_indication_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_signalling_priority_indication_with_nsapi =
@@ -1158,7 +1362,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_signalling_priority_indication_with_nsapi =
     0,
     0,
     sizeof(ogs_gtp1_tlv_signalling_priority_indication_with_nsapi_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_higher_bitrates_than_16_mbps_flag =
@@ -1169,7 +1375,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_higher_bitrates_than_16_mbps_flag =
     1,
     0,
     sizeof(ogs_gtp1_tlv_higher_bitrates_than_16_mbps_flag_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_additional_mm_context_for_srvcc =
@@ -1180,7 +1388,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_additional_mm_context_for_srvcc =
     0,
     0,
     sizeof(ogs_gtp1_tlv_additional_mm_context_for_srvcc_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_additional_flags_for_srvcc =
@@ -1191,7 +1401,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_additional_flags_for_srvcc =
     0,
     0,
     sizeof(ogs_gtp1_tlv_additional_flags_for_srvcc_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_stn_sr =
@@ -1202,7 +1414,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_stn_sr =
     0,
     0,
     sizeof(ogs_gtp1_tlv_stn_sr_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_c_msisdn =
@@ -1213,7 +1427,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_c_msisdn =
     0,
     0,
     sizeof(ogs_gtp1_tlv_c_msisdn_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_extended_ranap_cause =
@@ -1224,7 +1440,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_extended_ranap_cause =
     0,
     0,
     sizeof(ogs_gtp1_tlv_extended_ranap_cause_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_enodeb_id =
@@ -1235,7 +1453,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_enodeb_id =
     0,
     0,
     sizeof(ogs_gtp1_tlv_enodeb_id_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_selection_mode_with_nsapi =
@@ -1246,7 +1466,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_selection_mode_with_nsapi =
     2,
     0,
     sizeof(ogs_gtp1_tlv_selection_mode_with_nsapi_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_uli_timestamp =
@@ -1257,7 +1479,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_uli_timestamp =
     0,
     0,
     sizeof(ogs_gtp1_tlv_uli_timestamp_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_lhn_id_with_nsapi =
@@ -1268,7 +1492,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_lhn_id_with_nsapi =
     0,
     0,
     sizeof(ogs_gtp1_tlv_lhn_id_with_nsapi_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_cn_operator_selection_entity =
@@ -1279,7 +1505,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_cn_operator_selection_entity =
     0,
     0,
     sizeof(ogs_gtp1_tlv_cn_operator_selection_entity_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_ue_usage_type =
@@ -1290,7 +1518,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_ue_usage_type =
     0,
     0,
     sizeof(ogs_gtp1_tlv_ue_usage_type_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_extended_common_flags_ii =
@@ -1301,7 +1531,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_extended_common_flags_ii =
     0,
     0,
     sizeof(ogs_gtp1_tlv_extended_common_flags_ii_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_node_identifier =
@@ -1312,7 +1544,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_node_identifier =
     0,
     0,
     sizeof(ogs_gtp1_tlv_node_identifier_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_ciot_optimizations_support_indication =
@@ -1323,7 +1557,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_ciot_optimizations_support_indication =
     0,
     0,
     sizeof(ogs_gtp1_tlv_ciot_optimizations_support_indication_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_scef_pdn_connection =
@@ -1334,7 +1570,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_scef_pdn_connection =
     0,
     0,
     sizeof(ogs_gtp1_tlv_scef_pdn_connection_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_iov_updates_counter =
@@ -1345,7 +1583,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_iov_updates_counter =
     1,
     0,
     sizeof(ogs_gtp1_tlv_iov_updates_counter_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_mapped_ue_usage_type =
@@ -1356,7 +1596,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_mapped_ue_usage_type =
     0,
     0,
     sizeof(ogs_gtp1_tlv_mapped_ue_usage_type_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_up_function_selection_indication_flags =
@@ -1367,7 +1609,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_up_function_selection_indication_flags =
     0,
     0,
     sizeof(ogs_gtp1_tlv_up_function_selection_indication_flags_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_special_ie_type_for_ie_type_extension =
@@ -1378,7 +1622,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_special_ie_type_for_ie_type_extension =
     0,
     0,
     sizeof(ogs_gtp1_tlv_special_ie_type_for_ie_type_extension_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_charging_gateway_address =
@@ -1389,7 +1635,9 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_charging_gateway_address =
     0,
     0,
     sizeof(ogs_gtp1_tlv_charging_gateway_address_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_echo_request =
@@ -1398,7 +1646,14 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_echo_request =
     "Echo Request",
     0, 0, 0, 0, {
     NULL,
-}};
+}, NULL, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_echo_response_slot[2] = {
+    [0] = { OGS_GTP1_RECOVERY_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_echo_response_t, recovery) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_echo_response = {
+    1, 1, ogs_gtp1_msg_index_echo_response_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_echo_response =
 {
@@ -1407,7 +1662,88 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_echo_response =
     0, 0, 0, 0, {
         &ogs_gtp1_tlv_desc_recovery,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_echo_response, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_create_pdp_context_request_slot[128] = {
+    [0] = { OGS_GTP1_END_USER_ADDRESS_TYPE, 0, 0, 12, 10,
+        offsetof(ogs_gtp1_create_pdp_context_request_t, end_user_address) },
+    [7] = { OGS_GTP1_MAPPED_UE_USAGE_TYPE_TYPE, 0, 0, 37, 34,
+        offsetof(ogs_gtp1_create_pdp_context_request_t, mapped_ue_usage_type) },
+    [10] = { OGS_GTP1_CHARGING_CHARACTERISTICS_TYPE, 0, 0, 9, 7,
+        offsetof(ogs_gtp1_create_pdp_context_request_t, charging_characteristics) },
+    [11] = { OGS_GTP1_RAI_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_create_pdp_context_request_t, routeing_area_identity) },
+    [12] = { OGS_GTP1_ACCESS_POINT_NAME_TYPE, 0, 0, 13, 11,
+        offsetof(ogs_gtp1_create_pdp_context_request_t, access_point_name) },
+    [13] = { OGS_GTP1_SV_TYPE, 0, 0, 27, 24,
+        offsetof(ogs_gtp1_create_pdp_context_request_t, imei) },
+    [16] = { OGS_GTP1_TUNNEL_ENDPOINT_IDENTIFIER_DATA_I_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp1_create_pdp_context_request_t, tunnel_endpoint_identifier_data_i) },
+    [19] = { OGS_GTP1_SIGNALLING_PRIORITY_INDICATION_TYPE, 0, 0, 35, 32,
+        offsetof(ogs_gtp1_create_pdp_context_request_t, signalling_priority_indication) },
+    [22] = { OGS_GTP1_MSISDN_TYPE, 0, 0, 17, 14,
+        offsetof(ogs_gtp1_create_pdp_context_request_t, msisdn) },
+    [24] = { OGS_GTP1_CN_OPERATOR_SELECTION_ENTITY_TYPE, 0, 0, 36, 33,
+        offsetof(ogs_gtp1_create_pdp_context_request_t, cn_operator_selection_entity) },
+    [25] = { OGS_GTP1_EXTENDED_COMMON_FLAGS_TYPE, 0, 0, 32, 29,
+        offsetof(ogs_gtp1_create_pdp_context_request_t, extended_common_flags) },
+    [31] = { OGS_GTP1_CORRELATION_ID_TYPE, 0, 0, 30, 27,
+        offsetof(ogs_gtp1_create_pdp_context_request_t, correlation_id) },
+    [33] = { OGS_GTP1_TRAFFIC_FLOW_TEMPLATE_TYPE, 0, 0, 19, 16,
+        offsetof(ogs_gtp1_create_pdp_context_request_t, tft) },
+    [49] = { OGS_GTP1_MS_TIME_ZONE_TYPE, 0, 0, 26, 23,
+        offsetof(ogs_gtp1_create_pdp_context_request_t, ms_time_zone) },
+    [50] = { OGS_GTP1_IMSI_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_create_pdp_context_request_t, imsi) },
+    [55] = { OGS_GTP1_SELECTION_MODE_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp1_create_pdp_context_request_t, selection_mode) },
+    [56] = { OGS_GTP1_OMC_IDENTITY_TYPE, 0, 0, 21, 18,
+        offsetof(ogs_gtp1_create_pdp_context_request_t, omc_identity) },
+    [60] = { OGS_GTP1_TRACE_TYPE_TYPE, 0, 0, 11, 9,
+        offsetof(ogs_gtp1_create_pdp_context_request_t, trace_type) },
+    [61] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 0, 15, 13,
+        offsetof(ogs_gtp1_create_pdp_context_request_t, sgsn_address_for_signalling) },
+    [62] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 1, 16, 13,
+        offsetof(ogs_gtp1_create_pdp_context_request_t, sgsn_address_for_user_traffic) },
+    [77] = { OGS_GTP1_APN_RESTRICTION_TYPE, 0, 0, 23, 20,
+        offsetof(ogs_gtp1_create_pdp_context_request_t, apn_restriction) },
+    [82] = { OGS_GTP1_ADDITIONAL_TRACE_INFO_TYPE, 0, 0, 29, 26,
+        offsetof(ogs_gtp1_create_pdp_context_request_t, additional_trace_info) },
+    [86] = { OGS_GTP1_AMBR_TYPE, 0, 0, 34, 31,
+        offsetof(ogs_gtp1_create_pdp_context_request_t, apn_ambr) },
+    [88] = { OGS_GTP1_USER_LOCATION_INFORMATION_TYPE, 0, 0, 25, 22,
+        offsetof(ogs_gtp1_create_pdp_context_request_t, user_location_information) },
+    [94] = { OGS_GTP1_RECOVERY_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp1_create_pdp_context_request_t, recovery) },
+    [95] = { OGS_GTP1_TRIGGER_ID_TYPE, 0, 0, 20, 17,
+        offsetof(ogs_gtp1_create_pdp_context_request_t, trigger_id) },
+    [96] = { OGS_GTP1_UP_FUNCTION_SELECTION_INDICATION_FLAGS_TYPE, 0, 0, 38, 35,
+        offsetof(ogs_gtp1_create_pdp_context_request_t, up_function_selection_indication_flags) },
+    [99] = { OGS_GTP1_TRACE_REFERENCE_TYPE, 0, 0, 10, 8,
+        offsetof(ogs_gtp1_create_pdp_context_request_t, trace_reference) },
+    [100] = { OGS_GTP1_PROTOCOL_CONFIGURATION_OPTIONS_TYPE, 0, 0, 14, 12,
+        offsetof(ogs_gtp1_create_pdp_context_request_t, protocol_configuration_options) },
+    [101] = { OGS_GTP1_CAMEL_CHARGING_INFORMATION_CONTAINER_TYPE, 0, 0, 28, 25,
+        offsetof(ogs_gtp1_create_pdp_context_request_t, camel_charging_information_container) },
+    [103] = { OGS_GTP1_EVOLVED_ALLOCATION_RETENTION_PRIORITY_I_TYPE, 0, 0, 31, 28,
+        offsetof(ogs_gtp1_create_pdp_context_request_t, evolved_allocation_retention_priority_i) },
+    [105] = { OGS_GTP1_TUNNEL_ENDPOINT_IDENTIFIER_CONTROL_PLANE_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_gtp1_create_pdp_context_request_t, tunnel_endpoint_identifier_control_plane) },
+    [111] = { OGS_GTP1_QUALITY_OF_SERVICE_PROFILE_TYPE, 0, 0, 18, 15,
+        offsetof(ogs_gtp1_create_pdp_context_request_t, quality_of_service_profile) },
+    [114] = { OGS_GTP1_UCI_TYPE, 0, 0, 33, 30,
+        offsetof(ogs_gtp1_create_pdp_context_request_t, user_csg_information) },
+    [116] = { OGS_GTP1_NSAPI_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_gtp1_create_pdp_context_request_t, nsapi) },
+    [117] = { OGS_GTP1_NSAPI_TYPE, 0, 1, 8, 6,
+        offsetof(ogs_gtp1_create_pdp_context_request_t, linked_nsapi) },
+    [118] = { OGS_GTP1_COMMON_FLAGS_TYPE, 0, 0, 22, 19,
+        offsetof(ogs_gtp1_create_pdp_context_request_t, common_flags) },
+    [127] = { OGS_GTP1_RAT_TYPE_TYPE, 0, 0, 24, 21,
+        offsetof(ogs_gtp1_create_pdp_context_request_t, rat_type) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_create_pdp_context_request = {
+    127, 36, ogs_gtp1_msg_index_create_pdp_context_request_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_create_pdp_context_request =
 {
@@ -1453,7 +1789,64 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_create_pdp_context_request =
         &ogs_gtp1_tlv_desc_mapped_ue_usage_type,
         &ogs_gtp1_tlv_desc_up_function_selection_indication_flags,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_create_pdp_context_request, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_create_pdp_context_response_slot[64] = {
+    [0] = { OGS_GTP1_END_USER_ADDRESS_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_gtp1_create_pdp_context_response_t, end_user_address) },
+    [1] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 3, 13, 9,
+        offsetof(ogs_gtp1_create_pdp_context_response_t, alternative_ggsn_address_for_user_traffic) },
+    [3] = { OGS_GTP1_CHARGING_GATEWAY_ADDRESS_TYPE, 0, 0, 15, 11,
+        offsetof(ogs_gtp1_create_pdp_context_response_t, charging_gateway_address) },
+    [4] = { OGS_GTP1_CHARGING_GATEWAY_ADDRESS_TYPE, 0, 1, 16, 11,
+        offsetof(ogs_gtp1_create_pdp_context_response_t, alternative_charging_gateway_address) },
+    [8] = { OGS_GTP1_REORDERING_REQUIRED_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_create_pdp_context_response_t, reordering_required) },
+    [10] = { OGS_GTP1_EXTENDED_COMMON_FLAGS_II_TYPE, 0, 0, 26, 21,
+        offsetof(ogs_gtp1_create_pdp_context_response_t, extended_common_flags_ii) },
+    [11] = { OGS_GTP1_CSG_INFORMATION_REPORTING_ACTION_TYPE, 0, 0, 23, 18,
+        offsetof(ogs_gtp1_create_pdp_context_response_t, csg_information_reporting_action) },
+    [13] = { OGS_GTP1_APN_RESTRICTION_TYPE, 0, 0, 18, 13,
+        offsetof(ogs_gtp1_create_pdp_context_response_t, apn_restriction) },
+    [16] = { OGS_GTP1_TUNNEL_ENDPOINT_IDENTIFIER_DATA_I_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp1_create_pdp_context_response_t, tunnel_endpoint_identifier_data_i) },
+    [22] = { OGS_GTP1_AMBR_TYPE, 0, 0, 24, 19,
+        offsetof(ogs_gtp1_create_pdp_context_response_t, apn_ambr) },
+    [25] = { OGS_GTP1_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_create_pdp_context_response_t, cause) },
+    [26] = { OGS_GTP1_EXTENDED_COMMON_FLAGS_TYPE, 0, 0, 22, 17,
+        offsetof(ogs_gtp1_create_pdp_context_response_t, extended_common_flag) },
+    [30] = { OGS_GTP1_RECOVERY_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp1_create_pdp_context_response_t, recovery) },
+    [36] = { OGS_GTP1_PROTOCOL_CONFIGURATION_OPTIONS_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_gtp1_create_pdp_context_response_t, protocol_configuration_options) },
+    [39] = { OGS_GTP1_CHARGING_ID_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_gtp1_create_pdp_context_response_t, charging_id) },
+    [40] = { OGS_GTP1_EVOLVED_ALLOCATION_RETENTION_PRIORITY_I_TYPE, 0, 0, 21, 16,
+        offsetof(ogs_gtp1_create_pdp_context_response_t, evolved_allocation_retention_priority_i) },
+    [41] = { OGS_GTP1_TUNNEL_ENDPOINT_IDENTIFIER_CONTROL_PLANE_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp1_create_pdp_context_response_t, tunnel_endpoint_identifier_control_plane) },
+    [45] = { OGS_GTP1_MS_INFO_CHANGE_REPORTING_ACTION_TYPE, 0, 0, 19, 14,
+        offsetof(ogs_gtp1_create_pdp_context_response_t, ms_info_change_reporting_action) },
+    [47] = { OGS_GTP1_QUALITY_OF_SERVICE_PROFILE_TYPE, 0, 0, 14, 10,
+        offsetof(ogs_gtp1_create_pdp_context_response_t, quality_of_service_profile) },
+    [52] = { OGS_GTP1_NSAPI_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_gtp1_create_pdp_context_response_t, nsapi) },
+    [53] = { OGS_GTP1_COMMON_FLAGS_TYPE, 0, 0, 17, 12,
+        offsetof(ogs_gtp1_create_pdp_context_response_t, common_flags) },
+    [56] = { OGS_GTP1_BEARER_CONTROL_MODE_TYPE, 0, 0, 20, 15,
+        offsetof(ogs_gtp1_create_pdp_context_response_t, bearer_control_mode) },
+    [58] = { OGS_GTP1_GGSN_BACK_OFF_TIME_TYPE, 0, 0, 25, 20,
+        offsetof(ogs_gtp1_create_pdp_context_response_t, ggsn_back_off_time) },
+    [61] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 0, 10, 9,
+        offsetof(ogs_gtp1_create_pdp_context_response_t, ggsn_address_for_control_plane) },
+    [62] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 1, 11, 9,
+        offsetof(ogs_gtp1_create_pdp_context_response_t, ggsn_address_for_user_traffic) },
+    [63] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 2, 12, 9,
+        offsetof(ogs_gtp1_create_pdp_context_response_t, alternative_ggsn_address_for_control_plane) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_create_pdp_context_response = {
+    63, 22, ogs_gtp1_msg_index_create_pdp_context_response_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_create_pdp_context_response =
 {
@@ -1487,7 +1880,72 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_create_pdp_context_response =
         &ogs_gtp1_tlv_desc_ggsn_back_off_time,
         &ogs_gtp1_tlv_desc_extended_common_flags_ii,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_create_pdp_context_response, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_update_pdp_context_request_slot[64] = {
+    [0] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 3, 13, 9,
+        offsetof(ogs_gtp1_update_pdp_context_request_t, alternative_sgsn_address_for_user_traffic) },
+    [1] = { OGS_GTP1_RAT_TYPE_TYPE, 0, 0, 19, 15,
+        offsetof(ogs_gtp1_update_pdp_context_request_t, rat_type) },
+    [6] = { OGS_GTP1_DIRECT_TUNNEL_FLAGS_TYPE, 0, 0, 23, 19,
+        offsetof(ogs_gtp1_update_pdp_context_request_t, direct_tunnel_flags) },
+    [10] = { OGS_GTP1_SV_TYPE, 0, 0, 30, 26,
+        offsetof(ogs_gtp1_update_pdp_context_request_t, imei) },
+    [11] = { OGS_GTP1_RAI_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_update_pdp_context_request_t, routeing_area_identity) },
+    [16] = { OGS_GTP1_TUNNEL_ENDPOINT_IDENTIFIER_DATA_I_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp1_update_pdp_context_request_t, tunnel_endpoint_identifier_data_i) },
+    [18] = { OGS_GTP1_ADDITIONAL_TRACE_INFO_TYPE, 0, 0, 22, 18,
+        offsetof(ogs_gtp1_update_pdp_context_request_t, additonal_trace_info) },
+    [19] = { OGS_GTP1_SIGNALLING_PRIORITY_INDICATION_TYPE, 0, 0, 28, 24,
+        offsetof(ogs_gtp1_update_pdp_context_request_t, signalling_priority_indication) },
+    [22] = { OGS_GTP1_AMBR_TYPE, 0, 0, 27, 23,
+        offsetof(ogs_gtp1_update_pdp_context_request_t, apn_ambr) },
+    [24] = { OGS_GTP1_USER_LOCATION_INFORMATION_TYPE, 0, 0, 20, 16,
+        offsetof(ogs_gtp1_update_pdp_context_request_t, user_location_information) },
+    [25] = { OGS_GTP1_EXTENDED_COMMON_FLAGS_TYPE, 0, 0, 25, 21,
+        offsetof(ogs_gtp1_update_pdp_context_request_t, extended_common_flags) },
+    [26] = { OGS_GTP1_CN_OPERATOR_SELECTION_ENTITY_TYPE, 0, 0, 29, 25,
+        offsetof(ogs_gtp1_update_pdp_context_request_t, cn_operator_selection_entity) },
+    [30] = { OGS_GTP1_RECOVERY_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp1_update_pdp_context_request_t, recovery) },
+    [31] = { OGS_GTP1_TRIGGER_ID_TYPE, 0, 0, 16, 12,
+        offsetof(ogs_gtp1_update_pdp_context_request_t, trigger_id) },
+    [33] = { OGS_GTP1_TRAFFIC_FLOW_TEMPLATE_TYPE, 0, 0, 15, 11,
+        offsetof(ogs_gtp1_update_pdp_context_request_t, tft) },
+    [35] = { OGS_GTP1_TRACE_REFERENCE_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_gtp1_update_pdp_context_request_t, trace_reference) },
+    [36] = { OGS_GTP1_PROTOCOL_CONFIGURATION_OPTIONS_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_gtp1_update_pdp_context_request_t, protocol_configuration_options) },
+    [39] = { OGS_GTP1_EVOLVED_ALLOCATION_RETENTION_PRIORITY_I_TYPE, 0, 0, 24, 20,
+        offsetof(ogs_gtp1_update_pdp_context_request_t, evolved_allocation_retention_priority_i) },
+    [41] = { OGS_GTP1_TUNNEL_ENDPOINT_IDENTIFIER_CONTROL_PLANE_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp1_update_pdp_context_request_t, tunnel_endpoint_identifier_control_plane) },
+    [47] = { OGS_GTP1_QUALITY_OF_SERVICE_PROFILE_TYPE, 0, 0, 14, 10,
+        offsetof(ogs_gtp1_update_pdp_context_request_t, quality_of_service_profile) },
+    [49] = { OGS_GTP1_MS_TIME_ZONE_TYPE, 0, 0, 21, 17,
+        offsetof(ogs_gtp1_update_pdp_context_request_t, ms_time_zone) },
+    [50] = { OGS_GTP1_IMSI_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_update_pdp_context_request_t, imsi) },
+    [51] = { OGS_GTP1_UCI_TYPE, 0, 0, 26, 22,
+        offsetof(ogs_gtp1_update_pdp_context_request_t, user_csg_information) },
+    [52] = { OGS_GTP1_NSAPI_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_gtp1_update_pdp_context_request_t, nsapi) },
+    [53] = { OGS_GTP1_COMMON_FLAGS_TYPE, 0, 0, 18, 14,
+        offsetof(ogs_gtp1_update_pdp_context_request_t, common_flags) },
+    [55] = { OGS_GTP1_OMC_IDENTITY_TYPE, 0, 0, 17, 13,
+        offsetof(ogs_gtp1_update_pdp_context_request_t, omc_identity) },
+    [60] = { OGS_GTP1_TRACE_TYPE_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_gtp1_update_pdp_context_request_t, trace_type) },
+    [61] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 0, 10, 9,
+        offsetof(ogs_gtp1_update_pdp_context_request_t, sgsn_address_for_control_plane) },
+    [62] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 1, 11, 9,
+        offsetof(ogs_gtp1_update_pdp_context_request_t, sgsn_address_for_user_traffic) },
+    [63] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 2, 12, 9,
+        offsetof(ogs_gtp1_update_pdp_context_request_t, alternative_sgsn_address_for_control_plane) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_update_pdp_context_request = {
+    63, 27, ogs_gtp1_msg_index_update_pdp_context_request_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_update_pdp_context_request =
 {
@@ -1525,7 +1983,52 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_update_pdp_context_request =
         &ogs_gtp1_tlv_desc_cn_operator_selection_entity,
         &ogs_gtp1_tlv_desc_sv,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_update_pdp_context_request, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_update_pdp_context_response_slot[64] = {
+    [0] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 3, 10, 6,
+        offsetof(ogs_gtp1_update_pdp_context_response_t, alternative_ggsn_address_for_user_traffic) },
+    [3] = { OGS_GTP1_CHARGING_GATEWAY_ADDRESS_TYPE, 0, 0, 12, 8,
+        offsetof(ogs_gtp1_update_pdp_context_response_t, charging_gateway_address) },
+    [4] = { OGS_GTP1_CHARGING_GATEWAY_ADDRESS_TYPE, 0, 1, 13, 8,
+        offsetof(ogs_gtp1_update_pdp_context_response_t, alternative_charging_gateway_address) },
+    [11] = { OGS_GTP1_CSG_INFORMATION_REPORTING_ACTION_TYPE, 0, 0, 19, 14,
+        offsetof(ogs_gtp1_update_pdp_context_response_t, csg_information_reporting_action) },
+    [13] = { OGS_GTP1_APN_RESTRICTION_TYPE, 0, 0, 15, 10,
+        offsetof(ogs_gtp1_update_pdp_context_response_t, apn_restriction) },
+    [16] = { OGS_GTP1_TUNNEL_ENDPOINT_IDENTIFIER_DATA_I_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp1_update_pdp_context_response_t, tunnel_endpoint_identifier_data_i) },
+    [22] = { OGS_GTP1_AMBR_TYPE, 0, 0, 20, 15,
+        offsetof(ogs_gtp1_update_pdp_context_response_t, apn_ambr) },
+    [25] = { OGS_GTP1_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_update_pdp_context_response_t, cause) },
+    [30] = { OGS_GTP1_RECOVERY_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_update_pdp_context_response_t, recovery) },
+    [36] = { OGS_GTP1_PROTOCOL_CONFIGURATION_OPTIONS_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_gtp1_update_pdp_context_response_t, protocol_configuration_options) },
+    [39] = { OGS_GTP1_CHARGING_ID_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp1_update_pdp_context_response_t, charging_id) },
+    [40] = { OGS_GTP1_EVOLVED_ALLOCATION_RETENTION_PRIORITY_I_TYPE, 0, 0, 18, 13,
+        offsetof(ogs_gtp1_update_pdp_context_response_t, evolved_allocation_retention_priority_i) },
+    [41] = { OGS_GTP1_TUNNEL_ENDPOINT_IDENTIFIER_CONTROL_PLANE_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp1_update_pdp_context_response_t, tunnel_endpoint_identifier_control_plane) },
+    [45] = { OGS_GTP1_MS_INFO_CHANGE_REPORTING_ACTION_TYPE, 0, 0, 17, 12,
+        offsetof(ogs_gtp1_update_pdp_context_response_t, ms_info_change_reporting_action) },
+    [47] = { OGS_GTP1_QUALITY_OF_SERVICE_PROFILE_TYPE, 0, 0, 11, 7,
+        offsetof(ogs_gtp1_update_pdp_context_response_t, quality_of_service_profile) },
+    [52] = { OGS_GTP1_COMMON_FLAGS_TYPE, 0, 0, 14, 9,
+        offsetof(ogs_gtp1_update_pdp_context_response_t, common_flags) },
+    [56] = { OGS_GTP1_BEARER_CONTROL_MODE_TYPE, 0, 0, 16, 11,
+        offsetof(ogs_gtp1_update_pdp_context_response_t, bearer_control_mode) },
+    [61] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_gtp1_update_pdp_context_response_t, ggsn_address_for_control_plane) },
+    [62] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 1, 8, 6,
+        offsetof(ogs_gtp1_update_pdp_context_response_t, ggsn_address_for_user_traffic) },
+    [63] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 2, 9, 6,
+        offsetof(ogs_gtp1_update_pdp_context_response_t, alternative_ggsn_address_for_control_plane) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_update_pdp_context_response = {
+    63, 16, ogs_gtp1_msg_index_update_pdp_context_response_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_update_pdp_context_response =
 {
@@ -1553,7 +2056,28 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_update_pdp_context_response =
         &ogs_gtp1_tlv_desc_csg_information_reporting_action,
         &ogs_gtp1_tlv_desc_ambr,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_update_pdp_context_response, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_delete_pdp_context_request_slot[16] = {
+    [1] = { OGS_GTP1_MS_TIME_ZONE_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_gtp1_delete_pdp_context_request_t, ms_time_zone) },
+    [4] = { OGS_GTP1_NSAPI_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp1_delete_pdp_context_request_t, nsapi) },
+    [5] = { OGS_GTP1_PROTOCOL_CONFIGURATION_OPTIONS_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp1_delete_pdp_context_request_t, protocol_configuration_options) },
+    [6] = { OGS_GTP1_ULI_TIMESTAMP_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_gtp1_delete_pdp_context_request_t, uli_timestamp) },
+    [8] = { OGS_GTP1_USER_LOCATION_INFORMATION_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp1_delete_pdp_context_request_t, user_location_information) },
+    [9] = { OGS_GTP1_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_delete_pdp_context_request_t, cause) },
+    [10] = { OGS_GTP1_EXTENDED_COMMON_FLAGS_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_gtp1_delete_pdp_context_request_t, extended_common_flags) },
+    [11] = { OGS_GTP1_TEARDOWN_IND_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_delete_pdp_context_request_t, teardown_ind) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_delete_pdp_context_request = {
+    15, 8, ogs_gtp1_msg_index_delete_pdp_context_request_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_delete_pdp_context_request =
 {
@@ -1569,7 +2093,22 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_delete_pdp_context_request =
         &ogs_gtp1_tlv_desc_extended_common_flags,
         &ogs_gtp1_tlv_desc_uli_timestamp,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_delete_pdp_context_request, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_delete_pdp_context_response_slot[16] = {
+    [1] = { OGS_GTP1_MS_TIME_ZONE_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp1_delete_pdp_context_response_t, ms_time_zone) },
+    [4] = { OGS_GTP1_PROTOCOL_CONFIGURATION_OPTIONS_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_delete_pdp_context_response_t, protocol_configuration_options) },
+    [6] = { OGS_GTP1_ULI_TIMESTAMP_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp1_delete_pdp_context_response_t, uli_timestamp) },
+    [8] = { OGS_GTP1_USER_LOCATION_INFORMATION_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp1_delete_pdp_context_response_t, user_location_information) },
+    [9] = { OGS_GTP1_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_delete_pdp_context_response_t, cause) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_delete_pdp_context_response = {
+    15, 5, ogs_gtp1_msg_index_delete_pdp_context_response_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_delete_pdp_context_response =
 {
@@ -1582,7 +2121,24 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_delete_pdp_context_response =
         &ogs_gtp1_tlv_desc_ms_time_zone,
         &ogs_gtp1_tlv_desc_uli_timestamp,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_delete_pdp_context_response, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_initiate_pdp_context_activation_request_slot[16] = {
+    [0] = { OGS_GTP1_CORRELATION_ID_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp1_initiate_pdp_context_activation_request_t, correlation_id) },
+    [1] = { OGS_GTP1_TRAFFIC_FLOW_TEMPLATE_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp1_initiate_pdp_context_activation_request_t, tft) },
+    [4] = { OGS_GTP1_NSAPI_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_initiate_pdp_context_activation_request_t, linked_nsapi) },
+    [5] = { OGS_GTP1_PROTOCOL_CONFIGURATION_OPTIONS_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_initiate_pdp_context_activation_request_t, protocol_configuration_options) },
+    [7] = { OGS_GTP1_EVOLVED_ALLOCATION_RETENTION_PRIORITY_I_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_gtp1_initiate_pdp_context_activation_request_t, evolved_allocation_retention_priority_i) },
+    [15] = { OGS_GTP1_QUALITY_OF_SERVICE_PROFILE_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp1_initiate_pdp_context_activation_request_t, quality_of_service_profile) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_initiate_pdp_context_activation_request = {
+    15, 6, ogs_gtp1_msg_index_initiate_pdp_context_activation_request_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_initiate_pdp_context_activation_request =
 {
@@ -1596,7 +2152,16 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_initiate_pdp_context_activation_request =
         &ogs_gtp1_tlv_desc_correlation_id,
         &ogs_gtp1_tlv_desc_evolved_allocation_retention_priority_i,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_initiate_pdp_context_activation_request, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_initiate_pdp_context_activation_response_slot[4] = {
+    [0] = { OGS_GTP1_PROTOCOL_CONFIGURATION_OPTIONS_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_initiate_pdp_context_activation_response_t, protocol_configuration_options) },
+    [1] = { OGS_GTP1_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_initiate_pdp_context_activation_response_t, cause) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_initiate_pdp_context_activation_response = {
+    3, 2, ogs_gtp1_msg_index_initiate_pdp_context_activation_response_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_initiate_pdp_context_activation_response =
 {
@@ -1606,7 +2171,24 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_initiate_pdp_context_activation_response =
         &ogs_gtp1_tlv_desc_cause,
         &ogs_gtp1_tlv_desc_protocol_configuration_options,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_initiate_pdp_context_activation_response, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_pdu_notification_request_slot[16] = {
+    [0] = { OGS_GTP1_END_USER_ADDRESS_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp1_pdu_notification_request_t, end_user_address) },
+    [2] = { OGS_GTP1_IMSI_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_pdu_notification_request_t, imsi) },
+    [4] = { OGS_GTP1_PROTOCOL_CONFIGURATION_OPTIONS_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp1_pdu_notification_request_t, protocol_configuration_options) },
+    [9] = { OGS_GTP1_TUNNEL_ENDPOINT_IDENTIFIER_CONTROL_PLANE_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_pdu_notification_request_t, tunnel_endpoint_identifier_control_plane) },
+    [11] = { OGS_GTP1_ACCESS_POINT_NAME_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp1_pdu_notification_request_t, access_point_name) },
+    [13] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_gtp1_pdu_notification_request_t, ggsn_address_for_control_plane) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_pdu_notification_request = {
+    15, 6, ogs_gtp1_msg_index_pdu_notification_request_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_pdu_notification_request =
 {
@@ -1620,7 +2202,14 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_pdu_notification_request =
         &ogs_gtp1_tlv_desc_protocol_configuration_options,
         &ogs_gtp1_tlv_desc_gsn_address,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_pdu_notification_request, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_pdu_notification_response_slot[2] = {
+    [1] = { OGS_GTP1_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_pdu_notification_response_t, cause) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_pdu_notification_response = {
+    1, 1, ogs_gtp1_msg_index_pdu_notification_response_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_pdu_notification_response =
 {
@@ -1629,7 +2218,22 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_pdu_notification_response =
     0, 0, 0, 0, {
         &ogs_gtp1_tlv_desc_cause,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_pdu_notification_response, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_pdu_notification_reject_request_slot[16] = {
+    [0] = { OGS_GTP1_END_USER_ADDRESS_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp1_pdu_notification_reject_request_t, end_user_address) },
+    [4] = { OGS_GTP1_PROTOCOL_CONFIGURATION_OPTIONS_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp1_pdu_notification_reject_request_t, protocol_configuration_options) },
+    [9] = { OGS_GTP1_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_pdu_notification_reject_request_t, cause) },
+    [10] = { OGS_GTP1_TUNNEL_ENDPOINT_IDENTIFIER_CONTROL_PLANE_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_pdu_notification_reject_request_t, tunnel_endpoint_identifier_control_plane) },
+    [11] = { OGS_GTP1_ACCESS_POINT_NAME_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp1_pdu_notification_reject_request_t, access_point_name) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_pdu_notification_reject_request = {
+    15, 5, ogs_gtp1_msg_index_pdu_notification_reject_request_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_pdu_notification_reject_request =
 {
@@ -1642,7 +2246,14 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_pdu_notification_reject_request =
         &ogs_gtp1_tlv_desc_access_point_name,
         &ogs_gtp1_tlv_desc_protocol_configuration_options,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_pdu_notification_reject_request, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_pdu_notification_reject_response_slot[2] = {
+    [1] = { OGS_GTP1_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_pdu_notification_reject_response_t, cause) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_pdu_notification_reject_response = {
+    1, 1, ogs_gtp1_msg_index_pdu_notification_reject_response_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_pdu_notification_reject_response =
 {
@@ -1651,7 +2262,14 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_pdu_notification_reject_response =
     0, 0, 0, 0, {
         &ogs_gtp1_tlv_desc_cause,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_pdu_notification_reject_response, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_supported_extension_headers_notification_slot[2] = {
+    [1] = { OGS_GTP1_EXTENSION_HEADER_TYPE_LIST_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_supported_extension_headers_notification_t, extension_header_type_list) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_supported_extension_headers_notification = {
+    1, 1, ogs_gtp1_msg_index_supported_extension_headers_notification_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_supported_extension_headers_notification =
 {
@@ -1660,7 +2278,14 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_supported_extension_headers_notification =
     0, 0, 0, 0, {
         &ogs_gtp1_tlv_desc_extension_header_type_list,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_supported_extension_headers_notification, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_send_routeing_information_for_gprs_request_slot[2] = {
+    [0] = { OGS_GTP1_IMSI_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_send_routeing_information_for_gprs_request_t, imsi) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_send_routeing_information_for_gprs_request = {
+    1, 1, ogs_gtp1_msg_index_send_routeing_information_for_gprs_request_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_send_routeing_information_for_gprs_request =
 {
@@ -1669,7 +2294,22 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_send_routeing_information_for_gprs_request =
     0, 0, 0, 0, {
         &ogs_gtp1_tlv_desc_imsi,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_send_routeing_information_for_gprs_request, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_send_routeing_information_for_gprs_response_slot[16] = {
+    [2] = { OGS_GTP1_IMSI_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_send_routeing_information_for_gprs_response_t, imsi) },
+    [3] = { OGS_GTP1_MAP_CAUSE_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp1_send_routeing_information_for_gprs_response_t, map_cause) },
+    [5] = { OGS_GTP1_MS_NOT_REACHABLE_REASON_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp1_send_routeing_information_for_gprs_response_t, ms_not_reachable_reason) },
+    [9] = { OGS_GTP1_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_send_routeing_information_for_gprs_response_t, cause) },
+    [13] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp1_send_routeing_information_for_gprs_response_t, gsn_address) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_send_routeing_information_for_gprs_response = {
+    15, 5, ogs_gtp1_msg_index_send_routeing_information_for_gprs_response_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_send_routeing_information_for_gprs_response =
 {
@@ -1682,7 +2322,14 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_send_routeing_information_for_gprs_response =
         &ogs_gtp1_tlv_desc_ms_not_reachable_reason,
         &ogs_gtp1_tlv_desc_gsn_address,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_send_routeing_information_for_gprs_response, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_failure_report_request_slot[2] = {
+    [0] = { OGS_GTP1_IMSI_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_failure_report_request_t, imsi) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_failure_report_request = {
+    1, 1, ogs_gtp1_msg_index_failure_report_request_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_failure_report_request =
 {
@@ -1691,7 +2338,16 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_failure_report_request =
     0, 0, 0, 0, {
         &ogs_gtp1_tlv_desc_imsi,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_failure_report_request, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_failure_report_response_slot[4] = {
+    [1] = { OGS_GTP1_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_failure_report_response_t, cause) },
+    [3] = { OGS_GTP1_MAP_CAUSE_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_failure_report_response_t, map_cause) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_failure_report_response = {
+    3, 2, ogs_gtp1_msg_index_failure_report_response_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_failure_report_response =
 {
@@ -1701,7 +2357,16 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_failure_report_response =
         &ogs_gtp1_tlv_desc_cause,
         &ogs_gtp1_tlv_desc_map_cause,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_failure_report_response, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_note_ms_gprs_present_request_slot[4] = {
+    [1] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_note_ms_gprs_present_request_t, gsn_address) },
+    [2] = { OGS_GTP1_IMSI_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_note_ms_gprs_present_request_t, imsi) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_note_ms_gprs_present_request = {
+    3, 2, ogs_gtp1_msg_index_note_ms_gprs_present_request_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_note_ms_gprs_present_request =
 {
@@ -1711,7 +2376,14 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_note_ms_gprs_present_request =
         &ogs_gtp1_tlv_desc_imsi,
         &ogs_gtp1_tlv_desc_gsn_address,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_note_ms_gprs_present_request, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_note_ms_gprs_present_response_slot[2] = {
+    [1] = { OGS_GTP1_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_note_ms_gprs_present_response_t, cause) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_note_ms_gprs_present_response = {
+    1, 1, ogs_gtp1_msg_index_note_ms_gprs_present_response_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_note_ms_gprs_present_response =
 {
@@ -1720,7 +2392,22 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_note_ms_gprs_present_response =
     0, 0, 0, 0, {
         &ogs_gtp1_tlv_desc_cause,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_note_ms_gprs_present_response, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_identification_request_slot[16] = {
+    [11] = { OGS_GTP1_RAI_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_identification_request_t, routeing_area_identity) },
+    [12] = { OGS_GTP1_P_TMSI_SIGNATURE_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp1_identification_request_t, p_tmsi_signature) },
+    [13] = { OGS_GTP1_P_TMSI_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_identification_request_t, packet_tmsi) },
+    [14] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp1_identification_request_t, sgsn_address_for_control_plane) },
+    [15] = { OGS_GTP1_HOP_COUNTER_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp1_identification_request_t, hop_counter) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_identification_request = {
+    15, 5, ogs_gtp1_msg_index_identification_request_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_identification_request =
 {
@@ -1733,7 +2420,24 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_identification_request =
         &ogs_gtp1_tlv_desc_gsn_address,
         &ogs_gtp1_tlv_desc_hop_counter,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_identification_request, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_identification_response_slot[16] = {
+    [1] = { OGS_GTP1_AUTHENTICATION_TRIPLET_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp1_identification_response_t, authentication_triplet) },
+    [2] = { OGS_GTP1_IMSI_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_identification_response_t, imsi) },
+    [3] = { OGS_GTP1_UE_USAGE_TYPE_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp1_identification_response_t, ue_usage_type) },
+    [8] = { OGS_GTP1_AUTHENTICATION_QUINTUPLET_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp1_identification_response_t, authentication_quintuplet) },
+    [9] = { OGS_GTP1_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_identification_response_t, cause) },
+    [14] = { OGS_GTP1_IOV_UPDATES_COUNTER_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_gtp1_identification_response_t, iov_updates_counter) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_identification_response = {
+    15, 6, ogs_gtp1_msg_index_identification_response_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_identification_response =
 {
@@ -1747,7 +2451,36 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_identification_response =
         &ogs_gtp1_tlv_desc_ue_usage_type,
         &ogs_gtp1_tlv_desc_iov_updates_counter,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_identification_response, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_sgsn_context_request_slot[32] = {
+    [0] = { OGS_GTP1_RAT_TYPE_TYPE, 0, 0, 11, 9,
+        offsetof(ogs_gtp1_sgsn_context_request_t, rat_type) },
+    [4] = { OGS_GTP1_TLLI_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp1_sgsn_context_request_t, temporary_logical_link_identifier) },
+    [5] = { OGS_GTP1_MS_VALIDATED_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_gtp1_sgsn_context_request_t, ms_validated) },
+    [9] = { OGS_GTP1_TUNNEL_ENDPOINT_IDENTIFIER_CONTROL_PLANE_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_gtp1_sgsn_context_request_t, tunnel_endpoint_identifier_control_plane) },
+    [11] = { OGS_GTP1_RAI_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_sgsn_context_request_t, routeing_area_identity) },
+    [12] = { OGS_GTP1_P_TMSI_SIGNATURE_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp1_sgsn_context_request_t, p_tmsi_signature) },
+    [13] = { OGS_GTP1_HOP_COUNTER_TYPE, 0, 0, 12, 10,
+        offsetof(ogs_gtp1_sgsn_context_request_t, hop_counter) },
+    [18] = { OGS_GTP1_IMSI_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_sgsn_context_request_t, imsi) },
+    [27] = { OGS_GTP1_SGSN_NUMBER_TYPE, 0, 0, 10, 8,
+        offsetof(ogs_gtp1_sgsn_context_request_t, sgsn_number) },
+    [29] = { OGS_GTP1_P_TMSI_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp1_sgsn_context_request_t, packet_tmsi) },
+    [30] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_gtp1_sgsn_context_request_t, sgsn_address_for_control_plane) },
+    [31] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 1, 9, 7,
+        offsetof(ogs_gtp1_sgsn_context_request_t, alternative_sgsn_address_for_control_plane) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_sgsn_context_request = {
+    31, 11, ogs_gtp1_msg_index_sgsn_context_request_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_sgsn_context_request =
 {
@@ -1767,7 +2500,76 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_sgsn_context_request =
         &ogs_gtp1_tlv_desc_rat_type,
         &ogs_gtp1_tlv_desc_hop_counter,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_sgsn_context_request, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_sgsn_context_response_slot[64] = {
+    [0] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 2, 14, 11,
+        offsetof(ogs_gtp1_sgsn_context_response_t, alternative_ggsn_address_for_user_traffic) },
+    [1] = { OGS_GTP1_EVOLVED_ALLOCATION_RETENTION_PRIORITY_II_TYPE, 0, 0, 20, 16,
+        offsetof(ogs_gtp1_sgsn_context_response_t, evolved_allocation_retention_priority_ii) },
+    [2] = { OGS_GTP1_LHN_ID_WITH_NSAPI_TYPE, 0, 0, 28, 24,
+        offsetof(ogs_gtp1_sgsn_context_response_t, local_home_network_id_with_nsapi) },
+    [5] = { OGS_GTP1_HIGHER_BITRATES_THAN_16_MBPS_FLAG_TYPE, 0, 0, 26, 22,
+        offsetof(ogs_gtp1_sgsn_context_response_t, higher_bitrates_than_16_mbps_flag) },
+    [8] = { OGS_GTP1_UE_AMBR_TYPE, 0, 0, 23, 19,
+        offsetof(ogs_gtp1_sgsn_context_response_t, ue_ambr) },
+    [10] = { OGS_GTP1_CHARGING_CHARACTERISTICS_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_gtp1_sgsn_context_response_t, charging_characteristics) },
+    [11] = { OGS_GTP1_EXTENDED_COMMON_FLAGS_II_TYPE, 0, 0, 30, 26,
+        offsetof(ogs_gtp1_sgsn_context_response_t, extended_common_flags_ii) },
+    [13] = { OGS_GTP1_SELECTION_MODE_WITH_NSAPI_TYPE, 0, 0, 27, 23,
+        offsetof(ogs_gtp1_sgsn_context_response_t, selection_mode_with_nsapi) },
+    [14] = { OGS_GTP1_FQDN_TYPE, 0, 0, 19, 15,
+        offsetof(ogs_gtp1_sgsn_context_response_t, co_located_ggsn_pgw_fqdn) },
+    [21] = { OGS_GTP1_SCEF_PDN_CONNECTION_TYPE, 0, 0, 31, 27,
+        offsetof(ogs_gtp1_sgsn_context_response_t, ue_scef_pdn_connection) },
+    [24] = { OGS_GTP1_RADIO_PRIORITY_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_gtp1_sgsn_context_response_t, radio_priority) },
+    [25] = { OGS_GTP1_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_sgsn_context_response_t, cause) },
+    [26] = { OGS_GTP1_MM_CONTEXT_TYPE, 0, 0, 10, 9,
+        offsetof(ogs_gtp1_sgsn_context_response_t, mm_context) },
+    [27] = { OGS_GTP1_EXTENDED_COMMON_FLAGS_TYPE, 0, 0, 21, 17,
+        offsetof(ogs_gtp1_sgsn_context_response_t, extended_common_flags) },
+    [33] = { OGS_GTP1_APN_AMBR_WITH_NSAPI_TYPE, 0, 0, 24, 20,
+        offsetof(ogs_gtp1_sgsn_context_response_t, apn_ambr_with_nsapi) },
+    [38] = { OGS_GTP1_RAB_CONTEXT_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp1_sgsn_context_response_t, rab_context) },
+    [39] = { OGS_GTP1_RADIO_PRIORITY_LCS_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_gtp1_sgsn_context_response_t, radio_priority_lcs) },
+    [41] = { OGS_GTP1_TUNNEL_ENDPOINT_IDENTIFIER_CONTROL_PLANE_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp1_sgsn_context_response_t, tunnel_endpoint_identifier_control_plane) },
+    [42] = { OGS_GTP1_PDP_CONTEXT_PRIORITIZATION_TYPE, 0, 0, 15, 12,
+        offsetof(ogs_gtp1_sgsn_context_response_t, pdp_context_prioritization) },
+    [44] = { OGS_GTP1_SIGNALLING_PRIORITY_INDICATION_WITH_NSAPI_TYPE, 0, 0, 25, 21,
+        offsetof(ogs_gtp1_sgsn_context_response_t, signalling_priority_indication_with_nsapi) },
+    [46] = { OGS_GTP1_IOV_UPDATES_COUNTER_TYPE, 0, 0, 32, 28,
+        offsetof(ogs_gtp1_sgsn_context_response_t, iov_updates_counter) },
+    [47] = { OGS_GTP1_UE_NETWORK_CAPABILITY_TYPE, 0, 0, 22, 18,
+        offsetof(ogs_gtp1_sgsn_context_response_t, ue_network_capability) },
+    [49] = { OGS_GTP1_PACKET_FLOW_ID_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_gtp1_sgsn_context_response_t, packet_flow_id) },
+    [50] = { OGS_GTP1_IMSI_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_sgsn_context_response_t, imsi) },
+    [51] = { OGS_GTP1_PDP_CONTEXT_TYPE, 0, 0, 11, 10,
+        offsetof(ogs_gtp1_sgsn_context_response_t, pdp_context) },
+    [52] = { OGS_GTP1_UE_USAGE_TYPE_TYPE, 0, 0, 29, 25,
+        offsetof(ogs_gtp1_sgsn_context_response_t, ue_usage_type) },
+    [53] = { OGS_GTP1_RFSP_INDEX_TYPE, 0, 0, 17, 14,
+        offsetof(ogs_gtp1_sgsn_context_response_t, subscribed_rfsp_index) },
+    [54] = { OGS_GTP1_RFSP_INDEX_TYPE, 0, 1, 18, 14,
+        offsetof(ogs_gtp1_sgsn_context_response_t, rfsp_index_in_use) },
+    [60] = { OGS_GTP1_MBMS_UE_CONTEXT_TYPE, 0, 0, 16, 13,
+        offsetof(ogs_gtp1_sgsn_context_response_t, mbms_ue_context) },
+    [61] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 0, 12, 11,
+        offsetof(ogs_gtp1_sgsn_context_response_t, sgsn_address_for_control_plane) },
+    [62] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 1, 13, 11,
+        offsetof(ogs_gtp1_sgsn_context_response_t, alternative_ggsn_address_for_control_plane) },
+    [63] = { OGS_GTP1_RADIO_PRIORITY_SMS_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp1_sgsn_context_response_t, radio_priority_sms) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_sgsn_context_response = {
+    63, 29, ogs_gtp1_msg_index_sgsn_context_response_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_sgsn_context_response =
 {
@@ -1807,7 +2609,22 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_sgsn_context_response =
         &ogs_gtp1_tlv_desc_scef_pdn_connection,
         &ogs_gtp1_tlv_desc_iov_updates_counter,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_sgsn_context_response, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_sgsn_context_acknowledge_slot[16] = {
+    [2] = { OGS_GTP1_TUNNEL_ENDPOINT_IDENTIFIER_DATA_II_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_sgsn_context_acknowledge_t, tunnel_endpoint_identifier_data_ii) },
+    [3] = { OGS_GTP1_NODE_IDENTIFIER_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp1_sgsn_context_acknowledge_t, node_identifier) },
+    [9] = { OGS_GTP1_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_sgsn_context_acknowledge_t, cause) },
+    [11] = { OGS_GTP1_SGSN_NUMBER_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp1_sgsn_context_acknowledge_t, sgsn_number) },
+    [13] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp1_sgsn_context_acknowledge_t, sgsn_address_for_user_traffic) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_sgsn_context_acknowledge = {
+    15, 5, ogs_gtp1_msg_index_sgsn_context_acknowledge_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_sgsn_context_acknowledge =
 {
@@ -1820,7 +2637,98 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_sgsn_context_acknowledge =
         &ogs_gtp1_tlv_desc_sgsn_number,
         &ogs_gtp1_tlv_desc_node_identifier,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_sgsn_context_acknowledge, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_forward_relocation_request_slot[128] = {
+    [2] = { OGS_GTP1_C_MSISDN_TYPE, 0, 0, 37, 33,
+        offsetof(ogs_gtp1_forward_relocation_request_t, c_msisdn) },
+    [4] = { OGS_GTP1_SELECTED_PLMN_ID_TYPE, 0, 0, 15, 12,
+        offsetof(ogs_gtp1_forward_relocation_request_t, selected_plmn_id) },
+    [8] = { OGS_GTP1_UE_AMBR_TYPE, 0, 0, 30, 26,
+        offsetof(ogs_gtp1_forward_relocation_request_t, ue_ambr) },
+    [10] = { OGS_GTP1_CHARGING_CHARACTERISTICS_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp1_forward_relocation_request_t, charging_characteristics) },
+    [13] = { OGS_GTP1_SELECTION_MODE_WITH_NSAPI_TYPE, 0, 0, 40, 36,
+        offsetof(ogs_gtp1_forward_relocation_request_t, selection_mode_with_nsapi) },
+    [14] = { OGS_GTP1_FQDN_TYPE, 0, 0, 24, 20,
+        offsetof(ogs_gtp1_forward_relocation_request_t, co_located_ggsn_pgw_fqdn) },
+    [20] = { OGS_GTP1_PS_HANDOVER_XID_PARAMETERS_TYPE, 0, 0, 19, 16,
+        offsetof(ogs_gtp1_forward_relocation_request_t, ps_handover_xid_parameters) },
+    [25] = { OGS_GTP1_EXTENDED_COMMON_FLAGS_TYPE, 0, 0, 26, 22,
+        offsetof(ogs_gtp1_forward_relocation_request_t, extended_common_flags) },
+    [36] = { OGS_GTP1_CSG_ID_TYPE, 0, 0, 27, 23,
+        offsetof(ogs_gtp1_forward_relocation_request_t, csg_id) },
+    [37] = { OGS_GTP1_BSS_CONTAINER_TYPE, 0, 0, 16, 13,
+        offsetof(ogs_gtp1_forward_relocation_request_t, bss_container) },
+    [41] = { OGS_GTP1_STN_SR_TYPE, 0, 0, 36, 32,
+        offsetof(ogs_gtp1_forward_relocation_request_t, stn_sr) },
+    [47] = { OGS_GTP1_UE_NETWORK_CAPABILITY_TYPE, 0, 0, 29, 25,
+        offsetof(ogs_gtp1_forward_relocation_request_t, ue_network_capability) },
+    [48] = { OGS_GTP1_BSSGP_CAUSE_TYPE, 0, 0, 18, 15,
+        offsetof(ogs_gtp1_forward_relocation_request_t, bssgp_cause) },
+    [49] = { OGS_GTP1_PACKET_FLOW_ID_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp1_forward_relocation_request_t, packet_flow_id) },
+    [50] = { OGS_GTP1_IMSI_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_forward_relocation_request_t, imsi) },
+    [51] = { OGS_GTP1_PDP_CONTEXT_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_gtp1_forward_relocation_request_t, pdp_context) },
+    [52] = { OGS_GTP1_ENODEB_ID_TYPE, 0, 0, 39, 35,
+        offsetof(ogs_gtp1_forward_relocation_request_t, enodeb_id) },
+    [53] = { OGS_GTP1_RFSP_INDEX_TYPE, 0, 0, 22, 19,
+        offsetof(ogs_gtp1_forward_relocation_request_t, subscribed_rfsp_index) },
+    [54] = { OGS_GTP1_RFSP_INDEX_TYPE, 0, 1, 23, 19,
+        offsetof(ogs_gtp1_forward_relocation_request_t, rfsp_index_in_use) },
+    [60] = { OGS_GTP1_MBMS_UE_CONTEXT_TYPE, 0, 0, 14, 11,
+        offsetof(ogs_gtp1_forward_relocation_request_t, mbms_ue_context) },
+    [61] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_gtp1_forward_relocation_request_t, sgsn_address_for_control_plane) },
+    [62] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 1, 9, 7,
+        offsetof(ogs_gtp1_forward_relocation_request_t, alternative_ggsn_address_for_control_plane) },
+    [63] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 2, 10, 7,
+        offsetof(ogs_gtp1_forward_relocation_request_t, alternative_ggsn_address_for_user_traffic) },
+    [64] = { OGS_GTP1_EVOLVED_ALLOCATION_RETENTION_PRIORITY_II_TYPE, 0, 0, 25, 21,
+        offsetof(ogs_gtp1_forward_relocation_request_t, evolved_allocation_retention_priority_ii) },
+    [69] = { OGS_GTP1_HIGHER_BITRATES_THAN_16_MBPS_FLAG_TYPE, 0, 0, 33, 29,
+        offsetof(ogs_gtp1_forward_relocation_request_t, higher_bitrates_than_16_mbps_flag) },
+    [70] = { OGS_GTP1_DIRECT_TUNNEL_FLAGS_TYPE, 0, 0, 20, 17,
+        offsetof(ogs_gtp1_forward_relocation_request_t, direct_tunnel_flags) },
+    [74] = { OGS_GTP1_EXTENDED_COMMON_FLAGS_II_TYPE, 0, 0, 42, 38,
+        offsetof(ogs_gtp1_forward_relocation_request_t, extended_common_flags_ii) },
+    [77] = { OGS_GTP1_RANAP_CAUSE_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp1_forward_relocation_request_t, ranap_cause) },
+    [80] = { OGS_GTP1_ADDITIONAL_FLAGS_FOR_SRVCC_TYPE, 0, 0, 35, 31,
+        offsetof(ogs_gtp1_forward_relocation_request_t, additional_flags_for_srvcc) },
+    [83] = { OGS_GTP1_UTRAN_TRANSPARENT_CONTAINER_TYPE, 0, 0, 12, 9,
+        offsetof(ogs_gtp1_forward_relocation_request_t, utran_transparent_container) },
+    [85] = { OGS_GTP1_SCEF_PDN_CONNECTION_TYPE, 0, 0, 43, 39,
+        offsetof(ogs_gtp1_forward_relocation_request_t, ue_scef_pdn_connection) },
+    [89] = { OGS_GTP1_MM_CONTEXT_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_gtp1_forward_relocation_request_t, mm_context) },
+    [91] = { OGS_GTP1_EXTENDED_RANAP_CAUSE_TYPE, 0, 0, 38, 34,
+        offsetof(ogs_gtp1_forward_relocation_request_t, extended_ranap_cause) },
+    [92] = { OGS_GTP1_RELIABLE_INTER_RAT_HANDOVER_INFO_TYPE, 0, 0, 21, 18,
+        offsetof(ogs_gtp1_forward_relocation_request_t, reliable_inter_rat_handover_info) },
+    [97] = { OGS_GTP1_APN_AMBR_WITH_NSAPI_TYPE, 0, 0, 31, 27,
+        offsetof(ogs_gtp1_forward_relocation_request_t, apn_ambr_with_nsapi) },
+    [105] = { OGS_GTP1_TUNNEL_ENDPOINT_IDENTIFIER_CONTROL_PLANE_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_forward_relocation_request_t, tunnel_endpoint_identifier_control_plane) },
+    [106] = { OGS_GTP1_PDP_CONTEXT_PRIORITIZATION_TYPE, 0, 0, 13, 10,
+        offsetof(ogs_gtp1_forward_relocation_request_t, pdp_context_prioritization) },
+    [108] = { OGS_GTP1_SIGNALLING_PRIORITY_INDICATION_WITH_NSAPI_TYPE, 0, 0, 32, 28,
+        offsetof(ogs_gtp1_forward_relocation_request_t, signalling_priority_indication_with_nsapi) },
+    [113] = { OGS_GTP1_UE_USAGE_TYPE_TYPE, 0, 0, 41, 37,
+        offsetof(ogs_gtp1_forward_relocation_request_t, ue_usage_type) },
+    [119] = { OGS_GTP1_ADDITIONAL_MM_CONTEXT_FOR_SRVCC_TYPE, 0, 0, 34, 30,
+        offsetof(ogs_gtp1_forward_relocation_request_t, additional_mm_context_for_srvcc) },
+    [122] = { OGS_GTP1_TARGET_IDENTIFICATION_TYPE, 0, 0, 11, 8,
+        offsetof(ogs_gtp1_forward_relocation_request_t, target_identification) },
+    [125] = { OGS_GTP1_CMI_TYPE, 0, 0, 28, 24,
+        offsetof(ogs_gtp1_forward_relocation_request_t, csg_membership_indication) },
+    [126] = { OGS_GTP1_CELL_IDENTIFICATION_TYPE, 0, 0, 17, 14,
+        offsetof(ogs_gtp1_forward_relocation_request_t, cell_identification) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_forward_relocation_request = {
+    127, 40, ogs_gtp1_msg_index_forward_relocation_request_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_forward_relocation_request =
 {
@@ -1871,7 +2779,42 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_forward_relocation_request =
         &ogs_gtp1_tlv_desc_extended_common_flags_ii,
         &ogs_gtp1_tlv_desc_scef_pdn_connection,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_forward_relocation_request, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_forward_relocation_response_slot[32] = {
+    [2] = { OGS_GTP1_TUNNEL_ENDPOINT_IDENTIFIER_DATA_II_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp1_forward_relocation_response_t, tunnel_endpoint_identifier_data_ii) },
+    [3] = { OGS_GTP1_ADDITIONAL_RAB_SETUP_INFORMATION_TYPE, 0, 0, 9, 7,
+        offsetof(ogs_gtp1_forward_relocation_response_t, additional_rab_setup_information) },
+    [4] = { OGS_GTP1_NODE_IDENTIFIER_TYPE, 0, 0, 15, 13,
+        offsetof(ogs_gtp1_forward_relocation_response_t, node_identfiier) },
+    [5] = { OGS_GTP1_BSS_CONTAINER_TYPE, 0, 0, 11, 9,
+        offsetof(ogs_gtp1_forward_relocation_response_t, bss_container) },
+    [9] = { OGS_GTP1_TUNNEL_ENDPOINT_IDENTIFIER_CONTROL_PLANE_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_forward_relocation_response_t, tunnel_endpoint_identifier_control_plane) },
+    [12] = { OGS_GTP1_RAB_SETUP_INFORMATION_TYPE, 0, 0, 8, 6,
+        offsetof(ogs_gtp1_forward_relocation_response_t, rab_setup_information) },
+    [13] = { OGS_GTP1_RANAP_CAUSE_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp1_forward_relocation_response_t, ranap_cause) },
+    [16] = { OGS_GTP1_BSSGP_CAUSE_TYPE, 0, 0, 12, 10,
+        offsetof(ogs_gtp1_forward_relocation_response_t, bssgp_cause) },
+    [19] = { OGS_GTP1_UTRAN_TRANSPARENT_CONTAINER_TYPE, 0, 0, 7, 5,
+        offsetof(ogs_gtp1_forward_relocation_response_t, utran_transparent_container) },
+    [25] = { OGS_GTP1_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_forward_relocation_response_t, cause) },
+    [27] = { OGS_GTP1_SGSN_NUMBER_TYPE, 0, 0, 10, 8,
+        offsetof(ogs_gtp1_forward_relocation_response_t, sgsn_number) },
+    [28] = { OGS_GTP1_LIST_OF_SET_UP_PFCS_TYPE, 0, 0, 13, 11,
+        offsetof(ogs_gtp1_forward_relocation_response_t, list_of_set_up_pfcs) },
+    [29] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp1_forward_relocation_response_t, sgsn_address_for_control_plane) },
+    [30] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 1, 6, 4,
+        offsetof(ogs_gtp1_forward_relocation_response_t, sgsn_address_for_user_traffic) },
+    [31] = { OGS_GTP1_EXTENDED_RANAP_CAUSE_TYPE, 0, 0, 14, 12,
+        offsetof(ogs_gtp1_forward_relocation_response_t, extended_ranap_cause) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_forward_relocation_response = {
+    31, 14, ogs_gtp1_msg_index_forward_relocation_response_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_forward_relocation_response =
 {
@@ -1894,7 +2837,7 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_forward_relocation_response =
         &ogs_gtp1_tlv_desc_extended_ranap_cause,
         &ogs_gtp1_tlv_desc_node_identifier,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_forward_relocation_response, NULL};
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_forward_relocation_complete =
 {
@@ -1902,7 +2845,20 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_forward_relocation_complete =
     "Forward Relocation Complete",
     0, 0, 0, 0, {
     NULL,
-}};
+}, NULL, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_relocation_cancel_request_slot[8] = {
+    [1] = { OGS_GTP1_EXTENDED_COMMON_FLAGS_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp1_relocation_cancel_request_t, extended_common_flags) },
+    [2] = { OGS_GTP1_IMSI_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_relocation_cancel_request_t, imsi) },
+    [3] = { OGS_GTP1_SV_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_relocation_cancel_request_t, imei) },
+    [4] = { OGS_GTP1_EXTENDED_RANAP_CAUSE_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp1_relocation_cancel_request_t, extended_ranap_cause) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_relocation_cancel_request = {
+    7, 4, ogs_gtp1_msg_index_relocation_cancel_request_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_relocation_cancel_request =
 {
@@ -1914,7 +2870,14 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_relocation_cancel_request =
         &ogs_gtp1_tlv_desc_extended_common_flags,
         &ogs_gtp1_tlv_desc_extended_ranap_cause,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_relocation_cancel_request, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_relocation_cancel_response_slot[2] = {
+    [1] = { OGS_GTP1_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_relocation_cancel_response_t, cause) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_relocation_cancel_response = {
+    1, 1, ogs_gtp1_msg_index_relocation_cancel_response_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_relocation_cancel_response =
 {
@@ -1923,7 +2886,18 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_relocation_cancel_response =
     0, 0, 0, 0, {
         &ogs_gtp1_tlv_desc_cause,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_relocation_cancel_response, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_forward_srns_context_slot[8] = {
+    [1] = { OGS_GTP1_SOURCE_RNC_PDCP_CONTEXT_INFO_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_forward_srns_context_t, source_rnc_pdcp_context_info) },
+    [6] = { OGS_GTP1_RAB_CONTEXT_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_forward_srns_context_t, rab_context) },
+    [7] = { OGS_GTP1_PDU_NUMBERS_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp1_forward_srns_context_t, pdu_numbers) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_forward_srns_context = {
+    7, 3, ogs_gtp1_msg_index_forward_srns_context_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_forward_srns_context =
 {
@@ -1934,7 +2908,14 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_forward_srns_context =
         &ogs_gtp1_tlv_desc_source_rnc_pdcp_context_info,
         &ogs_gtp1_tlv_desc_pdu_numbers,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_forward_srns_context, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_forward_relocation_complete_acknowledge_slot[2] = {
+    [1] = { OGS_GTP1_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_forward_relocation_complete_acknowledge_t, cause) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_forward_relocation_complete_acknowledge = {
+    1, 1, ogs_gtp1_msg_index_forward_relocation_complete_acknowledge_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_forward_relocation_complete_acknowledge =
 {
@@ -1943,7 +2924,14 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_forward_relocation_complete_acknowledge =
     0, 0, 0, 0, {
         &ogs_gtp1_tlv_desc_cause,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_forward_relocation_complete_acknowledge, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_forward_srns_context_acknowledge_slot[2] = {
+    [1] = { OGS_GTP1_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_forward_srns_context_acknowledge_t, cause) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_forward_srns_context_acknowledge = {
+    1, 1, ogs_gtp1_msg_index_forward_srns_context_acknowledge_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_forward_srns_context_acknowledge =
 {
@@ -1952,7 +2940,14 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_forward_srns_context_acknowledge =
     0, 0, 0, 0, {
         &ogs_gtp1_tlv_desc_cause,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_forward_srns_context_acknowledge, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_ue_registration_query_request_slot[2] = {
+    [0] = { OGS_GTP1_IMSI_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_ue_registration_query_request_t, imsi) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_ue_registration_query_request = {
+    1, 1, ogs_gtp1_msg_index_ue_registration_query_request_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_ue_registration_query_request =
 {
@@ -1961,7 +2956,18 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_ue_registration_query_request =
     0, 0, 0, 0, {
         &ogs_gtp1_tlv_desc_imsi,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_ue_registration_query_request, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_ue_registration_query_response_slot[8] = {
+    [1] = { OGS_GTP1_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_ue_registration_query_response_t, cause) },
+    [2] = { OGS_GTP1_IMSI_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_ue_registration_query_response_t, imsi) },
+    [4] = { OGS_GTP1_SELECTED_PLMN_ID_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp1_ue_registration_query_response_t, selected_plmn_id) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_ue_registration_query_response = {
+    7, 3, ogs_gtp1_msg_index_ue_registration_query_response_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_ue_registration_query_response =
 {
@@ -1972,7 +2978,18 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_ue_registration_query_response =
         &ogs_gtp1_tlv_desc_imsi,
         &ogs_gtp1_tlv_desc_selected_plmn_id,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_ue_registration_query_response, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_ran_information_relay_slot[8] = {
+    [0] = { OGS_GTP1_RAN_TRANSPARENT_CONTAINER_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_ran_information_relay_t, ran_transparent_container) },
+    [2] = { OGS_GTP1_RIM_ROUTING_ADDRESS_DISCRIMINATOR_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp1_ran_information_relay_t, rim_routing_address_discriminator) },
+    [6] = { OGS_GTP1_RIM_ROUTING_ADDRESS_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_ran_information_relay_t, rim_routing_address) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_ran_information_relay = {
+    7, 3, ogs_gtp1_msg_index_ran_information_relay_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_ran_information_relay =
 {
@@ -1983,7 +3000,26 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_ran_information_relay =
         &ogs_gtp1_tlv_desc_rim_routing_address,
         &ogs_gtp1_tlv_desc_rim_routing_address_discriminator,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_ran_information_relay, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_mbms_notification_request_slot[16] = {
+    [0] = { OGS_GTP1_END_USER_ADDRESS_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp1_mbms_notification_request_t, end_user_address) },
+    [2] = { OGS_GTP1_IMSI_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_mbms_notification_request_t, imsi) },
+    [4] = { OGS_GTP1_NSAPI_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp1_mbms_notification_request_t, nsapi) },
+    [7] = { OGS_GTP1_MBMS_PROTOCOL_CONFIGURATION_OPTIONS_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_gtp1_mbms_notification_request_t, mbms_protocol_configuration_options) },
+    [9] = { OGS_GTP1_TUNNEL_ENDPOINT_IDENTIFIER_CONTROL_PLANE_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_mbms_notification_request_t, tunnel_endpoint_identifier_control_plane) },
+    [11] = { OGS_GTP1_ACCESS_POINT_NAME_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp1_mbms_notification_request_t, access_point_name) },
+    [13] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_gtp1_mbms_notification_request_t, ggsn_address_for_control_plane) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_mbms_notification_request = {
+    15, 7, ogs_gtp1_msg_index_mbms_notification_request_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_notification_request =
 {
@@ -1998,7 +3034,14 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_notification_request =
         &ogs_gtp1_tlv_desc_gsn_address,
         &ogs_gtp1_tlv_desc_mbms_protocol_configuration_options,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_mbms_notification_request, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_mbms_notification_response_slot[2] = {
+    [1] = { OGS_GTP1_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_mbms_notification_response_t, cause) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_mbms_notification_response = {
+    1, 1, ogs_gtp1_msg_index_mbms_notification_response_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_notification_response =
 {
@@ -2007,7 +3050,24 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_notification_response =
     0, 0, 0, 0, {
         &ogs_gtp1_tlv_desc_cause,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_mbms_notification_response, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_mbms_notification_reject_request_slot[16] = {
+    [0] = { OGS_GTP1_END_USER_ADDRESS_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp1_mbms_notification_reject_request_t, end_user_address) },
+    [4] = { OGS_GTP1_NSAPI_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp1_mbms_notification_reject_request_t, nsapi) },
+    [9] = { OGS_GTP1_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_mbms_notification_reject_request_t, cause) },
+    [10] = { OGS_GTP1_TUNNEL_ENDPOINT_IDENTIFIER_CONTROL_PLANE_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_mbms_notification_reject_request_t, tunnel_endpoint_identifier_control_plane) },
+    [11] = { OGS_GTP1_ACCESS_POINT_NAME_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp1_mbms_notification_reject_request_t, access_point_name) },
+    [13] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_gtp1_mbms_notification_reject_request_t, sgsn_address_for_control_plane) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_mbms_notification_reject_request = {
+    15, 6, ogs_gtp1_msg_index_mbms_notification_reject_request_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_notification_reject_request =
 {
@@ -2021,7 +3081,14 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_notification_reject_request =
         &ogs_gtp1_tlv_desc_access_point_name,
         &ogs_gtp1_tlv_desc_gsn_address,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_mbms_notification_reject_request, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_mbms_notification_reject_response_slot[2] = {
+    [1] = { OGS_GTP1_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_mbms_notification_reject_response_t, cause) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_mbms_notification_reject_response = {
+    1, 1, ogs_gtp1_msg_index_mbms_notification_reject_response_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_notification_reject_response =
 {
@@ -2030,7 +3097,54 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_notification_reject_response =
     0, 0, 0, 0, {
         &ogs_gtp1_tlv_desc_cause,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_mbms_notification_reject_response, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_create_mbms_context_request_slot[64] = {
+    [0] = { OGS_GTP1_END_USER_ADDRESS_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_gtp1_create_mbms_context_request_t, end_user_address) },
+    [1] = { OGS_GTP1_ADDITIONAL_MBMS_TRACE_INFO_TYPE, 0, 0, 21, 20,
+        offsetof(ogs_gtp1_create_mbms_context_request_t, additional_mbms_trace_info) },
+    [7] = { OGS_GTP1_MBMS_PROTOCOL_CONFIGURATION_OPTIONS_TYPE, 0, 0, 18, 17,
+        offsetof(ogs_gtp1_create_mbms_context_request_t, mbms_protocol_configuration_options) },
+    [10] = { OGS_GTP1_SV_TYPE, 0, 0, 17, 16,
+        offsetof(ogs_gtp1_create_mbms_context_request_t, imei) },
+    [11] = { OGS_GTP1_RAI_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_create_mbms_context_request_t, routeing_area_identity) },
+    [12] = { OGS_GTP1_ACCESS_POINT_NAME_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_gtp1_create_mbms_context_request_t, access_point_name) },
+    [15] = { OGS_GTP1_ENHANCED_NSAPI_TYPE, 0, 0, 20, 19,
+        offsetof(ogs_gtp1_create_mbms_context_request_t, enhanced_nsapi) },
+    [18] = { OGS_GTP1_ADDITIONAL_TRACE_INFO_TYPE, 0, 0, 19, 18,
+        offsetof(ogs_gtp1_create_mbms_context_request_t, additonal_trace_info) },
+    [22] = { OGS_GTP1_MSISDN_TYPE, 0, 0, 11, 10,
+        offsetof(ogs_gtp1_create_mbms_context_request_t, msisdn) },
+    [24] = { OGS_GTP1_USER_LOCATION_INFORMATION_TYPE, 0, 0, 15, 14,
+        offsetof(ogs_gtp1_create_mbms_context_request_t, user_location_information) },
+    [30] = { OGS_GTP1_RECOVERY_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp1_create_mbms_context_request_t, recovery) },
+    [31] = { OGS_GTP1_TRIGGER_ID_TYPE, 0, 0, 12, 11,
+        offsetof(ogs_gtp1_create_mbms_context_request_t, trigger_id) },
+    [35] = { OGS_GTP1_TRACE_REFERENCE_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_gtp1_create_mbms_context_request_t, trace_reference) },
+    [41] = { OGS_GTP1_TUNNEL_ENDPOINT_IDENTIFIER_CONTROL_PLANE_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp1_create_mbms_context_request_t, tunnel_endpoint_identifier_control_plane) },
+    [49] = { OGS_GTP1_MS_TIME_ZONE_TYPE, 0, 0, 16, 15,
+        offsetof(ogs_gtp1_create_mbms_context_request_t, ms_time_zone) },
+    [50] = { OGS_GTP1_IMSI_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_create_mbms_context_request_t, imsi) },
+    [55] = { OGS_GTP1_SELECTION_MODE_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp1_create_mbms_context_request_t, selection_mode) },
+    [56] = { OGS_GTP1_OMC_IDENTITY_TYPE, 0, 0, 13, 12,
+        offsetof(ogs_gtp1_create_mbms_context_request_t, omc_identity) },
+    [60] = { OGS_GTP1_TRACE_TYPE_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_gtp1_create_mbms_context_request_t, trace_type) },
+    [61] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 0, 10, 9,
+        offsetof(ogs_gtp1_create_mbms_context_request_t, sgsn_address_for_signalling) },
+    [63] = { OGS_GTP1_RAT_TYPE_TYPE, 0, 0, 14, 13,
+        offsetof(ogs_gtp1_create_mbms_context_request_t, rat_type) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_create_mbms_context_request = {
+    63, 21, ogs_gtp1_msg_index_create_mbms_context_request_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_create_mbms_context_request =
 {
@@ -2059,7 +3173,30 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_create_mbms_context_request =
         &ogs_gtp1_tlv_desc_enhanced_nsapi,
         &ogs_gtp1_tlv_desc_additional_mbms_trace_info,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_create_mbms_context_request, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_create_mbms_context_response_slot[32] = {
+    [3] = { OGS_GTP1_CHARGING_GATEWAY_ADDRESS_TYPE, 0, 0, 7, 5,
+        offsetof(ogs_gtp1_create_mbms_context_response_t, charging_gateway_address) },
+    [4] = { OGS_GTP1_CHARGING_GATEWAY_ADDRESS_TYPE, 0, 1, 8, 5,
+        offsetof(ogs_gtp1_create_mbms_context_response_t, alternative_charging_gateway_address) },
+    [7] = { OGS_GTP1_CHARGING_ID_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp1_create_mbms_context_response_t, charging_id) },
+    [8] = { OGS_GTP1_MBMS_PROTOCOL_CONFIGURATION_OPTIONS_TYPE, 0, 0, 9, 6,
+        offsetof(ogs_gtp1_create_mbms_context_response_t, mbms_protocol_configuration_options) },
+    [9] = { OGS_GTP1_TUNNEL_ENDPOINT_IDENTIFIER_CONTROL_PLANE_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp1_create_mbms_context_response_t, tunnel_endpoint_identifier_control_plane) },
+    [25] = { OGS_GTP1_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_create_mbms_context_response_t, cause) },
+    [29] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp1_create_mbms_context_response_t, ggsn_address_for_control_plane) },
+    [30] = { OGS_GTP1_RECOVERY_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_create_mbms_context_response_t, recovery) },
+    [31] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 1, 6, 4,
+        offsetof(ogs_gtp1_create_mbms_context_response_t, alternative_ggsn_address_for_control_plane) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_create_mbms_context_response = {
+    31, 7, ogs_gtp1_msg_index_create_mbms_context_response_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_create_mbms_context_response =
 {
@@ -2076,7 +3213,42 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_create_mbms_context_response =
         &ogs_gtp1_tlv_desc_charging_gateway_address,
         &ogs_gtp1_tlv_desc_mbms_protocol_configuration_options,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_create_mbms_context_response, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_update_mbms_context_request_slot[32] = {
+    [0] = { OGS_GTP1_TRIGGER_ID_TYPE, 0, 0, 8, 6,
+        offsetof(ogs_gtp1_update_mbms_context_request_t, trigger_id) },
+    [1] = { OGS_GTP1_RAT_TYPE_TYPE, 0, 0, 10, 8,
+        offsetof(ogs_gtp1_update_mbms_context_request_t, rat_type) },
+    [2] = { OGS_GTP1_ADDITIONAL_MBMS_TRACE_INFO_TYPE, 0, 0, 15, 13,
+        offsetof(ogs_gtp1_update_mbms_context_request_t, additional_mbms_trace_info) },
+    [3] = { OGS_GTP1_TRACE_REFERENCE_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp1_update_mbms_context_request_t, trace_reference) },
+    [9] = { OGS_GTP1_TUNNEL_ENDPOINT_IDENTIFIER_CONTROL_PLANE_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp1_update_mbms_context_request_t, tunnel_endpoint_identifier_control_plane) },
+    [11] = { OGS_GTP1_RAI_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_update_mbms_context_request_t, routeing_area_identity) },
+    [15] = { OGS_GTP1_ENHANCED_NSAPI_TYPE, 0, 0, 14, 12,
+        offsetof(ogs_gtp1_update_mbms_context_request_t, enhanced_nsapi) },
+    [17] = { OGS_GTP1_MS_TIME_ZONE_TYPE, 0, 0, 12, 10,
+        offsetof(ogs_gtp1_update_mbms_context_request_t, ms_time_zone) },
+    [18] = { OGS_GTP1_ADDITIONAL_TRACE_INFO_TYPE, 0, 0, 13, 11,
+        offsetof(ogs_gtp1_update_mbms_context_request_t, additional_trace_info) },
+    [23] = { OGS_GTP1_OMC_IDENTITY_TYPE, 0, 0, 9, 7,
+        offsetof(ogs_gtp1_update_mbms_context_request_t, omc_identity) },
+    [24] = { OGS_GTP1_USER_LOCATION_INFORMATION_TYPE, 0, 0, 11, 9,
+        offsetof(ogs_gtp1_update_mbms_context_request_t, user_location_information) },
+    [28] = { OGS_GTP1_TRACE_TYPE_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp1_update_mbms_context_request_t, trace_type) },
+    [29] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_gtp1_update_mbms_context_request_t, sgsn_address_for_control_plane) },
+    [30] = { OGS_GTP1_RECOVERY_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_update_mbms_context_request_t, recovery) },
+    [31] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 1, 7, 5,
+        offsetof(ogs_gtp1_update_mbms_context_request_t, alternative_sgsn_address_for_control_plane) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_update_mbms_context_request = {
+    31, 14, ogs_gtp1_msg_index_update_mbms_context_request_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_update_mbms_context_request =
 {
@@ -2099,7 +3271,28 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_update_mbms_context_request =
         &ogs_gtp1_tlv_desc_enhanced_nsapi,
         &ogs_gtp1_tlv_desc_additional_mbms_trace_info,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_update_mbms_context_request, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_update_mbms_context_response_slot[16] = {
+    [3] = { OGS_GTP1_CHARGING_GATEWAY_ADDRESS_TYPE, 0, 0, 7, 5,
+        offsetof(ogs_gtp1_update_mbms_context_response_t, charging_gateway_address) },
+    [4] = { OGS_GTP1_CHARGING_GATEWAY_ADDRESS_TYPE, 0, 1, 8, 5,
+        offsetof(ogs_gtp1_update_mbms_context_response_t, alternative_charging_gateway_address) },
+    [7] = { OGS_GTP1_CHARGING_ID_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp1_update_mbms_context_response_t, charging_id) },
+    [9] = { OGS_GTP1_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_update_mbms_context_response_t, cause) },
+    [10] = { OGS_GTP1_TUNNEL_ENDPOINT_IDENTIFIER_CONTROL_PLANE_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp1_update_mbms_context_response_t, tunnel_endpoint_identifier_control_plane) },
+    [13] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp1_update_mbms_context_response_t, ggsn_address_for_control_plane) },
+    [14] = { OGS_GTP1_RECOVERY_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_update_mbms_context_response_t, recovery) },
+    [15] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 1, 6, 4,
+        offsetof(ogs_gtp1_update_mbms_context_response_t, alternative_ggsn_address_for_control_plane) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_update_mbms_context_response = {
+    15, 6, ogs_gtp1_msg_index_update_mbms_context_response_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_update_mbms_context_response =
 {
@@ -2115,7 +3308,24 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_update_mbms_context_response =
         &ogs_gtp1_tlv_desc_charging_gateway_address,
         &ogs_gtp1_tlv_desc_charging_gateway_address,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_update_mbms_context_response, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_delete_mbms_context_request_slot[16] = {
+    [0] = { OGS_GTP1_END_USER_ADDRESS_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp1_delete_mbms_context_request_t, end_user_address) },
+    [2] = { OGS_GTP1_IMSI_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_delete_mbms_context_request_t, imsi) },
+    [7] = { OGS_GTP1_MBMS_PROTOCOL_CONFIGURATION_OPTIONS_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp1_delete_mbms_context_request_t, mbms_protocol_configuration_options) },
+    [9] = { OGS_GTP1_TUNNEL_ENDPOINT_IDENTIFIER_CONTROL_PLANE_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_delete_mbms_context_request_t, tunnel_endpoint_identifier_control_plane) },
+    [11] = { OGS_GTP1_ACCESS_POINT_NAME_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp1_delete_mbms_context_request_t, access_point_name) },
+    [15] = { OGS_GTP1_ENHANCED_NSAPI_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_gtp1_delete_mbms_context_request_t, enhanced_nsapi) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_delete_mbms_context_request = {
+    15, 6, ogs_gtp1_msg_index_delete_mbms_context_request_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_delete_mbms_context_request =
 {
@@ -2129,7 +3339,16 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_delete_mbms_context_request =
         &ogs_gtp1_tlv_desc_mbms_protocol_configuration_options,
         &ogs_gtp1_tlv_desc_enhanced_nsapi,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_delete_mbms_context_request, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_delete_mbms_context_response_slot[4] = {
+    [1] = { OGS_GTP1_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_delete_mbms_context_response_t, cause) },
+    [3] = { OGS_GTP1_MBMS_PROTOCOL_CONFIGURATION_OPTIONS_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_delete_mbms_context_response_t, mbms_protocol_configuration_options) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_delete_mbms_context_response = {
+    3, 2, ogs_gtp1_msg_index_delete_mbms_context_response_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_delete_mbms_context_response =
 {
@@ -2139,7 +3358,22 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_delete_mbms_context_response =
         &ogs_gtp1_tlv_desc_cause,
         &ogs_gtp1_tlv_desc_mbms_protocol_configuration_options,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_delete_mbms_context_response, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_mbms_registration_request_slot[16] = {
+    [0] = { OGS_GTP1_END_USER_ADDRESS_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_mbms_registration_request_t, end_user_address) },
+    [9] = { OGS_GTP1_TUNNEL_ENDPOINT_IDENTIFIER_CONTROL_PLANE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_mbms_registration_request_t, tunnel_endpoint_identifier_control_plane) },
+    [11] = { OGS_GTP1_ACCESS_POINT_NAME_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp1_mbms_registration_request_t, access_point_name) },
+    [13] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp1_mbms_registration_request_t, sgsn_address_for_control_plane) },
+    [14] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 1, 5, 3,
+        offsetof(ogs_gtp1_mbms_registration_request_t, alternative_sgsn_address_for_control_plane) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_mbms_registration_request = {
+    15, 4, ogs_gtp1_msg_index_mbms_registration_request_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_registration_request =
 {
@@ -2152,7 +3386,22 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_registration_request =
         &ogs_gtp1_tlv_desc_gsn_address,
         &ogs_gtp1_tlv_desc_gsn_address,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_mbms_registration_request, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_mbms_registration_response_slot[16] = {
+    [5] = { OGS_GTP1_TMGI_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp1_mbms_registration_response_t, temporary_mobile_group_identity) },
+    [9] = { OGS_GTP1_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_mbms_registration_response_t, cause) },
+    [10] = { OGS_GTP1_TUNNEL_ENDPOINT_IDENTIFIER_CONTROL_PLANE_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_mbms_registration_response_t, tunnel_endpoint_identifier_control_plane) },
+    [11] = { OGS_GTP1_REQUIRED_MBMS_BEARER_CAPABILITIES_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp1_mbms_registration_response_t, required_mbms_bearer_capabilities) },
+    [13] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp1_mbms_registration_response_t, ggsn_address_for_control_plane) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_mbms_registration_response = {
+    15, 5, ogs_gtp1_msg_index_mbms_registration_response_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_registration_response =
 {
@@ -2165,7 +3414,16 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_registration_response =
         &ogs_gtp1_tlv_desc_tmgi,
         &ogs_gtp1_tlv_desc_required_mbms_bearer_capabilities,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_mbms_registration_response, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_mbms_de_registration_request_slot[4] = {
+    [0] = { OGS_GTP1_END_USER_ADDRESS_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_mbms_de_registration_request_t, end_user_address) },
+    [3] = { OGS_GTP1_ACCESS_POINT_NAME_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_mbms_de_registration_request_t, access_point_name) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_mbms_de_registration_request = {
+    3, 2, ogs_gtp1_msg_index_mbms_de_registration_request_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_de_registration_request =
 {
@@ -2175,7 +3433,14 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_de_registration_request =
         &ogs_gtp1_tlv_desc_end_user_address,
         &ogs_gtp1_tlv_desc_access_point_name,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_mbms_de_registration_request, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_mbms_de_registration_response_slot[2] = {
+    [1] = { OGS_GTP1_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_mbms_de_registration_response_t, cause) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_mbms_de_registration_response = {
+    1, 1, ogs_gtp1_msg_index_mbms_de_registration_response_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_de_registration_response =
 {
@@ -2184,7 +3449,46 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_de_registration_response =
     0, 0, 0, 0, {
         &ogs_gtp1_tlv_desc_cause,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_mbms_de_registration_response, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_mbms_session_start_request_slot[64] = {
+    [0] = { OGS_GTP1_END_USER_ADDRESS_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp1_mbms_session_start_request_t, end_user_address) },
+    [11] = { OGS_GTP1_ACCESS_POINT_NAME_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp1_mbms_session_start_request_t, access_point_name) },
+    [17] = { OGS_GTP1_MBMS_FLOW_IDENTIFIER_TYPE, 0, 0, 16, 14,
+        offsetof(ogs_gtp1_mbms_session_start_request_t, mbms_flow_identifier) },
+    [21] = { OGS_GTP1_TMGI_TYPE, 0, 0, 9, 7,
+        offsetof(ogs_gtp1_mbms_session_start_request_t, temporary_mobile_group_identity) },
+    [26] = { OGS_GTP1_MBMS_SESSION_REPETITION_NUMBER_TYPE, 0, 0, 14, 12,
+        offsetof(ogs_gtp1_mbms_session_start_request_t, mbms_session_repetition_number) },
+    [29] = { OGS_GTP1_MBMS_SESSION_IDENTIFIER_TYPE, 0, 0, 11, 9,
+        offsetof(ogs_gtp1_mbms_session_start_request_t, mbms_session_identifier) },
+    [30] = { OGS_GTP1_RECOVERY_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_mbms_session_start_request_t, recovery) },
+    [32] = { OGS_GTP1_MBMS_SERVICE_AREA_TYPE, 0, 0, 10, 8,
+        offsetof(ogs_gtp1_mbms_session_start_request_t, mbms_service_area) },
+    [40] = { OGS_GTP1_MBMS_SESSION_DURATION_TYPE, 0, 0, 13, 11,
+        offsetof(ogs_gtp1_mbms_session_start_request_t, mbms_session_duration) },
+    [41] = { OGS_GTP1_TUNNEL_ENDPOINT_IDENTIFIER_CONTROL_PLANE_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_mbms_session_start_request_t, tunnel_endpoint_identifier_control_plane) },
+    [42] = { OGS_GTP1_MBMS_IP_MULTICAST_DISTRIBUTION_TYPE, 0, 0, 17, 15,
+        offsetof(ogs_gtp1_mbms_session_start_request_t, mbms_ip_multicast_distribution) },
+    [47] = { OGS_GTP1_QUALITY_OF_SERVICE_PROFILE_TYPE, 0, 0, 7, 5,
+        offsetof(ogs_gtp1_mbms_session_start_request_t, quality_of_service_profile) },
+    [51] = { OGS_GTP1_MBMS_TIME_TO_DATA_TRANSFER_TYPE, 0, 0, 15, 13,
+        offsetof(ogs_gtp1_mbms_session_start_request_t, mbms_time_to_data_transfer) },
+    [52] = { OGS_GTP1_COMMON_FLAGS_TYPE, 0, 0, 8, 6,
+        offsetof(ogs_gtp1_mbms_session_start_request_t, common_flags) },
+    [54] = { OGS_GTP1_MBMS_2G_3G_INDICATOR_TYPE, 0, 0, 12, 10,
+        offsetof(ogs_gtp1_mbms_session_start_request_t, mbms_2g_3g_indicator) },
+    [61] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp1_mbms_session_start_request_t, ggsn_address_for_control_plane) },
+    [62] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 1, 6, 4,
+        offsetof(ogs_gtp1_mbms_session_start_request_t, alternative_ggsn_address_for_control_plane) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_mbms_session_start_request = {
+    63, 16, ogs_gtp1_msg_index_mbms_session_start_request_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_session_start_request =
 {
@@ -2209,7 +3513,28 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_session_start_request =
         &ogs_gtp1_tlv_desc_mbms_flow_identifier,
         &ogs_gtp1_tlv_desc_mbms_ip_multicast_distribution,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_mbms_session_start_request, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_mbms_session_start_response_slot[16] = {
+    [0] = { OGS_GTP1_TUNNEL_ENDPOINT_IDENTIFIER_DATA_I_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp1_mbms_session_start_response_t, tunnel_endpoint_identifier_data_i) },
+    [1] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 2, 7, 4,
+        offsetof(ogs_gtp1_mbms_session_start_response_t, alternative_sgsn_address_for_user_traffic) },
+    [3] = { OGS_GTP1_MBMS_DISTRIBUTION_ACKNOWLEDGEMENT_TYPE, 0, 0, 8, 5,
+        offsetof(ogs_gtp1_mbms_session_start_response_t, mbms_distribution_acknowledgement) },
+    [9] = { OGS_GTP1_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_mbms_session_start_response_t, cause) },
+    [10] = { OGS_GTP1_TUNNEL_ENDPOINT_IDENTIFIER_CONTROL_PLANE_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp1_mbms_session_start_response_t, tunnel_endpoint_identifier_control_plane) },
+    [13] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp1_mbms_session_start_response_t, sgsn_address_for_control_plane) },
+    [14] = { OGS_GTP1_RECOVERY_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_mbms_session_start_response_t, recovery) },
+    [15] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 1, 6, 4,
+        offsetof(ogs_gtp1_mbms_session_start_response_t, sgsn_address_for_user_traffic) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_mbms_session_start_response = {
+    15, 6, ogs_gtp1_msg_index_mbms_session_start_response_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_session_start_response =
 {
@@ -2225,7 +3550,18 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_session_start_response =
         &ogs_gtp1_tlv_desc_gsn_address,
         &ogs_gtp1_tlv_desc_mbms_distribution_acknowledgement,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_mbms_session_start_response, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_mbms_session_stop_request_slot[8] = {
+    [0] = { OGS_GTP1_END_USER_ADDRESS_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_mbms_session_stop_request_t, end_user_address) },
+    [1] = { OGS_GTP1_MBMS_FLOW_IDENTIFIER_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp1_mbms_session_stop_request_t, mbms_flow_identifier) },
+    [3] = { OGS_GTP1_ACCESS_POINT_NAME_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_mbms_session_stop_request_t, access_point_name) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_mbms_session_stop_request = {
+    7, 3, ogs_gtp1_msg_index_mbms_session_stop_request_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_session_stop_request =
 {
@@ -2236,7 +3572,14 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_session_stop_request =
         &ogs_gtp1_tlv_desc_access_point_name,
         &ogs_gtp1_tlv_desc_mbms_flow_identifier,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_mbms_session_stop_request, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_mbms_session_stop_response_slot[2] = {
+    [1] = { OGS_GTP1_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_mbms_session_stop_response_t, cause) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_mbms_session_stop_response = {
+    1, 1, ogs_gtp1_msg_index_mbms_session_stop_response_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_session_stop_response =
 {
@@ -2245,7 +3588,32 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_session_stop_response =
     0, 0, 0, 0, {
         &ogs_gtp1_tlv_desc_cause,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_mbms_session_stop_response, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_mbms_session_update_request_slot[32] = {
+    [0] = { OGS_GTP1_END_USER_ADDRESS_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_mbms_session_update_request_t, end_user_address) },
+    [1] = { OGS_GTP1_MBMS_SERVICE_AREA_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_gtp1_mbms_session_update_request_t, mbms_service_area) },
+    [8] = { OGS_GTP1_MBMS_SESSION_DURATION_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_gtp1_mbms_session_update_request_t, mbms_session_duration) },
+    [9] = { OGS_GTP1_TUNNEL_ENDPOINT_IDENTIFIER_CONTROL_PLANE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_mbms_session_update_request_t, tunnel_endpoint_identifier_control_plane) },
+    [11] = { OGS_GTP1_ACCESS_POINT_NAME_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp1_mbms_session_update_request_t, access_point_name) },
+    [17] = { OGS_GTP1_MBMS_FLOW_IDENTIFIER_TYPE, 0, 0, 10, 9,
+        offsetof(ogs_gtp1_mbms_session_update_request_t, mbms_flow_identifier) },
+    [21] = { OGS_GTP1_TMGI_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp1_mbms_session_update_request_t, temporary_mobile_group_identity) },
+    [26] = { OGS_GTP1_MBMS_SESSION_REPETITION_NUMBER_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_gtp1_mbms_session_update_request_t, mbms_session_repetition_number) },
+    [29] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp1_mbms_session_update_request_t, ggsn_address_for_control_plane) },
+    [30] = { OGS_GTP1_MBMS_SESSION_IDENTIFIER_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_gtp1_mbms_session_update_request_t, mbms_session_identifier) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_mbms_session_update_request = {
+    31, 10, ogs_gtp1_msg_index_mbms_session_update_request_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_session_update_request =
 {
@@ -2263,7 +3631,22 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_session_update_request =
         &ogs_gtp1_tlv_desc_mbms_session_repetition_number,
         &ogs_gtp1_tlv_desc_mbms_flow_identifier,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_mbms_session_update_request, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp1_msg_index_mbms_session_update_response_slot[16] = {
+    [0] = { OGS_GTP1_TUNNEL_ENDPOINT_IDENTIFIER_DATA_I_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp1_mbms_session_update_response_t, tunnel_endpoint_identifier_data_i) },
+    [9] = { OGS_GTP1_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp1_mbms_session_update_response_t, cause) },
+    [10] = { OGS_GTP1_TUNNEL_ENDPOINT_IDENTIFIER_CONTROL_PLANE_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp1_mbms_session_update_response_t, tunnel_endpoint_identifier_control_plane) },
+    [13] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp1_mbms_session_update_response_t, sgsn_address_for_data_i) },
+    [14] = { OGS_GTP1_GSN_ADDRESS_TYPE, 0, 1, 5, 3,
+        offsetof(ogs_gtp1_mbms_session_update_response_t, sgsn_address_for_control_plane) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp1_msg_index_mbms_session_update_response = {
+    15, 4, ogs_gtp1_msg_index_mbms_session_update_response_slot };
 
 ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_session_update_response =
 {
@@ -2276,7 +3659,7 @@ ogs_tlv_desc_t ogs_gtp1_tlv_desc_mbms_session_update_response =
         &ogs_gtp1_tlv_desc_gsn_address,
         &ogs_gtp1_tlv_desc_gsn_address,
     NULL,
-}};
+}, &ogs_gtp1_msg_index_mbms_session_update_response, NULL};
 
 
 int ogs_gtp1_parse_msg(ogs_gtp1_message_t *gtp1_message, ogs_pkbuf_t *pkbuf)
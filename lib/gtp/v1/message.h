@@ -22,8 +22,8 @@
 /*******************************************************************************
  * This file had been created by gtp1-tlv.py script v0.1.0
  * Please do not modify this file but regenerate it via script.
- * Created on: 2023-12-11 17:21:37.064347 by pespin
- * from 29060-h40.docx
+ * Created from 29060-h40.docx
+ * (sha256: 63ee8f5056967e44969eb0b779cb1d26605c9454573d362e6b8a7c65532b4127)
  ******************************************************************************/
 
 #if !defined(OGS_GTP_INSIDE) && !defined(OGS_GTP_COMPILATION)
@@ -1188,6 +1188,127 @@ typedef struct ogs_gtp1_mbms_session_update_response_s {
     ogs_gtp1_tlv_gsn_address_t sgsn_address_for_control_plane;
 } ogs_gtp1_mbms_session_update_response_t;
 
+/*
+ * The most ogs_tlv_t nodes a message takes from the pool of
+ * ogs_tlv_get() to be parsed or built, and how deep its IEs nest.
+ */
+#define OGS_GTP1_ECHO_REQUEST_MAX_TLV 0
+#define OGS_GTP1_ECHO_REQUEST_MAX_TLV_DEPTH 0
+#define OGS_GTP1_ECHO_RESPONSE_MAX_TLV 1
+#define OGS_GTP1_ECHO_RESPONSE_MAX_TLV_DEPTH 1
+#define OGS_GTP1_CREATE_PDP_CONTEXT_REQUEST_MAX_TLV 38
+#define OGS_GTP1_CREATE_PDP_CONTEXT_REQUEST_MAX_TLV_DEPTH 1
+#define OGS_GTP1_CREATE_PDP_CONTEXT_RESPONSE_MAX_TLV 26
+#define OGS_GTP1_CREATE_PDP_CONTEXT_RESPONSE_MAX_TLV_DEPTH 1
+#define OGS_GTP1_UPDATE_PDP_CONTEXT_REQUEST_MAX_TLV 30
+#define OGS_GTP1_UPDATE_PDP_CONTEXT_REQUEST_MAX_TLV_DEPTH 1
+#define OGS_GTP1_UPDATE_PDP_CONTEXT_RESPONSE_MAX_TLV 20
+#define OGS_GTP1_UPDATE_PDP_CONTEXT_RESPONSE_MAX_TLV_DEPTH 1
+#define OGS_GTP1_DELETE_PDP_CONTEXT_REQUEST_MAX_TLV 8
+#define OGS_GTP1_DELETE_PDP_CONTEXT_REQUEST_MAX_TLV_DEPTH 1
+#define OGS_GTP1_DELETE_PDP_CONTEXT_RESPONSE_MAX_TLV 5
+#define OGS_GTP1_DELETE_PDP_CONTEXT_RESPONSE_MAX_TLV_DEPTH 1
+#define OGS_GTP1_INITIATE_PDP_CONTEXT_ACTIVATION_REQUEST_MAX_TLV 6
+#define OGS_GTP1_INITIATE_PDP_CONTEXT_ACTIVATION_REQUEST_MAX_TLV_DEPTH 1
+#define OGS_GTP1_INITIATE_PDP_CONTEXT_ACTIVATION_RESPONSE_MAX_TLV 2
+#define OGS_GTP1_INITIATE_PDP_CONTEXT_ACTIVATION_RESPONSE_MAX_TLV_DEPTH 1
+#define OGS_GTP1_PDU_NOTIFICATION_REQUEST_MAX_TLV 6
+#define OGS_GTP1_PDU_NOTIFICATION_REQUEST_MAX_TLV_DEPTH 1
+#define OGS_GTP1_PDU_NOTIFICATION_RESPONSE_MAX_TLV 1
+#define OGS_GTP1_PDU_NOTIFICATION_RESPONSE_MAX_TLV_DEPTH 1
+#define OGS_GTP1_PDU_NOTIFICATION_REJECT_REQUEST_MAX_TLV 5
+#define OGS_GTP1_PDU_NOTIFICATION_REJECT_REQUEST_MAX_TLV_DEPTH 1
+#define OGS_GTP1_PDU_NOTIFICATION_REJECT_RESPONSE_MAX_TLV 1
+#define OGS_GTP1_PDU_NOTIFICATION_REJECT_RESPONSE_MAX_TLV_DEPTH 1
+#define OGS_GTP1_SUPPORTED_EXTENSION_HEADERS_NOTIFICATION_MAX_TLV 1
+#define OGS_GTP1_SUPPORTED_EXTENSION_HEADERS_NOTIFICATION_MAX_TLV_DEPTH 1
+#define OGS_GTP1_SEND_ROUTEING_INFORMATION_FOR_GPRS_REQUEST_MAX_TLV 1
+#define OGS_GTP1_SEND_ROUTEING_INFORMATION_FOR_GPRS_REQUEST_MAX_TLV_DEPTH 1
+#define OGS_GTP1_SEND_ROUTEING_INFORMATION_FOR_GPRS_RESPONSE_MAX_TLV 5
+#define OGS_GTP1_SEND_ROUTEING_INFORMATION_FOR_GPRS_RESPONSE_MAX_TLV_DEPTH 1
+#define OGS_GTP1_FAILURE_REPORT_REQUEST_MAX_TLV 1
+#define OGS_GTP1_FAILURE_REPORT_REQUEST_MAX_TLV_DEPTH 1
+#define OGS_GTP1_FAILURE_REPORT_RESPONSE_MAX_TLV 2
+#define OGS_GTP1_FAILURE_REPORT_RESPONSE_MAX_TLV_DEPTH 1
+#define OGS_GTP1_NOTE_MS_GPRS_PRESENT_REQUEST_MAX_TLV 2
+#define OGS_GTP1_NOTE_MS_GPRS_PRESENT_REQUEST_MAX_TLV_DEPTH 1
+#define OGS_GTP1_NOTE_MS_GPRS_PRESENT_RESPONSE_MAX_TLV 1
+#define OGS_GTP1_NOTE_MS_GPRS_PRESENT_RESPONSE_MAX_TLV_DEPTH 1
+#define OGS_GTP1_IDENTIFICATION_REQUEST_MAX_TLV 5
+#define OGS_GTP1_IDENTIFICATION_REQUEST_MAX_TLV_DEPTH 1
+#define OGS_GTP1_IDENTIFICATION_RESPONSE_MAX_TLV 6
+#define OGS_GTP1_IDENTIFICATION_RESPONSE_MAX_TLV_DEPTH 1
+#define OGS_GTP1_SGSN_CONTEXT_REQUEST_MAX_TLV 12
+#define OGS_GTP1_SGSN_CONTEXT_REQUEST_MAX_TLV_DEPTH 1
+#define OGS_GTP1_SGSN_CONTEXT_RESPONSE_MAX_TLV 32
+#define OGS_GTP1_SGSN_CONTEXT_RESPONSE_MAX_TLV_DEPTH 1
+#define OGS_GTP1_SGSN_CONTEXT_ACKNOWLEDGE_MAX_TLV 5
+#define OGS_GTP1_SGSN_CONTEXT_ACKNOWLEDGE_MAX_TLV_DEPTH 1
+#define OGS_GTP1_FORWARD_RELOCATION_REQUEST_MAX_TLV 43
+#define OGS_GTP1_FORWARD_RELOCATION_REQUEST_MAX_TLV_DEPTH 1
+#define OGS_GTP1_FORWARD_RELOCATION_RESPONSE_MAX_TLV 15
+#define OGS_GTP1_FORWARD_RELOCATION_RESPONSE_MAX_TLV_DEPTH 1
+#define OGS_GTP1_FORWARD_RELOCATION_COMPLETE_MAX_TLV 0
+#define OGS_GTP1_FORWARD_RELOCATION_COMPLETE_MAX_TLV_DEPTH 0
+#define OGS_GTP1_RELOCATION_CANCEL_REQUEST_MAX_TLV 4
+#define OGS_GTP1_RELOCATION_CANCEL_REQUEST_MAX_TLV_DEPTH 1
+#define OGS_GTP1_RELOCATION_CANCEL_RESPONSE_MAX_TLV 1
+#define OGS_GTP1_RELOCATION_CANCEL_RESPONSE_MAX_TLV_DEPTH 1
+#define OGS_GTP1_FORWARD_SRNS_CONTEXT_MAX_TLV 3
+#define OGS_GTP1_FORWARD_SRNS_CONTEXT_MAX_TLV_DEPTH 1
+#define OGS_GTP1_FORWARD_RELOCATION_COMPLETE_ACKNOWLEDGE_MAX_TLV 1
+#define OGS_GTP1_FORWARD_RELOCATION_COMPLETE_ACKNOWLEDGE_MAX_TLV_DEPTH 1
+#define OGS_GTP1_FORWARD_SRNS_CONTEXT_ACKNOWLEDGE_MAX_TLV 1
+#define OGS_GTP1_FORWARD_SRNS_CONTEXT_ACKNOWLEDGE_MAX_TLV_DEPTH 1
+#define OGS_GTP1_UE_REGISTRATION_QUERY_REQUEST_MAX_TLV 1
+#define OGS_GTP1_UE_REGISTRATION_QUERY_REQUEST_MAX_TLV_DEPTH 1
+#define OGS_GTP1_UE_REGISTRATION_QUERY_RESPONSE_MAX_TLV 3
+#define OGS_GTP1_UE_REGISTRATION_QUERY_RESPONSE_MAX_TLV_DEPTH 1
+#define OGS_GTP1_RAN_INFORMATION_RELAY_MAX_TLV 3
+#define OGS_GTP1_RAN_INFORMATION_RELAY_MAX_TLV_DEPTH 1
+#define OGS_GTP1_MBMS_NOTIFICATION_REQUEST_MAX_TLV 7
+#define OGS_GTP1_MBMS_NOTIFICATION_REQUEST_MAX_TLV_DEPTH 1
+#define OGS_GTP1_MBMS_NOTIFICATION_RESPONSE_MAX_TLV 1
+#define OGS_GTP1_MBMS_NOTIFICATION_RESPONSE_MAX_TLV_DEPTH 1
+#define OGS_GTP1_MBMS_NOTIFICATION_REJECT_REQUEST_MAX_TLV 6
+#define OGS_GTP1_MBMS_NOTIFICATION_REJECT_REQUEST_MAX_TLV_DEPTH 1
+#define OGS_GTP1_MBMS_NOTIFICATION_REJECT_RESPONSE_MAX_TLV 1
+#define OGS_GTP1_MBMS_NOTIFICATION_REJECT_RESPONSE_MAX_TLV_DEPTH 1
+#define OGS_GTP1_CREATE_MBMS_CONTEXT_REQUEST_MAX_TLV 21
+#define OGS_GTP1_CREATE_MBMS_CONTEXT_REQUEST_MAX_TLV_DEPTH 1
+#define OGS_GTP1_CREATE_MBMS_CONTEXT_RESPONSE_MAX_TLV 9
+#define OGS_GTP1_CREATE_MBMS_CONTEXT_RESPONSE_MAX_TLV_DEPTH 1
+#define OGS_GTP1_UPDATE_MBMS_CONTEXT_REQUEST_MAX_TLV 15
+#define OGS_GTP1_UPDATE_MBMS_CONTEXT_REQUEST_MAX_TLV_DEPTH 1
+#define OGS_GTP1_UPDATE_MBMS_CONTEXT_RESPONSE_MAX_TLV 8
+#define OGS_GTP1_UPDATE_MBMS_CONTEXT_RESPONSE_MAX_TLV_DEPTH 1
+#define OGS_GTP1_DELETE_MBMS_CONTEXT_REQUEST_MAX_TLV 6
+#define OGS_GTP1_DELETE_MBMS_CONTEXT_REQUEST_MAX_TLV_DEPTH 1
+#define OGS_GTP1_DELETE_MBMS_CONTEXT_RESPONSE_MAX_TLV 2
+#define OGS_GTP1_DELETE_MBMS_CONTEXT_RESPONSE_MAX_TLV_DEPTH 1
+#define OGS_GTP1_MBMS_REGISTRATION_REQUEST_MAX_TLV 5
+#define OGS_GTP1_MBMS_REGISTRATION_REQUEST_MAX_TLV_DEPTH 1
+#define OGS_GTP1_MBMS_REGISTRATION_RESPONSE_MAX_TLV 5
+#define OGS_GTP1_MBMS_REGISTRATION_RESPONSE_MAX_TLV_DEPTH 1
+#define OGS_GTP1_MBMS_DE_REGISTRATION_REQUEST_MAX_TLV 2
+#define OGS_GTP1_MBMS_DE_REGISTRATION_REQUEST_MAX_TLV_DEPTH 1
+#define OGS_GTP1_MBMS_DE_REGISTRATION_RESPONSE_MAX_TLV 1
+#define OGS_GTP1_MBMS_DE_REGISTRATION_RESPONSE_MAX_TLV_DEPTH 1
+#define OGS_GTP1_MBMS_SESSION_START_REQUEST_MAX_TLV 17
+#define OGS_GTP1_MBMS_SESSION_START_REQUEST_MAX_TLV_DEPTH 1
+#define OGS_GTP1_MBMS_SESSION_START_RESPONSE_MAX_TLV 8
+#define OGS_GTP1_MBMS_SESSION_START_RESPONSE_MAX_TLV_DEPTH 1
+#define OGS_GTP1_MBMS_SESSION_STOP_REQUEST_MAX_TLV 3
+#define OGS_GTP1_MBMS_SESSION_STOP_REQUEST_MAX_TLV_DEPTH 1
+#define OGS_GTP1_MBMS_SESSION_STOP_RESPONSE_MAX_TLV 1
+#define OGS_GTP1_MBMS_SESSION_STOP_RESPONSE_MAX_TLV_DEPTH 1
+#define OGS_GTP1_MBMS_SESSION_UPDATE_REQUEST_MAX_TLV 10
+#define OGS_GTP1_MBMS_SESSION_UPDATE_REQUEST_MAX_TLV_DEPTH 1
+#define OGS_GTP1_MBMS_SESSION_UPDATE_RESPONSE_MAX_TLV 5
+#define OGS_GTP1_MBMS_SESSION_UPDATE_RESPONSE_MAX_TLV_DEPTH 1
+#define OGS_GTP1_MAX_TLV 43
+#define OGS_GTP1_MAX_TLV_DEPTH 1
+
 typedef struct ogs_gtp1_message_s {
    ogs_gtp1_header_t h;
    union {
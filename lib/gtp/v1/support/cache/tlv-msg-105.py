@@ -1,4 +0,0 @@
-ies = []
-ies.append({ "ie_value" : "Cause", "presence" : "Mandatory", "reference" : "7.7.1"})
-ies.append({ "ie_value" : "MBMS Protocol Configuration Options", "presence" : "Optional", "reference" : "7.7.58"})
-msg_list[key]["ies"] = ies
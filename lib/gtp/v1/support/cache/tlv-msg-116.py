@@ -1,19 +0,0 @@
-ies = []
-ies.append({ "ie_value" : "Recovery", "presence" : "Optional", "reference" : "7.7.11"})
-ies.append({ "ie_value" : "Tunnel Endpoint Identifier Control Plane", "presence" : "Conditional", "reference" : "7.7.14"})
-ies.append({ "ie_value" : "End User Address", "presence" : "Mandatory", "reference" : "7.7.27"})
-ies.append({ "ie_value" : "Access Point Name", "presence" : "Mandatory", "reference" : "7.7.30"})
-ies.append({ "ie_value" : "GGSN Address for Control Plane", "presence" : "Conditional", "reference" : "7.7.32"})
-ies.append({ "ie_value" : "Alternative GGSN Address for Control Plane", "presence" : "Optional", "reference" : "7.7.32"})
-ies.append({ "ie_value" : "Quality of Service Profile", "presence" : "Mandatory", "reference" : "7.7.34"})
-ies.append({ "ie_value" : "Common Flags", "presence" : "Mandatory", "reference" : "7.7.48"})
-ies.append({ "ie_value" : "Temporary Mobile Group Identity", "presence" : "Mandatory", "reference" : "7.7.56"})
-ies.append({ "ie_value" : "MBMS Service Area", "presence" : "Mandatory", "reference" : "7.7.60"})
-ies.append({ "ie_value" : "MBMS Session Identifier", "presence" : "Optional", "reference" : "7.7.65"})
-ies.append({ "ie_value" : "MBMS 2G/3G Indicator", "presence" : "Mandatory", "reference" : "7.7.66"})
-ies.append({ "ie_value" : "MBMS Session Duration", "presence" : "Mandatory", "reference" : "7.7.59"})
-ies.append({ "ie_value" : "MBMS Session Repetition Number", "presence" : "Optional", "reference" : "7.7.69"})
-ies.append({ "ie_value" : "MBMS Time To Data Transfer", "presence" : "Mandatory", "reference" : "7.7.70"})
-ies.append({ "ie_value" : "MBMS Flow Identifier", "presence" : "Optional", "reference" : "7.7.84"})
-ies.append({ "ie_value" : "MBMS IP Multicast Distribution", "presence" : "Optional", "reference" : "7.7.85"})
-msg_list[key]["ies"] = ies
@@ -1,5 +0,0 @@
-ies = []
-ies.append({ "ie_value" : "End User Address", "presence" : "Mandatory", "reference" : "7.7.27"})
-ies.append({ "ie_value" : "Access Point Name", "presence" : "Mandatory", "reference" : "7.7.30"})
-ies.append({ "ie_value" : "MBMS Flow Identifier", "presence" : "Optional", "reference" : "7.7.84"})
-msg_list[key]["ies"] = ies
@@ -1,3 +0,0 @@
-ies = []
-ies.append({ "ie_value" : "Recovery", "presence" : "Mandatory", "reference" : "7.7.11"})
-msg_list[key]["ies"] = ies
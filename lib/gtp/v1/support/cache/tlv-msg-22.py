@@ -1,8 +0,0 @@
-ies = []
-ies.append({ "ie_value" : "Linked NSAPI", "presence" : "Mandatory", "reference" : "7.7.17"})
-ies.append({ "ie_value" : "Protocol Configuration Options", "presence" : "Optional", "reference" : "7.7.31"})
-ies.append({ "ie_value" : "Quality of Service Profile", "presence" : "Mandatory", "reference" : "7.7.34"})
-ies.append({ "ie_value" : "TFT", "presence" : "Conditional", "reference" : "7.7.36"})
-ies.append({ "ie_value" : "Correlation-ID", "presence" : "Mandatory", "reference" : "7.7.82"})
-ies.append({ "ie_value" : "Evolved Allocation/Retention Priority I", "presence" : "Optional", "reference" : "7.7.91"})
-msg_list[key]["ies"] = ies
@@ -1,4 +0,0 @@
-ies = []
-ies.append({ "ie_value" : "Cause", "presence" : "Mandatory", "reference" : "7.7.1"})
-ies.append({ "ie_value" : "Protocol Configuration Options", "presence" : "Conditional", "reference" : "7.7.31"})
-msg_list[key]["ies"] = ies
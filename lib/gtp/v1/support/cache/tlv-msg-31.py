@@ -1,3 +0,0 @@
-ies = []
-ies.append({ "ie_value" : "Extension Header Type List", "presence" : "Mandatory", "reference" : "7.7.40"})
-msg_list[key]["ies"] = ies
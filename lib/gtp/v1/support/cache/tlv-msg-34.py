@@ -1,3 +0,0 @@
-ies = []
-ies.append({ "ie_value" : "IMSI", "presence" : "Mandatory", "reference" : "7.7.2"})
-msg_list[key]["ies"] = ies
@@ -1,4 +0,0 @@
-ies = []
-ies.append({ "ie_value" : "Cause", "presence" : "Mandatory", "reference" : "7.7.1"})
-ies.append({ "ie_value" : "MAP Cause", "presence" : "Optional", "reference" : "7.7.8"})
-msg_list[key]["ies"] = ies
@@ -1,4 +0,0 @@
-ies = []
-ies.append({ "ie_value" : "IMSI", "presence" : "Mandatory", "reference" : "7.7.2"})
-ies.append({ "ie_value" : "GSN Address", "presence" : "Mandatory", "reference" : "7.7.32"})
-msg_list[key]["ies"] = ies
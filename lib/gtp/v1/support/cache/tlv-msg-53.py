@@ -1,45 +0,0 @@
-ies = []
-ies.append({ "ie_value" : "IMSI", "presence" : "Conditional", "reference" : "7.7.2"})
-ies.append({ "ie_value" : "Tunnel Endpoint Identifier Control Plane", "presence" : "Mandatory", "reference" : "7.7.14"})
-ies.append({ "ie_value" : "RANAP Cause", "presence" : "Mandatory", "reference" : "7.7.18"})
-ies.append({ "ie_value" : "Packet Flow ID", "presence" : "Optional", "reference" : "7.7.22"})
-ies.append({ "ie_value" : "Charging Characteristics", "presence" : "Optional", "reference" : "7.7.23"})
-ies.append({ "ie_value" : "MM Context", "presence" : "Mandatory", "reference" : "7.7.28"})
-ies.append({ "ie_value" : "PDP Context", "presence" : "Conditional", "reference" : "7.7.29"})
-ies.append({ "ie_value" : "SGSN Address for Control plane", "presence" : "Mandatory", "reference" : "7.7.32"})
-ies.append({ "ie_value" : "Alternative GGSN Address for control Plane", "presence" : "Optional", "reference" : "7.7.32"})
-ies.append({ "ie_value" : "Alternative GGSN Address for user traffic", "presence" : "Optional", "reference" : "7.7.32"})
-ies.append({ "ie_value" : "Target Identification", "presence" : "Mandatory", "reference" : "7.7.37"})
-ies.append({ "ie_value" : "UTRAN transparent container", "presence" : "Mandatory", "reference" : "7.7.38"})
-ies.append({ "ie_value" : "PDP Context Prioritization", "presence" : "Optional", "reference" : "7.7.45"})
-ies.append({ "ie_value" : "MBMS UE Context", "presence" : "Optional", "reference" : "7.7.55"})
-ies.append({ "ie_value" : "Selected PLMN ID", "presence" : "Optional", "reference" : "7.7.64"})
-ies.append({ "ie_value" : "BSS Container", "presence" : "Optional", "reference" : "7.7.72"})
-ies.append({ "ie_value" : "Cell Identification", "presence" : "Optional", "reference" : "7.7.73"})
-ies.append({ "ie_value" : "BSSGP Cause", "presence" : "Optional", "reference" : "7.7.75"})
-ies.append({ "ie_value" : "PS Handover XID Parameters", "presence" : "Optional", "reference" : "7.7.79"})
-ies.append({ "ie_value" : "Direct Tunnel Flags", "presence" : "Optional", "reference" : "7.7.81"})
-ies.append({ "ie_value" : "Reliable INTER RAT HANDOVER INFO", "presence" : "Optional", "reference" : "7.7.87"})
-ies.append({ "ie_value" : "Subscribed RFSP Index", "presence" : "Optional", "reference" : "7.7.88"})
-ies.append({ "ie_value" : "RFSP Index in use", "presence" : "Optional", "reference" : "7.7.88"})
-ies.append({ "ie_value" : "Co-located GGSN-PGW FQDN", "presence" : "Optional", "reference" : "7.7.90"})
-ies.append({ "ie_value" : "Evolved Allocation/Retention Priority II", "presence" : "Optional", "reference" : "7.7.92"})
-ies.append({ "ie_value" : "Extended Common Flags", "presence" : "Optional", "reference" : "7.7.93"})
-ies.append({ "ie_value" : "CSG ID", "presence" : "Optional", "reference" : "7.7.96"})
-ies.append({ "ie_value" : "CSG Membership Indication", "presence" : "Optional", "reference" : "7.7.97"})
-ies.append({ "ie_value" : "UE Network Capability", "presence" : "Optional", "reference" : "7.7.99"})
-ies.append({ "ie_value" : "UE-AMBR", "presence" : "Optional", "reference" : "7.7.100"})
-ies.append({ "ie_value" : "APN-AMBR with NSAPI", "presence" : "Optional", "reference" : "7.7.101"})
-ies.append({ "ie_value" : "Signalling Priority Indication with NSAPI", "presence" : "Optional", "reference" : "7.7.104"})
-ies.append({ "ie_value" : "Higher bitrates than 16 Mbps flag", "presence" : "Optional", "reference" : "7.7.105"})
-ies.append({ "ie_value" : "Additional MM context for SRVCC", "presence" : "Optional", "reference" : "7.7.107"})
-ies.append({ "ie_value" : "Additional flags for SRVCC", "presence" : "Optional", "reference" : "7.7.108"})
-ies.append({ "ie_value" : "STN-SR", "presence" : "Optional", "reference" : "7.7.109"})
-ies.append({ "ie_value" : "C-MSISDN", "presence" : "Optional", "reference" : "7.7.110"})
-ies.append({ "ie_value" : "Extended RANAP Cause", "presence" : "Optional", "reference" : "7.7.111"})
-ies.append({ "ie_value" : "eNodeB ID", "presence" : "Optional", "reference" : "7.7.112"})
-ies.append({ "ie_value" : "Selection Mode with NSAPI", "presence" : "Optional", "reference" : "7.7.113"})
-ies.append({ "ie_value" : "UE Usage Type", "presence" : "Optional", "reference" : "7.7.117"})
-ies.append({ "ie_value" : "Extended Common Flags II", "presence" : "Optional", "reference" : "7.7.118"})
-ies.append({ "ie_value" : "UE SCEF PDN Connection", "presence" : "Optional", "reference" : "7.7.121"})
-msg_list[key]["ies"] = ies
@@ -1,5 +0,0 @@
-ies = []
-ies.append({ "ie_value" : "RAB Context", "presence" : "Mandatory", "reference" : "7.7.19"})
-ies.append({ "ie_value" : "Source RNC PDCP context info", "presence" : "Optional", "reference" : "7.7.61"})
-ies.append({ "ie_value" : "PDU Numbers", "presence" : "Optional", "reference" : "7.7.74"})
-msg_list[key]["ies"] = ies
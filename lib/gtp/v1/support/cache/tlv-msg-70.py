@@ -1,5 +0,0 @@
-ies = []
-ies.append({ "ie_value" : "RAN Transparent Container", "presence" : "Mandatory", "reference" : "7.7.43"})
-ies.append({ "ie_value" : "RIM Routing Address", "presence" : "Optional", "reference" : "7.7.57"})
-ies.append({ "ie_value" : "RIM Routing Address Discriminator", "presence" : "Optional", "reference" : "7.7.77"})
-msg_list[key]["ies"] = ies
@@ -1,64 +0,0 @@
-# [Table 1: Messages in GTP] Index = 11
-msg_list["Echo Request"] = { "type" : "1" }
-msg_list["Echo Response"] = { "type" : "2" }
-msg_list["Version Not Supported"] = { "type" : "3" }
-msg_list["Node Alive Request"] = { "type" : "4" }
-msg_list["Node Alive Response"] = { "type" : "5" }
-msg_list["Redirection Request"] = { "type" : "6" }
-msg_list["Redirection Response"] = { "type" : "7" }
-msg_list["Create PDP Context Request"] = { "type" : "16" }
-msg_list["Create PDP Context Response"] = { "type" : "17" }
-msg_list["Update PDP Context Request"] = { "type" : "18" }
-msg_list["Update PDP Context Response"] = { "type" : "19" }
-msg_list["Delete PDP Context Request"] = { "type" : "20" }
-msg_list["Delete PDP Context Response"] = { "type" : "21" }
-msg_list["Initiate PDP Context Activation Request"] = { "type" : "22" }
-msg_list["Initiate PDP Context Activation Response"] = { "type" : "23" }
-msg_list["Error Indication"] = { "type" : "26" }
-msg_list["PDU Notification Request"] = { "type" : "27" }
-msg_list["PDU Notification Response"] = { "type" : "28" }
-msg_list["PDU Notification Reject Request"] = { "type" : "29" }
-msg_list["PDU Notification Reject Response"] = { "type" : "30" }
-msg_list["Supported Extension Headers Notification"] = { "type" : "31" }
-msg_list["Send Routeing Information for GPRS Request"] = { "type" : "32" }
-msg_list["Send Routeing Information for GPRS Response"] = { "type" : "33" }
-msg_list["Failure Report Request"] = { "type" : "34" }
-msg_list["Failure Report Response"] = { "type" : "35" }
-msg_list["Note MS GPRS Present Request"] = { "type" : "36" }
-msg_list["Note MS GPRS Present Response"] = { "type" : "37" }
-msg_list["Identification Request"] = { "type" : "48" }
-msg_list["Identification Response"] = { "type" : "49" }
-msg_list["SGSN Context Request"] = { "type" : "50" }
-msg_list["SGSN Context Response"] = { "type" : "51" }
-msg_list["SGSN Context Acknowledge"] = { "type" : "52" }
-msg_list["Forward Relocation Request"] = { "type" : "53" }
-msg_list["Forward Relocation Response"] = { "type" : "54" }
-msg_list["Forward Relocation Complete"] = { "type" : "55" }
-msg_list["Relocation Cancel Request"] = { "type" : "56" }
-msg_list["Relocation Cancel Response"] = { "type" : "57" }
-msg_list["Forward SRNS Context"] = { "type" : "58" }
-msg_list["Forward Relocation Complete Acknowledge"] = { "type" : "59" }
-msg_list["Forward SRNS Context Acknowledge"] = { "type" : "60" }
-msg_list["UE Registration Query Request"] = { "type" : "61" }
-msg_list["UE Registration Query Response"] = { "type" : "62" }
-msg_list["RAN Information Relay"] = { "type" : "70" }
-msg_list["MBMS Notification Request"] = { "type" : "96" }
-msg_list["MBMS Notification Response"] = { "type" : "97" }
-msg_list["MBMS Notification Reject Request"] = { "type" : "98" }
-msg_list["MBMS Notification Reject Response"] = { "type" : "99" }
-msg_list["Create MBMS Context Request"] = { "type" : "100" }
-msg_list["Create MBMS Context Response"] = { "type" : "101" }
-msg_list["Update MBMS Context Request"] = { "type" : "102" }
-msg_list["Update MBMS Context Response"] = { "type" : "103" }
-msg_list["Delete MBMS Context Request"] = { "type" : "104" }
-msg_list["Delete MBMS Context Response"] = { "type" : "105" }
-msg_list["MBMS Registration Request"] = { "type" : "112" }
-msg_list["MBMS Registration Response"] = { "type" : "113" }
-msg_list["MBMS De-Registration Request"] = { "type" : "114" }
-msg_list["MBMS De-Registration Response"] = { "type" : "115" }
-msg_list["MBMS Session Start Request"] = { "type" : "116" }
-msg_list["MBMS Session Start Response"] = { "type" : "117" }
-msg_list["MBMS Session Stop Request"] = { "type" : "118" }
-msg_list["MBMS Session Stop Response"] = { "type" : "119" }
-msg_list["MBMS Session Update Request"] = { "type" : "120" }
-msg_list["MBMS Session Update Response"] = { "type" : "121" }
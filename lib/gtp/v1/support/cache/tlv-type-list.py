@@ -1,125 +0,0 @@
-# [Table 37: Information Elements] Index = 73
-type_list["Cause"] = { "type" : "1", "reference" : "7.7.1", "format" : "TV", "size" : 1 }
-type_list["IMSI"] = { "type" : "2", "reference" : "7.7.2", "format" : "TV", "size" : 8 }
-type_list["RAI"] = { "type" : "3", "reference" : "7.7.3", "format" : "TV", "size" : 6 }
-type_list["TLLI"] = { "type" : "4", "reference" : "7.7.4", "format" : "TV", "size" : 4 }
-type_list["P-TMSI"] = { "type" : "5", "reference" : "7.7.5", "format" : "TV", "size" : 4 }
-type_list["Reordering Required"] = { "type" : "8", "reference" : "7.7.6", "format" : "TV", "size" : 1 }
-type_list["Authentication Triplet"] = { "type" : "9", "reference" : "7.7.7", "format" : "TV", "size" : 28 }
-type_list["MAP Cause"] = { "type" : "11", "reference" : "7.7.8", "format" : "TV", "size" : 1 }
-type_list["P-TMSI Signature"] = { "type" : "12", "reference" : "7.7.9", "format" : "TV", "size" : 3 }
-type_list["MS Validated"] = { "type" : "13", "reference" : "7.7.10", "format" : "TV", "size" : 1 }
-type_list["Recovery"] = { "type" : "14", "reference" : "7.7.11", "format" : "TV", "size" : 1 }
-type_list["Selection Mode"] = { "type" : "15", "reference" : "7.7.12", "format" : "TV", "size" : 1 }
-type_list["Tunnel Endpoint Identifier Data I"] = { "type" : "16", "reference" : "7.7.13", "format" : "TV", "size" : 4 }
-type_list["Tunnel Endpoint Identifier Control Plane"] = { "type" : "17", "reference" : "7.7.14", "format" : "TV", "size" : 4 }
-type_list["Tunnel Endpoint Identifier Data II"] = { "type" : "18", "reference" : "7.7.15", "format" : "TV", "size" : 5 }
-type_list["Teardown Ind"] = { "type" : "19", "reference" : "7.7.16", "format" : "TV", "size" : 1 }
-type_list["NSAPI"] = { "type" : "20", "reference" : "7.7.17", "format" : "TV", "size" : 1 }
-type_list["RANAP Cause"] = { "type" : "21", "reference" : "7.7.18", "format" : "TV", "size" : 1 }
-type_list["RAB Context"] = { "type" : "22", "reference" : "7.7.19", "format" : "TV", "size" : 9 }
-type_list["Radio Priority SMS"] = { "type" : "23", "reference" : "7.7.20", "format" : "TV", "size" : 1 }
-type_list["Radio Priority"] = { "type" : "24", "reference" : "7.7.21", "format" : "TV", "size" : 1 }
-type_list["Packet Flow Id"] = { "type" : "25", "reference" : "7.7.22", "format" : "TV", "size" : 2 }
-type_list["Charging Characteristics"] = { "type" : "26", "reference" : "7.7.23", "format" : "TV", "size" : 2 }
-type_list["Trace Reference"] = { "type" : "27", "reference" : "7.7.24", "format" : "TV", "size" : 2 }
-type_list["Trace Type"] = { "type" : "28", "reference" : "7.7.25", "format" : "TV", "size" : 2 }
-type_list["MS Not Reachable Reason"] = { "type" : "29", "reference" : "7.7.25A", "format" : "TV", "size" : 1 }
-type_list["Charging ID"] = { "type" : "127", "reference" : "7.7.26", "format" : "TV", "size" : 4 }
-type_list["End User Address"] = { "type" : "128", "reference" : "7.7.27", "format" : "TLV" }
-type_list["MM Context"] = { "type" : "129", "reference" : "7.7.28", "format" : "TLV" }
-type_list["PDP Context"] = { "type" : "130", "reference" : "7.7.29", "format" : "TLV" }
-type_list["Access Point Name"] = { "type" : "131", "reference" : "7.7.30", "format" : "TLV" }
-type_list["Protocol Configuration Options"] = { "type" : "132", "reference" : "7.7.31", "format" : "TLV" }
-type_list["GSN Address"] = { "type" : "133", "reference" : "7.7.32", "format" : "TLV" }
-type_list["MSISDN"] = { "type" : "134", "reference" : "7.7.33", "format" : "TLV" }
-type_list["Quality of Service Profile"] = { "type" : "135", "reference" : "7.7.34", "format" : "TLV" }
-type_list["Authentication Quintuplet"] = { "type" : "136", "reference" : "7.7.35", "format" : "TLV" }
-type_list["Traffic Flow Template"] = { "type" : "137", "reference" : "7.7.36", "format" : "TLV" }
-type_list["Target Identification"] = { "type" : "138", "reference" : "7.7.37", "format" : "TLV" }
-type_list["UTRAN Transparent Container"] = { "type" : "139", "reference" : "7.7.38", "format" : "TLV" }
-type_list["RAB Setup Information"] = { "type" : "140", "reference" : "7.7.39", "format" : "TLV" }
-type_list["Extension Header Type List"] = { "type" : "141", "reference" : "7.7.40", "format" : "TLV" }
-type_list["Trigger Id"] = { "type" : "142", "reference" : "7.7.41", "format" : "TLV" }
-type_list["OMC Identity"] = { "type" : "143", "reference" : "7.7.42", "format" : "TLV" }
-type_list["RAN Transparent Container"] = { "type" : "144", "reference" : "7.7.43", "format" : "TLV" }
-type_list["PDP Context Prioritization"] = { "type" : "145", "reference" : "7.7.45", "format" : "TLV", "size" : 0 }
-type_list["Additional RAB Setup Information"] = { "type" : "146", "reference" : "7.7.45A", "format" : "TLV" }
-type_list["SGSN Number"] = { "type" : "147", "reference" : "7.7.47", "format" : "TLV" }
-type_list["Common Flags"] = { "type" : "148", "reference" : "7.7.48", "format" : "TLV", "size" : 1 }
-type_list["APN Restriction"] = { "type" : "149", "reference" : "7.7.49", "format" : "TLV", "size" : 1 }
-type_list["Radio Priority LCS"] = { "type" : "150", "reference" : "7.7.25B", "format" : "TLV", "size" : 1 }
-type_list["RAT Type"] = { "type" : "151", "reference" : "7.7.50", "format" : "TLV", "size" : 1 }
-type_list["User Location Information"] = { "type" : "152", "reference" : "7.7.51", "format" : "TLV" }
-type_list["MS Time Zone"] = { "type" : "153", "reference" : "7.7.52", "format" : "TLV", "size" : 1 }
-type_list["SV"] = { "type" : "154", "reference" : "7.7.53", "format" : "TLV", "size" : 8 }
-type_list["CAMEL Charging Information Container"] = { "type" : "155", "reference" : "7.7.54", "format" : "TLV" }
-type_list["MBMS UE Context"] = { "type" : "156", "reference" : "7.7.55", "format" : "TLV" }
-type_list["TMGI"] = { "type" : "157", "reference" : "7.7.56", "format" : "TLV", "size" : 6 }
-type_list["RIM Routing Address"] = { "type" : "158", "reference" : "7.7.57", "format" : "TLV" }
-type_list["MBMS Protocol Configuration Options"] = { "type" : "159", "reference" : "7.7.58", "format" : "TLV" }
-type_list["MBMS Service Area"] = { "type" : "160", "reference" : "7.7.60", "format" : "TLV" }
-type_list["Source RNC PDCP context info"] = { "type" : "161", "reference" : "7.7.61", "format" : "TLV" }
-type_list["Additional Trace Info"] = { "type" : "162", "reference" : "7.7.62", "format" : "TLV", "size" : 9 }
-type_list["Hop Counter"] = { "type" : "163", "reference" : "7.7.63", "format" : "TLV", "size" : 1 }
-type_list["Selected PLMN ID"] = { "type" : "164", "reference" : "7.7.64", "format" : "TLV", "size" : 3 }
-type_list["MBMS Session Identifier"] = { "type" : "165", "reference" : "7.7.65", "format" : "TLV", "size" : 1 }
-type_list["MBMS 2G/3G Indicator"] = { "type" : "166", "reference" : "7.7.66", "format" : "TLV", "size" : 1 }
-type_list["Enhanced NSAPI"] = { "type" : "167", "reference" : "7.7.67", "format" : "TLV", "size" : 1 }
-type_list["MBMS Session Duration"] = { "type" : "168", "reference" : "7.7.59", "format" : "TLV", "size" : 3 }
-type_list["Additional MBMS Trace Info"] = { "type" : "169", "reference" : "7.7.68", "format" : "TLV", "size" : 8 }
-type_list["MBMS Session Repetition Number"] = { "type" : "170", "reference" : "7.7.69", "format" : "TLV", "size" : 1 }
-type_list["MBMS Time To Data Transfer"] = { "type" : "171", "reference" : "7.7.70", "format" : "TLV", "size" : 1 }
-type_list["BSS Container"] = { "type" : "173", "reference" : "7.7.72", "format" : "TLV" }
-type_list["Cell Identification"] = { "type" : "174", "reference" : "7.7.73", "format" : "TLV", "size" : 17 }
-type_list["PDU Numbers"] = { "type" : "175", "reference" : "7.7.74", "format" : "TLV", "size" : 9 }
-type_list["BSSGP Cause"] = { "type" : "176", "reference" : "7.7.75", "format" : "TLV", "size" : 1 }
-type_list["Required MBMS bearer capabilities"] = { "type" : "177", "reference" : "7.7.76", "format" : "TLV" }
-type_list["RIM Routing Address Discriminator"] = { "type" : "178", "reference" : "7.7.77", "format" : "TLV", "size" : 1 }
-type_list["List of set-up PFCs"] = { "type" : "179", "reference" : "7.7.78", "format" : "TLV" }
-type_list["PS Handover XID Parameters"] = { "type" : "180", "reference" : "7.7.79", "format" : "TLV" }
-type_list["MS Info Change Reporting Action"] = { "type" : "181", "reference" : "7.7.80", "format" : "TLV", "size" : 1 }
-type_list["Direct Tunnel Flags"] = { "type" : "182", "reference" : "7.7.81", "format" : "TLV" }
-type_list["Correlation-ID"] = { "type" : "183", "reference" : "7.7.82", "format" : "TLV", "size" : 1 }
-type_list["Bearer Control Mode"] = { "type" : "184", "reference" : "7.7.83", "format" : "TLV", "size" : 1 }
-type_list["MBMS Flow Identifier"] = { "type" : "185", "reference" : "7.7.84", "format" : "TLV" }
-type_list["MBMS IP Multicast Distribution"] = { "type" : "186", "reference" : "7.7.85", "format" : "TLV" }
-type_list["MBMS Distribution Acknowledgement"] = { "type" : "187", "reference" : "7.7.86", "format" : "TLV", "size" : 1 }
-type_list["Reliable INTER RAT HANDOVER INFO"] = { "type" : "188", "reference" : "7.7.87", "format" : "TLV", "size" : 1 }
-type_list["RFSP Index"] = { "type" : "189", "reference" : "7.7.88", "format" : "TLV", "size" : 2 }
-type_list["FQDN"] = { "type" : "190", "reference" : "7.7.90", "format" : "TLV" }
-type_list["Evolved Allocation/Retention Priority I"] = { "type" : "191", "reference" : "7.7.91", "format" : "TLV", "size" : 1 }
-type_list["Evolved Allocation/Retention Priority II"] = { "type" : "192", "reference" : "7.7.92", "format" : "TLV", "size" : 2 }
-type_list["Extended Common Flags"] = { "type" : "193", "reference" : "7.7.93", "format" : "TLV" }
-type_list["UCI"] = { "type" : "194", "reference" : "7.7.94", "format" : "TLV", "size" : 8 }
-type_list["CSG Information Reporting Action"] = { "type" : "195", "reference" : "7.7.95", "format" : "TLV" }
-type_list["CSG ID"] = { "type" : "196", "reference" : "7.7.96", "format" : "TLV", "size" : 4 }
-type_list["CMI"] = { "type" : "197", "reference" : "7.7.97", "format" : "TLV", "size" : 1 }
-type_list["AMBR"] = { "type" : "198", "reference" : "7.7.98", "format" : "TLV", "size" : 8 }
-type_list["UE Network Capability"] = { "type" : "199", "reference" : "7.7.99", "format" : "TLV" }
-type_list["UE-AMBR"] = { "type" : "200", "reference" : "7.7.100", "format" : "TLV" }
-type_list["APN-AMBR with NSAPI"] = { "type" : "201", "reference" : "7.7.101", "format" : "TLV", "size" : 9 }
-type_list["GGSN Back-Off Time"] = { "type" : "202", "reference" : "7.7.102", "format" : "TLV" }
-type_list["Signalling Priority Indication"] = { "type" : "203", "reference" : "7.7.103", "format" : "TLV" }
-type_list["Signalling Priority Indication with NSAPI"] = { "type" : "204", "reference" : "7.7.104", "format" : "TLV" }
-type_list["Higher bitrates than 16 Mbps flag"] = { "type" : "205", "reference" : "7.7.105", "format" : "TLV", "size" : 1 }
-type_list["Additional MM context for SRVCC"] = { "type" : "207", "reference" : "7.7.107", "format" : "TLV" }
-type_list["Additional flags for SRVCC"] = { "type" : "208", "reference" : "7.7.108", "format" : "TLV" }
-type_list["STN-SR"] = { "type" : "209", "reference" : "7.7.109", "format" : "TLV" }
-type_list["C-MSISDN"] = { "type" : "210", "reference" : "7.7.110", "format" : "TLV" }
-type_list["Extended RANAP Cause"] = { "type" : "211", "reference" : "7.7.111", "format" : "TLV" }
-type_list["eNodeB ID"] = { "type" : "212", "reference" : "7.7.112", "format" : "TLV" }
-type_list["Selection Mode with NSAPI"] = { "type" : "213", "reference" : "7.7.113", "format" : "TLV", "size" : 2 }
-type_list["ULI Timestamp"] = { "type" : "214", "reference" : "7.7.114", "format" : "TLV" }
-type_list["LHN-ID with NSAPI"] = { "type" : "215", "reference" : "7.7.115", "format" : "TLV" }
-type_list["CN Operator Selection Entity"] = { "type" : "216", "reference" : "7.7.116", "format" : "TLV" }
-type_list["UE Usage Type"] = { "type" : "217", "reference" : "7.7.117", "format" : "TLV" }
-type_list["Extended Common Flags II"] = { "type" : "218", "reference" : "7.7.118", "format" : "TLV" }
-type_list["Node Identifier"] = { "type" : "219", "reference" : "7.7.119", "format" : "TLV" }
-type_list["CIoT Optimizations Support Indication"] = { "type" : "220", "reference" : "7.7.120", "format" : "TLV" }
-type_list["SCEF PDN Connection"] = { "type" : "221", "reference" : "7.7.121", "format" : "TLV" }
-type_list["IOV_updates counter"] = { "type" : "222", "reference" : "7.7.122", "format" : "TLV", "size" : 1 }
-type_list["Mapped UE Usage Type"] = { "type" : "223", "reference" : "7.7.123", "format" : "TLV" }
-type_list["UP Function Selection Indication Flags"] = { "type" : "224", "reference" : "7.7.124", "format" : "TLV" }
-type_list["Special IE type for IE Type Extension"] = { "type" : "238", "reference" : "See NOTE3", "format" : "TLV" }
-type_list["Charging Gateway Address"] = { "type" : "251", "reference" : "7.7.44", "format" : "TLV" }
@@ -17,17 +17,14 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from docx import Document
-from docx.document import Document as _Document
-from docx.oxml.text.paragraph import CT_P
-from docx.oxml.table import CT_Tbl
-from docx.table import _Cell, Table
-from docx.text.paragraph import Paragraph
-
 import re, os, sys, string
-import datetime
 import getopt
-import getpass
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+    '..', '..', '..', 'core', 'support'))
+from ogsgen import SpecIndex, Cache, Output, source_sha256, stamp, \
+    write_desc_index, write_bench_prologue, write_bench_tlv, write_bench_main, \
+    Corpus, VARIANTS, tlv_octets, memoize, Profile
 
 version = "0.1.0"
 
@@ -38,6 +35,13 @@ verbosity = 0
 filename = ""
 outdir = './'
 cachedir = './cache/'
+cache_ro = []
+reproducible = False
+depfile = None
+bench = None
+corpus = None
+profiling = False
+pstats = None
 
 FAIL = '\033[91m'
 INFO = '\033[93m'
@@ -59,7 +63,6 @@ def write_file(f, string):
     d_print(string)
 
 def output_header_to_file(f):
-    now = datetime.datetime.now()
     f.write("""/*
  * Copyright (C) 2019 by Sukchan Lee <acetcom@gmail.com>
  * Copyright (C) 2022 by sysmocom - s.f.m.c. GmbH <info@sysmocom.de>
@@ -85,7 +88,7 @@ def output_header_to_file(f):
     f.write("/*******************************************************************************\n")
     f.write(" * This file had been created by gtp1-tlv.py script v%s\n" % (version))
     f.write(" * Please do not modify this file but regenerate it via script.\n")
-    f.write(" * Created on: %s by %s\n * from %s\n" % (str(now), getpass.getuser(), filename))
+    f.write(stamp(filename, reproducible))
     f.write(" ******************************************************************************/\n\n")
 
 def usage():
@@ -96,11 +99,20 @@ def usage():
     print("-f [file] Input file to parse")
     print("-o [dir]  Output files to given directory")
     print("-c [dir]  Cache files to given directory")
+    print("-C [dir]  Also read cache files from dir, never writing there")
+    print("-r        Reproducible output (no date and user in headers)")
+    print("-M [file] Write the files read to a Makefile depfile")
+    print("-B [file] Write a C program benchmarking the codec of each message")
+    print("-F [file] Write a seed corpus of the messages for the fuzzers (.zip)")
+    print("-t        Report the time and peak memory of each phase")
+    print("-T [file] Write a cProfile of the run to file (pstats)")
     print("-h        Print this help and return")
 
+@memoize
 def v_upper(v):
     return re.sub('3GPP', '', re.sub('\'', '_', re.sub('/', '_', re.sub('-', '_', re.sub(' ', '_', v)))).upper())
 
+@memoize
 def v_lower(v):
     return re.sub('3gpp', '', re.sub('\'', '_', re.sub('/', '_', re.sub('-', '_', re.sub(' ', '_', v)))).lower())
 
@@ -116,12 +128,12 @@ def get_cells(cells):
         #"FIXME: Table 7.5A.9: Information Elements in a Delete MBMS Context Request" format in document is broken:
         d_info("Expected length 3: %r" % repr(cells))
         return None
-    presence = cells[1].text
+    presence = cells[1]
     presence = re.sub('\n', '', presence);
-    ie_value = re.sub('\s*\n*\s*\([^\)]*\)*', '', cells[0].text)
+    ie_value = re.sub('\s*\n*\s*\([^\)]*\)*', '', cells[0])
     ie_value = re.sub('\\xa0', ' ', ie_value) # drop unicode char "No-Break Space" in "Higher bitrates than 16 Mbps flag"
     ie_value = re.sub('\n', ' ', ie_value)
-    comment = cells[2].text.encode('ascii', 'ignore').decode('utf-8').rstrip()
+    comment = cells[2].encode('ascii', 'ignore').decode('utf-8').rstrip()
     comment = re.sub('\n|\"|\'|\\\\', '', comment);
     if comment == 'GSN Address 7.7.32':
         reference = '7.7.32'
@@ -129,58 +141,92 @@ def get_cells(cells):
         reference = comment
 
     if ie_value == '' and reference == '7.7.16':
-        # For some unknown reason "cells[0].text" is '' in this row
+        # For some unknown reason "cells[0]" is '' in this row
         ie_value = 'Teardown Ind'
 
     return { "ie_value" : ie_value, "presence" : presence, "reference": reference, }
 
-def write_cells_to_file(name, cells):
-    write_file(f, name + ".append({ " + \
-        "\"ie_value\" : \"" + cells["ie_value"] + \
-        "\", \"presence\" : \"" + cells["presence"] + \
-        "\", \"reference\" : \"" + cells["reference"] + "\"})\n")
+def extract_msg_list():
+    msg_list = {}
+    tables = []
 
-def document_paragraph_tables(document):
+    msg_table = ""
+    for i, paragraph, table in spec.paragraph_tables():
+        if spec.header(i)[0].find('Message Type value') != -1:
+            msg_table = table
+            tables = [{ "index" : i, "heading" : paragraph }]
+            d_print("Table Index = %d Name = [%s]\n" % (i, paragraph))
 
+    for row in msg_table[2:-6]:
+        key = row[1]
+        type = row[0]
+        if type.isdigit() is False:
+            continue
+        if int(type) in range(128, 160):
+            continue
+        if int(type) in range(231, 240):
+            continue
+        if key.find('Reserved') != -1:
+            continue
+        key = re.sub('\s*\n*\s*\([^\)]*\)*', '', key)
+        key = re.sub('\n', '', key)
+        msg_list[key] = { "type": type }
+
+    return msg_list, tables
+
+def extract_type_list():
+    type_list = {}
     tables = []
-    # iterate .docx objects
-    def iter_block_items(parent):
-
-      if isinstance(parent, _Document):
-          parent_elm = parent.element.body
-      elif isinstance(parent, _Cell):
-          parent_elm = parent._tc
-      elif isinstance(parent, _Row):
-          parent_elm = parent._tr
-      else:
-          raise ValueError("Document format error.")
-
-      for child in parent_elm.iterchildren():
-          if isinstance(child, CT_P):
-              yield Paragraph(child, parent)
-          elif isinstance(child, CT_Tbl):
-              yield Table(child, parent)
-
-    idx = -1
-    paragraph = ''
-    for block in iter_block_items(document):
-        table=[]
-        # memorize the paragraph
-        if isinstance(block, Paragraph):
-          paragraph = block.text
-          continue
-        # fetch the table
-        if isinstance(block, Table):
-            idx += 1
-            table = block
-        # store table having a paragraph name
-        tables.append([idx, paragraph, table])
-
-    return tables
 
+    ie_table = ""
+    for i, paragraph, table in spec.paragraph_tables():
+        d_print("iter: Table Index = %d Name = [%s]\n" % (i, paragraph))
+        if spec.header(i)[0].find('IE Type Value') != -1:
+            ie_table = table
+            tables = [{ "index" : i, "heading" : paragraph }]
+            d_print("Table Index = %d Name = [%s]\n" % (i, paragraph))
+
+    for row in ie_table[1:-3]:
+        type = row[0]
+        format = row[1]
+        key = row[2]
+        reference = row[3]
+        len_type = row[4]
+        if key.find('Reserved') != -1:
+            continue
+        if key.find('Spare') != -1:
+            continue
+        else:
+            key = re.sub('.*\(', '', row[2])
+            key = re.sub('\)', '', key)
+            key = re.sub('\s*$', '', key)
+            if key == '' and type == '19':
+                # For some unknown reason "row[2]" is '' in this row
+                key = 'Teardown Ind'
+        type_list[key] = { 'type': type , 'reference': reference, 'format': format }
+        if (format.find('TLV') != -1 or format.find('TV') != -1) and len_type.find('Fixed') != -1:
+            size = int(row[5])
+            type_list[key]['size'] = size
+
+    return type_list, tables
+
+def extract_msg_ies(table):
+    tables = [{ "index" : table }]
+
+    ies = []
+    table = spec.table(table)
+    for row in table[1:]:
+        cells = get_cells(row)
+        if cells is None:
+            continue
+        if cells["ie_value"] == "Private Extension":
+            continue;
+        ies.append(cells)
+
+    return ies, tables
 
 try:
-    opts, args = getopt.getopt(sys.argv[1:], "df:ho:c:", ["debug", "file", "help", "output", "cache"])
+    opts, args = getopt.getopt(sys.argv[1:], "df:hro:c:C:M:B:F:tT:", ["debug", "file=", "help", "output=", "cache=", "readonly-cache=", "reproducible", "depfile=", "bench=", "corpus=", "profile", "pstats="])
 except getopt.GetoptError as err:
     # print help information and exit:
     usage()
@@ -199,6 +245,20 @@ for o, a in opts:
         cachedir = a
         if cachedir.rfind('/') != len(cachedir):
             cachedir += '/'
+    if o in ("-C", "--readonly-cache"):
+        cache_ro.append(a)
+    if o in ("-r", "--reproducible"):
+        reproducible = True
+    if o in ("-M", "--depfile"):
+        depfile = a
+    if o in ("-B", "--bench"):
+        bench = a
+    if o in ("-F", "--corpus"):
+        corpus = a
+    if o in ("-t", "--profile"):
+        profiling = True
+    if o in ("-T", "--pstats"):
+        pstats = a
     if o in ("-h", "--help"):
         usage()
         sys.exit(2)
@@ -208,88 +268,25 @@ if os.path.isfile(filename) and os.access(filename, os.R_OK):
 else:
     d_error("Cannot find file : " + filename)
 
-d_info("[Message List]")
-cachefile = cachedir + 'tlv-msg-list.py'
-if os.path.isfile(cachefile) and os.access(cachefile, os.R_OK):
-    exec(open(cachefile).read())
-    print("Read from " + cachefile)
-else:
-    document = Document(filename)
-    f = open(cachefile, 'w')
+spec = SpecIndex(filename)
 
-    msg_table = ""
-    for i, paragraph, table in document_paragraph_tables(document):
-        cell = table.rows[0].cells[0]
-        if cell.text.find('Message Type value') != -1:
-            msg_table = table
-            d_print("Table Index = %d Name = [%s]\n" % (i, paragraph))
-            write_file(f, "# [%s] Index = %d\n" % (paragraph, i))
+cache = Cache(cachedir, filename, "gtp1-tlv.py v%s" % version,
+        source_sha256(get_cells, extract_msg_list, extract_type_list,
+            extract_msg_ies),
+        readonly=cache_ro)
 
-    for row in msg_table.rows[2:-6]:
-        key = row.cells[1].text
-        type = row.cells[0].text
-        if type.isdigit() is False:
-            continue
-        if int(type) in range(128, 160):
-            continue
-        if int(type) in range(231, 240):
-            continue
-        if key.find('Reserved') != -1:
-            continue
-        key = re.sub('\s*\n*\s*\([^\)]*\)*', '', key)
-        key = re.sub('\n', '', key)
-        msg_list[key] = { "type": type }
-        write_file(f, "msg_list[\"" + key + "\"] = { \"type\" : \"" + type + "\" }\n")
-    f.close()
+profile = Profile(profiling, pstats)
+spec.load = profile.wrap('docx', spec.load)
+cache.load = profile.wrap('cache', cache.load)
+cache.store = profile.wrap('cache', cache.store)
+get_cells = profile.wrap('get_cells', get_cells)
 
-d_info("[IE Type List]")
-cachefile = cachedir + 'tlv-type-list.py'
-if os.path.isfile(cachefile) and os.access(cachefile, os.R_OK):
-    exec(open(cachefile).read())
-    print("Read from " + cachefile)
-else:
-    document = Document(filename)
-    f = open(cachefile, 'w')
+d_info("[Message List]")
+msg_list.update(cache.fetch('tlv-msg-list', extract_msg_list))
 
-    ie_table = ""
-    for i, paragraph, table in document_paragraph_tables(document):
-        d_print("iter: Table Index = %d Name = [%s]\n" % (i, paragraph))
-        cell = table.rows[0].cells[0]
-        if cell.text.find('IE Type Value') != -1:
-            ie_table = table
-            d_print("Table Index = %d Name = [%s]\n" % (i, paragraph))
-            write_file(f, "# [%s] Index = %d\n" % (paragraph, i))
-
-    for row in ie_table.rows[1:-3]:
-        type = row.cells[0].text
-        format = row.cells[1].text
-        key = row.cells[2].text
-        reference = row.cells[3].text
-        len_type = row.cells[4].text
-        if key.find('Reserved') != -1:
-            continue
-        if key.find('Spare') != -1:
-            continue
-        else:
-            key = re.sub('.*\(', '', row.cells[2].text)
-            key = re.sub('\)', '', key)
-            key = re.sub('\s*$', '', key)
-            if key == '' and type == '19':
-                # For some unknown reason "row.cells[2].text" is '' in this row
-                key = 'Teardown Ind'
-        type_list[key] = { 'type': type , 'reference': reference, 'format': format }
-        write_file(f, "type_list[\"" + key + "\"] = { \"type\" : \"" + type)
-        write_file(f, "\", \"reference\" : \"" + reference)
-        write_file(f, "\", \"format\" : \"" + format)
-        if (format.find('TLV') != -1 or format.find('TV') != -1) and len_type.find('Fixed') != -1:
-            size = int(row.cells[5].text)
-            type_list[key]['size'] = size
-            write_file(f, "\", \"size\" : " + str(size))
-        else:
-            write_file(f, "\"")
-        write_file(f, " }\n")
-    f.close()
-    #type_list['MM Context'] = { "type": "107", "reference": "7.7.28" }
+d_info("[IE Type List]")
+type_list.update(cache.fetch('tlv-type-list', extract_type_list))
+#type_list['MM Context'] = { "type": "107", "reference": "7.7.28" }
 
 
 def set_c_type(ie_name, c_type=''):
@@ -396,30 +393,14 @@ for key in msg_list.keys():
 #            d_info('skipping, broken in source document')
 #            # FIXME: manually generate the cells for each row
 #            continue
-        cachefile = cachedir + "tlv-msg-" + msg_list[key]["type"] + ".py"
-        if os.path.isfile(cachefile) and os.access(cachefile, os.R_OK):
-            exec(open(cachefile).read())
-            print("Read from " + cachefile)
-        else:
-            document = Document(filename)
-            f = open(cachefile, 'w')
-
-            ies = []
-            write_file(f, "ies = []\n")
-            table = document.tables[msg_list[key]["table"]]
-            for row in table.rows[1:]:
-                cells = get_cells(row.cells)
-                if cells is None:
-                    continue
-                if cells["ie_value"] == "Private Extension":
-                    continue;
-                ies.append(cells)
-                write_cells_to_file("ies", cells)
-            msg_list[key]["ies"] = ies
-            write_file(f, "msg_list[key][\"ies\"] = ies\n")
-            f.close()
-
-f = open(outdir + 'message.h', 'w')
+        msg_list[key]["ies"] = cache.fetch(
+                "tlv-msg-" + msg_list[key]["type"], extract_msg_ies,
+                table=msg_list[key]["table"])
+
+profile.enter('emit')
+output = Output()
+
+f = output.open(outdir + 'message.h')
 output_header_to_file(f)
 f.write("""#if !defined(OGS_GTP_INSIDE) && !defined(OGS_GTP_COMPILATION)
 #error "This header cannot be included directly."
@@ -520,6 +501,23 @@ for (k, v) in sorted_msg_list:
         f.write("} ogs_gtp1_" + v_lower(k) + "_t;\n")
         f.write("\n")
 
+f.write("""/*
+ * The most ogs_tlv_t nodes a message takes from the pool of
+ * ogs_tlv_get() to be parsed or built, and how deep its IEs nest.
+ */
+""")
+max_tlv = (0, 0)
+for (k, v) in sorted_msg_list:
+    if "ies" in msg_list[k]:
+        count = len(msg_list[k]["ies"])
+        depth = 1 if count != 0 else 0
+        f.write("#define OGS_GTP1_%s_MAX_TLV %d\n" % (v_upper(k), count))
+        f.write("#define OGS_GTP1_%s_MAX_TLV_DEPTH %d\n" % (v_upper(k), depth))
+        max_tlv = (max(max_tlv[0], count), max(max_tlv[1], depth))
+f.write("#define OGS_GTP1_MAX_TLV %d\n" % max_tlv[0])
+f.write("#define OGS_GTP1_MAX_TLV_DEPTH %d\n" % max_tlv[1])
+f.write("\n")
+
 f.write("typedef struct ogs_gtp1_message_s {\n")
 f.write("   ogs_gtp1_header_t h;\n")
 f.write("   union {\n")
@@ -540,7 +538,7 @@ ogs_pkbuf_t *ogs_gtp1_build_msg(ogs_gtp1_message_t *gtp1_message);
 """)
 f.close()
 
-f = open(outdir + 'message.c', 'w')
+f = output.open(outdir + 'message.c')
 output_header_to_file(f)
 f.write("""#include "ogs-gtp.h"
 
@@ -580,11 +578,21 @@ for (k, v) in sorted_type_list:
         f.write("    0,\n")
     f.write("    0,\n")
     f.write("    sizeof(ogs_gtp1_tlv_%s_t),\n" % v_lower(k))
-    f.write("    { NULL }\n")
+    f.write("    { NULL },\n")
+    f.write("    NULL,\n")
+    f.write("    NULL\n")
     f.write("};\n\n")
 
 for (k, v) in sorted_msg_list:
     if "ies" in msg_list[k]:
+        children = []
+        for ies in msg_list[k]["ies"]:
+            ie_type = ie_reference2type(ies["reference"])
+            children.append((int(type_list[ie_type]["type"]),
+                "OGS_GTP1_%s_TYPE" % v_upper(ie_type), 0,
+                "offsetof(ogs_gtp1_%s_t, %s)" % (v_lower(k), v_lower(ies["ie_value"]))))
+        index = write_desc_index(f, "ogs_gtp1_msg_index_%s" % v_lower(k), children)
+
         f.write("ogs_tlv_desc_t ogs_gtp1_tlv_desc_%s =\n" % v_lower(k))
         f.write("{\n")
         f.write("    OGS_TLV_MESSAGE,\n")
@@ -596,7 +604,7 @@ for (k, v) in sorted_msg_list:
             #else:
                 f.write("        &ogs_gtp1_tlv_desc_%s,\n" % v_lower(ie_reference2type(ies["reference"])))
         f.write("    NULL,\n")
-        f.write("}};\n\n")
+        f.write("}, %s, NULL};\n\n" % index)
 f.write("\n")
 
 f.write("""int ogs_gtp1_parse_msg(ogs_gtp1_message_t *gtp1_message, ogs_pkbuf_t *pkbuf)
@@ -678,3 +686,60 @@ f.write("""    default:
 f.write("\n")
 
 f.close()
+
+if bench is not None:
+    f = output.open(bench)
+    output_header_to_file(f)
+    write_bench_prologue(f, "GTPv1-C", ["ogs-gtp.h", "unit/tlv-message.h"])
+    write_bench_tlv(f, "ogs_gtp1_message_t", "OGS_TLV_MODE_T1_L2",
+            "ogs_tlv_parse_msg_desc")
+    f.write("static const bench_message_t bench_messages[] = {\n")
+    for (k, v) in sorted_msg_list:
+        if len(msg_list[k].get("ies", [])) == 0:
+            continue
+        f.write("    { \"%s\", &ogs_gtp1_tlv_desc_%s,\n" % (k, v_lower(k)))
+        f.write("        sizeof(ogs_gtp1_%s_t), NULL, NULL },\n" % v_lower(k))
+    f.write("};\n\n")
+    write_bench_main(f, """    ogs_log_install_domain(&__ogs_gtp_domain, "gtp", OGS_LOG_ERROR);
+""", "bench_messages")
+    f.close()
+
+if corpus is not None:
+    def corpus_ies(ies_list, variant):
+        octets = []
+        for ies in ies_list:
+            if variant == "mandatory" and ies["presence"] != "Mandatory":
+                continue
+            t = ie_reference2type(ies["reference"])
+            if "size" in type_list[t]:
+                value = [0] * type_list[t]["size"]
+            else:
+                value = [0]
+            if type_list[t]["format"] == 'TV':
+                octets += tlv_octets("T1", int(type_list[t]["type"]), value)
+            else:
+                octets += tlv_octets("T1_L2", int(type_list[t]["type"]), value)
+        return octets
+
+    seeds = Corpus("gtp1")
+    for (k, v) in sorted_msg_list:
+        if "ies" not in msg_list[k]:
+            continue
+        variants = {}
+        for variant in VARIANTS:
+            octets = corpus_ies(msg_list[k]["ies"], variant)
+            if octets in variants.values():
+                continue
+            variants[variant] = octets
+            # Sequence number 1, a TEID of 0
+            header = [0x32, int(v), 0, 0] + [0] * 4 + [0, 1, 0, 0]
+            length = len(header) + len(octets) - 8
+            header[2:4] = [length >> 8, length & 0xff]
+            seeds.add(v_lower(k), variant, header + octets)
+    seeds.write(output, corpus)
+
+if depfile is not None:
+    output.write_depfile(depfile, [filename] + cache.files)
+
+output.summary()
+profile.report()
@@ -20,13 +20,13 @@
 /*******************************************************************************
  * This file had been created by gtp-tlv.py script v0.1.0
  * Please do not modify this file but regenerate it via script.
- * Created on: 2023-08-26 16:35:12.648272 by acetcom
- * from 29274-h70.docx
+ * Created from 29274-h70.docx
+ * (sha256: 38b0693c737614cdfb2703dfce9dd5e6507890243a899399d1f0f0ea4a093a3a)
  ******************************************************************************/
 
 #include "ogs-gtp.h"
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_imsi_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_imsi =
 {
     OGS_TLV_VAR_STR,
     "IMSI",
@@ -34,10 +34,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_imsi_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_imsi_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_cause_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_cause =
 {
     OGS_TLV_VAR_STR,
     "Cause",
@@ -45,10 +47,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_cause_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_cause_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_recovery_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_recovery =
 {
     OGS_TLV_UINT8,
     "Recovery",
@@ -56,10 +60,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_recovery_0 =
     1,
     0,
     sizeof(ogs_gtp2_tlv_recovery_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_stn_sr_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_stn_sr =
 {
     OGS_TLV_VAR_STR,
     "STN-SR",
@@ -67,10 +73,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_stn_sr_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_stn_sr_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_srvcc_cause_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_srvcc_cause =
 {
     OGS_TLV_VAR_STR,
     "SRVCC Cause",
@@ -78,10 +86,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_srvcc_cause_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_srvcc_cause_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_apn_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_apn =
 {
     OGS_TLV_VAR_STR,
     "APN",
@@ -89,10 +99,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_apn_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_apn_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_ambr_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_ambr =
 {
     OGS_TLV_VAR_STR,
     "AMBR",
@@ -100,10 +112,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_ambr_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_ambr_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_ebi_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_ebi =
 {
     OGS_TLV_UINT8,
     "EBI",
@@ -111,65 +125,25 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_ebi_0 =
     1,
     0,
     sizeof(ogs_gtp2_tlv_ebi_t),
-    { NULL }
-};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_ebi_1 =
-{
-    OGS_TLV_UINT8,
-    "EBI",
-    OGS_GTP2_EBI_TYPE,
-    1,
-    1,
-    sizeof(ogs_gtp2_tlv_ebi_t),
-    { NULL }
-};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_ip_address_0 =
-{
-    OGS_TLV_VAR_STR,
-    "IP Address",
-    OGS_GTP2_IP_ADDRESS_TYPE,
-    0,
-    0,
-    sizeof(ogs_gtp2_tlv_ip_address_t),
-    { NULL }
-};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_ip_address_1 =
-{
-    OGS_TLV_VAR_STR,
-    "IP Address",
-    OGS_GTP2_IP_ADDRESS_TYPE,
-    0,
-    1,
-    sizeof(ogs_gtp2_tlv_ip_address_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_ip_address_2 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_ip_address =
 {
     OGS_TLV_VAR_STR,
     "IP Address",
     OGS_GTP2_IP_ADDRESS_TYPE,
     0,
-    2,
-    sizeof(ogs_gtp2_tlv_ip_address_t),
-    { NULL }
-};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_ip_address_3 =
-{
-    OGS_TLV_VAR_STR,
-    "IP Address",
-    OGS_GTP2_IP_ADDRESS_TYPE,
     0,
-    3,
     sizeof(ogs_gtp2_tlv_ip_address_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_mei_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_mei =
 {
     OGS_TLV_VAR_STR,
     "MEI",
@@ -177,10 +151,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_mei_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_mei_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_msisdn_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_msisdn =
 {
     OGS_TLV_VAR_STR,
     "MSISDN",
@@ -188,10 +164,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_msisdn_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_msisdn_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_indication_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_indication =
 {
     OGS_TLV_VAR_STR,
     "Indication",
@@ -199,10 +177,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_indication_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_indication_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_pco_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_pco =
 {
     OGS_TLV_VAR_STR,
     "PCO",
@@ -210,10 +190,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_pco_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_pco_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_paa_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_paa =
 {
     OGS_TLV_VAR_STR,
     "PAA",
@@ -221,10 +203,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_paa_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_paa_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_bearer_qos_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_bearer_qos =
 {
     OGS_TLV_VAR_STR,
     "Bearer QoS",
@@ -232,10 +216,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_bearer_qos_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_bearer_qos_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_flow_qos_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_flow_qos =
 {
     OGS_TLV_VAR_STR,
     "Flow QoS",
@@ -243,10 +229,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_flow_qos_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_flow_qos_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_rat_type_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_rat_type =
 {
     OGS_TLV_UINT8,
     "RAT Type",
@@ -254,10 +242,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_rat_type_0 =
     1,
     0,
     sizeof(ogs_gtp2_tlv_rat_type_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_serving_network_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_serving_network =
 {
     OGS_TLV_VAR_STR,
     "Serving Network",
@@ -265,10 +255,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_serving_network_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_serving_network_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_bearer_tft_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_bearer_tft =
 {
     OGS_TLV_VAR_STR,
     "Bearer TFT",
@@ -276,10 +268,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_bearer_tft_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_bearer_tft_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_tad_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_tad =
 {
     OGS_TLV_VAR_STR,
     "TAD",
@@ -287,10 +281,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_tad_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_tad_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_uli_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_uli =
 {
     OGS_TLV_VAR_STR,
     "ULI",
@@ -298,153 +294,25 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_uli_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_uli_t),
-    { NULL }
-};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_uli_1 =
-{
-    OGS_TLV_VAR_STR,
-    "ULI",
-    OGS_GTP2_ULI_TYPE,
-    0,
-    1,
-    sizeof(ogs_gtp2_tlv_uli_t),
-    { NULL }
-};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_f_teid_0 =
-{
-    OGS_TLV_VAR_STR,
-    "F-TEID",
-    OGS_GTP2_F_TEID_TYPE,
-    0,
-    0,
-    sizeof(ogs_gtp2_tlv_f_teid_t),
-    { NULL }
-};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_f_teid_1 =
-{
-    OGS_TLV_VAR_STR,
-    "F-TEID",
-    OGS_GTP2_F_TEID_TYPE,
-    0,
-    1,
-    sizeof(ogs_gtp2_tlv_f_teid_t),
-    { NULL }
-};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_f_teid_2 =
-{
-    OGS_TLV_VAR_STR,
-    "F-TEID",
-    OGS_GTP2_F_TEID_TYPE,
-    0,
-    2,
-    sizeof(ogs_gtp2_tlv_f_teid_t),
-    { NULL }
-};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_f_teid_3 =
-{
-    OGS_TLV_VAR_STR,
-    "F-TEID",
-    OGS_GTP2_F_TEID_TYPE,
-    0,
-    3,
-    sizeof(ogs_gtp2_tlv_f_teid_t),
-    { NULL }
-};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_f_teid_4 =
-{
-    OGS_TLV_VAR_STR,
-    "F-TEID",
-    OGS_GTP2_F_TEID_TYPE,
-    0,
-    4,
-    sizeof(ogs_gtp2_tlv_f_teid_t),
-    { NULL }
-};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_f_teid_5 =
-{
-    OGS_TLV_VAR_STR,
-    "F-TEID",
-    OGS_GTP2_F_TEID_TYPE,
-    0,
-    5,
-    sizeof(ogs_gtp2_tlv_f_teid_t),
-    { NULL }
-};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_f_teid_6 =
-{
-    OGS_TLV_VAR_STR,
-    "F-TEID",
-    OGS_GTP2_F_TEID_TYPE,
-    0,
-    6,
-    sizeof(ogs_gtp2_tlv_f_teid_t),
-    { NULL }
-};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_f_teid_7 =
-{
-    OGS_TLV_VAR_STR,
-    "F-TEID",
-    OGS_GTP2_F_TEID_TYPE,
-    0,
-    7,
-    sizeof(ogs_gtp2_tlv_f_teid_t),
-    { NULL }
-};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_f_teid_8 =
-{
-    OGS_TLV_VAR_STR,
-    "F-TEID",
-    OGS_GTP2_F_TEID_TYPE,
-    0,
-    8,
-    sizeof(ogs_gtp2_tlv_f_teid_t),
-    { NULL }
-};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_f_teid_9 =
-{
-    OGS_TLV_VAR_STR,
-    "F-TEID",
-    OGS_GTP2_F_TEID_TYPE,
-    0,
-    9,
-    sizeof(ogs_gtp2_tlv_f_teid_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_f_teid_10 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_f_teid =
 {
     OGS_TLV_VAR_STR,
     "F-TEID",
     OGS_GTP2_F_TEID_TYPE,
     0,
-    10,
-    sizeof(ogs_gtp2_tlv_f_teid_t),
-    { NULL }
-};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_f_teid_11 =
-{
-    OGS_TLV_VAR_STR,
-    "F-TEID",
-    OGS_GTP2_F_TEID_TYPE,
     0,
-    11,
     sizeof(ogs_gtp2_tlv_f_teid_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_tmsi_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_tmsi =
 {
     OGS_TLV_VAR_STR,
     "TMSI",
@@ -452,10 +320,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_tmsi_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_tmsi_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_global_cn_id_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_global_cn_id =
 {
     OGS_TLV_VAR_STR,
     "Global CN-Id",
@@ -463,10 +333,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_global_cn_id_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_global_cn_id_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_s103pdf_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_s103pdf =
 {
     OGS_TLV_VAR_STR,
     "S103PDF",
@@ -474,10 +346,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_s103pdf_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_s103pdf_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_s1udf_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_s1udf =
 {
     OGS_TLV_VAR_STR,
     "S1UDF",
@@ -485,10 +359,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_s1udf_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_s1udf_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_delay_value_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_delay_value =
 {
     OGS_TLV_UINT8,
     "Delay Value",
@@ -496,10 +372,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_delay_value_0 =
     1,
     0,
     sizeof(ogs_gtp2_tlv_delay_value_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_charging_id_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_charging_id =
 {
     OGS_TLV_UINT32,
     "Charging ID",
@@ -507,10 +385,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_charging_id_0 =
     4,
     0,
     sizeof(ogs_gtp2_tlv_charging_id_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_charging_characteristics_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_charging_characteristics =
 {
     OGS_TLV_VAR_STR,
     "Charging Characteristics",
@@ -518,10 +398,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_charging_characteristics_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_charging_characteristics_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_trace_information_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_trace_information =
 {
     OGS_TLV_VAR_STR,
     "Trace Information",
@@ -529,10 +411,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_trace_information_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_trace_information_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_bearer_flags_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_bearer_flags =
 {
     OGS_TLV_VAR_STR,
     "Bearer Flags",
@@ -540,10 +424,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_bearer_flags_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_bearer_flags_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_pdn_type_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_pdn_type =
 {
     OGS_TLV_UINT8,
     "PDN Type",
@@ -551,10 +437,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_pdn_type_0 =
     1,
     0,
     sizeof(ogs_gtp2_tlv_pdn_type_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_pti_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_pti =
 {
     OGS_TLV_UINT8,
     "PTI",
@@ -562,10 +450,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_pti_0 =
     1,
     0,
     sizeof(ogs_gtp2_tlv_pti_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_mm_context_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_mm_context =
 {
     OGS_TLV_VAR_STR,
     "MM Context",
@@ -573,10 +463,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_mm_context_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_mm_context_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_pdu_numbers_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_pdu_numbers =
 {
     OGS_TLV_VAR_STR,
     "PDU Numbers",
@@ -584,10 +476,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_pdu_numbers_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_pdu_numbers_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_p_tmsi_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_p_tmsi =
 {
     OGS_TLV_VAR_STR,
     "P-TMSI",
@@ -595,10 +489,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_p_tmsi_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_p_tmsi_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_p_tmsi_signature_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_p_tmsi_signature =
 {
     OGS_TLV_VAR_STR,
     "P-TMSI Signature",
@@ -606,10 +502,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_p_tmsi_signature_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_p_tmsi_signature_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_hop_counter_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_hop_counter =
 {
     OGS_TLV_VAR_STR,
     "Hop Counter",
@@ -617,10 +515,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_hop_counter_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_hop_counter_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_ue_time_zone_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_ue_time_zone =
 {
     OGS_TLV_VAR_STR,
     "UE Time Zone",
@@ -628,10 +528,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_ue_time_zone_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_ue_time_zone_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_trace_reference_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_trace_reference =
 {
     OGS_TLV_VAR_STR,
     "Trace Reference",
@@ -639,10 +541,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_trace_reference_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_trace_reference_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_complete_request_message_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_complete_request_message =
 {
     OGS_TLV_VAR_STR,
     "Complete Request Message",
@@ -650,10 +554,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_complete_request_message_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_complete_request_message_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_guti_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_guti =
 {
     OGS_TLV_VAR_STR,
     "GUTI",
@@ -661,10 +567,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_guti_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_guti_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_f_container_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_f_container =
 {
     OGS_TLV_VAR_STR,
     "F-Container",
@@ -672,10 +580,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_f_container_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_f_container_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_f_cause_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_f_cause =
 {
     OGS_TLV_VAR_STR,
     "F-Cause",
@@ -683,10 +593,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_f_cause_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_f_cause_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_plmn_id_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_plmn_id =
 {
     OGS_TLV_VAR_STR,
     "PLMN ID",
@@ -694,10 +606,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_plmn_id_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_plmn_id_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_target_identification_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_target_identification =
 {
     OGS_TLV_VAR_STR,
     "Target Identification",
@@ -705,10 +619,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_target_identification_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_target_identification_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_packet_flow_id_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_packet_flow_id =
 {
     OGS_TLV_VAR_STR,
     "Packet Flow ID",
@@ -716,10 +632,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_packet_flow_id_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_packet_flow_id_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_rab_context_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_rab_context =
 {
     OGS_TLV_VAR_STR,
     "RAB Context",
@@ -727,10 +645,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_rab_context_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_rab_context_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_source_rnc_pdcp_context_info_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_source_rnc_pdcp_context_info =
 {
     OGS_TLV_VAR_STR,
     "Source RNC PDCP Context Info",
@@ -738,10 +658,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_source_rnc_pdcp_context_info_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_source_rnc_pdcp_context_info_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_port_number_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_port_number =
 {
     OGS_TLV_UINT16,
     "Port Number",
@@ -749,32 +671,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_port_number_0 =
     2,
     0,
     sizeof(ogs_gtp2_tlv_port_number_t),
-    { NULL }
-};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_port_number_1 =
-{
-    OGS_TLV_UINT16,
-    "Port Number",
-    OGS_GTP2_PORT_NUMBER_TYPE,
-    2,
-    1,
-    sizeof(ogs_gtp2_tlv_port_number_t),
-    { NULL }
-};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_port_number_2 =
-{
-    OGS_TLV_UINT16,
-    "Port Number",
-    OGS_GTP2_PORT_NUMBER_TYPE,
-    2,
-    2,
-    sizeof(ogs_gtp2_tlv_port_number_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_apn_restriction_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_apn_restriction =
 {
     OGS_TLV_UINT8,
     "APN Restriction",
@@ -782,10 +684,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_apn_restriction_0 =
     1,
     0,
     sizeof(ogs_gtp2_tlv_apn_restriction_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_selection_mode_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_selection_mode =
 {
     OGS_TLV_UINT8,
     "Selection Mode",
@@ -793,10 +697,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_selection_mode_0 =
     1,
     0,
     sizeof(ogs_gtp2_tlv_selection_mode_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_source_identification_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_source_identification =
 {
     OGS_TLV_VAR_STR,
     "Source Identification",
@@ -804,10 +710,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_source_identification_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_source_identification_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_change_reporting_action_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_change_reporting_action =
 {
     OGS_TLV_VAR_STR,
     "Change Reporting Action",
@@ -815,54 +723,25 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_change_reporting_action_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_change_reporting_action_t),
-    { NULL }
-};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_fq_csid_0 =
-{
-    OGS_TLV_VAR_STR,
-    "FQ-CSID",
-    OGS_GTP2_FQ_CSID_TYPE,
-    0,
-    0,
-    sizeof(ogs_gtp2_tlv_fq_csid_t),
-    { NULL }
-};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_fq_csid_1 =
-{
-    OGS_TLV_VAR_STR,
-    "FQ-CSID",
-    OGS_GTP2_FQ_CSID_TYPE,
-    0,
-    1,
-    sizeof(ogs_gtp2_tlv_fq_csid_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_fq_csid_2 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_fq_csid =
 {
     OGS_TLV_VAR_STR,
     "FQ-CSID",
     OGS_GTP2_FQ_CSID_TYPE,
     0,
-    2,
-    sizeof(ogs_gtp2_tlv_fq_csid_t),
-    { NULL }
-};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_fq_csid_3 =
-{
-    OGS_TLV_VAR_STR,
-    "FQ-CSID",
-    OGS_GTP2_FQ_CSID_TYPE,
     0,
-    3,
     sizeof(ogs_gtp2_tlv_fq_csid_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_channel_needed_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_channel_needed =
 {
     OGS_TLV_VAR_STR,
     "Channel needed",
@@ -870,10 +749,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_channel_needed_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_channel_needed_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_emlpp_priority_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_emlpp_priority =
 {
     OGS_TLV_VAR_STR,
     "eMLPP Priority",
@@ -881,10 +762,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_emlpp_priority_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_emlpp_priority_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_node_type_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_node_type =
 {
     OGS_TLV_UINT8,
     "Node Type",
@@ -892,10 +775,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_node_type_0 =
     1,
     0,
     sizeof(ogs_gtp2_tlv_node_type_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_fqdn_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_fqdn =
 {
     OGS_TLV_VAR_STR,
     "FQDN",
@@ -903,65 +788,38 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_fqdn_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_fqdn_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_fqdn_1 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_ti =
 {
     OGS_TLV_VAR_STR,
-    "FQDN",
-    OGS_GTP2_FQDN_TYPE,
+    "TI",
+    OGS_GTP2_TI_TYPE,
     0,
-    1,
-    sizeof(ogs_gtp2_tlv_fqdn_t),
-    { NULL }
+    0,
+    sizeof(ogs_gtp2_tlv_ti_t),
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_fqdn_2 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_mbms_session_duration =
 {
     OGS_TLV_VAR_STR,
-    "FQDN",
-    OGS_GTP2_FQDN_TYPE,
+    "MBMS Session Duration",
+    OGS_GTP2_MBMS_SESSION_DURATION_TYPE,
     0,
-    2,
-    sizeof(ogs_gtp2_tlv_fqdn_t),
-    { NULL }
+    0,
+    sizeof(ogs_gtp2_tlv_mbms_session_duration_t),
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_fqdn_3 =
-{
-    OGS_TLV_VAR_STR,
-    "FQDN",
-    OGS_GTP2_FQDN_TYPE,
-    0,
-    3,
-    sizeof(ogs_gtp2_tlv_fqdn_t),
-    { NULL }
-};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_ti_0 =
-{
-    OGS_TLV_VAR_STR,
-    "TI",
-    OGS_GTP2_TI_TYPE,
-    0,
-    0,
-    sizeof(ogs_gtp2_tlv_ti_t),
-    { NULL }
-};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_mbms_session_duration_0 =
-{
-    OGS_TLV_VAR_STR,
-    "MBMS Session Duration",
-    OGS_GTP2_MBMS_SESSION_DURATION_TYPE,
-    0,
-    0,
-    sizeof(ogs_gtp2_tlv_mbms_session_duration_t),
-    { NULL }
-};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_mbms_service_area_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_mbms_service_area =
 {
     OGS_TLV_VAR_STR,
     "MBMS Service Area",
@@ -969,10 +827,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_mbms_service_area_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_mbms_service_area_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_mbms_session_identifier_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_mbms_session_identifier =
 {
     OGS_TLV_VAR_STR,
     "MBMS Session Identifier",
@@ -980,10 +840,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_mbms_session_identifier_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_mbms_session_identifier_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_mbms_flow_identifier_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_mbms_flow_identifier =
 {
     OGS_TLV_VAR_STR,
     "MBMS Flow Identifier",
@@ -991,10 +853,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_mbms_flow_identifier_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_mbms_flow_identifier_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_mbms_ip_multicast_distribution_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_mbms_ip_multicast_distribution =
 {
     OGS_TLV_VAR_STR,
     "MBMS IP Multicast Distribution",
@@ -1002,10 +866,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_mbms_ip_multicast_distribution_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_mbms_ip_multicast_distribution_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_mbms_distribution_acknowledge_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_mbms_distribution_acknowledge =
 {
     OGS_TLV_VAR_STR,
     "MBMS Distribution Acknowledge",
@@ -1013,10 +879,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_mbms_distribution_acknowledge_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_mbms_distribution_acknowledge_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_rfsp_index_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_rfsp_index =
 {
     OGS_TLV_VAR_STR,
     "RFSP Index",
@@ -1024,10 +892,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_rfsp_index_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_rfsp_index_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_uci_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_uci =
 {
     OGS_TLV_VAR_STR,
     "UCI",
@@ -1035,10 +905,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_uci_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_uci_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_csg_information_reporting_action_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_csg_information_reporting_action =
 {
     OGS_TLV_VAR_STR,
     "CSG Information Reporting Action",
@@ -1046,10 +918,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_csg_information_reporting_action_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_csg_information_reporting_action_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_csg_id_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_csg_id =
 {
     OGS_TLV_VAR_STR,
     "CSG ID",
@@ -1057,10 +931,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_csg_id_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_csg_id_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_cmi_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_cmi =
 {
     OGS_TLV_VAR_STR,
     "CMI",
@@ -1068,10 +944,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_cmi_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_cmi_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_service_indicator_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_service_indicator =
 {
     OGS_TLV_VAR_STR,
     "Service indicator",
@@ -1079,10 +957,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_service_indicator_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_service_indicator_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_detach_type_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_detach_type =
 {
     OGS_TLV_VAR_STR,
     "Detach Type",
@@ -1090,54 +970,25 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_detach_type_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_detach_type_t),
-    { NULL }
-};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_ldn_0 =
-{
-    OGS_TLV_VAR_STR,
-    "LDN",
-    OGS_GTP2_LDN_TYPE,
-    0,
-    0,
-    sizeof(ogs_gtp2_tlv_ldn_t),
-    { NULL }
-};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_ldn_1 =
-{
-    OGS_TLV_VAR_STR,
-    "LDN",
-    OGS_GTP2_LDN_TYPE,
-    0,
-    1,
-    sizeof(ogs_gtp2_tlv_ldn_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_ldn_2 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_ldn =
 {
     OGS_TLV_VAR_STR,
     "LDN",
     OGS_GTP2_LDN_TYPE,
     0,
-    2,
-    sizeof(ogs_gtp2_tlv_ldn_t),
-    { NULL }
-};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_ldn_3 =
-{
-    OGS_TLV_VAR_STR,
-    "LDN",
-    OGS_GTP2_LDN_TYPE,
     0,
-    3,
     sizeof(ogs_gtp2_tlv_ldn_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_node_features_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_node_features =
 {
     OGS_TLV_UINT8,
     "Node Features",
@@ -1145,10 +996,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_node_features_0 =
     1,
     0,
     sizeof(ogs_gtp2_tlv_node_features_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_mbms_time_to_data_transfer_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_mbms_time_to_data_transfer =
 {
     OGS_TLV_VAR_STR,
     "MBMS Time to Data Transfer",
@@ -1156,10 +1009,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_mbms_time_to_data_transfer_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_mbms_time_to_data_transfer_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_throttling_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_throttling =
 {
     OGS_TLV_VAR_STR,
     "Throttling",
@@ -1167,10 +1022,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_throttling_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_throttling_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_arp_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_arp =
 {
     OGS_TLV_VAR_STR,
     "ARP",
@@ -1178,10 +1035,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_arp_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_arp_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_epc_timer_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_epc_timer =
 {
     OGS_TLV_VAR_STR,
     "EPC Timer",
@@ -1189,10 +1048,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_epc_timer_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_epc_timer_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_signalling_priority_indication_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_signalling_priority_indication =
 {
     OGS_TLV_VAR_STR,
     "Signalling Priority Indication",
@@ -1200,10 +1061,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_signalling_priority_indication_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_signalling_priority_indication_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_tmgi_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_tmgi =
 {
     OGS_TLV_VAR_STR,
     "TMGI",
@@ -1211,10 +1074,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_tmgi_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_tmgi_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_additional_mm_context_for_srvcc_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_additional_mm_context_for_srvcc =
 {
     OGS_TLV_VAR_STR,
     "Additional MM context for SRVCC",
@@ -1222,10 +1087,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_additional_mm_context_for_srvcc_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_additional_mm_context_for_srvcc_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_additional_flags_for_srvcc_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_additional_flags_for_srvcc =
 {
     OGS_TLV_VAR_STR,
     "Additional flags for SRVCC",
@@ -1233,10 +1100,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_additional_flags_for_srvcc_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_additional_flags_for_srvcc_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_mdt_configuration_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_mdt_configuration =
 {
     OGS_TLV_VAR_STR,
     "MDT Configuration",
@@ -1244,10 +1113,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_mdt_configuration_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_mdt_configuration_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_apco_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_apco =
 {
     OGS_TLV_VAR_STR,
     "APCO",
@@ -1255,10 +1126,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_apco_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_apco_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_absolute_time_of_mbms_data_transfer_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_absolute_time_of_mbms_data_transfer =
 {
     OGS_TLV_VAR_STR,
     "Absolute Time of MBMS Data Transfer",
@@ -1266,10 +1139,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_absolute_time_of_mbms_data_transfer_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_absolute_time_of_mbms_data_transfer_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_enb_information_reporting_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_enb_information_reporting =
 {
     OGS_TLV_VAR_STR,
     "eNB Information Reporting",
@@ -1277,10 +1152,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_enb_information_reporting_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_enb_information_reporting_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_ip4cp_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_ip4cp =
 {
     OGS_TLV_VAR_STR,
     "IP4CP",
@@ -1288,10 +1165,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_ip4cp_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_ip4cp_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_change_to_report_flags_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_change_to_report_flags =
 {
     OGS_TLV_VAR_STR,
     "Change to Report Flags",
@@ -1299,10 +1178,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_change_to_report_flags_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_change_to_report_flags_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_action_indication_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_action_indication =
 {
     OGS_TLV_VAR_STR,
     "Action Indication",
@@ -1310,10 +1191,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_action_indication_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_action_indication_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_twan_identifier_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_twan_identifier =
 {
     OGS_TLV_VAR_STR,
     "TWAN Identifier",
@@ -1321,21 +1204,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_twan_identifier_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_twan_identifier_t),
-    { NULL }
-};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_twan_identifier_1 =
-{
-    OGS_TLV_VAR_STR,
-    "TWAN Identifier",
-    OGS_GTP2_TWAN_IDENTIFIER_TYPE,
-    0,
-    1,
-    sizeof(ogs_gtp2_tlv_twan_identifier_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_uli_timestamp_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_uli_timestamp =
 {
     OGS_TLV_VAR_STR,
     "ULI Timestamp",
@@ -1343,10 +1217,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_uli_timestamp_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_uli_timestamp_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_mbms_flags_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_mbms_flags =
 {
     OGS_TLV_VAR_STR,
     "MBMS Flags",
@@ -1354,10 +1230,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_mbms_flags_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_mbms_flags_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_ran_nas_cause_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_ran_nas_cause =
 {
     OGS_TLV_VAR_STR,
     "RAN/NAS Cause",
@@ -1365,10 +1243,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_ran_nas_cause_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_ran_nas_cause_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_cn_operator_selection_entity_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_cn_operator_selection_entity =
 {
     OGS_TLV_VAR_STR,
     "CN Operator Selection Entity",
@@ -1376,10 +1256,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_cn_operator_selection_entity_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_cn_operator_selection_entity_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_twmi_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_twmi =
 {
     OGS_TLV_VAR_STR,
     "TWMI",
@@ -1387,10 +1269,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_twmi_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_twmi_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_node_number_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_node_number =
 {
     OGS_TLV_VAR_STR,
     "Node Number",
@@ -1398,10 +1282,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_node_number_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_node_number_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_node_identifier_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_node_identifier =
 {
     OGS_TLV_VAR_STR,
     "Node Identifier",
@@ -1409,10 +1295,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_node_identifier_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_node_identifier_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_presence_reporting_area_action_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_presence_reporting_area_action =
 {
     OGS_TLV_VAR_STR,
     "Presence Reporting Area Action",
@@ -1420,10 +1308,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_presence_reporting_area_action_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_presence_reporting_area_action_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_presence_reporting_area_information_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_presence_reporting_area_information =
 {
     OGS_TLV_VAR_STR,
     "Presence Reporting Area Information",
@@ -1431,10 +1321,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_presence_reporting_area_information_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_presence_reporting_area_information_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_twan_identifier_timestamp_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_twan_identifier_timestamp =
 {
     OGS_TLV_VAR_STR,
     "TWAN Identifier Timestamp",
@@ -1442,21 +1334,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_twan_identifier_timestamp_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_twan_identifier_timestamp_t),
-    { NULL }
-};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_twan_identifier_timestamp_1 =
-{
-    OGS_TLV_VAR_STR,
-    "TWAN Identifier Timestamp",
-    OGS_GTP2_TWAN_IDENTIFIER_TIMESTAMP_TYPE,
-    0,
-    1,
-    sizeof(ogs_gtp2_tlv_twan_identifier_timestamp_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_metric_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_metric =
 {
     OGS_TLV_VAR_STR,
     "Metric",
@@ -1464,10 +1347,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_metric_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_metric_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_sequence_number_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_sequence_number =
 {
     OGS_TLV_VAR_STR,
     "Sequence Number",
@@ -1475,10 +1360,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_sequence_number_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_sequence_number_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_apn_and_relative_capacity_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_apn_and_relative_capacity =
 {
     OGS_TLV_VAR_STR,
     "APN and Relative Capacity",
@@ -1486,10 +1373,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_apn_and_relative_capacity_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_apn_and_relative_capacity_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_wlan_offloadability_indication_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_wlan_offloadability_indication =
 {
     OGS_TLV_VAR_STR,
     "WLAN Offloadability Indication",
@@ -1497,10 +1386,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_wlan_offloadability_indication_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_wlan_offloadability_indication_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_paging_and_service_information_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_paging_and_service_information =
 {
     OGS_TLV_VAR_STR,
     "Paging and Service Information",
@@ -1508,10 +1399,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_paging_and_service_information_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_paging_and_service_information_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_integer_number_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_integer_number =
 {
     OGS_TLV_VAR_STR,
     "Integer Number",
@@ -1519,10 +1412,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_integer_number_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_integer_number_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_millisecond_time_stamp_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_millisecond_time_stamp =
 {
     OGS_TLV_VAR_STR,
     "Millisecond Time Stamp",
@@ -1530,10 +1425,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_millisecond_time_stamp_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_millisecond_time_stamp_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_monitoring_event_information_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_monitoring_event_information =
 {
     OGS_TLV_VAR_STR,
     "Monitoring Event Information",
@@ -1541,10 +1438,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_monitoring_event_information_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_monitoring_event_information_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_ecgi_list_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_ecgi_list =
 {
     OGS_TLV_VAR_STR,
     "ECGI List",
@@ -1552,10 +1451,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_ecgi_list_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_ecgi_list_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_remote_user_id_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_remote_user_id =
 {
     OGS_TLV_VAR_STR,
     "Remote User ID",
@@ -1563,10 +1464,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_remote_user_id_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_remote_user_id_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_remote_ue_ip_information_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_remote_ue_ip_information =
 {
     OGS_TLV_VAR_STR,
     "Remote UE IP Information",
@@ -1574,10 +1477,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_remote_ue_ip_information_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_remote_ue_ip_information_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_ciot_optimizations_support_indication_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_ciot_optimizations_support_indication =
 {
     OGS_TLV_VAR_STR,
     "CIoT Optimizations Support Indication",
@@ -1585,10 +1490,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_ciot_optimizations_support_indication_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_ciot_optimizations_support_indication_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_header_compression_configuration_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_header_compression_configuration =
 {
     OGS_TLV_VAR_STR,
     "Header Compression Configuration",
@@ -1596,10 +1503,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_header_compression_configuration_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_header_compression_configuration_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_epco_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_epco =
 {
     OGS_TLV_VAR_STR,
     "ePCO",
@@ -1607,10 +1516,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_epco_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_epco_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_serving_plmn_rate_control_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_serving_plmn_rate_control =
 {
     OGS_TLV_VAR_STR,
     "Serving PLMN Rate Control",
@@ -1618,10 +1529,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_serving_plmn_rate_control_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_serving_plmn_rate_control_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_counter_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_counter =
 {
     OGS_TLV_VAR_STR,
     "Counter",
@@ -1629,10 +1542,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_counter_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_counter_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_mapped_ue_usage_type_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_mapped_ue_usage_type =
 {
     OGS_TLV_VAR_STR,
     "Mapped UE Usage Type",
@@ -1640,10 +1555,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_mapped_ue_usage_type_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_mapped_ue_usage_type_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_secondary_rat_usage_data_report_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_secondary_rat_usage_data_report =
 {
     OGS_TLV_VAR_STR,
     "Secondary RAT Usage Data Report",
@@ -1651,10 +1568,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_secondary_rat_usage_data_report_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_secondary_rat_usage_data_report_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_up_function_selection_indication_flags_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_up_function_selection_indication_flags =
 {
     OGS_TLV_VAR_STR,
     "UP Function Selection Indication Flags",
@@ -1662,10 +1581,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_up_function_selection_indication_flags_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_up_function_selection_indication_flags_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_maximum_packet_loss_rate_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_maximum_packet_loss_rate =
 {
     OGS_TLV_VAR_STR,
     "Maximum Packet Loss Rate",
@@ -1673,10 +1594,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_maximum_packet_loss_rate_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_maximum_packet_loss_rate_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_apn_rate_control_status_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_apn_rate_control_status =
 {
     OGS_TLV_VAR_STR,
     "APN Rate Control Status",
@@ -1684,10 +1607,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_apn_rate_control_status_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_apn_rate_control_status_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_extended_trace_information_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_extended_trace_information =
 {
     OGS_TLV_VAR_STR,
     "Extended Trace Information",
@@ -1695,10 +1620,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_extended_trace_information_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_extended_trace_information_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_monitoring_event_extension_information_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_monitoring_event_extension_information =
 {
     OGS_TLV_VAR_STR,
     "Monitoring Event Extension Information",
@@ -1706,10 +1633,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_monitoring_event_extension_information_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_monitoring_event_extension_information_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_additional_rrm_policy_index_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_additional_rrm_policy_index =
 {
     OGS_TLV_VAR_STR,
     "Additional RRM Policy Index",
@@ -1717,10 +1646,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_additional_rrm_policy_index_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_additional_rrm_policy_index_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_services_authorized_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_services_authorized =
 {
     OGS_TLV_VAR_STR,
     "Services Authorized",
@@ -1728,21 +1659,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_services_authorized_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_services_authorized_t),
-    { NULL }
-};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_services_authorized_1 =
-{
-    OGS_TLV_VAR_STR,
-    "Services Authorized",
-    OGS_GTP2_SERVICES_AUTHORIZED_TYPE,
-    0,
-    1,
-    sizeof(ogs_gtp2_tlv_services_authorized_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_bit_rate_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_bit_rate =
 {
     OGS_TLV_VAR_STR,
     "Bit Rate",
@@ -1750,21 +1672,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_bit_rate_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_bit_rate_t),
-    { NULL }
-};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_bit_rate_1 =
-{
-    OGS_TLV_VAR_STR,
-    "Bit Rate",
-    OGS_GTP2_BIT_RATE_TYPE,
-    0,
-    1,
-    sizeof(ogs_gtp2_tlv_bit_rate_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_pc5_qos_flow_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_pc5_qos_flow =
 {
     OGS_TLV_VAR_STR,
     "PC5 QoS Flow",
@@ -1772,10 +1685,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_pc5_qos_flow_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_pc5_qos_flow_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_sgi_ptp_tunnel_address_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_sgi_ptp_tunnel_address =
 {
     OGS_TLV_VAR_STR,
     "SGi PtP Tunnel Address",
@@ -1783,10 +1698,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_sgi_ptp_tunnel_address_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_sgi_ptp_tunnel_address_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_pgw_fqdn_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_pgw_fqdn =
 {
     OGS_TLV_VAR_STR,
     "PGW FQDN",
@@ -1794,21 +1711,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_pgw_fqdn_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_pgw_fqdn_t),
-    { NULL }
-};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_pgw_fqdn_1 =
-{
-    OGS_TLV_VAR_STR,
-    "PGW FQDN",
-    OGS_GTP2_PGW_FQDN_TYPE,
-    0,
-    1,
-    sizeof(ogs_gtp2_tlv_pgw_fqdn_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_group_id_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_group_id =
 {
     OGS_TLV_VAR_STR,
     "Group Id",
@@ -1816,21 +1724,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_group_id_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_group_id_t),
-    { NULL }
-};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_group_id_1 =
-{
-    OGS_TLV_VAR_STR,
-    "Group Id",
-    OGS_GTP2_GROUP_ID_TYPE,
-    0,
-    1,
-    sizeof(ogs_gtp2_tlv_group_id_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_pscell_id_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_pscell_id =
 {
     OGS_TLV_VAR_STR,
     "PSCell ID",
@@ -1838,10 +1737,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_pscell_id_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_pscell_id_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_up_security_policy_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_up_security_policy =
 {
     OGS_TLV_VAR_STR,
     "UP Security Policy",
@@ -1849,10 +1750,12 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_up_security_policy_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_up_security_policy_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_alternative_imsi_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_alternative_imsi =
 {
     OGS_TLV_VAR_STR,
     "Alternative IMSI",
@@ -1860,10 +1763,21 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_alternative_imsi_0 =
     0,
     0,
     sizeof(ogs_gtp2_tlv_alternative_imsi_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_gtp2_tlv_index_pc5_qos_parameters_slot[4] = {
+    [0] = { OGS_GTP2_PC5_QOS_FLOW_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp2_tlv_pc5_qos_parameters_t, pc5_qos_flows) - sizeof(ogs_tlv_presence_t) },
+    [3] = { OGS_GTP2_BIT_RATE_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp2_tlv_pc5_qos_parameters_t, pc5_link_aggregated_bit_rates) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_gtp2_tlv_index_pc5_qos_parameters = {
+    3, 2, ogs_gtp2_tlv_index_pc5_qos_parameters_slot };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_pc5_qos_parameters_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_pc5_qos_parameters =
 {
     OGS_TLV_COMPOUND,
     "PC5 QoS Parameters",
@@ -1872,13 +1786,24 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_pc5_qos_parameters_0 =
     0,
     sizeof(ogs_gtp2_tlv_pc5_qos_parameters_t),
     {
-        &ogs_gtp2_tlv_desc_pc5_qos_flow_0,
-        &ogs_gtp2_tlv_desc_bit_rate_0,
+        &ogs_gtp2_tlv_desc_pc5_qos_flow,
+        &ogs_gtp2_tlv_desc_bit_rate,
         NULL,
-    }
+    },
+    &ogs_gtp2_tlv_index_pc5_qos_parameters,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_gtp2_tlv_index_remote_ue_context_slot[4] = {
+    [0] = { OGS_GTP2_REMOTE_USER_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp2_tlv_remote_ue_context_t, remote_user_id) - sizeof(ogs_tlv_presence_t) },
+    [1] = { OGS_GTP2_REMOTE_UE_IP_INFORMATION_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp2_tlv_remote_ue_context_t, remote_ue_ip_information) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_gtp2_tlv_index_remote_ue_context = {
+    3, 2, ogs_gtp2_tlv_index_remote_ue_context_slot };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_remote_ue_context_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_remote_ue_context =
 {
     OGS_TLV_COMPOUND,
     "Remote UE Context",
@@ -1887,13 +1812,42 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_remote_ue_context_0 =
     0,
     sizeof(ogs_gtp2_tlv_remote_ue_context_t),
     {
-        &ogs_gtp2_tlv_desc_remote_user_id_0,
-        &ogs_gtp2_tlv_desc_remote_ue_ip_information_0,
+        &ogs_gtp2_tlv_desc_remote_user_id,
+        &ogs_gtp2_tlv_desc_remote_ue_ip_information,
         NULL,
-    }
-};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_pgw_change_info_0 =
+    },
+    &ogs_gtp2_tlv_index_remote_ue_context,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_gtp2_tlv_index_pgw_change_info_slot[32] = {
+    [0] = { OGS_GTP2_GROUP_ID_TYPE, 1, 0, 9, 8,
+        offsetof(ogs_gtp2_tlv_pgw_change_info_t, new_group_id) - sizeof(ogs_tlv_presence_t) },
+    [1] = { OGS_GTP2_IP_ADDRESS_TYPE, 1, 0, 5, 4,
+        offsetof(ogs_gtp2_tlv_pgw_change_info_t, new_pgw_c_smf_ip_address) - sizeof(ogs_tlv_presence_t) },
+    [4] = { OGS_GTP2_FQ_CSID_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_gtp2_tlv_pgw_change_info_t, pgw_c_smf_fq_csid) - sizeof(ogs_tlv_presence_t) },
+    [6] = { OGS_GTP2_PGW_FQDN_TYPE, 1, 0, 3, 2,
+        offsetof(ogs_gtp2_tlv_pgw_change_info_t, alternative_pgw_c_smf_fqdn) - sizeof(ogs_tlv_presence_t) },
+    [8] = { OGS_GTP2_IP_ADDRESS_TYPE, 2, 0, 8, 7,
+        offsetof(ogs_gtp2_tlv_pgw_change_info_t, pgw_control_plane_ip_address) - sizeof(ogs_tlv_presence_t) },
+    [15] = { OGS_GTP2_IP_ADDRESS_TYPE, 3, 0, 6, 5,
+        offsetof(ogs_gtp2_tlv_pgw_change_info_t, new_sgw_c_ip_address) - sizeof(ogs_tlv_presence_t) },
+    [24] = { OGS_GTP2_GROUP_ID_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp2_tlv_pgw_change_info_t, group_id) - sizeof(ogs_tlv_presence_t) },
+    [26] = { OGS_GTP2_IP_ADDRESS_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp2_tlv_pgw_change_info_t, alternative_pgw_c_smf_ip_address) - sizeof(ogs_tlv_presence_t) },
+    [31] = { OGS_GTP2_PGW_FQDN_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp2_tlv_pgw_change_info_t, pgw_set_fqdn) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp2_tlv_index_pgw_change_info = {
+    31, 9, ogs_gtp2_tlv_index_pgw_change_info_slot };
+
+static const uint8_t ogs_gtp2_tlv_instance_pgw_change_info[9] = {
+    0, 0, 1, 0, 1, 3, 0, 2, 1,
+};
+
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_pgw_change_info =
 {
     OGS_TLV_COMPOUND,
     "PGW Change Info",
@@ -1902,20 +1856,41 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_pgw_change_info_0 =
     0,
     sizeof(ogs_gtp2_tlv_pgw_change_info_t),
     {
-        &ogs_gtp2_tlv_desc_pgw_fqdn_0,
-        &ogs_gtp2_tlv_desc_ip_address_0,
-        &ogs_gtp2_tlv_desc_pgw_fqdn_1,
-        &ogs_gtp2_tlv_desc_group_id_0,
-        &ogs_gtp2_tlv_desc_ip_address_1,
-        &ogs_gtp2_tlv_desc_ip_address_3,
-        &ogs_gtp2_tlv_desc_fq_csid_0,
-        &ogs_gtp2_tlv_desc_ip_address_2,
-        &ogs_gtp2_tlv_desc_group_id_1,
+        &ogs_gtp2_tlv_desc_pgw_fqdn,
+        &ogs_gtp2_tlv_desc_ip_address,
+        &ogs_gtp2_tlv_desc_pgw_fqdn,
+        &ogs_gtp2_tlv_desc_group_id,
+        &ogs_gtp2_tlv_desc_ip_address,
+        &ogs_gtp2_tlv_desc_ip_address,
+        &ogs_gtp2_tlv_desc_fq_csid,
+        &ogs_gtp2_tlv_desc_ip_address,
+        &ogs_gtp2_tlv_desc_group_id,
         NULL,
-    }
+    },
+    &ogs_gtp2_tlv_index_pgw_change_info,
+    ogs_gtp2_tlv_instance_pgw_change_info
+};
+
+static const ogs_tlv_desc_slot_t ogs_gtp2_tlv_index_v2x_context_slot[16] = {
+    [2] = { OGS_GTP2_SERVICES_AUTHORIZED_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp2_tlv_v2x_context_t, lte_v2x_services_authorized) - sizeof(ogs_tlv_presence_t) },
+    [3] = { OGS_GTP2_BIT_RATE_TYPE, 1, 0, 4, 3,
+        offsetof(ogs_gtp2_tlv_v2x_context_t, nr_ue_sidelink_aggregate_maximum_bit_rate) - sizeof(ogs_tlv_presence_t) },
+    [9] = { OGS_GTP2_SERVICES_AUTHORIZED_TYPE, 1, 0, 2, 1,
+        offsetof(ogs_gtp2_tlv_v2x_context_t, nr_v2x_services_authorized) - sizeof(ogs_tlv_presence_t) },
+    [10] = { OGS_GTP2_PC5_QOS_PARAMETERS_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp2_tlv_v2x_context_t, pc5_qos_parameters) - sizeof(ogs_tlv_presence_t) },
+    [11] = { OGS_GTP2_BIT_RATE_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp2_tlv_v2x_context_t, lte_ue_sidelink_aggregate_maximum_bit_rate) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp2_tlv_index_v2x_context = {
+    15, 5, ogs_gtp2_tlv_index_v2x_context_slot };
+
+static const uint8_t ogs_gtp2_tlv_instance_v2x_context[5] = {
+    0, 1, 0, 1, 0,
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_v2x_context_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_v2x_context =
 {
     OGS_TLV_COMPOUND,
     "V2X Context",
@@ -1924,16 +1899,80 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_v2x_context_0 =
     0,
     sizeof(ogs_gtp2_tlv_v2x_context_t),
     {
-        &ogs_gtp2_tlv_desc_services_authorized_0,
-        &ogs_gtp2_tlv_desc_services_authorized_1,
-        &ogs_gtp2_tlv_desc_bit_rate_0,
-        &ogs_gtp2_tlv_desc_bit_rate_1,
-        &ogs_gtp2_tlv_desc_pc5_qos_parameters_0,
+        &ogs_gtp2_tlv_desc_services_authorized,
+        &ogs_gtp2_tlv_desc_services_authorized,
+        &ogs_gtp2_tlv_desc_bit_rate,
+        &ogs_gtp2_tlv_desc_bit_rate,
+        &ogs_gtp2_tlv_desc_pc5_qos_parameters,
         NULL,
-    }
-};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_bearer_context_0 =
+    },
+    &ogs_gtp2_tlv_index_v2x_context,
+    ogs_gtp2_tlv_instance_v2x_context
+};
+
+static const ogs_tlv_desc_slot_t ogs_gtp2_tlv_index_bearer_context_slot[64] = {
+    [3] = { OGS_GTP2_PACKET_FLOW_ID_TYPE, 0, 0, 26, 25,
+        offsetof(ogs_gtp2_tlv_bearer_context_t, packet_flow_id) - sizeof(ogs_tlv_presence_t) },
+    [5] = { OGS_GTP2_F_TEID_TYPE, 10, 0, 20, 19,
+        offsetof(ogs_gtp2_tlv_bearer_context_t, s2a_u_twan_f_teid_10) - sizeof(ogs_tlv_presence_t) },
+    [6] = { OGS_GTP2_F_TEID_TYPE, 1, 0, 4, 3,
+        offsetof(ogs_gtp2_tlv_bearer_context_t, s4_u_sgsn_f_teid) - sizeof(ogs_tlv_presence_t) },
+    [7] = { OGS_GTP2_F_CONTAINER_TYPE, 0, 0, 24, 23,
+        offsetof(ogs_gtp2_tlv_bearer_context_t, bss_container) - sizeof(ogs_tlv_presence_t) },
+    [12] = { OGS_GTP2_F_TEID_TYPE, 11, 0, 21, 20,
+        offsetof(ogs_gtp2_tlv_bearer_context_t, s2a_u_pgw_f_teid) - sizeof(ogs_tlv_presence_t) },
+    [13] = { OGS_GTP2_F_TEID_TYPE, 2, 0, 5, 4,
+        offsetof(ogs_gtp2_tlv_bearer_context_t, s5_s8_u_sgw_f_teid) - sizeof(ogs_tlv_presence_t) },
+    [14] = { OGS_GTP2_RAN_NAS_CAUSE_TYPE, 0, 0, 22, 21,
+        offsetof(ogs_gtp2_tlv_bearer_context_t, ran_nas_cause) - sizeof(ogs_tlv_presence_t) },
+    [16] = { OGS_GTP2_BEARER_QOS_TYPE, 0, 0, 10, 9,
+        offsetof(ogs_gtp2_tlv_bearer_context_t, bearer_level_qos) - sizeof(ogs_tlv_presence_t) },
+    [19] = { OGS_GTP2_MAXIMUM_PACKET_LOSS_RATE_TYPE, 0, 0, 17, 16,
+        offsetof(ogs_gtp2_tlv_bearer_context_t, maximum_packet_loss_rate) - sizeof(ogs_tlv_presence_t) },
+    [20] = { OGS_GTP2_F_TEID_TYPE, 3, 0, 6, 5,
+        offsetof(ogs_gtp2_tlv_bearer_context_t, s5_s8_u_pgw_f_teid) - sizeof(ogs_tlv_presence_t) },
+    [27] = { OGS_GTP2_F_TEID_TYPE, 4, 0, 7, 6,
+        offsetof(ogs_gtp2_tlv_bearer_context_t, s12_rnc_f_teid) - sizeof(ogs_tlv_presence_t) },
+    [30] = { OGS_GTP2_PCO_TYPE, 0, 0, 15, 14,
+        offsetof(ogs_gtp2_tlv_bearer_context_t, protocol_configuration_options) - sizeof(ogs_tlv_presence_t) },
+    [33] = { OGS_GTP2_EBI_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp2_tlv_bearer_context_t, eps_bearer_id) - sizeof(ogs_tlv_presence_t) },
+    [34] = { OGS_GTP2_F_TEID_TYPE, 5, 0, 8, 7,
+        offsetof(ogs_gtp2_tlv_bearer_context_t, s2b_u_epdg_f_teid_5) - sizeof(ogs_tlv_presence_t) },
+    [35] = { OGS_GTP2_TI_TYPE, 0, 0, 25, 24,
+        offsetof(ogs_gtp2_tlv_bearer_context_t, transaction_identifier) - sizeof(ogs_tlv_presence_t) },
+    [41] = { OGS_GTP2_F_TEID_TYPE, 6, 0, 9, 8,
+        offsetof(ogs_gtp2_tlv_bearer_context_t, s2a_u_twan_f_teid_6) - sizeof(ogs_tlv_presence_t) },
+    [43] = { OGS_GTP2_APCO_TYPE, 0, 0, 23, 22,
+        offsetof(ogs_gtp2_tlv_bearer_context_t, additional_protocol_configuration_options) - sizeof(ogs_tlv_presence_t) },
+    [46] = { OGS_GTP2_CHARGING_ID_TYPE, 0, 0, 13, 12,
+        offsetof(ogs_gtp2_tlv_bearer_context_t, charging_id) - sizeof(ogs_tlv_presence_t) },
+    [48] = { OGS_GTP2_F_TEID_TYPE, 7, 0, 11, 10,
+        offsetof(ogs_gtp2_tlv_bearer_context_t, s11_u_mme_f_teid) - sizeof(ogs_tlv_presence_t) },
+    [50] = { OGS_GTP2_CAUSE_TYPE, 0, 0, 12, 11,
+        offsetof(ogs_gtp2_tlv_bearer_context_t, cause) - sizeof(ogs_tlv_presence_t) },
+    [52] = { OGS_GTP2_BEARER_TFT_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp2_tlv_bearer_context_t, tft) - sizeof(ogs_tlv_presence_t) },
+    [55] = { OGS_GTP2_F_TEID_TYPE, 8, 0, 18, 17,
+        offsetof(ogs_gtp2_tlv_bearer_context_t, s2b_u_epdg_f_teid_8) - sizeof(ogs_tlv_presence_t) },
+    [57] = { OGS_GTP2_BEARER_FLAGS_TYPE, 0, 0, 14, 13,
+        offsetof(ogs_gtp2_tlv_bearer_context_t, bearer_flags) - sizeof(ogs_tlv_presence_t) },
+    [61] = { OGS_GTP2_EPCO_TYPE, 0, 0, 16, 15,
+        offsetof(ogs_gtp2_tlv_bearer_context_t, extended_protocol_configuration_options) - sizeof(ogs_tlv_presence_t) },
+    [62] = { OGS_GTP2_F_TEID_TYPE, 9, 0, 19, 18,
+        offsetof(ogs_gtp2_tlv_bearer_context_t, s2b_u_pgw_f_teid) - sizeof(ogs_tlv_presence_t) },
+    [63] = { OGS_GTP2_F_TEID_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp2_tlv_bearer_context_t, s1_u_enodeb_f_teid) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp2_tlv_index_bearer_context = {
+    63, 26, ogs_gtp2_tlv_index_bearer_context_slot };
+
+static const uint8_t ogs_gtp2_tlv_instance_bearer_context[26] = {
+    0, 0, 0, 1, 2, 3, 4, 5, 6, 0, 7, 0, 0, 0, 0, 0,
+    0, 8, 9, 10, 11, 0, 0, 0, 0, 0,
+};
+
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_bearer_context =
 {
     OGS_TLV_COMPOUND,
     "Bearer Context",
@@ -1942,76 +1981,99 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_bearer_context_0 =
     0,
     sizeof(ogs_gtp2_tlv_bearer_context_t),
     {
-        &ogs_gtp2_tlv_desc_ebi_0,
-        &ogs_gtp2_tlv_desc_bearer_tft_0,
-        &ogs_gtp2_tlv_desc_f_teid_0,
-        &ogs_gtp2_tlv_desc_f_teid_1,
-        &ogs_gtp2_tlv_desc_f_teid_2,
-        &ogs_gtp2_tlv_desc_f_teid_3,
-        &ogs_gtp2_tlv_desc_f_teid_4,
-        &ogs_gtp2_tlv_desc_f_teid_5,
-        &ogs_gtp2_tlv_desc_f_teid_6,
-        &ogs_gtp2_tlv_desc_bearer_qos_0,
-        &ogs_gtp2_tlv_desc_f_teid_7,
-        &ogs_gtp2_tlv_desc_cause_0,
-        &ogs_gtp2_tlv_desc_charging_id_0,
-        &ogs_gtp2_tlv_desc_bearer_flags_0,
-        &ogs_gtp2_tlv_desc_pco_0,
-        &ogs_gtp2_tlv_desc_epco_0,
-        &ogs_gtp2_tlv_desc_maximum_packet_loss_rate_0,
-        &ogs_gtp2_tlv_desc_f_teid_8,
-        &ogs_gtp2_tlv_desc_f_teid_9,
-        &ogs_gtp2_tlv_desc_f_teid_10,
-        &ogs_gtp2_tlv_desc_f_teid_11,
-        &ogs_gtp2_tlv_desc_ran_nas_cause_0,
-        &ogs_gtp2_tlv_desc_apco_0,
-        &ogs_gtp2_tlv_desc_f_container_0,
-        &ogs_gtp2_tlv_desc_ti_0,
-        &ogs_gtp2_tlv_desc_packet_flow_id_0,
-        NULL,
-    }
-};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_bearer_context_1 =
-{
-    OGS_TLV_COMPOUND,
-    "Bearer Context",
-    OGS_GTP2_BEARER_CONTEXT_TYPE,
-    0,
-    1,
-    sizeof(ogs_gtp2_tlv_bearer_context_t),
-    {
-        &ogs_gtp2_tlv_desc_ebi_0,
-        &ogs_gtp2_tlv_desc_bearer_tft_0,
-        &ogs_gtp2_tlv_desc_f_teid_0,
-        &ogs_gtp2_tlv_desc_f_teid_1,
-        &ogs_gtp2_tlv_desc_f_teid_2,
-        &ogs_gtp2_tlv_desc_f_teid_3,
-        &ogs_gtp2_tlv_desc_f_teid_4,
-        &ogs_gtp2_tlv_desc_f_teid_5,
-        &ogs_gtp2_tlv_desc_f_teid_6,
-        &ogs_gtp2_tlv_desc_bearer_qos_0,
-        &ogs_gtp2_tlv_desc_f_teid_7,
-        &ogs_gtp2_tlv_desc_cause_0,
-        &ogs_gtp2_tlv_desc_charging_id_0,
-        &ogs_gtp2_tlv_desc_bearer_flags_0,
-        &ogs_gtp2_tlv_desc_pco_0,
-        &ogs_gtp2_tlv_desc_epco_0,
-        &ogs_gtp2_tlv_desc_maximum_packet_loss_rate_0,
-        &ogs_gtp2_tlv_desc_f_teid_8,
-        &ogs_gtp2_tlv_desc_f_teid_9,
-        &ogs_gtp2_tlv_desc_f_teid_10,
-        &ogs_gtp2_tlv_desc_f_teid_11,
-        &ogs_gtp2_tlv_desc_ran_nas_cause_0,
-        &ogs_gtp2_tlv_desc_apco_0,
-        &ogs_gtp2_tlv_desc_f_container_0,
-        &ogs_gtp2_tlv_desc_ti_0,
-        &ogs_gtp2_tlv_desc_packet_flow_id_0,
+        &ogs_gtp2_tlv_desc_ebi,
+        &ogs_gtp2_tlv_desc_bearer_tft,
+        &ogs_gtp2_tlv_desc_f_teid,
+        &ogs_gtp2_tlv_desc_f_teid,
+        &ogs_gtp2_tlv_desc_f_teid,
+        &ogs_gtp2_tlv_desc_f_teid,
+        &ogs_gtp2_tlv_desc_f_teid,
+        &ogs_gtp2_tlv_desc_f_teid,
+        &ogs_gtp2_tlv_desc_f_teid,
+        &ogs_gtp2_tlv_desc_bearer_qos,
+        &ogs_gtp2_tlv_desc_f_teid,
+        &ogs_gtp2_tlv_desc_cause,
+        &ogs_gtp2_tlv_desc_charging_id,
+        &ogs_gtp2_tlv_desc_bearer_flags,
+        &ogs_gtp2_tlv_desc_pco,
+        &ogs_gtp2_tlv_desc_epco,
+        &ogs_gtp2_tlv_desc_maximum_packet_loss_rate,
+        &ogs_gtp2_tlv_desc_f_teid,
+        &ogs_gtp2_tlv_desc_f_teid,
+        &ogs_gtp2_tlv_desc_f_teid,
+        &ogs_gtp2_tlv_desc_f_teid,
+        &ogs_gtp2_tlv_desc_ran_nas_cause,
+        &ogs_gtp2_tlv_desc_apco,
+        &ogs_gtp2_tlv_desc_f_container,
+        &ogs_gtp2_tlv_desc_ti,
+        &ogs_gtp2_tlv_desc_packet_flow_id,
         NULL,
-    }
-};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_pdn_connection_0 =
+    },
+    &ogs_gtp2_tlv_index_bearer_context,
+    ogs_gtp2_tlv_instance_bearer_context
+};
+
+static const ogs_tlv_desc_slot_t ogs_gtp2_tlv_index_pdn_connection_slot[64] = {
+    [0] = { OGS_GTP2_SELECTION_MODE_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp2_tlv_pdn_connection_t, selection_mode) - sizeof(ogs_tlv_presence_t) },
+    [1] = { OGS_GTP2_IP_ADDRESS_TYPE, 1, 0, 5, 4,
+        offsetof(ogs_gtp2_tlv_pdn_connection_t, ipv6_address) - sizeof(ogs_tlv_presence_t) },
+    [2] = { OGS_GTP2_CSG_INFORMATION_REPORTING_ACTION_TYPE, 0, 0, 13, 12,
+        offsetof(ogs_gtp2_tlv_pdn_connection_t, csg_information_reporting_action) - sizeof(ogs_tlv_presence_t) },
+    [5] = { OGS_GTP2_INDICATION_TYPE, 0, 0, 15, 14,
+        offsetof(ogs_gtp2_tlv_pdn_connection_t, indication_flags) - sizeof(ogs_tlv_presence_t) },
+    [7] = { OGS_GTP2_CHARGING_CHARACTERISTICS_TYPE, 0, 0, 11, 10,
+        offsetof(ogs_gtp2_tlv_pdn_connection_t, charging_characteristics) - sizeof(ogs_tlv_presence_t) },
+    [8] = { OGS_GTP2_FQDN_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_gtp2_tlv_pdn_connection_t, pgw_node_name) - sizeof(ogs_tlv_presence_t) },
+    [9] = { OGS_GTP2_AMBR_TYPE, 0, 0, 10, 9,
+        offsetof(ogs_gtp2_tlv_pdn_connection_t, aggregate_maximum_bit_rate) - sizeof(ogs_tlv_presence_t) },
+    [10] = { OGS_GTP2_PRESENCE_REPORTING_AREA_ACTION_TYPE, 0, 0, 19, 18,
+        offsetof(ogs_gtp2_tlv_pdn_connection_t, presence_reporting_area_action) - sizeof(ogs_tlv_presence_t) },
+    [11] = { OGS_GTP2_CHANGE_REPORTING_ACTION_TYPE, 0, 0, 12, 11,
+        offsetof(ogs_gtp2_tlv_pdn_connection_t, change_reporting_action) - sizeof(ogs_tlv_presence_t) },
+    [12] = { OGS_GTP2_UP_SECURITY_POLICY_TYPE, 0, 0, 25, 24,
+        offsetof(ogs_gtp2_tlv_pdn_connection_t, up_security_policy) - sizeof(ogs_tlv_presence_t) },
+    [15] = { OGS_GTP2_CHANGE_TO_REPORT_FLAGS_TYPE, 0, 0, 17, 16,
+        offsetof(ogs_gtp2_tlv_pdn_connection_t, change_to_report_flags) - sizeof(ogs_tlv_presence_t) },
+    [16] = { OGS_GTP2_FQDN_TYPE, 1, 0, 18, 17,
+        offsetof(ogs_gtp2_tlv_pdn_connection_t, local_home_network_id) - sizeof(ogs_tlv_presence_t) },
+    [17] = { OGS_GTP2_WLAN_OFFLOADABILITY_INDICATION_TYPE, 0, 0, 20, 19,
+        offsetof(ogs_gtp2_tlv_pdn_connection_t, wlan_offloadability_indication) - sizeof(ogs_tlv_presence_t) },
+    [21] = { OGS_GTP2_BEARER_CONTEXT_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_gtp2_tlv_pdn_connection_t, bearer_contexts) - sizeof(ogs_tlv_presence_t) },
+    [22] = { OGS_GTP2_SIGNALLING_PRIORITY_INDICATION_TYPE, 0, 0, 16, 15,
+        offsetof(ogs_gtp2_tlv_pdn_connection_t, signalling_priority_indication) - sizeof(ogs_tlv_presence_t) },
+    [29] = { OGS_GTP2_ENB_INFORMATION_REPORTING_TYPE, 0, 0, 14, 13,
+        offsetof(ogs_gtp2_tlv_pdn_connection_t, hnb_information_reporting) - sizeof(ogs_tlv_presence_t) },
+    [33] = { OGS_GTP2_EBI_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_gtp2_tlv_pdn_connection_t, linked_eps_bearer_id) - sizeof(ogs_tlv_presence_t) },
+    [36] = { OGS_GTP2_HEADER_COMPRESSION_CONFIGURATION_TYPE, 0, 0, 23, 22,
+        offsetof(ogs_gtp2_tlv_pdn_connection_t, header_compression_configuration) - sizeof(ogs_tlv_presence_t) },
+    [38] = { OGS_GTP2_PGW_CHANGE_INFO_TYPE, 0, 0, 24, 23,
+        offsetof(ogs_gtp2_tlv_pdn_connection_t, pgw_change_info) - sizeof(ogs_tlv_presence_t) },
+    [39] = { OGS_GTP2_APN_RESTRICTION_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp2_tlv_pdn_connection_t, apn_restriction) - sizeof(ogs_tlv_presence_t) },
+    [40] = { OGS_GTP2_REMOTE_UE_CONTEXT_TYPE, 0, 0, 21, 20,
+        offsetof(ogs_gtp2_tlv_pdn_connection_t, remote_ue_context_connected) - sizeof(ogs_tlv_presence_t) },
+    [43] = { OGS_GTP2_PDN_TYPE_TYPE, 0, 0, 22, 21,
+        offsetof(ogs_gtp2_tlv_pdn_connection_t, pdn_type) - sizeof(ogs_tlv_presence_t) },
+    [47] = { OGS_GTP2_APN_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp2_tlv_pdn_connection_t, apn) - sizeof(ogs_tlv_presence_t) },
+    [58] = { OGS_GTP2_IP_ADDRESS_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp2_tlv_pdn_connection_t, ipv4_address) - sizeof(ogs_tlv_presence_t) },
+    [63] = { OGS_GTP2_F_TEID_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_gtp2_tlv_pdn_connection_t, pgw_s5_s8_ip_address_for_control_plane_or_pmip) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp2_tlv_index_pdn_connection = {
+    63, 25, ogs_gtp2_tlv_index_pdn_connection_slot };
+
+static const uint8_t ogs_gtp2_tlv_instance_pdn_connection[25] = {
+    0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 1, 0, 0, 0, 0, 0, 0, 0,
+};
+
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_pdn_connection =
 {
     OGS_TLV_COMPOUND,
     "PDN Connection",
@@ -2020,87 +2082,81 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_pdn_connection_0 =
     0,
     sizeof(ogs_gtp2_tlv_pdn_connection_t),
     {
-        &ogs_gtp2_tlv_desc_apn_0,
-        &ogs_gtp2_tlv_desc_apn_restriction_0,
-        &ogs_gtp2_tlv_desc_selection_mode_0,
-        &ogs_gtp2_tlv_desc_ip_address_0,
-        &ogs_gtp2_tlv_desc_ip_address_1,
-        &ogs_gtp2_tlv_desc_ebi_0,
-        &ogs_gtp2_tlv_desc_f_teid_0,
-        &ogs_gtp2_tlv_desc_fqdn_0,
-        &ogs_gtp2_tlv_desc_bearer_context_0,
-        &ogs_gtp2_tlv_desc_ambr_0,
-        &ogs_gtp2_tlv_desc_charging_characteristics_0,
-        &ogs_gtp2_tlv_desc_change_reporting_action_0,
-        &ogs_gtp2_tlv_desc_csg_information_reporting_action_0,
-        &ogs_gtp2_tlv_desc_enb_information_reporting_0,
-        &ogs_gtp2_tlv_desc_indication_0,
-        &ogs_gtp2_tlv_desc_signalling_priority_indication_0,
-        &ogs_gtp2_tlv_desc_change_to_report_flags_0,
-        &ogs_gtp2_tlv_desc_fqdn_1,
-        &ogs_gtp2_tlv_desc_presence_reporting_area_action_0,
-        &ogs_gtp2_tlv_desc_wlan_offloadability_indication_0,
-        &ogs_gtp2_tlv_desc_remote_ue_context_0,
-        &ogs_gtp2_tlv_desc_pdn_type_0,
-        &ogs_gtp2_tlv_desc_header_compression_configuration_0,
-        &ogs_gtp2_tlv_desc_pgw_change_info_0,
-        &ogs_gtp2_tlv_desc_up_security_policy_0,
+        &ogs_gtp2_tlv_desc_apn,
+        &ogs_gtp2_tlv_desc_apn_restriction,
+        &ogs_gtp2_tlv_desc_selection_mode,
+        &ogs_gtp2_tlv_desc_ip_address,
+        &ogs_gtp2_tlv_desc_ip_address,
+        &ogs_gtp2_tlv_desc_ebi,
+        &ogs_gtp2_tlv_desc_f_teid,
+        &ogs_gtp2_tlv_desc_fqdn,
+        &ogs_gtp2_tlv_desc_bearer_context,
+        &ogs_gtp2_tlv_desc_ambr,
+        &ogs_gtp2_tlv_desc_charging_characteristics,
+        &ogs_gtp2_tlv_desc_change_reporting_action,
+        &ogs_gtp2_tlv_desc_csg_information_reporting_action,
+        &ogs_gtp2_tlv_desc_enb_information_reporting,
+        &ogs_gtp2_tlv_desc_indication,
+        &ogs_gtp2_tlv_desc_signalling_priority_indication,
+        &ogs_gtp2_tlv_desc_change_to_report_flags,
+        &ogs_gtp2_tlv_desc_fqdn,
+        &ogs_gtp2_tlv_desc_presence_reporting_area_action,
+        &ogs_gtp2_tlv_desc_wlan_offloadability_indication,
+        &ogs_gtp2_tlv_desc_remote_ue_context,
+        &ogs_gtp2_tlv_desc_pdn_type,
+        &ogs_gtp2_tlv_desc_header_compression_configuration,
+        &ogs_gtp2_tlv_desc_pgw_change_info,
+        &ogs_gtp2_tlv_desc_up_security_policy,
         NULL,
-    }
+    },
+    &ogs_gtp2_tlv_index_pdn_connection,
+    ogs_gtp2_tlv_instance_pdn_connection
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_overload_control_information_0 =
-{
-    OGS_TLV_COMPOUND,
-    "Overload Control Information",
-    OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE,
-    0,
-    0,
-    sizeof(ogs_gtp2_tlv_overload_control_information_t),
-    {
-        &ogs_gtp2_tlv_desc_sequence_number_0,
-        &ogs_gtp2_tlv_desc_metric_0,
-        &ogs_gtp2_tlv_desc_epc_timer_0,
-        &ogs_gtp2_tlv_desc_apn_0,
-        NULL,
-    }
+static const ogs_tlv_desc_slot_t ogs_gtp2_tlv_index_overload_control_information_slot[8] = {
+    [0] = { OGS_GTP2_APN_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp2_tlv_overload_control_information_t, list_of_access_point_name) - sizeof(ogs_tlv_presence_t) },
+    [4] = { OGS_GTP2_EPC_TIMER_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp2_tlv_overload_control_information_t, period_of_validity) - sizeof(ogs_tlv_presence_t) },
+    [6] = { OGS_GTP2_METRIC_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp2_tlv_overload_control_information_t, overload_reduction_metric) - sizeof(ogs_tlv_presence_t) },
+    [7] = { OGS_GTP2_SEQUENCE_NUMBER_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp2_tlv_overload_control_information_t, overload_control_sequence_number) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_gtp2_tlv_index_overload_control_information = {
+    7, 4, ogs_gtp2_tlv_index_overload_control_information_slot };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_overload_control_information_1 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_overload_control_information =
 {
     OGS_TLV_COMPOUND,
     "Overload Control Information",
     OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE,
     0,
-    1,
+    0,
     sizeof(ogs_gtp2_tlv_overload_control_information_t),
     {
-        &ogs_gtp2_tlv_desc_sequence_number_0,
-        &ogs_gtp2_tlv_desc_metric_0,
-        &ogs_gtp2_tlv_desc_epc_timer_0,
-        &ogs_gtp2_tlv_desc_apn_0,
+        &ogs_gtp2_tlv_desc_sequence_number,
+        &ogs_gtp2_tlv_desc_metric,
+        &ogs_gtp2_tlv_desc_epc_timer,
+        &ogs_gtp2_tlv_desc_apn,
         NULL,
-    }
+    },
+    &ogs_gtp2_tlv_index_overload_control_information,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_overload_control_information_2 =
-{
-    OGS_TLV_COMPOUND,
-    "Overload Control Information",
-    OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE,
-    0,
-    2,
-    sizeof(ogs_gtp2_tlv_overload_control_information_t),
-    {
-        &ogs_gtp2_tlv_desc_sequence_number_0,
-        &ogs_gtp2_tlv_desc_metric_0,
-        &ogs_gtp2_tlv_desc_epc_timer_0,
-        &ogs_gtp2_tlv_desc_apn_0,
-        NULL,
-    }
+static const ogs_tlv_desc_slot_t ogs_gtp2_tlv_index_load_control_information_slot[8] = {
+    [0] = { OGS_GTP2_APN_AND_RELATIVE_CAPACITY_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp2_tlv_load_control_information_t, list_of_apn_and_relative_capacity) - sizeof(ogs_tlv_presence_t) },
+    [6] = { OGS_GTP2_METRIC_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp2_tlv_load_control_information_t, load_metric) - sizeof(ogs_tlv_presence_t) },
+    [7] = { OGS_GTP2_SEQUENCE_NUMBER_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp2_tlv_load_control_information_t, load_control_sequence_number) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_gtp2_tlv_index_load_control_information = {
+    7, 3, ogs_gtp2_tlv_index_load_control_information_slot };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_load_control_information_0 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_load_control_information =
 {
     OGS_TLV_COMPOUND,
     "Load Control Information",
@@ -2109,751 +2165,1936 @@ ogs_tlv_desc_t ogs_gtp2_tlv_desc_load_control_information_0 =
     0,
     sizeof(ogs_gtp2_tlv_load_control_information_t),
     {
-        &ogs_gtp2_tlv_desc_sequence_number_0,
-        &ogs_gtp2_tlv_desc_metric_0,
-        &ogs_gtp2_tlv_desc_apn_and_relative_capacity_0,
+        &ogs_gtp2_tlv_desc_sequence_number,
+        &ogs_gtp2_tlv_desc_metric,
+        &ogs_gtp2_tlv_desc_apn_and_relative_capacity,
         NULL,
-    }
+    },
+    &ogs_gtp2_tlv_index_load_control_information,
+    NULL
 };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_load_control_information_1 =
-{
-    OGS_TLV_COMPOUND,
-    "Load Control Information",
-    OGS_GTP2_LOAD_CONTROL_INFORMATION_TYPE,
-    0,
-    1,
-    sizeof(ogs_gtp2_tlv_load_control_information_t),
-    {
-        &ogs_gtp2_tlv_desc_sequence_number_0,
-        &ogs_gtp2_tlv_desc_metric_0,
-        &ogs_gtp2_tlv_desc_apn_and_relative_capacity_0,
-        NULL,
-    }
+static const ogs_tlv_desc_slot_t ogs_gtp2_tlv_index_scef_pdn_connection_slot[8] = {
+    [0] = { OGS_GTP2_NODE_IDENTIFIER_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp2_tlv_scef_pdn_connection_t, scef_id) - sizeof(ogs_tlv_presence_t) },
+    [1] = { OGS_GTP2_EBI_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp2_tlv_scef_pdn_connection_t, default_eps_bearer_id) - sizeof(ogs_tlv_presence_t) },
+    [7] = { OGS_GTP2_APN_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp2_tlv_scef_pdn_connection_t, apn) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_gtp2_tlv_index_scef_pdn_connection = {
+    7, 3, ogs_gtp2_tlv_index_scef_pdn_connection_slot };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_load_control_information_2 =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_scef_pdn_connection =
 {
     OGS_TLV_COMPOUND,
-    "Load Control Information",
-    OGS_GTP2_LOAD_CONTROL_INFORMATION_TYPE,
+    "SCEF PDN Connection",
+    OGS_GTP2_SCEF_PDN_CONNECTION_TYPE,
     0,
-    2,
-    sizeof(ogs_gtp2_tlv_load_control_information_t),
+    0,
+    sizeof(ogs_gtp2_tlv_scef_pdn_connection_t),
     {
-        &ogs_gtp2_tlv_desc_sequence_number_0,
-        &ogs_gtp2_tlv_desc_metric_0,
-        &ogs_gtp2_tlv_desc_apn_and_relative_capacity_0,
+        &ogs_gtp2_tlv_desc_apn,
+        &ogs_gtp2_tlv_desc_ebi,
+        &ogs_gtp2_tlv_desc_node_identifier,
         NULL,
-    }
+    },
+    &ogs_gtp2_tlv_index_scef_pdn_connection,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_gtp2_msg_index_echo_request_slot[4] = {
+    [0] = { OGS_GTP2_NODE_FEATURES_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp2_echo_request_t, sending_node_features) },
+    [3] = { OGS_GTP2_RECOVERY_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp2_echo_request_t, recovery) },
 };
+static const ogs_tlv_desc_index_t ogs_gtp2_msg_index_echo_request = {
+    3, 2, ogs_gtp2_msg_index_echo_request_slot };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_scef_pdn_connection_0 =
-{
-    OGS_TLV_COMPOUND,
-    "SCEF PDN Connection",
-    OGS_GTP2_SCEF_PDN_CONNECTION_TYPE,
-    0,
-    0,
-    sizeof(ogs_gtp2_tlv_scef_pdn_connection_t),
-    {
-        &ogs_gtp2_tlv_desc_apn_0,
-        &ogs_gtp2_tlv_desc_ebi_0,
-        &ogs_gtp2_tlv_desc_node_identifier_0,
-        NULL,
-    }
-};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_echo_request =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_echo_request =
 {
     OGS_TLV_MESSAGE,
     "Echo Request",
     0, 0, 0, 0, {
-        &ogs_gtp2_tlv_desc_recovery_0,
-        &ogs_gtp2_tlv_desc_node_features_0,
+        &ogs_gtp2_tlv_desc_recovery,
+        &ogs_gtp2_tlv_desc_node_features,
     NULL,
-}};
+}, &ogs_gtp2_msg_index_echo_request, NULL};
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_echo_response =
+static const ogs_tlv_desc_slot_t ogs_gtp2_msg_index_echo_response_slot[4] = {
+    [0] = { OGS_GTP2_NODE_FEATURES_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp2_echo_response_t, sending_node_features) },
+    [3] = { OGS_GTP2_RECOVERY_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp2_echo_response_t, recovery) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp2_msg_index_echo_response = {
+    3, 2, ogs_gtp2_msg_index_echo_response_slot };
+
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_echo_response =
 {
     OGS_TLV_MESSAGE,
     "Echo Response",
     0, 0, 0, 0, {
-        &ogs_gtp2_tlv_desc_recovery_0,
-        &ogs_gtp2_tlv_desc_node_features_0,
+        &ogs_gtp2_tlv_desc_recovery,
+        &ogs_gtp2_tlv_desc_node_features,
     NULL,
-}};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_create_session_request =
+}, &ogs_gtp2_msg_index_echo_response, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp2_msg_index_create_session_request_slot[256] = {
+    [0] = { 0, 0, 0, 20, 19,
+        offsetof(ogs_gtp2_create_session_request_t, bearer_contexts_to_be_created) + sizeof(ogs_gtp2_tlv_bearer_context_t) },
+    [6] = { OGS_GTP2_LDN_TYPE, 1, 0, 32, 31,
+        offsetof(ogs_gtp2_create_session_request_t, sgw_ldn) },
+    [7] = { OGS_GTP2_F_CONTAINER_TYPE, 0, 0, 53, 52,
+        offsetof(ogs_gtp2_create_session_request_t, nbifom_container) },
+    [8] = { OGS_GTP2_AMBR_TYPE, 0, 0, 15, 14,
+        offsetof(ogs_gtp2_create_session_request_t, aggregate_maximum_bit_rate) },
+    [13] = { OGS_GTP2_LDN_TYPE, 2, 0, 33, 32,
+        offsetof(ogs_gtp2_create_session_request_t, epdg_ldn) },
+    [20] = { OGS_GTP2_LDN_TYPE, 3, 0, 34, 33,
+        offsetof(ogs_gtp2_create_session_request_t, twan_ldn) },
+    [21] = { OGS_GTP2_SIGNALLING_PRIORITY_INDICATION_TYPE, 0, 0, 35, 34,
+        offsetof(ogs_gtp2_create_session_request_t, signalling_priority_indication) },
+    [30] = { OGS_GTP2_PCO_TYPE, 0, 0, 18, 17,
+        offsetof(ogs_gtp2_create_session_request_t, protocol_configuration_options) },
+    [43] = { OGS_GTP2_APCO_TYPE, 0, 0, 38, 37,
+        offsetof(ogs_gtp2_create_session_request_t, additional_protocol_configuration_options) },
+    [47] = { OGS_GTP2_APN_TYPE, 0, 0, 10, 9,
+        offsetof(ogs_gtp2_create_session_request_t, access_point_name) },
+    [48] = { OGS_GTP2_NODE_IDENTIFIER_TYPE, 0, 0, 55, 54,
+        offsetof(ogs_gtp2_create_session_request_t, _aaa_server_identifier) },
+    [58] = { OGS_GTP2_UP_FUNCTION_SELECTION_INDICATION_FLAGS_TYPE, 0, 0, 64, 63,
+        offsetof(ogs_gtp2_create_session_request_t, up_function_selection_indication_flags) },
+    [65] = { OGS_GTP2_TWAN_IDENTIFIER_TYPE, 0, 0, 42, 41,
+        offsetof(ogs_gtp2_create_session_request_t, twan_identifier) },
+    [69] = { OGS_GTP2_INDICATION_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_gtp2_create_session_request_t, indication_flags) },
+    [72] = { OGS_GTP2_TWAN_IDENTIFIER_TYPE, 1, 0, 51, 50,
+        offsetof(ogs_gtp2_create_session_request_t, wlan_location_information) },
+    [73] = { OGS_GTP2_FQDN_TYPE, 0, 0, 62, 61,
+        offsetof(ogs_gtp2_create_session_request_t, sgw_u_node_name) },
+    [91] = { OGS_GTP2_SERVING_NETWORK_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp2_create_session_request_t, serving_network) },
+    [92] = { OGS_GTP2_MILLISECOND_TIME_STAMP_TYPE, 0, 0, 49, 48,
+        offsetof(ogs_gtp2_create_session_request_t, origination_time_stamp) },
+    [96] = { OGS_GTP2_TRACE_INFORMATION_TYPE, 0, 0, 22, 21,
+        offsetof(ogs_gtp2_create_session_request_t, trace_information) },
+    [97] = { OGS_GTP2_SECONDARY_RAT_USAGE_DATA_REPORT_TYPE, 0, 0, 63, 62,
+        offsetof(ogs_gtp2_create_session_request_t, secondary_rat_usage_data_report) },
+    [108] = { OGS_GTP2_MSISDN_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp2_create_session_request_t, msisdn) },
+    [126] = { OGS_GTP2_TWMI_TYPE, 0, 0, 17, 16,
+        offsetof(ogs_gtp2_create_session_request_t, trusted_wlan_mode_indication) },
+    [128] = { OGS_GTP2_SELECTION_MODE_TYPE, 0, 0, 11, 10,
+        offsetof(ogs_gtp2_create_session_request_t, selection_mode) },
+    [130] = { OGS_GTP2_RAT_TYPE_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_gtp2_create_session_request_t, rat_type) },
+    [131] = { OGS_GTP2_INTEGER_NUMBER_TYPE, 0, 0, 50, 49,
+        offsetof(ogs_gtp2_create_session_request_t, maximum_wait_time) },
+    [135] = { OGS_GTP2_CHARGING_CHARACTERISTICS_TYPE, 0, 0, 30, 29,
+        offsetof(ogs_gtp2_create_session_request_t, charging_characteristics) },
+    [136] = { OGS_GTP2_MAPPED_UE_USAGE_TYPE_TYPE, 0, 0, 60, 59,
+        offsetof(ogs_gtp2_create_session_request_t, mapped_ue_usage_type) },
+    [139] = { OGS_GTP2_RECOVERY_TYPE, 0, 0, 23, 22,
+        offsetof(ogs_gtp2_create_session_request_t, recovery) },
+    [147] = { OGS_GTP2_MEI_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp2_create_session_request_t, me_identity) },
+    [148] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 0, 0, 46, 45,
+        offsetof(ogs_gtp2_create_session_request_t, mme_s4_sgsn_s_overload_control_information) },
+    [155] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 1, 0, 47, 46,
+        offsetof(ogs_gtp2_create_session_request_t, sgw_s_overload_control_information) },
+    [162] = { OGS_GTP2_UE_TIME_ZONE_TYPE, 0, 0, 28, 27,
+        offsetof(ogs_gtp2_create_session_request_t, ue_time_zone) },
+    [163] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 2, 0, 48, 47,
+        offsetof(ogs_gtp2_create_session_request_t, twan_epdg_s_overload_control_information) },
+    [165] = { OGS_GTP2_CN_OPERATOR_SELECTION_ENTITY_TYPE, 0, 0, 44, 43,
+        offsetof(ogs_gtp2_create_session_request_t, cn_operator_selection_entity) },
+    [167] = { OGS_GTP2_APN_RESTRICTION_TYPE, 0, 0, 14, 13,
+        offsetof(ogs_gtp2_create_session_request_t, maximum_apn_restriction) },
+    [175] = { OGS_GTP2_COUNTER_TYPE, 0, 0, 58, 57,
+        offsetof(ogs_gtp2_create_session_request_t, mo_exception_data_counter) },
+    [186] = { OGS_GTP2_IP_ADDRESS_TYPE, 0, 0, 36, 35,
+        offsetof(ogs_gtp2_create_session_request_t, ue_local_ip_address) },
+    [187] = { OGS_GTP2_TWAN_IDENTIFIER_TIMESTAMP_TYPE, 0, 0, 52, 51,
+        offsetof(ogs_gtp2_create_session_request_t, wlan_location_timestamp) },
+    [191] = { OGS_GTP2_F_TEID_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_gtp2_create_session_request_t, sender_f_teid_for_control_plane) },
+    [193] = { OGS_GTP2_IP_ADDRESS_TYPE, 1, 0, 39, 38,
+        offsetof(ogs_gtp2_create_session_request_t, hnb_local_ip_address) },
+    [198] = { OGS_GTP2_F_TEID_TYPE, 1, 0, 9, 8,
+        offsetof(ogs_gtp2_create_session_request_t, pgw_s5_s8_address_for_control_plane_or_pmip) },
+    [200] = { OGS_GTP2_IP_ADDRESS_TYPE, 2, 0, 41, 40,
+        offsetof(ogs_gtp2_create_session_request_t, mme_s4_sgsn_identifier) },
+    [206] = { OGS_GTP2_PORT_NUMBER_TYPE, 0, 0, 37, 36,
+        offsetof(ogs_gtp2_create_session_request_t, ue_udp_port) },
+    [207] = { OGS_GTP2_IP_ADDRESS_TYPE, 3, 0, 43, 42,
+        offsetof(ogs_gtp2_create_session_request_t, epdg_ip_address) },
+    [213] = { OGS_GTP2_BEARER_CONTEXT_TYPE, 0, 0, 19, 18,
+        offsetof(ogs_gtp2_create_session_request_t, bearer_contexts_to_be_created) },
+    [214] = { OGS_GTP2_PORT_NUMBER_TYPE, 1, 0, 40, 39,
+        offsetof(ogs_gtp2_create_session_request_t, hnb_udp_port) },
+    [215] = { OGS_GTP2_SERVING_PLMN_RATE_CONTROL_TYPE, 0, 0, 57, 56,
+        offsetof(ogs_gtp2_create_session_request_t, serving_plmn_rate_control) },
+    [217] = { OGS_GTP2_IMSI_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp2_create_session_request_t, imsi) },
+    [220] = { OGS_GTP2_BEARER_CONTEXT_TYPE, 1, 0, 21, 20,
+        offsetof(ogs_gtp2_create_session_request_t, bearer_contexts_to_be_removed) },
+    [221] = { OGS_GTP2_PORT_NUMBER_TYPE, 2, 0, 59, 58,
+        offsetof(ogs_gtp2_create_session_request_t, ue_tcp_port) },
+    [225] = { OGS_GTP2_EBI_TYPE, 0, 0, 16, 15,
+        offsetof(ogs_gtp2_create_session_request_t, linked_eps_bearer_id) },
+    [226] = { OGS_GTP2_PRESENCE_REPORTING_AREA_INFORMATION_TYPE, 0, 0, 45, 44,
+        offsetof(ogs_gtp2_create_session_request_t, presence_reporting_area_information) },
+    [228] = { OGS_GTP2_FQ_CSID_TYPE, 0, 0, 24, 23,
+        offsetof(ogs_gtp2_create_session_request_t, mme_fq_csid) },
+    [230] = { OGS_GTP2_ULI_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp2_create_session_request_t, user_location_information) },
+    [231] = { OGS_GTP2_REMOTE_UE_CONTEXT_TYPE, 0, 0, 54, 53,
+        offsetof(ogs_gtp2_create_session_request_t, remote_ue_context_connected) },
+    [233] = { OGS_GTP2_UCI_TYPE, 0, 0, 29, 28,
+        offsetof(ogs_gtp2_create_session_request_t, user_csg_information) },
+    [235] = { OGS_GTP2_PDN_TYPE_TYPE, 0, 0, 12, 11,
+        offsetof(ogs_gtp2_create_session_request_t, pdn_type) },
+    [236] = { OGS_GTP2_FQ_CSID_TYPE, 1, 0, 25, 24,
+        offsetof(ogs_gtp2_create_session_request_t, sgw_fq_csid) },
+    [237] = { OGS_GTP2_ULI_TYPE, 1, 0, 61, 60,
+        offsetof(ogs_gtp2_create_session_request_t, user_location_information_for_sgw) },
+    [238] = { OGS_GTP2_APN_RATE_CONTROL_STATUS_TYPE, 0, 0, 65, 64,
+        offsetof(ogs_gtp2_create_session_request_t, apn_rate_control_status) },
+    [242] = { OGS_GTP2_FQ_CSID_TYPE, 2, 0, 26, 25,
+        offsetof(ogs_gtp2_create_session_request_t, epdg_fq_csid) },
+    [247] = { OGS_GTP2_PAA_TYPE, 0, 0, 13, 12,
+        offsetof(ogs_gtp2_create_session_request_t, pdn_address_allocation) },
+    [249] = { OGS_GTP2_FQ_CSID_TYPE, 3, 0, 27, 26,
+        offsetof(ogs_gtp2_create_session_request_t, twan_fq_csid) },
+    [253] = { OGS_GTP2_EPCO_TYPE, 0, 0, 56, 55,
+        offsetof(ogs_gtp2_create_session_request_t, extended_protocol_configuration_options) },
+    [255] = { OGS_GTP2_LDN_TYPE, 0, 0, 31, 30,
+        offsetof(ogs_gtp2_create_session_request_t, mme_s4_sgsn_ldn) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp2_msg_index_create_session_request = {
+    255, 65, ogs_gtp2_msg_index_create_session_request_slot };
+
+static const uint8_t ogs_gtp2_msg_instance_create_session_request[65] = {
+    0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 1, 0, 0, 0, 1, 2, 3, 0, 0, 0, 0, 1,
+    2, 3, 0, 0, 0, 0, 1, 1, 2, 0, 3, 0, 0, 0, 1, 2,
+    0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 2, 0, 1, 0, 0, 0,
+    0,
+};
+
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_create_session_request =
 {
     OGS_TLV_MESSAGE,
     "Create Session Request",
     0, 0, 0, 0, {
-        &ogs_gtp2_tlv_desc_imsi_0,
-        &ogs_gtp2_tlv_desc_msisdn_0,
-        &ogs_gtp2_tlv_desc_mei_0,
-        &ogs_gtp2_tlv_desc_uli_0,
-        &ogs_gtp2_tlv_desc_serving_network_0,
-        &ogs_gtp2_tlv_desc_rat_type_0,
-        &ogs_gtp2_tlv_desc_indication_0,
-        &ogs_gtp2_tlv_desc_f_teid_0,
-        &ogs_gtp2_tlv_desc_f_teid_1,
-        &ogs_gtp2_tlv_desc_apn_0,
-        &ogs_gtp2_tlv_desc_selection_mode_0,
-        &ogs_gtp2_tlv_desc_pdn_type_0,
-        &ogs_gtp2_tlv_desc_paa_0,
-        &ogs_gtp2_tlv_desc_apn_restriction_0,
-        &ogs_gtp2_tlv_desc_ambr_0,
-        &ogs_gtp2_tlv_desc_ebi_0,
-        &ogs_gtp2_tlv_desc_twmi_0,
-        &ogs_gtp2_tlv_desc_pco_0,
-        &ogs_gtp2_tlv_desc_bearer_context_0,
+        &ogs_gtp2_tlv_desc_imsi,
+        &ogs_gtp2_tlv_desc_msisdn,
+        &ogs_gtp2_tlv_desc_mei,
+        &ogs_gtp2_tlv_desc_uli,
+        &ogs_gtp2_tlv_desc_serving_network,
+        &ogs_gtp2_tlv_desc_rat_type,
+        &ogs_gtp2_tlv_desc_indication,
+        &ogs_gtp2_tlv_desc_f_teid,
+        &ogs_gtp2_tlv_desc_f_teid,
+        &ogs_gtp2_tlv_desc_apn,
+        &ogs_gtp2_tlv_desc_selection_mode,
+        &ogs_gtp2_tlv_desc_pdn_type,
+        &ogs_gtp2_tlv_desc_paa,
+        &ogs_gtp2_tlv_desc_apn_restriction,
+        &ogs_gtp2_tlv_desc_ambr,
+        &ogs_gtp2_tlv_desc_ebi,
+        &ogs_gtp2_tlv_desc_twmi,
+        &ogs_gtp2_tlv_desc_pco,
+        &ogs_gtp2_tlv_desc_bearer_context,
         &ogs_tlv_desc_more8,
-        &ogs_gtp2_tlv_desc_bearer_context_1,
-        &ogs_gtp2_tlv_desc_trace_information_0,
-        &ogs_gtp2_tlv_desc_recovery_0,
-        &ogs_gtp2_tlv_desc_fq_csid_0,
-        &ogs_gtp2_tlv_desc_fq_csid_1,
-        &ogs_gtp2_tlv_desc_fq_csid_2,
-        &ogs_gtp2_tlv_desc_fq_csid_3,
-        &ogs_gtp2_tlv_desc_ue_time_zone_0,
-        &ogs_gtp2_tlv_desc_uci_0,
-        &ogs_gtp2_tlv_desc_charging_characteristics_0,
-        &ogs_gtp2_tlv_desc_ldn_0,
-        &ogs_gtp2_tlv_desc_ldn_1,
-        &ogs_gtp2_tlv_desc_ldn_2,
-        &ogs_gtp2_tlv_desc_ldn_3,
-        &ogs_gtp2_tlv_desc_signalling_priority_indication_0,
-        &ogs_gtp2_tlv_desc_ip_address_0,
-        &ogs_gtp2_tlv_desc_port_number_0,
-        &ogs_gtp2_tlv_desc_apco_0,
-        &ogs_gtp2_tlv_desc_ip_address_1,
-        &ogs_gtp2_tlv_desc_port_number_1,
-        &ogs_gtp2_tlv_desc_ip_address_2,
-        &ogs_gtp2_tlv_desc_twan_identifier_0,
-        &ogs_gtp2_tlv_desc_ip_address_3,
-        &ogs_gtp2_tlv_desc_cn_operator_selection_entity_0,
-        &ogs_gtp2_tlv_desc_presence_reporting_area_information_0,
-        &ogs_gtp2_tlv_desc_overload_control_information_0,
-        &ogs_gtp2_tlv_desc_overload_control_information_1,
-        &ogs_gtp2_tlv_desc_overload_control_information_2,
-        &ogs_gtp2_tlv_desc_millisecond_time_stamp_0,
-        &ogs_gtp2_tlv_desc_integer_number_0,
-        &ogs_gtp2_tlv_desc_twan_identifier_1,
-        &ogs_gtp2_tlv_desc_twan_identifier_timestamp_0,
-        &ogs_gtp2_tlv_desc_f_container_0,
-        &ogs_gtp2_tlv_desc_remote_ue_context_0,
-        &ogs_gtp2_tlv_desc_node_identifier_0,
-        &ogs_gtp2_tlv_desc_epco_0,
-        &ogs_gtp2_tlv_desc_serving_plmn_rate_control_0,
-        &ogs_gtp2_tlv_desc_counter_0,
-        &ogs_gtp2_tlv_desc_port_number_2,
-        &ogs_gtp2_tlv_desc_mapped_ue_usage_type_0,
-        &ogs_gtp2_tlv_desc_uli_1,
-        &ogs_gtp2_tlv_desc_fqdn_0,
-        &ogs_gtp2_tlv_desc_secondary_rat_usage_data_report_0,
-        &ogs_gtp2_tlv_desc_up_function_selection_indication_flags_0,
-        &ogs_gtp2_tlv_desc_apn_rate_control_status_0,
-    NULL,
-}};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_create_session_response =
+        &ogs_gtp2_tlv_desc_bearer_context,
+        &ogs_gtp2_tlv_desc_trace_information,
+        &ogs_gtp2_tlv_desc_recovery,
+        &ogs_gtp2_tlv_desc_fq_csid,
+        &ogs_gtp2_tlv_desc_fq_csid,
+        &ogs_gtp2_tlv_desc_fq_csid,
+        &ogs_gtp2_tlv_desc_fq_csid,
+        &ogs_gtp2_tlv_desc_ue_time_zone,
+        &ogs_gtp2_tlv_desc_uci,
+        &ogs_gtp2_tlv_desc_charging_characteristics,
+        &ogs_gtp2_tlv_desc_ldn,
+        &ogs_gtp2_tlv_desc_ldn,
+        &ogs_gtp2_tlv_desc_ldn,
+        &ogs_gtp2_tlv_desc_ldn,
+        &ogs_gtp2_tlv_desc_signalling_priority_indication,
+        &ogs_gtp2_tlv_desc_ip_address,
+        &ogs_gtp2_tlv_desc_port_number,
+        &ogs_gtp2_tlv_desc_apco,
+        &ogs_gtp2_tlv_desc_ip_address,
+        &ogs_gtp2_tlv_desc_port_number,
+        &ogs_gtp2_tlv_desc_ip_address,
+        &ogs_gtp2_tlv_desc_twan_identifier,
+        &ogs_gtp2_tlv_desc_ip_address,
+        &ogs_gtp2_tlv_desc_cn_operator_selection_entity,
+        &ogs_gtp2_tlv_desc_presence_reporting_area_information,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_millisecond_time_stamp,
+        &ogs_gtp2_tlv_desc_integer_number,
+        &ogs_gtp2_tlv_desc_twan_identifier,
+        &ogs_gtp2_tlv_desc_twan_identifier_timestamp,
+        &ogs_gtp2_tlv_desc_f_container,
+        &ogs_gtp2_tlv_desc_remote_ue_context,
+        &ogs_gtp2_tlv_desc_node_identifier,
+        &ogs_gtp2_tlv_desc_epco,
+        &ogs_gtp2_tlv_desc_serving_plmn_rate_control,
+        &ogs_gtp2_tlv_desc_counter,
+        &ogs_gtp2_tlv_desc_port_number,
+        &ogs_gtp2_tlv_desc_mapped_ue_usage_type,
+        &ogs_gtp2_tlv_desc_uli,
+        &ogs_gtp2_tlv_desc_fqdn,
+        &ogs_gtp2_tlv_desc_secondary_rat_usage_data_report,
+        &ogs_gtp2_tlv_desc_up_function_selection_indication_flags,
+        &ogs_gtp2_tlv_desc_apn_rate_control_status,
+    NULL,
+}, &ogs_gtp2_msg_index_create_session_request, ogs_gtp2_msg_instance_create_session_request};
+
+static const ogs_tlv_desc_slot_t ogs_gtp2_msg_index_create_session_response_slot[128] = {
+    [0] = { 0, 0, 0, 13, 12,
+        offsetof(ogs_gtp2_create_session_response_t, bearer_contexts_created) + sizeof(ogs_gtp2_tlv_bearer_context_t) },
+    [6] = { OGS_GTP2_LDN_TYPE, 1, 0, 21, 20,
+        offsetof(ogs_gtp2_create_session_response_t, pgw_ldn) },
+    [7] = { OGS_GTP2_F_CONTAINER_TYPE, 0, 0, 32, 31,
+        offsetof(ogs_gtp2_create_session_response_t, nbifom_container) },
+    [8] = { OGS_GTP2_AMBR_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_gtp2_create_session_response_t, aggregate_maximum_bit_rate) },
+    [9] = { OGS_GTP2_PRESENCE_REPORTING_AREA_ACTION_TYPE, 0, 0, 26, 25,
+        offsetof(ogs_gtp2_create_session_response_t, presence_reporting_area_action) },
+    [11] = { OGS_GTP2_CHANGE_REPORTING_ACTION_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp2_create_session_response_t, change_reporting_action) },
+    [12] = { OGS_GTP2_RECOVERY_TYPE, 0, 0, 15, 14,
+        offsetof(ogs_gtp2_create_session_response_t, recovery) },
+    [13] = { OGS_GTP2_SGI_PTP_TUNNEL_ADDRESS_TYPE, 0, 0, 36, 35,
+        offsetof(ogs_gtp2_create_session_response_t, sgi_ptp_tunnel_address) },
+    [20] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 0, 0, 30, 29,
+        offsetof(ogs_gtp2_create_session_response_t, pgw_s_overload_control_information) },
+    [27] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 1, 0, 31, 30,
+        offsetof(ogs_gtp2_create_session_response_t, sgw_s_overload_control_information) },
+    [30] = { OGS_GTP2_PCO_TYPE, 0, 0, 11, 10,
+        offsetof(ogs_gtp2_create_session_response_t, protocol_configuration_options) },
+    [39] = { OGS_GTP2_APN_RESTRICTION_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_gtp2_create_session_response_t, apn_restriction) },
+    [43] = { OGS_GTP2_APCO_TYPE, 0, 0, 23, 22,
+        offsetof(ogs_gtp2_create_session_response_t, additional_protocol_configuration_options) },
+    [46] = { OGS_GTP2_CHARGING_ID_TYPE, 0, 0, 33, 32,
+        offsetof(ogs_gtp2_create_session_response_t, pdn_connection_charging_id) },
+    [50] = { OGS_GTP2_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp2_create_session_response_t, cause) },
+    [54] = { OGS_GTP2_IP4CP_TYPE, 0, 0, 24, 23,
+        offsetof(ogs_gtp2_create_session_response_t, trusted_wlan_ipv4_parameters) },
+    [58] = { OGS_GTP2_IP_ADDRESS_TYPE, 0, 0, 17, 16,
+        offsetof(ogs_gtp2_create_session_response_t, charging_gateway_address) },
+    [60] = { OGS_GTP2_EPC_TIMER_TYPE, 0, 0, 22, 21,
+        offsetof(ogs_gtp2_create_session_response_t, pgw_back_off_time) },
+    [63] = { OGS_GTP2_F_TEID_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp2_create_session_response_t, sender_f_teid_for_control_plane) },
+    [65] = { OGS_GTP2_IP_ADDRESS_TYPE, 1, 0, 39, 38,
+        offsetof(ogs_gtp2_create_session_response_t, alternative_pgw_c_smf_ip_address) },
+    [66] = { OGS_GTP2_CSG_INFORMATION_REPORTING_ACTION_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp2_create_session_response_t, csg_information_reporting_action) },
+    [69] = { OGS_GTP2_INDICATION_TYPE, 0, 0, 25, 24,
+        offsetof(ogs_gtp2_create_session_response_t, indication_flags) },
+    [70] = { OGS_GTP2_F_TEID_TYPE, 1, 0, 6, 5,
+        offsetof(ogs_gtp2_create_session_response_t, pgw_s5_s8__s2a_s2b_f_teid_for_pmip_based_interface_or_for_gtp_based_control_plane_interface) },
+    [72] = { OGS_GTP2_FQDN_TYPE, 0, 0, 16, 15,
+        offsetof(ogs_gtp2_create_session_response_t, charging_gateway_name) },
+    [74] = { OGS_GTP2_UP_SECURITY_POLICY_TYPE, 0, 0, 40, 39,
+        offsetof(ogs_gtp2_create_session_response_t, up_security_policy) },
+    [79] = { OGS_GTP2_FQDN_TYPE, 1, 0, 35, 34,
+        offsetof(ogs_gtp2_create_session_response_t, pgw_node_name) },
+    [85] = { OGS_GTP2_BEARER_CONTEXT_TYPE, 0, 0, 12, 11,
+        offsetof(ogs_gtp2_create_session_response_t, bearer_contexts_created) },
+    [92] = { OGS_GTP2_BEARER_CONTEXT_TYPE, 1, 0, 14, 13,
+        offsetof(ogs_gtp2_create_session_response_t, bearer_contexts_marked_for_removal) },
+    [93] = { OGS_GTP2_ENB_INFORMATION_REPORTING_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp2_create_session_response_t, hnb_information_reporting) },
+    [94] = { OGS_GTP2_FQDN_TYPE, 3, 0, 38, 37,
+        offsetof(ogs_gtp2_create_session_response_t, alternative_pgw_c_smf_fqdn) },
+    [97] = { OGS_GTP2_EBI_TYPE, 0, 0, 10, 9,
+        offsetof(ogs_gtp2_create_session_response_t, linked_eps_bearer_id) },
+    [100] = { OGS_GTP2_FQ_CSID_TYPE, 0, 0, 18, 17,
+        offsetof(ogs_gtp2_create_session_response_t, pgw_fq_csid) },
+    [102] = { OGS_GTP2_PGW_CHANGE_INFO_TYPE, 0, 0, 37, 36,
+        offsetof(ogs_gtp2_create_session_response_t, pgw_change_info) },
+    [107] = { OGS_GTP2_FQ_CSID_TYPE, 1, 0, 19, 18,
+        offsetof(ogs_gtp2_create_session_response_t, sgw_fq_csid) },
+    [109] = { OGS_GTP2_LOAD_CONTROL_INFORMATION_TYPE, 0, 0, 27, 26,
+        offsetof(ogs_gtp2_create_session_response_t, pgw_s_node_level_load_control_information) },
+    [116] = { OGS_GTP2_LOAD_CONTROL_INFORMATION_TYPE, 1, 0, 28, 27,
+        offsetof(ogs_gtp2_create_session_response_t, pgw_s_apn_level_load_control_information) },
+    [119] = { OGS_GTP2_PAA_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_gtp2_create_session_response_t, pdn_address_allocation) },
+    [123] = { OGS_GTP2_LOAD_CONTROL_INFORMATION_TYPE, 2, 0, 29, 28,
+        offsetof(ogs_gtp2_create_session_response_t, sgw_s_node_level_load_control_information) },
+    [125] = { OGS_GTP2_EPCO_TYPE, 0, 0, 34, 33,
+        offsetof(ogs_gtp2_create_session_response_t, extended_protocol_configuration_options) },
+    [127] = { OGS_GTP2_LDN_TYPE, 0, 0, 20, 19,
+        offsetof(ogs_gtp2_create_session_response_t, sgw_ldn) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp2_msg_index_create_session_response = {
+    127, 40, ogs_gtp2_msg_index_create_session_response_slot };
+
+static const uint8_t ogs_gtp2_msg_instance_create_session_response[40] = {
+    0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0,
+    0, 0, 1, 0, 1, 0, 0, 0, 0, 0, 0, 1, 2, 0, 1, 0,
+    0, 0, 1, 0, 0, 3, 1, 0,
+};
+
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_create_session_response =
 {
     OGS_TLV_MESSAGE,
     "Create Session Response",
     0, 0, 0, 0, {
-        &ogs_gtp2_tlv_desc_cause_0,
-        &ogs_gtp2_tlv_desc_change_reporting_action_0,
-        &ogs_gtp2_tlv_desc_csg_information_reporting_action_0,
-        &ogs_gtp2_tlv_desc_enb_information_reporting_0,
-        &ogs_gtp2_tlv_desc_f_teid_0,
-        &ogs_gtp2_tlv_desc_f_teid_1,
-        &ogs_gtp2_tlv_desc_paa_0,
-        &ogs_gtp2_tlv_desc_apn_restriction_0,
-        &ogs_gtp2_tlv_desc_ambr_0,
-        &ogs_gtp2_tlv_desc_ebi_0,
-        &ogs_gtp2_tlv_desc_pco_0,
-        &ogs_gtp2_tlv_desc_bearer_context_0,
+        &ogs_gtp2_tlv_desc_cause,
+        &ogs_gtp2_tlv_desc_change_reporting_action,
+        &ogs_gtp2_tlv_desc_csg_information_reporting_action,
+        &ogs_gtp2_tlv_desc_enb_information_reporting,
+        &ogs_gtp2_tlv_desc_f_teid,
+        &ogs_gtp2_tlv_desc_f_teid,
+        &ogs_gtp2_tlv_desc_paa,
+        &ogs_gtp2_tlv_desc_apn_restriction,
+        &ogs_gtp2_tlv_desc_ambr,
+        &ogs_gtp2_tlv_desc_ebi,
+        &ogs_gtp2_tlv_desc_pco,
+        &ogs_gtp2_tlv_desc_bearer_context,
         &ogs_tlv_desc_more8,
-        &ogs_gtp2_tlv_desc_bearer_context_1,
-        &ogs_gtp2_tlv_desc_recovery_0,
-        &ogs_gtp2_tlv_desc_fqdn_0,
-        &ogs_gtp2_tlv_desc_ip_address_0,
-        &ogs_gtp2_tlv_desc_fq_csid_0,
-        &ogs_gtp2_tlv_desc_fq_csid_1,
-        &ogs_gtp2_tlv_desc_ldn_0,
-        &ogs_gtp2_tlv_desc_ldn_1,
-        &ogs_gtp2_tlv_desc_epc_timer_0,
-        &ogs_gtp2_tlv_desc_apco_0,
-        &ogs_gtp2_tlv_desc_ip4cp_0,
-        &ogs_gtp2_tlv_desc_indication_0,
-        &ogs_gtp2_tlv_desc_presence_reporting_area_action_0,
-        &ogs_gtp2_tlv_desc_load_control_information_0,
-        &ogs_gtp2_tlv_desc_load_control_information_1,
-        &ogs_gtp2_tlv_desc_load_control_information_2,
-        &ogs_gtp2_tlv_desc_overload_control_information_0,
-        &ogs_gtp2_tlv_desc_overload_control_information_1,
-        &ogs_gtp2_tlv_desc_f_container_0,
-        &ogs_gtp2_tlv_desc_charging_id_0,
-        &ogs_gtp2_tlv_desc_epco_0,
-        &ogs_gtp2_tlv_desc_fqdn_1,
-        &ogs_gtp2_tlv_desc_sgi_ptp_tunnel_address_0,
-        &ogs_gtp2_tlv_desc_pgw_change_info_0,
-        &ogs_gtp2_tlv_desc_fqdn_3,
-        &ogs_gtp2_tlv_desc_ip_address_1,
-        &ogs_gtp2_tlv_desc_up_security_policy_0,
-    NULL,
-}};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_modify_bearer_request =
+        &ogs_gtp2_tlv_desc_bearer_context,
+        &ogs_gtp2_tlv_desc_recovery,
+        &ogs_gtp2_tlv_desc_fqdn,
+        &ogs_gtp2_tlv_desc_ip_address,
+        &ogs_gtp2_tlv_desc_fq_csid,
+        &ogs_gtp2_tlv_desc_fq_csid,
+        &ogs_gtp2_tlv_desc_ldn,
+        &ogs_gtp2_tlv_desc_ldn,
+        &ogs_gtp2_tlv_desc_epc_timer,
+        &ogs_gtp2_tlv_desc_apco,
+        &ogs_gtp2_tlv_desc_ip4cp,
+        &ogs_gtp2_tlv_desc_indication,
+        &ogs_gtp2_tlv_desc_presence_reporting_area_action,
+        &ogs_gtp2_tlv_desc_load_control_information,
+        &ogs_gtp2_tlv_desc_load_control_information,
+        &ogs_gtp2_tlv_desc_load_control_information,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_f_container,
+        &ogs_gtp2_tlv_desc_charging_id,
+        &ogs_gtp2_tlv_desc_epco,
+        &ogs_gtp2_tlv_desc_fqdn,
+        &ogs_gtp2_tlv_desc_sgi_ptp_tunnel_address,
+        &ogs_gtp2_tlv_desc_pgw_change_info,
+        &ogs_gtp2_tlv_desc_fqdn,
+        &ogs_gtp2_tlv_desc_ip_address,
+        &ogs_gtp2_tlv_desc_up_security_policy,
+    NULL,
+}, &ogs_gtp2_msg_index_create_session_response, ogs_gtp2_msg_instance_create_session_response};
+
+static const ogs_tlv_desc_slot_t ogs_gtp2_msg_index_modify_bearer_request_slot[128] = {
+    [0] = { 0, 0, 0, 10, 9,
+        offsetof(ogs_gtp2_modify_bearer_request_t, bearer_contexts_to_be_modified) + sizeof(ogs_gtp2_tlv_bearer_context_t) },
+    [2] = { OGS_GTP2_RAT_TYPE_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp2_modify_bearer_request_t, rat_type) },
+    [6] = { OGS_GTP2_LDN_TYPE, 1, 0, 20, 19,
+        offsetof(ogs_gtp2_modify_bearer_request_t, sgw_ldn) },
+    [8] = { OGS_GTP2_AMBR_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_gtp2_modify_bearer_request_t, aggregate_maximum_bit_rate) },
+    [11] = { OGS_GTP2_RECOVERY_TYPE, 0, 0, 12, 11,
+        offsetof(ogs_gtp2_modify_bearer_request_t, recovery) },
+    [19] = { OGS_GTP2_MEI_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp2_modify_bearer_request_t, me_identity) },
+    [20] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 0, 0, 26, 25,
+        offsetof(ogs_gtp2_modify_bearer_request_t, mme_s4_sgsn_s_overload_control_information) },
+    [27] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 1, 0, 27, 26,
+        offsetof(ogs_gtp2_modify_bearer_request_t, sgw_s_overload_control_information) },
+    [34] = { OGS_GTP2_UE_TIME_ZONE_TYPE, 0, 0, 13, 12,
+        offsetof(ogs_gtp2_modify_bearer_request_t, ue_time_zone) },
+    [35] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 2, 0, 28, 27,
+        offsetof(ogs_gtp2_modify_bearer_request_t, epdg_s_overload_control_information) },
+    [37] = { OGS_GTP2_CN_OPERATOR_SELECTION_ENTITY_TYPE, 0, 0, 24, 23,
+        offsetof(ogs_gtp2_modify_bearer_request_t, cn_operator_selection_entity) },
+    [47] = { OGS_GTP2_COUNTER_TYPE, 0, 0, 30, 29,
+        offsetof(ogs_gtp2_modify_bearer_request_t, mo_exception_data_counter) },
+    [58] = { OGS_GTP2_IP_ADDRESS_TYPE, 0, 0, 21, 20,
+        offsetof(ogs_gtp2_modify_bearer_request_t, hnb_local_ip_address) },
+    [59] = { OGS_GTP2_TWAN_IDENTIFIER_TIMESTAMP_TYPE, 0, 0, 34, 33,
+        offsetof(ogs_gtp2_modify_bearer_request_t, wlan_location_timestamp) },
+    [63] = { OGS_GTP2_F_TEID_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_gtp2_modify_bearer_request_t, sender_f_teid_for_control_plane) },
+    [65] = { OGS_GTP2_IP_ADDRESS_TYPE, 1, 0, 17, 16,
+        offsetof(ogs_gtp2_modify_bearer_request_t, ue_local_ip_address) },
+    [66] = { OGS_GTP2_TWAN_IDENTIFIER_TYPE, 0, 0, 33, 32,
+        offsetof(ogs_gtp2_modify_bearer_request_t, wlan_location_information) },
+    [69] = { OGS_GTP2_INDICATION_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp2_modify_bearer_request_t, indication_flags) },
+    [72] = { OGS_GTP2_IP_ADDRESS_TYPE, 2, 0, 23, 22,
+        offsetof(ogs_gtp2_modify_bearer_request_t, mme_s4_sgsn_identifier) },
+    [78] = { OGS_GTP2_PORT_NUMBER_TYPE, 0, 0, 22, 21,
+        offsetof(ogs_gtp2_modify_bearer_request_t, hnb_udp_port) },
+    [85] = { OGS_GTP2_BEARER_CONTEXT_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_gtp2_modify_bearer_request_t, bearer_contexts_to_be_modified) },
+    [86] = { OGS_GTP2_PORT_NUMBER_TYPE, 1, 0, 18, 17,
+        offsetof(ogs_gtp2_modify_bearer_request_t, ue_udp_port) },
+    [87] = { OGS_GTP2_SERVING_PLMN_RATE_CONTROL_TYPE, 0, 0, 29, 28,
+        offsetof(ogs_gtp2_modify_bearer_request_t, serving_plmn_rate_control) },
+    [89] = { OGS_GTP2_IMSI_TYPE, 0, 0, 31, 30,
+        offsetof(ogs_gtp2_modify_bearer_request_t, imsi) },
+    [91] = { OGS_GTP2_SERVING_NETWORK_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp2_modify_bearer_request_t, serving_network) },
+    [92] = { OGS_GTP2_BEARER_CONTEXT_TYPE, 1, 0, 11, 10,
+        offsetof(ogs_gtp2_modify_bearer_request_t, bearer_contexts_to_be_removed) },
+    [97] = { OGS_GTP2_SECONDARY_RAT_USAGE_DATA_REPORT_TYPE, 0, 0, 35, 34,
+        offsetof(ogs_gtp2_modify_bearer_request_t, secondary_rat_usage_data_report) },
+    [98] = { OGS_GTP2_PRESENCE_REPORTING_AREA_INFORMATION_TYPE, 0, 0, 25, 24,
+        offsetof(ogs_gtp2_modify_bearer_request_t, presence_reporting_area_information) },
+    [100] = { OGS_GTP2_FQ_CSID_TYPE, 0, 0, 14, 13,
+        offsetof(ogs_gtp2_modify_bearer_request_t, mme_fq_csid) },
+    [102] = { OGS_GTP2_ULI_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp2_modify_bearer_request_t, user_location_information) },
+    [105] = { OGS_GTP2_UCI_TYPE, 0, 0, 16, 15,
+        offsetof(ogs_gtp2_modify_bearer_request_t, user_csg_information) },
+    [107] = { OGS_GTP2_FQ_CSID_TYPE, 1, 0, 15, 14,
+        offsetof(ogs_gtp2_modify_bearer_request_t, sgw_fq_csid) },
+    [109] = { OGS_GTP2_ULI_TYPE, 1, 0, 32, 31,
+        offsetof(ogs_gtp2_modify_bearer_request_t, user_location_information_for_sgw) },
+    [113] = { OGS_GTP2_PSCELL_ID_TYPE, 0, 0, 36, 35,
+        offsetof(ogs_gtp2_modify_bearer_request_t, pscell_id) },
+    [124] = { OGS_GTP2_DELAY_VALUE_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_gtp2_modify_bearer_request_t, delay_downlink_packet_notification_request) },
+    [127] = { OGS_GTP2_LDN_TYPE, 0, 0, 19, 18,
+        offsetof(ogs_gtp2_modify_bearer_request_t, mme_s4_sgsn_ldn) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp2_msg_index_modify_bearer_request = {
+    127, 36, ogs_gtp2_msg_index_modify_bearer_request_slot };
+
+static const uint8_t ogs_gtp2_msg_instance_modify_bearer_request[36] = {
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0,
+    1, 1, 0, 1, 0, 0, 2, 0, 0, 0, 1, 2, 0, 0, 0, 1,
+    0, 0, 0, 0,
+};
+
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_modify_bearer_request =
 {
     OGS_TLV_MESSAGE,
     "Modify Bearer Request",
     0, 0, 0, 0, {
-        &ogs_gtp2_tlv_desc_mei_0,
-        &ogs_gtp2_tlv_desc_uli_0,
-        &ogs_gtp2_tlv_desc_serving_network_0,
-        &ogs_gtp2_tlv_desc_rat_type_0,
-        &ogs_gtp2_tlv_desc_indication_0,
-        &ogs_gtp2_tlv_desc_f_teid_0,
-        &ogs_gtp2_tlv_desc_ambr_0,
-        &ogs_gtp2_tlv_desc_delay_value_0,
-        &ogs_gtp2_tlv_desc_bearer_context_0,
+        &ogs_gtp2_tlv_desc_mei,
+        &ogs_gtp2_tlv_desc_uli,
+        &ogs_gtp2_tlv_desc_serving_network,
+        &ogs_gtp2_tlv_desc_rat_type,
+        &ogs_gtp2_tlv_desc_indication,
+        &ogs_gtp2_tlv_desc_f_teid,
+        &ogs_gtp2_tlv_desc_ambr,
+        &ogs_gtp2_tlv_desc_delay_value,
+        &ogs_gtp2_tlv_desc_bearer_context,
         &ogs_tlv_desc_more8,
-        &ogs_gtp2_tlv_desc_bearer_context_1,
-        &ogs_gtp2_tlv_desc_recovery_0,
-        &ogs_gtp2_tlv_desc_ue_time_zone_0,
-        &ogs_gtp2_tlv_desc_fq_csid_0,
-        &ogs_gtp2_tlv_desc_fq_csid_1,
-        &ogs_gtp2_tlv_desc_uci_0,
-        &ogs_gtp2_tlv_desc_ip_address_1,
-        &ogs_gtp2_tlv_desc_port_number_1,
-        &ogs_gtp2_tlv_desc_ldn_0,
-        &ogs_gtp2_tlv_desc_ldn_1,
-        &ogs_gtp2_tlv_desc_ip_address_0,
-        &ogs_gtp2_tlv_desc_port_number_0,
-        &ogs_gtp2_tlv_desc_ip_address_2,
-        &ogs_gtp2_tlv_desc_cn_operator_selection_entity_0,
-        &ogs_gtp2_tlv_desc_presence_reporting_area_information_0,
-        &ogs_gtp2_tlv_desc_overload_control_information_0,
-        &ogs_gtp2_tlv_desc_overload_control_information_1,
-        &ogs_gtp2_tlv_desc_overload_control_information_2,
-        &ogs_gtp2_tlv_desc_serving_plmn_rate_control_0,
-        &ogs_gtp2_tlv_desc_counter_0,
-        &ogs_gtp2_tlv_desc_imsi_0,
-        &ogs_gtp2_tlv_desc_uli_1,
-        &ogs_gtp2_tlv_desc_twan_identifier_0,
-        &ogs_gtp2_tlv_desc_twan_identifier_timestamp_0,
-        &ogs_gtp2_tlv_desc_secondary_rat_usage_data_report_0,
-        &ogs_gtp2_tlv_desc_pscell_id_0,
-    NULL,
-}};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_modify_bearer_response =
+        &ogs_gtp2_tlv_desc_bearer_context,
+        &ogs_gtp2_tlv_desc_recovery,
+        &ogs_gtp2_tlv_desc_ue_time_zone,
+        &ogs_gtp2_tlv_desc_fq_csid,
+        &ogs_gtp2_tlv_desc_fq_csid,
+        &ogs_gtp2_tlv_desc_uci,
+        &ogs_gtp2_tlv_desc_ip_address,
+        &ogs_gtp2_tlv_desc_port_number,
+        &ogs_gtp2_tlv_desc_ldn,
+        &ogs_gtp2_tlv_desc_ldn,
+        &ogs_gtp2_tlv_desc_ip_address,
+        &ogs_gtp2_tlv_desc_port_number,
+        &ogs_gtp2_tlv_desc_ip_address,
+        &ogs_gtp2_tlv_desc_cn_operator_selection_entity,
+        &ogs_gtp2_tlv_desc_presence_reporting_area_information,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_serving_plmn_rate_control,
+        &ogs_gtp2_tlv_desc_counter,
+        &ogs_gtp2_tlv_desc_imsi,
+        &ogs_gtp2_tlv_desc_uli,
+        &ogs_gtp2_tlv_desc_twan_identifier,
+        &ogs_gtp2_tlv_desc_twan_identifier_timestamp,
+        &ogs_gtp2_tlv_desc_secondary_rat_usage_data_report,
+        &ogs_gtp2_tlv_desc_pscell_id,
+    NULL,
+}, &ogs_gtp2_msg_index_modify_bearer_request, ogs_gtp2_msg_instance_modify_bearer_request};
+
+static const ogs_tlv_desc_slot_t ogs_gtp2_msg_index_modify_bearer_response_slot[64] = {
+    [0] = { 0, 0, 0, 7, 6,
+        offsetof(ogs_gtp2_modify_bearer_response_t, bearer_contexts_modified) + sizeof(ogs_gtp2_tlv_bearer_context_t) },
+    [2] = { OGS_GTP2_CSG_INFORMATION_REPORTING_ACTION_TYPE, 0, 0, 10, 9,
+        offsetof(ogs_gtp2_modify_bearer_response_t, csg_information_reporting_action) },
+    [5] = { OGS_GTP2_INDICATION_TYPE, 0, 0, 19, 18,
+        offsetof(ogs_gtp2_modify_bearer_response_t, indication_flags) },
+    [6] = { OGS_GTP2_LDN_TYPE, 1, 0, 18, 17,
+        offsetof(ogs_gtp2_modify_bearer_response_t, pgw_ldn) },
+    [8] = { OGS_GTP2_FQDN_TYPE, 0, 0, 12, 11,
+        offsetof(ogs_gtp2_modify_bearer_response_t, charging_gateway_name) },
+    [9] = { OGS_GTP2_PRESENCE_REPORTING_AREA_ACTION_TYPE, 0, 0, 20, 19,
+        offsetof(ogs_gtp2_modify_bearer_response_t, presence_reporting_area_action) },
+    [11] = { OGS_GTP2_CHANGE_REPORTING_ACTION_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_gtp2_modify_bearer_response_t, change_reporting_action) },
+    [12] = { OGS_GTP2_RECOVERY_TYPE, 0, 0, 16, 15,
+        offsetof(ogs_gtp2_modify_bearer_response_t, recovery) },
+    [20] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 0, 0, 24, 23,
+        offsetof(ogs_gtp2_modify_bearer_response_t, pgw_s_overload_control_information) },
+    [21] = { OGS_GTP2_BEARER_CONTEXT_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_gtp2_modify_bearer_response_t, bearer_contexts_modified) },
+    [27] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 1, 0, 25, 24,
+        offsetof(ogs_gtp2_modify_bearer_response_t, sgw_s_overload_control_information) },
+    [28] = { OGS_GTP2_BEARER_CONTEXT_TYPE, 1, 0, 8, 7,
+        offsetof(ogs_gtp2_modify_bearer_response_t, bearer_contexts_marked_for_removal) },
+    [29] = { OGS_GTP2_ENB_INFORMATION_REPORTING_TYPE, 0, 0, 11, 10,
+        offsetof(ogs_gtp2_modify_bearer_response_t, hnb_information_reporting) },
+    [30] = { OGS_GTP2_PCO_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp2_modify_bearer_response_t, protocol_configuration_options) },
+    [33] = { OGS_GTP2_EBI_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp2_modify_bearer_response_t, linked_eps_bearer_id) },
+    [36] = { OGS_GTP2_FQ_CSID_TYPE, 0, 0, 14, 13,
+        offsetof(ogs_gtp2_modify_bearer_response_t, pgw_fq_csid) },
+    [38] = { OGS_GTP2_PGW_CHANGE_INFO_TYPE, 0, 0, 27, 26,
+        offsetof(ogs_gtp2_modify_bearer_response_t, pgw_change_info) },
+    [39] = { OGS_GTP2_APN_RESTRICTION_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp2_modify_bearer_response_t, apn_restriction) },
+    [43] = { OGS_GTP2_FQ_CSID_TYPE, 1, 0, 15, 14,
+        offsetof(ogs_gtp2_modify_bearer_response_t, sgw_fq_csid) },
+    [44] = { OGS_GTP2_MSISDN_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp2_modify_bearer_response_t, msisdn) },
+    [45] = { OGS_GTP2_LOAD_CONTROL_INFORMATION_TYPE, 0, 0, 21, 20,
+        offsetof(ogs_gtp2_modify_bearer_response_t, pgw_s_node_level_load_control_information) },
+    [46] = { OGS_GTP2_CHARGING_ID_TYPE, 0, 0, 26, 25,
+        offsetof(ogs_gtp2_modify_bearer_response_t, pdn_connection_charging_id) },
+    [50] = { OGS_GTP2_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp2_modify_bearer_response_t, cause) },
+    [52] = { OGS_GTP2_LOAD_CONTROL_INFORMATION_TYPE, 1, 0, 22, 21,
+        offsetof(ogs_gtp2_modify_bearer_response_t, pgw_s_apn_level_load_control_information) },
+    [58] = { OGS_GTP2_IP_ADDRESS_TYPE, 0, 0, 13, 12,
+        offsetof(ogs_gtp2_modify_bearer_response_t, charging_gateway_address) },
+    [59] = { OGS_GTP2_LOAD_CONTROL_INFORMATION_TYPE, 2, 0, 23, 22,
+        offsetof(ogs_gtp2_modify_bearer_response_t, sgw_s_node_level_load_control_information) },
+    [63] = { OGS_GTP2_LDN_TYPE, 0, 0, 17, 16,
+        offsetof(ogs_gtp2_modify_bearer_response_t, sgw_ldn) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp2_msg_index_modify_bearer_response = {
+    63, 27, ogs_gtp2_msg_index_modify_bearer_response_slot };
+
+static const uint8_t ogs_gtp2_msg_instance_modify_bearer_response[27] = {
+    0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1, 0,
+    0, 1, 0, 0, 0, 1, 2, 0, 1, 0, 0,
+};
+
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_modify_bearer_response =
 {
     OGS_TLV_MESSAGE,
     "Modify Bearer Response",
     0, 0, 0, 0, {
-        &ogs_gtp2_tlv_desc_cause_0,
-        &ogs_gtp2_tlv_desc_msisdn_0,
-        &ogs_gtp2_tlv_desc_ebi_0,
-        &ogs_gtp2_tlv_desc_apn_restriction_0,
-        &ogs_gtp2_tlv_desc_pco_0,
-        &ogs_gtp2_tlv_desc_bearer_context_0,
+        &ogs_gtp2_tlv_desc_cause,
+        &ogs_gtp2_tlv_desc_msisdn,
+        &ogs_gtp2_tlv_desc_ebi,
+        &ogs_gtp2_tlv_desc_apn_restriction,
+        &ogs_gtp2_tlv_desc_pco,
+        &ogs_gtp2_tlv_desc_bearer_context,
         &ogs_tlv_desc_more8,
-        &ogs_gtp2_tlv_desc_bearer_context_1,
-        &ogs_gtp2_tlv_desc_change_reporting_action_0,
-        &ogs_gtp2_tlv_desc_csg_information_reporting_action_0,
-        &ogs_gtp2_tlv_desc_enb_information_reporting_0,
-        &ogs_gtp2_tlv_desc_fqdn_0,
-        &ogs_gtp2_tlv_desc_ip_address_0,
-        &ogs_gtp2_tlv_desc_fq_csid_0,
-        &ogs_gtp2_tlv_desc_fq_csid_1,
-        &ogs_gtp2_tlv_desc_recovery_0,
-        &ogs_gtp2_tlv_desc_ldn_0,
-        &ogs_gtp2_tlv_desc_ldn_1,
-        &ogs_gtp2_tlv_desc_indication_0,
-        &ogs_gtp2_tlv_desc_presence_reporting_area_action_0,
-        &ogs_gtp2_tlv_desc_load_control_information_0,
-        &ogs_gtp2_tlv_desc_load_control_information_1,
-        &ogs_gtp2_tlv_desc_load_control_information_2,
-        &ogs_gtp2_tlv_desc_overload_control_information_0,
-        &ogs_gtp2_tlv_desc_overload_control_information_1,
-        &ogs_gtp2_tlv_desc_charging_id_0,
-        &ogs_gtp2_tlv_desc_pgw_change_info_0,
-    NULL,
-}};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_delete_session_request =
+        &ogs_gtp2_tlv_desc_bearer_context,
+        &ogs_gtp2_tlv_desc_change_reporting_action,
+        &ogs_gtp2_tlv_desc_csg_information_reporting_action,
+        &ogs_gtp2_tlv_desc_enb_information_reporting,
+        &ogs_gtp2_tlv_desc_fqdn,
+        &ogs_gtp2_tlv_desc_ip_address,
+        &ogs_gtp2_tlv_desc_fq_csid,
+        &ogs_gtp2_tlv_desc_fq_csid,
+        &ogs_gtp2_tlv_desc_recovery,
+        &ogs_gtp2_tlv_desc_ldn,
+        &ogs_gtp2_tlv_desc_ldn,
+        &ogs_gtp2_tlv_desc_indication,
+        &ogs_gtp2_tlv_desc_presence_reporting_area_action,
+        &ogs_gtp2_tlv_desc_load_control_information,
+        &ogs_gtp2_tlv_desc_load_control_information,
+        &ogs_gtp2_tlv_desc_load_control_information,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_charging_id,
+        &ogs_gtp2_tlv_desc_pgw_change_info,
+    NULL,
+}, &ogs_gtp2_msg_index_modify_bearer_response, ogs_gtp2_msg_instance_modify_bearer_response};
+
+static const ogs_tlv_desc_slot_t ogs_gtp2_msg_index_delete_session_request_slot[64] = {
+    [1] = { OGS_GTP2_TWAN_IDENTIFIER_TYPE, 0, 0, 11, 10,
+        offsetof(ogs_gtp2_delete_session_request_t, twan_identifier) },
+    [2] = { OGS_GTP2_TWAN_IDENTIFIER_TIMESTAMP_TYPE, 1, 0, 17, 16,
+        offsetof(ogs_gtp2_delete_session_request_t, wlan_location_timestamp) },
+    [5] = { OGS_GTP2_INDICATION_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp2_delete_session_request_t, indication_flags) },
+    [8] = { OGS_GTP2_TWAN_IDENTIFIER_TYPE, 1, 0, 16, 15,
+        offsetof(ogs_gtp2_delete_session_request_t, wlan_location_information) },
+    [12] = { OGS_GTP2_RAN_NAS_CAUSE_TYPE, 0, 0, 10, 9,
+        offsetof(ogs_gtp2_delete_session_request_t, ran_nas_release_cause) },
+    [14] = { OGS_GTP2_PORT_NUMBER_TYPE, 0, 0, 19, 18,
+        offsetof(ogs_gtp2_delete_session_request_t, ue_udp_port) },
+    [20] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 0, 0, 13, 12,
+        offsetof(ogs_gtp2_delete_session_request_t, mme_s4_sgsn_s_overload_control_information) },
+    [21] = { OGS_GTP2_PORT_NUMBER_TYPE, 1, 0, 21, 20,
+        offsetof(ogs_gtp2_delete_session_request_t, ue_tcp_port) },
+    [26] = { OGS_GTP2_ULI_TIMESTAMP_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_gtp2_delete_session_request_t, uli_timestamp) },
+    [27] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 1, 0, 14, 13,
+        offsetof(ogs_gtp2_delete_session_request_t, sgw_s_overload_control_information) },
+    [30] = { OGS_GTP2_PCO_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp2_delete_session_request_t, protocol_configuration_options) },
+    [33] = { OGS_GTP2_EBI_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp2_delete_session_request_t, linked_eps_bearer_id) },
+    [34] = { OGS_GTP2_UE_TIME_ZONE_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_gtp2_delete_session_request_t, ue_time_zone) },
+    [35] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 2, 0, 15, 14,
+        offsetof(ogs_gtp2_delete_session_request_t, twan_epdg_s_overload_control_information) },
+    [36] = { OGS_GTP2_SECONDARY_RAT_USAGE_DATA_REPORT_TYPE, 0, 0, 22, 21,
+        offsetof(ogs_gtp2_delete_session_request_t, secondary_rat_usage_data_report) },
+    [38] = { OGS_GTP2_ULI_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp2_delete_session_request_t, user_location_information) },
+    [47] = { OGS_GTP2_NODE_TYPE_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_gtp2_delete_session_request_t, originating_node) },
+    [49] = { OGS_GTP2_PSCELL_ID_TYPE, 0, 0, 23, 22,
+        offsetof(ogs_gtp2_delete_session_request_t, pscell_id) },
+    [50] = { OGS_GTP2_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp2_delete_session_request_t, cause) },
+    [58] = { OGS_GTP2_IP_ADDRESS_TYPE, 0, 0, 18, 17,
+        offsetof(ogs_gtp2_delete_session_request_t, ue_local_ip_address) },
+    [59] = { OGS_GTP2_TWAN_IDENTIFIER_TIMESTAMP_TYPE, 0, 0, 12, 11,
+        offsetof(ogs_gtp2_delete_session_request_t, twan_identifier_timestamp) },
+    [61] = { OGS_GTP2_EPCO_TYPE, 0, 0, 20, 19,
+        offsetof(ogs_gtp2_delete_session_request_t, extended_protocol_configuration_options) },
+    [63] = { OGS_GTP2_F_TEID_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_gtp2_delete_session_request_t, sender_f_teid_for_control_plane) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp2_msg_index_delete_session_request = {
+    63, 23, ogs_gtp2_msg_index_delete_session_request_slot };
+
+static const uint8_t ogs_gtp2_msg_instance_delete_session_request[23] = {
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 2, 1,
+    1, 0, 0, 0, 1, 0, 0,
+};
+
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_delete_session_request =
 {
     OGS_TLV_MESSAGE,
     "Delete Session Request",
     0, 0, 0, 0, {
-        &ogs_gtp2_tlv_desc_cause_0,
-        &ogs_gtp2_tlv_desc_ebi_0,
-        &ogs_gtp2_tlv_desc_uli_0,
-        &ogs_gtp2_tlv_desc_indication_0,
-        &ogs_gtp2_tlv_desc_pco_0,
-        &ogs_gtp2_tlv_desc_node_type_0,
-        &ogs_gtp2_tlv_desc_f_teid_0,
-        &ogs_gtp2_tlv_desc_ue_time_zone_0,
-        &ogs_gtp2_tlv_desc_uli_timestamp_0,
-        &ogs_gtp2_tlv_desc_ran_nas_cause_0,
-        &ogs_gtp2_tlv_desc_twan_identifier_0,
-        &ogs_gtp2_tlv_desc_twan_identifier_timestamp_0,
-        &ogs_gtp2_tlv_desc_overload_control_information_0,
-        &ogs_gtp2_tlv_desc_overload_control_information_1,
-        &ogs_gtp2_tlv_desc_overload_control_information_2,
-        &ogs_gtp2_tlv_desc_twan_identifier_1,
-        &ogs_gtp2_tlv_desc_twan_identifier_timestamp_1,
-        &ogs_gtp2_tlv_desc_ip_address_0,
-        &ogs_gtp2_tlv_desc_port_number_0,
-        &ogs_gtp2_tlv_desc_epco_0,
-        &ogs_gtp2_tlv_desc_port_number_1,
-        &ogs_gtp2_tlv_desc_secondary_rat_usage_data_report_0,
-        &ogs_gtp2_tlv_desc_pscell_id_0,
-    NULL,
-}};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_delete_session_response =
+        &ogs_gtp2_tlv_desc_cause,
+        &ogs_gtp2_tlv_desc_ebi,
+        &ogs_gtp2_tlv_desc_uli,
+        &ogs_gtp2_tlv_desc_indication,
+        &ogs_gtp2_tlv_desc_pco,
+        &ogs_gtp2_tlv_desc_node_type,
+        &ogs_gtp2_tlv_desc_f_teid,
+        &ogs_gtp2_tlv_desc_ue_time_zone,
+        &ogs_gtp2_tlv_desc_uli_timestamp,
+        &ogs_gtp2_tlv_desc_ran_nas_cause,
+        &ogs_gtp2_tlv_desc_twan_identifier,
+        &ogs_gtp2_tlv_desc_twan_identifier_timestamp,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_twan_identifier,
+        &ogs_gtp2_tlv_desc_twan_identifier_timestamp,
+        &ogs_gtp2_tlv_desc_ip_address,
+        &ogs_gtp2_tlv_desc_port_number,
+        &ogs_gtp2_tlv_desc_epco,
+        &ogs_gtp2_tlv_desc_port_number,
+        &ogs_gtp2_tlv_desc_secondary_rat_usage_data_report,
+        &ogs_gtp2_tlv_desc_pscell_id,
+    NULL,
+}, &ogs_gtp2_msg_index_delete_session_request, ogs_gtp2_msg_instance_delete_session_request};
+
+static const ogs_tlv_desc_slot_t ogs_gtp2_msg_index_delete_session_response_slot[32] = {
+    [5] = { OGS_GTP2_INDICATION_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp2_delete_session_response_t, indication_flags) },
+    [11] = { OGS_GTP2_RECOVERY_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp2_delete_session_response_t, recovery) },
+    [12] = { OGS_GTP2_APN_RATE_CONTROL_STATUS_TYPE, 0, 0, 11, 10,
+        offsetof(ogs_gtp2_delete_session_response_t, apn_rate_control_status) },
+    [13] = { OGS_GTP2_LOAD_CONTROL_INFORMATION_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp2_delete_session_response_t, pgw_s_node_level_load_control_information) },
+    [18] = { OGS_GTP2_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp2_delete_session_response_t, cause) },
+    [20] = { OGS_GTP2_LOAD_CONTROL_INFORMATION_TYPE, 1, 0, 6, 5,
+        offsetof(ogs_gtp2_delete_session_response_t, pgw_s_apn_level_load_control_information) },
+    [21] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_gtp2_delete_session_response_t, pgw_s_overload_control_information) },
+    [27] = { OGS_GTP2_LOAD_CONTROL_INFORMATION_TYPE, 2, 0, 7, 6,
+        offsetof(ogs_gtp2_delete_session_response_t, sgw_s_node_level_load_control_information) },
+    [28] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 1, 0, 9, 8,
+        offsetof(ogs_gtp2_delete_session_response_t, sgw_s_overload_control_information) },
+    [29] = { OGS_GTP2_EPCO_TYPE, 0, 0, 10, 9,
+        offsetof(ogs_gtp2_delete_session_response_t, extended_protocol_configuration_options) },
+    [30] = { OGS_GTP2_PCO_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp2_delete_session_response_t, protocol_configuration_options) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp2_msg_index_delete_session_response = {
+    31, 11, ogs_gtp2_msg_index_delete_session_response_slot };
+
+static const uint8_t ogs_gtp2_msg_instance_delete_session_response[11] = {
+    0, 0, 0, 0, 0, 1, 2, 0, 1, 0, 0,
+};
+
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_delete_session_response =
 {
     OGS_TLV_MESSAGE,
     "Delete Session Response",
     0, 0, 0, 0, {
-        &ogs_gtp2_tlv_desc_cause_0,
-        &ogs_gtp2_tlv_desc_recovery_0,
-        &ogs_gtp2_tlv_desc_pco_0,
-        &ogs_gtp2_tlv_desc_indication_0,
-        &ogs_gtp2_tlv_desc_load_control_information_0,
-        &ogs_gtp2_tlv_desc_load_control_information_1,
-        &ogs_gtp2_tlv_desc_load_control_information_2,
-        &ogs_gtp2_tlv_desc_overload_control_information_0,
-        &ogs_gtp2_tlv_desc_overload_control_information_1,
-        &ogs_gtp2_tlv_desc_epco_0,
-        &ogs_gtp2_tlv_desc_apn_rate_control_status_0,
-    NULL,
-}};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_modify_bearer_command =
+        &ogs_gtp2_tlv_desc_cause,
+        &ogs_gtp2_tlv_desc_recovery,
+        &ogs_gtp2_tlv_desc_pco,
+        &ogs_gtp2_tlv_desc_indication,
+        &ogs_gtp2_tlv_desc_load_control_information,
+        &ogs_gtp2_tlv_desc_load_control_information,
+        &ogs_gtp2_tlv_desc_load_control_information,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_epco,
+        &ogs_gtp2_tlv_desc_apn_rate_control_status,
+    NULL,
+}, &ogs_gtp2_msg_index_delete_session_response, ogs_gtp2_msg_instance_delete_session_response};
+
+static const ogs_tlv_desc_slot_t ogs_gtp2_msg_index_modify_bearer_command_slot[16] = {
+    [2] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 2, 0, 5, 4,
+        offsetof(ogs_gtp2_modify_bearer_command_t, twan_epdg_s_overload_control_information) },
+    [4] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp2_modify_bearer_command_t, mme_s4_sgsn_s_overload_control_information) },
+    [5] = { OGS_GTP2_BEARER_CONTEXT_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp2_modify_bearer_command_t, bearer_context) },
+    [8] = { OGS_GTP2_AMBR_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp2_modify_bearer_command_t, apn_aggregate_maximum_bit_rate) },
+    [11] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 1, 0, 4, 3,
+        offsetof(ogs_gtp2_modify_bearer_command_t, sgw_s_overload_control_information) },
+    [15] = { OGS_GTP2_F_TEID_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_gtp2_modify_bearer_command_t, sender_f_teid_for_control_plane) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp2_msg_index_modify_bearer_command = {
+    15, 6, ogs_gtp2_msg_index_modify_bearer_command_slot };
+
+static const uint8_t ogs_gtp2_msg_instance_modify_bearer_command[6] = {
+    0, 0, 0, 1, 2, 0,
+};
+
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_modify_bearer_command =
 {
     OGS_TLV_MESSAGE,
     "Modify Bearer Command",
     0, 0, 0, 0, {
-        &ogs_gtp2_tlv_desc_ambr_0,
-        &ogs_gtp2_tlv_desc_bearer_context_0,
-        &ogs_gtp2_tlv_desc_overload_control_information_0,
-        &ogs_gtp2_tlv_desc_overload_control_information_1,
-        &ogs_gtp2_tlv_desc_overload_control_information_2,
-        &ogs_gtp2_tlv_desc_f_teid_0,
+        &ogs_gtp2_tlv_desc_ambr,
+        &ogs_gtp2_tlv_desc_bearer_context,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_f_teid,
     NULL,
-}};
+}, &ogs_gtp2_msg_index_modify_bearer_command, ogs_gtp2_msg_instance_modify_bearer_command};
+
+static const ogs_tlv_desc_slot_t ogs_gtp2_msg_index_modify_bearer_failure_indication_slot[16] = {
+    [2] = { OGS_GTP2_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp2_modify_bearer_failure_indication_t, cause) },
+    [4] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp2_modify_bearer_failure_indication_t, pgw_s_overload_control_information) },
+    [5] = { OGS_GTP2_INDICATION_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp2_modify_bearer_failure_indication_t, indication_flags) },
+    [11] = { OGS_GTP2_RECOVERY_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp2_modify_bearer_failure_indication_t, recovery) },
+    [12] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 1, 0, 5, 4,
+        offsetof(ogs_gtp2_modify_bearer_failure_indication_t, sgw_s_overload_control_information) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp2_msg_index_modify_bearer_failure_indication = {
+    15, 5, ogs_gtp2_msg_index_modify_bearer_failure_indication_slot };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_modify_bearer_failure_indication =
+static const uint8_t ogs_gtp2_msg_instance_modify_bearer_failure_indication[5] = {
+    0, 0, 0, 0, 1,
+};
+
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_modify_bearer_failure_indication =
 {
     OGS_TLV_MESSAGE,
     "Modify Bearer Failure Indication",
     0, 0, 0, 0, {
-        &ogs_gtp2_tlv_desc_cause_0,
-        &ogs_gtp2_tlv_desc_recovery_0,
-        &ogs_gtp2_tlv_desc_indication_0,
-        &ogs_gtp2_tlv_desc_overload_control_information_0,
-        &ogs_gtp2_tlv_desc_overload_control_information_1,
+        &ogs_gtp2_tlv_desc_cause,
+        &ogs_gtp2_tlv_desc_recovery,
+        &ogs_gtp2_tlv_desc_indication,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_overload_control_information,
     NULL,
-}};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_delete_bearer_command =
+}, &ogs_gtp2_msg_index_modify_bearer_failure_indication, ogs_gtp2_msg_instance_modify_bearer_failure_indication};
+
+static const ogs_tlv_desc_slot_t ogs_gtp2_msg_index_delete_bearer_command_slot[32] = {
+    [1] = { OGS_GTP2_SECONDARY_RAT_USAGE_DATA_REPORT_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_gtp2_delete_bearer_command_t, secondary_rat_usage_data_report) },
+    [2] = { OGS_GTP2_UE_TIME_ZONE_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp2_delete_bearer_command_t, ue_time_zone) },
+    [6] = { OGS_GTP2_ULI_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp2_delete_bearer_command_t, user_location_information) },
+    [17] = { OGS_GTP2_PSCELL_ID_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_gtp2_delete_bearer_command_t, pscell_id) },
+    [20] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp2_delete_bearer_command_t, mme_s4_sgsn_s_overload_control_information) },
+    [21] = { OGS_GTP2_BEARER_CONTEXT_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp2_delete_bearer_command_t, bearer_contexts) },
+    [26] = { OGS_GTP2_ULI_TIMESTAMP_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp2_delete_bearer_command_t, uli_timestamp) },
+    [27] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 1, 0, 6, 5,
+        offsetof(ogs_gtp2_delete_bearer_command_t, sgw_s_overload_control_information) },
+    [31] = { OGS_GTP2_F_TEID_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_gtp2_delete_bearer_command_t, sender_f_teid_for_control_plane) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp2_msg_index_delete_bearer_command = {
+    31, 9, ogs_gtp2_msg_index_delete_bearer_command_slot };
+
+static const uint8_t ogs_gtp2_msg_instance_delete_bearer_command[9] = {
+    0, 0, 0, 0, 0, 1, 0, 0, 0,
+};
+
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_delete_bearer_command =
 {
     OGS_TLV_MESSAGE,
     "Delete Bearer Command",
     0, 0, 0, 0, {
-        &ogs_gtp2_tlv_desc_bearer_context_0,
-        &ogs_gtp2_tlv_desc_uli_0,
-        &ogs_gtp2_tlv_desc_uli_timestamp_0,
-        &ogs_gtp2_tlv_desc_ue_time_zone_0,
-        &ogs_gtp2_tlv_desc_overload_control_information_0,
-        &ogs_gtp2_tlv_desc_overload_control_information_1,
-        &ogs_gtp2_tlv_desc_f_teid_0,
-        &ogs_gtp2_tlv_desc_secondary_rat_usage_data_report_0,
-        &ogs_gtp2_tlv_desc_pscell_id_0,
+        &ogs_gtp2_tlv_desc_bearer_context,
+        &ogs_gtp2_tlv_desc_uli,
+        &ogs_gtp2_tlv_desc_uli_timestamp,
+        &ogs_gtp2_tlv_desc_ue_time_zone,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_f_teid,
+        &ogs_gtp2_tlv_desc_secondary_rat_usage_data_report,
+        &ogs_gtp2_tlv_desc_pscell_id,
     NULL,
-}};
+}, &ogs_gtp2_msg_index_delete_bearer_command, ogs_gtp2_msg_instance_delete_bearer_command};
+
+static const ogs_tlv_desc_slot_t ogs_gtp2_msg_index_delete_bearer_failure_indication_slot[16] = {
+    [2] = { OGS_GTP2_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp2_delete_bearer_failure_indication_t, cause) },
+    [4] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp2_delete_bearer_failure_indication_t, pgw_s_overload_control_information) },
+    [5] = { OGS_GTP2_BEARER_CONTEXT_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp2_delete_bearer_failure_indication_t, bearer_context) },
+    [6] = { OGS_GTP2_INDICATION_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp2_delete_bearer_failure_indication_t, indication_flags) },
+    [11] = { OGS_GTP2_RECOVERY_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp2_delete_bearer_failure_indication_t, recovery) },
+    [12] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 1, 0, 6, 5,
+        offsetof(ogs_gtp2_delete_bearer_failure_indication_t, sgw_s_overload_control_information) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp2_msg_index_delete_bearer_failure_indication = {
+    15, 6, ogs_gtp2_msg_index_delete_bearer_failure_indication_slot };
+
+static const uint8_t ogs_gtp2_msg_instance_delete_bearer_failure_indication[6] = {
+    0, 0, 0, 0, 0, 1,
+};
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_delete_bearer_failure_indication =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_delete_bearer_failure_indication =
 {
     OGS_TLV_MESSAGE,
     "Delete Bearer Failure Indication",
     0, 0, 0, 0, {
-        &ogs_gtp2_tlv_desc_cause_0,
-        &ogs_gtp2_tlv_desc_bearer_context_0,
-        &ogs_gtp2_tlv_desc_recovery_0,
-        &ogs_gtp2_tlv_desc_indication_0,
-        &ogs_gtp2_tlv_desc_overload_control_information_0,
-        &ogs_gtp2_tlv_desc_overload_control_information_1,
+        &ogs_gtp2_tlv_desc_cause,
+        &ogs_gtp2_tlv_desc_bearer_context,
+        &ogs_gtp2_tlv_desc_recovery,
+        &ogs_gtp2_tlv_desc_indication,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_overload_control_information,
     NULL,
-}};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_bearer_resource_command =
+}, &ogs_gtp2_msg_index_delete_bearer_failure_indication, ogs_gtp2_msg_instance_delete_bearer_failure_indication};
+
+static const ogs_tlv_desc_slot_t ogs_gtp2_msg_index_bearer_resource_command_slot[64] = {
+    [2] = { OGS_GTP2_RAT_TYPE_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp2_bearer_resource_command_t, rat_type) },
+    [4] = { OGS_GTP2_PTI_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp2_bearer_resource_command_t, procedure_transaction_id) },
+    [5] = { OGS_GTP2_INDICATION_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_gtp2_bearer_resource_command_t, indication_flags) },
+    [6] = { OGS_GTP2_F_TEID_TYPE, 1, 0, 11, 10,
+        offsetof(ogs_gtp2_bearer_resource_command_t, s12_rnc_f_teid) },
+    [7] = { OGS_GTP2_F_CONTAINER_TYPE, 0, 0, 16, 15,
+        offsetof(ogs_gtp2_bearer_resource_command_t, nbifom_container) },
+    [13] = { OGS_GTP2_TAD_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp2_bearer_resource_command_t, traffic_aggregate_description) },
+    [14] = { OGS_GTP2_F_TEID_TYPE, 2, 0, 18, 17,
+        offsetof(ogs_gtp2_bearer_resource_command_t, sender_f_teid_for_control_plane) },
+    [20] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 0, 0, 14, 13,
+        offsetof(ogs_gtp2_bearer_resource_command_t, mme_s4_sgsn_s_overload_control_information) },
+    [21] = { OGS_GTP2_SIGNALLING_PRIORITY_INDICATION_TYPE, 0, 0, 13, 12,
+        offsetof(ogs_gtp2_bearer_resource_command_t, signalling_priority_indication) },
+    [27] = { OGS_GTP2_SERVING_NETWORK_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_gtp2_bearer_resource_command_t, serving_network) },
+    [28] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 1, 0, 15, 14,
+        offsetof(ogs_gtp2_bearer_resource_command_t, sgw_s_overload_control_information) },
+    [30] = { OGS_GTP2_PCO_TYPE, 0, 0, 12, 11,
+        offsetof(ogs_gtp2_bearer_resource_command_t, protocol_configuration_options) },
+    [33] = { OGS_GTP2_EBI_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp2_bearer_resource_command_t, linked_eps_bearer_id) },
+    [38] = { OGS_GTP2_ULI_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_gtp2_bearer_resource_command_t, user_location_information) },
+    [40] = { OGS_GTP2_EBI_TYPE, 1, 0, 8, 7,
+        offsetof(ogs_gtp2_bearer_resource_command_t, eps_bearer_id) },
+    [41] = { OGS_GTP2_FLOW_QOS_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp2_bearer_resource_command_t, flow_quality_of_service) },
+    [49] = { OGS_GTP2_PSCELL_ID_TYPE, 0, 0, 19, 18,
+        offsetof(ogs_gtp2_bearer_resource_command_t, pscell_id) },
+    [61] = { OGS_GTP2_EPCO_TYPE, 0, 0, 17, 16,
+        offsetof(ogs_gtp2_bearer_resource_command_t, extended_protocol_configuration_options) },
+    [63] = { OGS_GTP2_F_TEID_TYPE, 0, 0, 10, 9,
+        offsetof(ogs_gtp2_bearer_resource_command_t, s4_u_sgsn_f_teid) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp2_msg_index_bearer_resource_command = {
+    63, 19, ogs_gtp2_msg_index_bearer_resource_command_slot };
+
+static const uint8_t ogs_gtp2_msg_instance_bearer_resource_command[19] = {
+    0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 1, 0,
+    0, 2, 0,
+};
+
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_bearer_resource_command =
 {
     OGS_TLV_MESSAGE,
     "Bearer Resource Command",
     0, 0, 0, 0, {
-        &ogs_gtp2_tlv_desc_ebi_0,
-        &ogs_gtp2_tlv_desc_pti_0,
-        &ogs_gtp2_tlv_desc_flow_qos_0,
-        &ogs_gtp2_tlv_desc_tad_0,
-        &ogs_gtp2_tlv_desc_rat_type_0,
-        &ogs_gtp2_tlv_desc_serving_network_0,
-        &ogs_gtp2_tlv_desc_uli_0,
-        &ogs_gtp2_tlv_desc_ebi_1,
-        &ogs_gtp2_tlv_desc_indication_0,
-        &ogs_gtp2_tlv_desc_f_teid_0,
-        &ogs_gtp2_tlv_desc_f_teid_1,
-        &ogs_gtp2_tlv_desc_pco_0,
-        &ogs_gtp2_tlv_desc_signalling_priority_indication_0,
-        &ogs_gtp2_tlv_desc_overload_control_information_0,
-        &ogs_gtp2_tlv_desc_overload_control_information_1,
-        &ogs_gtp2_tlv_desc_f_container_0,
-        &ogs_gtp2_tlv_desc_epco_0,
-        &ogs_gtp2_tlv_desc_f_teid_2,
-        &ogs_gtp2_tlv_desc_pscell_id_0,
-    NULL,
-}};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_bearer_resource_failure_indication =
+        &ogs_gtp2_tlv_desc_ebi,
+        &ogs_gtp2_tlv_desc_pti,
+        &ogs_gtp2_tlv_desc_flow_qos,
+        &ogs_gtp2_tlv_desc_tad,
+        &ogs_gtp2_tlv_desc_rat_type,
+        &ogs_gtp2_tlv_desc_serving_network,
+        &ogs_gtp2_tlv_desc_uli,
+        &ogs_gtp2_tlv_desc_ebi,
+        &ogs_gtp2_tlv_desc_indication,
+        &ogs_gtp2_tlv_desc_f_teid,
+        &ogs_gtp2_tlv_desc_f_teid,
+        &ogs_gtp2_tlv_desc_pco,
+        &ogs_gtp2_tlv_desc_signalling_priority_indication,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_f_container,
+        &ogs_gtp2_tlv_desc_epco,
+        &ogs_gtp2_tlv_desc_f_teid,
+        &ogs_gtp2_tlv_desc_pscell_id,
+    NULL,
+}, &ogs_gtp2_msg_index_bearer_resource_command, ogs_gtp2_msg_instance_bearer_resource_command};
+
+static const ogs_tlv_desc_slot_t ogs_gtp2_msg_index_bearer_resource_failure_indication_slot[16] = {
+    [1] = { OGS_GTP2_EBI_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp2_bearer_resource_failure_indication_t, linked_eps_bearer_id) },
+    [2] = { OGS_GTP2_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp2_bearer_resource_failure_indication_t, cause) },
+    [4] = { OGS_GTP2_PTI_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp2_bearer_resource_failure_indication_t, procedure_transaction_id) },
+    [5] = { OGS_GTP2_INDICATION_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp2_bearer_resource_failure_indication_t, indication_flags) },
+    [6] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp2_bearer_resource_failure_indication_t, pgw_s_overload_control_information) },
+    [7] = { OGS_GTP2_F_CONTAINER_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_gtp2_bearer_resource_failure_indication_t, nbifom_container) },
+    [11] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 1, 0, 6, 5,
+        offsetof(ogs_gtp2_bearer_resource_failure_indication_t, sgw_s_overload_control_information) },
+    [12] = { OGS_GTP2_RECOVERY_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_gtp2_bearer_resource_failure_indication_t, recovery) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp2_msg_index_bearer_resource_failure_indication = {
+    15, 8, ogs_gtp2_msg_index_bearer_resource_failure_indication_slot };
+
+static const uint8_t ogs_gtp2_msg_instance_bearer_resource_failure_indication[8] = {
+    0, 0, 0, 0, 0, 1, 0, 0,
+};
+
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_bearer_resource_failure_indication =
 {
     OGS_TLV_MESSAGE,
     "Bearer Resource Failure Indication",
     0, 0, 0, 0, {
-        &ogs_gtp2_tlv_desc_cause_0,
-        &ogs_gtp2_tlv_desc_ebi_0,
-        &ogs_gtp2_tlv_desc_pti_0,
-        &ogs_gtp2_tlv_desc_indication_0,
-        &ogs_gtp2_tlv_desc_overload_control_information_0,
-        &ogs_gtp2_tlv_desc_overload_control_information_1,
-        &ogs_gtp2_tlv_desc_recovery_0,
-        &ogs_gtp2_tlv_desc_f_container_0,
+        &ogs_gtp2_tlv_desc_cause,
+        &ogs_gtp2_tlv_desc_ebi,
+        &ogs_gtp2_tlv_desc_pti,
+        &ogs_gtp2_tlv_desc_indication,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_recovery,
+        &ogs_gtp2_tlv_desc_f_container,
     NULL,
-}};
+}, &ogs_gtp2_msg_index_bearer_resource_failure_indication, ogs_gtp2_msg_instance_bearer_resource_failure_indication};
+
+static const ogs_tlv_desc_slot_t ogs_gtp2_msg_index_downlink_data_notification_failure_indication_slot[8] = {
+    [1] = { OGS_GTP2_IMSI_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp2_downlink_data_notification_failure_indication_t, imsi) },
+    [2] = { OGS_GTP2_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp2_downlink_data_notification_failure_indication_t, cause) },
+    [7] = { OGS_GTP2_NODE_TYPE_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp2_downlink_data_notification_failure_indication_t, originating_node) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp2_msg_index_downlink_data_notification_failure_indication = {
+    7, 3, ogs_gtp2_msg_index_downlink_data_notification_failure_indication_slot };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_downlink_data_notification_failure_indication =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_downlink_data_notification_failure_indication =
 {
     OGS_TLV_MESSAGE,
     "Downlink Data Notification Failure Indication",
     0, 0, 0, 0, {
-        &ogs_gtp2_tlv_desc_cause_0,
-        &ogs_gtp2_tlv_desc_node_type_0,
-        &ogs_gtp2_tlv_desc_imsi_0,
+        &ogs_gtp2_tlv_desc_cause,
+        &ogs_gtp2_tlv_desc_node_type,
+        &ogs_gtp2_tlv_desc_imsi,
     NULL,
-}};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_create_bearer_request =
+}, &ogs_gtp2_msg_index_downlink_data_notification_failure_indication, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp2_msg_index_create_bearer_request_slot[64] = {
+    [2] = { OGS_GTP2_CSG_INFORMATION_REPORTING_ACTION_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_gtp2_create_bearer_request_t, csg_information_reporting_action) },
+    [4] = { OGS_GTP2_PTI_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp2_create_bearer_request_t, procedure_transaction_id) },
+    [5] = { OGS_GTP2_INDICATION_TYPE, 0, 0, 11, 10,
+        offsetof(ogs_gtp2_create_bearer_request_t, indication_flags) },
+    [6] = { OGS_GTP2_F_CONTAINER_TYPE, 0, 0, 17, 16,
+        offsetof(ogs_gtp2_create_bearer_request_t, nbifom_container) },
+    [9] = { OGS_GTP2_PRESENCE_REPORTING_AREA_ACTION_TYPE, 0, 0, 10, 9,
+        offsetof(ogs_gtp2_create_bearer_request_t, presence_reporting_area_action) },
+    [11] = { OGS_GTP2_CHANGE_REPORTING_ACTION_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_gtp2_create_bearer_request_t, change_reporting_action) },
+    [20] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 0, 0, 15, 14,
+        offsetof(ogs_gtp2_create_bearer_request_t, pgw_s_overload_control_information) },
+    [21] = { OGS_GTP2_BEARER_CONTEXT_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp2_create_bearer_request_t, bearer_contexts) },
+    [27] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 1, 0, 16, 15,
+        offsetof(ogs_gtp2_create_bearer_request_t, sgw_s_overload_control_information) },
+    [29] = { OGS_GTP2_ENB_INFORMATION_REPORTING_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_gtp2_create_bearer_request_t, hnb_information_reporting) },
+    [30] = { OGS_GTP2_PCO_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp2_create_bearer_request_t, protocol_configuration_options) },
+    [33] = { OGS_GTP2_EBI_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp2_create_bearer_request_t, linked_eps_bearer_id) },
+    [36] = { OGS_GTP2_FQ_CSID_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp2_create_bearer_request_t, pgw_fq_csid) },
+    [38] = { OGS_GTP2_PGW_CHANGE_INFO_TYPE, 0, 0, 18, 17,
+        offsetof(ogs_gtp2_create_bearer_request_t, pgw_change_info) },
+    [43] = { OGS_GTP2_FQ_CSID_TYPE, 1, 0, 6, 5,
+        offsetof(ogs_gtp2_create_bearer_request_t, sgw_fq_csid) },
+    [45] = { OGS_GTP2_LOAD_CONTROL_INFORMATION_TYPE, 0, 0, 12, 11,
+        offsetof(ogs_gtp2_create_bearer_request_t, pgw_s_node_level_load_control_information) },
+    [52] = { OGS_GTP2_LOAD_CONTROL_INFORMATION_TYPE, 1, 0, 13, 12,
+        offsetof(ogs_gtp2_create_bearer_request_t, pgw_s_apn_level_load_control_information) },
+    [59] = { OGS_GTP2_LOAD_CONTROL_INFORMATION_TYPE, 2, 0, 14, 13,
+        offsetof(ogs_gtp2_create_bearer_request_t, sgw_s_node_level_load_control_information) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp2_msg_index_create_bearer_request = {
+    63, 18, ogs_gtp2_msg_index_create_bearer_request_slot };
+
+static const uint8_t ogs_gtp2_msg_instance_create_bearer_request[18] = {
+    0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1, 2, 0, 1,
+    0, 0,
+};
+
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_create_bearer_request =
 {
     OGS_TLV_MESSAGE,
     "Create Bearer Request",
     0, 0, 0, 0, {
-        &ogs_gtp2_tlv_desc_pti_0,
-        &ogs_gtp2_tlv_desc_ebi_0,
-        &ogs_gtp2_tlv_desc_pco_0,
-        &ogs_gtp2_tlv_desc_bearer_context_0,
-        &ogs_gtp2_tlv_desc_fq_csid_0,
-        &ogs_gtp2_tlv_desc_fq_csid_1,
-        &ogs_gtp2_tlv_desc_change_reporting_action_0,
-        &ogs_gtp2_tlv_desc_csg_information_reporting_action_0,
-        &ogs_gtp2_tlv_desc_enb_information_reporting_0,
-        &ogs_gtp2_tlv_desc_presence_reporting_area_action_0,
-        &ogs_gtp2_tlv_desc_indication_0,
-        &ogs_gtp2_tlv_desc_load_control_information_0,
-        &ogs_gtp2_tlv_desc_load_control_information_1,
-        &ogs_gtp2_tlv_desc_load_control_information_2,
-        &ogs_gtp2_tlv_desc_overload_control_information_0,
-        &ogs_gtp2_tlv_desc_overload_control_information_1,
-        &ogs_gtp2_tlv_desc_f_container_0,
-        &ogs_gtp2_tlv_desc_pgw_change_info_0,
-    NULL,
-}};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_create_bearer_response =
+        &ogs_gtp2_tlv_desc_pti,
+        &ogs_gtp2_tlv_desc_ebi,
+        &ogs_gtp2_tlv_desc_pco,
+        &ogs_gtp2_tlv_desc_bearer_context,
+        &ogs_gtp2_tlv_desc_fq_csid,
+        &ogs_gtp2_tlv_desc_fq_csid,
+        &ogs_gtp2_tlv_desc_change_reporting_action,
+        &ogs_gtp2_tlv_desc_csg_information_reporting_action,
+        &ogs_gtp2_tlv_desc_enb_information_reporting,
+        &ogs_gtp2_tlv_desc_presence_reporting_area_action,
+        &ogs_gtp2_tlv_desc_indication,
+        &ogs_gtp2_tlv_desc_load_control_information,
+        &ogs_gtp2_tlv_desc_load_control_information,
+        &ogs_gtp2_tlv_desc_load_control_information,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_f_container,
+        &ogs_gtp2_tlv_desc_pgw_change_info,
+    NULL,
+}, &ogs_gtp2_msg_index_create_bearer_request, ogs_gtp2_msg_instance_create_bearer_request};
+
+static const ogs_tlv_desc_slot_t ogs_gtp2_msg_index_create_bearer_response_slot[64] = {
+    [1] = { OGS_GTP2_TWAN_IDENTIFIER_TYPE, 0, 0, 11, 10,
+        offsetof(ogs_gtp2_create_bearer_response_t, twan_identifier) },
+    [2] = { OGS_GTP2_TWAN_IDENTIFIER_TIMESTAMP_TYPE, 1, 0, 18, 17,
+        offsetof(ogs_gtp2_create_bearer_response_t, wlan_location_timestamp) },
+    [6] = { OGS_GTP2_F_CONTAINER_TYPE, 0, 0, 20, 19,
+        offsetof(ogs_gtp2_create_bearer_response_t, nbifom_container) },
+    [8] = { OGS_GTP2_TWAN_IDENTIFIER_TYPE, 1, 0, 17, 16,
+        offsetof(ogs_gtp2_create_bearer_response_t, wlan_location_information) },
+    [11] = { OGS_GTP2_RECOVERY_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp2_create_bearer_response_t, recovery) },
+    [14] = { OGS_GTP2_PORT_NUMBER_TYPE, 0, 0, 19, 18,
+        offsetof(ogs_gtp2_create_bearer_response_t, ue_udp_port) },
+    [20] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 0, 0, 12, 11,
+        offsetof(ogs_gtp2_create_bearer_response_t, mme_s4_sgsn_s_overload_control_information) },
+    [21] = { OGS_GTP2_BEARER_CONTEXT_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp2_create_bearer_response_t, bearer_contexts) },
+    [22] = { OGS_GTP2_PORT_NUMBER_TYPE, 1, 0, 21, 20,
+        offsetof(ogs_gtp2_create_bearer_response_t, ue_tcp_port) },
+    [27] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 1, 0, 13, 12,
+        offsetof(ogs_gtp2_create_bearer_response_t, sgw_s_overload_control_information) },
+    [30] = { OGS_GTP2_PCO_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_gtp2_create_bearer_response_t, protocol_configuration_options) },
+    [34] = { OGS_GTP2_UE_TIME_ZONE_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_gtp2_create_bearer_response_t, ue_time_zone) },
+    [35] = { OGS_GTP2_PRESENCE_REPORTING_AREA_INFORMATION_TYPE, 0, 0, 14, 13,
+        offsetof(ogs_gtp2_create_bearer_response_t, presence_reporting_area_information) },
+    [36] = { OGS_GTP2_FQ_CSID_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp2_create_bearer_response_t, mme_fq_csid) },
+    [37] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 2, 0, 16, 15,
+        offsetof(ogs_gtp2_create_bearer_response_t, twan_epdg_s_overload_control_information) },
+    [38] = { OGS_GTP2_ULI_TYPE, 0, 0, 10, 9,
+        offsetof(ogs_gtp2_create_bearer_response_t, user_location_information) },
+    [43] = { OGS_GTP2_FQ_CSID_TYPE, 1, 0, 5, 4,
+        offsetof(ogs_gtp2_create_bearer_response_t, sgw_fq_csid) },
+    [49] = { OGS_GTP2_PSCELL_ID_TYPE, 0, 0, 22, 21,
+        offsetof(ogs_gtp2_create_bearer_response_t, pscell_id) },
+    [50] = { OGS_GTP2_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp2_create_bearer_response_t, cause) },
+    [51] = { OGS_GTP2_FQ_CSID_TYPE, 2, 0, 6, 5,
+        offsetof(ogs_gtp2_create_bearer_response_t, epdg_fq_csid) },
+    [57] = { OGS_GTP2_FQ_CSID_TYPE, 3, 0, 7, 6,
+        offsetof(ogs_gtp2_create_bearer_response_t, twan_fq_csid) },
+    [58] = { OGS_GTP2_IP_ADDRESS_TYPE, 0, 0, 15, 14,
+        offsetof(ogs_gtp2_create_bearer_response_t, mme_s4_sgsn_identifier) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp2_msg_index_create_bearer_response = {
+    63, 22, ogs_gtp2_msg_index_create_bearer_response_slot };
+
+static const uint8_t ogs_gtp2_msg_instance_create_bearer_response[22] = {
+    0, 0, 0, 0, 1, 2, 3, 0, 0, 0, 0, 0, 1, 0, 0, 2,
+    1, 1, 0, 0, 1, 0,
+};
+
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_create_bearer_response =
 {
     OGS_TLV_MESSAGE,
     "Create Bearer Response",
     0, 0, 0, 0, {
-        &ogs_gtp2_tlv_desc_cause_0,
-        &ogs_gtp2_tlv_desc_bearer_context_0,
-        &ogs_gtp2_tlv_desc_recovery_0,
-        &ogs_gtp2_tlv_desc_fq_csid_0,
-        &ogs_gtp2_tlv_desc_fq_csid_1,
-        &ogs_gtp2_tlv_desc_fq_csid_2,
-        &ogs_gtp2_tlv_desc_fq_csid_3,
-        &ogs_gtp2_tlv_desc_pco_0,
-        &ogs_gtp2_tlv_desc_ue_time_zone_0,
-        &ogs_gtp2_tlv_desc_uli_0,
-        &ogs_gtp2_tlv_desc_twan_identifier_0,
-        &ogs_gtp2_tlv_desc_overload_control_information_0,
-        &ogs_gtp2_tlv_desc_overload_control_information_1,
-        &ogs_gtp2_tlv_desc_presence_reporting_area_information_0,
-        &ogs_gtp2_tlv_desc_ip_address_0,
-        &ogs_gtp2_tlv_desc_overload_control_information_2,
-        &ogs_gtp2_tlv_desc_twan_identifier_1,
-        &ogs_gtp2_tlv_desc_twan_identifier_timestamp_1,
-        &ogs_gtp2_tlv_desc_port_number_0,
-        &ogs_gtp2_tlv_desc_f_container_0,
-        &ogs_gtp2_tlv_desc_port_number_1,
-        &ogs_gtp2_tlv_desc_pscell_id_0,
-    NULL,
-}};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_update_bearer_request =
+        &ogs_gtp2_tlv_desc_cause,
+        &ogs_gtp2_tlv_desc_bearer_context,
+        &ogs_gtp2_tlv_desc_recovery,
+        &ogs_gtp2_tlv_desc_fq_csid,
+        &ogs_gtp2_tlv_desc_fq_csid,
+        &ogs_gtp2_tlv_desc_fq_csid,
+        &ogs_gtp2_tlv_desc_fq_csid,
+        &ogs_gtp2_tlv_desc_pco,
+        &ogs_gtp2_tlv_desc_ue_time_zone,
+        &ogs_gtp2_tlv_desc_uli,
+        &ogs_gtp2_tlv_desc_twan_identifier,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_presence_reporting_area_information,
+        &ogs_gtp2_tlv_desc_ip_address,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_twan_identifier,
+        &ogs_gtp2_tlv_desc_twan_identifier_timestamp,
+        &ogs_gtp2_tlv_desc_port_number,
+        &ogs_gtp2_tlv_desc_f_container,
+        &ogs_gtp2_tlv_desc_port_number,
+        &ogs_gtp2_tlv_desc_pscell_id,
+    NULL,
+}, &ogs_gtp2_msg_index_create_bearer_response, ogs_gtp2_msg_instance_create_bearer_response};
+
+static const ogs_tlv_desc_slot_t ogs_gtp2_msg_index_update_bearer_request_slot[64] = {
+    [2] = { OGS_GTP2_CSG_INFORMATION_REPORTING_ACTION_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_gtp2_update_bearer_request_t, csg_information_reporting_action) },
+    [4] = { OGS_GTP2_PTI_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp2_update_bearer_request_t, procedure_transaction_id) },
+    [5] = { OGS_GTP2_INDICATION_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_gtp2_update_bearer_request_t, indication_flags) },
+    [6] = { OGS_GTP2_F_CONTAINER_TYPE, 0, 0, 17, 16,
+        offsetof(ogs_gtp2_update_bearer_request_t, nbifom_container) },
+    [8] = { OGS_GTP2_AMBR_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp2_update_bearer_request_t, aggregate_maximum_bit_rate) },
+    [9] = { OGS_GTP2_PRESENCE_REPORTING_AREA_ACTION_TYPE, 0, 0, 11, 10,
+        offsetof(ogs_gtp2_update_bearer_request_t, presence_reporting_area_action) },
+    [11] = { OGS_GTP2_CHANGE_REPORTING_ACTION_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp2_update_bearer_request_t, change_reporting_action) },
+    [20] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 0, 0, 15, 14,
+        offsetof(ogs_gtp2_update_bearer_request_t, pgw_s_overload_control_information) },
+    [21] = { OGS_GTP2_BEARER_CONTEXT_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp2_update_bearer_request_t, bearer_contexts) },
+    [27] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 1, 0, 16, 15,
+        offsetof(ogs_gtp2_update_bearer_request_t, sgw_s_overload_control_information) },
+    [29] = { OGS_GTP2_ENB_INFORMATION_REPORTING_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_gtp2_update_bearer_request_t, hnb_information_reporting) },
+    [30] = { OGS_GTP2_PCO_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp2_update_bearer_request_t, protocol_configuration_options) },
+    [36] = { OGS_GTP2_FQ_CSID_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_gtp2_update_bearer_request_t, pgw_fq_csid) },
+    [38] = { OGS_GTP2_PGW_CHANGE_INFO_TYPE, 0, 0, 18, 17,
+        offsetof(ogs_gtp2_update_bearer_request_t, pgw_change_info) },
+    [43] = { OGS_GTP2_FQ_CSID_TYPE, 1, 0, 10, 9,
+        offsetof(ogs_gtp2_update_bearer_request_t, sgw_fq_csid) },
+    [45] = { OGS_GTP2_LOAD_CONTROL_INFORMATION_TYPE, 0, 0, 12, 11,
+        offsetof(ogs_gtp2_update_bearer_request_t, pgw_s_node_level_load_control_information) },
+    [52] = { OGS_GTP2_LOAD_CONTROL_INFORMATION_TYPE, 1, 0, 13, 12,
+        offsetof(ogs_gtp2_update_bearer_request_t, pgw_s_apn_level_load_control_information) },
+    [59] = { OGS_GTP2_LOAD_CONTROL_INFORMATION_TYPE, 2, 0, 14, 13,
+        offsetof(ogs_gtp2_update_bearer_request_t, sgw_s_node_level_load_control_information) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp2_msg_index_update_bearer_request = {
+    63, 18, ogs_gtp2_msg_index_update_bearer_request_slot };
+
+static const uint8_t ogs_gtp2_msg_instance_update_bearer_request[18] = {
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 2, 0, 1,
+    0, 0,
+};
+
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_update_bearer_request =
 {
     OGS_TLV_MESSAGE,
     "Update Bearer Request",
     0, 0, 0, 0, {
-        &ogs_gtp2_tlv_desc_bearer_context_0,
-        &ogs_gtp2_tlv_desc_pti_0,
-        &ogs_gtp2_tlv_desc_pco_0,
-        &ogs_gtp2_tlv_desc_ambr_0,
-        &ogs_gtp2_tlv_desc_change_reporting_action_0,
-        &ogs_gtp2_tlv_desc_csg_information_reporting_action_0,
-        &ogs_gtp2_tlv_desc_enb_information_reporting_0,
-        &ogs_gtp2_tlv_desc_indication_0,
-        &ogs_gtp2_tlv_desc_fq_csid_0,
-        &ogs_gtp2_tlv_desc_fq_csid_1,
-        &ogs_gtp2_tlv_desc_presence_reporting_area_action_0,
-        &ogs_gtp2_tlv_desc_load_control_information_0,
-        &ogs_gtp2_tlv_desc_load_control_information_1,
-        &ogs_gtp2_tlv_desc_load_control_information_2,
-        &ogs_gtp2_tlv_desc_overload_control_information_0,
-        &ogs_gtp2_tlv_desc_overload_control_information_1,
-        &ogs_gtp2_tlv_desc_f_container_0,
-        &ogs_gtp2_tlv_desc_pgw_change_info_0,
-    NULL,
-}};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_update_bearer_response =
+        &ogs_gtp2_tlv_desc_bearer_context,
+        &ogs_gtp2_tlv_desc_pti,
+        &ogs_gtp2_tlv_desc_pco,
+        &ogs_gtp2_tlv_desc_ambr,
+        &ogs_gtp2_tlv_desc_change_reporting_action,
+        &ogs_gtp2_tlv_desc_csg_information_reporting_action,
+        &ogs_gtp2_tlv_desc_enb_information_reporting,
+        &ogs_gtp2_tlv_desc_indication,
+        &ogs_gtp2_tlv_desc_fq_csid,
+        &ogs_gtp2_tlv_desc_fq_csid,
+        &ogs_gtp2_tlv_desc_presence_reporting_area_action,
+        &ogs_gtp2_tlv_desc_load_control_information,
+        &ogs_gtp2_tlv_desc_load_control_information,
+        &ogs_gtp2_tlv_desc_load_control_information,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_f_container,
+        &ogs_gtp2_tlv_desc_pgw_change_info,
+    NULL,
+}, &ogs_gtp2_msg_index_update_bearer_request, ogs_gtp2_msg_instance_update_bearer_request};
+
+static const ogs_tlv_desc_slot_t ogs_gtp2_msg_index_update_bearer_response_slot[64] = {
+    [1] = { OGS_GTP2_TWAN_IDENTIFIER_TYPE, 0, 0, 12, 11,
+        offsetof(ogs_gtp2_update_bearer_response_t, twan_identifier) },
+    [2] = { OGS_GTP2_TWAN_IDENTIFIER_TIMESTAMP_TYPE, 1, 0, 19, 18,
+        offsetof(ogs_gtp2_update_bearer_response_t, wlan_location_timestamp) },
+    [5] = { OGS_GTP2_INDICATION_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_gtp2_update_bearer_response_t, indication_flags) },
+    [6] = { OGS_GTP2_F_CONTAINER_TYPE, 0, 0, 21, 20,
+        offsetof(ogs_gtp2_update_bearer_response_t, nbifom_container) },
+    [8] = { OGS_GTP2_TWAN_IDENTIFIER_TYPE, 1, 0, 18, 17,
+        offsetof(ogs_gtp2_update_bearer_response_t, wlan_location_information) },
+    [11] = { OGS_GTP2_RECOVERY_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp2_update_bearer_response_t, recovery) },
+    [14] = { OGS_GTP2_PORT_NUMBER_TYPE, 0, 0, 20, 19,
+        offsetof(ogs_gtp2_update_bearer_response_t, ue_udp_port) },
+    [20] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 0, 0, 13, 12,
+        offsetof(ogs_gtp2_update_bearer_response_t, mme_s4_sgsn_s_overload_control_information) },
+    [21] = { OGS_GTP2_BEARER_CONTEXT_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp2_update_bearer_response_t, bearer_contexts) },
+    [22] = { OGS_GTP2_PORT_NUMBER_TYPE, 1, 0, 22, 21,
+        offsetof(ogs_gtp2_update_bearer_response_t, ue_tcp_port) },
+    [27] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 1, 0, 14, 13,
+        offsetof(ogs_gtp2_update_bearer_response_t, sgw_s_overload_control_information) },
+    [30] = { OGS_GTP2_PCO_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp2_update_bearer_response_t, protocol_configuration_options) },
+    [34] = { OGS_GTP2_UE_TIME_ZONE_TYPE, 0, 0, 10, 9,
+        offsetof(ogs_gtp2_update_bearer_response_t, ue_time_zone) },
+    [35] = { OGS_GTP2_PRESENCE_REPORTING_AREA_INFORMATION_TYPE, 0, 0, 15, 14,
+        offsetof(ogs_gtp2_update_bearer_response_t, presence_reporting_area_information) },
+    [36] = { OGS_GTP2_FQ_CSID_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp2_update_bearer_response_t, mme_fq_csid) },
+    [37] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 2, 0, 17, 16,
+        offsetof(ogs_gtp2_update_bearer_response_t, twan_epdg_s_overload_control_information) },
+    [38] = { OGS_GTP2_ULI_TYPE, 0, 0, 11, 10,
+        offsetof(ogs_gtp2_update_bearer_response_t, user_location_information) },
+    [43] = { OGS_GTP2_FQ_CSID_TYPE, 1, 0, 6, 5,
+        offsetof(ogs_gtp2_update_bearer_response_t, sgw_fq_csid) },
+    [49] = { OGS_GTP2_PSCELL_ID_TYPE, 0, 0, 23, 22,
+        offsetof(ogs_gtp2_update_bearer_response_t, pscell_id) },
+    [50] = { OGS_GTP2_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp2_update_bearer_response_t, cause) },
+    [51] = { OGS_GTP2_FQ_CSID_TYPE, 2, 0, 7, 6,
+        offsetof(ogs_gtp2_update_bearer_response_t, epdg_fq_csid) },
+    [57] = { OGS_GTP2_FQ_CSID_TYPE, 3, 0, 8, 7,
+        offsetof(ogs_gtp2_update_bearer_response_t, twan_fq_csid) },
+    [58] = { OGS_GTP2_IP_ADDRESS_TYPE, 0, 0, 16, 15,
+        offsetof(ogs_gtp2_update_bearer_response_t, mme_s4_sgsn_identifier) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp2_msg_index_update_bearer_response = {
+    63, 23, ogs_gtp2_msg_index_update_bearer_response_slot };
+
+static const uint8_t ogs_gtp2_msg_instance_update_bearer_response[23] = {
+    0, 0, 0, 0, 0, 1, 2, 3, 0, 0, 0, 0, 0, 1, 0, 0,
+    2, 1, 1, 0, 0, 1, 0,
+};
+
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_update_bearer_response =
 {
     OGS_TLV_MESSAGE,
     "Update Bearer Response",
     0, 0, 0, 0, {
-        &ogs_gtp2_tlv_desc_cause_0,
-        &ogs_gtp2_tlv_desc_bearer_context_0,
-        &ogs_gtp2_tlv_desc_pco_0,
-        &ogs_gtp2_tlv_desc_recovery_0,
-        &ogs_gtp2_tlv_desc_fq_csid_0,
-        &ogs_gtp2_tlv_desc_fq_csid_1,
-        &ogs_gtp2_tlv_desc_fq_csid_2,
-        &ogs_gtp2_tlv_desc_fq_csid_3,
-        &ogs_gtp2_tlv_desc_indication_0,
-        &ogs_gtp2_tlv_desc_ue_time_zone_0,
-        &ogs_gtp2_tlv_desc_uli_0,
-        &ogs_gtp2_tlv_desc_twan_identifier_0,
-        &ogs_gtp2_tlv_desc_overload_control_information_0,
-        &ogs_gtp2_tlv_desc_overload_control_information_1,
-        &ogs_gtp2_tlv_desc_presence_reporting_area_information_0,
-        &ogs_gtp2_tlv_desc_ip_address_0,
-        &ogs_gtp2_tlv_desc_overload_control_information_2,
-        &ogs_gtp2_tlv_desc_twan_identifier_1,
-        &ogs_gtp2_tlv_desc_twan_identifier_timestamp_1,
-        &ogs_gtp2_tlv_desc_port_number_0,
-        &ogs_gtp2_tlv_desc_f_container_0,
-        &ogs_gtp2_tlv_desc_port_number_1,
-        &ogs_gtp2_tlv_desc_pscell_id_0,
-    NULL,
-}};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_delete_bearer_request =
+        &ogs_gtp2_tlv_desc_cause,
+        &ogs_gtp2_tlv_desc_bearer_context,
+        &ogs_gtp2_tlv_desc_pco,
+        &ogs_gtp2_tlv_desc_recovery,
+        &ogs_gtp2_tlv_desc_fq_csid,
+        &ogs_gtp2_tlv_desc_fq_csid,
+        &ogs_gtp2_tlv_desc_fq_csid,
+        &ogs_gtp2_tlv_desc_fq_csid,
+        &ogs_gtp2_tlv_desc_indication,
+        &ogs_gtp2_tlv_desc_ue_time_zone,
+        &ogs_gtp2_tlv_desc_uli,
+        &ogs_gtp2_tlv_desc_twan_identifier,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_presence_reporting_area_information,
+        &ogs_gtp2_tlv_desc_ip_address,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_twan_identifier,
+        &ogs_gtp2_tlv_desc_twan_identifier_timestamp,
+        &ogs_gtp2_tlv_desc_port_number,
+        &ogs_gtp2_tlv_desc_f_container,
+        &ogs_gtp2_tlv_desc_port_number,
+        &ogs_gtp2_tlv_desc_pscell_id,
+    NULL,
+}, &ogs_gtp2_msg_index_update_bearer_response, ogs_gtp2_msg_instance_update_bearer_response};
+
+static const ogs_tlv_desc_slot_t ogs_gtp2_msg_index_delete_bearer_request_slot[64] = {
+    [4] = { OGS_GTP2_PTI_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp2_delete_bearer_request_t, procedure_transaction_id) },
+    [5] = { OGS_GTP2_INDICATION_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_gtp2_delete_bearer_request_t, indication_flags) },
+    [6] = { OGS_GTP2_F_CONTAINER_TYPE, 0, 0, 15, 14,
+        offsetof(ogs_gtp2_delete_bearer_request_t, nbifom_container) },
+    [20] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 0, 0, 13, 12,
+        offsetof(ogs_gtp2_delete_bearer_request_t, pgw_s_overload_control_information) },
+    [21] = { OGS_GTP2_BEARER_CONTEXT_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp2_delete_bearer_request_t, failed_bearer_contexts) },
+    [27] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 1, 0, 14, 13,
+        offsetof(ogs_gtp2_delete_bearer_request_t, sgw_s_overload_control_information) },
+    [30] = { OGS_GTP2_PCO_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp2_delete_bearer_request_t, protocol_configuration_options) },
+    [33] = { OGS_GTP2_EBI_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp2_delete_bearer_request_t, linked_eps_bearer_id) },
+    [36] = { OGS_GTP2_FQ_CSID_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_gtp2_delete_bearer_request_t, pgw_fq_csid) },
+    [38] = { OGS_GTP2_PGW_CHANGE_INFO_TYPE, 0, 0, 18, 17,
+        offsetof(ogs_gtp2_delete_bearer_request_t, pgw_change_info) },
+    [40] = { OGS_GTP2_EBI_TYPE, 1, 0, 2, 1,
+        offsetof(ogs_gtp2_delete_bearer_request_t, eps_bearer_ids) },
+    [43] = { OGS_GTP2_FQ_CSID_TYPE, 1, 0, 7, 6,
+        offsetof(ogs_gtp2_delete_bearer_request_t, sgw_fq_csid) },
+    [44] = { OGS_GTP2_APN_RATE_CONTROL_STATUS_TYPE, 0, 0, 16, 15,
+        offsetof(ogs_gtp2_delete_bearer_request_t, apn_rate_control_status) },
+    [45] = { OGS_GTP2_LOAD_CONTROL_INFORMATION_TYPE, 0, 0, 10, 9,
+        offsetof(ogs_gtp2_delete_bearer_request_t, pgw_s_node_level_load_control_information) },
+    [50] = { OGS_GTP2_CAUSE_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_gtp2_delete_bearer_request_t, cause) },
+    [52] = { OGS_GTP2_LOAD_CONTROL_INFORMATION_TYPE, 1, 0, 11, 10,
+        offsetof(ogs_gtp2_delete_bearer_request_t, pgw_s_apn_level_load_control_information) },
+    [59] = { OGS_GTP2_LOAD_CONTROL_INFORMATION_TYPE, 2, 0, 12, 11,
+        offsetof(ogs_gtp2_delete_bearer_request_t, sgw_s_node_level_load_control_information) },
+    [61] = { OGS_GTP2_EPCO_TYPE, 0, 0, 17, 16,
+        offsetof(ogs_gtp2_delete_bearer_request_t, extended_protocol_configuration_options) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp2_msg_index_delete_bearer_request = {
+    63, 18, ogs_gtp2_msg_index_delete_bearer_request_slot };
+
+static const uint8_t ogs_gtp2_msg_instance_delete_bearer_request[18] = {
+    0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 1, 2, 0, 1, 0, 0,
+    0, 0,
+};
+
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_delete_bearer_request =
 {
     OGS_TLV_MESSAGE,
     "Delete Bearer Request",
     0, 0, 0, 0, {
-        &ogs_gtp2_tlv_desc_ebi_0,
-        &ogs_gtp2_tlv_desc_ebi_1,
-        &ogs_gtp2_tlv_desc_bearer_context_0,
-        &ogs_gtp2_tlv_desc_pti_0,
-        &ogs_gtp2_tlv_desc_pco_0,
-        &ogs_gtp2_tlv_desc_fq_csid_0,
-        &ogs_gtp2_tlv_desc_fq_csid_1,
-        &ogs_gtp2_tlv_desc_cause_0,
-        &ogs_gtp2_tlv_desc_indication_0,
-        &ogs_gtp2_tlv_desc_load_control_information_0,
-        &ogs_gtp2_tlv_desc_load_control_information_1,
-        &ogs_gtp2_tlv_desc_load_control_information_2,
-        &ogs_gtp2_tlv_desc_overload_control_information_0,
-        &ogs_gtp2_tlv_desc_overload_control_information_1,
-        &ogs_gtp2_tlv_desc_f_container_0,
-        &ogs_gtp2_tlv_desc_apn_rate_control_status_0,
-        &ogs_gtp2_tlv_desc_epco_0,
-        &ogs_gtp2_tlv_desc_pgw_change_info_0,
-    NULL,
-}};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_delete_bearer_response =
+        &ogs_gtp2_tlv_desc_ebi,
+        &ogs_gtp2_tlv_desc_ebi,
+        &ogs_gtp2_tlv_desc_bearer_context,
+        &ogs_gtp2_tlv_desc_pti,
+        &ogs_gtp2_tlv_desc_pco,
+        &ogs_gtp2_tlv_desc_fq_csid,
+        &ogs_gtp2_tlv_desc_fq_csid,
+        &ogs_gtp2_tlv_desc_cause,
+        &ogs_gtp2_tlv_desc_indication,
+        &ogs_gtp2_tlv_desc_load_control_information,
+        &ogs_gtp2_tlv_desc_load_control_information,
+        &ogs_gtp2_tlv_desc_load_control_information,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_f_container,
+        &ogs_gtp2_tlv_desc_apn_rate_control_status,
+        &ogs_gtp2_tlv_desc_epco,
+        &ogs_gtp2_tlv_desc_pgw_change_info,
+    NULL,
+}, &ogs_gtp2_msg_index_delete_bearer_request, ogs_gtp2_msg_instance_delete_bearer_request};
+
+static const ogs_tlv_desc_slot_t ogs_gtp2_msg_index_delete_bearer_response_slot[64] = {
+    [1] = { OGS_GTP2_TWAN_IDENTIFIER_TYPE, 0, 0, 13, 12,
+        offsetof(ogs_gtp2_delete_bearer_response_t, twan_identifier) },
+    [2] = { OGS_GTP2_TWAN_IDENTIFIER_TIMESTAMP_TYPE, 1, 0, 20, 19,
+        offsetof(ogs_gtp2_delete_bearer_response_t, wlan_location_timestamp) },
+    [6] = { OGS_GTP2_F_CONTAINER_TYPE, 0, 0, 22, 21,
+        offsetof(ogs_gtp2_delete_bearer_response_t, nbifom_container) },
+    [8] = { OGS_GTP2_TWAN_IDENTIFIER_TYPE, 1, 0, 19, 18,
+        offsetof(ogs_gtp2_delete_bearer_response_t, wlan_location_information) },
+    [11] = { OGS_GTP2_RECOVERY_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp2_delete_bearer_response_t, recovery) },
+    [14] = { OGS_GTP2_PORT_NUMBER_TYPE, 0, 0, 21, 20,
+        offsetof(ogs_gtp2_delete_bearer_response_t, ue_udp_port) },
+    [20] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 0, 0, 15, 14,
+        offsetof(ogs_gtp2_delete_bearer_response_t, mme_s4_sgsn_s_overload_control_information) },
+    [21] = { OGS_GTP2_BEARER_CONTEXT_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp2_delete_bearer_response_t, bearer_contexts) },
+    [22] = { OGS_GTP2_PORT_NUMBER_TYPE, 1, 0, 23, 22,
+        offsetof(ogs_gtp2_delete_bearer_response_t, ue_tcp_port) },
+    [26] = { OGS_GTP2_ULI_TIMESTAMP_TYPE, 0, 0, 12, 11,
+        offsetof(ogs_gtp2_delete_bearer_response_t, uli_timestamp) },
+    [27] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 1, 0, 16, 15,
+        offsetof(ogs_gtp2_delete_bearer_response_t, sgw_s_overload_control_information) },
+    [30] = { OGS_GTP2_PCO_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_gtp2_delete_bearer_response_t, protocol_configuration_options) },
+    [33] = { OGS_GTP2_EBI_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp2_delete_bearer_response_t, linked_eps_bearer_id) },
+    [34] = { OGS_GTP2_UE_TIME_ZONE_TYPE, 0, 0, 10, 9,
+        offsetof(ogs_gtp2_delete_bearer_response_t, ue_time_zone) },
+    [35] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 2, 0, 18, 17,
+        offsetof(ogs_gtp2_delete_bearer_response_t, twan_epdg_s_overload_control_information) },
+    [36] = { OGS_GTP2_FQ_CSID_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp2_delete_bearer_response_t, mme_fq_csid) },
+    [37] = { OGS_GTP2_SECONDARY_RAT_USAGE_DATA_REPORT_TYPE, 0, 0, 24, 23,
+        offsetof(ogs_gtp2_delete_bearer_response_t, secondary_rat_usage_data_report) },
+    [38] = { OGS_GTP2_ULI_TYPE, 0, 0, 11, 10,
+        offsetof(ogs_gtp2_delete_bearer_response_t, user_location_information) },
+    [43] = { OGS_GTP2_FQ_CSID_TYPE, 1, 0, 6, 5,
+        offsetof(ogs_gtp2_delete_bearer_response_t, sgw_fq_csid) },
+    [49] = { OGS_GTP2_PSCELL_ID_TYPE, 0, 0, 25, 24,
+        offsetof(ogs_gtp2_delete_bearer_response_t, pscell_id) },
+    [50] = { OGS_GTP2_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp2_delete_bearer_response_t, cause) },
+    [51] = { OGS_GTP2_FQ_CSID_TYPE, 2, 0, 7, 6,
+        offsetof(ogs_gtp2_delete_bearer_response_t, epdg_fq_csid) },
+    [57] = { OGS_GTP2_FQ_CSID_TYPE, 3, 0, 8, 7,
+        offsetof(ogs_gtp2_delete_bearer_response_t, twan_fq_csid) },
+    [58] = { OGS_GTP2_IP_ADDRESS_TYPE, 0, 0, 17, 16,
+        offsetof(ogs_gtp2_delete_bearer_response_t, mme_s4_sgsn_identifier) },
+    [59] = { OGS_GTP2_TWAN_IDENTIFIER_TIMESTAMP_TYPE, 0, 0, 14, 13,
+        offsetof(ogs_gtp2_delete_bearer_response_t, twan_identifier_timestamp) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp2_msg_index_delete_bearer_response = {
+    63, 25, ogs_gtp2_msg_index_delete_bearer_response_slot };
+
+static const uint8_t ogs_gtp2_msg_instance_delete_bearer_response[25] = {
+    0, 0, 0, 0, 0, 1, 2, 3, 0, 0, 0, 0, 0, 0, 0, 1,
+    0, 2, 1, 1, 0, 0, 1, 0, 0,
+};
+
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_delete_bearer_response =
 {
     OGS_TLV_MESSAGE,
     "Delete Bearer Response",
     0, 0, 0, 0, {
-        &ogs_gtp2_tlv_desc_cause_0,
-        &ogs_gtp2_tlv_desc_ebi_0,
-        &ogs_gtp2_tlv_desc_bearer_context_0,
-        &ogs_gtp2_tlv_desc_recovery_0,
-        &ogs_gtp2_tlv_desc_fq_csid_0,
-        &ogs_gtp2_tlv_desc_fq_csid_1,
-        &ogs_gtp2_tlv_desc_fq_csid_2,
-        &ogs_gtp2_tlv_desc_fq_csid_3,
-        &ogs_gtp2_tlv_desc_pco_0,
-        &ogs_gtp2_tlv_desc_ue_time_zone_0,
-        &ogs_gtp2_tlv_desc_uli_0,
-        &ogs_gtp2_tlv_desc_uli_timestamp_0,
-        &ogs_gtp2_tlv_desc_twan_identifier_0,
-        &ogs_gtp2_tlv_desc_twan_identifier_timestamp_0,
-        &ogs_gtp2_tlv_desc_overload_control_information_0,
-        &ogs_gtp2_tlv_desc_overload_control_information_1,
-        &ogs_gtp2_tlv_desc_ip_address_0,
-        &ogs_gtp2_tlv_desc_overload_control_information_2,
-        &ogs_gtp2_tlv_desc_twan_identifier_1,
-        &ogs_gtp2_tlv_desc_twan_identifier_timestamp_1,
-        &ogs_gtp2_tlv_desc_port_number_0,
-        &ogs_gtp2_tlv_desc_f_container_0,
-        &ogs_gtp2_tlv_desc_port_number_1,
-        &ogs_gtp2_tlv_desc_secondary_rat_usage_data_report_0,
-        &ogs_gtp2_tlv_desc_pscell_id_0,
-    NULL,
-}};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_create_indirect_data_forwarding_tunnel_request =
+        &ogs_gtp2_tlv_desc_cause,
+        &ogs_gtp2_tlv_desc_ebi,
+        &ogs_gtp2_tlv_desc_bearer_context,
+        &ogs_gtp2_tlv_desc_recovery,
+        &ogs_gtp2_tlv_desc_fq_csid,
+        &ogs_gtp2_tlv_desc_fq_csid,
+        &ogs_gtp2_tlv_desc_fq_csid,
+        &ogs_gtp2_tlv_desc_fq_csid,
+        &ogs_gtp2_tlv_desc_pco,
+        &ogs_gtp2_tlv_desc_ue_time_zone,
+        &ogs_gtp2_tlv_desc_uli,
+        &ogs_gtp2_tlv_desc_uli_timestamp,
+        &ogs_gtp2_tlv_desc_twan_identifier,
+        &ogs_gtp2_tlv_desc_twan_identifier_timestamp,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_ip_address,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_twan_identifier,
+        &ogs_gtp2_tlv_desc_twan_identifier_timestamp,
+        &ogs_gtp2_tlv_desc_port_number,
+        &ogs_gtp2_tlv_desc_f_container,
+        &ogs_gtp2_tlv_desc_port_number,
+        &ogs_gtp2_tlv_desc_secondary_rat_usage_data_report,
+        &ogs_gtp2_tlv_desc_pscell_id,
+    NULL,
+}, &ogs_gtp2_msg_index_delete_bearer_response, ogs_gtp2_msg_instance_delete_bearer_response};
+
+static const ogs_tlv_desc_slot_t ogs_gtp2_msg_index_create_indirect_data_forwarding_tunnel_request_slot[16] = {
+    [0] = { 0, 0, 0, 6, 5,
+        offsetof(ogs_gtp2_create_indirect_data_forwarding_tunnel_request_t, bearer_contexts) + sizeof(ogs_gtp2_tlv_bearer_context_t) },
+    [3] = { OGS_GTP2_MEI_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp2_create_indirect_data_forwarding_tunnel_request_t, me_identity) },
+    [5] = { OGS_GTP2_INDICATION_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp2_create_indirect_data_forwarding_tunnel_request_t, indication_flags) },
+    [6] = { OGS_GTP2_BEARER_CONTEXT_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp2_create_indirect_data_forwarding_tunnel_request_t, bearer_contexts) },
+    [9] = { OGS_GTP2_IMSI_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp2_create_indirect_data_forwarding_tunnel_request_t, imsi) },
+    [11] = { OGS_GTP2_RECOVERY_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_gtp2_create_indirect_data_forwarding_tunnel_request_t, recovery) },
+    [15] = { OGS_GTP2_F_TEID_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp2_create_indirect_data_forwarding_tunnel_request_t, sender_f_teid_for_control_plane) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp2_msg_index_create_indirect_data_forwarding_tunnel_request = {
+    15, 7, ogs_gtp2_msg_index_create_indirect_data_forwarding_tunnel_request_slot };
+
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_create_indirect_data_forwarding_tunnel_request =
 {
     OGS_TLV_MESSAGE,
     "Create Indirect Data Forwarding Tunnel Request",
     0, 0, 0, 0, {
-        &ogs_gtp2_tlv_desc_imsi_0,
-        &ogs_gtp2_tlv_desc_mei_0,
-        &ogs_gtp2_tlv_desc_indication_0,
-        &ogs_gtp2_tlv_desc_f_teid_0,
-        &ogs_gtp2_tlv_desc_bearer_context_0,
+        &ogs_gtp2_tlv_desc_imsi,
+        &ogs_gtp2_tlv_desc_mei,
+        &ogs_gtp2_tlv_desc_indication,
+        &ogs_gtp2_tlv_desc_f_teid,
+        &ogs_gtp2_tlv_desc_bearer_context,
         &ogs_tlv_desc_more8,
-        &ogs_gtp2_tlv_desc_recovery_0,
+        &ogs_gtp2_tlv_desc_recovery,
     NULL,
-}};
+}, &ogs_gtp2_msg_index_create_indirect_data_forwarding_tunnel_request, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp2_msg_index_create_indirect_data_forwarding_tunnel_response_slot[16] = {
+    [0] = { 0, 0, 0, 4, 3,
+        offsetof(ogs_gtp2_create_indirect_data_forwarding_tunnel_response_t, bearer_contexts) + sizeof(ogs_gtp2_tlv_bearer_context_t) },
+    [2] = { OGS_GTP2_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp2_create_indirect_data_forwarding_tunnel_response_t, cause) },
+    [5] = { OGS_GTP2_BEARER_CONTEXT_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp2_create_indirect_data_forwarding_tunnel_response_t, bearer_contexts) },
+    [11] = { OGS_GTP2_RECOVERY_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp2_create_indirect_data_forwarding_tunnel_response_t, recovery) },
+    [15] = { OGS_GTP2_F_TEID_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp2_create_indirect_data_forwarding_tunnel_response_t, sender_f_teid_for_control_plane) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp2_msg_index_create_indirect_data_forwarding_tunnel_response = {
+    15, 5, ogs_gtp2_msg_index_create_indirect_data_forwarding_tunnel_response_slot };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_create_indirect_data_forwarding_tunnel_response =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_create_indirect_data_forwarding_tunnel_response =
 {
     OGS_TLV_MESSAGE,
     "Create Indirect Data Forwarding Tunnel Response",
     0, 0, 0, 0, {
-        &ogs_gtp2_tlv_desc_cause_0,
-        &ogs_gtp2_tlv_desc_f_teid_0,
-        &ogs_gtp2_tlv_desc_bearer_context_0,
+        &ogs_gtp2_tlv_desc_cause,
+        &ogs_gtp2_tlv_desc_f_teid,
+        &ogs_gtp2_tlv_desc_bearer_context,
         &ogs_tlv_desc_more8,
-        &ogs_gtp2_tlv_desc_recovery_0,
+        &ogs_gtp2_tlv_desc_recovery,
     NULL,
-}};
+}, &ogs_gtp2_msg_index_create_indirect_data_forwarding_tunnel_response, NULL};
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_delete_indirect_data_forwarding_tunnel_request =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_delete_indirect_data_forwarding_tunnel_request =
 {
     OGS_TLV_MESSAGE,
     "Delete Indirect Data Forwarding Tunnel Request",
     0, 0, 0, 0, {
     NULL,
-}};
+}, NULL, NULL};
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_delete_indirect_data_forwarding_tunnel_response =
+static const ogs_tlv_desc_slot_t ogs_gtp2_msg_index_delete_indirect_data_forwarding_tunnel_response_slot[4] = {
+    [2] = { OGS_GTP2_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp2_delete_indirect_data_forwarding_tunnel_response_t, cause) },
+    [3] = { OGS_GTP2_RECOVERY_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp2_delete_indirect_data_forwarding_tunnel_response_t, recovery) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp2_msg_index_delete_indirect_data_forwarding_tunnel_response = {
+    3, 2, ogs_gtp2_msg_index_delete_indirect_data_forwarding_tunnel_response_slot };
+
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_delete_indirect_data_forwarding_tunnel_response =
 {
     OGS_TLV_MESSAGE,
     "Delete Indirect Data Forwarding Tunnel Response",
     0, 0, 0, 0, {
-        &ogs_gtp2_tlv_desc_cause_0,
-        &ogs_gtp2_tlv_desc_recovery_0,
+        &ogs_gtp2_tlv_desc_cause,
+        &ogs_gtp2_tlv_desc_recovery,
     NULL,
-}};
+}, &ogs_gtp2_msg_index_delete_indirect_data_forwarding_tunnel_response, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp2_msg_index_release_access_bearers_request_slot[16] = {
+    [1] = { OGS_GTP2_EBI_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp2_release_access_bearers_request_t, list_of_rabs) },
+    [2] = { OGS_GTP2_SECONDARY_RAT_USAGE_DATA_REPORT_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp2_release_access_bearers_request_t, secondary_rat_usage_data_report) },
+    [3] = { OGS_GTP2_PSCELL_ID_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp2_release_access_bearers_request_t, pscell_id) },
+    [5] = { OGS_GTP2_INDICATION_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp2_release_access_bearers_request_t, indication_flags) },
+    [15] = { OGS_GTP2_NODE_TYPE_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp2_release_access_bearers_request_t, originating_node) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp2_msg_index_release_access_bearers_request = {
+    15, 5, ogs_gtp2_msg_index_release_access_bearers_request_slot };
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_release_access_bearers_request =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_release_access_bearers_request =
 {
     OGS_TLV_MESSAGE,
     "Release Access Bearers Request",
     0, 0, 0, 0, {
-        &ogs_gtp2_tlv_desc_ebi_0,
-        &ogs_gtp2_tlv_desc_node_type_0,
-        &ogs_gtp2_tlv_desc_indication_0,
-        &ogs_gtp2_tlv_desc_secondary_rat_usage_data_report_0,
-        &ogs_gtp2_tlv_desc_pscell_id_0,
+        &ogs_gtp2_tlv_desc_ebi,
+        &ogs_gtp2_tlv_desc_node_type,
+        &ogs_gtp2_tlv_desc_indication,
+        &ogs_gtp2_tlv_desc_secondary_rat_usage_data_report,
+        &ogs_gtp2_tlv_desc_pscell_id,
     NULL,
-}};
+}, &ogs_gtp2_msg_index_release_access_bearers_request, NULL};
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_release_access_bearers_response =
+static const ogs_tlv_desc_slot_t ogs_gtp2_msg_index_release_access_bearers_response_slot[16] = {
+    [2] = { OGS_GTP2_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp2_release_access_bearers_response_t, cause) },
+    [4] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp2_release_access_bearers_response_t, sgw_s_overload_control_information) },
+    [5] = { OGS_GTP2_INDICATION_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp2_release_access_bearers_response_t, indication_flags) },
+    [11] = { OGS_GTP2_RECOVERY_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp2_release_access_bearers_response_t, recovery) },
+    [13] = { OGS_GTP2_LOAD_CONTROL_INFORMATION_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp2_release_access_bearers_response_t, sgw_s_node_level_load_control_information) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp2_msg_index_release_access_bearers_response = {
+    15, 5, ogs_gtp2_msg_index_release_access_bearers_response_slot };
+
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_release_access_bearers_response =
 {
     OGS_TLV_MESSAGE,
     "Release Access Bearers Response",
     0, 0, 0, 0, {
-        &ogs_gtp2_tlv_desc_cause_0,
-        &ogs_gtp2_tlv_desc_recovery_0,
-        &ogs_gtp2_tlv_desc_indication_0,
-        &ogs_gtp2_tlv_desc_load_control_information_0,
-        &ogs_gtp2_tlv_desc_overload_control_information_0,
+        &ogs_gtp2_tlv_desc_cause,
+        &ogs_gtp2_tlv_desc_recovery,
+        &ogs_gtp2_tlv_desc_indication,
+        &ogs_gtp2_tlv_desc_load_control_information,
+        &ogs_gtp2_tlv_desc_overload_control_information,
     NULL,
-}};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_downlink_data_notification =
+}, &ogs_gtp2_msg_index_release_access_bearers_response, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp2_msg_index_downlink_data_notification_slot[32] = {
+    [1] = { OGS_GTP2_EBI_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp2_downlink_data_notification_t, eps_bearer_id) },
+    [3] = { OGS_GTP2_ARP_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp2_downlink_data_notification_t, allocation_retention_priority) },
+    [4] = { OGS_GTP2_INTEGER_NUMBER_TYPE, 0, 0, 10, 9,
+        offsetof(ogs_gtp2_downlink_data_notification_t, dl_data_packets_size) },
+    [5] = { OGS_GTP2_INDICATION_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_gtp2_downlink_data_notification_t, indication_flags) },
+    [10] = { OGS_GTP2_PAGING_AND_SERVICE_INFORMATION_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_gtp2_downlink_data_notification_t, paging_and_service_information) },
+    [13] = { OGS_GTP2_LOAD_CONTROL_INFORMATION_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_gtp2_downlink_data_notification_t, sgw_s_node_level_load_control_information) },
+    [18] = { OGS_GTP2_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp2_downlink_data_notification_t, cause) },
+    [20] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_gtp2_downlink_data_notification_t, sgw_s_overload_control_information) },
+    [25] = { OGS_GTP2_IMSI_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp2_downlink_data_notification_t, imsi) },
+    [31] = { OGS_GTP2_F_TEID_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp2_downlink_data_notification_t, sender_f_teid_for_control_plane) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp2_msg_index_downlink_data_notification = {
+    31, 10, ogs_gtp2_msg_index_downlink_data_notification_slot };
+
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_downlink_data_notification =
 {
     OGS_TLV_MESSAGE,
     "Downlink Data Notification",
     0, 0, 0, 0, {
-        &ogs_gtp2_tlv_desc_cause_0,
-        &ogs_gtp2_tlv_desc_ebi_0,
-        &ogs_gtp2_tlv_desc_arp_0,
-        &ogs_gtp2_tlv_desc_imsi_0,
-        &ogs_gtp2_tlv_desc_f_teid_0,
-        &ogs_gtp2_tlv_desc_indication_0,
-        &ogs_gtp2_tlv_desc_load_control_information_0,
-        &ogs_gtp2_tlv_desc_overload_control_information_0,
-        &ogs_gtp2_tlv_desc_paging_and_service_information_0,
-        &ogs_gtp2_tlv_desc_integer_number_0,
+        &ogs_gtp2_tlv_desc_cause,
+        &ogs_gtp2_tlv_desc_ebi,
+        &ogs_gtp2_tlv_desc_arp,
+        &ogs_gtp2_tlv_desc_imsi,
+        &ogs_gtp2_tlv_desc_f_teid,
+        &ogs_gtp2_tlv_desc_indication,
+        &ogs_gtp2_tlv_desc_load_control_information,
+        &ogs_gtp2_tlv_desc_overload_control_information,
+        &ogs_gtp2_tlv_desc_paging_and_service_information,
+        &ogs_gtp2_tlv_desc_integer_number,
     NULL,
-}};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_downlink_data_notification_acknowledge =
+}, &ogs_gtp2_msg_index_downlink_data_notification, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp2_msg_index_downlink_data_notification_acknowledge_slot[16] = {
+    [2] = { OGS_GTP2_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp2_downlink_data_notification_acknowledge_t, cause) },
+    [3] = { OGS_GTP2_INTEGER_NUMBER_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_gtp2_downlink_data_notification_acknowledge_t, dl_buffering_suggested_packet_count) },
+    [9] = { OGS_GTP2_IMSI_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp2_downlink_data_notification_acknowledge_t, imsi) },
+    [10] = { OGS_GTP2_THROTTLING_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp2_downlink_data_notification_acknowledge_t, dl_low_priority_traffic_throttling) },
+    [11] = { OGS_GTP2_RECOVERY_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp2_downlink_data_notification_acknowledge_t, recovery) },
+    [12] = { OGS_GTP2_DELAY_VALUE_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp2_downlink_data_notification_acknowledge_t, data_notification_delay) },
+    [13] = { OGS_GTP2_EPC_TIMER_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_gtp2_downlink_data_notification_acknowledge_t, dl_buffering_duration) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp2_msg_index_downlink_data_notification_acknowledge = {
+    15, 7, ogs_gtp2_msg_index_downlink_data_notification_acknowledge_slot };
+
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_downlink_data_notification_acknowledge =
 {
     OGS_TLV_MESSAGE,
     "Downlink Data Notification Acknowledge",
     0, 0, 0, 0, {
-        &ogs_gtp2_tlv_desc_cause_0,
-        &ogs_gtp2_tlv_desc_delay_value_0,
-        &ogs_gtp2_tlv_desc_recovery_0,
-        &ogs_gtp2_tlv_desc_throttling_0,
-        &ogs_gtp2_tlv_desc_imsi_0,
-        &ogs_gtp2_tlv_desc_epc_timer_0,
-        &ogs_gtp2_tlv_desc_integer_number_0,
+        &ogs_gtp2_tlv_desc_cause,
+        &ogs_gtp2_tlv_desc_delay_value,
+        &ogs_gtp2_tlv_desc_recovery,
+        &ogs_gtp2_tlv_desc_throttling,
+        &ogs_gtp2_tlv_desc_imsi,
+        &ogs_gtp2_tlv_desc_epc_timer,
+        &ogs_gtp2_tlv_desc_integer_number,
     NULL,
-}};
-
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_modify_access_bearers_request =
+}, &ogs_gtp2_msg_index_downlink_data_notification_acknowledge, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_gtp2_msg_index_modify_access_bearers_request_slot[16] = {
+    [1] = { OGS_GTP2_SECONDARY_RAT_USAGE_DATA_REPORT_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_gtp2_modify_access_bearers_request_t, secondary_rat_usage_data_report) },
+    [2] = { OGS_GTP2_PSCELL_ID_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_gtp2_modify_access_bearers_request_t, pscell_id) },
+    [5] = { OGS_GTP2_INDICATION_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp2_modify_access_bearers_request_t, indication_flags) },
+    [6] = { OGS_GTP2_BEARER_CONTEXT_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp2_modify_access_bearers_request_t, bearer_contexts_to_be_modified) },
+    [11] = { OGS_GTP2_RECOVERY_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_gtp2_modify_access_bearers_request_t, recovery) },
+    [12] = { OGS_GTP2_DELAY_VALUE_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_gtp2_modify_access_bearers_request_t, delay_downlink_packet_notification_request) },
+    [13] = { OGS_GTP2_BEARER_CONTEXT_TYPE, 1, 0, 5, 4,
+        offsetof(ogs_gtp2_modify_access_bearers_request_t, bearer_contexts_to_be_removed) },
+    [15] = { OGS_GTP2_F_TEID_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp2_modify_access_bearers_request_t, sender_f_teid_for_control_plane) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp2_msg_index_modify_access_bearers_request = {
+    15, 8, ogs_gtp2_msg_index_modify_access_bearers_request_slot };
+
+static const uint8_t ogs_gtp2_msg_instance_modify_access_bearers_request[8] = {
+    0, 0, 0, 0, 1, 0, 0, 0,
+};
+
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_modify_access_bearers_request =
 {
     OGS_TLV_MESSAGE,
     "Modify Access Bearers Request",
     0, 0, 0, 0, {
-        &ogs_gtp2_tlv_desc_indication_0,
-        &ogs_gtp2_tlv_desc_f_teid_0,
-        &ogs_gtp2_tlv_desc_delay_value_0,
-        &ogs_gtp2_tlv_desc_bearer_context_0,
-        &ogs_gtp2_tlv_desc_bearer_context_1,
-        &ogs_gtp2_tlv_desc_recovery_0,
-        &ogs_gtp2_tlv_desc_secondary_rat_usage_data_report_0,
-        &ogs_gtp2_tlv_desc_pscell_id_0,
+        &ogs_gtp2_tlv_desc_indication,
+        &ogs_gtp2_tlv_desc_f_teid,
+        &ogs_gtp2_tlv_desc_delay_value,
+        &ogs_gtp2_tlv_desc_bearer_context,
+        &ogs_gtp2_tlv_desc_bearer_context,
+        &ogs_gtp2_tlv_desc_recovery,
+        &ogs_gtp2_tlv_desc_secondary_rat_usage_data_report,
+        &ogs_gtp2_tlv_desc_pscell_id,
     NULL,
-}};
+}, &ogs_gtp2_msg_index_modify_access_bearers_request, ogs_gtp2_msg_instance_modify_access_bearers_request};
+
+static const ogs_tlv_desc_slot_t ogs_gtp2_msg_index_modify_access_bearers_response_slot[16] = {
+    [2] = { OGS_GTP2_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_gtp2_modify_access_bearers_response_t, cause) },
+    [4] = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_gtp2_modify_access_bearers_response_t, sgw_s_overload_control_information) },
+    [5] = { OGS_GTP2_BEARER_CONTEXT_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_gtp2_modify_access_bearers_response_t, bearer_contexts_modified) },
+    [6] = { OGS_GTP2_INDICATION_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_gtp2_modify_access_bearers_response_t, indication_flags) },
+    [11] = { OGS_GTP2_RECOVERY_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_gtp2_modify_access_bearers_response_t, recovery) },
+    [12] = { OGS_GTP2_BEARER_CONTEXT_TYPE, 1, 0, 3, 2,
+        offsetof(ogs_gtp2_modify_access_bearers_response_t, bearer_contexts_marked_for_removal) },
+    [13] = { OGS_GTP2_LOAD_CONTROL_INFORMATION_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_gtp2_modify_access_bearers_response_t, sgw_s_node_level_load_control_information) },
+};
+static const ogs_tlv_desc_index_t ogs_gtp2_msg_index_modify_access_bearers_response = {
+    15, 7, ogs_gtp2_msg_index_modify_access_bearers_response_slot };
+
+static const uint8_t ogs_gtp2_msg_instance_modify_access_bearers_response[7] = {
+    0, 0, 1, 0, 0, 0, 0,
+};
 
-ogs_tlv_desc_t ogs_gtp2_tlv_desc_modify_access_bearers_response =
+const ogs_tlv_desc_t ogs_gtp2_tlv_desc_modify_access_bearers_response =
 {
     OGS_TLV_MESSAGE,
     "Modify Access Bearers Response",
     0, 0, 0, 0, {
-        &ogs_gtp2_tlv_desc_cause_0,
-        &ogs_gtp2_tlv_desc_bearer_context_0,
-        &ogs_gtp2_tlv_desc_bearer_context_1,
-        &ogs_gtp2_tlv_desc_recovery_0,
-        &ogs_gtp2_tlv_desc_indication_0,
-        &ogs_gtp2_tlv_desc_load_control_information_0,
-        &ogs_gtp2_tlv_desc_overload_control_information_0,
+        &ogs_gtp2_tlv_desc_cause,
+        &ogs_gtp2_tlv_desc_bearer_context,
+        &ogs_gtp2_tlv_desc_bearer_context,
+        &ogs_gtp2_tlv_desc_recovery,
+        &ogs_gtp2_tlv_desc_indication,
+        &ogs_gtp2_tlv_desc_load_control_information,
+        &ogs_gtp2_tlv_desc_overload_control_information,
     NULL,
-}};
+}, &ogs_gtp2_msg_index_modify_access_bearers_response, ogs_gtp2_msg_instance_modify_access_bearers_response};
+
 
+/* Size of the union member for the message type, 0 if it has none */
+static size_t gtp2_message_size(uint8_t type)
+{
+    switch(type) {
+    case OGS_GTP2_ECHO_REQUEST_TYPE:
+        return sizeof(ogs_gtp2_echo_request_t);
+    case OGS_GTP2_ECHO_RESPONSE_TYPE:
+        return sizeof(ogs_gtp2_echo_response_t);
+    case OGS_GTP2_CREATE_SESSION_REQUEST_TYPE:
+        return sizeof(ogs_gtp2_create_session_request_t);
+    case OGS_GTP2_CREATE_SESSION_RESPONSE_TYPE:
+        return sizeof(ogs_gtp2_create_session_response_t);
+    case OGS_GTP2_MODIFY_BEARER_REQUEST_TYPE:
+        return sizeof(ogs_gtp2_modify_bearer_request_t);
+    case OGS_GTP2_MODIFY_BEARER_RESPONSE_TYPE:
+        return sizeof(ogs_gtp2_modify_bearer_response_t);
+    case OGS_GTP2_DELETE_SESSION_REQUEST_TYPE:
+        return sizeof(ogs_gtp2_delete_session_request_t);
+    case OGS_GTP2_DELETE_SESSION_RESPONSE_TYPE:
+        return sizeof(ogs_gtp2_delete_session_response_t);
+    case OGS_GTP2_MODIFY_BEARER_COMMAND_TYPE:
+        return sizeof(ogs_gtp2_modify_bearer_command_t);
+    case OGS_GTP2_MODIFY_BEARER_FAILURE_INDICATION_TYPE:
+        return sizeof(ogs_gtp2_modify_bearer_failure_indication_t);
+    case OGS_GTP2_DELETE_BEARER_COMMAND_TYPE:
+        return sizeof(ogs_gtp2_delete_bearer_command_t);
+    case OGS_GTP2_DELETE_BEARER_FAILURE_INDICATION_TYPE:
+        return sizeof(ogs_gtp2_delete_bearer_failure_indication_t);
+    case OGS_GTP2_BEARER_RESOURCE_COMMAND_TYPE:
+        return sizeof(ogs_gtp2_bearer_resource_command_t);
+    case OGS_GTP2_BEARER_RESOURCE_FAILURE_INDICATION_TYPE:
+        return sizeof(ogs_gtp2_bearer_resource_failure_indication_t);
+    case OGS_GTP2_DOWNLINK_DATA_NOTIFICATION_FAILURE_INDICATION_TYPE:
+        return sizeof(ogs_gtp2_downlink_data_notification_failure_indication_t);
+    case OGS_GTP2_CREATE_BEARER_REQUEST_TYPE:
+        return sizeof(ogs_gtp2_create_bearer_request_t);
+    case OGS_GTP2_CREATE_BEARER_RESPONSE_TYPE:
+        return sizeof(ogs_gtp2_create_bearer_response_t);
+    case OGS_GTP2_UPDATE_BEARER_REQUEST_TYPE:
+        return sizeof(ogs_gtp2_update_bearer_request_t);
+    case OGS_GTP2_UPDATE_BEARER_RESPONSE_TYPE:
+        return sizeof(ogs_gtp2_update_bearer_response_t);
+    case OGS_GTP2_DELETE_BEARER_REQUEST_TYPE:
+        return sizeof(ogs_gtp2_delete_bearer_request_t);
+    case OGS_GTP2_DELETE_BEARER_RESPONSE_TYPE:
+        return sizeof(ogs_gtp2_delete_bearer_response_t);
+    case OGS_GTP2_CREATE_INDIRECT_DATA_FORWARDING_TUNNEL_REQUEST_TYPE:
+        return sizeof(ogs_gtp2_create_indirect_data_forwarding_tunnel_request_t);
+    case OGS_GTP2_CREATE_INDIRECT_DATA_FORWARDING_TUNNEL_RESPONSE_TYPE:
+        return sizeof(ogs_gtp2_create_indirect_data_forwarding_tunnel_response_t);
+    case OGS_GTP2_DELETE_INDIRECT_DATA_FORWARDING_TUNNEL_REQUEST_TYPE:
+        return sizeof(ogs_gtp2_delete_indirect_data_forwarding_tunnel_request_t);
+    case OGS_GTP2_DELETE_INDIRECT_DATA_FORWARDING_TUNNEL_RESPONSE_TYPE:
+        return sizeof(ogs_gtp2_delete_indirect_data_forwarding_tunnel_response_t);
+    case OGS_GTP2_RELEASE_ACCESS_BEARERS_REQUEST_TYPE:
+        return sizeof(ogs_gtp2_release_access_bearers_request_t);
+    case OGS_GTP2_RELEASE_ACCESS_BEARERS_RESPONSE_TYPE:
+        return sizeof(ogs_gtp2_release_access_bearers_response_t);
+    case OGS_GTP2_DOWNLINK_DATA_NOTIFICATION_TYPE:
+        return sizeof(ogs_gtp2_downlink_data_notification_t);
+    case OGS_GTP2_DOWNLINK_DATA_NOTIFICATION_ACKNOWLEDGE_TYPE:
+        return sizeof(ogs_gtp2_downlink_data_notification_acknowledge_t);
+    case OGS_GTP2_MODIFY_ACCESS_BEARERS_REQUEST_TYPE:
+        return sizeof(ogs_gtp2_modify_access_bearers_request_t);
+    case OGS_GTP2_MODIFY_ACCESS_BEARERS_RESPONSE_TYPE:
+        return sizeof(ogs_gtp2_modify_access_bearers_response_t);
+    default:
+        return 0;
+    }
+}
 
 int ogs_gtp2_parse_msg(ogs_gtp2_message_t *gtp2_message, ogs_pkbuf_t *pkbuf)
 {
@@ -2868,7 +4109,10 @@ int ogs_gtp2_parse_msg(ogs_gtp2_message_t *gtp2_message, ogs_pkbuf_t *pkbuf)
     h = (ogs_gtp2_header_t *)pkbuf->data;
     ogs_assert(h);
 
-    memset(gtp2_message, 0, sizeof(ogs_gtp2_message_t));
+    /* Clear the header and the message of this type, not the whole union */
+    memset(gtp2_message, 0,
+            offsetof(ogs_gtp2_message_t, echo_request) +
+            gtp2_message_size(h->type));
 
     if (h->teid_presence)
         size = OGS_GTPV2C_HEADER_LEN;
@@ -3159,3 +4403,1087 @@ ogs_pkbuf_t *ogs_gtp2_build_msg(ogs_gtp2_message_t *gtp2_message)
 
     return pkbuf;
 }
+
+static int gtp2_peek_header(ogs_pkbuf_t *pkbuf)
+{
+    ogs_gtp2_header_t *h = (ogs_gtp2_header_t *)pkbuf->data;
+    uint16_t size = 0;
+
+    if (pkbuf->len < OGS_GTPV2C_HEADER_LEN-OGS_GTP2_TEID_LEN) {
+        ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+        return OGS_ERROR;
+    }
+
+    if (h->teid_presence)
+        size = OGS_GTPV2C_HEADER_LEN;
+    else
+        size = OGS_GTPV2C_HEADER_LEN-OGS_GTP2_TEID_LEN;
+
+    if (pkbuf->len < size) {
+        ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+        return OGS_ERROR;
+    }
+
+    return size;
+}
+
+int ogs_gtp2_peek(ogs_pkbuf_t *pkbuf, uint8_t *type, uint32_t *teid)
+{
+    ogs_gtp2_header_t *h = NULL;
+
+    ogs_assert(pkbuf);
+
+    if (gtp2_peek_header(pkbuf) < 0)
+        return OGS_ERROR;
+
+    h = (ogs_gtp2_header_t *)pkbuf->data;
+    if (type)
+        *type = h->type;
+    if (teid)
+        *teid = h->teid_presence ? be32toh(h->teid) : 0;
+
+    return OGS_OK;
+}
+
+int ogs_gtp2_peek_ies(ogs_pkbuf_t *pkbuf, ogs_gtp2_peek_t *ies, int num)
+{
+    uint8_t *pos = NULL, *end = NULL;
+    uint8_t type, instance;
+    uint16_t length;
+    int size, found = 0, i;
+
+    ogs_assert(pkbuf);
+    ogs_assert(ies);
+
+    for (i = 0; i < num; i++)
+        ies[i].offset = -1;
+
+    size = gtp2_peek_header(pkbuf);
+    if (size < 0)
+        return OGS_ERROR;
+
+    pos = pkbuf->data + size;
+    end = pkbuf->data + pkbuf->len;
+    while (pos < end && found < num) {
+        /* Type(1), Length(2), Spare(4 bits) and Instance(4 bits) */
+        if (end - pos < 4) {
+            ogs_error("Can't peek TLV [LEN:%d]", pkbuf->len);
+            return OGS_ERROR;
+        }
+        type = pos[0];
+        length = (pos[1] << 8) | pos[2];
+        instance = pos[3] & 0x0f;
+        pos += 4;
+        if (end - pos < length) {
+            ogs_error("Can't peek TLV [LEN:%d]", pkbuf->len);
+            return OGS_ERROR;
+        }
+
+        for (i = 0; i < num; i++) {
+            if (ies[i].type == type && ies[i].instance == instance &&
+                    ies[i].offset < 0) {
+                ies[i].offset = pos - pkbuf->data;
+                ies[i].length = length;
+                found++;
+                break;
+            }
+        }
+        pos += length;
+    }
+
+    return found;
+}
+
+int ogs_gtp2_peek_imsi(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_IMSI_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_cause(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_CAUSE_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_recovery(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_RECOVERY_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_apn(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_APN_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_ambr(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_AMBR_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_ebi(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_EBI_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_ip_address(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_IP_ADDRESS_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_mei(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_MEI_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_msisdn(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_MSISDN_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_indication(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_INDICATION_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_pco(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_PCO_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_paa(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_PAA_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_flow_qos(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_FLOW_QOS_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_rat_type(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_RAT_TYPE_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_serving_network(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_SERVING_NETWORK_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_tad(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_TAD_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_uli(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_ULI_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_f_teid(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_F_TEID_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_delay_value(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_DELAY_VALUE_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_bearer_context(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_BEARER_CONTEXT_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_charging_id(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_CHARGING_ID_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_charging_characteristics(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_CHARGING_CHARACTERISTICS_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_trace_information(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_TRACE_INFORMATION_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_pdn_type(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_PDN_TYPE_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_pti(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_PTI_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_ue_time_zone(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_UE_TIME_ZONE_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_f_container(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_F_CONTAINER_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_port_number(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_PORT_NUMBER_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_apn_restriction(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_APN_RESTRICTION_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_selection_mode(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_SELECTION_MODE_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_change_reporting_action(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_CHANGE_REPORTING_ACTION_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_fq_csid(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_FQ_CSID_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_node_type(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_NODE_TYPE_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_fqdn(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_FQDN_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_uci(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_UCI_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_csg_information_reporting_action(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_CSG_INFORMATION_REPORTING_ACTION_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_ldn(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_LDN_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_node_features(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_NODE_FEATURES_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_throttling(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_THROTTLING_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_arp(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_ARP_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_epc_timer(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_EPC_TIMER_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_signalling_priority_indication(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_SIGNALLING_PRIORITY_INDICATION_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_apco(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_APCO_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_enb_information_reporting(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_ENB_INFORMATION_REPORTING_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_ip4cp(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_IP4CP_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_twan_identifier(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_TWAN_IDENTIFIER_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_uli_timestamp(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_ULI_TIMESTAMP_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_ran_nas_cause(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_RAN_NAS_CAUSE_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_cn_operator_selection_entity(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_CN_OPERATOR_SELECTION_ENTITY_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_twmi(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_TWMI_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_node_identifier(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_NODE_IDENTIFIER_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_presence_reporting_area_action(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_PRESENCE_REPORTING_AREA_ACTION_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_presence_reporting_area_information(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_PRESENCE_REPORTING_AREA_INFORMATION_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_twan_identifier_timestamp(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_TWAN_IDENTIFIER_TIMESTAMP_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_overload_control_information(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_OVERLOAD_CONTROL_INFORMATION_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_load_control_information(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_LOAD_CONTROL_INFORMATION_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_paging_and_service_information(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_PAGING_AND_SERVICE_INFORMATION_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_integer_number(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_INTEGER_NUMBER_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_millisecond_time_stamp(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_MILLISECOND_TIME_STAMP_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_remote_ue_context(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_REMOTE_UE_CONTEXT_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_epco(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_EPCO_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_serving_plmn_rate_control(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_SERVING_PLMN_RATE_CONTROL_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_counter(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_COUNTER_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_mapped_ue_usage_type(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_MAPPED_UE_USAGE_TYPE_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_secondary_rat_usage_data_report(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_SECONDARY_RAT_USAGE_DATA_REPORT_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_up_function_selection_indication_flags(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_UP_FUNCTION_SELECTION_INDICATION_FLAGS_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_apn_rate_control_status(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_APN_RATE_CONTROL_STATUS_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_sgi_ptp_tunnel_address(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_SGI_PTP_TUNNEL_ADDRESS_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_pgw_change_info(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_PGW_CHANGE_INFO_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_pscell_id(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_PSCELL_ID_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_gtp2_peek_up_security_policy(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)
+{
+    ogs_gtp2_peek_t ie = { OGS_GTP2_UP_SECURITY_POLICY_TYPE, instance, 0, -1 };
+
+    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
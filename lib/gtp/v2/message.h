@@ -20,8 +20,8 @@
 /*******************************************************************************
  * This file had been created by gtp-tlv.py script v0.1.0
  * Please do not modify this file but regenerate it via script.
- * Created on: 2023-08-26 16:35:12.642445 by acetcom
- * from 29274-h70.docx
+ * Created from 29274-h70.docx
+ * (sha256: 38b0693c737614cdfb2703dfce9dd5e6507890243a899399d1f0f0ea4a093a3a)
  ******************************************************************************/
 
 #if !defined(OGS_GTP_INSIDE) && !defined(OGS_GTP_COMPILATION)
@@ -279,244 +279,206 @@ typedef struct ogs_gtp2_header_s {
 #define OGS_GTP2_ALTERNATIVE_IMSI_TYPE 219
 
 /* Information Element TLV Descriptor */
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_imsi_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_cause_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_recovery_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_stn_sr_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_srvcc_cause_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_apn_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_ambr_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_ebi_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_ebi_1;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_ip_address_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_ip_address_1;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_ip_address_2;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_ip_address_3;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_mei_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_msisdn_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_indication_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_pco_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_paa_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_bearer_qos_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_flow_qos_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_rat_type_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_serving_network_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_bearer_tft_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_tad_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_uli_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_uli_1;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_f_teid_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_f_teid_1;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_f_teid_2;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_f_teid_3;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_f_teid_4;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_f_teid_5;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_f_teid_6;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_f_teid_7;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_f_teid_8;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_f_teid_9;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_f_teid_10;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_f_teid_11;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_tmsi_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_global_cn_id_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_s103pdf_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_s1udf_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_delay_value_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_charging_id_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_charging_characteristics_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_trace_information_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_bearer_flags_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_pdn_type_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_pti_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_mm_context_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_pdu_numbers_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_p_tmsi_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_p_tmsi_signature_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_hop_counter_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_ue_time_zone_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_trace_reference_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_complete_request_message_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_guti_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_f_container_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_f_cause_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_plmn_id_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_target_identification_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_packet_flow_id_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_rab_context_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_source_rnc_pdcp_context_info_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_port_number_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_port_number_1;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_port_number_2;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_apn_restriction_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_selection_mode_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_source_identification_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_change_reporting_action_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_fq_csid_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_fq_csid_1;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_fq_csid_2;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_fq_csid_3;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_channel_needed_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_emlpp_priority_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_node_type_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_fqdn_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_fqdn_1;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_fqdn_2;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_fqdn_3;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_ti_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_mbms_session_duration_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_mbms_service_area_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_mbms_session_identifier_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_mbms_flow_identifier_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_mbms_ip_multicast_distribution_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_mbms_distribution_acknowledge_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_rfsp_index_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_uci_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_csg_information_reporting_action_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_csg_id_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_cmi_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_service_indicator_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_detach_type_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_ldn_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_ldn_1;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_ldn_2;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_ldn_3;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_node_features_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_mbms_time_to_data_transfer_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_throttling_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_arp_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_epc_timer_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_signalling_priority_indication_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_tmgi_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_additional_mm_context_for_srvcc_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_additional_flags_for_srvcc_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_mdt_configuration_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_apco_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_absolute_time_of_mbms_data_transfer_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_enb_information_reporting_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_ip4cp_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_change_to_report_flags_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_action_indication_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_twan_identifier_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_twan_identifier_1;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_uli_timestamp_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_mbms_flags_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_ran_nas_cause_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_cn_operator_selection_entity_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_twmi_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_node_number_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_node_identifier_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_presence_reporting_area_action_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_presence_reporting_area_information_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_twan_identifier_timestamp_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_twan_identifier_timestamp_1;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_metric_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_sequence_number_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_apn_and_relative_capacity_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_wlan_offloadability_indication_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_paging_and_service_information_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_integer_number_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_millisecond_time_stamp_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_monitoring_event_information_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_ecgi_list_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_remote_user_id_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_remote_ue_ip_information_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_ciot_optimizations_support_indication_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_header_compression_configuration_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_epco_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_serving_plmn_rate_control_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_counter_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_mapped_ue_usage_type_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_secondary_rat_usage_data_report_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_up_function_selection_indication_flags_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_maximum_packet_loss_rate_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_apn_rate_control_status_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_extended_trace_information_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_monitoring_event_extension_information_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_additional_rrm_policy_index_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_services_authorized_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_services_authorized_1;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_bit_rate_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_bit_rate_1;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_pc5_qos_flow_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_sgi_ptp_tunnel_address_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_pgw_fqdn_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_pgw_fqdn_1;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_group_id_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_group_id_1;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_pscell_id_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_up_security_policy_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_alternative_imsi_0;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_imsi;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_cause;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_recovery;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_stn_sr;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_srvcc_cause;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_apn;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_ambr;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_ebi;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_ip_address;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_mei;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_msisdn;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_indication;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_pco;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_paa;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_bearer_qos;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_flow_qos;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_rat_type;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_serving_network;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_bearer_tft;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_tad;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_uli;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_f_teid;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_tmsi;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_global_cn_id;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_s103pdf;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_s1udf;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_delay_value;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_charging_id;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_charging_characteristics;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_trace_information;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_bearer_flags;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_pdn_type;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_pti;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_mm_context;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_pdu_numbers;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_p_tmsi;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_p_tmsi_signature;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_hop_counter;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_ue_time_zone;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_trace_reference;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_complete_request_message;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_guti;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_f_container;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_f_cause;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_plmn_id;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_target_identification;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_packet_flow_id;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_rab_context;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_source_rnc_pdcp_context_info;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_port_number;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_apn_restriction;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_selection_mode;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_source_identification;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_change_reporting_action;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_fq_csid;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_channel_needed;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_emlpp_priority;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_node_type;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_fqdn;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_ti;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_mbms_session_duration;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_mbms_service_area;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_mbms_session_identifier;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_mbms_flow_identifier;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_mbms_ip_multicast_distribution;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_mbms_distribution_acknowledge;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_rfsp_index;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_uci;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_csg_information_reporting_action;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_csg_id;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_cmi;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_service_indicator;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_detach_type;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_ldn;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_node_features;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_mbms_time_to_data_transfer;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_throttling;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_arp;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_epc_timer;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_signalling_priority_indication;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_tmgi;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_additional_mm_context_for_srvcc;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_additional_flags_for_srvcc;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_mdt_configuration;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_apco;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_absolute_time_of_mbms_data_transfer;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_enb_information_reporting;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_ip4cp;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_change_to_report_flags;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_action_indication;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_twan_identifier;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_uli_timestamp;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_mbms_flags;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_ran_nas_cause;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_cn_operator_selection_entity;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_twmi;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_node_number;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_node_identifier;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_presence_reporting_area_action;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_presence_reporting_area_information;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_twan_identifier_timestamp;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_metric;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_sequence_number;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_apn_and_relative_capacity;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_wlan_offloadability_indication;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_paging_and_service_information;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_integer_number;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_millisecond_time_stamp;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_monitoring_event_information;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_ecgi_list;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_remote_user_id;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_remote_ue_ip_information;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_ciot_optimizations_support_indication;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_header_compression_configuration;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_epco;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_serving_plmn_rate_control;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_counter;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_mapped_ue_usage_type;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_secondary_rat_usage_data_report;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_up_function_selection_indication_flags;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_maximum_packet_loss_rate;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_apn_rate_control_status;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_extended_trace_information;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_monitoring_event_extension_information;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_additional_rrm_policy_index;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_services_authorized;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_bit_rate;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_pc5_qos_flow;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_sgi_ptp_tunnel_address;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_pgw_fqdn;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_group_id;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_pscell_id;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_up_security_policy;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_alternative_imsi;
 
 /* Group Information Element TLV Descriptor */
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_pc5_qos_parameters_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_remote_ue_context_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_pgw_change_info_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_v2x_context_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_bearer_context_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_bearer_context_1;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_pdn_connection_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_overload_control_information_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_overload_control_information_1;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_overload_control_information_2;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_load_control_information_0;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_load_control_information_1;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_load_control_information_2;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_scef_pdn_connection_0;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_pc5_qos_parameters;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_remote_ue_context;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_pgw_change_info;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_v2x_context;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_bearer_context;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_pdn_connection;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_overload_control_information;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_load_control_information;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_scef_pdn_connection;
 
 /* Message Descriptor */
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_echo_request;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_echo_response;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_version_not_supported_indication;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_create_session_request;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_create_session_response;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_modify_bearer_request;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_modify_bearer_response;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_delete_session_request;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_delete_session_response;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_change_notification_request;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_change_notification_response;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_remote_ue_report_notification;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_remote_ue_report_acknowledge;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_modify_bearer_command;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_modify_bearer_failure_indication;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_delete_bearer_command;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_delete_bearer_failure_indication;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_bearer_resource_command;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_bearer_resource_failure_indication;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_downlink_data_notification_failure_indication;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_trace_session_activation;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_trace_session_deactivation;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_stop_paging_indication;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_create_bearer_request;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_create_bearer_response;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_update_bearer_request;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_update_bearer_response;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_delete_bearer_request;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_delete_bearer_response;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_delete_pdn_connection_set_request;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_delete_pdn_connection_set_response;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_pgw_downlink_triggering_notification;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_pgw_downlink_triggering_acknowledge;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_create_forwarding_tunnel_request;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_create_forwarding_tunnel_response;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_suspend_notification;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_suspend_acknowledge;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_resume_notification;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_resume_acknowledge;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_create_indirect_data_forwarding_tunnel_request;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_create_indirect_data_forwarding_tunnel_response;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_delete_indirect_data_forwarding_tunnel_request;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_delete_indirect_data_forwarding_tunnel_response;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_release_access_bearers_request;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_release_access_bearers_response;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_downlink_data_notification;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_downlink_data_notification_acknowledge;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_pgw_restart_notification;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_pgw_restart_notification_acknowledge;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_update_pdn_connection_set_request;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_update_pdn_connection_set_response;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_modify_access_bearers_request;
-extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_modify_access_bearers_response;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_echo_request;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_echo_response;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_version_not_supported_indication;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_create_session_request;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_create_session_response;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_modify_bearer_request;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_modify_bearer_response;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_delete_session_request;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_delete_session_response;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_change_notification_request;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_change_notification_response;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_remote_ue_report_notification;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_remote_ue_report_acknowledge;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_modify_bearer_command;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_modify_bearer_failure_indication;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_delete_bearer_command;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_delete_bearer_failure_indication;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_bearer_resource_command;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_bearer_resource_failure_indication;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_downlink_data_notification_failure_indication;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_trace_session_activation;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_trace_session_deactivation;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_stop_paging_indication;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_create_bearer_request;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_create_bearer_response;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_update_bearer_request;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_update_bearer_response;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_delete_bearer_request;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_delete_bearer_response;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_delete_pdn_connection_set_request;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_delete_pdn_connection_set_response;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_pgw_downlink_triggering_notification;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_pgw_downlink_triggering_acknowledge;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_create_forwarding_tunnel_request;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_create_forwarding_tunnel_response;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_suspend_notification;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_suspend_acknowledge;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_resume_notification;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_resume_acknowledge;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_create_indirect_data_forwarding_tunnel_request;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_create_indirect_data_forwarding_tunnel_response;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_delete_indirect_data_forwarding_tunnel_request;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_delete_indirect_data_forwarding_tunnel_response;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_release_access_bearers_request;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_release_access_bearers_response;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_downlink_data_notification;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_downlink_data_notification_acknowledge;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_pgw_restart_notification;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_pgw_restart_notification_acknowledge;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_update_pdn_connection_set_request;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_update_pdn_connection_set_response;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_modify_access_bearers_request;
+extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_modify_access_bearers_response;
 
 /* Structure for Information Element */
 typedef ogs_tlv_octet_t ogs_gtp2_tlv_imsi_t;
@@ -1300,6 +1262,75 @@ typedef struct ogs_gtp2_modify_access_bearers_response_s {
     ogs_gtp2_tlv_overload_control_information_t sgw_s_overload_control_information;
 } ogs_gtp2_modify_access_bearers_response_t;
 
+/*
+ * The most ogs_tlv_t nodes a message takes from the pool of
+ * ogs_tlv_get() to be parsed or built, and how deep its IEs nest.
+ */
+#define OGS_GTP2_ECHO_REQUEST_MAX_TLV 2
+#define OGS_GTP2_ECHO_REQUEST_MAX_TLV_DEPTH 1
+#define OGS_GTP2_ECHO_RESPONSE_MAX_TLV 2
+#define OGS_GTP2_ECHO_RESPONSE_MAX_TLV_DEPTH 1
+#define OGS_GTP2_CREATE_SESSION_REQUEST_MAX_TLV (103 + OGS_BEARER_PER_UE * 27)
+#define OGS_GTP2_CREATE_SESSION_REQUEST_MAX_TLV_DEPTH 2
+#define OGS_GTP2_CREATE_SESSION_RESPONSE_MAX_TLV (90 + OGS_BEARER_PER_UE * 27)
+#define OGS_GTP2_CREATE_SESSION_RESPONSE_MAX_TLV_DEPTH 2
+#define OGS_GTP2_MODIFY_BEARER_REQUEST_MAX_TLV (72 + OGS_BEARER_PER_UE * 27)
+#define OGS_GTP2_MODIFY_BEARER_REQUEST_MAX_TLV_DEPTH 2
+#define OGS_GTP2_MODIFY_BEARER_RESPONSE_MAX_TLV (77 + OGS_BEARER_PER_UE * 27)
+#define OGS_GTP2_MODIFY_BEARER_RESPONSE_MAX_TLV_DEPTH 2
+#define OGS_GTP2_DELETE_SESSION_REQUEST_MAX_TLV 35
+#define OGS_GTP2_DELETE_SESSION_REQUEST_MAX_TLV_DEPTH 2
+#define OGS_GTP2_DELETE_SESSION_RESPONSE_MAX_TLV 28
+#define OGS_GTP2_DELETE_SESSION_RESPONSE_MAX_TLV_DEPTH 2
+#define OGS_GTP2_MODIFY_BEARER_COMMAND_MAX_TLV 44
+#define OGS_GTP2_MODIFY_BEARER_COMMAND_MAX_TLV_DEPTH 2
+#define OGS_GTP2_MODIFY_BEARER_FAILURE_INDICATION_MAX_TLV 13
+#define OGS_GTP2_MODIFY_BEARER_FAILURE_INDICATION_MAX_TLV_DEPTH 2
+#define OGS_GTP2_DELETE_BEARER_COMMAND_MAX_TLV 43
+#define OGS_GTP2_DELETE_BEARER_COMMAND_MAX_TLV_DEPTH 2
+#define OGS_GTP2_DELETE_BEARER_FAILURE_INDICATION_MAX_TLV 40
+#define OGS_GTP2_DELETE_BEARER_FAILURE_INDICATION_MAX_TLV_DEPTH 2
+#define OGS_GTP2_BEARER_RESOURCE_COMMAND_MAX_TLV 27
+#define OGS_GTP2_BEARER_RESOURCE_COMMAND_MAX_TLV_DEPTH 2
+#define OGS_GTP2_BEARER_RESOURCE_FAILURE_INDICATION_MAX_TLV 16
+#define OGS_GTP2_BEARER_RESOURCE_FAILURE_INDICATION_MAX_TLV_DEPTH 2
+#define OGS_GTP2_DOWNLINK_DATA_NOTIFICATION_FAILURE_INDICATION_MAX_TLV 3
+#define OGS_GTP2_DOWNLINK_DATA_NOTIFICATION_FAILURE_INDICATION_MAX_TLV_DEPTH 1
+#define OGS_GTP2_CREATE_BEARER_REQUEST_MAX_TLV 70
+#define OGS_GTP2_CREATE_BEARER_REQUEST_MAX_TLV_DEPTH 2
+#define OGS_GTP2_CREATE_BEARER_RESPONSE_MAX_TLV 60
+#define OGS_GTP2_CREATE_BEARER_RESPONSE_MAX_TLV_DEPTH 2
+#define OGS_GTP2_UPDATE_BEARER_REQUEST_MAX_TLV 70
+#define OGS_GTP2_UPDATE_BEARER_REQUEST_MAX_TLV_DEPTH 2
+#define OGS_GTP2_UPDATE_BEARER_RESPONSE_MAX_TLV 61
+#define OGS_GTP2_UPDATE_BEARER_RESPONSE_MAX_TLV_DEPTH 2
+#define OGS_GTP2_DELETE_BEARER_REQUEST_MAX_TLV 70
+#define OGS_GTP2_DELETE_BEARER_REQUEST_MAX_TLV_DEPTH 2
+#define OGS_GTP2_DELETE_BEARER_RESPONSE_MAX_TLV 63
+#define OGS_GTP2_DELETE_BEARER_RESPONSE_MAX_TLV_DEPTH 2
+#define OGS_GTP2_CREATE_INDIRECT_DATA_FORWARDING_TUNNEL_REQUEST_MAX_TLV (5 + OGS_BEARER_PER_UE * 27)
+#define OGS_GTP2_CREATE_INDIRECT_DATA_FORWARDING_TUNNEL_REQUEST_MAX_TLV_DEPTH 2
+#define OGS_GTP2_CREATE_INDIRECT_DATA_FORWARDING_TUNNEL_RESPONSE_MAX_TLV (3 + OGS_BEARER_PER_UE * 27)
+#define OGS_GTP2_CREATE_INDIRECT_DATA_FORWARDING_TUNNEL_RESPONSE_MAX_TLV_DEPTH 2
+#define OGS_GTP2_DELETE_INDIRECT_DATA_FORWARDING_TUNNEL_REQUEST_MAX_TLV 0
+#define OGS_GTP2_DELETE_INDIRECT_DATA_FORWARDING_TUNNEL_REQUEST_MAX_TLV_DEPTH 0
+#define OGS_GTP2_DELETE_INDIRECT_DATA_FORWARDING_TUNNEL_RESPONSE_MAX_TLV 2
+#define OGS_GTP2_DELETE_INDIRECT_DATA_FORWARDING_TUNNEL_RESPONSE_MAX_TLV_DEPTH 1
+#define OGS_GTP2_RELEASE_ACCESS_BEARERS_REQUEST_MAX_TLV 5
+#define OGS_GTP2_RELEASE_ACCESS_BEARERS_REQUEST_MAX_TLV_DEPTH 1
+#define OGS_GTP2_RELEASE_ACCESS_BEARERS_RESPONSE_MAX_TLV 12
+#define OGS_GTP2_RELEASE_ACCESS_BEARERS_RESPONSE_MAX_TLV_DEPTH 2
+#define OGS_GTP2_DOWNLINK_DATA_NOTIFICATION_MAX_TLV 17
+#define OGS_GTP2_DOWNLINK_DATA_NOTIFICATION_MAX_TLV_DEPTH 2
+#define OGS_GTP2_DOWNLINK_DATA_NOTIFICATION_ACKNOWLEDGE_MAX_TLV 7
+#define OGS_GTP2_DOWNLINK_DATA_NOTIFICATION_ACKNOWLEDGE_MAX_TLV_DEPTH 1
+#define OGS_GTP2_MODIFY_ACCESS_BEARERS_REQUEST_MAX_TLV 60
+#define OGS_GTP2_MODIFY_ACCESS_BEARERS_REQUEST_MAX_TLV_DEPTH 2
+#define OGS_GTP2_MODIFY_ACCESS_BEARERS_RESPONSE_MAX_TLV 66
+#define OGS_GTP2_MODIFY_ACCESS_BEARERS_RESPONSE_MAX_TLV_DEPTH 2
+#define OGS_GTP2_MAX_TLV OGS_GTP2_CREATE_SESSION_REQUEST_MAX_TLV
+#define OGS_GTP2_MAX_TLV_DEPTH 2
+
 typedef struct ogs_gtp2_message_s {
    ogs_gtp2_header_t h;
    union {
@@ -1340,6 +1371,168 @@ typedef struct ogs_gtp2_message_s {
 int ogs_gtp2_parse_msg(ogs_gtp2_message_t *gtp2_message, ogs_pkbuf_t *pkbuf);
 ogs_pkbuf_t *ogs_gtp2_build_msg(ogs_gtp2_message_t *gtp2_message);
 
+/*
+ * Look at a message before ogs_gtp2_parse_msg(), e.g. to route or drop it.
+ * ogs_gtp2_peek() checks the header and gets the message type and the TEID
+ * (0 without one). ogs_gtp2_peek_ies() walks the top-level IEs once and
+ * sets the offset in the pkbuf and the length of each requested type and
+ * instance, leaving -1 for the absent ones; an IE requested twice gets its
+ * first and second occurrences. It returns how many were found.
+ * ogs_gtp2_peek_<ie>() returns the offset of a single IE, or OGS_ERROR if
+ * it is absent.
+ */
+typedef struct ogs_gtp2_peek_s {
+    uint8_t type;
+    uint8_t instance;
+    uint16_t length;
+    int offset;
+} ogs_gtp2_peek_t;
+
+int ogs_gtp2_peek(ogs_pkbuf_t *pkbuf, uint8_t *type, uint32_t *teid);
+int ogs_gtp2_peek_ies(ogs_pkbuf_t *pkbuf, ogs_gtp2_peek_t *ies, int num);
+int ogs_gtp2_peek_imsi(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_cause(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_recovery(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_apn(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_ambr(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_ebi(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_ip_address(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_mei(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_msisdn(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_indication(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_pco(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_paa(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_flow_qos(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_rat_type(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_serving_network(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_tad(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_uli(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_f_teid(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_delay_value(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_bearer_context(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_charging_id(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_charging_characteristics(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_trace_information(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_pdn_type(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_pti(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_ue_time_zone(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_f_container(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_port_number(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_apn_restriction(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_selection_mode(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_change_reporting_action(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_fq_csid(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_node_type(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_fqdn(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_uci(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_csg_information_reporting_action(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_ldn(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_node_features(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_throttling(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_arp(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_epc_timer(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_signalling_priority_indication(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_apco(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_enb_information_reporting(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_ip4cp(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_twan_identifier(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_uli_timestamp(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_ran_nas_cause(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_cn_operator_selection_entity(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_twmi(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_node_identifier(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_presence_reporting_area_action(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_presence_reporting_area_information(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_twan_identifier_timestamp(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_overload_control_information(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_load_control_information(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_paging_and_service_information(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_integer_number(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_millisecond_time_stamp(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_remote_ue_context(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_epco(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_serving_plmn_rate_control(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_counter(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_mapped_ue_usage_type(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_secondary_rat_usage_data_report(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_up_function_selection_indication_flags(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_apn_rate_control_status(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_sgi_ptp_tunnel_address(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_pgw_change_info(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_pscell_id(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+int ogs_gtp2_peek_up_security_policy(
+        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);
+
 #ifdef __cplusplus
 }
 #endif
@@ -1,8 +0,0 @@
-ies = []
-ies.append({ "ie_type" : "IMSI", "ie_value" : "IMSI", "presence" : "C", "instance" : "0", "comment" : "This IE shall be included by the MME/SGSN if the SGW that the MME/SGSN selects for indirect data forwarding is different from the SGW already in use for the UE as the anchor point except for the case:-	If the UE is emergency or RLOS attached and the UE is UICClessWhen the IMSI is included in the message, it is not used as an identifier-	if UE is emergency or RLOS attached but IMSI is not authenticated.See NOTE1."})
-ies.append({ "ie_type" : "MEI", "ie_value" : "ME Identity", "presence" : "C", "instance" : "0", "comment" : "This IE shall be included by the MME/SGSN if the SGW that the MME/SGSN selects for indirect data forwarding is different from the SGW already in use for the UE as the anchor point and if one of the following condition is satisfied:-	If the UE is emergency or RLOS attached and the UE is UICCless; or-	If the UE is emergency or RLOS attached and the IMSI is not authenticated"})
-ies.append({ "ie_type" : "Indication", "ie_value" : "Indication Flags", "presence" : "CO", "instance" : "0", "comment" : "This IE shall be included if any one of the applicable flags is set to 1.Applicable flags are:Unauthenticated IMSI: This flag shall be set to 1 if the IMSI present in the message is not authenticated and is for an emergency or RLOS attached UE.Indirect Data Forwarding with UPF Indication: This flag shall be set to 1 if indirect data forwarding is required for user plane routes from UPF in the 5GS to EPS handover procedure or to UPF in the EPS to 5GS handover procedure. This flag shall not be set to 1 if indirect data forwarding is used for other mobility procedures. See NOTE 2."})
-ies.append({ "ie_type" : "F-TEID", "ie_value" : "Sender F-TEID for Control Plane", "presence" : "C", "instance" : "0", "comment" : "This IE shall be included by the MME/SGSN if the SGW that the MME/SGSN selects for indirect data forwarding is different from the SGW already in use for the UE as the anchor point.See NOTE1."})
-ies.append({ "ie_type" : "Bearer Context", "ie_value" : "Bearer Contexts", "presence" : "M", "instance" : "0", "comment" : "Several IEs with this type and instance value may be included as necessary to represent a list of Bearers"})
-ies.append({ "ie_type" : "Recovery", "ie_value" : "Recovery", "presence" : "CO", "instance" : "0", "comment" : "This IE shall be included if contacting the peer for the first time."})
-msg_list[key]["ies"] = ies
@@ -1,2 +0,0 @@
-ies = []
-msg_list[key]["ies"] = ies
@@ -1,54 +0,0 @@
-# [Table 6.1-1: Message types for GTPv2] Index = 7
-msg_list["Echo Request"] = { "type" : "1" }
-msg_list["Echo Response"] = { "type" : "2" }
-msg_list["Version Not Supported Indication"] = { "type" : "3" }
-msg_list["Create Session Request"] = { "type" : "32" }
-msg_list["Create Session Response"] = { "type" : "33" }
-msg_list["Delete Session Request"] = { "type" : "36" }
-msg_list["Delete Session Response"] = { "type" : "37" }
-msg_list["Modify Bearer Request"] = { "type" : "34" }
-msg_list["Modify Bearer Response"] = { "type" : "35" }
-msg_list["Remote UE Report Notification"] = { "type" : "40" }
-msg_list["Remote UE Report Acknowledge"] = { "type" : "41" }
-msg_list["Change Notification Request"] = { "type" : "38" }
-msg_list["Change Notification Response"] = { "type" : "39" }
-msg_list["Resume Notification"] = { "type" : "164" }
-msg_list["Resume Acknowledge"] = { "type" : "165" }
-msg_list["Modify Bearer Command"] = { "type" : "64" }
-msg_list["Modify Bearer Failure Indication"] = { "type" : "65" }
-msg_list["Delete Bearer Command"] = { "type" : "66" }
-msg_list["Delete Bearer Failure Indication"] = { "type" : "67" }
-msg_list["Bearer Resource Command"] = { "type" : "68" }
-msg_list["Bearer Resource Failure Indication"] = { "type" : "69" }
-msg_list["Downlink Data Notification Failure Indication"] = { "type" : "70" }
-msg_list["Trace Session Activation"] = { "type" : "71" }
-msg_list["Trace Session Deactivation"] = { "type" : "72" }
-msg_list["Stop Paging Indication"] = { "type" : "73" }
-msg_list["Create Bearer Request"] = { "type" : "95" }
-msg_list["Create Bearer Response"] = { "type" : "96" }
-msg_list["Update Bearer Request"] = { "type" : "97" }
-msg_list["Update Bearer Response"] = { "type" : "98" }
-msg_list["Delete Bearer Request"] = { "type" : "99" }
-msg_list["Delete Bearer Response"] = { "type" : "100" }
-msg_list["Delete PDN Connection Set Request"] = { "type" : "101" }
-msg_list["Delete PDN Connection Set Response"] = { "type" : "102" }
-msg_list["PGW Downlink Triggering Notification"] = { "type" : "103" }
-msg_list["PGW Downlink Triggering Acknowledge"] = { "type" : "104" }
-msg_list["Suspend Notification"] = { "type" : "162" }
-msg_list["Suspend Acknowledge"] = { "type" : "163" }
-msg_list["Create Forwarding Tunnel Request"] = { "type" : "160" }
-msg_list["Create Forwarding Tunnel Response"] = { "type" : "161" }
-msg_list["Create Indirect Data Forwarding Tunnel Request"] = { "type" : "166" }
-msg_list["Create Indirect Data Forwarding Tunnel Response"] = { "type" : "167" }
-msg_list["Delete Indirect Data Forwarding Tunnel Request"] = { "type" : "168" }
-msg_list["Delete Indirect Data Forwarding Tunnel Response"] = { "type" : "169" }
-msg_list["Release Access Bearers Request"] = { "type" : "170" }
-msg_list["Release Access Bearers Response"] = { "type" : "171" }
-msg_list["Downlink Data Notification"] = { "type" : "176" }
-msg_list["Downlink Data Notification Acknowledge"] = { "type" : "177" }
-msg_list["PGW Restart Notification"] = { "type" : "179" }
-msg_list["PGW Restart Notification Acknowledge"] = { "type" : "180" }
-msg_list["Update PDN Connection Set Request"] = { "type" : "200" }
-msg_list["Update PDN Connection Set Response"] = { "type" : "201" }
-msg_list["Modify Access Bearers Request"] = { "type" : "211" }
-msg_list["Modify Access Bearers Response"] = { "type" : "212" }
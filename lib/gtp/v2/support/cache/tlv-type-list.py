@@ -1,143 +0,0 @@
-# [Table 8.1-1: Information Element types for GTPv2] Index = 166
-type_list["IMSI"] = { "type" : "1", "max_instance" : "0" }
-type_list["Cause"] = { "type" : "2", "max_instance" : "0" }
-type_list["Recovery"] = { "type" : "3", "max_instance" : "0" }
-type_list["STN-SR"] = { "type" : "51", "max_instance" : "0" }
-type_list["SRVCC Cause"] = { "type" : "56", "max_instance" : "0" }
-type_list["APN"] = { "type" : "71", "max_instance" : "0" }
-type_list["AMBR"] = { "type" : "72", "max_instance" : "0" }
-type_list["EBI"] = { "type" : "73", "max_instance" : "0" }
-type_list["IP Address"] = { "type" : "74", "max_instance" : "0" }
-type_list["MEI"] = { "type" : "75", "max_instance" : "0" }
-type_list["MSISDN"] = { "type" : "76", "max_instance" : "0" }
-type_list["Indication"] = { "type" : "77", "max_instance" : "0" }
-type_list["PCO"] = { "type" : "78", "max_instance" : "0" }
-type_list["PAA"] = { "type" : "79", "max_instance" : "0" }
-type_list["Bearer QoS"] = { "type" : "80", "max_instance" : "0" }
-type_list["Flow QoS"] = { "type" : "81", "max_instance" : "0" }
-type_list["RAT Type"] = { "type" : "82", "max_instance" : "0" }
-type_list["Serving Network"] = { "type" : "83", "max_instance" : "0" }
-type_list["Bearer TFT"] = { "type" : "84", "max_instance" : "0" }
-type_list["TAD"] = { "type" : "85", "max_instance" : "0" }
-type_list["ULI"] = { "type" : "86", "max_instance" : "0" }
-type_list["F-TEID"] = { "type" : "87", "max_instance" : "0" }
-type_list["TMSI"] = { "type" : "88", "max_instance" : "0" }
-type_list["Global CN-Id"] = { "type" : "89", "max_instance" : "0" }
-type_list["S103PDF"] = { "type" : "90", "max_instance" : "0" }
-type_list["S1UDF"] = { "type" : "91", "max_instance" : "0" }
-type_list["Delay Value"] = { "type" : "92", "max_instance" : "0" }
-type_list["Bearer Context"] = { "type" : "93", "max_instance" : "0" }
-type_list["Charging ID"] = { "type" : "94", "max_instance" : "0" }
-type_list["Charging Characteristics"] = { "type" : "95", "max_instance" : "0" }
-type_list["Trace Information"] = { "type" : "96", "max_instance" : "0" }
-type_list["Bearer Flags"] = { "type" : "97", "max_instance" : "0" }
-type_list["PDN Type"] = { "type" : "99", "max_instance" : "0" }
-type_list["PTI"] = { "type" : "100", "max_instance" : "0" }
-type_list["PDN Connection"] = { "type" : "109", "max_instance" : "0" }
-type_list["PDU Numbers"] = { "type" : "110", "max_instance" : "0" }
-type_list["P-TMSI"] = { "type" : "111", "max_instance" : "0" }
-type_list["P-TMSI Signature"] = { "type" : "112", "max_instance" : "0" }
-type_list["Hop Counter"] = { "type" : "113", "max_instance" : "0" }
-type_list["UE Time Zone"] = { "type" : "114", "max_instance" : "0" }
-type_list["Trace Reference"] = { "type" : "115", "max_instance" : "0" }
-type_list["Complete Request Message"] = { "type" : "116", "max_instance" : "0" }
-type_list["GUTI"] = { "type" : "117", "max_instance" : "0" }
-type_list["F-Container"] = { "type" : "118", "max_instance" : "0" }
-type_list["F-Cause"] = { "type" : "119", "max_instance" : "0" }
-type_list["PLMN ID"] = { "type" : "120", "max_instance" : "0" }
-type_list["Target Identification"] = { "type" : "121", "max_instance" : "0" }
-type_list["Packet Flow ID"] = { "type" : "123", "max_instance" : "0" }
-type_list["RAB Context"] = { "type" : "124", "max_instance" : "0" }
-type_list["Source RNC PDCP Context Info"] = { "type" : "125", "max_instance" : "0" }
-type_list["Port Number"] = { "type" : "126", "max_instance" : "0" }
-type_list["APN Restriction"] = { "type" : "127", "max_instance" : "0" }
-type_list["Selection Mode"] = { "type" : "128", "max_instance" : "0" }
-type_list["Source Identification"] = { "type" : "129", "max_instance" : "0" }
-type_list["Change Reporting Action"] = { "type" : "131", "max_instance" : "0" }
-type_list["FQ-CSID"] = { "type" : "132", "max_instance" : "0" }
-type_list["Channel needed"] = { "type" : "133", "max_instance" : "0" }
-type_list["eMLPP Priority"] = { "type" : "134", "max_instance" : "0" }
-type_list["Node Type"] = { "type" : "135", "max_instance" : "0" }
-type_list["FQDN"] = { "type" : "136", "max_instance" : "0" }
-type_list["TI"] = { "type" : "137", "max_instance" : "0" }
-type_list["MBMS Session Duration"] = { "type" : "138", "max_instance" : "0" }
-type_list["MBMS Service Area"] = { "type" : "139", "max_instance" : "0" }
-type_list["MBMS Session Identifier"] = { "type" : "140", "max_instance" : "0" }
-type_list["MBMS Flow Identifier"] = { "type" : "141", "max_instance" : "0" }
-type_list["MBMS IP Multicast Distribution"] = { "type" : "142", "max_instance" : "0" }
-type_list["MBMS Distribution Acknowledge"] = { "type" : "143", "max_instance" : "0" }
-type_list["RFSP Index"] = { "type" : "144", "max_instance" : "0" }
-type_list["UCI"] = { "type" : "145", "max_instance" : "0" }
-type_list["CSG Information Reporting Action"] = { "type" : "146", "max_instance" : "0" }
-type_list["CSG ID"] = { "type" : "147", "max_instance" : "0" }
-type_list["CMI"] = { "type" : "148", "max_instance" : "0" }
-type_list["Service indicator"] = { "type" : "149", "max_instance" : "0" }
-type_list["Detach Type"] = { "type" : "150", "max_instance" : "0" }
-type_list["LDN"] = { "type" : "151", "max_instance" : "0" }
-type_list["Node Features"] = { "type" : "152", "max_instance" : "0" }
-type_list["MBMS Time to Data Transfer"] = { "type" : "153", "max_instance" : "0" }
-type_list["Throttling"] = { "type" : "154", "max_instance" : "0" }
-type_list["ARP"] = { "type" : "155", "max_instance" : "0" }
-type_list["EPC Timer"] = { "type" : "156", "max_instance" : "0" }
-type_list["Signalling Priority Indication"] = { "type" : "157", "max_instance" : "0" }
-type_list["TMGI"] = { "type" : "158", "max_instance" : "0" }
-type_list["Additional MM context for SRVCC"] = { "type" : "159", "max_instance" : "0" }
-type_list["Additional flags for SRVCC"] = { "type" : "160", "max_instance" : "0" }
-type_list["MDT Configuration"] = { "type" : "162", "max_instance" : "0" }
-type_list["APCO"] = { "type" : "163", "max_instance" : "0" }
-type_list["Absolute Time of MBMS Data Transfer"] = { "type" : "164", "max_instance" : "0" }
-type_list["eNB Information Reporting"] = { "type" : "165", "max_instance" : "0" }
-type_list["IP4CP"] = { "type" : "166", "max_instance" : "0" }
-type_list["Change to Report Flags"] = { "type" : "167", "max_instance" : "0" }
-type_list["Action Indication"] = { "type" : "168", "max_instance" : "0" }
-type_list["TWAN Identifier"] = { "type" : "169", "max_instance" : "0" }
-type_list["ULI Timestamp"] = { "type" : "170", "max_instance" : "0" }
-type_list["MBMS Flags"] = { "type" : "171", "max_instance" : "0" }
-type_list["RAN/NAS Cause"] = { "type" : "172", "max_instance" : "0" }
-type_list["CN Operator Selection Entity"] = { "type" : "173", "max_instance" : "0" }
-type_list["TWMI"] = { "type" : "174", "max_instance" : "0" }
-type_list["Node Number"] = { "type" : "175", "max_instance" : "0" }
-type_list["Node Identifier"] = { "type" : "176", "max_instance" : "0" }
-type_list["Presence Reporting Area Action"] = { "type" : "177", "max_instance" : "0" }
-type_list["Presence Reporting Area Information"] = { "type" : "178", "max_instance" : "0" }
-type_list["TWAN Identifier Timestamp"] = { "type" : "179", "max_instance" : "0" }
-type_list["Overload Control Information"] = { "type" : "180", "max_instance" : "0" }
-type_list["Load Control Information"] = { "type" : "181", "max_instance" : "0" }
-type_list["Metric"] = { "type" : "182", "max_instance" : "0" }
-type_list["Sequence Number"] = { "type" : "183", "max_instance" : "0" }
-type_list["APN and Relative Capacity"] = { "type" : "184", "max_instance" : "0" }
-type_list["WLAN Offloadability Indication"] = { "type" : "185", "max_instance" : "0" }
-type_list["Paging and Service Information"] = { "type" : "186", "max_instance" : "0" }
-type_list["Integer Number"] = { "type" : "187", "max_instance" : "0" }
-type_list["Millisecond Time Stamp"] = { "type" : "188", "max_instance" : "0" }
-type_list["Monitoring Event Information"] = { "type" : "189", "max_instance" : "0" }
-type_list["ECGI List"] = { "type" : "190", "max_instance" : "0" }
-type_list["Remote UE Context"] = { "type" : "191", "max_instance" : "0" }
-type_list["Remote User ID"] = { "type" : "192", "max_instance" : "0" }
-type_list["Remote UE IP Information"] = { "type" : "193", "max_instance" : "0" }
-type_list["CIoT Optimizations Support Indication"] = { "type" : "194", "max_instance" : "0" }
-type_list["SCEF PDN Connection"] = { "type" : "195", "max_instance" : "0" }
-type_list["Header Compression Configuration"] = { "type" : "196", "max_instance" : "0" }
-type_list["ePCO"] = { "type" : "197", "max_instance" : "0" }
-type_list["Serving PLMN Rate Control"] = { "type" : "198", "max_instance" : "0" }
-type_list["Counter"] = { "type" : "199", "max_instance" : "0" }
-type_list["Mapped UE Usage Type"] = { "type" : "200", "max_instance" : "0" }
-type_list["Secondary RAT Usage Data Report"] = { "type" : "201", "max_instance" : "0" }
-type_list["UP Function Selection Indication Flags"] = { "type" : "202", "max_instance" : "0" }
-type_list["Maximum Packet Loss Rate"] = { "type" : "203", "max_instance" : "0" }
-type_list["APN Rate Control Status"] = { "type" : "204", "max_instance" : "0" }
-type_list["Extended Trace Information"] = { "type" : "205", "max_instance" : "0" }
-type_list["Monitoring Event Extension Information"] = { "type" : "206", "max_instance" : "0" }
-type_list["Additional RRM Policy Index"] = { "type" : "207", "max_instance" : "0" }
-type_list["V2X Context"] = { "type" : "208", "max_instance" : "0" }
-type_list["PC5 QoS Parameters"] = { "type" : "209", "max_instance" : "0" }
-type_list["Services Authorized"] = { "type" : "210", "max_instance" : "0" }
-type_list["Bit Rate"] = { "type" : "211", "max_instance" : "0" }
-type_list["PC5 QoS Flow"] = { "type" : "212", "max_instance" : "0" }
-type_list["SGi PtP Tunnel Address"] = { "type" : "213", "max_instance" : "0" }
-type_list["PGW Change Info"] = { "type" : "214", "max_instance" : "0" }
-type_list["PGW FQDN"] = { "type" : "215", "max_instance" : "0" }
-type_list["Group Id"] = { "type" : "216", "max_instance" : "0" }
-type_list["PSCell ID"] = { "type" : "217", "max_instance" : "0" }
-type_list["UP Security Policy"] = { "type" : "218", "max_instance" : "0" }
-type_list["Alternative IMSI"] = { "type" : "219", "max_instance" : "0" }
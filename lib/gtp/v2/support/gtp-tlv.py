@@ -15,17 +15,14 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from docx import Document
-from docx.document import Document as _Document
-from docx.oxml.text.paragraph import CT_P
-from docx.oxml.table import CT_Tbl
-from docx.table import _Cell, Table
-from docx.text.paragraph import Paragraph
-
 import re, os, sys, string
-import datetime
 import getopt
-import getpass
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+    '..', '..', '..', 'core', 'support'))
+from ogsgen import SpecIndex, Cache, Output, source_sha256, stamp, \
+    write_desc_index, write_size_report, write_bench_prologue, \
+    write_bench_tlv, write_bench_main, Corpus, VARIANTS, tlv_octets, memoize, Profile
 
 version = "0.1.0"
 
@@ -37,6 +34,15 @@ verbosity = 0
 filename = ""
 outdir = './'
 cachedir = './cache/'
+cache_ro = []
+reproducible = False
+depfile = None
+jobs = 1
+sizes = None
+bench = None
+corpus = None
+profiling = False
+pstats = None
 
 FAIL = '\033[91m'
 INFO = '\033[93m'
@@ -58,7 +64,6 @@ def write_file(f, string):
     d_print(string)
 
 def output_header_to_file(f):
-    now = datetime.datetime.now()
     f.write("""/*
  * Copyright (C) 2019-2023 by Sukchan Lee <acetcom@gmail.com>
  *
@@ -82,7 +87,7 @@ def output_header_to_file(f):
     f.write("/*******************************************************************************\n")
     f.write(" * This file had been created by gtp-tlv.py script v%s\n" % (version))
     f.write(" * Please do not modify this file but regenerate it via script.\n")
-    f.write(" * Created on: %s by %s\n * from %s\n" % (str(now), getpass.getuser(), filename))
+    f.write(stamp(filename, reproducible))
     f.write(" ******************************************************************************/\n\n")
 
 def usage():
@@ -93,19 +98,30 @@ def usage():
     print("-f [file] Input file to parse")
     print("-o [dir]  Output files to given directory")
     print("-c [dir]  Cache files to given directory")
+    print("-C [dir]  Also read cache files from dir, never writing there")
+    print("-r        Reproducible output (no date and user in headers)")
+    print("-M [file] Write the files read to a Makefile depfile")
+    print("-j [num]  Extract message tables with num processes")
+    print("-S [file] Write a C program reporting the size of the structures")
+    print("-B [file] Write a C program benchmarking the codec of each message")
+    print("-F [file] Write a seed corpus of the messages for the fuzzers (.zip)")
+    print("-t        Report the time and peak memory of each phase")
+    print("-T [file] Write a cProfile of the run to file (pstats)")
     print("-h        Print this help and return")
 
+@memoize
 def v_upper(v):
     return re.sub('3GPP', '', re.sub('\'', '_', re.sub('/', '_', re.sub('-', '_', re.sub(' ', '_', v)))).upper())
 
+@memoize
 def v_lower(v):
     return re.sub('3gpp', '', re.sub('\'', '_', re.sub('/', '_', re.sub('-', '_', re.sub(' ', '_', v)))).lower())
 
 def get_cells(cells):
-    instance = cells[4].text
+    instance = cells[4]
     if instance.isdigit() is not True:
         return None
-    ie_type = re.sub('\s*$', '', re.sub('\s*\n*\s*\([A-z]*\s*NOTE.*\)*', '', cells[3].text))
+    ie_type = re.sub('\s*$', '', re.sub('\s*\n*\s*\([A-z]*\s*NOTE.*\)*', '', cells[3]))
     if ie_type.find('LDN') != -1:
         ie_type = 'LDN'
     elif ie_type.find('APCO') != -1:
@@ -124,115 +140,35 @@ def get_cells(cells):
         ie_type = 'APN Rate Control Status'
     if ie_type not in type_list.keys():
         assert False, "Unknown IE type : [" \
-                + cells[3].text + "]" + "(" + ie_type + ")"
-    presence = cells[1].text
+                + cells[3] + "]" + "(" + ie_type + ")"
+    presence = cells[1]
     presence = re.sub('\n', '', presence);
-    ie_value = re.sub('\s*\n*\s*\([^\)]*\)*', '', cells[0].text)
+    ie_value = re.sub('\s*\n*\s*\([^\)]*\)*', '', cells[0])
     ie_value = re.sub('\n', '', ie_value);
-    comment = cells[2].text.encode('ascii', 'ignore').decode('utf-8')
+    comment = cells[2].encode('ascii', 'ignore').decode('utf-8')
     comment = re.sub('\n|\"|\'|\\\\', '', comment);
 
-    if int(instance) > int(type_list[ie_type]["max_instance"]):
-        type_list[ie_type]["max_instance"] = instance
-        write_file(f, "type_list[\"" + ie_type + "\"][\"max_instance\"] = \"" + instance + "\"\n")
-
     return { "ie_type" : ie_type, "ie_value" : ie_value, "presence" : presence, "instance" : instance, "comment" : comment }
 
-def write_cells_to_file(name, cells):
-    write_file(f, name + ".append({ \"ie_type\" : \"" + cells["ie_type"] + \
-        "\", \"ie_value\" : \"" + cells["ie_value"] + \
-        "\", \"presence\" : \"" + cells["presence"] + \
-        "\", \"instance\" : \"" + cells["instance"] + \
-        "\", \"comment\" : \"" + cells["comment"] + "\"})\n")
-
-def document_paragraph_tables(document):
+def update_max_instance(ies):
+    for ie in ies:
+        if int(ie["instance"]) > int(type_list[ie["ie_type"]]["max_instance"]):
+            type_list[ie["ie_type"]]["max_instance"] = ie["instance"]
 
+def extract_msg_list():
+    msg_list = {}
     tables = []
-    # iterate .docx objects
-    def iter_block_items(parent):
-
-      if isinstance(parent, _Document):
-          parent_elm = parent.element.body
-      elif isinstance(parent, _Cell):
-          parent_elm = parent._tc
-      elif isinstance(parent, _Row):
-          parent_elm = parent._tr
-      else:
-          raise ValueError("Document format error.")
-
-      for child in parent_elm.iterchildren():
-          if isinstance(child, CT_P):
-              yield Paragraph(child, parent)
-          elif isinstance(child, CT_Tbl):
-              yield Table(child, parent)
-
-    idx = -1
-    paragraph = ''
-    for block in iter_block_items(document):
-        table=[]
-        # memoize the paragraph
-        if isinstance(block, Paragraph):
-          paragraph = block.text
-          continue
-        # fetch the table
-        if isinstance(block, Table):
-            idx += 1
-            table = block
-        # store table having a paragraph name
-        tables.append([idx, paragraph, table])
-
-    return tables
-
-
-try:
-    opts, args = getopt.getopt(sys.argv[1:], "df:ho:c:", ["debug", "file", "help", "output", "cache"])
-except getopt.GetoptError as err:
-    # print help information and exit:
-    usage()
-    sys.exit(2)
-
-for o, a in opts:
-    if o in ("-d", "--debug"):
-        verbosity = 1
-    if o in ("-f", "--file"):
-        filename = a
-    if o in ("-o", "--output"):
-        outdir = a
-        if outdir.rfind('/') != len(outdir):
-            outdir += '/'
-    if o in ("-c", "--cache"):
-        cachedir = a
-        if cachedir.rfind('/') != len(cachedir):
-            cachedir += '/'
-    if o in ("-h", "--help"):
-        usage()
-        sys.exit(2)
-
-if os.path.isfile(filename) and os.access(filename, os.R_OK):
-    file = open(filename, 'r')
-else:
-    d_error("Cannot find file : " + filename)
-
-d_info("[Message List]")
-cachefile = cachedir + 'tlv-msg-list.py'
-if os.path.isfile(cachefile) and os.access(cachefile, os.R_OK):
-    exec(open(cachefile).read())
-    print("Read from " + cachefile)
-else:
-    document = Document(filename)
-    f = open(cachefile, 'w')
 
     msg_table = ""
-    for i, paragraph, table in document_paragraph_tables(document):
-        cell = table.rows[0].cells[0]
-        if cell.text.find('Message Type value') != -1:
+    for i, paragraph, table in spec.paragraph_tables():
+        if spec.header(i)[0].find('Message Type value') != -1:
             msg_table = table
+            tables = [{ "index" : i, "heading" : paragraph }]
             d_print("Table Index = %d Name = [%s]\n" % (i, paragraph))
-            write_file(f, "# [%s] Index = %d\n" % (paragraph, i))
 
-    for row in msg_table.rows[2:-4]:
-        key = row.cells[1].text
-        type = row.cells[0].text
+    for row in msg_table[2:-4]:
+        key = row[1]
+        type = row[0]
         if type.isdigit() is False:
             continue
         if int(type) in range(128, 160):
@@ -244,29 +180,23 @@ else:
         key = re.sub('\s*\n*\s*\([^\)]*\)*', '', key)
         key = re.sub('\n', '', key);
         msg_list[key] = { "type": type }
-        write_file(f, "msg_list[\"" + key + "\"] = { \"type\" : \"" + type + "\" }\n")
-    f.close()
 
-d_info("[IE Type List]")
-cachefile = cachedir + 'tlv-type-list.py'
-if os.path.isfile(cachefile) and os.access(cachefile, os.R_OK):
-    exec(open(cachefile).read())
-    print("Read from " + cachefile)
-else:
-    document = Document(filename)
-    f = open(cachefile, 'w')
+    return msg_list, tables
+
+def extract_type_list():
+    type_list = {}
+    tables = []
 
     ie_table = ""
-    for i, paragraph, table in document_paragraph_tables(document):
-        cell = table.rows[0].cells[0]
-        if cell.text.find('IE Type value') != -1:
+    for i, paragraph, table in spec.paragraph_tables():
+        if spec.header(i)[0].find('IE Type value') != -1:
             ie_table = table
+            tables = [{ "index" : i, "heading" : paragraph }]
             d_print("Table Index = %d Name = [%s]\n" % (i, paragraph))
-            write_file(f, "# [%s] Index = %d\n" % (paragraph, i))
 
-    for row in ie_table.rows[1:-5]:
-        key = row.cells[1].text
-        type = row.cells[0].text
+    for row in ie_table[1:-5]:
+        key = row[1]
+        type = row[0]
         if type.isdigit() is False:
             continue
         if key.find('Reserved') != -1:
@@ -286,44 +216,35 @@ else:
         elif key.find('Procedure Transaction ID') != -1:
             key = 'PTI'
         else:
-            key = re.sub('.*\(', '', row.cells[1].text)
+            key = re.sub('.*\(', '', row[1])
             key = re.sub('\)', '', key)
             key = re.sub('\s*$', '', key)
 
         type_list[key] = { "type": type , "max_instance" : "0" }
-        write_file(f, "type_list[\"" + key + "\"] = { \"type\" : \"" + type)
-        write_file(f, "\", \"max_instance\" : \"0\" }\n")
-    f.close()
-type_list['MM Context'] = { "type": "107", "max_instance" : "0" }
 
-d_info("[Group IE List]")
-cachefile = cachedir + 'tlv-group-list.py'
-if os.path.isfile(cachefile) and os.access(cachefile, os.R_OK):
-    exec(open(cachefile).read())
-    print("Read from " + cachefile)
-else:
-    document = Document(filename)
-    f = open(cachefile, 'w')
+    return type_list, tables
 
-    for i, paragraph, table in document_paragraph_tables(document):
-        if table.rows[0].cells[0].text.find('Octet') != -1 and \
-            table.rows[0].cells[2].text.find('IE Type') != -1:
-            d_print("Table Index = %d\n" % i)
+def extract_group_list():
+    group_list = {}
+    tables = []
 
-            row = table.rows[0];
+    for i, paragraph, table in spec.paragraph_tables():
+        header = spec.header(i)
+        if header[0].find('Octet') != -1 and \
+            header[2].find('IE Type') != -1:
+            d_print("Table Index = %d\n" % i)
 
-            if len(re.findall('\d+', row.cells[2].text)) == 0:
+            if len(re.findall('\d+', header[2])) == 0:
                 continue;
-            ie_type = re.findall('\d+', row.cells[2].text)[0]
-            ie_name = re.sub('\s*IE Type.*', '', row.cells[2].text)
+            ie_type = re.findall('\d+', header[2])[0]
+            ie_name = re.sub('\s*IE Type.*', '', header[2])
 
-            write_file(f, "# [%s] Index = %d\n" % (paragraph, i))
+            tables.append({ "index" : i, "heading" : paragraph })
 
             if ie_name not in group_list.keys():
                 ies = []
-                write_file(f, "ies = []\n")
-                for row in table.rows[4:]:
-                    cells = get_cells(row.cells)
+                for row in table[4:]:
+                    cells = get_cells(row)
                     if cells is None:
                         continue
 
@@ -333,17 +254,14 @@ else:
                             ies_is_added = False
                     if ies_is_added is True:
                         ies.append(cells)
-                        write_cells_to_file("ies", cells)
 
                 ie_idx = str(int(ie_type)+100)
                 group_list[ie_name] = { "index" : ie_idx, "type" : ie_type, "ies" : ies }
-                write_file(f, "group_list[\"" + ie_name + "\"] = { \"index\" : \"" + ie_idx + "\", \"type\" : \"" + ie_type + "\", \"ies\" : ies }\n")
             else:
                 group_list_is_added = False
                 added_ies = group_list[ie_name]["ies"]
-                write_file(f, "added_ies = group_list[\"" + ie_name + "\"][\"ies\"]\n")
-                for row in table.rows[4:]:
-                    cells = get_cells(row.cells)
+                for row in table[4:]:
+                    cells = get_cells(row)
                     if cells is None:
                         continue
 
@@ -356,13 +274,103 @@ else:
                             ies_is_added = False
                     if ies_is_added is True:
                         added_ies.append(cells)
-                        write_cells_to_file("added_ies", cells)
                         group_list_is_added = True
                 if group_list_is_added is True:
                     ie_idx = str(int(ie_type)+100)
                     group_list[ie_name] = { "index" : ie_idx, "type" : ie_type, "ies" : added_ies }
-                    write_file(f, "group_list[\"" + ie_name + "\"] = { \"index\" : \"" + ie_idx + "\", \"type\" : \"" + ie_type + "\", \"ies\" : added_ies }\n")
-    f.close()
+
+    return group_list, tables
+
+def extract_msg_ies(table):
+    tables = [{ "index" : table }]
+
+    ies = []
+    table = spec.table(table)
+    for row in table[1:]:
+        cells = get_cells(row)
+        if cells is None:
+            continue
+
+        ies_is_added = True
+        for ie in ies:
+            if (cells["ie_type"], cells["instance"]) == (ie["ie_type"], ie["instance"]):
+                ies_is_added = False
+        if ies_is_added is True:
+            ies.append(cells)
+
+    return ies, tables
+
+try:
+    opts, args = getopt.getopt(sys.argv[1:], "df:hro:c:C:j:M:S:B:F:tT:", ["debug", "file=", "help", "output=", "cache=", "readonly-cache=", "jobs=", "reproducible", "depfile=", "sizes=", "bench=", "corpus=", "profile", "pstats="])
+except getopt.GetoptError as err:
+    # print help information and exit:
+    usage()
+    sys.exit(2)
+
+for o, a in opts:
+    if o in ("-d", "--debug"):
+        verbosity = 1
+    if o in ("-f", "--file"):
+        filename = a
+    if o in ("-o", "--output"):
+        outdir = a
+        if outdir.rfind('/') != len(outdir):
+            outdir += '/'
+    if o in ("-c", "--cache"):
+        cachedir = a
+        if cachedir.rfind('/') != len(cachedir):
+            cachedir += '/'
+    if o in ("-C", "--readonly-cache"):
+        cache_ro.append(a)
+    if o in ("-j", "--jobs"):
+        jobs = int(a)
+    if o in ("-r", "--reproducible"):
+        reproducible = True
+    if o in ("-M", "--depfile"):
+        depfile = a
+    if o in ("-S", "--sizes"):
+        sizes = a
+    if o in ("-B", "--bench"):
+        bench = a
+    if o in ("-F", "--corpus"):
+        corpus = a
+    if o in ("-t", "--profile"):
+        profiling = True
+    if o in ("-T", "--pstats"):
+        pstats = a
+    if o in ("-h", "--help"):
+        usage()
+        sys.exit(2)
+
+if os.path.isfile(filename) and os.access(filename, os.R_OK):
+    file = open(filename, 'r')
+else:
+    d_error("Cannot find file : " + filename)
+
+spec = SpecIndex(filename)
+
+cache = Cache(cachedir, filename, "gtp-tlv.py v%s" % version,
+        source_sha256(get_cells, extract_msg_list, extract_type_list,
+            extract_group_list, extract_msg_ies),
+        readonly=cache_ro)
+
+profile = Profile(profiling, pstats)
+spec.load = profile.wrap('docx', spec.load)
+cache.load = profile.wrap('cache', cache.load)
+cache.store = profile.wrap('cache', cache.store)
+get_cells = profile.wrap('get_cells', get_cells)
+
+d_info("[Message List]")
+msg_list.update(cache.fetch('tlv-msg-list', extract_msg_list))
+
+d_info("[IE Type List]")
+type_list.update(cache.fetch('tlv-type-list', extract_type_list))
+type_list['MM Context'] = { "type": "107", "max_instance" : "0" }
+
+d_info("[Group IE List]")
+group_list.update(cache.fetch('tlv-group-list', extract_group_list))
+for k, v in group_list.items():
+    update_max_instance(v["ies"])
 
 msg_list["Echo Request"]["table"] = 8
 msg_list["Echo Response"]["table"] = 9
@@ -396,35 +404,14 @@ msg_list["Release Access Bearers Response"]["table"] = 87
 msg_list["Modify Access Bearers Request"]["table"] = 91
 msg_list["Modify Access Bearers Response"]["table"] = 94
 
-for key in msg_list.keys():
-    if "table" in msg_list[key].keys():
-        d_info("[" + key + "]")
-        cachefile = cachedir + "tlv-msg-" + msg_list[key]["type"] + ".py"
-        if os.path.isfile(cachefile) and os.access(cachefile, os.R_OK):
-            exec(open(cachefile).read())
-            print("Read from " + cachefile)
-        else:
-            document = Document(filename)
-            f = open(cachefile, 'w')
-
-            ies = []
-            write_file(f, "ies = []\n")
-            table = document.tables[msg_list[key]["table"]]
-            for row in table.rows[1:]:
-                cells = get_cells(row.cells)
-                if cells is None:
-                    continue
-
-                ies_is_added = True
-                for ie in ies:
-                    if (cells["ie_type"], cells["instance"]) == (ie["ie_type"], ie["instance"]):
-                        ies_is_added = False
-                if ies_is_added is True:
-                    ies.append(cells)
-                    write_cells_to_file("ies", cells)
-            msg_list[key]["ies"] = ies
-            write_file(f, "msg_list[key][\"ies\"] = ies\n")
-            f.close()
+msg_keys = [key for key in msg_list.keys() if "table" in msg_list[key].keys()]
+d_info("[Message Tables]")
+msg_ies = cache.fetch_many(
+        [("tlv-msg-" + msg_list[key]["type"], { "table" : msg_list[key]["table"] })
+            for key in msg_keys], extract_msg_ies, jobs, spec.load)
+for key, ies in zip(msg_keys, msg_ies):
+    msg_list[key]["ies"] = ies
+    update_max_instance(ies)
 
 type_list["Recovery"]["size"] = 1                       # Type : 3
 type_list["EBI"]["size"] = 1                            # Type : 73
@@ -439,7 +426,10 @@ type_list["Selection Mode"]["size"] = 1                 # Type : 128
 type_list["Node Type"]["size"] = 1                      # Type : 135
 type_list["Node Features"]["size"] = 1                  # Type : 152
 
-f = open(outdir + 'message.h', 'w')
+profile.enter('emit')
+output = Output()
+
+f = output.open(outdir + 'message.h')
 output_header_to_file(f)
 f.write("""#if !defined(OGS_GTP_INSIDE) && !defined(OGS_GTP_COMPILATION)
 #error "This header cannot be included directly."
@@ -507,17 +497,26 @@ f.write("\n")
 
 tmp = [(k, v["type"]) for k, v in type_list.items()]
 sorted_type_list = sorted(tmp, key=lambda tup: int(tup[1]))
+
+# The IEs a message can carry at its top level
+peek_types = set()
+for (k, v) in msg_list.items():
+    for ies in v.get("ies", []):
+        peek_types.add(ies["ie_type"])
+peek_type_list = [(k, v) for (k, v) in sorted_type_list if k in peek_types]
 for (k, v) in sorted_type_list:
     f.write("#define OGS_GTP2_" + v_upper(k) + "_TYPE " + v + "\n")
 f.write("\n")
 
+# The instances of an IE share its descriptor, the parents give the instance
+for (k, v) in sorted_type_list:
+    assert k not in msg_list.keys(), "Duplicated name = %s" % k
+
 f.write("/* Information Element TLV Descriptor */\n")
 for (k, v) in sorted_type_list:
     if k in group_list.keys():
         continue
-    for instance in range(0, int(type_list[k]["max_instance"])+1):
-        f.write("extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_" + v_lower(k))
-        f.write("_" + str(instance) + ";\n")
+    f.write("extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_" + v_lower(k) + ";\n")
 f.write("\n")
 
 for k, v in group_list.items():
@@ -533,14 +532,12 @@ sorted_group_list = sorted(tmp, key=lambda tup: int(tup[1]))
 
 f.write("/* Group Information Element TLV Descriptor */\n")
 for (k, v) in sorted_group_list:
-    for instance in range(0, int(type_list[k]["max_instance"])+1):
-        f.write("extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_" + v_lower(k))
-        f.write("_" + str(instance) + ";\n")
+    f.write("extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_" + v_lower(k) + ";\n")
 f.write("\n")
 
 f.write("/* Message Descriptor */\n")
 for (k, v) in sorted_msg_list:
-    f.write("extern ogs_tlv_desc_t ogs_gtp2_tlv_desc_" + v_lower(k) + ";\n")
+    f.write("extern const ogs_tlv_desc_t ogs_gtp2_tlv_desc_" + v_lower(k) + ";\n")
 f.write("\n")
 
 f.write("/* Structure for Information Element */\n")
@@ -563,31 +560,40 @@ for (k, v) in sorted_type_list:
 f.write("\n")
 
 f.write("/* Structure for Group Information Element */\n")
+group_members = {}
 for (k, v) in sorted_group_list:
     f.write("typedef struct ogs_gtp2_tlv_" + v_lower(k) + "_s {\n")
     f.write("    ogs_tlv_presence_t presence;\n")
+    group_members[k] = []
     for ies in group_list[k]["ies"]:
+        member = v_lower(ies["ie_value"])
         f.write("    ogs_gtp2_tlv_" + v_lower(ies["ie_type"]) + "_t " + \
                 v_lower(ies["ie_value"]))
         if ies["ie_type"] == "F-TEID":
             if ies["ie_value"] == "S2b-U ePDG F-TEID":
+                member += "_" + ies["instance"]
                 f.write("_" + ies["instance"] + ";")
             elif ies["ie_value"] == "S2a-U TWAN F-TEID":
+                member += "_" + ies["instance"]
                 f.write("_" + ies["instance"] + ";")
             else:
                 f.write(";")
             f.write(" /* Instance : " + ies["instance"] + " */\n")
         else:
             f.write(";\n")
+        group_members[k].append(member)
     f.write("} ogs_gtp2_tlv_" + v_lower(k) + "_t;\n")
     f.write("\n")
 
+def bearer_contexts(k, ies):
+    return ((k == 'Create Indirect Data Forwarding Tunnel Request' or k == 'Create Indirect Data Forwarding Tunnel Response') and ies["ie_value"] == 'Bearer Contexts') or (k == 'Create Session Request' and ies["ie_value"] == 'Bearer Contexts to be created') or (k == 'Create Session Response' and ies["ie_value"] == 'Bearer Contexts created') or (k == 'Modify Bearer Request' and ies["ie_value"] == 'Bearer Contexts to be modified') or (k == 'Modify Bearer Response' and ies["ie_value"] == 'Bearer Contexts modified')
+
 f.write("/* Structure for Message */\n")
 for (k, v) in sorted_msg_list:
     if "ies" in msg_list[k]:
         f.write("typedef struct ogs_gtp2_" + v_lower(k) + "_s {\n")
         for ies in msg_list[k]["ies"]:
-            if ((k == 'Create Indirect Data Forwarding Tunnel Request' or k == 'Create Indirect Data Forwarding Tunnel Response') and ies["ie_value"] == 'Bearer Contexts') or (k == 'Create Session Request' and ies["ie_value"] == 'Bearer Contexts to be created') or (k == 'Create Session Response' and ies["ie_value"] == 'Bearer Contexts created') or (k == 'Modify Bearer Request' and ies["ie_value"] == 'Bearer Contexts to be modified') or (k == 'Modify Bearer Response' and ies["ie_value"] == 'Bearer Contexts modified'):
+            if bearer_contexts(k, ies):
                 f.write("    ogs_gtp2_tlv_" + v_lower(ies["ie_type"]) + "_t " + \
                         v_lower(ies["ie_value"]) + "[OGS_BEARER_PER_UE];\n")
             else:
@@ -596,6 +602,49 @@ for (k, v) in sorted_msg_list:
         f.write("} ogs_gtp2_" + v_lower(k) + "_t;\n")
         f.write("\n")
 
+# The ogs_tlv_t nodes ogs_tlv_parse_msg() or ogs_tlv_build_msg() take from
+# the pool when every IE of the structure is present, and the depth of
+# the IEs
+def tlv_nodes(ies_list):
+    count = 0
+    depth = 0
+    for ies in ies_list:
+        if ies["ie_type"] in group_list.keys():
+            (c, d) = tlv_nodes(group_list[ies["ie_type"]]["ies"])
+        else:
+            (c, d) = (0, 0)
+        count += 1 + c
+        depth = max(depth, 1 + d)
+    return (count, depth)
+
+f.write("""/*
+ * The most ogs_tlv_t nodes a message takes from the pool of
+ * ogs_tlv_get() to be parsed or built, and how deep its IEs nest.
+ */
+""")
+max_tlv = []
+for (k, v) in sorted_msg_list:
+    if "ies" in msg_list[k]:
+        (count, depth) = tlv_nodes(
+                [ies for ies in msg_list[k]["ies"] if not bearer_contexts(k, ies)])
+        (bearer, bearer_depth) = tlv_nodes(
+                [ies for ies in msg_list[k]["ies"] if bearer_contexts(k, ies)])
+        depth = max(depth, bearer_depth)
+        if bearer != 0:
+            f.write("#define OGS_GTP2_%s_MAX_TLV (%d + OGS_BEARER_PER_UE * %d)\n" %
+                    (v_upper(k), count, bearer))
+        else:
+            f.write("#define OGS_GTP2_%s_MAX_TLV %d\n" % (v_upper(k), count))
+        f.write("#define OGS_GTP2_%s_MAX_TLV_DEPTH %d\n" % (v_upper(k), depth))
+        max_tlv.append((count, bearer, depth, k))
+largest = max(max_tlv)
+assert all(count <= largest[0] and bearer <= largest[1]
+        for (count, bearer, depth, k) in max_tlv), \
+        "The largest message depends on OGS_BEARER_PER_UE"
+f.write("#define OGS_GTP2_MAX_TLV OGS_GTP2_%s_MAX_TLV\n" % v_upper(largest[3]))
+f.write("#define OGS_GTP2_MAX_TLV_DEPTH %d\n" % max(m[2] for m in max_tlv))
+f.write("\n")
+
 f.write("typedef struct ogs_gtp2_message_s {\n")
 f.write("   ogs_gtp2_header_t h;\n")
 f.write("   union {\n")
@@ -608,6 +657,31 @@ f.write("} ogs_gtp2_message_t;\n\n")
 f.write("""int ogs_gtp2_parse_msg(ogs_gtp2_message_t *gtp2_message, ogs_pkbuf_t *pkbuf);
 ogs_pkbuf_t *ogs_gtp2_build_msg(ogs_gtp2_message_t *gtp2_message);
 
+/*
+ * Look at a message before ogs_gtp2_parse_msg(), e.g. to route or drop it.
+ * ogs_gtp2_peek() checks the header and gets the message type and the TEID
+ * (0 without one). ogs_gtp2_peek_ies() walks the top-level IEs once and
+ * sets the offset in the pkbuf and the length of each requested type and
+ * instance, leaving -1 for the absent ones; an IE requested twice gets its
+ * first and second occurrences. It returns how many were found.
+ * ogs_gtp2_peek_<ie>() returns the offset of a single IE, or OGS_ERROR if
+ * it is absent.
+ */
+typedef struct ogs_gtp2_peek_s {
+    uint8_t type;
+    uint8_t instance;
+    uint16_t length;
+    int offset;
+} ogs_gtp2_peek_t;
+
+int ogs_gtp2_peek(ogs_pkbuf_t *pkbuf, uint8_t *type, uint32_t *teid);
+int ogs_gtp2_peek_ies(ogs_pkbuf_t *pkbuf, ogs_gtp2_peek_t *ies, int num);
+""")
+for (k, v) in peek_type_list:
+    f.write("int ogs_gtp2_peek_%s(\n" % v_lower(k))
+    f.write("        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length);\n")
+
+f.write("""
 #ifdef __cplusplus
 }
 #endif
@@ -616,74 +690,139 @@ ogs_pkbuf_t *ogs_gtp2_build_msg(ogs_gtp2_message_t *gtp2_message);
 """)
 f.close()
 
-f = open(outdir + 'message.c', 'w')
+f = output.open(outdir + 'message.c')
 output_header_to_file(f)
 f.write("""#include "ogs-gtp.h"
 
 """)
 
+descs = 0
 for (k, v) in sorted_type_list:
     if k in group_list.keys():
         continue
-    for instance in range(0, int(type_list[k]["max_instance"])+1):
-        f.write("ogs_tlv_desc_t ogs_gtp2_tlv_desc_%s_%d =\n" % (v_lower(k), instance))
-        f.write("{\n")
-        if "size" in type_list[k]:
-            if type_list[k]["size"] == 1:
-                f.write("    OGS_TLV_UINT8,\n")
-            elif type_list[k]["size"] == 2:
-                f.write("    OGS_TLV_UINT16,\n")
-            elif type_list[k]["size"] == 3:
-                f.write("    OGS_TLV_UINT24,\n")
-            elif type_list[k]["size"] == 4:
-                f.write("    OGS_TLV_UINT32,\n")
-            else:
-                assert False, "Unknown size = %d for key = %s" % (type_list[k]["size"], k)
-        else:
-            f.write("    OGS_TLV_VAR_STR,\n")
-        f.write("    \"%s\",\n" % k)
-        f.write("    OGS_GTP2_%s_TYPE,\n" % v_upper(k))
-        if "size" in type_list[k]:
-            f.write("    %d,\n" % type_list[k]["size"])
+    f.write("const ogs_tlv_desc_t ogs_gtp2_tlv_desc_%s =\n" % v_lower(k))
+    f.write("{\n")
+    if "size" in type_list[k]:
+        if type_list[k]["size"] == 1:
+            f.write("    OGS_TLV_UINT8,\n")
+        elif type_list[k]["size"] == 2:
+            f.write("    OGS_TLV_UINT16,\n")
+        elif type_list[k]["size"] == 3:
+            f.write("    OGS_TLV_UINT24,\n")
+        elif type_list[k]["size"] == 4:
+            f.write("    OGS_TLV_UINT32,\n")
         else:
-            f.write("    0,\n")
-        f.write("    %d,\n" % instance)
-        f.write("    sizeof(ogs_gtp2_tlv_%s_t),\n" % v_lower(k))
-        f.write("    { NULL }\n")
-        f.write("};\n\n")
+            assert False, "Unknown size = %d for key = %s" % (type_list[k]["size"], k)
+    else:
+        f.write("    OGS_TLV_VAR_STR,\n")
+    f.write("    \"%s\",\n" % k)
+    f.write("    OGS_GTP2_%s_TYPE,\n" % v_upper(k))
+    if "size" in type_list[k]:
+        f.write("    %d,\n" % type_list[k]["size"])
+    else:
+        f.write("    0,\n")
+    f.write("    0,\n")
+    f.write("    sizeof(ogs_gtp2_tlv_%s_t),\n" % v_lower(k))
+    f.write("    { NULL },\n")
+    f.write("    NULL,\n")
+    f.write("    NULL\n")
+    f.write("};\n\n")
+    descs += 1
+
+child_instances = []
+def write_child_instance(f, name, instances):
+    """Write the child_instance[] of a descriptor and return what the
+    descriptor has to point to"""
+    if len([i for i in instances if i != 0]) == 0:
+        return "NULL"
+    child_instances.append(len(instances))
+    f.write("static const uint8_t %s[%d] = {" % (name, len(instances)))
+    for i, instance in enumerate(instances):
+        if i % 16 == 0:
+            f.write("\n   ")
+        f.write(" %d," % instance)
+    f.write("\n};\n\n")
+    return name
+
+def ie_index_child(ies, offset):
+    return (int(type_list[ies["ie_type"]]["type"]),
+            "OGS_GTP2_%s_TYPE" % v_upper(ies["ie_type"]),
+            int(ies["instance"]), offset)
 
 for (k, v) in sorted_group_list:
-    for instance in range(0, int(type_list[k]["max_instance"])+1):
-        f.write("ogs_tlv_desc_t ogs_gtp2_tlv_desc_%s_%d =\n" % (v_lower(k), instance))
-        f.write("{\n")
-        f.write("    OGS_TLV_COMPOUND,\n")
-        f.write("    \"%s\",\n" % k)
-        f.write("    OGS_GTP2_%s_TYPE,\n" % v_upper(k))
-        f.write("    0,\n")
-        f.write("    %d,\n" % instance)
-        f.write("    sizeof(ogs_gtp2_tlv_%s_t),\n" % v_lower(k))
-        f.write("    {\n")
-        for ies in group_list[k]["ies"]:
-                f.write("        &ogs_gtp2_tlv_desc_%s_%s,\n" % (v_lower(ies["ie_type"]), v_lower(ies["instance"])))
-        f.write("        NULL,\n")
-        f.write("    }\n")
-        f.write("};\n\n")
+    # The instances of a group IE share its list of children
+    children = []
+    for (ies, member) in zip(group_list[k]["ies"], group_members[k]):
+        children.append(ie_index_child(ies,
+            "offsetof(ogs_gtp2_tlv_%s_t, %s) - sizeof(ogs_tlv_presence_t)" %
+            (v_lower(k), member)))
+    index = write_desc_index(f, "ogs_gtp2_tlv_index_%s" % v_lower(k), children)
+    instance = write_child_instance(f, "ogs_gtp2_tlv_instance_%s" % v_lower(k),
+            [int(ies["instance"]) for ies in group_list[k]["ies"]])
+
+    f.write("const ogs_tlv_desc_t ogs_gtp2_tlv_desc_%s =\n" % v_lower(k))
+    f.write("{\n")
+    f.write("    OGS_TLV_COMPOUND,\n")
+    f.write("    \"%s\",\n" % k)
+    f.write("    OGS_GTP2_%s_TYPE,\n" % v_upper(k))
+    f.write("    0,\n")
+    f.write("    0,\n")
+    f.write("    sizeof(ogs_gtp2_tlv_%s_t),\n" % v_lower(k))
+    f.write("    {\n")
+    for ies in group_list[k]["ies"]:
+        f.write("        &ogs_gtp2_tlv_desc_%s,\n" % v_lower(ies["ie_type"]))
+    f.write("        NULL,\n")
+    f.write("    },\n")
+    f.write("    %s,\n" % index)
+    f.write("    %s\n" % instance)
+    f.write("};\n\n")
+    descs += 1
 
 for (k, v) in sorted_msg_list:
     if "ies" in msg_list[k]:
-        f.write("ogs_tlv_desc_t ogs_gtp2_tlv_desc_%s =\n" % v_lower(k))
+        children = []
+        for ies in msg_list[k]["ies"]:
+            member = "offsetof(ogs_gtp2_%s_t, %s)" % (v_lower(k), v_lower(ies["ie_value"]))
+            children.append(ie_index_child(ies, member))
+            if bearer_contexts(k, ies):
+                children.append((0, "0", 0, "%s + sizeof(ogs_gtp2_tlv_%s_t)" %
+                    (member, v_lower(ies["ie_type"]))))
+        index = write_desc_index(f, "ogs_gtp2_msg_index_%s" % v_lower(k), children)
+        instance = write_child_instance(f,
+                "ogs_gtp2_msg_instance_%s" % v_lower(k),
+                [instance for (type, type_macro, instance, offset) in children])
+
+        f.write("const ogs_tlv_desc_t ogs_gtp2_tlv_desc_%s =\n" % v_lower(k))
         f.write("{\n")
         f.write("    OGS_TLV_MESSAGE,\n")
         f.write("    \"%s\",\n" % k)
         f.write("    0, 0, 0, 0, {\n")
         for ies in msg_list[k]["ies"]:
-            f.write("        &ogs_gtp2_tlv_desc_%s_%s,\n" % (v_lower(ies["ie_type"]), v_lower(ies["instance"])))
-            if ((k == 'Create Indirect Data Forwarding Tunnel Request' or k == 'Create Indirect Data Forwarding Tunnel Response') and ies["ie_value"] == 'Bearer Contexts') or (k == 'Create Session Request' and ies["ie_value"] == 'Bearer Contexts to be created') or (k == 'Create Session Response' and ies["ie_value"] == 'Bearer Contexts created') or (k == 'Modify Bearer Request' and ies["ie_value"] == 'Bearer Contexts to be modified') or (k == 'Modify Bearer Response' and ies["ie_value"] == 'Bearer Contexts modified'):
+            f.write("        &ogs_gtp2_tlv_desc_%s,\n" % v_lower(ies["ie_type"]))
+            if bearer_contexts(k, ies):
                 f.write("        &ogs_tlv_desc_more8,\n")
         f.write("    NULL,\n")
-        f.write("}};\n\n")
+        f.write("}, %s, %s};\n\n" % (index, instance))
+        descs += 1
 f.write("\n")
 
+first = [k for (k, v) in sorted_msg_list if "ies" in msg_list[k]][0]
+f.write("""/* Size of the union member for the message type, 0 if it has none */
+static size_t gtp2_message_size(uint8_t type)
+{
+    switch(type) {
+""")
+for (k, v) in sorted_msg_list:
+    if "ies" in msg_list[k]:
+        f.write("    case OGS_GTP2_%s_TYPE:\n" % v_upper(k))
+        f.write("        return sizeof(ogs_gtp2_%s_t);\n" % v_lower(k))
+f.write("""    default:
+        return 0;
+    }
+}
+
+""")
+
 f.write("""int ogs_gtp2_parse_msg(ogs_gtp2_message_t *gtp2_message, ogs_pkbuf_t *pkbuf)
 {
     int rv = OGS_ERROR;
@@ -697,8 +836,12 @@ f.write("""int ogs_gtp2_parse_msg(ogs_gtp2_message_t *gtp2_message, ogs_pkbuf_t
     h = (ogs_gtp2_header_t *)pkbuf->data;
     ogs_assert(h);
 
-    memset(gtp2_message, 0, sizeof(ogs_gtp2_message_t));
-
+    /* Clear the header and the message of this type, not the whole union */
+    memset(gtp2_message, 0,
+            offsetof(ogs_gtp2_message_t, %s) +
+            gtp2_message_size(h->type));
+""" % v_lower(first))
+f.write("""
     if (h->teid_presence)
         size = OGS_GTPV2C_HEADER_LEN;
     else
@@ -761,4 +904,200 @@ f.write("""    default:
 }
 """)
 
+f.write("""
+static int gtp2_peek_header(ogs_pkbuf_t *pkbuf)
+{
+    ogs_gtp2_header_t *h = (ogs_gtp2_header_t *)pkbuf->data;
+    uint16_t size = 0;
+
+    if (pkbuf->len < OGS_GTPV2C_HEADER_LEN-OGS_GTP2_TEID_LEN) {
+        ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+        return OGS_ERROR;
+    }
+
+    if (h->teid_presence)
+        size = OGS_GTPV2C_HEADER_LEN;
+    else
+        size = OGS_GTPV2C_HEADER_LEN-OGS_GTP2_TEID_LEN;
+
+    if (pkbuf->len < size) {
+        ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+        return OGS_ERROR;
+    }
+
+    return size;
+}
+
+int ogs_gtp2_peek(ogs_pkbuf_t *pkbuf, uint8_t *type, uint32_t *teid)
+{
+    ogs_gtp2_header_t *h = NULL;
+
+    ogs_assert(pkbuf);
+
+    if (gtp2_peek_header(pkbuf) < 0)
+        return OGS_ERROR;
+
+    h = (ogs_gtp2_header_t *)pkbuf->data;
+    if (type)
+        *type = h->type;
+    if (teid)
+        *teid = h->teid_presence ? be32toh(h->teid) : 0;
+
+    return OGS_OK;
+}
+
+int ogs_gtp2_peek_ies(ogs_pkbuf_t *pkbuf, ogs_gtp2_peek_t *ies, int num)
+{
+    uint8_t *pos = NULL, *end = NULL;
+    uint8_t type, instance;
+    uint16_t length;
+    int size, found = 0, i;
+
+    ogs_assert(pkbuf);
+    ogs_assert(ies);
+
+    for (i = 0; i < num; i++)
+        ies[i].offset = -1;
+
+    size = gtp2_peek_header(pkbuf);
+    if (size < 0)
+        return OGS_ERROR;
+
+    pos = pkbuf->data + size;
+    end = pkbuf->data + pkbuf->len;
+    while (pos < end && found < num) {
+        /* Type(1), Length(2), Spare(4 bits) and Instance(4 bits) */
+        if (end - pos < 4) {
+            ogs_error("Can't peek TLV [LEN:%d]", pkbuf->len);
+            return OGS_ERROR;
+        }
+        type = pos[0];
+        length = (pos[1] << 8) | pos[2];
+        instance = pos[3] & 0x0f;
+        pos += 4;
+        if (end - pos < length) {
+            ogs_error("Can't peek TLV [LEN:%d]", pkbuf->len);
+            return OGS_ERROR;
+        }
+
+        for (i = 0; i < num; i++) {
+            if (ies[i].type == type && ies[i].instance == instance &&
+                    ies[i].offset < 0) {
+                ies[i].offset = pos - pkbuf->data;
+                ies[i].length = length;
+                found++;
+                break;
+            }
+        }
+        pos += length;
+    }
+
+    return found;
+}
+""")
+
+for (k, v) in peek_type_list:
+    f.write("\n")
+    f.write("int ogs_gtp2_peek_%s(\n" % v_lower(k))
+    f.write("        ogs_pkbuf_t *pkbuf, uint8_t instance, uint16_t *length)\n")
+    f.write("{\n")
+    f.write("    ogs_gtp2_peek_t ie = { OGS_GTP2_%s_TYPE, instance, 0, -1 };\n" % v_upper(k))
+    f.write("\n")
+    f.write("    if (ogs_gtp2_peek_ies(pkbuf, &ie, 1) != 1)\n")
+    f.write("        return OGS_ERROR;\n")
+    f.write("\n")
+    f.write("    if (length)\n")
+    f.write("        *length = ie.length;\n")
+    f.write("\n")
+    f.write("    return ie.offset;\n")
+    f.write("}\n")
+
 f.close()
+
+if sizes is not None:
+    structs = []
+    for (k, v) in sorted_group_list:
+        structs.append(("ogs_gtp2_tlv_%s_t" % v_lower(k),
+            ["presence"] + group_members[k]))
+    for (k, v) in sorted_msg_list:
+        if "ies" in msg_list[k]:
+            structs.append(("ogs_gtp2_%s_t" % v_lower(k),
+                [v_lower(ies["ie_value"]) for ies in msg_list[k]["ies"]]))
+    f = output.open(sizes)
+    output_header_to_file(f)
+    instances = len([k for (k, v) in sorted_msg_list if "ies" in msg_list[k]])
+    for (k, v) in sorted_type_list:
+        instances += int(type_list[k]["max_instance"]) + 1
+    write_size_report(f, ["ogs-gtp.h"], structs,
+            ("ogs_gtp2_message_t", v_lower(first)),
+            [("ogs_tlv_desc_t", descs,
+                "%d * sizeof(ogs_tlv_desc_t)" % descs),
+             ("ogs_tlv_desc_t if each IE instance had its own", instances,
+                "%d * sizeof(ogs_tlv_desc_t)" % instances),
+             ("child_instance[]", len(child_instances),
+                 "%d" % sum(child_instances))])
+    f.close()
+
+if bench is not None:
+    f = output.open(bench)
+    output_header_to_file(f)
+    write_bench_prologue(f, "GTPv2-C", ["ogs-gtp.h", "unit/tlv-message.h"])
+    write_bench_tlv(f, "ogs_gtp2_message_t", "OGS_TLV_MODE_T1_L2_I1",
+            "ogs_tlv_parse_msg")
+    f.write("static const bench_message_t bench_messages[] = {\n")
+    for (k, v) in sorted_msg_list:
+        if len(msg_list[k].get("ies", [])) == 0:
+            continue
+        f.write("    { \"%s\", &ogs_gtp2_tlv_desc_%s,\n" % (k, v_lower(k)))
+        f.write("        sizeof(ogs_gtp2_%s_t), NULL, NULL },\n" % v_lower(k))
+    f.write("};\n\n")
+    write_bench_main(f, """    ogs_log_install_domain(&__ogs_gtp_domain, "gtp", OGS_LOG_ERROR);
+""", "bench_messages")
+    f.close()
+
+if corpus is not None:
+    def corpus_ies(k, ies_list, variant):
+        octets = []
+        for ies in ies_list:
+            if variant == "mandatory" and ies["presence"] != "M":
+                continue
+            t = ies["ie_type"]
+            if t in group_list.keys():
+                value = corpus_ies(t, group_list[t]["ies"],
+                        "all" if variant == "max" else variant)
+            elif "size" in type_list[t]:
+                value = [0] * type_list[t]["size"]
+            else:
+                value = [0]
+            n = 1
+            if variant == "max" and bearer_contexts(k, ies):
+                n = 8
+            octets += tlv_octets("T1_L2_I1", int(type_list[t]["type"]), value,
+                    int(ies["instance"])) * n
+        return octets
+
+    seeds = Corpus("gtp2")
+    for (k, v) in sorted_msg_list:
+        if "ies" not in msg_list[k]:
+            continue
+        variants = {}
+        for variant in VARIANTS:
+            octets = corpus_ies(k, msg_list[k]["ies"], variant)
+            if octets in variants.values():
+                continue
+            variants[variant] = octets
+            # Sequence number 1, a TEID of 0 past Version Not Supported
+            if int(v) > 3:
+                header = [0x48, int(v), 0, 0] + [0] * 4 + [0, 0, 1, 0]
+            else:
+                header = [0x40, int(v), 0, 0] + [0, 0, 1, 0]
+            length = len(header) + len(octets) - 4
+            header[2:4] = [length >> 8, length & 0xff]
+            seeds.add(v_lower(k), variant, header + octets)
+    seeds.write(output, corpus)
+
+if depfile is not None:
+    output.write_depfile(depfile, [filename] + cache.files)
+
+output.summary()
+profile.report()
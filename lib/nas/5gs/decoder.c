@@ -28,8 +28,8 @@
 /*******************************************************************************
  * This file had been created by nas-message.py script v0.2.0
  * Please do not modify this file but regenerate it via script.
- * Created on: 2024-01-21 18:47:47.827076 by acetcom
- * from 24501-h90.docx
+ * Created from 24501-h90.docx
+ * (sha256: 934e13e03cc23a890da2448bd91bac0d11d7f538d814a725666f5c9be66f7b96)
  ******************************************************************************/
 
 #include "ogs-nas-5gs.h"
@@ -78,45 +78,38 @@ int ogs_nas_5gs_decode_5gsm_status(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *
 int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_registration_request_t *registration_request = &message->gmm.registration_request;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode REGISTRATION_REQUEST\n");
 
-    size = ogs_nas_5gs_decode_5gs_registration_type(&registration_request->registration_type, pkbuf);
+    size = ogs_nas_5gs_read_5gs_registration_type(&registration_request->registration_type, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_5gs_decode_5gs_registration_type() failed");
+        ogs_error("ogs_nas_5gs_read_5gs_registration_type() failed");
         return size;
     }
 
     decoded += size;
 
-    size = ogs_nas_5gs_decode_5gs_mobile_identity(&registration_request->mobile_identity, pkbuf);
+    size = ogs_nas_5gs_read_5gs_mobile_identity(&registration_request->mobile_identity, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_5gs_decode_5gs_mobile_identity() failed");
+        ogs_error("ogs_nas_5gs_read_5gs_mobile_identity() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch(type) {
         case OGS_NAS_5GS_REGISTRATION_REQUEST_NON_CURRENT_NATIVE_NAS_KEY_SET_IDENTIFIER_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_5gs_decode_key_set_identifier(&registration_request->non_current_native_nas_key_set_identifier, pkbuf);
+            size = ogs_nas_5gs_read_key_set_identifier(&registration_request->non_current_native_nas_key_set_identifier, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_key_set_identifier() failed");
+               ogs_error("ogs_nas_5gs_read_key_set_identifier() failed");
                return size;
             }
 
@@ -124,9 +117,10 @@ int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REQUEST_5GMM_CAPABILITY_TYPE:
-            size = ogs_nas_5gs_decode_5gmm_capability(&registration_request->gmm_capability, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_5gmm_capability(&registration_request->gmm_capability, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_5gmm_capability() failed");
+               ogs_error("ogs_nas_5gs_read_5gmm_capability() failed");
                return size;
             }
 
@@ -134,9 +128,10 @@ int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REQUEST_UE_SECURITY_CAPABILITY_TYPE:
-            size = ogs_nas_5gs_decode_ue_security_capability(&registration_request->ue_security_capability, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_ue_security_capability(&registration_request->ue_security_capability, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_ue_security_capability() failed");
+               ogs_error("ogs_nas_5gs_read_ue_security_capability() failed");
                return size;
             }
 
@@ -144,9 +139,10 @@ int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_NSSAI_TYPE:
-            size = ogs_nas_5gs_decode_nssai(&registration_request->requested_nssai, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_nssai(&registration_request->requested_nssai, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_nssai() failed");
+               ogs_error("ogs_nas_5gs_read_nssai() failed");
                return size;
             }
 
@@ -154,9 +150,10 @@ int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REQUEST_LAST_VISITED_REGISTERED_TAI_TYPE:
-            size = ogs_nas_5gs_decode_5gs_tracking_area_identity(&registration_request->last_visited_registered_tai, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_5gs_tracking_area_identity(&registration_request->last_visited_registered_tai, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_5gs_tracking_area_identity() failed");
+               ogs_error("ogs_nas_5gs_read_5gs_tracking_area_identity() failed");
                return size;
             }
 
@@ -164,9 +161,10 @@ int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REQUEST_S1_UE_NETWORK_CAPABILITY_TYPE:
-            size = ogs_nas_5gs_decode_s1_ue_network_capability(&registration_request->s1_ue_network_capability, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_s1_ue_network_capability(&registration_request->s1_ue_network_capability, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_s1_ue_network_capability() failed");
+               ogs_error("ogs_nas_5gs_read_s1_ue_network_capability() failed");
                return size;
             }
 
@@ -174,9 +172,10 @@ int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REQUEST_UPLINK_DATA_STATUS_TYPE:
-            size = ogs_nas_5gs_decode_uplink_data_status(&registration_request->uplink_data_status, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_uplink_data_status(&registration_request->uplink_data_status, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_uplink_data_status() failed");
+               ogs_error("ogs_nas_5gs_read_uplink_data_status() failed");
                return size;
             }
 
@@ -184,9 +183,10 @@ int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REQUEST_PDU_SESSION_STATUS_TYPE:
-            size = ogs_nas_5gs_decode_pdu_session_status(&registration_request->pdu_session_status, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_pdu_session_status(&registration_request->pdu_session_status, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_pdu_session_status() failed");
+               ogs_error("ogs_nas_5gs_read_pdu_session_status() failed");
                return size;
             }
 
@@ -194,11 +194,9 @@ int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REQUEST_MICO_INDICATION_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_5gs_decode_mico_indication(&registration_request->mico_indication, pkbuf);
+            size = ogs_nas_5gs_read_mico_indication(&registration_request->mico_indication, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_mico_indication() failed");
+               ogs_error("ogs_nas_5gs_read_mico_indication() failed");
                return size;
             }
 
@@ -206,9 +204,10 @@ int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REQUEST_UE_STATUS_TYPE:
-            size = ogs_nas_5gs_decode_ue_status(&registration_request->ue_status, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_ue_status(&registration_request->ue_status, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_ue_status() failed");
+               ogs_error("ogs_nas_5gs_read_ue_status() failed");
                return size;
             }
 
@@ -216,9 +215,10 @@ int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REQUEST_ADDITIONAL_GUTI_TYPE:
-            size = ogs_nas_5gs_decode_5gs_mobile_identity(&registration_request->additional_guti, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_5gs_mobile_identity(&registration_request->additional_guti, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_5gs_mobile_identity() failed");
+               ogs_error("ogs_nas_5gs_read_5gs_mobile_identity() failed");
                return size;
             }
 
@@ -226,9 +226,10 @@ int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REQUEST_ALLOWED_PDU_SESSION_STATUS_TYPE:
-            size = ogs_nas_5gs_decode_allowed_pdu_session_status(&registration_request->allowed_pdu_session_status, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_allowed_pdu_session_status(&registration_request->allowed_pdu_session_status, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_allowed_pdu_session_status() failed");
+               ogs_error("ogs_nas_5gs_read_allowed_pdu_session_status() failed");
                return size;
             }
 
@@ -236,9 +237,10 @@ int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REQUEST_UE_USAGE_SETTING_TYPE:
-            size = ogs_nas_5gs_decode_ue_usage_setting(&registration_request->ue_usage_setting, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_ue_usage_setting(&registration_request->ue_usage_setting, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_ue_usage_setting() failed");
+               ogs_error("ogs_nas_5gs_read_ue_usage_setting() failed");
                return size;
             }
 
@@ -246,9 +248,10 @@ int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_DRX_PARAMETERS_TYPE:
-            size = ogs_nas_5gs_decode_5gs_drx_parameters(&registration_request->requested_drx_parameters, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_5gs_drx_parameters(&registration_request->requested_drx_parameters, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_5gs_drx_parameters() failed");
+               ogs_error("ogs_nas_5gs_read_5gs_drx_parameters() failed");
                return size;
             }
 
@@ -256,9 +259,10 @@ int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REQUEST_EPS_NAS_MESSAGE_CONTAINER_TYPE:
-            size = ogs_nas_5gs_decode_eps_nas_message_container(&registration_request->eps_nas_message_container, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_eps_nas_message_container(&registration_request->eps_nas_message_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_eps_nas_message_container() failed");
+               ogs_error("ogs_nas_5gs_read_eps_nas_message_container() failed");
                return size;
             }
 
@@ -266,9 +270,10 @@ int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REQUEST_LADN_INDICATION_TYPE:
-            size = ogs_nas_5gs_decode_ladn_indication(&registration_request->ladn_indication, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_ladn_indication(&registration_request->ladn_indication, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_ladn_indication() failed");
+               ogs_error("ogs_nas_5gs_read_ladn_indication() failed");
                return size;
             }
 
@@ -276,11 +281,9 @@ int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REQUEST_PAYLOAD_CONTAINER_TYPE_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_5gs_decode_payload_container_type(&registration_request->payload_container_type, pkbuf);
+            size = ogs_nas_5gs_read_payload_container_type(&registration_request->payload_container_type, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_payload_container_type() failed");
+               ogs_error("ogs_nas_5gs_read_payload_container_type() failed");
                return size;
             }
 
@@ -288,9 +291,10 @@ int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REQUEST_PAYLOAD_CONTAINER_TYPE:
-            size = ogs_nas_5gs_decode_payload_container(&registration_request->payload_container, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_payload_container(&registration_request->payload_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_payload_container() failed");
+               ogs_error("ogs_nas_5gs_read_payload_container() failed");
                return size;
             }
 
@@ -298,11 +302,9 @@ int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REQUEST_NETWORK_SLICING_INDICATION_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_5gs_decode_network_slicing_indication(&registration_request->network_slicing_indication, pkbuf);
+            size = ogs_nas_5gs_read_network_slicing_indication(&registration_request->network_slicing_indication, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_network_slicing_indication() failed");
+               ogs_error("ogs_nas_5gs_read_network_slicing_indication() failed");
                return size;
             }
 
@@ -310,9 +312,10 @@ int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REQUEST_5GS_UPDATE_TYPE_TYPE:
-            size = ogs_nas_5gs_decode_5gs_update_type(&registration_request->update_type, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_5gs_update_type(&registration_request->update_type, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_5gs_update_type() failed");
+               ogs_error("ogs_nas_5gs_read_5gs_update_type() failed");
                return size;
             }
 
@@ -320,9 +323,10 @@ int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REQUEST_MOBILE_STATION_CLASSMARK_2_TYPE:
-            size = ogs_nas_5gs_decode_mobile_station_classmark_2(&registration_request->mobile_station_classmark_2, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_mobile_station_classmark_2(&registration_request->mobile_station_classmark_2, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_mobile_station_classmark_2() failed");
+               ogs_error("ogs_nas_5gs_read_mobile_station_classmark_2() failed");
                return size;
             }
 
@@ -330,9 +334,10 @@ int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REQUEST_SUPPORTED_CODECS_TYPE:
-            size = ogs_nas_5gs_decode_supported_codec_list(&registration_request->supported_codecs, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_supported_codec_list(&registration_request->supported_codecs, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_supported_codec_list() failed");
+               ogs_error("ogs_nas_5gs_read_supported_codec_list() failed");
                return size;
             }
 
@@ -340,9 +345,10 @@ int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REQUEST_NAS_MESSAGE_CONTAINER_TYPE:
-            size = ogs_nas_5gs_decode_message_container(&registration_request->nas_message_container, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_message_container(&registration_request->nas_message_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_message_container() failed");
+               ogs_error("ogs_nas_5gs_read_message_container() failed");
                return size;
             }
 
@@ -350,9 +356,10 @@ int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REQUEST_EPS_BEARER_CONTEXT_STATUS_TYPE:
-            size = ogs_nas_5gs_decode_eps_bearer_context_status(&registration_request->eps_bearer_context_status, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_eps_bearer_context_status(&registration_request->eps_bearer_context_status, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_eps_bearer_context_status() failed");
+               ogs_error("ogs_nas_5gs_read_eps_bearer_context_status() failed");
                return size;
             }
 
@@ -360,9 +367,10 @@ int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_EXTENDED_DRX_PARAMETERS_TYPE:
-            size = ogs_nas_5gs_decode_extended_drx_parameters(&registration_request->requested_extended_drx_parameters, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_extended_drx_parameters(&registration_request->requested_extended_drx_parameters, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_extended_drx_parameters() failed");
+               ogs_error("ogs_nas_5gs_read_extended_drx_parameters() failed");
                return size;
             }
 
@@ -370,9 +378,10 @@ int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REQUEST_T3324_VALUE_TYPE:
-            size = ogs_nas_5gs_decode_gprs_timer_3(&registration_request->t3324_value, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_gprs_timer_3(&registration_request->t3324_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_gprs_timer_3() failed");
+               ogs_error("ogs_nas_5gs_read_gprs_timer_3() failed");
                return size;
             }
 
@@ -380,9 +389,10 @@ int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REQUEST_UE_RADIO_CAPABILITY_ID_TYPE:
-            size = ogs_nas_5gs_decode_ue_radio_capability_id(&registration_request->ue_radio_capability_id, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_ue_radio_capability_id(&registration_request->ue_radio_capability_id, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_ue_radio_capability_id() failed");
+               ogs_error("ogs_nas_5gs_read_ue_radio_capability_id() failed");
                return size;
             }
 
@@ -390,9 +400,10 @@ int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_MAPPED_NSSAI_TYPE:
-            size = ogs_nas_5gs_decode_mapped_nssai(&registration_request->requested_mapped_nssai, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_mapped_nssai(&registration_request->requested_mapped_nssai, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_mapped_nssai() failed");
+               ogs_error("ogs_nas_5gs_read_mapped_nssai() failed");
                return size;
             }
 
@@ -400,9 +411,10 @@ int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REQUEST_ADDITIONAL_INFORMATION_REQUESTED_TYPE:
-            size = ogs_nas_5gs_decode_additional_information_requested(&registration_request->additional_information_requested, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_additional_information_requested(&registration_request->additional_information_requested, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_additional_information_requested() failed");
+               ogs_error("ogs_nas_5gs_read_additional_information_requested() failed");
                return size;
             }
 
@@ -410,9 +422,10 @@ int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_WUS_ASSISTANCE_INFORMATION_TYPE:
-            size = ogs_nas_5gs_decode_wus_assistance_information(&registration_request->requested_wus_assistance_information, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_wus_assistance_information(&registration_request->requested_wus_assistance_information, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_wus_assistance_information() failed");
+               ogs_error("ogs_nas_5gs_read_wus_assistance_information() failed");
                return size;
             }
 
@@ -420,11 +433,9 @@ int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REQUEST_N5GC_INDICATION_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_5gs_decode_n5gc_indication(&registration_request->n5gc_indication, pkbuf);
+            size = ogs_nas_5gs_read_n5gc_indication(&registration_request->n5gc_indication, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_n5gc_indication() failed");
+               ogs_error("ogs_nas_5gs_read_n5gc_indication() failed");
                return size;
             }
 
@@ -432,9 +443,10 @@ int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_NB_N1_MODE_DRX_PARAMETERS_TYPE:
-            size = ogs_nas_5gs_decode_nb_n1_mode_drx_parameters(&registration_request->requested_nb_n1_mode_drx_parameters, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_nb_n1_mode_drx_parameters(&registration_request->requested_nb_n1_mode_drx_parameters, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_nb_n1_mode_drx_parameters() failed");
+               ogs_error("ogs_nas_5gs_read_nb_n1_mode_drx_parameters() failed");
                return size;
             }
 
@@ -442,9 +454,10 @@ int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REQUEST_UE_REQUEST_TYPE_TYPE:
-            size = ogs_nas_5gs_decode_ue_request_type(&registration_request->ue_request_type, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_ue_request_type(&registration_request->ue_request_type, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_ue_request_type() failed");
+               ogs_error("ogs_nas_5gs_read_ue_request_type() failed");
                return size;
             }
 
@@ -452,9 +465,10 @@ int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REQUEST_PAGING_RESTRICTION_TYPE:
-            size = ogs_nas_5gs_decode_paging_restriction(&registration_request->paging_restriction, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_paging_restriction(&registration_request->paging_restriction, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_paging_restriction() failed");
+               ogs_error("ogs_nas_5gs_read_paging_restriction() failed");
                return size;
             }
 
@@ -462,9 +476,10 @@ int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REQUEST_SERVICE_LEVEL_AA_CONTAINER_TYPE:
-            size = ogs_nas_5gs_decode_service_level_aa_container(&registration_request->service_level_aa_container, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_service_level_aa_container(&registration_request->service_level_aa_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_service_level_aa_container() failed");
+               ogs_error("ogs_nas_5gs_read_service_level_aa_container() failed");
                return size;
             }
 
@@ -472,9 +487,10 @@ int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REQUEST_NID_TYPE:
-            size = ogs_nas_5gs_decode_nid(&registration_request->nid, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_nid(&registration_request->nid, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_nid() failed");
+               ogs_error("ogs_nas_5gs_read_nid() failed");
                return size;
             }
 
@@ -482,9 +498,10 @@ int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REQUEST_MS_DETERMINED_PLMN_WITH_DISASTER_CONDITION_TYPE:
-            size = ogs_nas_5gs_decode_plmn_identity(&registration_request->ms_determined_plmn_with_disaster_condition, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_plmn_identity(&registration_request->ms_determined_plmn_with_disaster_condition, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_plmn_identity() failed");
+               ogs_error("ogs_nas_5gs_read_plmn_identity() failed");
                return size;
             }
 
@@ -492,9 +509,10 @@ int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_PEIPS_ASSISTANCE_INFORMATION_TYPE:
-            size = ogs_nas_5gs_decode_peips_assistance_information(&registration_request->requested_peips_assistance_information, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_peips_assistance_information(&registration_request->requested_peips_assistance_information, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_peips_assistance_information() failed");
+               ogs_error("ogs_nas_5gs_read_peips_assistance_information() failed");
                return size;
             }
 
@@ -502,9 +520,10 @@ int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_T3512_VALUE_TYPE:
-            size = ogs_nas_5gs_decode_gprs_timer_3(&registration_request->requested_t3512_value, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_gprs_timer_3(&registration_request->requested_t3512_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_gprs_timer_3() failed");
+               ogs_error("ogs_nas_5gs_read_gprs_timer_3() failed");
                return size;
             }
 
@@ -513,45 +532,44 @@ int ogs_nas_5gs_decode_registration_request(ogs_nas_5gs_message_t *message, ogs_
             break;
         default:
             ogs_error("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_registration_accept_t *registration_accept = &message->gmm.registration_accept;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode REGISTRATION_ACCEPT\n");
 
-    size = ogs_nas_5gs_decode_5gs_registration_result(&registration_accept->registration_result, pkbuf);
+    size = ogs_nas_5gs_read_5gs_registration_result(&registration_accept->registration_result, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_5gs_decode_5gs_registration_result() failed");
+        ogs_error("ogs_nas_5gs_read_5gs_registration_result() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch(type) {
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_5G_GUTI_TYPE:
-            size = ogs_nas_5gs_decode_5gs_mobile_identity(&registration_accept->guti, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_5gs_mobile_identity(&registration_accept->guti, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_5gs_mobile_identity() failed");
+               ogs_error("ogs_nas_5gs_read_5gs_mobile_identity() failed");
                return size;
             }
 
@@ -559,9 +577,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_EQUIVALENT_PLMNS_TYPE:
-            size = ogs_nas_5gs_decode_plmn_list(&registration_accept->equivalent_plmns, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_plmn_list(&registration_accept->equivalent_plmns, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_plmn_list() failed");
+               ogs_error("ogs_nas_5gs_read_plmn_list() failed");
                return size;
             }
 
@@ -569,9 +588,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_TAI_LIST_TYPE:
-            size = ogs_nas_5gs_decode_5gs_tracking_area_identity_list(&registration_accept->tai_list, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_5gs_tracking_area_identity_list(&registration_accept->tai_list, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_5gs_tracking_area_identity_list() failed");
+               ogs_error("ogs_nas_5gs_read_5gs_tracking_area_identity_list() failed");
                return size;
             }
 
@@ -579,9 +599,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_ALLOWED_NSSAI_TYPE:
-            size = ogs_nas_5gs_decode_nssai(&registration_accept->allowed_nssai, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_nssai(&registration_accept->allowed_nssai, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_nssai() failed");
+               ogs_error("ogs_nas_5gs_read_nssai() failed");
                return size;
             }
 
@@ -589,9 +610,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_REJECTED_NSSAI_TYPE:
-            size = ogs_nas_5gs_decode_rejected_nssai(&registration_accept->rejected_nssai, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_rejected_nssai(&registration_accept->rejected_nssai, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_rejected_nssai() failed");
+               ogs_error("ogs_nas_5gs_read_rejected_nssai() failed");
                return size;
             }
 
@@ -599,9 +621,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_CONFIGURED_NSSAI_TYPE:
-            size = ogs_nas_5gs_decode_nssai(&registration_accept->configured_nssai, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_nssai(&registration_accept->configured_nssai, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_nssai() failed");
+               ogs_error("ogs_nas_5gs_read_nssai() failed");
                return size;
             }
 
@@ -609,9 +632,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_5GS_NETWORK_FEATURE_SUPPORT_TYPE:
-            size = ogs_nas_5gs_decode_5gs_network_feature_support(&registration_accept->network_feature_support, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_5gs_network_feature_support(&registration_accept->network_feature_support, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_5gs_network_feature_support() failed");
+               ogs_error("ogs_nas_5gs_read_5gs_network_feature_support() failed");
                return size;
             }
 
@@ -619,9 +643,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_PDU_SESSION_STATUS_TYPE:
-            size = ogs_nas_5gs_decode_pdu_session_status(&registration_accept->pdu_session_status, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_pdu_session_status(&registration_accept->pdu_session_status, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_pdu_session_status() failed");
+               ogs_error("ogs_nas_5gs_read_pdu_session_status() failed");
                return size;
             }
 
@@ -629,9 +654,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_PDU_SESSION_REACTIVATION_RESULT_TYPE:
-            size = ogs_nas_5gs_decode_pdu_session_reactivation_result(&registration_accept->pdu_session_reactivation_result, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_pdu_session_reactivation_result(&registration_accept->pdu_session_reactivation_result, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_pdu_session_reactivation_result() failed");
+               ogs_error("ogs_nas_5gs_read_pdu_session_reactivation_result() failed");
                return size;
             }
 
@@ -639,9 +665,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_PDU_SESSION_REACTIVATION_RESULT_ERROR_CAUSE_TYPE:
-            size = ogs_nas_5gs_decode_pdu_session_reactivation_result_error_cause(&registration_accept->pdu_session_reactivation_result_error_cause, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_pdu_session_reactivation_result_error_cause(&registration_accept->pdu_session_reactivation_result_error_cause, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_pdu_session_reactivation_result_error_cause() failed");
+               ogs_error("ogs_nas_5gs_read_pdu_session_reactivation_result_error_cause() failed");
                return size;
             }
 
@@ -649,9 +676,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_LADN_INFORMATION_TYPE:
-            size = ogs_nas_5gs_decode_ladn_information(&registration_accept->ladn_information, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_ladn_information(&registration_accept->ladn_information, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_ladn_information() failed");
+               ogs_error("ogs_nas_5gs_read_ladn_information() failed");
                return size;
             }
 
@@ -659,11 +687,9 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_MICO_INDICATION_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_5gs_decode_mico_indication(&registration_accept->mico_indication, pkbuf);
+            size = ogs_nas_5gs_read_mico_indication(&registration_accept->mico_indication, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_mico_indication() failed");
+               ogs_error("ogs_nas_5gs_read_mico_indication() failed");
                return size;
             }
 
@@ -671,11 +697,9 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_NETWORK_SLICING_INDICATION_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_5gs_decode_network_slicing_indication(&registration_accept->network_slicing_indication, pkbuf);
+            size = ogs_nas_5gs_read_network_slicing_indication(&registration_accept->network_slicing_indication, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_network_slicing_indication() failed");
+               ogs_error("ogs_nas_5gs_read_network_slicing_indication() failed");
                return size;
             }
 
@@ -683,9 +707,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_SERVICE_AREA_LIST_TYPE:
-            size = ogs_nas_5gs_decode_service_area_list(&registration_accept->service_area_list, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_service_area_list(&registration_accept->service_area_list, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_service_area_list() failed");
+               ogs_error("ogs_nas_5gs_read_service_area_list() failed");
                return size;
             }
 
@@ -693,9 +718,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_T3512_VALUE_TYPE:
-            size = ogs_nas_5gs_decode_gprs_timer_3(&registration_accept->t3512_value, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_gprs_timer_3(&registration_accept->t3512_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_gprs_timer_3() failed");
+               ogs_error("ogs_nas_5gs_read_gprs_timer_3() failed");
                return size;
             }
 
@@ -703,9 +729,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_NON_3GPP_DE_REGISTRATION_TIMER_VALUE_TYPE:
-            size = ogs_nas_5gs_decode_gprs_timer_2(&registration_accept->non_3gpp_de_registration_timer_value, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_gprs_timer_2(&registration_accept->non_3gpp_de_registration_timer_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_gprs_timer_2() failed");
+               ogs_error("ogs_nas_5gs_read_gprs_timer_2() failed");
                return size;
             }
 
@@ -713,9 +740,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_T3502_VALUE_TYPE:
-            size = ogs_nas_5gs_decode_gprs_timer_2(&registration_accept->t3502_value, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_gprs_timer_2(&registration_accept->t3502_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_gprs_timer_2() failed");
+               ogs_error("ogs_nas_5gs_read_gprs_timer_2() failed");
                return size;
             }
 
@@ -723,9 +751,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_EMERGENCY_NUMBER_LIST_TYPE:
-            size = ogs_nas_5gs_decode_emergency_number_list(&registration_accept->emergency_number_list, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_emergency_number_list(&registration_accept->emergency_number_list, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_emergency_number_list() failed");
+               ogs_error("ogs_nas_5gs_read_emergency_number_list() failed");
                return size;
             }
 
@@ -733,9 +762,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_EXTENDED_EMERGENCY_NUMBER_LIST_TYPE:
-            size = ogs_nas_5gs_decode_extended_emergency_number_list(&registration_accept->extended_emergency_number_list, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_extended_emergency_number_list(&registration_accept->extended_emergency_number_list, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_extended_emergency_number_list() failed");
+               ogs_error("ogs_nas_5gs_read_extended_emergency_number_list() failed");
                return size;
             }
 
@@ -743,9 +773,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_SOR_TRANSPARENT_CONTAINER_TYPE:
-            size = ogs_nas_5gs_decode_sor_transparent_container(&registration_accept->sor_transparent_container, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_sor_transparent_container(&registration_accept->sor_transparent_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_sor_transparent_container() failed");
+               ogs_error("ogs_nas_5gs_read_sor_transparent_container() failed");
                return size;
             }
 
@@ -753,9 +784,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_EAP_MESSAGE_TYPE:
-            size = ogs_nas_5gs_decode_eap_message(&registration_accept->eap_message, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_eap_message(&registration_accept->eap_message, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_eap_message() failed");
+               ogs_error("ogs_nas_5gs_read_eap_message() failed");
                return size;
             }
 
@@ -763,11 +795,9 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_NSSAI_INCLUSION_MODE_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_5gs_decode_nssai_inclusion_mode(&registration_accept->nssai_inclusion_mode, pkbuf);
+            size = ogs_nas_5gs_read_nssai_inclusion_mode(&registration_accept->nssai_inclusion_mode, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_nssai_inclusion_mode() failed");
+               ogs_error("ogs_nas_5gs_read_nssai_inclusion_mode() failed");
                return size;
             }
 
@@ -775,9 +805,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_OPERATOR_DEFINED_ACCESS_CATEGORY_DEFINITIONS_TYPE:
-            size = ogs_nas_5gs_decode_operator_defined_access_category_definitions(&registration_accept->operator_defined_access_category_definitions, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_operator_defined_access_category_definitions(&registration_accept->operator_defined_access_category_definitions, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_operator_defined_access_category_definitions() failed");
+               ogs_error("ogs_nas_5gs_read_operator_defined_access_category_definitions() failed");
                return size;
             }
 
@@ -785,9 +816,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_NEGOTIATED_DRX_PARAMETERS_TYPE:
-            size = ogs_nas_5gs_decode_5gs_drx_parameters(&registration_accept->negotiated_drx_parameters, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_5gs_drx_parameters(&registration_accept->negotiated_drx_parameters, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_5gs_drx_parameters() failed");
+               ogs_error("ogs_nas_5gs_read_5gs_drx_parameters() failed");
                return size;
             }
 
@@ -795,11 +827,9 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_NON_3GPP_NW_POLICIES_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_5gs_decode_non_3gpp_nw_provided_policies(&registration_accept->non_3gpp_nw_policies, pkbuf);
+            size = ogs_nas_5gs_read_non_3gpp_nw_provided_policies(&registration_accept->non_3gpp_nw_policies, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_non_3gpp_nw_provided_policies() failed");
+               ogs_error("ogs_nas_5gs_read_non_3gpp_nw_provided_policies() failed");
                return size;
             }
 
@@ -807,9 +837,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_EPS_BEARER_CONTEXT_STATUS_TYPE:
-            size = ogs_nas_5gs_decode_eps_bearer_context_status(&registration_accept->eps_bearer_context_status, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_eps_bearer_context_status(&registration_accept->eps_bearer_context_status, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_eps_bearer_context_status() failed");
+               ogs_error("ogs_nas_5gs_read_eps_bearer_context_status() failed");
                return size;
             }
 
@@ -817,9 +848,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_NEGOTIATED_EXTENDED_DRX_PARAMETERS_TYPE:
-            size = ogs_nas_5gs_decode_extended_drx_parameters(&registration_accept->negotiated_extended_drx_parameters, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_extended_drx_parameters(&registration_accept->negotiated_extended_drx_parameters, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_extended_drx_parameters() failed");
+               ogs_error("ogs_nas_5gs_read_extended_drx_parameters() failed");
                return size;
             }
 
@@ -827,9 +859,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_T3447_VALUE_TYPE:
-            size = ogs_nas_5gs_decode_gprs_timer_3(&registration_accept->t3447_value, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_gprs_timer_3(&registration_accept->t3447_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_gprs_timer_3() failed");
+               ogs_error("ogs_nas_5gs_read_gprs_timer_3() failed");
                return size;
             }
 
@@ -837,9 +870,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_T3448_VALUE_TYPE:
-            size = ogs_nas_5gs_decode_gprs_timer_2(&registration_accept->t3448_value, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_gprs_timer_2(&registration_accept->t3448_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_gprs_timer_2() failed");
+               ogs_error("ogs_nas_5gs_read_gprs_timer_2() failed");
                return size;
             }
 
@@ -847,9 +881,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_T3324_VALUE_TYPE:
-            size = ogs_nas_5gs_decode_gprs_timer_3(&registration_accept->t3324_value, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_gprs_timer_3(&registration_accept->t3324_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_gprs_timer_3() failed");
+               ogs_error("ogs_nas_5gs_read_gprs_timer_3() failed");
                return size;
             }
 
@@ -857,9 +892,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_UE_RADIO_CAPABILITY_ID_TYPE:
-            size = ogs_nas_5gs_decode_ue_radio_capability_id(&registration_accept->ue_radio_capability_id, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_ue_radio_capability_id(&registration_accept->ue_radio_capability_id, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_ue_radio_capability_id() failed");
+               ogs_error("ogs_nas_5gs_read_ue_radio_capability_id() failed");
                return size;
             }
 
@@ -867,11 +903,9 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_UE_RADIO_CAPABILITY_ID_DELETION_INDICATION_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_5gs_decode_ue_radio_capability_id_deletion_indication(&registration_accept->ue_radio_capability_id_deletion_indication, pkbuf);
+            size = ogs_nas_5gs_read_ue_radio_capability_id_deletion_indication(&registration_accept->ue_radio_capability_id_deletion_indication, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_ue_radio_capability_id_deletion_indication() failed");
+               ogs_error("ogs_nas_5gs_read_ue_radio_capability_id_deletion_indication() failed");
                return size;
             }
 
@@ -879,9 +913,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_PENDING_NSSAI_TYPE:
-            size = ogs_nas_5gs_decode_nssai(&registration_accept->pending_nssai, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_nssai(&registration_accept->pending_nssai, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_nssai() failed");
+               ogs_error("ogs_nas_5gs_read_nssai() failed");
                return size;
             }
 
@@ -889,9 +924,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_CIPHERING_KEY_DATA_TYPE:
-            size = ogs_nas_5gs_decode_ciphering_key_data(&registration_accept->ciphering_key_data, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_ciphering_key_data(&registration_accept->ciphering_key_data, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_ciphering_key_data() failed");
+               ogs_error("ogs_nas_5gs_read_ciphering_key_data() failed");
                return size;
             }
 
@@ -899,9 +935,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_CAG_INFORMATION_LIST_TYPE:
-            size = ogs_nas_5gs_decode_cag_information_list(&registration_accept->cag_information_list, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_cag_information_list(&registration_accept->cag_information_list, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_cag_information_list() failed");
+               ogs_error("ogs_nas_5gs_read_cag_information_list() failed");
                return size;
             }
 
@@ -909,9 +946,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_TRUNCATED_5G_S_TMSI_CONFIGURATION_TYPE:
-            size = ogs_nas_5gs_decode_truncated_5g_s_tmsi_configuration(&registration_accept->truncated_s_tmsi_configuration, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_truncated_5g_s_tmsi_configuration(&registration_accept->truncated_s_tmsi_configuration, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_truncated_5g_s_tmsi_configuration() failed");
+               ogs_error("ogs_nas_5gs_read_truncated_5g_s_tmsi_configuration() failed");
                return size;
             }
 
@@ -919,9 +957,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_NEGOTIATED_WUS_ASSISTANCE_INFORMATION_TYPE:
-            size = ogs_nas_5gs_decode_wus_assistance_information(&registration_accept->negotiated_wus_assistance_information, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_wus_assistance_information(&registration_accept->negotiated_wus_assistance_information, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_wus_assistance_information() failed");
+               ogs_error("ogs_nas_5gs_read_wus_assistance_information() failed");
                return size;
             }
 
@@ -929,9 +968,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_NEGOTIATED_NB_N1_MODE_DRX_PARAMETERS_TYPE:
-            size = ogs_nas_5gs_decode_nb_n1_mode_drx_parameters(&registration_accept->negotiated_nb_n1_mode_drx_parameters, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_nb_n1_mode_drx_parameters(&registration_accept->negotiated_nb_n1_mode_drx_parameters, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_nb_n1_mode_drx_parameters() failed");
+               ogs_error("ogs_nas_5gs_read_nb_n1_mode_drx_parameters() failed");
                return size;
             }
 
@@ -939,9 +979,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_EXTENDED_REJECTED_NSSAI_TYPE:
-            size = ogs_nas_5gs_decode_extended_rejected_nssai(&registration_accept->extended_rejected_nssai, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_extended_rejected_nssai(&registration_accept->extended_rejected_nssai, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_extended_rejected_nssai() failed");
+               ogs_error("ogs_nas_5gs_read_extended_rejected_nssai() failed");
                return size;
             }
 
@@ -949,9 +990,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_SERVICE_LEVEL_AA_CONTAINER_TYPE:
-            size = ogs_nas_5gs_decode_service_level_aa_container(&registration_accept->service_level_aa_container, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_service_level_aa_container(&registration_accept->service_level_aa_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_service_level_aa_container() failed");
+               ogs_error("ogs_nas_5gs_read_service_level_aa_container() failed");
                return size;
             }
 
@@ -959,20 +1001,22 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_NEGOTIATED_PEIPS_ASSISTANCE_INFORMATION_TYPE:
-            size = ogs_nas_5gs_decode_peips_assistance_information(&registration_accept->negotiated_peips_assistance_information, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_peips_assistance_information(&registration_accept->negotiated_peips_assistance_information, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_peips_assistance_information() failed");
+               ogs_error("ogs_nas_5gs_read_peips_assistance_information() failed");
                return size;
             }
 
             registration_accept->presencemask |= OGS_NAS_5GS_REGISTRATION_ACCEPT_NEGOTIATED_PEIPS_ASSISTANCE_INFORMATION_PRESENT;
             decoded += size;
             break;
-#if 0 /* Modified by acetcom */
+#if 0 /* The IEI is taken by an earlier IE */
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_5GS_ADDITIONAL_REQUEST_RESULT_TYPE:
-            size = ogs_nas_5gs_decode_5gs_additional_request_result(&registration_accept->additional_request_result, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_5gs_additional_request_result(&registration_accept->additional_request_result, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_5gs_additional_request_result() failed");
+               ogs_error("ogs_nas_5gs_read_5gs_additional_request_result() failed");
                return size;
             }
 
@@ -981,9 +1025,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             break;
 #endif
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_NSSRG_INFORMATION_TYPE:
-            size = ogs_nas_5gs_decode_nssrg_information(&registration_accept->nssrg_information, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_nssrg_information(&registration_accept->nssrg_information, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_nssrg_information() failed");
+               ogs_error("ogs_nas_5gs_read_nssrg_information() failed");
                return size;
             }
 
@@ -991,9 +1036,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_DISASTER_ROAMING_WAIT_RANGE_TYPE:
-            size = ogs_nas_5gs_decode_registration_wait_range(&registration_accept->disaster_roaming_wait_range, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_registration_wait_range(&registration_accept->disaster_roaming_wait_range, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_registration_wait_range() failed");
+               ogs_error("ogs_nas_5gs_read_registration_wait_range() failed");
                return size;
             }
 
@@ -1001,9 +1047,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_DISASTER_RETURN_WAIT_RANGE_TYPE:
-            size = ogs_nas_5gs_decode_registration_wait_range(&registration_accept->disaster_return_wait_range, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_registration_wait_range(&registration_accept->disaster_return_wait_range, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_registration_wait_range() failed");
+               ogs_error("ogs_nas_5gs_read_registration_wait_range() failed");
                return size;
             }
 
@@ -1011,9 +1058,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_LIST_OF_PLMNS_TO_BE_USED_IN_DISASTER_CONDITION_TYPE:
-            size = ogs_nas_5gs_decode_list_of_plmns_to_be_used_in_disaster_condition(&registration_accept->list_of_plmns_to_be_used_in_disaster_condition, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_list_of_plmns_to_be_used_in_disaster_condition(&registration_accept->list_of_plmns_to_be_used_in_disaster_condition, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_list_of_plmns_to_be_used_in_disaster_condition() failed");
+               ogs_error("ogs_nas_5gs_read_list_of_plmns_to_be_used_in_disaster_condition() failed");
                return size;
             }
 
@@ -1021,9 +1069,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_FORBIDDEN_TAI_FOR_THE_LIST_OF_5GS_FORBIDDEN_TRACKING_AREAS_FOR_ROAMING_TYPE:
-            size = ogs_nas_5gs_decode_5gs_tracking_area_identity_list(&registration_accept->forbidden_tai_for_the_list_of_forbidden_tracking_areas_for_roaming, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_5gs_tracking_area_identity_list(&registration_accept->forbidden_tai_for_the_list_of_forbidden_tracking_areas_for_roaming, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_5gs_tracking_area_identity_list() failed");
+               ogs_error("ogs_nas_5gs_read_5gs_tracking_area_identity_list() failed");
                return size;
             }
 
@@ -1031,9 +1080,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_FORBIDDEN_TAI_FOR_THE_LIST_OF_5GS_FORBIDDEN_TRACKING_AREAS_FORREGIONAL_PROVISION_OF_SERVICE_TYPE:
-            size = ogs_nas_5gs_decode_5gs_tracking_area_identity_list(&registration_accept->forbidden_tai_for_the_list_of_forbidden_tracking_areas_forregional_provision_of_service, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_5gs_tracking_area_identity_list(&registration_accept->forbidden_tai_for_the_list_of_forbidden_tracking_areas_forregional_provision_of_service, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_5gs_tracking_area_identity_list() failed");
+               ogs_error("ogs_nas_5gs_read_5gs_tracking_area_identity_list() failed");
                return size;
             }
 
@@ -1041,9 +1091,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_EXTENDED_CAG_INFORMATION_LIST_TYPE:
-            size = ogs_nas_5gs_decode_extended_cag_information_list(&registration_accept->extended_cag_information_list, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_extended_cag_information_list(&registration_accept->extended_cag_information_list, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_extended_cag_information_list() failed");
+               ogs_error("ogs_nas_5gs_read_extended_cag_information_list() failed");
                return size;
             }
 
@@ -1051,9 +1102,10 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_ACCEPT_NSAG_INFORMATION_TYPE:
-            size = ogs_nas_5gs_decode_nsag_information(&registration_accept->nsag_information, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_nsag_information(&registration_accept->nsag_information, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_nsag_information() failed");
+               ogs_error("ogs_nas_5gs_read_nsag_information() failed");
                return size;
             }
 
@@ -1062,37 +1114,36 @@ int ogs_nas_5gs_decode_registration_accept(ogs_nas_5gs_message_t *message, ogs_p
             break;
         default:
             ogs_error("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_registration_complete(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_registration_complete_t *registration_complete = &message->gmm.registration_complete;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode REGISTRATION_COMPLETE\n");
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch(type) {
         case OGS_NAS_5GS_REGISTRATION_COMPLETE_SOR_TRANSPARENT_CONTAINER_TYPE:
-            size = ogs_nas_5gs_decode_sor_transparent_container(&registration_complete->sor_transparent_container, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_sor_transparent_container(&registration_complete->sor_transparent_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_sor_transparent_container() failed");
+               ogs_error("ogs_nas_5gs_read_sor_transparent_container() failed");
                return size;
             }
 
@@ -1101,45 +1152,44 @@ int ogs_nas_5gs_decode_registration_complete(ogs_nas_5gs_message_t *message, ogs
             break;
         default:
             ogs_error("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_registration_reject(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_registration_reject_t *registration_reject = &message->gmm.registration_reject;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode REGISTRATION_REJECT\n");
 
-    size = ogs_nas_5gs_decode_5gmm_cause(&registration_reject->gmm_cause, pkbuf);
+    size = ogs_nas_5gs_read_5gmm_cause(&registration_reject->gmm_cause, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_5gs_decode_5gmm_cause() failed");
+        ogs_error("ogs_nas_5gs_read_5gmm_cause() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch(type) {
         case OGS_NAS_5GS_REGISTRATION_REJECT_T3346_VALUE_TYPE:
-            size = ogs_nas_5gs_decode_gprs_timer_2(&registration_reject->t3346_value, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_gprs_timer_2(&registration_reject->t3346_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_gprs_timer_2() failed");
+               ogs_error("ogs_nas_5gs_read_gprs_timer_2() failed");
                return size;
             }
 
@@ -1147,9 +1197,10 @@ int ogs_nas_5gs_decode_registration_reject(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REJECT_T3502_VALUE_TYPE:
-            size = ogs_nas_5gs_decode_gprs_timer_2(&registration_reject->t3502_value, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_gprs_timer_2(&registration_reject->t3502_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_gprs_timer_2() failed");
+               ogs_error("ogs_nas_5gs_read_gprs_timer_2() failed");
                return size;
             }
 
@@ -1157,9 +1208,10 @@ int ogs_nas_5gs_decode_registration_reject(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REJECT_EAP_MESSAGE_TYPE:
-            size = ogs_nas_5gs_decode_eap_message(&registration_reject->eap_message, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_eap_message(&registration_reject->eap_message, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_eap_message() failed");
+               ogs_error("ogs_nas_5gs_read_eap_message() failed");
                return size;
             }
 
@@ -1167,9 +1219,10 @@ int ogs_nas_5gs_decode_registration_reject(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REJECT_REJECTED_NSSAI_TYPE:
-            size = ogs_nas_5gs_decode_rejected_nssai(&registration_reject->rejected_nssai, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_rejected_nssai(&registration_reject->rejected_nssai, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_rejected_nssai() failed");
+               ogs_error("ogs_nas_5gs_read_rejected_nssai() failed");
                return size;
             }
 
@@ -1177,9 +1230,10 @@ int ogs_nas_5gs_decode_registration_reject(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REJECT_CAG_INFORMATION_LIST_TYPE:
-            size = ogs_nas_5gs_decode_cag_information_list(&registration_reject->cag_information_list, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_cag_information_list(&registration_reject->cag_information_list, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_cag_information_list() failed");
+               ogs_error("ogs_nas_5gs_read_cag_information_list() failed");
                return size;
             }
 
@@ -1187,9 +1241,10 @@ int ogs_nas_5gs_decode_registration_reject(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REJECT_EXTENDED_REJECTED_NSSAI_TYPE:
-            size = ogs_nas_5gs_decode_extended_rejected_nssai(&registration_reject->extended_rejected_nssai, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_extended_rejected_nssai(&registration_reject->extended_rejected_nssai, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_extended_rejected_nssai() failed");
+               ogs_error("ogs_nas_5gs_read_extended_rejected_nssai() failed");
                return size;
             }
 
@@ -1197,9 +1252,10 @@ int ogs_nas_5gs_decode_registration_reject(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REJECT_DISASTER_RETURN_WAIT_RANGE_TYPE:
-            size = ogs_nas_5gs_decode_registration_wait_range(&registration_reject->disaster_return_wait_range, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_registration_wait_range(&registration_reject->disaster_return_wait_range, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_registration_wait_range() failed");
+               ogs_error("ogs_nas_5gs_read_registration_wait_range() failed");
                return size;
             }
 
@@ -1207,9 +1263,10 @@ int ogs_nas_5gs_decode_registration_reject(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REJECT_EXTENDED_CAG_INFORMATION_LIST_TYPE:
-            size = ogs_nas_5gs_decode_extended_cag_information_list(&registration_reject->extended_cag_information_list, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_extended_cag_information_list(&registration_reject->extended_cag_information_list, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_extended_cag_information_list() failed");
+               ogs_error("ogs_nas_5gs_read_extended_cag_information_list() failed");
                return size;
             }
 
@@ -1217,9 +1274,10 @@ int ogs_nas_5gs_decode_registration_reject(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REJECT_LOWER_BOUND_TIMER_VALUE_TYPE:
-            size = ogs_nas_5gs_decode_gprs_timer_3(&registration_reject->lower_bound_timer_value, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_gprs_timer_3(&registration_reject->lower_bound_timer_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_gprs_timer_3() failed");
+               ogs_error("ogs_nas_5gs_read_gprs_timer_3() failed");
                return size;
             }
 
@@ -1227,9 +1285,10 @@ int ogs_nas_5gs_decode_registration_reject(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REJECT_FORBIDDEN_TAI_FOR_THE_LIST_OF_5GS_FORBIDDEN_TRACKING_AREAS_FOR_ROAMING_TYPE:
-            size = ogs_nas_5gs_decode_5gs_tracking_area_identity_list(&registration_reject->forbidden_tai_for_the_list_of_forbidden_tracking_areas_for_roaming, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_5gs_tracking_area_identity_list(&registration_reject->forbidden_tai_for_the_list_of_forbidden_tracking_areas_for_roaming, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_5gs_tracking_area_identity_list() failed");
+               ogs_error("ogs_nas_5gs_read_5gs_tracking_area_identity_list() failed");
                return size;
             }
 
@@ -1237,9 +1296,10 @@ int ogs_nas_5gs_decode_registration_reject(ogs_nas_5gs_message_t *message, ogs_p
             decoded += size;
             break;
         case OGS_NAS_5GS_REGISTRATION_REJECT_FORBIDDEN_TAI_FOR_THE_LIST_OF_5GS_FORBIDDEN_TRACKING_AREAS_FORREGIONAL_PROVISION_OF_SERVICE_TYPE:
-            size = ogs_nas_5gs_decode_5gs_tracking_area_identity_list(&registration_reject->forbidden_tai_for_the_list_of_forbidden_tracking_areas_forregional_provision_of_service, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_5gs_tracking_area_identity_list(&registration_reject->forbidden_tai_for_the_list_of_forbidden_tracking_areas_forregional_provision_of_service, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_5gs_tracking_area_identity_list() failed");
+               ogs_error("ogs_nas_5gs_read_5gs_tracking_area_identity_list() failed");
                return size;
             }
 
@@ -1248,72 +1308,75 @@ int ogs_nas_5gs_decode_registration_reject(ogs_nas_5gs_message_t *message, ogs_p
             break;
         default:
             ogs_error("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_deregistration_request_from_ue(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_deregistration_request_from_ue_t *deregistration_request_from_ue = &message->gmm.deregistration_request_from_ue;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode DEREGISTRATION_REQUEST_FROM_UE\n");
 
-    size = ogs_nas_5gs_decode_de_registration_type(&deregistration_request_from_ue->de_registration_type, pkbuf);
+    size = ogs_nas_5gs_read_de_registration_type(&deregistration_request_from_ue->de_registration_type, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_5gs_decode_de_registration_type() failed");
+        ogs_error("ogs_nas_5gs_read_de_registration_type() failed");
         return size;
     }
 
     decoded += size;
 
-    size = ogs_nas_5gs_decode_5gs_mobile_identity(&deregistration_request_from_ue->mobile_identity, pkbuf);
+    size = ogs_nas_5gs_read_5gs_mobile_identity(&deregistration_request_from_ue->mobile_identity, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_5gs_decode_5gs_mobile_identity() failed");
+        ogs_error("ogs_nas_5gs_read_5gs_mobile_identity() failed");
         return size;
     }
 
     decoded += size;
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_deregistration_request_to_ue(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_deregistration_request_to_ue_t *deregistration_request_to_ue = &message->gmm.deregistration_request_to_ue;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode DEREGISTRATION_REQUEST_TO_UE\n");
 
-    size = ogs_nas_5gs_decode_de_registration_type(&deregistration_request_to_ue->de_registration_type, pkbuf);
+    size = ogs_nas_5gs_read_de_registration_type(&deregistration_request_to_ue->de_registration_type, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_5gs_decode_de_registration_type() failed");
+        ogs_error("ogs_nas_5gs_read_de_registration_type() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch(type) {
         case OGS_NAS_5GS_DEREGISTRATION_REQUEST_TO_UE_5GMM_CAUSE_TYPE:
-            size = ogs_nas_5gs_decode_5gmm_cause(&deregistration_request_to_ue->gmm_cause, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_5gmm_cause(&deregistration_request_to_ue->gmm_cause, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_5gmm_cause() failed");
+               ogs_error("ogs_nas_5gs_read_5gmm_cause() failed");
                return size;
             }
 
@@ -1321,9 +1384,10 @@ int ogs_nas_5gs_decode_deregistration_request_to_ue(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_DEREGISTRATION_REQUEST_TO_UE_T3346_VALUE_TYPE:
-            size = ogs_nas_5gs_decode_gprs_timer_2(&deregistration_request_to_ue->t3346_value, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_gprs_timer_2(&deregistration_request_to_ue->t3346_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_gprs_timer_2() failed");
+               ogs_error("ogs_nas_5gs_read_gprs_timer_2() failed");
                return size;
             }
 
@@ -1331,9 +1395,10 @@ int ogs_nas_5gs_decode_deregistration_request_to_ue(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_DEREGISTRATION_REQUEST_TO_UE_REJECTED_NSSAI_TYPE:
-            size = ogs_nas_5gs_decode_rejected_nssai(&deregistration_request_to_ue->rejected_nssai, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_rejected_nssai(&deregistration_request_to_ue->rejected_nssai, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_rejected_nssai() failed");
+               ogs_error("ogs_nas_5gs_read_rejected_nssai() failed");
                return size;
             }
 
@@ -1341,9 +1406,10 @@ int ogs_nas_5gs_decode_deregistration_request_to_ue(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_DEREGISTRATION_REQUEST_TO_UE_CAG_INFORMATION_LIST_TYPE:
-            size = ogs_nas_5gs_decode_cag_information_list(&deregistration_request_to_ue->cag_information_list, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_cag_information_list(&deregistration_request_to_ue->cag_information_list, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_cag_information_list() failed");
+               ogs_error("ogs_nas_5gs_read_cag_information_list() failed");
                return size;
             }
 
@@ -1351,9 +1417,10 @@ int ogs_nas_5gs_decode_deregistration_request_to_ue(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_DEREGISTRATION_REQUEST_TO_UE_EXTENDED_REJECTED_NSSAI_TYPE:
-            size = ogs_nas_5gs_decode_extended_rejected_nssai(&deregistration_request_to_ue->extended_rejected_nssai, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_extended_rejected_nssai(&deregistration_request_to_ue->extended_rejected_nssai, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_extended_rejected_nssai() failed");
+               ogs_error("ogs_nas_5gs_read_extended_rejected_nssai() failed");
                return size;
             }
 
@@ -1361,9 +1428,10 @@ int ogs_nas_5gs_decode_deregistration_request_to_ue(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_DEREGISTRATION_REQUEST_TO_UE_DISASTER_RETURN_WAIT_RANGE_TYPE:
-            size = ogs_nas_5gs_decode_registration_wait_range(&deregistration_request_to_ue->disaster_return_wait_range, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_registration_wait_range(&deregistration_request_to_ue->disaster_return_wait_range, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_registration_wait_range() failed");
+               ogs_error("ogs_nas_5gs_read_registration_wait_range() failed");
                return size;
             }
 
@@ -1371,9 +1439,10 @@ int ogs_nas_5gs_decode_deregistration_request_to_ue(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_DEREGISTRATION_REQUEST_TO_UE_EXTENDED_CAG_INFORMATION_LIST_TYPE:
-            size = ogs_nas_5gs_decode_extended_cag_information_list(&deregistration_request_to_ue->extended_cag_information_list, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_extended_cag_information_list(&deregistration_request_to_ue->extended_cag_information_list, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_extended_cag_information_list() failed");
+               ogs_error("ogs_nas_5gs_read_extended_cag_information_list() failed");
                return size;
             }
 
@@ -1381,9 +1450,10 @@ int ogs_nas_5gs_decode_deregistration_request_to_ue(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_DEREGISTRATION_REQUEST_TO_UE_LOWER_BOUND_TIMER_VALUE_TYPE:
-            size = ogs_nas_5gs_decode_gprs_timer_3(&deregistration_request_to_ue->lower_bound_timer_value, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_gprs_timer_3(&deregistration_request_to_ue->lower_bound_timer_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_gprs_timer_3() failed");
+               ogs_error("ogs_nas_5gs_read_gprs_timer_3() failed");
                return size;
             }
 
@@ -1391,9 +1461,10 @@ int ogs_nas_5gs_decode_deregistration_request_to_ue(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_DEREGISTRATION_REQUEST_TO_UE_FORBIDDEN_TAI_FOR_THE_LIST_OF_5GS_FORBIDDEN_TRACKING_AREAS_FOR_ROAMING_TYPE:
-            size = ogs_nas_5gs_decode_5gs_tracking_area_identity_list(&deregistration_request_to_ue->forbidden_tai_for_the_list_of_forbidden_tracking_areas_for_roaming, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_5gs_tracking_area_identity_list(&deregistration_request_to_ue->forbidden_tai_for_the_list_of_forbidden_tracking_areas_for_roaming, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_5gs_tracking_area_identity_list() failed");
+               ogs_error("ogs_nas_5gs_read_5gs_tracking_area_identity_list() failed");
                return size;
             }
 
@@ -1401,9 +1472,10 @@ int ogs_nas_5gs_decode_deregistration_request_to_ue(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_DEREGISTRATION_REQUEST_TO_UE_FORBIDDEN_TAI_FOR_THE_LIST_OF_5GS_FORBIDDEN_TRACKING_AREAS_FORREGIONAL_PROVISION_OF_SERVICE_TYPE:
-            size = ogs_nas_5gs_decode_5gs_tracking_area_identity_list(&deregistration_request_to_ue->forbidden_tai_for_the_list_of_forbidden_tracking_areas_forregional_provision_of_service, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_5gs_tracking_area_identity_list(&deregistration_request_to_ue->forbidden_tai_for_the_list_of_forbidden_tracking_areas_forregional_provision_of_service, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_5gs_tracking_area_identity_list() failed");
+               ogs_error("ogs_nas_5gs_read_5gs_tracking_area_identity_list() failed");
                return size;
             }
 
@@ -1412,53 +1484,52 @@ int ogs_nas_5gs_decode_deregistration_request_to_ue(ogs_nas_5gs_message_t *messa
             break;
         default:
             ogs_error("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_service_request(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_service_request_t *service_request = &message->gmm.service_request;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode SERVICE_REQUEST\n");
 
-    size = ogs_nas_5gs_decode_key_set_identifier(&service_request->ngksi, pkbuf);
+    size = ogs_nas_5gs_read_key_set_identifier(&service_request->ngksi, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_5gs_decode_key_set_identifier() failed");
+        ogs_error("ogs_nas_5gs_read_key_set_identifier() failed");
         return size;
     }
 
     decoded += size;
 
-    size = ogs_nas_5gs_decode_5gs_mobile_identity(&service_request->s_tmsi, pkbuf);
+    size = ogs_nas_5gs_read_5gs_mobile_identity(&service_request->s_tmsi, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_5gs_decode_5gs_mobile_identity() failed");
+        ogs_error("ogs_nas_5gs_read_5gs_mobile_identity() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch(type) {
         case OGS_NAS_5GS_SERVICE_REQUEST_UPLINK_DATA_STATUS_TYPE:
-            size = ogs_nas_5gs_decode_uplink_data_status(&service_request->uplink_data_status, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_uplink_data_status(&service_request->uplink_data_status, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_uplink_data_status() failed");
+               ogs_error("ogs_nas_5gs_read_uplink_data_status() failed");
                return size;
             }
 
@@ -1466,9 +1537,10 @@ int ogs_nas_5gs_decode_service_request(ogs_nas_5gs_message_t *message, ogs_pkbuf
             decoded += size;
             break;
         case OGS_NAS_5GS_SERVICE_REQUEST_PDU_SESSION_STATUS_TYPE:
-            size = ogs_nas_5gs_decode_pdu_session_status(&service_request->pdu_session_status, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_pdu_session_status(&service_request->pdu_session_status, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_pdu_session_status() failed");
+               ogs_error("ogs_nas_5gs_read_pdu_session_status() failed");
                return size;
             }
 
@@ -1476,9 +1548,10 @@ int ogs_nas_5gs_decode_service_request(ogs_nas_5gs_message_t *message, ogs_pkbuf
             decoded += size;
             break;
         case OGS_NAS_5GS_SERVICE_REQUEST_ALLOWED_PDU_SESSION_STATUS_TYPE:
-            size = ogs_nas_5gs_decode_allowed_pdu_session_status(&service_request->allowed_pdu_session_status, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_allowed_pdu_session_status(&service_request->allowed_pdu_session_status, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_allowed_pdu_session_status() failed");
+               ogs_error("ogs_nas_5gs_read_allowed_pdu_session_status() failed");
                return size;
             }
 
@@ -1486,9 +1559,10 @@ int ogs_nas_5gs_decode_service_request(ogs_nas_5gs_message_t *message, ogs_pkbuf
             decoded += size;
             break;
         case OGS_NAS_5GS_SERVICE_REQUEST_NAS_MESSAGE_CONTAINER_TYPE:
-            size = ogs_nas_5gs_decode_message_container(&service_request->nas_message_container, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_message_container(&service_request->nas_message_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_message_container() failed");
+               ogs_error("ogs_nas_5gs_read_message_container() failed");
                return size;
             }
 
@@ -1496,9 +1570,10 @@ int ogs_nas_5gs_decode_service_request(ogs_nas_5gs_message_t *message, ogs_pkbuf
             decoded += size;
             break;
         case OGS_NAS_5GS_SERVICE_REQUEST_UE_REQUEST_TYPE_TYPE:
-            size = ogs_nas_5gs_decode_ue_request_type(&service_request->ue_request_type, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_ue_request_type(&service_request->ue_request_type, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_ue_request_type() failed");
+               ogs_error("ogs_nas_5gs_read_ue_request_type() failed");
                return size;
             }
 
@@ -1506,9 +1581,10 @@ int ogs_nas_5gs_decode_service_request(ogs_nas_5gs_message_t *message, ogs_pkbuf
             decoded += size;
             break;
         case OGS_NAS_5GS_SERVICE_REQUEST_PAGING_RESTRICTION_TYPE:
-            size = ogs_nas_5gs_decode_paging_restriction(&service_request->paging_restriction, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_paging_restriction(&service_request->paging_restriction, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_paging_restriction() failed");
+               ogs_error("ogs_nas_5gs_read_paging_restriction() failed");
                return size;
             }
 
@@ -1517,45 +1593,44 @@ int ogs_nas_5gs_decode_service_request(ogs_nas_5gs_message_t *message, ogs_pkbuf
             break;
         default:
             ogs_error("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_service_reject(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_service_reject_t *service_reject = &message->gmm.service_reject;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode SERVICE_REJECT\n");
 
-    size = ogs_nas_5gs_decode_5gmm_cause(&service_reject->gmm_cause, pkbuf);
+    size = ogs_nas_5gs_read_5gmm_cause(&service_reject->gmm_cause, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_5gs_decode_5gmm_cause() failed");
+        ogs_error("ogs_nas_5gs_read_5gmm_cause() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch(type) {
         case OGS_NAS_5GS_SERVICE_REJECT_PDU_SESSION_STATUS_TYPE:
-            size = ogs_nas_5gs_decode_pdu_session_status(&service_reject->pdu_session_status, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_pdu_session_status(&service_reject->pdu_session_status, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_pdu_session_status() failed");
+               ogs_error("ogs_nas_5gs_read_pdu_session_status() failed");
                return size;
             }
 
@@ -1563,9 +1638,10 @@ int ogs_nas_5gs_decode_service_reject(ogs_nas_5gs_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_5GS_SERVICE_REJECT_T3346_VALUE_TYPE:
-            size = ogs_nas_5gs_decode_gprs_timer_2(&service_reject->t3346_value, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_gprs_timer_2(&service_reject->t3346_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_gprs_timer_2() failed");
+               ogs_error("ogs_nas_5gs_read_gprs_timer_2() failed");
                return size;
             }
 
@@ -1573,9 +1649,10 @@ int ogs_nas_5gs_decode_service_reject(ogs_nas_5gs_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_5GS_SERVICE_REJECT_EAP_MESSAGE_TYPE:
-            size = ogs_nas_5gs_decode_eap_message(&service_reject->eap_message, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_eap_message(&service_reject->eap_message, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_eap_message() failed");
+               ogs_error("ogs_nas_5gs_read_eap_message() failed");
                return size;
             }
 
@@ -1583,9 +1660,10 @@ int ogs_nas_5gs_decode_service_reject(ogs_nas_5gs_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_5GS_SERVICE_REJECT_T3448_VALUE_TYPE:
-            size = ogs_nas_5gs_decode_gprs_timer_2(&service_reject->t3448_value, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_gprs_timer_2(&service_reject->t3448_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_gprs_timer_2() failed");
+               ogs_error("ogs_nas_5gs_read_gprs_timer_2() failed");
                return size;
             }
 
@@ -1593,9 +1671,10 @@ int ogs_nas_5gs_decode_service_reject(ogs_nas_5gs_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_5GS_SERVICE_REJECT_CAG_INFORMATION_LIST_TYPE:
-            size = ogs_nas_5gs_decode_cag_information_list(&service_reject->cag_information_list, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_cag_information_list(&service_reject->cag_information_list, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_cag_information_list() failed");
+               ogs_error("ogs_nas_5gs_read_cag_information_list() failed");
                return size;
             }
 
@@ -1603,9 +1682,10 @@ int ogs_nas_5gs_decode_service_reject(ogs_nas_5gs_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_5GS_SERVICE_REJECT_DISASTER_RETURN_WAIT_RANGE_TYPE:
-            size = ogs_nas_5gs_decode_registration_wait_range(&service_reject->disaster_return_wait_range, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_registration_wait_range(&service_reject->disaster_return_wait_range, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_registration_wait_range() failed");
+               ogs_error("ogs_nas_5gs_read_registration_wait_range() failed");
                return size;
             }
 
@@ -1613,9 +1693,10 @@ int ogs_nas_5gs_decode_service_reject(ogs_nas_5gs_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_5GS_SERVICE_REJECT_EXTENDED_CAG_INFORMATION_LIST_TYPE:
-            size = ogs_nas_5gs_decode_extended_cag_information_list(&service_reject->extended_cag_information_list, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_extended_cag_information_list(&service_reject->extended_cag_information_list, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_extended_cag_information_list() failed");
+               ogs_error("ogs_nas_5gs_read_extended_cag_information_list() failed");
                return size;
             }
 
@@ -1623,9 +1704,10 @@ int ogs_nas_5gs_decode_service_reject(ogs_nas_5gs_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_5GS_SERVICE_REJECT_LOWER_BOUND_TIMER_VALUE_TYPE:
-            size = ogs_nas_5gs_decode_gprs_timer_3(&service_reject->lower_bound_timer_value, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_gprs_timer_3(&service_reject->lower_bound_timer_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_gprs_timer_3() failed");
+               ogs_error("ogs_nas_5gs_read_gprs_timer_3() failed");
                return size;
             }
 
@@ -1633,9 +1715,10 @@ int ogs_nas_5gs_decode_service_reject(ogs_nas_5gs_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_5GS_SERVICE_REJECT_FORBIDDEN_TAI_FOR_THE_LIST_OF_5GS_FORBIDDEN_TRACKING_AREAS_FOR_ROAMING_TYPE:
-            size = ogs_nas_5gs_decode_5gs_tracking_area_identity_list(&service_reject->forbidden_tai_for_the_list_of_forbidden_tracking_areas_for_roaming, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_5gs_tracking_area_identity_list(&service_reject->forbidden_tai_for_the_list_of_forbidden_tracking_areas_for_roaming, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_5gs_tracking_area_identity_list() failed");
+               ogs_error("ogs_nas_5gs_read_5gs_tracking_area_identity_list() failed");
                return size;
             }
 
@@ -1643,9 +1726,10 @@ int ogs_nas_5gs_decode_service_reject(ogs_nas_5gs_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_5GS_SERVICE_REJECT_FORBIDDEN_TAI_FOR_THE_LIST_OF_5GS_FORBIDDEN_TRACKING_AREAS_FORREGIONAL_PROVISION_OF_SERVICE_TYPE:
-            size = ogs_nas_5gs_decode_5gs_tracking_area_identity_list(&service_reject->forbidden_tai_for_the_list_of_forbidden_tracking_areas_forregional_provision_of_service, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_5gs_tracking_area_identity_list(&service_reject->forbidden_tai_for_the_list_of_forbidden_tracking_areas_forregional_provision_of_service, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_5gs_tracking_area_identity_list() failed");
+               ogs_error("ogs_nas_5gs_read_5gs_tracking_area_identity_list() failed");
                return size;
             }
 
@@ -1654,37 +1738,36 @@ int ogs_nas_5gs_decode_service_reject(ogs_nas_5gs_message_t *message, ogs_pkbuf_
             break;
         default:
             ogs_error("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_service_accept(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_service_accept_t *service_accept = &message->gmm.service_accept;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode SERVICE_ACCEPT\n");
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch(type) {
         case OGS_NAS_5GS_SERVICE_ACCEPT_PDU_SESSION_STATUS_TYPE:
-            size = ogs_nas_5gs_decode_pdu_session_status(&service_accept->pdu_session_status, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_pdu_session_status(&service_accept->pdu_session_status, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_pdu_session_status() failed");
+               ogs_error("ogs_nas_5gs_read_pdu_session_status() failed");
                return size;
             }
 
@@ -1692,9 +1775,10 @@ int ogs_nas_5gs_decode_service_accept(ogs_nas_5gs_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_5GS_SERVICE_ACCEPT_PDU_SESSION_REACTIVATION_RESULT_TYPE:
-            size = ogs_nas_5gs_decode_pdu_session_reactivation_result(&service_accept->pdu_session_reactivation_result, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_pdu_session_reactivation_result(&service_accept->pdu_session_reactivation_result, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_pdu_session_reactivation_result() failed");
+               ogs_error("ogs_nas_5gs_read_pdu_session_reactivation_result() failed");
                return size;
             }
 
@@ -1702,9 +1786,10 @@ int ogs_nas_5gs_decode_service_accept(ogs_nas_5gs_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_5GS_SERVICE_ACCEPT_PDU_SESSION_REACTIVATION_RESULT_ERROR_CAUSE_TYPE:
-            size = ogs_nas_5gs_decode_pdu_session_reactivation_result_error_cause(&service_accept->pdu_session_reactivation_result_error_cause, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_pdu_session_reactivation_result_error_cause(&service_accept->pdu_session_reactivation_result_error_cause, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_pdu_session_reactivation_result_error_cause() failed");
+               ogs_error("ogs_nas_5gs_read_pdu_session_reactivation_result_error_cause() failed");
                return size;
             }
 
@@ -1712,9 +1797,10 @@ int ogs_nas_5gs_decode_service_accept(ogs_nas_5gs_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_5GS_SERVICE_ACCEPT_EAP_MESSAGE_TYPE:
-            size = ogs_nas_5gs_decode_eap_message(&service_accept->eap_message, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_eap_message(&service_accept->eap_message, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_eap_message() failed");
+               ogs_error("ogs_nas_5gs_read_eap_message() failed");
                return size;
             }
 
@@ -1722,9 +1808,10 @@ int ogs_nas_5gs_decode_service_accept(ogs_nas_5gs_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_5GS_SERVICE_ACCEPT_T3448_VALUE_TYPE:
-            size = ogs_nas_5gs_decode_gprs_timer_2(&service_accept->t3448_value, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_gprs_timer_2(&service_accept->t3448_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_gprs_timer_2() failed");
+               ogs_error("ogs_nas_5gs_read_gprs_timer_2() failed");
                return size;
             }
 
@@ -1732,9 +1819,10 @@ int ogs_nas_5gs_decode_service_accept(ogs_nas_5gs_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_5GS_SERVICE_ACCEPT_5GS_ADDITIONAL_REQUEST_RESULT_TYPE:
-            size = ogs_nas_5gs_decode_5gs_additional_request_result(&service_accept->additional_request_result, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_5gs_additional_request_result(&service_accept->additional_request_result, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_5gs_additional_request_result() failed");
+               ogs_error("ogs_nas_5gs_read_5gs_additional_request_result() failed");
                return size;
             }
 
@@ -1742,9 +1830,10 @@ int ogs_nas_5gs_decode_service_accept(ogs_nas_5gs_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_5GS_SERVICE_ACCEPT_FORBIDDEN_TAI_FOR_THE_LIST_OF_5GS_FORBIDDEN_TRACKING_AREAS_FOR_ROAMING_TYPE:
-            size = ogs_nas_5gs_decode_5gs_tracking_area_identity_list(&service_accept->forbidden_tai_for_the_list_of_forbidden_tracking_areas_for_roaming, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_5gs_tracking_area_identity_list(&service_accept->forbidden_tai_for_the_list_of_forbidden_tracking_areas_for_roaming, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_5gs_tracking_area_identity_list() failed");
+               ogs_error("ogs_nas_5gs_read_5gs_tracking_area_identity_list() failed");
                return size;
             }
 
@@ -1752,9 +1841,10 @@ int ogs_nas_5gs_decode_service_accept(ogs_nas_5gs_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_5GS_SERVICE_ACCEPT_FORBIDDEN_TAI_FOR_THE_LIST_OF_5GS_FORBIDDEN_TRACKING_AREAS_FORREGIONAL_PROVISION_OF_SERVICE_TYPE:
-            size = ogs_nas_5gs_decode_5gs_tracking_area_identity_list(&service_accept->forbidden_tai_for_the_list_of_forbidden_tracking_areas_forregional_provision_of_service, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_5gs_tracking_area_identity_list(&service_accept->forbidden_tai_for_the_list_of_forbidden_tracking_areas_forregional_provision_of_service, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_5gs_tracking_area_identity_list() failed");
+               ogs_error("ogs_nas_5gs_read_5gs_tracking_area_identity_list() failed");
                return size;
             }
 
@@ -1763,39 +1853,35 @@ int ogs_nas_5gs_decode_service_accept(ogs_nas_5gs_message_t *message, ogs_pkbuf_
             break;
         default:
             ogs_error("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_configuration_update_command(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_configuration_update_command_t *configuration_update_command = &message->gmm.configuration_update_command;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode CONFIGURATION_UPDATE_COMMAND\n");
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch(type) {
         case OGS_NAS_5GS_CONFIGURATION_UPDATE_COMMAND_CONFIGURATION_UPDATE_INDICATION_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_5gs_decode_configuration_update_indication(&configuration_update_command->configuration_update_indication, pkbuf);
+            size = ogs_nas_5gs_read_configuration_update_indication(&configuration_update_command->configuration_update_indication, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_configuration_update_indication() failed");
+               ogs_error("ogs_nas_5gs_read_configuration_update_indication() failed");
                return size;
             }
 
@@ -1803,9 +1889,10 @@ int ogs_nas_5gs_decode_configuration_update_command(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_CONFIGURATION_UPDATE_COMMAND_5G_GUTI_TYPE:
-            size = ogs_nas_5gs_decode_5gs_mobile_identity(&configuration_update_command->guti, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_5gs_mobile_identity(&configuration_update_command->guti, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_5gs_mobile_identity() failed");
+               ogs_error("ogs_nas_5gs_read_5gs_mobile_identity() failed");
                return size;
             }
 
@@ -1813,9 +1900,10 @@ int ogs_nas_5gs_decode_configuration_update_command(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_CONFIGURATION_UPDATE_COMMAND_TAI_LIST_TYPE:
-            size = ogs_nas_5gs_decode_5gs_tracking_area_identity_list(&configuration_update_command->tai_list, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_5gs_tracking_area_identity_list(&configuration_update_command->tai_list, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_5gs_tracking_area_identity_list() failed");
+               ogs_error("ogs_nas_5gs_read_5gs_tracking_area_identity_list() failed");
                return size;
             }
 
@@ -1823,9 +1911,10 @@ int ogs_nas_5gs_decode_configuration_update_command(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_CONFIGURATION_UPDATE_COMMAND_ALLOWED_NSSAI_TYPE:
-            size = ogs_nas_5gs_decode_nssai(&configuration_update_command->allowed_nssai, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_nssai(&configuration_update_command->allowed_nssai, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_nssai() failed");
+               ogs_error("ogs_nas_5gs_read_nssai() failed");
                return size;
             }
 
@@ -1833,9 +1922,10 @@ int ogs_nas_5gs_decode_configuration_update_command(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_CONFIGURATION_UPDATE_COMMAND_SERVICE_AREA_LIST_TYPE:
-            size = ogs_nas_5gs_decode_service_area_list(&configuration_update_command->service_area_list, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_service_area_list(&configuration_update_command->service_area_list, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_service_area_list() failed");
+               ogs_error("ogs_nas_5gs_read_service_area_list() failed");
                return size;
             }
 
@@ -1843,9 +1933,10 @@ int ogs_nas_5gs_decode_configuration_update_command(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_CONFIGURATION_UPDATE_COMMAND_FULL_NAME_FOR_NETWORK_TYPE:
-            size = ogs_nas_5gs_decode_network_name(&configuration_update_command->full_name_for_network, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_network_name(&configuration_update_command->full_name_for_network, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_network_name() failed");
+               ogs_error("ogs_nas_5gs_read_network_name() failed");
                return size;
             }
 
@@ -1853,9 +1944,10 @@ int ogs_nas_5gs_decode_configuration_update_command(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_CONFIGURATION_UPDATE_COMMAND_SHORT_NAME_FOR_NETWORK_TYPE:
-            size = ogs_nas_5gs_decode_network_name(&configuration_update_command->short_name_for_network, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_network_name(&configuration_update_command->short_name_for_network, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_network_name() failed");
+               ogs_error("ogs_nas_5gs_read_network_name() failed");
                return size;
             }
 
@@ -1863,9 +1955,10 @@ int ogs_nas_5gs_decode_configuration_update_command(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_CONFIGURATION_UPDATE_COMMAND_LOCAL_TIME_ZONE_TYPE:
-            size = ogs_nas_5gs_decode_time_zone(&configuration_update_command->local_time_zone, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_time_zone(&configuration_update_command->local_time_zone, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_time_zone() failed");
+               ogs_error("ogs_nas_5gs_read_time_zone() failed");
                return size;
             }
 
@@ -1873,9 +1966,10 @@ int ogs_nas_5gs_decode_configuration_update_command(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_CONFIGURATION_UPDATE_COMMAND_UNIVERSAL_TIME_AND_LOCAL_TIME_ZONE_TYPE:
-            size = ogs_nas_5gs_decode_time_zone_and_time(&configuration_update_command->universal_time_and_local_time_zone, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_time_zone_and_time(&configuration_update_command->universal_time_and_local_time_zone, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_time_zone_and_time() failed");
+               ogs_error("ogs_nas_5gs_read_time_zone_and_time() failed");
                return size;
             }
 
@@ -1883,9 +1977,10 @@ int ogs_nas_5gs_decode_configuration_update_command(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_CONFIGURATION_UPDATE_COMMAND_NETWORK_DAYLIGHT_SAVING_TIME_TYPE:
-            size = ogs_nas_5gs_decode_daylight_saving_time(&configuration_update_command->network_daylight_saving_time, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_daylight_saving_time(&configuration_update_command->network_daylight_saving_time, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_daylight_saving_time() failed");
+               ogs_error("ogs_nas_5gs_read_daylight_saving_time() failed");
                return size;
             }
 
@@ -1893,9 +1988,10 @@ int ogs_nas_5gs_decode_configuration_update_command(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_CONFIGURATION_UPDATE_COMMAND_LADN_INFORMATION_TYPE:
-            size = ogs_nas_5gs_decode_ladn_information(&configuration_update_command->ladn_information, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_ladn_information(&configuration_update_command->ladn_information, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_ladn_information() failed");
+               ogs_error("ogs_nas_5gs_read_ladn_information() failed");
                return size;
             }
 
@@ -1903,11 +1999,9 @@ int ogs_nas_5gs_decode_configuration_update_command(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_CONFIGURATION_UPDATE_COMMAND_MICO_INDICATION_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_5gs_decode_mico_indication(&configuration_update_command->mico_indication, pkbuf);
+            size = ogs_nas_5gs_read_mico_indication(&configuration_update_command->mico_indication, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_mico_indication() failed");
+               ogs_error("ogs_nas_5gs_read_mico_indication() failed");
                return size;
             }
 
@@ -1915,11 +2009,9 @@ int ogs_nas_5gs_decode_configuration_update_command(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_CONFIGURATION_UPDATE_COMMAND_NETWORK_SLICING_INDICATION_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_5gs_decode_network_slicing_indication(&configuration_update_command->network_slicing_indication, pkbuf);
+            size = ogs_nas_5gs_read_network_slicing_indication(&configuration_update_command->network_slicing_indication, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_network_slicing_indication() failed");
+               ogs_error("ogs_nas_5gs_read_network_slicing_indication() failed");
                return size;
             }
 
@@ -1927,9 +2019,10 @@ int ogs_nas_5gs_decode_configuration_update_command(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_CONFIGURATION_UPDATE_COMMAND_CONFIGURED_NSSAI_TYPE:
-            size = ogs_nas_5gs_decode_nssai(&configuration_update_command->configured_nssai, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_nssai(&configuration_update_command->configured_nssai, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_nssai() failed");
+               ogs_error("ogs_nas_5gs_read_nssai() failed");
                return size;
             }
 
@@ -1937,9 +2030,10 @@ int ogs_nas_5gs_decode_configuration_update_command(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_CONFIGURATION_UPDATE_COMMAND_REJECTED_NSSAI_TYPE:
-            size = ogs_nas_5gs_decode_rejected_nssai(&configuration_update_command->rejected_nssai, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_rejected_nssai(&configuration_update_command->rejected_nssai, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_rejected_nssai() failed");
+               ogs_error("ogs_nas_5gs_read_rejected_nssai() failed");
                return size;
             }
 
@@ -1947,9 +2041,10 @@ int ogs_nas_5gs_decode_configuration_update_command(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_CONFIGURATION_UPDATE_COMMAND_OPERATOR_DEFINED_ACCESS_CATEGORY_DEFINITIONS_TYPE:
-            size = ogs_nas_5gs_decode_operator_defined_access_category_definitions(&configuration_update_command->operator_defined_access_category_definitions, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_operator_defined_access_category_definitions(&configuration_update_command->operator_defined_access_category_definitions, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_operator_defined_access_category_definitions() failed");
+               ogs_error("ogs_nas_5gs_read_operator_defined_access_category_definitions() failed");
                return size;
             }
 
@@ -1957,11 +2052,9 @@ int ogs_nas_5gs_decode_configuration_update_command(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_CONFIGURATION_UPDATE_COMMAND_SMS_INDICATION_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_5gs_decode_sms_indication(&configuration_update_command->sms_indication, pkbuf);
+            size = ogs_nas_5gs_read_sms_indication(&configuration_update_command->sms_indication, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_sms_indication() failed");
+               ogs_error("ogs_nas_5gs_read_sms_indication() failed");
                return size;
             }
 
@@ -1969,9 +2062,10 @@ int ogs_nas_5gs_decode_configuration_update_command(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_CONFIGURATION_UPDATE_COMMAND_T3447_VALUE_TYPE:
-            size = ogs_nas_5gs_decode_gprs_timer_3(&configuration_update_command->t3447_value, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_gprs_timer_3(&configuration_update_command->t3447_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_gprs_timer_3() failed");
+               ogs_error("ogs_nas_5gs_read_gprs_timer_3() failed");
                return size;
             }
 
@@ -1979,9 +2073,10 @@ int ogs_nas_5gs_decode_configuration_update_command(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_CONFIGURATION_UPDATE_COMMAND_CAG_INFORMATION_LIST_TYPE:
-            size = ogs_nas_5gs_decode_cag_information_list(&configuration_update_command->cag_information_list, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_cag_information_list(&configuration_update_command->cag_information_list, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_cag_information_list() failed");
+               ogs_error("ogs_nas_5gs_read_cag_information_list() failed");
                return size;
             }
 
@@ -1989,9 +2084,10 @@ int ogs_nas_5gs_decode_configuration_update_command(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_CONFIGURATION_UPDATE_COMMAND_UE_RADIO_CAPABILITY_ID_TYPE:
-            size = ogs_nas_5gs_decode_ue_radio_capability_id(&configuration_update_command->ue_radio_capability_id, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_ue_radio_capability_id(&configuration_update_command->ue_radio_capability_id, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_ue_radio_capability_id() failed");
+               ogs_error("ogs_nas_5gs_read_ue_radio_capability_id() failed");
                return size;
             }
 
@@ -1999,11 +2095,9 @@ int ogs_nas_5gs_decode_configuration_update_command(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_CONFIGURATION_UPDATE_COMMAND_UE_RADIO_CAPABILITY_ID_DELETION_INDICATION_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_5gs_decode_ue_radio_capability_id_deletion_indication(&configuration_update_command->ue_radio_capability_id_deletion_indication, pkbuf);
+            size = ogs_nas_5gs_read_ue_radio_capability_id_deletion_indication(&configuration_update_command->ue_radio_capability_id_deletion_indication, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_ue_radio_capability_id_deletion_indication() failed");
+               ogs_error("ogs_nas_5gs_read_ue_radio_capability_id_deletion_indication() failed");
                return size;
             }
 
@@ -2011,9 +2105,10 @@ int ogs_nas_5gs_decode_configuration_update_command(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_CONFIGURATION_UPDATE_COMMAND_5GS_REGISTRATION_RESULT_TYPE:
-            size = ogs_nas_5gs_decode_5gs_registration_result(&configuration_update_command->registration_result, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_5gs_registration_result(&configuration_update_command->registration_result, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_5gs_registration_result() failed");
+               ogs_error("ogs_nas_5gs_read_5gs_registration_result() failed");
                return size;
             }
 
@@ -2021,9 +2116,10 @@ int ogs_nas_5gs_decode_configuration_update_command(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_CONFIGURATION_UPDATE_COMMAND_TRUNCATED_5G_S_TMSI_CONFIGURATION_TYPE:
-            size = ogs_nas_5gs_decode_truncated_5g_s_tmsi_configuration(&configuration_update_command->truncated_s_tmsi_configuration, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_truncated_5g_s_tmsi_configuration(&configuration_update_command->truncated_s_tmsi_configuration, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_truncated_5g_s_tmsi_configuration() failed");
+               ogs_error("ogs_nas_5gs_read_truncated_5g_s_tmsi_configuration() failed");
                return size;
             }
 
@@ -2031,11 +2127,9 @@ int ogs_nas_5gs_decode_configuration_update_command(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_CONFIGURATION_UPDATE_COMMAND_ADDITIONAL_CONFIGURATION_INDICATION_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_5gs_decode_additional_configuration_indication(&configuration_update_command->additional_configuration_indication, pkbuf);
+            size = ogs_nas_5gs_read_additional_configuration_indication(&configuration_update_command->additional_configuration_indication, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_additional_configuration_indication() failed");
+               ogs_error("ogs_nas_5gs_read_additional_configuration_indication() failed");
                return size;
             }
 
@@ -2043,9 +2137,10 @@ int ogs_nas_5gs_decode_configuration_update_command(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_CONFIGURATION_UPDATE_COMMAND_EXTENDED_REJECTED_NSSAI_TYPE:
-            size = ogs_nas_5gs_decode_extended_rejected_nssai(&configuration_update_command->extended_rejected_nssai, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_extended_rejected_nssai(&configuration_update_command->extended_rejected_nssai, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_extended_rejected_nssai() failed");
+               ogs_error("ogs_nas_5gs_read_extended_rejected_nssai() failed");
                return size;
             }
 
@@ -2053,9 +2148,10 @@ int ogs_nas_5gs_decode_configuration_update_command(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_CONFIGURATION_UPDATE_COMMAND_SERVICE_LEVEL_AA_CONTAINER_TYPE:
-            size = ogs_nas_5gs_decode_service_level_aa_container(&configuration_update_command->service_level_aa_container, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_service_level_aa_container(&configuration_update_command->service_level_aa_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_service_level_aa_container() failed");
+               ogs_error("ogs_nas_5gs_read_service_level_aa_container() failed");
                return size;
             }
 
@@ -2063,9 +2159,10 @@ int ogs_nas_5gs_decode_configuration_update_command(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_CONFIGURATION_UPDATE_COMMAND_NSSRG_INFORMATION_TYPE:
-            size = ogs_nas_5gs_decode_nssrg_information(&configuration_update_command->nssrg_information, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_nssrg_information(&configuration_update_command->nssrg_information, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_nssrg_information() failed");
+               ogs_error("ogs_nas_5gs_read_nssrg_information() failed");
                return size;
             }
 
@@ -2073,9 +2170,10 @@ int ogs_nas_5gs_decode_configuration_update_command(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_CONFIGURATION_UPDATE_COMMAND_DISASTER_ROAMING_WAIT_RANGE_TYPE:
-            size = ogs_nas_5gs_decode_registration_wait_range(&configuration_update_command->disaster_roaming_wait_range, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_registration_wait_range(&configuration_update_command->disaster_roaming_wait_range, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_registration_wait_range() failed");
+               ogs_error("ogs_nas_5gs_read_registration_wait_range() failed");
                return size;
             }
 
@@ -2083,9 +2181,10 @@ int ogs_nas_5gs_decode_configuration_update_command(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_CONFIGURATION_UPDATE_COMMAND_DISASTER_RETURN_WAIT_RANGE_TYPE:
-            size = ogs_nas_5gs_decode_registration_wait_range(&configuration_update_command->disaster_return_wait_range, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_registration_wait_range(&configuration_update_command->disaster_return_wait_range, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_registration_wait_range() failed");
+               ogs_error("ogs_nas_5gs_read_registration_wait_range() failed");
                return size;
             }
 
@@ -2093,9 +2192,10 @@ int ogs_nas_5gs_decode_configuration_update_command(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_CONFIGURATION_UPDATE_COMMAND_LIST_OF_PLMNS_TO_BE_USED_IN_DISASTER_CONDITION_TYPE:
-            size = ogs_nas_5gs_decode_list_of_plmns_to_be_used_in_disaster_condition(&configuration_update_command->list_of_plmns_to_be_used_in_disaster_condition, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_list_of_plmns_to_be_used_in_disaster_condition(&configuration_update_command->list_of_plmns_to_be_used_in_disaster_condition, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_list_of_plmns_to_be_used_in_disaster_condition() failed");
+               ogs_error("ogs_nas_5gs_read_list_of_plmns_to_be_used_in_disaster_condition() failed");
                return size;
             }
 
@@ -2103,9 +2203,10 @@ int ogs_nas_5gs_decode_configuration_update_command(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_CONFIGURATION_UPDATE_COMMAND_EXTENDED_CAG_INFORMATION_LIST_TYPE:
-            size = ogs_nas_5gs_decode_extended_cag_information_list(&configuration_update_command->extended_cag_information_list, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_extended_cag_information_list(&configuration_update_command->extended_cag_information_list, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_extended_cag_information_list() failed");
+               ogs_error("ogs_nas_5gs_read_extended_cag_information_list() failed");
                return size;
             }
 
@@ -2113,9 +2214,10 @@ int ogs_nas_5gs_decode_configuration_update_command(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_CONFIGURATION_UPDATE_COMMAND_UPDATED_PEIPS_ASSISTANCE_INFORMATION_TYPE:
-            size = ogs_nas_5gs_decode_peips_assistance_information(&configuration_update_command->updated_peips_assistance_information, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_peips_assistance_information(&configuration_update_command->updated_peips_assistance_information, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_peips_assistance_information() failed");
+               ogs_error("ogs_nas_5gs_read_peips_assistance_information() failed");
                return size;
             }
 
@@ -2123,9 +2225,10 @@ int ogs_nas_5gs_decode_configuration_update_command(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_CONFIGURATION_UPDATE_COMMAND_NSAG_INFORMATION_TYPE:
-            size = ogs_nas_5gs_decode_nsag_information(&configuration_update_command->nsag_information, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_nsag_information(&configuration_update_command->nsag_information, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_nsag_information() failed");
+               ogs_error("ogs_nas_5gs_read_nsag_information() failed");
                return size;
             }
 
@@ -2133,11 +2236,9 @@ int ogs_nas_5gs_decode_configuration_update_command(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_CONFIGURATION_UPDATE_COMMAND_PRIORITY_INDICATOR_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_5gs_decode_priority_indicator(&configuration_update_command->priority_indicator, pkbuf);
+            size = ogs_nas_5gs_read_priority_indicator(&configuration_update_command->priority_indicator, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_priority_indicator() failed");
+               ogs_error("ogs_nas_5gs_read_priority_indicator() failed");
                return size;
             }
 
@@ -2146,53 +2247,52 @@ int ogs_nas_5gs_decode_configuration_update_command(ogs_nas_5gs_message_t *messa
             break;
         default:
             ogs_error("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_authentication_request(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_authentication_request_t *authentication_request = &message->gmm.authentication_request;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode AUTHENTICATION_REQUEST\n");
 
-    size = ogs_nas_5gs_decode_key_set_identifier(&authentication_request->ngksi, pkbuf);
+    size = ogs_nas_5gs_read_key_set_identifier(&authentication_request->ngksi, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_5gs_decode_key_set_identifier() failed");
+        ogs_error("ogs_nas_5gs_read_key_set_identifier() failed");
         return size;
     }
 
     decoded += size;
 
-    size = ogs_nas_5gs_decode_abba(&authentication_request->abba, pkbuf);
+    size = ogs_nas_5gs_read_abba(&authentication_request->abba, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_5gs_decode_abba() failed");
+        ogs_error("ogs_nas_5gs_read_abba() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch(type) {
         case OGS_NAS_5GS_AUTHENTICATION_REQUEST_AUTHENTICATION_PARAMETER_RAND_TYPE:
-            size = ogs_nas_5gs_decode_authentication_parameter_rand(&authentication_request->authentication_parameter_rand, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_authentication_parameter_rand(&authentication_request->authentication_parameter_rand, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_authentication_parameter_rand() failed");
+               ogs_error("ogs_nas_5gs_read_authentication_parameter_rand() failed");
                return size;
             }
 
@@ -2200,9 +2300,10 @@ int ogs_nas_5gs_decode_authentication_request(ogs_nas_5gs_message_t *message, og
             decoded += size;
             break;
         case OGS_NAS_5GS_AUTHENTICATION_REQUEST_AUTHENTICATION_PARAMETER_AUTN_TYPE:
-            size = ogs_nas_5gs_decode_authentication_parameter_autn(&authentication_request->authentication_parameter_autn, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_authentication_parameter_autn(&authentication_request->authentication_parameter_autn, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_authentication_parameter_autn() failed");
+               ogs_error("ogs_nas_5gs_read_authentication_parameter_autn() failed");
                return size;
             }
 
@@ -2210,9 +2311,10 @@ int ogs_nas_5gs_decode_authentication_request(ogs_nas_5gs_message_t *message, og
             decoded += size;
             break;
         case OGS_NAS_5GS_AUTHENTICATION_REQUEST_EAP_MESSAGE_TYPE:
-            size = ogs_nas_5gs_decode_eap_message(&authentication_request->eap_message, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_eap_message(&authentication_request->eap_message, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_eap_message() failed");
+               ogs_error("ogs_nas_5gs_read_eap_message() failed");
                return size;
             }
 
@@ -2221,37 +2323,36 @@ int ogs_nas_5gs_decode_authentication_request(ogs_nas_5gs_message_t *message, og
             break;
         default:
             ogs_error("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_authentication_response(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_authentication_response_t *authentication_response = &message->gmm.authentication_response;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode AUTHENTICATION_RESPONSE\n");
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch(type) {
         case OGS_NAS_5GS_AUTHENTICATION_RESPONSE_AUTHENTICATION_RESPONSE_PARAMETER_TYPE:
-            size = ogs_nas_5gs_decode_authentication_response_parameter(&authentication_response->authentication_response_parameter, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_authentication_response_parameter(&authentication_response->authentication_response_parameter, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_authentication_response_parameter() failed");
+               ogs_error("ogs_nas_5gs_read_authentication_response_parameter() failed");
                return size;
             }
 
@@ -2259,9 +2360,10 @@ int ogs_nas_5gs_decode_authentication_response(ogs_nas_5gs_message_t *message, o
             decoded += size;
             break;
         case OGS_NAS_5GS_AUTHENTICATION_RESPONSE_EAP_MESSAGE_TYPE:
-            size = ogs_nas_5gs_decode_eap_message(&authentication_response->eap_message, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_eap_message(&authentication_response->eap_message, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_eap_message() failed");
+               ogs_error("ogs_nas_5gs_read_eap_message() failed");
                return size;
             }
 
@@ -2270,37 +2372,36 @@ int ogs_nas_5gs_decode_authentication_response(ogs_nas_5gs_message_t *message, o
             break;
         default:
             ogs_error("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_authentication_reject(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_authentication_reject_t *authentication_reject = &message->gmm.authentication_reject;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode AUTHENTICATION_REJECT\n");
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch(type) {
         case OGS_NAS_5GS_AUTHENTICATION_REJECT_EAP_MESSAGE_TYPE:
-            size = ogs_nas_5gs_decode_eap_message(&authentication_reject->eap_message, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_eap_message(&authentication_reject->eap_message, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_eap_message() failed");
+               ogs_error("ogs_nas_5gs_read_eap_message() failed");
                return size;
             }
 
@@ -2309,45 +2410,44 @@ int ogs_nas_5gs_decode_authentication_reject(ogs_nas_5gs_message_t *message, ogs
             break;
         default:
             ogs_error("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_authentication_failure(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_authentication_failure_t *authentication_failure = &message->gmm.authentication_failure;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode AUTHENTICATION_FAILURE\n");
 
-    size = ogs_nas_5gs_decode_5gmm_cause(&authentication_failure->gmm_cause, pkbuf);
+    size = ogs_nas_5gs_read_5gmm_cause(&authentication_failure->gmm_cause, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_5gs_decode_5gmm_cause() failed");
+        ogs_error("ogs_nas_5gs_read_5gmm_cause() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch(type) {
         case OGS_NAS_5GS_AUTHENTICATION_FAILURE_AUTHENTICATION_FAILURE_PARAMETER_TYPE:
-            size = ogs_nas_5gs_decode_authentication_failure_parameter(&authentication_failure->authentication_failure_parameter, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_authentication_failure_parameter(&authentication_failure->authentication_failure_parameter, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_authentication_failure_parameter() failed");
+               ogs_error("ogs_nas_5gs_read_authentication_failure_parameter() failed");
                return size;
             }
 
@@ -2356,53 +2456,52 @@ int ogs_nas_5gs_decode_authentication_failure(ogs_nas_5gs_message_t *message, og
             break;
         default:
             ogs_error("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_authentication_result(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_authentication_result_t *authentication_result = &message->gmm.authentication_result;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode AUTHENTICATION_RESULT\n");
 
-    size = ogs_nas_5gs_decode_key_set_identifier(&authentication_result->ngksi, pkbuf);
+    size = ogs_nas_5gs_read_key_set_identifier(&authentication_result->ngksi, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_5gs_decode_key_set_identifier() failed");
+        ogs_error("ogs_nas_5gs_read_key_set_identifier() failed");
         return size;
     }
 
     decoded += size;
 
-    size = ogs_nas_5gs_decode_eap_message(&authentication_result->eap_message, pkbuf);
+    size = ogs_nas_5gs_read_eap_message(&authentication_result->eap_message, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_5gs_decode_eap_message() failed");
+        ogs_error("ogs_nas_5gs_read_eap_message() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch(type) {
         case OGS_NAS_5GS_AUTHENTICATION_RESULT_ABBA_TYPE:
-            size = ogs_nas_5gs_decode_abba(&authentication_result->abba, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_abba(&authentication_result->abba, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_abba() failed");
+               ogs_error("ogs_nas_5gs_read_abba() failed");
                return size;
             }
 
@@ -2411,101 +2510,105 @@ int ogs_nas_5gs_decode_authentication_result(ogs_nas_5gs_message_t *message, ogs
             break;
         default:
             ogs_error("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_identity_request(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_identity_request_t *identity_request = &message->gmm.identity_request;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode IDENTITY_REQUEST\n");
 
-    size = ogs_nas_5gs_decode_5gs_identity_type(&identity_request->identity_type, pkbuf);
+    size = ogs_nas_5gs_read_5gs_identity_type(&identity_request->identity_type, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_5gs_decode_5gs_identity_type() failed");
+        ogs_error("ogs_nas_5gs_read_5gs_identity_type() failed");
         return size;
     }
 
     decoded += size;
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_identity_response(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_identity_response_t *identity_response = &message->gmm.identity_response;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode IDENTITY_RESPONSE\n");
 
-    size = ogs_nas_5gs_decode_5gs_mobile_identity(&identity_response->mobile_identity, pkbuf);
+    size = ogs_nas_5gs_read_5gs_mobile_identity(&identity_response->mobile_identity, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_5gs_decode_5gs_mobile_identity() failed");
+        ogs_error("ogs_nas_5gs_read_5gs_mobile_identity() failed");
         return size;
     }
 
     decoded += size;
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_security_mode_command(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_security_mode_command_t *security_mode_command = &message->gmm.security_mode_command;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode SECURITY_MODE_COMMAND\n");
 
-    size = ogs_nas_5gs_decode_security_algorithms(&security_mode_command->selected_nas_security_algorithms, pkbuf);
+    size = ogs_nas_5gs_read_security_algorithms(&security_mode_command->selected_nas_security_algorithms, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_5gs_decode_security_algorithms() failed");
+        ogs_error("ogs_nas_5gs_read_security_algorithms() failed");
         return size;
     }
 
     decoded += size;
 
-    size = ogs_nas_5gs_decode_key_set_identifier(&security_mode_command->ngksi, pkbuf);
+    size = ogs_nas_5gs_read_key_set_identifier(&security_mode_command->ngksi, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_5gs_decode_key_set_identifier() failed");
+        ogs_error("ogs_nas_5gs_read_key_set_identifier() failed");
         return size;
     }
 
     decoded += size;
 
-    size = ogs_nas_5gs_decode_ue_security_capability(&security_mode_command->replayed_ue_security_capabilities, pkbuf);
+    size = ogs_nas_5gs_read_ue_security_capability(&security_mode_command->replayed_ue_security_capabilities, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_5gs_decode_ue_security_capability() failed");
+        ogs_error("ogs_nas_5gs_read_ue_security_capability() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch(type) {
         case OGS_NAS_5GS_SECURITY_MODE_COMMAND_IMEISV_REQUEST_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_5gs_decode_imeisv_request(&security_mode_command->imeisv_request, pkbuf);
+            size = ogs_nas_5gs_read_imeisv_request(&security_mode_command->imeisv_request, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_imeisv_request() failed");
+               ogs_error("ogs_nas_5gs_read_imeisv_request() failed");
                return size;
             }
 
@@ -2513,9 +2616,10 @@ int ogs_nas_5gs_decode_security_mode_command(ogs_nas_5gs_message_t *message, ogs
             decoded += size;
             break;
         case OGS_NAS_5GS_SECURITY_MODE_COMMAND_SELECTED_EPS_NAS_SECURITY_ALGORITHMS_TYPE:
-            size = ogs_nas_5gs_decode_eps_nas_security_algorithms(&security_mode_command->selected_eps_nas_security_algorithms, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_eps_nas_security_algorithms(&security_mode_command->selected_eps_nas_security_algorithms, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_eps_nas_security_algorithms() failed");
+               ogs_error("ogs_nas_5gs_read_eps_nas_security_algorithms() failed");
                return size;
             }
 
@@ -2523,9 +2627,10 @@ int ogs_nas_5gs_decode_security_mode_command(ogs_nas_5gs_message_t *message, ogs
             decoded += size;
             break;
         case OGS_NAS_5GS_SECURITY_MODE_COMMAND_ADDITIONAL_5G_SECURITY_INFORMATION_TYPE:
-            size = ogs_nas_5gs_decode_additional_5g_security_information(&security_mode_command->additional_security_information, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_additional_5g_security_information(&security_mode_command->additional_security_information, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_additional_5g_security_information() failed");
+               ogs_error("ogs_nas_5gs_read_additional_5g_security_information() failed");
                return size;
             }
 
@@ -2533,9 +2638,10 @@ int ogs_nas_5gs_decode_security_mode_command(ogs_nas_5gs_message_t *message, ogs
             decoded += size;
             break;
         case OGS_NAS_5GS_SECURITY_MODE_COMMAND_EAP_MESSAGE_TYPE:
-            size = ogs_nas_5gs_decode_eap_message(&security_mode_command->eap_message, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_eap_message(&security_mode_command->eap_message, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_eap_message() failed");
+               ogs_error("ogs_nas_5gs_read_eap_message() failed");
                return size;
             }
 
@@ -2543,9 +2649,10 @@ int ogs_nas_5gs_decode_security_mode_command(ogs_nas_5gs_message_t *message, ogs
             decoded += size;
             break;
         case OGS_NAS_5GS_SECURITY_MODE_COMMAND_ABBA_TYPE:
-            size = ogs_nas_5gs_decode_abba(&security_mode_command->abba, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_abba(&security_mode_command->abba, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_abba() failed");
+               ogs_error("ogs_nas_5gs_read_abba() failed");
                return size;
             }
 
@@ -2553,9 +2660,10 @@ int ogs_nas_5gs_decode_security_mode_command(ogs_nas_5gs_message_t *message, ogs
             decoded += size;
             break;
         case OGS_NAS_5GS_SECURITY_MODE_COMMAND_REPLAYED_S1_UE_SECURITY_CAPABILITIES_TYPE:
-            size = ogs_nas_5gs_decode_s1_ue_security_capability(&security_mode_command->replayed_s1_ue_security_capabilities, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_s1_ue_security_capability(&security_mode_command->replayed_s1_ue_security_capabilities, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_s1_ue_security_capability() failed");
+               ogs_error("ogs_nas_5gs_read_s1_ue_security_capability() failed");
                return size;
             }
 
@@ -2564,37 +2672,36 @@ int ogs_nas_5gs_decode_security_mode_command(ogs_nas_5gs_message_t *message, ogs
             break;
         default:
             ogs_error("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_security_mode_complete(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_security_mode_complete_t *security_mode_complete = &message->gmm.security_mode_complete;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode SECURITY_MODE_COMPLETE\n");
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch(type) {
         case OGS_NAS_5GS_SECURITY_MODE_COMPLETE_IMEISV_TYPE:
-            size = ogs_nas_5gs_decode_5gs_mobile_identity(&security_mode_complete->imeisv, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_5gs_mobile_identity(&security_mode_complete->imeisv, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_5gs_mobile_identity() failed");
+               ogs_error("ogs_nas_5gs_read_5gs_mobile_identity() failed");
                return size;
             }
 
@@ -2602,9 +2709,10 @@ int ogs_nas_5gs_decode_security_mode_complete(ogs_nas_5gs_message_t *message, og
             decoded += size;
             break;
         case OGS_NAS_5GS_SECURITY_MODE_COMPLETE_NAS_MESSAGE_CONTAINER_TYPE:
-            size = ogs_nas_5gs_decode_message_container(&security_mode_complete->nas_message_container, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_message_container(&security_mode_complete->nas_message_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_message_container() failed");
+               ogs_error("ogs_nas_5gs_read_message_container() failed");
                return size;
             }
 
@@ -2612,9 +2720,10 @@ int ogs_nas_5gs_decode_security_mode_complete(ogs_nas_5gs_message_t *message, og
             decoded += size;
             break;
         case OGS_NAS_5GS_SECURITY_MODE_COMPLETE_NON_IMEISV_PEI_TYPE:
-            size = ogs_nas_5gs_decode_5gs_mobile_identity(&security_mode_complete->non_imeisv_pei, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_5gs_mobile_identity(&security_mode_complete->non_imeisv_pei, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_5gs_mobile_identity() failed");
+               ogs_error("ogs_nas_5gs_read_5gs_mobile_identity() failed");
                return size;
             }
 
@@ -2623,94 +2732,105 @@ int ogs_nas_5gs_decode_security_mode_complete(ogs_nas_5gs_message_t *message, og
             break;
         default:
             ogs_error("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_security_mode_reject(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_security_mode_reject_t *security_mode_reject = &message->gmm.security_mode_reject;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode SECURITY_MODE_REJECT\n");
 
-    size = ogs_nas_5gs_decode_5gmm_cause(&security_mode_reject->gmm_cause, pkbuf);
+    size = ogs_nas_5gs_read_5gmm_cause(&security_mode_reject->gmm_cause, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_5gs_decode_5gmm_cause() failed");
+        ogs_error("ogs_nas_5gs_read_5gmm_cause() failed");
         return size;
     }
 
     decoded += size;
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_5gmm_status(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_5gmm_status_t *gmm_status = &message->gmm.gmm_status;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode 5GMM_STATUS\n");
 
-    size = ogs_nas_5gs_decode_5gmm_cause(&gmm_status->gmm_cause, pkbuf);
+    size = ogs_nas_5gs_read_5gmm_cause(&gmm_status->gmm_cause, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_5gs_decode_5gmm_cause() failed");
+        ogs_error("ogs_nas_5gs_read_5gmm_cause() failed");
         return size;
     }
 
     decoded += size;
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_notification(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_notification_t *notification = &message->gmm.notification;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode NOTIFICATION\n");
 
-    size = ogs_nas_5gs_decode_access_type(&notification->access_type, pkbuf);
+    size = ogs_nas_5gs_read_access_type(&notification->access_type, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_5gs_decode_access_type() failed");
+        ogs_error("ogs_nas_5gs_read_access_type() failed");
         return size;
     }
 
     decoded += size;
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_notification_response(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_notification_response_t *notification_response = &message->gmm.notification_response;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode NOTIFICATION_RESPONSE\n");
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch(type) {
         case OGS_NAS_5GS_NOTIFICATION_RESPONSE_PDU_SESSION_STATUS_TYPE:
-            size = ogs_nas_5gs_decode_pdu_session_status(&notification_response->pdu_session_status, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_pdu_session_status(&notification_response->pdu_session_status, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_pdu_session_status() failed");
+               ogs_error("ogs_nas_5gs_read_pdu_session_status() failed");
                return size;
             }
 
@@ -2719,53 +2839,52 @@ int ogs_nas_5gs_decode_notification_response(ogs_nas_5gs_message_t *message, ogs
             break;
         default:
             ogs_error("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_ul_nas_transport(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_ul_nas_transport_t *ul_nas_transport = &message->gmm.ul_nas_transport;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode UL_NAS_TRANSPORT\n");
 
-    size = ogs_nas_5gs_decode_payload_container_type(&ul_nas_transport->payload_container_type, pkbuf);
+    size = ogs_nas_5gs_read_payload_container_type(&ul_nas_transport->payload_container_type, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_5gs_decode_payload_container_type() failed");
+        ogs_error("ogs_nas_5gs_read_payload_container_type() failed");
         return size;
     }
 
     decoded += size;
 
-    size = ogs_nas_5gs_decode_payload_container(&ul_nas_transport->payload_container, pkbuf);
+    size = ogs_nas_5gs_read_payload_container(&ul_nas_transport->payload_container, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_5gs_decode_payload_container() failed");
+        ogs_error("ogs_nas_5gs_read_payload_container() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch(type) {
         case OGS_NAS_5GS_UL_NAS_TRANSPORT_PDU_SESSION_ID_TYPE:
-            size = ogs_nas_5gs_decode_pdu_session_identity_2(&ul_nas_transport->pdu_session_id, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_pdu_session_identity_2(&ul_nas_transport->pdu_session_id, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_pdu_session_identity_2() failed");
+               ogs_error("ogs_nas_5gs_read_pdu_session_identity_2() failed");
                return size;
             }
 
@@ -2773,9 +2892,10 @@ int ogs_nas_5gs_decode_ul_nas_transport(ogs_nas_5gs_message_t *message, ogs_pkbu
             decoded += size;
             break;
         case OGS_NAS_5GS_UL_NAS_TRANSPORT_OLD_PDU_SESSION_ID_TYPE:
-            size = ogs_nas_5gs_decode_pdu_session_identity_2(&ul_nas_transport->old_pdu_session_id, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_pdu_session_identity_2(&ul_nas_transport->old_pdu_session_id, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_pdu_session_identity_2() failed");
+               ogs_error("ogs_nas_5gs_read_pdu_session_identity_2() failed");
                return size;
             }
 
@@ -2783,11 +2903,9 @@ int ogs_nas_5gs_decode_ul_nas_transport(ogs_nas_5gs_message_t *message, ogs_pkbu
             decoded += size;
             break;
         case OGS_NAS_5GS_UL_NAS_TRANSPORT_REQUEST_TYPE_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_5gs_decode_request_type(&ul_nas_transport->request_type, pkbuf);
+            size = ogs_nas_5gs_read_request_type(&ul_nas_transport->request_type, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_request_type() failed");
+               ogs_error("ogs_nas_5gs_read_request_type() failed");
                return size;
             }
 
@@ -2795,9 +2913,10 @@ int ogs_nas_5gs_decode_ul_nas_transport(ogs_nas_5gs_message_t *message, ogs_pkbu
             decoded += size;
             break;
         case OGS_NAS_5GS_UL_NAS_TRANSPORT_S_NSSAI_TYPE:
-            size = ogs_nas_5gs_decode_s_nssai(&ul_nas_transport->s_nssai, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_s_nssai(&ul_nas_transport->s_nssai, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_s_nssai() failed");
+               ogs_error("ogs_nas_5gs_read_s_nssai() failed");
                return size;
             }
 
@@ -2805,9 +2924,10 @@ int ogs_nas_5gs_decode_ul_nas_transport(ogs_nas_5gs_message_t *message, ogs_pkbu
             decoded += size;
             break;
         case OGS_NAS_5GS_UL_NAS_TRANSPORT_DNN_TYPE:
-            size = ogs_nas_5gs_decode_dnn(&ul_nas_transport->dnn, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_dnn(&ul_nas_transport->dnn, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_dnn() failed");
+               ogs_error("ogs_nas_5gs_read_dnn() failed");
                return size;
             }
 
@@ -2815,9 +2935,10 @@ int ogs_nas_5gs_decode_ul_nas_transport(ogs_nas_5gs_message_t *message, ogs_pkbu
             decoded += size;
             break;
         case OGS_NAS_5GS_UL_NAS_TRANSPORT_ADDITIONAL_INFORMATION_TYPE:
-            size = ogs_nas_5gs_decode_additional_information(&ul_nas_transport->additional_information, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_additional_information(&ul_nas_transport->additional_information, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_additional_information() failed");
+               ogs_error("ogs_nas_5gs_read_additional_information() failed");
                return size;
             }
 
@@ -2825,11 +2946,9 @@ int ogs_nas_5gs_decode_ul_nas_transport(ogs_nas_5gs_message_t *message, ogs_pkbu
             decoded += size;
             break;
         case OGS_NAS_5GS_UL_NAS_TRANSPORT_MA_PDU_SESSION_INFORMATION_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_5gs_decode_ma_pdu_session_information(&ul_nas_transport->ma_pdu_session_information, pkbuf);
+            size = ogs_nas_5gs_read_ma_pdu_session_information(&ul_nas_transport->ma_pdu_session_information, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_ma_pdu_session_information() failed");
+               ogs_error("ogs_nas_5gs_read_ma_pdu_session_information() failed");
                return size;
             }
 
@@ -2837,11 +2956,9 @@ int ogs_nas_5gs_decode_ul_nas_transport(ogs_nas_5gs_message_t *message, ogs_pkbu
             decoded += size;
             break;
         case OGS_NAS_5GS_UL_NAS_TRANSPORT_RELEASE_ASSISTANCE_INDICATION_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_5gs_decode_release_assistance_indication(&ul_nas_transport->release_assistance_indication, pkbuf);
+            size = ogs_nas_5gs_read_release_assistance_indication(&ul_nas_transport->release_assistance_indication, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_release_assistance_indication() failed");
+               ogs_error("ogs_nas_5gs_read_release_assistance_indication() failed");
                return size;
             }
 
@@ -2850,53 +2967,52 @@ int ogs_nas_5gs_decode_ul_nas_transport(ogs_nas_5gs_message_t *message, ogs_pkbu
             break;
         default:
             ogs_error("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_dl_nas_transport(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_dl_nas_transport_t *dl_nas_transport = &message->gmm.dl_nas_transport;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode DL_NAS_TRANSPORT\n");
 
-    size = ogs_nas_5gs_decode_payload_container_type(&dl_nas_transport->payload_container_type, pkbuf);
+    size = ogs_nas_5gs_read_payload_container_type(&dl_nas_transport->payload_container_type, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_5gs_decode_payload_container_type() failed");
+        ogs_error("ogs_nas_5gs_read_payload_container_type() failed");
         return size;
     }
 
     decoded += size;
 
-    size = ogs_nas_5gs_decode_payload_container(&dl_nas_transport->payload_container, pkbuf);
+    size = ogs_nas_5gs_read_payload_container(&dl_nas_transport->payload_container, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_5gs_decode_payload_container() failed");
+        ogs_error("ogs_nas_5gs_read_payload_container() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch(type) {
         case OGS_NAS_5GS_DL_NAS_TRANSPORT_PDU_SESSION_ID_TYPE:
-            size = ogs_nas_5gs_decode_pdu_session_identity_2(&dl_nas_transport->pdu_session_id, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_pdu_session_identity_2(&dl_nas_transport->pdu_session_id, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_pdu_session_identity_2() failed");
+               ogs_error("ogs_nas_5gs_read_pdu_session_identity_2() failed");
                return size;
             }
 
@@ -2904,9 +3020,10 @@ int ogs_nas_5gs_decode_dl_nas_transport(ogs_nas_5gs_message_t *message, ogs_pkbu
             decoded += size;
             break;
         case OGS_NAS_5GS_DL_NAS_TRANSPORT_ADDITIONAL_INFORMATION_TYPE:
-            size = ogs_nas_5gs_decode_additional_information(&dl_nas_transport->additional_information, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_additional_information(&dl_nas_transport->additional_information, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_additional_information() failed");
+               ogs_error("ogs_nas_5gs_read_additional_information() failed");
                return size;
             }
 
@@ -2914,9 +3031,10 @@ int ogs_nas_5gs_decode_dl_nas_transport(ogs_nas_5gs_message_t *message, ogs_pkbu
             decoded += size;
             break;
         case OGS_NAS_5GS_DL_NAS_TRANSPORT_5GMM_CAUSE_TYPE:
-            size = ogs_nas_5gs_decode_5gmm_cause(&dl_nas_transport->gmm_cause, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_5gmm_cause(&dl_nas_transport->gmm_cause, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_5gmm_cause() failed");
+               ogs_error("ogs_nas_5gs_read_5gmm_cause() failed");
                return size;
             }
 
@@ -2924,9 +3042,10 @@ int ogs_nas_5gs_decode_dl_nas_transport(ogs_nas_5gs_message_t *message, ogs_pkbu
             decoded += size;
             break;
         case OGS_NAS_5GS_DL_NAS_TRANSPORT_BACK_OFF_TIMER_VALUE_TYPE:
-            size = ogs_nas_5gs_decode_gprs_timer_3(&dl_nas_transport->back_off_timer_value, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_gprs_timer_3(&dl_nas_transport->back_off_timer_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_gprs_timer_3() failed");
+               ogs_error("ogs_nas_5gs_read_gprs_timer_3() failed");
                return size;
             }
 
@@ -2934,9 +3053,10 @@ int ogs_nas_5gs_decode_dl_nas_transport(ogs_nas_5gs_message_t *message, ogs_pkbu
             decoded += size;
             break;
         case OGS_NAS_5GS_DL_NAS_TRANSPORT_LOWER_BOUND_TIMER_VALUE_TYPE:
-            size = ogs_nas_5gs_decode_gprs_timer_3(&dl_nas_transport->lower_bound_timer_value, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_gprs_timer_3(&dl_nas_transport->lower_bound_timer_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_gprs_timer_3() failed");
+               ogs_error("ogs_nas_5gs_read_gprs_timer_3() failed");
                return size;
             }
 
@@ -2945,47 +3065,43 @@ int ogs_nas_5gs_decode_dl_nas_transport(ogs_nas_5gs_message_t *message, ogs_pkbu
             break;
         default:
             ogs_error("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_pdu_session_establishment_request(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_pdu_session_establishment_request_t *pdu_session_establishment_request = &message->gsm.pdu_session_establishment_request;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode PDU_SESSION_ESTABLISHMENT_REQUEST\n");
 
-    size = ogs_nas_5gs_decode_integrity_protection_maximum_data_rate(&pdu_session_establishment_request->integrity_protection_maximum_data_rate, pkbuf);
+    size = ogs_nas_5gs_read_integrity_protection_maximum_data_rate(&pdu_session_establishment_request->integrity_protection_maximum_data_rate, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_5gs_decode_integrity_protection_maximum_data_rate() failed");
+        ogs_error("ogs_nas_5gs_read_integrity_protection_maximum_data_rate() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch(type) {
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_REQUEST_PDU_SESSION_TYPE_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_5gs_decode_pdu_session_type(&pdu_session_establishment_request->pdu_session_type, pkbuf);
+            size = ogs_nas_5gs_read_pdu_session_type(&pdu_session_establishment_request->pdu_session_type, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_pdu_session_type() failed");
+               ogs_error("ogs_nas_5gs_read_pdu_session_type() failed");
                return size;
             }
 
@@ -2993,11 +3109,9 @@ int ogs_nas_5gs_decode_pdu_session_establishment_request(ogs_nas_5gs_message_t *
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_REQUEST_SSC_MODE_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_5gs_decode_ssc_mode(&pdu_session_establishment_request->ssc_mode, pkbuf);
+            size = ogs_nas_5gs_read_ssc_mode(&pdu_session_establishment_request->ssc_mode, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_ssc_mode() failed");
+               ogs_error("ogs_nas_5gs_read_ssc_mode() failed");
                return size;
             }
 
@@ -3005,9 +3119,10 @@ int ogs_nas_5gs_decode_pdu_session_establishment_request(ogs_nas_5gs_message_t *
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_REQUEST_5GSM_CAPABILITY_TYPE:
-            size = ogs_nas_5gs_decode_5gsm_capability(&pdu_session_establishment_request->gsm_capability, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_5gsm_capability(&pdu_session_establishment_request->gsm_capability, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_5gsm_capability() failed");
+               ogs_error("ogs_nas_5gs_read_5gsm_capability() failed");
                return size;
             }
 
@@ -3015,9 +3130,10 @@ int ogs_nas_5gs_decode_pdu_session_establishment_request(ogs_nas_5gs_message_t *
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_REQUEST_MAXIMUM_NUMBER_OF_SUPPORTED_PACKET_FILTERS_TYPE:
-            size = ogs_nas_5gs_decode_maximum_number_of_supported_packet_filters(&pdu_session_establishment_request->maximum_number_of_supported_packet_filters, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_maximum_number_of_supported_packet_filters(&pdu_session_establishment_request->maximum_number_of_supported_packet_filters, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_maximum_number_of_supported_packet_filters() failed");
+               ogs_error("ogs_nas_5gs_read_maximum_number_of_supported_packet_filters() failed");
                return size;
             }
 
@@ -3025,11 +3141,9 @@ int ogs_nas_5gs_decode_pdu_session_establishment_request(ogs_nas_5gs_message_t *
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_REQUEST_ALWAYS_ON_PDU_SESSION_REQUESTED_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_5gs_decode_always_on_pdu_session_requested(&pdu_session_establishment_request->always_on_pdu_session_requested, pkbuf);
+            size = ogs_nas_5gs_read_always_on_pdu_session_requested(&pdu_session_establishment_request->always_on_pdu_session_requested, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_always_on_pdu_session_requested() failed");
+               ogs_error("ogs_nas_5gs_read_always_on_pdu_session_requested() failed");
                return size;
             }
 
@@ -3037,9 +3151,10 @@ int ogs_nas_5gs_decode_pdu_session_establishment_request(ogs_nas_5gs_message_t *
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_REQUEST_SM_PDU_DN_REQUEST_CONTAINER_TYPE:
-            size = ogs_nas_5gs_decode_sm_pdu_dn_request_container(&pdu_session_establishment_request->sm_pdu_dn_request_container, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_sm_pdu_dn_request_container(&pdu_session_establishment_request->sm_pdu_dn_request_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_sm_pdu_dn_request_container() failed");
+               ogs_error("ogs_nas_5gs_read_sm_pdu_dn_request_container() failed");
                return size;
             }
 
@@ -3047,9 +3162,10 @@ int ogs_nas_5gs_decode_pdu_session_establishment_request(ogs_nas_5gs_message_t *
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_REQUEST_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_5gs_decode_extended_protocol_configuration_options(&pdu_session_establishment_request->extended_protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_extended_protocol_configuration_options(&pdu_session_establishment_request->extended_protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_extended_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_5gs_read_extended_protocol_configuration_options() failed");
                return size;
             }
 
@@ -3057,9 +3173,10 @@ int ogs_nas_5gs_decode_pdu_session_establishment_request(ogs_nas_5gs_message_t *
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_REQUEST_IP_HEADER_COMPRESSION_CONFIGURATION_TYPE:
-            size = ogs_nas_5gs_decode_ip_header_compression_configuration(&pdu_session_establishment_request->ip_header_compression_configuration, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_ip_header_compression_configuration(&pdu_session_establishment_request->ip_header_compression_configuration, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_ip_header_compression_configuration() failed");
+               ogs_error("ogs_nas_5gs_read_ip_header_compression_configuration() failed");
                return size;
             }
 
@@ -3067,9 +3184,10 @@ int ogs_nas_5gs_decode_pdu_session_establishment_request(ogs_nas_5gs_message_t *
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_REQUEST_DS_TT_ETHERNET_PORT_MAC_ADDRESS_TYPE:
-            size = ogs_nas_5gs_decode_ds_tt_ethernet_port_mac_address(&pdu_session_establishment_request->ds_tt_ethernet_port_mac_address, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_ds_tt_ethernet_port_mac_address(&pdu_session_establishment_request->ds_tt_ethernet_port_mac_address, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_ds_tt_ethernet_port_mac_address() failed");
+               ogs_error("ogs_nas_5gs_read_ds_tt_ethernet_port_mac_address() failed");
                return size;
             }
 
@@ -3077,9 +3195,10 @@ int ogs_nas_5gs_decode_pdu_session_establishment_request(ogs_nas_5gs_message_t *
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_REQUEST_UE_DS_TT_RESIDENCE_TIME_TYPE:
-            size = ogs_nas_5gs_decode_ue_ds_tt_residence_time(&pdu_session_establishment_request->ue_ds_tt_residence_time, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_ue_ds_tt_residence_time(&pdu_session_establishment_request->ue_ds_tt_residence_time, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_ue_ds_tt_residence_time() failed");
+               ogs_error("ogs_nas_5gs_read_ue_ds_tt_residence_time() failed");
                return size;
             }
 
@@ -3087,9 +3206,10 @@ int ogs_nas_5gs_decode_pdu_session_establishment_request(ogs_nas_5gs_message_t *
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_REQUEST_PORT_MANAGEMENT_INFORMATION_CONTAINER_TYPE:
-            size = ogs_nas_5gs_decode_port_management_information_container(&pdu_session_establishment_request->port_management_information_container, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_port_management_information_container(&pdu_session_establishment_request->port_management_information_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_port_management_information_container() failed");
+               ogs_error("ogs_nas_5gs_read_port_management_information_container() failed");
                return size;
             }
 
@@ -3097,9 +3217,10 @@ int ogs_nas_5gs_decode_pdu_session_establishment_request(ogs_nas_5gs_message_t *
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_REQUEST_ETHERNET_HEADER_COMPRESSION_CONFIGURATION_TYPE:
-            size = ogs_nas_5gs_decode_ethernet_header_compression_configuration(&pdu_session_establishment_request->ethernet_header_compression_configuration, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_ethernet_header_compression_configuration(&pdu_session_establishment_request->ethernet_header_compression_configuration, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_ethernet_header_compression_configuration() failed");
+               ogs_error("ogs_nas_5gs_read_ethernet_header_compression_configuration() failed");
                return size;
             }
 
@@ -3107,9 +3228,10 @@ int ogs_nas_5gs_decode_pdu_session_establishment_request(ogs_nas_5gs_message_t *
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_REQUEST_SUGGESTED_INTERFACE_IDENTIFIER_TYPE:
-            size = ogs_nas_5gs_decode_pdu_address(&pdu_session_establishment_request->suggested_interface_identifier, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_pdu_address(&pdu_session_establishment_request->suggested_interface_identifier, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_pdu_address() failed");
+               ogs_error("ogs_nas_5gs_read_pdu_address() failed");
                return size;
             }
 
@@ -3117,9 +3239,10 @@ int ogs_nas_5gs_decode_pdu_session_establishment_request(ogs_nas_5gs_message_t *
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_REQUEST_SERVICE_LEVEL_AA_CONTAINER_TYPE:
-            size = ogs_nas_5gs_decode_service_level_aa_container(&pdu_session_establishment_request->service_level_aa_container, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_service_level_aa_container(&pdu_session_establishment_request->service_level_aa_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_service_level_aa_container() failed");
+               ogs_error("ogs_nas_5gs_read_service_level_aa_container() failed");
                return size;
             }
 
@@ -3127,9 +3250,10 @@ int ogs_nas_5gs_decode_pdu_session_establishment_request(ogs_nas_5gs_message_t *
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_REQUEST_REQUESTED_MBS_CONTAINER_TYPE:
-            size = ogs_nas_5gs_decode_requested_mbs_container(&pdu_session_establishment_request->requested_mbs_container, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_requested_mbs_container(&pdu_session_establishment_request->requested_mbs_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_requested_mbs_container() failed");
+               ogs_error("ogs_nas_5gs_read_requested_mbs_container() failed");
                return size;
             }
 
@@ -3137,9 +3261,10 @@ int ogs_nas_5gs_decode_pdu_session_establishment_request(ogs_nas_5gs_message_t *
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_REQUEST_PDU_SESSION_PAIR_ID_TYPE:
-            size = ogs_nas_5gs_decode_pdu_session_pair_id(&pdu_session_establishment_request->pdu_session_pair_id, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_pdu_session_pair_id(&pdu_session_establishment_request->pdu_session_pair_id, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_pdu_session_pair_id() failed");
+               ogs_error("ogs_nas_5gs_read_pdu_session_pair_id() failed");
                return size;
             }
 
@@ -3147,9 +3272,10 @@ int ogs_nas_5gs_decode_pdu_session_establishment_request(ogs_nas_5gs_message_t *
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_REQUEST_RSN_TYPE:
-            size = ogs_nas_5gs_decode_rsn(&pdu_session_establishment_request->rsn, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_rsn(&pdu_session_establishment_request->rsn, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_rsn() failed");
+               ogs_error("ogs_nas_5gs_read_rsn() failed");
                return size;
             }
 
@@ -3158,61 +3284,60 @@ int ogs_nas_5gs_decode_pdu_session_establishment_request(ogs_nas_5gs_message_t *
             break;
         default:
             ogs_error("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_pdu_session_establishment_accept(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_pdu_session_establishment_accept_t *pdu_session_establishment_accept = &message->gsm.pdu_session_establishment_accept;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode PDU_SESSION_ESTABLISHMENT_ACCEPT\n");
 
-    size = ogs_nas_5gs_decode_pdu_session_type(&pdu_session_establishment_accept->selected_pdu_session_type, pkbuf);
+    size = ogs_nas_5gs_read_pdu_session_type(&pdu_session_establishment_accept->selected_pdu_session_type, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_5gs_decode_pdu_session_type() failed");
+        ogs_error("ogs_nas_5gs_read_pdu_session_type() failed");
         return size;
     }
 
     decoded += size;
 
-    size = ogs_nas_5gs_decode_qos_rules(&pdu_session_establishment_accept->authorized_qos_rules, pkbuf);
+    size = ogs_nas_5gs_read_qos_rules(&pdu_session_establishment_accept->authorized_qos_rules, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_5gs_decode_qos_rules() failed");
+        ogs_error("ogs_nas_5gs_read_qos_rules() failed");
         return size;
     }
 
     decoded += size;
 
-    size = ogs_nas_5gs_decode_session_ambr(&pdu_session_establishment_accept->session_ambr, pkbuf);
+    size = ogs_nas_5gs_read_session_ambr(&pdu_session_establishment_accept->session_ambr, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_5gs_decode_session_ambr() failed");
+        ogs_error("ogs_nas_5gs_read_session_ambr() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch(type) {
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_ACCEPT_5GSM_CAUSE_TYPE:
-            size = ogs_nas_5gs_decode_5gsm_cause(&pdu_session_establishment_accept->gsm_cause, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_5gsm_cause(&pdu_session_establishment_accept->gsm_cause, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_5gsm_cause() failed");
+               ogs_error("ogs_nas_5gs_read_5gsm_cause() failed");
                return size;
             }
 
@@ -3220,9 +3345,10 @@ int ogs_nas_5gs_decode_pdu_session_establishment_accept(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_ACCEPT_PDU_ADDRESS_TYPE:
-            size = ogs_nas_5gs_decode_pdu_address(&pdu_session_establishment_accept->pdu_address, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_pdu_address(&pdu_session_establishment_accept->pdu_address, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_pdu_address() failed");
+               ogs_error("ogs_nas_5gs_read_pdu_address() failed");
                return size;
             }
 
@@ -3230,9 +3356,10 @@ int ogs_nas_5gs_decode_pdu_session_establishment_accept(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_ACCEPT_RQ_TIMER_VALUE_TYPE:
-            size = ogs_nas_5gs_decode_gprs_timer(&pdu_session_establishment_accept->rq_timer_value, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_gprs_timer(&pdu_session_establishment_accept->rq_timer_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_gprs_timer() failed");
+               ogs_error("ogs_nas_5gs_read_gprs_timer() failed");
                return size;
             }
 
@@ -3240,9 +3367,10 @@ int ogs_nas_5gs_decode_pdu_session_establishment_accept(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_ACCEPT_S_NSSAI_TYPE:
-            size = ogs_nas_5gs_decode_s_nssai(&pdu_session_establishment_accept->s_nssai, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_s_nssai(&pdu_session_establishment_accept->s_nssai, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_s_nssai() failed");
+               ogs_error("ogs_nas_5gs_read_s_nssai() failed");
                return size;
             }
 
@@ -3250,11 +3378,9 @@ int ogs_nas_5gs_decode_pdu_session_establishment_accept(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_ACCEPT_ALWAYS_ON_PDU_SESSION_INDICATION_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_5gs_decode_always_on_pdu_session_indication(&pdu_session_establishment_accept->always_on_pdu_session_indication, pkbuf);
+            size = ogs_nas_5gs_read_always_on_pdu_session_indication(&pdu_session_establishment_accept->always_on_pdu_session_indication, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_always_on_pdu_session_indication() failed");
+               ogs_error("ogs_nas_5gs_read_always_on_pdu_session_indication() failed");
                return size;
             }
 
@@ -3262,9 +3388,10 @@ int ogs_nas_5gs_decode_pdu_session_establishment_accept(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_ACCEPT_MAPPED_EPS_BEARER_CONTEXTS_TYPE:
-            size = ogs_nas_5gs_decode_mapped_eps_bearer_contexts(&pdu_session_establishment_accept->mapped_eps_bearer_contexts, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_mapped_eps_bearer_contexts(&pdu_session_establishment_accept->mapped_eps_bearer_contexts, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_mapped_eps_bearer_contexts() failed");
+               ogs_error("ogs_nas_5gs_read_mapped_eps_bearer_contexts() failed");
                return size;
             }
 
@@ -3272,9 +3399,10 @@ int ogs_nas_5gs_decode_pdu_session_establishment_accept(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_ACCEPT_EAP_MESSAGE_TYPE:
-            size = ogs_nas_5gs_decode_eap_message(&pdu_session_establishment_accept->eap_message, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_eap_message(&pdu_session_establishment_accept->eap_message, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_eap_message() failed");
+               ogs_error("ogs_nas_5gs_read_eap_message() failed");
                return size;
             }
 
@@ -3282,9 +3410,10 @@ int ogs_nas_5gs_decode_pdu_session_establishment_accept(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_ACCEPT_AUTHORIZED_QOS_FLOW_DESCRIPTIONS_TYPE:
-            size = ogs_nas_5gs_decode_qos_flow_descriptions(&pdu_session_establishment_accept->authorized_qos_flow_descriptions, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_qos_flow_descriptions(&pdu_session_establishment_accept->authorized_qos_flow_descriptions, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_qos_flow_descriptions() failed");
+               ogs_error("ogs_nas_5gs_read_qos_flow_descriptions() failed");
                return size;
             }
 
@@ -3292,9 +3421,10 @@ int ogs_nas_5gs_decode_pdu_session_establishment_accept(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_ACCEPT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_5gs_decode_extended_protocol_configuration_options(&pdu_session_establishment_accept->extended_protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_extended_protocol_configuration_options(&pdu_session_establishment_accept->extended_protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_extended_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_5gs_read_extended_protocol_configuration_options() failed");
                return size;
             }
 
@@ -3302,9 +3432,10 @@ int ogs_nas_5gs_decode_pdu_session_establishment_accept(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_ACCEPT_DNN_TYPE:
-            size = ogs_nas_5gs_decode_dnn(&pdu_session_establishment_accept->dnn, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_dnn(&pdu_session_establishment_accept->dnn, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_dnn() failed");
+               ogs_error("ogs_nas_5gs_read_dnn() failed");
                return size;
             }
 
@@ -3312,9 +3443,10 @@ int ogs_nas_5gs_decode_pdu_session_establishment_accept(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_ACCEPT_5GSM_NETWORK_FEATURE_SUPPORT_TYPE:
-            size = ogs_nas_5gs_decode_5gsm_network_feature_support(&pdu_session_establishment_accept->gsm_network_feature_support, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_5gsm_network_feature_support(&pdu_session_establishment_accept->gsm_network_feature_support, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_5gsm_network_feature_support() failed");
+               ogs_error("ogs_nas_5gs_read_5gsm_network_feature_support() failed");
                return size;
             }
 
@@ -3322,9 +3454,10 @@ int ogs_nas_5gs_decode_pdu_session_establishment_accept(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_ACCEPT_SERVING_PLMN_RATE_CONTROL_TYPE:
-            size = ogs_nas_5gs_decode_serving_plmn_rate_control(&pdu_session_establishment_accept->serving_plmn_rate_control, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_serving_plmn_rate_control(&pdu_session_establishment_accept->serving_plmn_rate_control, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_serving_plmn_rate_control() failed");
+               ogs_error("ogs_nas_5gs_read_serving_plmn_rate_control() failed");
                return size;
             }
 
@@ -3332,9 +3465,10 @@ int ogs_nas_5gs_decode_pdu_session_establishment_accept(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_ACCEPT_ATSSS_CONTAINER_TYPE:
-            size = ogs_nas_5gs_decode_atsss_container(&pdu_session_establishment_accept->atsss_container, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_atsss_container(&pdu_session_establishment_accept->atsss_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_atsss_container() failed");
+               ogs_error("ogs_nas_5gs_read_atsss_container() failed");
                return size;
             }
 
@@ -3342,11 +3476,9 @@ int ogs_nas_5gs_decode_pdu_session_establishment_accept(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_ACCEPT_CONTROL_PLANE_ONLY_INDICATION_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_5gs_decode_control_plane_only_indication(&pdu_session_establishment_accept->control_plane_only_indication, pkbuf);
+            size = ogs_nas_5gs_read_control_plane_only_indication(&pdu_session_establishment_accept->control_plane_only_indication, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_control_plane_only_indication() failed");
+               ogs_error("ogs_nas_5gs_read_control_plane_only_indication() failed");
                return size;
             }
 
@@ -3354,9 +3486,10 @@ int ogs_nas_5gs_decode_pdu_session_establishment_accept(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_ACCEPT_IP_HEADER_COMPRESSION_CONFIGURATION_TYPE:
-            size = ogs_nas_5gs_decode_ip_header_compression_configuration(&pdu_session_establishment_accept->ip_header_compression_configuration, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_ip_header_compression_configuration(&pdu_session_establishment_accept->ip_header_compression_configuration, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_ip_header_compression_configuration() failed");
+               ogs_error("ogs_nas_5gs_read_ip_header_compression_configuration() failed");
                return size;
             }
 
@@ -3364,9 +3497,10 @@ int ogs_nas_5gs_decode_pdu_session_establishment_accept(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_ACCEPT_ETHERNET_HEADER_COMPRESSION_CONFIGURATION_TYPE:
-            size = ogs_nas_5gs_decode_ethernet_header_compression_configuration(&pdu_session_establishment_accept->ethernet_header_compression_configuration, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_ethernet_header_compression_configuration(&pdu_session_establishment_accept->ethernet_header_compression_configuration, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_ethernet_header_compression_configuration() failed");
+               ogs_error("ogs_nas_5gs_read_ethernet_header_compression_configuration() failed");
                return size;
             }
 
@@ -3374,9 +3508,10 @@ int ogs_nas_5gs_decode_pdu_session_establishment_accept(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_ACCEPT_SERVICE_LEVEL_AA_CONTAINER_TYPE:
-            size = ogs_nas_5gs_decode_service_level_aa_container(&pdu_session_establishment_accept->service_level_aa_container, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_service_level_aa_container(&pdu_session_establishment_accept->service_level_aa_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_service_level_aa_container() failed");
+               ogs_error("ogs_nas_5gs_read_service_level_aa_container() failed");
                return size;
             }
 
@@ -3384,9 +3519,10 @@ int ogs_nas_5gs_decode_pdu_session_establishment_accept(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_ACCEPT_RECEIVED_MBS_CONTAINER_TYPE:
-            size = ogs_nas_5gs_decode_received_mbs_container(&pdu_session_establishment_accept->received_mbs_container, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_received_mbs_container(&pdu_session_establishment_accept->received_mbs_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_received_mbs_container() failed");
+               ogs_error("ogs_nas_5gs_read_received_mbs_container() failed");
                return size;
             }
 
@@ -3395,45 +3531,44 @@ int ogs_nas_5gs_decode_pdu_session_establishment_accept(ogs_nas_5gs_message_t *m
             break;
         default:
             ogs_error("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_pdu_session_establishment_reject(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_pdu_session_establishment_reject_t *pdu_session_establishment_reject = &message->gsm.pdu_session_establishment_reject;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode PDU_SESSION_ESTABLISHMENT_REJECT\n");
 
-    size = ogs_nas_5gs_decode_5gsm_cause(&pdu_session_establishment_reject->gsm_cause, pkbuf);
+    size = ogs_nas_5gs_read_5gsm_cause(&pdu_session_establishment_reject->gsm_cause, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_5gs_decode_5gsm_cause() failed");
+        ogs_error("ogs_nas_5gs_read_5gsm_cause() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch(type) {
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_REJECT_BACK_OFF_TIMER_VALUE_TYPE:
-            size = ogs_nas_5gs_decode_gprs_timer_3(&pdu_session_establishment_reject->back_off_timer_value, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_gprs_timer_3(&pdu_session_establishment_reject->back_off_timer_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_gprs_timer_3() failed");
+               ogs_error("ogs_nas_5gs_read_gprs_timer_3() failed");
                return size;
             }
 
@@ -3441,11 +3576,9 @@ int ogs_nas_5gs_decode_pdu_session_establishment_reject(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_REJECT_ALLOWED_SSC_MODE_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_5gs_decode_allowed_ssc_mode(&pdu_session_establishment_reject->allowed_ssc_mode, pkbuf);
+            size = ogs_nas_5gs_read_allowed_ssc_mode(&pdu_session_establishment_reject->allowed_ssc_mode, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_allowed_ssc_mode() failed");
+               ogs_error("ogs_nas_5gs_read_allowed_ssc_mode() failed");
                return size;
             }
 
@@ -3453,9 +3586,10 @@ int ogs_nas_5gs_decode_pdu_session_establishment_reject(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_REJECT_EAP_MESSAGE_TYPE:
-            size = ogs_nas_5gs_decode_eap_message(&pdu_session_establishment_reject->eap_message, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_eap_message(&pdu_session_establishment_reject->eap_message, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_eap_message() failed");
+               ogs_error("ogs_nas_5gs_read_eap_message() failed");
                return size;
             }
 
@@ -3463,9 +3597,10 @@ int ogs_nas_5gs_decode_pdu_session_establishment_reject(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_REJECT_5GSM_CONGESTION_RE_ATTEMPT_INDICATOR_TYPE:
-            size = ogs_nas_5gs_decode_5gsm_congestion_re_attempt_indicator(&pdu_session_establishment_reject->gsm_congestion_re_attempt_indicator, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_5gsm_congestion_re_attempt_indicator(&pdu_session_establishment_reject->gsm_congestion_re_attempt_indicator, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_5gsm_congestion_re_attempt_indicator() failed");
+               ogs_error("ogs_nas_5gs_read_5gsm_congestion_re_attempt_indicator() failed");
                return size;
             }
 
@@ -3473,9 +3608,10 @@ int ogs_nas_5gs_decode_pdu_session_establishment_reject(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_REJECT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_5gs_decode_extended_protocol_configuration_options(&pdu_session_establishment_reject->extended_protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_extended_protocol_configuration_options(&pdu_session_establishment_reject->extended_protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_extended_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_5gs_read_extended_protocol_configuration_options() failed");
                return size;
             }
 
@@ -3483,9 +3619,10 @@ int ogs_nas_5gs_decode_pdu_session_establishment_reject(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_REJECT_RE_ATTEMPT_INDICATOR_TYPE:
-            size = ogs_nas_5gs_decode_re_attempt_indicator(&pdu_session_establishment_reject->re_attempt_indicator, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_re_attempt_indicator(&pdu_session_establishment_reject->re_attempt_indicator, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_re_attempt_indicator() failed");
+               ogs_error("ogs_nas_5gs_read_re_attempt_indicator() failed");
                return size;
             }
 
@@ -3493,9 +3630,10 @@ int ogs_nas_5gs_decode_pdu_session_establishment_reject(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_REJECT_SERVICE_LEVEL_AA_CONTAINER_TYPE:
-            size = ogs_nas_5gs_decode_service_level_aa_container(&pdu_session_establishment_reject->service_level_aa_container, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_service_level_aa_container(&pdu_session_establishment_reject->service_level_aa_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_service_level_aa_container() failed");
+               ogs_error("ogs_nas_5gs_read_service_level_aa_container() failed");
                return size;
             }
 
@@ -3504,45 +3642,44 @@ int ogs_nas_5gs_decode_pdu_session_establishment_reject(ogs_nas_5gs_message_t *m
             break;
         default:
             ogs_error("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_pdu_session_authentication_command(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_pdu_session_authentication_command_t *pdu_session_authentication_command = &message->gsm.pdu_session_authentication_command;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode PDU_SESSION_AUTHENTICATION_COMMAND\n");
 
-    size = ogs_nas_5gs_decode_eap_message(&pdu_session_authentication_command->eap_message, pkbuf);
+    size = ogs_nas_5gs_read_eap_message(&pdu_session_authentication_command->eap_message, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_5gs_decode_eap_message() failed");
+        ogs_error("ogs_nas_5gs_read_eap_message() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch(type) {
         case OGS_NAS_5GS_PDU_SESSION_AUTHENTICATION_COMMAND_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_5gs_decode_extended_protocol_configuration_options(&pdu_session_authentication_command->extended_protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_extended_protocol_configuration_options(&pdu_session_authentication_command->extended_protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_extended_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_5gs_read_extended_protocol_configuration_options() failed");
                return size;
             }
 
@@ -3551,45 +3688,44 @@ int ogs_nas_5gs_decode_pdu_session_authentication_command(ogs_nas_5gs_message_t
             break;
         default:
             ogs_error("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_pdu_session_authentication_complete(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_pdu_session_authentication_complete_t *pdu_session_authentication_complete = &message->gsm.pdu_session_authentication_complete;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode PDU_SESSION_AUTHENTICATION_COMPLETE\n");
 
-    size = ogs_nas_5gs_decode_eap_message(&pdu_session_authentication_complete->eap_message, pkbuf);
+    size = ogs_nas_5gs_read_eap_message(&pdu_session_authentication_complete->eap_message, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_5gs_decode_eap_message() failed");
+        ogs_error("ogs_nas_5gs_read_eap_message() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch(type) {
         case OGS_NAS_5GS_PDU_SESSION_AUTHENTICATION_COMPLETE_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_5gs_decode_extended_protocol_configuration_options(&pdu_session_authentication_complete->extended_protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_extended_protocol_configuration_options(&pdu_session_authentication_complete->extended_protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_extended_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_5gs_read_extended_protocol_configuration_options() failed");
                return size;
             }
 
@@ -3598,37 +3734,36 @@ int ogs_nas_5gs_decode_pdu_session_authentication_complete(ogs_nas_5gs_message_t
             break;
         default:
             ogs_error("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_pdu_session_authentication_result(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_pdu_session_authentication_result_t *pdu_session_authentication_result = &message->gsm.pdu_session_authentication_result;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode PDU_SESSION_AUTHENTICATION_RESULT\n");
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch(type) {
         case OGS_NAS_5GS_PDU_SESSION_AUTHENTICATION_RESULT_EAP_MESSAGE_TYPE:
-            size = ogs_nas_5gs_decode_eap_message(&pdu_session_authentication_result->eap_message, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_eap_message(&pdu_session_authentication_result->eap_message, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_eap_message() failed");
+               ogs_error("ogs_nas_5gs_read_eap_message() failed");
                return size;
             }
 
@@ -3636,9 +3771,10 @@ int ogs_nas_5gs_decode_pdu_session_authentication_result(ogs_nas_5gs_message_t *
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_AUTHENTICATION_RESULT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_5gs_decode_extended_protocol_configuration_options(&pdu_session_authentication_result->extended_protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_extended_protocol_configuration_options(&pdu_session_authentication_result->extended_protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_extended_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_5gs_read_extended_protocol_configuration_options() failed");
                return size;
             }
 
@@ -3647,37 +3783,36 @@ int ogs_nas_5gs_decode_pdu_session_authentication_result(ogs_nas_5gs_message_t *
             break;
         default:
             ogs_error("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_pdu_session_modification_request(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_pdu_session_modification_request_t *pdu_session_modification_request = &message->gsm.pdu_session_modification_request;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode PDU_SESSION_MODIFICATION_REQUEST\n");
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch(type) {
         case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_REQUEST_5GSM_CAPABILITY_TYPE:
-            size = ogs_nas_5gs_decode_5gsm_capability(&pdu_session_modification_request->gsm_capability, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_5gsm_capability(&pdu_session_modification_request->gsm_capability, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_5gsm_capability() failed");
+               ogs_error("ogs_nas_5gs_read_5gsm_capability() failed");
                return size;
             }
 
@@ -3685,9 +3820,10 @@ int ogs_nas_5gs_decode_pdu_session_modification_request(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_REQUEST_5GSM_CAUSE_TYPE:
-            size = ogs_nas_5gs_decode_5gsm_cause(&pdu_session_modification_request->gsm_cause, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_5gsm_cause(&pdu_session_modification_request->gsm_cause, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_5gsm_cause() failed");
+               ogs_error("ogs_nas_5gs_read_5gsm_cause() failed");
                return size;
             }
 
@@ -3695,9 +3831,10 @@ int ogs_nas_5gs_decode_pdu_session_modification_request(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_REQUEST_MAXIMUM_NUMBER_OF_SUPPORTED_PACKET_FILTERS_TYPE:
-            size = ogs_nas_5gs_decode_maximum_number_of_supported_packet_filters(&pdu_session_modification_request->maximum_number_of_supported_packet_filters, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_maximum_number_of_supported_packet_filters(&pdu_session_modification_request->maximum_number_of_supported_packet_filters, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_maximum_number_of_supported_packet_filters() failed");
+               ogs_error("ogs_nas_5gs_read_maximum_number_of_supported_packet_filters() failed");
                return size;
             }
 
@@ -3705,11 +3842,9 @@ int ogs_nas_5gs_decode_pdu_session_modification_request(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_REQUEST_ALWAYS_ON_PDU_SESSION_REQUESTED_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_5gs_decode_always_on_pdu_session_requested(&pdu_session_modification_request->always_on_pdu_session_requested, pkbuf);
+            size = ogs_nas_5gs_read_always_on_pdu_session_requested(&pdu_session_modification_request->always_on_pdu_session_requested, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_always_on_pdu_session_requested() failed");
+               ogs_error("ogs_nas_5gs_read_always_on_pdu_session_requested() failed");
                return size;
             }
 
@@ -3717,9 +3852,10 @@ int ogs_nas_5gs_decode_pdu_session_modification_request(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_REQUEST_INTEGRITY_PROTECTION_MAXIMUM_DATA_RATE_TYPE:
-            size = ogs_nas_5gs_decode_integrity_protection_maximum_data_rate(&pdu_session_modification_request->integrity_protection_maximum_data_rate, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_integrity_protection_maximum_data_rate(&pdu_session_modification_request->integrity_protection_maximum_data_rate, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_integrity_protection_maximum_data_rate() failed");
+               ogs_error("ogs_nas_5gs_read_integrity_protection_maximum_data_rate() failed");
                return size;
             }
 
@@ -3727,9 +3863,10 @@ int ogs_nas_5gs_decode_pdu_session_modification_request(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_REQUEST_REQUESTED_QOS_RULES_TYPE:
-            size = ogs_nas_5gs_decode_qos_rules(&pdu_session_modification_request->requested_qos_rules, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_qos_rules(&pdu_session_modification_request->requested_qos_rules, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_qos_rules() failed");
+               ogs_error("ogs_nas_5gs_read_qos_rules() failed");
                return size;
             }
 
@@ -3737,9 +3874,10 @@ int ogs_nas_5gs_decode_pdu_session_modification_request(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_REQUEST_REQUESTED_QOS_FLOW_DESCRIPTIONS_TYPE:
-            size = ogs_nas_5gs_decode_qos_flow_descriptions(&pdu_session_modification_request->requested_qos_flow_descriptions, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_qos_flow_descriptions(&pdu_session_modification_request->requested_qos_flow_descriptions, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_qos_flow_descriptions() failed");
+               ogs_error("ogs_nas_5gs_read_qos_flow_descriptions() failed");
                return size;
             }
 
@@ -3747,9 +3885,10 @@ int ogs_nas_5gs_decode_pdu_session_modification_request(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_REQUEST_MAPPED_EPS_BEARER_CONTEXTS_TYPE:
-            size = ogs_nas_5gs_decode_mapped_eps_bearer_contexts(&pdu_session_modification_request->mapped_eps_bearer_contexts, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_mapped_eps_bearer_contexts(&pdu_session_modification_request->mapped_eps_bearer_contexts, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_mapped_eps_bearer_contexts() failed");
+               ogs_error("ogs_nas_5gs_read_mapped_eps_bearer_contexts() failed");
                return size;
             }
 
@@ -3757,9 +3896,10 @@ int ogs_nas_5gs_decode_pdu_session_modification_request(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_REQUEST_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_5gs_decode_extended_protocol_configuration_options(&pdu_session_modification_request->extended_protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_extended_protocol_configuration_options(&pdu_session_modification_request->extended_protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_extended_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_5gs_read_extended_protocol_configuration_options() failed");
                return size;
             }
 
@@ -3767,9 +3907,10 @@ int ogs_nas_5gs_decode_pdu_session_modification_request(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_REQUEST_PORT_MANAGEMENT_INFORMATION_CONTAINER_TYPE:
-            size = ogs_nas_5gs_decode_port_management_information_container(&pdu_session_modification_request->port_management_information_container, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_port_management_information_container(&pdu_session_modification_request->port_management_information_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_port_management_information_container() failed");
+               ogs_error("ogs_nas_5gs_read_port_management_information_container() failed");
                return size;
             }
 
@@ -3777,9 +3918,10 @@ int ogs_nas_5gs_decode_pdu_session_modification_request(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_REQUEST_IP_HEADER_COMPRESSION_CONFIGURATION_TYPE:
-            size = ogs_nas_5gs_decode_header_compression_configuration(&pdu_session_modification_request->ip_header_compression_configuration, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_header_compression_configuration(&pdu_session_modification_request->ip_header_compression_configuration, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_header_compression_configuration() failed");
+               ogs_error("ogs_nas_5gs_read_header_compression_configuration() failed");
                return size;
             }
 
@@ -3787,9 +3929,10 @@ int ogs_nas_5gs_decode_pdu_session_modification_request(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_REQUEST_ETHERNET_HEADER_COMPRESSION_CONFIGURATION_TYPE:
-            size = ogs_nas_5gs_decode_ethernet_header_compression_configuration(&pdu_session_modification_request->ethernet_header_compression_configuration, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_ethernet_header_compression_configuration(&pdu_session_modification_request->ethernet_header_compression_configuration, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_ethernet_header_compression_configuration() failed");
+               ogs_error("ogs_nas_5gs_read_ethernet_header_compression_configuration() failed");
                return size;
             }
 
@@ -3797,9 +3940,10 @@ int ogs_nas_5gs_decode_pdu_session_modification_request(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_REQUEST_REQUESTED_MBS_CONTAINER_TYPE:
-            size = ogs_nas_5gs_decode_requested_mbs_container(&pdu_session_modification_request->requested_mbs_container, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_requested_mbs_container(&pdu_session_modification_request->requested_mbs_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_requested_mbs_container() failed");
+               ogs_error("ogs_nas_5gs_read_requested_mbs_container() failed");
                return size;
             }
 
@@ -3807,9 +3951,10 @@ int ogs_nas_5gs_decode_pdu_session_modification_request(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_REQUEST_SERVICE_LEVEL_AA_CONTAINER_TYPE:
-            size = ogs_nas_5gs_decode_service_level_aa_container(&pdu_session_modification_request->service_level_aa_container, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_service_level_aa_container(&pdu_session_modification_request->service_level_aa_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_service_level_aa_container() failed");
+               ogs_error("ogs_nas_5gs_read_service_level_aa_container() failed");
                return size;
             }
 
@@ -3818,45 +3963,44 @@ int ogs_nas_5gs_decode_pdu_session_modification_request(ogs_nas_5gs_message_t *m
             break;
         default:
             ogs_error("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_pdu_session_modification_reject(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_pdu_session_modification_reject_t *pdu_session_modification_reject = &message->gsm.pdu_session_modification_reject;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode PDU_SESSION_MODIFICATION_REJECT\n");
 
-    size = ogs_nas_5gs_decode_5gsm_cause(&pdu_session_modification_reject->gsm_cause, pkbuf);
+    size = ogs_nas_5gs_read_5gsm_cause(&pdu_session_modification_reject->gsm_cause, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_5gs_decode_5gsm_cause() failed");
+        ogs_error("ogs_nas_5gs_read_5gsm_cause() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch(type) {
         case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_REJECT_BACK_OFF_TIMER_VALUE_TYPE:
-            size = ogs_nas_5gs_decode_gprs_timer_3(&pdu_session_modification_reject->back_off_timer_value, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_gprs_timer_3(&pdu_session_modification_reject->back_off_timer_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_gprs_timer_3() failed");
+               ogs_error("ogs_nas_5gs_read_gprs_timer_3() failed");
                return size;
             }
 
@@ -3864,9 +4008,10 @@ int ogs_nas_5gs_decode_pdu_session_modification_reject(ogs_nas_5gs_message_t *me
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_REJECT_5GSM_CONGESTION_RE_ATTEMPT_INDICATOR_TYPE:
-            size = ogs_nas_5gs_decode_5gsm_congestion_re_attempt_indicator(&pdu_session_modification_reject->gsm_congestion_re_attempt_indicator, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_5gsm_congestion_re_attempt_indicator(&pdu_session_modification_reject->gsm_congestion_re_attempt_indicator, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_5gsm_congestion_re_attempt_indicator() failed");
+               ogs_error("ogs_nas_5gs_read_5gsm_congestion_re_attempt_indicator() failed");
                return size;
             }
 
@@ -3874,9 +4019,10 @@ int ogs_nas_5gs_decode_pdu_session_modification_reject(ogs_nas_5gs_message_t *me
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_REJECT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_5gs_decode_extended_protocol_configuration_options(&pdu_session_modification_reject->extended_protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_extended_protocol_configuration_options(&pdu_session_modification_reject->extended_protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_extended_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_5gs_read_extended_protocol_configuration_options() failed");
                return size;
             }
 
@@ -3884,9 +4030,10 @@ int ogs_nas_5gs_decode_pdu_session_modification_reject(ogs_nas_5gs_message_t *me
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_REJECT_RE_ATTEMPT_INDICATOR_TYPE:
-            size = ogs_nas_5gs_decode_re_attempt_indicator(&pdu_session_modification_reject->re_attempt_indicator, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_re_attempt_indicator(&pdu_session_modification_reject->re_attempt_indicator, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_re_attempt_indicator() failed");
+               ogs_error("ogs_nas_5gs_read_re_attempt_indicator() failed");
                return size;
             }
 
@@ -3895,37 +4042,36 @@ int ogs_nas_5gs_decode_pdu_session_modification_reject(ogs_nas_5gs_message_t *me
             break;
         default:
             ogs_error("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_pdu_session_modification_command(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_pdu_session_modification_command_t *pdu_session_modification_command = &message->gsm.pdu_session_modification_command;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode PDU_SESSION_MODIFICATION_COMMAND\n");
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch(type) {
         case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_COMMAND_5GSM_CAUSE_TYPE:
-            size = ogs_nas_5gs_decode_5gsm_cause(&pdu_session_modification_command->gsm_cause, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_5gsm_cause(&pdu_session_modification_command->gsm_cause, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_5gsm_cause() failed");
+               ogs_error("ogs_nas_5gs_read_5gsm_cause() failed");
                return size;
             }
 
@@ -3933,9 +4079,10 @@ int ogs_nas_5gs_decode_pdu_session_modification_command(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_COMMAND_SESSION_AMBR_TYPE:
-            size = ogs_nas_5gs_decode_session_ambr(&pdu_session_modification_command->session_ambr, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_session_ambr(&pdu_session_modification_command->session_ambr, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_session_ambr() failed");
+               ogs_error("ogs_nas_5gs_read_session_ambr() failed");
                return size;
             }
 
@@ -3943,9 +4090,10 @@ int ogs_nas_5gs_decode_pdu_session_modification_command(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_COMMAND_RQ_TIMER_VALUE_TYPE:
-            size = ogs_nas_5gs_decode_gprs_timer(&pdu_session_modification_command->rq_timer_value, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_gprs_timer(&pdu_session_modification_command->rq_timer_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_gprs_timer() failed");
+               ogs_error("ogs_nas_5gs_read_gprs_timer() failed");
                return size;
             }
 
@@ -3953,11 +4101,9 @@ int ogs_nas_5gs_decode_pdu_session_modification_command(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_COMMAND_ALWAYS_ON_PDU_SESSION_INDICATION_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_5gs_decode_always_on_pdu_session_indication(&pdu_session_modification_command->always_on_pdu_session_indication, pkbuf);
+            size = ogs_nas_5gs_read_always_on_pdu_session_indication(&pdu_session_modification_command->always_on_pdu_session_indication, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_always_on_pdu_session_indication() failed");
+               ogs_error("ogs_nas_5gs_read_always_on_pdu_session_indication() failed");
                return size;
             }
 
@@ -3965,9 +4111,10 @@ int ogs_nas_5gs_decode_pdu_session_modification_command(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_COMMAND_AUTHORIZED_QOS_RULES_TYPE:
-            size = ogs_nas_5gs_decode_qos_rules(&pdu_session_modification_command->authorized_qos_rules, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_qos_rules(&pdu_session_modification_command->authorized_qos_rules, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_qos_rules() failed");
+               ogs_error("ogs_nas_5gs_read_qos_rules() failed");
                return size;
             }
 
@@ -3975,9 +4122,10 @@ int ogs_nas_5gs_decode_pdu_session_modification_command(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_COMMAND_MAPPED_EPS_BEARER_CONTEXTS_TYPE:
-            size = ogs_nas_5gs_decode_mapped_eps_bearer_contexts(&pdu_session_modification_command->mapped_eps_bearer_contexts, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_mapped_eps_bearer_contexts(&pdu_session_modification_command->mapped_eps_bearer_contexts, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_mapped_eps_bearer_contexts() failed");
+               ogs_error("ogs_nas_5gs_read_mapped_eps_bearer_contexts() failed");
                return size;
             }
 
@@ -3985,9 +4133,10 @@ int ogs_nas_5gs_decode_pdu_session_modification_command(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_COMMAND_AUTHORIZED_QOS_FLOW_DESCRIPTIONS_TYPE:
-            size = ogs_nas_5gs_decode_qos_flow_descriptions(&pdu_session_modification_command->authorized_qos_flow_descriptions, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_qos_flow_descriptions(&pdu_session_modification_command->authorized_qos_flow_descriptions, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_qos_flow_descriptions() failed");
+               ogs_error("ogs_nas_5gs_read_qos_flow_descriptions() failed");
                return size;
             }
 
@@ -3995,9 +4144,10 @@ int ogs_nas_5gs_decode_pdu_session_modification_command(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_COMMAND_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_5gs_decode_extended_protocol_configuration_options(&pdu_session_modification_command->extended_protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_extended_protocol_configuration_options(&pdu_session_modification_command->extended_protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_extended_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_5gs_read_extended_protocol_configuration_options() failed");
                return size;
             }
 
@@ -4005,9 +4155,10 @@ int ogs_nas_5gs_decode_pdu_session_modification_command(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_COMMAND_ATSSS_CONTAINER_TYPE:
-            size = ogs_nas_5gs_decode_atsss_container(&pdu_session_modification_command->atsss_container, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_atsss_container(&pdu_session_modification_command->atsss_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_atsss_container() failed");
+               ogs_error("ogs_nas_5gs_read_atsss_container() failed");
                return size;
             }
 
@@ -4015,9 +4166,10 @@ int ogs_nas_5gs_decode_pdu_session_modification_command(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_COMMAND_IP_HEADER_COMPRESSION_CONFIGURATION_TYPE:
-            size = ogs_nas_5gs_decode_ip_header_compression_configuration(&pdu_session_modification_command->ip_header_compression_configuration, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_ip_header_compression_configuration(&pdu_session_modification_command->ip_header_compression_configuration, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_ip_header_compression_configuration() failed");
+               ogs_error("ogs_nas_5gs_read_ip_header_compression_configuration() failed");
                return size;
             }
 
@@ -4025,9 +4177,10 @@ int ogs_nas_5gs_decode_pdu_session_modification_command(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_COMMAND_PORT_MANAGEMENT_INFORMATION_CONTAINER_TYPE:
-            size = ogs_nas_5gs_decode_port_management_information_container(&pdu_session_modification_command->port_management_information_container, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_port_management_information_container(&pdu_session_modification_command->port_management_information_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_port_management_information_container() failed");
+               ogs_error("ogs_nas_5gs_read_port_management_information_container() failed");
                return size;
             }
 
@@ -4035,9 +4188,10 @@ int ogs_nas_5gs_decode_pdu_session_modification_command(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_COMMAND_SERVING_PLMN_RATE_CONTROL_TYPE:
-            size = ogs_nas_5gs_decode_serving_plmn_rate_control(&pdu_session_modification_command->serving_plmn_rate_control, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_serving_plmn_rate_control(&pdu_session_modification_command->serving_plmn_rate_control, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_serving_plmn_rate_control() failed");
+               ogs_error("ogs_nas_5gs_read_serving_plmn_rate_control() failed");
                return size;
             }
 
@@ -4045,9 +4199,10 @@ int ogs_nas_5gs_decode_pdu_session_modification_command(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_COMMAND_ETHERNET_HEADER_COMPRESSION_CONFIGURATION_TYPE:
-            size = ogs_nas_5gs_decode_ethernet_header_compression_configuration(&pdu_session_modification_command->ethernet_header_compression_configuration, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_ethernet_header_compression_configuration(&pdu_session_modification_command->ethernet_header_compression_configuration, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_ethernet_header_compression_configuration() failed");
+               ogs_error("ogs_nas_5gs_read_ethernet_header_compression_configuration() failed");
                return size;
             }
 
@@ -4055,9 +4210,10 @@ int ogs_nas_5gs_decode_pdu_session_modification_command(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_COMMAND_RECEIVED_MBS_CONTAINER_TYPE:
-            size = ogs_nas_5gs_decode_received_mbs_container(&pdu_session_modification_command->received_mbs_container, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_received_mbs_container(&pdu_session_modification_command->received_mbs_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_received_mbs_container() failed");
+               ogs_error("ogs_nas_5gs_read_received_mbs_container() failed");
                return size;
             }
 
@@ -4065,9 +4221,10 @@ int ogs_nas_5gs_decode_pdu_session_modification_command(ogs_nas_5gs_message_t *m
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_COMMAND_SERVICE_LEVEL_AA_CONTAINER_TYPE:
-            size = ogs_nas_5gs_decode_service_level_aa_container(&pdu_session_modification_command->service_level_aa_container, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_service_level_aa_container(&pdu_session_modification_command->service_level_aa_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_service_level_aa_container() failed");
+               ogs_error("ogs_nas_5gs_read_service_level_aa_container() failed");
                return size;
             }
 
@@ -4076,37 +4233,36 @@ int ogs_nas_5gs_decode_pdu_session_modification_command(ogs_nas_5gs_message_t *m
             break;
         default:
             ogs_error("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_pdu_session_modification_complete(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_pdu_session_modification_complete_t *pdu_session_modification_complete = &message->gsm.pdu_session_modification_complete;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode PDU_SESSION_MODIFICATION_COMPLETE\n");
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch(type) {
         case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_COMPLETE_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_5gs_decode_extended_protocol_configuration_options(&pdu_session_modification_complete->extended_protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_extended_protocol_configuration_options(&pdu_session_modification_complete->extended_protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_extended_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_5gs_read_extended_protocol_configuration_options() failed");
                return size;
             }
 
@@ -4114,9 +4270,10 @@ int ogs_nas_5gs_decode_pdu_session_modification_complete(ogs_nas_5gs_message_t *
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_COMPLETE_PORT_MANAGEMENT_INFORMATION_CONTAINER_TYPE:
-            size = ogs_nas_5gs_decode_port_management_information_container(&pdu_session_modification_complete->port_management_information_container, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_port_management_information_container(&pdu_session_modification_complete->port_management_information_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_port_management_information_container() failed");
+               ogs_error("ogs_nas_5gs_read_port_management_information_container() failed");
                return size;
             }
 
@@ -4125,45 +4282,44 @@ int ogs_nas_5gs_decode_pdu_session_modification_complete(ogs_nas_5gs_message_t *
             break;
         default:
             ogs_error("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_pdu_session_modification_command_reject(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_pdu_session_modification_command_reject_t *pdu_session_modification_command_reject = &message->gsm.pdu_session_modification_command_reject;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode PDU_SESSION_MODIFICATION_COMMAND_REJECT\n");
 
-    size = ogs_nas_5gs_decode_5gsm_cause(&pdu_session_modification_command_reject->gsm_cause, pkbuf);
+    size = ogs_nas_5gs_read_5gsm_cause(&pdu_session_modification_command_reject->gsm_cause, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_5gs_decode_5gsm_cause() failed");
+        ogs_error("ogs_nas_5gs_read_5gsm_cause() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch(type) {
         case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_COMMAND_REJECT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_5gs_decode_extended_protocol_configuration_options(&pdu_session_modification_command_reject->extended_protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_extended_protocol_configuration_options(&pdu_session_modification_command_reject->extended_protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_extended_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_5gs_read_extended_protocol_configuration_options() failed");
                return size;
             }
 
@@ -4172,37 +4328,36 @@ int ogs_nas_5gs_decode_pdu_session_modification_command_reject(ogs_nas_5gs_messa
             break;
         default:
             ogs_error("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_pdu_session_release_request(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_pdu_session_release_request_t *pdu_session_release_request = &message->gsm.pdu_session_release_request;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode PDU_SESSION_RELEASE_REQUEST\n");
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch(type) {
         case OGS_NAS_5GS_PDU_SESSION_RELEASE_REQUEST_5GSM_CAUSE_TYPE:
-            size = ogs_nas_5gs_decode_5gsm_cause(&pdu_session_release_request->gsm_cause, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_5gsm_cause(&pdu_session_release_request->gsm_cause, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_5gsm_cause() failed");
+               ogs_error("ogs_nas_5gs_read_5gsm_cause() failed");
                return size;
             }
 
@@ -4210,9 +4365,10 @@ int ogs_nas_5gs_decode_pdu_session_release_request(ogs_nas_5gs_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_RELEASE_REQUEST_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_5gs_decode_extended_protocol_configuration_options(&pdu_session_release_request->extended_protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_extended_protocol_configuration_options(&pdu_session_release_request->extended_protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_extended_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_5gs_read_extended_protocol_configuration_options() failed");
                return size;
             }
 
@@ -4221,45 +4377,44 @@ int ogs_nas_5gs_decode_pdu_session_release_request(ogs_nas_5gs_message_t *messag
             break;
         default:
             ogs_error("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_pdu_session_release_reject(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_pdu_session_release_reject_t *pdu_session_release_reject = &message->gsm.pdu_session_release_reject;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode PDU_SESSION_RELEASE_REJECT\n");
 
-    size = ogs_nas_5gs_decode_5gsm_cause(&pdu_session_release_reject->gsm_cause, pkbuf);
+    size = ogs_nas_5gs_read_5gsm_cause(&pdu_session_release_reject->gsm_cause, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_5gs_decode_5gsm_cause() failed");
+        ogs_error("ogs_nas_5gs_read_5gsm_cause() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch(type) {
         case OGS_NAS_5GS_PDU_SESSION_RELEASE_REJECT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_5gs_decode_extended_protocol_configuration_options(&pdu_session_release_reject->extended_protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_extended_protocol_configuration_options(&pdu_session_release_reject->extended_protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_extended_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_5gs_read_extended_protocol_configuration_options() failed");
                return size;
             }
 
@@ -4268,45 +4423,44 @@ int ogs_nas_5gs_decode_pdu_session_release_reject(ogs_nas_5gs_message_t *message
             break;
         default:
             ogs_error("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_pdu_session_release_command(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_pdu_session_release_command_t *pdu_session_release_command = &message->gsm.pdu_session_release_command;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode PDU_SESSION_RELEASE_COMMAND\n");
 
-    size = ogs_nas_5gs_decode_5gsm_cause(&pdu_session_release_command->gsm_cause, pkbuf);
+    size = ogs_nas_5gs_read_5gsm_cause(&pdu_session_release_command->gsm_cause, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_5gs_decode_5gsm_cause() failed");
+        ogs_error("ogs_nas_5gs_read_5gsm_cause() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch(type) {
         case OGS_NAS_5GS_PDU_SESSION_RELEASE_COMMAND_BACK_OFF_TIMER_VALUE_TYPE:
-            size = ogs_nas_5gs_decode_gprs_timer_3(&pdu_session_release_command->back_off_timer_value, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_gprs_timer_3(&pdu_session_release_command->back_off_timer_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_gprs_timer_3() failed");
+               ogs_error("ogs_nas_5gs_read_gprs_timer_3() failed");
                return size;
             }
 
@@ -4314,9 +4468,10 @@ int ogs_nas_5gs_decode_pdu_session_release_command(ogs_nas_5gs_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_RELEASE_COMMAND_EAP_MESSAGE_TYPE:
-            size = ogs_nas_5gs_decode_eap_message(&pdu_session_release_command->eap_message, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_eap_message(&pdu_session_release_command->eap_message, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_eap_message() failed");
+               ogs_error("ogs_nas_5gs_read_eap_message() failed");
                return size;
             }
 
@@ -4324,9 +4479,10 @@ int ogs_nas_5gs_decode_pdu_session_release_command(ogs_nas_5gs_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_RELEASE_COMMAND_5GSM_CONGESTION_RE_ATTEMPT_INDICATOR_TYPE:
-            size = ogs_nas_5gs_decode_5gsm_congestion_re_attempt_indicator(&pdu_session_release_command->gsm_congestion_re_attempt_indicator, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_5gsm_congestion_re_attempt_indicator(&pdu_session_release_command->gsm_congestion_re_attempt_indicator, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_5gsm_congestion_re_attempt_indicator() failed");
+               ogs_error("ogs_nas_5gs_read_5gsm_congestion_re_attempt_indicator() failed");
                return size;
             }
 
@@ -4334,9 +4490,10 @@ int ogs_nas_5gs_decode_pdu_session_release_command(ogs_nas_5gs_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_RELEASE_COMMAND_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_5gs_decode_extended_protocol_configuration_options(&pdu_session_release_command->extended_protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_extended_protocol_configuration_options(&pdu_session_release_command->extended_protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_extended_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_5gs_read_extended_protocol_configuration_options() failed");
                return size;
             }
 
@@ -4344,11 +4501,9 @@ int ogs_nas_5gs_decode_pdu_session_release_command(ogs_nas_5gs_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_RELEASE_COMMAND_ACCESS_TYPE_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_5gs_decode_access_type(&pdu_session_release_command->access_type, pkbuf);
+            size = ogs_nas_5gs_read_access_type(&pdu_session_release_command->access_type, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_access_type() failed");
+               ogs_error("ogs_nas_5gs_read_access_type() failed");
                return size;
             }
 
@@ -4356,9 +4511,10 @@ int ogs_nas_5gs_decode_pdu_session_release_command(ogs_nas_5gs_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_RELEASE_COMMAND_SERVICE_LEVEL_AA_CONTAINER_TYPE:
-            size = ogs_nas_5gs_decode_service_level_aa_container(&pdu_session_release_command->service_level_aa_container, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_service_level_aa_container(&pdu_session_release_command->service_level_aa_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_service_level_aa_container() failed");
+               ogs_error("ogs_nas_5gs_read_service_level_aa_container() failed");
                return size;
             }
 
@@ -4367,37 +4523,36 @@ int ogs_nas_5gs_decode_pdu_session_release_command(ogs_nas_5gs_message_t *messag
             break;
         default:
             ogs_error("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_pdu_session_release_complete(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_pdu_session_release_complete_t *pdu_session_release_complete = &message->gsm.pdu_session_release_complete;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode PDU_SESSION_RELEASE_COMPLETE\n");
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch(type) {
         case OGS_NAS_5GS_PDU_SESSION_RELEASE_COMPLETE_5GSM_CAUSE_TYPE:
-            size = ogs_nas_5gs_decode_5gsm_cause(&pdu_session_release_complete->gsm_cause, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_5gsm_cause(&pdu_session_release_complete->gsm_cause, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_5gsm_cause() failed");
+               ogs_error("ogs_nas_5gs_read_5gsm_cause() failed");
                return size;
             }
 
@@ -4405,9 +4560,10 @@ int ogs_nas_5gs_decode_pdu_session_release_complete(ogs_nas_5gs_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_5GS_PDU_SESSION_RELEASE_COMPLETE_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_5gs_decode_extended_protocol_configuration_options(&pdu_session_release_complete->extended_protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_5gs_read_extended_protocol_configuration_options(&pdu_session_release_complete->extended_protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_5gs_decode_extended_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_5gs_read_extended_protocol_configuration_options() failed");
                return size;
             }
 
@@ -4416,34 +4572,101 @@ int ogs_nas_5gs_decode_pdu_session_release_complete(ogs_nas_5gs_message_t *messa
             break;
         default:
             ogs_error("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_5gs_decode_5gsm_status(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_5gs_5gsm_status_t *gsm_status = &message->gsm.gsm_status;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode 5GSM_STATUS\n");
 
-    size = ogs_nas_5gs_decode_5gsm_cause(&gsm_status->gsm_cause, pkbuf);
+    size = ogs_nas_5gs_read_5gsm_cause(&gsm_status->gsm_cause, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_5gs_decode_5gsm_cause() failed");
+        ogs_error("ogs_nas_5gs_read_5gsm_cause() failed");
         return size;
     }
 
     decoded += size;
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
+/* Size of the union member for the message type, 0 if it has none */
+static size_t ogs_nas_5gmm_message_size(uint8_t message_type)
+{
+    switch(message_type) {
+    case OGS_NAS_5GS_REGISTRATION_REQUEST:
+        return sizeof(ogs_nas_5gs_registration_request_t);
+    case OGS_NAS_5GS_REGISTRATION_ACCEPT:
+        return sizeof(ogs_nas_5gs_registration_accept_t);
+    case OGS_NAS_5GS_REGISTRATION_COMPLETE:
+        return sizeof(ogs_nas_5gs_registration_complete_t);
+    case OGS_NAS_5GS_REGISTRATION_REJECT:
+        return sizeof(ogs_nas_5gs_registration_reject_t);
+    case OGS_NAS_5GS_DEREGISTRATION_REQUEST_FROM_UE:
+        return sizeof(ogs_nas_5gs_deregistration_request_from_ue_t);
+    case OGS_NAS_5GS_DEREGISTRATION_REQUEST_TO_UE:
+        return sizeof(ogs_nas_5gs_deregistration_request_to_ue_t);
+    case OGS_NAS_5GS_SERVICE_REQUEST:
+        return sizeof(ogs_nas_5gs_service_request_t);
+    case OGS_NAS_5GS_SERVICE_REJECT:
+        return sizeof(ogs_nas_5gs_service_reject_t);
+    case OGS_NAS_5GS_SERVICE_ACCEPT:
+        return sizeof(ogs_nas_5gs_service_accept_t);
+    case OGS_NAS_5GS_CONFIGURATION_UPDATE_COMMAND:
+        return sizeof(ogs_nas_5gs_configuration_update_command_t);
+    case OGS_NAS_5GS_AUTHENTICATION_REQUEST:
+        return sizeof(ogs_nas_5gs_authentication_request_t);
+    case OGS_NAS_5GS_AUTHENTICATION_RESPONSE:
+        return sizeof(ogs_nas_5gs_authentication_response_t);
+    case OGS_NAS_5GS_AUTHENTICATION_REJECT:
+        return sizeof(ogs_nas_5gs_authentication_reject_t);
+    case OGS_NAS_5GS_AUTHENTICATION_FAILURE:
+        return sizeof(ogs_nas_5gs_authentication_failure_t);
+    case OGS_NAS_5GS_AUTHENTICATION_RESULT:
+        return sizeof(ogs_nas_5gs_authentication_result_t);
+    case OGS_NAS_5GS_IDENTITY_REQUEST:
+        return sizeof(ogs_nas_5gs_identity_request_t);
+    case OGS_NAS_5GS_IDENTITY_RESPONSE:
+        return sizeof(ogs_nas_5gs_identity_response_t);
+    case OGS_NAS_5GS_SECURITY_MODE_COMMAND:
+        return sizeof(ogs_nas_5gs_security_mode_command_t);
+    case OGS_NAS_5GS_SECURITY_MODE_COMPLETE:
+        return sizeof(ogs_nas_5gs_security_mode_complete_t);
+    case OGS_NAS_5GS_SECURITY_MODE_REJECT:
+        return sizeof(ogs_nas_5gs_security_mode_reject_t);
+    case OGS_NAS_5GS_5GMM_STATUS:
+        return sizeof(ogs_nas_5gs_5gmm_status_t);
+    case OGS_NAS_5GS_NOTIFICATION:
+        return sizeof(ogs_nas_5gs_notification_t);
+    case OGS_NAS_5GS_NOTIFICATION_RESPONSE:
+        return sizeof(ogs_nas_5gs_notification_response_t);
+    case OGS_NAS_5GS_UL_NAS_TRANSPORT:
+        return sizeof(ogs_nas_5gs_ul_nas_transport_t);
+    case OGS_NAS_5GS_DL_NAS_TRANSPORT:
+        return sizeof(ogs_nas_5gs_dl_nas_transport_t);
+    default:
+        return 0;
+    }
+}
+
 int ogs_nas_5gmm_decode(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
+    ogs_nas_5gmm_header_t *h = NULL;
     int size = 0;
     int decoded = 0;
 
@@ -4455,9 +4678,12 @@ int ogs_nas_5gmm_decode(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
        ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
        return OGS_ERROR;
     }
+    h = (ogs_nas_5gmm_header_t *)(pkbuf->data - size);
 
-    memset(message, 0, sizeof(ogs_nas_5gs_message_t));
-    memcpy(&message->gmm.h, pkbuf->data - size, size);
+    /* Clear the headers and the message of this type, not the whole union */
+    memset(message, 0, offsetof(ogs_nas_5gs_message_t, gmm.registration_request) +
+            ogs_nas_5gmm_message_size(h->message_type));
+    memcpy(&message->gmm.h, h, size);
     decoded += size;
 
     switch(message->gmm.h.message_type) {
@@ -4702,8 +4928,50 @@ int ogs_nas_5gmm_decode(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 
     return OGS_OK;
 }
+/* Size of the union member for the message type, 0 if it has none */
+static size_t ogs_nas_5gsm_message_size(uint8_t message_type)
+{
+    switch(message_type) {
+    case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_REQUEST:
+        return sizeof(ogs_nas_5gs_pdu_session_establishment_request_t);
+    case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_ACCEPT:
+        return sizeof(ogs_nas_5gs_pdu_session_establishment_accept_t);
+    case OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_REJECT:
+        return sizeof(ogs_nas_5gs_pdu_session_establishment_reject_t);
+    case OGS_NAS_5GS_PDU_SESSION_AUTHENTICATION_COMMAND:
+        return sizeof(ogs_nas_5gs_pdu_session_authentication_command_t);
+    case OGS_NAS_5GS_PDU_SESSION_AUTHENTICATION_COMPLETE:
+        return sizeof(ogs_nas_5gs_pdu_session_authentication_complete_t);
+    case OGS_NAS_5GS_PDU_SESSION_AUTHENTICATION_RESULT:
+        return sizeof(ogs_nas_5gs_pdu_session_authentication_result_t);
+    case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_REQUEST:
+        return sizeof(ogs_nas_5gs_pdu_session_modification_request_t);
+    case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_REJECT:
+        return sizeof(ogs_nas_5gs_pdu_session_modification_reject_t);
+    case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_COMMAND:
+        return sizeof(ogs_nas_5gs_pdu_session_modification_command_t);
+    case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_COMPLETE:
+        return sizeof(ogs_nas_5gs_pdu_session_modification_complete_t);
+    case OGS_NAS_5GS_PDU_SESSION_MODIFICATION_COMMAND_REJECT:
+        return sizeof(ogs_nas_5gs_pdu_session_modification_command_reject_t);
+    case OGS_NAS_5GS_PDU_SESSION_RELEASE_REQUEST:
+        return sizeof(ogs_nas_5gs_pdu_session_release_request_t);
+    case OGS_NAS_5GS_PDU_SESSION_RELEASE_REJECT:
+        return sizeof(ogs_nas_5gs_pdu_session_release_reject_t);
+    case OGS_NAS_5GS_PDU_SESSION_RELEASE_COMMAND:
+        return sizeof(ogs_nas_5gs_pdu_session_release_command_t);
+    case OGS_NAS_5GS_PDU_SESSION_RELEASE_COMPLETE:
+        return sizeof(ogs_nas_5gs_pdu_session_release_complete_t);
+    case OGS_NAS_5GS_5GSM_STATUS:
+        return sizeof(ogs_nas_5gs_5gsm_status_t);
+    default:
+        return 0;
+    }
+}
+
 int ogs_nas_5gsm_decode(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
+    ogs_nas_5gsm_header_t *h = NULL;
     int size = 0;
     int decoded = 0;
 
@@ -4715,9 +4983,12 @@ int ogs_nas_5gsm_decode(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
        ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
        return OGS_ERROR;
     }
+    h = (ogs_nas_5gsm_header_t *)(pkbuf->data - size);
 
-    memset(message, 0, sizeof(ogs_nas_5gs_message_t));
-    memcpy(&message->gsm.h, pkbuf->data - size, size);
+    /* Clear the headers and the message of this type, not the whole union */
+    memset(message, 0, offsetof(ogs_nas_5gs_message_t, gsm.pdu_session_establishment_request) +
+            ogs_nas_5gsm_message_size(h->message_type));
+    memcpy(&message->gsm.h, h, size);
     decoded += size;
 
     switch(message->gsm.h.message_type) {
@@ -4876,3 +5147,1702 @@ int ogs_nas_5gsm_decode(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
     return OGS_OK;
 }
 
+static int ogs_nas_5gs_locate_registration_request(
+        ogs_nas_5gs_registration_request_lazy_t *lazy, ogs_pkbuf_t *pkbuf)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = &lazy->registration_request;
+    unsigned char *data = pkbuf->data - sizeof(ogs_nas_5gmm_header_t);
+    int size = 0;
+    int i;
+
+    size = ogs_nas_5gs_decode_5gs_registration_type(&registration_request->registration_type, pkbuf);
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_5gs_registration_type() failed");
+        return size;
+    }
+
+    size = ogs_nas_5gs_decode_5gs_mobile_identity(&registration_request->mobile_identity, pkbuf);
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_5gs_mobile_identity() failed");
+        return size;
+    }
+
+    while (pkbuf->len > 0) {
+        uint8_t *buffer = pkbuf->data;
+        uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
+
+        size = sizeof(uint8_t);
+        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+           return OGS_ERROR;
+        }
+
+        /* i is the bit of the IE in presencemask */
+        switch(type) {
+        case OGS_NAS_5GS_REGISTRATION_REQUEST_NON_CURRENT_NATIVE_NAS_KEY_SET_IDENTIFIER_TYPE:
+            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
+            size = sizeof(ogs_nas_key_set_identifier_t);
+            i = 0;
+            break;
+        case OGS_NAS_5GS_REGISTRATION_REQUEST_5GMM_CAPABILITY_TYPE:
+            if (pkbuf->len < 1) {
+               ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+               return OGS_ERROR;
+            }
+            size = pkbuf->data[0] + 1;
+            if (sizeof(ogs_nas_5gmm_capability_t) < size) {
+               ogs_error("Too long [size:%d]", (int)size);
+               return OGS_ERROR;
+            }
+            i = 1;
+            break;
+        case OGS_NAS_5GS_REGISTRATION_REQUEST_UE_SECURITY_CAPABILITY_TYPE:
+            if (pkbuf->len < 1) {
+               ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+               return OGS_ERROR;
+            }
+            size = pkbuf->data[0] + 1;
+            if (sizeof(ogs_nas_ue_security_capability_t) < size) {
+               ogs_error("Too long [size:%d]", (int)size);
+               return OGS_ERROR;
+            }
+            i = 2;
+            break;
+        case OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_NSSAI_TYPE:
+            if (pkbuf->len < 1) {
+               ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+               return OGS_ERROR;
+            }
+            size = pkbuf->data[0] + 1;
+            if (sizeof(ogs_nas_nssai_t) < size) {
+               ogs_error("Too long [size:%d]", (int)size);
+               return OGS_ERROR;
+            }
+            i = 3;
+            break;
+        case OGS_NAS_5GS_REGISTRATION_REQUEST_LAST_VISITED_REGISTERED_TAI_TYPE:
+            size = sizeof(ogs_nas_5gs_tracking_area_identity_t);
+            i = 4;
+            break;
+        case OGS_NAS_5GS_REGISTRATION_REQUEST_S1_UE_NETWORK_CAPABILITY_TYPE:
+            if (pkbuf->len < 1) {
+               ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+               return OGS_ERROR;
+            }
+            size = pkbuf->data[0] + 1;
+            if (sizeof(ogs_nas_s1_ue_network_capability_t) < size) {
+               ogs_error("Too long [size:%d]", (int)size);
+               return OGS_ERROR;
+            }
+            i = 5;
+            break;
+        case OGS_NAS_5GS_REGISTRATION_REQUEST_UPLINK_DATA_STATUS_TYPE:
+            if (pkbuf->len < 1) {
+               ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+               return OGS_ERROR;
+            }
+            size = pkbuf->data[0] + 1;
+            if (sizeof(ogs_nas_uplink_data_status_t) < size) {
+               ogs_error("Too long [size:%d]", (int)size);
+               return OGS_ERROR;
+            }
+            i = 6;
+            break;
+        case OGS_NAS_5GS_REGISTRATION_REQUEST_PDU_SESSION_STATUS_TYPE:
+            if (pkbuf->len < 1) {
+               ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+               return OGS_ERROR;
+            }
+            size = pkbuf->data[0] + 1;
+            if (sizeof(ogs_nas_pdu_session_status_t) < size) {
+               ogs_error("Too long [size:%d]", (int)size);
+               return OGS_ERROR;
+            }
+            i = 7;
+            break;
+        case OGS_NAS_5GS_REGISTRATION_REQUEST_MICO_INDICATION_TYPE:
+            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
+            size = sizeof(ogs_nas_mico_indication_t);
+            i = 8;
+            break;
+        case OGS_NAS_5GS_REGISTRATION_REQUEST_UE_STATUS_TYPE:
+            if (pkbuf->len < 1) {
+               ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+               return OGS_ERROR;
+            }
+            size = pkbuf->data[0] + 1;
+            if (sizeof(ogs_nas_ue_status_t) < size) {
+               ogs_error("Too long [size:%d]", (int)size);
+               return OGS_ERROR;
+            }
+            i = 9;
+            break;
+        case OGS_NAS_5GS_REGISTRATION_REQUEST_ADDITIONAL_GUTI_TYPE:
+            if (pkbuf->len < 2) {
+               ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+               return OGS_ERROR;
+            }
+            size = ((pkbuf->data[0] << 8) | pkbuf->data[1]) + 2;
+            i = 10;
+            break;
+        case OGS_NAS_5GS_REGISTRATION_REQUEST_ALLOWED_PDU_SESSION_STATUS_TYPE:
+            if (pkbuf->len < 1) {
+               ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+               return OGS_ERROR;
+            }
+            size = pkbuf->data[0] + 1;
+            if (sizeof(ogs_nas_allowed_pdu_session_status_t) < size) {
+               ogs_error("Too long [size:%d]", (int)size);
+               return OGS_ERROR;
+            }
+            i = 11;
+            break;
+        case OGS_NAS_5GS_REGISTRATION_REQUEST_UE_USAGE_SETTING_TYPE:
+            if (pkbuf->len < 1) {
+               ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+               return OGS_ERROR;
+            }
+            size = pkbuf->data[0] + 1;
+            if (sizeof(ogs_nas_ue_usage_setting_t) < size) {
+               ogs_error("Too long [size:%d]", (int)size);
+               return OGS_ERROR;
+            }
+            i = 12;
+            break;
+        case OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_DRX_PARAMETERS_TYPE:
+            if (pkbuf->len < 1) {
+               ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+               return OGS_ERROR;
+            }
+            size = pkbuf->data[0] + 1;
+            if (sizeof(ogs_nas_5gs_drx_parameters_t) < size) {
+               ogs_error("Too long [size:%d]", (int)size);
+               return OGS_ERROR;
+            }
+            i = 13;
+            break;
+        case OGS_NAS_5GS_REGISTRATION_REQUEST_EPS_NAS_MESSAGE_CONTAINER_TYPE:
+            if (pkbuf->len < 2) {
+               ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+               return OGS_ERROR;
+            }
+            size = ((pkbuf->data[0] << 8) | pkbuf->data[1]) + 2;
+            i = 14;
+            break;
+        case OGS_NAS_5GS_REGISTRATION_REQUEST_LADN_INDICATION_TYPE:
+            if (pkbuf->len < 2) {
+               ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+               return OGS_ERROR;
+            }
+            size = ((pkbuf->data[0] << 8) | pkbuf->data[1]) + 2;
+            i = 15;
+            break;
+        case OGS_NAS_5GS_REGISTRATION_REQUEST_PAYLOAD_CONTAINER_TYPE_TYPE:
+            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
+            size = sizeof(ogs_nas_payload_container_type_t);
+            i = 16;
+            break;
+        case OGS_NAS_5GS_REGISTRATION_REQUEST_PAYLOAD_CONTAINER_TYPE:
+            if (pkbuf->len < 2) {
+               ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+               return OGS_ERROR;
+            }
+            size = ((pkbuf->data[0] << 8) | pkbuf->data[1]) + 2;
+            i = 17;
+            break;
+        case OGS_NAS_5GS_REGISTRATION_REQUEST_NETWORK_SLICING_INDICATION_TYPE:
+            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
+            size = sizeof(ogs_nas_network_slicing_indication_t);
+            i = 18;
+            break;
+        case OGS_NAS_5GS_REGISTRATION_REQUEST_5GS_UPDATE_TYPE_TYPE:
+            if (pkbuf->len < 1) {
+               ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+               return OGS_ERROR;
+            }
+            size = pkbuf->data[0] + 1;
+            if (sizeof(ogs_nas_5gs_update_type_t) < size) {
+               ogs_error("Too long [size:%d]", (int)size);
+               return OGS_ERROR;
+            }
+            i = 19;
+            break;
+        case OGS_NAS_5GS_REGISTRATION_REQUEST_MOBILE_STATION_CLASSMARK_2_TYPE:
+            if (pkbuf->len < 1) {
+               ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+               return OGS_ERROR;
+            }
+            size = pkbuf->data[0] + 1;
+            if (sizeof(ogs_nas_mobile_station_classmark_2_t) < size) {
+               ogs_error("Too long [size:%d]", (int)size);
+               return OGS_ERROR;
+            }
+            i = 20;
+            break;
+        case OGS_NAS_5GS_REGISTRATION_REQUEST_SUPPORTED_CODECS_TYPE:
+            if (pkbuf->len < 1) {
+               ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+               return OGS_ERROR;
+            }
+            size = pkbuf->data[0] + 1;
+            if (sizeof(ogs_nas_supported_codec_list_t) < size) {
+               ogs_error("Too long [size:%d]", (int)size);
+               return OGS_ERROR;
+            }
+            i = 21;
+            break;
+        case OGS_NAS_5GS_REGISTRATION_REQUEST_NAS_MESSAGE_CONTAINER_TYPE:
+            if (pkbuf->len < 2) {
+               ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+               return OGS_ERROR;
+            }
+            size = ((pkbuf->data[0] << 8) | pkbuf->data[1]) + 2;
+            i = 22;
+            break;
+        case OGS_NAS_5GS_REGISTRATION_REQUEST_EPS_BEARER_CONTEXT_STATUS_TYPE:
+            if (pkbuf->len < 1) {
+               ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+               return OGS_ERROR;
+            }
+            size = pkbuf->data[0] + 1;
+            if (sizeof(ogs_nas_eps_bearer_context_status_t) < size) {
+               ogs_error("Too long [size:%d]", (int)size);
+               return OGS_ERROR;
+            }
+            i = 23;
+            break;
+        case OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_EXTENDED_DRX_PARAMETERS_TYPE:
+            if (pkbuf->len < 1) {
+               ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+               return OGS_ERROR;
+            }
+            size = pkbuf->data[0] + 1;
+            if (sizeof(ogs_nas_extended_drx_parameters_t) < size) {
+               ogs_error("Too long [size:%d]", (int)size);
+               return OGS_ERROR;
+            }
+            i = 24;
+            break;
+        case OGS_NAS_5GS_REGISTRATION_REQUEST_T3324_VALUE_TYPE:
+            if (pkbuf->len < 1) {
+               ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+               return OGS_ERROR;
+            }
+            size = pkbuf->data[0] + 1;
+            if (sizeof(ogs_nas_gprs_timer_3_t) < size) {
+               ogs_error("Too long [size:%d]", (int)size);
+               return OGS_ERROR;
+            }
+            i = 25;
+            break;
+        case OGS_NAS_5GS_REGISTRATION_REQUEST_UE_RADIO_CAPABILITY_ID_TYPE:
+            if (pkbuf->len < 1) {
+               ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+               return OGS_ERROR;
+            }
+            size = pkbuf->data[0] + 1;
+            if (sizeof(ogs_nas_ue_radio_capability_id_t) < size) {
+               ogs_error("Too long [size:%d]", (int)size);
+               return OGS_ERROR;
+            }
+            i = 26;
+            break;
+        case OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_MAPPED_NSSAI_TYPE:
+            if (pkbuf->len < 1) {
+               ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+               return OGS_ERROR;
+            }
+            size = pkbuf->data[0] + 1;
+            if (sizeof(ogs_nas_mapped_nssai_t) < size) {
+               ogs_error("Too long [size:%d]", (int)size);
+               return OGS_ERROR;
+            }
+            i = 27;
+            break;
+        case OGS_NAS_5GS_REGISTRATION_REQUEST_ADDITIONAL_INFORMATION_REQUESTED_TYPE:
+            if (pkbuf->len < 1) {
+               ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+               return OGS_ERROR;
+            }
+            size = pkbuf->data[0] + 1;
+            if (sizeof(ogs_nas_additional_information_requested_t) < size) {
+               ogs_error("Too long [size:%d]", (int)size);
+               return OGS_ERROR;
+            }
+            i = 28;
+            break;
+        case OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_WUS_ASSISTANCE_INFORMATION_TYPE:
+            if (pkbuf->len < 1) {
+               ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+               return OGS_ERROR;
+            }
+            size = pkbuf->data[0] + 1;
+            if (sizeof(ogs_nas_wus_assistance_information_t) < size) {
+               ogs_error("Too long [size:%d]", (int)size);
+               return OGS_ERROR;
+            }
+            i = 29;
+            break;
+        case OGS_NAS_5GS_REGISTRATION_REQUEST_N5GC_INDICATION_TYPE:
+            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
+            size = sizeof(ogs_nas_n5gc_indication_t);
+            i = 30;
+            break;
+        case OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_NB_N1_MODE_DRX_PARAMETERS_TYPE:
+            if (pkbuf->len < 1) {
+               ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+               return OGS_ERROR;
+            }
+            size = pkbuf->data[0] + 1;
+            if (sizeof(ogs_nas_nb_n1_mode_drx_parameters_t) < size) {
+               ogs_error("Too long [size:%d]", (int)size);
+               return OGS_ERROR;
+            }
+            i = 31;
+            break;
+        case OGS_NAS_5GS_REGISTRATION_REQUEST_UE_REQUEST_TYPE_TYPE:
+            if (pkbuf->len < 1) {
+               ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+               return OGS_ERROR;
+            }
+            size = pkbuf->data[0] + 1;
+            if (sizeof(ogs_nas_ue_request_type_t) < size) {
+               ogs_error("Too long [size:%d]", (int)size);
+               return OGS_ERROR;
+            }
+            i = 32;
+            break;
+        case OGS_NAS_5GS_REGISTRATION_REQUEST_PAGING_RESTRICTION_TYPE:
+            if (pkbuf->len < 1) {
+               ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+               return OGS_ERROR;
+            }
+            size = pkbuf->data[0] + 1;
+            if (sizeof(ogs_nas_paging_restriction_t) < size) {
+               ogs_error("Too long [size:%d]", (int)size);
+               return OGS_ERROR;
+            }
+            i = 33;
+            break;
+        case OGS_NAS_5GS_REGISTRATION_REQUEST_SERVICE_LEVEL_AA_CONTAINER_TYPE:
+            if (pkbuf->len < 2) {
+               ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+               return OGS_ERROR;
+            }
+            size = ((pkbuf->data[0] << 8) | pkbuf->data[1]) + 2;
+            i = 34;
+            break;
+        case OGS_NAS_5GS_REGISTRATION_REQUEST_NID_TYPE:
+            if (pkbuf->len < 1) {
+               ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+               return OGS_ERROR;
+            }
+            size = pkbuf->data[0] + 1;
+            if (sizeof(ogs_nas_nid_t) < size) {
+               ogs_error("Too long [size:%d]", (int)size);
+               return OGS_ERROR;
+            }
+            i = 35;
+            break;
+        case OGS_NAS_5GS_REGISTRATION_REQUEST_MS_DETERMINED_PLMN_WITH_DISASTER_CONDITION_TYPE:
+            if (pkbuf->len < 1) {
+               ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+               return OGS_ERROR;
+            }
+            size = pkbuf->data[0] + 1;
+            if (sizeof(ogs_nas_plmn_identity_t) < size) {
+               ogs_error("Too long [size:%d]", (int)size);
+               return OGS_ERROR;
+            }
+            i = 36;
+            break;
+        case OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_PEIPS_ASSISTANCE_INFORMATION_TYPE:
+            if (pkbuf->len < 1) {
+               ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+               return OGS_ERROR;
+            }
+            size = pkbuf->data[0] + 1;
+            if (sizeof(ogs_nas_peips_assistance_information_t) < size) {
+               ogs_error("Too long [size:%d]", (int)size);
+               return OGS_ERROR;
+            }
+            i = 37;
+            break;
+        case OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_T3512_VALUE_TYPE:
+            if (pkbuf->len < 1) {
+               ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+               return OGS_ERROR;
+            }
+            size = pkbuf->data[0] + 1;
+            if (sizeof(ogs_nas_gprs_timer_3_t) < size) {
+               ogs_error("Too long [size:%d]", (int)size);
+               return OGS_ERROR;
+            }
+            i = 38;
+            break;
+        default:
+            ogs_error("Unknown type(0x%x) or not implemented\n", type);
+            continue;
+        }
+
+        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+           return OGS_ERROR;
+        }
+
+        /* From the start of the message */
+        lazy->offset[i] = pkbuf->data - size - data;
+        registration_request->presencemask |= (uint64_t)1 << i;
+    }
+
+    return OGS_OK;
+}
+
+int ogs_nas_5gs_decode_registration_request_lazy(
+        ogs_nas_5gs_registration_request_lazy_t *lazy, ogs_pkbuf_t *pkbuf)
+{
+    unsigned char *data = NULL;
+    int size = 0;
+    int rv;
+
+    ogs_assert(lazy);
+    ogs_assert(pkbuf);
+    ogs_assert(pkbuf->data);
+
+    ogs_trace("[NAS] Decode REGISTRATION_REQUEST lazily\n");
+
+    data = pkbuf->data;
+    size = sizeof(ogs_nas_5gmm_header_t);
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return OGS_ERROR;
+    }
+
+    memset(lazy, 0, sizeof(*lazy));
+    memcpy(&lazy->h, pkbuf->data - size, size);
+
+    if (lazy->h.message_type != OGS_NAS_5GS_REGISTRATION_REQUEST) {
+        ogs_error("Not REGISTRATION_REQUEST [0x%x]", lazy->h.message_type);
+        ogs_assert(ogs_pkbuf_push(pkbuf, size));
+        return OGS_ERROR;
+    }
+
+    rv = ogs_nas_5gs_locate_registration_request(lazy, pkbuf);
+    ogs_assert(ogs_pkbuf_push(pkbuf, pkbuf->data - data));
+    if (rv != OGS_OK)
+        return OGS_ERROR;
+
+    lazy->pkbuf = pkbuf;
+
+    return OGS_OK;
+}
+
+ogs_nas_key_set_identifier_t *ogs_nas_5gs_registration_request_non_current_native_nas_key_set_identifier(
+        ogs_nas_5gs_registration_request_lazy_t *lazy)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = NULL;
+    unsigned char *data = NULL;
+    int size = 0;
+
+    ogs_assert(lazy);
+    registration_request = &lazy->registration_request;
+
+    if (!(registration_request->presencemask & OGS_NAS_5GS_REGISTRATION_REQUEST_NON_CURRENT_NATIVE_NAS_KEY_SET_IDENTIFIER_PRESENT))
+        return NULL;
+    if (lazy->decodedmask & OGS_NAS_5GS_REGISTRATION_REQUEST_NON_CURRENT_NATIVE_NAS_KEY_SET_IDENTIFIER_PRESENT)
+        return &registration_request->non_current_native_nas_key_set_identifier;
+
+    ogs_assert(lazy->pkbuf);
+    data = lazy->pkbuf->data;
+    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[0]));
+    size = ogs_nas_5gs_decode_key_set_identifier(&registration_request->non_current_native_nas_key_set_identifier, lazy->pkbuf);
+    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_key_set_identifier() failed");
+        registration_request->presencemask &= ~OGS_NAS_5GS_REGISTRATION_REQUEST_NON_CURRENT_NATIVE_NAS_KEY_SET_IDENTIFIER_PRESENT;
+        return NULL;
+    }
+
+    lazy->decodedmask |= OGS_NAS_5GS_REGISTRATION_REQUEST_NON_CURRENT_NATIVE_NAS_KEY_SET_IDENTIFIER_PRESENT;
+
+    return &registration_request->non_current_native_nas_key_set_identifier;
+}
+
+ogs_nas_5gmm_capability_t *ogs_nas_5gs_registration_request_gmm_capability(
+        ogs_nas_5gs_registration_request_lazy_t *lazy)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = NULL;
+    unsigned char *data = NULL;
+    int size = 0;
+
+    ogs_assert(lazy);
+    registration_request = &lazy->registration_request;
+
+    if (!(registration_request->presencemask & OGS_NAS_5GS_REGISTRATION_REQUEST_5GMM_CAPABILITY_PRESENT))
+        return NULL;
+    if (lazy->decodedmask & OGS_NAS_5GS_REGISTRATION_REQUEST_5GMM_CAPABILITY_PRESENT)
+        return &registration_request->gmm_capability;
+
+    ogs_assert(lazy->pkbuf);
+    data = lazy->pkbuf->data;
+    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[1]));
+    size = ogs_nas_5gs_decode_5gmm_capability(&registration_request->gmm_capability, lazy->pkbuf);
+    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_5gmm_capability() failed");
+        registration_request->presencemask &= ~OGS_NAS_5GS_REGISTRATION_REQUEST_5GMM_CAPABILITY_PRESENT;
+        return NULL;
+    }
+
+    lazy->decodedmask |= OGS_NAS_5GS_REGISTRATION_REQUEST_5GMM_CAPABILITY_PRESENT;
+
+    return &registration_request->gmm_capability;
+}
+
+ogs_nas_ue_security_capability_t *ogs_nas_5gs_registration_request_ue_security_capability(
+        ogs_nas_5gs_registration_request_lazy_t *lazy)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = NULL;
+    unsigned char *data = NULL;
+    int size = 0;
+
+    ogs_assert(lazy);
+    registration_request = &lazy->registration_request;
+
+    if (!(registration_request->presencemask & OGS_NAS_5GS_REGISTRATION_REQUEST_UE_SECURITY_CAPABILITY_PRESENT))
+        return NULL;
+    if (lazy->decodedmask & OGS_NAS_5GS_REGISTRATION_REQUEST_UE_SECURITY_CAPABILITY_PRESENT)
+        return &registration_request->ue_security_capability;
+
+    ogs_assert(lazy->pkbuf);
+    data = lazy->pkbuf->data;
+    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[2]));
+    size = ogs_nas_5gs_decode_ue_security_capability(&registration_request->ue_security_capability, lazy->pkbuf);
+    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_ue_security_capability() failed");
+        registration_request->presencemask &= ~OGS_NAS_5GS_REGISTRATION_REQUEST_UE_SECURITY_CAPABILITY_PRESENT;
+        return NULL;
+    }
+
+    lazy->decodedmask |= OGS_NAS_5GS_REGISTRATION_REQUEST_UE_SECURITY_CAPABILITY_PRESENT;
+
+    return &registration_request->ue_security_capability;
+}
+
+ogs_nas_nssai_t *ogs_nas_5gs_registration_request_requested_nssai(
+        ogs_nas_5gs_registration_request_lazy_t *lazy)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = NULL;
+    unsigned char *data = NULL;
+    int size = 0;
+
+    ogs_assert(lazy);
+    registration_request = &lazy->registration_request;
+
+    if (!(registration_request->presencemask & OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_NSSAI_PRESENT))
+        return NULL;
+    if (lazy->decodedmask & OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_NSSAI_PRESENT)
+        return &registration_request->requested_nssai;
+
+    ogs_assert(lazy->pkbuf);
+    data = lazy->pkbuf->data;
+    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[3]));
+    size = ogs_nas_5gs_decode_nssai(&registration_request->requested_nssai, lazy->pkbuf);
+    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_nssai() failed");
+        registration_request->presencemask &= ~OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_NSSAI_PRESENT;
+        return NULL;
+    }
+
+    lazy->decodedmask |= OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_NSSAI_PRESENT;
+
+    return &registration_request->requested_nssai;
+}
+
+ogs_nas_5gs_tracking_area_identity_t *ogs_nas_5gs_registration_request_last_visited_registered_tai(
+        ogs_nas_5gs_registration_request_lazy_t *lazy)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = NULL;
+    unsigned char *data = NULL;
+    int size = 0;
+
+    ogs_assert(lazy);
+    registration_request = &lazy->registration_request;
+
+    if (!(registration_request->presencemask & OGS_NAS_5GS_REGISTRATION_REQUEST_LAST_VISITED_REGISTERED_TAI_PRESENT))
+        return NULL;
+    if (lazy->decodedmask & OGS_NAS_5GS_REGISTRATION_REQUEST_LAST_VISITED_REGISTERED_TAI_PRESENT)
+        return &registration_request->last_visited_registered_tai;
+
+    ogs_assert(lazy->pkbuf);
+    data = lazy->pkbuf->data;
+    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[4]));
+    size = ogs_nas_5gs_decode_5gs_tracking_area_identity(&registration_request->last_visited_registered_tai, lazy->pkbuf);
+    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_5gs_tracking_area_identity() failed");
+        registration_request->presencemask &= ~OGS_NAS_5GS_REGISTRATION_REQUEST_LAST_VISITED_REGISTERED_TAI_PRESENT;
+        return NULL;
+    }
+
+    lazy->decodedmask |= OGS_NAS_5GS_REGISTRATION_REQUEST_LAST_VISITED_REGISTERED_TAI_PRESENT;
+
+    return &registration_request->last_visited_registered_tai;
+}
+
+ogs_nas_s1_ue_network_capability_t *ogs_nas_5gs_registration_request_s1_ue_network_capability(
+        ogs_nas_5gs_registration_request_lazy_t *lazy)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = NULL;
+    unsigned char *data = NULL;
+    int size = 0;
+
+    ogs_assert(lazy);
+    registration_request = &lazy->registration_request;
+
+    if (!(registration_request->presencemask & OGS_NAS_5GS_REGISTRATION_REQUEST_S1_UE_NETWORK_CAPABILITY_PRESENT))
+        return NULL;
+    if (lazy->decodedmask & OGS_NAS_5GS_REGISTRATION_REQUEST_S1_UE_NETWORK_CAPABILITY_PRESENT)
+        return &registration_request->s1_ue_network_capability;
+
+    ogs_assert(lazy->pkbuf);
+    data = lazy->pkbuf->data;
+    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[5]));
+    size = ogs_nas_5gs_decode_s1_ue_network_capability(&registration_request->s1_ue_network_capability, lazy->pkbuf);
+    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_s1_ue_network_capability() failed");
+        registration_request->presencemask &= ~OGS_NAS_5GS_REGISTRATION_REQUEST_S1_UE_NETWORK_CAPABILITY_PRESENT;
+        return NULL;
+    }
+
+    lazy->decodedmask |= OGS_NAS_5GS_REGISTRATION_REQUEST_S1_UE_NETWORK_CAPABILITY_PRESENT;
+
+    return &registration_request->s1_ue_network_capability;
+}
+
+ogs_nas_uplink_data_status_t *ogs_nas_5gs_registration_request_uplink_data_status(
+        ogs_nas_5gs_registration_request_lazy_t *lazy)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = NULL;
+    unsigned char *data = NULL;
+    int size = 0;
+
+    ogs_assert(lazy);
+    registration_request = &lazy->registration_request;
+
+    if (!(registration_request->presencemask & OGS_NAS_5GS_REGISTRATION_REQUEST_UPLINK_DATA_STATUS_PRESENT))
+        return NULL;
+    if (lazy->decodedmask & OGS_NAS_5GS_REGISTRATION_REQUEST_UPLINK_DATA_STATUS_PRESENT)
+        return &registration_request->uplink_data_status;
+
+    ogs_assert(lazy->pkbuf);
+    data = lazy->pkbuf->data;
+    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[6]));
+    size = ogs_nas_5gs_decode_uplink_data_status(&registration_request->uplink_data_status, lazy->pkbuf);
+    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_uplink_data_status() failed");
+        registration_request->presencemask &= ~OGS_NAS_5GS_REGISTRATION_REQUEST_UPLINK_DATA_STATUS_PRESENT;
+        return NULL;
+    }
+
+    lazy->decodedmask |= OGS_NAS_5GS_REGISTRATION_REQUEST_UPLINK_DATA_STATUS_PRESENT;
+
+    return &registration_request->uplink_data_status;
+}
+
+ogs_nas_pdu_session_status_t *ogs_nas_5gs_registration_request_pdu_session_status(
+        ogs_nas_5gs_registration_request_lazy_t *lazy)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = NULL;
+    unsigned char *data = NULL;
+    int size = 0;
+
+    ogs_assert(lazy);
+    registration_request = &lazy->registration_request;
+
+    if (!(registration_request->presencemask & OGS_NAS_5GS_REGISTRATION_REQUEST_PDU_SESSION_STATUS_PRESENT))
+        return NULL;
+    if (lazy->decodedmask & OGS_NAS_5GS_REGISTRATION_REQUEST_PDU_SESSION_STATUS_PRESENT)
+        return &registration_request->pdu_session_status;
+
+    ogs_assert(lazy->pkbuf);
+    data = lazy->pkbuf->data;
+    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[7]));
+    size = ogs_nas_5gs_decode_pdu_session_status(&registration_request->pdu_session_status, lazy->pkbuf);
+    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_pdu_session_status() failed");
+        registration_request->presencemask &= ~OGS_NAS_5GS_REGISTRATION_REQUEST_PDU_SESSION_STATUS_PRESENT;
+        return NULL;
+    }
+
+    lazy->decodedmask |= OGS_NAS_5GS_REGISTRATION_REQUEST_PDU_SESSION_STATUS_PRESENT;
+
+    return &registration_request->pdu_session_status;
+}
+
+ogs_nas_mico_indication_t *ogs_nas_5gs_registration_request_mico_indication(
+        ogs_nas_5gs_registration_request_lazy_t *lazy)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = NULL;
+    unsigned char *data = NULL;
+    int size = 0;
+
+    ogs_assert(lazy);
+    registration_request = &lazy->registration_request;
+
+    if (!(registration_request->presencemask & OGS_NAS_5GS_REGISTRATION_REQUEST_MICO_INDICATION_PRESENT))
+        return NULL;
+    if (lazy->decodedmask & OGS_NAS_5GS_REGISTRATION_REQUEST_MICO_INDICATION_PRESENT)
+        return &registration_request->mico_indication;
+
+    ogs_assert(lazy->pkbuf);
+    data = lazy->pkbuf->data;
+    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[8]));
+    size = ogs_nas_5gs_decode_mico_indication(&registration_request->mico_indication, lazy->pkbuf);
+    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_mico_indication() failed");
+        registration_request->presencemask &= ~OGS_NAS_5GS_REGISTRATION_REQUEST_MICO_INDICATION_PRESENT;
+        return NULL;
+    }
+
+    lazy->decodedmask |= OGS_NAS_5GS_REGISTRATION_REQUEST_MICO_INDICATION_PRESENT;
+
+    return &registration_request->mico_indication;
+}
+
+ogs_nas_ue_status_t *ogs_nas_5gs_registration_request_ue_status(
+        ogs_nas_5gs_registration_request_lazy_t *lazy)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = NULL;
+    unsigned char *data = NULL;
+    int size = 0;
+
+    ogs_assert(lazy);
+    registration_request = &lazy->registration_request;
+
+    if (!(registration_request->presencemask & OGS_NAS_5GS_REGISTRATION_REQUEST_UE_STATUS_PRESENT))
+        return NULL;
+    if (lazy->decodedmask & OGS_NAS_5GS_REGISTRATION_REQUEST_UE_STATUS_PRESENT)
+        return &registration_request->ue_status;
+
+    ogs_assert(lazy->pkbuf);
+    data = lazy->pkbuf->data;
+    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[9]));
+    size = ogs_nas_5gs_decode_ue_status(&registration_request->ue_status, lazy->pkbuf);
+    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_ue_status() failed");
+        registration_request->presencemask &= ~OGS_NAS_5GS_REGISTRATION_REQUEST_UE_STATUS_PRESENT;
+        return NULL;
+    }
+
+    lazy->decodedmask |= OGS_NAS_5GS_REGISTRATION_REQUEST_UE_STATUS_PRESENT;
+
+    return &registration_request->ue_status;
+}
+
+ogs_nas_5gs_mobile_identity_t *ogs_nas_5gs_registration_request_additional_guti(
+        ogs_nas_5gs_registration_request_lazy_t *lazy)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = NULL;
+    unsigned char *data = NULL;
+    int size = 0;
+
+    ogs_assert(lazy);
+    registration_request = &lazy->registration_request;
+
+    if (!(registration_request->presencemask & OGS_NAS_5GS_REGISTRATION_REQUEST_ADDITIONAL_GUTI_PRESENT))
+        return NULL;
+    if (lazy->decodedmask & OGS_NAS_5GS_REGISTRATION_REQUEST_ADDITIONAL_GUTI_PRESENT)
+        return &registration_request->additional_guti;
+
+    ogs_assert(lazy->pkbuf);
+    data = lazy->pkbuf->data;
+    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[10]));
+    size = ogs_nas_5gs_decode_5gs_mobile_identity(&registration_request->additional_guti, lazy->pkbuf);
+    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_5gs_mobile_identity() failed");
+        registration_request->presencemask &= ~OGS_NAS_5GS_REGISTRATION_REQUEST_ADDITIONAL_GUTI_PRESENT;
+        return NULL;
+    }
+
+    lazy->decodedmask |= OGS_NAS_5GS_REGISTRATION_REQUEST_ADDITIONAL_GUTI_PRESENT;
+
+    return &registration_request->additional_guti;
+}
+
+ogs_nas_allowed_pdu_session_status_t *ogs_nas_5gs_registration_request_allowed_pdu_session_status(
+        ogs_nas_5gs_registration_request_lazy_t *lazy)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = NULL;
+    unsigned char *data = NULL;
+    int size = 0;
+
+    ogs_assert(lazy);
+    registration_request = &lazy->registration_request;
+
+    if (!(registration_request->presencemask & OGS_NAS_5GS_REGISTRATION_REQUEST_ALLOWED_PDU_SESSION_STATUS_PRESENT))
+        return NULL;
+    if (lazy->decodedmask & OGS_NAS_5GS_REGISTRATION_REQUEST_ALLOWED_PDU_SESSION_STATUS_PRESENT)
+        return &registration_request->allowed_pdu_session_status;
+
+    ogs_assert(lazy->pkbuf);
+    data = lazy->pkbuf->data;
+    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[11]));
+    size = ogs_nas_5gs_decode_allowed_pdu_session_status(&registration_request->allowed_pdu_session_status, lazy->pkbuf);
+    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_allowed_pdu_session_status() failed");
+        registration_request->presencemask &= ~OGS_NAS_5GS_REGISTRATION_REQUEST_ALLOWED_PDU_SESSION_STATUS_PRESENT;
+        return NULL;
+    }
+
+    lazy->decodedmask |= OGS_NAS_5GS_REGISTRATION_REQUEST_ALLOWED_PDU_SESSION_STATUS_PRESENT;
+
+    return &registration_request->allowed_pdu_session_status;
+}
+
+ogs_nas_ue_usage_setting_t *ogs_nas_5gs_registration_request_ue_usage_setting(
+        ogs_nas_5gs_registration_request_lazy_t *lazy)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = NULL;
+    unsigned char *data = NULL;
+    int size = 0;
+
+    ogs_assert(lazy);
+    registration_request = &lazy->registration_request;
+
+    if (!(registration_request->presencemask & OGS_NAS_5GS_REGISTRATION_REQUEST_UE_USAGE_SETTING_PRESENT))
+        return NULL;
+    if (lazy->decodedmask & OGS_NAS_5GS_REGISTRATION_REQUEST_UE_USAGE_SETTING_PRESENT)
+        return &registration_request->ue_usage_setting;
+
+    ogs_assert(lazy->pkbuf);
+    data = lazy->pkbuf->data;
+    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[12]));
+    size = ogs_nas_5gs_decode_ue_usage_setting(&registration_request->ue_usage_setting, lazy->pkbuf);
+    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_ue_usage_setting() failed");
+        registration_request->presencemask &= ~OGS_NAS_5GS_REGISTRATION_REQUEST_UE_USAGE_SETTING_PRESENT;
+        return NULL;
+    }
+
+    lazy->decodedmask |= OGS_NAS_5GS_REGISTRATION_REQUEST_UE_USAGE_SETTING_PRESENT;
+
+    return &registration_request->ue_usage_setting;
+}
+
+ogs_nas_5gs_drx_parameters_t *ogs_nas_5gs_registration_request_requested_drx_parameters(
+        ogs_nas_5gs_registration_request_lazy_t *lazy)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = NULL;
+    unsigned char *data = NULL;
+    int size = 0;
+
+    ogs_assert(lazy);
+    registration_request = &lazy->registration_request;
+
+    if (!(registration_request->presencemask & OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_DRX_PARAMETERS_PRESENT))
+        return NULL;
+    if (lazy->decodedmask & OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_DRX_PARAMETERS_PRESENT)
+        return &registration_request->requested_drx_parameters;
+
+    ogs_assert(lazy->pkbuf);
+    data = lazy->pkbuf->data;
+    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[13]));
+    size = ogs_nas_5gs_decode_5gs_drx_parameters(&registration_request->requested_drx_parameters, lazy->pkbuf);
+    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_5gs_drx_parameters() failed");
+        registration_request->presencemask &= ~OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_DRX_PARAMETERS_PRESENT;
+        return NULL;
+    }
+
+    lazy->decodedmask |= OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_DRX_PARAMETERS_PRESENT;
+
+    return &registration_request->requested_drx_parameters;
+}
+
+ogs_nas_eps_nas_message_container_t *ogs_nas_5gs_registration_request_eps_nas_message_container(
+        ogs_nas_5gs_registration_request_lazy_t *lazy)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = NULL;
+    unsigned char *data = NULL;
+    int size = 0;
+
+    ogs_assert(lazy);
+    registration_request = &lazy->registration_request;
+
+    if (!(registration_request->presencemask & OGS_NAS_5GS_REGISTRATION_REQUEST_EPS_NAS_MESSAGE_CONTAINER_PRESENT))
+        return NULL;
+    if (lazy->decodedmask & OGS_NAS_5GS_REGISTRATION_REQUEST_EPS_NAS_MESSAGE_CONTAINER_PRESENT)
+        return &registration_request->eps_nas_message_container;
+
+    ogs_assert(lazy->pkbuf);
+    data = lazy->pkbuf->data;
+    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[14]));
+    size = ogs_nas_5gs_decode_eps_nas_message_container(&registration_request->eps_nas_message_container, lazy->pkbuf);
+    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_eps_nas_message_container() failed");
+        registration_request->presencemask &= ~OGS_NAS_5GS_REGISTRATION_REQUEST_EPS_NAS_MESSAGE_CONTAINER_PRESENT;
+        return NULL;
+    }
+
+    lazy->decodedmask |= OGS_NAS_5GS_REGISTRATION_REQUEST_EPS_NAS_MESSAGE_CONTAINER_PRESENT;
+
+    return &registration_request->eps_nas_message_container;
+}
+
+ogs_nas_ladn_indication_t *ogs_nas_5gs_registration_request_ladn_indication(
+        ogs_nas_5gs_registration_request_lazy_t *lazy)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = NULL;
+    unsigned char *data = NULL;
+    int size = 0;
+
+    ogs_assert(lazy);
+    registration_request = &lazy->registration_request;
+
+    if (!(registration_request->presencemask & OGS_NAS_5GS_REGISTRATION_REQUEST_LADN_INDICATION_PRESENT))
+        return NULL;
+    if (lazy->decodedmask & OGS_NAS_5GS_REGISTRATION_REQUEST_LADN_INDICATION_PRESENT)
+        return &registration_request->ladn_indication;
+
+    ogs_assert(lazy->pkbuf);
+    data = lazy->pkbuf->data;
+    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[15]));
+    size = ogs_nas_5gs_decode_ladn_indication(&registration_request->ladn_indication, lazy->pkbuf);
+    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_ladn_indication() failed");
+        registration_request->presencemask &= ~OGS_NAS_5GS_REGISTRATION_REQUEST_LADN_INDICATION_PRESENT;
+        return NULL;
+    }
+
+    lazy->decodedmask |= OGS_NAS_5GS_REGISTRATION_REQUEST_LADN_INDICATION_PRESENT;
+
+    return &registration_request->ladn_indication;
+}
+
+ogs_nas_payload_container_type_t *ogs_nas_5gs_registration_request_payload_container_type(
+        ogs_nas_5gs_registration_request_lazy_t *lazy)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = NULL;
+    unsigned char *data = NULL;
+    int size = 0;
+
+    ogs_assert(lazy);
+    registration_request = &lazy->registration_request;
+
+    if (!(registration_request->presencemask & OGS_NAS_5GS_REGISTRATION_REQUEST_PAYLOAD_CONTAINER_TYPE_PRESENT))
+        return NULL;
+    if (lazy->decodedmask & OGS_NAS_5GS_REGISTRATION_REQUEST_PAYLOAD_CONTAINER_TYPE_PRESENT)
+        return &registration_request->payload_container_type;
+
+    ogs_assert(lazy->pkbuf);
+    data = lazy->pkbuf->data;
+    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[16]));
+    size = ogs_nas_5gs_decode_payload_container_type(&registration_request->payload_container_type, lazy->pkbuf);
+    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_payload_container_type() failed");
+        registration_request->presencemask &= ~OGS_NAS_5GS_REGISTRATION_REQUEST_PAYLOAD_CONTAINER_TYPE_PRESENT;
+        return NULL;
+    }
+
+    lazy->decodedmask |= OGS_NAS_5GS_REGISTRATION_REQUEST_PAYLOAD_CONTAINER_TYPE_PRESENT;
+
+    return &registration_request->payload_container_type;
+}
+
+ogs_nas_payload_container_t *ogs_nas_5gs_registration_request_payload_container(
+        ogs_nas_5gs_registration_request_lazy_t *lazy)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = NULL;
+    unsigned char *data = NULL;
+    int size = 0;
+
+    ogs_assert(lazy);
+    registration_request = &lazy->registration_request;
+
+    if (!(registration_request->presencemask & OGS_NAS_5GS_REGISTRATION_REQUEST_PAYLOAD_CONTAINER_PRESENT))
+        return NULL;
+    if (lazy->decodedmask & OGS_NAS_5GS_REGISTRATION_REQUEST_PAYLOAD_CONTAINER_PRESENT)
+        return &registration_request->payload_container;
+
+    ogs_assert(lazy->pkbuf);
+    data = lazy->pkbuf->data;
+    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[17]));
+    size = ogs_nas_5gs_decode_payload_container(&registration_request->payload_container, lazy->pkbuf);
+    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_payload_container() failed");
+        registration_request->presencemask &= ~OGS_NAS_5GS_REGISTRATION_REQUEST_PAYLOAD_CONTAINER_PRESENT;
+        return NULL;
+    }
+
+    lazy->decodedmask |= OGS_NAS_5GS_REGISTRATION_REQUEST_PAYLOAD_CONTAINER_PRESENT;
+
+    return &registration_request->payload_container;
+}
+
+ogs_nas_network_slicing_indication_t *ogs_nas_5gs_registration_request_network_slicing_indication(
+        ogs_nas_5gs_registration_request_lazy_t *lazy)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = NULL;
+    unsigned char *data = NULL;
+    int size = 0;
+
+    ogs_assert(lazy);
+    registration_request = &lazy->registration_request;
+
+    if (!(registration_request->presencemask & OGS_NAS_5GS_REGISTRATION_REQUEST_NETWORK_SLICING_INDICATION_PRESENT))
+        return NULL;
+    if (lazy->decodedmask & OGS_NAS_5GS_REGISTRATION_REQUEST_NETWORK_SLICING_INDICATION_PRESENT)
+        return &registration_request->network_slicing_indication;
+
+    ogs_assert(lazy->pkbuf);
+    data = lazy->pkbuf->data;
+    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[18]));
+    size = ogs_nas_5gs_decode_network_slicing_indication(&registration_request->network_slicing_indication, lazy->pkbuf);
+    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_network_slicing_indication() failed");
+        registration_request->presencemask &= ~OGS_NAS_5GS_REGISTRATION_REQUEST_NETWORK_SLICING_INDICATION_PRESENT;
+        return NULL;
+    }
+
+    lazy->decodedmask |= OGS_NAS_5GS_REGISTRATION_REQUEST_NETWORK_SLICING_INDICATION_PRESENT;
+
+    return &registration_request->network_slicing_indication;
+}
+
+ogs_nas_5gs_update_type_t *ogs_nas_5gs_registration_request_update_type(
+        ogs_nas_5gs_registration_request_lazy_t *lazy)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = NULL;
+    unsigned char *data = NULL;
+    int size = 0;
+
+    ogs_assert(lazy);
+    registration_request = &lazy->registration_request;
+
+    if (!(registration_request->presencemask & OGS_NAS_5GS_REGISTRATION_REQUEST_5GS_UPDATE_TYPE_PRESENT))
+        return NULL;
+    if (lazy->decodedmask & OGS_NAS_5GS_REGISTRATION_REQUEST_5GS_UPDATE_TYPE_PRESENT)
+        return &registration_request->update_type;
+
+    ogs_assert(lazy->pkbuf);
+    data = lazy->pkbuf->data;
+    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[19]));
+    size = ogs_nas_5gs_decode_5gs_update_type(&registration_request->update_type, lazy->pkbuf);
+    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_5gs_update_type() failed");
+        registration_request->presencemask &= ~OGS_NAS_5GS_REGISTRATION_REQUEST_5GS_UPDATE_TYPE_PRESENT;
+        return NULL;
+    }
+
+    lazy->decodedmask |= OGS_NAS_5GS_REGISTRATION_REQUEST_5GS_UPDATE_TYPE_PRESENT;
+
+    return &registration_request->update_type;
+}
+
+ogs_nas_mobile_station_classmark_2_t *ogs_nas_5gs_registration_request_mobile_station_classmark_2(
+        ogs_nas_5gs_registration_request_lazy_t *lazy)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = NULL;
+    unsigned char *data = NULL;
+    int size = 0;
+
+    ogs_assert(lazy);
+    registration_request = &lazy->registration_request;
+
+    if (!(registration_request->presencemask & OGS_NAS_5GS_REGISTRATION_REQUEST_MOBILE_STATION_CLASSMARK_2_PRESENT))
+        return NULL;
+    if (lazy->decodedmask & OGS_NAS_5GS_REGISTRATION_REQUEST_MOBILE_STATION_CLASSMARK_2_PRESENT)
+        return &registration_request->mobile_station_classmark_2;
+
+    ogs_assert(lazy->pkbuf);
+    data = lazy->pkbuf->data;
+    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[20]));
+    size = ogs_nas_5gs_decode_mobile_station_classmark_2(&registration_request->mobile_station_classmark_2, lazy->pkbuf);
+    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_mobile_station_classmark_2() failed");
+        registration_request->presencemask &= ~OGS_NAS_5GS_REGISTRATION_REQUEST_MOBILE_STATION_CLASSMARK_2_PRESENT;
+        return NULL;
+    }
+
+    lazy->decodedmask |= OGS_NAS_5GS_REGISTRATION_REQUEST_MOBILE_STATION_CLASSMARK_2_PRESENT;
+
+    return &registration_request->mobile_station_classmark_2;
+}
+
+ogs_nas_supported_codec_list_t *ogs_nas_5gs_registration_request_supported_codecs(
+        ogs_nas_5gs_registration_request_lazy_t *lazy)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = NULL;
+    unsigned char *data = NULL;
+    int size = 0;
+
+    ogs_assert(lazy);
+    registration_request = &lazy->registration_request;
+
+    if (!(registration_request->presencemask & OGS_NAS_5GS_REGISTRATION_REQUEST_SUPPORTED_CODECS_PRESENT))
+        return NULL;
+    if (lazy->decodedmask & OGS_NAS_5GS_REGISTRATION_REQUEST_SUPPORTED_CODECS_PRESENT)
+        return &registration_request->supported_codecs;
+
+    ogs_assert(lazy->pkbuf);
+    data = lazy->pkbuf->data;
+    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[21]));
+    size = ogs_nas_5gs_decode_supported_codec_list(&registration_request->supported_codecs, lazy->pkbuf);
+    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_supported_codec_list() failed");
+        registration_request->presencemask &= ~OGS_NAS_5GS_REGISTRATION_REQUEST_SUPPORTED_CODECS_PRESENT;
+        return NULL;
+    }
+
+    lazy->decodedmask |= OGS_NAS_5GS_REGISTRATION_REQUEST_SUPPORTED_CODECS_PRESENT;
+
+    return &registration_request->supported_codecs;
+}
+
+ogs_nas_message_container_t *ogs_nas_5gs_registration_request_nas_message_container(
+        ogs_nas_5gs_registration_request_lazy_t *lazy)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = NULL;
+    unsigned char *data = NULL;
+    int size = 0;
+
+    ogs_assert(lazy);
+    registration_request = &lazy->registration_request;
+
+    if (!(registration_request->presencemask & OGS_NAS_5GS_REGISTRATION_REQUEST_NAS_MESSAGE_CONTAINER_PRESENT))
+        return NULL;
+    if (lazy->decodedmask & OGS_NAS_5GS_REGISTRATION_REQUEST_NAS_MESSAGE_CONTAINER_PRESENT)
+        return &registration_request->nas_message_container;
+
+    ogs_assert(lazy->pkbuf);
+    data = lazy->pkbuf->data;
+    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[22]));
+    size = ogs_nas_5gs_decode_message_container(&registration_request->nas_message_container, lazy->pkbuf);
+    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_message_container() failed");
+        registration_request->presencemask &= ~OGS_NAS_5GS_REGISTRATION_REQUEST_NAS_MESSAGE_CONTAINER_PRESENT;
+        return NULL;
+    }
+
+    lazy->decodedmask |= OGS_NAS_5GS_REGISTRATION_REQUEST_NAS_MESSAGE_CONTAINER_PRESENT;
+
+    return &registration_request->nas_message_container;
+}
+
+ogs_nas_eps_bearer_context_status_t *ogs_nas_5gs_registration_request_eps_bearer_context_status(
+        ogs_nas_5gs_registration_request_lazy_t *lazy)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = NULL;
+    unsigned char *data = NULL;
+    int size = 0;
+
+    ogs_assert(lazy);
+    registration_request = &lazy->registration_request;
+
+    if (!(registration_request->presencemask & OGS_NAS_5GS_REGISTRATION_REQUEST_EPS_BEARER_CONTEXT_STATUS_PRESENT))
+        return NULL;
+    if (lazy->decodedmask & OGS_NAS_5GS_REGISTRATION_REQUEST_EPS_BEARER_CONTEXT_STATUS_PRESENT)
+        return &registration_request->eps_bearer_context_status;
+
+    ogs_assert(lazy->pkbuf);
+    data = lazy->pkbuf->data;
+    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[23]));
+    size = ogs_nas_5gs_decode_eps_bearer_context_status(&registration_request->eps_bearer_context_status, lazy->pkbuf);
+    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_eps_bearer_context_status() failed");
+        registration_request->presencemask &= ~OGS_NAS_5GS_REGISTRATION_REQUEST_EPS_BEARER_CONTEXT_STATUS_PRESENT;
+        return NULL;
+    }
+
+    lazy->decodedmask |= OGS_NAS_5GS_REGISTRATION_REQUEST_EPS_BEARER_CONTEXT_STATUS_PRESENT;
+
+    return &registration_request->eps_bearer_context_status;
+}
+
+ogs_nas_extended_drx_parameters_t *ogs_nas_5gs_registration_request_requested_extended_drx_parameters(
+        ogs_nas_5gs_registration_request_lazy_t *lazy)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = NULL;
+    unsigned char *data = NULL;
+    int size = 0;
+
+    ogs_assert(lazy);
+    registration_request = &lazy->registration_request;
+
+    if (!(registration_request->presencemask & OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_EXTENDED_DRX_PARAMETERS_PRESENT))
+        return NULL;
+    if (lazy->decodedmask & OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_EXTENDED_DRX_PARAMETERS_PRESENT)
+        return &registration_request->requested_extended_drx_parameters;
+
+    ogs_assert(lazy->pkbuf);
+    data = lazy->pkbuf->data;
+    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[24]));
+    size = ogs_nas_5gs_decode_extended_drx_parameters(&registration_request->requested_extended_drx_parameters, lazy->pkbuf);
+    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_extended_drx_parameters() failed");
+        registration_request->presencemask &= ~OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_EXTENDED_DRX_PARAMETERS_PRESENT;
+        return NULL;
+    }
+
+    lazy->decodedmask |= OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_EXTENDED_DRX_PARAMETERS_PRESENT;
+
+    return &registration_request->requested_extended_drx_parameters;
+}
+
+ogs_nas_gprs_timer_3_t *ogs_nas_5gs_registration_request_t3324_value(
+        ogs_nas_5gs_registration_request_lazy_t *lazy)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = NULL;
+    unsigned char *data = NULL;
+    int size = 0;
+
+    ogs_assert(lazy);
+    registration_request = &lazy->registration_request;
+
+    if (!(registration_request->presencemask & OGS_NAS_5GS_REGISTRATION_REQUEST_T3324_VALUE_PRESENT))
+        return NULL;
+    if (lazy->decodedmask & OGS_NAS_5GS_REGISTRATION_REQUEST_T3324_VALUE_PRESENT)
+        return &registration_request->t3324_value;
+
+    ogs_assert(lazy->pkbuf);
+    data = lazy->pkbuf->data;
+    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[25]));
+    size = ogs_nas_5gs_decode_gprs_timer_3(&registration_request->t3324_value, lazy->pkbuf);
+    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_gprs_timer_3() failed");
+        registration_request->presencemask &= ~OGS_NAS_5GS_REGISTRATION_REQUEST_T3324_VALUE_PRESENT;
+        return NULL;
+    }
+
+    lazy->decodedmask |= OGS_NAS_5GS_REGISTRATION_REQUEST_T3324_VALUE_PRESENT;
+
+    return &registration_request->t3324_value;
+}
+
+ogs_nas_ue_radio_capability_id_t *ogs_nas_5gs_registration_request_ue_radio_capability_id(
+        ogs_nas_5gs_registration_request_lazy_t *lazy)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = NULL;
+    unsigned char *data = NULL;
+    int size = 0;
+
+    ogs_assert(lazy);
+    registration_request = &lazy->registration_request;
+
+    if (!(registration_request->presencemask & OGS_NAS_5GS_REGISTRATION_REQUEST_UE_RADIO_CAPABILITY_ID_PRESENT))
+        return NULL;
+    if (lazy->decodedmask & OGS_NAS_5GS_REGISTRATION_REQUEST_UE_RADIO_CAPABILITY_ID_PRESENT)
+        return &registration_request->ue_radio_capability_id;
+
+    ogs_assert(lazy->pkbuf);
+    data = lazy->pkbuf->data;
+    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[26]));
+    size = ogs_nas_5gs_decode_ue_radio_capability_id(&registration_request->ue_radio_capability_id, lazy->pkbuf);
+    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_ue_radio_capability_id() failed");
+        registration_request->presencemask &= ~OGS_NAS_5GS_REGISTRATION_REQUEST_UE_RADIO_CAPABILITY_ID_PRESENT;
+        return NULL;
+    }
+
+    lazy->decodedmask |= OGS_NAS_5GS_REGISTRATION_REQUEST_UE_RADIO_CAPABILITY_ID_PRESENT;
+
+    return &registration_request->ue_radio_capability_id;
+}
+
+ogs_nas_mapped_nssai_t *ogs_nas_5gs_registration_request_requested_mapped_nssai(
+        ogs_nas_5gs_registration_request_lazy_t *lazy)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = NULL;
+    unsigned char *data = NULL;
+    int size = 0;
+
+    ogs_assert(lazy);
+    registration_request = &lazy->registration_request;
+
+    if (!(registration_request->presencemask & OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_MAPPED_NSSAI_PRESENT))
+        return NULL;
+    if (lazy->decodedmask & OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_MAPPED_NSSAI_PRESENT)
+        return &registration_request->requested_mapped_nssai;
+
+    ogs_assert(lazy->pkbuf);
+    data = lazy->pkbuf->data;
+    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[27]));
+    size = ogs_nas_5gs_decode_mapped_nssai(&registration_request->requested_mapped_nssai, lazy->pkbuf);
+    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_mapped_nssai() failed");
+        registration_request->presencemask &= ~OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_MAPPED_NSSAI_PRESENT;
+        return NULL;
+    }
+
+    lazy->decodedmask |= OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_MAPPED_NSSAI_PRESENT;
+
+    return &registration_request->requested_mapped_nssai;
+}
+
+ogs_nas_additional_information_requested_t *ogs_nas_5gs_registration_request_additional_information_requested(
+        ogs_nas_5gs_registration_request_lazy_t *lazy)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = NULL;
+    unsigned char *data = NULL;
+    int size = 0;
+
+    ogs_assert(lazy);
+    registration_request = &lazy->registration_request;
+
+    if (!(registration_request->presencemask & OGS_NAS_5GS_REGISTRATION_REQUEST_ADDITIONAL_INFORMATION_REQUESTED_PRESENT))
+        return NULL;
+    if (lazy->decodedmask & OGS_NAS_5GS_REGISTRATION_REQUEST_ADDITIONAL_INFORMATION_REQUESTED_PRESENT)
+        return &registration_request->additional_information_requested;
+
+    ogs_assert(lazy->pkbuf);
+    data = lazy->pkbuf->data;
+    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[28]));
+    size = ogs_nas_5gs_decode_additional_information_requested(&registration_request->additional_information_requested, lazy->pkbuf);
+    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_additional_information_requested() failed");
+        registration_request->presencemask &= ~OGS_NAS_5GS_REGISTRATION_REQUEST_ADDITIONAL_INFORMATION_REQUESTED_PRESENT;
+        return NULL;
+    }
+
+    lazy->decodedmask |= OGS_NAS_5GS_REGISTRATION_REQUEST_ADDITIONAL_INFORMATION_REQUESTED_PRESENT;
+
+    return &registration_request->additional_information_requested;
+}
+
+ogs_nas_wus_assistance_information_t *ogs_nas_5gs_registration_request_requested_wus_assistance_information(
+        ogs_nas_5gs_registration_request_lazy_t *lazy)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = NULL;
+    unsigned char *data = NULL;
+    int size = 0;
+
+    ogs_assert(lazy);
+    registration_request = &lazy->registration_request;
+
+    if (!(registration_request->presencemask & OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_WUS_ASSISTANCE_INFORMATION_PRESENT))
+        return NULL;
+    if (lazy->decodedmask & OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_WUS_ASSISTANCE_INFORMATION_PRESENT)
+        return &registration_request->requested_wus_assistance_information;
+
+    ogs_assert(lazy->pkbuf);
+    data = lazy->pkbuf->data;
+    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[29]));
+    size = ogs_nas_5gs_decode_wus_assistance_information(&registration_request->requested_wus_assistance_information, lazy->pkbuf);
+    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_wus_assistance_information() failed");
+        registration_request->presencemask &= ~OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_WUS_ASSISTANCE_INFORMATION_PRESENT;
+        return NULL;
+    }
+
+    lazy->decodedmask |= OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_WUS_ASSISTANCE_INFORMATION_PRESENT;
+
+    return &registration_request->requested_wus_assistance_information;
+}
+
+ogs_nas_n5gc_indication_t *ogs_nas_5gs_registration_request_n5gc_indication(
+        ogs_nas_5gs_registration_request_lazy_t *lazy)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = NULL;
+    unsigned char *data = NULL;
+    int size = 0;
+
+    ogs_assert(lazy);
+    registration_request = &lazy->registration_request;
+
+    if (!(registration_request->presencemask & OGS_NAS_5GS_REGISTRATION_REQUEST_N5GC_INDICATION_PRESENT))
+        return NULL;
+    if (lazy->decodedmask & OGS_NAS_5GS_REGISTRATION_REQUEST_N5GC_INDICATION_PRESENT)
+        return &registration_request->n5gc_indication;
+
+    ogs_assert(lazy->pkbuf);
+    data = lazy->pkbuf->data;
+    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[30]));
+    size = ogs_nas_5gs_decode_n5gc_indication(&registration_request->n5gc_indication, lazy->pkbuf);
+    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_n5gc_indication() failed");
+        registration_request->presencemask &= ~OGS_NAS_5GS_REGISTRATION_REQUEST_N5GC_INDICATION_PRESENT;
+        return NULL;
+    }
+
+    lazy->decodedmask |= OGS_NAS_5GS_REGISTRATION_REQUEST_N5GC_INDICATION_PRESENT;
+
+    return &registration_request->n5gc_indication;
+}
+
+ogs_nas_nb_n1_mode_drx_parameters_t *ogs_nas_5gs_registration_request_requested_nb_n1_mode_drx_parameters(
+        ogs_nas_5gs_registration_request_lazy_t *lazy)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = NULL;
+    unsigned char *data = NULL;
+    int size = 0;
+
+    ogs_assert(lazy);
+    registration_request = &lazy->registration_request;
+
+    if (!(registration_request->presencemask & OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_NB_N1_MODE_DRX_PARAMETERS_PRESENT))
+        return NULL;
+    if (lazy->decodedmask & OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_NB_N1_MODE_DRX_PARAMETERS_PRESENT)
+        return &registration_request->requested_nb_n1_mode_drx_parameters;
+
+    ogs_assert(lazy->pkbuf);
+    data = lazy->pkbuf->data;
+    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[31]));
+    size = ogs_nas_5gs_decode_nb_n1_mode_drx_parameters(&registration_request->requested_nb_n1_mode_drx_parameters, lazy->pkbuf);
+    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_nb_n1_mode_drx_parameters() failed");
+        registration_request->presencemask &= ~OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_NB_N1_MODE_DRX_PARAMETERS_PRESENT;
+        return NULL;
+    }
+
+    lazy->decodedmask |= OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_NB_N1_MODE_DRX_PARAMETERS_PRESENT;
+
+    return &registration_request->requested_nb_n1_mode_drx_parameters;
+}
+
+ogs_nas_ue_request_type_t *ogs_nas_5gs_registration_request_ue_request_type(
+        ogs_nas_5gs_registration_request_lazy_t *lazy)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = NULL;
+    unsigned char *data = NULL;
+    int size = 0;
+
+    ogs_assert(lazy);
+    registration_request = &lazy->registration_request;
+
+    if (!(registration_request->presencemask & OGS_NAS_5GS_REGISTRATION_REQUEST_UE_REQUEST_TYPE_PRESENT))
+        return NULL;
+    if (lazy->decodedmask & OGS_NAS_5GS_REGISTRATION_REQUEST_UE_REQUEST_TYPE_PRESENT)
+        return &registration_request->ue_request_type;
+
+    ogs_assert(lazy->pkbuf);
+    data = lazy->pkbuf->data;
+    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[32]));
+    size = ogs_nas_5gs_decode_ue_request_type(&registration_request->ue_request_type, lazy->pkbuf);
+    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_ue_request_type() failed");
+        registration_request->presencemask &= ~OGS_NAS_5GS_REGISTRATION_REQUEST_UE_REQUEST_TYPE_PRESENT;
+        return NULL;
+    }
+
+    lazy->decodedmask |= OGS_NAS_5GS_REGISTRATION_REQUEST_UE_REQUEST_TYPE_PRESENT;
+
+    return &registration_request->ue_request_type;
+}
+
+ogs_nas_paging_restriction_t *ogs_nas_5gs_registration_request_paging_restriction(
+        ogs_nas_5gs_registration_request_lazy_t *lazy)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = NULL;
+    unsigned char *data = NULL;
+    int size = 0;
+
+    ogs_assert(lazy);
+    registration_request = &lazy->registration_request;
+
+    if (!(registration_request->presencemask & OGS_NAS_5GS_REGISTRATION_REQUEST_PAGING_RESTRICTION_PRESENT))
+        return NULL;
+    if (lazy->decodedmask & OGS_NAS_5GS_REGISTRATION_REQUEST_PAGING_RESTRICTION_PRESENT)
+        return &registration_request->paging_restriction;
+
+    ogs_assert(lazy->pkbuf);
+    data = lazy->pkbuf->data;
+    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[33]));
+    size = ogs_nas_5gs_decode_paging_restriction(&registration_request->paging_restriction, lazy->pkbuf);
+    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_paging_restriction() failed");
+        registration_request->presencemask &= ~OGS_NAS_5GS_REGISTRATION_REQUEST_PAGING_RESTRICTION_PRESENT;
+        return NULL;
+    }
+
+    lazy->decodedmask |= OGS_NAS_5GS_REGISTRATION_REQUEST_PAGING_RESTRICTION_PRESENT;
+
+    return &registration_request->paging_restriction;
+}
+
+ogs_nas_service_level_aa_container_t *ogs_nas_5gs_registration_request_service_level_aa_container(
+        ogs_nas_5gs_registration_request_lazy_t *lazy)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = NULL;
+    unsigned char *data = NULL;
+    int size = 0;
+
+    ogs_assert(lazy);
+    registration_request = &lazy->registration_request;
+
+    if (!(registration_request->presencemask & OGS_NAS_5GS_REGISTRATION_REQUEST_SERVICE_LEVEL_AA_CONTAINER_PRESENT))
+        return NULL;
+    if (lazy->decodedmask & OGS_NAS_5GS_REGISTRATION_REQUEST_SERVICE_LEVEL_AA_CONTAINER_PRESENT)
+        return &registration_request->service_level_aa_container;
+
+    ogs_assert(lazy->pkbuf);
+    data = lazy->pkbuf->data;
+    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[34]));
+    size = ogs_nas_5gs_decode_service_level_aa_container(&registration_request->service_level_aa_container, lazy->pkbuf);
+    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_service_level_aa_container() failed");
+        registration_request->presencemask &= ~OGS_NAS_5GS_REGISTRATION_REQUEST_SERVICE_LEVEL_AA_CONTAINER_PRESENT;
+        return NULL;
+    }
+
+    lazy->decodedmask |= OGS_NAS_5GS_REGISTRATION_REQUEST_SERVICE_LEVEL_AA_CONTAINER_PRESENT;
+
+    return &registration_request->service_level_aa_container;
+}
+
+ogs_nas_nid_t *ogs_nas_5gs_registration_request_nid(
+        ogs_nas_5gs_registration_request_lazy_t *lazy)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = NULL;
+    unsigned char *data = NULL;
+    int size = 0;
+
+    ogs_assert(lazy);
+    registration_request = &lazy->registration_request;
+
+    if (!(registration_request->presencemask & OGS_NAS_5GS_REGISTRATION_REQUEST_NID_PRESENT))
+        return NULL;
+    if (lazy->decodedmask & OGS_NAS_5GS_REGISTRATION_REQUEST_NID_PRESENT)
+        return &registration_request->nid;
+
+    ogs_assert(lazy->pkbuf);
+    data = lazy->pkbuf->data;
+    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[35]));
+    size = ogs_nas_5gs_decode_nid(&registration_request->nid, lazy->pkbuf);
+    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_nid() failed");
+        registration_request->presencemask &= ~OGS_NAS_5GS_REGISTRATION_REQUEST_NID_PRESENT;
+        return NULL;
+    }
+
+    lazy->decodedmask |= OGS_NAS_5GS_REGISTRATION_REQUEST_NID_PRESENT;
+
+    return &registration_request->nid;
+}
+
+ogs_nas_plmn_identity_t *ogs_nas_5gs_registration_request_ms_determined_plmn_with_disaster_condition(
+        ogs_nas_5gs_registration_request_lazy_t *lazy)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = NULL;
+    unsigned char *data = NULL;
+    int size = 0;
+
+    ogs_assert(lazy);
+    registration_request = &lazy->registration_request;
+
+    if (!(registration_request->presencemask & OGS_NAS_5GS_REGISTRATION_REQUEST_MS_DETERMINED_PLMN_WITH_DISASTER_CONDITION_PRESENT))
+        return NULL;
+    if (lazy->decodedmask & OGS_NAS_5GS_REGISTRATION_REQUEST_MS_DETERMINED_PLMN_WITH_DISASTER_CONDITION_PRESENT)
+        return &registration_request->ms_determined_plmn_with_disaster_condition;
+
+    ogs_assert(lazy->pkbuf);
+    data = lazy->pkbuf->data;
+    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[36]));
+    size = ogs_nas_5gs_decode_plmn_identity(&registration_request->ms_determined_plmn_with_disaster_condition, lazy->pkbuf);
+    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_plmn_identity() failed");
+        registration_request->presencemask &= ~OGS_NAS_5GS_REGISTRATION_REQUEST_MS_DETERMINED_PLMN_WITH_DISASTER_CONDITION_PRESENT;
+        return NULL;
+    }
+
+    lazy->decodedmask |= OGS_NAS_5GS_REGISTRATION_REQUEST_MS_DETERMINED_PLMN_WITH_DISASTER_CONDITION_PRESENT;
+
+    return &registration_request->ms_determined_plmn_with_disaster_condition;
+}
+
+ogs_nas_peips_assistance_information_t *ogs_nas_5gs_registration_request_requested_peips_assistance_information(
+        ogs_nas_5gs_registration_request_lazy_t *lazy)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = NULL;
+    unsigned char *data = NULL;
+    int size = 0;
+
+    ogs_assert(lazy);
+    registration_request = &lazy->registration_request;
+
+    if (!(registration_request->presencemask & OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_PEIPS_ASSISTANCE_INFORMATION_PRESENT))
+        return NULL;
+    if (lazy->decodedmask & OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_PEIPS_ASSISTANCE_INFORMATION_PRESENT)
+        return &registration_request->requested_peips_assistance_information;
+
+    ogs_assert(lazy->pkbuf);
+    data = lazy->pkbuf->data;
+    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[37]));
+    size = ogs_nas_5gs_decode_peips_assistance_information(&registration_request->requested_peips_assistance_information, lazy->pkbuf);
+    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_peips_assistance_information() failed");
+        registration_request->presencemask &= ~OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_PEIPS_ASSISTANCE_INFORMATION_PRESENT;
+        return NULL;
+    }
+
+    lazy->decodedmask |= OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_PEIPS_ASSISTANCE_INFORMATION_PRESENT;
+
+    return &registration_request->requested_peips_assistance_information;
+}
+
+ogs_nas_gprs_timer_3_t *ogs_nas_5gs_registration_request_requested_t3512_value(
+        ogs_nas_5gs_registration_request_lazy_t *lazy)
+{
+    ogs_nas_5gs_registration_request_t *registration_request = NULL;
+    unsigned char *data = NULL;
+    int size = 0;
+
+    ogs_assert(lazy);
+    registration_request = &lazy->registration_request;
+
+    if (!(registration_request->presencemask & OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_T3512_VALUE_PRESENT))
+        return NULL;
+    if (lazy->decodedmask & OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_T3512_VALUE_PRESENT)
+        return &registration_request->requested_t3512_value;
+
+    ogs_assert(lazy->pkbuf);
+    data = lazy->pkbuf->data;
+    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[38]));
+    size = ogs_nas_5gs_decode_gprs_timer_3(&registration_request->requested_t3512_value, lazy->pkbuf);
+    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));
+    if (size < 0) {
+        ogs_error("ogs_nas_5gs_decode_gprs_timer_3() failed");
+        registration_request->presencemask &= ~OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_T3512_VALUE_PRESENT;
+        return NULL;
+    }
+
+    lazy->decodedmask |= OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_T3512_VALUE_PRESENT;
+
+    return &registration_request->requested_t3512_value;
+}
+
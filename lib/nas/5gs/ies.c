@@ -28,8 +28,8 @@
 /*******************************************************************************
  * This file had been created by nas-message.py script v0.2.0
  * Please do not modify this file but regenerate it via script.
- * Created on: 2024-12-11 21:13:08.097860 by acetcom
- * from 24501-h90.docx
+ * Created from 24501-h90.docx
+ * (sha256: 934e13e03cc23a890da2448bd91bac0d11d7f538d814a725666f5c9be66f7b96)
  ******************************************************************************/
 
 #include "ogs-nas-5gs.h"
@@ -38,38 +38,52 @@ int ogs_nas_5gs_encode_optional_type(ogs_pkbuf_t *pkbuf, uint8_t type)
 {
     int size = sizeof(uint8_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &type, size);
 
     return size;
 }
 /* 9.11.2.1 Additional information
  * O TLV 3-n */
-int ogs_nas_5gs_decode_additional_information(ogs_nas_additional_information_t *additional_information, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_additional_information(ogs_nas_additional_information_t *additional_information, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_additional_information_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_additional_information_t *)pkbuf->data;
+    source = (ogs_nas_additional_information_t *)data;
 
     additional_information->length = source->length;
     size = additional_information->length + sizeof(additional_information->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*additional_information) < size) return -1;
-    memcpy(additional_information, pkbuf->data - size, size);
+    memcpy(additional_information, data, size);
+
+    ogs_nas_trace_ie("ADDITIONAL_INFORMATION", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_additional_information(ogs_nas_additional_information_t *additional_information, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_additional_information(additional_information, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  ADDITIONAL_INFORMATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -80,41 +94,54 @@ int ogs_nas_5gs_encode_additional_information(ogs_pkbuf_t *pkbuf, ogs_nas_additi
     ogs_nas_additional_information_t target;
 
     memcpy(&target, additional_information, sizeof(ogs_nas_additional_information_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  ADDITIONAL_INFORMATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("ADDITIONAL_INFORMATION", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.2.10 Service-level-AA container
  * O TLV-E 6-n */
-int ogs_nas_5gs_decode_service_level_aa_container(ogs_nas_service_level_aa_container_t *service_level_aa_container, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_service_level_aa_container(ogs_nas_service_level_aa_container_t *service_level_aa_container, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_service_level_aa_container_t *source = NULL;
 
-    if (pkbuf->len < 2) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 2) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_service_level_aa_container_t *)pkbuf->data;
+    source = (ogs_nas_service_level_aa_container_t *)data;
 
     service_level_aa_container->length = be16toh(source->length);
     size = service_level_aa_container->length + sizeof(service_level_aa_container->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    service_level_aa_container->buffer = pkbuf->data - size + sizeof(service_level_aa_container->length);
+    service_level_aa_container->buffer = data + sizeof(service_level_aa_container->length);
+
+    ogs_nas_trace_ie("SERVICE_LEVEL_AA_CONTAINER", service_level_aa_container->buffer, service_level_aa_container->length);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_service_level_aa_container(ogs_nas_service_level_aa_container_t *service_level_aa_container, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_service_level_aa_container(service_level_aa_container, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  SERVICE_LEVEL_AA_CONTAINER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, (void*)service_level_aa_container->buffer, service_level_aa_container->length);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -128,35 +155,51 @@ int ogs_nas_5gs_encode_service_level_aa_container(ogs_pkbuf_t *pkbuf, ogs_nas_se
     ogs_assert(service_level_aa_container->buffer);
 
     size = sizeof(service_level_aa_container->length);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     target = htobe16(service_level_aa_container->length);
     memcpy(pkbuf->data - size, &target, size);
 
     size = service_level_aa_container->length;
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, service_level_aa_container->buffer, size);
 
-    ogs_trace("  SERVICE_LEVEL_AA_CONTAINER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("SERVICE_LEVEL_AA_CONTAINER", pkbuf->data - size, size);
 
     return service_level_aa_container->length + sizeof(service_level_aa_container->length);
 }
 
 /* 9.11.2.1A Access type
  * M V 1/2 */
-int ogs_nas_5gs_decode_access_type(ogs_nas_access_type_t *access_type, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_access_type(ogs_nas_access_type_t *access_type, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_access_type_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(access_type, pkbuf->data - size, size);
+    memcpy(access_type, data, size);
+
+    ogs_nas_trace_ie("ACCESS_TYPE", data, size);
 
-    ogs_trace("  ACCESS_TYPE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    return size;
+}
+
+int ogs_nas_5gs_decode_access_type(ogs_nas_access_type_t *access_type, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_access_type(access_type, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -167,39 +210,41 @@ int ogs_nas_5gs_encode_access_type(ogs_pkbuf_t *pkbuf, ogs_nas_access_type_t *ac
     ogs_nas_access_type_t target;
 
     memcpy(&target, access_type, size);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  ACCESS_TYPE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("ACCESS_TYPE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.2.1B DNN
  * O TLV 3-102 */
-int ogs_nas_5gs_decode_dnn(ogs_nas_dnn_t *dnn, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_dnn(ogs_nas_dnn_t *dnn, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_dnn_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_dnn_t *)pkbuf->data;
+    source = (ogs_nas_dnn_t *)data;
 
     dnn->length = source->length;
     size = dnn->length + sizeof(dnn->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*dnn) < size) return -1;
-    memcpy(dnn, pkbuf->data - size, size);
+    memcpy(dnn, data, size);
 
     {
         char data_network_name[OGS_MAX_DNN_LEN+1];
@@ -211,8 +256,19 @@ int ogs_nas_5gs_decode_dnn(ogs_nas_dnn_t *dnn, ogs_pkbuf_t *pkbuf)
         }
     }
 
-    ogs_trace("  DNN - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("DNN", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_dnn(ogs_nas_dnn_t *dnn, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_dnn(dnn, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -226,41 +282,54 @@ int ogs_nas_5gs_encode_dnn(ogs_pkbuf_t *pkbuf, ogs_nas_dnn_t *dnn)
     target.length = ogs_fqdn_build(target.value, dnn->value, dnn->length);
     size = target.length + sizeof(target.length);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  DNN - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("DNN", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.2.2 EAP message
  * O TLV-E 7-1503 */
-int ogs_nas_5gs_decode_eap_message(ogs_nas_eap_message_t *eap_message, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_eap_message(ogs_nas_eap_message_t *eap_message, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_eap_message_t *source = NULL;
 
-    if (pkbuf->len < 2) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 2) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_eap_message_t *)pkbuf->data;
+    source = (ogs_nas_eap_message_t *)data;
 
     eap_message->length = be16toh(source->length);
     size = eap_message->length + sizeof(eap_message->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    eap_message->buffer = pkbuf->data - size + sizeof(eap_message->length);
+    eap_message->buffer = data + sizeof(eap_message->length);
+
+    ogs_nas_trace_ie("EAP_MESSAGE", eap_message->buffer, eap_message->length);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_eap_message(ogs_nas_eap_message_t *eap_message, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_eap_message(eap_message, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  EAP_MESSAGE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, (void*)eap_message->buffer, eap_message->length);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -274,35 +343,51 @@ int ogs_nas_5gs_encode_eap_message(ogs_pkbuf_t *pkbuf, ogs_nas_eap_message_t *ea
     ogs_assert(eap_message->buffer);
 
     size = sizeof(eap_message->length);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     target = htobe16(eap_message->length);
     memcpy(pkbuf->data - size, &target, size);
 
     size = eap_message->length;
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, eap_message->buffer, size);
 
-    ogs_trace("  EAP_MESSAGE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("EAP_MESSAGE", pkbuf->data - size, size);
 
     return eap_message->length + sizeof(eap_message->length);
 }
 
 /* 9.11.2.3 GPRS timer
  * O TV 2 */
-int ogs_nas_5gs_decode_gprs_timer(ogs_nas_gprs_timer_t *gprs_timer, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_gprs_timer(ogs_nas_gprs_timer_t *gprs_timer, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_gprs_timer_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(gprs_timer, pkbuf->data - size, size);
+    memcpy(gprs_timer, data, size);
+
+    ogs_nas_trace_ie("GPRS_TIMER", data, size);
 
-    ogs_trace("  GPRS_TIMER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    return size;
+}
+
+int ogs_nas_5gs_decode_gprs_timer(ogs_nas_gprs_timer_t *gprs_timer, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_gprs_timer(gprs_timer, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -313,42 +398,55 @@ int ogs_nas_5gs_encode_gprs_timer(ogs_pkbuf_t *pkbuf, ogs_nas_gprs_timer_t *gprs
     ogs_nas_gprs_timer_t target;
 
     memcpy(&target, gprs_timer, size);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  GPRS_TIMER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("GPRS_TIMER", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.2.4 GPRS timer 2
  * O TLV 3 */
-int ogs_nas_5gs_decode_gprs_timer_2(ogs_nas_gprs_timer_2_t *gprs_timer_2, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_gprs_timer_2(ogs_nas_gprs_timer_2_t *gprs_timer_2, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_gprs_timer_2_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_gprs_timer_2_t *)pkbuf->data;
+    source = (ogs_nas_gprs_timer_2_t *)data;
 
     gprs_timer_2->length = source->length;
     size = gprs_timer_2->length + sizeof(gprs_timer_2->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*gprs_timer_2) < size) return -1;
-    memcpy(gprs_timer_2, pkbuf->data - size, size);
+    memcpy(gprs_timer_2, data, size);
+
+    ogs_nas_trace_ie("GPRS_TIMER_2", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_gprs_timer_2(ogs_nas_gprs_timer_2_t *gprs_timer_2, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_gprs_timer_2(gprs_timer_2, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  GPRS_TIMER_2 - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -359,42 +457,55 @@ int ogs_nas_5gs_encode_gprs_timer_2(ogs_pkbuf_t *pkbuf, ogs_nas_gprs_timer_2_t *
     ogs_nas_gprs_timer_2_t target;
 
     memcpy(&target, gprs_timer_2, sizeof(ogs_nas_gprs_timer_2_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  GPRS_TIMER_2 - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("GPRS_TIMER_2", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.2.5 GPRS timer 3
  * O TLV 3 */
-int ogs_nas_5gs_decode_gprs_timer_3(ogs_nas_gprs_timer_3_t *gprs_timer_3, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_gprs_timer_3(ogs_nas_gprs_timer_3_t *gprs_timer_3, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_gprs_timer_3_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_gprs_timer_3_t *)pkbuf->data;
+    source = (ogs_nas_gprs_timer_3_t *)data;
 
     gprs_timer_3->length = source->length;
     size = gprs_timer_3->length + sizeof(gprs_timer_3->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*gprs_timer_3) < size) return -1;
-    memcpy(gprs_timer_3, pkbuf->data - size, size);
+    memcpy(gprs_timer_3, data, size);
+
+    ogs_nas_trace_ie("GPRS_TIMER_3", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_gprs_timer_3(ogs_nas_gprs_timer_3_t *gprs_timer_3, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_gprs_timer_3(gprs_timer_3, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  GPRS_TIMER_3 - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -405,42 +516,55 @@ int ogs_nas_5gs_encode_gprs_timer_3(ogs_pkbuf_t *pkbuf, ogs_nas_gprs_timer_3_t *
     ogs_nas_gprs_timer_3_t target;
 
     memcpy(&target, gprs_timer_3, sizeof(ogs_nas_gprs_timer_3_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  GPRS_TIMER_3 - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("GPRS_TIMER_3", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.2.8 S-NSSAI
  * O TLV 3-10 */
-int ogs_nas_5gs_decode_s_nssai(ogs_nas_s_nssai_t *s_nssai, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_s_nssai(ogs_nas_s_nssai_t *s_nssai, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_s_nssai_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_s_nssai_t *)pkbuf->data;
+    source = (ogs_nas_s_nssai_t *)data;
 
     s_nssai->length = source->length;
     size = s_nssai->length + sizeof(s_nssai->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*s_nssai) < size) return -1;
-    memcpy(s_nssai, pkbuf->data - size, size);
+    memcpy(s_nssai, data, size);
+
+    ogs_nas_trace_ie("S_NSSAI", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_s_nssai(ogs_nas_s_nssai_t *s_nssai, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_s_nssai(s_nssai, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  S_NSSAI - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -451,42 +575,55 @@ int ogs_nas_5gs_encode_s_nssai(ogs_pkbuf_t *pkbuf, ogs_nas_s_nssai_t *s_nssai)
     ogs_nas_s_nssai_t target;
 
     memcpy(&target, s_nssai, sizeof(ogs_nas_s_nssai_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  S_NSSAI - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("S_NSSAI", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.1 5GMM capability
  * O TLV 3-15 */
-int ogs_nas_5gs_decode_5gmm_capability(ogs_nas_5gmm_capability_t *gmm_capability, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_5gmm_capability(ogs_nas_5gmm_capability_t *gmm_capability, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_5gmm_capability_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_5gmm_capability_t *)pkbuf->data;
+    source = (ogs_nas_5gmm_capability_t *)data;
 
     gmm_capability->length = source->length;
     size = gmm_capability->length + sizeof(gmm_capability->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*gmm_capability) < size) return -1;
-    memcpy(gmm_capability, pkbuf->data - size, size);
+    memcpy(gmm_capability, data, size);
+
+    ogs_nas_trace_ie("5GMM_CAPABILITY", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_5gmm_capability(ogs_nas_5gmm_capability_t *gmm_capability, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_5gmm_capability(gmm_capability, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  5GMM_CAPABILITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -497,42 +634,55 @@ int ogs_nas_5gs_encode_5gmm_capability(ogs_pkbuf_t *pkbuf, ogs_nas_5gmm_capabili
     ogs_nas_5gmm_capability_t target;
 
     memcpy(&target, gmm_capability, sizeof(ogs_nas_5gmm_capability_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  5GMM_CAPABILITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("5GMM_CAPABILITY", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.10 ABBA
  * M LV 3-n */
-int ogs_nas_5gs_decode_abba(ogs_nas_abba_t *abba, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_abba(ogs_nas_abba_t *abba, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_abba_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_abba_t *)pkbuf->data;
+    source = (ogs_nas_abba_t *)data;
 
     abba->length = source->length;
     size = abba->length + sizeof(abba->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*abba) < size) return -1;
-    memcpy(abba, pkbuf->data - size, size);
+    memcpy(abba, data, size);
+
+    ogs_nas_trace_ie("ABBA", data, size);
+
+    return size;
+}
 
-    ogs_trace("  ABBA - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+int ogs_nas_5gs_decode_abba(ogs_nas_abba_t *abba, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_abba(abba, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -543,42 +693,55 @@ int ogs_nas_5gs_encode_abba(ogs_pkbuf_t *pkbuf, ogs_nas_abba_t *abba)
     ogs_nas_abba_t target;
 
     memcpy(&target, abba, sizeof(ogs_nas_abba_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  ABBA - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("ABBA", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.12 Additional 5G security information
  * O TLV 3 */
-int ogs_nas_5gs_decode_additional_5g_security_information(ogs_nas_additional_5g_security_information_t *additional_security_information, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_additional_5g_security_information(ogs_nas_additional_5g_security_information_t *additional_security_information, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_additional_5g_security_information_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_additional_5g_security_information_t *)pkbuf->data;
+    source = (ogs_nas_additional_5g_security_information_t *)data;
 
     additional_security_information->length = source->length;
     size = additional_security_information->length + sizeof(additional_security_information->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*additional_security_information) < size) return -1;
-    memcpy(additional_security_information, pkbuf->data - size, size);
+    memcpy(additional_security_information, data, size);
+
+    ogs_nas_trace_ie("ADDITIONAL_5G_SECURITY_INFORMATION", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_additional_5g_security_information(ogs_nas_additional_5g_security_information_t *additional_security_information, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_additional_5g_security_information(additional_security_information, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  ADDITIONAL_5G_SECURITY_INFORMATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -589,42 +752,55 @@ int ogs_nas_5gs_encode_additional_5g_security_information(ogs_pkbuf_t *pkbuf, og
     ogs_nas_additional_5g_security_information_t target;
 
     memcpy(&target, additional_security_information, sizeof(ogs_nas_additional_5g_security_information_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  ADDITIONAL_5G_SECURITY_INFORMATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("ADDITIONAL_5G_SECURITY_INFORMATION", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.12A Additional information requested
  * O TLV 3 */
-int ogs_nas_5gs_decode_additional_information_requested(ogs_nas_additional_information_requested_t *additional_information_requested, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_additional_information_requested(ogs_nas_additional_information_requested_t *additional_information_requested, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_additional_information_requested_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_additional_information_requested_t *)pkbuf->data;
+    source = (ogs_nas_additional_information_requested_t *)data;
 
     additional_information_requested->length = source->length;
     size = additional_information_requested->length + sizeof(additional_information_requested->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*additional_information_requested) < size) return -1;
-    memcpy(additional_information_requested, pkbuf->data - size, size);
+    memcpy(additional_information_requested, data, size);
+
+    ogs_nas_trace_ie("ADDITIONAL_INFORMATION_REQUESTED", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_additional_information_requested(ogs_nas_additional_information_requested_t *additional_information_requested, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_additional_information_requested(additional_information_requested, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  ADDITIONAL_INFORMATION_REQUESTED - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -635,44 +811,57 @@ int ogs_nas_5gs_encode_additional_information_requested(ogs_pkbuf_t *pkbuf, ogs_
     ogs_nas_additional_information_requested_t target;
 
     memcpy(&target, additional_information_requested, sizeof(ogs_nas_additional_information_requested_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  ADDITIONAL_INFORMATION_REQUESTED - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("ADDITIONAL_INFORMATION_REQUESTED", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.13 Allowed PDU session status
  * O TLV 4-34 */
-int ogs_nas_5gs_decode_allowed_pdu_session_status(ogs_nas_allowed_pdu_session_status_t *allowed_pdu_session_status, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_allowed_pdu_session_status(ogs_nas_allowed_pdu_session_status_t *allowed_pdu_session_status, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_allowed_pdu_session_status_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_allowed_pdu_session_status_t *)pkbuf->data;
+    source = (ogs_nas_allowed_pdu_session_status_t *)data;
 
     allowed_pdu_session_status->length = source->length;
     size = allowed_pdu_session_status->length + sizeof(allowed_pdu_session_status->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*allowed_pdu_session_status) < size) return -1;
-    memcpy(allowed_pdu_session_status, pkbuf->data - size, size);
+    memcpy(allowed_pdu_session_status, data, size);
 
     allowed_pdu_session_status->psi = be16toh(allowed_pdu_session_status->psi);
 
-    ogs_trace("  ALLOWED_PDU_SESSION_STATUS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("ALLOWED_PDU_SESSION_STATUS", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_allowed_pdu_session_status(ogs_nas_allowed_pdu_session_status_t *allowed_pdu_session_status, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_allowed_pdu_session_status(allowed_pdu_session_status, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -685,42 +874,55 @@ int ogs_nas_5gs_encode_allowed_pdu_session_status(ogs_pkbuf_t *pkbuf, ogs_nas_al
     memcpy(&target, allowed_pdu_session_status, sizeof(ogs_nas_allowed_pdu_session_status_t));
     target.psi = htobe16(allowed_pdu_session_status->psi);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  ALLOWED_PDU_SESSION_STATUS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("ALLOWED_PDU_SESSION_STATUS", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.14 Authentication failure parameter
  * O TLV 16 */
-int ogs_nas_5gs_decode_authentication_failure_parameter(ogs_nas_authentication_failure_parameter_t *authentication_failure_parameter, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_authentication_failure_parameter(ogs_nas_authentication_failure_parameter_t *authentication_failure_parameter, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_authentication_failure_parameter_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_authentication_failure_parameter_t *)pkbuf->data;
+    source = (ogs_nas_authentication_failure_parameter_t *)data;
 
     authentication_failure_parameter->length = source->length;
     size = authentication_failure_parameter->length + sizeof(authentication_failure_parameter->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*authentication_failure_parameter) < size) return -1;
-    memcpy(authentication_failure_parameter, pkbuf->data - size, size);
+    memcpy(authentication_failure_parameter, data, size);
 
-    ogs_trace("  AUTHENTICATION_FAILURE_PARAMETER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("AUTHENTICATION_FAILURE_PARAMETER", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_authentication_failure_parameter(ogs_nas_authentication_failure_parameter_t *authentication_failure_parameter, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_authentication_failure_parameter(authentication_failure_parameter, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -731,42 +933,55 @@ int ogs_nas_5gs_encode_authentication_failure_parameter(ogs_pkbuf_t *pkbuf, ogs_
     ogs_nas_authentication_failure_parameter_t target;
 
     memcpy(&target, authentication_failure_parameter, sizeof(ogs_nas_authentication_failure_parameter_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  AUTHENTICATION_FAILURE_PARAMETER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("AUTHENTICATION_FAILURE_PARAMETER", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.15 Authentication parameter AUTN
  * O TLV 18 */
-int ogs_nas_5gs_decode_authentication_parameter_autn(ogs_nas_authentication_parameter_autn_t *authentication_parameter_autn, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_authentication_parameter_autn(ogs_nas_authentication_parameter_autn_t *authentication_parameter_autn, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_authentication_parameter_autn_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_authentication_parameter_autn_t *)pkbuf->data;
+    source = (ogs_nas_authentication_parameter_autn_t *)data;
 
     authentication_parameter_autn->length = source->length;
     size = authentication_parameter_autn->length + sizeof(authentication_parameter_autn->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*authentication_parameter_autn) < size) return -1;
-    memcpy(authentication_parameter_autn, pkbuf->data - size, size);
+    memcpy(authentication_parameter_autn, data, size);
+
+    ogs_nas_trace_ie("AUTHENTICATION_PARAMETER_AUTN", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_authentication_parameter_autn(ogs_nas_authentication_parameter_autn_t *authentication_parameter_autn, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_authentication_parameter_autn(authentication_parameter_autn, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  AUTHENTICATION_PARAMETER_AUTN - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -777,30 +992,43 @@ int ogs_nas_5gs_encode_authentication_parameter_autn(ogs_pkbuf_t *pkbuf, ogs_nas
     ogs_nas_authentication_parameter_autn_t target;
 
     memcpy(&target, authentication_parameter_autn, sizeof(ogs_nas_authentication_parameter_autn_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  AUTHENTICATION_PARAMETER_AUTN - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("AUTHENTICATION_PARAMETER_AUTN", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.16 Authentication parameter RAND
  * O TV 17 */
-int ogs_nas_5gs_decode_authentication_parameter_rand(ogs_nas_authentication_parameter_rand_t *authentication_parameter_rand, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_authentication_parameter_rand(ogs_nas_authentication_parameter_rand_t *authentication_parameter_rand, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_authentication_parameter_rand_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(authentication_parameter_rand, pkbuf->data - size, size);
+    memcpy(authentication_parameter_rand, data, size);
+
+    ogs_nas_trace_ie("AUTHENTICATION_PARAMETER_RAND", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_authentication_parameter_rand(ogs_nas_authentication_parameter_rand_t *authentication_parameter_rand, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_authentication_parameter_rand(authentication_parameter_rand, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  AUTHENTICATION_PARAMETER_RAND - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -811,42 +1039,55 @@ int ogs_nas_5gs_encode_authentication_parameter_rand(ogs_pkbuf_t *pkbuf, ogs_nas
     ogs_nas_authentication_parameter_rand_t target;
 
     memcpy(&target, authentication_parameter_rand, size);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  AUTHENTICATION_PARAMETER_RAND - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("AUTHENTICATION_PARAMETER_RAND", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.17 Authentication response parameter
  * O TLV 18 */
-int ogs_nas_5gs_decode_authentication_response_parameter(ogs_nas_authentication_response_parameter_t *authentication_response_parameter, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_authentication_response_parameter(ogs_nas_authentication_response_parameter_t *authentication_response_parameter, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_authentication_response_parameter_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_authentication_response_parameter_t *)pkbuf->data;
+    source = (ogs_nas_authentication_response_parameter_t *)data;
 
     authentication_response_parameter->length = source->length;
     size = authentication_response_parameter->length + sizeof(authentication_response_parameter->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*authentication_response_parameter) < size) return -1;
-    memcpy(authentication_response_parameter, pkbuf->data - size, size);
+    memcpy(authentication_response_parameter, data, size);
+
+    ogs_nas_trace_ie("AUTHENTICATION_RESPONSE_PARAMETER", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_authentication_response_parameter(ogs_nas_authentication_response_parameter_t *authentication_response_parameter, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_authentication_response_parameter(authentication_response_parameter, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  AUTHENTICATION_RESPONSE_PARAMETER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -857,30 +1098,43 @@ int ogs_nas_5gs_encode_authentication_response_parameter(ogs_pkbuf_t *pkbuf, ogs
     ogs_nas_authentication_response_parameter_t target;
 
     memcpy(&target, authentication_response_parameter, sizeof(ogs_nas_authentication_response_parameter_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  AUTHENTICATION_RESPONSE_PARAMETER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("AUTHENTICATION_RESPONSE_PARAMETER", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.18 Configuration update indication
  * O TV 1 */
-int ogs_nas_5gs_decode_configuration_update_indication(ogs_nas_configuration_update_indication_t *configuration_update_indication, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_configuration_update_indication(ogs_nas_configuration_update_indication_t *configuration_update_indication, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_configuration_update_indication_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(configuration_update_indication, pkbuf->data - size, size);
+    memcpy(configuration_update_indication, data, size);
+
+    ogs_nas_trace_ie("CONFIGURATION_UPDATE_INDICATION", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_configuration_update_indication(ogs_nas_configuration_update_indication_t *configuration_update_indication, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_configuration_update_indication(configuration_update_indication, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  CONFIGURATION_UPDATE_INDICATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -889,41 +1143,54 @@ int ogs_nas_5gs_encode_configuration_update_indication(ogs_pkbuf_t *pkbuf, ogs_n
 {
     int size = sizeof(ogs_nas_configuration_update_indication_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, configuration_update_indication, size);
 
-    ogs_trace("  CONFIGURATION_UPDATE_INDICATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("CONFIGURATION_UPDATE_INDICATION", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.18A CAG information list
  * O TLV-E 3-n */
-int ogs_nas_5gs_decode_cag_information_list(ogs_nas_cag_information_list_t *cag_information_list, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_cag_information_list(ogs_nas_cag_information_list_t *cag_information_list, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_cag_information_list_t *source = NULL;
 
-    if (pkbuf->len < 2) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 2) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_cag_information_list_t *)pkbuf->data;
+    source = (ogs_nas_cag_information_list_t *)data;
 
     cag_information_list->length = be16toh(source->length);
     size = cag_information_list->length + sizeof(cag_information_list->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    cag_information_list->buffer = pkbuf->data - size + sizeof(cag_information_list->length);
+    cag_information_list->buffer = data + sizeof(cag_information_list->length);
+
+    ogs_nas_trace_ie("CAG_INFORMATION_LIST", cag_information_list->buffer, cag_information_list->length);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_cag_information_list(ogs_nas_cag_information_list_t *cag_information_list, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_cag_information_list(cag_information_list, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  CAG_INFORMATION_LIST - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, (void*)cag_information_list->buffer, cag_information_list->length);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -937,46 +1204,62 @@ int ogs_nas_5gs_encode_cag_information_list(ogs_pkbuf_t *pkbuf, ogs_nas_cag_info
     ogs_assert(cag_information_list->buffer);
 
     size = sizeof(cag_information_list->length);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     target = htobe16(cag_information_list->length);
     memcpy(pkbuf->data - size, &target, size);
 
     size = cag_information_list->length;
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, cag_information_list->buffer, size);
 
-    ogs_trace("  CAG_INFORMATION_LIST - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("CAG_INFORMATION_LIST", pkbuf->data - size, size);
 
     return cag_information_list->length + sizeof(cag_information_list->length);
 }
 
 /* 9.11.3.18C Ciphering key data
  * O TLV-E 34-n */
-int ogs_nas_5gs_decode_ciphering_key_data(ogs_nas_ciphering_key_data_t *ciphering_key_data, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_ciphering_key_data(ogs_nas_ciphering_key_data_t *ciphering_key_data, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_ciphering_key_data_t *source = NULL;
 
-    if (pkbuf->len < 2) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 2) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_ciphering_key_data_t *)pkbuf->data;
+    source = (ogs_nas_ciphering_key_data_t *)data;
 
     ciphering_key_data->length = be16toh(source->length);
     size = ciphering_key_data->length + sizeof(ciphering_key_data->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    ciphering_key_data->buffer = pkbuf->data - size + sizeof(ciphering_key_data->length);
+    ciphering_key_data->buffer = data + sizeof(ciphering_key_data->length);
+
+    ogs_nas_trace_ie("CIPHERING_KEY_DATA", ciphering_key_data->buffer, ciphering_key_data->length);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_ciphering_key_data(ogs_nas_ciphering_key_data_t *ciphering_key_data, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_ciphering_key_data(ciphering_key_data, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  CIPHERING_KEY_DATA - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, (void*)ciphering_key_data->buffer, ciphering_key_data->length);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -990,47 +1273,63 @@ int ogs_nas_5gs_encode_ciphering_key_data(ogs_pkbuf_t *pkbuf, ogs_nas_ciphering_
     ogs_assert(ciphering_key_data->buffer);
 
     size = sizeof(ciphering_key_data->length);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     target = htobe16(ciphering_key_data->length);
     memcpy(pkbuf->data - size, &target, size);
 
     size = ciphering_key_data->length;
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, ciphering_key_data->buffer, size);
 
-    ogs_trace("  CIPHERING_KEY_DATA - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("CIPHERING_KEY_DATA", pkbuf->data - size, size);
 
     return ciphering_key_data->length + sizeof(ciphering_key_data->length);
 }
 
 /* 9.11.3.19 Daylight saving time
  * O TLV 3 */
-int ogs_nas_5gs_decode_daylight_saving_time(ogs_nas_daylight_saving_time_t *daylight_saving_time, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_daylight_saving_time(ogs_nas_daylight_saving_time_t *daylight_saving_time, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_daylight_saving_time_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_daylight_saving_time_t *)pkbuf->data;
+    source = (ogs_nas_daylight_saving_time_t *)data;
 
     daylight_saving_time->length = source->length;
     size = daylight_saving_time->length + sizeof(daylight_saving_time->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*daylight_saving_time) < size) return -1;
-    memcpy(daylight_saving_time, pkbuf->data - size, size);
+    memcpy(daylight_saving_time, data, size);
+
+    ogs_nas_trace_ie("DAYLIGHT_SAVING_TIME", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_daylight_saving_time(ogs_nas_daylight_saving_time_t *daylight_saving_time, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_daylight_saving_time(daylight_saving_time, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  DAYLIGHT_SAVING_TIME - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1041,30 +1340,43 @@ int ogs_nas_5gs_encode_daylight_saving_time(ogs_pkbuf_t *pkbuf, ogs_nas_daylight
     ogs_nas_daylight_saving_time_t target;
 
     memcpy(&target, daylight_saving_time, sizeof(ogs_nas_daylight_saving_time_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  DAYLIGHT_SAVING_TIME - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("DAYLIGHT_SAVING_TIME", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.2 5GMM cause
  * M V 1 */
-int ogs_nas_5gs_decode_5gmm_cause(ogs_nas_5gmm_cause_t *gmm_cause, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_5gmm_cause(ogs_nas_5gmm_cause_t *gmm_cause, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_5gmm_cause_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(gmm_cause, pkbuf->data - size, size);
+    memcpy(gmm_cause, data, size);
+
+    ogs_nas_trace_ie("5GMM_CAUSE", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_5gmm_cause(ogs_nas_5gmm_cause_t *gmm_cause, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_5gmm_cause(gmm_cause, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  5GMM_CAUSE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1075,30 +1387,43 @@ int ogs_nas_5gs_encode_5gmm_cause(ogs_pkbuf_t *pkbuf, ogs_nas_5gmm_cause_t *gmm_
     ogs_nas_5gmm_cause_t target;
 
     memcpy(&target, gmm_cause, size);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  5GMM_CAUSE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("5GMM_CAUSE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.20 De-registration type
  * M V 1/2 */
-int ogs_nas_5gs_decode_de_registration_type(ogs_nas_de_registration_type_t *de_registration_type, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_de_registration_type(ogs_nas_de_registration_type_t *de_registration_type, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_de_registration_type_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(de_registration_type, pkbuf->data - size, size);
+    memcpy(de_registration_type, data, size);
+
+    ogs_nas_trace_ie("DE_REGISTRATION_TYPE", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_de_registration_type(ogs_nas_de_registration_type_t *de_registration_type, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_de_registration_type(de_registration_type, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  DE_REGISTRATION_TYPE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1109,42 +1434,55 @@ int ogs_nas_5gs_encode_de_registration_type(ogs_pkbuf_t *pkbuf, ogs_nas_de_regis
     ogs_nas_de_registration_type_t target;
 
     memcpy(&target, de_registration_type, size);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  DE_REGISTRATION_TYPE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("DE_REGISTRATION_TYPE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.23 Emergency number list
  * O TLV 5-50 */
-int ogs_nas_5gs_decode_emergency_number_list(ogs_nas_emergency_number_list_t *emergency_number_list, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_emergency_number_list(ogs_nas_emergency_number_list_t *emergency_number_list, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_emergency_number_list_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_emergency_number_list_t *)pkbuf->data;
+    source = (ogs_nas_emergency_number_list_t *)data;
 
     emergency_number_list->length = source->length;
     size = emergency_number_list->length + sizeof(emergency_number_list->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*emergency_number_list) < size) return -1;
-    memcpy(emergency_number_list, pkbuf->data - size, size);
+    memcpy(emergency_number_list, data, size);
+
+    ogs_nas_trace_ie("EMERGENCY_NUMBER_LIST", data, size);
+
+    return size;
+}
 
-    ogs_trace("  EMERGENCY_NUMBER_LIST - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+int ogs_nas_5gs_decode_emergency_number_list(ogs_nas_emergency_number_list_t *emergency_number_list, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_emergency_number_list(emergency_number_list, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1155,42 +1493,55 @@ int ogs_nas_5gs_encode_emergency_number_list(ogs_pkbuf_t *pkbuf, ogs_nas_emergen
     ogs_nas_emergency_number_list_t target;
 
     memcpy(&target, emergency_number_list, sizeof(ogs_nas_emergency_number_list_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  EMERGENCY_NUMBER_LIST - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("EMERGENCY_NUMBER_LIST", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.23A EPS bearer context status
  * O TLV 4 */
-int ogs_nas_5gs_decode_eps_bearer_context_status(ogs_nas_eps_bearer_context_status_t *eps_bearer_context_status, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_eps_bearer_context_status(ogs_nas_eps_bearer_context_status_t *eps_bearer_context_status, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_eps_bearer_context_status_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_eps_bearer_context_status_t *)pkbuf->data;
+    source = (ogs_nas_eps_bearer_context_status_t *)data;
 
     eps_bearer_context_status->length = source->length;
     size = eps_bearer_context_status->length + sizeof(eps_bearer_context_status->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*eps_bearer_context_status) < size) return -1;
-    memcpy(eps_bearer_context_status, pkbuf->data - size, size);
+    memcpy(eps_bearer_context_status, data, size);
+
+    ogs_nas_trace_ie("EPS_BEARER_CONTEXT_STATUS", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_eps_bearer_context_status(ogs_nas_eps_bearer_context_status_t *eps_bearer_context_status, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_eps_bearer_context_status(eps_bearer_context_status, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  EPS_BEARER_CONTEXT_STATUS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1201,41 +1552,54 @@ int ogs_nas_5gs_encode_eps_bearer_context_status(ogs_pkbuf_t *pkbuf, ogs_nas_eps
     ogs_nas_eps_bearer_context_status_t target;
 
     memcpy(&target, eps_bearer_context_status, sizeof(ogs_nas_eps_bearer_context_status_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  EPS_BEARER_CONTEXT_STATUS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("EPS_BEARER_CONTEXT_STATUS", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.24 EPS NAS message container
  * O TLV-E 4-n */
-int ogs_nas_5gs_decode_eps_nas_message_container(ogs_nas_eps_nas_message_container_t *eps_nas_message_container, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_eps_nas_message_container(ogs_nas_eps_nas_message_container_t *eps_nas_message_container, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_eps_nas_message_container_t *source = NULL;
 
-    if (pkbuf->len < 2) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 2) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_eps_nas_message_container_t *)pkbuf->data;
+    source = (ogs_nas_eps_nas_message_container_t *)data;
 
     eps_nas_message_container->length = be16toh(source->length);
     size = eps_nas_message_container->length + sizeof(eps_nas_message_container->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    eps_nas_message_container->buffer = pkbuf->data - size + sizeof(eps_nas_message_container->length);
+    eps_nas_message_container->buffer = data + sizeof(eps_nas_message_container->length);
+
+    ogs_nas_trace_ie("EPS_NAS_MESSAGE_CONTAINER", eps_nas_message_container->buffer, eps_nas_message_container->length);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_eps_nas_message_container(ogs_nas_eps_nas_message_container_t *eps_nas_message_container, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_eps_nas_message_container(eps_nas_message_container, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  EPS_NAS_MESSAGE_CONTAINER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, (void*)eps_nas_message_container->buffer, eps_nas_message_container->length);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1249,35 +1613,51 @@ int ogs_nas_5gs_encode_eps_nas_message_container(ogs_pkbuf_t *pkbuf, ogs_nas_eps
     ogs_assert(eps_nas_message_container->buffer);
 
     size = sizeof(eps_nas_message_container->length);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     target = htobe16(eps_nas_message_container->length);
     memcpy(pkbuf->data - size, &target, size);
 
     size = eps_nas_message_container->length;
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, eps_nas_message_container->buffer, size);
 
-    ogs_trace("  EPS_NAS_MESSAGE_CONTAINER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("EPS_NAS_MESSAGE_CONTAINER", pkbuf->data - size, size);
 
     return eps_nas_message_container->length + sizeof(eps_nas_message_container->length);
 }
 
 /* 9.11.3.25 EPS NAS security algorithms
  * O TV 2 */
-int ogs_nas_5gs_decode_eps_nas_security_algorithms(ogs_nas_eps_nas_security_algorithms_t *eps_nas_security_algorithms, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_eps_nas_security_algorithms(ogs_nas_eps_nas_security_algorithms_t *eps_nas_security_algorithms, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_eps_nas_security_algorithms_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(eps_nas_security_algorithms, pkbuf->data - size, size);
+    memcpy(eps_nas_security_algorithms, data, size);
+
+    ogs_nas_trace_ie("EPS_NAS_SECURITY_ALGORITHMS", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_eps_nas_security_algorithms(ogs_nas_eps_nas_security_algorithms_t *eps_nas_security_algorithms, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_eps_nas_security_algorithms(eps_nas_security_algorithms, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  EPS_NAS_SECURITY_ALGORITHMS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1288,95 +1668,124 @@ int ogs_nas_5gs_encode_eps_nas_security_algorithms(ogs_pkbuf_t *pkbuf, ogs_nas_e
     ogs_nas_eps_nas_security_algorithms_t target;
 
     memcpy(&target, eps_nas_security_algorithms, size);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  EPS_NAS_SECURITY_ALGORITHMS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("EPS_NAS_SECURITY_ALGORITHMS", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.26 Extended emergency number list
  * O TLV-E 7-65538 */
-int ogs_nas_5gs_decode_extended_emergency_number_list(ogs_nas_extended_emergency_number_list_t *extended_emergency_number_list, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_extended_emergency_number_list(ogs_nas_extended_emergency_number_list_t *extended_emergency_number_list, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_extended_emergency_number_list_t *source = NULL;
 
-    if (pkbuf->len < 2) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 2) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_extended_emergency_number_list_t *)pkbuf->data;
+    source = (ogs_nas_extended_emergency_number_list_t *)data;
 
     extended_emergency_number_list->length = be16toh(source->length);
     size = extended_emergency_number_list->length + sizeof(extended_emergency_number_list->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    extended_emergency_number_list->buffer = pkbuf->data - size + sizeof(extended_emergency_number_list->length);
+    extended_emergency_number_list->buffer = data + sizeof(extended_emergency_number_list->length);
 
-    ogs_trace("  EXTENDED_EMERGENCY_NUMBER_LIST - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, (void*)extended_emergency_number_list->buffer, extended_emergency_number_list->length);
+    ogs_nas_trace_ie("EXTENDED_EMERGENCY_NUMBER_LIST", extended_emergency_number_list->buffer, extended_emergency_number_list->length);
 
     return size;
 }
 
-int ogs_nas_5gs_encode_extended_emergency_number_list(ogs_pkbuf_t *pkbuf, ogs_nas_extended_emergency_number_list_t *extended_emergency_number_list)
+int ogs_nas_5gs_decode_extended_emergency_number_list(ogs_nas_extended_emergency_number_list_t *extended_emergency_number_list, ogs_pkbuf_t *pkbuf)
 {
-    int size = 0;
+    int size = ogs_nas_5gs_read_extended_emergency_number_list(extended_emergency_number_list, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+
+    return size;
+}
+
+int ogs_nas_5gs_encode_extended_emergency_number_list(ogs_pkbuf_t *pkbuf, ogs_nas_extended_emergency_number_list_t *extended_emergency_number_list)
+{
+    int size = 0;
     int target;
 
     ogs_assert(extended_emergency_number_list);
     ogs_assert(extended_emergency_number_list->buffer);
 
     size = sizeof(extended_emergency_number_list->length);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     target = htobe16(extended_emergency_number_list->length);
     memcpy(pkbuf->data - size, &target, size);
 
     size = extended_emergency_number_list->length;
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, extended_emergency_number_list->buffer, size);
 
-    ogs_trace("  EXTENDED_EMERGENCY_NUMBER_LIST - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("EXTENDED_EMERGENCY_NUMBER_LIST", pkbuf->data - size, size);
 
     return extended_emergency_number_list->length + sizeof(extended_emergency_number_list->length);
 }
 
 /* 9.11.3.26A Extended DRX parameters
  * O TLV 3-4 */
-int ogs_nas_5gs_decode_extended_drx_parameters(ogs_nas_extended_drx_parameters_t *extended_drx_parameters, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_extended_drx_parameters(ogs_nas_extended_drx_parameters_t *extended_drx_parameters, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_extended_drx_parameters_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_extended_drx_parameters_t *)pkbuf->data;
+    source = (ogs_nas_extended_drx_parameters_t *)data;
 
     extended_drx_parameters->length = source->length;
     size = extended_drx_parameters->length + sizeof(extended_drx_parameters->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*extended_drx_parameters) < size) return -1;
-    memcpy(extended_drx_parameters, pkbuf->data - size, size);
+    memcpy(extended_drx_parameters, data, size);
+
+    ogs_nas_trace_ie("EXTENDED_DRX_PARAMETERS", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_extended_drx_parameters(ogs_nas_extended_drx_parameters_t *extended_drx_parameters, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_extended_drx_parameters(extended_drx_parameters, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  EXTENDED_DRX_PARAMETERS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1387,30 +1796,43 @@ int ogs_nas_5gs_encode_extended_drx_parameters(ogs_pkbuf_t *pkbuf, ogs_nas_exten
     ogs_nas_extended_drx_parameters_t target;
 
     memcpy(&target, extended_drx_parameters, sizeof(ogs_nas_extended_drx_parameters_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  EXTENDED_DRX_PARAMETERS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("EXTENDED_DRX_PARAMETERS", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.28 IMEISV request
  * O TV 1 */
-int ogs_nas_5gs_decode_imeisv_request(ogs_nas_imeisv_request_t *imeisv_request, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_imeisv_request(ogs_nas_imeisv_request_t *imeisv_request, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_imeisv_request_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(imeisv_request, pkbuf->data - size, size);
+    memcpy(imeisv_request, data, size);
+
+    ogs_nas_trace_ie("IMEISV_REQUEST", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_imeisv_request(ogs_nas_imeisv_request_t *imeisv_request, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_imeisv_request(imeisv_request, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  IMEISV_REQUEST - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1419,41 +1841,54 @@ int ogs_nas_5gs_encode_imeisv_request(ogs_pkbuf_t *pkbuf, ogs_nas_imeisv_request
 {
     int size = sizeof(ogs_nas_imeisv_request_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, imeisv_request, size);
 
-    ogs_trace("  IMEISV_REQUEST - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("IMEISV_REQUEST", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.29 LADN indication
  * O TLV-E 3-811 */
-int ogs_nas_5gs_decode_ladn_indication(ogs_nas_ladn_indication_t *ladn_indication, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_ladn_indication(ogs_nas_ladn_indication_t *ladn_indication, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_ladn_indication_t *source = NULL;
 
-    if (pkbuf->len < 2) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 2) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_ladn_indication_t *)pkbuf->data;
+    source = (ogs_nas_ladn_indication_t *)data;
 
     ladn_indication->length = be16toh(source->length);
     size = ladn_indication->length + sizeof(ladn_indication->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    ladn_indication->buffer = pkbuf->data - size + sizeof(ladn_indication->length);
+    ladn_indication->buffer = data + sizeof(ladn_indication->length);
+
+    ogs_nas_trace_ie("LADN_INDICATION", ladn_indication->buffer, ladn_indication->length);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_ladn_indication(ogs_nas_ladn_indication_t *ladn_indication, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_ladn_indication(ladn_indication, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  LADN_INDICATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, (void*)ladn_indication->buffer, ladn_indication->length);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1467,47 +1902,63 @@ int ogs_nas_5gs_encode_ladn_indication(ogs_pkbuf_t *pkbuf, ogs_nas_ladn_indicati
     ogs_assert(ladn_indication->buffer);
 
     size = sizeof(ladn_indication->length);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     target = htobe16(ladn_indication->length);
     memcpy(pkbuf->data - size, &target, size);
 
     size = ladn_indication->length;
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, ladn_indication->buffer, size);
 
-    ogs_trace("  LADN_INDICATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("LADN_INDICATION", pkbuf->data - size, size);
 
     return ladn_indication->length + sizeof(ladn_indication->length);
 }
 
 /* 9.11.3.2A 5GS DRX parameters
  * O TLV 3 */
-int ogs_nas_5gs_decode_5gs_drx_parameters(ogs_nas_5gs_drx_parameters_t *drx_parameters, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_5gs_drx_parameters(ogs_nas_5gs_drx_parameters_t *drx_parameters, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_5gs_drx_parameters_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_5gs_drx_parameters_t *)pkbuf->data;
+    source = (ogs_nas_5gs_drx_parameters_t *)data;
 
     drx_parameters->length = source->length;
     size = drx_parameters->length + sizeof(drx_parameters->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*drx_parameters) < size) return -1;
-    memcpy(drx_parameters, pkbuf->data - size, size);
+    memcpy(drx_parameters, data, size);
+
+    ogs_nas_trace_ie("5GS_DRX_PARAMETERS", data, size);
+
+    return size;
+}
 
-    ogs_trace("  5GS_DRX_PARAMETERS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+int ogs_nas_5gs_decode_5gs_drx_parameters(ogs_nas_5gs_drx_parameters_t *drx_parameters, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_5gs_drx_parameters(drx_parameters, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1518,30 +1969,43 @@ int ogs_nas_5gs_encode_5gs_drx_parameters(ogs_pkbuf_t *pkbuf, ogs_nas_5gs_drx_pa
     ogs_nas_5gs_drx_parameters_t target;
 
     memcpy(&target, drx_parameters, sizeof(ogs_nas_5gs_drx_parameters_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  5GS_DRX_PARAMETERS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("5GS_DRX_PARAMETERS", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.3 5GS identity type
  * M V 1/2 */
-int ogs_nas_5gs_decode_5gs_identity_type(ogs_nas_5gs_identity_type_t *identity_type, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_5gs_identity_type(ogs_nas_5gs_identity_type_t *identity_type, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_5gs_identity_type_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(identity_type, pkbuf->data - size, size);
+    memcpy(identity_type, data, size);
+
+    ogs_nas_trace_ie("5GS_IDENTITY_TYPE", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_5gs_identity_type(ogs_nas_5gs_identity_type_t *identity_type, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_5gs_identity_type(identity_type, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  5GS_IDENTITY_TYPE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1552,41 +2016,54 @@ int ogs_nas_5gs_encode_5gs_identity_type(ogs_pkbuf_t *pkbuf, ogs_nas_5gs_identit
     ogs_nas_5gs_identity_type_t target;
 
     memcpy(&target, identity_type, size);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  5GS_IDENTITY_TYPE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("5GS_IDENTITY_TYPE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.30 LADN information
  * O TLV-E 12-1715 */
-int ogs_nas_5gs_decode_ladn_information(ogs_nas_ladn_information_t *ladn_information, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_ladn_information(ogs_nas_ladn_information_t *ladn_information, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_ladn_information_t *source = NULL;
 
-    if (pkbuf->len < 2) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 2) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_ladn_information_t *)pkbuf->data;
+    source = (ogs_nas_ladn_information_t *)data;
 
     ladn_information->length = be16toh(source->length);
     size = ladn_information->length + sizeof(ladn_information->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    ladn_information->buffer = pkbuf->data - size + sizeof(ladn_information->length);
+    ladn_information->buffer = data + sizeof(ladn_information->length);
+
+    ogs_nas_trace_ie("LADN_INFORMATION", ladn_information->buffer, ladn_information->length);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_ladn_information(ogs_nas_ladn_information_t *ladn_information, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_ladn_information(ladn_information, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  LADN_INFORMATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, (void*)ladn_information->buffer, ladn_information->length);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1600,35 +2077,51 @@ int ogs_nas_5gs_encode_ladn_information(ogs_pkbuf_t *pkbuf, ogs_nas_ladn_informa
     ogs_assert(ladn_information->buffer);
 
     size = sizeof(ladn_information->length);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     target = htobe16(ladn_information->length);
     memcpy(pkbuf->data - size, &target, size);
 
     size = ladn_information->length;
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, ladn_information->buffer, size);
 
-    ogs_trace("  LADN_INFORMATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("LADN_INFORMATION", pkbuf->data - size, size);
 
     return ladn_information->length + sizeof(ladn_information->length);
 }
 
 /* 9.11.3.31 MICO indication
  * O TV 1 */
-int ogs_nas_5gs_decode_mico_indication(ogs_nas_mico_indication_t *mico_indication, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_mico_indication(ogs_nas_mico_indication_t *mico_indication, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_mico_indication_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(mico_indication, pkbuf->data - size, size);
+    memcpy(mico_indication, data, size);
+
+    ogs_nas_trace_ie("MICO_INDICATION", data, size);
 
-    ogs_trace("  MICO_INDICATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    return size;
+}
+
+int ogs_nas_5gs_decode_mico_indication(ogs_nas_mico_indication_t *mico_indication, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_mico_indication(mico_indication, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1637,30 +2130,43 @@ int ogs_nas_5gs_encode_mico_indication(ogs_pkbuf_t *pkbuf, ogs_nas_mico_indicati
 {
     int size = sizeof(ogs_nas_mico_indication_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, mico_indication, size);
 
-    ogs_trace("  MICO_INDICATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("MICO_INDICATION", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.31A MA PDU session information
  * O TV 1 */
-int ogs_nas_5gs_decode_ma_pdu_session_information(ogs_nas_ma_pdu_session_information_t *ma_pdu_session_information, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_ma_pdu_session_information(ogs_nas_ma_pdu_session_information_t *ma_pdu_session_information, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_ma_pdu_session_information_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(ma_pdu_session_information, pkbuf->data - size, size);
+    memcpy(ma_pdu_session_information, data, size);
 
-    ogs_trace("  MA_PDU_SESSION_INFORMATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("MA_PDU_SESSION_INFORMATION", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_ma_pdu_session_information(ogs_nas_ma_pdu_session_information_t *ma_pdu_session_information, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_ma_pdu_session_information(ma_pdu_session_information, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1669,42 +2175,55 @@ int ogs_nas_5gs_encode_ma_pdu_session_information(ogs_pkbuf_t *pkbuf, ogs_nas_ma
 {
     int size = sizeof(ogs_nas_ma_pdu_session_information_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, ma_pdu_session_information, size);
 
-    ogs_trace("  MA_PDU_SESSION_INFORMATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("MA_PDU_SESSION_INFORMATION", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.31B Mapped NSSAI
  * O TLV 3-42 */
-int ogs_nas_5gs_decode_mapped_nssai(ogs_nas_mapped_nssai_t *mapped_nssai, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_mapped_nssai(ogs_nas_mapped_nssai_t *mapped_nssai, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_mapped_nssai_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_mapped_nssai_t *)pkbuf->data;
+    source = (ogs_nas_mapped_nssai_t *)data;
 
     mapped_nssai->length = source->length;
     size = mapped_nssai->length + sizeof(mapped_nssai->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*mapped_nssai) < size) return -1;
-    memcpy(mapped_nssai, pkbuf->data - size, size);
+    memcpy(mapped_nssai, data, size);
+
+    ogs_nas_trace_ie("MAPPED_NSSAI", data, size);
+
+    return size;
+}
 
-    ogs_trace("  MAPPED_NSSAI - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+int ogs_nas_5gs_decode_mapped_nssai(ogs_nas_mapped_nssai_t *mapped_nssai, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_mapped_nssai(mapped_nssai, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1715,42 +2234,55 @@ int ogs_nas_5gs_encode_mapped_nssai(ogs_pkbuf_t *pkbuf, ogs_nas_mapped_nssai_t *
     ogs_nas_mapped_nssai_t target;
 
     memcpy(&target, mapped_nssai, sizeof(ogs_nas_mapped_nssai_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  MAPPED_NSSAI - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("MAPPED_NSSAI", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.31C Mobile station classmark 2
  * O TLV 5 */
-int ogs_nas_5gs_decode_mobile_station_classmark_2(ogs_nas_mobile_station_classmark_2_t *mobile_station_classmark_2, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_mobile_station_classmark_2(ogs_nas_mobile_station_classmark_2_t *mobile_station_classmark_2, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_mobile_station_classmark_2_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_mobile_station_classmark_2_t *)pkbuf->data;
+    source = (ogs_nas_mobile_station_classmark_2_t *)data;
 
     mobile_station_classmark_2->length = source->length;
     size = mobile_station_classmark_2->length + sizeof(mobile_station_classmark_2->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*mobile_station_classmark_2) < size) return -1;
-    memcpy(mobile_station_classmark_2, pkbuf->data - size, size);
+    memcpy(mobile_station_classmark_2, data, size);
+
+    ogs_nas_trace_ie("MOBILE_STATION_CLASSMARK_2", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_mobile_station_classmark_2(ogs_nas_mobile_station_classmark_2_t *mobile_station_classmark_2, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_mobile_station_classmark_2(mobile_station_classmark_2, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  MOBILE_STATION_CLASSMARK_2 - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1761,30 +2293,43 @@ int ogs_nas_5gs_encode_mobile_station_classmark_2(ogs_pkbuf_t *pkbuf, ogs_nas_mo
     ogs_nas_mobile_station_classmark_2_t target;
 
     memcpy(&target, mobile_station_classmark_2, sizeof(ogs_nas_mobile_station_classmark_2_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  MOBILE_STATION_CLASSMARK_2 - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("MOBILE_STATION_CLASSMARK_2", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.32 key set identifier
  * O TV 1 */
-int ogs_nas_5gs_decode_key_set_identifier(ogs_nas_key_set_identifier_t *key_set_identifier, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_key_set_identifier(ogs_nas_key_set_identifier_t *key_set_identifier, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_key_set_identifier_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(key_set_identifier, pkbuf->data - size, size);
+    memcpy(key_set_identifier, data, size);
+
+    ogs_nas_trace_ie("KEY_SET_IDENTIFIER", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_key_set_identifier(ogs_nas_key_set_identifier_t *key_set_identifier, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_key_set_identifier(key_set_identifier, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  KEY_SET_IDENTIFIER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1793,41 +2338,54 @@ int ogs_nas_5gs_encode_key_set_identifier(ogs_pkbuf_t *pkbuf, ogs_nas_key_set_id
 {
     int size = sizeof(ogs_nas_key_set_identifier_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, key_set_identifier, size);
 
-    ogs_trace("  KEY_SET_IDENTIFIER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("KEY_SET_IDENTIFIER", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.33 message container
  * O TLV-E 4-n */
-int ogs_nas_5gs_decode_message_container(ogs_nas_message_container_t *message_container, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_message_container(ogs_nas_message_container_t *message_container, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_message_container_t *source = NULL;
 
-    if (pkbuf->len < 2) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 2) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_message_container_t *)pkbuf->data;
+    source = (ogs_nas_message_container_t *)data;
 
     message_container->length = be16toh(source->length);
     size = message_container->length + sizeof(message_container->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    message_container->buffer = pkbuf->data - size + sizeof(message_container->length);
+    message_container->buffer = data + sizeof(message_container->length);
+
+    ogs_nas_trace_ie("MESSAGE_CONTAINER", message_container->buffer, message_container->length);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_message_container(ogs_nas_message_container_t *message_container, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_message_container(message_container, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  MESSAGE_CONTAINER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, (void*)message_container->buffer, message_container->length);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1841,35 +2399,51 @@ int ogs_nas_5gs_encode_message_container(ogs_pkbuf_t *pkbuf, ogs_nas_message_con
     ogs_assert(message_container->buffer);
 
     size = sizeof(message_container->length);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     target = htobe16(message_container->length);
     memcpy(pkbuf->data - size, &target, size);
 
     size = message_container->length;
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, message_container->buffer, size);
 
-    ogs_trace("  MESSAGE_CONTAINER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("MESSAGE_CONTAINER", pkbuf->data - size, size);
 
     return message_container->length + sizeof(message_container->length);
 }
 
 /* 9.11.3.34 security algorithms
  * M V 1 */
-int ogs_nas_5gs_decode_security_algorithms(ogs_nas_security_algorithms_t *security_algorithms, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_security_algorithms(ogs_nas_security_algorithms_t *security_algorithms, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_security_algorithms_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(security_algorithms, pkbuf->data - size, size);
+    memcpy(security_algorithms, data, size);
+
+    ogs_nas_trace_ie("SECURITY_ALGORITHMS", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_security_algorithms(ogs_nas_security_algorithms_t *security_algorithms, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_security_algorithms(security_algorithms, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  SECURITY_ALGORITHMS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1880,42 +2454,55 @@ int ogs_nas_5gs_encode_security_algorithms(ogs_pkbuf_t *pkbuf, ogs_nas_security_
     ogs_nas_security_algorithms_t target;
 
     memcpy(&target, security_algorithms, size);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  SECURITY_ALGORITHMS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("SECURITY_ALGORITHMS", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.35 Network name
  * O TLV 3-n */
-int ogs_nas_5gs_decode_network_name(ogs_nas_network_name_t *network_name, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_network_name(ogs_nas_network_name_t *network_name, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_network_name_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_network_name_t *)pkbuf->data;
+    source = (ogs_nas_network_name_t *)data;
 
     network_name->length = source->length;
     size = network_name->length + sizeof(network_name->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*network_name) < size) return -1;
-    memcpy(network_name, pkbuf->data - size, size);
+    memcpy(network_name, data, size);
+
+    ogs_nas_trace_ie("NETWORK_NAME", data, size);
+
+    return size;
+}
 
-    ogs_trace("  NETWORK_NAME - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+int ogs_nas_5gs_decode_network_name(ogs_nas_network_name_t *network_name, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_network_name(network_name, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1926,30 +2513,43 @@ int ogs_nas_5gs_encode_network_name(ogs_pkbuf_t *pkbuf, ogs_nas_network_name_t *
     ogs_nas_network_name_t target;
 
     memcpy(&target, network_name, sizeof(ogs_nas_network_name_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  NETWORK_NAME - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("NETWORK_NAME", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.36 Network slicing indication
  * O TV 1 */
-int ogs_nas_5gs_decode_network_slicing_indication(ogs_nas_network_slicing_indication_t *network_slicing_indication, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_network_slicing_indication(ogs_nas_network_slicing_indication_t *network_slicing_indication, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_network_slicing_indication_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(network_slicing_indication, pkbuf->data - size, size);
+    memcpy(network_slicing_indication, data, size);
+
+    ogs_nas_trace_ie("NETWORK_SLICING_INDICATION", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_network_slicing_indication(ogs_nas_network_slicing_indication_t *network_slicing_indication, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_network_slicing_indication(network_slicing_indication, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  NETWORK_SLICING_INDICATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1958,30 +2558,43 @@ int ogs_nas_5gs_encode_network_slicing_indication(ogs_pkbuf_t *pkbuf, ogs_nas_ne
 {
     int size = sizeof(ogs_nas_network_slicing_indication_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, network_slicing_indication, size);
 
-    ogs_trace("  NETWORK_SLICING_INDICATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("NETWORK_SLICING_INDICATION", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.36A Non-3GPP NW provided policies
  * O TV 1 */
-int ogs_nas_5gs_decode_non_3gpp_nw_provided_policies(ogs_nas_non_3gpp_nw_provided_policies_t *non_3gpp_nw_provided_policies, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_non_3gpp_nw_provided_policies(ogs_nas_non_3gpp_nw_provided_policies_t *non_3gpp_nw_provided_policies, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_non_3gpp_nw_provided_policies_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(non_3gpp_nw_provided_policies, pkbuf->data - size, size);
+    memcpy(non_3gpp_nw_provided_policies, data, size);
+
+    ogs_nas_trace_ie("NON_3GPP_NW_PROVIDED_POLICIES", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_non_3gpp_nw_provided_policies(ogs_nas_non_3gpp_nw_provided_policies_t *non_3gpp_nw_provided_policies, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_non_3gpp_nw_provided_policies(non_3gpp_nw_provided_policies, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  NON_3GPP_NW_PROVIDED_POLICIES - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1990,42 +2603,55 @@ int ogs_nas_5gs_encode_non_3gpp_nw_provided_policies(ogs_pkbuf_t *pkbuf, ogs_nas
 {
     int size = sizeof(ogs_nas_non_3gpp_nw_provided_policies_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, non_3gpp_nw_provided_policies, size);
 
-    ogs_trace("  NON_3GPP_NW_PROVIDED_POLICIES - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("NON_3GPP_NW_PROVIDED_POLICIES", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.37 NSSAI
  * O TLV 4-74 */
-int ogs_nas_5gs_decode_nssai(ogs_nas_nssai_t *nssai, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_nssai(ogs_nas_nssai_t *nssai, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_nssai_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_nssai_t *)pkbuf->data;
+    source = (ogs_nas_nssai_t *)data;
 
     nssai->length = source->length;
     size = nssai->length + sizeof(nssai->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*nssai) < size) return -1;
-    memcpy(nssai, pkbuf->data - size, size);
+    memcpy(nssai, data, size);
+
+    ogs_nas_trace_ie("NSSAI", data, size);
+
+    return size;
+}
 
-    ogs_trace("  NSSAI - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+int ogs_nas_5gs_decode_nssai(ogs_nas_nssai_t *nssai, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_nssai(nssai, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2036,30 +2662,43 @@ int ogs_nas_5gs_encode_nssai(ogs_pkbuf_t *pkbuf, ogs_nas_nssai_t *nssai)
     ogs_nas_nssai_t target;
 
     memcpy(&target, nssai, sizeof(ogs_nas_nssai_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  NSSAI - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("NSSAI", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.37A NSSAI inclusion mode
  * O TV 1 */
-int ogs_nas_5gs_decode_nssai_inclusion_mode(ogs_nas_nssai_inclusion_mode_t *nssai_inclusion_mode, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_nssai_inclusion_mode(ogs_nas_nssai_inclusion_mode_t *nssai_inclusion_mode, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_nssai_inclusion_mode_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(nssai_inclusion_mode, pkbuf->data - size, size);
+    memcpy(nssai_inclusion_mode, data, size);
+
+    ogs_nas_trace_ie("NSSAI_INCLUSION_MODE", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_nssai_inclusion_mode(ogs_nas_nssai_inclusion_mode_t *nssai_inclusion_mode, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_nssai_inclusion_mode(nssai_inclusion_mode, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  NSSAI_INCLUSION_MODE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2068,41 +2707,54 @@ int ogs_nas_5gs_encode_nssai_inclusion_mode(ogs_pkbuf_t *pkbuf, ogs_nas_nssai_in
 {
     int size = sizeof(ogs_nas_nssai_inclusion_mode_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, nssai_inclusion_mode, size);
 
-    ogs_trace("  NSSAI_INCLUSION_MODE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("NSSAI_INCLUSION_MODE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.38 Operator-defined access category definitions
  * O TLV-E 3-8323 */
-int ogs_nas_5gs_decode_operator_defined_access_category_definitions(ogs_nas_operator_defined_access_category_definitions_t *operator_defined_access_category_definitions, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_operator_defined_access_category_definitions(ogs_nas_operator_defined_access_category_definitions_t *operator_defined_access_category_definitions, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_operator_defined_access_category_definitions_t *source = NULL;
 
-    if (pkbuf->len < 2) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 2) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_operator_defined_access_category_definitions_t *)pkbuf->data;
+    source = (ogs_nas_operator_defined_access_category_definitions_t *)data;
 
     operator_defined_access_category_definitions->length = be16toh(source->length);
     size = operator_defined_access_category_definitions->length + sizeof(operator_defined_access_category_definitions->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    operator_defined_access_category_definitions->buffer = pkbuf->data - size + sizeof(operator_defined_access_category_definitions->length);
+    operator_defined_access_category_definitions->buffer = data + sizeof(operator_defined_access_category_definitions->length);
+
+    ogs_nas_trace_ie("OPERATOR_DEFINED_ACCESS_CATEGORY_DEFINITIONS", operator_defined_access_category_definitions->buffer, operator_defined_access_category_definitions->length);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_operator_defined_access_category_definitions(ogs_nas_operator_defined_access_category_definitions_t *operator_defined_access_category_definitions, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_operator_defined_access_category_definitions(operator_defined_access_category_definitions, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  OPERATOR_DEFINED_ACCESS_CATEGORY_DEFINITIONS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, (void*)operator_defined_access_category_definitions->buffer, operator_defined_access_category_definitions->length);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2116,46 +2768,62 @@ int ogs_nas_5gs_encode_operator_defined_access_category_definitions(ogs_pkbuf_t
     ogs_assert(operator_defined_access_category_definitions->buffer);
 
     size = sizeof(operator_defined_access_category_definitions->length);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     target = htobe16(operator_defined_access_category_definitions->length);
     memcpy(pkbuf->data - size, &target, size);
 
     size = operator_defined_access_category_definitions->length;
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, operator_defined_access_category_definitions->buffer, size);
 
-    ogs_trace("  OPERATOR_DEFINED_ACCESS_CATEGORY_DEFINITIONS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("OPERATOR_DEFINED_ACCESS_CATEGORY_DEFINITIONS", pkbuf->data - size, size);
 
     return operator_defined_access_category_definitions->length + sizeof(operator_defined_access_category_definitions->length);
 }
 
 /* 9.11.3.39 Payload container
  * O TLV-E 4-65538 */
-int ogs_nas_5gs_decode_payload_container(ogs_nas_payload_container_t *payload_container, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_payload_container(ogs_nas_payload_container_t *payload_container, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_payload_container_t *source = NULL;
 
-    if (pkbuf->len < 2) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 2) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_payload_container_t *)pkbuf->data;
+    source = (ogs_nas_payload_container_t *)data;
 
     payload_container->length = be16toh(source->length);
     size = payload_container->length + sizeof(payload_container->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    payload_container->buffer = pkbuf->data - size + sizeof(payload_container->length);
+    payload_container->buffer = data + sizeof(payload_container->length);
+
+    ogs_nas_trace_ie("PAYLOAD_CONTAINER", payload_container->buffer, payload_container->length);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_payload_container(ogs_nas_payload_container_t *payload_container, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_payload_container(payload_container, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  PAYLOAD_CONTAINER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, (void*)payload_container->buffer, payload_container->length);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2169,46 +2837,62 @@ int ogs_nas_5gs_encode_payload_container(ogs_pkbuf_t *pkbuf, ogs_nas_payload_con
     ogs_assert(payload_container->buffer);
 
     size = sizeof(payload_container->length);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     target = htobe16(payload_container->length);
     memcpy(pkbuf->data - size, &target, size);
 
     size = payload_container->length;
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, payload_container->buffer, size);
 
-    ogs_trace("  PAYLOAD_CONTAINER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("PAYLOAD_CONTAINER", pkbuf->data - size, size);
 
     return payload_container->length + sizeof(payload_container->length);
 }
 
 /* 9.11.3.4 5GS mobile identity
  * M LV-E 6-n */
-int ogs_nas_5gs_decode_5gs_mobile_identity(ogs_nas_5gs_mobile_identity_t *mobile_identity, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_5gs_mobile_identity(ogs_nas_5gs_mobile_identity_t *mobile_identity, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_5gs_mobile_identity_t *source = NULL;
 
-    if (pkbuf->len < 2) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 2) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_5gs_mobile_identity_t *)pkbuf->data;
+    source = (ogs_nas_5gs_mobile_identity_t *)data;
 
     mobile_identity->length = be16toh(source->length);
     size = mobile_identity->length + sizeof(mobile_identity->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    mobile_identity->buffer = pkbuf->data - size + sizeof(mobile_identity->length);
+    mobile_identity->buffer = data + sizeof(mobile_identity->length);
+
+    ogs_nas_trace_ie("5GS_MOBILE_IDENTITY", mobile_identity->buffer, mobile_identity->length);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_5gs_mobile_identity(ogs_nas_5gs_mobile_identity_t *mobile_identity, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_5gs_mobile_identity(mobile_identity, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  5GS_MOBILE_IDENTITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, (void*)mobile_identity->buffer, mobile_identity->length);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2222,35 +2906,51 @@ int ogs_nas_5gs_encode_5gs_mobile_identity(ogs_pkbuf_t *pkbuf, ogs_nas_5gs_mobil
     ogs_assert(mobile_identity->buffer);
 
     size = sizeof(mobile_identity->length);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     target = htobe16(mobile_identity->length);
     memcpy(pkbuf->data - size, &target, size);
 
     size = mobile_identity->length;
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, mobile_identity->buffer, size);
 
-    ogs_trace("  5GS_MOBILE_IDENTITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("5GS_MOBILE_IDENTITY", pkbuf->data - size, size);
 
     return mobile_identity->length + sizeof(mobile_identity->length);
 }
 
 /* 9.11.3.40 Payload container type
  * O TV 1 */
-int ogs_nas_5gs_decode_payload_container_type(ogs_nas_payload_container_type_t *payload_container_type, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_payload_container_type(ogs_nas_payload_container_type_t *payload_container_type, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_payload_container_type_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(payload_container_type, pkbuf->data - size, size);
+    memcpy(payload_container_type, data, size);
+
+    ogs_nas_trace_ie("PAYLOAD_CONTAINER_TYPE", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_payload_container_type(ogs_nas_payload_container_type_t *payload_container_type, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_payload_container_type(payload_container_type, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  PAYLOAD_CONTAINER_TYPE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2259,30 +2959,43 @@ int ogs_nas_5gs_encode_payload_container_type(ogs_pkbuf_t *pkbuf, ogs_nas_payloa
 {
     int size = sizeof(ogs_nas_payload_container_type_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, payload_container_type, size);
 
-    ogs_trace("  PAYLOAD_CONTAINER_TYPE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("PAYLOAD_CONTAINER_TYPE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.41 PDU session identity 2
  * C TV 2 */
-int ogs_nas_5gs_decode_pdu_session_identity_2(ogs_nas_pdu_session_identity_2_t *pdu_session_identity_2, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_pdu_session_identity_2(ogs_nas_pdu_session_identity_2_t *pdu_session_identity_2, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_pdu_session_identity_2_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(pdu_session_identity_2, pkbuf->data - size, size);
+    memcpy(pdu_session_identity_2, data, size);
+
+    ogs_nas_trace_ie("PDU_SESSION_IDENTITY_2", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_pdu_session_identity_2(ogs_nas_pdu_session_identity_2_t *pdu_session_identity_2, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_pdu_session_identity_2(pdu_session_identity_2, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  PDU_SESSION_IDENTITY_2 - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2293,44 +3006,57 @@ int ogs_nas_5gs_encode_pdu_session_identity_2(ogs_pkbuf_t *pkbuf, ogs_nas_pdu_se
     ogs_nas_pdu_session_identity_2_t target;
 
     memcpy(&target, pdu_session_identity_2, size);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  PDU_SESSION_IDENTITY_2 - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("PDU_SESSION_IDENTITY_2", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.42 PDU session reactivation result
  * O TLV 4-34 */
-int ogs_nas_5gs_decode_pdu_session_reactivation_result(ogs_nas_pdu_session_reactivation_result_t *pdu_session_reactivation_result, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_pdu_session_reactivation_result(ogs_nas_pdu_session_reactivation_result_t *pdu_session_reactivation_result, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_pdu_session_reactivation_result_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_pdu_session_reactivation_result_t *)pkbuf->data;
+    source = (ogs_nas_pdu_session_reactivation_result_t *)data;
 
     pdu_session_reactivation_result->length = source->length;
     size = pdu_session_reactivation_result->length + sizeof(pdu_session_reactivation_result->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*pdu_session_reactivation_result) < size) return -1;
-    memcpy(pdu_session_reactivation_result, pkbuf->data - size, size);
+    memcpy(pdu_session_reactivation_result, data, size);
 
     pdu_session_reactivation_result->psi = be16toh(pdu_session_reactivation_result->psi);
 
-    ogs_trace("  PDU_SESSION_REACTIVATION_RESULT - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("PDU_SESSION_REACTIVATION_RESULT", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_pdu_session_reactivation_result(ogs_nas_pdu_session_reactivation_result_t *pdu_session_reactivation_result, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_pdu_session_reactivation_result(pdu_session_reactivation_result, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2343,41 +3069,54 @@ int ogs_nas_5gs_encode_pdu_session_reactivation_result(ogs_pkbuf_t *pkbuf, ogs_n
     memcpy(&target, pdu_session_reactivation_result, sizeof(ogs_nas_pdu_session_reactivation_result_t));
     target.psi = htobe16(pdu_session_reactivation_result->psi);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  PDU_SESSION_REACTIVATION_RESULT - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("PDU_SESSION_REACTIVATION_RESULT", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.43 PDU session reactivation result error cause
  * O TLV-E 5-515 */
-int ogs_nas_5gs_decode_pdu_session_reactivation_result_error_cause(ogs_nas_pdu_session_reactivation_result_error_cause_t *pdu_session_reactivation_result_error_cause, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_pdu_session_reactivation_result_error_cause(ogs_nas_pdu_session_reactivation_result_error_cause_t *pdu_session_reactivation_result_error_cause, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_pdu_session_reactivation_result_error_cause_t *source = NULL;
 
-    if (pkbuf->len < 2) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 2) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_pdu_session_reactivation_result_error_cause_t *)pkbuf->data;
+    source = (ogs_nas_pdu_session_reactivation_result_error_cause_t *)data;
 
     pdu_session_reactivation_result_error_cause->length = be16toh(source->length);
     size = pdu_session_reactivation_result_error_cause->length + sizeof(pdu_session_reactivation_result_error_cause->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    pdu_session_reactivation_result_error_cause->buffer = pkbuf->data - size + sizeof(pdu_session_reactivation_result_error_cause->length);
+    pdu_session_reactivation_result_error_cause->buffer = data + sizeof(pdu_session_reactivation_result_error_cause->length);
+
+    ogs_nas_trace_ie("PDU_SESSION_REACTIVATION_RESULT_ERROR_CAUSE", pdu_session_reactivation_result_error_cause->buffer, pdu_session_reactivation_result_error_cause->length);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_pdu_session_reactivation_result_error_cause(ogs_nas_pdu_session_reactivation_result_error_cause_t *pdu_session_reactivation_result_error_cause, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_pdu_session_reactivation_result_error_cause(pdu_session_reactivation_result_error_cause, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  PDU_SESSION_REACTIVATION_RESULT_ERROR_CAUSE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, (void*)pdu_session_reactivation_result_error_cause->buffer, pdu_session_reactivation_result_error_cause->length);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2391,49 +3130,65 @@ int ogs_nas_5gs_encode_pdu_session_reactivation_result_error_cause(ogs_pkbuf_t *
     ogs_assert(pdu_session_reactivation_result_error_cause->buffer);
 
     size = sizeof(pdu_session_reactivation_result_error_cause->length);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     target = htobe16(pdu_session_reactivation_result_error_cause->length);
     memcpy(pkbuf->data - size, &target, size);
 
     size = pdu_session_reactivation_result_error_cause->length;
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, pdu_session_reactivation_result_error_cause->buffer, size);
 
-    ogs_trace("  PDU_SESSION_REACTIVATION_RESULT_ERROR_CAUSE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("PDU_SESSION_REACTIVATION_RESULT_ERROR_CAUSE", pkbuf->data - size, size);
 
     return pdu_session_reactivation_result_error_cause->length + sizeof(pdu_session_reactivation_result_error_cause->length);
 }
 
 /* 9.11.3.44 PDU session status
  * O TLV 4-34 */
-int ogs_nas_5gs_decode_pdu_session_status(ogs_nas_pdu_session_status_t *pdu_session_status, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_pdu_session_status(ogs_nas_pdu_session_status_t *pdu_session_status, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_pdu_session_status_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_pdu_session_status_t *)pkbuf->data;
+    source = (ogs_nas_pdu_session_status_t *)data;
 
     pdu_session_status->length = source->length;
     size = pdu_session_status->length + sizeof(pdu_session_status->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*pdu_session_status) < size) return -1;
-    memcpy(pdu_session_status, pkbuf->data - size, size);
+    memcpy(pdu_session_status, data, size);
 
     pdu_session_status->psi = be16toh(pdu_session_status->psi);
 
-    ogs_trace("  PDU_SESSION_STATUS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("PDU_SESSION_STATUS", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_pdu_session_status(ogs_nas_pdu_session_status_t *pdu_session_status, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_pdu_session_status(pdu_session_status, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2446,42 +3201,55 @@ int ogs_nas_5gs_encode_pdu_session_status(ogs_pkbuf_t *pkbuf, ogs_nas_pdu_sessio
     memcpy(&target, pdu_session_status, sizeof(ogs_nas_pdu_session_status_t));
     target.psi = htobe16(pdu_session_status->psi);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  PDU_SESSION_STATUS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("PDU_SESSION_STATUS", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.45 PLMN list
  * O TLV 5-47 */
-int ogs_nas_5gs_decode_plmn_list(ogs_nas_plmn_list_t *plmn_list, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_plmn_list(ogs_nas_plmn_list_t *plmn_list, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_plmn_list_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_plmn_list_t *)pkbuf->data;
+    source = (ogs_nas_plmn_list_t *)data;
 
     plmn_list->length = source->length;
     size = plmn_list->length + sizeof(plmn_list->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*plmn_list) < size) return -1;
-    memcpy(plmn_list, pkbuf->data - size, size);
+    memcpy(plmn_list, data, size);
+
+    ogs_nas_trace_ie("PLMN_LIST", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_plmn_list(ogs_nas_plmn_list_t *plmn_list, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_plmn_list(plmn_list, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  PLMN_LIST - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2492,42 +3260,55 @@ int ogs_nas_5gs_encode_plmn_list(ogs_pkbuf_t *pkbuf, ogs_nas_plmn_list_t *plmn_l
     ogs_nas_plmn_list_t target;
 
     memcpy(&target, plmn_list, sizeof(ogs_nas_plmn_list_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  PLMN_LIST - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("PLMN_LIST", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.46 Rejected NSSAI
  * O TLV 4-42 */
-int ogs_nas_5gs_decode_rejected_nssai(ogs_nas_rejected_nssai_t *rejected_nssai, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_rejected_nssai(ogs_nas_rejected_nssai_t *rejected_nssai, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_rejected_nssai_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_rejected_nssai_t *)pkbuf->data;
+    source = (ogs_nas_rejected_nssai_t *)data;
 
     rejected_nssai->length = source->length;
     size = rejected_nssai->length + sizeof(rejected_nssai->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*rejected_nssai) < size) return -1;
-    memcpy(rejected_nssai, pkbuf->data - size, size);
+    memcpy(rejected_nssai, data, size);
+
+    ogs_nas_trace_ie("REJECTED_NSSAI", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_rejected_nssai(ogs_nas_rejected_nssai_t *rejected_nssai, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_rejected_nssai(rejected_nssai, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  REJECTED_NSSAI - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2538,30 +3319,43 @@ int ogs_nas_5gs_encode_rejected_nssai(ogs_pkbuf_t *pkbuf, ogs_nas_rejected_nssai
     ogs_nas_rejected_nssai_t target;
 
     memcpy(&target, rejected_nssai, sizeof(ogs_nas_rejected_nssai_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  REJECTED_NSSAI - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("REJECTED_NSSAI", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.46A Release assistance indication
  * O TV 1 */
-int ogs_nas_5gs_decode_release_assistance_indication(ogs_nas_release_assistance_indication_t *release_assistance_indication, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_release_assistance_indication(ogs_nas_release_assistance_indication_t *release_assistance_indication, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_release_assistance_indication_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(release_assistance_indication, pkbuf->data - size, size);
+    memcpy(release_assistance_indication, data, size);
+
+    ogs_nas_trace_ie("RELEASE_ASSISTANCE_INDICATION", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_release_assistance_indication(ogs_nas_release_assistance_indication_t *release_assistance_indication, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_release_assistance_indication(release_assistance_indication, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  RELEASE_ASSISTANCE_INDICATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2570,30 +3364,43 @@ int ogs_nas_5gs_encode_release_assistance_indication(ogs_pkbuf_t *pkbuf, ogs_nas
 {
     int size = sizeof(ogs_nas_release_assistance_indication_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, release_assistance_indication, size);
 
-    ogs_trace("  RELEASE_ASSISTANCE_INDICATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("RELEASE_ASSISTANCE_INDICATION", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.47 Request type
  * O TV 1 */
-int ogs_nas_5gs_decode_request_type(ogs_nas_request_type_t *request_type, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_request_type(ogs_nas_request_type_t *request_type, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_request_type_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(request_type, pkbuf->data - size, size);
+    memcpy(request_type, data, size);
+
+    ogs_nas_trace_ie("REQUEST_TYPE", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_request_type(ogs_nas_request_type_t *request_type, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_request_type(request_type, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  REQUEST_TYPE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2602,42 +3409,55 @@ int ogs_nas_5gs_encode_request_type(ogs_pkbuf_t *pkbuf, ogs_nas_request_type_t *
 {
     int size = sizeof(ogs_nas_request_type_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, request_type, size);
 
-    ogs_trace("  REQUEST_TYPE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("REQUEST_TYPE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.48 S1 UE network capability
  * O TLV 4-15 */
-int ogs_nas_5gs_decode_s1_ue_network_capability(ogs_nas_s1_ue_network_capability_t *s1_ue_network_capability, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_s1_ue_network_capability(ogs_nas_s1_ue_network_capability_t *s1_ue_network_capability, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_s1_ue_network_capability_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_s1_ue_network_capability_t *)pkbuf->data;
+    source = (ogs_nas_s1_ue_network_capability_t *)data;
 
     s1_ue_network_capability->length = source->length;
     size = s1_ue_network_capability->length + sizeof(s1_ue_network_capability->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*s1_ue_network_capability) < size) return -1;
-    memcpy(s1_ue_network_capability, pkbuf->data - size, size);
+    memcpy(s1_ue_network_capability, data, size);
+
+    ogs_nas_trace_ie("S1_UE_NETWORK_CAPABILITY", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_s1_ue_network_capability(ogs_nas_s1_ue_network_capability_t *s1_ue_network_capability, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_s1_ue_network_capability(s1_ue_network_capability, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  S1_UE_NETWORK_CAPABILITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2648,42 +3468,55 @@ int ogs_nas_5gs_encode_s1_ue_network_capability(ogs_pkbuf_t *pkbuf, ogs_nas_s1_u
     ogs_nas_s1_ue_network_capability_t target;
 
     memcpy(&target, s1_ue_network_capability, sizeof(ogs_nas_s1_ue_network_capability_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  S1_UE_NETWORK_CAPABILITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("S1_UE_NETWORK_CAPABILITY", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.48A S1 UE security capability
  * O TLV 4-7 */
-int ogs_nas_5gs_decode_s1_ue_security_capability(ogs_nas_s1_ue_security_capability_t *s1_ue_security_capability, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_s1_ue_security_capability(ogs_nas_s1_ue_security_capability_t *s1_ue_security_capability, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_s1_ue_security_capability_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_s1_ue_security_capability_t *)pkbuf->data;
+    source = (ogs_nas_s1_ue_security_capability_t *)data;
 
     s1_ue_security_capability->length = source->length;
     size = s1_ue_security_capability->length + sizeof(s1_ue_security_capability->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*s1_ue_security_capability) < size) return -1;
-    memcpy(s1_ue_security_capability, pkbuf->data - size, size);
+    memcpy(s1_ue_security_capability, data, size);
+
+    ogs_nas_trace_ie("S1_UE_SECURITY_CAPABILITY", data, size);
 
-    ogs_trace("  S1_UE_SECURITY_CAPABILITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    return size;
+}
+
+int ogs_nas_5gs_decode_s1_ue_security_capability(ogs_nas_s1_ue_security_capability_t *s1_ue_security_capability, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_s1_ue_security_capability(s1_ue_security_capability, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2694,42 +3527,55 @@ int ogs_nas_5gs_encode_s1_ue_security_capability(ogs_pkbuf_t *pkbuf, ogs_nas_s1_
     ogs_nas_s1_ue_security_capability_t target;
 
     memcpy(&target, s1_ue_security_capability, sizeof(ogs_nas_s1_ue_security_capability_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  S1_UE_SECURITY_CAPABILITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("S1_UE_SECURITY_CAPABILITY", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.49 Service area list
  * O TLV 6-114 */
-int ogs_nas_5gs_decode_service_area_list(ogs_nas_service_area_list_t *service_area_list, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_service_area_list(ogs_nas_service_area_list_t *service_area_list, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_service_area_list_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_service_area_list_t *)pkbuf->data;
+    source = (ogs_nas_service_area_list_t *)data;
 
     service_area_list->length = source->length;
     size = service_area_list->length + sizeof(service_area_list->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*service_area_list) < size) return -1;
-    memcpy(service_area_list, pkbuf->data - size, size);
+    memcpy(service_area_list, data, size);
+
+    ogs_nas_trace_ie("SERVICE_AREA_LIST", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_service_area_list(ogs_nas_service_area_list_t *service_area_list, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_service_area_list(service_area_list, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  SERVICE_AREA_LIST - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2740,42 +3586,55 @@ int ogs_nas_5gs_encode_service_area_list(ogs_pkbuf_t *pkbuf, ogs_nas_service_are
     ogs_nas_service_area_list_t target;
 
     memcpy(&target, service_area_list, sizeof(ogs_nas_service_area_list_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  SERVICE_AREA_LIST - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("SERVICE_AREA_LIST", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.5 5GS network feature support
  * O TLV 3-5 */
-int ogs_nas_5gs_decode_5gs_network_feature_support(ogs_nas_5gs_network_feature_support_t *network_feature_support, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_5gs_network_feature_support(ogs_nas_5gs_network_feature_support_t *network_feature_support, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_5gs_network_feature_support_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_5gs_network_feature_support_t *)pkbuf->data;
+    source = (ogs_nas_5gs_network_feature_support_t *)data;
 
     network_feature_support->length = source->length;
     size = network_feature_support->length + sizeof(network_feature_support->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*network_feature_support) < size) return -1;
-    memcpy(network_feature_support, pkbuf->data - size, size);
+    memcpy(network_feature_support, data, size);
+
+    ogs_nas_trace_ie("5GS_NETWORK_FEATURE_SUPPORT", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_5gs_network_feature_support(ogs_nas_5gs_network_feature_support_t *network_feature_support, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_5gs_network_feature_support(network_feature_support, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  5GS_NETWORK_FEATURE_SUPPORT - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2786,30 +3645,43 @@ int ogs_nas_5gs_encode_5gs_network_feature_support(ogs_pkbuf_t *pkbuf, ogs_nas_5
     ogs_nas_5gs_network_feature_support_t target;
 
     memcpy(&target, network_feature_support, sizeof(ogs_nas_5gs_network_feature_support_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  5GS_NETWORK_FEATURE_SUPPORT - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("5GS_NETWORK_FEATURE_SUPPORT", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.50A SMS indication
  * O TV 1 */
-int ogs_nas_5gs_decode_sms_indication(ogs_nas_sms_indication_t *sms_indication, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_sms_indication(ogs_nas_sms_indication_t *sms_indication, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_sms_indication_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(sms_indication, pkbuf->data - size, size);
+    memcpy(sms_indication, data, size);
+
+    ogs_nas_trace_ie("SMS_INDICATION", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_sms_indication(ogs_nas_sms_indication_t *sms_indication, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_sms_indication(sms_indication, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  SMS_INDICATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2818,41 +3690,54 @@ int ogs_nas_5gs_encode_sms_indication(ogs_pkbuf_t *pkbuf, ogs_nas_sms_indication
 {
     int size = sizeof(ogs_nas_sms_indication_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, sms_indication, size);
 
-    ogs_trace("  SMS_INDICATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("SMS_INDICATION", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.51 SOR transparent container
  * O TLV-E 20-n */
-int ogs_nas_5gs_decode_sor_transparent_container(ogs_nas_sor_transparent_container_t *sor_transparent_container, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_sor_transparent_container(ogs_nas_sor_transparent_container_t *sor_transparent_container, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_sor_transparent_container_t *source = NULL;
 
-    if (pkbuf->len < 2) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 2) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_sor_transparent_container_t *)pkbuf->data;
+    source = (ogs_nas_sor_transparent_container_t *)data;
 
     sor_transparent_container->length = be16toh(source->length);
     size = sor_transparent_container->length + sizeof(sor_transparent_container->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    sor_transparent_container->buffer = pkbuf->data - size + sizeof(sor_transparent_container->length);
+    sor_transparent_container->buffer = data + sizeof(sor_transparent_container->length);
+
+    ogs_nas_trace_ie("SOR_TRANSPARENT_CONTAINER", sor_transparent_container->buffer, sor_transparent_container->length);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_sor_transparent_container(ogs_nas_sor_transparent_container_t *sor_transparent_container, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_sor_transparent_container(sor_transparent_container, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  SOR_TRANSPARENT_CONTAINER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, (void*)sor_transparent_container->buffer, sor_transparent_container->length);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2866,47 +3751,63 @@ int ogs_nas_5gs_encode_sor_transparent_container(ogs_pkbuf_t *pkbuf, ogs_nas_sor
     ogs_assert(sor_transparent_container->buffer);
 
     size = sizeof(sor_transparent_container->length);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     target = htobe16(sor_transparent_container->length);
     memcpy(pkbuf->data - size, &target, size);
 
     size = sor_transparent_container->length;
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, sor_transparent_container->buffer, size);
 
-    ogs_trace("  SOR_TRANSPARENT_CONTAINER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("SOR_TRANSPARENT_CONTAINER", pkbuf->data - size, size);
 
     return sor_transparent_container->length + sizeof(sor_transparent_container->length);
 }
 
 /* 9.11.3.51A Supported codec list
  * O TLV 5-n */
-int ogs_nas_5gs_decode_supported_codec_list(ogs_nas_supported_codec_list_t *supported_codec_list, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_supported_codec_list(ogs_nas_supported_codec_list_t *supported_codec_list, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_supported_codec_list_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_supported_codec_list_t *)pkbuf->data;
+    source = (ogs_nas_supported_codec_list_t *)data;
 
     supported_codec_list->length = source->length;
     size = supported_codec_list->length + sizeof(supported_codec_list->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*supported_codec_list) < size) return -1;
-    memcpy(supported_codec_list, pkbuf->data - size, size);
+    memcpy(supported_codec_list, data, size);
+
+    ogs_nas_trace_ie("SUPPORTED_CODEC_LIST", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_supported_codec_list(ogs_nas_supported_codec_list_t *supported_codec_list, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_supported_codec_list(supported_codec_list, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  SUPPORTED_CODEC_LIST - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2917,30 +3818,43 @@ int ogs_nas_5gs_encode_supported_codec_list(ogs_pkbuf_t *pkbuf, ogs_nas_supporte
     ogs_nas_supported_codec_list_t target;
 
     memcpy(&target, supported_codec_list, sizeof(ogs_nas_supported_codec_list_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  SUPPORTED_CODEC_LIST - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("SUPPORTED_CODEC_LIST", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.52 Time zone
  * O TV 2 */
-int ogs_nas_5gs_decode_time_zone(ogs_nas_time_zone_t *time_zone, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_time_zone(ogs_nas_time_zone_t *time_zone, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_time_zone_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(time_zone, pkbuf->data - size, size);
+    memcpy(time_zone, data, size);
+
+    ogs_nas_trace_ie("TIME_ZONE", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_time_zone(ogs_nas_time_zone_t *time_zone, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_time_zone(time_zone, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  TIME_ZONE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2951,30 +3865,43 @@ int ogs_nas_5gs_encode_time_zone(ogs_pkbuf_t *pkbuf, ogs_nas_time_zone_t *time_z
     ogs_nas_time_zone_t target;
 
     memcpy(&target, time_zone, size);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  TIME_ZONE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("TIME_ZONE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.53 Time zone and time
  * O TV 8 */
-int ogs_nas_5gs_decode_time_zone_and_time(ogs_nas_time_zone_and_time_t *time_zone_and_time, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_time_zone_and_time(ogs_nas_time_zone_and_time_t *time_zone_and_time, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_time_zone_and_time_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(time_zone_and_time, pkbuf->data - size, size);
+    memcpy(time_zone_and_time, data, size);
+
+    ogs_nas_trace_ie("TIME_ZONE_AND_TIME", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_time_zone_and_time(ogs_nas_time_zone_and_time_t *time_zone_and_time, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_time_zone_and_time(time_zone_and_time, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  TIME_ZONE_AND_TIME - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2985,42 +3912,55 @@ int ogs_nas_5gs_encode_time_zone_and_time(ogs_pkbuf_t *pkbuf, ogs_nas_time_zone_
     ogs_nas_time_zone_and_time_t target;
 
     memcpy(&target, time_zone_and_time, size);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  TIME_ZONE_AND_TIME - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("TIME_ZONE_AND_TIME", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.54 UE security capability
  * O TLV 4-10 */
-int ogs_nas_5gs_decode_ue_security_capability(ogs_nas_ue_security_capability_t *ue_security_capability, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_ue_security_capability(ogs_nas_ue_security_capability_t *ue_security_capability, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_ue_security_capability_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_ue_security_capability_t *)pkbuf->data;
+    source = (ogs_nas_ue_security_capability_t *)data;
 
     ue_security_capability->length = source->length;
     size = ue_security_capability->length + sizeof(ue_security_capability->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*ue_security_capability) < size) return -1;
-    memcpy(ue_security_capability, pkbuf->data - size, size);
+    memcpy(ue_security_capability, data, size);
+
+    ogs_nas_trace_ie("UE_SECURITY_CAPABILITY", data, size);
+
+    return size;
+}
 
-    ogs_trace("  UE_SECURITY_CAPABILITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+int ogs_nas_5gs_decode_ue_security_capability(ogs_nas_ue_security_capability_t *ue_security_capability, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_ue_security_capability(ue_security_capability, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3031,42 +3971,55 @@ int ogs_nas_5gs_encode_ue_security_capability(ogs_pkbuf_t *pkbuf, ogs_nas_ue_sec
     ogs_nas_ue_security_capability_t target;
 
     memcpy(&target, ue_security_capability, sizeof(ogs_nas_ue_security_capability_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  UE_SECURITY_CAPABILITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("UE_SECURITY_CAPABILITY", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.55 UE usage setting
  * O TLV 3 */
-int ogs_nas_5gs_decode_ue_usage_setting(ogs_nas_ue_usage_setting_t *ue_usage_setting, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_ue_usage_setting(ogs_nas_ue_usage_setting_t *ue_usage_setting, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_ue_usage_setting_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_ue_usage_setting_t *)pkbuf->data;
+    source = (ogs_nas_ue_usage_setting_t *)data;
 
     ue_usage_setting->length = source->length;
     size = ue_usage_setting->length + sizeof(ue_usage_setting->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*ue_usage_setting) < size) return -1;
-    memcpy(ue_usage_setting, pkbuf->data - size, size);
+    memcpy(ue_usage_setting, data, size);
+
+    ogs_nas_trace_ie("UE_USAGE_SETTING", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_ue_usage_setting(ogs_nas_ue_usage_setting_t *ue_usage_setting, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_ue_usage_setting(ue_usage_setting, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  UE_USAGE_SETTING - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3077,42 +4030,55 @@ int ogs_nas_5gs_encode_ue_usage_setting(ogs_pkbuf_t *pkbuf, ogs_nas_ue_usage_set
     ogs_nas_ue_usage_setting_t target;
 
     memcpy(&target, ue_usage_setting, sizeof(ogs_nas_ue_usage_setting_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  UE_USAGE_SETTING - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("UE_USAGE_SETTING", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.56 UE status
  * O TLV 3 */
-int ogs_nas_5gs_decode_ue_status(ogs_nas_ue_status_t *ue_status, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_ue_status(ogs_nas_ue_status_t *ue_status, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_ue_status_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_ue_status_t *)pkbuf->data;
+    source = (ogs_nas_ue_status_t *)data;
 
     ue_status->length = source->length;
     size = ue_status->length + sizeof(ue_status->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*ue_status) < size) return -1;
-    memcpy(ue_status, pkbuf->data - size, size);
+    memcpy(ue_status, data, size);
+
+    ogs_nas_trace_ie("UE_STATUS", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_ue_status(ogs_nas_ue_status_t *ue_status, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_ue_status(ue_status, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  UE_STATUS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3123,44 +4089,57 @@ int ogs_nas_5gs_encode_ue_status(ogs_pkbuf_t *pkbuf, ogs_nas_ue_status_t *ue_sta
     ogs_nas_ue_status_t target;
 
     memcpy(&target, ue_status, sizeof(ogs_nas_ue_status_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  UE_STATUS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("UE_STATUS", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.57 Uplink data status
  * O TLV 4-34 */
-int ogs_nas_5gs_decode_uplink_data_status(ogs_nas_uplink_data_status_t *uplink_data_status, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_uplink_data_status(ogs_nas_uplink_data_status_t *uplink_data_status, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_uplink_data_status_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_uplink_data_status_t *)pkbuf->data;
+    source = (ogs_nas_uplink_data_status_t *)data;
 
     uplink_data_status->length = source->length;
     size = uplink_data_status->length + sizeof(uplink_data_status->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*uplink_data_status) < size) return -1;
-    memcpy(uplink_data_status, pkbuf->data - size, size);
+    memcpy(uplink_data_status, data, size);
 
     uplink_data_status->psi = be16toh(uplink_data_status->psi);
 
-    ogs_trace("  UPLINK_DATA_STATUS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("UPLINK_DATA_STATUS", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_uplink_data_status(ogs_nas_uplink_data_status_t *uplink_data_status, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_uplink_data_status(uplink_data_status, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3173,42 +4152,55 @@ int ogs_nas_5gs_encode_uplink_data_status(ogs_pkbuf_t *pkbuf, ogs_nas_uplink_dat
     memcpy(&target, uplink_data_status, sizeof(ogs_nas_uplink_data_status_t));
     target.psi = htobe16(uplink_data_status->psi);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  UPLINK_DATA_STATUS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("UPLINK_DATA_STATUS", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.6 5GS registration result
  * M LV 2 */
-int ogs_nas_5gs_decode_5gs_registration_result(ogs_nas_5gs_registration_result_t *registration_result, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_5gs_registration_result(ogs_nas_5gs_registration_result_t *registration_result, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_5gs_registration_result_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_5gs_registration_result_t *)pkbuf->data;
+    source = (ogs_nas_5gs_registration_result_t *)data;
 
     registration_result->length = source->length;
     size = registration_result->length + sizeof(registration_result->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*registration_result) < size) return -1;
-    memcpy(registration_result, pkbuf->data - size, size);
+    memcpy(registration_result, data, size);
+
+    ogs_nas_trace_ie("5GS_REGISTRATION_RESULT", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_5gs_registration_result(ogs_nas_5gs_registration_result_t *registration_result, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_5gs_registration_result(registration_result, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  5GS_REGISTRATION_RESULT - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3219,42 +4211,55 @@ int ogs_nas_5gs_encode_5gs_registration_result(ogs_pkbuf_t *pkbuf, ogs_nas_5gs_r
     ogs_nas_5gs_registration_result_t target;
 
     memcpy(&target, registration_result, sizeof(ogs_nas_5gs_registration_result_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  5GS_REGISTRATION_RESULT - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("5GS_REGISTRATION_RESULT", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.68 UE radio capability ID
  * O TLV 3-n */
-int ogs_nas_5gs_decode_ue_radio_capability_id(ogs_nas_ue_radio_capability_id_t *ue_radio_capability_id, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_ue_radio_capability_id(ogs_nas_ue_radio_capability_id_t *ue_radio_capability_id, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_ue_radio_capability_id_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_ue_radio_capability_id_t *)pkbuf->data;
+    source = (ogs_nas_ue_radio_capability_id_t *)data;
 
     ue_radio_capability_id->length = source->length;
     size = ue_radio_capability_id->length + sizeof(ue_radio_capability_id->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*ue_radio_capability_id) < size) return -1;
-    memcpy(ue_radio_capability_id, pkbuf->data - size, size);
+    memcpy(ue_radio_capability_id, data, size);
+
+    ogs_nas_trace_ie("UE_RADIO_CAPABILITY_ID", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_ue_radio_capability_id(ogs_nas_ue_radio_capability_id_t *ue_radio_capability_id, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_ue_radio_capability_id(ue_radio_capability_id, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  UE_RADIO_CAPABILITY_ID - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3265,30 +4270,43 @@ int ogs_nas_5gs_encode_ue_radio_capability_id(ogs_pkbuf_t *pkbuf, ogs_nas_ue_rad
     ogs_nas_ue_radio_capability_id_t target;
 
     memcpy(&target, ue_radio_capability_id, sizeof(ogs_nas_ue_radio_capability_id_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  UE_RADIO_CAPABILITY_ID - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("UE_RADIO_CAPABILITY_ID", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.69 UE radio capability ID deletion indication
  * O TV 1 */
-int ogs_nas_5gs_decode_ue_radio_capability_id_deletion_indication(ogs_nas_ue_radio_capability_id_deletion_indication_t *ue_radio_capability_id_deletion_indication, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_ue_radio_capability_id_deletion_indication(ogs_nas_ue_radio_capability_id_deletion_indication_t *ue_radio_capability_id_deletion_indication, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_ue_radio_capability_id_deletion_indication_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(ue_radio_capability_id_deletion_indication, pkbuf->data - size, size);
+    memcpy(ue_radio_capability_id_deletion_indication, data, size);
+
+    ogs_nas_trace_ie("UE_RADIO_CAPABILITY_ID_DELETION_INDICATION", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_ue_radio_capability_id_deletion_indication(ogs_nas_ue_radio_capability_id_deletion_indication_t *ue_radio_capability_id_deletion_indication, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_ue_radio_capability_id_deletion_indication(ue_radio_capability_id_deletion_indication, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  UE_RADIO_CAPABILITY_ID_DELETION_INDICATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3297,30 +4315,43 @@ int ogs_nas_5gs_encode_ue_radio_capability_id_deletion_indication(ogs_pkbuf_t *p
 {
     int size = sizeof(ogs_nas_ue_radio_capability_id_deletion_indication_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, ue_radio_capability_id_deletion_indication, size);
 
-    ogs_trace("  UE_RADIO_CAPABILITY_ID_DELETION_INDICATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("UE_RADIO_CAPABILITY_ID_DELETION_INDICATION", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.7 5GS registration type
  * M V 1/2 */
-int ogs_nas_5gs_decode_5gs_registration_type(ogs_nas_5gs_registration_type_t *registration_type, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_5gs_registration_type(ogs_nas_5gs_registration_type_t *registration_type, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_5gs_registration_type_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(registration_type, pkbuf->data - size, size);
+    memcpy(registration_type, data, size);
+
+    ogs_nas_trace_ie("5GS_REGISTRATION_TYPE", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_5gs_registration_type(ogs_nas_5gs_registration_type_t *registration_type, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_5gs_registration_type(registration_type, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  5GS_REGISTRATION_TYPE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3331,42 +4362,55 @@ int ogs_nas_5gs_encode_5gs_registration_type(ogs_pkbuf_t *pkbuf, ogs_nas_5gs_reg
     ogs_nas_5gs_registration_type_t target;
 
     memcpy(&target, registration_type, size);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  5GS_REGISTRATION_TYPE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("5GS_REGISTRATION_TYPE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.70 Truncated 5G-S-TMSI configuration
  * O TLV 3 */
-int ogs_nas_5gs_decode_truncated_5g_s_tmsi_configuration(ogs_nas_truncated_5g_s_tmsi_configuration_t *truncated_s_tmsi_configuration, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_truncated_5g_s_tmsi_configuration(ogs_nas_truncated_5g_s_tmsi_configuration_t *truncated_s_tmsi_configuration, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_truncated_5g_s_tmsi_configuration_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_truncated_5g_s_tmsi_configuration_t *)pkbuf->data;
+    source = (ogs_nas_truncated_5g_s_tmsi_configuration_t *)data;
 
     truncated_s_tmsi_configuration->length = source->length;
     size = truncated_s_tmsi_configuration->length + sizeof(truncated_s_tmsi_configuration->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*truncated_s_tmsi_configuration) < size) return -1;
-    memcpy(truncated_s_tmsi_configuration, pkbuf->data - size, size);
+    memcpy(truncated_s_tmsi_configuration, data, size);
+
+    ogs_nas_trace_ie("TRUNCATED_5G_S_TMSI_CONFIGURATION", data, size);
+
+    return size;
+}
 
-    ogs_trace("  TRUNCATED_5G_S_TMSI_CONFIGURATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+int ogs_nas_5gs_decode_truncated_5g_s_tmsi_configuration(ogs_nas_truncated_5g_s_tmsi_configuration_t *truncated_s_tmsi_configuration, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_truncated_5g_s_tmsi_configuration(truncated_s_tmsi_configuration, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3377,42 +4421,55 @@ int ogs_nas_5gs_encode_truncated_5g_s_tmsi_configuration(ogs_pkbuf_t *pkbuf, ogs
     ogs_nas_truncated_5g_s_tmsi_configuration_t target;
 
     memcpy(&target, truncated_s_tmsi_configuration, sizeof(ogs_nas_truncated_5g_s_tmsi_configuration_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  TRUNCATED_5G_S_TMSI_CONFIGURATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("TRUNCATED_5G_S_TMSI_CONFIGURATION", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.71 WUS assistance information
  * O TLV 3-n */
-int ogs_nas_5gs_decode_wus_assistance_information(ogs_nas_wus_assistance_information_t *wus_assistance_information, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_wus_assistance_information(ogs_nas_wus_assistance_information_t *wus_assistance_information, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_wus_assistance_information_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_wus_assistance_information_t *)pkbuf->data;
+    source = (ogs_nas_wus_assistance_information_t *)data;
 
     wus_assistance_information->length = source->length;
     size = wus_assistance_information->length + sizeof(wus_assistance_information->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*wus_assistance_information) < size) return -1;
-    memcpy(wus_assistance_information, pkbuf->data - size, size);
+    memcpy(wus_assistance_information, data, size);
+
+    ogs_nas_trace_ie("WUS_ASSISTANCE_INFORMATION", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_wus_assistance_information(ogs_nas_wus_assistance_information_t *wus_assistance_information, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_wus_assistance_information(wus_assistance_information, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  WUS_ASSISTANCE_INFORMATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3423,30 +4480,43 @@ int ogs_nas_5gs_encode_wus_assistance_information(ogs_pkbuf_t *pkbuf, ogs_nas_wu
     ogs_nas_wus_assistance_information_t target;
 
     memcpy(&target, wus_assistance_information, sizeof(ogs_nas_wus_assistance_information_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  WUS_ASSISTANCE_INFORMATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("WUS_ASSISTANCE_INFORMATION", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.72 N5GC indication
  * O TV 1 */
-int ogs_nas_5gs_decode_n5gc_indication(ogs_nas_n5gc_indication_t *n5gc_indication, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_n5gc_indication(ogs_nas_n5gc_indication_t *n5gc_indication, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_n5gc_indication_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(n5gc_indication, pkbuf->data - size, size);
+    memcpy(n5gc_indication, data, size);
+
+    ogs_nas_trace_ie("N5GC_INDICATION", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_n5gc_indication(ogs_nas_n5gc_indication_t *n5gc_indication, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_n5gc_indication(n5gc_indication, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  N5GC_INDICATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3455,42 +4525,55 @@ int ogs_nas_5gs_encode_n5gc_indication(ogs_pkbuf_t *pkbuf, ogs_nas_n5gc_indicati
 {
     int size = sizeof(ogs_nas_n5gc_indication_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, n5gc_indication, size);
 
-    ogs_trace("  N5GC_INDICATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("N5GC_INDICATION", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.73 NB-N1 mode DRX parameters
  * O TLV 3 */
-int ogs_nas_5gs_decode_nb_n1_mode_drx_parameters(ogs_nas_nb_n1_mode_drx_parameters_t *nb_n1_mode_drx_parameters, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_nb_n1_mode_drx_parameters(ogs_nas_nb_n1_mode_drx_parameters_t *nb_n1_mode_drx_parameters, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_nb_n1_mode_drx_parameters_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_nb_n1_mode_drx_parameters_t *)pkbuf->data;
+    source = (ogs_nas_nb_n1_mode_drx_parameters_t *)data;
 
     nb_n1_mode_drx_parameters->length = source->length;
     size = nb_n1_mode_drx_parameters->length + sizeof(nb_n1_mode_drx_parameters->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*nb_n1_mode_drx_parameters) < size) return -1;
-    memcpy(nb_n1_mode_drx_parameters, pkbuf->data - size, size);
+    memcpy(nb_n1_mode_drx_parameters, data, size);
+
+    ogs_nas_trace_ie("NB_N1_MODE_DRX_PARAMETERS", data, size);
 
-    ogs_trace("  NB_N1_MODE_DRX_PARAMETERS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    return size;
+}
+
+int ogs_nas_5gs_decode_nb_n1_mode_drx_parameters(ogs_nas_nb_n1_mode_drx_parameters_t *nb_n1_mode_drx_parameters, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_nb_n1_mode_drx_parameters(nb_n1_mode_drx_parameters, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3501,30 +4584,43 @@ int ogs_nas_5gs_encode_nb_n1_mode_drx_parameters(ogs_pkbuf_t *pkbuf, ogs_nas_nb_
     ogs_nas_nb_n1_mode_drx_parameters_t target;
 
     memcpy(&target, nb_n1_mode_drx_parameters, sizeof(ogs_nas_nb_n1_mode_drx_parameters_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  NB_N1_MODE_DRX_PARAMETERS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("NB_N1_MODE_DRX_PARAMETERS", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.74 Additional configuration indication
  * O TV 1 */
-int ogs_nas_5gs_decode_additional_configuration_indication(ogs_nas_additional_configuration_indication_t *additional_configuration_indication, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_additional_configuration_indication(ogs_nas_additional_configuration_indication_t *additional_configuration_indication, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_additional_configuration_indication_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(additional_configuration_indication, pkbuf->data - size, size);
+    memcpy(additional_configuration_indication, data, size);
 
-    ogs_trace("  ADDITIONAL_CONFIGURATION_INDICATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("ADDITIONAL_CONFIGURATION_INDICATION", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_additional_configuration_indication(ogs_nas_additional_configuration_indication_t *additional_configuration_indication, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_additional_configuration_indication(additional_configuration_indication, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3533,42 +4629,55 @@ int ogs_nas_5gs_encode_additional_configuration_indication(ogs_pkbuf_t *pkbuf, o
 {
     int size = sizeof(ogs_nas_additional_configuration_indication_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, additional_configuration_indication, size);
 
-    ogs_trace("  ADDITIONAL_CONFIGURATION_INDICATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("ADDITIONAL_CONFIGURATION_INDICATION", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.75 Extended rejected NSSAI
  * O TLV 5-90 */
-int ogs_nas_5gs_decode_extended_rejected_nssai(ogs_nas_extended_rejected_nssai_t *extended_rejected_nssai, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_extended_rejected_nssai(ogs_nas_extended_rejected_nssai_t *extended_rejected_nssai, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_extended_rejected_nssai_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_extended_rejected_nssai_t *)pkbuf->data;
+    source = (ogs_nas_extended_rejected_nssai_t *)data;
 
     extended_rejected_nssai->length = source->length;
     size = extended_rejected_nssai->length + sizeof(extended_rejected_nssai->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*extended_rejected_nssai) < size) return -1;
-    memcpy(extended_rejected_nssai, pkbuf->data - size, size);
+    memcpy(extended_rejected_nssai, data, size);
+
+    ogs_nas_trace_ie("EXTENDED_REJECTED_NSSAI", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_extended_rejected_nssai(ogs_nas_extended_rejected_nssai_t *extended_rejected_nssai, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_extended_rejected_nssai(extended_rejected_nssai, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  EXTENDED_REJECTED_NSSAI - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3579,42 +4688,55 @@ int ogs_nas_5gs_encode_extended_rejected_nssai(ogs_pkbuf_t *pkbuf, ogs_nas_exten
     ogs_nas_extended_rejected_nssai_t target;
 
     memcpy(&target, extended_rejected_nssai, sizeof(ogs_nas_extended_rejected_nssai_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  EXTENDED_REJECTED_NSSAI - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("EXTENDED_REJECTED_NSSAI", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.76 UE request type
  * O TLV 3 */
-int ogs_nas_5gs_decode_ue_request_type(ogs_nas_ue_request_type_t *ue_request_type, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_ue_request_type(ogs_nas_ue_request_type_t *ue_request_type, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_ue_request_type_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_ue_request_type_t *)pkbuf->data;
+    source = (ogs_nas_ue_request_type_t *)data;
 
     ue_request_type->length = source->length;
     size = ue_request_type->length + sizeof(ue_request_type->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*ue_request_type) < size) return -1;
-    memcpy(ue_request_type, pkbuf->data - size, size);
+    memcpy(ue_request_type, data, size);
+
+    ogs_nas_trace_ie("UE_REQUEST_TYPE", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_ue_request_type(ogs_nas_ue_request_type_t *ue_request_type, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_ue_request_type(ue_request_type, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  UE_REQUEST_TYPE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3625,42 +4747,55 @@ int ogs_nas_5gs_encode_ue_request_type(ogs_pkbuf_t *pkbuf, ogs_nas_ue_request_ty
     ogs_nas_ue_request_type_t target;
 
     memcpy(&target, ue_request_type, sizeof(ogs_nas_ue_request_type_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  UE_REQUEST_TYPE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("UE_REQUEST_TYPE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.77 Paging restriction
  * O TLV 3-35 */
-int ogs_nas_5gs_decode_paging_restriction(ogs_nas_paging_restriction_t *paging_restriction, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_paging_restriction(ogs_nas_paging_restriction_t *paging_restriction, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_paging_restriction_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_paging_restriction_t *)pkbuf->data;
+    source = (ogs_nas_paging_restriction_t *)data;
 
     paging_restriction->length = source->length;
     size = paging_restriction->length + sizeof(paging_restriction->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*paging_restriction) < size) return -1;
-    memcpy(paging_restriction, pkbuf->data - size, size);
+    memcpy(paging_restriction, data, size);
+
+    ogs_nas_trace_ie("PAGING_RESTRICTION", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_paging_restriction(ogs_nas_paging_restriction_t *paging_restriction, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_paging_restriction(paging_restriction, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  PAGING_RESTRICTION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3671,42 +4806,55 @@ int ogs_nas_5gs_encode_paging_restriction(ogs_pkbuf_t *pkbuf, ogs_nas_paging_res
     ogs_nas_paging_restriction_t target;
 
     memcpy(&target, paging_restriction, sizeof(ogs_nas_paging_restriction_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  PAGING_RESTRICTION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("PAGING_RESTRICTION", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.79 NID
  * O TLV 8 */
-int ogs_nas_5gs_decode_nid(ogs_nas_nid_t *nid, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_nid(ogs_nas_nid_t *nid, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_nid_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_nid_t *)pkbuf->data;
+    source = (ogs_nas_nid_t *)data;
 
     nid->length = source->length;
     size = nid->length + sizeof(nid->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*nid) < size) return -1;
-    memcpy(nid, pkbuf->data - size, size);
+    memcpy(nid, data, size);
+
+    ogs_nas_trace_ie("NID", data, size);
+
+    return size;
+}
 
-    ogs_trace("  NID - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+int ogs_nas_5gs_decode_nid(ogs_nas_nid_t *nid, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_nid(nid, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3717,32 +4865,45 @@ int ogs_nas_5gs_encode_nid(ogs_pkbuf_t *pkbuf, ogs_nas_nid_t *nid)
     ogs_nas_nid_t target;
 
     memcpy(&target, nid, sizeof(ogs_nas_nid_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  NID - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("NID", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.8 5GS tracking area identity
  * O TV 7 */
-int ogs_nas_5gs_decode_5gs_tracking_area_identity(ogs_nas_5gs_tracking_area_identity_t *tracking_area_identity, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_5gs_tracking_area_identity(ogs_nas_5gs_tracking_area_identity_t *tracking_area_identity, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_5gs_tracking_area_identity_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(tracking_area_identity, pkbuf->data - size, size);
+    memcpy(tracking_area_identity, data, size);
 
     tracking_area_identity->tac = ogs_be24toh(tracking_area_identity->tac);
 
-    ogs_trace("  5GS_TRACKING_AREA_IDENTITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("5GS_TRACKING_AREA_IDENTITY", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_5gs_tracking_area_identity(ogs_nas_5gs_tracking_area_identity_t *tracking_area_identity, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_5gs_tracking_area_identity(tracking_area_identity, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3755,42 +4916,55 @@ int ogs_nas_5gs_encode_5gs_tracking_area_identity(ogs_pkbuf_t *pkbuf, ogs_nas_5g
     memcpy(&target, tracking_area_identity, size);
     target.tac = ogs_htobe24(tracking_area_identity->tac);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  5GS_TRACKING_AREA_IDENTITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("5GS_TRACKING_AREA_IDENTITY", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.80 PEIPS assistance information
  * O TLV 3-n */
-int ogs_nas_5gs_decode_peips_assistance_information(ogs_nas_peips_assistance_information_t *peips_assistance_information, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_peips_assistance_information(ogs_nas_peips_assistance_information_t *peips_assistance_information, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_peips_assistance_information_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_peips_assistance_information_t *)pkbuf->data;
+    source = (ogs_nas_peips_assistance_information_t *)data;
 
     peips_assistance_information->length = source->length;
     size = peips_assistance_information->length + sizeof(peips_assistance_information->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*peips_assistance_information) < size) return -1;
-    memcpy(peips_assistance_information, pkbuf->data - size, size);
+    memcpy(peips_assistance_information, data, size);
+
+    ogs_nas_trace_ie("PEIPS_ASSISTANCE_INFORMATION", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_peips_assistance_information(ogs_nas_peips_assistance_information_t *peips_assistance_information, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_peips_assistance_information(peips_assistance_information, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  PEIPS_ASSISTANCE_INFORMATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3801,42 +4975,55 @@ int ogs_nas_5gs_encode_peips_assistance_information(ogs_pkbuf_t *pkbuf, ogs_nas_
     ogs_nas_peips_assistance_information_t target;
 
     memcpy(&target, peips_assistance_information, sizeof(ogs_nas_peips_assistance_information_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  PEIPS_ASSISTANCE_INFORMATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("PEIPS_ASSISTANCE_INFORMATION", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.81 5GS additional request result
  * O TLV 3 */
-int ogs_nas_5gs_decode_5gs_additional_request_result(ogs_nas_5gs_additional_request_result_t *additional_request_result, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_5gs_additional_request_result(ogs_nas_5gs_additional_request_result_t *additional_request_result, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_5gs_additional_request_result_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_5gs_additional_request_result_t *)pkbuf->data;
+    source = (ogs_nas_5gs_additional_request_result_t *)data;
 
     additional_request_result->length = source->length;
     size = additional_request_result->length + sizeof(additional_request_result->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*additional_request_result) < size) return -1;
-    memcpy(additional_request_result, pkbuf->data - size, size);
+    memcpy(additional_request_result, data, size);
+
+    ogs_nas_trace_ie("5GS_ADDITIONAL_REQUEST_RESULT", data, size);
 
-    ogs_trace("  5GS_ADDITIONAL_REQUEST_RESULT - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    return size;
+}
+
+int ogs_nas_5gs_decode_5gs_additional_request_result(ogs_nas_5gs_additional_request_result_t *additional_request_result, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_5gs_additional_request_result(additional_request_result, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3847,41 +5034,54 @@ int ogs_nas_5gs_encode_5gs_additional_request_result(ogs_pkbuf_t *pkbuf, ogs_nas
     ogs_nas_5gs_additional_request_result_t target;
 
     memcpy(&target, additional_request_result, sizeof(ogs_nas_5gs_additional_request_result_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  5GS_ADDITIONAL_REQUEST_RESULT - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("5GS_ADDITIONAL_REQUEST_RESULT", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.82 NSSRG information
  * O TLV-E 7-4099 */
-int ogs_nas_5gs_decode_nssrg_information(ogs_nas_nssrg_information_t *nssrg_information, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_nssrg_information(ogs_nas_nssrg_information_t *nssrg_information, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_nssrg_information_t *source = NULL;
 
-    if (pkbuf->len < 2) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 2) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_nssrg_information_t *)pkbuf->data;
+    source = (ogs_nas_nssrg_information_t *)data;
 
     nssrg_information->length = be16toh(source->length);
     size = nssrg_information->length + sizeof(nssrg_information->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    nssrg_information->buffer = pkbuf->data - size + sizeof(nssrg_information->length);
+    nssrg_information->buffer = data + sizeof(nssrg_information->length);
+
+    ogs_nas_trace_ie("NSSRG_INFORMATION", nssrg_information->buffer, nssrg_information->length);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_nssrg_information(ogs_nas_nssrg_information_t *nssrg_information, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_nssrg_information(nssrg_information, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  NSSRG_INFORMATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, (void*)nssrg_information->buffer, nssrg_information->length);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3895,47 +5095,63 @@ int ogs_nas_5gs_encode_nssrg_information(ogs_pkbuf_t *pkbuf, ogs_nas_nssrg_infor
     ogs_assert(nssrg_information->buffer);
 
     size = sizeof(nssrg_information->length);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     target = htobe16(nssrg_information->length);
     memcpy(pkbuf->data - size, &target, size);
 
     size = nssrg_information->length;
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, nssrg_information->buffer, size);
 
-    ogs_trace("  NSSRG_INFORMATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("NSSRG_INFORMATION", pkbuf->data - size, size);
 
     return nssrg_information->length + sizeof(nssrg_information->length);
 }
 
 /* 9.11.3.83 List of PLMNs to be used in disaster condition
  * O TLV 2-n */
-int ogs_nas_5gs_decode_list_of_plmns_to_be_used_in_disaster_condition(ogs_nas_list_of_plmns_to_be_used_in_disaster_condition_t *list_of_plmns_to_be_used_in_disaster_condition, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_list_of_plmns_to_be_used_in_disaster_condition(ogs_nas_list_of_plmns_to_be_used_in_disaster_condition_t *list_of_plmns_to_be_used_in_disaster_condition, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_list_of_plmns_to_be_used_in_disaster_condition_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_list_of_plmns_to_be_used_in_disaster_condition_t *)pkbuf->data;
+    source = (ogs_nas_list_of_plmns_to_be_used_in_disaster_condition_t *)data;
 
     list_of_plmns_to_be_used_in_disaster_condition->length = source->length;
     size = list_of_plmns_to_be_used_in_disaster_condition->length + sizeof(list_of_plmns_to_be_used_in_disaster_condition->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*list_of_plmns_to_be_used_in_disaster_condition) < size) return -1;
-    memcpy(list_of_plmns_to_be_used_in_disaster_condition, pkbuf->data - size, size);
+    memcpy(list_of_plmns_to_be_used_in_disaster_condition, data, size);
+
+    ogs_nas_trace_ie("LIST_OF_PLMNS_TO_BE_USED_IN_DISASTER_CONDITION", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_list_of_plmns_to_be_used_in_disaster_condition(ogs_nas_list_of_plmns_to_be_used_in_disaster_condition_t *list_of_plmns_to_be_used_in_disaster_condition, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_list_of_plmns_to_be_used_in_disaster_condition(list_of_plmns_to_be_used_in_disaster_condition, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  LIST_OF_PLMNS_TO_BE_USED_IN_DISASTER_CONDITION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3946,42 +5162,55 @@ int ogs_nas_5gs_encode_list_of_plmns_to_be_used_in_disaster_condition(ogs_pkbuf_
     ogs_nas_list_of_plmns_to_be_used_in_disaster_condition_t target;
 
     memcpy(&target, list_of_plmns_to_be_used_in_disaster_condition, sizeof(ogs_nas_list_of_plmns_to_be_used_in_disaster_condition_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  LIST_OF_PLMNS_TO_BE_USED_IN_DISASTER_CONDITION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("LIST_OF_PLMNS_TO_BE_USED_IN_DISASTER_CONDITION", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.84 Registration wait range
  * O TLV 4 */
-int ogs_nas_5gs_decode_registration_wait_range(ogs_nas_registration_wait_range_t *registration_wait_range, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_registration_wait_range(ogs_nas_registration_wait_range_t *registration_wait_range, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_registration_wait_range_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_registration_wait_range_t *)pkbuf->data;
+    source = (ogs_nas_registration_wait_range_t *)data;
 
     registration_wait_range->length = source->length;
     size = registration_wait_range->length + sizeof(registration_wait_range->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*registration_wait_range) < size) return -1;
-    memcpy(registration_wait_range, pkbuf->data - size, size);
+    memcpy(registration_wait_range, data, size);
+
+    ogs_nas_trace_ie("REGISTRATION_WAIT_RANGE", data, size);
 
-    ogs_trace("  REGISTRATION_WAIT_RANGE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    return size;
+}
+
+int ogs_nas_5gs_decode_registration_wait_range(ogs_nas_registration_wait_range_t *registration_wait_range, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_registration_wait_range(registration_wait_range, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3992,42 +5221,55 @@ int ogs_nas_5gs_encode_registration_wait_range(ogs_pkbuf_t *pkbuf, ogs_nas_regis
     ogs_nas_registration_wait_range_t target;
 
     memcpy(&target, registration_wait_range, sizeof(ogs_nas_registration_wait_range_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  REGISTRATION_WAIT_RANGE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("REGISTRATION_WAIT_RANGE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.85 PLMN identity
  * O TLV 5 */
-int ogs_nas_5gs_decode_plmn_identity(ogs_nas_plmn_identity_t *plmn_identity, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_plmn_identity(ogs_nas_plmn_identity_t *plmn_identity, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_plmn_identity_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_plmn_identity_t *)pkbuf->data;
+    source = (ogs_nas_plmn_identity_t *)data;
 
     plmn_identity->length = source->length;
     size = plmn_identity->length + sizeof(plmn_identity->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*plmn_identity) < size) return -1;
-    memcpy(plmn_identity, pkbuf->data - size, size);
+    memcpy(plmn_identity, data, size);
 
-    ogs_trace("  PLMN_IDENTITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("PLMN_IDENTITY", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_plmn_identity(ogs_nas_plmn_identity_t *plmn_identity, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_plmn_identity(plmn_identity, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -4038,41 +5280,54 @@ int ogs_nas_5gs_encode_plmn_identity(ogs_pkbuf_t *pkbuf, ogs_nas_plmn_identity_t
     ogs_nas_plmn_identity_t target;
 
     memcpy(&target, plmn_identity, sizeof(ogs_nas_plmn_identity_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  PLMN_IDENTITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("PLMN_IDENTITY", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.86 Extended CAG information list
  * O TLV-E 3-n */
-int ogs_nas_5gs_decode_extended_cag_information_list(ogs_nas_extended_cag_information_list_t *extended_cag_information_list, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_extended_cag_information_list(ogs_nas_extended_cag_information_list_t *extended_cag_information_list, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_extended_cag_information_list_t *source = NULL;
 
-    if (pkbuf->len < 2) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 2) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_extended_cag_information_list_t *)pkbuf->data;
+    source = (ogs_nas_extended_cag_information_list_t *)data;
 
     extended_cag_information_list->length = be16toh(source->length);
     size = extended_cag_information_list->length + sizeof(extended_cag_information_list->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    extended_cag_information_list->buffer = pkbuf->data - size + sizeof(extended_cag_information_list->length);
+    extended_cag_information_list->buffer = data + sizeof(extended_cag_information_list->length);
+
+    ogs_nas_trace_ie("EXTENDED_CAG_INFORMATION_LIST", extended_cag_information_list->buffer, extended_cag_information_list->length);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_extended_cag_information_list(ogs_nas_extended_cag_information_list_t *extended_cag_information_list, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_extended_cag_information_list(extended_cag_information_list, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  EXTENDED_CAG_INFORMATION_LIST - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, (void*)extended_cag_information_list->buffer, extended_cag_information_list->length);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -4086,46 +5341,62 @@ int ogs_nas_5gs_encode_extended_cag_information_list(ogs_pkbuf_t *pkbuf, ogs_nas
     ogs_assert(extended_cag_information_list->buffer);
 
     size = sizeof(extended_cag_information_list->length);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     target = htobe16(extended_cag_information_list->length);
     memcpy(pkbuf->data - size, &target, size);
 
     size = extended_cag_information_list->length;
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, extended_cag_information_list->buffer, size);
 
-    ogs_trace("  EXTENDED_CAG_INFORMATION_LIST - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("EXTENDED_CAG_INFORMATION_LIST", pkbuf->data - size, size);
 
     return extended_cag_information_list->length + sizeof(extended_cag_information_list->length);
 }
 
 /* 9.11.3.87 NSAG information
  * O TLV-E 9-3143 */
-int ogs_nas_5gs_decode_nsag_information(ogs_nas_nsag_information_t *nsag_information, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_nsag_information(ogs_nas_nsag_information_t *nsag_information, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_nsag_information_t *source = NULL;
 
-    if (pkbuf->len < 2) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 2) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_nsag_information_t *)pkbuf->data;
+    source = (ogs_nas_nsag_information_t *)data;
 
     nsag_information->length = be16toh(source->length);
     size = nsag_information->length + sizeof(nsag_information->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    nsag_information->buffer = pkbuf->data - size + sizeof(nsag_information->length);
+    nsag_information->buffer = data + sizeof(nsag_information->length);
+
+    ogs_nas_trace_ie("NSAG_INFORMATION", nsag_information->buffer, nsag_information->length);
 
-    ogs_trace("  NSAG_INFORMATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, (void*)nsag_information->buffer, nsag_information->length);
+    return size;
+}
+
+int ogs_nas_5gs_decode_nsag_information(ogs_nas_nsag_information_t *nsag_information, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_nsag_information(nsag_information, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -4139,47 +5410,63 @@ int ogs_nas_5gs_encode_nsag_information(ogs_pkbuf_t *pkbuf, ogs_nas_nsag_informa
     ogs_assert(nsag_information->buffer);
 
     size = sizeof(nsag_information->length);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     target = htobe16(nsag_information->length);
     memcpy(pkbuf->data - size, &target, size);
 
     size = nsag_information->length;
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, nsag_information->buffer, size);
 
-    ogs_trace("  NSAG_INFORMATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("NSAG_INFORMATION", pkbuf->data - size, size);
 
     return nsag_information->length + sizeof(nsag_information->length);
 }
 
 /* 9.11.3.9 5GS tracking area identity list
  * O TLV 9-114 */
-int ogs_nas_5gs_decode_5gs_tracking_area_identity_list(ogs_nas_5gs_tracking_area_identity_list_t *tracking_area_identity_list, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_5gs_tracking_area_identity_list(ogs_nas_5gs_tracking_area_identity_list_t *tracking_area_identity_list, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_5gs_tracking_area_identity_list_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_5gs_tracking_area_identity_list_t *)pkbuf->data;
+    source = (ogs_nas_5gs_tracking_area_identity_list_t *)data;
 
     tracking_area_identity_list->length = source->length;
     size = tracking_area_identity_list->length + sizeof(tracking_area_identity_list->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*tracking_area_identity_list) < size) return -1;
-    memcpy(tracking_area_identity_list, pkbuf->data - size, size);
+    memcpy(tracking_area_identity_list, data, size);
+
+    ogs_nas_trace_ie("5GS_TRACKING_AREA_IDENTITY_LIST", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_5gs_tracking_area_identity_list(ogs_nas_5gs_tracking_area_identity_list_t *tracking_area_identity_list, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_5gs_tracking_area_identity_list(tracking_area_identity_list, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  5GS_TRACKING_AREA_IDENTITY_LIST - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -4190,30 +5477,43 @@ int ogs_nas_5gs_encode_5gs_tracking_area_identity_list(ogs_pkbuf_t *pkbuf, ogs_n
     ogs_nas_5gs_tracking_area_identity_list_t target;
 
     memcpy(&target, tracking_area_identity_list, sizeof(ogs_nas_5gs_tracking_area_identity_list_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  5GS_TRACKING_AREA_IDENTITY_LIST - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("5GS_TRACKING_AREA_IDENTITY_LIST", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.91 Priority indicator
  * O TV 1 */
-int ogs_nas_5gs_decode_priority_indicator(ogs_nas_priority_indicator_t *priority_indicator, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_priority_indicator(ogs_nas_priority_indicator_t *priority_indicator, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_priority_indicator_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(priority_indicator, pkbuf->data - size, size);
+    memcpy(priority_indicator, data, size);
+
+    ogs_nas_trace_ie("PRIORITY_INDICATOR", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_priority_indicator(ogs_nas_priority_indicator_t *priority_indicator, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_priority_indicator(priority_indicator, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  PRIORITY_INDICATOR - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -4222,42 +5522,55 @@ int ogs_nas_5gs_encode_priority_indicator(ogs_pkbuf_t *pkbuf, ogs_nas_priority_i
 {
     int size = sizeof(ogs_nas_priority_indicator_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, priority_indicator, size);
 
-    ogs_trace("  PRIORITY_INDICATOR - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("PRIORITY_INDICATOR", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.3.9A 5GS update type
  * O TLV 3 */
-int ogs_nas_5gs_decode_5gs_update_type(ogs_nas_5gs_update_type_t *update_type, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_5gs_update_type(ogs_nas_5gs_update_type_t *update_type, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_5gs_update_type_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_5gs_update_type_t *)pkbuf->data;
+    source = (ogs_nas_5gs_update_type_t *)data;
 
     update_type->length = source->length;
     size = update_type->length + sizeof(update_type->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*update_type) < size) return -1;
-    memcpy(update_type, pkbuf->data - size, size);
+    memcpy(update_type, data, size);
+
+    ogs_nas_trace_ie("5GS_UPDATE_TYPE", data, size);
 
-    ogs_trace("  5GS_UPDATE_TYPE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    return size;
+}
+
+int ogs_nas_5gs_decode_5gs_update_type(ogs_nas_5gs_update_type_t *update_type, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_5gs_update_type(update_type, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -4268,42 +5581,55 @@ int ogs_nas_5gs_encode_5gs_update_type(ogs_pkbuf_t *pkbuf, ogs_nas_5gs_update_ty
     ogs_nas_5gs_update_type_t target;
 
     memcpy(&target, update_type, sizeof(ogs_nas_5gs_update_type_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  5GS_UPDATE_TYPE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("5GS_UPDATE_TYPE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.4.1 5GSM capability
  * O TLV 3-15 */
-int ogs_nas_5gs_decode_5gsm_capability(ogs_nas_5gsm_capability_t *gsm_capability, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_5gsm_capability(ogs_nas_5gsm_capability_t *gsm_capability, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_5gsm_capability_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_5gsm_capability_t *)pkbuf->data;
+    source = (ogs_nas_5gsm_capability_t *)data;
 
     gsm_capability->length = source->length;
     size = gsm_capability->length + sizeof(gsm_capability->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*gsm_capability) < size) return -1;
-    memcpy(gsm_capability, pkbuf->data - size, size);
+    memcpy(gsm_capability, data, size);
 
-    ogs_trace("  5GSM_CAPABILITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("5GSM_CAPABILITY", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_5gsm_capability(ogs_nas_5gsm_capability_t *gsm_capability, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_5gsm_capability(gsm_capability, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -4314,42 +5640,55 @@ int ogs_nas_5gs_encode_5gsm_capability(ogs_pkbuf_t *pkbuf, ogs_nas_5gsm_capabili
     ogs_nas_5gsm_capability_t target;
 
     memcpy(&target, gsm_capability, sizeof(ogs_nas_5gsm_capability_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  5GSM_CAPABILITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("5GSM_CAPABILITY", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.4.10 PDU address
  * O TLV 11 */
-int ogs_nas_5gs_decode_pdu_address(ogs_nas_pdu_address_t *pdu_address, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_pdu_address(ogs_nas_pdu_address_t *pdu_address, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_pdu_address_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_pdu_address_t *)pkbuf->data;
+    source = (ogs_nas_pdu_address_t *)data;
 
     pdu_address->length = source->length;
     size = pdu_address->length + sizeof(pdu_address->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*pdu_address) < size) return -1;
-    memcpy(pdu_address, pkbuf->data - size, size);
+    memcpy(pdu_address, data, size);
+
+    ogs_nas_trace_ie("PDU_ADDRESS", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_pdu_address(ogs_nas_pdu_address_t *pdu_address, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_pdu_address(pdu_address, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  PDU_ADDRESS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -4360,30 +5699,43 @@ int ogs_nas_5gs_encode_pdu_address(ogs_pkbuf_t *pkbuf, ogs_nas_pdu_address_t *pd
     ogs_nas_pdu_address_t target;
 
     memcpy(&target, pdu_address, sizeof(ogs_nas_pdu_address_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  PDU_ADDRESS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("PDU_ADDRESS", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.4.11 PDU session type
  * O TV 1 */
-int ogs_nas_5gs_decode_pdu_session_type(ogs_nas_pdu_session_type_t *pdu_session_type, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_pdu_session_type(ogs_nas_pdu_session_type_t *pdu_session_type, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_pdu_session_type_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(pdu_session_type, pkbuf->data - size, size);
+    memcpy(pdu_session_type, data, size);
+
+    ogs_nas_trace_ie("PDU_SESSION_TYPE", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_pdu_session_type(ogs_nas_pdu_session_type_t *pdu_session_type, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_pdu_session_type(pdu_session_type, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  PDU_SESSION_TYPE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -4392,41 +5744,54 @@ int ogs_nas_5gs_encode_pdu_session_type(ogs_pkbuf_t *pkbuf, ogs_nas_pdu_session_
 {
     int size = sizeof(ogs_nas_pdu_session_type_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, pdu_session_type, size);
 
-    ogs_trace("  PDU_SESSION_TYPE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("PDU_SESSION_TYPE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.4.12 QoS flow descriptions
  * O TLV-E 6-65538 */
-int ogs_nas_5gs_decode_qos_flow_descriptions(ogs_nas_qos_flow_descriptions_t *qos_flow_descriptions, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_qos_flow_descriptions(ogs_nas_qos_flow_descriptions_t *qos_flow_descriptions, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_qos_flow_descriptions_t *source = NULL;
 
-    if (pkbuf->len < 2) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 2) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_qos_flow_descriptions_t *)pkbuf->data;
+    source = (ogs_nas_qos_flow_descriptions_t *)data;
 
     qos_flow_descriptions->length = be16toh(source->length);
     size = qos_flow_descriptions->length + sizeof(qos_flow_descriptions->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    qos_flow_descriptions->buffer = pkbuf->data - size + sizeof(qos_flow_descriptions->length);
+    qos_flow_descriptions->buffer = data + sizeof(qos_flow_descriptions->length);
+
+    ogs_nas_trace_ie("QOS_FLOW_DESCRIPTIONS", qos_flow_descriptions->buffer, qos_flow_descriptions->length);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_qos_flow_descriptions(ogs_nas_qos_flow_descriptions_t *qos_flow_descriptions, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_qos_flow_descriptions(qos_flow_descriptions, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  QOS_FLOW_DESCRIPTIONS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, (void*)qos_flow_descriptions->buffer, qos_flow_descriptions->length);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -4440,46 +5805,62 @@ int ogs_nas_5gs_encode_qos_flow_descriptions(ogs_pkbuf_t *pkbuf, ogs_nas_qos_flo
     ogs_assert(qos_flow_descriptions->buffer);
 
     size = sizeof(qos_flow_descriptions->length);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     target = htobe16(qos_flow_descriptions->length);
     memcpy(pkbuf->data - size, &target, size);
 
     size = qos_flow_descriptions->length;
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, qos_flow_descriptions->buffer, size);
 
-    ogs_trace("  QOS_FLOW_DESCRIPTIONS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("QOS_FLOW_DESCRIPTIONS", pkbuf->data - size, size);
 
     return qos_flow_descriptions->length + sizeof(qos_flow_descriptions->length);
 }
 
 /* 9.11.4.13 QoS rules
  * M LV-E 6-65538 */
-int ogs_nas_5gs_decode_qos_rules(ogs_nas_qos_rules_t *qos_rules, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_qos_rules(ogs_nas_qos_rules_t *qos_rules, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_qos_rules_t *source = NULL;
 
-    if (pkbuf->len < 2) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 2) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_qos_rules_t *)pkbuf->data;
+    source = (ogs_nas_qos_rules_t *)data;
 
     qos_rules->length = be16toh(source->length);
     size = qos_rules->length + sizeof(qos_rules->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    qos_rules->buffer = pkbuf->data - size + sizeof(qos_rules->length);
+    qos_rules->buffer = data + sizeof(qos_rules->length);
+
+    ogs_nas_trace_ie("QOS_RULES", qos_rules->buffer, qos_rules->length);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_qos_rules(ogs_nas_qos_rules_t *qos_rules, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_qos_rules(qos_rules, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  QOS_RULES - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, (void*)qos_rules->buffer, qos_rules->length);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -4493,50 +5874,66 @@ int ogs_nas_5gs_encode_qos_rules(ogs_pkbuf_t *pkbuf, ogs_nas_qos_rules_t *qos_ru
     ogs_assert(qos_rules->buffer);
 
     size = sizeof(qos_rules->length);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     target = htobe16(qos_rules->length);
     memcpy(pkbuf->data - size, &target, size);
 
     size = qos_rules->length;
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, qos_rules->buffer, size);
 
-    ogs_trace("  QOS_RULES - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("QOS_RULES", pkbuf->data - size, size);
 
     return qos_rules->length + sizeof(qos_rules->length);
 }
 
 /* 9.11.4.14 Session-AMBR
  * M LV 7 */
-int ogs_nas_5gs_decode_session_ambr(ogs_nas_session_ambr_t *session_ambr, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_session_ambr(ogs_nas_session_ambr_t *session_ambr, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_session_ambr_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_session_ambr_t *)pkbuf->data;
+    source = (ogs_nas_session_ambr_t *)data;
 
     session_ambr->length = source->length;
     size = session_ambr->length + sizeof(session_ambr->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*session_ambr) < size) return -1;
-    memcpy(session_ambr, pkbuf->data - size, size);
+    memcpy(session_ambr, data, size);
 
     session_ambr->downlink.value = be16toh(source->downlink.value);
     session_ambr->uplink.value = be16toh(source->uplink.value);
 
-    ogs_trace("  SESSION_AMBR - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("SESSION_AMBR", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_session_ambr(ogs_nas_session_ambr_t *session_ambr, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_session_ambr(session_ambr, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -4550,76 +5947,110 @@ int ogs_nas_5gs_encode_session_ambr(ogs_pkbuf_t *pkbuf, ogs_nas_session_ambr_t *
     target.downlink.value = htobe16(session_ambr->downlink.value);
     target.uplink.value = htobe16(session_ambr->uplink.value);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  SESSION_AMBR - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("SESSION_AMBR", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.4.15 SM PDU DN request container
  * O TLV 3-255 */
-int ogs_nas_5gs_decode_sm_pdu_dn_request_container(ogs_nas_sm_pdu_dn_request_container_t *sm_pdu_dn_request_container, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_sm_pdu_dn_request_container(ogs_nas_sm_pdu_dn_request_container_t *sm_pdu_dn_request_container, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_sm_pdu_dn_request_container_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_sm_pdu_dn_request_container_t *)pkbuf->data;
+    source = (ogs_nas_sm_pdu_dn_request_container_t *)data;
 
     sm_pdu_dn_request_container->length = source->length;
     size = sm_pdu_dn_request_container->length + sizeof(sm_pdu_dn_request_container->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    if (sizeof(*sm_pdu_dn_request_container) < size) return -1;
-    memcpy(sm_pdu_dn_request_container, pkbuf->data - size, size);
+    sm_pdu_dn_request_container->buffer = data + sizeof(sm_pdu_dn_request_container->length);
 
-    ogs_trace("  SM_PDU_DN_REQUEST_CONTAINER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("SM_PDU_DN_REQUEST_CONTAINER", sm_pdu_dn_request_container->buffer, sm_pdu_dn_request_container->length);
 
     return size;
 }
 
-int ogs_nas_5gs_encode_sm_pdu_dn_request_container(ogs_pkbuf_t *pkbuf, ogs_nas_sm_pdu_dn_request_container_t *sm_pdu_dn_request_container)
+int ogs_nas_5gs_decode_sm_pdu_dn_request_container(ogs_nas_sm_pdu_dn_request_container_t *sm_pdu_dn_request_container, ogs_pkbuf_t *pkbuf)
 {
-    int size = sm_pdu_dn_request_container->length + sizeof(sm_pdu_dn_request_container->length);
-    ogs_nas_sm_pdu_dn_request_container_t target;
+    int size = ogs_nas_5gs_read_sm_pdu_dn_request_container(sm_pdu_dn_request_container, pkbuf->data, pkbuf->len);
 
-    memcpy(&target, sm_pdu_dn_request_container, sizeof(ogs_nas_sm_pdu_dn_request_container_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
-    memcpy(pkbuf->data - size, &target, size);
+    if (size < 0)
+        return size;
 
-    ogs_trace("  SM_PDU_DN_REQUEST_CONTAINER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
 
+int ogs_nas_5gs_encode_sm_pdu_dn_request_container(ogs_pkbuf_t *pkbuf, ogs_nas_sm_pdu_dn_request_container_t *sm_pdu_dn_request_container)
+{
+    int size = 0;
+
+    ogs_assert(sm_pdu_dn_request_container);
+    ogs_assert(sm_pdu_dn_request_container->buffer);
+
+    size = sizeof(sm_pdu_dn_request_container->length);
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
+    memcpy(pkbuf->data - size, &sm_pdu_dn_request_container->length, size);
+
+    size = sm_pdu_dn_request_container->length;
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
+    memcpy(pkbuf->data - size, sm_pdu_dn_request_container->buffer, size);
+
+    ogs_nas_trace_ie("SM_PDU_DN_REQUEST_CONTAINER", pkbuf->data - size, size);
+
+    return sm_pdu_dn_request_container->length + sizeof(sm_pdu_dn_request_container->length);
+}
+
 /* 9.11.4.16 SSC mode
  * O TV 1 */
-int ogs_nas_5gs_decode_ssc_mode(ogs_nas_ssc_mode_t *ssc_mode, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_ssc_mode(ogs_nas_ssc_mode_t *ssc_mode, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_ssc_mode_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(ssc_mode, pkbuf->data - size, size);
+    memcpy(ssc_mode, data, size);
+
+    ogs_nas_trace_ie("SSC_MODE", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_ssc_mode(ogs_nas_ssc_mode_t *ssc_mode, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_ssc_mode(ssc_mode, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  SSC_MODE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -4628,42 +6059,55 @@ int ogs_nas_5gs_encode_ssc_mode(ogs_pkbuf_t *pkbuf, ogs_nas_ssc_mode_t *ssc_mode
 {
     int size = sizeof(ogs_nas_ssc_mode_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, ssc_mode, size);
 
-    ogs_trace("  SSC_MODE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("SSC_MODE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.4.17 Re-attempt indicator
  * O TLV 3 */
-int ogs_nas_5gs_decode_re_attempt_indicator(ogs_nas_re_attempt_indicator_t *re_attempt_indicator, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_re_attempt_indicator(ogs_nas_re_attempt_indicator_t *re_attempt_indicator, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_re_attempt_indicator_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_re_attempt_indicator_t *)pkbuf->data;
+    source = (ogs_nas_re_attempt_indicator_t *)data;
 
     re_attempt_indicator->length = source->length;
     size = re_attempt_indicator->length + sizeof(re_attempt_indicator->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*re_attempt_indicator) < size) return -1;
-    memcpy(re_attempt_indicator, pkbuf->data - size, size);
+    memcpy(re_attempt_indicator, data, size);
+
+    ogs_nas_trace_ie("RE_ATTEMPT_INDICATOR", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_re_attempt_indicator(ogs_nas_re_attempt_indicator_t *re_attempt_indicator, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_re_attempt_indicator(re_attempt_indicator, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  RE_ATTEMPT_INDICATOR - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -4674,42 +6118,55 @@ int ogs_nas_5gs_encode_re_attempt_indicator(ogs_pkbuf_t *pkbuf, ogs_nas_re_attem
     ogs_nas_re_attempt_indicator_t target;
 
     memcpy(&target, re_attempt_indicator, sizeof(ogs_nas_re_attempt_indicator_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  RE_ATTEMPT_INDICATOR - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("RE_ATTEMPT_INDICATOR", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.4.18 5GSM network feature support
  * O TLV 3-15 */
-int ogs_nas_5gs_decode_5gsm_network_feature_support(ogs_nas_5gsm_network_feature_support_t *gsm_network_feature_support, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_5gsm_network_feature_support(ogs_nas_5gsm_network_feature_support_t *gsm_network_feature_support, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_5gsm_network_feature_support_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_5gsm_network_feature_support_t *)pkbuf->data;
+    source = (ogs_nas_5gsm_network_feature_support_t *)data;
 
     gsm_network_feature_support->length = source->length;
     size = gsm_network_feature_support->length + sizeof(gsm_network_feature_support->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*gsm_network_feature_support) < size) return -1;
-    memcpy(gsm_network_feature_support, pkbuf->data - size, size);
+    memcpy(gsm_network_feature_support, data, size);
+
+    ogs_nas_trace_ie("5GSM_NETWORK_FEATURE_SUPPORT", data, size);
+
+    return size;
+}
 
-    ogs_trace("  5GSM_NETWORK_FEATURE_SUPPORT - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+int ogs_nas_5gs_decode_5gsm_network_feature_support(ogs_nas_5gsm_network_feature_support_t *gsm_network_feature_support, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_5gsm_network_feature_support(gsm_network_feature_support, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -4720,30 +6177,43 @@ int ogs_nas_5gs_encode_5gsm_network_feature_support(ogs_pkbuf_t *pkbuf, ogs_nas_
     ogs_nas_5gsm_network_feature_support_t target;
 
     memcpy(&target, gsm_network_feature_support, sizeof(ogs_nas_5gsm_network_feature_support_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  5GSM_NETWORK_FEATURE_SUPPORT - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("5GSM_NETWORK_FEATURE_SUPPORT", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.4.2 5GSM cause
  * O TV 2 */
-int ogs_nas_5gs_decode_5gsm_cause(ogs_nas_5gsm_cause_t *gsm_cause, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_5gsm_cause(ogs_nas_5gsm_cause_t *gsm_cause, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_5gsm_cause_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(gsm_cause, pkbuf->data - size, size);
+    memcpy(gsm_cause, data, size);
+
+    ogs_nas_trace_ie("5GSM_CAUSE", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_5gsm_cause(ogs_nas_5gsm_cause_t *gsm_cause, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_5gsm_cause(gsm_cause, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  5GSM_CAUSE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -4754,42 +6224,55 @@ int ogs_nas_5gs_encode_5gsm_cause(ogs_pkbuf_t *pkbuf, ogs_nas_5gsm_cause_t *gsm_
     ogs_nas_5gsm_cause_t target;
 
     memcpy(&target, gsm_cause, size);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  5GSM_CAUSE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("5GSM_CAUSE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.4.20 Serving PLMN rate control
  * O TLV 4 */
-int ogs_nas_5gs_decode_serving_plmn_rate_control(ogs_nas_serving_plmn_rate_control_t *serving_plmn_rate_control, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_serving_plmn_rate_control(ogs_nas_serving_plmn_rate_control_t *serving_plmn_rate_control, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_serving_plmn_rate_control_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_serving_plmn_rate_control_t *)pkbuf->data;
+    source = (ogs_nas_serving_plmn_rate_control_t *)data;
 
     serving_plmn_rate_control->length = source->length;
     size = serving_plmn_rate_control->length + sizeof(serving_plmn_rate_control->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*serving_plmn_rate_control) < size) return -1;
-    memcpy(serving_plmn_rate_control, pkbuf->data - size, size);
+    memcpy(serving_plmn_rate_control, data, size);
+
+    ogs_nas_trace_ie("SERVING_PLMN_RATE_CONTROL", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_serving_plmn_rate_control(ogs_nas_serving_plmn_rate_control_t *serving_plmn_rate_control, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_serving_plmn_rate_control(serving_plmn_rate_control, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  SERVING_PLMN_RATE_CONTROL - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -4800,42 +6283,55 @@ int ogs_nas_5gs_encode_serving_plmn_rate_control(ogs_pkbuf_t *pkbuf, ogs_nas_ser
     ogs_nas_serving_plmn_rate_control_t target;
 
     memcpy(&target, serving_plmn_rate_control, sizeof(ogs_nas_serving_plmn_rate_control_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  SERVING_PLMN_RATE_CONTROL - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("SERVING_PLMN_RATE_CONTROL", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.4.21 5GSM congestion re-attempt indicator
  * O TLV 3 */
-int ogs_nas_5gs_decode_5gsm_congestion_re_attempt_indicator(ogs_nas_5gsm_congestion_re_attempt_indicator_t *gsm_congestion_re_attempt_indicator, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_5gsm_congestion_re_attempt_indicator(ogs_nas_5gsm_congestion_re_attempt_indicator_t *gsm_congestion_re_attempt_indicator, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_5gsm_congestion_re_attempt_indicator_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_5gsm_congestion_re_attempt_indicator_t *)pkbuf->data;
+    source = (ogs_nas_5gsm_congestion_re_attempt_indicator_t *)data;
 
     gsm_congestion_re_attempt_indicator->length = source->length;
     size = gsm_congestion_re_attempt_indicator->length + sizeof(gsm_congestion_re_attempt_indicator->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*gsm_congestion_re_attempt_indicator) < size) return -1;
-    memcpy(gsm_congestion_re_attempt_indicator, pkbuf->data - size, size);
+    memcpy(gsm_congestion_re_attempt_indicator, data, size);
+
+    ogs_nas_trace_ie("5GSM_CONGESTION_RE_ATTEMPT_INDICATOR", data, size);
 
-    ogs_trace("  5GSM_CONGESTION_RE_ATTEMPT_INDICATOR - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    return size;
+}
+
+int ogs_nas_5gs_decode_5gsm_congestion_re_attempt_indicator(ogs_nas_5gsm_congestion_re_attempt_indicator_t *gsm_congestion_re_attempt_indicator, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_5gsm_congestion_re_attempt_indicator(gsm_congestion_re_attempt_indicator, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -4846,41 +6342,54 @@ int ogs_nas_5gs_encode_5gsm_congestion_re_attempt_indicator(ogs_pkbuf_t *pkbuf,
     ogs_nas_5gsm_congestion_re_attempt_indicator_t target;
 
     memcpy(&target, gsm_congestion_re_attempt_indicator, sizeof(ogs_nas_5gsm_congestion_re_attempt_indicator_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  5GSM_CONGESTION_RE_ATTEMPT_INDICATOR - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("5GSM_CONGESTION_RE_ATTEMPT_INDICATOR", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.4.22 ATSSS container
  * O TLV-E 3-65538 */
-int ogs_nas_5gs_decode_atsss_container(ogs_nas_atsss_container_t *atsss_container, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_atsss_container(ogs_nas_atsss_container_t *atsss_container, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_atsss_container_t *source = NULL;
 
-    if (pkbuf->len < 2) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 2) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_atsss_container_t *)pkbuf->data;
+    source = (ogs_nas_atsss_container_t *)data;
 
     atsss_container->length = be16toh(source->length);
     size = atsss_container->length + sizeof(atsss_container->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    atsss_container->buffer = pkbuf->data - size + sizeof(atsss_container->length);
+    atsss_container->buffer = data + sizeof(atsss_container->length);
 
-    ogs_trace("  ATSSS_CONTAINER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, (void*)atsss_container->buffer, atsss_container->length);
+    ogs_nas_trace_ie("ATSSS_CONTAINER", atsss_container->buffer, atsss_container->length);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_atsss_container(ogs_nas_atsss_container_t *atsss_container, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_atsss_container(atsss_container, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -4894,35 +6403,51 @@ int ogs_nas_5gs_encode_atsss_container(ogs_pkbuf_t *pkbuf, ogs_nas_atsss_contain
     ogs_assert(atsss_container->buffer);
 
     size = sizeof(atsss_container->length);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     target = htobe16(atsss_container->length);
     memcpy(pkbuf->data - size, &target, size);
 
     size = atsss_container->length;
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, atsss_container->buffer, size);
 
-    ogs_trace("  ATSSS_CONTAINER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("ATSSS_CONTAINER", pkbuf->data - size, size);
 
     return atsss_container->length + sizeof(atsss_container->length);
 }
 
 /* 9.11.4.23 Control plane only indication
  * O TV 1 */
-int ogs_nas_5gs_decode_control_plane_only_indication(ogs_nas_control_plane_only_indication_t *control_plane_only_indication, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_control_plane_only_indication(ogs_nas_control_plane_only_indication_t *control_plane_only_indication, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_control_plane_only_indication_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(control_plane_only_indication, pkbuf->data - size, size);
+    memcpy(control_plane_only_indication, data, size);
+
+    ogs_nas_trace_ie("CONTROL_PLANE_ONLY_INDICATION", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_control_plane_only_indication(ogs_nas_control_plane_only_indication_t *control_plane_only_indication, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_control_plane_only_indication(control_plane_only_indication, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  CONTROL_PLANE_ONLY_INDICATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -4931,42 +6456,55 @@ int ogs_nas_5gs_encode_control_plane_only_indication(ogs_pkbuf_t *pkbuf, ogs_nas
 {
     int size = sizeof(ogs_nas_control_plane_only_indication_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, control_plane_only_indication, size);
 
-    ogs_trace("  CONTROL_PLANE_ONLY_INDICATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("CONTROL_PLANE_ONLY_INDICATION", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.4.24 IP header compression configuration
  * O TLV 5-257 */
-int ogs_nas_5gs_decode_ip_header_compression_configuration(ogs_nas_ip_header_compression_configuration_t *ip_header_compression_configuration, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_ip_header_compression_configuration(ogs_nas_ip_header_compression_configuration_t *ip_header_compression_configuration, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_ip_header_compression_configuration_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_ip_header_compression_configuration_t *)pkbuf->data;
+    source = (ogs_nas_ip_header_compression_configuration_t *)data;
 
     ip_header_compression_configuration->length = source->length;
     size = ip_header_compression_configuration->length + sizeof(ip_header_compression_configuration->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*ip_header_compression_configuration) < size) return -1;
-    memcpy(ip_header_compression_configuration, pkbuf->data - size, size);
+    memcpy(ip_header_compression_configuration, data, size);
+
+    ogs_nas_trace_ie("IP_HEADER_COMPRESSION_CONFIGURATION", data, size);
 
-    ogs_trace("  IP_HEADER_COMPRESSION_CONFIGURATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    return size;
+}
+
+int ogs_nas_5gs_decode_ip_header_compression_configuration(ogs_nas_ip_header_compression_configuration_t *ip_header_compression_configuration, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_ip_header_compression_configuration(ip_header_compression_configuration, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -4977,44 +6515,57 @@ int ogs_nas_5gs_encode_ip_header_compression_configuration(ogs_pkbuf_t *pkbuf, o
     ogs_nas_ip_header_compression_configuration_t target;
 
     memcpy(&target, ip_header_compression_configuration, sizeof(ogs_nas_ip_header_compression_configuration_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  IP_HEADER_COMPRESSION_CONFIGURATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("IP_HEADER_COMPRESSION_CONFIGURATION", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.4.24 Header compression configuration
  * O TLV 5-257 */
-int ogs_nas_5gs_decode_header_compression_configuration(ogs_nas_header_compression_configuration_t *header_compression_configuration, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_header_compression_configuration(ogs_nas_header_compression_configuration_t *header_compression_configuration, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_header_compression_configuration_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_header_compression_configuration_t *)pkbuf->data;
+    source = (ogs_nas_header_compression_configuration_t *)data;
 
     header_compression_configuration->length = source->length;
     size = header_compression_configuration->length + sizeof(header_compression_configuration->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*header_compression_configuration) < size) return -1;
-    memcpy(header_compression_configuration, pkbuf->data - size, size);
+    memcpy(header_compression_configuration, data, size);
 
     header_compression_configuration->max_cid = be16toh(header_compression_configuration->max_cid);
 
-    ogs_trace("  HEADER_COMPRESSION_CONFIGURATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("HEADER_COMPRESSION_CONFIGURATION", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_header_compression_configuration(ogs_nas_header_compression_configuration_t *header_compression_configuration, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_header_compression_configuration(header_compression_configuration, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -5027,42 +6578,55 @@ int ogs_nas_5gs_encode_header_compression_configuration(ogs_pkbuf_t *pkbuf, ogs_
     memcpy(&target, header_compression_configuration, sizeof(ogs_nas_header_compression_configuration_t));
     target.max_cid = htobe16(header_compression_configuration->max_cid);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  HEADER_COMPRESSION_CONFIGURATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("HEADER_COMPRESSION_CONFIGURATION", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.4.25 DS-TT Ethernet port MAC address
  * O TLV 8 */
-int ogs_nas_5gs_decode_ds_tt_ethernet_port_mac_address(ogs_nas_ds_tt_ethernet_port_mac_address_t *ds_tt_ethernet_port_mac_address, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_ds_tt_ethernet_port_mac_address(ogs_nas_ds_tt_ethernet_port_mac_address_t *ds_tt_ethernet_port_mac_address, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_ds_tt_ethernet_port_mac_address_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_ds_tt_ethernet_port_mac_address_t *)pkbuf->data;
+    source = (ogs_nas_ds_tt_ethernet_port_mac_address_t *)data;
 
     ds_tt_ethernet_port_mac_address->length = source->length;
     size = ds_tt_ethernet_port_mac_address->length + sizeof(ds_tt_ethernet_port_mac_address->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*ds_tt_ethernet_port_mac_address) < size) return -1;
-    memcpy(ds_tt_ethernet_port_mac_address, pkbuf->data - size, size);
+    memcpy(ds_tt_ethernet_port_mac_address, data, size);
+
+    ogs_nas_trace_ie("DS_TT_ETHERNET_PORT_MAC_ADDRESS", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_ds_tt_ethernet_port_mac_address(ogs_nas_ds_tt_ethernet_port_mac_address_t *ds_tt_ethernet_port_mac_address, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_ds_tt_ethernet_port_mac_address(ds_tt_ethernet_port_mac_address, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  DS_TT_ETHERNET_PORT_MAC_ADDRESS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -5073,42 +6637,55 @@ int ogs_nas_5gs_encode_ds_tt_ethernet_port_mac_address(ogs_pkbuf_t *pkbuf, ogs_n
     ogs_nas_ds_tt_ethernet_port_mac_address_t target;
 
     memcpy(&target, ds_tt_ethernet_port_mac_address, sizeof(ogs_nas_ds_tt_ethernet_port_mac_address_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  DS_TT_ETHERNET_PORT_MAC_ADDRESS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("DS_TT_ETHERNET_PORT_MAC_ADDRESS", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.4.26 UE-DS-TT residence time
  * O TLV 10 */
-int ogs_nas_5gs_decode_ue_ds_tt_residence_time(ogs_nas_ue_ds_tt_residence_time_t *ue_ds_tt_residence_time, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_ue_ds_tt_residence_time(ogs_nas_ue_ds_tt_residence_time_t *ue_ds_tt_residence_time, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_ue_ds_tt_residence_time_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_ue_ds_tt_residence_time_t *)pkbuf->data;
+    source = (ogs_nas_ue_ds_tt_residence_time_t *)data;
 
     ue_ds_tt_residence_time->length = source->length;
     size = ue_ds_tt_residence_time->length + sizeof(ue_ds_tt_residence_time->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    if (sizeof(*ue_ds_tt_residence_time) < size) return -1;
-    memcpy(ue_ds_tt_residence_time, pkbuf->data - size, size);
+    if (sizeof(*ue_ds_tt_residence_time) < size) return -1;
+    memcpy(ue_ds_tt_residence_time, data, size);
+
+    ogs_nas_trace_ie("UE_DS_TT_RESIDENCE_TIME", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_ue_ds_tt_residence_time(ogs_nas_ue_ds_tt_residence_time_t *ue_ds_tt_residence_time, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_ue_ds_tt_residence_time(ue_ds_tt_residence_time, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  UE_DS_TT_RESIDENCE_TIME - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -5119,41 +6696,54 @@ int ogs_nas_5gs_encode_ue_ds_tt_residence_time(ogs_pkbuf_t *pkbuf, ogs_nas_ue_ds
     ogs_nas_ue_ds_tt_residence_time_t target;
 
     memcpy(&target, ue_ds_tt_residence_time, sizeof(ogs_nas_ue_ds_tt_residence_time_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  UE_DS_TT_RESIDENCE_TIME - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("UE_DS_TT_RESIDENCE_TIME", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.4.27 Port management information container
  * O TLV-E 8-65538 */
-int ogs_nas_5gs_decode_port_management_information_container(ogs_nas_port_management_information_container_t *port_management_information_container, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_port_management_information_container(ogs_nas_port_management_information_container_t *port_management_information_container, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_port_management_information_container_t *source = NULL;
 
-    if (pkbuf->len < 2) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 2) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_port_management_information_container_t *)pkbuf->data;
+    source = (ogs_nas_port_management_information_container_t *)data;
 
     port_management_information_container->length = be16toh(source->length);
     size = port_management_information_container->length + sizeof(port_management_information_container->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    port_management_information_container->buffer = pkbuf->data - size + sizeof(port_management_information_container->length);
+    port_management_information_container->buffer = data + sizeof(port_management_information_container->length);
+
+    ogs_nas_trace_ie("PORT_MANAGEMENT_INFORMATION_CONTAINER", port_management_information_container->buffer, port_management_information_container->length);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_port_management_information_container(ogs_nas_port_management_information_container_t *port_management_information_container, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_port_management_information_container(port_management_information_container, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  PORT_MANAGEMENT_INFORMATION_CONTAINER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, (void*)port_management_information_container->buffer, port_management_information_container->length);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -5167,47 +6757,63 @@ int ogs_nas_5gs_encode_port_management_information_container(ogs_pkbuf_t *pkbuf,
     ogs_assert(port_management_information_container->buffer);
 
     size = sizeof(port_management_information_container->length);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     target = htobe16(port_management_information_container->length);
     memcpy(pkbuf->data - size, &target, size);
 
     size = port_management_information_container->length;
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, port_management_information_container->buffer, size);
 
-    ogs_trace("  PORT_MANAGEMENT_INFORMATION_CONTAINER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("PORT_MANAGEMENT_INFORMATION_CONTAINER", pkbuf->data - size, size);
 
     return port_management_information_container->length + sizeof(port_management_information_container->length);
 }
 
 /* 9.11.4.28 Ethernet header compression configuration
  * O TLV 3 */
-int ogs_nas_5gs_decode_ethernet_header_compression_configuration(ogs_nas_ethernet_header_compression_configuration_t *ethernet_header_compression_configuration, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_ethernet_header_compression_configuration(ogs_nas_ethernet_header_compression_configuration_t *ethernet_header_compression_configuration, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_ethernet_header_compression_configuration_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_ethernet_header_compression_configuration_t *)pkbuf->data;
+    source = (ogs_nas_ethernet_header_compression_configuration_t *)data;
 
     ethernet_header_compression_configuration->length = source->length;
     size = ethernet_header_compression_configuration->length + sizeof(ethernet_header_compression_configuration->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*ethernet_header_compression_configuration) < size) return -1;
-    memcpy(ethernet_header_compression_configuration, pkbuf->data - size, size);
+    memcpy(ethernet_header_compression_configuration, data, size);
+
+    ogs_nas_trace_ie("ETHERNET_HEADER_COMPRESSION_CONFIGURATION", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_ethernet_header_compression_configuration(ogs_nas_ethernet_header_compression_configuration_t *ethernet_header_compression_configuration, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_ethernet_header_compression_configuration(ethernet_header_compression_configuration, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  ETHERNET_HEADER_COMPRESSION_CONFIGURATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -5218,30 +6824,43 @@ int ogs_nas_5gs_encode_ethernet_header_compression_configuration(ogs_pkbuf_t *pk
     ogs_nas_ethernet_header_compression_configuration_t target;
 
     memcpy(&target, ethernet_header_compression_configuration, sizeof(ogs_nas_ethernet_header_compression_configuration_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  ETHERNET_HEADER_COMPRESSION_CONFIGURATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("ETHERNET_HEADER_COMPRESSION_CONFIGURATION", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.4.3 Always-on PDU session indication
  * O TV 1 */
-int ogs_nas_5gs_decode_always_on_pdu_session_indication(ogs_nas_always_on_pdu_session_indication_t *always_on_pdu_session_indication, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_always_on_pdu_session_indication(ogs_nas_always_on_pdu_session_indication_t *always_on_pdu_session_indication, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_always_on_pdu_session_indication_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(always_on_pdu_session_indication, pkbuf->data - size, size);
+    memcpy(always_on_pdu_session_indication, data, size);
+
+    ogs_nas_trace_ie("ALWAYS_ON_PDU_SESSION_INDICATION", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_always_on_pdu_session_indication(ogs_nas_always_on_pdu_session_indication_t *always_on_pdu_session_indication, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_always_on_pdu_session_indication(always_on_pdu_session_indication, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  ALWAYS_ON_PDU_SESSION_INDICATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -5250,41 +6869,54 @@ int ogs_nas_5gs_encode_always_on_pdu_session_indication(ogs_pkbuf_t *pkbuf, ogs_
 {
     int size = sizeof(ogs_nas_always_on_pdu_session_indication_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, always_on_pdu_session_indication, size);
 
-    ogs_trace("  ALWAYS_ON_PDU_SESSION_INDICATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("ALWAYS_ON_PDU_SESSION_INDICATION", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.4.30 Requested MBS container
  * O TLV-E 8-65538 */
-int ogs_nas_5gs_decode_requested_mbs_container(ogs_nas_requested_mbs_container_t *requested_mbs_container, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_requested_mbs_container(ogs_nas_requested_mbs_container_t *requested_mbs_container, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_requested_mbs_container_t *source = NULL;
 
-    if (pkbuf->len < 2) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 2) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_requested_mbs_container_t *)pkbuf->data;
+    source = (ogs_nas_requested_mbs_container_t *)data;
 
     requested_mbs_container->length = be16toh(source->length);
     size = requested_mbs_container->length + sizeof(requested_mbs_container->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    requested_mbs_container->buffer = pkbuf->data - size + sizeof(requested_mbs_container->length);
+    requested_mbs_container->buffer = data + sizeof(requested_mbs_container->length);
+
+    ogs_nas_trace_ie("REQUESTED_MBS_CONTAINER", requested_mbs_container->buffer, requested_mbs_container->length);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_requested_mbs_container(ogs_nas_requested_mbs_container_t *requested_mbs_container, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_requested_mbs_container(requested_mbs_container, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  REQUESTED_MBS_CONTAINER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, (void*)requested_mbs_container->buffer, requested_mbs_container->length);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -5298,46 +6930,62 @@ int ogs_nas_5gs_encode_requested_mbs_container(ogs_pkbuf_t *pkbuf, ogs_nas_reque
     ogs_assert(requested_mbs_container->buffer);
 
     size = sizeof(requested_mbs_container->length);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     target = htobe16(requested_mbs_container->length);
     memcpy(pkbuf->data - size, &target, size);
 
     size = requested_mbs_container->length;
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, requested_mbs_container->buffer, size);
 
-    ogs_trace("  REQUESTED_MBS_CONTAINER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("REQUESTED_MBS_CONTAINER", pkbuf->data - size, size);
 
     return requested_mbs_container->length + sizeof(requested_mbs_container->length);
 }
 
 /* 9.11.4.31 Received MBS container
  * O TLV-E 9-65538 */
-int ogs_nas_5gs_decode_received_mbs_container(ogs_nas_received_mbs_container_t *received_mbs_container, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_received_mbs_container(ogs_nas_received_mbs_container_t *received_mbs_container, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_received_mbs_container_t *source = NULL;
 
-    if (pkbuf->len < 2) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 2) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_received_mbs_container_t *)pkbuf->data;
+    source = (ogs_nas_received_mbs_container_t *)data;
 
     received_mbs_container->length = be16toh(source->length);
     size = received_mbs_container->length + sizeof(received_mbs_container->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    received_mbs_container->buffer = pkbuf->data - size + sizeof(received_mbs_container->length);
+    received_mbs_container->buffer = data + sizeof(received_mbs_container->length);
+
+    ogs_nas_trace_ie("RECEIVED_MBS_CONTAINER", received_mbs_container->buffer, received_mbs_container->length);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_received_mbs_container(ogs_nas_received_mbs_container_t *received_mbs_container, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_received_mbs_container(received_mbs_container, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  RECEIVED_MBS_CONTAINER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, (void*)received_mbs_container->buffer, received_mbs_container->length);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -5351,47 +6999,63 @@ int ogs_nas_5gs_encode_received_mbs_container(ogs_pkbuf_t *pkbuf, ogs_nas_receiv
     ogs_assert(received_mbs_container->buffer);
 
     size = sizeof(received_mbs_container->length);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     target = htobe16(received_mbs_container->length);
     memcpy(pkbuf->data - size, &target, size);
 
     size = received_mbs_container->length;
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, received_mbs_container->buffer, size);
 
-    ogs_trace("  RECEIVED_MBS_CONTAINER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("RECEIVED_MBS_CONTAINER", pkbuf->data - size, size);
 
     return received_mbs_container->length + sizeof(received_mbs_container->length);
 }
 
 /* 9.11.4.32 PDU session pair ID
  * O TLV 3 */
-int ogs_nas_5gs_decode_pdu_session_pair_id(ogs_nas_pdu_session_pair_id_t *pdu_session_pair_id, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_pdu_session_pair_id(ogs_nas_pdu_session_pair_id_t *pdu_session_pair_id, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_pdu_session_pair_id_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_pdu_session_pair_id_t *)pkbuf->data;
+    source = (ogs_nas_pdu_session_pair_id_t *)data;
 
     pdu_session_pair_id->length = source->length;
     size = pdu_session_pair_id->length + sizeof(pdu_session_pair_id->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*pdu_session_pair_id) < size) return -1;
-    memcpy(pdu_session_pair_id, pkbuf->data - size, size);
+    memcpy(pdu_session_pair_id, data, size);
+
+    ogs_nas_trace_ie("PDU_SESSION_PAIR_ID", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_pdu_session_pair_id(ogs_nas_pdu_session_pair_id_t *pdu_session_pair_id, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_pdu_session_pair_id(pdu_session_pair_id, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  PDU_SESSION_PAIR_ID - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -5402,42 +7066,55 @@ int ogs_nas_5gs_encode_pdu_session_pair_id(ogs_pkbuf_t *pkbuf, ogs_nas_pdu_sessi
     ogs_nas_pdu_session_pair_id_t target;
 
     memcpy(&target, pdu_session_pair_id, sizeof(ogs_nas_pdu_session_pair_id_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  PDU_SESSION_PAIR_ID - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("PDU_SESSION_PAIR_ID", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.4.33 RSN
  * O TLV 3 */
-int ogs_nas_5gs_decode_rsn(ogs_nas_rsn_t *rsn, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_rsn(ogs_nas_rsn_t *rsn, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_rsn_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_rsn_t *)pkbuf->data;
+    source = (ogs_nas_rsn_t *)data;
 
     rsn->length = source->length;
     size = rsn->length + sizeof(rsn->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*rsn) < size) return -1;
-    memcpy(rsn, pkbuf->data - size, size);
+    memcpy(rsn, data, size);
+
+    ogs_nas_trace_ie("RSN", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_rsn(ogs_nas_rsn_t *rsn, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_rsn(rsn, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  RSN - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -5448,30 +7125,43 @@ int ogs_nas_5gs_encode_rsn(ogs_pkbuf_t *pkbuf, ogs_nas_rsn_t *rsn)
     ogs_nas_rsn_t target;
 
     memcpy(&target, rsn, sizeof(ogs_nas_rsn_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  RSN - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("RSN", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.4.4 Always-on PDU session requested
  * O TV 1 */
-int ogs_nas_5gs_decode_always_on_pdu_session_requested(ogs_nas_always_on_pdu_session_requested_t *always_on_pdu_session_requested, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_always_on_pdu_session_requested(ogs_nas_always_on_pdu_session_requested_t *always_on_pdu_session_requested, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_always_on_pdu_session_requested_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(always_on_pdu_session_requested, pkbuf->data - size, size);
+    memcpy(always_on_pdu_session_requested, data, size);
+
+    ogs_nas_trace_ie("ALWAYS_ON_PDU_SESSION_REQUESTED", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_always_on_pdu_session_requested(ogs_nas_always_on_pdu_session_requested_t *always_on_pdu_session_requested, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_always_on_pdu_session_requested(always_on_pdu_session_requested, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  ALWAYS_ON_PDU_SESSION_REQUESTED - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -5480,30 +7170,43 @@ int ogs_nas_5gs_encode_always_on_pdu_session_requested(ogs_pkbuf_t *pkbuf, ogs_n
 {
     int size = sizeof(ogs_nas_always_on_pdu_session_requested_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, always_on_pdu_session_requested, size);
 
-    ogs_trace("  ALWAYS_ON_PDU_SESSION_REQUESTED - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("ALWAYS_ON_PDU_SESSION_REQUESTED", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.4.5 Allowed SSC mode
  * O TV 1 */
-int ogs_nas_5gs_decode_allowed_ssc_mode(ogs_nas_allowed_ssc_mode_t *allowed_ssc_mode, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_allowed_ssc_mode(ogs_nas_allowed_ssc_mode_t *allowed_ssc_mode, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_allowed_ssc_mode_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(allowed_ssc_mode, pkbuf->data - size, size);
+    memcpy(allowed_ssc_mode, data, size);
+
+    ogs_nas_trace_ie("ALLOWED_SSC_MODE", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_allowed_ssc_mode(ogs_nas_allowed_ssc_mode_t *allowed_ssc_mode, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_allowed_ssc_mode(allowed_ssc_mode, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  ALLOWED_SSC_MODE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -5512,41 +7215,54 @@ int ogs_nas_5gs_encode_allowed_ssc_mode(ogs_pkbuf_t *pkbuf, ogs_nas_allowed_ssc_
 {
     int size = sizeof(ogs_nas_allowed_ssc_mode_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, allowed_ssc_mode, size);
 
-    ogs_trace("  ALLOWED_SSC_MODE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("ALLOWED_SSC_MODE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.4.6 Extended protocol configuration options
  * O TLV-E 4-65538 */
-int ogs_nas_5gs_decode_extended_protocol_configuration_options(ogs_nas_extended_protocol_configuration_options_t *extended_protocol_configuration_options, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_extended_protocol_configuration_options(ogs_nas_extended_protocol_configuration_options_t *extended_protocol_configuration_options, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_extended_protocol_configuration_options_t *source = NULL;
 
-    if (pkbuf->len < 2) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 2) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_extended_protocol_configuration_options_t *)pkbuf->data;
+    source = (ogs_nas_extended_protocol_configuration_options_t *)data;
 
     extended_protocol_configuration_options->length = be16toh(source->length);
     size = extended_protocol_configuration_options->length + sizeof(extended_protocol_configuration_options->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    extended_protocol_configuration_options->buffer = pkbuf->data - size + sizeof(extended_protocol_configuration_options->length);
+    extended_protocol_configuration_options->buffer = data + sizeof(extended_protocol_configuration_options->length);
+
+    ogs_nas_trace_ie("EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS", extended_protocol_configuration_options->buffer, extended_protocol_configuration_options->length);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_extended_protocol_configuration_options(ogs_nas_extended_protocol_configuration_options_t *extended_protocol_configuration_options, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_extended_protocol_configuration_options(extended_protocol_configuration_options, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, (void*)extended_protocol_configuration_options->buffer, extended_protocol_configuration_options->length);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -5560,35 +7276,51 @@ int ogs_nas_5gs_encode_extended_protocol_configuration_options(ogs_pkbuf_t *pkbu
     ogs_assert(extended_protocol_configuration_options->buffer);
 
     size = sizeof(extended_protocol_configuration_options->length);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     target = htobe16(extended_protocol_configuration_options->length);
     memcpy(pkbuf->data - size, &target, size);
 
     size = extended_protocol_configuration_options->length;
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, extended_protocol_configuration_options->buffer, size);
 
-    ogs_trace("  EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS", pkbuf->data - size, size);
 
     return extended_protocol_configuration_options->length + sizeof(extended_protocol_configuration_options->length);
 }
 
 /* 9.11.4.7 Integrity protection maximum data rate
  * M V 2 */
-int ogs_nas_5gs_decode_integrity_protection_maximum_data_rate(ogs_nas_integrity_protection_maximum_data_rate_t *integrity_protection_maximum_data_rate, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_integrity_protection_maximum_data_rate(ogs_nas_integrity_protection_maximum_data_rate_t *integrity_protection_maximum_data_rate, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_integrity_protection_maximum_data_rate_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(integrity_protection_maximum_data_rate, pkbuf->data - size, size);
+    memcpy(integrity_protection_maximum_data_rate, data, size);
+
+    ogs_nas_trace_ie("INTEGRITY_PROTECTION_MAXIMUM_DATA_RATE", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_integrity_protection_maximum_data_rate(ogs_nas_integrity_protection_maximum_data_rate_t *integrity_protection_maximum_data_rate, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_integrity_protection_maximum_data_rate(integrity_protection_maximum_data_rate, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  INTEGRITY_PROTECTION_MAXIMUM_DATA_RATE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -5599,41 +7331,54 @@ int ogs_nas_5gs_encode_integrity_protection_maximum_data_rate(ogs_pkbuf_t *pkbuf
     ogs_nas_integrity_protection_maximum_data_rate_t target;
 
     memcpy(&target, integrity_protection_maximum_data_rate, size);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  INTEGRITY_PROTECTION_MAXIMUM_DATA_RATE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("INTEGRITY_PROTECTION_MAXIMUM_DATA_RATE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.11.4.8 Mapped EPS bearer contexts
  * O TLV-E 7-65538 */
-int ogs_nas_5gs_decode_mapped_eps_bearer_contexts(ogs_nas_mapped_eps_bearer_contexts_t *mapped_eps_bearer_contexts, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_mapped_eps_bearer_contexts(ogs_nas_mapped_eps_bearer_contexts_t *mapped_eps_bearer_contexts, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_mapped_eps_bearer_contexts_t *source = NULL;
 
-    if (pkbuf->len < 2) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 2) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_mapped_eps_bearer_contexts_t *)pkbuf->data;
+    source = (ogs_nas_mapped_eps_bearer_contexts_t *)data;
 
     mapped_eps_bearer_contexts->length = be16toh(source->length);
     size = mapped_eps_bearer_contexts->length + sizeof(mapped_eps_bearer_contexts->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    mapped_eps_bearer_contexts->buffer = pkbuf->data - size + sizeof(mapped_eps_bearer_contexts->length);
+    mapped_eps_bearer_contexts->buffer = data + sizeof(mapped_eps_bearer_contexts->length);
+
+    ogs_nas_trace_ie("MAPPED_EPS_BEARER_CONTEXTS", mapped_eps_bearer_contexts->buffer, mapped_eps_bearer_contexts->length);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_mapped_eps_bearer_contexts(ogs_nas_mapped_eps_bearer_contexts_t *mapped_eps_bearer_contexts, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_mapped_eps_bearer_contexts(mapped_eps_bearer_contexts, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  MAPPED_EPS_BEARER_CONTEXTS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, (void*)mapped_eps_bearer_contexts->buffer, mapped_eps_bearer_contexts->length);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -5647,35 +7392,51 @@ int ogs_nas_5gs_encode_mapped_eps_bearer_contexts(ogs_pkbuf_t *pkbuf, ogs_nas_ma
     ogs_assert(mapped_eps_bearer_contexts->buffer);
 
     size = sizeof(mapped_eps_bearer_contexts->length);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     target = htobe16(mapped_eps_bearer_contexts->length);
     memcpy(pkbuf->data - size, &target, size);
 
     size = mapped_eps_bearer_contexts->length;
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, mapped_eps_bearer_contexts->buffer, size);
 
-    ogs_trace("  MAPPED_EPS_BEARER_CONTEXTS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("MAPPED_EPS_BEARER_CONTEXTS", pkbuf->data - size, size);
 
     return mapped_eps_bearer_contexts->length + sizeof(mapped_eps_bearer_contexts->length);
 }
 
 /* 9.11.4.9 Maximum number of supported packet filters
  * O TV 3 */
-int ogs_nas_5gs_decode_maximum_number_of_supported_packet_filters(ogs_nas_maximum_number_of_supported_packet_filters_t *maximum_number_of_supported_packet_filters, ogs_pkbuf_t *pkbuf)
+int ogs_nas_5gs_read_maximum_number_of_supported_packet_filters(ogs_nas_maximum_number_of_supported_packet_filters_t *maximum_number_of_supported_packet_filters, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_maximum_number_of_supported_packet_filters_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(maximum_number_of_supported_packet_filters, pkbuf->data - size, size);
+    memcpy(maximum_number_of_supported_packet_filters, data, size);
+
+    ogs_nas_trace_ie("MAXIMUM_NUMBER_OF_SUPPORTED_PACKET_FILTERS", data, size);
+
+    return size;
+}
+
+int ogs_nas_5gs_decode_maximum_number_of_supported_packet_filters(ogs_nas_maximum_number_of_supported_packet_filters_t *maximum_number_of_supported_packet_filters, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_5gs_read_maximum_number_of_supported_packet_filters(maximum_number_of_supported_packet_filters, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  MAXIMUM_NUMBER_OF_SUPPORTED_PACKET_FILTERS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -5686,11 +7447,13 @@ int ogs_nas_5gs_encode_maximum_number_of_supported_packet_filters(ogs_pkbuf_t *p
     ogs_nas_maximum_number_of_supported_packet_filters_t target;
 
     memcpy(&target, maximum_number_of_supported_packet_filters, size);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  MAXIMUM_NUMBER_OF_SUPPORTED_PACKET_FILTERS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("MAXIMUM_NUMBER_OF_SUPPORTED_PACKET_FILTERS", pkbuf->data - size, size);
 
     return size;
 }
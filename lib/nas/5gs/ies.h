@@ -28,8 +28,8 @@
 /*******************************************************************************
  * This file had been created by nas-message.py script v0.2.0
  * Please do not modify this file but regenerate it via script.
- * Created on: 2024-01-21 18:47:47.809393 by acetcom
- * from 24501-h90.docx
+ * Created from 24501-h90.docx
+ * (sha256: 934e13e03cc23a890da2448bd91bac0d11d7f538d814a725666f5c9be66f7b96)
  ******************************************************************************/
 
 #if !defined(OGS_NAS_INSIDE) && !defined(OGS_NAS_COMPILATION)
@@ -45,6 +45,136 @@ extern "C" {
 
 int ogs_nas_5gs_encode_optional_type(ogs_pkbuf_t *pkbuf, uint8_t type);
 
+int ogs_nas_5gs_read_additional_information(ogs_nas_additional_information_t *additional_information, unsigned char *data, int len);
+int ogs_nas_5gs_read_service_level_aa_container(ogs_nas_service_level_aa_container_t *service_level_aa_container, unsigned char *data, int len);
+int ogs_nas_5gs_read_access_type(ogs_nas_access_type_t *access_type, unsigned char *data, int len);
+int ogs_nas_5gs_read_dnn(ogs_nas_dnn_t *dnn, unsigned char *data, int len);
+int ogs_nas_5gs_read_eap_message(ogs_nas_eap_message_t *eap_message, unsigned char *data, int len);
+int ogs_nas_5gs_read_gprs_timer(ogs_nas_gprs_timer_t *gprs_timer, unsigned char *data, int len);
+int ogs_nas_5gs_read_gprs_timer_2(ogs_nas_gprs_timer_2_t *gprs_timer_2, unsigned char *data, int len);
+int ogs_nas_5gs_read_gprs_timer_3(ogs_nas_gprs_timer_3_t *gprs_timer_3, unsigned char *data, int len);
+int ogs_nas_5gs_read_s_nssai(ogs_nas_s_nssai_t *s_nssai, unsigned char *data, int len);
+int ogs_nas_5gs_read_5gmm_capability(ogs_nas_5gmm_capability_t *gmm_capability, unsigned char *data, int len);
+int ogs_nas_5gs_read_abba(ogs_nas_abba_t *abba, unsigned char *data, int len);
+int ogs_nas_5gs_read_additional_5g_security_information(ogs_nas_additional_5g_security_information_t *additional_security_information, unsigned char *data, int len);
+int ogs_nas_5gs_read_additional_information_requested(ogs_nas_additional_information_requested_t *additional_information_requested, unsigned char *data, int len);
+int ogs_nas_5gs_read_allowed_pdu_session_status(ogs_nas_allowed_pdu_session_status_t *allowed_pdu_session_status, unsigned char *data, int len);
+int ogs_nas_5gs_read_authentication_failure_parameter(ogs_nas_authentication_failure_parameter_t *authentication_failure_parameter, unsigned char *data, int len);
+int ogs_nas_5gs_read_authentication_parameter_autn(ogs_nas_authentication_parameter_autn_t *authentication_parameter_autn, unsigned char *data, int len);
+int ogs_nas_5gs_read_authentication_parameter_rand(ogs_nas_authentication_parameter_rand_t *authentication_parameter_rand, unsigned char *data, int len);
+int ogs_nas_5gs_read_authentication_response_parameter(ogs_nas_authentication_response_parameter_t *authentication_response_parameter, unsigned char *data, int len);
+int ogs_nas_5gs_read_configuration_update_indication(ogs_nas_configuration_update_indication_t *configuration_update_indication, unsigned char *data, int len);
+int ogs_nas_5gs_read_cag_information_list(ogs_nas_cag_information_list_t *cag_information_list, unsigned char *data, int len);
+int ogs_nas_5gs_read_ciphering_key_data(ogs_nas_ciphering_key_data_t *ciphering_key_data, unsigned char *data, int len);
+int ogs_nas_5gs_read_daylight_saving_time(ogs_nas_daylight_saving_time_t *daylight_saving_time, unsigned char *data, int len);
+int ogs_nas_5gs_read_5gmm_cause(ogs_nas_5gmm_cause_t *gmm_cause, unsigned char *data, int len);
+int ogs_nas_5gs_read_de_registration_type(ogs_nas_de_registration_type_t *de_registration_type, unsigned char *data, int len);
+int ogs_nas_5gs_read_emergency_number_list(ogs_nas_emergency_number_list_t *emergency_number_list, unsigned char *data, int len);
+int ogs_nas_5gs_read_eps_bearer_context_status(ogs_nas_eps_bearer_context_status_t *eps_bearer_context_status, unsigned char *data, int len);
+int ogs_nas_5gs_read_eps_nas_message_container(ogs_nas_eps_nas_message_container_t *eps_nas_message_container, unsigned char *data, int len);
+int ogs_nas_5gs_read_eps_nas_security_algorithms(ogs_nas_eps_nas_security_algorithms_t *eps_nas_security_algorithms, unsigned char *data, int len);
+int ogs_nas_5gs_read_extended_emergency_number_list(ogs_nas_extended_emergency_number_list_t *extended_emergency_number_list, unsigned char *data, int len);
+int ogs_nas_5gs_read_extended_drx_parameters(ogs_nas_extended_drx_parameters_t *extended_drx_parameters, unsigned char *data, int len);
+int ogs_nas_5gs_read_imeisv_request(ogs_nas_imeisv_request_t *imeisv_request, unsigned char *data, int len);
+int ogs_nas_5gs_read_ladn_indication(ogs_nas_ladn_indication_t *ladn_indication, unsigned char *data, int len);
+int ogs_nas_5gs_read_5gs_drx_parameters(ogs_nas_5gs_drx_parameters_t *drx_parameters, unsigned char *data, int len);
+int ogs_nas_5gs_read_5gs_identity_type(ogs_nas_5gs_identity_type_t *identity_type, unsigned char *data, int len);
+int ogs_nas_5gs_read_ladn_information(ogs_nas_ladn_information_t *ladn_information, unsigned char *data, int len);
+int ogs_nas_5gs_read_mico_indication(ogs_nas_mico_indication_t *mico_indication, unsigned char *data, int len);
+int ogs_nas_5gs_read_ma_pdu_session_information(ogs_nas_ma_pdu_session_information_t *ma_pdu_session_information, unsigned char *data, int len);
+int ogs_nas_5gs_read_mapped_nssai(ogs_nas_mapped_nssai_t *mapped_nssai, unsigned char *data, int len);
+int ogs_nas_5gs_read_mobile_station_classmark_2(ogs_nas_mobile_station_classmark_2_t *mobile_station_classmark_2, unsigned char *data, int len);
+int ogs_nas_5gs_read_key_set_identifier(ogs_nas_key_set_identifier_t *key_set_identifier, unsigned char *data, int len);
+int ogs_nas_5gs_read_message_container(ogs_nas_message_container_t *message_container, unsigned char *data, int len);
+int ogs_nas_5gs_read_security_algorithms(ogs_nas_security_algorithms_t *security_algorithms, unsigned char *data, int len);
+int ogs_nas_5gs_read_network_name(ogs_nas_network_name_t *network_name, unsigned char *data, int len);
+int ogs_nas_5gs_read_network_slicing_indication(ogs_nas_network_slicing_indication_t *network_slicing_indication, unsigned char *data, int len);
+int ogs_nas_5gs_read_non_3gpp_nw_provided_policies(ogs_nas_non_3gpp_nw_provided_policies_t *non_3gpp_nw_provided_policies, unsigned char *data, int len);
+int ogs_nas_5gs_read_nssai(ogs_nas_nssai_t *nssai, unsigned char *data, int len);
+int ogs_nas_5gs_read_nssai_inclusion_mode(ogs_nas_nssai_inclusion_mode_t *nssai_inclusion_mode, unsigned char *data, int len);
+int ogs_nas_5gs_read_operator_defined_access_category_definitions(ogs_nas_operator_defined_access_category_definitions_t *operator_defined_access_category_definitions, unsigned char *data, int len);
+int ogs_nas_5gs_read_payload_container(ogs_nas_payload_container_t *payload_container, unsigned char *data, int len);
+int ogs_nas_5gs_read_5gs_mobile_identity(ogs_nas_5gs_mobile_identity_t *mobile_identity, unsigned char *data, int len);
+int ogs_nas_5gs_read_payload_container_type(ogs_nas_payload_container_type_t *payload_container_type, unsigned char *data, int len);
+int ogs_nas_5gs_read_pdu_session_identity_2(ogs_nas_pdu_session_identity_2_t *pdu_session_identity_2, unsigned char *data, int len);
+int ogs_nas_5gs_read_pdu_session_reactivation_result(ogs_nas_pdu_session_reactivation_result_t *pdu_session_reactivation_result, unsigned char *data, int len);
+int ogs_nas_5gs_read_pdu_session_reactivation_result_error_cause(ogs_nas_pdu_session_reactivation_result_error_cause_t *pdu_session_reactivation_result_error_cause, unsigned char *data, int len);
+int ogs_nas_5gs_read_pdu_session_status(ogs_nas_pdu_session_status_t *pdu_session_status, unsigned char *data, int len);
+int ogs_nas_5gs_read_plmn_list(ogs_nas_plmn_list_t *plmn_list, unsigned char *data, int len);
+int ogs_nas_5gs_read_rejected_nssai(ogs_nas_rejected_nssai_t *rejected_nssai, unsigned char *data, int len);
+int ogs_nas_5gs_read_release_assistance_indication(ogs_nas_release_assistance_indication_t *release_assistance_indication, unsigned char *data, int len);
+int ogs_nas_5gs_read_request_type(ogs_nas_request_type_t *request_type, unsigned char *data, int len);
+int ogs_nas_5gs_read_s1_ue_network_capability(ogs_nas_s1_ue_network_capability_t *s1_ue_network_capability, unsigned char *data, int len);
+int ogs_nas_5gs_read_s1_ue_security_capability(ogs_nas_s1_ue_security_capability_t *s1_ue_security_capability, unsigned char *data, int len);
+int ogs_nas_5gs_read_service_area_list(ogs_nas_service_area_list_t *service_area_list, unsigned char *data, int len);
+int ogs_nas_5gs_read_5gs_network_feature_support(ogs_nas_5gs_network_feature_support_t *network_feature_support, unsigned char *data, int len);
+int ogs_nas_5gs_read_sms_indication(ogs_nas_sms_indication_t *sms_indication, unsigned char *data, int len);
+int ogs_nas_5gs_read_sor_transparent_container(ogs_nas_sor_transparent_container_t *sor_transparent_container, unsigned char *data, int len);
+int ogs_nas_5gs_read_supported_codec_list(ogs_nas_supported_codec_list_t *supported_codec_list, unsigned char *data, int len);
+int ogs_nas_5gs_read_time_zone(ogs_nas_time_zone_t *time_zone, unsigned char *data, int len);
+int ogs_nas_5gs_read_time_zone_and_time(ogs_nas_time_zone_and_time_t *time_zone_and_time, unsigned char *data, int len);
+int ogs_nas_5gs_read_ue_security_capability(ogs_nas_ue_security_capability_t *ue_security_capability, unsigned char *data, int len);
+int ogs_nas_5gs_read_ue_usage_setting(ogs_nas_ue_usage_setting_t *ue_usage_setting, unsigned char *data, int len);
+int ogs_nas_5gs_read_ue_status(ogs_nas_ue_status_t *ue_status, unsigned char *data, int len);
+int ogs_nas_5gs_read_uplink_data_status(ogs_nas_uplink_data_status_t *uplink_data_status, unsigned char *data, int len);
+int ogs_nas_5gs_read_5gs_registration_result(ogs_nas_5gs_registration_result_t *registration_result, unsigned char *data, int len);
+int ogs_nas_5gs_read_ue_radio_capability_id(ogs_nas_ue_radio_capability_id_t *ue_radio_capability_id, unsigned char *data, int len);
+int ogs_nas_5gs_read_ue_radio_capability_id_deletion_indication(ogs_nas_ue_radio_capability_id_deletion_indication_t *ue_radio_capability_id_deletion_indication, unsigned char *data, int len);
+int ogs_nas_5gs_read_5gs_registration_type(ogs_nas_5gs_registration_type_t *registration_type, unsigned char *data, int len);
+int ogs_nas_5gs_read_truncated_5g_s_tmsi_configuration(ogs_nas_truncated_5g_s_tmsi_configuration_t *truncated_s_tmsi_configuration, unsigned char *data, int len);
+int ogs_nas_5gs_read_wus_assistance_information(ogs_nas_wus_assistance_information_t *wus_assistance_information, unsigned char *data, int len);
+int ogs_nas_5gs_read_n5gc_indication(ogs_nas_n5gc_indication_t *n5gc_indication, unsigned char *data, int len);
+int ogs_nas_5gs_read_nb_n1_mode_drx_parameters(ogs_nas_nb_n1_mode_drx_parameters_t *nb_n1_mode_drx_parameters, unsigned char *data, int len);
+int ogs_nas_5gs_read_additional_configuration_indication(ogs_nas_additional_configuration_indication_t *additional_configuration_indication, unsigned char *data, int len);
+int ogs_nas_5gs_read_extended_rejected_nssai(ogs_nas_extended_rejected_nssai_t *extended_rejected_nssai, unsigned char *data, int len);
+int ogs_nas_5gs_read_ue_request_type(ogs_nas_ue_request_type_t *ue_request_type, unsigned char *data, int len);
+int ogs_nas_5gs_read_paging_restriction(ogs_nas_paging_restriction_t *paging_restriction, unsigned char *data, int len);
+int ogs_nas_5gs_read_nid(ogs_nas_nid_t *nid, unsigned char *data, int len);
+int ogs_nas_5gs_read_5gs_tracking_area_identity(ogs_nas_5gs_tracking_area_identity_t *tracking_area_identity, unsigned char *data, int len);
+int ogs_nas_5gs_read_peips_assistance_information(ogs_nas_peips_assistance_information_t *peips_assistance_information, unsigned char *data, int len);
+int ogs_nas_5gs_read_5gs_additional_request_result(ogs_nas_5gs_additional_request_result_t *additional_request_result, unsigned char *data, int len);
+int ogs_nas_5gs_read_nssrg_information(ogs_nas_nssrg_information_t *nssrg_information, unsigned char *data, int len);
+int ogs_nas_5gs_read_list_of_plmns_to_be_used_in_disaster_condition(ogs_nas_list_of_plmns_to_be_used_in_disaster_condition_t *list_of_plmns_to_be_used_in_disaster_condition, unsigned char *data, int len);
+int ogs_nas_5gs_read_registration_wait_range(ogs_nas_registration_wait_range_t *registration_wait_range, unsigned char *data, int len);
+int ogs_nas_5gs_read_plmn_identity(ogs_nas_plmn_identity_t *plmn_identity, unsigned char *data, int len);
+int ogs_nas_5gs_read_extended_cag_information_list(ogs_nas_extended_cag_information_list_t *extended_cag_information_list, unsigned char *data, int len);
+int ogs_nas_5gs_read_nsag_information(ogs_nas_nsag_information_t *nsag_information, unsigned char *data, int len);
+int ogs_nas_5gs_read_5gs_tracking_area_identity_list(ogs_nas_5gs_tracking_area_identity_list_t *tracking_area_identity_list, unsigned char *data, int len);
+int ogs_nas_5gs_read_priority_indicator(ogs_nas_priority_indicator_t *priority_indicator, unsigned char *data, int len);
+int ogs_nas_5gs_read_5gs_update_type(ogs_nas_5gs_update_type_t *update_type, unsigned char *data, int len);
+int ogs_nas_5gs_read_5gsm_capability(ogs_nas_5gsm_capability_t *gsm_capability, unsigned char *data, int len);
+int ogs_nas_5gs_read_pdu_address(ogs_nas_pdu_address_t *pdu_address, unsigned char *data, int len);
+int ogs_nas_5gs_read_pdu_session_type(ogs_nas_pdu_session_type_t *pdu_session_type, unsigned char *data, int len);
+int ogs_nas_5gs_read_qos_flow_descriptions(ogs_nas_qos_flow_descriptions_t *qos_flow_descriptions, unsigned char *data, int len);
+int ogs_nas_5gs_read_qos_rules(ogs_nas_qos_rules_t *qos_rules, unsigned char *data, int len);
+int ogs_nas_5gs_read_session_ambr(ogs_nas_session_ambr_t *session_ambr, unsigned char *data, int len);
+int ogs_nas_5gs_read_sm_pdu_dn_request_container(ogs_nas_sm_pdu_dn_request_container_t *sm_pdu_dn_request_container, unsigned char *data, int len);
+int ogs_nas_5gs_read_ssc_mode(ogs_nas_ssc_mode_t *ssc_mode, unsigned char *data, int len);
+int ogs_nas_5gs_read_re_attempt_indicator(ogs_nas_re_attempt_indicator_t *re_attempt_indicator, unsigned char *data, int len);
+int ogs_nas_5gs_read_5gsm_network_feature_support(ogs_nas_5gsm_network_feature_support_t *gsm_network_feature_support, unsigned char *data, int len);
+int ogs_nas_5gs_read_5gsm_cause(ogs_nas_5gsm_cause_t *gsm_cause, unsigned char *data, int len);
+int ogs_nas_5gs_read_serving_plmn_rate_control(ogs_nas_serving_plmn_rate_control_t *serving_plmn_rate_control, unsigned char *data, int len);
+int ogs_nas_5gs_read_5gsm_congestion_re_attempt_indicator(ogs_nas_5gsm_congestion_re_attempt_indicator_t *gsm_congestion_re_attempt_indicator, unsigned char *data, int len);
+int ogs_nas_5gs_read_atsss_container(ogs_nas_atsss_container_t *atsss_container, unsigned char *data, int len);
+int ogs_nas_5gs_read_control_plane_only_indication(ogs_nas_control_plane_only_indication_t *control_plane_only_indication, unsigned char *data, int len);
+int ogs_nas_5gs_read_ip_header_compression_configuration(ogs_nas_ip_header_compression_configuration_t *ip_header_compression_configuration, unsigned char *data, int len);
+int ogs_nas_5gs_read_header_compression_configuration(ogs_nas_header_compression_configuration_t *header_compression_configuration, unsigned char *data, int len);
+int ogs_nas_5gs_read_ds_tt_ethernet_port_mac_address(ogs_nas_ds_tt_ethernet_port_mac_address_t *ds_tt_ethernet_port_mac_address, unsigned char *data, int len);
+int ogs_nas_5gs_read_ue_ds_tt_residence_time(ogs_nas_ue_ds_tt_residence_time_t *ue_ds_tt_residence_time, unsigned char *data, int len);
+int ogs_nas_5gs_read_port_management_information_container(ogs_nas_port_management_information_container_t *port_management_information_container, unsigned char *data, int len);
+int ogs_nas_5gs_read_ethernet_header_compression_configuration(ogs_nas_ethernet_header_compression_configuration_t *ethernet_header_compression_configuration, unsigned char *data, int len);
+int ogs_nas_5gs_read_always_on_pdu_session_indication(ogs_nas_always_on_pdu_session_indication_t *always_on_pdu_session_indication, unsigned char *data, int len);
+int ogs_nas_5gs_read_requested_mbs_container(ogs_nas_requested_mbs_container_t *requested_mbs_container, unsigned char *data, int len);
+int ogs_nas_5gs_read_received_mbs_container(ogs_nas_received_mbs_container_t *received_mbs_container, unsigned char *data, int len);
+int ogs_nas_5gs_read_pdu_session_pair_id(ogs_nas_pdu_session_pair_id_t *pdu_session_pair_id, unsigned char *data, int len);
+int ogs_nas_5gs_read_rsn(ogs_nas_rsn_t *rsn, unsigned char *data, int len);
+int ogs_nas_5gs_read_always_on_pdu_session_requested(ogs_nas_always_on_pdu_session_requested_t *always_on_pdu_session_requested, unsigned char *data, int len);
+int ogs_nas_5gs_read_allowed_ssc_mode(ogs_nas_allowed_ssc_mode_t *allowed_ssc_mode, unsigned char *data, int len);
+int ogs_nas_5gs_read_extended_protocol_configuration_options(ogs_nas_extended_protocol_configuration_options_t *extended_protocol_configuration_options, unsigned char *data, int len);
+int ogs_nas_5gs_read_integrity_protection_maximum_data_rate(ogs_nas_integrity_protection_maximum_data_rate_t *integrity_protection_maximum_data_rate, unsigned char *data, int len);
+int ogs_nas_5gs_read_mapped_eps_bearer_contexts(ogs_nas_mapped_eps_bearer_contexts_t *mapped_eps_bearer_contexts, unsigned char *data, int len);
+int ogs_nas_5gs_read_maximum_number_of_supported_packet_filters(ogs_nas_maximum_number_of_supported_packet_filters_t *maximum_number_of_supported_packet_filters, unsigned char *data, int len);
+
 int ogs_nas_5gs_decode_additional_information(ogs_nas_additional_information_t *additional_information, ogs_pkbuf_t *pkbuf);
 int ogs_nas_5gs_decode_service_level_aa_container(ogs_nas_service_level_aa_container_t *service_level_aa_container, ogs_pkbuf_t *pkbuf);
 int ogs_nas_5gs_decode_access_type(ogs_nas_access_type_t *access_type, ogs_pkbuf_t *pkbuf);
@@ -28,8 +28,8 @@
 /*******************************************************************************
  * This file had been created by nas-message.py script v0.2.0
  * Please do not modify this file but regenerate it via script.
- * Created on: 2024-01-21 18:47:47.820801 by acetcom
- * from 24501-h90.docx
+ * Created from 24501-h90.docx
+ * (sha256: 934e13e03cc23a890da2448bd91bac0d11d7f538d814a725666f5c9be66f7b96)
  ******************************************************************************/
 
 #if !defined(OGS_NAS_INSIDE) && !defined(OGS_NAS_COMPILATION)
@@ -197,12 +197,13 @@ typedef struct ogs_nas_5gs_security_header_s {
 #define OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_T3512_VALUE_TYPE 0x3B
 
 typedef struct ogs_nas_5gs_registration_request_s {
+    uint64_t presencemask;
+
     /* Mandatory fields */
     ogs_nas_5gs_registration_type_t registration_type;
     ogs_nas_5gs_mobile_identity_t mobile_identity;
 
     /* Optional fields */
-    uint64_t presencemask;
     ogs_nas_key_set_identifier_t non_current_native_nas_key_set_identifier;
     ogs_nas_5gmm_capability_t gmm_capability;
     ogs_nas_ue_security_capability_t ue_security_capability;
@@ -350,11 +351,12 @@ typedef struct ogs_nas_5gs_registration_request_s {
 #define OGS_NAS_5GS_REGISTRATION_ACCEPT_NSAG_INFORMATION_TYPE 0x7C
 
 typedef struct ogs_nas_5gs_registration_accept_s {
+    uint64_t presencemask;
+
     /* Mandatory fields */
     ogs_nas_5gs_registration_result_t registration_result;
 
     /* Optional fields */
-    uint64_t presencemask;
     ogs_nas_5gs_mobile_identity_t guti;
     ogs_nas_plmn_list_t equivalent_plmns;
     ogs_nas_5gs_tracking_area_identity_list_t tai_list;
@@ -415,9 +417,9 @@ typedef struct ogs_nas_5gs_registration_accept_s {
 #define OGS_NAS_5GS_REGISTRATION_COMPLETE_SOR_TRANSPARENT_CONTAINER_TYPE 0x73
 
 typedef struct ogs_nas_5gs_registration_complete_s {
+    uint64_t presencemask;
 
     /* Optional fields */
-    uint64_t presencemask;
     ogs_nas_sor_transparent_container_t sor_transparent_container;
 } ogs_nas_5gs_registration_complete_t;
 
@@ -449,11 +451,12 @@ typedef struct ogs_nas_5gs_registration_complete_s {
 #define OGS_NAS_5GS_REGISTRATION_REJECT_FORBIDDEN_TAI_FOR_THE_LIST_OF_5GS_FORBIDDEN_TRACKING_AREAS_FORREGIONAL_PROVISION_OF_SERVICE_TYPE 0x1E
 
 typedef struct ogs_nas_5gs_registration_reject_s {
+    uint64_t presencemask;
+
     /* Mandatory fields */
     ogs_nas_5gmm_cause_t gmm_cause;
 
     /* Optional fields */
-    uint64_t presencemask;
     ogs_nas_gprs_timer_2_t t3346_value;
     ogs_nas_gprs_timer_2_t t3502_value;
     ogs_nas_eap_message_t eap_message;
@@ -504,11 +507,12 @@ typedef struct ogs_nas_5gs_deregistration_request_from_ue_s {
 #define OGS_NAS_5GS_DEREGISTRATION_REQUEST_TO_UE_FORBIDDEN_TAI_FOR_THE_LIST_OF_5GS_FORBIDDEN_TRACKING_AREAS_FORREGIONAL_PROVISION_OF_SERVICE_TYPE 0x1E
 
 typedef struct ogs_nas_5gs_deregistration_request_to_ue_s {
+    uint64_t presencemask;
+
     /* Mandatory fields */
     ogs_nas_de_registration_type_t de_registration_type;
 
     /* Optional fields */
-    uint64_t presencemask;
     ogs_nas_5gmm_cause_t gmm_cause;
     ogs_nas_gprs_timer_2_t t3346_value;
     ogs_nas_rejected_nssai_t rejected_nssai;
@@ -539,12 +543,13 @@ typedef struct ogs_nas_5gs_deregistration_request_to_ue_s {
 #define OGS_NAS_5GS_SERVICE_REQUEST_PAGING_RESTRICTION_TYPE 0x28
 
 typedef struct ogs_nas_5gs_service_request_s {
+    uint64_t presencemask;
+
     /* Mandatory fields */
     ogs_nas_key_set_identifier_t ngksi;
     ogs_nas_5gs_mobile_identity_t s_tmsi;
 
     /* Optional fields */
-    uint64_t presencemask;
     ogs_nas_uplink_data_status_t uplink_data_status;
     ogs_nas_pdu_session_status_t pdu_session_status;
     ogs_nas_allowed_pdu_session_status_t allowed_pdu_session_status;
@@ -579,11 +584,12 @@ typedef struct ogs_nas_5gs_service_request_s {
 #define OGS_NAS_5GS_SERVICE_REJECT_FORBIDDEN_TAI_FOR_THE_LIST_OF_5GS_FORBIDDEN_TRACKING_AREAS_FORREGIONAL_PROVISION_OF_SERVICE_TYPE 0x1E
 
 typedef struct ogs_nas_5gs_service_reject_s {
+    uint64_t presencemask;
+
     /* Mandatory fields */
     ogs_nas_5gmm_cause_t gmm_cause;
 
     /* Optional fields */
-    uint64_t presencemask;
     ogs_nas_pdu_session_status_t pdu_session_status;
     ogs_nas_gprs_timer_2_t t3346_value;
     ogs_nas_eap_message_t eap_message;
@@ -618,9 +624,9 @@ typedef struct ogs_nas_5gs_service_reject_s {
 #define OGS_NAS_5GS_SERVICE_ACCEPT_FORBIDDEN_TAI_FOR_THE_LIST_OF_5GS_FORBIDDEN_TRACKING_AREAS_FORREGIONAL_PROVISION_OF_SERVICE_TYPE 0x1E
 
 typedef struct ogs_nas_5gs_service_accept_s {
+    uint64_t presencemask;
 
     /* Optional fields */
-    uint64_t presencemask;
     ogs_nas_pdu_session_status_t pdu_session_status;
     ogs_nas_pdu_session_reactivation_result_t pdu_session_reactivation_result;
     ogs_nas_pdu_session_reactivation_result_error_cause_t pdu_session_reactivation_result_error_cause;
@@ -705,9 +711,9 @@ typedef struct ogs_nas_5gs_service_accept_s {
 #define OGS_NAS_5GS_CONFIGURATION_UPDATE_COMMAND_PRIORITY_INDICATOR_TYPE 0xE0
 
 typedef struct ogs_nas_5gs_configuration_update_command_s {
+    uint64_t presencemask;
 
     /* Optional fields */
-    uint64_t presencemask;
     ogs_nas_configuration_update_indication_t configuration_update_indication;
     ogs_nas_5gs_mobile_identity_t guti;
     ogs_nas_5gs_tracking_area_identity_list_t tai_list;
@@ -756,12 +762,13 @@ typedef struct ogs_nas_5gs_configuration_update_command_s {
 #define OGS_NAS_5GS_AUTHENTICATION_REQUEST_EAP_MESSAGE_TYPE 0x78
 
 typedef struct ogs_nas_5gs_authentication_request_s {
+    uint64_t presencemask;
+
     /* Mandatory fields */
     ogs_nas_key_set_identifier_t ngksi;
     ogs_nas_abba_t abba;
 
     /* Optional fields */
-    uint64_t presencemask;
     ogs_nas_authentication_parameter_rand_t authentication_parameter_rand;
     ogs_nas_authentication_parameter_autn_t authentication_parameter_autn;
     ogs_nas_eap_message_t eap_message;
@@ -777,9 +784,9 @@ typedef struct ogs_nas_5gs_authentication_request_s {
 #define OGS_NAS_5GS_AUTHENTICATION_RESPONSE_EAP_MESSAGE_TYPE 0x78
 
 typedef struct ogs_nas_5gs_authentication_response_s {
+    uint64_t presencemask;
 
     /* Optional fields */
-    uint64_t presencemask;
     ogs_nas_authentication_response_parameter_t authentication_response_parameter;
     ogs_nas_eap_message_t eap_message;
 } ogs_nas_5gs_authentication_response_t;
@@ -792,9 +799,9 @@ typedef struct ogs_nas_5gs_authentication_response_s {
 #define OGS_NAS_5GS_AUTHENTICATION_REJECT_EAP_MESSAGE_TYPE 0x78
 
 typedef struct ogs_nas_5gs_authentication_reject_s {
+    uint64_t presencemask;
 
     /* Optional fields */
-    uint64_t presencemask;
     ogs_nas_eap_message_t eap_message;
 } ogs_nas_5gs_authentication_reject_t;
 
@@ -806,11 +813,12 @@ typedef struct ogs_nas_5gs_authentication_reject_s {
 #define OGS_NAS_5GS_AUTHENTICATION_FAILURE_AUTHENTICATION_FAILURE_PARAMETER_TYPE 0x30
 
 typedef struct ogs_nas_5gs_authentication_failure_s {
+    uint64_t presencemask;
+
     /* Mandatory fields */
     ogs_nas_5gmm_cause_t gmm_cause;
 
     /* Optional fields */
-    uint64_t presencemask;
     ogs_nas_authentication_failure_parameter_t authentication_failure_parameter;
 } ogs_nas_5gs_authentication_failure_t;
 
@@ -822,12 +830,13 @@ typedef struct ogs_nas_5gs_authentication_failure_s {
 #define OGS_NAS_5GS_AUTHENTICATION_RESULT_ABBA_TYPE 0x38
 
 typedef struct ogs_nas_5gs_authentication_result_s {
+    uint64_t presencemask;
+
     /* Mandatory fields */
     ogs_nas_key_set_identifier_t ngksi;
     ogs_nas_eap_message_t eap_message;
 
     /* Optional fields */
-    uint64_t presencemask;
     ogs_nas_abba_t abba;
 } ogs_nas_5gs_authentication_result_t;
 
@@ -869,13 +878,14 @@ typedef struct ogs_nas_5gs_identity_response_s {
 #define OGS_NAS_5GS_SECURITY_MODE_COMMAND_REPLAYED_S1_UE_SECURITY_CAPABILITIES_TYPE 0x19
 
 typedef struct ogs_nas_5gs_security_mode_command_s {
+    uint64_t presencemask;
+
     /* Mandatory fields */
     ogs_nas_security_algorithms_t selected_nas_security_algorithms;
     ogs_nas_key_set_identifier_t ngksi;
     ogs_nas_ue_security_capability_t replayed_ue_security_capabilities;
 
     /* Optional fields */
-    uint64_t presencemask;
     ogs_nas_imeisv_request_t imeisv_request;
     ogs_nas_eps_nas_security_algorithms_t selected_eps_nas_security_algorithms;
     ogs_nas_additional_5g_security_information_t additional_security_information;
@@ -896,9 +906,9 @@ typedef struct ogs_nas_5gs_security_mode_command_s {
 #define OGS_NAS_5GS_SECURITY_MODE_COMPLETE_NON_IMEISV_PEI_TYPE 0x78
 
 typedef struct ogs_nas_5gs_security_mode_complete_s {
+    uint64_t presencemask;
 
     /* Optional fields */
-    uint64_t presencemask;
     ogs_nas_5gs_mobile_identity_t imeisv;
     ogs_nas_message_container_t nas_message_container;
     ogs_nas_5gs_mobile_identity_t non_imeisv_pei;
@@ -942,9 +952,9 @@ typedef struct ogs_nas_5gs_notification_s {
 #define OGS_NAS_5GS_NOTIFICATION_RESPONSE_PDU_SESSION_STATUS_TYPE 0x50
 
 typedef struct ogs_nas_5gs_notification_response_s {
+    uint64_t presencemask;
 
     /* Optional fields */
-    uint64_t presencemask;
     ogs_nas_pdu_session_status_t pdu_session_status;
 } ogs_nas_5gs_notification_response_t;
 
@@ -970,12 +980,13 @@ typedef struct ogs_nas_5gs_notification_response_s {
 #define OGS_NAS_5GS_UL_NAS_TRANSPORT_RELEASE_ASSISTANCE_INDICATION_TYPE 0xF0
 
 typedef struct ogs_nas_5gs_ul_nas_transport_s {
+    uint64_t presencemask;
+
     /* Mandatory fields */
     ogs_nas_payload_container_type_t payload_container_type;
     ogs_nas_payload_container_t payload_container;
 
     /* Optional fields */
-    uint64_t presencemask;
     ogs_nas_pdu_session_identity_2_t pdu_session_id;
     ogs_nas_pdu_session_identity_2_t old_pdu_session_id;
     ogs_nas_request_type_t request_type;
@@ -1002,12 +1013,13 @@ typedef struct ogs_nas_5gs_ul_nas_transport_s {
 #define OGS_NAS_5GS_DL_NAS_TRANSPORT_LOWER_BOUND_TIMER_VALUE_TYPE 0x3A
 
 typedef struct ogs_nas_5gs_dl_nas_transport_s {
+    uint64_t presencemask;
+
     /* Mandatory fields */
     ogs_nas_payload_container_type_t payload_container_type;
     ogs_nas_payload_container_t payload_container;
 
     /* Optional fields */
-    uint64_t presencemask;
     ogs_nas_pdu_session_identity_2_t pdu_session_id;
     ogs_nas_additional_information_t additional_information;
     ogs_nas_5gmm_cause_t gmm_cause;
@@ -1055,11 +1067,12 @@ typedef struct ogs_nas_5gs_dl_nas_transport_s {
 #define OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_REQUEST_RSN_TYPE 0x35
 
 typedef struct ogs_nas_5gs_pdu_session_establishment_request_s {
+    uint64_t presencemask;
+
     /* Mandatory fields */
     ogs_nas_integrity_protection_maximum_data_rate_t integrity_protection_maximum_data_rate;
 
     /* Optional fields */
-    uint64_t presencemask;
     ogs_nas_pdu_session_type_t pdu_session_type;
     ogs_nas_ssc_mode_t ssc_mode;
     ogs_nas_5gsm_capability_t gsm_capability;
@@ -1121,13 +1134,14 @@ typedef struct ogs_nas_5gs_pdu_session_establishment_request_s {
 #define OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_ACCEPT_RECEIVED_MBS_CONTAINER_TYPE 0x71
 
 typedef struct ogs_nas_5gs_pdu_session_establishment_accept_s {
+    uint64_t presencemask;
+
     /* Mandatory fields */
     ogs_nas_pdu_session_type_t selected_pdu_session_type;
     ogs_nas_qos_rules_t authorized_qos_rules;
     ogs_nas_session_ambr_t session_ambr;
 
     /* Optional fields */
-    uint64_t presencemask;
     ogs_nas_5gsm_cause_t gsm_cause;
     ogs_nas_pdu_address_t pdu_address;
     ogs_nas_gprs_timer_t rq_timer_value;
@@ -1168,11 +1182,12 @@ typedef struct ogs_nas_5gs_pdu_session_establishment_accept_s {
 #define OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_REJECT_SERVICE_LEVEL_AA_CONTAINER_TYPE 0x72
 
 typedef struct ogs_nas_5gs_pdu_session_establishment_reject_s {
+    uint64_t presencemask;
+
     /* Mandatory fields */
     ogs_nas_5gsm_cause_t gsm_cause;
 
     /* Optional fields */
-    uint64_t presencemask;
     ogs_nas_gprs_timer_3_t back_off_timer_value;
     ogs_nas_allowed_ssc_mode_t allowed_ssc_mode;
     ogs_nas_eap_message_t eap_message;
@@ -1190,11 +1205,12 @@ typedef struct ogs_nas_5gs_pdu_session_establishment_reject_s {
 #define OGS_NAS_5GS_PDU_SESSION_AUTHENTICATION_COMMAND_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE 0x7B
 
 typedef struct ogs_nas_5gs_pdu_session_authentication_command_s {
+    uint64_t presencemask;
+
     /* Mandatory fields */
     ogs_nas_eap_message_t eap_message;
 
     /* Optional fields */
-    uint64_t presencemask;
     ogs_nas_extended_protocol_configuration_options_t extended_protocol_configuration_options;
 } ogs_nas_5gs_pdu_session_authentication_command_t;
 
@@ -1206,11 +1222,12 @@ typedef struct ogs_nas_5gs_pdu_session_authentication_command_s {
 #define OGS_NAS_5GS_PDU_SESSION_AUTHENTICATION_COMPLETE_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE 0x7B
 
 typedef struct ogs_nas_5gs_pdu_session_authentication_complete_s {
+    uint64_t presencemask;
+
     /* Mandatory fields */
     ogs_nas_eap_message_t eap_message;
 
     /* Optional fields */
-    uint64_t presencemask;
     ogs_nas_extended_protocol_configuration_options_t extended_protocol_configuration_options;
 } ogs_nas_5gs_pdu_session_authentication_complete_t;
 
@@ -1224,9 +1241,9 @@ typedef struct ogs_nas_5gs_pdu_session_authentication_complete_s {
 #define OGS_NAS_5GS_PDU_SESSION_AUTHENTICATION_RESULT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE 0x7B
 
 typedef struct ogs_nas_5gs_pdu_session_authentication_result_s {
+    uint64_t presencemask;
 
     /* Optional fields */
-    uint64_t presencemask;
     ogs_nas_eap_message_t eap_message;
     ogs_nas_extended_protocol_configuration_options_t extended_protocol_configuration_options;
 } ogs_nas_5gs_pdu_session_authentication_result_t;
@@ -1265,9 +1282,9 @@ typedef struct ogs_nas_5gs_pdu_session_authentication_result_s {
 #define OGS_NAS_5GS_PDU_SESSION_MODIFICATION_REQUEST_SERVICE_LEVEL_AA_CONTAINER_TYPE 0x72
 
 typedef struct ogs_nas_5gs_pdu_session_modification_request_s {
+    uint64_t presencemask;
 
     /* Optional fields */
-    uint64_t presencemask;
     ogs_nas_5gsm_capability_t gsm_capability;
     ogs_nas_5gsm_cause_t gsm_cause;
     ogs_nas_maximum_number_of_supported_packet_filters_t maximum_number_of_supported_packet_filters;
@@ -1298,11 +1315,12 @@ typedef struct ogs_nas_5gs_pdu_session_modification_request_s {
 #define OGS_NAS_5GS_PDU_SESSION_MODIFICATION_REJECT_RE_ATTEMPT_INDICATOR_TYPE 0x1D
 
 typedef struct ogs_nas_5gs_pdu_session_modification_reject_s {
+    uint64_t presencemask;
+
     /* Mandatory fields */
     ogs_nas_5gsm_cause_t gsm_cause;
 
     /* Optional fields */
-    uint64_t presencemask;
     ogs_nas_gprs_timer_3_t back_off_timer_value;
     ogs_nas_5gsm_congestion_re_attempt_indicator_t gsm_congestion_re_attempt_indicator;
     ogs_nas_extended_protocol_configuration_options_t extended_protocol_configuration_options;
@@ -1345,9 +1363,9 @@ typedef struct ogs_nas_5gs_pdu_session_modification_reject_s {
 #define OGS_NAS_5GS_PDU_SESSION_MODIFICATION_COMMAND_SERVICE_LEVEL_AA_CONTAINER_TYPE 0x72
 
 typedef struct ogs_nas_5gs_pdu_session_modification_command_s {
+    uint64_t presencemask;
 
     /* Optional fields */
-    uint64_t presencemask;
     ogs_nas_5gsm_cause_t gsm_cause;
     ogs_nas_session_ambr_t session_ambr;
     ogs_nas_gprs_timer_t rq_timer_value;
@@ -1375,9 +1393,9 @@ typedef struct ogs_nas_5gs_pdu_session_modification_command_s {
 #define OGS_NAS_5GS_PDU_SESSION_MODIFICATION_COMPLETE_PORT_MANAGEMENT_INFORMATION_CONTAINER_TYPE 0x74
 
 typedef struct ogs_nas_5gs_pdu_session_modification_complete_s {
+    uint64_t presencemask;
 
     /* Optional fields */
-    uint64_t presencemask;
     ogs_nas_extended_protocol_configuration_options_t extended_protocol_configuration_options;
     ogs_nas_port_management_information_container_t port_management_information_container;
 } ogs_nas_5gs_pdu_session_modification_complete_t;
@@ -1390,11 +1408,12 @@ typedef struct ogs_nas_5gs_pdu_session_modification_complete_s {
 #define OGS_NAS_5GS_PDU_SESSION_MODIFICATION_COMMAND_REJECT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE 0x7B
 
 typedef struct ogs_nas_5gs_pdu_session_modification_command_reject_s {
+    uint64_t presencemask;
+
     /* Mandatory fields */
     ogs_nas_5gsm_cause_t gsm_cause;
 
     /* Optional fields */
-    uint64_t presencemask;
     ogs_nas_extended_protocol_configuration_options_t extended_protocol_configuration_options;
 } ogs_nas_5gs_pdu_session_modification_command_reject_t;
 
@@ -1408,9 +1427,9 @@ typedef struct ogs_nas_5gs_pdu_session_modification_command_reject_s {
 #define OGS_NAS_5GS_PDU_SESSION_RELEASE_REQUEST_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE 0x7B
 
 typedef struct ogs_nas_5gs_pdu_session_release_request_s {
+    uint64_t presencemask;
 
     /* Optional fields */
-    uint64_t presencemask;
     ogs_nas_5gsm_cause_t gsm_cause;
     ogs_nas_extended_protocol_configuration_options_t extended_protocol_configuration_options;
 } ogs_nas_5gs_pdu_session_release_request_t;
@@ -1423,11 +1442,12 @@ typedef struct ogs_nas_5gs_pdu_session_release_request_s {
 #define OGS_NAS_5GS_PDU_SESSION_RELEASE_REJECT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE 0x7B
 
 typedef struct ogs_nas_5gs_pdu_session_release_reject_s {
+    uint64_t presencemask;
+
     /* Mandatory fields */
     ogs_nas_5gsm_cause_t gsm_cause;
 
     /* Optional fields */
-    uint64_t presencemask;
     ogs_nas_extended_protocol_configuration_options_t extended_protocol_configuration_options;
 } ogs_nas_5gs_pdu_session_release_reject_t;
 
@@ -1449,11 +1469,12 @@ typedef struct ogs_nas_5gs_pdu_session_release_reject_s {
 #define OGS_NAS_5GS_PDU_SESSION_RELEASE_COMMAND_SERVICE_LEVEL_AA_CONTAINER_TYPE 0x72
 
 typedef struct ogs_nas_5gs_pdu_session_release_command_s {
+    uint64_t presencemask;
+
     /* Mandatory fields */
     ogs_nas_5gsm_cause_t gsm_cause;
 
     /* Optional fields */
-    uint64_t presencemask;
     ogs_nas_gprs_timer_3_t back_off_timer_value;
     ogs_nas_eap_message_t eap_message;
     ogs_nas_5gsm_congestion_re_attempt_indicator_t gsm_congestion_re_attempt_indicator;
@@ -1472,9 +1493,9 @@ typedef struct ogs_nas_5gs_pdu_session_release_command_s {
 #define OGS_NAS_5GS_PDU_SESSION_RELEASE_COMPLETE_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE 0x7B
 
 typedef struct ogs_nas_5gs_pdu_session_release_complete_s {
+    uint64_t presencemask;
 
     /* Optional fields */
-    uint64_t presencemask;
     ogs_nas_5gsm_cause_t gsm_cause;
     ogs_nas_extended_protocol_configuration_options_t extended_protocol_configuration_options;
 } ogs_nas_5gs_pdu_session_release_complete_t;
@@ -1557,6 +1578,165 @@ int ogs_nas_5gmm_decode(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf);
 int ogs_nas_5gsm_decode(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf);
 ogs_pkbuf_t *ogs_nas_5gs_plain_encode(ogs_nas_5gs_message_t *message);
 
+/*
+ * Encode the message in the tailroom of a pkbuf of the caller, past the
+ * octets it already holds, and return the number of octets encoded.
+ * The headroom is left alone for the security header.
+ */
+int ogs_nas_5gmm_encode_to(
+        ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf);
+int ogs_nas_5gsm_encode_to(
+        ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf);
+int ogs_nas_5gs_plain_encode_to(
+        ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf);
+
+/* Exact number of octets the encoder writes, header included */
+int ogs_nas_5gmm_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gsm_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_registration_request_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_registration_accept_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_registration_complete_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_registration_reject_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_deregistration_request_from_ue_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_deregistration_accept_from_ue_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_deregistration_request_to_ue_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_deregistration_accept_to_ue_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_service_request_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_service_reject_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_service_accept_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_configuration_update_command_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_configuration_update_complete_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_authentication_request_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_authentication_response_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_authentication_reject_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_authentication_failure_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_authentication_result_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_identity_request_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_identity_response_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_security_mode_command_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_security_mode_complete_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_security_mode_reject_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_5gmm_status_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_notification_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_notification_response_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_ul_nas_transport_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_dl_nas_transport_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_pdu_session_establishment_request_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_pdu_session_establishment_accept_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_pdu_session_establishment_reject_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_pdu_session_authentication_command_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_pdu_session_authentication_complete_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_pdu_session_authentication_result_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_pdu_session_modification_request_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_pdu_session_modification_reject_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_pdu_session_modification_command_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_pdu_session_modification_complete_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_pdu_session_modification_command_reject_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_pdu_session_release_request_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_pdu_session_release_reject_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_pdu_session_release_command_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_pdu_session_release_complete_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gs_5gsm_status_encoded_size(ogs_nas_5gs_message_t *message);
+
+/*
+ * Lazy decoders: the mandatory IEs are decoded right away, while the
+ * optional IEs are only located. Each of them is decoded by its accessor
+ * on first use and kept in the message, so the pkbuf must live as long
+ * as the accessors are called. An accessor returns NULL if the IE is
+ * absent or cannot be decoded.
+ */
+typedef struct ogs_nas_5gs_registration_request_lazy_s {
+    ogs_nas_5gmm_header_t h;
+    ogs_nas_5gs_registration_request_t registration_request;
+
+    ogs_pkbuf_t *pkbuf;
+    uint64_t decodedmask;
+    unsigned int offset[39];
+} ogs_nas_5gs_registration_request_lazy_t;
+
+int ogs_nas_5gs_decode_registration_request_lazy(
+        ogs_nas_5gs_registration_request_lazy_t *lazy, ogs_pkbuf_t *pkbuf);
+ogs_nas_key_set_identifier_t *ogs_nas_5gs_registration_request_non_current_native_nas_key_set_identifier(
+        ogs_nas_5gs_registration_request_lazy_t *lazy);
+ogs_nas_5gmm_capability_t *ogs_nas_5gs_registration_request_gmm_capability(
+        ogs_nas_5gs_registration_request_lazy_t *lazy);
+ogs_nas_ue_security_capability_t *ogs_nas_5gs_registration_request_ue_security_capability(
+        ogs_nas_5gs_registration_request_lazy_t *lazy);
+ogs_nas_nssai_t *ogs_nas_5gs_registration_request_requested_nssai(
+        ogs_nas_5gs_registration_request_lazy_t *lazy);
+ogs_nas_5gs_tracking_area_identity_t *ogs_nas_5gs_registration_request_last_visited_registered_tai(
+        ogs_nas_5gs_registration_request_lazy_t *lazy);
+ogs_nas_s1_ue_network_capability_t *ogs_nas_5gs_registration_request_s1_ue_network_capability(
+        ogs_nas_5gs_registration_request_lazy_t *lazy);
+ogs_nas_uplink_data_status_t *ogs_nas_5gs_registration_request_uplink_data_status(
+        ogs_nas_5gs_registration_request_lazy_t *lazy);
+ogs_nas_pdu_session_status_t *ogs_nas_5gs_registration_request_pdu_session_status(
+        ogs_nas_5gs_registration_request_lazy_t *lazy);
+ogs_nas_mico_indication_t *ogs_nas_5gs_registration_request_mico_indication(
+        ogs_nas_5gs_registration_request_lazy_t *lazy);
+ogs_nas_ue_status_t *ogs_nas_5gs_registration_request_ue_status(
+        ogs_nas_5gs_registration_request_lazy_t *lazy);
+ogs_nas_5gs_mobile_identity_t *ogs_nas_5gs_registration_request_additional_guti(
+        ogs_nas_5gs_registration_request_lazy_t *lazy);
+ogs_nas_allowed_pdu_session_status_t *ogs_nas_5gs_registration_request_allowed_pdu_session_status(
+        ogs_nas_5gs_registration_request_lazy_t *lazy);
+ogs_nas_ue_usage_setting_t *ogs_nas_5gs_registration_request_ue_usage_setting(
+        ogs_nas_5gs_registration_request_lazy_t *lazy);
+ogs_nas_5gs_drx_parameters_t *ogs_nas_5gs_registration_request_requested_drx_parameters(
+        ogs_nas_5gs_registration_request_lazy_t *lazy);
+ogs_nas_eps_nas_message_container_t *ogs_nas_5gs_registration_request_eps_nas_message_container(
+        ogs_nas_5gs_registration_request_lazy_t *lazy);
+ogs_nas_ladn_indication_t *ogs_nas_5gs_registration_request_ladn_indication(
+        ogs_nas_5gs_registration_request_lazy_t *lazy);
+ogs_nas_payload_container_type_t *ogs_nas_5gs_registration_request_payload_container_type(
+        ogs_nas_5gs_registration_request_lazy_t *lazy);
+ogs_nas_payload_container_t *ogs_nas_5gs_registration_request_payload_container(
+        ogs_nas_5gs_registration_request_lazy_t *lazy);
+ogs_nas_network_slicing_indication_t *ogs_nas_5gs_registration_request_network_slicing_indication(
+        ogs_nas_5gs_registration_request_lazy_t *lazy);
+ogs_nas_5gs_update_type_t *ogs_nas_5gs_registration_request_update_type(
+        ogs_nas_5gs_registration_request_lazy_t *lazy);
+ogs_nas_mobile_station_classmark_2_t *ogs_nas_5gs_registration_request_mobile_station_classmark_2(
+        ogs_nas_5gs_registration_request_lazy_t *lazy);
+ogs_nas_supported_codec_list_t *ogs_nas_5gs_registration_request_supported_codecs(
+        ogs_nas_5gs_registration_request_lazy_t *lazy);
+ogs_nas_message_container_t *ogs_nas_5gs_registration_request_nas_message_container(
+        ogs_nas_5gs_registration_request_lazy_t *lazy);
+ogs_nas_eps_bearer_context_status_t *ogs_nas_5gs_registration_request_eps_bearer_context_status(
+        ogs_nas_5gs_registration_request_lazy_t *lazy);
+ogs_nas_extended_drx_parameters_t *ogs_nas_5gs_registration_request_requested_extended_drx_parameters(
+        ogs_nas_5gs_registration_request_lazy_t *lazy);
+ogs_nas_gprs_timer_3_t *ogs_nas_5gs_registration_request_t3324_value(
+        ogs_nas_5gs_registration_request_lazy_t *lazy);
+ogs_nas_ue_radio_capability_id_t *ogs_nas_5gs_registration_request_ue_radio_capability_id(
+        ogs_nas_5gs_registration_request_lazy_t *lazy);
+ogs_nas_mapped_nssai_t *ogs_nas_5gs_registration_request_requested_mapped_nssai(
+        ogs_nas_5gs_registration_request_lazy_t *lazy);
+ogs_nas_additional_information_requested_t *ogs_nas_5gs_registration_request_additional_information_requested(
+        ogs_nas_5gs_registration_request_lazy_t *lazy);
+ogs_nas_wus_assistance_information_t *ogs_nas_5gs_registration_request_requested_wus_assistance_information(
+        ogs_nas_5gs_registration_request_lazy_t *lazy);
+ogs_nas_n5gc_indication_t *ogs_nas_5gs_registration_request_n5gc_indication(
+        ogs_nas_5gs_registration_request_lazy_t *lazy);
+ogs_nas_nb_n1_mode_drx_parameters_t *ogs_nas_5gs_registration_request_requested_nb_n1_mode_drx_parameters(
+        ogs_nas_5gs_registration_request_lazy_t *lazy);
+ogs_nas_ue_request_type_t *ogs_nas_5gs_registration_request_ue_request_type(
+        ogs_nas_5gs_registration_request_lazy_t *lazy);
+ogs_nas_paging_restriction_t *ogs_nas_5gs_registration_request_paging_restriction(
+        ogs_nas_5gs_registration_request_lazy_t *lazy);
+ogs_nas_service_level_aa_container_t *ogs_nas_5gs_registration_request_service_level_aa_container(
+        ogs_nas_5gs_registration_request_lazy_t *lazy);
+ogs_nas_nid_t *ogs_nas_5gs_registration_request_nid(
+        ogs_nas_5gs_registration_request_lazy_t *lazy);
+ogs_nas_plmn_identity_t *ogs_nas_5gs_registration_request_ms_determined_plmn_with_disaster_condition(
+        ogs_nas_5gs_registration_request_lazy_t *lazy);
+ogs_nas_peips_assistance_information_t *ogs_nas_5gs_registration_request_requested_peips_assistance_information(
+        ogs_nas_5gs_registration_request_lazy_t *lazy);
+ogs_nas_gprs_timer_3_t *ogs_nas_5gs_registration_request_requested_t3512_value(
+        ogs_nas_5gs_registration_request_lazy_t *lazy);
+
+
+
 #ifdef __cplusplus
 }
 #endif
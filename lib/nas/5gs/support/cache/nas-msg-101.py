@@ -1,3 +0,0 @@
-ies = []
-ies.append({ "iei" : "", "value" : "Access type", "type" : "Access type", "reference" : "9.11.2.1A", "presence" : "M", "format" : "V", "length" : "1/2"})
-msg_list[key]["ies"] = ies
@@ -1,3 +0,0 @@
-ies = []
-ies.append({ "iei" : "50", "value" : "PDU session status", "type" : "PDU session status", "reference" : "9.11.3.44", "presence" : "O", "format" : "TLV", "length" : "4-34"})
-msg_list[key]["ies"] = ies
@@ -1,3 +0,0 @@
-ies = []
-ies.append({ "iei" : "", "value" : "5GSM cause", "type" : "5GSM cause", "reference" : "9.11.4.2", "presence" : "M", "format" : "V", "length" : "1"})
-msg_list[key]["ies"] = ies
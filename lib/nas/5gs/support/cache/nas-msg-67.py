@@ -1,3 +0,0 @@
-ies = []
-ies.append({ "iei" : "73", "value" : "SOR transparent container", "type" : "SOR transparent container", "reference" : "9.11.3.51", "presence" : "O", "format" : "TLV-E", "length" : "20"})
-msg_list[key]["ies"] = ies
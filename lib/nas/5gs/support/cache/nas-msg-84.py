@@ -1,36 +0,0 @@
-ies = []
-ies.append({ "iei" : "D-", "value" : "Configuration update indication", "type" : "Configuration update indication", "reference" : "9.11.3.18", "presence" : "O", "format" : "TV", "length" : "1"})
-ies.append({ "iei" : "77", "value" : "5G-GUTI", "type" : "5GS mobile identity", "reference" : "9.11.3.4", "presence" : "O", "format" : "TLV-E", "length" : "14"})
-ies.append({ "iei" : "54", "value" : "TAI list", "type" : "5GS tracking area identity list", "reference" : "9.11.3.9", "presence" : "O", "format" : "TLV", "length" : "9-114"})
-ies.append({ "iei" : "15", "value" : "Allowed NSSAI", "type" : "NSSAI", "reference" : "9.11.3.37", "presence" : "O", "format" : "TLV", "length" : "4-74"})
-ies.append({ "iei" : "27", "value" : "Service area list", "type" : "Service area list", "reference" : "9.11.3.49", "presence" : "O", "format" : "TLV", "length" : "6-114"})
-ies.append({ "iei" : "43", "value" : "Full name for network", "type" : "Network name", "reference" : "9.11.3.35", "presence" : "O", "format" : "TLV", "length" : "3-n"})
-ies.append({ "iei" : "45", "value" : "Short name for network", "type" : "Network name", "reference" : "9.11.3.35", "presence" : "O", "format" : "TLV", "length" : "3-n"})
-ies.append({ "iei" : "46", "value" : "Local time zone", "type" : "Time zone", "reference" : "9.11.3.52", "presence" : "O", "format" : "TV", "length" : "2"})
-ies.append({ "iei" : "47", "value" : "Universal time and local time zone", "type" : "Time zone and time", "reference" : "9.11.3.53", "presence" : "O", "format" : "TV", "length" : "8"})
-ies.append({ "iei" : "49", "value" : "Network daylight saving time", "type" : "Daylight saving time", "reference" : "9.11.3.19", "presence" : "O", "format" : "TLV", "length" : "3"})
-ies.append({ "iei" : "79", "value" : "LADN information", "type" : "LADN information", "reference" : "9.11.3.30", "presence" : "O", "format" : "TLV-E", "length" : "3-1715"})
-ies.append({ "iei" : "B-", "value" : "MICO indication", "type" : "MICO indication", "reference" : "9.11.3.31", "presence" : "O", "format" : "TV", "length" : "1"})
-ies.append({ "iei" : "9-", "value" : "Network slicing indication", "type" : "Network slicing indication", "reference" : "9.11.3.36", "presence" : "O", "format" : "TV", "length" : "1"})
-ies.append({ "iei" : "31", "value" : "Configured NSSAI", "type" : "NSSAI", "reference" : "9.11.3.37", "presence" : "O", "format" : "TLV", "length" : "4-146"})
-ies.append({ "iei" : "11", "value" : "Rejected NSSAI", "type" : "Rejected NSSAI", "reference" : "9.11.3.46", "presence" : "O", "format" : "TLV", "length" : "4-42"})
-ies.append({ "iei" : "76", "value" : "Operator-defined access category definitions", "type" : "Operator-defined access category definitions", "reference" : "9.11.3.38", "presence" : "O", "format" : "TLV-E", "length" : "3-8323"})
-ies.append({ "iei" : "F-", "value" : "SMS indication", "type" : "SMS indication", "reference" : "9.11.3.50A", "presence" : "O", "format" : "TV", "length" : "1"})
-ies.append({ "iei" : "6C", "value" : "T3447 value", "type" : "GPRS timer 3", "reference" : "9.11.2.5", "presence" : "O", "format" : "TLV", "length" : "3"})
-ies.append({ "iei" : "75", "value" : "CAG information list", "type" : "CAG information list", "reference" : "9.11.3.18A", "presence" : "O", "format" : "TLV-E", "length" : "3-n"})
-ies.append({ "iei" : "67", "value" : "UE radio capability ID", "type" : "UE radio capability ID", "reference" : "9.11.3.68", "presence" : "O", "format" : "TLV", "length" : "3-n"})
-ies.append({ "iei" : "A-", "value" : "UE radio capability ID deletion indication", "type" : "UE radio capability ID deletion indication", "reference" : "9.11.3.69", "presence" : "O", "format" : "TV", "length" : "1"})
-ies.append({ "iei" : "44", "value" : "5GS registration result", "type" : "5GS registration result", "reference" : "9.11.3.6", "presence" : "O", "format" : "TLV", "length" : "3"})
-ies.append({ "iei" : "1B", "value" : "Truncated 5G-S-TMSI configuration", "type" : "Truncated 5G-S-TMSI configuration", "reference" : "9.11.3.70", "presence" : "O", "format" : "TLV", "length" : "3"})
-ies.append({ "iei" : "C-", "value" : "Additional configuration indication", "type" : "Additional configuration indication", "reference" : "9.11.3.74", "presence" : "O", "format" : "TV", "length" : "1"})
-ies.append({ "iei" : "68", "value" : "Extended rejected NSSAI", "type" : "Extended rejected NSSAI", "reference" : "9.11.3.75", "presence" : "O", "format" : "TLV", "length" : "5-90"})
-ies.append({ "iei" : "72", "value" : "Service-level-AA container", "type" : "Service-level-AA container", "reference" : "9.11.2.10", "presence" : "O", "format" : "TLV-E", "length" : "6-n"})
-ies.append({ "iei" : "70", "value" : "NSSRG information", "type" : "NSSRG information", "reference" : "9.11.3.82", "presence" : "O", "format" : "TLV-E", "length" : "7-4099"})
-ies.append({ "iei" : "14", "value" : "Disaster roaming wait range", "type" : "Registration wait range", "reference" : "9.11.3.84", "presence" : "O", "format" : "TLV", "length" : "4"})
-ies.append({ "iei" : "2C", "value" : "Disaster return wait range", "type" : "Registration wait range", "reference" : "9.11.3.84", "presence" : "O", "format" : "TLV", "length" : "4"})
-ies.append({ "iei" : "13", "value" : "List of PLMNs to be used in disaster condition", "type" : "List of PLMNs to be used in disaster condition", "reference" : "9.11.3.83", "presence" : "O", "format" : "TLV", "length" : "2-n"})
-ies.append({ "iei" : "71", "value" : "Extended CAG information list", "type" : "Extended CAG information list", "reference" : "9.11.3.86", "presence" : "O", "format" : "TLV-E", "length" : "3-n"})
-ies.append({ "iei" : "1F", "value" : "Updated PEIPS assistance information", "type" : "PEIPS assistance information", "reference" : "9.11.3.80", "presence" : "O", "format" : "TLV", "length" : "3-n"})
-ies.append({ "iei" : "73", "value" : "NSAG information", "type" : "NSAG information", "reference" : "9.11.3.87", "presence" : "O", "format" : "TLV-E", "length" : "9-3143"})
-ies.append({ "iei" : "E-", "value" : "Priority indicator", "type" : "Priority indicator", "reference" : "9.11.3.91", "presence" : "O", "format" : "TV", "length" : "1"})
-msg_list[key]["ies"] = ies
@@ -1,3 +0,0 @@
-ies = []
-ies.append({ "iei" : "78", "value" : "EAP message", "type" : "EAP message", "reference" : "9.11.2.2", "presence" : "O", "format" : "TLV-E", "length" : "7-1503"})
-msg_list[key]["ies"] = ies
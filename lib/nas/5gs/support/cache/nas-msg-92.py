@@ -1,3 +0,0 @@
-ies = []
-ies.append({ "iei" : "", "value" : "Mobile identity", "type" : "5GS mobile identity", "reference" : "9.11.3.4", "presence" : "M", "format" : "LV-E", "length" : "3-n"})
-msg_list[key]["ies"] = ies
@@ -23,11 +23,15 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
 # WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
-from docx import Document
 import re, os, sys, string
-import datetime
 import getopt
-import getpass
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+    '..', '..', '..', 'core', 'support'))
+from ogsgen import SpecIndex, Cache, Output, source_sha256, stamp, \
+    write_size_report, write_bench_prologue, write_bench_nas, \
+    write_bench_octets, write_bench_main, nas_ie_octets, Corpus, VARIANTS, \
+    memoize, Profile
 
 version = "0.2.0"
 
@@ -38,7 +42,17 @@ verbosity = 0
 filename = ""
 outdir = './'
 cachedir = './cache/'
-currentdir = './'
+cache_ro = []
+reproducible = False
+depfile = None
+lazy = "65"
+sizes = None
+bench = None
+corpus = None
+python = None
+profiling = False
+pstats = None
+currentdir = os.path.dirname(os.path.abspath(__file__)) + '/'
 
 FAIL = '\033[91m'
 INFO = '\033[93m'
@@ -60,7 +74,6 @@ def write_file(f, string):
     d_print(string)
 
 def output_header_to_file(f):
-    now = datetime.datetime.now()
     f.write("""/*
  * The MIT License
  *
@@ -92,7 +105,7 @@ def output_header_to_file(f):
     f.write("/*******************************************************************************\n")
     f.write(" * This file had been created by nas-message.py script v%s\n" % (version))
     f.write(" * Please do not modify this file but regenerate it via script.\n")
-    f.write(" * Created on: %s by %s\n * from %s\n" % (str(now), getpass.getuser(), filename))
+    f.write(stamp(filename, reproducible))
     f.write(" ******************************************************************************/\n\n")
 
 def usage():
@@ -103,26 +116,39 @@ def usage():
     print("-f [file] Input file to parse")
     print("-o [dir]  Output files to given directory")
     print("-c [dir]  Cache files to given directory")
+    print("-C [dir]  Also read cache files from dir, never writing there")
+    print("-r        Reproducible output (no date and user in headers)")
+    print("-M [file] Write the files read to a Makefile depfile")
+    print("-L [list] Message types with a lazy decoder (default: %s)" % (lazy))
+    print("-S [file] Write a C program reporting the size of the structures")
+    print("-B [file] Write a C program benchmarking the codec of each message")
+    print("-F [file] Write a seed corpus of the messages for the fuzzers (.zip)")
+    print("-P [file] Write a decoder of the messages in pure Python")
+    print("-t        Report the time and peak memory of each phase")
+    print("-T [file] Write a cProfile of the run to file (pstats)")
     print("-h        Print this help and return")
 
+@memoize
 def v_upper(v):
     return re.sub('\'', '_', re.sub('/', '_', re.sub('-', '_', re.sub(' ', '_', v)))).upper()
 
+@memoize
 def v_lower(v):
     return re.sub('\'', '_', re.sub('/', '_', re.sub('-', '_', re.sub(' ', '_', v)))).lower()
 
+@memoize
 def get_value(v):
     return re.sub('5gs_', '', re.sub('5g_', '', re.sub('5gsm', 'gsm', re.sub('5gmm', 'gmm', re.sub('\'', '_', re.sub('/', '_', re.sub('-', '_', re.sub(' ', '_', v)))).lower()))))
 
 def get_cells(cells):
-    iei = cells[0].text
-    value = cells[1].text.encode('ascii', 'ignore').decode('utf-8')
+    iei = cells[0]
+    value = cells[1].encode('ascii', 'ignore').decode('utf-8')
     value = re.sub("\s*$", "", re.sub("\s*\n*\s*\([^\)]*\)*", "", re.sub("\"|'s", "", value)))
-    type = re.sub("^NAS ", "", re.sub("'s", "", re.sub('\s*\n\s*[a-zA-Z0-9.]*', '', cells[2].text)))
-    reference = re.sub('[a-zA-Z0-9\'\-\s]*\n\s*', '', cells[2].text)
-    presence = cells[3].text
-    format = cells[4].text
-    length = cells[5].text
+    type = re.sub("^NAS ", "", re.sub("'s", "", re.sub('\s*\n\s*[a-zA-Z0-9.]*', '', cells[2])))
+    reference = re.sub('[a-zA-Z0-9\'\-\s]*\n\s*', '', cells[2])
+    presence = cells[3]
+    format = cells[4]
+    length = cells[5]
 
 # Spec errata - workaround
     if (type == "Request type" and value == "Request type"):
@@ -130,17 +156,42 @@ def get_cells(cells):
 
     return { "iei" : iei, "value" : value, "type" : type, "reference" : reference, "presence" : presence, "format" : format, "length" : length }
 
-def write_cells_to_file(name, cells):
-    write_file(f, name + ".append({ \"iei\" : \"" + cells["iei"] + \
-        "\", \"value\" : \"" + cells["value"] + \
-        "\", \"type\" : \"" + cells["type"] + \
-        "\", \"reference\" : \"" + cells["reference"] + \
-        "\", \"presence\" : \"" + cells["presence"] + \
-        "\", \"format\" : \"" + cells["format"] + \
-        "\", \"length\" : \"" + cells["length"] + "\"})\n")
+def extract_msg_ies(table):
+    tables = [{ "index" : table }]
+
+    ies = []
+    table = spec.table(table)
+
+    start_row = 0
+    for start_row, row in enumerate(table):
+        cells = get_cells(row);
+        if cells["type"].find('Message type') != -1:
+            break
+        if cells["type"].find('KSI and sequence number') != -1:
+            start_row -= 1
+            break
+
+    assert start_row <= 4, "Can't find message type"
+
+    half_length = True;
+    for row in table[start_row+1:]:
+        cells = get_cells(row)
+        if cells is None:
+            continue
+
+        if cells["length"] == "1/2":
+            if half_length is True:
+                half_length = False;
+            else:
+                half_length = True;
+                continue;
+
+        ies.append(cells)
+
+    return ies, tables
 
 try:
-    opts, args = getopt.getopt(sys.argv[1:], "df:ho:c:", ["debug", "file", "help", "output", "cache"])
+    opts, args = getopt.getopt(sys.argv[1:], "df:hro:c:C:M:L:S:B:F:P:tT:", ["debug", "file=", "help", "output=", "cache=", "readonly-cache=", "reproducible", "depfile=", "lazy=", "sizes=", "bench=", "corpus=", "python=", "profile", "pstats="])
 except getopt.GetoptError as err:
     # print help information and exit:
     usage()
@@ -156,13 +207,50 @@ for o, a in opts:
         if outdir.rfind('/') != len(outdir):
             outdir += '/'
     if o in ("-c", "--cache"):
-        cache = a
+        cachedir = a
         if cachedir.rfind('/') != len(cachedir):
             cachedir += '/'
+    if o in ("-C", "--readonly-cache"):
+        cache_ro.append(a)
+    if o in ("-r", "--reproducible"):
+        reproducible = True
+    if o in ("-M", "--depfile"):
+        depfile = a
+    if o in ("-L", "--lazy"):
+        lazy = a
+    if o in ("-S", "--sizes"):
+        sizes = a
+    if o in ("-B", "--bench"):
+        bench = a
+    if o in ("-F", "--corpus"):
+        corpus = a
+    if o in ("-P", "--python"):
+        python = a
+    if o in ("-t", "--profile"):
+        profiling = True
+    if o in ("-T", "--pstats"):
+        pstats = a
     if o in ("-h", "--help"):
         usage()
         sys.exit(2)
 
+if os.path.isfile(filename) and os.access(filename, os.R_OK):
+    file = open(filename, 'r')
+else:
+    d_error("Cannot find file : " + filename)
+
+spec = SpecIndex(filename)
+
+cache = Cache(cachedir, filename, "nas-message.py v%s" % version,
+        source_sha256(get_cells, extract_msg_ies),
+        readonly=cache_ro)
+
+profile = Profile(profiling, pstats)
+spec.load = profile.wrap('docx', spec.load)
+cache.load = profile.wrap('cache', cache.load)
+cache.store = profile.wrap('cache', cache.store)
+get_cells = profile.wrap('get_cells', get_cells)
+
 # Message Type List
 
 msg_list["REGISTRATION REQUEST"] = { "type" : "65" }
@@ -263,49 +351,9 @@ for key in msg_list.keys():
         continue;
 
     d_info("[" + key + "]")
-    cachefile = cachedir + "nas-msg-" + msg_list[key]["type"] + ".py"
-    if os.path.isfile(cachefile) and os.access(cachefile, os.R_OK):
-        exec(open(cachefile).read())
-        print("Read from " + cachefile)
-    else:
-        document = Document(filename)
-        f = open(cachefile, 'w') 
-
-        ies = []
-        write_file(f, "ies = []\n")
-        table = document.tables[msg_list[key]["table"]]
-
-        start_row = 0
-        for start_row, row in enumerate(table.rows):
-            cells = get_cells(row.cells);
-            if cells["type"].find('Message type') != -1:
-                break
-            if cells["type"].find('KSI and sequence number') != -1:
-                start_row -= 1
-                break
-
-        assert start_row <= 4, "Can't find message type"
-
-        half_length = True;
-        for row in table.rows[start_row+1:]:
-            cells = get_cells(row.cells)
-            if cells is None:
-                continue
-
-            if cells["length"] == "1/2":
-                if half_length is True:
-                    half_length = False;
-                else:
-                    half_length = True;
-                    continue;
-
-            ies.append(cells)
-            write_cells_to_file("ies", cells)
-
-        msg_list[key]["ies"] = ies
-        write_file(f, "msg_list[key][\"ies\"] = ies\n")
-
-        f.close()
+    msg_list[key]["ies"] = cache.fetch(
+            "nas-msg-" + msg_list[key]["type"], extract_msg_ies,
+            table=msg_list[key]["table"])
 
 
 tmp = [(k, v["type"]) for k, v in msg_list.items()]
@@ -327,13 +375,18 @@ for (k, v) in sorted_msg_list:
 d_info("[Type List]")
 typefile = currentdir + "type-list.py"
 if os.path.isfile(typefile) and os.access(typefile, os.R_OK):
+    profile.enter('cache')
     exec(open(typefile).read())
     print("Read from " + typefile)
+    profile.enter('extract')
 
 tmp = [(k, v["reference"]) for k, v in type_list.items()]
 sorted_type_list = sorted(tmp, key=lambda tup: tup[1])
 
-f = open(outdir + 'ies.h', 'w')
+profile.enter('emit')
+output = Output()
+
+f = output.open(outdir + 'ies.h')
 output_header_to_file(f)
 f.write("""#if !defined(OGS_NAS_INSIDE) && !defined(OGS_NAS_COMPILATION)
 #error "This header cannot be included directly."
@@ -350,6 +403,10 @@ int ogs_nas_5gs_encode_optional_type(ogs_pkbuf_t *pkbuf, uint8_t type);
 
 """)
 
+for (k, v) in sorted_type_list:
+    f.write("int ogs_nas_5gs_read_%s(ogs_nas_%s_t *%s, unsigned char *data, int len);\n" % (v_lower(k), v_lower(k), get_value(k)))
+f.write("\n")
+
 for (k, v) in sorted_type_list:
     f.write("int ogs_nas_5gs_decode_%s(ogs_nas_%s_t *%s, ogs_pkbuf_t *pkbuf);\n" % (v_lower(k), v_lower(k), get_value(k)))
 f.write("\n")
@@ -368,7 +425,19 @@ f.write("""#ifdef __cplusplus
 """)
 f.close()
 
-f = open(outdir + 'ies.c', 'w')
+# ogs_nas_5gs_decode_<type>(), pulling from the pkbuf what
+# ogs_nas_5gs_read_<type>() took
+def write_decode(f, k):
+    f.write("int ogs_nas_5gs_decode_%s(ogs_nas_%s_t *%s, ogs_pkbuf_t *pkbuf)\n" % (v_lower(k), v_lower(k), get_value(k)))
+    f.write("{\n")
+    f.write("    int size = ogs_nas_5gs_read_%s(%s, pkbuf->data, pkbuf->len);\n\n" % (v_lower(k), get_value(k)))
+    f.write("    if (size < 0)\n")
+    f.write("        return size;\n\n")
+    f.write("    ogs_assert(ogs_pkbuf_pull(pkbuf, size));\n\n")
+    f.write("    return size;\n")
+    f.write("}\n\n")
+
+f = output.open(outdir + 'ies.c')
 output_header_to_file(f)
 f.write("""#include "ogs-nas-5gs.h"
 
@@ -376,7 +445,10 @@ int ogs_nas_5gs_encode_optional_type(ogs_pkbuf_t *pkbuf, uint8_t type)
 {
     int size = sizeof(uint8_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &type, size);
 
     return size;
@@ -388,45 +460,47 @@ for (k, v) in sorted_type_list:
     f.write("/* %s %s\n" % (type_list[k]["reference"], k))
     f.write(" * %s %s %s */\n" % (type_list[k]["presence"], type_list[k]["format"], type_list[k]["length"]))
     if (type_list[k]["format"] == "TV" or type_list[k]["format"] == "T") and type_list[k]["length"] == "1":
-        f.write("int ogs_nas_5gs_decode_%s(ogs_nas_%s_t *%s, ogs_pkbuf_t *pkbuf)\n" % (v_lower(k), v_lower(k), get_value(k)))
+        f.write("int ogs_nas_5gs_read_%s(ogs_nas_%s_t *%s, unsigned char *data, int len)\n" % (v_lower(k), v_lower(k), get_value(k)))
         f.write("{\n")
         f.write("    int size = sizeof(ogs_nas_%s_t);\n\n" % v_lower(k))
-        f.write("    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {\n")
-        f.write("       ogs_error(\"ogs_pkbuf_pull() failed [size:%d]\", (int)size);\n")
+        f.write("    if (len < size) {\n")
+        f.write("       ogs_error(\"Not enough data [size:%d len:%d]\", (int)size, len);\n")
         f.write("       return -1;\n")
         f.write("    }\n\n")
-        f.write("    memcpy(%s, pkbuf->data - size, size);\n\n" % get_value(k))
-        f.write("    ogs_trace(\"  %s - \");\n" % v_upper(k))
-        f.write("    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);\n\n");
+        f.write("    memcpy(%s, data, size);\n\n" % get_value(k))
+        f.write("    ogs_nas_trace_ie(\"%s\", data, size);\n\n" % v_upper(k))
         f.write("    return size;\n")
         f.write("}\n\n")
+        write_decode(f, k)
         f.write("int ogs_nas_5gs_encode_%s(ogs_pkbuf_t *pkbuf, ogs_nas_%s_t *%s)\n" % (v_lower(k), v_lower(k), get_value(k)))
         f.write("{\n")
         f.write("    int size = sizeof(ogs_nas_%s_t);\n\n" % v_lower(k))
-        f.write("    ogs_assert(ogs_pkbuf_pull(pkbuf, size));\n")
+        f.write("    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {\n")
+        f.write("       ogs_error(\"ogs_pkbuf_pull() failed [size:%d]\", (int)size);\n")
+        f.write("       return -1;\n")
+        f.write("    }\n")
         f.write("    memcpy(pkbuf->data - size, %s, size);\n\n" % get_value(k))
-        f.write("    ogs_trace(\"  %s - \");\n" % v_upper(k))
-        f.write("    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);\n\n");
+        f.write("    ogs_nas_trace_ie(\"%s\", pkbuf->data - size, size);\n\n" % v_upper(k))
         f.write("    return size;\n")
         f.write("}\n\n")
     elif type_list[k]["format"] == "TV" or type_list[k]["format"] == "V":
-        f.write("int ogs_nas_5gs_decode_%s(ogs_nas_%s_t *%s, ogs_pkbuf_t *pkbuf)\n" % (v_lower(k), v_lower(k), get_value(k)))
+        f.write("int ogs_nas_5gs_read_%s(ogs_nas_%s_t *%s, unsigned char *data, int len)\n" % (v_lower(k), v_lower(k), get_value(k)))
         f.write("{\n")
         if type_list[k]["length"] == "4":
             f.write("    int size = 3;\n\n")
         else:
             f.write("    int size = sizeof(ogs_nas_%s_t);\n\n" % v_lower(k))
-        f.write("    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {\n")
-        f.write("       ogs_error(\"ogs_pkbuf_pull() failed [size:%d]\", (int)size);\n")
+        f.write("    if (len < size) {\n")
+        f.write("       ogs_error(\"Not enough data [size:%d len:%d]\", (int)size, len);\n")
         f.write("       return -1;\n")
         f.write("    }\n\n")
-        f.write("    memcpy(%s, pkbuf->data - size, size);\n\n" % get_value(k))
+        f.write("    memcpy(%s, data, size);\n\n" % get_value(k))
         if "decode" in type_list[k]:
             f.write("%s" % type_list[k]["decode"])
-        f.write("    ogs_trace(\"  %s - \");\n" % v_upper(k))
-        f.write("    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);\n\n");
+        f.write("    ogs_nas_trace_ie(\"%s\", data, size);\n\n" % v_upper(k))
         f.write("    return size;\n")
         f.write("}\n\n")
+        write_decode(f, k)
         f.write("int ogs_nas_5gs_encode_%s(ogs_pkbuf_t *pkbuf, ogs_nas_%s_t *%s)\n" % (v_lower(k), v_lower(k), get_value(k)))
         f.write("{\n")
         if type_list[k]["length"] == "4":
@@ -437,33 +511,35 @@ for (k, v) in sorted_type_list:
         f.write("    memcpy(&target, %s, size);\n" % get_value(k))
         if "encode" in type_list[k]:
             f.write("%s" % type_list[k]["encode"])
-        f.write("    ogs_assert(ogs_pkbuf_pull(pkbuf, size));\n")
+        f.write("    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {\n")
+        f.write("       ogs_error(\"ogs_pkbuf_pull() failed [size:%d]\", (int)size);\n")
+        f.write("       return -1;\n")
+        f.write("    }\n")
         f.write("    memcpy(pkbuf->data - size, &target, size);\n\n")
-        f.write("    ogs_trace(\"  %s - \");\n" % v_upper(k))
-        f.write("    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);\n\n");
+        f.write("    ogs_nas_trace_ie(\"%s\", pkbuf->data - size, size);\n\n" % v_upper(k))
         f.write("    return size;\n")
         f.write("}\n\n")
     elif type_list[k]["format"] == "LV-E" or type_list[k]["format"] == "TLV-E":
-        f.write("int ogs_nas_5gs_decode_%s(ogs_nas_%s_t *%s, ogs_pkbuf_t *pkbuf)\n" % (v_lower(k), v_lower(k), get_value(k)))
+        f.write("int ogs_nas_5gs_read_%s(ogs_nas_%s_t *%s, unsigned char *data, int len)\n" % (v_lower(k), v_lower(k), get_value(k)))
         f.write("{\n")
         f.write("    int size = 0;\n")
         f.write("    ogs_nas_%s_t *source = NULL;\n\n" % v_lower(k))
-        f.write("    if (pkbuf->len < 2) {\n")
-        f.write("       ogs_error(\"Not enough pkbuf [len:%d]\", pkbuf->len);\n")
+        f.write("    if (len < 2) {\n")
+        f.write("       ogs_error(\"Not enough data [len:%d]\", len);\n")
         f.write("       return -1;\n")
         f.write("    }\n\n")
-        f.write("    source = (ogs_nas_%s_t *)pkbuf->data;\n\n" % v_lower(k))
+        f.write("    source = (ogs_nas_%s_t *)data;\n\n" % v_lower(k))
         f.write("    %s->length = be16toh(source->length);\n" % get_value(k))
         f.write("    size = %s->length + sizeof(%s->length);\n\n" % (get_value(k), get_value(k)))
-        f.write("    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {\n")
-        f.write("       ogs_error(\"ogs_pkbuf_pull() failed [size:%d]\", (int)size);\n")
+        f.write("    if (len < size) {\n")
+        f.write("       ogs_error(\"Not enough data [size:%d len:%d]\", (int)size, len);\n")
         f.write("       return -1;\n")
         f.write("    }\n\n")
-        f.write("    %s->buffer = pkbuf->data - size + sizeof(%s->length);\n\n" % (get_value(k), get_value(k)))
-        f.write("    ogs_trace(\"  %s - \");\n" % v_upper(k))
-        f.write("    ogs_log_hexdump(OGS_LOG_TRACE, (void*)%s->buffer, %s->length);\n\n" % (get_value(k), get_value(k)));
+        f.write("    %s->buffer = data + sizeof(%s->length);\n\n" % (get_value(k), get_value(k)))
+        f.write("    ogs_nas_trace_ie(\"%s\", %s->buffer, %s->length);\n\n" % (v_upper(k), get_value(k), get_value(k)))
         f.write("    return size;\n")
         f.write("}\n\n")
+        write_decode(f, k)
         f.write("int ogs_nas_5gs_encode_%s(ogs_pkbuf_t *pkbuf, ogs_nas_%s_t *%s)\n" % (v_lower(k), v_lower(k), get_value(k)))
         f.write("{\n")
         f.write("    int size = 0;\n")
@@ -471,40 +547,88 @@ for (k, v) in sorted_type_list:
         f.write("    ogs_assert(%s);\n" % get_value(k))
         f.write("    ogs_assert(%s->buffer);\n\n" % get_value(k))
         f.write("    size = sizeof(%s->length);\n" % get_value(k))
-        f.write("    ogs_assert(ogs_pkbuf_pull(pkbuf, size));\n")
+        f.write("    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {\n")
+        f.write("       ogs_error(\"ogs_pkbuf_pull() failed [size:%d]\", (int)size);\n")
+        f.write("       return -1;\n")
+        f.write("    }\n")
         f.write("    target = htobe16(%s->length);\n" % get_value(k))
         f.write("    memcpy(pkbuf->data - size, &target, size);\n\n")
         f.write("    size = %s->length;\n" % get_value(k))
-        f.write("    ogs_assert(ogs_pkbuf_pull(pkbuf, size));\n")
+        f.write("    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {\n")
+        f.write("       ogs_error(\"ogs_pkbuf_pull() failed [size:%d]\", (int)size);\n")
+        f.write("       return -1;\n")
+        f.write("    }\n")
         f.write("    memcpy(pkbuf->data - size, %s->buffer, size);\n\n" % get_value(k))
-        f.write("    ogs_trace(\"  %s - \");\n" % v_upper(k))
-        f.write("    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);\n\n");
+        f.write("    ogs_nas_trace_ie(\"%s\", pkbuf->data - size, size);\n\n" % v_upper(k))
         f.write("    return %s->length + sizeof(%s->length);\n" % (get_value(k), get_value(k)))
         f.write("}\n\n");
-    else:
-        f.write("int ogs_nas_5gs_decode_%s(ogs_nas_%s_t *%s, ogs_pkbuf_t *pkbuf)\n" % (v_lower(k), v_lower(k), get_value(k)))
+    elif "borrow" in type_list[k]:
+        # LV/TLV whose value is left in the pkbuf, as LV-E/TLV-E always are.
+        # The buffer is only valid as long as the decoded pkbuf is.
+        f.write("int ogs_nas_5gs_read_%s(ogs_nas_%s_t *%s, unsigned char *data, int len)\n" % (v_lower(k), v_lower(k), get_value(k)))
         f.write("{\n")
         f.write("    int size = 0;\n")
         f.write("    ogs_nas_%s_t *source = NULL;\n\n" % v_lower(k))
-        f.write("    if (pkbuf->len < 1) {\n")
-        f.write("       ogs_error(\"Not enough pkbuf [len:%d]\", pkbuf->len);\n")
+        f.write("    if (len < 1) {\n")
+        f.write("       ogs_error(\"Not enough data [len:%d]\", len);\n")
         f.write("       return -1;\n")
         f.write("    }\n\n")
-        f.write("    source = (ogs_nas_%s_t *)pkbuf->data;\n\n" % v_lower(k))
+        f.write("    source = (ogs_nas_%s_t *)data;\n\n" % v_lower(k))
         f.write("    %s->length = source->length;\n" % get_value(k))
         f.write("    size = %s->length + sizeof(%s->length);\n\n" % (get_value(k), get_value(k)))
+        f.write("    if (len < size) {\n")
+        f.write("       ogs_error(\"Not enough data [size:%d len:%d]\", (int)size, len);\n")
+        f.write("       return -1;\n")
+        f.write("    }\n\n")
+        f.write("    %s->buffer = data + sizeof(%s->length);\n\n" % (get_value(k), get_value(k)))
+        f.write("    ogs_nas_trace_ie(\"%s\", %s->buffer, %s->length);\n\n" % (v_upper(k), get_value(k), get_value(k)))
+        f.write("    return size;\n")
+        f.write("}\n\n")
+        write_decode(f, k)
+        f.write("int ogs_nas_5gs_encode_%s(ogs_pkbuf_t *pkbuf, ogs_nas_%s_t *%s)\n" % (v_lower(k), v_lower(k), get_value(k)))
+        f.write("{\n")
+        f.write("    int size = 0;\n\n")
+        f.write("    ogs_assert(%s);\n" % get_value(k))
+        f.write("    ogs_assert(%s->buffer);\n\n" % get_value(k))
+        f.write("    size = sizeof(%s->length);\n" % get_value(k))
         f.write("    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {\n")
         f.write("       ogs_error(\"ogs_pkbuf_pull() failed [size:%d]\", (int)size);\n")
         f.write("       return -1;\n")
+        f.write("    }\n")
+        f.write("    memcpy(pkbuf->data - size, &%s->length, size);\n\n" % get_value(k))
+        f.write("    size = %s->length;\n" % get_value(k))
+        f.write("    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {\n")
+        f.write("       ogs_error(\"ogs_pkbuf_pull() failed [size:%d]\", (int)size);\n")
+        f.write("       return -1;\n")
+        f.write("    }\n")
+        f.write("    memcpy(pkbuf->data - size, %s->buffer, size);\n\n" % get_value(k))
+        f.write("    ogs_nas_trace_ie(\"%s\", pkbuf->data - size, size);\n\n" % v_upper(k))
+        f.write("    return %s->length + sizeof(%s->length);\n" % (get_value(k), get_value(k)))
+        f.write("}\n\n");
+    else:
+        f.write("int ogs_nas_5gs_read_%s(ogs_nas_%s_t *%s, unsigned char *data, int len)\n" % (v_lower(k), v_lower(k), get_value(k)))
+        f.write("{\n")
+        f.write("    int size = 0;\n")
+        f.write("    ogs_nas_%s_t *source = NULL;\n\n" % v_lower(k))
+        f.write("    if (len < 1) {\n")
+        f.write("       ogs_error(\"Not enough data [len:%d]\", len);\n")
+        f.write("       return -1;\n")
+        f.write("    }\n\n")
+        f.write("    source = (ogs_nas_%s_t *)data;\n\n" % v_lower(k))
+        f.write("    %s->length = source->length;\n" % get_value(k))
+        f.write("    size = %s->length + sizeof(%s->length);\n\n" % (get_value(k), get_value(k)))
+        f.write("    if (len < size) {\n")
+        f.write("       ogs_error(\"Not enough data [size:%d len:%d]\", (int)size, len);\n")
+        f.write("       return -1;\n")
         f.write("    }\n\n")
         f.write("    if (sizeof(*%s) < size) return -1;\n" % get_value(k))
-        f.write("    memcpy(%s, pkbuf->data - size, size);\n\n" % get_value(k))
+        f.write("    memcpy(%s, data, size);\n\n" % get_value(k))
         if "decode" in type_list[k]:
             f.write("%s" % type_list[k]["decode"])
-        f.write("    ogs_trace(\"  %s - \");\n" % v_upper(k))
-        f.write("    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);\n\n");
+        f.write("    ogs_nas_trace_ie(\"%s\", data, size);\n\n" % v_upper(k))
         f.write("    return size;\n")
         f.write("}\n\n")
+        write_decode(f, k)
         f.write("int ogs_nas_5gs_encode_%s(ogs_pkbuf_t *pkbuf, ogs_nas_%s_t *%s)\n" % (v_lower(k), v_lower(k), get_value(k)))
         f.write("{\n")
         f.write("    int size = %s->length + sizeof(%s->length);\n" % (get_value(k), get_value(k)))
@@ -512,15 +636,17 @@ for (k, v) in sorted_type_list:
         f.write("    memcpy(&target, %s, sizeof(ogs_nas_%s_t));\n" % (get_value(k), v_lower(k)))
         if "encode" in type_list[k]:
             f.write("%s" % type_list[k]["encode"])
-        f.write("    ogs_assert(ogs_pkbuf_pull(pkbuf, size));\n")
+        f.write("    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {\n")
+        f.write("       ogs_error(\"ogs_pkbuf_pull() failed [size:%d]\", (int)size);\n")
+        f.write("       return -1;\n")
+        f.write("    }\n")
         f.write("    memcpy(pkbuf->data - size, &target, size);\n\n")
-        f.write("    ogs_trace(\"  %s - \");\n" % v_upper(k))
-        f.write("    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);\n\n");
+        f.write("    ogs_nas_trace_ie(\"%s\", pkbuf->data - size, size);\n\n" % v_upper(k))
         f.write("    return size;\n")
         f.write("}\n\n");
 f.close()
 
-f = open(outdir + 'message.h', 'w')
+f = output.open(outdir + 'message.h')
 output_header_to_file(f)
 f.write("""#if !defined(OGS_NAS_INSIDE) && !defined(OGS_NAS_COMPILATION)
 #error "This header cannot be included directly."
@@ -582,6 +708,11 @@ for (k, v) in sorted_msg_list:
 
     f.write("\n\ntypedef struct ogs_nas_5gs_%s_s {\n" % v_lower(k))
 
+    # presencemask comes first: after the mandatory IEs, which are mostly
+    # octet aligned, it would leave up to 7 octets of padding
+    if len([ies for ies in msg_list[k]["ies"] if ies["presence"] != "M"]) != 0:
+        f.write("    uint64_t presencemask;\n\n")
+
     mandatory_fields = False;
     optional_fields = False;
     for ie in msg_list[k]["ies"]:
@@ -590,8 +721,9 @@ for (k, v) in sorted_msg_list:
             mandatory_fields = True;
 
         if ie["presence"] != "M" and optional_fields is False:
-            f.write("\n    /* Optional fields */\n")
-            f.write("    uint64_t presencemask;\n");
+            if mandatory_fields is True:
+                f.write("\n")
+            f.write("    /* Optional fields */\n")
             optional_fields = True;
 
         f.write("    ogs_nas_" + v_lower(ie["type"]) + "_t " + \
@@ -644,6 +776,65 @@ int ogs_nas_5gmm_decode(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf);
 int ogs_nas_5gsm_decode(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf);
 ogs_pkbuf_t *ogs_nas_5gs_plain_encode(ogs_nas_5gs_message_t *message);
 
+/*
+ * Encode the message in the tailroom of a pkbuf of the caller, past the
+ * octets it already holds, and return the number of octets encoded.
+ * The headroom is left alone for the security header.
+ */
+int ogs_nas_5gmm_encode_to(
+        ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf);
+int ogs_nas_5gsm_encode_to(
+        ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf);
+int ogs_nas_5gs_plain_encode_to(
+        ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf);
+
+/* Exact number of octets the encoder writes, header included */
+int ogs_nas_5gmm_encoded_size(ogs_nas_5gs_message_t *message);
+int ogs_nas_5gsm_encoded_size(ogs_nas_5gs_message_t *message);
+""")
+for (k, v) in sorted_msg_list:
+    if "ies" not in msg_list[k]:
+        continue;
+    f.write("int ogs_nas_5gs_%s_encoded_size(ogs_nas_5gs_message_t *message);\n" % v_lower(k))
+
+lazy_msg_list = []
+for t in [t for t in lazy.split(",") if t.strip()]:
+    found = [(k, v) for (k, v) in sorted_msg_list if float(v) == float(t)]
+    if len(found) == 0:
+        d_error("Unknown message type : " + t)
+    if len([ies for ies in msg_list[found[0][0]].get("ies", []) if ies["presence"] != "M"]) != 0:
+        lazy_msg_list += found
+lazy_msg_list.sort(key=lambda tup: float(tup[1]))
+
+if len(lazy_msg_list) != 0:
+    f.write("""
+/*
+ * Lazy decoders: the mandatory IEs are decoded right away, while the
+ * optional IEs are only located. Each of them is decoded by its accessor
+ * on first use and kept in the message, so the pkbuf must live as long
+ * as the accessors are called. An accessor returns NULL if the IE is
+ * absent or cannot be decoded.
+ */
+""")
+for (k, v) in lazy_msg_list:
+    optional = [ies for ies in msg_list[k]["ies"] if ies["presence"] != "M"]
+    if float(msg_list[k]["type"]) < 192:
+        header = "5gmm"
+    else:
+        header = "5gsm"
+    f.write("typedef struct ogs_nas_5gs_%s_lazy_s {\n" % v_lower(k))
+    f.write("    ogs_nas_%s_header_t h;\n" % header)
+    f.write("    ogs_nas_5gs_%s_t %s;\n\n" % (v_lower(k), get_value(k)))
+    f.write("    ogs_pkbuf_t *pkbuf;\n")
+    f.write("    uint64_t decodedmask;\n")
+    f.write("    unsigned int offset[%d];\n" % len(optional))
+    f.write("} ogs_nas_5gs_%s_lazy_t;\n\n" % v_lower(k))
+    f.write("int ogs_nas_5gs_decode_%s_lazy(\n        ogs_nas_5gs_%s_lazy_t *lazy, ogs_pkbuf_t *pkbuf);\n" % (v_lower(k), v_lower(k)))
+    for ie in optional:
+        f.write("ogs_nas_%s_t *ogs_nas_5gs_%s_%s(\n        ogs_nas_5gs_%s_lazy_t *lazy);\n" % (v_lower(ie["type"]), get_value(k), get_value(ie["value"]), v_lower(k)))
+    f.write("\n")
+f.write("""
+
 #ifdef __cplusplus
 }
 #endif
@@ -655,7 +846,7 @@ f.close()
 
 
 
-f = open(outdir + 'decoder.c', 'w')
+f = output.open(outdir + 'decoder.c')
 output_header_to_file(f)
 f.write("""#include "ogs-nas-5gs.h"
 
@@ -679,64 +870,91 @@ for (k, v) in sorted_msg_list:
         f.write("    ogs_nas_5gs_%s_t *%s = &message->gmm.%s;\n" % (v_lower(k), get_value(k), get_value(k)))
     else:
         f.write("    ogs_nas_5gs_%s_t *%s = &message->gsm.%s;\n" % (v_lower(k), get_value(k), get_value(k)))
+    f.write("    unsigned char *data = pkbuf->data;\n")
+    f.write("    int len = pkbuf->len;\n")
     f.write("    int decoded = 0;\n")
     f.write("    int size = 0;\n\n")
     f.write("    ogs_trace(\"[NAS] Decode %s\\n\");\n\n" % v_upper(k))
 
     for ie in [ies for ies in msg_list[k]["ies"] if ies["presence"] == "M"]:
-        f.write("    size = ogs_nas_5gs_decode_%s(&%s->%s, pkbuf);\n" % (v_lower(ie["type"]), get_value(k), get_value(ie["value"])))
+        f.write("    size = ogs_nas_5gs_read_%s(&%s->%s, data + decoded, len - decoded);\n" % (v_lower(ie["type"]), get_value(k), get_value(ie["value"])))
         f.write("    if (size < 0) {\n")
-        f.write("        ogs_error(\"ogs_nas_5gs_decode_%s() failed\");\n" % v_lower(ie["type"]))
+        f.write("        ogs_error(\"ogs_nas_5gs_read_%s() failed\");\n" % v_lower(ie["type"]))
         f.write("        return size;\n")
         f.write("    }\n\n")
         f.write("    decoded += size;\n\n")
 
     optional_fields = False;
+    ieis = []
     for ie in [ies for ies in msg_list[k]["ies"] if ies["presence"] != "M"]:
         if optional_fields is False:
-            f.write("""    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+            f.write("""    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch(type) {
 """)
             optional_fields = True;
 
+        # The IEI is taken by an earlier IE, the case would be a duplicate
+        # (5GS ADDITIONAL REQUEST RESULT of REGISTRATION ACCEPT)
+        duplicate = ie["iei"] in ieis
+        ieis.append(ie["iei"])
+        if duplicate:
+            f.write("#if 0 /* The IEI is taken by an earlier IE */\n")
         f.write("        case OGS_NAS_5GS_%s_%s_TYPE:\n" % (v_upper(k), v_upper(ie["value"])))
-        if (ie["format"] == "TV" or ie["format"] == "T") and ie["length"] == "1":
-            f.write("            decoded--;\n")
-            f.write("            ogs_assert(ogs_pkbuf_push(pkbuf, 1));\n")
-        f.write("            size = ogs_nas_5gs_decode_%s(&%s->%s, pkbuf);\n" % (v_lower(ie["type"]), get_value(k), get_value(ie["value"])))
+        # The IEI of a type 1 IE is the upper half of its value
+        if not ((ie["format"] == "TV" or ie["format"] == "T") and ie["length"] == "1"):
+            f.write("            decoded++;\n")
+        f.write("            size = ogs_nas_5gs_read_%s(&%s->%s, data + decoded, len - decoded);\n" % (v_lower(ie["type"]), get_value(k), get_value(ie["value"])))
         f.write("            if (size < 0) {\n")
-        f.write("               ogs_error(\"ogs_nas_5gs_decode_%s() failed\");\n" % v_lower(ie["type"]))
+        f.write("               ogs_error(\"ogs_nas_5gs_read_%s() failed\");\n" % v_lower(ie["type"]))
         f.write("               return size;\n")
         f.write("            }\n\n")
         f.write("            %s->presencemask |= OGS_NAS_5GS_%s_%s_PRESENT;\n" % (get_value(k), v_upper(k), v_upper(ie["value"])))
         f.write("            decoded += size;\n")
         f.write("            break;\n")
+        if duplicate:
+            f.write("#endif\n")
 
     if [ies for ies in msg_list[k]["ies"] if ies["presence"] != "M"]:
         f.write("""        default:
             ogs_error("Unknown type(0x%x) or not implemented\\n", type);
+            decoded++;
             break;
         }
     }
 
 """)
-    f.write("""    return decoded;
+    f.write("""    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
+    return decoded;
+}
+
+""")
+
+first = [k for (k, v) in sorted_msg_list if len(msg_list[k].get("ies", [])) != 0 and float(v) < 192][0]
+f.write("""/* Size of the union member for the message type, 0 if it has none */
+static size_t ogs_nas_5gmm_message_size(uint8_t message_type)
+{
+    switch(message_type) {
+""")
+for (k, v) in sorted_msg_list:
+    if len(msg_list[k].get("ies", [])) == 0:
+        continue;
+    if float(msg_list[k]["type"]) < 192:
+        f.write("    case OGS_NAS_5GS_%s:\n" % v_upper(k))
+        f.write("        return sizeof(ogs_nas_5gs_%s_t);\n" % v_lower(k))
+f.write("""    default:
+        return 0;
+    }
 }
 
 """)
 
 f.write("""int ogs_nas_5gmm_decode(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
+    ogs_nas_5gmm_header_t *h = NULL;
     int size = 0;
     int decoded = 0;
 
@@ -745,12 +963,16 @@ f.write("""int ogs_nas_5gmm_decode(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *
 
     size = sizeof(ogs_nas_5gmm_header_t);
     if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       ogs_error("ogs_pkbuf_pull() failed [size:%%d]", (int)size);
        return OGS_ERROR;
     }
+    h = (ogs_nas_5gmm_header_t *)(pkbuf->data - size);
 
-    memset(message, 0, sizeof(ogs_nas_5gs_message_t));
-    memcpy(&message->gmm.h, pkbuf->data - size, size);
+    /* Clear the headers and the message of this type, not the whole union */
+    memset(message, 0, offsetof(ogs_nas_5gs_message_t, gmm.%s) +
+            ogs_nas_5gmm_message_size(h->message_type));
+""" % get_value(first))
+f.write("""    memcpy(&message->gmm.h, h, size);
     decoded += size;
 
     switch(message->gmm.h.message_type) {
@@ -781,8 +1003,28 @@ f.write("""    default:
 }
 """)
 
+first = [k for (k, v) in sorted_msg_list if len(msg_list[k].get("ies", [])) != 0 and float(v) >= 192][0]
+f.write("""/* Size of the union member for the message type, 0 if it has none */
+static size_t ogs_nas_5gsm_message_size(uint8_t message_type)
+{
+    switch(message_type) {
+""")
+for (k, v) in sorted_msg_list:
+    if len(msg_list[k].get("ies", [])) == 0:
+        continue;
+    if float(msg_list[k]["type"]) >= 192:
+        f.write("    case OGS_NAS_5GS_%s:\n" % v_upper(k))
+        f.write("        return sizeof(ogs_nas_5gs_%s_t);\n" % v_lower(k))
+f.write("""    default:
+        return 0;
+    }
+}
+
+""")
+
 f.write("""int ogs_nas_5gsm_decode(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
+    ogs_nas_5gsm_header_t *h = NULL;
     int size = 0;
     int decoded = 0;
 
@@ -791,12 +1033,16 @@ f.write("""int ogs_nas_5gsm_decode(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *
 
     size = sizeof(ogs_nas_5gsm_header_t);
     if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       ogs_error("ogs_pkbuf_pull() failed [size:%%d]", (int)size);
        return OGS_ERROR;
     }
+    h = (ogs_nas_5gsm_header_t *)(pkbuf->data - size);
 
-    memset(message, 0, sizeof(ogs_nas_5gs_message_t));
-    memcpy(&message->gsm.h, pkbuf->data - size, size);
+    /* Clear the headers and the message of this type, not the whole union */
+    memset(message, 0, offsetof(ogs_nas_5gs_message_t, gsm.%s) +
+            ogs_nas_5gsm_message_size(h->message_type));
+""" % get_value(first))
+f.write("""    memcpy(&message->gsm.h, h, size);
     decoded += size;
 
     switch(message->gsm.h.message_type) {
@@ -828,9 +1074,167 @@ f.write("""    default:
 
 """)
 
+# Octets taken by the value of an optional IE that starts at pkbuf->data,
+# as ogs_nas_5gs_decode_<type>() in ies.c would pull them
+def lazy_size(ie):
+    t = ie["type"]
+    if (type_list[t]["format"] == "TV" or type_list[t]["format"] == "T") and type_list[t]["length"] == "1":
+        return ("            size = sizeof(ogs_nas_%s_t);\n" % v_lower(t))
+    elif type_list[t]["format"] == "TV" or type_list[t]["format"] == "V":
+        if type_list[t]["length"] == "4":
+            return ("            size = 3;\n")
+        return ("            size = sizeof(ogs_nas_%s_t);\n" % v_lower(t))
+    elif type_list[t]["format"] == "LV-E" or type_list[t]["format"] == "TLV-E":
+        return ("            if (pkbuf->len < 2) {\n"
+                "               ogs_error(\"Not enough pkbuf [len:%d]\", pkbuf->len);\n"
+                "               return OGS_ERROR;\n"
+                "            }\n"
+                "            size = ((pkbuf->data[0] << 8) | pkbuf->data[1]) + 2;\n")
+    s = ("            if (pkbuf->len < 1) {\n"
+         "               ogs_error(\"Not enough pkbuf [len:%d]\", pkbuf->len);\n"
+         "               return OGS_ERROR;\n"
+         "            }\n"
+         "            size = pkbuf->data[0] + 1;\n")
+    if "borrow" not in type_list[t]:
+        s += ("            if (sizeof(ogs_nas_%s_t) < size) {\n"
+              "               ogs_error(\"Too long [size:%%d]\", (int)size);\n"
+              "               return OGS_ERROR;\n"
+              "            }\n" % v_lower(t))
+    return s
+
+for (k, v) in lazy_msg_list:
+    optional = [ies for ies in msg_list[k]["ies"] if ies["presence"] != "M"]
+    if float(msg_list[k]["type"]) < 192:
+        header = "5gmm"
+    else:
+        header = "5gsm"
+
+    f.write("static int ogs_nas_5gs_locate_%s(\n" % v_lower(k))
+    f.write("        ogs_nas_5gs_%s_lazy_t *lazy, ogs_pkbuf_t *pkbuf)\n{\n" % v_lower(k))
+    f.write("    ogs_nas_5gs_%s_t *%s = &lazy->%s;\n" % (v_lower(k), get_value(k), get_value(k)))
+    f.write("    unsigned char *data = pkbuf->data - sizeof(ogs_nas_%s_header_t);\n" % header)
+    f.write("    int size = 0;\n")
+    f.write("    int i;\n\n")
+
+    for ie in [ies for ies in msg_list[k]["ies"] if ies["presence"] == "M"]:
+        f.write("    size = ogs_nas_5gs_decode_%s(&%s->%s, pkbuf);\n" % (v_lower(ie["type"]), get_value(k), get_value(ie["value"])))
+        f.write("    if (size < 0) {\n")
+        f.write("        ogs_error(\"ogs_nas_5gs_decode_%s() failed\");\n" % v_lower(ie["type"]))
+        f.write("        return size;\n")
+        f.write("    }\n\n")
+
+    f.write("""    while (pkbuf->len > 0) {
+        uint8_t *buffer = pkbuf->data;
+        uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
+
+        size = sizeof(uint8_t);
+        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+           return OGS_ERROR;
+        }
+
+        /* i is the bit of the IE in presencemask */
+        switch(type) {
+""")
+    for i, ie in enumerate(optional):
+        f.write("        case OGS_NAS_5GS_%s_%s_TYPE:\n" % (v_upper(k), v_upper(ie["value"])))
+        if (ie["format"] == "TV" or ie["format"] == "T") and ie["length"] == "1":
+            f.write("            ogs_assert(ogs_pkbuf_push(pkbuf, 1));\n")
+        f.write(lazy_size(ie))
+        f.write("            i = %d;\n" % i)
+        f.write("            break;\n")
+    f.write("""        default:
+            ogs_error("Unknown type(0x%x) or not implemented\\n", type);
+            continue;
+        }
+
+        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+           return OGS_ERROR;
+        }
+
+""")
+    f.write("        /* From the start of the message */\n")
+    f.write("        lazy->offset[i] = pkbuf->data - size - data;\n")
+    f.write("        %s->presencemask |= (uint64_t)1 << i;\n" % get_value(k))
+    f.write("""    }
+
+    return OGS_OK;
+}
+
+""")
+
+    f.write("int ogs_nas_5gs_decode_%s_lazy(\n" % v_lower(k))
+    f.write("        ogs_nas_5gs_%s_lazy_t *lazy, ogs_pkbuf_t *pkbuf)\n{\n" % v_lower(k))
+    f.write("""    unsigned char *data = NULL;
+    int size = 0;
+    int rv;
+
+    ogs_assert(lazy);
+    ogs_assert(pkbuf);
+    ogs_assert(pkbuf->data);
+
+""")
+    f.write("    ogs_trace(\"[NAS] Decode %s lazily\\n\");\n\n" % v_upper(k))
+    f.write("    data = pkbuf->data;\n")
+    f.write("    size = sizeof(ogs_nas_%s_header_t);\n" % header)
+    f.write("""    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return OGS_ERROR;
+    }
+
+    memset(lazy, 0, sizeof(*lazy));
+    memcpy(&lazy->h, pkbuf->data - size, size);
+
+""")
+    f.write("    if (lazy->h.message_type != OGS_NAS_5GS_%s) {\n" % v_upper(k))
+    f.write("        ogs_error(\"Not %s [0x%%x]\", lazy->h.message_type);\n" % v_upper(k))
+    f.write("        ogs_assert(ogs_pkbuf_push(pkbuf, size));\n")
+    f.write("        return OGS_ERROR;\n")
+    f.write("    }\n\n")
+    f.write("    rv = ogs_nas_5gs_locate_%s(lazy, pkbuf);\n" % v_lower(k))
+    f.write("""    ogs_assert(ogs_pkbuf_push(pkbuf, pkbuf->data - data));
+    if (rv != OGS_OK)
+        return OGS_ERROR;
+
+    lazy->pkbuf = pkbuf;
+
+    return OGS_OK;
+}
+
+""")
+
+    for i, ie in enumerate(optional):
+        member = "%s->%s" % (get_value(k), get_value(ie["value"]))
+        present = "OGS_NAS_5GS_%s_%s_PRESENT" % (v_upper(k), v_upper(ie["value"]))
+        f.write("ogs_nas_%s_t *ogs_nas_5gs_%s_%s(\n" % (v_lower(ie["type"]), get_value(k), get_value(ie["value"])))
+        f.write("        ogs_nas_5gs_%s_lazy_t *lazy)\n{\n" % v_lower(k))
+        f.write("    ogs_nas_5gs_%s_t *%s = NULL;\n" % (v_lower(k), get_value(k)))
+        f.write("    unsigned char *data = NULL;\n")
+        f.write("    int size = 0;\n\n")
+        f.write("    ogs_assert(lazy);\n")
+        f.write("    %s = &lazy->%s;\n\n" % (get_value(k), get_value(k)))
+        f.write("    if (!(%s->presencemask & %s))\n" % (get_value(k), present))
+        f.write("        return NULL;\n")
+        f.write("    if (lazy->decodedmask & %s)\n" % present)
+        f.write("        return &%s;\n\n" % member)
+        f.write("    ogs_assert(lazy->pkbuf);\n")
+        f.write("    data = lazy->pkbuf->data;\n")
+        f.write("    ogs_assert(ogs_pkbuf_pull(lazy->pkbuf, lazy->offset[%d]));\n" % i)
+        f.write("    size = ogs_nas_5gs_decode_%s(&%s, lazy->pkbuf);\n" % (v_lower(ie["type"]), member))
+        f.write("    ogs_assert(ogs_pkbuf_push(lazy->pkbuf, lazy->pkbuf->data - data));\n")
+        f.write("    if (size < 0) {\n")
+        f.write("        ogs_error(\"ogs_nas_5gs_decode_%s() failed\");\n" % v_lower(ie["type"]))
+        f.write("        %s->presencemask &= ~%s;\n" % (get_value(k), present))
+        f.write("        return NULL;\n")
+        f.write("    }\n\n")
+        f.write("    lazy->decodedmask |= %s;\n\n" % present)
+        f.write("    return &%s;\n" % member)
+        f.write("}\n\n")
+
 f.close()
 
-f = open(outdir + 'encoder.c', 'w')
+f = output.open(outdir + 'encoder.c')
 output_header_to_file(f)
 f.write("""#include "ogs-nas-5gs.h"
 
@@ -860,7 +1264,10 @@ for (k, v) in sorted_msg_list:
 
     for ie in [ies for ies in msg_list[k]["ies"] if ies["presence"] == "M"]:
         f.write("    size = ogs_nas_5gs_encode_%s(pkbuf, &%s->%s);\n" % (v_lower(ie["type"]), get_value(k), get_value(ie["value"])))
-        f.write("    ogs_assert(size >= 0);\n")
+        f.write("    if (size < 0) {\n")
+        f.write("        ogs_error(\"ogs_nas_5gs_encode_%s() failed\");\n" % v_lower(ie["type"]))
+        f.write("        return size;\n")
+        f.write("    }\n")
         f.write("    encoded += size;\n\n")
 
     for ie in [ies for ies in msg_list[k]["ies"] if ies["presence"] != "M"]:
@@ -871,10 +1278,16 @@ for (k, v) in sorted_msg_list:
             f.write("        %s->%s.type = OGS_NAS_5GS_%s_%s_TYPE;\n\n" % (get_value(k), get_value(ie["value"]), v_upper(k), v_upper(ie["value"])))
         else:
             f.write("        size = ogs_nas_5gs_encode_optional_type(pkbuf, OGS_NAS_5GS_%s_%s_TYPE);\n" % (v_upper(k), v_upper(ie["value"])))
-            f.write("        ogs_assert(size >= 0);\n")
+            f.write("        if (size < 0) {\n")
+            f.write("            ogs_error(\"ogs_nas_5gs_encode_optional_type() failed\");\n")
+            f.write("            return size;\n")
+            f.write("        }\n")
             f.write("        encoded += size;\n\n")
         f.write("        size = ogs_nas_5gs_encode_%s(pkbuf, &%s->%s);\n" % (v_lower(ie["type"]), get_value(k), get_value(ie["value"])))
-        f.write("        ogs_assert(size >= 0);\n")
+        f.write("        if (size < 0) {\n")
+        f.write("            ogs_error(\"ogs_nas_5gs_encode_%s() failed\");\n" % v_lower(ie["type"]))
+        f.write("            return size;\n")
+        f.write("        }\n")
         f.write("        encoded += size;\n")
         f.write("    }\n\n")
 
@@ -884,23 +1297,101 @@ for (k, v) in sorted_msg_list:
 """)
 
 
-f.write("""ogs_pkbuf_t *ogs_nas_5gmm_encode(ogs_nas_5gs_message_t *message)
+# Octets written by ogs_nas_5gs_encode_<type>() in ies.c
+def encoded_size(t, member):
+    if (type_list[t]["format"] == "TV" or type_list[t]["format"] == "T") and type_list[t]["length"] == "1":
+        return "sizeof(ogs_nas_%s_t)" % v_lower(t)
+    elif type_list[t]["format"] == "TV" or type_list[t]["format"] == "V":
+        if type_list[t]["length"] == "4":
+            return "3"
+        return "sizeof(ogs_nas_%s_t)" % v_lower(t)
+    elif "encoded_size" in type_list[t]:
+        return type_list[t]["encoded_size"] % (member, member)
+    return "%s.length + sizeof(%s.length)" % (member, member)
+
+for (k, v) in sorted_msg_list:
+    if "ies" not in msg_list[k]:
+        continue;
+
+    f.write("int ogs_nas_5gs_%s_encoded_size(ogs_nas_5gs_message_t *message)\n{\n" % v_lower(k))
+    # Fixed size mandatory IEs alone do not look at the message
+    if len([ies for ies in msg_list[k]["ies"] if ies["presence"] != "M" or
+            "->" in encoded_size(ies["type"], "->")]) != 0:
+        if float(msg_list[k]["type"]) < 192:
+            f.write("    ogs_nas_5gs_%s_t *%s = &message->gmm.%s;\n" % (v_lower(k), get_value(k), get_value(k)))
+        else:
+            f.write("    ogs_nas_5gs_%s_t *%s = &message->gsm.%s;\n" % (v_lower(k), get_value(k), get_value(k)))
+    if float(msg_list[k]["type"]) < 192:
+        f.write("    int size = sizeof(ogs_nas_5gmm_header_t);\n\n")
+    else:
+        f.write("    int size = sizeof(ogs_nas_5gsm_header_t);\n\n")
+
+    for ie in [ies for ies in msg_list[k]["ies"] if ies["presence"] == "M"]:
+        f.write("    size += %s;\n" % encoded_size(ie["type"], "%s->%s" % (get_value(k), get_value(ie["value"]))))
+    if len([ies for ies in msg_list[k]["ies"] if ies["presence"] == "M"]) != 0:
+        f.write("\n")
+
+    for ie in [ies for ies in msg_list[k]["ies"] if ies["presence"] != "M"]:
+        f.write("    if (%s->presencemask & OGS_NAS_5GS_%s_%s_PRESENT)\n" % (get_value(k), v_upper(k), v_upper(ie["value"])))
+        if (ie["length"] == "1" and ie["format"] == "TV") or (ie["length"] == "1" and ie["format"] == "T"):
+            f.write("        size += %s;\n" % encoded_size(ie["type"], "%s->%s" % (get_value(k), get_value(ie["value"]))))
+        else:
+            f.write("        size += 1 + %s;\n" % encoded_size(ie["type"], "%s->%s" % (get_value(k), get_value(ie["value"]))))
+    if len([ies for ies in msg_list[k]["ies"] if ies["presence"] != "M"]) != 0:
+        f.write("\n")
+
+    f.write("""    return size;
+}
+
+""")
+
+for (name, h, cond) in [("5gmm", "gmm", lambda t: t < 192), ("5gsm", "gsm", lambda t: t >= 192)]:
+    f.write("int ogs_nas_%s_encoded_size(ogs_nas_5gs_message_t *message)\n" % name)
+    f.write("{\n")
+    f.write("    ogs_assert(message);\n\n")
+    f.write("    switch(message->%s.h.message_type) {\n" % h)
+    for (k, v) in sorted_msg_list:
+        if "ies" not in msg_list[k]:
+            continue;
+        if cond(float(msg_list[k]["type"])):
+            f.write("    case OGS_NAS_5GS_%s:\n" % v_upper(k))
+            f.write("        return ogs_nas_5gs_%s_encoded_size(message);\n" % v_lower(k))
+    f.write("    default:\n")
+    f.write("        break;\n")
+    f.write("    }\n\n")
+    f.write("    return OGS_ERROR;\n")
+    f.write("}\n\n")
+
+f.write("""int ogs_nas_5gmm_encode_to(
+        ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
 {
-    ogs_pkbuf_t *pkbuf = NULL;
     int size = 0;
     int encoded = 0;
+    int length = 0;
+    int len = 0;
+    int headroom = 0;
 
     ogs_assert(message);
+    ogs_assert(pkbuf);
 
-    /* The Packet Buffer(ogs_pkbuf_t) for NAS message MUST make a HEADROOM.
-     * When calculating AES_CMAC, we need to use the headroom of the packet. */
-    pkbuf = ogs_pkbuf_alloc(NULL, OGS_MAX_SDU_LEN);
-    if (!pkbuf) {
-        ogs_error("ogs_pkbuf_alloc() failed");
-        return NULL;
+    length = ogs_nas_5gmm_encoded_size(message);
+    if (length < 0) {
+        ogs_error("Unknown message type (0x%x) or not implemented", 
+                message->gmm.h.message_type);
+        return OGS_ERROR;
     }
-    ogs_pkbuf_reserve(pkbuf, OGS_NAS_HEADROOM);
-    ogs_pkbuf_put(pkbuf, OGS_MAX_SDU_LEN-OGS_NAS_HEADROOM);
+
+    if (ogs_pkbuf_tailroom(pkbuf) < length) {
+        ogs_error("Not enough tailroom [%d < %d]",
+                ogs_pkbuf_tailroom(pkbuf), length);
+        return OGS_ERROR;
+    }
+
+    /* The message follows the octets already in the pkbuf */
+    len = pkbuf->len;
+    headroom = ogs_pkbuf_headroom(pkbuf);
+    ogs_pkbuf_put(pkbuf, length);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, len));
 
     size = sizeof(ogs_nas_5gmm_header_t);
     ogs_assert(ogs_pkbuf_pull(pkbuf, size));
@@ -918,43 +1409,102 @@ for (k, v) in sorted_msg_list:
         f.write("    case OGS_NAS_5GS_%s:\n" % v_upper(k))
         if len(msg_list[k]["ies"]) != 0:
             f.write("        size = ogs_nas_5gs_encode_%s(pkbuf, message);\n" % v_lower(k))
-            f.write("        ogs_assert(size >= 0);\n")
-            f.write("        encoded += size;\n")
+        else:
+            f.write("        size = 0;\n")
         f.write("        break;\n")
 
 f.write("""    default:
         ogs_error("Unknown message type (0x%x) or not implemented", 
                 message->gmm.h.message_type);
-        ogs_pkbuf_free(pkbuf);
-        return NULL;
+        ogs_assert(ogs_pkbuf_push(pkbuf, len + encoded));
+        ogs_pkbuf_trim(pkbuf, len);
+        return OGS_ERROR;
     }
 
-    ogs_assert(ogs_pkbuf_push(pkbuf, encoded));
+    /* An IE found no room: encoded_size() counted too few octets */
+    if (size < 0) {
+        ogs_error("Encoded more than %d octets", length);
+        ogs_assert(ogs_pkbuf_push(pkbuf,
+                    ogs_pkbuf_headroom(pkbuf) - headroom));
+        ogs_pkbuf_trim(pkbuf, len);
+        return OGS_ERROR;
+    }
+    encoded += size;
 
-    pkbuf->len = encoded;
+    ogs_assert(ogs_pkbuf_push(pkbuf, len + encoded));
 
-    return pkbuf;
-}
+    if (encoded != length) {
+        ogs_error("Encoded %d octets, not %d", encoded, length);
+        ogs_pkbuf_trim(pkbuf, len);
+        return OGS_ERROR;
+    }
 
-""")
+    return encoded;
+}
 
-f.write("""ogs_pkbuf_t *ogs_nas_5gsm_encode(ogs_nas_5gs_message_t *message)
+ogs_pkbuf_t *ogs_nas_5gmm_encode(ogs_nas_5gs_message_t *message)
 {
     ogs_pkbuf_t *pkbuf = NULL;
-    int size = 0;
-    int encoded = 0;
+    int length = 0;
 
     ogs_assert(message);
 
+    length = ogs_nas_5gmm_encoded_size(message);
+    if (length < 0) {
+        ogs_error("Unknown message type (0x%x) or not implemented", 
+                message->gmm.h.message_type);
+        return NULL;
+    }
+
     /* The Packet Buffer(ogs_pkbuf_t) for NAS message MUST make a HEADROOM.
      * When calculating AES_CMAC, we need to use the headroom of the packet. */
-    pkbuf = ogs_pkbuf_alloc(NULL, OGS_MAX_SDU_LEN);
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_NAS_HEADROOM+length);
     if (!pkbuf) {
         ogs_error("ogs_pkbuf_alloc() failed");
         return NULL;
     }
     ogs_pkbuf_reserve(pkbuf, OGS_NAS_HEADROOM);
-    ogs_pkbuf_put(pkbuf, OGS_MAX_SDU_LEN-OGS_NAS_HEADROOM);
+
+    if (ogs_nas_5gmm_encode_to(message, pkbuf) < 0) {
+        ogs_pkbuf_free(pkbuf);
+        return NULL;
+    }
+
+    return pkbuf;
+}
+
+""")
+
+f.write("""int ogs_nas_5gsm_encode_to(
+        ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
+{
+    int size = 0;
+    int encoded = 0;
+    int length = 0;
+    int len = 0;
+    int headroom = 0;
+
+    ogs_assert(message);
+    ogs_assert(pkbuf);
+
+    length = ogs_nas_5gsm_encoded_size(message);
+    if (length < 0) {
+        ogs_error("Unknown message type (0x%x) or not implemented", 
+                message->gsm.h.message_type);
+        return OGS_ERROR;
+    }
+
+    if (ogs_pkbuf_tailroom(pkbuf) < length) {
+        ogs_error("Not enough tailroom [%d < %d]",
+                ogs_pkbuf_tailroom(pkbuf), length);
+        return OGS_ERROR;
+    }
+
+    /* The message follows the octets already in the pkbuf */
+    len = pkbuf->len;
+    headroom = ogs_pkbuf_headroom(pkbuf);
+    ogs_pkbuf_put(pkbuf, length);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, len));
 
     size = sizeof(ogs_nas_5gsm_header_t);
     ogs_assert(ogs_pkbuf_pull(pkbuf, size));
@@ -971,19 +1521,66 @@ for (k, v) in sorted_msg_list:
         f.write("    case OGS_NAS_5GS_%s:\n" % v_upper(k))
         if len(msg_list[k]["ies"]) != 0:
             f.write("        size = ogs_nas_5gs_encode_%s(pkbuf, message);\n" % v_lower(k))
-            f.write("        ogs_assert(size >= 0);\n")
-            f.write("        encoded += size;\n")
+        else:
+            f.write("        size = 0;\n")
         f.write("        break;\n")
 
 f.write("""    default:
         ogs_error("Unknown message type (0x%x) or not implemented", 
                 message->gsm.h.message_type);
-        ogs_pkbuf_free(pkbuf);
+        ogs_assert(ogs_pkbuf_push(pkbuf, len + encoded));
+        ogs_pkbuf_trim(pkbuf, len);
+        return OGS_ERROR;
+    }
+
+    /* An IE found no room: encoded_size() counted too few octets */
+    if (size < 0) {
+        ogs_error("Encoded more than %d octets", length);
+        ogs_assert(ogs_pkbuf_push(pkbuf,
+                    ogs_pkbuf_headroom(pkbuf) - headroom));
+        ogs_pkbuf_trim(pkbuf, len);
+        return OGS_ERROR;
+    }
+    encoded += size;
+
+    ogs_assert(ogs_pkbuf_push(pkbuf, len + encoded));
+
+    if (encoded != length) {
+        ogs_error("Encoded %d octets, not %d", encoded, length);
+        ogs_pkbuf_trim(pkbuf, len);
+        return OGS_ERROR;
+    }
+
+    return encoded;
+}
+
+ogs_pkbuf_t *ogs_nas_5gsm_encode(ogs_nas_5gs_message_t *message)
+{
+    ogs_pkbuf_t *pkbuf = NULL;
+    int length = 0;
+
+    ogs_assert(message);
+
+    length = ogs_nas_5gsm_encoded_size(message);
+    if (length < 0) {
+        ogs_error("Unknown message type (0x%x) or not implemented", 
+                message->gsm.h.message_type);
+        return NULL;
+    }
+
+    /* The Packet Buffer(ogs_pkbuf_t) for NAS message MUST make a HEADROOM.
+     * When calculating AES_CMAC, we need to use the headroom of the packet. */
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_NAS_HEADROOM+length);
+    if (!pkbuf) {
+        ogs_error("ogs_pkbuf_alloc() failed");
         return NULL;
     }
+    ogs_pkbuf_reserve(pkbuf, OGS_NAS_HEADROOM);
 
-    ogs_assert(ogs_pkbuf_push(pkbuf, encoded));
-    pkbuf->len = encoded;
+    if (ogs_nas_5gsm_encode_to(message, pkbuf) < 0) {
+        ogs_pkbuf_free(pkbuf);
+        return NULL;
+    }
 
     return pkbuf;
 }
@@ -1004,7 +1601,301 @@ ogs_pkbuf_t *ogs_nas_5gs_plain_encode(ogs_nas_5gs_message_t *message)
 
     return NULL;
 }
+
+int ogs_nas_5gs_plain_encode_to(
+        ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf)
+{
+    ogs_assert(message);
+
+    ogs_assert(message->gmm.h.extended_protocol_discriminator ==
+            message->gsm.h.extended_protocol_discriminator);
+
+    if (message->gmm.h.extended_protocol_discriminator == 
+            OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GMM)
+        return ogs_nas_5gmm_encode_to(message, pkbuf);
+    else if (message->gmm.h.extended_protocol_discriminator == 
+            OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GSM)
+        return ogs_nas_5gsm_encode_to(message, pkbuf);
+
+    return OGS_ERROR;
+}
 """)
 
 f.close()
 
+if sizes is not None:
+    structs = []
+    for (k, v) in sorted_msg_list:
+        if len(msg_list[k].get("ies", [])) == 0:
+            continue
+        members = [get_value(ie["value"]) for ie in msg_list[k]["ies"]]
+        if len([ies for ies in msg_list[k]["ies"] if ies["presence"] != "M"]) != 0:
+            members.append("presencemask")
+        structs.append(("ogs_nas_5gs_%s_t" % v_lower(k), members))
+    f = output.open(sizes)
+    output_header_to_file(f)
+    write_size_report(f, ["ogs-nas-5gs.h"], structs,
+            ("ogs_nas_5gs_message_t", "gmm.registration_request"))
+    f.close()
+
+# The message with its header and the IEs 'ies', each of them of its
+# minimum length and holding zeros
+def message_octets(k, v, ies):
+    if float(msg_list[k]["type"]) < 192:
+        octets = [0x7e, 0x00, int(v)]
+    else:
+        octets = [0x2e, 0x01, 0x01, int(v)]
+    for ie in ies:
+        octets += nas_ie_octets(ie)
+    return octets
+
+if bench is not None:
+    f = output.open(bench)
+    output_header_to_file(f)
+    write_bench_prologue(f, "NAS 5GS", ["ogs-nas-5gs.h"])
+    write_bench_nas(f, "ogs_nas_5gs_message_t", "ogs_nas_5gs_plain_encode")
+    for (k, v) in lazy_msg_list:
+        f.write("static ogs_nas_5gs_%s_lazy_t bench_%s;\n\n" %
+                (v_lower(k), get_value(k)))
+        f.write("static int bench_%s_lazy(ogs_pkbuf_t *pkbuf)\n{\n" %
+                get_value(k))
+        f.write("    return ogs_nas_5gs_decode_%s_lazy(&bench_%s, pkbuf);\n" %
+                (v_lower(k), get_value(k)))
+        f.write("}\n\n")
+    f.write("static const bench_message_t bench_messages[] = {\n")
+    for (k, v) in sorted_msg_list:
+        if len(msg_list[k].get("ies", [])) == 0:
+            continue
+        octets = message_octets(k, v, msg_list[k]["ies"])
+        if float(msg_list[k]["type"]) < 192:
+            decode = "ogs_nas_5gmm_decode"
+        else:
+            decode = "ogs_nas_5gsm_decode"
+        f.write("    { \"%s\",\n" % k)
+        write_bench_octets(f, octets)
+        if (k, v) in lazy_msg_list:
+            f.write("        %d, %s, bench_%s_lazy },\n" %
+                    (len(octets), decode, get_value(k)))
+        else:
+            f.write("        %d, %s, NULL },\n" % (len(octets), decode))
+    f.write("};\n\n")
+    # Some IEs log the zeros they hold as errors on every decode
+    write_bench_main(f, """    ogs_log_install_domain(&__ogs_nas_domain, "nas", OGS_LOG_FATAL);
+""", "bench_messages")
+    f.close()
+
+if corpus is not None:
+    seeds = Corpus("nas-5gs")
+    for (k, v) in sorted_msg_list:
+        if "ies" not in msg_list[k]:
+            continue
+        variants = {}
+        for variant in VARIANTS:
+            # No IE of a NAS message repeats, "max" is the same as "all"
+            octets = message_octets(k, v, [ie for ie in msg_list[k]["ies"]
+                if variant != "mandatory" or ie["presence"] == "M"])
+            if octets in variants.values():
+                continue
+            variants[variant] = octets
+            seeds.add(v_lower(k), variant, octets)
+    seeds.write(output, corpus)
+
+if python is not None:
+    # Octets of the value of an IE of the type 't', as
+    # ogs_nas_5gs_decode_<type>() in ies.c pulls them
+    def python_format(t):
+        if (type_list[t]["format"] == "TV" or type_list[t]["format"] == "T") and type_list[t]["length"] == "1":
+            return ("V", 1)
+        elif type_list[t]["format"] == "TV" or type_list[t]["format"] == "V":
+            if type_list[t]["length"] == "4":
+                return ("V", 3)
+            if type_list[t]["length"] == "1/2":
+                return ("V", 1)
+            if type_list[t]["format"] == "TV":
+                return ("V", int(type_list[t]["length"]) - 1)
+            return ("V", int(type_list[t]["length"]))
+        elif type_list[t]["format"] == "LV-E" or type_list[t]["format"] == "TLV-E":
+            return ("LV_E", 0)
+        return ("LV", 0)
+
+    f = output.open(python)
+    f.write("# This file had been created by nas-message.py script v%s\n" % (version))
+    f.write("# Please do not modify this file but regenerate it via script.\n")
+    f.write(re.sub("^ [*]", "#", stamp(filename, reproducible), flags=re.M))
+    f.write('''"""NAS 5GS messages of TS 24.501 decoded in pure Python
+
+For the offline analysis of captures. decode() returns the message type,
+the presence mask of the optional IEs (the presencemask of the C
+structure) and the value octets of the IEs. decode_batch() decodes a list
+of messages into columns:
+
+    >>> import ogs_nas_5gs
+    >>> columns = ogs_nas_5gs.decode_batch(payloads, ["mobile_identity"])
+    >>> columns["message_type"], columns["mobile_identity"]
+
+The values are not checked against the size of their C structure.
+"""
+
+import struct
+
+OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GSM = 0x2e
+OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GMM = 0x7e
+
+_5GMM_HEADER = struct.Struct("!BBB")
+_5GSM_HEADER = struct.Struct("!BBBB")
+# Security header type, message authentication code and sequence number
+_SECURITY_HEADER = struct.Struct("!BBIB")
+# Security header types whose plain message is not ciphered
+_INTEGRITY_PROTECTED = (1, 3)
+_LENGTH = struct.Struct("!H")
+
+# The value of an IE is 'size' octets (V), or follows a length of one
+# (LV) or two (LV_E) octets
+V = 0
+LV = 1
+LV_E = 2
+
+# (EPD, message type): (name, mandatory IEs, optional IEs by IEI)
+#   mandatory IE: (name, format, size)
+#   optional IE: (bit in the presence mask, name, format, size, half)
+# The IEI of a 'half' IE is the upper half of the first octet of its value
+MESSAGES = {
+''')
+    for (k, v) in sorted_msg_list:
+        if "ies" not in msg_list[k]:
+            continue
+        if float(msg_list[k]["type"]) < 192:
+            epd = "OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GMM"
+        else:
+            epd = "OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GSM"
+        f.write("    (%s, %s): (\"%s\", (\n" % (epd, v, get_value(k)))
+        for ie in [ies for ies in msg_list[k]["ies"] if ies["presence"] == "M"]:
+            (format, size) = python_format(ie["type"])
+            f.write("            (\"%s\", %s, %d),\n" % (get_value(ie["value"]), format, size))
+        f.write("        ), {\n")
+        ieis = []
+        for i, ie in enumerate([ies for ies in msg_list[k]["ies"] if ies["presence"] != "M"]):
+            # The IEI is taken by an earlier IE (see decoder.c)
+            if ie["iei"] in ieis:
+                continue
+            ieis.append(ie["iei"])
+            (format, size) = python_format(ie["type"])
+            half = (ie["format"] == "TV" or ie["format"] == "T") and ie["length"] == "1"
+            f.write("            0x%s: (%d, \"%s\", %s, %d, %s),\n" % (re.sub('-', '0', ie["iei"]).lower(), i, get_value(ie["value"]), format, size, half))
+        f.write("        }),\n")
+    f.write('''}
+
+def _value(data, offset, format, size):
+    """The start and the end of the value of an IE at 'offset'"""
+    if format == LV:
+        if offset + 1 > len(data):
+            raise ValueError("No length [offset:%d]" % offset)
+        size = data[offset]
+        offset += 1
+    elif format == LV_E:
+        if offset + 2 > len(data):
+            raise ValueError("No length [offset:%d]" % offset)
+        (size,) = _LENGTH.unpack_from(data, offset)
+        offset += 2
+    if offset + size > len(data):
+        raise ValueError("Not enough data [offset:%d size:%d len:%d]" %
+                (offset, size, len(data)))
+    return (offset, offset + size)
+
+def _decode(data, names):
+    epd = data[0] if len(data) > 0 else None
+    if (epd == OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GMM and
+            len(data) > 1 and data[1] & 0x0f):
+        security_header_type = data[1] & 0x0f
+        if security_header_type not in _INTEGRITY_PROTECTED:
+            raise ValueError("Ciphered message [security header type:%d]" %
+                    security_header_type)
+        # The security header starts with the EPD of the plain message
+        data = data[_SECURITY_HEADER.size:]
+        epd = data[0] if len(data) > 0 else None
+
+    if epd == OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GMM:
+        header = _5GMM_HEADER
+    elif epd == OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GSM:
+        header = _5GSM_HEADER
+    else:
+        raise ValueError("Unknown EPD [%s]" % epd)
+    if len(data) < header.size:
+        raise ValueError("No header [len:%d]" % len(data))
+    message_type = header.unpack_from(data)[-1]
+    # A message type of the other EPD is unknown too
+    message = MESSAGES.get((epd, message_type))
+    if message is None:
+        raise ValueError("Unknown message type [EPD:0x%x type:0x%x]" %
+                (epd, message_type))
+    (_, mandatory, optional) = message
+
+    ies = {}
+    offset = header.size
+    for (name, format, size) in mandatory:
+        (start, offset) = _value(data, offset, format, size)
+        if names is None or name in names:
+            ies[name] = data[start:offset]
+
+    presencemask = 0
+    while offset < len(data):
+        type = data[offset]
+        if type >= 0x80:
+            type &= 0xf0
+        ie = optional.get(type)
+        if ie is None:
+            # Skipped octet by octet, as ogs_nas_5gmm_decode() does
+            offset += 1
+            continue
+        (bit, name, format, size, half) = ie
+        if half is False:
+            offset += 1
+        (start, offset) = _value(data, offset, format, size)
+        presencemask |= 1 << bit
+        if names is None or name in names:
+            ies[name] = data[start:offset]
+
+    return (message_type, presencemask, ies)
+
+def decode(data):
+    """Decode the message 'data' into (message type, presence mask, IEs)
+
+    The IEs are a dict of the value octets by name. The plain message of an
+    integrity protected 5GMM message is decoded. Raises ValueError if the
+    message is malformed or ciphered."""
+    return _decode(data, None)
+
+def decode_batch(messages, names=()):
+    """Decode the list of messages 'messages' into columns
+
+    Returns a dict of lists with an entry per message: "message_type",
+    "presencemask" and the value octets of each IE in 'names'. An entry is
+    None if the message could not be decoded or has no such IE."""
+    wanted = frozenset(names)
+    message_types = []
+    presencemasks = []
+    columns = [[] for name in names]
+    for data in messages:
+        try:
+            (message_type, presencemask, ies) = _decode(data, wanted)
+        except ValueError:
+            (message_type, presencemask, ies) = (None, None, {})
+        message_types.append(message_type)
+        presencemasks.append(presencemask)
+        for (name, column) in zip(names, columns):
+            column.append(ies.get(name))
+
+    result = { "message_type": message_types, "presencemask": presencemasks }
+    result.update(zip(names, columns))
+    return result
+''')
+    f.close()
+
+if depfile is not None:
+    inputs = [filename] + cache.files
+    if os.path.isfile(typefile):
+        inputs.append(typefile)
+    output.write_depfile(depfile, inputs)
+
+output.summary()
+profile.report()
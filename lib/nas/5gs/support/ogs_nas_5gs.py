@@ -0,0 +1,610 @@
+# This file had been created by nas-message.py script v0.2.0
+# Please do not modify this file but regenerate it via script.
+# Created from 24501-h90.docx
+# (sha256: 934e13e03cc23a890da2448bd91bac0d11d7f538d814a725666f5c9be66f7b96)
+"""NAS 5GS messages of TS 24.501 decoded in pure Python
+
+For the offline analysis of captures. decode() returns the message type,
+the presence mask of the optional IEs (the presencemask of the C
+structure) and the value octets of the IEs. decode_batch() decodes a list
+of messages into columns:
+
+    >>> import ogs_nas_5gs
+    >>> columns = ogs_nas_5gs.decode_batch(payloads, ["mobile_identity"])
+    >>> columns["message_type"], columns["mobile_identity"]
+
+The values are not checked against the size of their C structure.
+"""
+
+import struct
+
+OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GSM = 0x2e
+OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GMM = 0x7e
+
+_5GMM_HEADER = struct.Struct("!BBB")
+_5GSM_HEADER = struct.Struct("!BBBB")
+# Security header type, message authentication code and sequence number
+_SECURITY_HEADER = struct.Struct("!BBIB")
+# Security header types whose plain message is not ciphered
+_INTEGRITY_PROTECTED = (1, 3)
+_LENGTH = struct.Struct("!H")
+
+# The value of an IE is 'size' octets (V), or follows a length of one
+# (LV) or two (LV_E) octets
+V = 0
+LV = 1
+LV_E = 2
+
+# (EPD, message type): (name, mandatory IEs, optional IEs by IEI)
+#   mandatory IE: (name, format, size)
+#   optional IE: (bit in the presence mask, name, format, size, half)
+# The IEI of a 'half' IE is the upper half of the first octet of its value
+MESSAGES = {
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GMM, 65): ("registration_request", (
+            ("registration_type", V, 1),
+            ("mobile_identity", LV_E, 0),
+        ), {
+            0xc0: (0, "non_current_native_nas_key_set_identifier", V, 1, True),
+            0x10: (1, "gmm_capability", LV, 0, False),
+            0x2e: (2, "ue_security_capability", LV, 0, False),
+            0x2f: (3, "requested_nssai", LV, 0, False),
+            0x52: (4, "last_visited_registered_tai", V, 6, False),
+            0x17: (5, "s1_ue_network_capability", LV, 0, False),
+            0x40: (6, "uplink_data_status", LV, 0, False),
+            0x50: (7, "pdu_session_status", LV, 0, False),
+            0xb0: (8, "mico_indication", V, 1, True),
+            0x2b: (9, "ue_status", LV, 0, False),
+            0x77: (10, "additional_guti", LV_E, 0, False),
+            0x25: (11, "allowed_pdu_session_status", LV, 0, False),
+            0x18: (12, "ue_usage_setting", LV, 0, False),
+            0x51: (13, "requested_drx_parameters", LV, 0, False),
+            0x70: (14, "eps_nas_message_container", LV_E, 0, False),
+            0x74: (15, "ladn_indication", LV_E, 0, False),
+            0x80: (16, "payload_container_type", V, 1, True),
+            0x7b: (17, "payload_container", LV_E, 0, False),
+            0x90: (18, "network_slicing_indication", V, 1, True),
+            0x53: (19, "update_type", LV, 0, False),
+            0x41: (20, "mobile_station_classmark_2", LV, 0, False),
+            0x42: (21, "supported_codecs", LV, 0, False),
+            0x71: (22, "nas_message_container", LV_E, 0, False),
+            0x60: (23, "eps_bearer_context_status", LV, 0, False),
+            0x6e: (24, "requested_extended_drx_parameters", LV, 0, False),
+            0x6a: (25, "t3324_value", LV, 0, False),
+            0x67: (26, "ue_radio_capability_id", LV, 0, False),
+            0x35: (27, "requested_mapped_nssai", LV, 0, False),
+            0x48: (28, "additional_information_requested", LV, 0, False),
+            0x1a: (29, "requested_wus_assistance_information", LV, 0, False),
+            0xa0: (30, "n5gc_indication", V, 1, True),
+            0x30: (31, "requested_nb_n1_mode_drx_parameters", LV, 0, False),
+            0x29: (32, "ue_request_type", LV, 0, False),
+            0x28: (33, "paging_restriction", LV, 0, False),
+            0x72: (34, "service_level_aa_container", LV_E, 0, False),
+            0x32: (35, "nid", LV, 0, False),
+            0x16: (36, "ms_determined_plmn_with_disaster_condition", LV, 0, False),
+            0x2a: (37, "requested_peips_assistance_information", LV, 0, False),
+            0x3b: (38, "requested_t3512_value", LV, 0, False),
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GMM, 66): ("registration_accept", (
+            ("registration_result", LV, 0),
+        ), {
+            0x77: (0, "guti", LV_E, 0, False),
+            0x4a: (1, "equivalent_plmns", LV, 0, False),
+            0x54: (2, "tai_list", LV, 0, False),
+            0x15: (3, "allowed_nssai", LV, 0, False),
+            0x11: (4, "rejected_nssai", LV, 0, False),
+            0x31: (5, "configured_nssai", LV, 0, False),
+            0x21: (6, "network_feature_support", LV, 0, False),
+            0x50: (7, "pdu_session_status", LV, 0, False),
+            0x26: (8, "pdu_session_reactivation_result", LV, 0, False),
+            0x72: (9, "pdu_session_reactivation_result_error_cause", LV_E, 0, False),
+            0x79: (10, "ladn_information", LV_E, 0, False),
+            0xb0: (11, "mico_indication", V, 1, True),
+            0x90: (12, "network_slicing_indication", V, 1, True),
+            0x27: (13, "service_area_list", LV, 0, False),
+            0x5e: (14, "t3512_value", LV, 0, False),
+            0x5d: (15, "non_3gpp_de_registration_timer_value", LV, 0, False),
+            0x16: (16, "t3502_value", LV, 0, False),
+            0x34: (17, "emergency_number_list", LV, 0, False),
+            0x7a: (18, "extended_emergency_number_list", LV_E, 0, False),
+            0x73: (19, "sor_transparent_container", LV_E, 0, False),
+            0x78: (20, "eap_message", LV_E, 0, False),
+            0xa0: (21, "nssai_inclusion_mode", V, 1, True),
+            0x76: (22, "operator_defined_access_category_definitions", LV_E, 0, False),
+            0x51: (23, "negotiated_drx_parameters", LV, 0, False),
+            0xd0: (24, "non_3gpp_nw_policies", V, 1, True),
+            0x60: (25, "eps_bearer_context_status", LV, 0, False),
+            0x6e: (26, "negotiated_extended_drx_parameters", LV, 0, False),
+            0x6c: (27, "t3447_value", LV, 0, False),
+            0x6b: (28, "t3448_value", LV, 0, False),
+            0x6a: (29, "t3324_value", LV, 0, False),
+            0x67: (30, "ue_radio_capability_id", LV, 0, False),
+            0xe0: (31, "ue_radio_capability_id_deletion_indication", V, 1, True),
+            0x39: (32, "pending_nssai", LV, 0, False),
+            0x74: (33, "ciphering_key_data", LV_E, 0, False),
+            0x75: (34, "cag_information_list", LV_E, 0, False),
+            0x1b: (35, "truncated_s_tmsi_configuration", LV, 0, False),
+            0x1c: (36, "negotiated_wus_assistance_information", LV, 0, False),
+            0x29: (37, "negotiated_nb_n1_mode_drx_parameters", LV, 0, False),
+            0x68: (38, "extended_rejected_nssai", LV, 0, False),
+            0x7b: (39, "service_level_aa_container", LV_E, 0, False),
+            0x33: (40, "negotiated_peips_assistance_information", LV, 0, False),
+            0x70: (42, "nssrg_information", LV_E, 0, False),
+            0x14: (43, "disaster_roaming_wait_range", LV, 0, False),
+            0x2c: (44, "disaster_return_wait_range", LV, 0, False),
+            0x13: (45, "list_of_plmns_to_be_used_in_disaster_condition", LV, 0, False),
+            0x1d: (46, "forbidden_tai_for_the_list_of_forbidden_tracking_areas_for_roaming", LV, 0, False),
+            0x1e: (47, "forbidden_tai_for_the_list_of_forbidden_tracking_areas_forregional_provision_of_service", LV, 0, False),
+            0x71: (48, "extended_cag_information_list", LV_E, 0, False),
+            0x7c: (49, "nsag_information", LV_E, 0, False),
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GMM, 67): ("registration_complete", (
+        ), {
+            0x73: (0, "sor_transparent_container", LV_E, 0, False),
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GMM, 68): ("registration_reject", (
+            ("gmm_cause", V, 1),
+        ), {
+            0x5f: (0, "t3346_value", LV, 0, False),
+            0x16: (1, "t3502_value", LV, 0, False),
+            0x78: (2, "eap_message", LV_E, 0, False),
+            0x69: (3, "rejected_nssai", LV, 0, False),
+            0x75: (4, "cag_information_list", LV_E, 0, False),
+            0x68: (5, "extended_rejected_nssai", LV, 0, False),
+            0x2c: (6, "disaster_return_wait_range", LV, 0, False),
+            0x71: (7, "extended_cag_information_list", LV_E, 0, False),
+            0x3a: (8, "lower_bound_timer_value", LV, 0, False),
+            0x1d: (9, "forbidden_tai_for_the_list_of_forbidden_tracking_areas_for_roaming", LV, 0, False),
+            0x1e: (10, "forbidden_tai_for_the_list_of_forbidden_tracking_areas_forregional_provision_of_service", LV, 0, False),
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GMM, 69): ("deregistration_request_from_ue", (
+            ("de_registration_type", V, 1),
+            ("mobile_identity", LV_E, 0),
+        ), {
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GMM, 70): ("deregistration_accept_from_ue", (
+        ), {
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GMM, 71): ("deregistration_request_to_ue", (
+            ("de_registration_type", V, 1),
+        ), {
+            0x58: (0, "gmm_cause", V, 1, False),
+            0x5f: (1, "t3346_value", LV, 0, False),
+            0x6d: (2, "rejected_nssai", LV, 0, False),
+            0x75: (3, "cag_information_list", LV_E, 0, False),
+            0x68: (4, "extended_rejected_nssai", LV, 0, False),
+            0x2c: (5, "disaster_return_wait_range", LV, 0, False),
+            0x71: (6, "extended_cag_information_list", LV_E, 0, False),
+            0x3a: (7, "lower_bound_timer_value", LV, 0, False),
+            0x1d: (8, "forbidden_tai_for_the_list_of_forbidden_tracking_areas_for_roaming", LV, 0, False),
+            0x1e: (9, "forbidden_tai_for_the_list_of_forbidden_tracking_areas_forregional_provision_of_service", LV, 0, False),
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GMM, 72): ("deregistration_accept_to_ue", (
+        ), {
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GMM, 76): ("service_request", (
+            ("ngksi", V, 1),
+            ("s_tmsi", LV_E, 0),
+        ), {
+            0x40: (0, "uplink_data_status", LV, 0, False),
+            0x50: (1, "pdu_session_status", LV, 0, False),
+            0x25: (2, "allowed_pdu_session_status", LV, 0, False),
+            0x71: (3, "nas_message_container", LV_E, 0, False),
+            0x29: (4, "ue_request_type", LV, 0, False),
+            0x28: (5, "paging_restriction", LV, 0, False),
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GMM, 77): ("service_reject", (
+            ("gmm_cause", V, 1),
+        ), {
+            0x50: (0, "pdu_session_status", LV, 0, False),
+            0x5f: (1, "t3346_value", LV, 0, False),
+            0x78: (2, "eap_message", LV_E, 0, False),
+            0x6b: (3, "t3448_value", LV, 0, False),
+            0x75: (4, "cag_information_list", LV_E, 0, False),
+            0x2c: (5, "disaster_return_wait_range", LV, 0, False),
+            0x71: (6, "extended_cag_information_list", LV_E, 0, False),
+            0x3a: (7, "lower_bound_timer_value", LV, 0, False),
+            0x1d: (8, "forbidden_tai_for_the_list_of_forbidden_tracking_areas_for_roaming", LV, 0, False),
+            0x1e: (9, "forbidden_tai_for_the_list_of_forbidden_tracking_areas_forregional_provision_of_service", LV, 0, False),
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GMM, 78): ("service_accept", (
+        ), {
+            0x50: (0, "pdu_session_status", LV, 0, False),
+            0x26: (1, "pdu_session_reactivation_result", LV, 0, False),
+            0x72: (2, "pdu_session_reactivation_result_error_cause", LV_E, 0, False),
+            0x78: (3, "eap_message", LV_E, 0, False),
+            0x6b: (4, "t3448_value", LV, 0, False),
+            0x34: (5, "additional_request_result", LV, 0, False),
+            0x1d: (6, "forbidden_tai_for_the_list_of_forbidden_tracking_areas_for_roaming", LV, 0, False),
+            0x1e: (7, "forbidden_tai_for_the_list_of_forbidden_tracking_areas_forregional_provision_of_service", LV, 0, False),
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GMM, 84): ("configuration_update_command", (
+        ), {
+            0xd0: (0, "configuration_update_indication", V, 1, True),
+            0x77: (1, "guti", LV_E, 0, False),
+            0x54: (2, "tai_list", LV, 0, False),
+            0x15: (3, "allowed_nssai", LV, 0, False),
+            0x27: (4, "service_area_list", LV, 0, False),
+            0x43: (5, "full_name_for_network", LV, 0, False),
+            0x45: (6, "short_name_for_network", LV, 0, False),
+            0x46: (7, "local_time_zone", V, 1, False),
+            0x47: (8, "universal_time_and_local_time_zone", V, 7, False),
+            0x49: (9, "network_daylight_saving_time", LV, 0, False),
+            0x79: (10, "ladn_information", LV_E, 0, False),
+            0xb0: (11, "mico_indication", V, 1, True),
+            0x90: (12, "network_slicing_indication", V, 1, True),
+            0x31: (13, "configured_nssai", LV, 0, False),
+            0x11: (14, "rejected_nssai", LV, 0, False),
+            0x76: (15, "operator_defined_access_category_definitions", LV_E, 0, False),
+            0xf0: (16, "sms_indication", V, 1, True),
+            0x6c: (17, "t3447_value", LV, 0, False),
+            0x75: (18, "cag_information_list", LV_E, 0, False),
+            0x67: (19, "ue_radio_capability_id", LV, 0, False),
+            0xa0: (20, "ue_radio_capability_id_deletion_indication", V, 1, True),
+            0x44: (21, "registration_result", LV, 0, False),
+            0x1b: (22, "truncated_s_tmsi_configuration", LV, 0, False),
+            0xc0: (23, "additional_configuration_indication", V, 1, True),
+            0x68: (24, "extended_rejected_nssai", LV, 0, False),
+            0x72: (25, "service_level_aa_container", LV_E, 0, False),
+            0x70: (26, "nssrg_information", LV_E, 0, False),
+            0x14: (27, "disaster_roaming_wait_range", LV, 0, False),
+            0x2c: (28, "disaster_return_wait_range", LV, 0, False),
+            0x13: (29, "list_of_plmns_to_be_used_in_disaster_condition", LV, 0, False),
+            0x71: (30, "extended_cag_information_list", LV_E, 0, False),
+            0x1f: (31, "updated_peips_assistance_information", LV, 0, False),
+            0x73: (32, "nsag_information", LV_E, 0, False),
+            0xe0: (33, "priority_indicator", V, 1, True),
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GMM, 85): ("configuration_update_complete", (
+        ), {
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GMM, 86): ("authentication_request", (
+            ("ngksi", V, 1),
+            ("abba", LV, 0),
+        ), {
+            0x21: (0, "authentication_parameter_rand", V, 16, False),
+            0x20: (1, "authentication_parameter_autn", LV, 0, False),
+            0x78: (2, "eap_message", LV_E, 0, False),
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GMM, 87): ("authentication_response", (
+        ), {
+            0x2d: (0, "authentication_response_parameter", LV, 0, False),
+            0x78: (1, "eap_message", LV_E, 0, False),
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GMM, 88): ("authentication_reject", (
+        ), {
+            0x78: (0, "eap_message", LV_E, 0, False),
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GMM, 89): ("authentication_failure", (
+            ("gmm_cause", V, 1),
+        ), {
+            0x30: (0, "authentication_failure_parameter", LV, 0, False),
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GMM, 90): ("authentication_result", (
+            ("ngksi", V, 1),
+            ("eap_message", LV_E, 0),
+        ), {
+            0x38: (0, "abba", LV, 0, False),
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GMM, 91): ("identity_request", (
+            ("identity_type", V, 1),
+        ), {
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GMM, 92): ("identity_response", (
+            ("mobile_identity", LV_E, 0),
+        ), {
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GMM, 93): ("security_mode_command", (
+            ("selected_nas_security_algorithms", V, 1),
+            ("ngksi", V, 1),
+            ("replayed_ue_security_capabilities", LV, 0),
+        ), {
+            0xe0: (0, "imeisv_request", V, 1, True),
+            0x57: (1, "selected_eps_nas_security_algorithms", V, 1, False),
+            0x36: (2, "additional_security_information", LV, 0, False),
+            0x78: (3, "eap_message", LV_E, 0, False),
+            0x38: (4, "abba", LV, 0, False),
+            0x19: (5, "replayed_s1_ue_security_capabilities", LV, 0, False),
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GMM, 94): ("security_mode_complete", (
+        ), {
+            0x77: (0, "imeisv", LV_E, 0, False),
+            0x71: (1, "nas_message_container", LV_E, 0, False),
+            0x78: (2, "non_imeisv_pei", LV_E, 0, False),
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GMM, 95): ("security_mode_reject", (
+            ("gmm_cause", V, 1),
+        ), {
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GMM, 100): ("gmm_status", (
+            ("gmm_cause", V, 1),
+        ), {
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GMM, 101): ("notification", (
+            ("access_type", V, 1),
+        ), {
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GMM, 102): ("notification_response", (
+        ), {
+            0x50: (0, "pdu_session_status", LV, 0, False),
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GMM, 103): ("ul_nas_transport", (
+            ("payload_container_type", V, 1),
+            ("payload_container", LV_E, 0),
+        ), {
+            0x12: (0, "pdu_session_id", V, 1, False),
+            0x59: (1, "old_pdu_session_id", V, 1, False),
+            0x80: (2, "request_type", V, 1, True),
+            0x22: (3, "s_nssai", LV, 0, False),
+            0x25: (4, "dnn", LV, 0, False),
+            0x24: (5, "additional_information", LV, 0, False),
+            0xa0: (6, "ma_pdu_session_information", V, 1, True),
+            0xf0: (7, "release_assistance_indication", V, 1, True),
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GMM, 104): ("dl_nas_transport", (
+            ("payload_container_type", V, 1),
+            ("payload_container", LV_E, 0),
+        ), {
+            0x12: (0, "pdu_session_id", V, 1, False),
+            0x24: (1, "additional_information", LV, 0, False),
+            0x58: (2, "gmm_cause", V, 1, False),
+            0x37: (3, "back_off_timer_value", LV, 0, False),
+            0x3a: (4, "lower_bound_timer_value", LV, 0, False),
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GSM, 193): ("pdu_session_establishment_request", (
+            ("integrity_protection_maximum_data_rate", V, 2),
+        ), {
+            0x90: (0, "pdu_session_type", V, 1, True),
+            0xa0: (1, "ssc_mode", V, 1, True),
+            0x28: (2, "gsm_capability", LV, 0, False),
+            0x55: (3, "maximum_number_of_supported_packet_filters", V, 2, False),
+            0xb0: (4, "always_on_pdu_session_requested", V, 1, True),
+            0x39: (5, "sm_pdu_dn_request_container", LV, 0, False),
+            0x7b: (6, "extended_protocol_configuration_options", LV_E, 0, False),
+            0x66: (7, "ip_header_compression_configuration", LV, 0, False),
+            0x6e: (8, "ds_tt_ethernet_port_mac_address", LV, 0, False),
+            0x6f: (9, "ue_ds_tt_residence_time", LV, 0, False),
+            0x74: (10, "port_management_information_container", LV_E, 0, False),
+            0x1f: (11, "ethernet_header_compression_configuration", LV, 0, False),
+            0x29: (12, "suggested_interface_identifier", LV, 0, False),
+            0x72: (13, "service_level_aa_container", LV_E, 0, False),
+            0x70: (14, "requested_mbs_container", LV_E, 0, False),
+            0x34: (15, "pdu_session_pair_id", LV, 0, False),
+            0x35: (16, "rsn", LV, 0, False),
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GSM, 194): ("pdu_session_establishment_accept", (
+            ("selected_pdu_session_type", V, 1),
+            ("authorized_qos_rules", LV_E, 0),
+            ("session_ambr", LV, 0),
+        ), {
+            0x59: (0, "gsm_cause", V, 1, False),
+            0x29: (1, "pdu_address", LV, 0, False),
+            0x56: (2, "rq_timer_value", V, 1, False),
+            0x22: (3, "s_nssai", LV, 0, False),
+            0x80: (4, "always_on_pdu_session_indication", V, 1, True),
+            0x75: (5, "mapped_eps_bearer_contexts", LV_E, 0, False),
+            0x78: (6, "eap_message", LV_E, 0, False),
+            0x79: (7, "authorized_qos_flow_descriptions", LV_E, 0, False),
+            0x7b: (8, "extended_protocol_configuration_options", LV_E, 0, False),
+            0x25: (9, "dnn", LV, 0, False),
+            0x17: (10, "gsm_network_feature_support", LV, 0, False),
+            0x18: (11, "serving_plmn_rate_control", LV, 0, False),
+            0x77: (12, "atsss_container", LV_E, 0, False),
+            0xc0: (13, "control_plane_only_indication", V, 1, True),
+            0x66: (14, "ip_header_compression_configuration", LV, 0, False),
+            0x1f: (15, "ethernet_header_compression_configuration", LV, 0, False),
+            0x72: (16, "service_level_aa_container", LV_E, 0, False),
+            0x71: (17, "received_mbs_container", LV_E, 0, False),
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GSM, 195): ("pdu_session_establishment_reject", (
+            ("gsm_cause", V, 1),
+        ), {
+            0x37: (0, "back_off_timer_value", LV, 0, False),
+            0xf0: (1, "allowed_ssc_mode", V, 1, True),
+            0x78: (2, "eap_message", LV_E, 0, False),
+            0x61: (3, "gsm_congestion_re_attempt_indicator", LV, 0, False),
+            0x7b: (4, "extended_protocol_configuration_options", LV_E, 0, False),
+            0x1d: (5, "re_attempt_indicator", LV, 0, False),
+            0x72: (6, "service_level_aa_container", LV_E, 0, False),
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GSM, 197): ("pdu_session_authentication_command", (
+            ("eap_message", LV_E, 0),
+        ), {
+            0x7b: (0, "extended_protocol_configuration_options", LV_E, 0, False),
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GSM, 198): ("pdu_session_authentication_complete", (
+            ("eap_message", LV_E, 0),
+        ), {
+            0x7b: (0, "extended_protocol_configuration_options", LV_E, 0, False),
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GSM, 199): ("pdu_session_authentication_result", (
+        ), {
+            0x78: (0, "eap_message", LV_E, 0, False),
+            0x7b: (1, "extended_protocol_configuration_options", LV_E, 0, False),
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GSM, 201): ("pdu_session_modification_request", (
+        ), {
+            0x28: (0, "gsm_capability", LV, 0, False),
+            0x59: (1, "gsm_cause", V, 1, False),
+            0x55: (2, "maximum_number_of_supported_packet_filters", V, 2, False),
+            0xb0: (3, "always_on_pdu_session_requested", V, 1, True),
+            0x13: (4, "integrity_protection_maximum_data_rate", V, 2, False),
+            0x7a: (5, "requested_qos_rules", LV_E, 0, False),
+            0x79: (6, "requested_qos_flow_descriptions", LV_E, 0, False),
+            0x75: (7, "mapped_eps_bearer_contexts", LV_E, 0, False),
+            0x7b: (8, "extended_protocol_configuration_options", LV_E, 0, False),
+            0x74: (9, "port_management_information_container", LV_E, 0, False),
+            0x66: (10, "ip_header_compression_configuration", LV, 0, False),
+            0x1f: (11, "ethernet_header_compression_configuration", LV, 0, False),
+            0x70: (12, "requested_mbs_container", LV_E, 0, False),
+            0x72: (13, "service_level_aa_container", LV_E, 0, False),
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GSM, 202): ("pdu_session_modification_reject", (
+            ("gsm_cause", V, 1),
+        ), {
+            0x37: (0, "back_off_timer_value", LV, 0, False),
+            0x61: (1, "gsm_congestion_re_attempt_indicator", LV, 0, False),
+            0x7b: (2, "extended_protocol_configuration_options", LV_E, 0, False),
+            0x1d: (3, "re_attempt_indicator", LV, 0, False),
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GSM, 203): ("pdu_session_modification_command", (
+        ), {
+            0x59: (0, "gsm_cause", V, 1, False),
+            0x2a: (1, "session_ambr", LV, 0, False),
+            0x56: (2, "rq_timer_value", V, 1, False),
+            0x80: (3, "always_on_pdu_session_indication", V, 1, True),
+            0x7a: (4, "authorized_qos_rules", LV_E, 0, False),
+            0x75: (5, "mapped_eps_bearer_contexts", LV_E, 0, False),
+            0x79: (6, "authorized_qos_flow_descriptions", LV_E, 0, False),
+            0x7b: (7, "extended_protocol_configuration_options", LV_E, 0, False),
+            0x77: (8, "atsss_container", LV_E, 0, False),
+            0x66: (9, "ip_header_compression_configuration", LV, 0, False),
+            0x74: (10, "port_management_information_container", LV_E, 0, False),
+            0x1e: (11, "serving_plmn_rate_control", LV, 0, False),
+            0x1f: (12, "ethernet_header_compression_configuration", LV, 0, False),
+            0x71: (13, "received_mbs_container", LV_E, 0, False),
+            0x72: (14, "service_level_aa_container", LV_E, 0, False),
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GSM, 204): ("pdu_session_modification_complete", (
+        ), {
+            0x7b: (0, "extended_protocol_configuration_options", LV_E, 0, False),
+            0x74: (1, "port_management_information_container", LV_E, 0, False),
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GSM, 205): ("pdu_session_modification_command_reject", (
+            ("gsm_cause", V, 1),
+        ), {
+            0x7b: (0, "extended_protocol_configuration_options", LV_E, 0, False),
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GSM, 209): ("pdu_session_release_request", (
+        ), {
+            0x59: (0, "gsm_cause", V, 1, False),
+            0x7b: (1, "extended_protocol_configuration_options", LV_E, 0, False),
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GSM, 210): ("pdu_session_release_reject", (
+            ("gsm_cause", V, 1),
+        ), {
+            0x7b: (0, "extended_protocol_configuration_options", LV_E, 0, False),
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GSM, 211): ("pdu_session_release_command", (
+            ("gsm_cause", V, 1),
+        ), {
+            0x37: (0, "back_off_timer_value", LV, 0, False),
+            0x78: (1, "eap_message", LV_E, 0, False),
+            0x61: (2, "gsm_congestion_re_attempt_indicator", LV, 0, False),
+            0x7b: (3, "extended_protocol_configuration_options", LV_E, 0, False),
+            0xd0: (4, "access_type", V, 1, True),
+            0x72: (5, "service_level_aa_container", LV_E, 0, False),
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GSM, 212): ("pdu_session_release_complete", (
+        ), {
+            0x59: (0, "gsm_cause", V, 1, False),
+            0x7b: (1, "extended_protocol_configuration_options", LV_E, 0, False),
+        }),
+    (OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GSM, 214): ("gsm_status", (
+            ("gsm_cause", V, 1),
+        ), {
+        }),
+}
+
+def _value(data, offset, format, size):
+    """The start and the end of the value of an IE at 'offset'"""
+    if format == LV:
+        if offset + 1 > len(data):
+            raise ValueError("No length [offset:%d]" % offset)
+        size = data[offset]
+        offset += 1
+    elif format == LV_E:
+        if offset + 2 > len(data):
+            raise ValueError("No length [offset:%d]" % offset)
+        (size,) = _LENGTH.unpack_from(data, offset)
+        offset += 2
+    if offset + size > len(data):
+        raise ValueError("Not enough data [offset:%d size:%d len:%d]" %
+                (offset, size, len(data)))
+    return (offset, offset + size)
+
+def _decode(data, names):
+    epd = data[0] if len(data) > 0 else None
+    if (epd == OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GMM and
+            len(data) > 1 and data[1] & 0x0f):
+        security_header_type = data[1] & 0x0f
+        if security_header_type not in _INTEGRITY_PROTECTED:
+            raise ValueError("Ciphered message [security header type:%d]" %
+                    security_header_type)
+        # The security header starts with the EPD of the plain message
+        data = data[_SECURITY_HEADER.size:]
+        epd = data[0] if len(data) > 0 else None
+
+    if epd == OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GMM:
+        header = _5GMM_HEADER
+    elif epd == OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GSM:
+        header = _5GSM_HEADER
+    else:
+        raise ValueError("Unknown EPD [%s]" % epd)
+    if len(data) < header.size:
+        raise ValueError("No header [len:%d]" % len(data))
+    message_type = header.unpack_from(data)[-1]
+    # A message type of the other EPD is unknown too
+    message = MESSAGES.get((epd, message_type))
+    if message is None:
+        raise ValueError("Unknown message type [EPD:0x%x type:0x%x]" %
+                (epd, message_type))
+    (_, mandatory, optional) = message
+
+    ies = {}
+    offset = header.size
+    for (name, format, size) in mandatory:
+        (start, offset) = _value(data, offset, format, size)
+        if names is None or name in names:
+            ies[name] = data[start:offset]
+
+    presencemask = 0
+    while offset < len(data):
+        type = data[offset]
+        if type >= 0x80:
+            type &= 0xf0
+        ie = optional.get(type)
+        if ie is None:
+            # Skipped octet by octet, as ogs_nas_5gmm_decode() does
+            offset += 1
+            continue
+        (bit, name, format, size, half) = ie
+        if half is False:
+            offset += 1
+        (start, offset) = _value(data, offset, format, size)
+        presencemask |= 1 << bit
+        if names is None or name in names:
+            ies[name] = data[start:offset]
+
+    return (message_type, presencemask, ies)
+
+def decode(data):
+    """Decode the message 'data' into (message type, presence mask, IEs)
+
+    The IEs are a dict of the value octets by name. The plain message of an
+    integrity protected 5GMM message is decoded. Raises ValueError if the
+    message is malformed or ciphered."""
+    return _decode(data, None)
+
+def decode_batch(messages, names=()):
+    """Decode the list of messages 'messages' into columns
+
+    Returns a dict of lists with an entry per message: "message_type",
+    "presencemask" and the value octets of each IE in 'names'. An entry is
+    None if the message could not be decoded or has no such IE."""
+    wanted = frozenset(names)
+    message_types = []
+    presencemasks = []
+    columns = [[] for name in names]
+    for data in messages:
+        try:
+            (message_type, presencemask, ies) = _decode(data, wanted)
+        except ValueError:
+            (message_type, presencemask, ies) = (None, None, {})
+        message_types.append(message_type)
+        presencemasks.append(presencemask)
+        for (name, column) in zip(names, columns):
+            column.append(ies.get(name))
+
+    result = { "message_type": message_types, "presencemask": presencemasks }
+    result.update(zip(names, columns))
+    return result
@@ -0,0 +1,66 @@
+import unittest
+
+import ogs_nas_5gs
+
+# Registration Request of tests/unit/nas-5gs-message-test.c
+REGISTRATION_REQUEST = bytes.fromhex(
+        "7e004179000d0100f110000000000000"
+        "0000102e04f0f0f0f0c12f0201014002"
+        "00207100037e0041")
+# PDU Session Establishment Request
+PDU_SESSION_ESTABLISHMENT_REQUEST = bytes.fromhex("2e0101c1ffff91a1")
+
+def protected(security_header_type, message):
+    """'message' after a security header of the type"""
+    return bytes([0x7e, security_header_type, 0xaa, 0xbb, 0xcc, 0xdd, 0x01]) + \
+            message
+
+class TestOgsNas5gs(unittest.TestCase):
+    def test_plain(self):
+        (message_type, presencemask, ies) = ogs_nas_5gs.decode(
+                REGISTRATION_REQUEST)
+        self.assertEqual(message_type, 0x41)
+        self.assertEqual(ies["registration_type"], b"\x79")
+        self.assertEqual(ies["ue_security_capability"], b"\xf0\xf0\xf0\xf0")
+        self.assertEqual(ies["nas_message_container"], b"\x7e\x00\x41")
+        self.assertNotEqual(presencemask, 0)
+
+    def test_integrity_protected(self):
+        for security_header_type in (1, 3):
+            self.assertEqual(
+                    ogs_nas_5gs.decode(
+                        protected(security_header_type, REGISTRATION_REQUEST)),
+                    ogs_nas_5gs.decode(REGISTRATION_REQUEST))
+
+    def test_ciphered(self):
+        for security_header_type in (2, 4):
+            with self.assertRaises(ValueError):
+                ogs_nas_5gs.decode(
+                        protected(security_header_type, REGISTRATION_REQUEST))
+
+    def test_epd_mismatch(self):
+        # The message type of a PDU Session Establishment Request
+        with self.assertRaises(ValueError):
+            ogs_nas_5gs.decode(bytes.fromhex("7e00c1ffff91a1"))
+        # The message type of a Registration Request
+        with self.assertRaises(ValueError):
+            ogs_nas_5gs.decode(bytes.fromhex("2e0101417900"))
+
+    def test_decode_batch(self):
+        columns = ogs_nas_5gs.decode_batch([
+                REGISTRATION_REQUEST,
+                protected(1, REGISTRATION_REQUEST),
+                protected(2, REGISTRATION_REQUEST),
+                b"",
+                PDU_SESSION_ESTABLISHMENT_REQUEST],
+            ["nas_message_container"])
+        self.assertEqual(columns["message_type"],
+                [0x41, 0x41, None, None, 0xc1])
+        self.assertEqual(columns["nas_message_container"],
+                [b"\x7e\x00\x41", b"\x7e\x00\x41", None, None, None])
+        self.assertEqual(columns["presencemask"][0],
+                columns["presencemask"][1])
+        self.assertIsNone(columns["presencemask"][2])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -41,6 +41,9 @@ type_list["DNN"]["encode"] = \
 "    target.length = ogs_fqdn_build(target.value, dnn->value, dnn->length);\n" \
 "    size = target.length + sizeof(target.length);\n\n"
 
+# ogs_fqdn_build() adds the length octet of the first label
+type_list["DNN"]["encoded_size"] = "%s.length + sizeof(%s.length) + 1"
+
 type_list["Session-AMBR"]["decode"] = \
 "    session_ambr->downlink.value = be16toh(source->downlink.value);\n" \
 "    session_ambr->uplink.value = be16toh(source->uplink.value);\n\n"
@@ -65,3 +68,7 @@ type_list["PDU session reactivation result"]["decode"] = \
 "    pdu_session_reactivation_result->psi = be16toh(pdu_session_reactivation_result->psi);\n\n"
 type_list["PDU session reactivation result"]["encode"] = \
 "    target.psi = htobe16(pdu_session_reactivation_result->psi);\n\n"
+
+# The value of a borrowed IE stays in the pkbuf it was decoded from:
+# its type is { length; void *buffer; } like the LV-E/TLV-E ones.
+type_list["SM PDU DN request container"]["borrow"] = True
@@ -1072,10 +1072,9 @@ int ogs_nas_parse_qos_rules(
 
 /* 9.11.4.15 SM PDU DN request container
  * O TLV 3-255 */
-#define OGS_NAX_MAX_SM_PDU_DN_REQUESTER_CONTAINER 255
 typedef struct ogs_nas_sm_pdu_dn_request_container_s {
     uint8_t length;
-    uint8_t buffer[OGS_NAX_MAX_SM_PDU_DN_REQUESTER_CONTAINER];
+    void *buffer;
 } ogs_nas_sm_pdu_dn_request_container_t;
 
 /* 9.11.4.16 SSC mode
@@ -39,6 +39,24 @@ extern int __ogs_nas_domain;
 #undef OGS_LOG_DOMAIN
 #define OGS_LOG_DOMAIN __ogs_nas_domain
 
+/*
+ * Trace of each IE in the codecs generated by nas-message.py.
+ * The hexdump is formatted before the log level is looked at,
+ * so the level is checked here first. OGS_NAS_NO_TRACE, set for
+ * release builds, removes the trace altogether.
+ */
+#if defined(OGS_NAS_NO_TRACE)
+#define ogs_nas_trace_ie(name, data, len) do { } while (0)
+#else
+#define ogs_nas_trace_ie(name, data, len) \
+    do { \
+        if (ogs_log_get_domain_level(OGS_LOG_DOMAIN) >= OGS_LOG_TRACE) { \
+            ogs_trace("  %s - ", name); \
+            ogs_log_hexdump(OGS_LOG_TRACE, data, len); \
+        } \
+    } while (0)
+#endif
+
 #ifdef __cplusplus
 }
 #endif
@@ -28,8 +28,8 @@
 /*******************************************************************************
  * This file had been created by nas-message.py script v0.1.0
  * Please do not modify this file but regenerate it via script.
- * Created on: 2024-01-21 18:50:03.417367 by acetcom
- * from 24301-h90.docx
+ * Created from 24301-h90.docx
+ * (sha256: 1acc20b2dabf84bff1965c46a7d926753c0e7fde48d8126faa12e06d66167125)
  ******************************************************************************/
 
 #include "ogs-nas-eps.h"
@@ -86,59 +86,55 @@ int ogs_nas_eps_decode_esm_status(ogs_nas_eps_message_t *message, ogs_pkbuf_t *p
 int ogs_nas_eps_decode_attach_request(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_attach_request_t *attach_request = &message->emm.attach_request;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode ATTACH_REQUEST\n");
 
-    size = ogs_nas_eps_decode_eps_attach_type(&attach_request->eps_attach_type, pkbuf);
+    size = ogs_nas_eps_read_eps_attach_type(&attach_request->eps_attach_type, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_eps_attach_type() failed");
+        ogs_error("ogs_nas_eps_read_eps_attach_type() failed");
         return size;
     }
 
     decoded += size;
 
-    size = ogs_nas_eps_decode_eps_mobile_identity(&attach_request->eps_mobile_identity, pkbuf);
+    size = ogs_nas_eps_read_eps_mobile_identity(&attach_request->eps_mobile_identity, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_eps_mobile_identity() failed");
+        ogs_error("ogs_nas_eps_read_eps_mobile_identity() failed");
         return size;
     }
 
     decoded += size;
 
-    size = ogs_nas_eps_decode_ue_network_capability(&attach_request->ue_network_capability, pkbuf);
+    size = ogs_nas_eps_read_ue_network_capability(&attach_request->ue_network_capability, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_ue_network_capability() failed");
+        ogs_error("ogs_nas_eps_read_ue_network_capability() failed");
         return size;
     }
 
     decoded += size;
 
-    size = ogs_nas_eps_decode_esm_message_container(&attach_request->esm_message_container, pkbuf);
+    size = ogs_nas_eps_read_esm_message_container(&attach_request->esm_message_container, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_esm_message_container() failed");
+        ogs_error("ogs_nas_eps_read_esm_message_container() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch (type) {
         case OGS_NAS_EPS_ATTACH_REQUEST_OLD_P_TMSI_SIGNATURE_TYPE:
-            size = ogs_nas_eps_decode_p_tmsi_signature(&attach_request->old_p_tmsi_signature, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_p_tmsi_signature(&attach_request->old_p_tmsi_signature, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_p_tmsi_signature() failed");
+               ogs_error("ogs_nas_eps_read_p_tmsi_signature() failed");
                return size;
             }
 
@@ -146,9 +142,10 @@ int ogs_nas_eps_decode_attach_request(ogs_nas_eps_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_REQUEST_ADDITIONAL_GUTI_TYPE:
-            size = ogs_nas_eps_decode_eps_mobile_identity(&attach_request->additional_guti, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_eps_mobile_identity(&attach_request->additional_guti, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_eps_mobile_identity() failed");
+               ogs_error("ogs_nas_eps_read_eps_mobile_identity() failed");
                return size;
             }
 
@@ -156,9 +153,10 @@ int ogs_nas_eps_decode_attach_request(ogs_nas_eps_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_REQUEST_LAST_VISITED_REGISTERED_TAI_TYPE:
-            size = ogs_nas_eps_decode_tracking_area_identity(&attach_request->last_visited_registered_tai, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_tracking_area_identity(&attach_request->last_visited_registered_tai, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_tracking_area_identity() failed");
+               ogs_error("ogs_nas_eps_read_tracking_area_identity() failed");
                return size;
             }
 
@@ -166,9 +164,10 @@ int ogs_nas_eps_decode_attach_request(ogs_nas_eps_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_REQUEST_DRX_PARAMETER_TYPE:
-            size = ogs_nas_eps_decode_drx_parameter(&attach_request->drx_parameter, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_drx_parameter(&attach_request->drx_parameter, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_drx_parameter() failed");
+               ogs_error("ogs_nas_eps_read_drx_parameter() failed");
                return size;
             }
 
@@ -176,9 +175,10 @@ int ogs_nas_eps_decode_attach_request(ogs_nas_eps_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_REQUEST_MS_NETWORK_CAPABILITY_TYPE:
-            size = ogs_nas_eps_decode_ms_network_capability(&attach_request->ms_network_capability, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_ms_network_capability(&attach_request->ms_network_capability, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_ms_network_capability() failed");
+               ogs_error("ogs_nas_eps_read_ms_network_capability() failed");
                return size;
             }
 
@@ -186,9 +186,10 @@ int ogs_nas_eps_decode_attach_request(ogs_nas_eps_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_REQUEST_OLD_LOCATION_AREA_IDENTIFICATION_TYPE:
-            size = ogs_nas_eps_decode_location_area_identification(&attach_request->old_location_area_identification, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_location_area_identification(&attach_request->old_location_area_identification, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_location_area_identification() failed");
+               ogs_error("ogs_nas_eps_read_location_area_identification() failed");
                return size;
             }
 
@@ -196,11 +197,9 @@ int ogs_nas_eps_decode_attach_request(ogs_nas_eps_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_REQUEST_TMSI_STATUS_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_tmsi_status(&attach_request->tmsi_status, pkbuf);
+            size = ogs_nas_eps_read_tmsi_status(&attach_request->tmsi_status, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_tmsi_status() failed");
+               ogs_error("ogs_nas_eps_read_tmsi_status() failed");
                return size;
             }
 
@@ -208,9 +207,10 @@ int ogs_nas_eps_decode_attach_request(ogs_nas_eps_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_REQUEST_MOBILE_STATION_CLASSMARK_2_TYPE:
-            size = ogs_nas_eps_decode_mobile_station_classmark_2(&attach_request->mobile_station_classmark_2, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_mobile_station_classmark_2(&attach_request->mobile_station_classmark_2, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_mobile_station_classmark_2() failed");
+               ogs_error("ogs_nas_eps_read_mobile_station_classmark_2() failed");
                return size;
             }
 
@@ -218,9 +218,10 @@ int ogs_nas_eps_decode_attach_request(ogs_nas_eps_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_REQUEST_MOBILE_STATION_CLASSMARK_3_TYPE:
-            size = ogs_nas_eps_decode_mobile_station_classmark_3(&attach_request->mobile_station_classmark_3, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_mobile_station_classmark_3(&attach_request->mobile_station_classmark_3, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_mobile_station_classmark_3() failed");
+               ogs_error("ogs_nas_eps_read_mobile_station_classmark_3() failed");
                return size;
             }
 
@@ -228,9 +229,10 @@ int ogs_nas_eps_decode_attach_request(ogs_nas_eps_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_REQUEST_SUPPORTED_CODECS_TYPE:
-            size = ogs_nas_eps_decode_supported_codec_list(&attach_request->supported_codecs, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_supported_codec_list(&attach_request->supported_codecs, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_supported_codec_list() failed");
+               ogs_error("ogs_nas_eps_read_supported_codec_list() failed");
                return size;
             }
 
@@ -238,11 +240,9 @@ int ogs_nas_eps_decode_attach_request(ogs_nas_eps_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_REQUEST_ADDITIONAL_UPDATE_TYPE_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_additional_update_type(&attach_request->additional_update_type, pkbuf);
+            size = ogs_nas_eps_read_additional_update_type(&attach_request->additional_update_type, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_additional_update_type() failed");
+               ogs_error("ogs_nas_eps_read_additional_update_type() failed");
                return size;
             }
 
@@ -250,9 +250,10 @@ int ogs_nas_eps_decode_attach_request(ogs_nas_eps_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_REQUEST_VOICE_DOMAIN_PREFERENCE_AND_UE_USAGE_SETTING_TYPE:
-            size = ogs_nas_eps_decode_voice_domain_preference_and_ue_usage_setting(&attach_request->voice_domain_preference_and_ue_usage_setting, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_voice_domain_preference_and_ue_usage_setting(&attach_request->voice_domain_preference_and_ue_usage_setting, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_voice_domain_preference_and_ue_usage_setting() failed");
+               ogs_error("ogs_nas_eps_read_voice_domain_preference_and_ue_usage_setting() failed");
                return size;
             }
 
@@ -260,11 +261,9 @@ int ogs_nas_eps_decode_attach_request(ogs_nas_eps_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_REQUEST_DEVICE_PROPERTIES_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_device_properties(&attach_request->device_properties, pkbuf);
+            size = ogs_nas_eps_read_device_properties(&attach_request->device_properties, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_device_properties() failed");
+               ogs_error("ogs_nas_eps_read_device_properties() failed");
                return size;
             }
 
@@ -272,11 +271,9 @@ int ogs_nas_eps_decode_attach_request(ogs_nas_eps_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_REQUEST_OLD_GUTI_TYPE_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_guti_type(&attach_request->old_guti_type, pkbuf);
+            size = ogs_nas_eps_read_guti_type(&attach_request->old_guti_type, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_guti_type() failed");
+               ogs_error("ogs_nas_eps_read_guti_type() failed");
                return size;
             }
 
@@ -284,11 +281,9 @@ int ogs_nas_eps_decode_attach_request(ogs_nas_eps_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_REQUEST_MS_NETWORK_FEATURE_SUPPORT_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_ms_network_feature_support(&attach_request->ms_network_feature_support, pkbuf);
+            size = ogs_nas_eps_read_ms_network_feature_support(&attach_request->ms_network_feature_support, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_ms_network_feature_support() failed");
+               ogs_error("ogs_nas_eps_read_ms_network_feature_support() failed");
                return size;
             }
 
@@ -296,9 +291,10 @@ int ogs_nas_eps_decode_attach_request(ogs_nas_eps_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_REQUEST_TMSI_BASED_NRI_CONTAINER_TYPE:
-            size = ogs_nas_eps_decode_network_resource_identifier_container(&attach_request->tmsi_based_nri_container, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_network_resource_identifier_container(&attach_request->tmsi_based_nri_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_network_resource_identifier_container() failed");
+               ogs_error("ogs_nas_eps_read_network_resource_identifier_container() failed");
                return size;
             }
 
@@ -306,9 +302,10 @@ int ogs_nas_eps_decode_attach_request(ogs_nas_eps_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_REQUEST_T3324_VALUE_TYPE:
-            size = ogs_nas_eps_decode_gprs_timer_2(&attach_request->t3324_value, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_gprs_timer_2(&attach_request->t3324_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_gprs_timer_2() failed");
+               ogs_error("ogs_nas_eps_read_gprs_timer_2() failed");
                return size;
             }
 
@@ -316,9 +313,10 @@ int ogs_nas_eps_decode_attach_request(ogs_nas_eps_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_REQUEST_T3412_EXTENDED_VALUE_TYPE:
-            size = ogs_nas_eps_decode_gprs_timer_3(&attach_request->t3412_extended_value, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_gprs_timer_3(&attach_request->t3412_extended_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_gprs_timer_3() failed");
+               ogs_error("ogs_nas_eps_read_gprs_timer_3() failed");
                return size;
             }
 
@@ -326,9 +324,10 @@ int ogs_nas_eps_decode_attach_request(ogs_nas_eps_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_REQUEST_EXTENDED_DRX_PARAMETERS_TYPE:
-            size = ogs_nas_eps_decode_extended_drx_parameters(&attach_request->extended_drx_parameters, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_extended_drx_parameters(&attach_request->extended_drx_parameters, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_extended_drx_parameters() failed");
+               ogs_error("ogs_nas_eps_read_extended_drx_parameters() failed");
                return size;
             }
 
@@ -336,9 +335,10 @@ int ogs_nas_eps_decode_attach_request(ogs_nas_eps_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_REQUEST_UE_ADDITIONAL_SECURITY_CAPABILITY_TYPE:
-            size = ogs_nas_eps_decode_ue_additional_security_capability(&attach_request->ue_additional_security_capability, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_ue_additional_security_capability(&attach_request->ue_additional_security_capability, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_ue_additional_security_capability() failed");
+               ogs_error("ogs_nas_eps_read_ue_additional_security_capability() failed");
                return size;
             }
 
@@ -346,9 +346,10 @@ int ogs_nas_eps_decode_attach_request(ogs_nas_eps_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_REQUEST_UE_STATUS_TYPE:
-            size = ogs_nas_eps_decode_ue_status(&attach_request->ue_status, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_ue_status(&attach_request->ue_status, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_ue_status() failed");
+               ogs_error("ogs_nas_eps_read_ue_status() failed");
                return size;
             }
 
@@ -356,9 +357,10 @@ int ogs_nas_eps_decode_attach_request(ogs_nas_eps_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_REQUEST_ADDITIONAL_INFORMATION_REQUESTED_TYPE:
-            size = ogs_nas_eps_decode_additional_information_requested(&attach_request->additional_information_requested, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_additional_information_requested(&attach_request->additional_information_requested, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_additional_information_requested() failed");
+               ogs_error("ogs_nas_eps_read_additional_information_requested() failed");
                return size;
             }
 
@@ -366,9 +368,10 @@ int ogs_nas_eps_decode_attach_request(ogs_nas_eps_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_REQUEST_N1_UE_NETWORK_CAPABILITY_TYPE:
-            size = ogs_nas_eps_decode_n1_ue_network_capability(&attach_request->n1_ue_network_capability, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_n1_ue_network_capability(&attach_request->n1_ue_network_capability, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_n1_ue_network_capability() failed");
+               ogs_error("ogs_nas_eps_read_n1_ue_network_capability() failed");
                return size;
             }
 
@@ -376,9 +379,10 @@ int ogs_nas_eps_decode_attach_request(ogs_nas_eps_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_REQUEST_UE_RADIO_CAPABILITY_ID_AVAILABILITY_TYPE:
-            size = ogs_nas_eps_decode_ue_radio_capability_id_availability(&attach_request->ue_radio_capability_id_availability, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_ue_radio_capability_id_availability(&attach_request->ue_radio_capability_id_availability, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_ue_radio_capability_id_availability() failed");
+               ogs_error("ogs_nas_eps_read_ue_radio_capability_id_availability() failed");
                return size;
             }
 
@@ -386,9 +390,10 @@ int ogs_nas_eps_decode_attach_request(ogs_nas_eps_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_REQUEST_REQUESTED_WUS_ASSISTANCE_INFORMATION_TYPE:
-            size = ogs_nas_eps_decode_wus_assistance_information(&attach_request->requested_wus_assistance_information, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_wus_assistance_information(&attach_request->requested_wus_assistance_information, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_wus_assistance_information() failed");
+               ogs_error("ogs_nas_eps_read_wus_assistance_information() failed");
                return size;
             }
 
@@ -396,9 +401,10 @@ int ogs_nas_eps_decode_attach_request(ogs_nas_eps_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_REQUEST_DRX_PARAMETER_IN_NB_S1_MODE_TYPE:
-            size = ogs_nas_eps_decode_nb_s1_drx_parameter(&attach_request->drx_parameter_in_nb_s1_mode, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_nb_s1_drx_parameter(&attach_request->drx_parameter_in_nb_s1_mode, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_nb_s1_drx_parameter() failed");
+               ogs_error("ogs_nas_eps_read_nb_s1_drx_parameter() failed");
                return size;
             }
 
@@ -406,9 +412,10 @@ int ogs_nas_eps_decode_attach_request(ogs_nas_eps_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_REQUEST_REQUESTED_IMSI_OFFSET_TYPE:
-            size = ogs_nas_eps_decode_imsi_offset(&attach_request->requested_imsi_offset, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_imsi_offset(&attach_request->requested_imsi_offset, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_imsi_offset() failed");
+               ogs_error("ogs_nas_eps_read_imsi_offset() failed");
                return size;
             }
 
@@ -417,69 +424,68 @@ int ogs_nas_eps_decode_attach_request(ogs_nas_eps_message_t *message, ogs_pkbuf_
             break;
         default:
             ogs_warn("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_attach_accept(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_attach_accept_t *attach_accept = &message->emm.attach_accept;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode ATTACH_ACCEPT\n");
 
-    size = ogs_nas_eps_decode_eps_attach_result(&attach_accept->eps_attach_result, pkbuf);
+    size = ogs_nas_eps_read_eps_attach_result(&attach_accept->eps_attach_result, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_eps_attach_result() failed");
+        ogs_error("ogs_nas_eps_read_eps_attach_result() failed");
         return size;
     }
 
     decoded += size;
 
-    size = ogs_nas_eps_decode_gprs_timer(&attach_accept->t3412_value, pkbuf);
+    size = ogs_nas_eps_read_gprs_timer(&attach_accept->t3412_value, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_gprs_timer() failed");
+        ogs_error("ogs_nas_eps_read_gprs_timer() failed");
         return size;
     }
 
     decoded += size;
 
-    size = ogs_nas_eps_decode_tracking_area_identity_list(&attach_accept->tai_list, pkbuf);
+    size = ogs_nas_eps_read_tracking_area_identity_list(&attach_accept->tai_list, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_tracking_area_identity_list() failed");
+        ogs_error("ogs_nas_eps_read_tracking_area_identity_list() failed");
         return size;
     }
 
     decoded += size;
 
-    size = ogs_nas_eps_decode_esm_message_container(&attach_accept->esm_message_container, pkbuf);
+    size = ogs_nas_eps_read_esm_message_container(&attach_accept->esm_message_container, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_esm_message_container() failed");
+        ogs_error("ogs_nas_eps_read_esm_message_container() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch (type) {
         case OGS_NAS_EPS_ATTACH_ACCEPT_GUTI_TYPE:
-            size = ogs_nas_eps_decode_eps_mobile_identity(&attach_accept->guti, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_eps_mobile_identity(&attach_accept->guti, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_eps_mobile_identity() failed");
+               ogs_error("ogs_nas_eps_read_eps_mobile_identity() failed");
                return size;
             }
 
@@ -487,9 +493,10 @@ int ogs_nas_eps_decode_attach_accept(ogs_nas_eps_message_t *message, ogs_pkbuf_t
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_ACCEPT_LOCATION_AREA_IDENTIFICATION_TYPE:
-            size = ogs_nas_eps_decode_location_area_identification(&attach_accept->location_area_identification, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_location_area_identification(&attach_accept->location_area_identification, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_location_area_identification() failed");
+               ogs_error("ogs_nas_eps_read_location_area_identification() failed");
                return size;
             }
 
@@ -497,9 +504,10 @@ int ogs_nas_eps_decode_attach_accept(ogs_nas_eps_message_t *message, ogs_pkbuf_t
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_ACCEPT_MS_IDENTITY_TYPE:
-            size = ogs_nas_eps_decode_mobile_identity(&attach_accept->ms_identity, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_mobile_identity(&attach_accept->ms_identity, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_mobile_identity() failed");
+               ogs_error("ogs_nas_eps_read_mobile_identity() failed");
                return size;
             }
 
@@ -507,9 +515,10 @@ int ogs_nas_eps_decode_attach_accept(ogs_nas_eps_message_t *message, ogs_pkbuf_t
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_ACCEPT_EMM_CAUSE_TYPE:
-            size = ogs_nas_eps_decode_emm_cause(&attach_accept->emm_cause, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_emm_cause(&attach_accept->emm_cause, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_emm_cause() failed");
+               ogs_error("ogs_nas_eps_read_emm_cause() failed");
                return size;
             }
 
@@ -517,9 +526,10 @@ int ogs_nas_eps_decode_attach_accept(ogs_nas_eps_message_t *message, ogs_pkbuf_t
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_ACCEPT_T3402_VALUE_TYPE:
-            size = ogs_nas_eps_decode_gprs_timer(&attach_accept->t3402_value, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_gprs_timer(&attach_accept->t3402_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_gprs_timer() failed");
+               ogs_error("ogs_nas_eps_read_gprs_timer() failed");
                return size;
             }
 
@@ -527,9 +537,10 @@ int ogs_nas_eps_decode_attach_accept(ogs_nas_eps_message_t *message, ogs_pkbuf_t
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_ACCEPT_T3423_VALUE_TYPE:
-            size = ogs_nas_eps_decode_gprs_timer(&attach_accept->t3423_value, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_gprs_timer(&attach_accept->t3423_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_gprs_timer() failed");
+               ogs_error("ogs_nas_eps_read_gprs_timer() failed");
                return size;
             }
 
@@ -537,9 +548,10 @@ int ogs_nas_eps_decode_attach_accept(ogs_nas_eps_message_t *message, ogs_pkbuf_t
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_ACCEPT_EQUIVALENT_PLMNS_TYPE:
-            size = ogs_nas_eps_decode_plmn_list(&attach_accept->equivalent_plmns, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_plmn_list(&attach_accept->equivalent_plmns, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_plmn_list() failed");
+               ogs_error("ogs_nas_eps_read_plmn_list() failed");
                return size;
             }
 
@@ -547,9 +559,10 @@ int ogs_nas_eps_decode_attach_accept(ogs_nas_eps_message_t *message, ogs_pkbuf_t
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_ACCEPT_EMERGENCY_NUMBER_LIST_TYPE:
-            size = ogs_nas_eps_decode_emergency_number_list(&attach_accept->emergency_number_list, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_emergency_number_list(&attach_accept->emergency_number_list, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_emergency_number_list() failed");
+               ogs_error("ogs_nas_eps_read_emergency_number_list() failed");
                return size;
             }
 
@@ -557,9 +570,10 @@ int ogs_nas_eps_decode_attach_accept(ogs_nas_eps_message_t *message, ogs_pkbuf_t
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_ACCEPT_EPS_NETWORK_FEATURE_SUPPORT_TYPE:
-            size = ogs_nas_eps_decode_eps_network_feature_support(&attach_accept->eps_network_feature_support, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_eps_network_feature_support(&attach_accept->eps_network_feature_support, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_eps_network_feature_support() failed");
+               ogs_error("ogs_nas_eps_read_eps_network_feature_support() failed");
                return size;
             }
 
@@ -567,11 +581,9 @@ int ogs_nas_eps_decode_attach_accept(ogs_nas_eps_message_t *message, ogs_pkbuf_t
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_ACCEPT_ADDITIONAL_UPDATE_RESULT_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_additional_update_result(&attach_accept->additional_update_result, pkbuf);
+            size = ogs_nas_eps_read_additional_update_result(&attach_accept->additional_update_result, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_additional_update_result() failed");
+               ogs_error("ogs_nas_eps_read_additional_update_result() failed");
                return size;
             }
 
@@ -579,9 +591,10 @@ int ogs_nas_eps_decode_attach_accept(ogs_nas_eps_message_t *message, ogs_pkbuf_t
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_ACCEPT_T3412_EXTENDED_VALUE_TYPE:
-            size = ogs_nas_eps_decode_gprs_timer_3(&attach_accept->t3412_extended_value, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_gprs_timer_3(&attach_accept->t3412_extended_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_gprs_timer_3() failed");
+               ogs_error("ogs_nas_eps_read_gprs_timer_3() failed");
                return size;
             }
 
@@ -589,9 +602,10 @@ int ogs_nas_eps_decode_attach_accept(ogs_nas_eps_message_t *message, ogs_pkbuf_t
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_ACCEPT_T3324_VALUE_TYPE:
-            size = ogs_nas_eps_decode_gprs_timer_2(&attach_accept->t3324_value, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_gprs_timer_2(&attach_accept->t3324_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_gprs_timer_2() failed");
+               ogs_error("ogs_nas_eps_read_gprs_timer_2() failed");
                return size;
             }
 
@@ -599,9 +613,10 @@ int ogs_nas_eps_decode_attach_accept(ogs_nas_eps_message_t *message, ogs_pkbuf_t
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_ACCEPT_EXTENDED_DRX_PARAMETERS_TYPE:
-            size = ogs_nas_eps_decode_extended_drx_parameters(&attach_accept->extended_drx_parameters, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_extended_drx_parameters(&attach_accept->extended_drx_parameters, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_extended_drx_parameters() failed");
+               ogs_error("ogs_nas_eps_read_extended_drx_parameters() failed");
                return size;
             }
 
@@ -609,9 +624,10 @@ int ogs_nas_eps_decode_attach_accept(ogs_nas_eps_message_t *message, ogs_pkbuf_t
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_ACCEPT_DCN_ID_TYPE:
-            size = ogs_nas_eps_decode_dcn_id(&attach_accept->dcn_id, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_dcn_id(&attach_accept->dcn_id, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_dcn_id() failed");
+               ogs_error("ogs_nas_eps_read_dcn_id() failed");
                return size;
             }
 
@@ -619,11 +635,9 @@ int ogs_nas_eps_decode_attach_accept(ogs_nas_eps_message_t *message, ogs_pkbuf_t
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_ACCEPT_SMS_SERVICES_STATUS_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_sms_services_status(&attach_accept->sms_services_status, pkbuf);
+            size = ogs_nas_eps_read_sms_services_status(&attach_accept->sms_services_status, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_sms_services_status() failed");
+               ogs_error("ogs_nas_eps_read_sms_services_status() failed");
                return size;
             }
 
@@ -631,11 +645,9 @@ int ogs_nas_eps_decode_attach_accept(ogs_nas_eps_message_t *message, ogs_pkbuf_t
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_ACCEPT_NON__NW_PROVIDED_POLICIES_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_non__nw_provided_policies(&attach_accept->non__nw_provided_policies, pkbuf);
+            size = ogs_nas_eps_read_non__nw_provided_policies(&attach_accept->non__nw_provided_policies, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_non__nw_provided_policies() failed");
+               ogs_error("ogs_nas_eps_read_non__nw_provided_policies() failed");
                return size;
             }
 
@@ -643,9 +655,10 @@ int ogs_nas_eps_decode_attach_accept(ogs_nas_eps_message_t *message, ogs_pkbuf_t
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_ACCEPT_T3448_VALUE_TYPE:
-            size = ogs_nas_eps_decode_gprs_timer_2(&attach_accept->t3448_value, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_gprs_timer_2(&attach_accept->t3448_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_gprs_timer_2() failed");
+               ogs_error("ogs_nas_eps_read_gprs_timer_2() failed");
                return size;
             }
 
@@ -653,11 +666,9 @@ int ogs_nas_eps_decode_attach_accept(ogs_nas_eps_message_t *message, ogs_pkbuf_t
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_ACCEPT_NETWORK_POLICY_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_network_policy(&attach_accept->network_policy, pkbuf);
+            size = ogs_nas_eps_read_network_policy(&attach_accept->network_policy, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_network_policy() failed");
+               ogs_error("ogs_nas_eps_read_network_policy() failed");
                return size;
             }
 
@@ -665,9 +676,10 @@ int ogs_nas_eps_decode_attach_accept(ogs_nas_eps_message_t *message, ogs_pkbuf_t
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_ACCEPT_T3447_VALUE_TYPE:
-            size = ogs_nas_eps_decode_gprs_timer_3(&attach_accept->t3447_value, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_gprs_timer_3(&attach_accept->t3447_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_gprs_timer_3() failed");
+               ogs_error("ogs_nas_eps_read_gprs_timer_3() failed");
                return size;
             }
 
@@ -675,9 +687,10 @@ int ogs_nas_eps_decode_attach_accept(ogs_nas_eps_message_t *message, ogs_pkbuf_t
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_ACCEPT_EXTENDED_EMERGENCY_NUMBER_LIST_TYPE:
-            size = ogs_nas_eps_decode_extended_emergency_number_list(&attach_accept->extended_emergency_number_list, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_extended_emergency_number_list(&attach_accept->extended_emergency_number_list, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_extended_emergency_number_list() failed");
+               ogs_error("ogs_nas_eps_read_extended_emergency_number_list() failed");
                return size;
             }
 
@@ -685,9 +698,10 @@ int ogs_nas_eps_decode_attach_accept(ogs_nas_eps_message_t *message, ogs_pkbuf_t
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_ACCEPT_CIPHERING_KEY_DATA_TYPE:
-            size = ogs_nas_eps_decode_ciphering_key_data(&attach_accept->ciphering_key_data, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_ciphering_key_data(&attach_accept->ciphering_key_data, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_ciphering_key_data() failed");
+               ogs_error("ogs_nas_eps_read_ciphering_key_data() failed");
                return size;
             }
 
@@ -695,9 +709,10 @@ int ogs_nas_eps_decode_attach_accept(ogs_nas_eps_message_t *message, ogs_pkbuf_t
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_ACCEPT_UE_RADIO_CAPABILITY_ID_TYPE:
-            size = ogs_nas_eps_decode_ue_radio_capability_id(&attach_accept->ue_radio_capability_id, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_ue_radio_capability_id(&attach_accept->ue_radio_capability_id, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_ue_radio_capability_id() failed");
+               ogs_error("ogs_nas_eps_read_ue_radio_capability_id() failed");
                return size;
             }
 
@@ -705,11 +720,9 @@ int ogs_nas_eps_decode_attach_accept(ogs_nas_eps_message_t *message, ogs_pkbuf_t
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_ACCEPT_UE_RADIO_CAPABILITY_ID_DELETION_INDICATION_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_ue_radio_capability_id_deletion_indication(&attach_accept->ue_radio_capability_id_deletion_indication, pkbuf);
+            size = ogs_nas_eps_read_ue_radio_capability_id_deletion_indication(&attach_accept->ue_radio_capability_id_deletion_indication, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_ue_radio_capability_id_deletion_indication() failed");
+               ogs_error("ogs_nas_eps_read_ue_radio_capability_id_deletion_indication() failed");
                return size;
             }
 
@@ -717,9 +730,10 @@ int ogs_nas_eps_decode_attach_accept(ogs_nas_eps_message_t *message, ogs_pkbuf_t
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_ACCEPT_NEGOTIATED_WUS_ASSISTANCE_INFORMATION_TYPE:
-            size = ogs_nas_eps_decode_wus_assistance_information(&attach_accept->negotiated_wus_assistance_information, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_wus_assistance_information(&attach_accept->negotiated_wus_assistance_information, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_wus_assistance_information() failed");
+               ogs_error("ogs_nas_eps_read_wus_assistance_information() failed");
                return size;
             }
 
@@ -727,9 +741,10 @@ int ogs_nas_eps_decode_attach_accept(ogs_nas_eps_message_t *message, ogs_pkbuf_t
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_ACCEPT_NEGOTIATED_DRX_PARAMETER_IN_NB_S1_MODE_TYPE:
-            size = ogs_nas_eps_decode_nb_s1_drx_parameter(&attach_accept->negotiated_drx_parameter_in_nb_s1_mode, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_nb_s1_drx_parameter(&attach_accept->negotiated_drx_parameter_in_nb_s1_mode, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_nb_s1_drx_parameter() failed");
+               ogs_error("ogs_nas_eps_read_nb_s1_drx_parameter() failed");
                return size;
             }
 
@@ -737,9 +752,10 @@ int ogs_nas_eps_decode_attach_accept(ogs_nas_eps_message_t *message, ogs_pkbuf_t
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_ACCEPT_NEGOTIATED_IMSI_OFFSET_TYPE:
-            size = ogs_nas_eps_decode_imsi_offset(&attach_accept->negotiated_imsi_offset, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_imsi_offset(&attach_accept->negotiated_imsi_offset, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_imsi_offset() failed");
+               ogs_error("ogs_nas_eps_read_imsi_offset() failed");
                return size;
             }
 
@@ -747,9 +763,10 @@ int ogs_nas_eps_decode_attach_accept(ogs_nas_eps_message_t *message, ogs_pkbuf_t
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_ACCEPT_FORBIDDEN_TAI_FOR_THE_LIST_OF_FORBIDDEN_TRACKING_AREAS_FOR_ROAMING_TYPE:
-            size = ogs_nas_eps_decode_tracking_area_identity_list(&attach_accept->forbidden_tai_for_the_list_of_forbidden_tracking_areas_for_roaming, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_tracking_area_identity_list(&attach_accept->forbidden_tai_for_the_list_of_forbidden_tracking_areas_for_roaming, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_tracking_area_identity_list() failed");
+               ogs_error("ogs_nas_eps_read_tracking_area_identity_list() failed");
                return size;
             }
 
@@ -757,9 +774,10 @@ int ogs_nas_eps_decode_attach_accept(ogs_nas_eps_message_t *message, ogs_pkbuf_t
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_ACCEPT_FORBIDDEN_TAI_FOR_THE_LIST_OF_FORBIDDEN_TRACKING_AREAS_FORREGIONAL_PROVISION_OF_SERVICE_TYPE:
-            size = ogs_nas_eps_decode_tracking_area_identity_list(&attach_accept->forbidden_tai_for_the_list_of_forbidden_tracking_areas_forregional_provision_of_service, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_tracking_area_identity_list(&attach_accept->forbidden_tai_for_the_list_of_forbidden_tracking_areas_forregional_provision_of_service, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_tracking_area_identity_list() failed");
+               ogs_error("ogs_nas_eps_read_tracking_area_identity_list() failed");
                return size;
             }
 
@@ -768,64 +786,67 @@ int ogs_nas_eps_decode_attach_accept(ogs_nas_eps_message_t *message, ogs_pkbuf_t
             break;
         default:
             ogs_warn("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_attach_complete(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_attach_complete_t *attach_complete = &message->emm.attach_complete;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode ATTACH_COMPLETE\n");
 
-    size = ogs_nas_eps_decode_esm_message_container(&attach_complete->esm_message_container, pkbuf);
+    size = ogs_nas_eps_read_esm_message_container(&attach_complete->esm_message_container, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_esm_message_container() failed");
+        ogs_error("ogs_nas_eps_read_esm_message_container() failed");
         return size;
     }
 
     decoded += size;
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_attach_reject(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_attach_reject_t *attach_reject = &message->emm.attach_reject;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode ATTACH_REJECT\n");
 
-    size = ogs_nas_eps_decode_emm_cause(&attach_reject->emm_cause, pkbuf);
+    size = ogs_nas_eps_read_emm_cause(&attach_reject->emm_cause, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_emm_cause() failed");
+        ogs_error("ogs_nas_eps_read_emm_cause() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch (type) {
         case OGS_NAS_EPS_ATTACH_REJECT_ESM_MESSAGE_CONTAINER_TYPE:
-            size = ogs_nas_eps_decode_esm_message_container(&attach_reject->esm_message_container, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_esm_message_container(&attach_reject->esm_message_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_esm_message_container() failed");
+               ogs_error("ogs_nas_eps_read_esm_message_container() failed");
                return size;
             }
 
@@ -833,9 +854,10 @@ int ogs_nas_eps_decode_attach_reject(ogs_nas_eps_message_t *message, ogs_pkbuf_t
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_REJECT_T3346_VALUE_TYPE:
-            size = ogs_nas_eps_decode_gprs_timer_2(&attach_reject->t3346_value, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_gprs_timer_2(&attach_reject->t3346_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_gprs_timer_2() failed");
+               ogs_error("ogs_nas_eps_read_gprs_timer_2() failed");
                return size;
             }
 
@@ -843,9 +865,10 @@ int ogs_nas_eps_decode_attach_reject(ogs_nas_eps_message_t *message, ogs_pkbuf_t
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_REJECT_T3402_VALUE_TYPE:
-            size = ogs_nas_eps_decode_gprs_timer_2(&attach_reject->t3402_value, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_gprs_timer_2(&attach_reject->t3402_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_gprs_timer_2() failed");
+               ogs_error("ogs_nas_eps_read_gprs_timer_2() failed");
                return size;
             }
 
@@ -853,11 +876,9 @@ int ogs_nas_eps_decode_attach_reject(ogs_nas_eps_message_t *message, ogs_pkbuf_t
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_REJECT_EXTENDED_EMM_CAUSE_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_extended_emm_cause(&attach_reject->extended_emm_cause, pkbuf);
+            size = ogs_nas_eps_read_extended_emm_cause(&attach_reject->extended_emm_cause, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_extended_emm_cause() failed");
+               ogs_error("ogs_nas_eps_read_extended_emm_cause() failed");
                return size;
             }
 
@@ -865,9 +886,10 @@ int ogs_nas_eps_decode_attach_reject(ogs_nas_eps_message_t *message, ogs_pkbuf_t
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_REJECT_LOWER_BOUND_TIMER_VALUE_TYPE:
-            size = ogs_nas_eps_decode_gprs_timer_3(&attach_reject->lower_bound_timer_value, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_gprs_timer_3(&attach_reject->lower_bound_timer_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_gprs_timer_3() failed");
+               ogs_error("ogs_nas_eps_read_gprs_timer_3() failed");
                return size;
             }
 
@@ -875,9 +897,10 @@ int ogs_nas_eps_decode_attach_reject(ogs_nas_eps_message_t *message, ogs_pkbuf_t
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_REJECT_FORBIDDEN_TAI_FOR_THE_LIST_OF_FORBIDDEN_TRACKING_AREAS_FOR_ROAMING_TYPE:
-            size = ogs_nas_eps_decode_tracking_area_identity_list(&attach_reject->forbidden_tai_for_the_list_of_forbidden_tracking_areas_for_roaming, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_tracking_area_identity_list(&attach_reject->forbidden_tai_for_the_list_of_forbidden_tracking_areas_for_roaming, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_tracking_area_identity_list() failed");
+               ogs_error("ogs_nas_eps_read_tracking_area_identity_list() failed");
                return size;
             }
 
@@ -885,9 +908,10 @@ int ogs_nas_eps_decode_attach_reject(ogs_nas_eps_message_t *message, ogs_pkbuf_t
             decoded += size;
             break;
         case OGS_NAS_EPS_ATTACH_REJECT_FORBIDDEN_TAI_FOR_THE_LIST_OF_FORBIDDEN_TRACKING_AREAS_FORREGIONAL_PROVISION_OF_SERVICE_TYPE:
-            size = ogs_nas_eps_decode_tracking_area_identity_list(&attach_reject->forbidden_tai_for_the_list_of_forbidden_tracking_areas_forregional_provision_of_service, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_tracking_area_identity_list(&attach_reject->forbidden_tai_for_the_list_of_forbidden_tracking_areas_forregional_provision_of_service, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_tracking_area_identity_list() failed");
+               ogs_error("ogs_nas_eps_read_tracking_area_identity_list() failed");
                return size;
             }
 
@@ -896,72 +920,75 @@ int ogs_nas_eps_decode_attach_reject(ogs_nas_eps_message_t *message, ogs_pkbuf_t
             break;
         default:
             ogs_warn("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_detach_request_from_ue(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_detach_request_from_ue_t *detach_request_from_ue = &message->emm.detach_request_from_ue;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode DETACH_REQUEST\n");
 
-    size = ogs_nas_eps_decode_detach_type(&detach_request_from_ue->detach_type, pkbuf);
+    size = ogs_nas_eps_read_detach_type(&detach_request_from_ue->detach_type, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_detach_type() failed");
+        ogs_error("ogs_nas_eps_read_detach_type() failed");
         return size;
     }
 
     decoded += size;
 
-    size = ogs_nas_eps_decode_eps_mobile_identity(&detach_request_from_ue->eps_mobile_identity, pkbuf);
+    size = ogs_nas_eps_read_eps_mobile_identity(&detach_request_from_ue->eps_mobile_identity, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_eps_mobile_identity() failed");
+        ogs_error("ogs_nas_eps_read_eps_mobile_identity() failed");
         return size;
     }
 
     decoded += size;
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_detach_request_to_ue(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_detach_request_to_ue_t *detach_request_to_ue = &message->emm.detach_request_to_ue;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode DETACH_REQUEST\n");
 
-    size = ogs_nas_eps_decode_detach_type(&detach_request_to_ue->detach_type, pkbuf);
+    size = ogs_nas_eps_read_detach_type(&detach_request_to_ue->detach_type, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_detach_type() failed");
+        ogs_error("ogs_nas_eps_read_detach_type() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch (type) {
         case OGS_NAS_EPS_DETACH_REQUEST_EMM_CAUSE_TYPE:
-            size = ogs_nas_eps_decode_emm_cause(&detach_request_to_ue->emm_cause, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_emm_cause(&detach_request_to_ue->emm_cause, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_emm_cause() failed");
+               ogs_error("ogs_nas_eps_read_emm_cause() failed");
                return size;
             }
 
@@ -969,9 +996,10 @@ int ogs_nas_eps_decode_detach_request_to_ue(ogs_nas_eps_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_EPS_DETACH_REQUEST_LOWER_BOUND_TIMER_VALUE_TYPE:
-            size = ogs_nas_eps_decode_gprs_timer_3(&detach_request_to_ue->lower_bound_timer_value, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_gprs_timer_3(&detach_request_to_ue->lower_bound_timer_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_gprs_timer_3() failed");
+               ogs_error("ogs_nas_eps_read_gprs_timer_3() failed");
                return size;
             }
 
@@ -979,9 +1007,10 @@ int ogs_nas_eps_decode_detach_request_to_ue(ogs_nas_eps_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_EPS_DETACH_REQUEST_FORBIDDEN_TAI_FOR_THE_LIST_OF_FORBIDDEN_TRACKING_AREAS_FOR_ROAMING_TYPE:
-            size = ogs_nas_eps_decode_tracking_area_identity_list(&detach_request_to_ue->forbidden_tai_for_the_list_of_forbidden_tracking_areas_for_roaming, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_tracking_area_identity_list(&detach_request_to_ue->forbidden_tai_for_the_list_of_forbidden_tracking_areas_for_roaming, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_tracking_area_identity_list() failed");
+               ogs_error("ogs_nas_eps_read_tracking_area_identity_list() failed");
                return size;
             }
 
@@ -989,9 +1018,10 @@ int ogs_nas_eps_decode_detach_request_to_ue(ogs_nas_eps_message_t *message, ogs_
             decoded += size;
             break;
         case OGS_NAS_EPS_DETACH_REQUEST_FORBIDDEN_TAI_FOR_THE_LIST_OF_FORBIDDEN_TRACKING_AREAS_FORREGIONAL_PROVISION_OF_SERVICE_TYPE:
-            size = ogs_nas_eps_decode_tracking_area_identity_list(&detach_request_to_ue->forbidden_tai_for_the_list_of_forbidden_tracking_areas_forregional_provision_of_service, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_tracking_area_identity_list(&detach_request_to_ue->forbidden_tai_for_the_list_of_forbidden_tracking_areas_forregional_provision_of_service, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_tracking_area_identity_list() failed");
+               ogs_error("ogs_nas_eps_read_tracking_area_identity_list() failed");
                return size;
             }
 
@@ -1000,55 +1030,51 @@ int ogs_nas_eps_decode_detach_request_to_ue(ogs_nas_eps_message_t *message, ogs_
             break;
         default:
             ogs_warn("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_tracking_area_update_request(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_tracking_area_update_request_t *tracking_area_update_request = &message->emm.tracking_area_update_request;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode TRACKING_AREA_UPDATE_REQUEST\n");
 
-    size = ogs_nas_eps_decode_eps_update_type(&tracking_area_update_request->eps_update_type, pkbuf);
+    size = ogs_nas_eps_read_eps_update_type(&tracking_area_update_request->eps_update_type, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_eps_update_type() failed");
+        ogs_error("ogs_nas_eps_read_eps_update_type() failed");
         return size;
     }
 
     decoded += size;
 
-    size = ogs_nas_eps_decode_eps_mobile_identity(&tracking_area_update_request->old_guti, pkbuf);
+    size = ogs_nas_eps_read_eps_mobile_identity(&tracking_area_update_request->old_guti, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_eps_mobile_identity() failed");
+        ogs_error("ogs_nas_eps_read_eps_mobile_identity() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch (type) {
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_NON_CURRENT_NATIVE_NAS_KEY_SET_IDENTIFIER_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_key_set_identifier(&tracking_area_update_request->non_current_native_nas_key_set_identifier, pkbuf);
+            size = ogs_nas_eps_read_key_set_identifier(&tracking_area_update_request->non_current_native_nas_key_set_identifier, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_key_set_identifier() failed");
+               ogs_error("ogs_nas_eps_read_key_set_identifier() failed");
                return size;
             }
 
@@ -1056,11 +1082,9 @@ int ogs_nas_eps_decode_tracking_area_update_request(ogs_nas_eps_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_GPRS_CIPHERING_KEY_SEQUENCE_NUMBER_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_ciphering_key_sequence_number(&tracking_area_update_request->gprs_ciphering_key_sequence_number, pkbuf);
+            size = ogs_nas_eps_read_ciphering_key_sequence_number(&tracking_area_update_request->gprs_ciphering_key_sequence_number, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_ciphering_key_sequence_number() failed");
+               ogs_error("ogs_nas_eps_read_ciphering_key_sequence_number() failed");
                return size;
             }
 
@@ -1068,9 +1092,10 @@ int ogs_nas_eps_decode_tracking_area_update_request(ogs_nas_eps_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_OLD_P_TMSI_SIGNATURE_TYPE:
-            size = ogs_nas_eps_decode_p_tmsi_signature(&tracking_area_update_request->old_p_tmsi_signature, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_p_tmsi_signature(&tracking_area_update_request->old_p_tmsi_signature, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_p_tmsi_signature() failed");
+               ogs_error("ogs_nas_eps_read_p_tmsi_signature() failed");
                return size;
             }
 
@@ -1078,9 +1103,10 @@ int ogs_nas_eps_decode_tracking_area_update_request(ogs_nas_eps_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_ADDITIONAL_GUTI_TYPE:
-            size = ogs_nas_eps_decode_eps_mobile_identity(&tracking_area_update_request->additional_guti, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_eps_mobile_identity(&tracking_area_update_request->additional_guti, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_eps_mobile_identity() failed");
+               ogs_error("ogs_nas_eps_read_eps_mobile_identity() failed");
                return size;
             }
 
@@ -1088,9 +1114,10 @@ int ogs_nas_eps_decode_tracking_area_update_request(ogs_nas_eps_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_NONCEUE_TYPE:
-            size = ogs_nas_eps_decode_nonce(&tracking_area_update_request->nonceue, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_nonce(&tracking_area_update_request->nonceue, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_nonce() failed");
+               ogs_error("ogs_nas_eps_read_nonce() failed");
                return size;
             }
 
@@ -1098,9 +1125,10 @@ int ogs_nas_eps_decode_tracking_area_update_request(ogs_nas_eps_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_UE_NETWORK_CAPABILITY_TYPE:
-            size = ogs_nas_eps_decode_ue_network_capability(&tracking_area_update_request->ue_network_capability, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_ue_network_capability(&tracking_area_update_request->ue_network_capability, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_ue_network_capability() failed");
+               ogs_error("ogs_nas_eps_read_ue_network_capability() failed");
                return size;
             }
 
@@ -1108,9 +1136,10 @@ int ogs_nas_eps_decode_tracking_area_update_request(ogs_nas_eps_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_LAST_VISITED_REGISTERED_TAI_TYPE:
-            size = ogs_nas_eps_decode_tracking_area_identity(&tracking_area_update_request->last_visited_registered_tai, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_tracking_area_identity(&tracking_area_update_request->last_visited_registered_tai, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_tracking_area_identity() failed");
+               ogs_error("ogs_nas_eps_read_tracking_area_identity() failed");
                return size;
             }
 
@@ -1118,9 +1147,10 @@ int ogs_nas_eps_decode_tracking_area_update_request(ogs_nas_eps_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_DRX_PARAMETER_TYPE:
-            size = ogs_nas_eps_decode_drx_parameter(&tracking_area_update_request->drx_parameter, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_drx_parameter(&tracking_area_update_request->drx_parameter, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_drx_parameter() failed");
+               ogs_error("ogs_nas_eps_read_drx_parameter() failed");
                return size;
             }
 
@@ -1128,11 +1158,9 @@ int ogs_nas_eps_decode_tracking_area_update_request(ogs_nas_eps_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_UE_RADIO_CAPABILITY_INFORMATION_UPDATE_NEEDED_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_ue_radio_capability_information_update_needed(&tracking_area_update_request->ue_radio_capability_information_update_needed, pkbuf);
+            size = ogs_nas_eps_read_ue_radio_capability_information_update_needed(&tracking_area_update_request->ue_radio_capability_information_update_needed, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_ue_radio_capability_information_update_needed() failed");
+               ogs_error("ogs_nas_eps_read_ue_radio_capability_information_update_needed() failed");
                return size;
             }
 
@@ -1140,9 +1168,10 @@ int ogs_nas_eps_decode_tracking_area_update_request(ogs_nas_eps_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_EPS_BEARER_CONTEXT_STATUS_TYPE:
-            size = ogs_nas_eps_decode_eps_bearer_context_status(&tracking_area_update_request->eps_bearer_context_status, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_eps_bearer_context_status(&tracking_area_update_request->eps_bearer_context_status, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_eps_bearer_context_status() failed");
+               ogs_error("ogs_nas_eps_read_eps_bearer_context_status() failed");
                return size;
             }
 
@@ -1150,9 +1179,10 @@ int ogs_nas_eps_decode_tracking_area_update_request(ogs_nas_eps_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_MS_NETWORK_CAPABILITY_TYPE:
-            size = ogs_nas_eps_decode_ms_network_capability(&tracking_area_update_request->ms_network_capability, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_ms_network_capability(&tracking_area_update_request->ms_network_capability, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_ms_network_capability() failed");
+               ogs_error("ogs_nas_eps_read_ms_network_capability() failed");
                return size;
             }
 
@@ -1160,9 +1190,10 @@ int ogs_nas_eps_decode_tracking_area_update_request(ogs_nas_eps_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_OLD_LOCATION_AREA_IDENTIFICATION_TYPE:
-            size = ogs_nas_eps_decode_location_area_identification(&tracking_area_update_request->old_location_area_identification, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_location_area_identification(&tracking_area_update_request->old_location_area_identification, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_location_area_identification() failed");
+               ogs_error("ogs_nas_eps_read_location_area_identification() failed");
                return size;
             }
 
@@ -1170,11 +1201,9 @@ int ogs_nas_eps_decode_tracking_area_update_request(ogs_nas_eps_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_TMSI_STATUS_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_tmsi_status(&tracking_area_update_request->tmsi_status, pkbuf);
+            size = ogs_nas_eps_read_tmsi_status(&tracking_area_update_request->tmsi_status, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_tmsi_status() failed");
+               ogs_error("ogs_nas_eps_read_tmsi_status() failed");
                return size;
             }
 
@@ -1182,9 +1211,10 @@ int ogs_nas_eps_decode_tracking_area_update_request(ogs_nas_eps_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_MOBILE_STATION_CLASSMARK_2_TYPE:
-            size = ogs_nas_eps_decode_mobile_station_classmark_2(&tracking_area_update_request->mobile_station_classmark_2, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_mobile_station_classmark_2(&tracking_area_update_request->mobile_station_classmark_2, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_mobile_station_classmark_2() failed");
+               ogs_error("ogs_nas_eps_read_mobile_station_classmark_2() failed");
                return size;
             }
 
@@ -1192,9 +1222,10 @@ int ogs_nas_eps_decode_tracking_area_update_request(ogs_nas_eps_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_MOBILE_STATION_CLASSMARK_3_TYPE:
-            size = ogs_nas_eps_decode_mobile_station_classmark_3(&tracking_area_update_request->mobile_station_classmark_3, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_mobile_station_classmark_3(&tracking_area_update_request->mobile_station_classmark_3, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_mobile_station_classmark_3() failed");
+               ogs_error("ogs_nas_eps_read_mobile_station_classmark_3() failed");
                return size;
             }
 
@@ -1202,9 +1233,10 @@ int ogs_nas_eps_decode_tracking_area_update_request(ogs_nas_eps_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_SUPPORTED_CODECS_TYPE:
-            size = ogs_nas_eps_decode_supported_codec_list(&tracking_area_update_request->supported_codecs, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_supported_codec_list(&tracking_area_update_request->supported_codecs, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_supported_codec_list() failed");
+               ogs_error("ogs_nas_eps_read_supported_codec_list() failed");
                return size;
             }
 
@@ -1212,11 +1244,9 @@ int ogs_nas_eps_decode_tracking_area_update_request(ogs_nas_eps_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_ADDITIONAL_UPDATE_TYPE_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_additional_update_type(&tracking_area_update_request->additional_update_type, pkbuf);
+            size = ogs_nas_eps_read_additional_update_type(&tracking_area_update_request->additional_update_type, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_additional_update_type() failed");
+               ogs_error("ogs_nas_eps_read_additional_update_type() failed");
                return size;
             }
 
@@ -1224,9 +1254,10 @@ int ogs_nas_eps_decode_tracking_area_update_request(ogs_nas_eps_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_VOICE_DOMAIN_PREFERENCE_AND_UE_USAGE_SETTING_TYPE:
-            size = ogs_nas_eps_decode_voice_domain_preference_and_ue_usage_setting(&tracking_area_update_request->voice_domain_preference_and_ue_usage_setting, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_voice_domain_preference_and_ue_usage_setting(&tracking_area_update_request->voice_domain_preference_and_ue_usage_setting, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_voice_domain_preference_and_ue_usage_setting() failed");
+               ogs_error("ogs_nas_eps_read_voice_domain_preference_and_ue_usage_setting() failed");
                return size;
             }
 
@@ -1234,11 +1265,9 @@ int ogs_nas_eps_decode_tracking_area_update_request(ogs_nas_eps_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_OLD_GUTI_TYPE_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_guti_type(&tracking_area_update_request->old_guti_type, pkbuf);
+            size = ogs_nas_eps_read_guti_type(&tracking_area_update_request->old_guti_type, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_guti_type() failed");
+               ogs_error("ogs_nas_eps_read_guti_type() failed");
                return size;
             }
 
@@ -1246,11 +1275,9 @@ int ogs_nas_eps_decode_tracking_area_update_request(ogs_nas_eps_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_DEVICE_PROPERTIES_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_device_properties(&tracking_area_update_request->device_properties, pkbuf);
+            size = ogs_nas_eps_read_device_properties(&tracking_area_update_request->device_properties, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_device_properties() failed");
+               ogs_error("ogs_nas_eps_read_device_properties() failed");
                return size;
             }
 
@@ -1258,11 +1285,9 @@ int ogs_nas_eps_decode_tracking_area_update_request(ogs_nas_eps_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_MS_NETWORK_FEATURE_SUPPORT_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_ms_network_feature_support(&tracking_area_update_request->ms_network_feature_support, pkbuf);
+            size = ogs_nas_eps_read_ms_network_feature_support(&tracking_area_update_request->ms_network_feature_support, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_ms_network_feature_support() failed");
+               ogs_error("ogs_nas_eps_read_ms_network_feature_support() failed");
                return size;
             }
 
@@ -1270,9 +1295,10 @@ int ogs_nas_eps_decode_tracking_area_update_request(ogs_nas_eps_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_TMSI_BASED_NRI_CONTAINER_TYPE:
-            size = ogs_nas_eps_decode_network_resource_identifier_container(&tracking_area_update_request->tmsi_based_nri_container, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_network_resource_identifier_container(&tracking_area_update_request->tmsi_based_nri_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_network_resource_identifier_container() failed");
+               ogs_error("ogs_nas_eps_read_network_resource_identifier_container() failed");
                return size;
             }
 
@@ -1280,9 +1306,10 @@ int ogs_nas_eps_decode_tracking_area_update_request(ogs_nas_eps_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_T3324_VALUE_TYPE:
-            size = ogs_nas_eps_decode_gprs_timer_2(&tracking_area_update_request->t3324_value, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_gprs_timer_2(&tracking_area_update_request->t3324_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_gprs_timer_2() failed");
+               ogs_error("ogs_nas_eps_read_gprs_timer_2() failed");
                return size;
             }
 
@@ -1290,9 +1317,10 @@ int ogs_nas_eps_decode_tracking_area_update_request(ogs_nas_eps_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_T3412_EXTENDED_VALUE_TYPE:
-            size = ogs_nas_eps_decode_gprs_timer_3(&tracking_area_update_request->t3412_extended_value, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_gprs_timer_3(&tracking_area_update_request->t3412_extended_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_gprs_timer_3() failed");
+               ogs_error("ogs_nas_eps_read_gprs_timer_3() failed");
                return size;
             }
 
@@ -1300,9 +1328,10 @@ int ogs_nas_eps_decode_tracking_area_update_request(ogs_nas_eps_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_EXTENDED_DRX_PARAMETERS_TYPE:
-            size = ogs_nas_eps_decode_extended_drx_parameters(&tracking_area_update_request->extended_drx_parameters, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_extended_drx_parameters(&tracking_area_update_request->extended_drx_parameters, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_extended_drx_parameters() failed");
+               ogs_error("ogs_nas_eps_read_extended_drx_parameters() failed");
                return size;
             }
 
@@ -1310,9 +1339,10 @@ int ogs_nas_eps_decode_tracking_area_update_request(ogs_nas_eps_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_UE_ADDITIONAL_SECURITY_CAPABILITY_TYPE:
-            size = ogs_nas_eps_decode_ue_additional_security_capability(&tracking_area_update_request->ue_additional_security_capability, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_ue_additional_security_capability(&tracking_area_update_request->ue_additional_security_capability, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_ue_additional_security_capability() failed");
+               ogs_error("ogs_nas_eps_read_ue_additional_security_capability() failed");
                return size;
             }
 
@@ -1320,9 +1350,10 @@ int ogs_nas_eps_decode_tracking_area_update_request(ogs_nas_eps_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_UE_STATUS_TYPE:
-            size = ogs_nas_eps_decode_ue_status(&tracking_area_update_request->ue_status, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_ue_status(&tracking_area_update_request->ue_status, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_ue_status() failed");
+               ogs_error("ogs_nas_eps_read_ue_status() failed");
                return size;
             }
 
@@ -1330,9 +1361,10 @@ int ogs_nas_eps_decode_tracking_area_update_request(ogs_nas_eps_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_ADDITIONAL_INFORMATION_REQUESTED_TYPE:
-            size = ogs_nas_eps_decode_additional_information_requested(&tracking_area_update_request->additional_information_requested, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_additional_information_requested(&tracking_area_update_request->additional_information_requested, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_additional_information_requested() failed");
+               ogs_error("ogs_nas_eps_read_additional_information_requested() failed");
                return size;
             }
 
@@ -1340,9 +1372,10 @@ int ogs_nas_eps_decode_tracking_area_update_request(ogs_nas_eps_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_N1_UE_NETWORK_CAPABILITY_TYPE:
-            size = ogs_nas_eps_decode_n1_ue_network_capability(&tracking_area_update_request->n1_ue_network_capability, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_n1_ue_network_capability(&tracking_area_update_request->n1_ue_network_capability, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_n1_ue_network_capability() failed");
+               ogs_error("ogs_nas_eps_read_n1_ue_network_capability() failed");
                return size;
             }
 
@@ -1350,9 +1383,10 @@ int ogs_nas_eps_decode_tracking_area_update_request(ogs_nas_eps_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_UE_RADIO_CAPABILITY_ID_AVAILABILITY_TYPE:
-            size = ogs_nas_eps_decode_ue_radio_capability_id_availability(&tracking_area_update_request->ue_radio_capability_id_availability, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_ue_radio_capability_id_availability(&tracking_area_update_request->ue_radio_capability_id_availability, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_ue_radio_capability_id_availability() failed");
+               ogs_error("ogs_nas_eps_read_ue_radio_capability_id_availability() failed");
                return size;
             }
 
@@ -1360,9 +1394,10 @@ int ogs_nas_eps_decode_tracking_area_update_request(ogs_nas_eps_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_REQUESTED_WUS_ASSISTANCE_INFORMATION_TYPE:
-            size = ogs_nas_eps_decode_wus_assistance_information(&tracking_area_update_request->requested_wus_assistance_information, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_wus_assistance_information(&tracking_area_update_request->requested_wus_assistance_information, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_wus_assistance_information() failed");
+               ogs_error("ogs_nas_eps_read_wus_assistance_information() failed");
                return size;
             }
 
@@ -1370,9 +1405,10 @@ int ogs_nas_eps_decode_tracking_area_update_request(ogs_nas_eps_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_DRX_PARAMETER_IN_NB_S1_MODE_TYPE:
-            size = ogs_nas_eps_decode_nb_s1_drx_parameter(&tracking_area_update_request->drx_parameter_in_nb_s1_mode, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_nb_s1_drx_parameter(&tracking_area_update_request->drx_parameter_in_nb_s1_mode, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_nb_s1_drx_parameter() failed");
+               ogs_error("ogs_nas_eps_read_nb_s1_drx_parameter() failed");
                return size;
             }
 
@@ -1380,9 +1416,10 @@ int ogs_nas_eps_decode_tracking_area_update_request(ogs_nas_eps_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_REQUESTED_IMSI_OFFSET_TYPE:
-            size = ogs_nas_eps_decode_imsi_offset(&tracking_area_update_request->requested_imsi_offset, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_imsi_offset(&tracking_area_update_request->requested_imsi_offset, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_imsi_offset() failed");
+               ogs_error("ogs_nas_eps_read_imsi_offset() failed");
                return size;
             }
 
@@ -1390,9 +1427,10 @@ int ogs_nas_eps_decode_tracking_area_update_request(ogs_nas_eps_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_UE_REQUEST_TYPE_TYPE:
-            size = ogs_nas_eps_decode_ue_request_type(&tracking_area_update_request->ue_request_type, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_ue_request_type(&tracking_area_update_request->ue_request_type, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_ue_request_type() failed");
+               ogs_error("ogs_nas_eps_read_ue_request_type() failed");
                return size;
             }
 
@@ -1400,9 +1438,10 @@ int ogs_nas_eps_decode_tracking_area_update_request(ogs_nas_eps_message_t *messa
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_PAGING_RESTRICTION_TYPE:
-            size = ogs_nas_eps_decode_paging_restriction(&tracking_area_update_request->paging_restriction, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_paging_restriction(&tracking_area_update_request->paging_restriction, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_paging_restriction() failed");
+               ogs_error("ogs_nas_eps_read_paging_restriction() failed");
                return size;
             }
 
@@ -1411,45 +1450,44 @@ int ogs_nas_eps_decode_tracking_area_update_request(ogs_nas_eps_message_t *messa
             break;
         default:
             ogs_warn("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_tracking_area_update_accept(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_tracking_area_update_accept_t *tracking_area_update_accept = &message->emm.tracking_area_update_accept;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode TRACKING_AREA_UPDATE_ACCEPT\n");
 
-    size = ogs_nas_eps_decode_eps_update_result(&tracking_area_update_accept->eps_update_result, pkbuf);
+    size = ogs_nas_eps_read_eps_update_result(&tracking_area_update_accept->eps_update_result, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_eps_update_result() failed");
+        ogs_error("ogs_nas_eps_read_eps_update_result() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch (type) {
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_T3412_VALUE_TYPE:
-            size = ogs_nas_eps_decode_gprs_timer(&tracking_area_update_accept->t3412_value, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_gprs_timer(&tracking_area_update_accept->t3412_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_gprs_timer() failed");
+               ogs_error("ogs_nas_eps_read_gprs_timer() failed");
                return size;
             }
 
@@ -1457,9 +1495,10 @@ int ogs_nas_eps_decode_tracking_area_update_accept(ogs_nas_eps_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_GUTI_TYPE:
-            size = ogs_nas_eps_decode_eps_mobile_identity(&tracking_area_update_accept->guti, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_eps_mobile_identity(&tracking_area_update_accept->guti, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_eps_mobile_identity() failed");
+               ogs_error("ogs_nas_eps_read_eps_mobile_identity() failed");
                return size;
             }
 
@@ -1467,9 +1506,10 @@ int ogs_nas_eps_decode_tracking_area_update_accept(ogs_nas_eps_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_TAI_LIST_TYPE:
-            size = ogs_nas_eps_decode_tracking_area_identity_list(&tracking_area_update_accept->tai_list, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_tracking_area_identity_list(&tracking_area_update_accept->tai_list, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_tracking_area_identity_list() failed");
+               ogs_error("ogs_nas_eps_read_tracking_area_identity_list() failed");
                return size;
             }
 
@@ -1477,9 +1517,10 @@ int ogs_nas_eps_decode_tracking_area_update_accept(ogs_nas_eps_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_EPS_BEARER_CONTEXT_STATUS_TYPE:
-            size = ogs_nas_eps_decode_eps_bearer_context_status(&tracking_area_update_accept->eps_bearer_context_status, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_eps_bearer_context_status(&tracking_area_update_accept->eps_bearer_context_status, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_eps_bearer_context_status() failed");
+               ogs_error("ogs_nas_eps_read_eps_bearer_context_status() failed");
                return size;
             }
 
@@ -1487,9 +1528,10 @@ int ogs_nas_eps_decode_tracking_area_update_accept(ogs_nas_eps_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_LOCATION_AREA_IDENTIFICATION_TYPE:
-            size = ogs_nas_eps_decode_location_area_identification(&tracking_area_update_accept->location_area_identification, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_location_area_identification(&tracking_area_update_accept->location_area_identification, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_location_area_identification() failed");
+               ogs_error("ogs_nas_eps_read_location_area_identification() failed");
                return size;
             }
 
@@ -1497,9 +1539,10 @@ int ogs_nas_eps_decode_tracking_area_update_accept(ogs_nas_eps_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_MS_IDENTITY_TYPE:
-            size = ogs_nas_eps_decode_mobile_identity(&tracking_area_update_accept->ms_identity, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_mobile_identity(&tracking_area_update_accept->ms_identity, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_mobile_identity() failed");
+               ogs_error("ogs_nas_eps_read_mobile_identity() failed");
                return size;
             }
 
@@ -1507,9 +1550,10 @@ int ogs_nas_eps_decode_tracking_area_update_accept(ogs_nas_eps_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_EMM_CAUSE_TYPE:
-            size = ogs_nas_eps_decode_emm_cause(&tracking_area_update_accept->emm_cause, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_emm_cause(&tracking_area_update_accept->emm_cause, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_emm_cause() failed");
+               ogs_error("ogs_nas_eps_read_emm_cause() failed");
                return size;
             }
 
@@ -1517,9 +1561,10 @@ int ogs_nas_eps_decode_tracking_area_update_accept(ogs_nas_eps_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_T3402_VALUE_TYPE:
-            size = ogs_nas_eps_decode_gprs_timer(&tracking_area_update_accept->t3402_value, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_gprs_timer(&tracking_area_update_accept->t3402_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_gprs_timer() failed");
+               ogs_error("ogs_nas_eps_read_gprs_timer() failed");
                return size;
             }
 
@@ -1527,9 +1572,10 @@ int ogs_nas_eps_decode_tracking_area_update_accept(ogs_nas_eps_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_T3423_VALUE_TYPE:
-            size = ogs_nas_eps_decode_gprs_timer(&tracking_area_update_accept->t3423_value, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_gprs_timer(&tracking_area_update_accept->t3423_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_gprs_timer() failed");
+               ogs_error("ogs_nas_eps_read_gprs_timer() failed");
                return size;
             }
 
@@ -1537,9 +1583,10 @@ int ogs_nas_eps_decode_tracking_area_update_accept(ogs_nas_eps_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_EQUIVALENT_PLMNS_TYPE:
-            size = ogs_nas_eps_decode_plmn_list(&tracking_area_update_accept->equivalent_plmns, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_plmn_list(&tracking_area_update_accept->equivalent_plmns, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_plmn_list() failed");
+               ogs_error("ogs_nas_eps_read_plmn_list() failed");
                return size;
             }
 
@@ -1547,9 +1594,10 @@ int ogs_nas_eps_decode_tracking_area_update_accept(ogs_nas_eps_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_EMERGENCY_NUMBER_LIST_TYPE:
-            size = ogs_nas_eps_decode_emergency_number_list(&tracking_area_update_accept->emergency_number_list, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_emergency_number_list(&tracking_area_update_accept->emergency_number_list, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_emergency_number_list() failed");
+               ogs_error("ogs_nas_eps_read_emergency_number_list() failed");
                return size;
             }
 
@@ -1557,9 +1605,10 @@ int ogs_nas_eps_decode_tracking_area_update_accept(ogs_nas_eps_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_EPS_NETWORK_FEATURE_SUPPORT_TYPE:
-            size = ogs_nas_eps_decode_eps_network_feature_support(&tracking_area_update_accept->eps_network_feature_support, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_eps_network_feature_support(&tracking_area_update_accept->eps_network_feature_support, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_eps_network_feature_support() failed");
+               ogs_error("ogs_nas_eps_read_eps_network_feature_support() failed");
                return size;
             }
 
@@ -1567,11 +1616,9 @@ int ogs_nas_eps_decode_tracking_area_update_accept(ogs_nas_eps_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_ADDITIONAL_UPDATE_RESULT_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_additional_update_result(&tracking_area_update_accept->additional_update_result, pkbuf);
+            size = ogs_nas_eps_read_additional_update_result(&tracking_area_update_accept->additional_update_result, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_additional_update_result() failed");
+               ogs_error("ogs_nas_eps_read_additional_update_result() failed");
                return size;
             }
 
@@ -1579,9 +1626,10 @@ int ogs_nas_eps_decode_tracking_area_update_accept(ogs_nas_eps_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_T3412_EXTENDED_VALUE_TYPE:
-            size = ogs_nas_eps_decode_gprs_timer_3(&tracking_area_update_accept->t3412_extended_value, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_gprs_timer_3(&tracking_area_update_accept->t3412_extended_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_gprs_timer_3() failed");
+               ogs_error("ogs_nas_eps_read_gprs_timer_3() failed");
                return size;
             }
 
@@ -1589,9 +1637,10 @@ int ogs_nas_eps_decode_tracking_area_update_accept(ogs_nas_eps_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_T3324_VALUE_TYPE:
-            size = ogs_nas_eps_decode_gprs_timer_2(&tracking_area_update_accept->t3324_value, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_gprs_timer_2(&tracking_area_update_accept->t3324_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_gprs_timer_2() failed");
+               ogs_error("ogs_nas_eps_read_gprs_timer_2() failed");
                return size;
             }
 
@@ -1599,9 +1648,10 @@ int ogs_nas_eps_decode_tracking_area_update_accept(ogs_nas_eps_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_EXTENDED_DRX_PARAMETERS_TYPE:
-            size = ogs_nas_eps_decode_extended_drx_parameters(&tracking_area_update_accept->extended_drx_parameters, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_extended_drx_parameters(&tracking_area_update_accept->extended_drx_parameters, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_extended_drx_parameters() failed");
+               ogs_error("ogs_nas_eps_read_extended_drx_parameters() failed");
                return size;
             }
 
@@ -1609,9 +1659,10 @@ int ogs_nas_eps_decode_tracking_area_update_accept(ogs_nas_eps_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_HEADER_COMPRESSION_CONFIGURATION_STATUS_TYPE:
-            size = ogs_nas_eps_decode_header_compression_configuration_status(&tracking_area_update_accept->header_compression_configuration_status, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_header_compression_configuration_status(&tracking_area_update_accept->header_compression_configuration_status, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_header_compression_configuration_status() failed");
+               ogs_error("ogs_nas_eps_read_header_compression_configuration_status() failed");
                return size;
             }
 
@@ -1619,9 +1670,10 @@ int ogs_nas_eps_decode_tracking_area_update_accept(ogs_nas_eps_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_DCN_ID_TYPE:
-            size = ogs_nas_eps_decode_dcn_id(&tracking_area_update_accept->dcn_id, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_dcn_id(&tracking_area_update_accept->dcn_id, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_dcn_id() failed");
+               ogs_error("ogs_nas_eps_read_dcn_id() failed");
                return size;
             }
 
@@ -1629,11 +1681,9 @@ int ogs_nas_eps_decode_tracking_area_update_accept(ogs_nas_eps_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_SMS_SERVICES_STATUS_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_sms_services_status(&tracking_area_update_accept->sms_services_status, pkbuf);
+            size = ogs_nas_eps_read_sms_services_status(&tracking_area_update_accept->sms_services_status, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_sms_services_status() failed");
+               ogs_error("ogs_nas_eps_read_sms_services_status() failed");
                return size;
             }
 
@@ -1641,11 +1691,9 @@ int ogs_nas_eps_decode_tracking_area_update_accept(ogs_nas_eps_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_NON__NW_POLICIES_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_non__nw_provided_policies(&tracking_area_update_accept->non__nw_policies, pkbuf);
+            size = ogs_nas_eps_read_non__nw_provided_policies(&tracking_area_update_accept->non__nw_policies, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_non__nw_provided_policies() failed");
+               ogs_error("ogs_nas_eps_read_non__nw_provided_policies() failed");
                return size;
             }
 
@@ -1653,9 +1701,10 @@ int ogs_nas_eps_decode_tracking_area_update_accept(ogs_nas_eps_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_T3448_VALUE_TYPE:
-            size = ogs_nas_eps_decode_gprs_timer_2(&tracking_area_update_accept->t3448_value, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_gprs_timer_2(&tracking_area_update_accept->t3448_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_gprs_timer_2() failed");
+               ogs_error("ogs_nas_eps_read_gprs_timer_2() failed");
                return size;
             }
 
@@ -1663,11 +1712,9 @@ int ogs_nas_eps_decode_tracking_area_update_accept(ogs_nas_eps_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_NETWORK_POLICY_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_network_policy(&tracking_area_update_accept->network_policy, pkbuf);
+            size = ogs_nas_eps_read_network_policy(&tracking_area_update_accept->network_policy, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_network_policy() failed");
+               ogs_error("ogs_nas_eps_read_network_policy() failed");
                return size;
             }
 
@@ -1675,9 +1722,10 @@ int ogs_nas_eps_decode_tracking_area_update_accept(ogs_nas_eps_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_T3447_VALUE_TYPE:
-            size = ogs_nas_eps_decode_gprs_timer_3(&tracking_area_update_accept->t3447_value, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_gprs_timer_3(&tracking_area_update_accept->t3447_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_gprs_timer_3() failed");
+               ogs_error("ogs_nas_eps_read_gprs_timer_3() failed");
                return size;
             }
 
@@ -1685,9 +1733,10 @@ int ogs_nas_eps_decode_tracking_area_update_accept(ogs_nas_eps_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_EXTENDED_EMERGENCY_NUMBER_LIST_TYPE:
-            size = ogs_nas_eps_decode_extended_emergency_number_list(&tracking_area_update_accept->extended_emergency_number_list, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_extended_emergency_number_list(&tracking_area_update_accept->extended_emergency_number_list, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_extended_emergency_number_list() failed");
+               ogs_error("ogs_nas_eps_read_extended_emergency_number_list() failed");
                return size;
             }
 
@@ -1695,9 +1744,10 @@ int ogs_nas_eps_decode_tracking_area_update_accept(ogs_nas_eps_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_CIPHERING_KEY_DATA_TYPE:
-            size = ogs_nas_eps_decode_ciphering_key_data(&tracking_area_update_accept->ciphering_key_data, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_ciphering_key_data(&tracking_area_update_accept->ciphering_key_data, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_ciphering_key_data() failed");
+               ogs_error("ogs_nas_eps_read_ciphering_key_data() failed");
                return size;
             }
 
@@ -1705,9 +1755,10 @@ int ogs_nas_eps_decode_tracking_area_update_accept(ogs_nas_eps_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_UE_RADIO_CAPABILITY_ID_TYPE:
-            size = ogs_nas_eps_decode_ue_radio_capability_id(&tracking_area_update_accept->ue_radio_capability_id, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_ue_radio_capability_id(&tracking_area_update_accept->ue_radio_capability_id, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_ue_radio_capability_id() failed");
+               ogs_error("ogs_nas_eps_read_ue_radio_capability_id() failed");
                return size;
             }
 
@@ -1715,11 +1766,9 @@ int ogs_nas_eps_decode_tracking_area_update_accept(ogs_nas_eps_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_UE_RADIO_CAPABILITY_ID_DELETION_INDICATION_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_ue_radio_capability_id_deletion_indication(&tracking_area_update_accept->ue_radio_capability_id_deletion_indication, pkbuf);
+            size = ogs_nas_eps_read_ue_radio_capability_id_deletion_indication(&tracking_area_update_accept->ue_radio_capability_id_deletion_indication, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_ue_radio_capability_id_deletion_indication() failed");
+               ogs_error("ogs_nas_eps_read_ue_radio_capability_id_deletion_indication() failed");
                return size;
             }
 
@@ -1727,9 +1776,10 @@ int ogs_nas_eps_decode_tracking_area_update_accept(ogs_nas_eps_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_NEGOTIATED_WUS_ASSISTANCE_INFORMATION_TYPE:
-            size = ogs_nas_eps_decode_wus_assistance_information(&tracking_area_update_accept->negotiated_wus_assistance_information, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_wus_assistance_information(&tracking_area_update_accept->negotiated_wus_assistance_information, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_wus_assistance_information() failed");
+               ogs_error("ogs_nas_eps_read_wus_assistance_information() failed");
                return size;
             }
 
@@ -1737,9 +1787,10 @@ int ogs_nas_eps_decode_tracking_area_update_accept(ogs_nas_eps_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_NEGOTIATED_DRX_PARAMETER_IN_NB_S1_MODE_TYPE:
-            size = ogs_nas_eps_decode_nb_s1_drx_parameter(&tracking_area_update_accept->negotiated_drx_parameter_in_nb_s1_mode, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_nb_s1_drx_parameter(&tracking_area_update_accept->negotiated_drx_parameter_in_nb_s1_mode, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_nb_s1_drx_parameter() failed");
+               ogs_error("ogs_nas_eps_read_nb_s1_drx_parameter() failed");
                return size;
             }
 
@@ -1747,9 +1798,10 @@ int ogs_nas_eps_decode_tracking_area_update_accept(ogs_nas_eps_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_NEGOTIATED_IMSI_OFFSET_TYPE:
-            size = ogs_nas_eps_decode_imsi_offset(&tracking_area_update_accept->negotiated_imsi_offset, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_imsi_offset(&tracking_area_update_accept->negotiated_imsi_offset, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_imsi_offset() failed");
+               ogs_error("ogs_nas_eps_read_imsi_offset() failed");
                return size;
             }
 
@@ -1757,9 +1809,10 @@ int ogs_nas_eps_decode_tracking_area_update_accept(ogs_nas_eps_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_EPS_ADDITIONAL_REQUEST_RESULT_TYPE:
-            size = ogs_nas_eps_decode_eps_additional_request_result(&tracking_area_update_accept->eps_additional_request_result, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_eps_additional_request_result(&tracking_area_update_accept->eps_additional_request_result, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_eps_additional_request_result() failed");
+               ogs_error("ogs_nas_eps_read_eps_additional_request_result() failed");
                return size;
             }
 
@@ -1767,9 +1820,10 @@ int ogs_nas_eps_decode_tracking_area_update_accept(ogs_nas_eps_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_FORBIDDEN_TAI_FOR_THE_LIST_OF_FORBIDDEN_TRACKING_AREAS_FOR_ROAMING_TYPE:
-            size = ogs_nas_eps_decode_tracking_area_identity_list(&tracking_area_update_accept->forbidden_tai_for_the_list_of_forbidden_tracking_areas_for_roaming, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_tracking_area_identity_list(&tracking_area_update_accept->forbidden_tai_for_the_list_of_forbidden_tracking_areas_for_roaming, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_tracking_area_identity_list() failed");
+               ogs_error("ogs_nas_eps_read_tracking_area_identity_list() failed");
                return size;
             }
 
@@ -1777,9 +1831,10 @@ int ogs_nas_eps_decode_tracking_area_update_accept(ogs_nas_eps_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_FORBIDDEN_TAI_FOR_THE_LIST_OF_FORBIDDEN_TRACKING_AREAS_FORREGIONAL_PROVISION_OF_SERVICE_TYPE:
-            size = ogs_nas_eps_decode_tracking_area_identity_list(&tracking_area_update_accept->forbidden_tai_for_the_list_of_forbidden_tracking_areas_forregional_provision_of_service, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_tracking_area_identity_list(&tracking_area_update_accept->forbidden_tai_for_the_list_of_forbidden_tracking_areas_forregional_provision_of_service, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_tracking_area_identity_list() failed");
+               ogs_error("ogs_nas_eps_read_tracking_area_identity_list() failed");
                return size;
             }
 
@@ -1788,45 +1843,44 @@ int ogs_nas_eps_decode_tracking_area_update_accept(ogs_nas_eps_message_t *messag
             break;
         default:
             ogs_warn("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_tracking_area_update_reject(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_tracking_area_update_reject_t *tracking_area_update_reject = &message->emm.tracking_area_update_reject;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode TRACKING_AREA_UPDATE_REJECT\n");
 
-    size = ogs_nas_eps_decode_emm_cause(&tracking_area_update_reject->emm_cause, pkbuf);
+    size = ogs_nas_eps_read_emm_cause(&tracking_area_update_reject->emm_cause, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_emm_cause() failed");
+        ogs_error("ogs_nas_eps_read_emm_cause() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch (type) {
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REJECT_T3346_VALUE_TYPE:
-            size = ogs_nas_eps_decode_gprs_timer_2(&tracking_area_update_reject->t3346_value, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_gprs_timer_2(&tracking_area_update_reject->t3346_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_gprs_timer_2() failed");
+               ogs_error("ogs_nas_eps_read_gprs_timer_2() failed");
                return size;
             }
 
@@ -1834,11 +1888,9 @@ int ogs_nas_eps_decode_tracking_area_update_reject(ogs_nas_eps_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REJECT_EXTENDED_EMM_CAUSE_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_extended_emm_cause(&tracking_area_update_reject->extended_emm_cause, pkbuf);
+            size = ogs_nas_eps_read_extended_emm_cause(&tracking_area_update_reject->extended_emm_cause, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_extended_emm_cause() failed");
+               ogs_error("ogs_nas_eps_read_extended_emm_cause() failed");
                return size;
             }
 
@@ -1846,9 +1898,10 @@ int ogs_nas_eps_decode_tracking_area_update_reject(ogs_nas_eps_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REJECT_LOWER_BOUND_TIMER_VALUE_TYPE:
-            size = ogs_nas_eps_decode_gprs_timer_3(&tracking_area_update_reject->lower_bound_timer_value, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_gprs_timer_3(&tracking_area_update_reject->lower_bound_timer_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_gprs_timer_3() failed");
+               ogs_error("ogs_nas_eps_read_gprs_timer_3() failed");
                return size;
             }
 
@@ -1856,9 +1909,10 @@ int ogs_nas_eps_decode_tracking_area_update_reject(ogs_nas_eps_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REJECT_FORBIDDEN_TAI_FOR_THE_LIST_OF_FORBIDDEN_TRACKING_AREAS_FOR_ROAMING_TYPE:
-            size = ogs_nas_eps_decode_tracking_area_identity_list(&tracking_area_update_reject->forbidden_tai_for_the_list_of_forbidden_tracking_areas_for_roaming, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_tracking_area_identity_list(&tracking_area_update_reject->forbidden_tai_for_the_list_of_forbidden_tracking_areas_for_roaming, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_tracking_area_identity_list() failed");
+               ogs_error("ogs_nas_eps_read_tracking_area_identity_list() failed");
                return size;
             }
 
@@ -1866,9 +1920,10 @@ int ogs_nas_eps_decode_tracking_area_update_reject(ogs_nas_eps_message_t *messag
             decoded += size;
             break;
         case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REJECT_FORBIDDEN_TAI_FOR_THE_LIST_OF_FORBIDDEN_TRACKING_AREAS_FORREGIONAL_PROVISION_OF_SERVICE_TYPE:
-            size = ogs_nas_eps_decode_tracking_area_identity_list(&tracking_area_update_reject->forbidden_tai_for_the_list_of_forbidden_tracking_areas_forregional_provision_of_service, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_tracking_area_identity_list(&tracking_area_update_reject->forbidden_tai_for_the_list_of_forbidden_tracking_areas_forregional_provision_of_service, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_tracking_area_identity_list() failed");
+               ogs_error("ogs_nas_eps_read_tracking_area_identity_list() failed");
                return size;
             }
 
@@ -1877,55 +1932,51 @@ int ogs_nas_eps_decode_tracking_area_update_reject(ogs_nas_eps_message_t *messag
             break;
         default:
             ogs_warn("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_extended_service_request(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_extended_service_request_t *extended_service_request = &message->emm.extended_service_request;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode EXTENDED_SERVICE_REQUEST\n");
 
-    size = ogs_nas_eps_decode_service_type(&extended_service_request->service_type, pkbuf);
+    size = ogs_nas_eps_read_service_type(&extended_service_request->service_type, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_service_type() failed");
+        ogs_error("ogs_nas_eps_read_service_type() failed");
         return size;
     }
 
     decoded += size;
 
-    size = ogs_nas_eps_decode_mobile_identity(&extended_service_request->m_tmsi, pkbuf);
+    size = ogs_nas_eps_read_mobile_identity(&extended_service_request->m_tmsi, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_mobile_identity() failed");
+        ogs_error("ogs_nas_eps_read_mobile_identity() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch (type) {
         case OGS_NAS_EPS_EXTENDED_SERVICE_REQUEST_CSFB_RESPONSE_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_csfb_response(&extended_service_request->csfb_response, pkbuf);
+            size = ogs_nas_eps_read_csfb_response(&extended_service_request->csfb_response, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_csfb_response() failed");
+               ogs_error("ogs_nas_eps_read_csfb_response() failed");
                return size;
             }
 
@@ -1933,9 +1984,10 @@ int ogs_nas_eps_decode_extended_service_request(ogs_nas_eps_message_t *message,
             decoded += size;
             break;
         case OGS_NAS_EPS_EXTENDED_SERVICE_REQUEST_EPS_BEARER_CONTEXT_STATUS_TYPE:
-            size = ogs_nas_eps_decode_eps_bearer_context_status(&extended_service_request->eps_bearer_context_status, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_eps_bearer_context_status(&extended_service_request->eps_bearer_context_status, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_eps_bearer_context_status() failed");
+               ogs_error("ogs_nas_eps_read_eps_bearer_context_status() failed");
                return size;
             }
 
@@ -1943,11 +1995,9 @@ int ogs_nas_eps_decode_extended_service_request(ogs_nas_eps_message_t *message,
             decoded += size;
             break;
         case OGS_NAS_EPS_EXTENDED_SERVICE_REQUEST_DEVICE_PROPERTIES_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_device_properties(&extended_service_request->device_properties, pkbuf);
+            size = ogs_nas_eps_read_device_properties(&extended_service_request->device_properties, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_device_properties() failed");
+               ogs_error("ogs_nas_eps_read_device_properties() failed");
                return size;
             }
 
@@ -1955,9 +2005,10 @@ int ogs_nas_eps_decode_extended_service_request(ogs_nas_eps_message_t *message,
             decoded += size;
             break;
         case OGS_NAS_EPS_EXTENDED_SERVICE_REQUEST_UE_REQUEST_TYPE_TYPE:
-            size = ogs_nas_eps_decode_ue_request_type(&extended_service_request->ue_request_type, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_ue_request_type(&extended_service_request->ue_request_type, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_ue_request_type() failed");
+               ogs_error("ogs_nas_eps_read_ue_request_type() failed");
                return size;
             }
 
@@ -1965,9 +2016,10 @@ int ogs_nas_eps_decode_extended_service_request(ogs_nas_eps_message_t *message,
             decoded += size;
             break;
         case OGS_NAS_EPS_EXTENDED_SERVICE_REQUEST_PAGING_RESTRICTION_TYPE:
-            size = ogs_nas_eps_decode_paging_restriction(&extended_service_request->paging_restriction, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_paging_restriction(&extended_service_request->paging_restriction, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_paging_restriction() failed");
+               ogs_error("ogs_nas_eps_read_paging_restriction() failed");
                return size;
             }
 
@@ -1976,72 +2028,75 @@ int ogs_nas_eps_decode_extended_service_request(ogs_nas_eps_message_t *message,
             break;
         default:
             ogs_warn("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_service_request(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_service_request_t *service_request = &message->emm.service_request;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode SERVICE_REQUEST\n");
 
-    size = ogs_nas_eps_decode_ksi_and_sequence_number(&service_request->ksi_and_sequence_number, pkbuf);
+    size = ogs_nas_eps_read_ksi_and_sequence_number(&service_request->ksi_and_sequence_number, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_ksi_and_sequence_number() failed");
+        ogs_error("ogs_nas_eps_read_ksi_and_sequence_number() failed");
         return size;
     }
 
     decoded += size;
 
-    size = ogs_nas_eps_decode_short_mac(&service_request->message_authentication_code, pkbuf);
+    size = ogs_nas_eps_read_short_mac(&service_request->message_authentication_code, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_short_mac() failed");
+        ogs_error("ogs_nas_eps_read_short_mac() failed");
         return size;
     }
 
     decoded += size;
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_service_reject(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_service_reject_t *service_reject = &message->emm.service_reject;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode SERVICE_REJECT\n");
 
-    size = ogs_nas_eps_decode_emm_cause(&service_reject->emm_cause, pkbuf);
+    size = ogs_nas_eps_read_emm_cause(&service_reject->emm_cause, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_emm_cause() failed");
+        ogs_error("ogs_nas_eps_read_emm_cause() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch (type) {
         case OGS_NAS_EPS_SERVICE_REJECT_T3442_VALUE_TYPE:
-            size = ogs_nas_eps_decode_gprs_timer(&service_reject->t3442_value, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_gprs_timer(&service_reject->t3442_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_gprs_timer() failed");
+               ogs_error("ogs_nas_eps_read_gprs_timer() failed");
                return size;
             }
 
@@ -2049,9 +2104,10 @@ int ogs_nas_eps_decode_service_reject(ogs_nas_eps_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_EPS_SERVICE_REJECT_T3346_VALUE_TYPE:
-            size = ogs_nas_eps_decode_gprs_timer_2(&service_reject->t3346_value, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_gprs_timer_2(&service_reject->t3346_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_gprs_timer_2() failed");
+               ogs_error("ogs_nas_eps_read_gprs_timer_2() failed");
                return size;
             }
 
@@ -2059,9 +2115,10 @@ int ogs_nas_eps_decode_service_reject(ogs_nas_eps_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_EPS_SERVICE_REJECT_T3448_VALUE_TYPE:
-            size = ogs_nas_eps_decode_gprs_timer_2(&service_reject->t3448_value, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_gprs_timer_2(&service_reject->t3448_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_gprs_timer_2() failed");
+               ogs_error("ogs_nas_eps_read_gprs_timer_2() failed");
                return size;
             }
 
@@ -2069,9 +2126,10 @@ int ogs_nas_eps_decode_service_reject(ogs_nas_eps_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_EPS_SERVICE_REJECT_LOWER_BOUND_TIMER_VALUE_TYPE:
-            size = ogs_nas_eps_decode_gprs_timer_3(&service_reject->lower_bound_timer_value, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_gprs_timer_3(&service_reject->lower_bound_timer_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_gprs_timer_3() failed");
+               ogs_error("ogs_nas_eps_read_gprs_timer_3() failed");
                return size;
             }
 
@@ -2079,9 +2137,10 @@ int ogs_nas_eps_decode_service_reject(ogs_nas_eps_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_EPS_SERVICE_REJECT_FORBIDDEN_TAI_FOR_THE_LIST_OF_FORBIDDEN_TRACKING_AREAS_FOR_ROAMING_TYPE:
-            size = ogs_nas_eps_decode_tracking_area_identity_list(&service_reject->forbidden_tai_for_the_list_of_forbidden_tracking_areas_for_roaming, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_tracking_area_identity_list(&service_reject->forbidden_tai_for_the_list_of_forbidden_tracking_areas_for_roaming, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_tracking_area_identity_list() failed");
+               ogs_error("ogs_nas_eps_read_tracking_area_identity_list() failed");
                return size;
             }
 
@@ -2089,9 +2148,10 @@ int ogs_nas_eps_decode_service_reject(ogs_nas_eps_message_t *message, ogs_pkbuf_
             decoded += size;
             break;
         case OGS_NAS_EPS_SERVICE_REJECT_FORBIDDEN_TAI_FOR_THE_LIST_OF_FORBIDDEN_TRACKING_AREAS_FORREGIONAL_PROVISION_OF_SERVICE_TYPE:
-            size = ogs_nas_eps_decode_tracking_area_identity_list(&service_reject->forbidden_tai_for_the_list_of_forbidden_tracking_areas_forregional_provision_of_service, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_tracking_area_identity_list(&service_reject->forbidden_tai_for_the_list_of_forbidden_tracking_areas_forregional_provision_of_service, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_tracking_area_identity_list() failed");
+               ogs_error("ogs_nas_eps_read_tracking_area_identity_list() failed");
                return size;
             }
 
@@ -2100,45 +2160,44 @@ int ogs_nas_eps_decode_service_reject(ogs_nas_eps_message_t *message, ogs_pkbuf_
             break;
         default:
             ogs_warn("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_guti_reallocation_command(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_guti_reallocation_command_t *guti_reallocation_command = &message->emm.guti_reallocation_command;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode GUTI_REALLOCATION_COMMAND\n");
 
-    size = ogs_nas_eps_decode_eps_mobile_identity(&guti_reallocation_command->guti, pkbuf);
+    size = ogs_nas_eps_read_eps_mobile_identity(&guti_reallocation_command->guti, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_eps_mobile_identity() failed");
+        ogs_error("ogs_nas_eps_read_eps_mobile_identity() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch (type) {
         case OGS_NAS_EPS_GUTI_REALLOCATION_COMMAND_TAI_LIST_TYPE:
-            size = ogs_nas_eps_decode_tracking_area_identity_list(&guti_reallocation_command->tai_list, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_tracking_area_identity_list(&guti_reallocation_command->tai_list, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_tracking_area_identity_list() failed");
+               ogs_error("ogs_nas_eps_read_tracking_area_identity_list() failed");
                return size;
             }
 
@@ -2146,9 +2205,10 @@ int ogs_nas_eps_decode_guti_reallocation_command(ogs_nas_eps_message_t *message,
             decoded += size;
             break;
         case OGS_NAS_EPS_GUTI_REALLOCATION_COMMAND_DCN_ID_TYPE:
-            size = ogs_nas_eps_decode_dcn_id(&guti_reallocation_command->dcn_id, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_dcn_id(&guti_reallocation_command->dcn_id, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_dcn_id() failed");
+               ogs_error("ogs_nas_eps_read_dcn_id() failed");
                return size;
             }
 
@@ -2156,9 +2216,10 @@ int ogs_nas_eps_decode_guti_reallocation_command(ogs_nas_eps_message_t *message,
             decoded += size;
             break;
         case OGS_NAS_EPS_GUTI_REALLOCATION_COMMAND_UE_RADIO_CAPABILITY_ID_TYPE:
-            size = ogs_nas_eps_decode_ue_radio_capability_id(&guti_reallocation_command->ue_radio_capability_id, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_ue_radio_capability_id(&guti_reallocation_command->ue_radio_capability_id, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_ue_radio_capability_id() failed");
+               ogs_error("ogs_nas_eps_read_ue_radio_capability_id() failed");
                return size;
             }
 
@@ -2166,11 +2227,9 @@ int ogs_nas_eps_decode_guti_reallocation_command(ogs_nas_eps_message_t *message,
             decoded += size;
             break;
         case OGS_NAS_EPS_GUTI_REALLOCATION_COMMAND_UE_RADIO_CAPABILITY_ID_DELETION_INDICATION_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_ue_radio_capability_id_deletion_indication(&guti_reallocation_command->ue_radio_capability_id_deletion_indication, pkbuf);
+            size = ogs_nas_eps_read_ue_radio_capability_id_deletion_indication(&guti_reallocation_command->ue_radio_capability_id_deletion_indication, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_ue_radio_capability_id_deletion_indication() failed");
+               ogs_error("ogs_nas_eps_read_ue_radio_capability_id_deletion_indication() failed");
                return size;
             }
 
@@ -2179,137 +2238,152 @@ int ogs_nas_eps_decode_guti_reallocation_command(ogs_nas_eps_message_t *message,
             break;
         default:
             ogs_warn("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_authentication_request(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_authentication_request_t *authentication_request = &message->emm.authentication_request;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode AUTHENTICATION_REQUEST\n");
 
-    size = ogs_nas_eps_decode_key_set_identifier(&authentication_request->nas_key_set_identifierasme, pkbuf);
+    size = ogs_nas_eps_read_key_set_identifier(&authentication_request->nas_key_set_identifierasme, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_key_set_identifier() failed");
+        ogs_error("ogs_nas_eps_read_key_set_identifier() failed");
         return size;
     }
 
     decoded += size;
 
-    size = ogs_nas_eps_decode_authentication_parameter_rand(&authentication_request->authentication_parameter_rand, pkbuf);
+    size = ogs_nas_eps_read_authentication_parameter_rand(&authentication_request->authentication_parameter_rand, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_authentication_parameter_rand() failed");
+        ogs_error("ogs_nas_eps_read_authentication_parameter_rand() failed");
         return size;
     }
 
     decoded += size;
 
-    size = ogs_nas_eps_decode_authentication_parameter_autn(&authentication_request->authentication_parameter_autn, pkbuf);
+    size = ogs_nas_eps_read_authentication_parameter_autn(&authentication_request->authentication_parameter_autn, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_authentication_parameter_autn() failed");
+        ogs_error("ogs_nas_eps_read_authentication_parameter_autn() failed");
         return size;
     }
 
     decoded += size;
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_authentication_response(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_authentication_response_t *authentication_response = &message->emm.authentication_response;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode AUTHENTICATION_RESPONSE\n");
 
-    size = ogs_nas_eps_decode_authentication_response_parameter(&authentication_response->authentication_response_parameter, pkbuf);
+    size = ogs_nas_eps_read_authentication_response_parameter(&authentication_response->authentication_response_parameter, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_authentication_response_parameter() failed");
+        ogs_error("ogs_nas_eps_read_authentication_response_parameter() failed");
         return size;
     }
 
     decoded += size;
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_identity_request(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_identity_request_t *identity_request = &message->emm.identity_request;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode IDENTITY_REQUEST\n");
 
-    size = ogs_nas_eps_decode_identity_type_2(&identity_request->identity_type, pkbuf);
+    size = ogs_nas_eps_read_identity_type_2(&identity_request->identity_type, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_identity_type_2() failed");
+        ogs_error("ogs_nas_eps_read_identity_type_2() failed");
         return size;
     }
 
     decoded += size;
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_identity_response(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_identity_response_t *identity_response = &message->emm.identity_response;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode IDENTITY_RESPONSE\n");
 
-    size = ogs_nas_eps_decode_mobile_identity(&identity_response->mobile_identity, pkbuf);
+    size = ogs_nas_eps_read_mobile_identity(&identity_response->mobile_identity, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_mobile_identity() failed");
+        ogs_error("ogs_nas_eps_read_mobile_identity() failed");
         return size;
     }
 
     decoded += size;
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_authentication_failure(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_authentication_failure_t *authentication_failure = &message->emm.authentication_failure;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode AUTHENTICATION_FAILURE\n");
 
-    size = ogs_nas_eps_decode_emm_cause(&authentication_failure->emm_cause, pkbuf);
+    size = ogs_nas_eps_read_emm_cause(&authentication_failure->emm_cause, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_emm_cause() failed");
+        ogs_error("ogs_nas_eps_read_emm_cause() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch (type) {
         case OGS_NAS_EPS_AUTHENTICATION_FAILURE_AUTHENTICATION_FAILURE_PARAMETER_TYPE:
-            size = ogs_nas_eps_decode_authentication_failure_parameter(&authentication_failure->authentication_failure_parameter, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_authentication_failure_parameter(&authentication_failure->authentication_failure_parameter, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_authentication_failure_parameter() failed");
+               ogs_error("ogs_nas_eps_read_authentication_failure_parameter() failed");
                return size;
             }
 
@@ -2318,63 +2392,59 @@ int ogs_nas_eps_decode_authentication_failure(ogs_nas_eps_message_t *message, og
             break;
         default:
             ogs_warn("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_security_mode_command(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_security_mode_command_t *security_mode_command = &message->emm.security_mode_command;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode SECURITY_MODE_COMMAND\n");
 
-    size = ogs_nas_eps_decode_security_algorithms(&security_mode_command->selected_nas_security_algorithms, pkbuf);
+    size = ogs_nas_eps_read_security_algorithms(&security_mode_command->selected_nas_security_algorithms, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_security_algorithms() failed");
+        ogs_error("ogs_nas_eps_read_security_algorithms() failed");
         return size;
     }
 
     decoded += size;
 
-    size = ogs_nas_eps_decode_key_set_identifier(&security_mode_command->nas_key_set_identifier, pkbuf);
+    size = ogs_nas_eps_read_key_set_identifier(&security_mode_command->nas_key_set_identifier, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_key_set_identifier() failed");
+        ogs_error("ogs_nas_eps_read_key_set_identifier() failed");
         return size;
     }
 
     decoded += size;
 
-    size = ogs_nas_eps_decode_ue_security_capability(&security_mode_command->replayed_ue_security_capabilities, pkbuf);
+    size = ogs_nas_eps_read_ue_security_capability(&security_mode_command->replayed_ue_security_capabilities, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_ue_security_capability() failed");
+        ogs_error("ogs_nas_eps_read_ue_security_capability() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch (type) {
         case OGS_NAS_EPS_SECURITY_MODE_COMMAND_IMEISV_REQUEST_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_imeisv_request(&security_mode_command->imeisv_request, pkbuf);
+            size = ogs_nas_eps_read_imeisv_request(&security_mode_command->imeisv_request, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_imeisv_request() failed");
+               ogs_error("ogs_nas_eps_read_imeisv_request() failed");
                return size;
             }
 
@@ -2382,9 +2452,10 @@ int ogs_nas_eps_decode_security_mode_command(ogs_nas_eps_message_t *message, ogs
             decoded += size;
             break;
         case OGS_NAS_EPS_SECURITY_MODE_COMMAND_REPLAYED_NONCEUE_TYPE:
-            size = ogs_nas_eps_decode_nonce(&security_mode_command->replayed_nonceue, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_nonce(&security_mode_command->replayed_nonceue, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_nonce() failed");
+               ogs_error("ogs_nas_eps_read_nonce() failed");
                return size;
             }
 
@@ -2392,9 +2463,10 @@ int ogs_nas_eps_decode_security_mode_command(ogs_nas_eps_message_t *message, ogs
             decoded += size;
             break;
         case OGS_NAS_EPS_SECURITY_MODE_COMMAND_NONCEMME_TYPE:
-            size = ogs_nas_eps_decode_nonce(&security_mode_command->noncemme, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_nonce(&security_mode_command->noncemme, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_nonce() failed");
+               ogs_error("ogs_nas_eps_read_nonce() failed");
                return size;
             }
 
@@ -2402,9 +2474,10 @@ int ogs_nas_eps_decode_security_mode_command(ogs_nas_eps_message_t *message, ogs
             decoded += size;
             break;
         case OGS_NAS_EPS_SECURITY_MODE_COMMAND_HASHMME_TYPE:
-            size = ogs_nas_eps_decode_hashmme(&security_mode_command->hashmme, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_hashmme(&security_mode_command->hashmme, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_hashmme() failed");
+               ogs_error("ogs_nas_eps_read_hashmme() failed");
                return size;
             }
 
@@ -2412,9 +2485,10 @@ int ogs_nas_eps_decode_security_mode_command(ogs_nas_eps_message_t *message, ogs
             decoded += size;
             break;
         case OGS_NAS_EPS_SECURITY_MODE_COMMAND_REPLAYED_UE_ADDITIONAL_SECURITY_CAPABILITY_TYPE:
-            size = ogs_nas_eps_decode_ue_additional_security_capability(&security_mode_command->replayed_ue_additional_security_capability, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_ue_additional_security_capability(&security_mode_command->replayed_ue_additional_security_capability, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_ue_additional_security_capability() failed");
+               ogs_error("ogs_nas_eps_read_ue_additional_security_capability() failed");
                return size;
             }
 
@@ -2422,9 +2496,10 @@ int ogs_nas_eps_decode_security_mode_command(ogs_nas_eps_message_t *message, ogs
             decoded += size;
             break;
         case OGS_NAS_EPS_SECURITY_MODE_COMMAND_UE_RADIO_CAPABILITY_ID_REQUEST_TYPE:
-            size = ogs_nas_eps_decode_ue_radio_capability_id_request(&security_mode_command->ue_radio_capability_id_request, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_ue_radio_capability_id_request(&security_mode_command->ue_radio_capability_id_request, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_ue_radio_capability_id_request() failed");
+               ogs_error("ogs_nas_eps_read_ue_radio_capability_id_request() failed");
                return size;
             }
 
@@ -2433,37 +2508,36 @@ int ogs_nas_eps_decode_security_mode_command(ogs_nas_eps_message_t *message, ogs
             break;
         default:
             ogs_warn("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_security_mode_complete(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_security_mode_complete_t *security_mode_complete = &message->emm.security_mode_complete;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode SECURITY_MODE_COMPLETE\n");
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch (type) {
         case OGS_NAS_EPS_SECURITY_MODE_COMPLETE_IMEISV_TYPE:
-            size = ogs_nas_eps_decode_mobile_identity(&security_mode_complete->imeisv, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_mobile_identity(&security_mode_complete->imeisv, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_mobile_identity() failed");
+               ogs_error("ogs_nas_eps_read_mobile_identity() failed");
                return size;
             }
 
@@ -2471,9 +2545,10 @@ int ogs_nas_eps_decode_security_mode_complete(ogs_nas_eps_message_t *message, og
             decoded += size;
             break;
         case OGS_NAS_EPS_SECURITY_MODE_COMPLETE_REPLAYED_NAS_MESSAGE_CONTAINER_TYPE:
-            size = ogs_nas_eps_decode_replayed_nas_message_container(&security_mode_complete->replayed_nas_message_container, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_replayed_nas_message_container(&security_mode_complete->replayed_nas_message_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_replayed_nas_message_container() failed");
+               ogs_error("ogs_nas_eps_read_replayed_nas_message_container() failed");
                return size;
             }
 
@@ -2481,9 +2556,10 @@ int ogs_nas_eps_decode_security_mode_complete(ogs_nas_eps_message_t *message, og
             decoded += size;
             break;
         case OGS_NAS_EPS_SECURITY_MODE_COMPLETE_UE_RADIO_CAPABILITY_ID_TYPE:
-            size = ogs_nas_eps_decode_ue_radio_capability_id(&security_mode_complete->ue_radio_capability_id, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_ue_radio_capability_id(&security_mode_complete->ue_radio_capability_id, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_ue_radio_capability_id() failed");
+               ogs_error("ogs_nas_eps_read_ue_radio_capability_id() failed");
                return size;
             }
 
@@ -2492,75 +2568,82 @@ int ogs_nas_eps_decode_security_mode_complete(ogs_nas_eps_message_t *message, og
             break;
         default:
             ogs_warn("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_security_mode_reject(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_security_mode_reject_t *security_mode_reject = &message->emm.security_mode_reject;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode SECURITY_MODE_REJECT\n");
 
-    size = ogs_nas_eps_decode_emm_cause(&security_mode_reject->emm_cause, pkbuf);
+    size = ogs_nas_eps_read_emm_cause(&security_mode_reject->emm_cause, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_emm_cause() failed");
+        ogs_error("ogs_nas_eps_read_emm_cause() failed");
         return size;
     }
 
     decoded += size;
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_emm_status(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_emm_status_t *emm_status = &message->emm.emm_status;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode EMM_STATUS\n");
 
-    size = ogs_nas_eps_decode_emm_cause(&emm_status->emm_cause, pkbuf);
+    size = ogs_nas_eps_read_emm_cause(&emm_status->emm_cause, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_emm_cause() failed");
+        ogs_error("ogs_nas_eps_read_emm_cause() failed");
         return size;
     }
 
     decoded += size;
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_emm_information(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_emm_information_t *emm_information = &message->emm.emm_information;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode EMM_INFORMATION\n");
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch (type) {
         case OGS_NAS_EPS_EMM_INFORMATION_FULL_NAME_FOR_NETWORK_TYPE:
-            size = ogs_nas_eps_decode_network_name(&emm_information->full_name_for_network, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_network_name(&emm_information->full_name_for_network, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_network_name() failed");
+               ogs_error("ogs_nas_eps_read_network_name() failed");
                return size;
             }
 
@@ -2568,9 +2651,10 @@ int ogs_nas_eps_decode_emm_information(ogs_nas_eps_message_t *message, ogs_pkbuf
             decoded += size;
             break;
         case OGS_NAS_EPS_EMM_INFORMATION_SHORT_NAME_FOR_NETWORK_TYPE:
-            size = ogs_nas_eps_decode_network_name(&emm_information->short_name_for_network, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_network_name(&emm_information->short_name_for_network, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_network_name() failed");
+               ogs_error("ogs_nas_eps_read_network_name() failed");
                return size;
             }
 
@@ -2578,9 +2662,10 @@ int ogs_nas_eps_decode_emm_information(ogs_nas_eps_message_t *message, ogs_pkbuf
             decoded += size;
             break;
         case OGS_NAS_EPS_EMM_INFORMATION_LOCAL_TIME_ZONE_TYPE:
-            size = ogs_nas_eps_decode_time_zone(&emm_information->local_time_zone, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_time_zone(&emm_information->local_time_zone, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_time_zone() failed");
+               ogs_error("ogs_nas_eps_read_time_zone() failed");
                return size;
             }
 
@@ -2588,9 +2673,10 @@ int ogs_nas_eps_decode_emm_information(ogs_nas_eps_message_t *message, ogs_pkbuf
             decoded += size;
             break;
         case OGS_NAS_EPS_EMM_INFORMATION_UNIVERSAL_TIME_AND_LOCAL_TIME_ZONE_TYPE:
-            size = ogs_nas_eps_decode_time_zone_and_time(&emm_information->universal_time_and_local_time_zone, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_time_zone_and_time(&emm_information->universal_time_and_local_time_zone, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_time_zone_and_time() failed");
+               ogs_error("ogs_nas_eps_read_time_zone_and_time() failed");
                return size;
             }
 
@@ -2598,9 +2684,10 @@ int ogs_nas_eps_decode_emm_information(ogs_nas_eps_message_t *message, ogs_pkbuf
             decoded += size;
             break;
         case OGS_NAS_EPS_EMM_INFORMATION_NETWORK_DAYLIGHT_SAVING_TIME_TYPE:
-            size = ogs_nas_eps_decode_daylight_saving_time(&emm_information->network_daylight_saving_time, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_daylight_saving_time(&emm_information->network_daylight_saving_time, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_daylight_saving_time() failed");
+               ogs_error("ogs_nas_eps_read_daylight_saving_time() failed");
                return size;
             }
 
@@ -2609,83 +2696,90 @@ int ogs_nas_eps_decode_emm_information(ogs_nas_eps_message_t *message, ogs_pkbuf
             break;
         default:
             ogs_warn("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_downlink_nas_transport(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_downlink_nas_transport_t *downlink_nas_transport = &message->emm.downlink_nas_transport;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode DOWNLINK_NAS_TRANSPORT\n");
 
-    size = ogs_nas_eps_decode_eps_message_container(&downlink_nas_transport->nas_message_container, pkbuf);
+    size = ogs_nas_eps_read_eps_message_container(&downlink_nas_transport->nas_message_container, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_eps_message_container() failed");
+        ogs_error("ogs_nas_eps_read_eps_message_container() failed");
         return size;
     }
 
     decoded += size;
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_uplink_nas_transport(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_uplink_nas_transport_t *uplink_nas_transport = &message->emm.uplink_nas_transport;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode UPLINK_NAS_TRANSPORT\n");
 
-    size = ogs_nas_eps_decode_eps_message_container(&uplink_nas_transport->nas_message_container, pkbuf);
+    size = ogs_nas_eps_read_eps_message_container(&uplink_nas_transport->nas_message_container, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_eps_message_container() failed");
+        ogs_error("ogs_nas_eps_read_eps_message_container() failed");
         return size;
     }
 
     decoded += size;
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_cs_service_notification(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_cs_service_notification_t *cs_service_notification = &message->emm.cs_service_notification;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode CS_SERVICE_NOTIFICATION\n");
 
-    size = ogs_nas_eps_decode_paging_identity(&cs_service_notification->paging_identity, pkbuf);
+    size = ogs_nas_eps_read_paging_identity(&cs_service_notification->paging_identity, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_paging_identity() failed");
+        ogs_error("ogs_nas_eps_read_paging_identity() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch (type) {
         case OGS_NAS_EPS_CS_SERVICE_NOTIFICATION_CLI_TYPE:
-            size = ogs_nas_eps_decode_cli(&cs_service_notification->cli, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_cli(&cs_service_notification->cli, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_cli() failed");
+               ogs_error("ogs_nas_eps_read_cli() failed");
                return size;
             }
 
@@ -2693,9 +2787,10 @@ int ogs_nas_eps_decode_cs_service_notification(ogs_nas_eps_message_t *message, o
             decoded += size;
             break;
         case OGS_NAS_EPS_CS_SERVICE_NOTIFICATION_SS_CODE_TYPE:
-            size = ogs_nas_eps_decode_ss_code(&cs_service_notification->ss_code, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_ss_code(&cs_service_notification->ss_code, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_ss_code() failed");
+               ogs_error("ogs_nas_eps_read_ss_code() failed");
                return size;
             }
 
@@ -2703,9 +2798,10 @@ int ogs_nas_eps_decode_cs_service_notification(ogs_nas_eps_message_t *message, o
             decoded += size;
             break;
         case OGS_NAS_EPS_CS_SERVICE_NOTIFICATION_LCS_INDICATOR_TYPE:
-            size = ogs_nas_eps_decode_lcs_indicator(&cs_service_notification->lcs_indicator, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_lcs_indicator(&cs_service_notification->lcs_indicator, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_lcs_indicator() failed");
+               ogs_error("ogs_nas_eps_read_lcs_indicator() failed");
                return size;
             }
 
@@ -2713,9 +2809,10 @@ int ogs_nas_eps_decode_cs_service_notification(ogs_nas_eps_message_t *message, o
             decoded += size;
             break;
         case OGS_NAS_EPS_CS_SERVICE_NOTIFICATION_LCS_CLIENT_IDENTITY_TYPE:
-            size = ogs_nas_eps_decode_lcs_client_identity(&cs_service_notification->lcs_client_identity, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_lcs_client_identity(&cs_service_notification->lcs_client_identity, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_lcs_client_identity() failed");
+               ogs_error("ogs_nas_eps_read_lcs_client_identity() failed");
                return size;
             }
 
@@ -2724,53 +2821,52 @@ int ogs_nas_eps_decode_cs_service_notification(ogs_nas_eps_message_t *message, o
             break;
         default:
             ogs_warn("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_uplink_generic_nas_transport(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_uplink_generic_nas_transport_t *uplink_generic_nas_transport = &message->emm.uplink_generic_nas_transport;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode UPLINK_GENERIC_NAS_TRANSPORT\n");
 
-    size = ogs_nas_eps_decode_generic_message_container_type(&uplink_generic_nas_transport->generic_message_container_type, pkbuf);
+    size = ogs_nas_eps_read_generic_message_container_type(&uplink_generic_nas_transport->generic_message_container_type, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_generic_message_container_type() failed");
+        ogs_error("ogs_nas_eps_read_generic_message_container_type() failed");
         return size;
     }
 
     decoded += size;
 
-    size = ogs_nas_eps_decode_generic_message_container(&uplink_generic_nas_transport->generic_message_container, pkbuf);
+    size = ogs_nas_eps_read_generic_message_container(&uplink_generic_nas_transport->generic_message_container, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_generic_message_container() failed");
+        ogs_error("ogs_nas_eps_read_generic_message_container() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch (type) {
         case OGS_NAS_EPS_UPLINK_GENERIC_NAS_TRANSPORT_ADDITIONAL_INFORMATION_TYPE:
-            size = ogs_nas_eps_decode_additional_information(&uplink_generic_nas_transport->additional_information, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_additional_information(&uplink_generic_nas_transport->additional_information, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_additional_information() failed");
+               ogs_error("ogs_nas_eps_read_additional_information() failed");
                return size;
             }
 
@@ -2779,53 +2875,52 @@ int ogs_nas_eps_decode_uplink_generic_nas_transport(ogs_nas_eps_message_t *messa
             break;
         default:
             ogs_warn("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_downlink_generic_nas_transport(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_downlink_generic_nas_transport_t *downlink_generic_nas_transport = &message->emm.downlink_generic_nas_transport;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode DOWNLINK_GENERIC_NAS_TRANSPORT\n");
 
-    size = ogs_nas_eps_decode_generic_message_container_type(&downlink_generic_nas_transport->generic_message_container_type, pkbuf);
+    size = ogs_nas_eps_read_generic_message_container_type(&downlink_generic_nas_transport->generic_message_container_type, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_generic_message_container_type() failed");
+        ogs_error("ogs_nas_eps_read_generic_message_container_type() failed");
         return size;
     }
 
     decoded += size;
 
-    size = ogs_nas_eps_decode_generic_message_container(&downlink_generic_nas_transport->generic_message_container, pkbuf);
+    size = ogs_nas_eps_read_generic_message_container(&downlink_generic_nas_transport->generic_message_container, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_generic_message_container() failed");
+        ogs_error("ogs_nas_eps_read_generic_message_container() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch (type) {
         case OGS_NAS_EPS_DOWNLINK_GENERIC_NAS_TRANSPORT_ADDITIONAL_INFORMATION_TYPE:
-            size = ogs_nas_eps_decode_additional_information(&downlink_generic_nas_transport->additional_information, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_additional_information(&downlink_generic_nas_transport->additional_information, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_additional_information() failed");
+               ogs_error("ogs_nas_eps_read_additional_information() failed");
                return size;
             }
 
@@ -2834,61 +2929,60 @@ int ogs_nas_eps_decode_downlink_generic_nas_transport(ogs_nas_eps_message_t *mes
             break;
         default:
             ogs_warn("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_activate_default_eps_bearer_context_request(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_activate_default_eps_bearer_context_request_t *activate_default_eps_bearer_context_request = &message->esm.activate_default_eps_bearer_context_request;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST\n");
 
-    size = ogs_nas_eps_decode_eps_quality_of_service(&activate_default_eps_bearer_context_request->eps_qos, pkbuf);
+    size = ogs_nas_eps_read_eps_quality_of_service(&activate_default_eps_bearer_context_request->eps_qos, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_eps_quality_of_service() failed");
+        ogs_error("ogs_nas_eps_read_eps_quality_of_service() failed");
         return size;
     }
 
     decoded += size;
 
-    size = ogs_nas_eps_decode_access_point_name(&activate_default_eps_bearer_context_request->access_point_name, pkbuf);
+    size = ogs_nas_eps_read_access_point_name(&activate_default_eps_bearer_context_request->access_point_name, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_access_point_name() failed");
+        ogs_error("ogs_nas_eps_read_access_point_name() failed");
         return size;
     }
 
     decoded += size;
 
-    size = ogs_nas_eps_decode_pdn_address(&activate_default_eps_bearer_context_request->pdn_address, pkbuf);
+    size = ogs_nas_eps_read_pdn_address(&activate_default_eps_bearer_context_request->pdn_address, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_pdn_address() failed");
+        ogs_error("ogs_nas_eps_read_pdn_address() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch (type) {
         case OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_TRANSACTION_IDENTIFIER_TYPE:
-            size = ogs_nas_eps_decode_transaction_identifier(&activate_default_eps_bearer_context_request->transaction_identifier, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_transaction_identifier(&activate_default_eps_bearer_context_request->transaction_identifier, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_transaction_identifier() failed");
+               ogs_error("ogs_nas_eps_read_transaction_identifier() failed");
                return size;
             }
 
@@ -2896,9 +2990,10 @@ int ogs_nas_eps_decode_activate_default_eps_bearer_context_request(ogs_nas_eps_m
             decoded += size;
             break;
         case OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_NEGOTIATED_QOS_TYPE:
-            size = ogs_nas_eps_decode_quality_of_service(&activate_default_eps_bearer_context_request->negotiated_qos, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_quality_of_service(&activate_default_eps_bearer_context_request->negotiated_qos, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_quality_of_service() failed");
+               ogs_error("ogs_nas_eps_read_quality_of_service() failed");
                return size;
             }
 
@@ -2906,9 +3001,10 @@ int ogs_nas_eps_decode_activate_default_eps_bearer_context_request(ogs_nas_eps_m
             decoded += size;
             break;
         case OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_NEGOTIATED_LLC_SAPI_TYPE:
-            size = ogs_nas_eps_decode_llc_service_access_point_identifier(&activate_default_eps_bearer_context_request->negotiated_llc_sapi, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_llc_service_access_point_identifier(&activate_default_eps_bearer_context_request->negotiated_llc_sapi, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_llc_service_access_point_identifier() failed");
+               ogs_error("ogs_nas_eps_read_llc_service_access_point_identifier() failed");
                return size;
             }
 
@@ -2916,11 +3012,9 @@ int ogs_nas_eps_decode_activate_default_eps_bearer_context_request(ogs_nas_eps_m
             decoded += size;
             break;
         case OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_RADIO_PRIORITY_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_radio_priority(&activate_default_eps_bearer_context_request->radio_priority, pkbuf);
+            size = ogs_nas_eps_read_radio_priority(&activate_default_eps_bearer_context_request->radio_priority, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_radio_priority() failed");
+               ogs_error("ogs_nas_eps_read_radio_priority() failed");
                return size;
             }
 
@@ -2928,9 +3022,10 @@ int ogs_nas_eps_decode_activate_default_eps_bearer_context_request(ogs_nas_eps_m
             decoded += size;
             break;
         case OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_PACKET_FLOW_IDENTIFIER_TYPE:
-            size = ogs_nas_eps_decode_packet_flow_identifier(&activate_default_eps_bearer_context_request->packet_flow_identifier, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_packet_flow_identifier(&activate_default_eps_bearer_context_request->packet_flow_identifier, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_packet_flow_identifier() failed");
+               ogs_error("ogs_nas_eps_read_packet_flow_identifier() failed");
                return size;
             }
 
@@ -2938,9 +3033,10 @@ int ogs_nas_eps_decode_activate_default_eps_bearer_context_request(ogs_nas_eps_m
             decoded += size;
             break;
         case OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_APN_AMBR_TYPE:
-            size = ogs_nas_eps_decode_apn_aggregate_maximum_bit_rate(&activate_default_eps_bearer_context_request->apn_ambr, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_apn_aggregate_maximum_bit_rate(&activate_default_eps_bearer_context_request->apn_ambr, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_apn_aggregate_maximum_bit_rate() failed");
+               ogs_error("ogs_nas_eps_read_apn_aggregate_maximum_bit_rate() failed");
                return size;
             }
 
@@ -2948,9 +3044,10 @@ int ogs_nas_eps_decode_activate_default_eps_bearer_context_request(ogs_nas_eps_m
             decoded += size;
             break;
         case OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_ESM_CAUSE_TYPE:
-            size = ogs_nas_eps_decode_esm_cause(&activate_default_eps_bearer_context_request->esm_cause, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_esm_cause(&activate_default_eps_bearer_context_request->esm_cause, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_esm_cause() failed");
+               ogs_error("ogs_nas_eps_read_esm_cause() failed");
                return size;
             }
 
@@ -2958,9 +3055,10 @@ int ogs_nas_eps_decode_activate_default_eps_bearer_context_request(ogs_nas_eps_m
             decoded += size;
             break;
         case OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_protocol_configuration_options(&activate_default_eps_bearer_context_request->protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_protocol_configuration_options(&activate_default_eps_bearer_context_request->protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_protocol_configuration_options() failed");
                return size;
             }
 
@@ -2968,11 +3066,9 @@ int ogs_nas_eps_decode_activate_default_eps_bearer_context_request(ogs_nas_eps_m
             decoded += size;
             break;
         case OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_CONNECTIVITY_TYPE_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_connectivity_type(&activate_default_eps_bearer_context_request->connectivity_type, pkbuf);
+            size = ogs_nas_eps_read_connectivity_type(&activate_default_eps_bearer_context_request->connectivity_type, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_connectivity_type() failed");
+               ogs_error("ogs_nas_eps_read_connectivity_type() failed");
                return size;
             }
 
@@ -2980,11 +3076,9 @@ int ogs_nas_eps_decode_activate_default_eps_bearer_context_request(ogs_nas_eps_m
             decoded += size;
             break;
         case OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_WLAN_OFFLOAD_INDICATION_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_wlan_offload_acceptability(&activate_default_eps_bearer_context_request->wlan_offload_indication, pkbuf);
+            size = ogs_nas_eps_read_wlan_offload_acceptability(&activate_default_eps_bearer_context_request->wlan_offload_indication, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_wlan_offload_acceptability() failed");
+               ogs_error("ogs_nas_eps_read_wlan_offload_acceptability() failed");
                return size;
             }
 
@@ -2992,9 +3086,10 @@ int ogs_nas_eps_decode_activate_default_eps_bearer_context_request(ogs_nas_eps_m
             decoded += size;
             break;
         case OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_NBIFOM_CONTAINER_TYPE:
-            size = ogs_nas_eps_decode_nbifom_container(&activate_default_eps_bearer_context_request->nbifom_container, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_nbifom_container(&activate_default_eps_bearer_context_request->nbifom_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_nbifom_container() failed");
+               ogs_error("ogs_nas_eps_read_nbifom_container() failed");
                return size;
             }
 
@@ -3002,9 +3097,10 @@ int ogs_nas_eps_decode_activate_default_eps_bearer_context_request(ogs_nas_eps_m
             decoded += size;
             break;
         case OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_HEADER_COMPRESSION_CONFIGURATION_TYPE:
-            size = ogs_nas_eps_decode_header_compression_configuration(&activate_default_eps_bearer_context_request->header_compression_configuration, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_header_compression_configuration(&activate_default_eps_bearer_context_request->header_compression_configuration, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_header_compression_configuration() failed");
+               ogs_error("ogs_nas_eps_read_header_compression_configuration() failed");
                return size;
             }
 
@@ -3012,11 +3108,9 @@ int ogs_nas_eps_decode_activate_default_eps_bearer_context_request(ogs_nas_eps_m
             decoded += size;
             break;
         case OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_CONTROL_PLANE_ONLY_INDICATION_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_control_plane_only_indication(&activate_default_eps_bearer_context_request->control_plane_only_indication, pkbuf);
+            size = ogs_nas_eps_read_control_plane_only_indication(&activate_default_eps_bearer_context_request->control_plane_only_indication, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_control_plane_only_indication() failed");
+               ogs_error("ogs_nas_eps_read_control_plane_only_indication() failed");
                return size;
             }
 
@@ -3024,9 +3118,10 @@ int ogs_nas_eps_decode_activate_default_eps_bearer_context_request(ogs_nas_eps_m
             decoded += size;
             break;
         case OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_extended_protocol_configuration_options(&activate_default_eps_bearer_context_request->extended_protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_extended_protocol_configuration_options(&activate_default_eps_bearer_context_request->extended_protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_extended_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_extended_protocol_configuration_options() failed");
                return size;
             }
 
@@ -3034,9 +3129,10 @@ int ogs_nas_eps_decode_activate_default_eps_bearer_context_request(ogs_nas_eps_m
             decoded += size;
             break;
         case OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_SERVING_PLMN_RATE_CONTROL_TYPE:
-            size = ogs_nas_eps_decode_serving_plmn_rate_control(&activate_default_eps_bearer_context_request->serving_plmn_rate_control, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_serving_plmn_rate_control(&activate_default_eps_bearer_context_request->serving_plmn_rate_control, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_serving_plmn_rate_control() failed");
+               ogs_error("ogs_nas_eps_read_serving_plmn_rate_control() failed");
                return size;
             }
 
@@ -3044,9 +3140,10 @@ int ogs_nas_eps_decode_activate_default_eps_bearer_context_request(ogs_nas_eps_m
             decoded += size;
             break;
         case OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_EXTENDED_APN_AMBR_TYPE:
-            size = ogs_nas_eps_decode_extended_apn_aggregate_maximum_bit_rate(&activate_default_eps_bearer_context_request->extended_apn_ambr, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_extended_apn_aggregate_maximum_bit_rate(&activate_default_eps_bearer_context_request->extended_apn_ambr, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_extended_apn_aggregate_maximum_bit_rate() failed");
+               ogs_error("ogs_nas_eps_read_extended_apn_aggregate_maximum_bit_rate() failed");
                return size;
             }
 
@@ -3055,37 +3152,36 @@ int ogs_nas_eps_decode_activate_default_eps_bearer_context_request(ogs_nas_eps_m
             break;
         default:
             ogs_warn("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_activate_default_eps_bearer_context_accept(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_activate_default_eps_bearer_context_accept_t *activate_default_eps_bearer_context_accept = &message->esm.activate_default_eps_bearer_context_accept;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_ACCEPT\n");
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch (type) {
         case OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_ACCEPT_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_protocol_configuration_options(&activate_default_eps_bearer_context_accept->protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_protocol_configuration_options(&activate_default_eps_bearer_context_accept->protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_protocol_configuration_options() failed");
                return size;
             }
 
@@ -3093,9 +3189,10 @@ int ogs_nas_eps_decode_activate_default_eps_bearer_context_accept(ogs_nas_eps_me
             decoded += size;
             break;
         case OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_ACCEPT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_extended_protocol_configuration_options(&activate_default_eps_bearer_context_accept->extended_protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_extended_protocol_configuration_options(&activate_default_eps_bearer_context_accept->extended_protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_extended_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_extended_protocol_configuration_options() failed");
                return size;
             }
 
@@ -3104,45 +3201,44 @@ int ogs_nas_eps_decode_activate_default_eps_bearer_context_accept(ogs_nas_eps_me
             break;
         default:
             ogs_warn("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_activate_default_eps_bearer_context_reject(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_activate_default_eps_bearer_context_reject_t *activate_default_eps_bearer_context_reject = &message->esm.activate_default_eps_bearer_context_reject;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REJECT\n");
 
-    size = ogs_nas_eps_decode_esm_cause(&activate_default_eps_bearer_context_reject->esm_cause, pkbuf);
+    size = ogs_nas_eps_read_esm_cause(&activate_default_eps_bearer_context_reject->esm_cause, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_esm_cause() failed");
+        ogs_error("ogs_nas_eps_read_esm_cause() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch (type) {
         case OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REJECT_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_protocol_configuration_options(&activate_default_eps_bearer_context_reject->protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_protocol_configuration_options(&activate_default_eps_bearer_context_reject->protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_protocol_configuration_options() failed");
                return size;
             }
 
@@ -3150,9 +3246,10 @@ int ogs_nas_eps_decode_activate_default_eps_bearer_context_reject(ogs_nas_eps_me
             decoded += size;
             break;
         case OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REJECT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_extended_protocol_configuration_options(&activate_default_eps_bearer_context_reject->extended_protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_extended_protocol_configuration_options(&activate_default_eps_bearer_context_reject->extended_protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_extended_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_extended_protocol_configuration_options() failed");
                return size;
             }
 
@@ -3161,61 +3258,60 @@ int ogs_nas_eps_decode_activate_default_eps_bearer_context_reject(ogs_nas_eps_me
             break;
         default:
             ogs_warn("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_activate_dedicated_eps_bearer_context_request(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_activate_dedicated_eps_bearer_context_request_t *activate_dedicated_eps_bearer_context_request = &message->esm.activate_dedicated_eps_bearer_context_request;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REQUEST\n");
 
-    size = ogs_nas_eps_decode_linked_eps_bearer_identity(&activate_dedicated_eps_bearer_context_request->linked_eps_bearer_identity, pkbuf);
+    size = ogs_nas_eps_read_linked_eps_bearer_identity(&activate_dedicated_eps_bearer_context_request->linked_eps_bearer_identity, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_linked_eps_bearer_identity() failed");
+        ogs_error("ogs_nas_eps_read_linked_eps_bearer_identity() failed");
         return size;
     }
 
     decoded += size;
 
-    size = ogs_nas_eps_decode_eps_quality_of_service(&activate_dedicated_eps_bearer_context_request->eps_qos, pkbuf);
+    size = ogs_nas_eps_read_eps_quality_of_service(&activate_dedicated_eps_bearer_context_request->eps_qos, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_eps_quality_of_service() failed");
+        ogs_error("ogs_nas_eps_read_eps_quality_of_service() failed");
         return size;
     }
 
     decoded += size;
 
-    size = ogs_nas_eps_decode_traffic_flow_template(&activate_dedicated_eps_bearer_context_request->tft, pkbuf);
+    size = ogs_nas_eps_read_traffic_flow_template(&activate_dedicated_eps_bearer_context_request->tft, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_traffic_flow_template() failed");
+        ogs_error("ogs_nas_eps_read_traffic_flow_template() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch (type) {
         case OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REQUEST_TRANSACTION_IDENTIFIER_TYPE:
-            size = ogs_nas_eps_decode_transaction_identifier(&activate_dedicated_eps_bearer_context_request->transaction_identifier, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_transaction_identifier(&activate_dedicated_eps_bearer_context_request->transaction_identifier, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_transaction_identifier() failed");
+               ogs_error("ogs_nas_eps_read_transaction_identifier() failed");
                return size;
             }
 
@@ -3223,9 +3319,10 @@ int ogs_nas_eps_decode_activate_dedicated_eps_bearer_context_request(ogs_nas_eps
             decoded += size;
             break;
         case OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REQUEST_NEGOTIATED_QOS_TYPE:
-            size = ogs_nas_eps_decode_quality_of_service(&activate_dedicated_eps_bearer_context_request->negotiated_qos, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_quality_of_service(&activate_dedicated_eps_bearer_context_request->negotiated_qos, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_quality_of_service() failed");
+               ogs_error("ogs_nas_eps_read_quality_of_service() failed");
                return size;
             }
 
@@ -3233,9 +3330,10 @@ int ogs_nas_eps_decode_activate_dedicated_eps_bearer_context_request(ogs_nas_eps
             decoded += size;
             break;
         case OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REQUEST_NEGOTIATED_LLC_SAPI_TYPE:
-            size = ogs_nas_eps_decode_llc_service_access_point_identifier(&activate_dedicated_eps_bearer_context_request->negotiated_llc_sapi, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_llc_service_access_point_identifier(&activate_dedicated_eps_bearer_context_request->negotiated_llc_sapi, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_llc_service_access_point_identifier() failed");
+               ogs_error("ogs_nas_eps_read_llc_service_access_point_identifier() failed");
                return size;
             }
 
@@ -3243,11 +3341,9 @@ int ogs_nas_eps_decode_activate_dedicated_eps_bearer_context_request(ogs_nas_eps
             decoded += size;
             break;
         case OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REQUEST_RADIO_PRIORITY_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_radio_priority(&activate_dedicated_eps_bearer_context_request->radio_priority, pkbuf);
+            size = ogs_nas_eps_read_radio_priority(&activate_dedicated_eps_bearer_context_request->radio_priority, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_radio_priority() failed");
+               ogs_error("ogs_nas_eps_read_radio_priority() failed");
                return size;
             }
 
@@ -3255,9 +3351,10 @@ int ogs_nas_eps_decode_activate_dedicated_eps_bearer_context_request(ogs_nas_eps
             decoded += size;
             break;
         case OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REQUEST_PACKET_FLOW_IDENTIFIER_TYPE:
-            size = ogs_nas_eps_decode_packet_flow_identifier(&activate_dedicated_eps_bearer_context_request->packet_flow_identifier, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_packet_flow_identifier(&activate_dedicated_eps_bearer_context_request->packet_flow_identifier, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_packet_flow_identifier() failed");
+               ogs_error("ogs_nas_eps_read_packet_flow_identifier() failed");
                return size;
             }
 
@@ -3265,9 +3362,10 @@ int ogs_nas_eps_decode_activate_dedicated_eps_bearer_context_request(ogs_nas_eps
             decoded += size;
             break;
         case OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REQUEST_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_protocol_configuration_options(&activate_dedicated_eps_bearer_context_request->protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_protocol_configuration_options(&activate_dedicated_eps_bearer_context_request->protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_protocol_configuration_options() failed");
                return size;
             }
 
@@ -3275,11 +3373,9 @@ int ogs_nas_eps_decode_activate_dedicated_eps_bearer_context_request(ogs_nas_eps
             decoded += size;
             break;
         case OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REQUEST_WLAN_OFFLOAD_INDICATION_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_wlan_offload_acceptability(&activate_dedicated_eps_bearer_context_request->wlan_offload_indication, pkbuf);
+            size = ogs_nas_eps_read_wlan_offload_acceptability(&activate_dedicated_eps_bearer_context_request->wlan_offload_indication, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_wlan_offload_acceptability() failed");
+               ogs_error("ogs_nas_eps_read_wlan_offload_acceptability() failed");
                return size;
             }
 
@@ -3287,9 +3383,10 @@ int ogs_nas_eps_decode_activate_dedicated_eps_bearer_context_request(ogs_nas_eps
             decoded += size;
             break;
         case OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REQUEST_NBIFOM_CONTAINER_TYPE:
-            size = ogs_nas_eps_decode_nbifom_container(&activate_dedicated_eps_bearer_context_request->nbifom_container, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_nbifom_container(&activate_dedicated_eps_bearer_context_request->nbifom_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_nbifom_container() failed");
+               ogs_error("ogs_nas_eps_read_nbifom_container() failed");
                return size;
             }
 
@@ -3297,9 +3394,10 @@ int ogs_nas_eps_decode_activate_dedicated_eps_bearer_context_request(ogs_nas_eps
             decoded += size;
             break;
         case OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REQUEST_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_extended_protocol_configuration_options(&activate_dedicated_eps_bearer_context_request->extended_protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_extended_protocol_configuration_options(&activate_dedicated_eps_bearer_context_request->extended_protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_extended_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_extended_protocol_configuration_options() failed");
                return size;
             }
 
@@ -3307,9 +3405,10 @@ int ogs_nas_eps_decode_activate_dedicated_eps_bearer_context_request(ogs_nas_eps
             decoded += size;
             break;
         case OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REQUEST_EXTENDED_EPS_QOS_TYPE:
-            size = ogs_nas_eps_decode_extended_quality_of_service(&activate_dedicated_eps_bearer_context_request->extended_eps_qos, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_extended_quality_of_service(&activate_dedicated_eps_bearer_context_request->extended_eps_qos, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_extended_quality_of_service() failed");
+               ogs_error("ogs_nas_eps_read_extended_quality_of_service() failed");
                return size;
             }
 
@@ -3318,37 +3417,36 @@ int ogs_nas_eps_decode_activate_dedicated_eps_bearer_context_request(ogs_nas_eps
             break;
         default:
             ogs_warn("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_activate_dedicated_eps_bearer_context_accept(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_activate_dedicated_eps_bearer_context_accept_t *activate_dedicated_eps_bearer_context_accept = &message->esm.activate_dedicated_eps_bearer_context_accept;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_ACCEPT\n");
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch (type) {
         case OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_ACCEPT_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_protocol_configuration_options(&activate_dedicated_eps_bearer_context_accept->protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_protocol_configuration_options(&activate_dedicated_eps_bearer_context_accept->protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_protocol_configuration_options() failed");
                return size;
             }
 
@@ -3356,9 +3454,10 @@ int ogs_nas_eps_decode_activate_dedicated_eps_bearer_context_accept(ogs_nas_eps_
             decoded += size;
             break;
         case OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_ACCEPT_NBIFOM_CONTAINER_TYPE:
-            size = ogs_nas_eps_decode_nbifom_container(&activate_dedicated_eps_bearer_context_accept->nbifom_container, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_nbifom_container(&activate_dedicated_eps_bearer_context_accept->nbifom_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_nbifom_container() failed");
+               ogs_error("ogs_nas_eps_read_nbifom_container() failed");
                return size;
             }
 
@@ -3366,9 +3465,10 @@ int ogs_nas_eps_decode_activate_dedicated_eps_bearer_context_accept(ogs_nas_eps_
             decoded += size;
             break;
         case OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_ACCEPT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_extended_protocol_configuration_options(&activate_dedicated_eps_bearer_context_accept->extended_protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_extended_protocol_configuration_options(&activate_dedicated_eps_bearer_context_accept->extended_protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_extended_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_extended_protocol_configuration_options() failed");
                return size;
             }
 
@@ -3377,45 +3477,44 @@ int ogs_nas_eps_decode_activate_dedicated_eps_bearer_context_accept(ogs_nas_eps_
             break;
         default:
             ogs_warn("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_activate_dedicated_eps_bearer_context_reject(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_activate_dedicated_eps_bearer_context_reject_t *activate_dedicated_eps_bearer_context_reject = &message->esm.activate_dedicated_eps_bearer_context_reject;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REJECT\n");
 
-    size = ogs_nas_eps_decode_esm_cause(&activate_dedicated_eps_bearer_context_reject->esm_cause, pkbuf);
+    size = ogs_nas_eps_read_esm_cause(&activate_dedicated_eps_bearer_context_reject->esm_cause, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_esm_cause() failed");
+        ogs_error("ogs_nas_eps_read_esm_cause() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch (type) {
         case OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REJECT_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_protocol_configuration_options(&activate_dedicated_eps_bearer_context_reject->protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_protocol_configuration_options(&activate_dedicated_eps_bearer_context_reject->protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_protocol_configuration_options() failed");
                return size;
             }
 
@@ -3423,9 +3522,10 @@ int ogs_nas_eps_decode_activate_dedicated_eps_bearer_context_reject(ogs_nas_eps_
             decoded += size;
             break;
         case OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REJECT_NBIFOM_CONTAINER_TYPE:
-            size = ogs_nas_eps_decode_nbifom_container(&activate_dedicated_eps_bearer_context_reject->nbifom_container, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_nbifom_container(&activate_dedicated_eps_bearer_context_reject->nbifom_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_nbifom_container() failed");
+               ogs_error("ogs_nas_eps_read_nbifom_container() failed");
                return size;
             }
 
@@ -3433,9 +3533,10 @@ int ogs_nas_eps_decode_activate_dedicated_eps_bearer_context_reject(ogs_nas_eps_
             decoded += size;
             break;
         case OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REJECT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_extended_protocol_configuration_options(&activate_dedicated_eps_bearer_context_reject->extended_protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_extended_protocol_configuration_options(&activate_dedicated_eps_bearer_context_reject->extended_protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_extended_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_extended_protocol_configuration_options() failed");
                return size;
             }
 
@@ -3444,37 +3545,36 @@ int ogs_nas_eps_decode_activate_dedicated_eps_bearer_context_reject(ogs_nas_eps_
             break;
         default:
             ogs_warn("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_modify_eps_bearer_context_request(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_modify_eps_bearer_context_request_t *modify_eps_bearer_context_request = &message->esm.modify_eps_bearer_context_request;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode MODIFY_EPS_BEARER_CONTEXT_REQUEST\n");
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch (type) {
         case OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_NEW_EPS_QOS_TYPE:
-            size = ogs_nas_eps_decode_eps_quality_of_service(&modify_eps_bearer_context_request->new_eps_qos, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_eps_quality_of_service(&modify_eps_bearer_context_request->new_eps_qos, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_eps_quality_of_service() failed");
+               ogs_error("ogs_nas_eps_read_eps_quality_of_service() failed");
                return size;
             }
 
@@ -3482,9 +3582,10 @@ int ogs_nas_eps_decode_modify_eps_bearer_context_request(ogs_nas_eps_message_t *
             decoded += size;
             break;
         case OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_TFT_TYPE:
-            size = ogs_nas_eps_decode_traffic_flow_template(&modify_eps_bearer_context_request->tft, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_traffic_flow_template(&modify_eps_bearer_context_request->tft, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_traffic_flow_template() failed");
+               ogs_error("ogs_nas_eps_read_traffic_flow_template() failed");
                return size;
             }
 
@@ -3492,9 +3593,10 @@ int ogs_nas_eps_decode_modify_eps_bearer_context_request(ogs_nas_eps_message_t *
             decoded += size;
             break;
         case OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_NEW_QOS_TYPE:
-            size = ogs_nas_eps_decode_quality_of_service(&modify_eps_bearer_context_request->new_qos, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_quality_of_service(&modify_eps_bearer_context_request->new_qos, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_quality_of_service() failed");
+               ogs_error("ogs_nas_eps_read_quality_of_service() failed");
                return size;
             }
 
@@ -3502,9 +3604,10 @@ int ogs_nas_eps_decode_modify_eps_bearer_context_request(ogs_nas_eps_message_t *
             decoded += size;
             break;
         case OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_NEGOTIATED_LLC_SAPI_TYPE:
-            size = ogs_nas_eps_decode_llc_service_access_point_identifier(&modify_eps_bearer_context_request->negotiated_llc_sapi, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_llc_service_access_point_identifier(&modify_eps_bearer_context_request->negotiated_llc_sapi, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_llc_service_access_point_identifier() failed");
+               ogs_error("ogs_nas_eps_read_llc_service_access_point_identifier() failed");
                return size;
             }
 
@@ -3512,11 +3615,9 @@ int ogs_nas_eps_decode_modify_eps_bearer_context_request(ogs_nas_eps_message_t *
             decoded += size;
             break;
         case OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_RADIO_PRIORITY_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_radio_priority(&modify_eps_bearer_context_request->radio_priority, pkbuf);
+            size = ogs_nas_eps_read_radio_priority(&modify_eps_bearer_context_request->radio_priority, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_radio_priority() failed");
+               ogs_error("ogs_nas_eps_read_radio_priority() failed");
                return size;
             }
 
@@ -3524,9 +3625,10 @@ int ogs_nas_eps_decode_modify_eps_bearer_context_request(ogs_nas_eps_message_t *
             decoded += size;
             break;
         case OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_PACKET_FLOW_IDENTIFIER_TYPE:
-            size = ogs_nas_eps_decode_packet_flow_identifier(&modify_eps_bearer_context_request->packet_flow_identifier, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_packet_flow_identifier(&modify_eps_bearer_context_request->packet_flow_identifier, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_packet_flow_identifier() failed");
+               ogs_error("ogs_nas_eps_read_packet_flow_identifier() failed");
                return size;
             }
 
@@ -3534,9 +3636,10 @@ int ogs_nas_eps_decode_modify_eps_bearer_context_request(ogs_nas_eps_message_t *
             decoded += size;
             break;
         case OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_APN_AMBR_TYPE:
-            size = ogs_nas_eps_decode_apn_aggregate_maximum_bit_rate(&modify_eps_bearer_context_request->apn_ambr, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_apn_aggregate_maximum_bit_rate(&modify_eps_bearer_context_request->apn_ambr, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_apn_aggregate_maximum_bit_rate() failed");
+               ogs_error("ogs_nas_eps_read_apn_aggregate_maximum_bit_rate() failed");
                return size;
             }
 
@@ -3544,9 +3647,10 @@ int ogs_nas_eps_decode_modify_eps_bearer_context_request(ogs_nas_eps_message_t *
             decoded += size;
             break;
         case OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_protocol_configuration_options(&modify_eps_bearer_context_request->protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_protocol_configuration_options(&modify_eps_bearer_context_request->protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_protocol_configuration_options() failed");
                return size;
             }
 
@@ -3554,11 +3658,9 @@ int ogs_nas_eps_decode_modify_eps_bearer_context_request(ogs_nas_eps_message_t *
             decoded += size;
             break;
         case OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_WLAN_OFFLOAD_INDICATION_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_wlan_offload_acceptability(&modify_eps_bearer_context_request->wlan_offload_indication, pkbuf);
+            size = ogs_nas_eps_read_wlan_offload_acceptability(&modify_eps_bearer_context_request->wlan_offload_indication, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_wlan_offload_acceptability() failed");
+               ogs_error("ogs_nas_eps_read_wlan_offload_acceptability() failed");
                return size;
             }
 
@@ -3566,9 +3668,10 @@ int ogs_nas_eps_decode_modify_eps_bearer_context_request(ogs_nas_eps_message_t *
             decoded += size;
             break;
         case OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_NBIFOM_CONTAINER_TYPE:
-            size = ogs_nas_eps_decode_nbifom_container(&modify_eps_bearer_context_request->nbifom_container, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_nbifom_container(&modify_eps_bearer_context_request->nbifom_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_nbifom_container() failed");
+               ogs_error("ogs_nas_eps_read_nbifom_container() failed");
                return size;
             }
 
@@ -3576,9 +3679,10 @@ int ogs_nas_eps_decode_modify_eps_bearer_context_request(ogs_nas_eps_message_t *
             decoded += size;
             break;
         case OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_HEADER_COMPRESSION_CONFIGURATION_TYPE:
-            size = ogs_nas_eps_decode_header_compression_configuration(&modify_eps_bearer_context_request->header_compression_configuration, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_header_compression_configuration(&modify_eps_bearer_context_request->header_compression_configuration, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_header_compression_configuration() failed");
+               ogs_error("ogs_nas_eps_read_header_compression_configuration() failed");
                return size;
             }
 
@@ -3586,9 +3690,10 @@ int ogs_nas_eps_decode_modify_eps_bearer_context_request(ogs_nas_eps_message_t *
             decoded += size;
             break;
         case OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_extended_protocol_configuration_options(&modify_eps_bearer_context_request->extended_protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_extended_protocol_configuration_options(&modify_eps_bearer_context_request->extended_protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_extended_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_extended_protocol_configuration_options() failed");
                return size;
             }
 
@@ -3596,9 +3701,10 @@ int ogs_nas_eps_decode_modify_eps_bearer_context_request(ogs_nas_eps_message_t *
             decoded += size;
             break;
         case OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_EXTENDED_APN_AMBR_TYPE:
-            size = ogs_nas_eps_decode_extended_apn_aggregate_maximum_bit_rate(&modify_eps_bearer_context_request->extended_apn_ambr, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_extended_apn_aggregate_maximum_bit_rate(&modify_eps_bearer_context_request->extended_apn_ambr, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_extended_apn_aggregate_maximum_bit_rate() failed");
+               ogs_error("ogs_nas_eps_read_extended_apn_aggregate_maximum_bit_rate() failed");
                return size;
             }
 
@@ -3606,9 +3712,10 @@ int ogs_nas_eps_decode_modify_eps_bearer_context_request(ogs_nas_eps_message_t *
             decoded += size;
             break;
         case OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_EXTENDED_EPS_QOS_TYPE:
-            size = ogs_nas_eps_decode_extended_quality_of_service(&modify_eps_bearer_context_request->extended_eps_qos, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_extended_quality_of_service(&modify_eps_bearer_context_request->extended_eps_qos, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_extended_quality_of_service() failed");
+               ogs_error("ogs_nas_eps_read_extended_quality_of_service() failed");
                return size;
             }
 
@@ -3617,37 +3724,36 @@ int ogs_nas_eps_decode_modify_eps_bearer_context_request(ogs_nas_eps_message_t *
             break;
         default:
             ogs_warn("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_modify_eps_bearer_context_accept(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_modify_eps_bearer_context_accept_t *modify_eps_bearer_context_accept = &message->esm.modify_eps_bearer_context_accept;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode MODIFY_EPS_BEARER_CONTEXT_ACCEPT\n");
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch (type) {
         case OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_ACCEPT_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_protocol_configuration_options(&modify_eps_bearer_context_accept->protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_protocol_configuration_options(&modify_eps_bearer_context_accept->protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_protocol_configuration_options() failed");
                return size;
             }
 
@@ -3655,9 +3761,10 @@ int ogs_nas_eps_decode_modify_eps_bearer_context_accept(ogs_nas_eps_message_t *m
             decoded += size;
             break;
         case OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_ACCEPT_NBIFOM_CONTAINER_TYPE:
-            size = ogs_nas_eps_decode_nbifom_container(&modify_eps_bearer_context_accept->nbifom_container, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_nbifom_container(&modify_eps_bearer_context_accept->nbifom_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_nbifom_container() failed");
+               ogs_error("ogs_nas_eps_read_nbifom_container() failed");
                return size;
             }
 
@@ -3665,9 +3772,10 @@ int ogs_nas_eps_decode_modify_eps_bearer_context_accept(ogs_nas_eps_message_t *m
             decoded += size;
             break;
         case OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_ACCEPT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_extended_protocol_configuration_options(&modify_eps_bearer_context_accept->extended_protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_extended_protocol_configuration_options(&modify_eps_bearer_context_accept->extended_protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_extended_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_extended_protocol_configuration_options() failed");
                return size;
             }
 
@@ -3676,45 +3784,44 @@ int ogs_nas_eps_decode_modify_eps_bearer_context_accept(ogs_nas_eps_message_t *m
             break;
         default:
             ogs_warn("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_modify_eps_bearer_context_reject(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_modify_eps_bearer_context_reject_t *modify_eps_bearer_context_reject = &message->esm.modify_eps_bearer_context_reject;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode MODIFY_EPS_BEARER_CONTEXT_REJECT\n");
 
-    size = ogs_nas_eps_decode_esm_cause(&modify_eps_bearer_context_reject->esm_cause, pkbuf);
+    size = ogs_nas_eps_read_esm_cause(&modify_eps_bearer_context_reject->esm_cause, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_esm_cause() failed");
+        ogs_error("ogs_nas_eps_read_esm_cause() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch (type) {
         case OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REJECT_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_protocol_configuration_options(&modify_eps_bearer_context_reject->protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_protocol_configuration_options(&modify_eps_bearer_context_reject->protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_protocol_configuration_options() failed");
                return size;
             }
 
@@ -3722,9 +3829,10 @@ int ogs_nas_eps_decode_modify_eps_bearer_context_reject(ogs_nas_eps_message_t *m
             decoded += size;
             break;
         case OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REJECT_NBIFOM_CONTAINER_TYPE:
-            size = ogs_nas_eps_decode_nbifom_container(&modify_eps_bearer_context_reject->nbifom_container, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_nbifom_container(&modify_eps_bearer_context_reject->nbifom_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_nbifom_container() failed");
+               ogs_error("ogs_nas_eps_read_nbifom_container() failed");
                return size;
             }
 
@@ -3732,9 +3840,10 @@ int ogs_nas_eps_decode_modify_eps_bearer_context_reject(ogs_nas_eps_message_t *m
             decoded += size;
             break;
         case OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REJECT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_extended_protocol_configuration_options(&modify_eps_bearer_context_reject->extended_protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_extended_protocol_configuration_options(&modify_eps_bearer_context_reject->extended_protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_extended_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_extended_protocol_configuration_options() failed");
                return size;
             }
 
@@ -3743,45 +3852,44 @@ int ogs_nas_eps_decode_modify_eps_bearer_context_reject(ogs_nas_eps_message_t *m
             break;
         default:
             ogs_warn("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_deactivate_eps_bearer_context_request(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_deactivate_eps_bearer_context_request_t *deactivate_eps_bearer_context_request = &message->esm.deactivate_eps_bearer_context_request;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode DEACTIVATE_EPS_BEARER_CONTEXT_REQUEST\n");
 
-    size = ogs_nas_eps_decode_esm_cause(&deactivate_eps_bearer_context_request->esm_cause, pkbuf);
+    size = ogs_nas_eps_read_esm_cause(&deactivate_eps_bearer_context_request->esm_cause, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_esm_cause() failed");
+        ogs_error("ogs_nas_eps_read_esm_cause() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch (type) {
         case OGS_NAS_EPS_DEACTIVATE_EPS_BEARER_CONTEXT_REQUEST_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_protocol_configuration_options(&deactivate_eps_bearer_context_request->protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_protocol_configuration_options(&deactivate_eps_bearer_context_request->protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_protocol_configuration_options() failed");
                return size;
             }
 
@@ -3789,9 +3897,10 @@ int ogs_nas_eps_decode_deactivate_eps_bearer_context_request(ogs_nas_eps_message
             decoded += size;
             break;
         case OGS_NAS_EPS_DEACTIVATE_EPS_BEARER_CONTEXT_REQUEST_T3396_VALUE_TYPE:
-            size = ogs_nas_eps_decode_gprs_timer_3(&deactivate_eps_bearer_context_request->t3396_value, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_gprs_timer_3(&deactivate_eps_bearer_context_request->t3396_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_gprs_timer_3() failed");
+               ogs_error("ogs_nas_eps_read_gprs_timer_3() failed");
                return size;
             }
 
@@ -3799,11 +3908,9 @@ int ogs_nas_eps_decode_deactivate_eps_bearer_context_request(ogs_nas_eps_message
             decoded += size;
             break;
         case OGS_NAS_EPS_DEACTIVATE_EPS_BEARER_CONTEXT_REQUEST_WLAN_OFFLOAD_INDICATION_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_wlan_offload_acceptability(&deactivate_eps_bearer_context_request->wlan_offload_indication, pkbuf);
+            size = ogs_nas_eps_read_wlan_offload_acceptability(&deactivate_eps_bearer_context_request->wlan_offload_indication, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_wlan_offload_acceptability() failed");
+               ogs_error("ogs_nas_eps_read_wlan_offload_acceptability() failed");
                return size;
             }
 
@@ -3811,9 +3918,10 @@ int ogs_nas_eps_decode_deactivate_eps_bearer_context_request(ogs_nas_eps_message
             decoded += size;
             break;
         case OGS_NAS_EPS_DEACTIVATE_EPS_BEARER_CONTEXT_REQUEST_NBIFOM_CONTAINER_TYPE:
-            size = ogs_nas_eps_decode_nbifom_container(&deactivate_eps_bearer_context_request->nbifom_container, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_nbifom_container(&deactivate_eps_bearer_context_request->nbifom_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_nbifom_container() failed");
+               ogs_error("ogs_nas_eps_read_nbifom_container() failed");
                return size;
             }
 
@@ -3821,9 +3929,10 @@ int ogs_nas_eps_decode_deactivate_eps_bearer_context_request(ogs_nas_eps_message
             decoded += size;
             break;
         case OGS_NAS_EPS_DEACTIVATE_EPS_BEARER_CONTEXT_REQUEST_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_extended_protocol_configuration_options(&deactivate_eps_bearer_context_request->extended_protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_extended_protocol_configuration_options(&deactivate_eps_bearer_context_request->extended_protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_extended_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_extended_protocol_configuration_options() failed");
                return size;
             }
 
@@ -3832,37 +3941,36 @@ int ogs_nas_eps_decode_deactivate_eps_bearer_context_request(ogs_nas_eps_message
             break;
         default:
             ogs_warn("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_deactivate_eps_bearer_context_accept(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_deactivate_eps_bearer_context_accept_t *deactivate_eps_bearer_context_accept = &message->esm.deactivate_eps_bearer_context_accept;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode DEACTIVATE_EPS_BEARER_CONTEXT_ACCEPT\n");
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch (type) {
         case OGS_NAS_EPS_DEACTIVATE_EPS_BEARER_CONTEXT_ACCEPT_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_protocol_configuration_options(&deactivate_eps_bearer_context_accept->protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_protocol_configuration_options(&deactivate_eps_bearer_context_accept->protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_protocol_configuration_options() failed");
                return size;
             }
 
@@ -3870,9 +3978,10 @@ int ogs_nas_eps_decode_deactivate_eps_bearer_context_accept(ogs_nas_eps_message_
             decoded += size;
             break;
         case OGS_NAS_EPS_DEACTIVATE_EPS_BEARER_CONTEXT_ACCEPT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_extended_protocol_configuration_options(&deactivate_eps_bearer_context_accept->extended_protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_extended_protocol_configuration_options(&deactivate_eps_bearer_context_accept->extended_protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_extended_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_extended_protocol_configuration_options() failed");
                return size;
             }
 
@@ -3881,47 +3990,43 @@ int ogs_nas_eps_decode_deactivate_eps_bearer_context_accept(ogs_nas_eps_message_
             break;
         default:
             ogs_warn("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_pdn_connectivity_request(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_pdn_connectivity_request_t *pdn_connectivity_request = &message->esm.pdn_connectivity_request;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode PDN_CONNECTIVITY_REQUEST\n");
 
-    size = ogs_nas_eps_decode_request_type(&pdn_connectivity_request->request_type, pkbuf);
+    size = ogs_nas_eps_read_request_type(&pdn_connectivity_request->request_type, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_request_type() failed");
+        ogs_error("ogs_nas_eps_read_request_type() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch (type) {
         case OGS_NAS_EPS_PDN_CONNECTIVITY_REQUEST_ESM_INFORMATION_TRANSFER_FLAG_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_esm_information_transfer_flag(&pdn_connectivity_request->esm_information_transfer_flag, pkbuf);
+            size = ogs_nas_eps_read_esm_information_transfer_flag(&pdn_connectivity_request->esm_information_transfer_flag, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_esm_information_transfer_flag() failed");
+               ogs_error("ogs_nas_eps_read_esm_information_transfer_flag() failed");
                return size;
             }
 
@@ -3929,9 +4034,10 @@ int ogs_nas_eps_decode_pdn_connectivity_request(ogs_nas_eps_message_t *message,
             decoded += size;
             break;
         case OGS_NAS_EPS_PDN_CONNECTIVITY_REQUEST_ACCESS_POINT_NAME_TYPE:
-            size = ogs_nas_eps_decode_access_point_name(&pdn_connectivity_request->access_point_name, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_access_point_name(&pdn_connectivity_request->access_point_name, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_access_point_name() failed");
+               ogs_error("ogs_nas_eps_read_access_point_name() failed");
                return size;
             }
 
@@ -3939,9 +4045,10 @@ int ogs_nas_eps_decode_pdn_connectivity_request(ogs_nas_eps_message_t *message,
             decoded += size;
             break;
         case OGS_NAS_EPS_PDN_CONNECTIVITY_REQUEST_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_protocol_configuration_options(&pdn_connectivity_request->protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_protocol_configuration_options(&pdn_connectivity_request->protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_protocol_configuration_options() failed");
                return size;
             }
 
@@ -3949,11 +4056,9 @@ int ogs_nas_eps_decode_pdn_connectivity_request(ogs_nas_eps_message_t *message,
             decoded += size;
             break;
         case OGS_NAS_EPS_PDN_CONNECTIVITY_REQUEST_DEVICE_PROPERTIES_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_device_properties(&pdn_connectivity_request->device_properties, pkbuf);
+            size = ogs_nas_eps_read_device_properties(&pdn_connectivity_request->device_properties, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_device_properties() failed");
+               ogs_error("ogs_nas_eps_read_device_properties() failed");
                return size;
             }
 
@@ -3961,9 +4066,10 @@ int ogs_nas_eps_decode_pdn_connectivity_request(ogs_nas_eps_message_t *message,
             decoded += size;
             break;
         case OGS_NAS_EPS_PDN_CONNECTIVITY_REQUEST_NBIFOM_CONTAINER_TYPE:
-            size = ogs_nas_eps_decode_nbifom_container(&pdn_connectivity_request->nbifom_container, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_nbifom_container(&pdn_connectivity_request->nbifom_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_nbifom_container() failed");
+               ogs_error("ogs_nas_eps_read_nbifom_container() failed");
                return size;
             }
 
@@ -3971,9 +4077,10 @@ int ogs_nas_eps_decode_pdn_connectivity_request(ogs_nas_eps_message_t *message,
             decoded += size;
             break;
         case OGS_NAS_EPS_PDN_CONNECTIVITY_REQUEST_HEADER_COMPRESSION_CONFIGURATION_TYPE:
-            size = ogs_nas_eps_decode_header_compression_configuration(&pdn_connectivity_request->header_compression_configuration, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_header_compression_configuration(&pdn_connectivity_request->header_compression_configuration, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_header_compression_configuration() failed");
+               ogs_error("ogs_nas_eps_read_header_compression_configuration() failed");
                return size;
             }
 
@@ -3981,9 +4088,10 @@ int ogs_nas_eps_decode_pdn_connectivity_request(ogs_nas_eps_message_t *message,
             decoded += size;
             break;
         case OGS_NAS_EPS_PDN_CONNECTIVITY_REQUEST_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_extended_protocol_configuration_options(&pdn_connectivity_request->extended_protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_extended_protocol_configuration_options(&pdn_connectivity_request->extended_protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_extended_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_extended_protocol_configuration_options() failed");
                return size;
             }
 
@@ -3992,45 +4100,44 @@ int ogs_nas_eps_decode_pdn_connectivity_request(ogs_nas_eps_message_t *message,
             break;
         default:
             ogs_warn("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_pdn_connectivity_reject(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_pdn_connectivity_reject_t *pdn_connectivity_reject = &message->esm.pdn_connectivity_reject;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode PDN_CONNECTIVITY_REJECT\n");
 
-    size = ogs_nas_eps_decode_esm_cause(&pdn_connectivity_reject->esm_cause, pkbuf);
+    size = ogs_nas_eps_read_esm_cause(&pdn_connectivity_reject->esm_cause, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_esm_cause() failed");
+        ogs_error("ogs_nas_eps_read_esm_cause() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch (type) {
         case OGS_NAS_EPS_PDN_CONNECTIVITY_REJECT_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_protocol_configuration_options(&pdn_connectivity_reject->protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_protocol_configuration_options(&pdn_connectivity_reject->protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_protocol_configuration_options() failed");
                return size;
             }
 
@@ -4038,9 +4145,10 @@ int ogs_nas_eps_decode_pdn_connectivity_reject(ogs_nas_eps_message_t *message, o
             decoded += size;
             break;
         case OGS_NAS_EPS_PDN_CONNECTIVITY_REJECT_BACK_OFF_TIMER_VALUE_TYPE:
-            size = ogs_nas_eps_decode_gprs_timer_3(&pdn_connectivity_reject->back_off_timer_value, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_gprs_timer_3(&pdn_connectivity_reject->back_off_timer_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_gprs_timer_3() failed");
+               ogs_error("ogs_nas_eps_read_gprs_timer_3() failed");
                return size;
             }
 
@@ -4048,9 +4156,10 @@ int ogs_nas_eps_decode_pdn_connectivity_reject(ogs_nas_eps_message_t *message, o
             decoded += size;
             break;
         case OGS_NAS_EPS_PDN_CONNECTIVITY_REJECT_RE_ATTEMPT_INDICATOR_TYPE:
-            size = ogs_nas_eps_decode_re_attempt_indicator(&pdn_connectivity_reject->re_attempt_indicator, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_re_attempt_indicator(&pdn_connectivity_reject->re_attempt_indicator, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_re_attempt_indicator() failed");
+               ogs_error("ogs_nas_eps_read_re_attempt_indicator() failed");
                return size;
             }
 
@@ -4058,9 +4167,10 @@ int ogs_nas_eps_decode_pdn_connectivity_reject(ogs_nas_eps_message_t *message, o
             decoded += size;
             break;
         case OGS_NAS_EPS_PDN_CONNECTIVITY_REJECT_NBIFOM_CONTAINER_TYPE:
-            size = ogs_nas_eps_decode_nbifom_container(&pdn_connectivity_reject->nbifom_container, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_nbifom_container(&pdn_connectivity_reject->nbifom_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_nbifom_container() failed");
+               ogs_error("ogs_nas_eps_read_nbifom_container() failed");
                return size;
             }
 
@@ -4068,9 +4178,10 @@ int ogs_nas_eps_decode_pdn_connectivity_reject(ogs_nas_eps_message_t *message, o
             decoded += size;
             break;
         case OGS_NAS_EPS_PDN_CONNECTIVITY_REJECT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_extended_protocol_configuration_options(&pdn_connectivity_reject->extended_protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_extended_protocol_configuration_options(&pdn_connectivity_reject->extended_protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_extended_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_extended_protocol_configuration_options() failed");
                return size;
             }
 
@@ -4079,45 +4190,44 @@ int ogs_nas_eps_decode_pdn_connectivity_reject(ogs_nas_eps_message_t *message, o
             break;
         default:
             ogs_warn("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_pdn_disconnect_request(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_pdn_disconnect_request_t *pdn_disconnect_request = &message->esm.pdn_disconnect_request;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode PDN_DISCONNECT_REQUEST\n");
 
-    size = ogs_nas_eps_decode_linked_eps_bearer_identity(&pdn_disconnect_request->linked_eps_bearer_identity, pkbuf);
+    size = ogs_nas_eps_read_linked_eps_bearer_identity(&pdn_disconnect_request->linked_eps_bearer_identity, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_linked_eps_bearer_identity() failed");
+        ogs_error("ogs_nas_eps_read_linked_eps_bearer_identity() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch (type) {
         case OGS_NAS_EPS_PDN_DISCONNECT_REQUEST_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_protocol_configuration_options(&pdn_disconnect_request->protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_protocol_configuration_options(&pdn_disconnect_request->protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_protocol_configuration_options() failed");
                return size;
             }
 
@@ -4125,9 +4235,10 @@ int ogs_nas_eps_decode_pdn_disconnect_request(ogs_nas_eps_message_t *message, og
             decoded += size;
             break;
         case OGS_NAS_EPS_PDN_DISCONNECT_REQUEST_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_extended_protocol_configuration_options(&pdn_disconnect_request->extended_protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_extended_protocol_configuration_options(&pdn_disconnect_request->extended_protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_extended_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_extended_protocol_configuration_options() failed");
                return size;
             }
 
@@ -4136,45 +4247,44 @@ int ogs_nas_eps_decode_pdn_disconnect_request(ogs_nas_eps_message_t *message, og
             break;
         default:
             ogs_warn("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_pdn_disconnect_reject(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_pdn_disconnect_reject_t *pdn_disconnect_reject = &message->esm.pdn_disconnect_reject;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode PDN_DISCONNECT_REJECT\n");
 
-    size = ogs_nas_eps_decode_esm_cause(&pdn_disconnect_reject->esm_cause, pkbuf);
+    size = ogs_nas_eps_read_esm_cause(&pdn_disconnect_reject->esm_cause, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_esm_cause() failed");
+        ogs_error("ogs_nas_eps_read_esm_cause() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch (type) {
         case OGS_NAS_EPS_PDN_DISCONNECT_REJECT_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_protocol_configuration_options(&pdn_disconnect_reject->protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_protocol_configuration_options(&pdn_disconnect_reject->protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_protocol_configuration_options() failed");
                return size;
             }
 
@@ -4182,9 +4292,10 @@ int ogs_nas_eps_decode_pdn_disconnect_reject(ogs_nas_eps_message_t *message, ogs
             decoded += size;
             break;
         case OGS_NAS_EPS_PDN_DISCONNECT_REJECT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_extended_protocol_configuration_options(&pdn_disconnect_reject->extended_protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_extended_protocol_configuration_options(&pdn_disconnect_reject->extended_protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_extended_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_extended_protocol_configuration_options() failed");
                return size;
             }
 
@@ -4193,61 +4304,60 @@ int ogs_nas_eps_decode_pdn_disconnect_reject(ogs_nas_eps_message_t *message, ogs
             break;
         default:
             ogs_warn("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_bearer_resource_allocation_request(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_bearer_resource_allocation_request_t *bearer_resource_allocation_request = &message->esm.bearer_resource_allocation_request;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode BEARER_RESOURCE_ALLOCATION_REQUEST\n");
 
-    size = ogs_nas_eps_decode_linked_eps_bearer_identity(&bearer_resource_allocation_request->linked_eps_bearer_identity, pkbuf);
+    size = ogs_nas_eps_read_linked_eps_bearer_identity(&bearer_resource_allocation_request->linked_eps_bearer_identity, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_linked_eps_bearer_identity() failed");
+        ogs_error("ogs_nas_eps_read_linked_eps_bearer_identity() failed");
         return size;
     }
 
     decoded += size;
 
-    size = ogs_nas_eps_decode_traffic_flow_aggregate_description(&bearer_resource_allocation_request->traffic_flow_aggregate, pkbuf);
+    size = ogs_nas_eps_read_traffic_flow_aggregate_description(&bearer_resource_allocation_request->traffic_flow_aggregate, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_traffic_flow_aggregate_description() failed");
+        ogs_error("ogs_nas_eps_read_traffic_flow_aggregate_description() failed");
         return size;
     }
 
     decoded += size;
 
-    size = ogs_nas_eps_decode_eps_quality_of_service(&bearer_resource_allocation_request->required_traffic_flow_qos, pkbuf);
+    size = ogs_nas_eps_read_eps_quality_of_service(&bearer_resource_allocation_request->required_traffic_flow_qos, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_eps_quality_of_service() failed");
+        ogs_error("ogs_nas_eps_read_eps_quality_of_service() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch (type) {
         case OGS_NAS_EPS_BEARER_RESOURCE_ALLOCATION_REQUEST_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_protocol_configuration_options(&bearer_resource_allocation_request->protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_protocol_configuration_options(&bearer_resource_allocation_request->protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_protocol_configuration_options() failed");
                return size;
             }
 
@@ -4255,11 +4365,9 @@ int ogs_nas_eps_decode_bearer_resource_allocation_request(ogs_nas_eps_message_t
             decoded += size;
             break;
         case OGS_NAS_EPS_BEARER_RESOURCE_ALLOCATION_REQUEST_DEVICE_PROPERTIES_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_device_properties(&bearer_resource_allocation_request->device_properties, pkbuf);
+            size = ogs_nas_eps_read_device_properties(&bearer_resource_allocation_request->device_properties, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_device_properties() failed");
+               ogs_error("ogs_nas_eps_read_device_properties() failed");
                return size;
             }
 
@@ -4267,9 +4375,10 @@ int ogs_nas_eps_decode_bearer_resource_allocation_request(ogs_nas_eps_message_t
             decoded += size;
             break;
         case OGS_NAS_EPS_BEARER_RESOURCE_ALLOCATION_REQUEST_NBIFOM_CONTAINER_TYPE:
-            size = ogs_nas_eps_decode_nbifom_container(&bearer_resource_allocation_request->nbifom_container, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_nbifom_container(&bearer_resource_allocation_request->nbifom_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_nbifom_container() failed");
+               ogs_error("ogs_nas_eps_read_nbifom_container() failed");
                return size;
             }
 
@@ -4277,9 +4386,10 @@ int ogs_nas_eps_decode_bearer_resource_allocation_request(ogs_nas_eps_message_t
             decoded += size;
             break;
         case OGS_NAS_EPS_BEARER_RESOURCE_ALLOCATION_REQUEST_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_extended_protocol_configuration_options(&bearer_resource_allocation_request->extended_protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_extended_protocol_configuration_options(&bearer_resource_allocation_request->extended_protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_extended_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_extended_protocol_configuration_options() failed");
                return size;
             }
 
@@ -4287,9 +4397,10 @@ int ogs_nas_eps_decode_bearer_resource_allocation_request(ogs_nas_eps_message_t
             decoded += size;
             break;
         case OGS_NAS_EPS_BEARER_RESOURCE_ALLOCATION_REQUEST_EXTENDED_EPS_QOS_TYPE:
-            size = ogs_nas_eps_decode_extended_quality_of_service(&bearer_resource_allocation_request->extended_eps_qos, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_extended_quality_of_service(&bearer_resource_allocation_request->extended_eps_qos, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_extended_quality_of_service() failed");
+               ogs_error("ogs_nas_eps_read_extended_quality_of_service() failed");
                return size;
             }
 
@@ -4298,45 +4409,44 @@ int ogs_nas_eps_decode_bearer_resource_allocation_request(ogs_nas_eps_message_t
             break;
         default:
             ogs_warn("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_bearer_resource_allocation_reject(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_bearer_resource_allocation_reject_t *bearer_resource_allocation_reject = &message->esm.bearer_resource_allocation_reject;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode BEARER_RESOURCE_ALLOCATION_REJECT\n");
 
-    size = ogs_nas_eps_decode_esm_cause(&bearer_resource_allocation_reject->esm_cause, pkbuf);
+    size = ogs_nas_eps_read_esm_cause(&bearer_resource_allocation_reject->esm_cause, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_esm_cause() failed");
+        ogs_error("ogs_nas_eps_read_esm_cause() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch (type) {
         case OGS_NAS_EPS_BEARER_RESOURCE_ALLOCATION_REJECT_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_protocol_configuration_options(&bearer_resource_allocation_reject->protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_protocol_configuration_options(&bearer_resource_allocation_reject->protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_protocol_configuration_options() failed");
                return size;
             }
 
@@ -4344,9 +4454,10 @@ int ogs_nas_eps_decode_bearer_resource_allocation_reject(ogs_nas_eps_message_t *
             decoded += size;
             break;
         case OGS_NAS_EPS_BEARER_RESOURCE_ALLOCATION_REJECT_BACK_OFF_TIMER_VALUE_TYPE:
-            size = ogs_nas_eps_decode_gprs_timer_3(&bearer_resource_allocation_reject->back_off_timer_value, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_gprs_timer_3(&bearer_resource_allocation_reject->back_off_timer_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_gprs_timer_3() failed");
+               ogs_error("ogs_nas_eps_read_gprs_timer_3() failed");
                return size;
             }
 
@@ -4354,9 +4465,10 @@ int ogs_nas_eps_decode_bearer_resource_allocation_reject(ogs_nas_eps_message_t *
             decoded += size;
             break;
         case OGS_NAS_EPS_BEARER_RESOURCE_ALLOCATION_REJECT_RE_ATTEMPT_INDICATOR_TYPE:
-            size = ogs_nas_eps_decode_re_attempt_indicator(&bearer_resource_allocation_reject->re_attempt_indicator, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_re_attempt_indicator(&bearer_resource_allocation_reject->re_attempt_indicator, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_re_attempt_indicator() failed");
+               ogs_error("ogs_nas_eps_read_re_attempt_indicator() failed");
                return size;
             }
 
@@ -4364,9 +4476,10 @@ int ogs_nas_eps_decode_bearer_resource_allocation_reject(ogs_nas_eps_message_t *
             decoded += size;
             break;
         case OGS_NAS_EPS_BEARER_RESOURCE_ALLOCATION_REJECT_NBIFOM_CONTAINER_TYPE:
-            size = ogs_nas_eps_decode_nbifom_container(&bearer_resource_allocation_reject->nbifom_container, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_nbifom_container(&bearer_resource_allocation_reject->nbifom_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_nbifom_container() failed");
+               ogs_error("ogs_nas_eps_read_nbifom_container() failed");
                return size;
             }
 
@@ -4374,9 +4487,10 @@ int ogs_nas_eps_decode_bearer_resource_allocation_reject(ogs_nas_eps_message_t *
             decoded += size;
             break;
         case OGS_NAS_EPS_BEARER_RESOURCE_ALLOCATION_REJECT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_extended_protocol_configuration_options(&bearer_resource_allocation_reject->extended_protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_extended_protocol_configuration_options(&bearer_resource_allocation_reject->extended_protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_extended_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_extended_protocol_configuration_options() failed");
                return size;
             }
 
@@ -4385,53 +4499,52 @@ int ogs_nas_eps_decode_bearer_resource_allocation_reject(ogs_nas_eps_message_t *
             break;
         default:
             ogs_warn("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_bearer_resource_modification_request(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_bearer_resource_modification_request_t *bearer_resource_modification_request = &message->esm.bearer_resource_modification_request;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode BEARER_RESOURCE_MODIFICATION_REQUEST\n");
 
-    size = ogs_nas_eps_decode_linked_eps_bearer_identity(&bearer_resource_modification_request->eps_bearer_identity_for_packet_filter, pkbuf);
+    size = ogs_nas_eps_read_linked_eps_bearer_identity(&bearer_resource_modification_request->eps_bearer_identity_for_packet_filter, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_linked_eps_bearer_identity() failed");
+        ogs_error("ogs_nas_eps_read_linked_eps_bearer_identity() failed");
         return size;
     }
 
     decoded += size;
 
-    size = ogs_nas_eps_decode_traffic_flow_aggregate_description(&bearer_resource_modification_request->traffic_flow_aggregate, pkbuf);
+    size = ogs_nas_eps_read_traffic_flow_aggregate_description(&bearer_resource_modification_request->traffic_flow_aggregate, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_traffic_flow_aggregate_description() failed");
+        ogs_error("ogs_nas_eps_read_traffic_flow_aggregate_description() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch (type) {
         case OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REQUEST_REQUIRED_TRAFFIC_FLOW_QOS_TYPE:
-            size = ogs_nas_eps_decode_eps_quality_of_service(&bearer_resource_modification_request->required_traffic_flow_qos, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_eps_quality_of_service(&bearer_resource_modification_request->required_traffic_flow_qos, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_eps_quality_of_service() failed");
+               ogs_error("ogs_nas_eps_read_eps_quality_of_service() failed");
                return size;
             }
 
@@ -4439,9 +4552,10 @@ int ogs_nas_eps_decode_bearer_resource_modification_request(ogs_nas_eps_message_
             decoded += size;
             break;
         case OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REQUEST_ESM_CAUSE_TYPE:
-            size = ogs_nas_eps_decode_esm_cause(&bearer_resource_modification_request->esm_cause, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_esm_cause(&bearer_resource_modification_request->esm_cause, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_esm_cause() failed");
+               ogs_error("ogs_nas_eps_read_esm_cause() failed");
                return size;
             }
 
@@ -4449,9 +4563,10 @@ int ogs_nas_eps_decode_bearer_resource_modification_request(ogs_nas_eps_message_
             decoded += size;
             break;
         case OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REQUEST_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_protocol_configuration_options(&bearer_resource_modification_request->protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_protocol_configuration_options(&bearer_resource_modification_request->protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_protocol_configuration_options() failed");
                return size;
             }
 
@@ -4459,11 +4574,9 @@ int ogs_nas_eps_decode_bearer_resource_modification_request(ogs_nas_eps_message_
             decoded += size;
             break;
         case OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REQUEST_DEVICE_PROPERTIES_TYPE:
-            decoded--;
-            ogs_assert(ogs_pkbuf_push(pkbuf, 1));
-            size = ogs_nas_eps_decode_device_properties(&bearer_resource_modification_request->device_properties, pkbuf);
+            size = ogs_nas_eps_read_device_properties(&bearer_resource_modification_request->device_properties, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_device_properties() failed");
+               ogs_error("ogs_nas_eps_read_device_properties() failed");
                return size;
             }
 
@@ -4471,9 +4584,10 @@ int ogs_nas_eps_decode_bearer_resource_modification_request(ogs_nas_eps_message_
             decoded += size;
             break;
         case OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REQUEST_NBIFOM_CONTAINER_TYPE:
-            size = ogs_nas_eps_decode_nbifom_container(&bearer_resource_modification_request->nbifom_container, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_nbifom_container(&bearer_resource_modification_request->nbifom_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_nbifom_container() failed");
+               ogs_error("ogs_nas_eps_read_nbifom_container() failed");
                return size;
             }
 
@@ -4481,9 +4595,10 @@ int ogs_nas_eps_decode_bearer_resource_modification_request(ogs_nas_eps_message_
             decoded += size;
             break;
         case OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REQUEST_HEADER_COMPRESSION_CONFIGURATION_TYPE:
-            size = ogs_nas_eps_decode_header_compression_configuration(&bearer_resource_modification_request->header_compression_configuration, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_header_compression_configuration(&bearer_resource_modification_request->header_compression_configuration, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_header_compression_configuration() failed");
+               ogs_error("ogs_nas_eps_read_header_compression_configuration() failed");
                return size;
             }
 
@@ -4491,9 +4606,10 @@ int ogs_nas_eps_decode_bearer_resource_modification_request(ogs_nas_eps_message_
             decoded += size;
             break;
         case OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REQUEST_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_extended_protocol_configuration_options(&bearer_resource_modification_request->extended_protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_extended_protocol_configuration_options(&bearer_resource_modification_request->extended_protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_extended_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_extended_protocol_configuration_options() failed");
                return size;
             }
 
@@ -4501,9 +4617,10 @@ int ogs_nas_eps_decode_bearer_resource_modification_request(ogs_nas_eps_message_
             decoded += size;
             break;
         case OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REQUEST_EXTENDED_EPS_QOS_TYPE:
-            size = ogs_nas_eps_decode_extended_quality_of_service(&bearer_resource_modification_request->extended_eps_qos, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_extended_quality_of_service(&bearer_resource_modification_request->extended_eps_qos, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_extended_quality_of_service() failed");
+               ogs_error("ogs_nas_eps_read_extended_quality_of_service() failed");
                return size;
             }
 
@@ -4512,45 +4629,44 @@ int ogs_nas_eps_decode_bearer_resource_modification_request(ogs_nas_eps_message_
             break;
         default:
             ogs_warn("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_bearer_resource_modification_reject(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_bearer_resource_modification_reject_t *bearer_resource_modification_reject = &message->esm.bearer_resource_modification_reject;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode BEARER_RESOURCE_MODIFICATION_REJECT\n");
 
-    size = ogs_nas_eps_decode_esm_cause(&bearer_resource_modification_reject->esm_cause, pkbuf);
+    size = ogs_nas_eps_read_esm_cause(&bearer_resource_modification_reject->esm_cause, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_esm_cause() failed");
+        ogs_error("ogs_nas_eps_read_esm_cause() failed");
         return size;
     }
 
     decoded += size;
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch (type) {
         case OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REJECT_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_protocol_configuration_options(&bearer_resource_modification_reject->protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_protocol_configuration_options(&bearer_resource_modification_reject->protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_protocol_configuration_options() failed");
                return size;
             }
 
@@ -4558,9 +4674,10 @@ int ogs_nas_eps_decode_bearer_resource_modification_reject(ogs_nas_eps_message_t
             decoded += size;
             break;
         case OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REJECT_BACK_OFF_TIMER_VALUE_TYPE:
-            size = ogs_nas_eps_decode_gprs_timer_3(&bearer_resource_modification_reject->back_off_timer_value, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_gprs_timer_3(&bearer_resource_modification_reject->back_off_timer_value, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_gprs_timer_3() failed");
+               ogs_error("ogs_nas_eps_read_gprs_timer_3() failed");
                return size;
             }
 
@@ -4568,9 +4685,10 @@ int ogs_nas_eps_decode_bearer_resource_modification_reject(ogs_nas_eps_message_t
             decoded += size;
             break;
         case OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REJECT_RE_ATTEMPT_INDICATOR_TYPE:
-            size = ogs_nas_eps_decode_re_attempt_indicator(&bearer_resource_modification_reject->re_attempt_indicator, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_re_attempt_indicator(&bearer_resource_modification_reject->re_attempt_indicator, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_re_attempt_indicator() failed");
+               ogs_error("ogs_nas_eps_read_re_attempt_indicator() failed");
                return size;
             }
 
@@ -4578,9 +4696,10 @@ int ogs_nas_eps_decode_bearer_resource_modification_reject(ogs_nas_eps_message_t
             decoded += size;
             break;
         case OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REJECT_NBIFOM_CONTAINER_TYPE:
-            size = ogs_nas_eps_decode_nbifom_container(&bearer_resource_modification_reject->nbifom_container, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_nbifom_container(&bearer_resource_modification_reject->nbifom_container, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_nbifom_container() failed");
+               ogs_error("ogs_nas_eps_read_nbifom_container() failed");
                return size;
             }
 
@@ -4588,9 +4707,10 @@ int ogs_nas_eps_decode_bearer_resource_modification_reject(ogs_nas_eps_message_t
             decoded += size;
             break;
         case OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REJECT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_extended_protocol_configuration_options(&bearer_resource_modification_reject->extended_protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_extended_protocol_configuration_options(&bearer_resource_modification_reject->extended_protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_extended_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_extended_protocol_configuration_options() failed");
                return size;
             }
 
@@ -4599,37 +4719,36 @@ int ogs_nas_eps_decode_bearer_resource_modification_reject(ogs_nas_eps_message_t
             break;
         default:
             ogs_warn("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_esm_information_response(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_esm_information_response_t *esm_information_response = &message->esm.esm_information_response;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode ESM_INFORMATION_RESPONSE\n");
 
-    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch (type) {
         case OGS_NAS_EPS_ESM_INFORMATION_RESPONSE_ACCESS_POINT_NAME_TYPE:
-            size = ogs_nas_eps_decode_access_point_name(&esm_information_response->access_point_name, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_access_point_name(&esm_information_response->access_point_name, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_access_point_name() failed");
+               ogs_error("ogs_nas_eps_read_access_point_name() failed");
                return size;
             }
 
@@ -4637,9 +4756,10 @@ int ogs_nas_eps_decode_esm_information_response(ogs_nas_eps_message_t *message,
             decoded += size;
             break;
         case OGS_NAS_EPS_ESM_INFORMATION_RESPONSE_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_protocol_configuration_options(&esm_information_response->protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_protocol_configuration_options(&esm_information_response->protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_protocol_configuration_options() failed");
                return size;
             }
 
@@ -4647,9 +4767,10 @@ int ogs_nas_eps_decode_esm_information_response(ogs_nas_eps_message_t *message,
             decoded += size;
             break;
         case OGS_NAS_EPS_ESM_INFORMATION_RESPONSE_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE:
-            size = ogs_nas_eps_decode_extended_protocol_configuration_options(&esm_information_response->extended_protocol_configuration_options, pkbuf);
+            decoded++;
+            size = ogs_nas_eps_read_extended_protocol_configuration_options(&esm_information_response->extended_protocol_configuration_options, data + decoded, len - decoded);
             if (size < 0) {
-               ogs_error("ogs_nas_eps_decode_extended_protocol_configuration_options() failed");
+               ogs_error("ogs_nas_eps_read_extended_protocol_configuration_options() failed");
                return size;
             }
 
@@ -4658,29 +4779,36 @@ int ogs_nas_eps_decode_esm_information_response(ogs_nas_eps_message_t *message,
             break;
         default:
             ogs_warn("Unknown type(0x%x) or not implemented\n", type);
+            decoded++;
             break;
         }
     }
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
 int ogs_nas_eps_decode_esm_status(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
     ogs_nas_eps_esm_status_t *esm_status = &message->esm.esm_status;
+    unsigned char *data = pkbuf->data;
+    int len = pkbuf->len;
     int decoded = 0;
     int size = 0;
 
     ogs_trace("[NAS] Decode ESM_STATUS\n");
 
-    size = ogs_nas_eps_decode_esm_cause(&esm_status->esm_cause, pkbuf);
+    size = ogs_nas_eps_read_esm_cause(&esm_status->esm_cause, data + decoded, len - decoded);
     if (size < 0) {
-        ogs_error("ogs_nas_eps_decode_esm_cause() failed");
+        ogs_error("ogs_nas_eps_read_esm_cause() failed");
         return size;
     }
 
     decoded += size;
 
+    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
     return decoded;
 }
 
@@ -28,8 +28,8 @@
 /*******************************************************************************
  * This file had been created by nas-message.py script v0.1.0
  * Please do not modify this file but regenerate it via script.
- * Created on: 2024-01-21 18:50:03.428897 by acetcom
- * from 24301-h90.docx
+ * Created from 24301-h90.docx
+ * (sha256: 1acc20b2dabf84bff1965c46a7d926753c0e7fde48d8126faa12e06d66167125)
  ******************************************************************************/
 
 #include "ogs-nas-eps.h"
@@ -92,78 +92,126 @@ int ogs_nas_eps_encode_attach_request(ogs_pkbuf_t *pkbuf, ogs_nas_eps_message_t
     ogs_trace("[NAS] Encode ATTACH_REQUEST");
 
     size = ogs_nas_eps_encode_eps_attach_type(pkbuf, &attach_request->eps_attach_type);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_eps_attach_type() failed");
+        return size;
+    }
     encoded += size;
 
     size = ogs_nas_eps_encode_eps_mobile_identity(pkbuf, &attach_request->eps_mobile_identity);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_eps_mobile_identity() failed");
+        return size;
+    }
     encoded += size;
 
     size = ogs_nas_eps_encode_ue_network_capability(pkbuf, &attach_request->ue_network_capability);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_ue_network_capability() failed");
+        return size;
+    }
     encoded += size;
 
     size = ogs_nas_eps_encode_esm_message_container(pkbuf, &attach_request->esm_message_container);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_esm_message_container() failed");
+        return size;
+    }
     encoded += size;
 
     if (attach_request->presencemask & OGS_NAS_EPS_ATTACH_REQUEST_OLD_P_TMSI_SIGNATURE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_REQUEST_OLD_P_TMSI_SIGNATURE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_p_tmsi_signature(pkbuf, &attach_request->old_p_tmsi_signature);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_p_tmsi_signature() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_request->presencemask & OGS_NAS_EPS_ATTACH_REQUEST_ADDITIONAL_GUTI_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_REQUEST_ADDITIONAL_GUTI_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_eps_mobile_identity(pkbuf, &attach_request->additional_guti);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_eps_mobile_identity() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_request->presencemask & OGS_NAS_EPS_ATTACH_REQUEST_LAST_VISITED_REGISTERED_TAI_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_REQUEST_LAST_VISITED_REGISTERED_TAI_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_tracking_area_identity(pkbuf, &attach_request->last_visited_registered_tai);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_tracking_area_identity() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_request->presencemask & OGS_NAS_EPS_ATTACH_REQUEST_DRX_PARAMETER_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_REQUEST_DRX_PARAMETER_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_drx_parameter(pkbuf, &attach_request->drx_parameter);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_drx_parameter() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_request->presencemask & OGS_NAS_EPS_ATTACH_REQUEST_MS_NETWORK_CAPABILITY_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_REQUEST_MS_NETWORK_CAPABILITY_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_ms_network_capability(pkbuf, &attach_request->ms_network_capability);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_ms_network_capability() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_request->presencemask & OGS_NAS_EPS_ATTACH_REQUEST_OLD_LOCATION_AREA_IDENTIFICATION_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_REQUEST_OLD_LOCATION_AREA_IDENTIFICATION_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_location_area_identification(pkbuf, &attach_request->old_location_area_identification);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_location_area_identification() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -171,37 +219,58 @@ int ogs_nas_eps_encode_attach_request(ogs_pkbuf_t *pkbuf, ogs_nas_eps_message_t
         attach_request->tmsi_status.type = (OGS_NAS_EPS_ATTACH_REQUEST_TMSI_STATUS_TYPE >> 4);
 
         size = ogs_nas_eps_encode_tmsi_status(pkbuf, &attach_request->tmsi_status);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_tmsi_status() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_request->presencemask & OGS_NAS_EPS_ATTACH_REQUEST_MOBILE_STATION_CLASSMARK_2_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_REQUEST_MOBILE_STATION_CLASSMARK_2_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_mobile_station_classmark_2(pkbuf, &attach_request->mobile_station_classmark_2);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_mobile_station_classmark_2() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_request->presencemask & OGS_NAS_EPS_ATTACH_REQUEST_MOBILE_STATION_CLASSMARK_3_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_REQUEST_MOBILE_STATION_CLASSMARK_3_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_mobile_station_classmark_3(pkbuf, &attach_request->mobile_station_classmark_3);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_mobile_station_classmark_3() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_request->presencemask & OGS_NAS_EPS_ATTACH_REQUEST_SUPPORTED_CODECS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_REQUEST_SUPPORTED_CODECS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_supported_codec_list(pkbuf, &attach_request->supported_codecs);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_supported_codec_list() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -209,17 +278,26 @@ int ogs_nas_eps_encode_attach_request(ogs_pkbuf_t *pkbuf, ogs_nas_eps_message_t
         attach_request->additional_update_type.type = (OGS_NAS_EPS_ATTACH_REQUEST_ADDITIONAL_UPDATE_TYPE_TYPE >> 4);
 
         size = ogs_nas_eps_encode_additional_update_type(pkbuf, &attach_request->additional_update_type);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_additional_update_type() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_request->presencemask & OGS_NAS_EPS_ATTACH_REQUEST_VOICE_DOMAIN_PREFERENCE_AND_UE_USAGE_SETTING_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_REQUEST_VOICE_DOMAIN_PREFERENCE_AND_UE_USAGE_SETTING_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_voice_domain_preference_and_ue_usage_setting(pkbuf, &attach_request->voice_domain_preference_and_ue_usage_setting);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_voice_domain_preference_and_ue_usage_setting() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -227,7 +305,10 @@ int ogs_nas_eps_encode_attach_request(ogs_pkbuf_t *pkbuf, ogs_nas_eps_message_t
         attach_request->device_properties.type = (OGS_NAS_EPS_ATTACH_REQUEST_DEVICE_PROPERTIES_TYPE >> 4);
 
         size = ogs_nas_eps_encode_device_properties(pkbuf, &attach_request->device_properties);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_device_properties() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -235,7 +316,10 @@ int ogs_nas_eps_encode_attach_request(ogs_pkbuf_t *pkbuf, ogs_nas_eps_message_t
         attach_request->old_guti_type.type = (OGS_NAS_EPS_ATTACH_REQUEST_OLD_GUTI_TYPE_TYPE >> 4);
 
         size = ogs_nas_eps_encode_guti_type(pkbuf, &attach_request->old_guti_type);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_guti_type() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -243,127 +327,202 @@ int ogs_nas_eps_encode_attach_request(ogs_pkbuf_t *pkbuf, ogs_nas_eps_message_t
         attach_request->ms_network_feature_support.type = (OGS_NAS_EPS_ATTACH_REQUEST_MS_NETWORK_FEATURE_SUPPORT_TYPE >> 4);
 
         size = ogs_nas_eps_encode_ms_network_feature_support(pkbuf, &attach_request->ms_network_feature_support);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_ms_network_feature_support() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_request->presencemask & OGS_NAS_EPS_ATTACH_REQUEST_TMSI_BASED_NRI_CONTAINER_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_REQUEST_TMSI_BASED_NRI_CONTAINER_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_network_resource_identifier_container(pkbuf, &attach_request->tmsi_based_nri_container);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_network_resource_identifier_container() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_request->presencemask & OGS_NAS_EPS_ATTACH_REQUEST_T3324_VALUE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_REQUEST_T3324_VALUE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_gprs_timer_2(pkbuf, &attach_request->t3324_value);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_gprs_timer_2() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_request->presencemask & OGS_NAS_EPS_ATTACH_REQUEST_T3412_EXTENDED_VALUE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_REQUEST_T3412_EXTENDED_VALUE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_gprs_timer_3(pkbuf, &attach_request->t3412_extended_value);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_gprs_timer_3() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_request->presencemask & OGS_NAS_EPS_ATTACH_REQUEST_EXTENDED_DRX_PARAMETERS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_REQUEST_EXTENDED_DRX_PARAMETERS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_extended_drx_parameters(pkbuf, &attach_request->extended_drx_parameters);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_extended_drx_parameters() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_request->presencemask & OGS_NAS_EPS_ATTACH_REQUEST_UE_ADDITIONAL_SECURITY_CAPABILITY_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_REQUEST_UE_ADDITIONAL_SECURITY_CAPABILITY_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_ue_additional_security_capability(pkbuf, &attach_request->ue_additional_security_capability);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_ue_additional_security_capability() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_request->presencemask & OGS_NAS_EPS_ATTACH_REQUEST_UE_STATUS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_REQUEST_UE_STATUS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_ue_status(pkbuf, &attach_request->ue_status);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_ue_status() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_request->presencemask & OGS_NAS_EPS_ATTACH_REQUEST_ADDITIONAL_INFORMATION_REQUESTED_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_REQUEST_ADDITIONAL_INFORMATION_REQUESTED_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_additional_information_requested(pkbuf, &attach_request->additional_information_requested);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_additional_information_requested() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_request->presencemask & OGS_NAS_EPS_ATTACH_REQUEST_N1_UE_NETWORK_CAPABILITY_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_REQUEST_N1_UE_NETWORK_CAPABILITY_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_n1_ue_network_capability(pkbuf, &attach_request->n1_ue_network_capability);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_n1_ue_network_capability() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_request->presencemask & OGS_NAS_EPS_ATTACH_REQUEST_UE_RADIO_CAPABILITY_ID_AVAILABILITY_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_REQUEST_UE_RADIO_CAPABILITY_ID_AVAILABILITY_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_ue_radio_capability_id_availability(pkbuf, &attach_request->ue_radio_capability_id_availability);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_ue_radio_capability_id_availability() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_request->presencemask & OGS_NAS_EPS_ATTACH_REQUEST_REQUESTED_WUS_ASSISTANCE_INFORMATION_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_REQUEST_REQUESTED_WUS_ASSISTANCE_INFORMATION_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_wus_assistance_information(pkbuf, &attach_request->requested_wus_assistance_information);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_wus_assistance_information() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_request->presencemask & OGS_NAS_EPS_ATTACH_REQUEST_DRX_PARAMETER_IN_NB_S1_MODE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_REQUEST_DRX_PARAMETER_IN_NB_S1_MODE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_nb_s1_drx_parameter(pkbuf, &attach_request->drx_parameter_in_nb_s1_mode);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_nb_s1_drx_parameter() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_request->presencemask & OGS_NAS_EPS_ATTACH_REQUEST_REQUESTED_IMSI_OFFSET_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_REQUEST_REQUESTED_IMSI_OFFSET_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_imsi_offset(pkbuf, &attach_request->requested_imsi_offset);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_imsi_offset() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -379,108 +538,174 @@ int ogs_nas_eps_encode_attach_accept(ogs_pkbuf_t *pkbuf, ogs_nas_eps_message_t *
     ogs_trace("[NAS] Encode ATTACH_ACCEPT");
 
     size = ogs_nas_eps_encode_eps_attach_result(pkbuf, &attach_accept->eps_attach_result);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_eps_attach_result() failed");
+        return size;
+    }
     encoded += size;
 
     size = ogs_nas_eps_encode_gprs_timer(pkbuf, &attach_accept->t3412_value);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_gprs_timer() failed");
+        return size;
+    }
     encoded += size;
 
     size = ogs_nas_eps_encode_tracking_area_identity_list(pkbuf, &attach_accept->tai_list);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_tracking_area_identity_list() failed");
+        return size;
+    }
     encoded += size;
 
     size = ogs_nas_eps_encode_esm_message_container(pkbuf, &attach_accept->esm_message_container);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_esm_message_container() failed");
+        return size;
+    }
     encoded += size;
 
     if (attach_accept->presencemask & OGS_NAS_EPS_ATTACH_ACCEPT_GUTI_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_ACCEPT_GUTI_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_eps_mobile_identity(pkbuf, &attach_accept->guti);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_eps_mobile_identity() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_accept->presencemask & OGS_NAS_EPS_ATTACH_ACCEPT_LOCATION_AREA_IDENTIFICATION_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_ACCEPT_LOCATION_AREA_IDENTIFICATION_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_location_area_identification(pkbuf, &attach_accept->location_area_identification);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_location_area_identification() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_accept->presencemask & OGS_NAS_EPS_ATTACH_ACCEPT_MS_IDENTITY_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_ACCEPT_MS_IDENTITY_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_mobile_identity(pkbuf, &attach_accept->ms_identity);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_mobile_identity() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_accept->presencemask & OGS_NAS_EPS_ATTACH_ACCEPT_EMM_CAUSE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_ACCEPT_EMM_CAUSE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_emm_cause(pkbuf, &attach_accept->emm_cause);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_emm_cause() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_accept->presencemask & OGS_NAS_EPS_ATTACH_ACCEPT_T3402_VALUE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_ACCEPT_T3402_VALUE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_gprs_timer(pkbuf, &attach_accept->t3402_value);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_gprs_timer() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_accept->presencemask & OGS_NAS_EPS_ATTACH_ACCEPT_T3423_VALUE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_ACCEPT_T3423_VALUE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_gprs_timer(pkbuf, &attach_accept->t3423_value);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_gprs_timer() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_accept->presencemask & OGS_NAS_EPS_ATTACH_ACCEPT_EQUIVALENT_PLMNS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_ACCEPT_EQUIVALENT_PLMNS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_plmn_list(pkbuf, &attach_accept->equivalent_plmns);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_plmn_list() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_accept->presencemask & OGS_NAS_EPS_ATTACH_ACCEPT_EMERGENCY_NUMBER_LIST_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_ACCEPT_EMERGENCY_NUMBER_LIST_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_emergency_number_list(pkbuf, &attach_accept->emergency_number_list);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_emergency_number_list() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_accept->presencemask & OGS_NAS_EPS_ATTACH_ACCEPT_EPS_NETWORK_FEATURE_SUPPORT_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_ACCEPT_EPS_NETWORK_FEATURE_SUPPORT_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_eps_network_feature_support(pkbuf, &attach_accept->eps_network_feature_support);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_eps_network_feature_support() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -488,47 +713,74 @@ int ogs_nas_eps_encode_attach_accept(ogs_pkbuf_t *pkbuf, ogs_nas_eps_message_t *
         attach_accept->additional_update_result.type = (OGS_NAS_EPS_ATTACH_ACCEPT_ADDITIONAL_UPDATE_RESULT_TYPE >> 4);
 
         size = ogs_nas_eps_encode_additional_update_result(pkbuf, &attach_accept->additional_update_result);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_additional_update_result() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_accept->presencemask & OGS_NAS_EPS_ATTACH_ACCEPT_T3412_EXTENDED_VALUE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_ACCEPT_T3412_EXTENDED_VALUE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_gprs_timer_3(pkbuf, &attach_accept->t3412_extended_value);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_gprs_timer_3() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_accept->presencemask & OGS_NAS_EPS_ATTACH_ACCEPT_T3324_VALUE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_ACCEPT_T3324_VALUE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_gprs_timer_2(pkbuf, &attach_accept->t3324_value);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_gprs_timer_2() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_accept->presencemask & OGS_NAS_EPS_ATTACH_ACCEPT_EXTENDED_DRX_PARAMETERS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_ACCEPT_EXTENDED_DRX_PARAMETERS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_extended_drx_parameters(pkbuf, &attach_accept->extended_drx_parameters);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_extended_drx_parameters() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_accept->presencemask & OGS_NAS_EPS_ATTACH_ACCEPT_DCN_ID_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_ACCEPT_DCN_ID_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_dcn_id(pkbuf, &attach_accept->dcn_id);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_dcn_id() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -536,7 +788,10 @@ int ogs_nas_eps_encode_attach_accept(ogs_pkbuf_t *pkbuf, ogs_nas_eps_message_t *
         attach_accept->sms_services_status.type = (OGS_NAS_EPS_ATTACH_ACCEPT_SMS_SERVICES_STATUS_TYPE >> 4);
 
         size = ogs_nas_eps_encode_sms_services_status(pkbuf, &attach_accept->sms_services_status);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_sms_services_status() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -544,17 +799,26 @@ int ogs_nas_eps_encode_attach_accept(ogs_pkbuf_t *pkbuf, ogs_nas_eps_message_t *
         attach_accept->non__nw_provided_policies.type = (OGS_NAS_EPS_ATTACH_ACCEPT_NON__NW_PROVIDED_POLICIES_TYPE >> 4);
 
         size = ogs_nas_eps_encode_non__nw_provided_policies(pkbuf, &attach_accept->non__nw_provided_policies);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_non__nw_provided_policies() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_accept->presencemask & OGS_NAS_EPS_ATTACH_ACCEPT_T3448_VALUE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_ACCEPT_T3448_VALUE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_gprs_timer_2(pkbuf, &attach_accept->t3448_value);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_gprs_timer_2() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -562,47 +826,74 @@ int ogs_nas_eps_encode_attach_accept(ogs_pkbuf_t *pkbuf, ogs_nas_eps_message_t *
         attach_accept->network_policy.type = (OGS_NAS_EPS_ATTACH_ACCEPT_NETWORK_POLICY_TYPE >> 4);
 
         size = ogs_nas_eps_encode_network_policy(pkbuf, &attach_accept->network_policy);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_network_policy() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_accept->presencemask & OGS_NAS_EPS_ATTACH_ACCEPT_T3447_VALUE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_ACCEPT_T3447_VALUE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_gprs_timer_3(pkbuf, &attach_accept->t3447_value);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_gprs_timer_3() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_accept->presencemask & OGS_NAS_EPS_ATTACH_ACCEPT_EXTENDED_EMERGENCY_NUMBER_LIST_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_ACCEPT_EXTENDED_EMERGENCY_NUMBER_LIST_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_extended_emergency_number_list(pkbuf, &attach_accept->extended_emergency_number_list);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_extended_emergency_number_list() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_accept->presencemask & OGS_NAS_EPS_ATTACH_ACCEPT_CIPHERING_KEY_DATA_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_ACCEPT_CIPHERING_KEY_DATA_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_ciphering_key_data(pkbuf, &attach_accept->ciphering_key_data);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_ciphering_key_data() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_accept->presencemask & OGS_NAS_EPS_ATTACH_ACCEPT_UE_RADIO_CAPABILITY_ID_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_ACCEPT_UE_RADIO_CAPABILITY_ID_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_ue_radio_capability_id(pkbuf, &attach_accept->ue_radio_capability_id);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_ue_radio_capability_id() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -610,57 +901,90 @@ int ogs_nas_eps_encode_attach_accept(ogs_pkbuf_t *pkbuf, ogs_nas_eps_message_t *
         attach_accept->ue_radio_capability_id_deletion_indication.type = (OGS_NAS_EPS_ATTACH_ACCEPT_UE_RADIO_CAPABILITY_ID_DELETION_INDICATION_TYPE >> 4);
 
         size = ogs_nas_eps_encode_ue_radio_capability_id_deletion_indication(pkbuf, &attach_accept->ue_radio_capability_id_deletion_indication);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_ue_radio_capability_id_deletion_indication() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_accept->presencemask & OGS_NAS_EPS_ATTACH_ACCEPT_NEGOTIATED_WUS_ASSISTANCE_INFORMATION_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_ACCEPT_NEGOTIATED_WUS_ASSISTANCE_INFORMATION_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_wus_assistance_information(pkbuf, &attach_accept->negotiated_wus_assistance_information);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_wus_assistance_information() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_accept->presencemask & OGS_NAS_EPS_ATTACH_ACCEPT_NEGOTIATED_DRX_PARAMETER_IN_NB_S1_MODE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_ACCEPT_NEGOTIATED_DRX_PARAMETER_IN_NB_S1_MODE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_nb_s1_drx_parameter(pkbuf, &attach_accept->negotiated_drx_parameter_in_nb_s1_mode);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_nb_s1_drx_parameter() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_accept->presencemask & OGS_NAS_EPS_ATTACH_ACCEPT_NEGOTIATED_IMSI_OFFSET_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_ACCEPT_NEGOTIATED_IMSI_OFFSET_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_imsi_offset(pkbuf, &attach_accept->negotiated_imsi_offset);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_imsi_offset() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_accept->presencemask & OGS_NAS_EPS_ATTACH_ACCEPT_FORBIDDEN_TAI_FOR_THE_LIST_OF_FORBIDDEN_TRACKING_AREAS_FOR_ROAMING_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_ACCEPT_FORBIDDEN_TAI_FOR_THE_LIST_OF_FORBIDDEN_TRACKING_AREAS_FOR_ROAMING_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_tracking_area_identity_list(pkbuf, &attach_accept->forbidden_tai_for_the_list_of_forbidden_tracking_areas_for_roaming);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_tracking_area_identity_list() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_accept->presencemask & OGS_NAS_EPS_ATTACH_ACCEPT_FORBIDDEN_TAI_FOR_THE_LIST_OF_FORBIDDEN_TRACKING_AREAS_FORREGIONAL_PROVISION_OF_SERVICE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_ACCEPT_FORBIDDEN_TAI_FOR_THE_LIST_OF_FORBIDDEN_TRACKING_AREAS_FORREGIONAL_PROVISION_OF_SERVICE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_tracking_area_identity_list(pkbuf, &attach_accept->forbidden_tai_for_the_list_of_forbidden_tracking_areas_forregional_provision_of_service);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_tracking_area_identity_list() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -676,7 +1000,10 @@ int ogs_nas_eps_encode_attach_complete(ogs_pkbuf_t *pkbuf, ogs_nas_eps_message_t
     ogs_trace("[NAS] Encode ATTACH_COMPLETE");
 
     size = ogs_nas_eps_encode_esm_message_container(pkbuf, &attach_complete->esm_message_container);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_esm_message_container() failed");
+        return size;
+    }
     encoded += size;
 
     return encoded;
@@ -691,36 +1018,57 @@ int ogs_nas_eps_encode_attach_reject(ogs_pkbuf_t *pkbuf, ogs_nas_eps_message_t *
     ogs_trace("[NAS] Encode ATTACH_REJECT");
 
     size = ogs_nas_eps_encode_emm_cause(pkbuf, &attach_reject->emm_cause);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_emm_cause() failed");
+        return size;
+    }
     encoded += size;
 
     if (attach_reject->presencemask & OGS_NAS_EPS_ATTACH_REJECT_ESM_MESSAGE_CONTAINER_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_REJECT_ESM_MESSAGE_CONTAINER_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_esm_message_container(pkbuf, &attach_reject->esm_message_container);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_esm_message_container() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_reject->presencemask & OGS_NAS_EPS_ATTACH_REJECT_T3346_VALUE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_REJECT_T3346_VALUE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_gprs_timer_2(pkbuf, &attach_reject->t3346_value);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_gprs_timer_2() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_reject->presencemask & OGS_NAS_EPS_ATTACH_REJECT_T3402_VALUE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_REJECT_T3402_VALUE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_gprs_timer_2(pkbuf, &attach_reject->t3402_value);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_gprs_timer_2() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -728,37 +1076,58 @@ int ogs_nas_eps_encode_attach_reject(ogs_pkbuf_t *pkbuf, ogs_nas_eps_message_t *
         attach_reject->extended_emm_cause.type = (OGS_NAS_EPS_ATTACH_REJECT_EXTENDED_EMM_CAUSE_TYPE >> 4);
 
         size = ogs_nas_eps_encode_extended_emm_cause(pkbuf, &attach_reject->extended_emm_cause);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_extended_emm_cause() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_reject->presencemask & OGS_NAS_EPS_ATTACH_REJECT_LOWER_BOUND_TIMER_VALUE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_REJECT_LOWER_BOUND_TIMER_VALUE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_gprs_timer_3(pkbuf, &attach_reject->lower_bound_timer_value);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_gprs_timer_3() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_reject->presencemask & OGS_NAS_EPS_ATTACH_REJECT_FORBIDDEN_TAI_FOR_THE_LIST_OF_FORBIDDEN_TRACKING_AREAS_FOR_ROAMING_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_REJECT_FORBIDDEN_TAI_FOR_THE_LIST_OF_FORBIDDEN_TRACKING_AREAS_FOR_ROAMING_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_tracking_area_identity_list(pkbuf, &attach_reject->forbidden_tai_for_the_list_of_forbidden_tracking_areas_for_roaming);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_tracking_area_identity_list() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (attach_reject->presencemask & OGS_NAS_EPS_ATTACH_REJECT_FORBIDDEN_TAI_FOR_THE_LIST_OF_FORBIDDEN_TRACKING_AREAS_FORREGIONAL_PROVISION_OF_SERVICE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ATTACH_REJECT_FORBIDDEN_TAI_FOR_THE_LIST_OF_FORBIDDEN_TRACKING_AREAS_FORREGIONAL_PROVISION_OF_SERVICE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_tracking_area_identity_list(pkbuf, &attach_reject->forbidden_tai_for_the_list_of_forbidden_tracking_areas_forregional_provision_of_service);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_tracking_area_identity_list() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -774,11 +1143,17 @@ int ogs_nas_eps_encode_detach_request_from_ue(ogs_pkbuf_t *pkbuf, ogs_nas_eps_me
     ogs_trace("[NAS] Encode DETACH_REQUEST");
 
     size = ogs_nas_eps_encode_detach_type(pkbuf, &detach_request_from_ue->detach_type);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_detach_type() failed");
+        return size;
+    }
     encoded += size;
 
     size = ogs_nas_eps_encode_eps_mobile_identity(pkbuf, &detach_request_from_ue->eps_mobile_identity);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_eps_mobile_identity() failed");
+        return size;
+    }
     encoded += size;
 
     return encoded;
@@ -793,46 +1168,73 @@ int ogs_nas_eps_encode_detach_request_to_ue(ogs_pkbuf_t *pkbuf, ogs_nas_eps_mess
     ogs_trace("[NAS] Encode DETACH_REQUEST");
 
     size = ogs_nas_eps_encode_detach_type(pkbuf, &detach_request_to_ue->detach_type);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_detach_type() failed");
+        return size;
+    }
     encoded += size;
 
     if (detach_request_to_ue->presencemask & OGS_NAS_EPS_DETACH_REQUEST_EMM_CAUSE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_DETACH_REQUEST_EMM_CAUSE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_emm_cause(pkbuf, &detach_request_to_ue->emm_cause);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_emm_cause() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (detach_request_to_ue->presencemask & OGS_NAS_EPS_DETACH_REQUEST_LOWER_BOUND_TIMER_VALUE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_DETACH_REQUEST_LOWER_BOUND_TIMER_VALUE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_gprs_timer_3(pkbuf, &detach_request_to_ue->lower_bound_timer_value);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_gprs_timer_3() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (detach_request_to_ue->presencemask & OGS_NAS_EPS_DETACH_REQUEST_FORBIDDEN_TAI_FOR_THE_LIST_OF_FORBIDDEN_TRACKING_AREAS_FOR_ROAMING_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_DETACH_REQUEST_FORBIDDEN_TAI_FOR_THE_LIST_OF_FORBIDDEN_TRACKING_AREAS_FOR_ROAMING_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_tracking_area_identity_list(pkbuf, &detach_request_to_ue->forbidden_tai_for_the_list_of_forbidden_tracking_areas_for_roaming);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_tracking_area_identity_list() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (detach_request_to_ue->presencemask & OGS_NAS_EPS_DETACH_REQUEST_FORBIDDEN_TAI_FOR_THE_LIST_OF_FORBIDDEN_TRACKING_AREAS_FORREGIONAL_PROVISION_OF_SERVICE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_DETACH_REQUEST_FORBIDDEN_TAI_FOR_THE_LIST_OF_FORBIDDEN_TRACKING_AREAS_FORREGIONAL_PROVISION_OF_SERVICE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_tracking_area_identity_list(pkbuf, &detach_request_to_ue->forbidden_tai_for_the_list_of_forbidden_tracking_areas_forregional_provision_of_service);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_tracking_area_identity_list() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -848,18 +1250,27 @@ int ogs_nas_eps_encode_tracking_area_update_request(ogs_pkbuf_t *pkbuf, ogs_nas_
     ogs_trace("[NAS] Encode TRACKING_AREA_UPDATE_REQUEST");
 
     size = ogs_nas_eps_encode_eps_update_type(pkbuf, &tracking_area_update_request->eps_update_type);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_eps_update_type() failed");
+        return size;
+    }
     encoded += size;
 
     size = ogs_nas_eps_encode_eps_mobile_identity(pkbuf, &tracking_area_update_request->old_guti);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_eps_mobile_identity() failed");
+        return size;
+    }
     encoded += size;
 
     if (tracking_area_update_request->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_NON_CURRENT_NATIVE_NAS_KEY_SET_IDENTIFIER_PRESENT) {
         tracking_area_update_request->non_current_native_nas_key_set_identifier.type = (OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_NON_CURRENT_NATIVE_NAS_KEY_SET_IDENTIFIER_TYPE >> 4);
 
         size = ogs_nas_eps_encode_key_set_identifier(pkbuf, &tracking_area_update_request->non_current_native_nas_key_set_identifier);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_key_set_identifier() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -867,67 +1278,106 @@ int ogs_nas_eps_encode_tracking_area_update_request(ogs_pkbuf_t *pkbuf, ogs_nas_
         tracking_area_update_request->gprs_ciphering_key_sequence_number.type = (OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_GPRS_CIPHERING_KEY_SEQUENCE_NUMBER_TYPE >> 4);
 
         size = ogs_nas_eps_encode_ciphering_key_sequence_number(pkbuf, &tracking_area_update_request->gprs_ciphering_key_sequence_number);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_ciphering_key_sequence_number() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_request->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_OLD_P_TMSI_SIGNATURE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_OLD_P_TMSI_SIGNATURE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_p_tmsi_signature(pkbuf, &tracking_area_update_request->old_p_tmsi_signature);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_p_tmsi_signature() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_request->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_ADDITIONAL_GUTI_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_ADDITIONAL_GUTI_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_eps_mobile_identity(pkbuf, &tracking_area_update_request->additional_guti);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_eps_mobile_identity() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_request->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_NONCEUE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_NONCEUE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_nonce(pkbuf, &tracking_area_update_request->nonceue);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_nonce() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_request->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_UE_NETWORK_CAPABILITY_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_UE_NETWORK_CAPABILITY_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_ue_network_capability(pkbuf, &tracking_area_update_request->ue_network_capability);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_ue_network_capability() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_request->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_LAST_VISITED_REGISTERED_TAI_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_LAST_VISITED_REGISTERED_TAI_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_tracking_area_identity(pkbuf, &tracking_area_update_request->last_visited_registered_tai);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_tracking_area_identity() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_request->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_DRX_PARAMETER_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_DRX_PARAMETER_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_drx_parameter(pkbuf, &tracking_area_update_request->drx_parameter);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_drx_parameter() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -935,37 +1385,58 @@ int ogs_nas_eps_encode_tracking_area_update_request(ogs_pkbuf_t *pkbuf, ogs_nas_
         tracking_area_update_request->ue_radio_capability_information_update_needed.type = (OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_UE_RADIO_CAPABILITY_INFORMATION_UPDATE_NEEDED_TYPE >> 4);
 
         size = ogs_nas_eps_encode_ue_radio_capability_information_update_needed(pkbuf, &tracking_area_update_request->ue_radio_capability_information_update_needed);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_ue_radio_capability_information_update_needed() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_request->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_EPS_BEARER_CONTEXT_STATUS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_EPS_BEARER_CONTEXT_STATUS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_eps_bearer_context_status(pkbuf, &tracking_area_update_request->eps_bearer_context_status);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_eps_bearer_context_status() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_request->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_MS_NETWORK_CAPABILITY_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_MS_NETWORK_CAPABILITY_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_ms_network_capability(pkbuf, &tracking_area_update_request->ms_network_capability);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_ms_network_capability() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_request->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_OLD_LOCATION_AREA_IDENTIFICATION_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_OLD_LOCATION_AREA_IDENTIFICATION_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_location_area_identification(pkbuf, &tracking_area_update_request->old_location_area_identification);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_location_area_identification() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -973,37 +1444,58 @@ int ogs_nas_eps_encode_tracking_area_update_request(ogs_pkbuf_t *pkbuf, ogs_nas_
         tracking_area_update_request->tmsi_status.type = (OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_TMSI_STATUS_TYPE >> 4);
 
         size = ogs_nas_eps_encode_tmsi_status(pkbuf, &tracking_area_update_request->tmsi_status);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_tmsi_status() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_request->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_MOBILE_STATION_CLASSMARK_2_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_MOBILE_STATION_CLASSMARK_2_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_mobile_station_classmark_2(pkbuf, &tracking_area_update_request->mobile_station_classmark_2);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_mobile_station_classmark_2() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_request->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_MOBILE_STATION_CLASSMARK_3_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_MOBILE_STATION_CLASSMARK_3_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_mobile_station_classmark_3(pkbuf, &tracking_area_update_request->mobile_station_classmark_3);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_mobile_station_classmark_3() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_request->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_SUPPORTED_CODECS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_SUPPORTED_CODECS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_supported_codec_list(pkbuf, &tracking_area_update_request->supported_codecs);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_supported_codec_list() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -1011,17 +1503,26 @@ int ogs_nas_eps_encode_tracking_area_update_request(ogs_pkbuf_t *pkbuf, ogs_nas_
         tracking_area_update_request->additional_update_type.type = (OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_ADDITIONAL_UPDATE_TYPE_TYPE >> 4);
 
         size = ogs_nas_eps_encode_additional_update_type(pkbuf, &tracking_area_update_request->additional_update_type);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_additional_update_type() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_request->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_VOICE_DOMAIN_PREFERENCE_AND_UE_USAGE_SETTING_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_VOICE_DOMAIN_PREFERENCE_AND_UE_USAGE_SETTING_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_voice_domain_preference_and_ue_usage_setting(pkbuf, &tracking_area_update_request->voice_domain_preference_and_ue_usage_setting);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_voice_domain_preference_and_ue_usage_setting() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -1029,7 +1530,10 @@ int ogs_nas_eps_encode_tracking_area_update_request(ogs_pkbuf_t *pkbuf, ogs_nas_
         tracking_area_update_request->old_guti_type.type = (OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_OLD_GUTI_TYPE_TYPE >> 4);
 
         size = ogs_nas_eps_encode_guti_type(pkbuf, &tracking_area_update_request->old_guti_type);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_guti_type() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -1037,7 +1541,10 @@ int ogs_nas_eps_encode_tracking_area_update_request(ogs_pkbuf_t *pkbuf, ogs_nas_
         tracking_area_update_request->device_properties.type = (OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_DEVICE_PROPERTIES_TYPE >> 4);
 
         size = ogs_nas_eps_encode_device_properties(pkbuf, &tracking_area_update_request->device_properties);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_device_properties() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -1045,147 +1552,234 @@ int ogs_nas_eps_encode_tracking_area_update_request(ogs_pkbuf_t *pkbuf, ogs_nas_
         tracking_area_update_request->ms_network_feature_support.type = (OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_MS_NETWORK_FEATURE_SUPPORT_TYPE >> 4);
 
         size = ogs_nas_eps_encode_ms_network_feature_support(pkbuf, &tracking_area_update_request->ms_network_feature_support);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_ms_network_feature_support() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_request->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_TMSI_BASED_NRI_CONTAINER_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_TMSI_BASED_NRI_CONTAINER_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_network_resource_identifier_container(pkbuf, &tracking_area_update_request->tmsi_based_nri_container);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_network_resource_identifier_container() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_request->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_T3324_VALUE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_T3324_VALUE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_gprs_timer_2(pkbuf, &tracking_area_update_request->t3324_value);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_gprs_timer_2() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_request->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_T3412_EXTENDED_VALUE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_T3412_EXTENDED_VALUE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_gprs_timer_3(pkbuf, &tracking_area_update_request->t3412_extended_value);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_gprs_timer_3() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_request->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_EXTENDED_DRX_PARAMETERS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_EXTENDED_DRX_PARAMETERS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_extended_drx_parameters(pkbuf, &tracking_area_update_request->extended_drx_parameters);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_extended_drx_parameters() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_request->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_UE_ADDITIONAL_SECURITY_CAPABILITY_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_UE_ADDITIONAL_SECURITY_CAPABILITY_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_ue_additional_security_capability(pkbuf, &tracking_area_update_request->ue_additional_security_capability);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_ue_additional_security_capability() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_request->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_UE_STATUS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_UE_STATUS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_ue_status(pkbuf, &tracking_area_update_request->ue_status);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_ue_status() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_request->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_ADDITIONAL_INFORMATION_REQUESTED_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_ADDITIONAL_INFORMATION_REQUESTED_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_additional_information_requested(pkbuf, &tracking_area_update_request->additional_information_requested);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_additional_information_requested() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_request->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_N1_UE_NETWORK_CAPABILITY_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_N1_UE_NETWORK_CAPABILITY_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_n1_ue_network_capability(pkbuf, &tracking_area_update_request->n1_ue_network_capability);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_n1_ue_network_capability() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_request->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_UE_RADIO_CAPABILITY_ID_AVAILABILITY_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_UE_RADIO_CAPABILITY_ID_AVAILABILITY_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_ue_radio_capability_id_availability(pkbuf, &tracking_area_update_request->ue_radio_capability_id_availability);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_ue_radio_capability_id_availability() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_request->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_REQUESTED_WUS_ASSISTANCE_INFORMATION_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_REQUESTED_WUS_ASSISTANCE_INFORMATION_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_wus_assistance_information(pkbuf, &tracking_area_update_request->requested_wus_assistance_information);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_wus_assistance_information() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_request->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_DRX_PARAMETER_IN_NB_S1_MODE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_DRX_PARAMETER_IN_NB_S1_MODE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_nb_s1_drx_parameter(pkbuf, &tracking_area_update_request->drx_parameter_in_nb_s1_mode);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_nb_s1_drx_parameter() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_request->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_REQUESTED_IMSI_OFFSET_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_REQUESTED_IMSI_OFFSET_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_imsi_offset(pkbuf, &tracking_area_update_request->requested_imsi_offset);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_imsi_offset() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_request->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_UE_REQUEST_TYPE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_UE_REQUEST_TYPE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_ue_request_type(pkbuf, &tracking_area_update_request->ue_request_type);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_ue_request_type() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_request->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_PAGING_RESTRICTION_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST_PAGING_RESTRICTION_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_paging_restriction(pkbuf, &tracking_area_update_request->paging_restriction);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_paging_restriction() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -1201,126 +1795,201 @@ int ogs_nas_eps_encode_tracking_area_update_accept(ogs_pkbuf_t *pkbuf, ogs_nas_e
     ogs_trace("[NAS] Encode TRACKING_AREA_UPDATE_ACCEPT");
 
     size = ogs_nas_eps_encode_eps_update_result(pkbuf, &tracking_area_update_accept->eps_update_result);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_eps_update_result() failed");
+        return size;
+    }
     encoded += size;
 
     if (tracking_area_update_accept->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_T3412_VALUE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_T3412_VALUE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_gprs_timer(pkbuf, &tracking_area_update_accept->t3412_value);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_gprs_timer() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_accept->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_GUTI_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_GUTI_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_eps_mobile_identity(pkbuf, &tracking_area_update_accept->guti);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_eps_mobile_identity() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_accept->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_TAI_LIST_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_TAI_LIST_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_tracking_area_identity_list(pkbuf, &tracking_area_update_accept->tai_list);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_tracking_area_identity_list() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_accept->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_EPS_BEARER_CONTEXT_STATUS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_EPS_BEARER_CONTEXT_STATUS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_eps_bearer_context_status(pkbuf, &tracking_area_update_accept->eps_bearer_context_status);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_eps_bearer_context_status() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_accept->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_LOCATION_AREA_IDENTIFICATION_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_LOCATION_AREA_IDENTIFICATION_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_location_area_identification(pkbuf, &tracking_area_update_accept->location_area_identification);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_location_area_identification() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_accept->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_MS_IDENTITY_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_MS_IDENTITY_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_mobile_identity(pkbuf, &tracking_area_update_accept->ms_identity);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_mobile_identity() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_accept->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_EMM_CAUSE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_EMM_CAUSE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_emm_cause(pkbuf, &tracking_area_update_accept->emm_cause);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_emm_cause() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_accept->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_T3402_VALUE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_T3402_VALUE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_gprs_timer(pkbuf, &tracking_area_update_accept->t3402_value);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_gprs_timer() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_accept->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_T3423_VALUE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_T3423_VALUE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_gprs_timer(pkbuf, &tracking_area_update_accept->t3423_value);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_gprs_timer() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_accept->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_EQUIVALENT_PLMNS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_EQUIVALENT_PLMNS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_plmn_list(pkbuf, &tracking_area_update_accept->equivalent_plmns);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_plmn_list() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_accept->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_EMERGENCY_NUMBER_LIST_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_EMERGENCY_NUMBER_LIST_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_emergency_number_list(pkbuf, &tracking_area_update_accept->emergency_number_list);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_emergency_number_list() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_accept->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_EPS_NETWORK_FEATURE_SUPPORT_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_EPS_NETWORK_FEATURE_SUPPORT_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_eps_network_feature_support(pkbuf, &tracking_area_update_accept->eps_network_feature_support);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_eps_network_feature_support() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -1328,57 +1997,90 @@ int ogs_nas_eps_encode_tracking_area_update_accept(ogs_pkbuf_t *pkbuf, ogs_nas_e
         tracking_area_update_accept->additional_update_result.type = (OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_ADDITIONAL_UPDATE_RESULT_TYPE >> 4);
 
         size = ogs_nas_eps_encode_additional_update_result(pkbuf, &tracking_area_update_accept->additional_update_result);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_additional_update_result() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_accept->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_T3412_EXTENDED_VALUE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_T3412_EXTENDED_VALUE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_gprs_timer_3(pkbuf, &tracking_area_update_accept->t3412_extended_value);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_gprs_timer_3() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_accept->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_T3324_VALUE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_T3324_VALUE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_gprs_timer_2(pkbuf, &tracking_area_update_accept->t3324_value);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_gprs_timer_2() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_accept->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_EXTENDED_DRX_PARAMETERS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_EXTENDED_DRX_PARAMETERS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_extended_drx_parameters(pkbuf, &tracking_area_update_accept->extended_drx_parameters);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_extended_drx_parameters() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_accept->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_HEADER_COMPRESSION_CONFIGURATION_STATUS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_HEADER_COMPRESSION_CONFIGURATION_STATUS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_header_compression_configuration_status(pkbuf, &tracking_area_update_accept->header_compression_configuration_status);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_header_compression_configuration_status() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_accept->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_DCN_ID_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_DCN_ID_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_dcn_id(pkbuf, &tracking_area_update_accept->dcn_id);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_dcn_id() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -1386,7 +2088,10 @@ int ogs_nas_eps_encode_tracking_area_update_accept(ogs_pkbuf_t *pkbuf, ogs_nas_e
         tracking_area_update_accept->sms_services_status.type = (OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_SMS_SERVICES_STATUS_TYPE >> 4);
 
         size = ogs_nas_eps_encode_sms_services_status(pkbuf, &tracking_area_update_accept->sms_services_status);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_sms_services_status() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -1394,17 +2099,26 @@ int ogs_nas_eps_encode_tracking_area_update_accept(ogs_pkbuf_t *pkbuf, ogs_nas_e
         tracking_area_update_accept->non__nw_policies.type = (OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_NON__NW_POLICIES_TYPE >> 4);
 
         size = ogs_nas_eps_encode_non__nw_provided_policies(pkbuf, &tracking_area_update_accept->non__nw_policies);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_non__nw_provided_policies() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_accept->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_T3448_VALUE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_T3448_VALUE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_gprs_timer_2(pkbuf, &tracking_area_update_accept->t3448_value);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_gprs_timer_2() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -1412,47 +2126,74 @@ int ogs_nas_eps_encode_tracking_area_update_accept(ogs_pkbuf_t *pkbuf, ogs_nas_e
         tracking_area_update_accept->network_policy.type = (OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_NETWORK_POLICY_TYPE >> 4);
 
         size = ogs_nas_eps_encode_network_policy(pkbuf, &tracking_area_update_accept->network_policy);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_network_policy() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_accept->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_T3447_VALUE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_T3447_VALUE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_gprs_timer_3(pkbuf, &tracking_area_update_accept->t3447_value);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_gprs_timer_3() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_accept->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_EXTENDED_EMERGENCY_NUMBER_LIST_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_EXTENDED_EMERGENCY_NUMBER_LIST_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_extended_emergency_number_list(pkbuf, &tracking_area_update_accept->extended_emergency_number_list);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_extended_emergency_number_list() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_accept->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_CIPHERING_KEY_DATA_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_CIPHERING_KEY_DATA_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_ciphering_key_data(pkbuf, &tracking_area_update_accept->ciphering_key_data);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_ciphering_key_data() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_accept->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_UE_RADIO_CAPABILITY_ID_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_UE_RADIO_CAPABILITY_ID_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_ue_radio_capability_id(pkbuf, &tracking_area_update_accept->ue_radio_capability_id);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_ue_radio_capability_id() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -1460,67 +2201,106 @@ int ogs_nas_eps_encode_tracking_area_update_accept(ogs_pkbuf_t *pkbuf, ogs_nas_e
         tracking_area_update_accept->ue_radio_capability_id_deletion_indication.type = (OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_UE_RADIO_CAPABILITY_ID_DELETION_INDICATION_TYPE >> 4);
 
         size = ogs_nas_eps_encode_ue_radio_capability_id_deletion_indication(pkbuf, &tracking_area_update_accept->ue_radio_capability_id_deletion_indication);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_ue_radio_capability_id_deletion_indication() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_accept->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_NEGOTIATED_WUS_ASSISTANCE_INFORMATION_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_NEGOTIATED_WUS_ASSISTANCE_INFORMATION_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_wus_assistance_information(pkbuf, &tracking_area_update_accept->negotiated_wus_assistance_information);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_wus_assistance_information() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_accept->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_NEGOTIATED_DRX_PARAMETER_IN_NB_S1_MODE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_NEGOTIATED_DRX_PARAMETER_IN_NB_S1_MODE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_nb_s1_drx_parameter(pkbuf, &tracking_area_update_accept->negotiated_drx_parameter_in_nb_s1_mode);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_nb_s1_drx_parameter() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_accept->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_NEGOTIATED_IMSI_OFFSET_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_NEGOTIATED_IMSI_OFFSET_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_imsi_offset(pkbuf, &tracking_area_update_accept->negotiated_imsi_offset);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_imsi_offset() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_accept->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_EPS_ADDITIONAL_REQUEST_RESULT_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_EPS_ADDITIONAL_REQUEST_RESULT_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_eps_additional_request_result(pkbuf, &tracking_area_update_accept->eps_additional_request_result);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_eps_additional_request_result() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_accept->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_FORBIDDEN_TAI_FOR_THE_LIST_OF_FORBIDDEN_TRACKING_AREAS_FOR_ROAMING_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_FORBIDDEN_TAI_FOR_THE_LIST_OF_FORBIDDEN_TRACKING_AREAS_FOR_ROAMING_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_tracking_area_identity_list(pkbuf, &tracking_area_update_accept->forbidden_tai_for_the_list_of_forbidden_tracking_areas_for_roaming);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_tracking_area_identity_list() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_accept->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_FORBIDDEN_TAI_FOR_THE_LIST_OF_FORBIDDEN_TRACKING_AREAS_FORREGIONAL_PROVISION_OF_SERVICE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT_FORBIDDEN_TAI_FOR_THE_LIST_OF_FORBIDDEN_TRACKING_AREAS_FORREGIONAL_PROVISION_OF_SERVICE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_tracking_area_identity_list(pkbuf, &tracking_area_update_accept->forbidden_tai_for_the_list_of_forbidden_tracking_areas_forregional_provision_of_service);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_tracking_area_identity_list() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -1536,16 +2316,25 @@ int ogs_nas_eps_encode_tracking_area_update_reject(ogs_pkbuf_t *pkbuf, ogs_nas_e
     ogs_trace("[NAS] Encode TRACKING_AREA_UPDATE_REJECT");
 
     size = ogs_nas_eps_encode_emm_cause(pkbuf, &tracking_area_update_reject->emm_cause);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_emm_cause() failed");
+        return size;
+    }
     encoded += size;
 
     if (tracking_area_update_reject->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_REJECT_T3346_VALUE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_REJECT_T3346_VALUE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_gprs_timer_2(pkbuf, &tracking_area_update_reject->t3346_value);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_gprs_timer_2() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -1553,37 +2342,58 @@ int ogs_nas_eps_encode_tracking_area_update_reject(ogs_pkbuf_t *pkbuf, ogs_nas_e
         tracking_area_update_reject->extended_emm_cause.type = (OGS_NAS_EPS_TRACKING_AREA_UPDATE_REJECT_EXTENDED_EMM_CAUSE_TYPE >> 4);
 
         size = ogs_nas_eps_encode_extended_emm_cause(pkbuf, &tracking_area_update_reject->extended_emm_cause);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_extended_emm_cause() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_reject->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_REJECT_LOWER_BOUND_TIMER_VALUE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_REJECT_LOWER_BOUND_TIMER_VALUE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_gprs_timer_3(pkbuf, &tracking_area_update_reject->lower_bound_timer_value);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_gprs_timer_3() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_reject->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_REJECT_FORBIDDEN_TAI_FOR_THE_LIST_OF_FORBIDDEN_TRACKING_AREAS_FOR_ROAMING_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_REJECT_FORBIDDEN_TAI_FOR_THE_LIST_OF_FORBIDDEN_TRACKING_AREAS_FOR_ROAMING_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_tracking_area_identity_list(pkbuf, &tracking_area_update_reject->forbidden_tai_for_the_list_of_forbidden_tracking_areas_for_roaming);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_tracking_area_identity_list() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (tracking_area_update_reject->presencemask & OGS_NAS_EPS_TRACKING_AREA_UPDATE_REJECT_FORBIDDEN_TAI_FOR_THE_LIST_OF_FORBIDDEN_TRACKING_AREAS_FORREGIONAL_PROVISION_OF_SERVICE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_TRACKING_AREA_UPDATE_REJECT_FORBIDDEN_TAI_FOR_THE_LIST_OF_FORBIDDEN_TRACKING_AREAS_FORREGIONAL_PROVISION_OF_SERVICE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_tracking_area_identity_list(pkbuf, &tracking_area_update_reject->forbidden_tai_for_the_list_of_forbidden_tracking_areas_forregional_provision_of_service);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_tracking_area_identity_list() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -1599,28 +2409,43 @@ int ogs_nas_eps_encode_extended_service_request(ogs_pkbuf_t *pkbuf, ogs_nas_eps_
     ogs_trace("[NAS] Encode EXTENDED_SERVICE_REQUEST");
 
     size = ogs_nas_eps_encode_service_type(pkbuf, &extended_service_request->service_type);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_service_type() failed");
+        return size;
+    }
     encoded += size;
 
     size = ogs_nas_eps_encode_mobile_identity(pkbuf, &extended_service_request->m_tmsi);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_mobile_identity() failed");
+        return size;
+    }
     encoded += size;
 
     if (extended_service_request->presencemask & OGS_NAS_EPS_EXTENDED_SERVICE_REQUEST_CSFB_RESPONSE_PRESENT) {
         extended_service_request->csfb_response.type = (OGS_NAS_EPS_EXTENDED_SERVICE_REQUEST_CSFB_RESPONSE_TYPE >> 4);
 
         size = ogs_nas_eps_encode_csfb_response(pkbuf, &extended_service_request->csfb_response);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_csfb_response() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (extended_service_request->presencemask & OGS_NAS_EPS_EXTENDED_SERVICE_REQUEST_EPS_BEARER_CONTEXT_STATUS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_EXTENDED_SERVICE_REQUEST_EPS_BEARER_CONTEXT_STATUS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_eps_bearer_context_status(pkbuf, &extended_service_request->eps_bearer_context_status);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_eps_bearer_context_status() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -1628,27 +2453,42 @@ int ogs_nas_eps_encode_extended_service_request(ogs_pkbuf_t *pkbuf, ogs_nas_eps_
         extended_service_request->device_properties.type = (OGS_NAS_EPS_EXTENDED_SERVICE_REQUEST_DEVICE_PROPERTIES_TYPE >> 4);
 
         size = ogs_nas_eps_encode_device_properties(pkbuf, &extended_service_request->device_properties);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_device_properties() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (extended_service_request->presencemask & OGS_NAS_EPS_EXTENDED_SERVICE_REQUEST_UE_REQUEST_TYPE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_EXTENDED_SERVICE_REQUEST_UE_REQUEST_TYPE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_ue_request_type(pkbuf, &extended_service_request->ue_request_type);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_ue_request_type() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (extended_service_request->presencemask & OGS_NAS_EPS_EXTENDED_SERVICE_REQUEST_PAGING_RESTRICTION_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_EXTENDED_SERVICE_REQUEST_PAGING_RESTRICTION_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_paging_restriction(pkbuf, &extended_service_request->paging_restriction);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_paging_restriction() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -1664,11 +2504,17 @@ int ogs_nas_eps_encode_service_request(ogs_pkbuf_t *pkbuf, ogs_nas_eps_message_t
     ogs_trace("[NAS] Encode SERVICE_REQUEST");
 
     size = ogs_nas_eps_encode_ksi_and_sequence_number(pkbuf, &service_request->ksi_and_sequence_number);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_ksi_and_sequence_number() failed");
+        return size;
+    }
     encoded += size;
 
     size = ogs_nas_eps_encode_short_mac(pkbuf, &service_request->message_authentication_code);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_short_mac() failed");
+        return size;
+    }
     encoded += size;
 
     return encoded;
@@ -1683,66 +2529,105 @@ int ogs_nas_eps_encode_service_reject(ogs_pkbuf_t *pkbuf, ogs_nas_eps_message_t
     ogs_trace("[NAS] Encode SERVICE_REJECT");
 
     size = ogs_nas_eps_encode_emm_cause(pkbuf, &service_reject->emm_cause);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_emm_cause() failed");
+        return size;
+    }
     encoded += size;
 
     if (service_reject->presencemask & OGS_NAS_EPS_SERVICE_REJECT_T3442_VALUE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_SERVICE_REJECT_T3442_VALUE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_gprs_timer(pkbuf, &service_reject->t3442_value);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_gprs_timer() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (service_reject->presencemask & OGS_NAS_EPS_SERVICE_REJECT_T3346_VALUE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_SERVICE_REJECT_T3346_VALUE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_gprs_timer_2(pkbuf, &service_reject->t3346_value);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_gprs_timer_2() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (service_reject->presencemask & OGS_NAS_EPS_SERVICE_REJECT_T3448_VALUE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_SERVICE_REJECT_T3448_VALUE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_gprs_timer_2(pkbuf, &service_reject->t3448_value);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_gprs_timer_2() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (service_reject->presencemask & OGS_NAS_EPS_SERVICE_REJECT_LOWER_BOUND_TIMER_VALUE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_SERVICE_REJECT_LOWER_BOUND_TIMER_VALUE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_gprs_timer_3(pkbuf, &service_reject->lower_bound_timer_value);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_gprs_timer_3() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (service_reject->presencemask & OGS_NAS_EPS_SERVICE_REJECT_FORBIDDEN_TAI_FOR_THE_LIST_OF_FORBIDDEN_TRACKING_AREAS_FOR_ROAMING_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_SERVICE_REJECT_FORBIDDEN_TAI_FOR_THE_LIST_OF_FORBIDDEN_TRACKING_AREAS_FOR_ROAMING_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_tracking_area_identity_list(pkbuf, &service_reject->forbidden_tai_for_the_list_of_forbidden_tracking_areas_for_roaming);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_tracking_area_identity_list() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (service_reject->presencemask & OGS_NAS_EPS_SERVICE_REJECT_FORBIDDEN_TAI_FOR_THE_LIST_OF_FORBIDDEN_TRACKING_AREAS_FORREGIONAL_PROVISION_OF_SERVICE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_SERVICE_REJECT_FORBIDDEN_TAI_FOR_THE_LIST_OF_FORBIDDEN_TRACKING_AREAS_FORREGIONAL_PROVISION_OF_SERVICE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_tracking_area_identity_list(pkbuf, &service_reject->forbidden_tai_for_the_list_of_forbidden_tracking_areas_forregional_provision_of_service);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_tracking_area_identity_list() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -1758,36 +2643,57 @@ int ogs_nas_eps_encode_guti_reallocation_command(ogs_pkbuf_t *pkbuf, ogs_nas_eps
     ogs_trace("[NAS] Encode GUTI_REALLOCATION_COMMAND");
 
     size = ogs_nas_eps_encode_eps_mobile_identity(pkbuf, &guti_reallocation_command->guti);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_eps_mobile_identity() failed");
+        return size;
+    }
     encoded += size;
 
     if (guti_reallocation_command->presencemask & OGS_NAS_EPS_GUTI_REALLOCATION_COMMAND_TAI_LIST_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_GUTI_REALLOCATION_COMMAND_TAI_LIST_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_tracking_area_identity_list(pkbuf, &guti_reallocation_command->tai_list);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_tracking_area_identity_list() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (guti_reallocation_command->presencemask & OGS_NAS_EPS_GUTI_REALLOCATION_COMMAND_DCN_ID_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_GUTI_REALLOCATION_COMMAND_DCN_ID_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_dcn_id(pkbuf, &guti_reallocation_command->dcn_id);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_dcn_id() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (guti_reallocation_command->presencemask & OGS_NAS_EPS_GUTI_REALLOCATION_COMMAND_UE_RADIO_CAPABILITY_ID_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_GUTI_REALLOCATION_COMMAND_UE_RADIO_CAPABILITY_ID_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_ue_radio_capability_id(pkbuf, &guti_reallocation_command->ue_radio_capability_id);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_ue_radio_capability_id() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -1795,7 +2701,10 @@ int ogs_nas_eps_encode_guti_reallocation_command(ogs_pkbuf_t *pkbuf, ogs_nas_eps
         guti_reallocation_command->ue_radio_capability_id_deletion_indication.type = (OGS_NAS_EPS_GUTI_REALLOCATION_COMMAND_UE_RADIO_CAPABILITY_ID_DELETION_INDICATION_TYPE >> 4);
 
         size = ogs_nas_eps_encode_ue_radio_capability_id_deletion_indication(pkbuf, &guti_reallocation_command->ue_radio_capability_id_deletion_indication);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_ue_radio_capability_id_deletion_indication() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -1811,15 +2720,24 @@ int ogs_nas_eps_encode_authentication_request(ogs_pkbuf_t *pkbuf, ogs_nas_eps_me
     ogs_trace("[NAS] Encode AUTHENTICATION_REQUEST");
 
     size = ogs_nas_eps_encode_key_set_identifier(pkbuf, &authentication_request->nas_key_set_identifierasme);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_key_set_identifier() failed");
+        return size;
+    }
     encoded += size;
 
     size = ogs_nas_eps_encode_authentication_parameter_rand(pkbuf, &authentication_request->authentication_parameter_rand);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_authentication_parameter_rand() failed");
+        return size;
+    }
     encoded += size;
 
     size = ogs_nas_eps_encode_authentication_parameter_autn(pkbuf, &authentication_request->authentication_parameter_autn);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_authentication_parameter_autn() failed");
+        return size;
+    }
     encoded += size;
 
     return encoded;
@@ -1834,7 +2752,10 @@ int ogs_nas_eps_encode_authentication_response(ogs_pkbuf_t *pkbuf, ogs_nas_eps_m
     ogs_trace("[NAS] Encode AUTHENTICATION_RESPONSE");
 
     size = ogs_nas_eps_encode_authentication_response_parameter(pkbuf, &authentication_response->authentication_response_parameter);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_authentication_response_parameter() failed");
+        return size;
+    }
     encoded += size;
 
     return encoded;
@@ -1849,7 +2770,10 @@ int ogs_nas_eps_encode_identity_request(ogs_pkbuf_t *pkbuf, ogs_nas_eps_message_
     ogs_trace("[NAS] Encode IDENTITY_REQUEST");
 
     size = ogs_nas_eps_encode_identity_type_2(pkbuf, &identity_request->identity_type);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_identity_type_2() failed");
+        return size;
+    }
     encoded += size;
 
     return encoded;
@@ -1864,7 +2788,10 @@ int ogs_nas_eps_encode_identity_response(ogs_pkbuf_t *pkbuf, ogs_nas_eps_message
     ogs_trace("[NAS] Encode IDENTITY_RESPONSE");
 
     size = ogs_nas_eps_encode_mobile_identity(pkbuf, &identity_response->mobile_identity);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_mobile_identity() failed");
+        return size;
+    }
     encoded += size;
 
     return encoded;
@@ -1879,16 +2806,25 @@ int ogs_nas_eps_encode_authentication_failure(ogs_pkbuf_t *pkbuf, ogs_nas_eps_me
     ogs_trace("[NAS] Encode AUTHENTICATION_FAILURE");
 
     size = ogs_nas_eps_encode_emm_cause(pkbuf, &authentication_failure->emm_cause);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_emm_cause() failed");
+        return size;
+    }
     encoded += size;
 
     if (authentication_failure->presencemask & OGS_NAS_EPS_AUTHENTICATION_FAILURE_AUTHENTICATION_FAILURE_PARAMETER_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_AUTHENTICATION_FAILURE_AUTHENTICATION_FAILURE_PARAMETER_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_authentication_failure_parameter(pkbuf, &authentication_failure->authentication_failure_parameter);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_authentication_failure_parameter() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -1904,72 +2840,114 @@ int ogs_nas_eps_encode_security_mode_command(ogs_pkbuf_t *pkbuf, ogs_nas_eps_mes
     ogs_trace("[NAS] Encode SECURITY_MODE_COMMAND");
 
     size = ogs_nas_eps_encode_security_algorithms(pkbuf, &security_mode_command->selected_nas_security_algorithms);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_security_algorithms() failed");
+        return size;
+    }
     encoded += size;
 
     size = ogs_nas_eps_encode_key_set_identifier(pkbuf, &security_mode_command->nas_key_set_identifier);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_key_set_identifier() failed");
+        return size;
+    }
     encoded += size;
 
     size = ogs_nas_eps_encode_ue_security_capability(pkbuf, &security_mode_command->replayed_ue_security_capabilities);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_ue_security_capability() failed");
+        return size;
+    }
     encoded += size;
 
     if (security_mode_command->presencemask & OGS_NAS_EPS_SECURITY_MODE_COMMAND_IMEISV_REQUEST_PRESENT) {
         security_mode_command->imeisv_request.type = (OGS_NAS_EPS_SECURITY_MODE_COMMAND_IMEISV_REQUEST_TYPE >> 4);
 
         size = ogs_nas_eps_encode_imeisv_request(pkbuf, &security_mode_command->imeisv_request);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_imeisv_request() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (security_mode_command->presencemask & OGS_NAS_EPS_SECURITY_MODE_COMMAND_REPLAYED_NONCEUE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_SECURITY_MODE_COMMAND_REPLAYED_NONCEUE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_nonce(pkbuf, &security_mode_command->replayed_nonceue);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_nonce() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (security_mode_command->presencemask & OGS_NAS_EPS_SECURITY_MODE_COMMAND_NONCEMME_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_SECURITY_MODE_COMMAND_NONCEMME_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_nonce(pkbuf, &security_mode_command->noncemme);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_nonce() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (security_mode_command->presencemask & OGS_NAS_EPS_SECURITY_MODE_COMMAND_HASHMME_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_SECURITY_MODE_COMMAND_HASHMME_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_hashmme(pkbuf, &security_mode_command->hashmme);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_hashmme() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (security_mode_command->presencemask & OGS_NAS_EPS_SECURITY_MODE_COMMAND_REPLAYED_UE_ADDITIONAL_SECURITY_CAPABILITY_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_SECURITY_MODE_COMMAND_REPLAYED_UE_ADDITIONAL_SECURITY_CAPABILITY_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_ue_additional_security_capability(pkbuf, &security_mode_command->replayed_ue_additional_security_capability);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_ue_additional_security_capability() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (security_mode_command->presencemask & OGS_NAS_EPS_SECURITY_MODE_COMMAND_UE_RADIO_CAPABILITY_ID_REQUEST_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_SECURITY_MODE_COMMAND_UE_RADIO_CAPABILITY_ID_REQUEST_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_ue_radio_capability_id_request(pkbuf, &security_mode_command->ue_radio_capability_id_request);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_ue_radio_capability_id_request() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -1986,31 +2964,49 @@ int ogs_nas_eps_encode_security_mode_complete(ogs_pkbuf_t *pkbuf, ogs_nas_eps_me
 
     if (security_mode_complete->presencemask & OGS_NAS_EPS_SECURITY_MODE_COMPLETE_IMEISV_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_SECURITY_MODE_COMPLETE_IMEISV_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_mobile_identity(pkbuf, &security_mode_complete->imeisv);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_mobile_identity() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (security_mode_complete->presencemask & OGS_NAS_EPS_SECURITY_MODE_COMPLETE_REPLAYED_NAS_MESSAGE_CONTAINER_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_SECURITY_MODE_COMPLETE_REPLAYED_NAS_MESSAGE_CONTAINER_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_replayed_nas_message_container(pkbuf, &security_mode_complete->replayed_nas_message_container);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_replayed_nas_message_container() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (security_mode_complete->presencemask & OGS_NAS_EPS_SECURITY_MODE_COMPLETE_UE_RADIO_CAPABILITY_ID_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_SECURITY_MODE_COMPLETE_UE_RADIO_CAPABILITY_ID_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_ue_radio_capability_id(pkbuf, &security_mode_complete->ue_radio_capability_id);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_ue_radio_capability_id() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -2026,7 +3022,10 @@ int ogs_nas_eps_encode_security_mode_reject(ogs_pkbuf_t *pkbuf, ogs_nas_eps_mess
     ogs_trace("[NAS] Encode SECURITY_MODE_REJECT");
 
     size = ogs_nas_eps_encode_emm_cause(pkbuf, &security_mode_reject->emm_cause);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_emm_cause() failed");
+        return size;
+    }
     encoded += size;
 
     return encoded;
@@ -2041,7 +3040,10 @@ int ogs_nas_eps_encode_emm_status(ogs_pkbuf_t *pkbuf, ogs_nas_eps_message_t *mes
     ogs_trace("[NAS] Encode EMM_STATUS");
 
     size = ogs_nas_eps_encode_emm_cause(pkbuf, &emm_status->emm_cause);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_emm_cause() failed");
+        return size;
+    }
     encoded += size;
 
     return encoded;
@@ -2057,51 +3059,81 @@ int ogs_nas_eps_encode_emm_information(ogs_pkbuf_t *pkbuf, ogs_nas_eps_message_t
 
     if (emm_information->presencemask & OGS_NAS_EPS_EMM_INFORMATION_FULL_NAME_FOR_NETWORK_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_EMM_INFORMATION_FULL_NAME_FOR_NETWORK_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_network_name(pkbuf, &emm_information->full_name_for_network);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_network_name() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (emm_information->presencemask & OGS_NAS_EPS_EMM_INFORMATION_SHORT_NAME_FOR_NETWORK_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_EMM_INFORMATION_SHORT_NAME_FOR_NETWORK_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_network_name(pkbuf, &emm_information->short_name_for_network);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_network_name() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (emm_information->presencemask & OGS_NAS_EPS_EMM_INFORMATION_LOCAL_TIME_ZONE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_EMM_INFORMATION_LOCAL_TIME_ZONE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_time_zone(pkbuf, &emm_information->local_time_zone);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_time_zone() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (emm_information->presencemask & OGS_NAS_EPS_EMM_INFORMATION_UNIVERSAL_TIME_AND_LOCAL_TIME_ZONE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_EMM_INFORMATION_UNIVERSAL_TIME_AND_LOCAL_TIME_ZONE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_time_zone_and_time(pkbuf, &emm_information->universal_time_and_local_time_zone);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_time_zone_and_time() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (emm_information->presencemask & OGS_NAS_EPS_EMM_INFORMATION_NETWORK_DAYLIGHT_SAVING_TIME_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_EMM_INFORMATION_NETWORK_DAYLIGHT_SAVING_TIME_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_daylight_saving_time(pkbuf, &emm_information->network_daylight_saving_time);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_daylight_saving_time() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -2117,7 +3149,10 @@ int ogs_nas_eps_encode_downlink_nas_transport(ogs_pkbuf_t *pkbuf, ogs_nas_eps_me
     ogs_trace("[NAS] Encode DOWNLINK_NAS_TRANSPORT");
 
     size = ogs_nas_eps_encode_eps_message_container(pkbuf, &downlink_nas_transport->nas_message_container);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_eps_message_container() failed");
+        return size;
+    }
     encoded += size;
 
     return encoded;
@@ -2132,7 +3167,10 @@ int ogs_nas_eps_encode_uplink_nas_transport(ogs_pkbuf_t *pkbuf, ogs_nas_eps_mess
     ogs_trace("[NAS] Encode UPLINK_NAS_TRANSPORT");
 
     size = ogs_nas_eps_encode_eps_message_container(pkbuf, &uplink_nas_transport->nas_message_container);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_eps_message_container() failed");
+        return size;
+    }
     encoded += size;
 
     return encoded;
@@ -2147,46 +3185,73 @@ int ogs_nas_eps_encode_cs_service_notification(ogs_pkbuf_t *pkbuf, ogs_nas_eps_m
     ogs_trace("[NAS] Encode CS_SERVICE_NOTIFICATION");
 
     size = ogs_nas_eps_encode_paging_identity(pkbuf, &cs_service_notification->paging_identity);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_paging_identity() failed");
+        return size;
+    }
     encoded += size;
 
     if (cs_service_notification->presencemask & OGS_NAS_EPS_CS_SERVICE_NOTIFICATION_CLI_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_CS_SERVICE_NOTIFICATION_CLI_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_cli(pkbuf, &cs_service_notification->cli);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_cli() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (cs_service_notification->presencemask & OGS_NAS_EPS_CS_SERVICE_NOTIFICATION_SS_CODE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_CS_SERVICE_NOTIFICATION_SS_CODE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_ss_code(pkbuf, &cs_service_notification->ss_code);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_ss_code() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (cs_service_notification->presencemask & OGS_NAS_EPS_CS_SERVICE_NOTIFICATION_LCS_INDICATOR_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_CS_SERVICE_NOTIFICATION_LCS_INDICATOR_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_lcs_indicator(pkbuf, &cs_service_notification->lcs_indicator);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_lcs_indicator() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (cs_service_notification->presencemask & OGS_NAS_EPS_CS_SERVICE_NOTIFICATION_LCS_CLIENT_IDENTITY_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_CS_SERVICE_NOTIFICATION_LCS_CLIENT_IDENTITY_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_lcs_client_identity(pkbuf, &cs_service_notification->lcs_client_identity);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_lcs_client_identity() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -2202,20 +3267,32 @@ int ogs_nas_eps_encode_uplink_generic_nas_transport(ogs_pkbuf_t *pkbuf, ogs_nas_
     ogs_trace("[NAS] Encode UPLINK_GENERIC_NAS_TRANSPORT");
 
     size = ogs_nas_eps_encode_generic_message_container_type(pkbuf, &uplink_generic_nas_transport->generic_message_container_type);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_generic_message_container_type() failed");
+        return size;
+    }
     encoded += size;
 
     size = ogs_nas_eps_encode_generic_message_container(pkbuf, &uplink_generic_nas_transport->generic_message_container);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_generic_message_container() failed");
+        return size;
+    }
     encoded += size;
 
     if (uplink_generic_nas_transport->presencemask & OGS_NAS_EPS_UPLINK_GENERIC_NAS_TRANSPORT_ADDITIONAL_INFORMATION_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_UPLINK_GENERIC_NAS_TRANSPORT_ADDITIONAL_INFORMATION_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_additional_information(pkbuf, &uplink_generic_nas_transport->additional_information);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_additional_information() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -2231,20 +3308,32 @@ int ogs_nas_eps_encode_downlink_generic_nas_transport(ogs_pkbuf_t *pkbuf, ogs_na
     ogs_trace("[NAS] Encode DOWNLINK_GENERIC_NAS_TRANSPORT");
 
     size = ogs_nas_eps_encode_generic_message_container_type(pkbuf, &downlink_generic_nas_transport->generic_message_container_type);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_generic_message_container_type() failed");
+        return size;
+    }
     encoded += size;
 
     size = ogs_nas_eps_encode_generic_message_container(pkbuf, &downlink_generic_nas_transport->generic_message_container);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_generic_message_container() failed");
+        return size;
+    }
     encoded += size;
 
     if (downlink_generic_nas_transport->presencemask & OGS_NAS_EPS_DOWNLINK_GENERIC_NAS_TRANSPORT_ADDITIONAL_INFORMATION_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_DOWNLINK_GENERIC_NAS_TRANSPORT_ADDITIONAL_INFORMATION_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_additional_information(pkbuf, &downlink_generic_nas_transport->additional_information);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_additional_information() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -2260,44 +3349,71 @@ int ogs_nas_eps_encode_activate_default_eps_bearer_context_request(ogs_pkbuf_t *
     ogs_trace("[NAS] Encode ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST");
 
     size = ogs_nas_eps_encode_eps_quality_of_service(pkbuf, &activate_default_eps_bearer_context_request->eps_qos);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_eps_quality_of_service() failed");
+        return size;
+    }
     encoded += size;
 
     size = ogs_nas_eps_encode_access_point_name(pkbuf, &activate_default_eps_bearer_context_request->access_point_name);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_access_point_name() failed");
+        return size;
+    }
     encoded += size;
 
     size = ogs_nas_eps_encode_pdn_address(pkbuf, &activate_default_eps_bearer_context_request->pdn_address);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_pdn_address() failed");
+        return size;
+    }
     encoded += size;
 
     if (activate_default_eps_bearer_context_request->presencemask & OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_TRANSACTION_IDENTIFIER_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_TRANSACTION_IDENTIFIER_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_transaction_identifier(pkbuf, &activate_default_eps_bearer_context_request->transaction_identifier);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_transaction_identifier() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (activate_default_eps_bearer_context_request->presencemask & OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_NEGOTIATED_QOS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_NEGOTIATED_QOS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_quality_of_service(pkbuf, &activate_default_eps_bearer_context_request->negotiated_qos);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_quality_of_service() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (activate_default_eps_bearer_context_request->presencemask & OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_NEGOTIATED_LLC_SAPI_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_NEGOTIATED_LLC_SAPI_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_llc_service_access_point_identifier(pkbuf, &activate_default_eps_bearer_context_request->negotiated_llc_sapi);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_llc_service_access_point_identifier() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -2305,47 +3421,74 @@ int ogs_nas_eps_encode_activate_default_eps_bearer_context_request(ogs_pkbuf_t *
         activate_default_eps_bearer_context_request->radio_priority.type = (OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_RADIO_PRIORITY_TYPE >> 4);
 
         size = ogs_nas_eps_encode_radio_priority(pkbuf, &activate_default_eps_bearer_context_request->radio_priority);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_radio_priority() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (activate_default_eps_bearer_context_request->presencemask & OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_PACKET_FLOW_IDENTIFIER_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_PACKET_FLOW_IDENTIFIER_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_packet_flow_identifier(pkbuf, &activate_default_eps_bearer_context_request->packet_flow_identifier);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_packet_flow_identifier() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (activate_default_eps_bearer_context_request->presencemask & OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_APN_AMBR_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_APN_AMBR_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_apn_aggregate_maximum_bit_rate(pkbuf, &activate_default_eps_bearer_context_request->apn_ambr);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_apn_aggregate_maximum_bit_rate() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (activate_default_eps_bearer_context_request->presencemask & OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_ESM_CAUSE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_ESM_CAUSE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_esm_cause(pkbuf, &activate_default_eps_bearer_context_request->esm_cause);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_esm_cause() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (activate_default_eps_bearer_context_request->presencemask & OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_protocol_configuration_options(pkbuf, &activate_default_eps_bearer_context_request->protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -2353,7 +3496,10 @@ int ogs_nas_eps_encode_activate_default_eps_bearer_context_request(ogs_pkbuf_t *
         activate_default_eps_bearer_context_request->connectivity_type.type = (OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_CONNECTIVITY_TYPE_TYPE >> 4);
 
         size = ogs_nas_eps_encode_connectivity_type(pkbuf, &activate_default_eps_bearer_context_request->connectivity_type);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_connectivity_type() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -2361,27 +3507,42 @@ int ogs_nas_eps_encode_activate_default_eps_bearer_context_request(ogs_pkbuf_t *
         activate_default_eps_bearer_context_request->wlan_offload_indication.type = (OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_WLAN_OFFLOAD_INDICATION_TYPE >> 4);
 
         size = ogs_nas_eps_encode_wlan_offload_acceptability(pkbuf, &activate_default_eps_bearer_context_request->wlan_offload_indication);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_wlan_offload_acceptability() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (activate_default_eps_bearer_context_request->presencemask & OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_NBIFOM_CONTAINER_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_NBIFOM_CONTAINER_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_nbifom_container(pkbuf, &activate_default_eps_bearer_context_request->nbifom_container);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_nbifom_container() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (activate_default_eps_bearer_context_request->presencemask & OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_HEADER_COMPRESSION_CONFIGURATION_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_HEADER_COMPRESSION_CONFIGURATION_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_header_compression_configuration(pkbuf, &activate_default_eps_bearer_context_request->header_compression_configuration);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_header_compression_configuration() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -2389,37 +3550,58 @@ int ogs_nas_eps_encode_activate_default_eps_bearer_context_request(ogs_pkbuf_t *
         activate_default_eps_bearer_context_request->control_plane_only_indication.type = (OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_CONTROL_PLANE_ONLY_INDICATION_TYPE >> 4);
 
         size = ogs_nas_eps_encode_control_plane_only_indication(pkbuf, &activate_default_eps_bearer_context_request->control_plane_only_indication);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_control_plane_only_indication() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (activate_default_eps_bearer_context_request->presencemask & OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_extended_protocol_configuration_options(pkbuf, &activate_default_eps_bearer_context_request->extended_protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_extended_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (activate_default_eps_bearer_context_request->presencemask & OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_SERVING_PLMN_RATE_CONTROL_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_SERVING_PLMN_RATE_CONTROL_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_serving_plmn_rate_control(pkbuf, &activate_default_eps_bearer_context_request->serving_plmn_rate_control);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_serving_plmn_rate_control() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (activate_default_eps_bearer_context_request->presencemask & OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_EXTENDED_APN_AMBR_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST_EXTENDED_APN_AMBR_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_extended_apn_aggregate_maximum_bit_rate(pkbuf, &activate_default_eps_bearer_context_request->extended_apn_ambr);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_extended_apn_aggregate_maximum_bit_rate() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -2436,21 +3618,33 @@ int ogs_nas_eps_encode_activate_default_eps_bearer_context_accept(ogs_pkbuf_t *p
 
     if (activate_default_eps_bearer_context_accept->presencemask & OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_ACCEPT_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_ACCEPT_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_protocol_configuration_options(pkbuf, &activate_default_eps_bearer_context_accept->protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (activate_default_eps_bearer_context_accept->presencemask & OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_ACCEPT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_ACCEPT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_extended_protocol_configuration_options(pkbuf, &activate_default_eps_bearer_context_accept->extended_protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_extended_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -2466,26 +3660,41 @@ int ogs_nas_eps_encode_activate_default_eps_bearer_context_reject(ogs_pkbuf_t *p
     ogs_trace("[NAS] Encode ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REJECT");
 
     size = ogs_nas_eps_encode_esm_cause(pkbuf, &activate_default_eps_bearer_context_reject->esm_cause);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_esm_cause() failed");
+        return size;
+    }
     encoded += size;
 
     if (activate_default_eps_bearer_context_reject->presencemask & OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REJECT_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REJECT_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_protocol_configuration_options(pkbuf, &activate_default_eps_bearer_context_reject->protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (activate_default_eps_bearer_context_reject->presencemask & OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REJECT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REJECT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_extended_protocol_configuration_options(pkbuf, &activate_default_eps_bearer_context_reject->extended_protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_extended_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -2501,44 +3710,71 @@ int ogs_nas_eps_encode_activate_dedicated_eps_bearer_context_request(ogs_pkbuf_t
     ogs_trace("[NAS] Encode ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REQUEST");
 
     size = ogs_nas_eps_encode_linked_eps_bearer_identity(pkbuf, &activate_dedicated_eps_bearer_context_request->linked_eps_bearer_identity);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_linked_eps_bearer_identity() failed");
+        return size;
+    }
     encoded += size;
 
     size = ogs_nas_eps_encode_eps_quality_of_service(pkbuf, &activate_dedicated_eps_bearer_context_request->eps_qos);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_eps_quality_of_service() failed");
+        return size;
+    }
     encoded += size;
 
     size = ogs_nas_eps_encode_traffic_flow_template(pkbuf, &activate_dedicated_eps_bearer_context_request->tft);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_traffic_flow_template() failed");
+        return size;
+    }
     encoded += size;
 
     if (activate_dedicated_eps_bearer_context_request->presencemask & OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REQUEST_TRANSACTION_IDENTIFIER_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REQUEST_TRANSACTION_IDENTIFIER_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_transaction_identifier(pkbuf, &activate_dedicated_eps_bearer_context_request->transaction_identifier);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_transaction_identifier() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (activate_dedicated_eps_bearer_context_request->presencemask & OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REQUEST_NEGOTIATED_QOS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REQUEST_NEGOTIATED_QOS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_quality_of_service(pkbuf, &activate_dedicated_eps_bearer_context_request->negotiated_qos);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_quality_of_service() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (activate_dedicated_eps_bearer_context_request->presencemask & OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REQUEST_NEGOTIATED_LLC_SAPI_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REQUEST_NEGOTIATED_LLC_SAPI_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_llc_service_access_point_identifier(pkbuf, &activate_dedicated_eps_bearer_context_request->negotiated_llc_sapi);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_llc_service_access_point_identifier() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -2546,27 +3782,42 @@ int ogs_nas_eps_encode_activate_dedicated_eps_bearer_context_request(ogs_pkbuf_t
         activate_dedicated_eps_bearer_context_request->radio_priority.type = (OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REQUEST_RADIO_PRIORITY_TYPE >> 4);
 
         size = ogs_nas_eps_encode_radio_priority(pkbuf, &activate_dedicated_eps_bearer_context_request->radio_priority);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_radio_priority() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (activate_dedicated_eps_bearer_context_request->presencemask & OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REQUEST_PACKET_FLOW_IDENTIFIER_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REQUEST_PACKET_FLOW_IDENTIFIER_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_packet_flow_identifier(pkbuf, &activate_dedicated_eps_bearer_context_request->packet_flow_identifier);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_packet_flow_identifier() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (activate_dedicated_eps_bearer_context_request->presencemask & OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REQUEST_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REQUEST_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_protocol_configuration_options(pkbuf, &activate_dedicated_eps_bearer_context_request->protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -2574,37 +3825,58 @@ int ogs_nas_eps_encode_activate_dedicated_eps_bearer_context_request(ogs_pkbuf_t
         activate_dedicated_eps_bearer_context_request->wlan_offload_indication.type = (OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REQUEST_WLAN_OFFLOAD_INDICATION_TYPE >> 4);
 
         size = ogs_nas_eps_encode_wlan_offload_acceptability(pkbuf, &activate_dedicated_eps_bearer_context_request->wlan_offload_indication);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_wlan_offload_acceptability() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (activate_dedicated_eps_bearer_context_request->presencemask & OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REQUEST_NBIFOM_CONTAINER_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REQUEST_NBIFOM_CONTAINER_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_nbifom_container(pkbuf, &activate_dedicated_eps_bearer_context_request->nbifom_container);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_nbifom_container() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (activate_dedicated_eps_bearer_context_request->presencemask & OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REQUEST_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REQUEST_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_extended_protocol_configuration_options(pkbuf, &activate_dedicated_eps_bearer_context_request->extended_protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_extended_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (activate_dedicated_eps_bearer_context_request->presencemask & OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REQUEST_EXTENDED_EPS_QOS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REQUEST_EXTENDED_EPS_QOS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_extended_quality_of_service(pkbuf, &activate_dedicated_eps_bearer_context_request->extended_eps_qos);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_extended_quality_of_service() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -2621,31 +3893,49 @@ int ogs_nas_eps_encode_activate_dedicated_eps_bearer_context_accept(ogs_pkbuf_t
 
     if (activate_dedicated_eps_bearer_context_accept->presencemask & OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_ACCEPT_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_ACCEPT_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_protocol_configuration_options(pkbuf, &activate_dedicated_eps_bearer_context_accept->protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (activate_dedicated_eps_bearer_context_accept->presencemask & OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_ACCEPT_NBIFOM_CONTAINER_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_ACCEPT_NBIFOM_CONTAINER_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_nbifom_container(pkbuf, &activate_dedicated_eps_bearer_context_accept->nbifom_container);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_nbifom_container() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (activate_dedicated_eps_bearer_context_accept->presencemask & OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_ACCEPT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_ACCEPT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_extended_protocol_configuration_options(pkbuf, &activate_dedicated_eps_bearer_context_accept->extended_protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_extended_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -2661,36 +3951,57 @@ int ogs_nas_eps_encode_activate_dedicated_eps_bearer_context_reject(ogs_pkbuf_t
     ogs_trace("[NAS] Encode ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REJECT");
 
     size = ogs_nas_eps_encode_esm_cause(pkbuf, &activate_dedicated_eps_bearer_context_reject->esm_cause);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_esm_cause() failed");
+        return size;
+    }
     encoded += size;
 
     if (activate_dedicated_eps_bearer_context_reject->presencemask & OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REJECT_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REJECT_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_protocol_configuration_options(pkbuf, &activate_dedicated_eps_bearer_context_reject->protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (activate_dedicated_eps_bearer_context_reject->presencemask & OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REJECT_NBIFOM_CONTAINER_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REJECT_NBIFOM_CONTAINER_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_nbifom_container(pkbuf, &activate_dedicated_eps_bearer_context_reject->nbifom_container);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_nbifom_container() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (activate_dedicated_eps_bearer_context_reject->presencemask & OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REJECT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REJECT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_extended_protocol_configuration_options(pkbuf, &activate_dedicated_eps_bearer_context_reject->extended_protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_extended_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -2707,41 +4018,65 @@ int ogs_nas_eps_encode_modify_eps_bearer_context_request(ogs_pkbuf_t *pkbuf, ogs
 
     if (modify_eps_bearer_context_request->presencemask & OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_NEW_EPS_QOS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_NEW_EPS_QOS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_eps_quality_of_service(pkbuf, &modify_eps_bearer_context_request->new_eps_qos);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_eps_quality_of_service() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (modify_eps_bearer_context_request->presencemask & OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_TFT_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_TFT_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_traffic_flow_template(pkbuf, &modify_eps_bearer_context_request->tft);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_traffic_flow_template() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (modify_eps_bearer_context_request->presencemask & OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_NEW_QOS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_NEW_QOS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_quality_of_service(pkbuf, &modify_eps_bearer_context_request->new_qos);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_quality_of_service() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (modify_eps_bearer_context_request->presencemask & OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_NEGOTIATED_LLC_SAPI_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_NEGOTIATED_LLC_SAPI_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_llc_service_access_point_identifier(pkbuf, &modify_eps_bearer_context_request->negotiated_llc_sapi);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_llc_service_access_point_identifier() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -2749,37 +4084,58 @@ int ogs_nas_eps_encode_modify_eps_bearer_context_request(ogs_pkbuf_t *pkbuf, ogs
         modify_eps_bearer_context_request->radio_priority.type = (OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_RADIO_PRIORITY_TYPE >> 4);
 
         size = ogs_nas_eps_encode_radio_priority(pkbuf, &modify_eps_bearer_context_request->radio_priority);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_radio_priority() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (modify_eps_bearer_context_request->presencemask & OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_PACKET_FLOW_IDENTIFIER_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_PACKET_FLOW_IDENTIFIER_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_packet_flow_identifier(pkbuf, &modify_eps_bearer_context_request->packet_flow_identifier);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_packet_flow_identifier() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (modify_eps_bearer_context_request->presencemask & OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_APN_AMBR_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_APN_AMBR_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_apn_aggregate_maximum_bit_rate(pkbuf, &modify_eps_bearer_context_request->apn_ambr);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_apn_aggregate_maximum_bit_rate() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (modify_eps_bearer_context_request->presencemask & OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_protocol_configuration_options(pkbuf, &modify_eps_bearer_context_request->protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -2787,57 +4143,90 @@ int ogs_nas_eps_encode_modify_eps_bearer_context_request(ogs_pkbuf_t *pkbuf, ogs
         modify_eps_bearer_context_request->wlan_offload_indication.type = (OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_WLAN_OFFLOAD_INDICATION_TYPE >> 4);
 
         size = ogs_nas_eps_encode_wlan_offload_acceptability(pkbuf, &modify_eps_bearer_context_request->wlan_offload_indication);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_wlan_offload_acceptability() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (modify_eps_bearer_context_request->presencemask & OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_NBIFOM_CONTAINER_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_NBIFOM_CONTAINER_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_nbifom_container(pkbuf, &modify_eps_bearer_context_request->nbifom_container);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_nbifom_container() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (modify_eps_bearer_context_request->presencemask & OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_HEADER_COMPRESSION_CONFIGURATION_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_HEADER_COMPRESSION_CONFIGURATION_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_header_compression_configuration(pkbuf, &modify_eps_bearer_context_request->header_compression_configuration);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_header_compression_configuration() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (modify_eps_bearer_context_request->presencemask & OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_extended_protocol_configuration_options(pkbuf, &modify_eps_bearer_context_request->extended_protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_extended_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (modify_eps_bearer_context_request->presencemask & OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_EXTENDED_APN_AMBR_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_EXTENDED_APN_AMBR_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_extended_apn_aggregate_maximum_bit_rate(pkbuf, &modify_eps_bearer_context_request->extended_apn_ambr);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_extended_apn_aggregate_maximum_bit_rate() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (modify_eps_bearer_context_request->presencemask & OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_EXTENDED_EPS_QOS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST_EXTENDED_EPS_QOS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_extended_quality_of_service(pkbuf, &modify_eps_bearer_context_request->extended_eps_qos);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_extended_quality_of_service() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -2854,31 +4243,49 @@ int ogs_nas_eps_encode_modify_eps_bearer_context_accept(ogs_pkbuf_t *pkbuf, ogs_
 
     if (modify_eps_bearer_context_accept->presencemask & OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_ACCEPT_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_ACCEPT_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_protocol_configuration_options(pkbuf, &modify_eps_bearer_context_accept->protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (modify_eps_bearer_context_accept->presencemask & OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_ACCEPT_NBIFOM_CONTAINER_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_ACCEPT_NBIFOM_CONTAINER_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_nbifom_container(pkbuf, &modify_eps_bearer_context_accept->nbifom_container);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_nbifom_container() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (modify_eps_bearer_context_accept->presencemask & OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_ACCEPT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_ACCEPT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_extended_protocol_configuration_options(pkbuf, &modify_eps_bearer_context_accept->extended_protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_extended_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -2894,36 +4301,57 @@ int ogs_nas_eps_encode_modify_eps_bearer_context_reject(ogs_pkbuf_t *pkbuf, ogs_
     ogs_trace("[NAS] Encode MODIFY_EPS_BEARER_CONTEXT_REJECT");
 
     size = ogs_nas_eps_encode_esm_cause(pkbuf, &modify_eps_bearer_context_reject->esm_cause);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_esm_cause() failed");
+        return size;
+    }
     encoded += size;
 
     if (modify_eps_bearer_context_reject->presencemask & OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REJECT_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REJECT_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_protocol_configuration_options(pkbuf, &modify_eps_bearer_context_reject->protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (modify_eps_bearer_context_reject->presencemask & OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REJECT_NBIFOM_CONTAINER_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REJECT_NBIFOM_CONTAINER_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_nbifom_container(pkbuf, &modify_eps_bearer_context_reject->nbifom_container);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_nbifom_container() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (modify_eps_bearer_context_reject->presencemask & OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REJECT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REJECT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_extended_protocol_configuration_options(pkbuf, &modify_eps_bearer_context_reject->extended_protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_extended_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -2939,26 +4367,41 @@ int ogs_nas_eps_encode_deactivate_eps_bearer_context_request(ogs_pkbuf_t *pkbuf,
     ogs_trace("[NAS] Encode DEACTIVATE_EPS_BEARER_CONTEXT_REQUEST");
 
     size = ogs_nas_eps_encode_esm_cause(pkbuf, &deactivate_eps_bearer_context_request->esm_cause);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_esm_cause() failed");
+        return size;
+    }
     encoded += size;
 
     if (deactivate_eps_bearer_context_request->presencemask & OGS_NAS_EPS_DEACTIVATE_EPS_BEARER_CONTEXT_REQUEST_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_DEACTIVATE_EPS_BEARER_CONTEXT_REQUEST_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_protocol_configuration_options(pkbuf, &deactivate_eps_bearer_context_request->protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (deactivate_eps_bearer_context_request->presencemask & OGS_NAS_EPS_DEACTIVATE_EPS_BEARER_CONTEXT_REQUEST_T3396_VALUE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_DEACTIVATE_EPS_BEARER_CONTEXT_REQUEST_T3396_VALUE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_gprs_timer_3(pkbuf, &deactivate_eps_bearer_context_request->t3396_value);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_gprs_timer_3() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -2966,27 +4409,42 @@ int ogs_nas_eps_encode_deactivate_eps_bearer_context_request(ogs_pkbuf_t *pkbuf,
         deactivate_eps_bearer_context_request->wlan_offload_indication.type = (OGS_NAS_EPS_DEACTIVATE_EPS_BEARER_CONTEXT_REQUEST_WLAN_OFFLOAD_INDICATION_TYPE >> 4);
 
         size = ogs_nas_eps_encode_wlan_offload_acceptability(pkbuf, &deactivate_eps_bearer_context_request->wlan_offload_indication);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_wlan_offload_acceptability() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (deactivate_eps_bearer_context_request->presencemask & OGS_NAS_EPS_DEACTIVATE_EPS_BEARER_CONTEXT_REQUEST_NBIFOM_CONTAINER_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_DEACTIVATE_EPS_BEARER_CONTEXT_REQUEST_NBIFOM_CONTAINER_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_nbifom_container(pkbuf, &deactivate_eps_bearer_context_request->nbifom_container);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_nbifom_container() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (deactivate_eps_bearer_context_request->presencemask & OGS_NAS_EPS_DEACTIVATE_EPS_BEARER_CONTEXT_REQUEST_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_DEACTIVATE_EPS_BEARER_CONTEXT_REQUEST_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_extended_protocol_configuration_options(pkbuf, &deactivate_eps_bearer_context_request->extended_protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_extended_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -3003,21 +4461,33 @@ int ogs_nas_eps_encode_deactivate_eps_bearer_context_accept(ogs_pkbuf_t *pkbuf,
 
     if (deactivate_eps_bearer_context_accept->presencemask & OGS_NAS_EPS_DEACTIVATE_EPS_BEARER_CONTEXT_ACCEPT_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_DEACTIVATE_EPS_BEARER_CONTEXT_ACCEPT_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_protocol_configuration_options(pkbuf, &deactivate_eps_bearer_context_accept->protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (deactivate_eps_bearer_context_accept->presencemask & OGS_NAS_EPS_DEACTIVATE_EPS_BEARER_CONTEXT_ACCEPT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_DEACTIVATE_EPS_BEARER_CONTEXT_ACCEPT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_extended_protocol_configuration_options(pkbuf, &deactivate_eps_bearer_context_accept->extended_protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_extended_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -3033,34 +4503,52 @@ int ogs_nas_eps_encode_pdn_connectivity_request(ogs_pkbuf_t *pkbuf, ogs_nas_eps_
     ogs_trace("[NAS] Encode PDN_CONNECTIVITY_REQUEST");
 
     size = ogs_nas_eps_encode_request_type(pkbuf, &pdn_connectivity_request->request_type);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_request_type() failed");
+        return size;
+    }
     encoded += size;
 
     if (pdn_connectivity_request->presencemask & OGS_NAS_EPS_PDN_CONNECTIVITY_REQUEST_ESM_INFORMATION_TRANSFER_FLAG_PRESENT) {
         pdn_connectivity_request->esm_information_transfer_flag.type = (OGS_NAS_EPS_PDN_CONNECTIVITY_REQUEST_ESM_INFORMATION_TRANSFER_FLAG_TYPE >> 4);
 
         size = ogs_nas_eps_encode_esm_information_transfer_flag(pkbuf, &pdn_connectivity_request->esm_information_transfer_flag);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_esm_information_transfer_flag() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (pdn_connectivity_request->presencemask & OGS_NAS_EPS_PDN_CONNECTIVITY_REQUEST_ACCESS_POINT_NAME_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_PDN_CONNECTIVITY_REQUEST_ACCESS_POINT_NAME_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_access_point_name(pkbuf, &pdn_connectivity_request->access_point_name);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_access_point_name() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (pdn_connectivity_request->presencemask & OGS_NAS_EPS_PDN_CONNECTIVITY_REQUEST_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_PDN_CONNECTIVITY_REQUEST_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_protocol_configuration_options(pkbuf, &pdn_connectivity_request->protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -3068,37 +4556,58 @@ int ogs_nas_eps_encode_pdn_connectivity_request(ogs_pkbuf_t *pkbuf, ogs_nas_eps_
         pdn_connectivity_request->device_properties.type = (OGS_NAS_EPS_PDN_CONNECTIVITY_REQUEST_DEVICE_PROPERTIES_TYPE >> 4);
 
         size = ogs_nas_eps_encode_device_properties(pkbuf, &pdn_connectivity_request->device_properties);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_device_properties() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (pdn_connectivity_request->presencemask & OGS_NAS_EPS_PDN_CONNECTIVITY_REQUEST_NBIFOM_CONTAINER_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_PDN_CONNECTIVITY_REQUEST_NBIFOM_CONTAINER_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_nbifom_container(pkbuf, &pdn_connectivity_request->nbifom_container);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_nbifom_container() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (pdn_connectivity_request->presencemask & OGS_NAS_EPS_PDN_CONNECTIVITY_REQUEST_HEADER_COMPRESSION_CONFIGURATION_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_PDN_CONNECTIVITY_REQUEST_HEADER_COMPRESSION_CONFIGURATION_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_header_compression_configuration(pkbuf, &pdn_connectivity_request->header_compression_configuration);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_header_compression_configuration() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (pdn_connectivity_request->presencemask & OGS_NAS_EPS_PDN_CONNECTIVITY_REQUEST_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_PDN_CONNECTIVITY_REQUEST_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_extended_protocol_configuration_options(pkbuf, &pdn_connectivity_request->extended_protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_extended_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -3114,56 +4623,89 @@ int ogs_nas_eps_encode_pdn_connectivity_reject(ogs_pkbuf_t *pkbuf, ogs_nas_eps_m
     ogs_trace("[NAS] Encode PDN_CONNECTIVITY_REJECT");
 
     size = ogs_nas_eps_encode_esm_cause(pkbuf, &pdn_connectivity_reject->esm_cause);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_esm_cause() failed");
+        return size;
+    }
     encoded += size;
 
     if (pdn_connectivity_reject->presencemask & OGS_NAS_EPS_PDN_CONNECTIVITY_REJECT_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_PDN_CONNECTIVITY_REJECT_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_protocol_configuration_options(pkbuf, &pdn_connectivity_reject->protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (pdn_connectivity_reject->presencemask & OGS_NAS_EPS_PDN_CONNECTIVITY_REJECT_BACK_OFF_TIMER_VALUE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_PDN_CONNECTIVITY_REJECT_BACK_OFF_TIMER_VALUE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_gprs_timer_3(pkbuf, &pdn_connectivity_reject->back_off_timer_value);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_gprs_timer_3() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (pdn_connectivity_reject->presencemask & OGS_NAS_EPS_PDN_CONNECTIVITY_REJECT_RE_ATTEMPT_INDICATOR_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_PDN_CONNECTIVITY_REJECT_RE_ATTEMPT_INDICATOR_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_re_attempt_indicator(pkbuf, &pdn_connectivity_reject->re_attempt_indicator);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_re_attempt_indicator() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (pdn_connectivity_reject->presencemask & OGS_NAS_EPS_PDN_CONNECTIVITY_REJECT_NBIFOM_CONTAINER_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_PDN_CONNECTIVITY_REJECT_NBIFOM_CONTAINER_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_nbifom_container(pkbuf, &pdn_connectivity_reject->nbifom_container);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_nbifom_container() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (pdn_connectivity_reject->presencemask & OGS_NAS_EPS_PDN_CONNECTIVITY_REJECT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_PDN_CONNECTIVITY_REJECT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_extended_protocol_configuration_options(pkbuf, &pdn_connectivity_reject->extended_protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_extended_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -3179,26 +4721,41 @@ int ogs_nas_eps_encode_pdn_disconnect_request(ogs_pkbuf_t *pkbuf, ogs_nas_eps_me
     ogs_trace("[NAS] Encode PDN_DISCONNECT_REQUEST");
 
     size = ogs_nas_eps_encode_linked_eps_bearer_identity(pkbuf, &pdn_disconnect_request->linked_eps_bearer_identity);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_linked_eps_bearer_identity() failed");
+        return size;
+    }
     encoded += size;
 
     if (pdn_disconnect_request->presencemask & OGS_NAS_EPS_PDN_DISCONNECT_REQUEST_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_PDN_DISCONNECT_REQUEST_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_protocol_configuration_options(pkbuf, &pdn_disconnect_request->protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (pdn_disconnect_request->presencemask & OGS_NAS_EPS_PDN_DISCONNECT_REQUEST_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_PDN_DISCONNECT_REQUEST_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_extended_protocol_configuration_options(pkbuf, &pdn_disconnect_request->extended_protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_extended_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -3214,26 +4771,41 @@ int ogs_nas_eps_encode_pdn_disconnect_reject(ogs_pkbuf_t *pkbuf, ogs_nas_eps_mes
     ogs_trace("[NAS] Encode PDN_DISCONNECT_REJECT");
 
     size = ogs_nas_eps_encode_esm_cause(pkbuf, &pdn_disconnect_reject->esm_cause);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_esm_cause() failed");
+        return size;
+    }
     encoded += size;
 
     if (pdn_disconnect_reject->presencemask & OGS_NAS_EPS_PDN_DISCONNECT_REJECT_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_PDN_DISCONNECT_REJECT_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_protocol_configuration_options(pkbuf, &pdn_disconnect_reject->protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (pdn_disconnect_reject->presencemask & OGS_NAS_EPS_PDN_DISCONNECT_REJECT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_PDN_DISCONNECT_REJECT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_extended_protocol_configuration_options(pkbuf, &pdn_disconnect_reject->extended_protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_extended_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -3249,24 +4821,39 @@ int ogs_nas_eps_encode_bearer_resource_allocation_request(ogs_pkbuf_t *pkbuf, og
     ogs_trace("[NAS] Encode BEARER_RESOURCE_ALLOCATION_REQUEST");
 
     size = ogs_nas_eps_encode_linked_eps_bearer_identity(pkbuf, &bearer_resource_allocation_request->linked_eps_bearer_identity);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_linked_eps_bearer_identity() failed");
+        return size;
+    }
     encoded += size;
 
     size = ogs_nas_eps_encode_traffic_flow_aggregate_description(pkbuf, &bearer_resource_allocation_request->traffic_flow_aggregate);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_traffic_flow_aggregate_description() failed");
+        return size;
+    }
     encoded += size;
 
     size = ogs_nas_eps_encode_eps_quality_of_service(pkbuf, &bearer_resource_allocation_request->required_traffic_flow_qos);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_eps_quality_of_service() failed");
+        return size;
+    }
     encoded += size;
 
     if (bearer_resource_allocation_request->presencemask & OGS_NAS_EPS_BEARER_RESOURCE_ALLOCATION_REQUEST_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_BEARER_RESOURCE_ALLOCATION_REQUEST_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_protocol_configuration_options(pkbuf, &bearer_resource_allocation_request->protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -3274,37 +4861,58 @@ int ogs_nas_eps_encode_bearer_resource_allocation_request(ogs_pkbuf_t *pkbuf, og
         bearer_resource_allocation_request->device_properties.type = (OGS_NAS_EPS_BEARER_RESOURCE_ALLOCATION_REQUEST_DEVICE_PROPERTIES_TYPE >> 4);
 
         size = ogs_nas_eps_encode_device_properties(pkbuf, &bearer_resource_allocation_request->device_properties);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_device_properties() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (bearer_resource_allocation_request->presencemask & OGS_NAS_EPS_BEARER_RESOURCE_ALLOCATION_REQUEST_NBIFOM_CONTAINER_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_BEARER_RESOURCE_ALLOCATION_REQUEST_NBIFOM_CONTAINER_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_nbifom_container(pkbuf, &bearer_resource_allocation_request->nbifom_container);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_nbifom_container() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (bearer_resource_allocation_request->presencemask & OGS_NAS_EPS_BEARER_RESOURCE_ALLOCATION_REQUEST_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_BEARER_RESOURCE_ALLOCATION_REQUEST_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_extended_protocol_configuration_options(pkbuf, &bearer_resource_allocation_request->extended_protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_extended_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (bearer_resource_allocation_request->presencemask & OGS_NAS_EPS_BEARER_RESOURCE_ALLOCATION_REQUEST_EXTENDED_EPS_QOS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_BEARER_RESOURCE_ALLOCATION_REQUEST_EXTENDED_EPS_QOS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_extended_quality_of_service(pkbuf, &bearer_resource_allocation_request->extended_eps_qos);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_extended_quality_of_service() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -3320,56 +4928,89 @@ int ogs_nas_eps_encode_bearer_resource_allocation_reject(ogs_pkbuf_t *pkbuf, ogs
     ogs_trace("[NAS] Encode BEARER_RESOURCE_ALLOCATION_REJECT");
 
     size = ogs_nas_eps_encode_esm_cause(pkbuf, &bearer_resource_allocation_reject->esm_cause);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_esm_cause() failed");
+        return size;
+    }
     encoded += size;
 
     if (bearer_resource_allocation_reject->presencemask & OGS_NAS_EPS_BEARER_RESOURCE_ALLOCATION_REJECT_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_BEARER_RESOURCE_ALLOCATION_REJECT_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_protocol_configuration_options(pkbuf, &bearer_resource_allocation_reject->protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (bearer_resource_allocation_reject->presencemask & OGS_NAS_EPS_BEARER_RESOURCE_ALLOCATION_REJECT_BACK_OFF_TIMER_VALUE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_BEARER_RESOURCE_ALLOCATION_REJECT_BACK_OFF_TIMER_VALUE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_gprs_timer_3(pkbuf, &bearer_resource_allocation_reject->back_off_timer_value);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_gprs_timer_3() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (bearer_resource_allocation_reject->presencemask & OGS_NAS_EPS_BEARER_RESOURCE_ALLOCATION_REJECT_RE_ATTEMPT_INDICATOR_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_BEARER_RESOURCE_ALLOCATION_REJECT_RE_ATTEMPT_INDICATOR_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_re_attempt_indicator(pkbuf, &bearer_resource_allocation_reject->re_attempt_indicator);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_re_attempt_indicator() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (bearer_resource_allocation_reject->presencemask & OGS_NAS_EPS_BEARER_RESOURCE_ALLOCATION_REJECT_NBIFOM_CONTAINER_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_BEARER_RESOURCE_ALLOCATION_REJECT_NBIFOM_CONTAINER_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_nbifom_container(pkbuf, &bearer_resource_allocation_reject->nbifom_container);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_nbifom_container() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (bearer_resource_allocation_reject->presencemask & OGS_NAS_EPS_BEARER_RESOURCE_ALLOCATION_REJECT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_BEARER_RESOURCE_ALLOCATION_REJECT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_extended_protocol_configuration_options(pkbuf, &bearer_resource_allocation_reject->extended_protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_extended_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -3385,40 +5026,64 @@ int ogs_nas_eps_encode_bearer_resource_modification_request(ogs_pkbuf_t *pkbuf,
     ogs_trace("[NAS] Encode BEARER_RESOURCE_MODIFICATION_REQUEST");
 
     size = ogs_nas_eps_encode_linked_eps_bearer_identity(pkbuf, &bearer_resource_modification_request->eps_bearer_identity_for_packet_filter);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_linked_eps_bearer_identity() failed");
+        return size;
+    }
     encoded += size;
 
     size = ogs_nas_eps_encode_traffic_flow_aggregate_description(pkbuf, &bearer_resource_modification_request->traffic_flow_aggregate);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_traffic_flow_aggregate_description() failed");
+        return size;
+    }
     encoded += size;
 
     if (bearer_resource_modification_request->presencemask & OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REQUEST_REQUIRED_TRAFFIC_FLOW_QOS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REQUEST_REQUIRED_TRAFFIC_FLOW_QOS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_eps_quality_of_service(pkbuf, &bearer_resource_modification_request->required_traffic_flow_qos);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_eps_quality_of_service() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (bearer_resource_modification_request->presencemask & OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REQUEST_ESM_CAUSE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REQUEST_ESM_CAUSE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_esm_cause(pkbuf, &bearer_resource_modification_request->esm_cause);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_esm_cause() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (bearer_resource_modification_request->presencemask & OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REQUEST_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REQUEST_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_protocol_configuration_options(pkbuf, &bearer_resource_modification_request->protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -3426,47 +5091,74 @@ int ogs_nas_eps_encode_bearer_resource_modification_request(ogs_pkbuf_t *pkbuf,
         bearer_resource_modification_request->device_properties.type = (OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REQUEST_DEVICE_PROPERTIES_TYPE >> 4);
 
         size = ogs_nas_eps_encode_device_properties(pkbuf, &bearer_resource_modification_request->device_properties);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_device_properties() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (bearer_resource_modification_request->presencemask & OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REQUEST_NBIFOM_CONTAINER_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REQUEST_NBIFOM_CONTAINER_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_nbifom_container(pkbuf, &bearer_resource_modification_request->nbifom_container);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_nbifom_container() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (bearer_resource_modification_request->presencemask & OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REQUEST_HEADER_COMPRESSION_CONFIGURATION_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REQUEST_HEADER_COMPRESSION_CONFIGURATION_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_header_compression_configuration(pkbuf, &bearer_resource_modification_request->header_compression_configuration);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_header_compression_configuration() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (bearer_resource_modification_request->presencemask & OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REQUEST_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REQUEST_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_extended_protocol_configuration_options(pkbuf, &bearer_resource_modification_request->extended_protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_extended_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (bearer_resource_modification_request->presencemask & OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REQUEST_EXTENDED_EPS_QOS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REQUEST_EXTENDED_EPS_QOS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_extended_quality_of_service(pkbuf, &bearer_resource_modification_request->extended_eps_qos);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_extended_quality_of_service() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -3482,56 +5174,89 @@ int ogs_nas_eps_encode_bearer_resource_modification_reject(ogs_pkbuf_t *pkbuf, o
     ogs_trace("[NAS] Encode BEARER_RESOURCE_MODIFICATION_REJECT");
 
     size = ogs_nas_eps_encode_esm_cause(pkbuf, &bearer_resource_modification_reject->esm_cause);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_esm_cause() failed");
+        return size;
+    }
     encoded += size;
 
     if (bearer_resource_modification_reject->presencemask & OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REJECT_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REJECT_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_protocol_configuration_options(pkbuf, &bearer_resource_modification_reject->protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (bearer_resource_modification_reject->presencemask & OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REJECT_BACK_OFF_TIMER_VALUE_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REJECT_BACK_OFF_TIMER_VALUE_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_gprs_timer_3(pkbuf, &bearer_resource_modification_reject->back_off_timer_value);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_gprs_timer_3() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (bearer_resource_modification_reject->presencemask & OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REJECT_RE_ATTEMPT_INDICATOR_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REJECT_RE_ATTEMPT_INDICATOR_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_re_attempt_indicator(pkbuf, &bearer_resource_modification_reject->re_attempt_indicator);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_re_attempt_indicator() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (bearer_resource_modification_reject->presencemask & OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REJECT_NBIFOM_CONTAINER_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REJECT_NBIFOM_CONTAINER_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_nbifom_container(pkbuf, &bearer_resource_modification_reject->nbifom_container);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_nbifom_container() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (bearer_resource_modification_reject->presencemask & OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REJECT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REJECT_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_extended_protocol_configuration_options(pkbuf, &bearer_resource_modification_reject->extended_protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_extended_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -3548,31 +5273,49 @@ int ogs_nas_eps_encode_esm_information_response(ogs_pkbuf_t *pkbuf, ogs_nas_eps_
 
     if (esm_information_response->presencemask & OGS_NAS_EPS_ESM_INFORMATION_RESPONSE_ACCESS_POINT_NAME_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ESM_INFORMATION_RESPONSE_ACCESS_POINT_NAME_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_access_point_name(pkbuf, &esm_information_response->access_point_name);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_access_point_name() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (esm_information_response->presencemask & OGS_NAS_EPS_ESM_INFORMATION_RESPONSE_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ESM_INFORMATION_RESPONSE_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_protocol_configuration_options(pkbuf, &esm_information_response->protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
     if (esm_information_response->presencemask & OGS_NAS_EPS_ESM_INFORMATION_RESPONSE_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_PRESENT) {
         size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_ESM_INFORMATION_RESPONSE_EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS_TYPE);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_optional_type() failed");
+            return size;
+        }
         encoded += size;
 
         size = ogs_nas_eps_encode_extended_protocol_configuration_options(pkbuf, &esm_information_response->extended_protocol_configuration_options);
-        ogs_assert(size >= 0);
+        if (size < 0) {
+            ogs_error("ogs_nas_eps_encode_extended_protocol_configuration_options() failed");
+            return size;
+        }
         encoded += size;
     }
 
@@ -3588,29 +5331,36 @@ int ogs_nas_eps_encode_esm_status(ogs_pkbuf_t *pkbuf, ogs_nas_eps_message_t *mes
     ogs_trace("[NAS] Encode ESM_STATUS");
 
     size = ogs_nas_eps_encode_esm_cause(pkbuf, &esm_status->esm_cause);
-    ogs_assert(size >= 0);
+    if (size < 0) {
+        ogs_error("ogs_nas_eps_encode_esm_cause() failed");
+        return size;
+    }
     encoded += size;
 
     return encoded;
 }
 
-ogs_pkbuf_t *ogs_nas_emm_encode(ogs_nas_eps_message_t *message)
+int ogs_nas_emm_encode_to(
+        ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
-    ogs_pkbuf_t *pkbuf = NULL;
     int size = 0;
     int encoded = 0;
+    int len = 0;
+    int headroom = 0;
 
     ogs_assert(message);
+    ogs_assert(pkbuf);
 
-    /* The Packet Buffer(ogs_pkbuf_t) for NAS message MUST make a HEADROOM.
-     * When calculating AES_CMAC, we need to use the headroom of the packet. */
-    pkbuf = ogs_pkbuf_alloc(NULL, OGS_MAX_SDU_LEN);
-    if (!pkbuf) {
-        ogs_error("ogs_pkbuf_alloc() failed");
-        return NULL;
+    if (ogs_pkbuf_tailroom(pkbuf) < sizeof(ogs_nas_emm_header_t)) {
+        ogs_error("Not enough tailroom [%d]", ogs_pkbuf_tailroom(pkbuf));
+        return OGS_ERROR;
     }
-    ogs_pkbuf_reserve(pkbuf, OGS_NAS_HEADROOM);
-    ogs_pkbuf_put(pkbuf, OGS_MAX_SDU_LEN-OGS_NAS_HEADROOM);
+
+    /* The message follows the octets already in the pkbuf */
+    len = pkbuf->len;
+    headroom = ogs_pkbuf_headroom(pkbuf);
+    ogs_pkbuf_put(pkbuf, ogs_pkbuf_tailroom(pkbuf));
+    ogs_assert(ogs_pkbuf_pull(pkbuf, len));
 
     size = sizeof(ogs_nas_emm_header_t);
     ogs_assert(ogs_pkbuf_pull(pkbuf, size));
@@ -3623,171 +5373,128 @@ ogs_pkbuf_t *ogs_nas_emm_encode(ogs_nas_eps_message_t *message)
         ogs_assert(ogs_pkbuf_push(pkbuf, 1));
         encoded -= 1;
         size = ogs_nas_eps_encode_service_request(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
-
         goto out;
     }
 
     switch (message->emm.h.message_type) {
     case OGS_NAS_EPS_ATTACH_REQUEST:
         size = ogs_nas_eps_encode_attach_request(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_ATTACH_ACCEPT:
         size = ogs_nas_eps_encode_attach_accept(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_ATTACH_COMPLETE:
         size = ogs_nas_eps_encode_attach_complete(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_ATTACH_REJECT:
         size = ogs_nas_eps_encode_attach_reject(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_DETACH_REQUEST:
         size = ogs_nas_eps_encode_detach_request_to_ue(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_DETACH_ACCEPT:
+        size = 0;
         break;
     case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REQUEST:
         size = ogs_nas_eps_encode_tracking_area_update_request(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_TRACKING_AREA_UPDATE_ACCEPT:
         size = ogs_nas_eps_encode_tracking_area_update_accept(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_TRACKING_AREA_UPDATE_COMPLETE:
+        size = 0;
         break;
     case OGS_NAS_EPS_TRACKING_AREA_UPDATE_REJECT:
         size = ogs_nas_eps_encode_tracking_area_update_reject(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_EXTENDED_SERVICE_REQUEST:
         size = ogs_nas_eps_encode_extended_service_request(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_SERVICE_REJECT:
         size = ogs_nas_eps_encode_service_reject(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_GUTI_REALLOCATION_COMMAND:
         size = ogs_nas_eps_encode_guti_reallocation_command(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_GUTI_REALLOCATION_COMPLETE:
+        size = 0;
         break;
     case OGS_NAS_EPS_AUTHENTICATION_REQUEST:
         size = ogs_nas_eps_encode_authentication_request(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_AUTHENTICATION_RESPONSE:
         size = ogs_nas_eps_encode_authentication_response(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_AUTHENTICATION_REJECT:
+        size = 0;
         break;
     case OGS_NAS_EPS_IDENTITY_REQUEST:
         size = ogs_nas_eps_encode_identity_request(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_IDENTITY_RESPONSE:
         size = ogs_nas_eps_encode_identity_response(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_AUTHENTICATION_FAILURE:
         size = ogs_nas_eps_encode_authentication_failure(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_SECURITY_MODE_COMMAND:
         size = ogs_nas_eps_encode_security_mode_command(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_SECURITY_MODE_COMPLETE:
         size = ogs_nas_eps_encode_security_mode_complete(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_SECURITY_MODE_REJECT:
         size = ogs_nas_eps_encode_security_mode_reject(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_EMM_STATUS:
         size = ogs_nas_eps_encode_emm_status(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_EMM_INFORMATION:
         size = ogs_nas_eps_encode_emm_information(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_DOWNLINK_NAS_TRANSPORT:
         size = ogs_nas_eps_encode_downlink_nas_transport(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_UPLINK_NAS_TRANSPORT:
         size = ogs_nas_eps_encode_uplink_nas_transport(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_CS_SERVICE_NOTIFICATION:
         size = ogs_nas_eps_encode_cs_service_notification(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_UPLINK_GENERIC_NAS_TRANSPORT:
         size = ogs_nas_eps_encode_uplink_generic_nas_transport(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_DOWNLINK_GENERIC_NAS_TRANSPORT:
         size = ogs_nas_eps_encode_downlink_generic_nas_transport(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     default:
         ogs_error("Unknown message type (0x%x) or not implemented", 
                message->emm.h.message_type);
-        ogs_pkbuf_free(pkbuf);
-        return NULL;
+        ogs_assert(ogs_pkbuf_push(pkbuf, len + encoded));
+        ogs_pkbuf_trim(pkbuf, len);
+        return OGS_ERROR;
     }
 
 out:
-    ogs_assert(ogs_pkbuf_push(pkbuf, encoded));
+    /* An IE found no room in the tailroom */
+    if (size < 0) {
+        ogs_assert(ogs_pkbuf_push(pkbuf,
+                    ogs_pkbuf_headroom(pkbuf) - headroom));
+        ogs_pkbuf_trim(pkbuf, len);
+        return OGS_ERROR;
+    }
+    encoded += size;
 
-    pkbuf->len = encoded;
+    ogs_assert(ogs_pkbuf_push(pkbuf, len + encoded));
 
-    return pkbuf;
+    ogs_pkbuf_trim(pkbuf, len + encoded);
+
+    return encoded;
 }
 
-ogs_pkbuf_t *ogs_nas_esm_encode(ogs_nas_eps_message_t *message)
+ogs_pkbuf_t *ogs_nas_emm_encode(ogs_nas_eps_message_t *message)
 {
     ogs_pkbuf_t *pkbuf = NULL;
-    int size = 0;
-    int encoded = 0;
 
     ogs_assert(message);
 
@@ -3799,7 +5506,36 @@ ogs_pkbuf_t *ogs_nas_esm_encode(ogs_nas_eps_message_t *message)
         return NULL;
     }
     ogs_pkbuf_reserve(pkbuf, OGS_NAS_HEADROOM);
-    ogs_pkbuf_put(pkbuf, OGS_MAX_SDU_LEN-OGS_NAS_HEADROOM);
+
+    if (ogs_nas_emm_encode_to(message, pkbuf) < 0) {
+        ogs_pkbuf_free(pkbuf);
+        return NULL;
+    }
+
+    return pkbuf;
+}
+
+int ogs_nas_esm_encode_to(
+        ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
+{
+    int size = 0;
+    int encoded = 0;
+    int len = 0;
+    int headroom = 0;
+
+    ogs_assert(message);
+    ogs_assert(pkbuf);
+
+    if (ogs_pkbuf_tailroom(pkbuf) < sizeof(ogs_nas_esm_header_t)) {
+        ogs_error("Not enough tailroom [%d]", ogs_pkbuf_tailroom(pkbuf));
+        return OGS_ERROR;
+    }
+
+    /* The message follows the octets already in the pkbuf */
+    len = pkbuf->len;
+    headroom = ogs_pkbuf_headroom(pkbuf);
+    ogs_pkbuf_put(pkbuf, ogs_pkbuf_tailroom(pkbuf));
+    ogs_assert(ogs_pkbuf_pull(pkbuf, len));
 
     size = sizeof(ogs_nas_esm_header_t);
     ogs_assert(ogs_pkbuf_pull(pkbuf, size));
@@ -3809,120 +5545,112 @@ ogs_pkbuf_t *ogs_nas_esm_encode(ogs_nas_eps_message_t *message)
     switch (message->esm.h.message_type) {
     case OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REQUEST:
         size = ogs_nas_eps_encode_activate_default_eps_bearer_context_request(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_ACCEPT:
         size = ogs_nas_eps_encode_activate_default_eps_bearer_context_accept(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_ACTIVATE_DEFAULT_EPS_BEARER_CONTEXT_REJECT:
         size = ogs_nas_eps_encode_activate_default_eps_bearer_context_reject(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REQUEST:
         size = ogs_nas_eps_encode_activate_dedicated_eps_bearer_context_request(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_ACCEPT:
         size = ogs_nas_eps_encode_activate_dedicated_eps_bearer_context_accept(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_ACTIVATE_DEDICATED_EPS_BEARER_CONTEXT_REJECT:
         size = ogs_nas_eps_encode_activate_dedicated_eps_bearer_context_reject(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REQUEST:
         size = ogs_nas_eps_encode_modify_eps_bearer_context_request(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_ACCEPT:
         size = ogs_nas_eps_encode_modify_eps_bearer_context_accept(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_MODIFY_EPS_BEARER_CONTEXT_REJECT:
         size = ogs_nas_eps_encode_modify_eps_bearer_context_reject(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_DEACTIVATE_EPS_BEARER_CONTEXT_REQUEST:
         size = ogs_nas_eps_encode_deactivate_eps_bearer_context_request(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_DEACTIVATE_EPS_BEARER_CONTEXT_ACCEPT:
         size = ogs_nas_eps_encode_deactivate_eps_bearer_context_accept(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_PDN_CONNECTIVITY_REQUEST:
         size = ogs_nas_eps_encode_pdn_connectivity_request(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_PDN_CONNECTIVITY_REJECT:
         size = ogs_nas_eps_encode_pdn_connectivity_reject(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_PDN_DISCONNECT_REQUEST:
         size = ogs_nas_eps_encode_pdn_disconnect_request(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_PDN_DISCONNECT_REJECT:
         size = ogs_nas_eps_encode_pdn_disconnect_reject(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_BEARER_RESOURCE_ALLOCATION_REQUEST:
         size = ogs_nas_eps_encode_bearer_resource_allocation_request(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_BEARER_RESOURCE_ALLOCATION_REJECT:
         size = ogs_nas_eps_encode_bearer_resource_allocation_reject(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REQUEST:
         size = ogs_nas_eps_encode_bearer_resource_modification_request(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_BEARER_RESOURCE_MODIFICATION_REJECT:
         size = ogs_nas_eps_encode_bearer_resource_modification_reject(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_ESM_INFORMATION_REQUEST:
+        size = 0;
         break;
     case OGS_NAS_EPS_ESM_INFORMATION_RESPONSE:
         size = ogs_nas_eps_encode_esm_information_response(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
     case OGS_NAS_EPS_ESM_STATUS:
         size = ogs_nas_eps_encode_esm_status(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
         break;
    default:
         ogs_error("Unknown message type (0x%x) or not implemented", 
                 message->esm.h.message_type);
-        ogs_pkbuf_free(pkbuf);
+        ogs_assert(ogs_pkbuf_push(pkbuf, len + encoded));
+        ogs_pkbuf_trim(pkbuf, len);
+        return OGS_ERROR;
+    }
+
+    /* An IE found no room in the tailroom */
+    if (size < 0) {
+        ogs_assert(ogs_pkbuf_push(pkbuf,
+                    ogs_pkbuf_headroom(pkbuf) - headroom));
+        ogs_pkbuf_trim(pkbuf, len);
+        return OGS_ERROR;
+    }
+    encoded += size;
+
+    ogs_assert(ogs_pkbuf_push(pkbuf, len + encoded));
+    ogs_pkbuf_trim(pkbuf, len + encoded);
+
+    return encoded;
+}
+
+ogs_pkbuf_t *ogs_nas_esm_encode(ogs_nas_eps_message_t *message)
+{
+    ogs_pkbuf_t *pkbuf = NULL;
+
+    ogs_assert(message);
+
+    /* The Packet Buffer(ogs_pkbuf_t) for NAS message MUST make a HEADROOM.
+     * When calculating AES_CMAC, we need to use the headroom of the packet. */
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_MAX_SDU_LEN);
+    if (!pkbuf) {
+        ogs_error("ogs_pkbuf_alloc() failed");
         return NULL;
     }
+    ogs_pkbuf_reserve(pkbuf, OGS_NAS_HEADROOM);
 
-    ogs_assert(ogs_pkbuf_push(pkbuf, encoded));
-    pkbuf->len = encoded;
+    if (ogs_nas_esm_encode_to(message, pkbuf) < 0) {
+        ogs_pkbuf_free(pkbuf);
+        return NULL;
+    }
 
     return pkbuf;
 }
@@ -3943,3 +5671,21 @@ ogs_pkbuf_t *ogs_nas_eps_plain_encode(ogs_nas_eps_message_t *message)
 
     return NULL;
 }
+
+int ogs_nas_eps_plain_encode_to(
+        ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
+{
+    ogs_assert(message);
+
+    ogs_assert(message->emm.h.protocol_discriminator ==
+            message->esm.h.protocol_discriminator);
+
+    if (message->emm.h.protocol_discriminator == 
+            OGS_NAS_PROTOCOL_DISCRIMINATOR_EMM)
+        return ogs_nas_emm_encode_to(message, pkbuf);
+    else if (message->emm.h.protocol_discriminator == 
+            OGS_NAS_PROTOCOL_DISCRIMINATOR_ESM)
+        return ogs_nas_esm_encode_to(message, pkbuf);
+
+    return OGS_ERROR;
+}
@@ -28,8 +28,8 @@
 /*******************************************************************************
  * This file had been created by nas-message.py script v0.1.0
  * Please do not modify this file but regenerate it via script.
- * Created on: 2024-12-11 21:08:02.462921 by acetcom
- * from 24301-h90.docx
+ * Created from 24301-h90.docx
+ * (sha256: 1acc20b2dabf84bff1965c46a7d926753c0e7fde48d8126faa12e06d66167125)
  ******************************************************************************/
 
 #include "ogs-nas-eps.h"
@@ -38,38 +38,52 @@ int ogs_nas_eps_encode_optional_type(ogs_pkbuf_t *pkbuf, uint8_t type)
 {
     int size = sizeof(uint8_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &type, size);
 
     return size;
 }
 /* 9.9.2.0 Additional information
  * O TLV 3-n */
-int ogs_nas_eps_decode_additional_information(ogs_nas_additional_information_t *additional_information, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_additional_information(ogs_nas_additional_information_t *additional_information, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_additional_information_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_additional_information_t *)pkbuf->data;
+    source = (ogs_nas_additional_information_t *)data;
 
     additional_information->length = source->length;
     size = additional_information->length + sizeof(additional_information->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*additional_information) < size) return -1;
-    memcpy(additional_information, pkbuf->data - size, size);
+    memcpy(additional_information, data, size);
+
+    ogs_nas_trace_ie("ADDITIONAL_INFORMATION", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_additional_information(ogs_nas_additional_information_t *additional_information, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_additional_information(additional_information, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  ADDITIONAL_INFORMATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -80,30 +94,43 @@ int ogs_nas_eps_encode_additional_information(ogs_pkbuf_t *pkbuf, ogs_nas_additi
     ogs_nas_additional_information_t target;
 
     memcpy(&target, additional_information, sizeof(ogs_nas_additional_information_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  ADDITIONAL_INFORMATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("ADDITIONAL_INFORMATION", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.2.0A Device properties
  * O TV 1 */
-int ogs_nas_eps_decode_device_properties(ogs_nas_device_properties_t *device_properties, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_device_properties(ogs_nas_device_properties_t *device_properties, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_device_properties_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(device_properties, pkbuf->data - size, size);
+    memcpy(device_properties, data, size);
+
+    ogs_nas_trace_ie("DEVICE_PROPERTIES", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_device_properties(ogs_nas_device_properties_t *device_properties, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_device_properties(device_properties, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  DEVICE_PROPERTIES - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -112,42 +139,55 @@ int ogs_nas_eps_encode_device_properties(ogs_pkbuf_t *pkbuf, ogs_nas_device_prop
 {
     int size = sizeof(ogs_nas_device_properties_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, device_properties, size);
 
-    ogs_trace("  DEVICE_PROPERTIES - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("DEVICE_PROPERTIES", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.2.1 EPS bearer context status
  * O TLV 4 */
-int ogs_nas_eps_decode_eps_bearer_context_status(ogs_nas_eps_bearer_context_status_t *eps_bearer_context_status, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_eps_bearer_context_status(ogs_nas_eps_bearer_context_status_t *eps_bearer_context_status, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_eps_bearer_context_status_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_eps_bearer_context_status_t *)pkbuf->data;
+    source = (ogs_nas_eps_bearer_context_status_t *)data;
 
     eps_bearer_context_status->length = source->length;
     size = eps_bearer_context_status->length + sizeof(eps_bearer_context_status->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*eps_bearer_context_status) < size) return -1;
-    memcpy(eps_bearer_context_status, pkbuf->data - size, size);
+    memcpy(eps_bearer_context_status, data, size);
+
+    ogs_nas_trace_ie("EPS_BEARER_CONTEXT_STATUS", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_eps_bearer_context_status(ogs_nas_eps_bearer_context_status_t *eps_bearer_context_status, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_eps_bearer_context_status(eps_bearer_context_status, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  EPS_BEARER_CONTEXT_STATUS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -158,42 +198,55 @@ int ogs_nas_eps_encode_eps_bearer_context_status(ogs_pkbuf_t *pkbuf, ogs_nas_eps
     ogs_nas_eps_bearer_context_status_t target;
 
     memcpy(&target, eps_bearer_context_status, sizeof(ogs_nas_eps_bearer_context_status_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  EPS_BEARER_CONTEXT_STATUS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("EPS_BEARER_CONTEXT_STATUS", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.2.10 Supported Codec List
  * O TLV 5-n */
-int ogs_nas_eps_decode_supported_codec_list(ogs_nas_supported_codec_list_t *supported_codec_list, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_supported_codec_list(ogs_nas_supported_codec_list_t *supported_codec_list, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_supported_codec_list_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_supported_codec_list_t *)pkbuf->data;
+    source = (ogs_nas_supported_codec_list_t *)data;
 
     supported_codec_list->length = source->length;
     size = supported_codec_list->length + sizeof(supported_codec_list->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*supported_codec_list) < size) return -1;
-    memcpy(supported_codec_list, pkbuf->data - size, size);
+    memcpy(supported_codec_list, data, size);
+
+    ogs_nas_trace_ie("SUPPORTED_CODEC_LIST", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_supported_codec_list(ogs_nas_supported_codec_list_t *supported_codec_list, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_supported_codec_list(supported_codec_list, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  SUPPORTED_CODEC_LIST - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -204,32 +257,45 @@ int ogs_nas_eps_encode_supported_codec_list(ogs_pkbuf_t *pkbuf, ogs_nas_supporte
     ogs_nas_supported_codec_list_t target;
 
     memcpy(&target, supported_codec_list, sizeof(ogs_nas_supported_codec_list_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  SUPPORTED_CODEC_LIST - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("SUPPORTED_CODEC_LIST", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.2.2 Location area identification
  * O TV 6 */
-int ogs_nas_eps_decode_location_area_identification(ogs_nas_location_area_identification_t *location_area_identification, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_location_area_identification(ogs_nas_location_area_identification_t *location_area_identification, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_location_area_identification_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(location_area_identification, pkbuf->data - size, size);
+    memcpy(location_area_identification, data, size);
 
     location_area_identification->lac = be16toh(location_area_identification->lac);
 
-    ogs_trace("  LOCATION_AREA_IDENTIFICATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("LOCATION_AREA_IDENTIFICATION", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_location_area_identification(ogs_nas_location_area_identification_t *location_area_identification, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_location_area_identification(location_area_identification, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -242,46 +308,59 @@ int ogs_nas_eps_encode_location_area_identification(ogs_pkbuf_t *pkbuf, ogs_nas_
     memcpy(&target, location_area_identification, size);
     target.lac = htobe16(location_area_identification->lac);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  LOCATION_AREA_IDENTIFICATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("LOCATION_AREA_IDENTIFICATION", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.2.3 Mobile identity
  * O TLV 7-10 */
-int ogs_nas_eps_decode_mobile_identity(ogs_nas_mobile_identity_t *mobile_identity, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_mobile_identity(ogs_nas_mobile_identity_t *mobile_identity, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_mobile_identity_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_mobile_identity_t *)pkbuf->data;
+    source = (ogs_nas_mobile_identity_t *)data;
 
     mobile_identity->length = source->length;
     size = mobile_identity->length + sizeof(mobile_identity->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*mobile_identity) < size) return -1;
-    memcpy(mobile_identity, pkbuf->data - size, size);
+    memcpy(mobile_identity, data, size);
 
     if (mobile_identity->tmsi.type == OGS_NAS_MOBILE_IDENTITY_TMSI) {
         mobile_identity->tmsi.tmsi = be32toh(mobile_identity->tmsi.tmsi);
     }
 
-    ogs_trace("  MOBILE_IDENTITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("MOBILE_IDENTITY", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_mobile_identity(ogs_nas_mobile_identity_t *mobile_identity, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_mobile_identity(mobile_identity, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -297,42 +376,55 @@ int ogs_nas_eps_encode_mobile_identity(ogs_pkbuf_t *pkbuf, ogs_nas_mobile_identi
         target.tmsi.spare = 0xf;
     }
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  MOBILE_IDENTITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("MOBILE_IDENTITY", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.2.4 Mobile station classmark 2
  * O TLV 5 */
-int ogs_nas_eps_decode_mobile_station_classmark_2(ogs_nas_mobile_station_classmark_2_t *mobile_station_classmark_2, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_mobile_station_classmark_2(ogs_nas_mobile_station_classmark_2_t *mobile_station_classmark_2, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_mobile_station_classmark_2_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_mobile_station_classmark_2_t *)pkbuf->data;
+    source = (ogs_nas_mobile_station_classmark_2_t *)data;
 
     mobile_station_classmark_2->length = source->length;
     size = mobile_station_classmark_2->length + sizeof(mobile_station_classmark_2->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*mobile_station_classmark_2) < size) return -1;
-    memcpy(mobile_station_classmark_2, pkbuf->data - size, size);
+    memcpy(mobile_station_classmark_2, data, size);
+
+    ogs_nas_trace_ie("MOBILE_STATION_CLASSMARK_2", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_mobile_station_classmark_2(ogs_nas_mobile_station_classmark_2_t *mobile_station_classmark_2, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_mobile_station_classmark_2(mobile_station_classmark_2, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  MOBILE_STATION_CLASSMARK_2 - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -343,42 +435,55 @@ int ogs_nas_eps_encode_mobile_station_classmark_2(ogs_pkbuf_t *pkbuf, ogs_nas_mo
     ogs_nas_mobile_station_classmark_2_t target;
 
     memcpy(&target, mobile_station_classmark_2, sizeof(ogs_nas_mobile_station_classmark_2_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  MOBILE_STATION_CLASSMARK_2 - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("MOBILE_STATION_CLASSMARK_2", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.2.5 Mobile station classmark 3
  * O TLV 2-34 */
-int ogs_nas_eps_decode_mobile_station_classmark_3(ogs_nas_mobile_station_classmark_3_t *mobile_station_classmark_3, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_mobile_station_classmark_3(ogs_nas_mobile_station_classmark_3_t *mobile_station_classmark_3, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_mobile_station_classmark_3_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_mobile_station_classmark_3_t *)pkbuf->data;
+    source = (ogs_nas_mobile_station_classmark_3_t *)data;
 
     mobile_station_classmark_3->length = source->length;
     size = mobile_station_classmark_3->length + sizeof(mobile_station_classmark_3->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*mobile_station_classmark_3) < size) return -1;
-    memcpy(mobile_station_classmark_3, pkbuf->data - size, size);
+    memcpy(mobile_station_classmark_3, data, size);
+
+    ogs_nas_trace_ie("MOBILE_STATION_CLASSMARK_3", data, size);
 
-    ogs_trace("  MOBILE_STATION_CLASSMARK_3 - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    return size;
+}
+
+int ogs_nas_eps_decode_mobile_station_classmark_3(ogs_nas_mobile_station_classmark_3_t *mobile_station_classmark_3, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_mobile_station_classmark_3(mobile_station_classmark_3, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -389,42 +494,55 @@ int ogs_nas_eps_encode_mobile_station_classmark_3(ogs_pkbuf_t *pkbuf, ogs_nas_mo
     ogs_nas_mobile_station_classmark_3_t target;
 
     memcpy(&target, mobile_station_classmark_3, sizeof(ogs_nas_mobile_station_classmark_3_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  MOBILE_STATION_CLASSMARK_3 - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("MOBILE_STATION_CLASSMARK_3", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.2.8 PLMN list
  * O TLV 5-47 */
-int ogs_nas_eps_decode_plmn_list(ogs_nas_plmn_list_t *plmn_list, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_plmn_list(ogs_nas_plmn_list_t *plmn_list, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_plmn_list_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_plmn_list_t *)pkbuf->data;
+    source = (ogs_nas_plmn_list_t *)data;
 
     plmn_list->length = source->length;
     size = plmn_list->length + sizeof(plmn_list->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*plmn_list) < size) return -1;
-    memcpy(plmn_list, pkbuf->data - size, size);
+    memcpy(plmn_list, data, size);
 
-    ogs_trace("  PLMN_LIST - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("PLMN_LIST", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_plmn_list(ogs_nas_plmn_list_t *plmn_list, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_plmn_list(plmn_list, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -435,30 +553,43 @@ int ogs_nas_eps_encode_plmn_list(ogs_pkbuf_t *pkbuf, ogs_nas_plmn_list_t *plmn_l
     ogs_nas_plmn_list_t target;
 
     memcpy(&target, plmn_list, sizeof(ogs_nas_plmn_list_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  PLMN_LIST - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("PLMN_LIST", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.0A Additional update result
  * O TV 1 */
-int ogs_nas_eps_decode_additional_update_result(ogs_nas_additional_update_result_t *additional_update_result, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_additional_update_result(ogs_nas_additional_update_result_t *additional_update_result, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_additional_update_result_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(additional_update_result, pkbuf->data - size, size);
+    memcpy(additional_update_result, data, size);
+
+    ogs_nas_trace_ie("ADDITIONAL_UPDATE_RESULT", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_additional_update_result(ogs_nas_additional_update_result_t *additional_update_result, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_additional_update_result(additional_update_result, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  ADDITIONAL_UPDATE_RESULT - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -467,30 +598,43 @@ int ogs_nas_eps_encode_additional_update_result(ogs_pkbuf_t *pkbuf, ogs_nas_addi
 {
     int size = sizeof(ogs_nas_additional_update_result_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, additional_update_result, size);
 
-    ogs_trace("  ADDITIONAL_UPDATE_RESULT - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("ADDITIONAL_UPDATE_RESULT", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.0B Additional update type
  * O TV 1 */
-int ogs_nas_eps_decode_additional_update_type(ogs_nas_additional_update_type_t *additional_update_type, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_additional_update_type(ogs_nas_additional_update_type_t *additional_update_type, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_additional_update_type_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(additional_update_type, pkbuf->data - size, size);
+    memcpy(additional_update_type, data, size);
+
+    ogs_nas_trace_ie("ADDITIONAL_UPDATE_TYPE", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_additional_update_type(ogs_nas_additional_update_type_t *additional_update_type, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_additional_update_type(additional_update_type, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  ADDITIONAL_UPDATE_TYPE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -499,42 +643,55 @@ int ogs_nas_eps_encode_additional_update_type(ogs_pkbuf_t *pkbuf, ogs_nas_additi
 {
     int size = sizeof(ogs_nas_additional_update_type_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, additional_update_type, size);
 
-    ogs_trace("  ADDITIONAL_UPDATE_TYPE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("ADDITIONAL_UPDATE_TYPE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.1 Authentication failure parameter
  * O TLV 16 */
-int ogs_nas_eps_decode_authentication_failure_parameter(ogs_nas_authentication_failure_parameter_t *authentication_failure_parameter, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_authentication_failure_parameter(ogs_nas_authentication_failure_parameter_t *authentication_failure_parameter, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_authentication_failure_parameter_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_authentication_failure_parameter_t *)pkbuf->data;
+    source = (ogs_nas_authentication_failure_parameter_t *)data;
 
     authentication_failure_parameter->length = source->length;
     size = authentication_failure_parameter->length + sizeof(authentication_failure_parameter->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*authentication_failure_parameter) < size) return -1;
-    memcpy(authentication_failure_parameter, pkbuf->data - size, size);
+    memcpy(authentication_failure_parameter, data, size);
+
+    ogs_nas_trace_ie("AUTHENTICATION_FAILURE_PARAMETER", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_authentication_failure_parameter(ogs_nas_authentication_failure_parameter_t *authentication_failure_parameter, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_authentication_failure_parameter(authentication_failure_parameter, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  AUTHENTICATION_FAILURE_PARAMETER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -545,30 +702,43 @@ int ogs_nas_eps_encode_authentication_failure_parameter(ogs_pkbuf_t *pkbuf, ogs_
     ogs_nas_authentication_failure_parameter_t target;
 
     memcpy(&target, authentication_failure_parameter, sizeof(ogs_nas_authentication_failure_parameter_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  AUTHENTICATION_FAILURE_PARAMETER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("AUTHENTICATION_FAILURE_PARAMETER", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.10 EPS attach result
  * M V 1/2 */
-int ogs_nas_eps_decode_eps_attach_result(ogs_nas_eps_attach_result_t *eps_attach_result, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_eps_attach_result(ogs_nas_eps_attach_result_t *eps_attach_result, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_eps_attach_result_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(eps_attach_result, pkbuf->data - size, size);
+    memcpy(eps_attach_result, data, size);
+
+    ogs_nas_trace_ie("EPS_ATTACH_RESULT", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_eps_attach_result(ogs_nas_eps_attach_result_t *eps_attach_result, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_eps_attach_result(eps_attach_result, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  EPS_ATTACH_RESULT - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -579,30 +749,43 @@ int ogs_nas_eps_encode_eps_attach_result(ogs_pkbuf_t *pkbuf, ogs_nas_eps_attach_
     ogs_nas_eps_attach_result_t target;
 
     memcpy(&target, eps_attach_result, size);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  EPS_ATTACH_RESULT - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("EPS_ATTACH_RESULT", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.11 EPS attach type
  * M V 1/2 */
-int ogs_nas_eps_decode_eps_attach_type(ogs_nas_eps_attach_type_t *eps_attach_type, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_eps_attach_type(ogs_nas_eps_attach_type_t *eps_attach_type, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_eps_attach_type_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(eps_attach_type, pkbuf->data - size, size);
+    memcpy(eps_attach_type, data, size);
+
+    ogs_nas_trace_ie("EPS_ATTACH_TYPE", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_eps_attach_type(ogs_nas_eps_attach_type_t *eps_attach_type, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_eps_attach_type(eps_attach_type, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  EPS_ATTACH_TYPE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -613,47 +796,60 @@ int ogs_nas_eps_encode_eps_attach_type(ogs_pkbuf_t *pkbuf, ogs_nas_eps_attach_ty
     ogs_nas_eps_attach_type_t target;
 
     memcpy(&target, eps_attach_type, size);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  EPS_ATTACH_TYPE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("EPS_ATTACH_TYPE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.12 EPS mobile identity
  * M LV 5-12 */
-int ogs_nas_eps_decode_eps_mobile_identity(ogs_nas_eps_mobile_identity_t *eps_mobile_identity, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_eps_mobile_identity(ogs_nas_eps_mobile_identity_t *eps_mobile_identity, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_eps_mobile_identity_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_eps_mobile_identity_t *)pkbuf->data;
+    source = (ogs_nas_eps_mobile_identity_t *)data;
 
     eps_mobile_identity->length = source->length;
     size = eps_mobile_identity->length + sizeof(eps_mobile_identity->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*eps_mobile_identity) < size) return -1;
-    memcpy(eps_mobile_identity, pkbuf->data - size, size);
+    memcpy(eps_mobile_identity, data, size);
 
     if (eps_mobile_identity->guti.type == OGS_NAS_EPS_MOBILE_IDENTITY_GUTI) {
         eps_mobile_identity->guti.mme_gid = be16toh(eps_mobile_identity->guti.mme_gid);
         eps_mobile_identity->guti.m_tmsi = be32toh(eps_mobile_identity->guti.m_tmsi);
     }
 
-    ogs_trace("  EPS_MOBILE_IDENTITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("EPS_MOBILE_IDENTITY", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_eps_mobile_identity(ogs_nas_eps_mobile_identity_t *eps_mobile_identity, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_eps_mobile_identity(eps_mobile_identity, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -670,42 +866,55 @@ int ogs_nas_eps_encode_eps_mobile_identity(ogs_pkbuf_t *pkbuf, ogs_nas_eps_mobil
         target.guti.m_tmsi = htobe32(eps_mobile_identity->guti.m_tmsi);
     }
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  EPS_MOBILE_IDENTITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("EPS_MOBILE_IDENTITY", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.12A EPS network feature support
  * O TLV 3-4 */
-int ogs_nas_eps_decode_eps_network_feature_support(ogs_nas_eps_network_feature_support_t *eps_network_feature_support, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_eps_network_feature_support(ogs_nas_eps_network_feature_support_t *eps_network_feature_support, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_eps_network_feature_support_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_eps_network_feature_support_t *)pkbuf->data;
+    source = (ogs_nas_eps_network_feature_support_t *)data;
 
     eps_network_feature_support->length = source->length;
     size = eps_network_feature_support->length + sizeof(eps_network_feature_support->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*eps_network_feature_support) < size) return -1;
-    memcpy(eps_network_feature_support, pkbuf->data - size, size);
+    memcpy(eps_network_feature_support, data, size);
+
+    ogs_nas_trace_ie("EPS_NETWORK_FEATURE_SUPPORT", data, size);
 
-    ogs_trace("  EPS_NETWORK_FEATURE_SUPPORT - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    return size;
+}
+
+int ogs_nas_eps_decode_eps_network_feature_support(ogs_nas_eps_network_feature_support_t *eps_network_feature_support, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_eps_network_feature_support(eps_network_feature_support, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -716,30 +925,43 @@ int ogs_nas_eps_encode_eps_network_feature_support(ogs_pkbuf_t *pkbuf, ogs_nas_e
     ogs_nas_eps_network_feature_support_t target;
 
     memcpy(&target, eps_network_feature_support, sizeof(ogs_nas_eps_network_feature_support_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  EPS_NETWORK_FEATURE_SUPPORT - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("EPS_NETWORK_FEATURE_SUPPORT", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.13 EPS update result
  * M V 1/2 */
-int ogs_nas_eps_decode_eps_update_result(ogs_nas_eps_update_result_t *eps_update_result, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_eps_update_result(ogs_nas_eps_update_result_t *eps_update_result, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_eps_update_result_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(eps_update_result, pkbuf->data - size, size);
+    memcpy(eps_update_result, data, size);
+
+    ogs_nas_trace_ie("EPS_UPDATE_RESULT", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_eps_update_result(ogs_nas_eps_update_result_t *eps_update_result, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_eps_update_result(eps_update_result, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  EPS_UPDATE_RESULT - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -750,30 +972,43 @@ int ogs_nas_eps_encode_eps_update_result(ogs_pkbuf_t *pkbuf, ogs_nas_eps_update_
     ogs_nas_eps_update_result_t target;
 
     memcpy(&target, eps_update_result, size);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  EPS_UPDATE_RESULT - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("EPS_UPDATE_RESULT", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.14 EPS update type
  * M V 1/2 */
-int ogs_nas_eps_decode_eps_update_type(ogs_nas_eps_update_type_t *eps_update_type, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_eps_update_type(ogs_nas_eps_update_type_t *eps_update_type, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_eps_update_type_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(eps_update_type, pkbuf->data - size, size);
+    memcpy(eps_update_type, data, size);
+
+    ogs_nas_trace_ie("EPS_UPDATE_TYPE", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_eps_update_type(ogs_nas_eps_update_type_t *eps_update_type, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_eps_update_type(eps_update_type, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  EPS_UPDATE_TYPE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -784,41 +1019,54 @@ int ogs_nas_eps_encode_eps_update_type(ogs_pkbuf_t *pkbuf, ogs_nas_eps_update_ty
     ogs_nas_eps_update_type_t target;
 
     memcpy(&target, eps_update_type, size);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  EPS_UPDATE_TYPE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("EPS_UPDATE_TYPE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.15 ESM message container
  * M LV-E 5-n */
-int ogs_nas_eps_decode_esm_message_container(ogs_nas_esm_message_container_t *esm_message_container, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_esm_message_container(ogs_nas_esm_message_container_t *esm_message_container, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_esm_message_container_t *source = NULL;
 
-    if (pkbuf->len < 2) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 2) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_esm_message_container_t *)pkbuf->data;
+    source = (ogs_nas_esm_message_container_t *)data;
 
     esm_message_container->length = be16toh(source->length);
     size = esm_message_container->length + sizeof(esm_message_container->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    esm_message_container->buffer = pkbuf->data - size + sizeof(esm_message_container->length);
+    esm_message_container->buffer = data + sizeof(esm_message_container->length);
+
+    ogs_nas_trace_ie("ESM_MESSAGE_CONTAINER", esm_message_container->buffer, esm_message_container->length);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_esm_message_container(ogs_nas_esm_message_container_t *esm_message_container, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_esm_message_container(esm_message_container, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  ESM_MESSAGE_CONTAINER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, (void*)esm_message_container->buffer, esm_message_container->length);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -832,35 +1080,51 @@ int ogs_nas_eps_encode_esm_message_container(ogs_pkbuf_t *pkbuf, ogs_nas_esm_mes
     ogs_assert(esm_message_container->buffer);
 
     size = sizeof(esm_message_container->length);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     target = htobe16(esm_message_container->length);
     memcpy(pkbuf->data - size, &target, size);
 
     size = esm_message_container->length;
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, esm_message_container->buffer, size);
 
-    ogs_trace("  ESM_MESSAGE_CONTAINER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("ESM_MESSAGE_CONTAINER", pkbuf->data - size, size);
 
     return esm_message_container->length + sizeof(esm_message_container->length);
 }
 
 /* 9.9.3.16 GPRS timer
  * M V 1 */
-int ogs_nas_eps_decode_gprs_timer(ogs_nas_gprs_timer_t *gprs_timer, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_gprs_timer(ogs_nas_gprs_timer_t *gprs_timer, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_gprs_timer_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(gprs_timer, pkbuf->data - size, size);
+    memcpy(gprs_timer, data, size);
 
-    ogs_trace("  GPRS_TIMER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("GPRS_TIMER", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_gprs_timer(ogs_nas_gprs_timer_t *gprs_timer, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_gprs_timer(gprs_timer, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -871,42 +1135,55 @@ int ogs_nas_eps_encode_gprs_timer(ogs_pkbuf_t *pkbuf, ogs_nas_gprs_timer_t *gprs
     ogs_nas_gprs_timer_t target;
 
     memcpy(&target, gprs_timer, size);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  GPRS_TIMER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("GPRS_TIMER", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.16A GPRS timer 2
  * O TLV 3 */
-int ogs_nas_eps_decode_gprs_timer_2(ogs_nas_gprs_timer_2_t *gprs_timer_2, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_gprs_timer_2(ogs_nas_gprs_timer_2_t *gprs_timer_2, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_gprs_timer_2_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_gprs_timer_2_t *)pkbuf->data;
+    source = (ogs_nas_gprs_timer_2_t *)data;
 
     gprs_timer_2->length = source->length;
     size = gprs_timer_2->length + sizeof(gprs_timer_2->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*gprs_timer_2) < size) return -1;
-    memcpy(gprs_timer_2, pkbuf->data - size, size);
+    memcpy(gprs_timer_2, data, size);
+
+    ogs_nas_trace_ie("GPRS_TIMER_2", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_gprs_timer_2(ogs_nas_gprs_timer_2_t *gprs_timer_2, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_gprs_timer_2(gprs_timer_2, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  GPRS_TIMER_2 - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -917,42 +1194,55 @@ int ogs_nas_eps_encode_gprs_timer_2(ogs_pkbuf_t *pkbuf, ogs_nas_gprs_timer_2_t *
     ogs_nas_gprs_timer_2_t target;
 
     memcpy(&target, gprs_timer_2, sizeof(ogs_nas_gprs_timer_2_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  GPRS_TIMER_2 - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("GPRS_TIMER_2", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.16B GPRS timer 3
  * O TLV 3 */
-int ogs_nas_eps_decode_gprs_timer_3(ogs_nas_gprs_timer_3_t *gprs_timer_3, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_gprs_timer_3(ogs_nas_gprs_timer_3_t *gprs_timer_3, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_gprs_timer_3_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_gprs_timer_3_t *)pkbuf->data;
+    source = (ogs_nas_gprs_timer_3_t *)data;
 
     gprs_timer_3->length = source->length;
     size = gprs_timer_3->length + sizeof(gprs_timer_3->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*gprs_timer_3) < size) return -1;
-    memcpy(gprs_timer_3, pkbuf->data - size, size);
+    memcpy(gprs_timer_3, data, size);
+
+    ogs_nas_trace_ie("GPRS_TIMER_3", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_gprs_timer_3(ogs_nas_gprs_timer_3_t *gprs_timer_3, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_gprs_timer_3(gprs_timer_3, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  GPRS_TIMER_3 - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -963,30 +1253,43 @@ int ogs_nas_eps_encode_gprs_timer_3(ogs_pkbuf_t *pkbuf, ogs_nas_gprs_timer_3_t *
     ogs_nas_gprs_timer_3_t target;
 
     memcpy(&target, gprs_timer_3, sizeof(ogs_nas_gprs_timer_3_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  GPRS_TIMER_3 - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("GPRS_TIMER_3", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.17 Identity type 2
  * M V 1/2 */
-int ogs_nas_eps_decode_identity_type_2(ogs_nas_identity_type_2_t *identity_type_2, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_identity_type_2(ogs_nas_identity_type_2_t *identity_type_2, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_identity_type_2_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(identity_type_2, pkbuf->data - size, size);
+    memcpy(identity_type_2, data, size);
+
+    ogs_nas_trace_ie("IDENTITY_TYPE_2", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_identity_type_2(ogs_nas_identity_type_2_t *identity_type_2, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_identity_type_2(identity_type_2, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  IDENTITY_TYPE_2 - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -997,30 +1300,43 @@ int ogs_nas_eps_encode_identity_type_2(ogs_pkbuf_t *pkbuf, ogs_nas_identity_type
     ogs_nas_identity_type_2_t target;
 
     memcpy(&target, identity_type_2, size);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  IDENTITY_TYPE_2 - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("IDENTITY_TYPE_2", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.18 IMEISV request
  * O TV 1 */
-int ogs_nas_eps_decode_imeisv_request(ogs_nas_imeisv_request_t *imeisv_request, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_imeisv_request(ogs_nas_imeisv_request_t *imeisv_request, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_imeisv_request_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(imeisv_request, pkbuf->data - size, size);
+    memcpy(imeisv_request, data, size);
+
+    ogs_nas_trace_ie("IMEISV_REQUEST", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_imeisv_request(ogs_nas_imeisv_request_t *imeisv_request, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_imeisv_request(imeisv_request, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  IMEISV_REQUEST - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1029,30 +1345,43 @@ int ogs_nas_eps_encode_imeisv_request(ogs_pkbuf_t *pkbuf, ogs_nas_imeisv_request
 {
     int size = sizeof(ogs_nas_imeisv_request_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, imeisv_request, size);
 
-    ogs_trace("  IMEISV_REQUEST - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("IMEISV_REQUEST", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.19 KSI and sequence number
  * M V 1 */
-int ogs_nas_eps_decode_ksi_and_sequence_number(ogs_nas_ksi_and_sequence_number_t *ksi_and_sequence_number, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_ksi_and_sequence_number(ogs_nas_ksi_and_sequence_number_t *ksi_and_sequence_number, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_ksi_and_sequence_number_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(ksi_and_sequence_number, pkbuf->data - size, size);
+    memcpy(ksi_and_sequence_number, data, size);
+
+    ogs_nas_trace_ie("KSI_AND_SEQUENCE_NUMBER", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_ksi_and_sequence_number(ogs_nas_ksi_and_sequence_number_t *ksi_and_sequence_number, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_ksi_and_sequence_number(ksi_and_sequence_number, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  KSI_AND_SEQUENCE_NUMBER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1063,42 +1392,55 @@ int ogs_nas_eps_encode_ksi_and_sequence_number(ogs_pkbuf_t *pkbuf, ogs_nas_ksi_a
     ogs_nas_ksi_and_sequence_number_t target;
 
     memcpy(&target, ksi_and_sequence_number, size);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  KSI_AND_SEQUENCE_NUMBER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("KSI_AND_SEQUENCE_NUMBER", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.2 Authentication parameter AUTN
  * M LV 17 */
-int ogs_nas_eps_decode_authentication_parameter_autn(ogs_nas_authentication_parameter_autn_t *authentication_parameter_autn, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_authentication_parameter_autn(ogs_nas_authentication_parameter_autn_t *authentication_parameter_autn, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_authentication_parameter_autn_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_authentication_parameter_autn_t *)pkbuf->data;
+    source = (ogs_nas_authentication_parameter_autn_t *)data;
 
     authentication_parameter_autn->length = source->length;
     size = authentication_parameter_autn->length + sizeof(authentication_parameter_autn->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*authentication_parameter_autn) < size) return -1;
-    memcpy(authentication_parameter_autn, pkbuf->data - size, size);
+    memcpy(authentication_parameter_autn, data, size);
+
+    ogs_nas_trace_ie("AUTHENTICATION_PARAMETER_AUTN", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_authentication_parameter_autn(ogs_nas_authentication_parameter_autn_t *authentication_parameter_autn, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_authentication_parameter_autn(authentication_parameter_autn, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  AUTHENTICATION_PARAMETER_AUTN - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1109,42 +1451,55 @@ int ogs_nas_eps_encode_authentication_parameter_autn(ogs_pkbuf_t *pkbuf, ogs_nas
     ogs_nas_authentication_parameter_autn_t target;
 
     memcpy(&target, authentication_parameter_autn, sizeof(ogs_nas_authentication_parameter_autn_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  AUTHENTICATION_PARAMETER_AUTN - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("AUTHENTICATION_PARAMETER_AUTN", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.20 MS network capability
  * O TLV 4-10 */
-int ogs_nas_eps_decode_ms_network_capability(ogs_nas_ms_network_capability_t *ms_network_capability, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_ms_network_capability(ogs_nas_ms_network_capability_t *ms_network_capability, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_ms_network_capability_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_ms_network_capability_t *)pkbuf->data;
+    source = (ogs_nas_ms_network_capability_t *)data;
 
     ms_network_capability->length = source->length;
     size = ms_network_capability->length + sizeof(ms_network_capability->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*ms_network_capability) < size) return -1;
-    memcpy(ms_network_capability, pkbuf->data - size, size);
+    memcpy(ms_network_capability, data, size);
+
+    ogs_nas_trace_ie("MS_NETWORK_CAPABILITY", data, size);
 
-    ogs_trace("  MS_NETWORK_CAPABILITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    return size;
+}
+
+int ogs_nas_eps_decode_ms_network_capability(ogs_nas_ms_network_capability_t *ms_network_capability, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_ms_network_capability(ms_network_capability, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1155,30 +1510,43 @@ int ogs_nas_eps_encode_ms_network_capability(ogs_pkbuf_t *pkbuf, ogs_nas_ms_netw
     ogs_nas_ms_network_capability_t target;
 
     memcpy(&target, ms_network_capability, sizeof(ogs_nas_ms_network_capability_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  MS_NETWORK_CAPABILITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("MS_NETWORK_CAPABILITY", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.20A MS network feature support
  * O TV 1 */
-int ogs_nas_eps_decode_ms_network_feature_support(ogs_nas_ms_network_feature_support_t *ms_network_feature_support, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_ms_network_feature_support(ogs_nas_ms_network_feature_support_t *ms_network_feature_support, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_ms_network_feature_support_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(ms_network_feature_support, pkbuf->data - size, size);
+    memcpy(ms_network_feature_support, data, size);
+
+    ogs_nas_trace_ie("MS_NETWORK_FEATURE_SUPPORT", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_ms_network_feature_support(ogs_nas_ms_network_feature_support_t *ms_network_feature_support, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_ms_network_feature_support(ms_network_feature_support, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  MS_NETWORK_FEATURE_SUPPORT - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1187,30 +1555,43 @@ int ogs_nas_eps_encode_ms_network_feature_support(ogs_pkbuf_t *pkbuf, ogs_nas_ms
 {
     int size = sizeof(ogs_nas_ms_network_feature_support_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, ms_network_feature_support, size);
 
-    ogs_trace("  MS_NETWORK_FEATURE_SUPPORT - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("MS_NETWORK_FEATURE_SUPPORT", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.21 key set identifier
  * O TV 1 */
-int ogs_nas_eps_decode_key_set_identifier(ogs_nas_key_set_identifier_t *key_set_identifier, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_key_set_identifier(ogs_nas_key_set_identifier_t *key_set_identifier, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_key_set_identifier_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(key_set_identifier, pkbuf->data - size, size);
+    memcpy(key_set_identifier, data, size);
+
+    ogs_nas_trace_ie("KEY_SET_IDENTIFIER", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_key_set_identifier(ogs_nas_key_set_identifier_t *key_set_identifier, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_key_set_identifier(key_set_identifier, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  KEY_SET_IDENTIFIER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1219,76 +1600,102 @@ int ogs_nas_eps_encode_key_set_identifier(ogs_pkbuf_t *pkbuf, ogs_nas_key_set_id
 {
     int size = sizeof(ogs_nas_key_set_identifier_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, key_set_identifier, size);
 
-    ogs_trace("  KEY_SET_IDENTIFIER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("KEY_SET_IDENTIFIER", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.22 EPS message container
  * M LV 3-252 */
-int ogs_nas_eps_decode_eps_message_container(ogs_nas_eps_message_container_t *eps_message_container, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_eps_message_container(ogs_nas_eps_message_container_t *eps_message_container, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_eps_message_container_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_eps_message_container_t *)pkbuf->data;
+    source = (ogs_nas_eps_message_container_t *)data;
 
     eps_message_container->length = source->length;
     size = eps_message_container->length + sizeof(eps_message_container->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*eps_message_container) < size) return -1;
-    memcpy(eps_message_container, pkbuf->data - size, size);
+    memcpy(eps_message_container, data, size);
 
-    ogs_trace("  EPS_MESSAGE_CONTAINER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("EPS_MESSAGE_CONTAINER", data, size);
 
     return size;
 }
 
-int ogs_nas_eps_encode_eps_message_container(ogs_pkbuf_t *pkbuf, ogs_nas_eps_message_container_t *eps_message_container)
+int ogs_nas_eps_decode_eps_message_container(ogs_nas_eps_message_container_t *eps_message_container, ogs_pkbuf_t *pkbuf)
 {
-    int size = eps_message_container->length + sizeof(eps_message_container->length);
-    ogs_nas_eps_message_container_t target;
+    int size = ogs_nas_eps_read_eps_message_container(eps_message_container, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    memcpy(&target, eps_message_container, sizeof(ogs_nas_eps_message_container_t));
     ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+
+    return size;
+}
+
+int ogs_nas_eps_encode_eps_message_container(ogs_pkbuf_t *pkbuf, ogs_nas_eps_message_container_t *eps_message_container)
+{
+    int size = eps_message_container->length + sizeof(eps_message_container->length);
+    ogs_nas_eps_message_container_t target;
+
+    memcpy(&target, eps_message_container, sizeof(ogs_nas_eps_message_container_t));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  EPS_MESSAGE_CONTAINER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("EPS_MESSAGE_CONTAINER", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.23 security algorithms
  * M V 1 */
-int ogs_nas_eps_decode_security_algorithms(ogs_nas_security_algorithms_t *security_algorithms, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_security_algorithms(ogs_nas_security_algorithms_t *security_algorithms, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_security_algorithms_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(security_algorithms, pkbuf->data - size, size);
+    memcpy(security_algorithms, data, size);
+
+    ogs_nas_trace_ie("SECURITY_ALGORITHMS", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_security_algorithms(ogs_nas_security_algorithms_t *security_algorithms, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_security_algorithms(security_algorithms, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  SECURITY_ALGORITHMS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1299,42 +1706,55 @@ int ogs_nas_eps_encode_security_algorithms(ogs_pkbuf_t *pkbuf, ogs_nas_security_
     ogs_nas_security_algorithms_t target;
 
     memcpy(&target, security_algorithms, size);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  SECURITY_ALGORITHMS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("SECURITY_ALGORITHMS", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.24 Network name
  * O TLV 3-n */
-int ogs_nas_eps_decode_network_name(ogs_nas_network_name_t *network_name, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_network_name(ogs_nas_network_name_t *network_name, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_network_name_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_network_name_t *)pkbuf->data;
+    source = (ogs_nas_network_name_t *)data;
 
     network_name->length = source->length;
     size = network_name->length + sizeof(network_name->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*network_name) < size) return -1;
-    memcpy(network_name, pkbuf->data - size, size);
+    memcpy(network_name, data, size);
 
-    ogs_trace("  NETWORK_NAME - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("NETWORK_NAME", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_network_name(ogs_nas_network_name_t *network_name, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_network_name(network_name, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1345,42 +1765,55 @@ int ogs_nas_eps_encode_network_name(ogs_pkbuf_t *pkbuf, ogs_nas_network_name_t *
     ogs_nas_network_name_t target;
 
     memcpy(&target, network_name, sizeof(ogs_nas_network_name_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  NETWORK_NAME - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("NETWORK_NAME", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.24A Network resource identifier container
  * O TLV 4 */
-int ogs_nas_eps_decode_network_resource_identifier_container(ogs_nas_network_resource_identifier_container_t *network_resource_identifier_container, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_network_resource_identifier_container(ogs_nas_network_resource_identifier_container_t *network_resource_identifier_container, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_network_resource_identifier_container_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_network_resource_identifier_container_t *)pkbuf->data;
+    source = (ogs_nas_network_resource_identifier_container_t *)data;
 
     network_resource_identifier_container->length = source->length;
     size = network_resource_identifier_container->length + sizeof(network_resource_identifier_container->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*network_resource_identifier_container) < size) return -1;
-    memcpy(network_resource_identifier_container, pkbuf->data - size, size);
+    memcpy(network_resource_identifier_container, data, size);
 
-    ogs_trace("  NETWORK_RESOURCE_IDENTIFIER_CONTAINER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("NETWORK_RESOURCE_IDENTIFIER_CONTAINER", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_network_resource_identifier_container(ogs_nas_network_resource_identifier_container_t *network_resource_identifier_container, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_network_resource_identifier_container(network_resource_identifier_container, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1391,32 +1824,45 @@ int ogs_nas_eps_encode_network_resource_identifier_container(ogs_pkbuf_t *pkbuf,
     ogs_nas_network_resource_identifier_container_t target;
 
     memcpy(&target, network_resource_identifier_container, sizeof(ogs_nas_network_resource_identifier_container_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  NETWORK_RESOURCE_IDENTIFIER_CONTAINER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("NETWORK_RESOURCE_IDENTIFIER_CONTAINER", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.25 Nonce
  * O TV 5 */
-int ogs_nas_eps_decode_nonce(ogs_nas_nonce_t *nonce, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_nonce(ogs_nas_nonce_t *nonce, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_nonce_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(nonce, pkbuf->data - size, size);
+    memcpy(nonce, data, size);
 
     *nonce = be32toh(*nonce);
 
-    ogs_trace("  NONCE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("NONCE", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_nonce(ogs_nas_nonce_t *nonce, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_nonce(nonce, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1429,30 +1875,43 @@ int ogs_nas_eps_encode_nonce(ogs_pkbuf_t *pkbuf, ogs_nas_nonce_t *nonce)
     memcpy(&target, nonce, size);
     target = htobe32(*nonce);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  NONCE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("NONCE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.25A Paging identity
  * M V 1 */
-int ogs_nas_eps_decode_paging_identity(ogs_nas_paging_identity_t *paging_identity, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_paging_identity(ogs_nas_paging_identity_t *paging_identity, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_paging_identity_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(paging_identity, pkbuf->data - size, size);
+    memcpy(paging_identity, data, size);
 
-    ogs_trace("  PAGING_IDENTITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("PAGING_IDENTITY", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_paging_identity(ogs_nas_paging_identity_t *paging_identity, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_paging_identity(paging_identity, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1463,32 +1922,45 @@ int ogs_nas_eps_encode_paging_identity(ogs_pkbuf_t *pkbuf, ogs_nas_paging_identi
     ogs_nas_paging_identity_t target;
 
     memcpy(&target, paging_identity, size);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  PAGING_IDENTITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("PAGING_IDENTITY", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.26 P-TMSI signature
  * O TV 4 */
-int ogs_nas_eps_decode_p_tmsi_signature(ogs_nas_p_tmsi_signature_t *p_tmsi_signature, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_p_tmsi_signature(ogs_nas_p_tmsi_signature_t *p_tmsi_signature, unsigned char *data, int len)
 {
     int size = 3;
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(p_tmsi_signature, pkbuf->data - size, size);
+    memcpy(p_tmsi_signature, data, size);
 
     *p_tmsi_signature = htobe32(*p_tmsi_signature);
 
-    ogs_trace("  P_TMSI_SIGNATURE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("P_TMSI_SIGNATURE", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_p_tmsi_signature(ogs_nas_p_tmsi_signature_t *p_tmsi_signature, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_p_tmsi_signature(p_tmsi_signature, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1501,30 +1973,43 @@ int ogs_nas_eps_encode_p_tmsi_signature(ogs_pkbuf_t *pkbuf, ogs_nas_p_tmsi_signa
     memcpy(&target, p_tmsi_signature, size);
     *p_tmsi_signature = be32toh(*p_tmsi_signature);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  P_TMSI_SIGNATURE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("P_TMSI_SIGNATURE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.26A Extended EMM cause
  * O TV 1 */
-int ogs_nas_eps_decode_extended_emm_cause(ogs_nas_extended_emm_cause_t *extended_emm_cause, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_extended_emm_cause(ogs_nas_extended_emm_cause_t *extended_emm_cause, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_extended_emm_cause_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(extended_emm_cause, pkbuf->data - size, size);
+    memcpy(extended_emm_cause, data, size);
 
-    ogs_trace("  EXTENDED_EMM_CAUSE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("EXTENDED_EMM_CAUSE", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_extended_emm_cause(ogs_nas_extended_emm_cause_t *extended_emm_cause, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_extended_emm_cause(extended_emm_cause, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1533,30 +2018,43 @@ int ogs_nas_eps_encode_extended_emm_cause(ogs_pkbuf_t *pkbuf, ogs_nas_extended_e
 {
     int size = sizeof(ogs_nas_extended_emm_cause_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, extended_emm_cause, size);
 
-    ogs_trace("  EXTENDED_EMM_CAUSE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("EXTENDED_EMM_CAUSE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.27 Service type
  * M V 1/2 */
-int ogs_nas_eps_decode_service_type(ogs_nas_service_type_t *service_type, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_service_type(ogs_nas_service_type_t *service_type, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_service_type_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(service_type, pkbuf->data - size, size);
+    memcpy(service_type, data, size);
 
-    ogs_trace("  SERVICE_TYPE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("SERVICE_TYPE", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_service_type(ogs_nas_service_type_t *service_type, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_service_type(service_type, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1567,32 +2065,45 @@ int ogs_nas_eps_encode_service_type(ogs_pkbuf_t *pkbuf, ogs_nas_service_type_t *
     ogs_nas_service_type_t target;
 
     memcpy(&target, service_type, size);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  SERVICE_TYPE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("SERVICE_TYPE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.28 Short MAC
  * M V 2 */
-int ogs_nas_eps_decode_short_mac(ogs_nas_short_mac_t *short_mac, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_short_mac(ogs_nas_short_mac_t *short_mac, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_short_mac_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(short_mac, pkbuf->data - size, size);
+    memcpy(short_mac, data, size);
 
     *short_mac = be16toh(*short_mac);
 
-    ogs_trace("  SHORT_MAC - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("SHORT_MAC", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_short_mac(ogs_nas_short_mac_t *short_mac, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_short_mac(short_mac, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1605,30 +2116,43 @@ int ogs_nas_eps_encode_short_mac(ogs_pkbuf_t *pkbuf, ogs_nas_short_mac_t *short_
     memcpy(&target, short_mac, size);
     target = htobe16(*short_mac);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  SHORT_MAC - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("SHORT_MAC", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.29 Time zone
  * O TV 2 */
-int ogs_nas_eps_decode_time_zone(ogs_nas_time_zone_t *time_zone, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_time_zone(ogs_nas_time_zone_t *time_zone, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_time_zone_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(time_zone, pkbuf->data - size, size);
+    memcpy(time_zone, data, size);
+
+    ogs_nas_trace_ie("TIME_ZONE", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_time_zone(ogs_nas_time_zone_t *time_zone, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_time_zone(time_zone, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  TIME_ZONE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1639,30 +2163,43 @@ int ogs_nas_eps_encode_time_zone(ogs_pkbuf_t *pkbuf, ogs_nas_time_zone_t *time_z
     ogs_nas_time_zone_t target;
 
     memcpy(&target, time_zone, size);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  TIME_ZONE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("TIME_ZONE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.3 Authentication parameter RAND
  * M V 16 */
-int ogs_nas_eps_decode_authentication_parameter_rand(ogs_nas_authentication_parameter_rand_t *authentication_parameter_rand, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_authentication_parameter_rand(ogs_nas_authentication_parameter_rand_t *authentication_parameter_rand, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_authentication_parameter_rand_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(authentication_parameter_rand, pkbuf->data - size, size);
+    memcpy(authentication_parameter_rand, data, size);
 
-    ogs_trace("  AUTHENTICATION_PARAMETER_RAND - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("AUTHENTICATION_PARAMETER_RAND", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_authentication_parameter_rand(ogs_nas_authentication_parameter_rand_t *authentication_parameter_rand, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_authentication_parameter_rand(authentication_parameter_rand, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1673,30 +2210,43 @@ int ogs_nas_eps_encode_authentication_parameter_rand(ogs_pkbuf_t *pkbuf, ogs_nas
     ogs_nas_authentication_parameter_rand_t target;
 
     memcpy(&target, authentication_parameter_rand, size);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  AUTHENTICATION_PARAMETER_RAND - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("AUTHENTICATION_PARAMETER_RAND", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.30 Time zone and time
  * O TV 8 */
-int ogs_nas_eps_decode_time_zone_and_time(ogs_nas_time_zone_and_time_t *time_zone_and_time, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_time_zone_and_time(ogs_nas_time_zone_and_time_t *time_zone_and_time, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_time_zone_and_time_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(time_zone_and_time, pkbuf->data - size, size);
+    memcpy(time_zone_and_time, data, size);
+
+    ogs_nas_trace_ie("TIME_ZONE_AND_TIME", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_time_zone_and_time(ogs_nas_time_zone_and_time_t *time_zone_and_time, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_time_zone_and_time(time_zone_and_time, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  TIME_ZONE_AND_TIME - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1707,30 +2257,43 @@ int ogs_nas_eps_encode_time_zone_and_time(ogs_pkbuf_t *pkbuf, ogs_nas_time_zone_
     ogs_nas_time_zone_and_time_t target;
 
     memcpy(&target, time_zone_and_time, size);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  TIME_ZONE_AND_TIME - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("TIME_ZONE_AND_TIME", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.31 TMSI status
  * O TV 1 */
-int ogs_nas_eps_decode_tmsi_status(ogs_nas_tmsi_status_t *tmsi_status, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_tmsi_status(ogs_nas_tmsi_status_t *tmsi_status, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_tmsi_status_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(tmsi_status, pkbuf->data - size, size);
+    memcpy(tmsi_status, data, size);
 
-    ogs_trace("  TMSI_STATUS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("TMSI_STATUS", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_tmsi_status(ogs_nas_tmsi_status_t *tmsi_status, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_tmsi_status(tmsi_status, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1739,32 +2302,45 @@ int ogs_nas_eps_encode_tmsi_status(ogs_pkbuf_t *pkbuf, ogs_nas_tmsi_status_t *tm
 {
     int size = sizeof(ogs_nas_tmsi_status_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, tmsi_status, size);
 
-    ogs_trace("  TMSI_STATUS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("TMSI_STATUS", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.32 Tracking area identity
  * O TV 6 */
-int ogs_nas_eps_decode_tracking_area_identity(ogs_nas_tracking_area_identity_t *tracking_area_identity, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_tracking_area_identity(ogs_nas_tracking_area_identity_t *tracking_area_identity, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_tracking_area_identity_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(tracking_area_identity, pkbuf->data - size, size);
+    memcpy(tracking_area_identity, data, size);
 
     tracking_area_identity->tac = be16toh(tracking_area_identity->tac);
 
-    ogs_trace("  TRACKING_AREA_IDENTITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("TRACKING_AREA_IDENTITY", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_tracking_area_identity(ogs_nas_tracking_area_identity_t *tracking_area_identity, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_tracking_area_identity(tracking_area_identity, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1777,42 +2353,55 @@ int ogs_nas_eps_encode_tracking_area_identity(ogs_pkbuf_t *pkbuf, ogs_nas_tracki
     memcpy(&target, tracking_area_identity, size);
     target.tac = htobe16(tracking_area_identity->tac);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  TRACKING_AREA_IDENTITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("TRACKING_AREA_IDENTITY", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.33 Tracking area identity list
  * M LV 7-97 */
-int ogs_nas_eps_decode_tracking_area_identity_list(ogs_nas_tracking_area_identity_list_t *tracking_area_identity_list, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_tracking_area_identity_list(ogs_nas_tracking_area_identity_list_t *tracking_area_identity_list, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_tracking_area_identity_list_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_tracking_area_identity_list_t *)pkbuf->data;
+    source = (ogs_nas_tracking_area_identity_list_t *)data;
 
     tracking_area_identity_list->length = source->length;
     size = tracking_area_identity_list->length + sizeof(tracking_area_identity_list->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*tracking_area_identity_list) < size) return -1;
-    memcpy(tracking_area_identity_list, pkbuf->data - size, size);
+    memcpy(tracking_area_identity_list, data, size);
 
-    ogs_trace("  TRACKING_AREA_IDENTITY_LIST - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("TRACKING_AREA_IDENTITY_LIST", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_tracking_area_identity_list(ogs_nas_tracking_area_identity_list_t *tracking_area_identity_list, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_tracking_area_identity_list(tracking_area_identity_list, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1823,42 +2412,55 @@ int ogs_nas_eps_encode_tracking_area_identity_list(ogs_pkbuf_t *pkbuf, ogs_nas_t
     ogs_nas_tracking_area_identity_list_t target;
 
     memcpy(&target, tracking_area_identity_list, sizeof(ogs_nas_tracking_area_identity_list_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  TRACKING_AREA_IDENTITY_LIST - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("TRACKING_AREA_IDENTITY_LIST", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.34 UE network capability
  * M LV 3-14 */
-int ogs_nas_eps_decode_ue_network_capability(ogs_nas_ue_network_capability_t *ue_network_capability, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_ue_network_capability(ogs_nas_ue_network_capability_t *ue_network_capability, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_ue_network_capability_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_ue_network_capability_t *)pkbuf->data;
+    source = (ogs_nas_ue_network_capability_t *)data;
 
     ue_network_capability->length = source->length;
     size = ue_network_capability->length + sizeof(ue_network_capability->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*ue_network_capability) < size) return -1;
-    memcpy(ue_network_capability, pkbuf->data - size, size);
+    memcpy(ue_network_capability, data, size);
 
-    ogs_trace("  UE_NETWORK_CAPABILITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("UE_NETWORK_CAPABILITY", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_ue_network_capability(ogs_nas_ue_network_capability_t *ue_network_capability, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_ue_network_capability(ue_network_capability, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1869,30 +2471,43 @@ int ogs_nas_eps_encode_ue_network_capability(ogs_pkbuf_t *pkbuf, ogs_nas_ue_netw
     ogs_nas_ue_network_capability_t target;
 
     memcpy(&target, ue_network_capability, sizeof(ogs_nas_ue_network_capability_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  UE_NETWORK_CAPABILITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("UE_NETWORK_CAPABILITY", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.35 UE radio capability information update needed
  * O TV 1 */
-int ogs_nas_eps_decode_ue_radio_capability_information_update_needed(ogs_nas_ue_radio_capability_information_update_needed_t *ue_radio_capability_information_update_needed, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_ue_radio_capability_information_update_needed(ogs_nas_ue_radio_capability_information_update_needed_t *ue_radio_capability_information_update_needed, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_ue_radio_capability_information_update_needed_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(ue_radio_capability_information_update_needed, pkbuf->data - size, size);
+    memcpy(ue_radio_capability_information_update_needed, data, size);
 
-    ogs_trace("  UE_RADIO_CAPABILITY_INFORMATION_UPDATE_NEEDED - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("UE_RADIO_CAPABILITY_INFORMATION_UPDATE_NEEDED", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_ue_radio_capability_information_update_needed(ogs_nas_ue_radio_capability_information_update_needed_t *ue_radio_capability_information_update_needed, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_ue_radio_capability_information_update_needed(ue_radio_capability_information_update_needed, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1901,42 +2516,55 @@ int ogs_nas_eps_encode_ue_radio_capability_information_update_needed(ogs_pkbuf_t
 {
     int size = sizeof(ogs_nas_ue_radio_capability_information_update_needed_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, ue_radio_capability_information_update_needed, size);
 
-    ogs_trace("  UE_RADIO_CAPABILITY_INFORMATION_UPDATE_NEEDED - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("UE_RADIO_CAPABILITY_INFORMATION_UPDATE_NEEDED", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.36 UE security capability
  * M LV 3-6 */
-int ogs_nas_eps_decode_ue_security_capability(ogs_nas_ue_security_capability_t *ue_security_capability, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_ue_security_capability(ogs_nas_ue_security_capability_t *ue_security_capability, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_ue_security_capability_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_ue_security_capability_t *)pkbuf->data;
+    source = (ogs_nas_ue_security_capability_t *)data;
 
     ue_security_capability->length = source->length;
     size = ue_security_capability->length + sizeof(ue_security_capability->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*ue_security_capability) < size) return -1;
-    memcpy(ue_security_capability, pkbuf->data - size, size);
+    memcpy(ue_security_capability, data, size);
+
+    ogs_nas_trace_ie("UE_SECURITY_CAPABILITY", data, size);
+
+    return size;
+}
 
-    ogs_trace("  UE_SECURITY_CAPABILITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+int ogs_nas_eps_decode_ue_security_capability(ogs_nas_ue_security_capability_t *ue_security_capability, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_ue_security_capability(ue_security_capability, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1947,42 +2575,55 @@ int ogs_nas_eps_encode_ue_security_capability(ogs_pkbuf_t *pkbuf, ogs_nas_ue_sec
     ogs_nas_ue_security_capability_t target;
 
     memcpy(&target, ue_security_capability, sizeof(ogs_nas_ue_security_capability_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  UE_SECURITY_CAPABILITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("UE_SECURITY_CAPABILITY", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.37 Emergency number list
  * O TLV 5-50 */
-int ogs_nas_eps_decode_emergency_number_list(ogs_nas_emergency_number_list_t *emergency_number_list, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_emergency_number_list(ogs_nas_emergency_number_list_t *emergency_number_list, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_emergency_number_list_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_emergency_number_list_t *)pkbuf->data;
+    source = (ogs_nas_emergency_number_list_t *)data;
 
     emergency_number_list->length = source->length;
     size = emergency_number_list->length + sizeof(emergency_number_list->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*emergency_number_list) < size) return -1;
-    memcpy(emergency_number_list, pkbuf->data - size, size);
+    memcpy(emergency_number_list, data, size);
+
+    ogs_nas_trace_ie("EMERGENCY_NUMBER_LIST", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_emergency_number_list(ogs_nas_emergency_number_list_t *emergency_number_list, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_emergency_number_list(emergency_number_list, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  EMERGENCY_NUMBER_LIST - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -1993,41 +2634,54 @@ int ogs_nas_eps_encode_emergency_number_list(ogs_pkbuf_t *pkbuf, ogs_nas_emergen
     ogs_nas_emergency_number_list_t target;
 
     memcpy(&target, emergency_number_list, sizeof(ogs_nas_emergency_number_list_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  EMERGENCY_NUMBER_LIST - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("EMERGENCY_NUMBER_LIST", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.37A Extended emergency number list
  * O TLV-E 7-65538 */
-int ogs_nas_eps_decode_extended_emergency_number_list(ogs_nas_extended_emergency_number_list_t *extended_emergency_number_list, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_extended_emergency_number_list(ogs_nas_extended_emergency_number_list_t *extended_emergency_number_list, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_extended_emergency_number_list_t *source = NULL;
 
-    if (pkbuf->len < 2) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 2) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_extended_emergency_number_list_t *)pkbuf->data;
+    source = (ogs_nas_extended_emergency_number_list_t *)data;
 
     extended_emergency_number_list->length = be16toh(source->length);
     size = extended_emergency_number_list->length + sizeof(extended_emergency_number_list->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    extended_emergency_number_list->buffer = pkbuf->data - size + sizeof(extended_emergency_number_list->length);
+    extended_emergency_number_list->buffer = data + sizeof(extended_emergency_number_list->length);
+
+    ogs_nas_trace_ie("EXTENDED_EMERGENCY_NUMBER_LIST", extended_emergency_number_list->buffer, extended_emergency_number_list->length);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_extended_emergency_number_list(ogs_nas_extended_emergency_number_list_t *extended_emergency_number_list, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_extended_emergency_number_list(extended_emergency_number_list, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  EXTENDED_EMERGENCY_NUMBER_LIST - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, (void*)extended_emergency_number_list->buffer, extended_emergency_number_list->length);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2041,47 +2695,63 @@ int ogs_nas_eps_encode_extended_emergency_number_list(ogs_pkbuf_t *pkbuf, ogs_na
     ogs_assert(extended_emergency_number_list->buffer);
 
     size = sizeof(extended_emergency_number_list->length);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     target = htobe16(extended_emergency_number_list->length);
     memcpy(pkbuf->data - size, &target, size);
 
     size = extended_emergency_number_list->length;
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, extended_emergency_number_list->buffer, size);
 
-    ogs_trace("  EXTENDED_EMERGENCY_NUMBER_LIST - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("EXTENDED_EMERGENCY_NUMBER_LIST", pkbuf->data - size, size);
 
     return extended_emergency_number_list->length + sizeof(extended_emergency_number_list->length);
 }
 
 /* 9.9.3.38 CLI
  * O TLV 3-14 */
-int ogs_nas_eps_decode_cli(ogs_nas_cli_t *cli, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_cli(ogs_nas_cli_t *cli, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_cli_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_cli_t *)pkbuf->data;
+    source = (ogs_nas_cli_t *)data;
 
     cli->length = source->length;
     size = cli->length + sizeof(cli->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*cli) < size) return -1;
-    memcpy(cli, pkbuf->data - size, size);
+    memcpy(cli, data, size);
+
+    ogs_nas_trace_ie("CLI", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_cli(ogs_nas_cli_t *cli, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_cli(cli, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  CLI - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2092,30 +2762,43 @@ int ogs_nas_eps_encode_cli(ogs_pkbuf_t *pkbuf, ogs_nas_cli_t *cli)
     ogs_nas_cli_t target;
 
     memcpy(&target, cli, sizeof(ogs_nas_cli_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  CLI - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("CLI", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.39 SS Code
  * O TV 2 */
-int ogs_nas_eps_decode_ss_code(ogs_nas_ss_code_t *ss_code, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_ss_code(ogs_nas_ss_code_t *ss_code, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_ss_code_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(ss_code, pkbuf->data - size, size);
+    memcpy(ss_code, data, size);
+
+    ogs_nas_trace_ie("SS_CODE", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_ss_code(ogs_nas_ss_code_t *ss_code, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_ss_code(ss_code, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  SS_CODE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2126,42 +2809,55 @@ int ogs_nas_eps_encode_ss_code(ogs_pkbuf_t *pkbuf, ogs_nas_ss_code_t *ss_code)
     ogs_nas_ss_code_t target;
 
     memcpy(&target, ss_code, size);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  SS_CODE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("SS_CODE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.4 Authentication response parameter
  * M LV 5-17 */
-int ogs_nas_eps_decode_authentication_response_parameter(ogs_nas_authentication_response_parameter_t *authentication_response_parameter, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_authentication_response_parameter(ogs_nas_authentication_response_parameter_t *authentication_response_parameter, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_authentication_response_parameter_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_authentication_response_parameter_t *)pkbuf->data;
+    source = (ogs_nas_authentication_response_parameter_t *)data;
 
     authentication_response_parameter->length = source->length;
     size = authentication_response_parameter->length + sizeof(authentication_response_parameter->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*authentication_response_parameter) < size) return -1;
-    memcpy(authentication_response_parameter, pkbuf->data - size, size);
+    memcpy(authentication_response_parameter, data, size);
+
+    ogs_nas_trace_ie("AUTHENTICATION_RESPONSE_PARAMETER", data, size);
+
+    return size;
+}
 
-    ogs_trace("  AUTHENTICATION_RESPONSE_PARAMETER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+int ogs_nas_eps_decode_authentication_response_parameter(ogs_nas_authentication_response_parameter_t *authentication_response_parameter, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_authentication_response_parameter(authentication_response_parameter, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2172,30 +2868,43 @@ int ogs_nas_eps_encode_authentication_response_parameter(ogs_pkbuf_t *pkbuf, ogs
     ogs_nas_authentication_response_parameter_t target;
 
     memcpy(&target, authentication_response_parameter, sizeof(ogs_nas_authentication_response_parameter_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  AUTHENTICATION_RESPONSE_PARAMETER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("AUTHENTICATION_RESPONSE_PARAMETER", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.40 LCS indicator
  * O TV 2 */
-int ogs_nas_eps_decode_lcs_indicator(ogs_nas_lcs_indicator_t *lcs_indicator, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_lcs_indicator(ogs_nas_lcs_indicator_t *lcs_indicator, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_lcs_indicator_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(lcs_indicator, pkbuf->data - size, size);
+    memcpy(lcs_indicator, data, size);
 
-    ogs_trace("  LCS_INDICATOR - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("LCS_INDICATOR", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_lcs_indicator(ogs_nas_lcs_indicator_t *lcs_indicator, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_lcs_indicator(lcs_indicator, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2206,42 +2915,55 @@ int ogs_nas_eps_encode_lcs_indicator(ogs_pkbuf_t *pkbuf, ogs_nas_lcs_indicator_t
     ogs_nas_lcs_indicator_t target;
 
     memcpy(&target, lcs_indicator, size);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  LCS_INDICATOR - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("LCS_INDICATOR", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.41 LCS client identity
  * O TLV 3-257 */
-int ogs_nas_eps_decode_lcs_client_identity(ogs_nas_lcs_client_identity_t *lcs_client_identity, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_lcs_client_identity(ogs_nas_lcs_client_identity_t *lcs_client_identity, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_lcs_client_identity_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_lcs_client_identity_t *)pkbuf->data;
+    source = (ogs_nas_lcs_client_identity_t *)data;
 
     lcs_client_identity->length = source->length;
     size = lcs_client_identity->length + sizeof(lcs_client_identity->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*lcs_client_identity) < size) return -1;
-    memcpy(lcs_client_identity, pkbuf->data - size, size);
+    memcpy(lcs_client_identity, data, size);
+
+    ogs_nas_trace_ie("LCS_CLIENT_IDENTITY", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_lcs_client_identity(ogs_nas_lcs_client_identity_t *lcs_client_identity, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_lcs_client_identity(lcs_client_identity, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  LCS_CLIENT_IDENTITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2252,30 +2974,43 @@ int ogs_nas_eps_encode_lcs_client_identity(ogs_pkbuf_t *pkbuf, ogs_nas_lcs_clien
     ogs_nas_lcs_client_identity_t target;
 
     memcpy(&target, lcs_client_identity, sizeof(ogs_nas_lcs_client_identity_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  LCS_CLIENT_IDENTITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("LCS_CLIENT_IDENTITY", pkbuf->data - size, size);
+
+    return size;
+}
+
+/* 9.9.3.42 Generic message container type
+ * M V 1 */
+int ogs_nas_eps_read_generic_message_container_type(ogs_nas_generic_message_container_type_t *generic_message_container_type, unsigned char *data, int len)
+{
+    int size = sizeof(ogs_nas_generic_message_container_type_t);
+
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
+       return -1;
+    }
+
+    memcpy(generic_message_container_type, data, size);
+
+    ogs_nas_trace_ie("GENERIC_MESSAGE_CONTAINER_TYPE", data, size);
 
     return size;
 }
 
-/* 9.9.3.42 Generic message container type
- * M V 1 */
 int ogs_nas_eps_decode_generic_message_container_type(ogs_nas_generic_message_container_type_t *generic_message_container_type, ogs_pkbuf_t *pkbuf)
 {
-    int size = sizeof(ogs_nas_generic_message_container_type_t);
-
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-       return -1;
-    }
+    int size = ogs_nas_eps_read_generic_message_container_type(generic_message_container_type, pkbuf->data, pkbuf->len);
 
-    memcpy(generic_message_container_type, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
 
-    ogs_trace("  GENERIC_MESSAGE_CONTAINER_TYPE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2286,41 +3021,54 @@ int ogs_nas_eps_encode_generic_message_container_type(ogs_pkbuf_t *pkbuf, ogs_na
     ogs_nas_generic_message_container_type_t target;
 
     memcpy(&target, generic_message_container_type, size);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  GENERIC_MESSAGE_CONTAINER_TYPE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("GENERIC_MESSAGE_CONTAINER_TYPE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.43 Generic message container
  * M LV-E 3-n */
-int ogs_nas_eps_decode_generic_message_container(ogs_nas_generic_message_container_t *generic_message_container, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_generic_message_container(ogs_nas_generic_message_container_t *generic_message_container, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_generic_message_container_t *source = NULL;
 
-    if (pkbuf->len < 2) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 2) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_generic_message_container_t *)pkbuf->data;
+    source = (ogs_nas_generic_message_container_t *)data;
 
     generic_message_container->length = be16toh(source->length);
     size = generic_message_container->length + sizeof(generic_message_container->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    generic_message_container->buffer = pkbuf->data - size + sizeof(generic_message_container->length);
+    generic_message_container->buffer = data + sizeof(generic_message_container->length);
+
+    ogs_nas_trace_ie("GENERIC_MESSAGE_CONTAINER", generic_message_container->buffer, generic_message_container->length);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_generic_message_container(ogs_nas_generic_message_container_t *generic_message_container, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_generic_message_container(generic_message_container, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  GENERIC_MESSAGE_CONTAINER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, (void*)generic_message_container->buffer, generic_message_container->length);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2334,47 +3082,63 @@ int ogs_nas_eps_encode_generic_message_container(ogs_pkbuf_t *pkbuf, ogs_nas_gen
     ogs_assert(generic_message_container->buffer);
 
     size = sizeof(generic_message_container->length);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     target = htobe16(generic_message_container->length);
     memcpy(pkbuf->data - size, &target, size);
 
     size = generic_message_container->length;
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, generic_message_container->buffer, size);
 
-    ogs_trace("  GENERIC_MESSAGE_CONTAINER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("GENERIC_MESSAGE_CONTAINER", pkbuf->data - size, size);
 
     return generic_message_container->length + sizeof(generic_message_container->length);
 }
 
 /* 9.9.3.44 Voice domain preference and UE usage setting
  * O TLV 3 */
-int ogs_nas_eps_decode_voice_domain_preference_and_ue_usage_setting(ogs_nas_voice_domain_preference_and_ue_usage_setting_t *voice_domain_preference_and_ue_usage_setting, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_voice_domain_preference_and_ue_usage_setting(ogs_nas_voice_domain_preference_and_ue_usage_setting_t *voice_domain_preference_and_ue_usage_setting, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_voice_domain_preference_and_ue_usage_setting_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_voice_domain_preference_and_ue_usage_setting_t *)pkbuf->data;
+    source = (ogs_nas_voice_domain_preference_and_ue_usage_setting_t *)data;
 
     voice_domain_preference_and_ue_usage_setting->length = source->length;
     size = voice_domain_preference_and_ue_usage_setting->length + sizeof(voice_domain_preference_and_ue_usage_setting->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*voice_domain_preference_and_ue_usage_setting) < size) return -1;
-    memcpy(voice_domain_preference_and_ue_usage_setting, pkbuf->data - size, size);
+    memcpy(voice_domain_preference_and_ue_usage_setting, data, size);
+
+    ogs_nas_trace_ie("VOICE_DOMAIN_PREFERENCE_AND_UE_USAGE_SETTING", data, size);
 
-    ogs_trace("  VOICE_DOMAIN_PREFERENCE_AND_UE_USAGE_SETTING - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    return size;
+}
+
+int ogs_nas_eps_decode_voice_domain_preference_and_ue_usage_setting(ogs_nas_voice_domain_preference_and_ue_usage_setting_t *voice_domain_preference_and_ue_usage_setting, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_voice_domain_preference_and_ue_usage_setting(voice_domain_preference_and_ue_usage_setting, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2385,30 +3149,43 @@ int ogs_nas_eps_encode_voice_domain_preference_and_ue_usage_setting(ogs_pkbuf_t
     ogs_nas_voice_domain_preference_and_ue_usage_setting_t target;
 
     memcpy(&target, voice_domain_preference_and_ue_usage_setting, sizeof(ogs_nas_voice_domain_preference_and_ue_usage_setting_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  VOICE_DOMAIN_PREFERENCE_AND_UE_USAGE_SETTING - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("VOICE_DOMAIN_PREFERENCE_AND_UE_USAGE_SETTING", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.45 GUTI type
  * O TV 1 */
-int ogs_nas_eps_decode_guti_type(ogs_nas_guti_type_t *guti_type, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_guti_type(ogs_nas_guti_type_t *guti_type, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_guti_type_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(guti_type, pkbuf->data - size, size);
+    memcpy(guti_type, data, size);
+
+    ogs_nas_trace_ie("GUTI_TYPE", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_guti_type(ogs_nas_guti_type_t *guti_type, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_guti_type(guti_type, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  GUTI_TYPE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2417,42 +3194,55 @@ int ogs_nas_eps_encode_guti_type(ogs_pkbuf_t *pkbuf, ogs_nas_guti_type_t *guti_t
 {
     int size = sizeof(ogs_nas_guti_type_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, guti_type, size);
 
-    ogs_trace("  GUTI_TYPE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("GUTI_TYPE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.46 Extended DRX parameters
  * O TLV 3 */
-int ogs_nas_eps_decode_extended_drx_parameters(ogs_nas_extended_drx_parameters_t *extended_drx_parameters, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_extended_drx_parameters(ogs_nas_extended_drx_parameters_t *extended_drx_parameters, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_extended_drx_parameters_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_extended_drx_parameters_t *)pkbuf->data;
+    source = (ogs_nas_extended_drx_parameters_t *)data;
 
     extended_drx_parameters->length = source->length;
     size = extended_drx_parameters->length + sizeof(extended_drx_parameters->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*extended_drx_parameters) < size) return -1;
-    memcpy(extended_drx_parameters, pkbuf->data - size, size);
+    memcpy(extended_drx_parameters, data, size);
+
+    ogs_nas_trace_ie("EXTENDED_DRX_PARAMETERS", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_extended_drx_parameters(ogs_nas_extended_drx_parameters_t *extended_drx_parameters, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_extended_drx_parameters(extended_drx_parameters, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  EXTENDED_DRX_PARAMETERS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2463,42 +3253,55 @@ int ogs_nas_eps_encode_extended_drx_parameters(ogs_pkbuf_t *pkbuf, ogs_nas_exten
     ogs_nas_extended_drx_parameters_t target;
 
     memcpy(&target, extended_drx_parameters, sizeof(ogs_nas_extended_drx_parameters_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  EXTENDED_DRX_PARAMETERS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("EXTENDED_DRX_PARAMETERS", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.48 DCN-ID
  * O TLV 4 */
-int ogs_nas_eps_decode_dcn_id(ogs_nas_dcn_id_t *dcn_id, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_dcn_id(ogs_nas_dcn_id_t *dcn_id, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_dcn_id_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_dcn_id_t *)pkbuf->data;
+    source = (ogs_nas_dcn_id_t *)data;
 
     dcn_id->length = source->length;
     size = dcn_id->length + sizeof(dcn_id->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*dcn_id) < size) return -1;
-    memcpy(dcn_id, pkbuf->data - size, size);
+    memcpy(dcn_id, data, size);
+
+    ogs_nas_trace_ie("DCN_ID", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_dcn_id(ogs_nas_dcn_id_t *dcn_id, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_dcn_id(dcn_id, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  DCN_ID - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2509,30 +3312,43 @@ int ogs_nas_eps_encode_dcn_id(ogs_pkbuf_t *pkbuf, ogs_nas_dcn_id_t *dcn_id)
     ogs_nas_dcn_id_t target;
 
     memcpy(&target, dcn_id, sizeof(ogs_nas_dcn_id_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  DCN_ID - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("DCN_ID", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.49 Non-3GPP NW provided policies
  * O TV 1 */
-int ogs_nas_eps_decode_non__nw_provided_policies(ogs_nas_non__nw_provided_policies_t *non__nw_provided_policies, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_non__nw_provided_policies(ogs_nas_non__nw_provided_policies_t *non__nw_provided_policies, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_non__nw_provided_policies_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(non__nw_provided_policies, pkbuf->data - size, size);
+    memcpy(non__nw_provided_policies, data, size);
+
+    ogs_nas_trace_ie("NON__NW_PROVIDED_POLICIES", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_non__nw_provided_policies(ogs_nas_non__nw_provided_policies_t *non__nw_provided_policies, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_non__nw_provided_policies(non__nw_provided_policies, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  NON__NW_PROVIDED_POLICIES - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2541,30 +3357,43 @@ int ogs_nas_eps_encode_non__nw_provided_policies(ogs_pkbuf_t *pkbuf, ogs_nas_non
 {
     int size = sizeof(ogs_nas_non__nw_provided_policies_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, non__nw_provided_policies, size);
 
-    ogs_trace("  NON__NW_PROVIDED_POLICIES - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("NON__NW_PROVIDED_POLICIES", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.4B SMS services status
  * O TV 1 */
-int ogs_nas_eps_decode_sms_services_status(ogs_nas_sms_services_status_t *sms_services_status, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_sms_services_status(ogs_nas_sms_services_status_t *sms_services_status, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_sms_services_status_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(sms_services_status, pkbuf->data - size, size);
+    memcpy(sms_services_status, data, size);
+
+    ogs_nas_trace_ie("SMS_SERVICES_STATUS", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_sms_services_status(ogs_nas_sms_services_status_t *sms_services_status, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_sms_services_status(sms_services_status, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  SMS_SERVICES_STATUS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2573,30 +3402,43 @@ int ogs_nas_eps_encode_sms_services_status(ogs_pkbuf_t *pkbuf, ogs_nas_sms_servi
 {
     int size = sizeof(ogs_nas_sms_services_status_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, sms_services_status, size);
 
-    ogs_trace("  SMS_SERVICES_STATUS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("SMS_SERVICES_STATUS", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.4a Ciphering key sequence number
  * O TV 1 */
-int ogs_nas_eps_decode_ciphering_key_sequence_number(ogs_nas_ciphering_key_sequence_number_t *ciphering_key_sequence_number, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_ciphering_key_sequence_number(ogs_nas_ciphering_key_sequence_number_t *ciphering_key_sequence_number, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_ciphering_key_sequence_number_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(ciphering_key_sequence_number, pkbuf->data - size, size);
+    memcpy(ciphering_key_sequence_number, data, size);
+
+    ogs_nas_trace_ie("CIPHERING_KEY_SEQUENCE_NUMBER", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_ciphering_key_sequence_number(ogs_nas_ciphering_key_sequence_number_t *ciphering_key_sequence_number, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_ciphering_key_sequence_number(ciphering_key_sequence_number, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  CIPHERING_KEY_SEQUENCE_NUMBER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2605,30 +3447,43 @@ int ogs_nas_eps_encode_ciphering_key_sequence_number(ogs_pkbuf_t *pkbuf, ogs_nas
 {
     int size = sizeof(ogs_nas_ciphering_key_sequence_number_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, ciphering_key_sequence_number, size);
 
-    ogs_trace("  CIPHERING_KEY_SEQUENCE_NUMBER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("CIPHERING_KEY_SEQUENCE_NUMBER", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.5 CSFB response
  * C TV 1 */
-int ogs_nas_eps_decode_csfb_response(ogs_nas_csfb_response_t *csfb_response, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_csfb_response(ogs_nas_csfb_response_t *csfb_response, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_csfb_response_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(csfb_response, pkbuf->data - size, size);
+    memcpy(csfb_response, data, size);
+
+    ogs_nas_trace_ie("CSFB_RESPONSE", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_csfb_response(ogs_nas_csfb_response_t *csfb_response, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_csfb_response(csfb_response, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  CSFB_RESPONSE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2637,42 +3492,55 @@ int ogs_nas_eps_encode_csfb_response(ogs_pkbuf_t *pkbuf, ogs_nas_csfb_response_t
 {
     int size = sizeof(ogs_nas_csfb_response_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, csfb_response, size);
 
-    ogs_trace("  CSFB_RESPONSE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("CSFB_RESPONSE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.50 HashMME
  * O TLV 10 */
-int ogs_nas_eps_decode_hashmme(ogs_nas_hashmme_t *hashmme, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_hashmme(ogs_nas_hashmme_t *hashmme, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_hashmme_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_hashmme_t *)pkbuf->data;
+    source = (ogs_nas_hashmme_t *)data;
 
     hashmme->length = source->length;
     size = hashmme->length + sizeof(hashmme->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*hashmme) < size) return -1;
-    memcpy(hashmme, pkbuf->data - size, size);
+    memcpy(hashmme, data, size);
+
+    ogs_nas_trace_ie("HASHMME", data, size);
 
-    ogs_trace("  HASHMME - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    return size;
+}
+
+int ogs_nas_eps_decode_hashmme(ogs_nas_hashmme_t *hashmme, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_hashmme(hashmme, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2683,41 +3551,54 @@ int ogs_nas_eps_encode_hashmme(ogs_pkbuf_t *pkbuf, ogs_nas_hashmme_t *hashmme)
     ogs_nas_hashmme_t target;
 
     memcpy(&target, hashmme, sizeof(ogs_nas_hashmme_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  HASHMME - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("HASHMME", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.51 Replayed NAS message container
  * O TLV-E 3-n */
-int ogs_nas_eps_decode_replayed_nas_message_container(ogs_nas_replayed_nas_message_container_t *replayed_nas_message_container, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_replayed_nas_message_container(ogs_nas_replayed_nas_message_container_t *replayed_nas_message_container, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_replayed_nas_message_container_t *source = NULL;
 
-    if (pkbuf->len < 2) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 2) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_replayed_nas_message_container_t *)pkbuf->data;
+    source = (ogs_nas_replayed_nas_message_container_t *)data;
 
     replayed_nas_message_container->length = be16toh(source->length);
     size = replayed_nas_message_container->length + sizeof(replayed_nas_message_container->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    replayed_nas_message_container->buffer = pkbuf->data - size + sizeof(replayed_nas_message_container->length);
+    replayed_nas_message_container->buffer = data + sizeof(replayed_nas_message_container->length);
 
-    ogs_trace("  REPLAYED_NAS_MESSAGE_CONTAINER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, (void*)replayed_nas_message_container->buffer, replayed_nas_message_container->length);
+    ogs_nas_trace_ie("REPLAYED_NAS_MESSAGE_CONTAINER", replayed_nas_message_container->buffer, replayed_nas_message_container->length);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_replayed_nas_message_container(ogs_nas_replayed_nas_message_container_t *replayed_nas_message_container, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_replayed_nas_message_container(replayed_nas_message_container, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2731,35 +3612,51 @@ int ogs_nas_eps_encode_replayed_nas_message_container(ogs_pkbuf_t *pkbuf, ogs_na
     ogs_assert(replayed_nas_message_container->buffer);
 
     size = sizeof(replayed_nas_message_container->length);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     target = htobe16(replayed_nas_message_container->length);
     memcpy(pkbuf->data - size, &target, size);
 
     size = replayed_nas_message_container->length;
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, replayed_nas_message_container->buffer, size);
 
-    ogs_trace("  REPLAYED_NAS_MESSAGE_CONTAINER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("REPLAYED_NAS_MESSAGE_CONTAINER", pkbuf->data - size, size);
 
     return replayed_nas_message_container->length + sizeof(replayed_nas_message_container->length);
 }
 
 /* 9.9.3.52 Network policy
  * O TV 1 */
-int ogs_nas_eps_decode_network_policy(ogs_nas_network_policy_t *network_policy, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_network_policy(ogs_nas_network_policy_t *network_policy, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_network_policy_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(network_policy, pkbuf->data - size, size);
+    memcpy(network_policy, data, size);
+
+    ogs_nas_trace_ie("NETWORK_POLICY", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_network_policy(ogs_nas_network_policy_t *network_policy, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_network_policy(network_policy, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  NETWORK_POLICY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2768,42 +3665,55 @@ int ogs_nas_eps_encode_network_policy(ogs_pkbuf_t *pkbuf, ogs_nas_network_policy
 {
     int size = sizeof(ogs_nas_network_policy_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, network_policy, size);
 
-    ogs_trace("  NETWORK_POLICY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("NETWORK_POLICY", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.53 UE additional security capability
  * O TLV 6 */
-int ogs_nas_eps_decode_ue_additional_security_capability(ogs_nas_ue_additional_security_capability_t *ue_additional_security_capability, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_ue_additional_security_capability(ogs_nas_ue_additional_security_capability_t *ue_additional_security_capability, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_ue_additional_security_capability_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_ue_additional_security_capability_t *)pkbuf->data;
+    source = (ogs_nas_ue_additional_security_capability_t *)data;
 
     ue_additional_security_capability->length = source->length;
     size = ue_additional_security_capability->length + sizeof(ue_additional_security_capability->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*ue_additional_security_capability) < size) return -1;
-    memcpy(ue_additional_security_capability, pkbuf->data - size, size);
+    memcpy(ue_additional_security_capability, data, size);
+
+    ogs_nas_trace_ie("UE_ADDITIONAL_SECURITY_CAPABILITY", data, size);
 
-    ogs_trace("  UE_ADDITIONAL_SECURITY_CAPABILITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    return size;
+}
+
+int ogs_nas_eps_decode_ue_additional_security_capability(ogs_nas_ue_additional_security_capability_t *ue_additional_security_capability, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_ue_additional_security_capability(ue_additional_security_capability, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2814,42 +3724,55 @@ int ogs_nas_eps_encode_ue_additional_security_capability(ogs_pkbuf_t *pkbuf, ogs
     ogs_nas_ue_additional_security_capability_t target;
 
     memcpy(&target, ue_additional_security_capability, sizeof(ogs_nas_ue_additional_security_capability_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  UE_ADDITIONAL_SECURITY_CAPABILITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("UE_ADDITIONAL_SECURITY_CAPABILITY", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.54 UE status
  * O TLV 3 */
-int ogs_nas_eps_decode_ue_status(ogs_nas_ue_status_t *ue_status, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_ue_status(ogs_nas_ue_status_t *ue_status, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_ue_status_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_ue_status_t *)pkbuf->data;
+    source = (ogs_nas_ue_status_t *)data;
 
     ue_status->length = source->length;
     size = ue_status->length + sizeof(ue_status->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*ue_status) < size) return -1;
-    memcpy(ue_status, pkbuf->data - size, size);
+    memcpy(ue_status, data, size);
+
+    ogs_nas_trace_ie("UE_STATUS", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_ue_status(ogs_nas_ue_status_t *ue_status, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_ue_status(ue_status, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  UE_STATUS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2860,30 +3783,43 @@ int ogs_nas_eps_encode_ue_status(ogs_pkbuf_t *pkbuf, ogs_nas_ue_status_t *ue_sta
     ogs_nas_ue_status_t target;
 
     memcpy(&target, ue_status, sizeof(ogs_nas_ue_status_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  UE_STATUS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("UE_STATUS", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.55 Additional information requested
  * O TV 2 */
-int ogs_nas_eps_decode_additional_information_requested(ogs_nas_additional_information_requested_t *additional_information_requested, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_additional_information_requested(ogs_nas_additional_information_requested_t *additional_information_requested, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_additional_information_requested_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(additional_information_requested, pkbuf->data - size, size);
+    memcpy(additional_information_requested, data, size);
+
+    ogs_nas_trace_ie("ADDITIONAL_INFORMATION_REQUESTED", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_additional_information_requested(ogs_nas_additional_information_requested_t *additional_information_requested, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_additional_information_requested(additional_information_requested, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  ADDITIONAL_INFORMATION_REQUESTED - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2894,41 +3830,54 @@ int ogs_nas_eps_encode_additional_information_requested(ogs_pkbuf_t *pkbuf, ogs_
     ogs_nas_additional_information_requested_t target;
 
     memcpy(&target, additional_information_requested, size);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  ADDITIONAL_INFORMATION_REQUESTED - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("ADDITIONAL_INFORMATION_REQUESTED", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.56 Ciphering key data
  * O TLV-E 35-2291 */
-int ogs_nas_eps_decode_ciphering_key_data(ogs_nas_ciphering_key_data_t *ciphering_key_data, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_ciphering_key_data(ogs_nas_ciphering_key_data_t *ciphering_key_data, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_ciphering_key_data_t *source = NULL;
 
-    if (pkbuf->len < 2) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 2) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_ciphering_key_data_t *)pkbuf->data;
+    source = (ogs_nas_ciphering_key_data_t *)data;
 
     ciphering_key_data->length = be16toh(source->length);
     size = ciphering_key_data->length + sizeof(ciphering_key_data->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    ciphering_key_data->buffer = pkbuf->data - size + sizeof(ciphering_key_data->length);
+    ciphering_key_data->buffer = data + sizeof(ciphering_key_data->length);
+
+    ogs_nas_trace_ie("CIPHERING_KEY_DATA", ciphering_key_data->buffer, ciphering_key_data->length);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_ciphering_key_data(ogs_nas_ciphering_key_data_t *ciphering_key_data, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_ciphering_key_data(ciphering_key_data, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  CIPHERING_KEY_DATA - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, (void*)ciphering_key_data->buffer, ciphering_key_data->length);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2942,47 +3891,63 @@ int ogs_nas_eps_encode_ciphering_key_data(ogs_pkbuf_t *pkbuf, ogs_nas_ciphering_
     ogs_assert(ciphering_key_data->buffer);
 
     size = sizeof(ciphering_key_data->length);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     target = htobe16(ciphering_key_data->length);
     memcpy(pkbuf->data - size, &target, size);
 
     size = ciphering_key_data->length;
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, ciphering_key_data->buffer, size);
 
-    ogs_trace("  CIPHERING_KEY_DATA - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("CIPHERING_KEY_DATA", pkbuf->data - size, size);
 
     return ciphering_key_data->length + sizeof(ciphering_key_data->length);
 }
 
 /* 9.9.3.57 N1 UE network capability
  * O TLV 3-15 */
-int ogs_nas_eps_decode_n1_ue_network_capability(ogs_nas_n1_ue_network_capability_t *n1_ue_network_capability, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_n1_ue_network_capability(ogs_nas_n1_ue_network_capability_t *n1_ue_network_capability, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_n1_ue_network_capability_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_n1_ue_network_capability_t *)pkbuf->data;
+    source = (ogs_nas_n1_ue_network_capability_t *)data;
 
     n1_ue_network_capability->length = source->length;
     size = n1_ue_network_capability->length + sizeof(n1_ue_network_capability->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*n1_ue_network_capability) < size) return -1;
-    memcpy(n1_ue_network_capability, pkbuf->data - size, size);
+    memcpy(n1_ue_network_capability, data, size);
 
-    ogs_trace("  N1_UE_NETWORK_CAPABILITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("N1_UE_NETWORK_CAPABILITY", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_n1_ue_network_capability(ogs_nas_n1_ue_network_capability_t *n1_ue_network_capability, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_n1_ue_network_capability(n1_ue_network_capability, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -2993,42 +3958,55 @@ int ogs_nas_eps_encode_n1_ue_network_capability(ogs_pkbuf_t *pkbuf, ogs_nas_n1_u
     ogs_nas_n1_ue_network_capability_t target;
 
     memcpy(&target, n1_ue_network_capability, sizeof(ogs_nas_n1_ue_network_capability_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  N1_UE_NETWORK_CAPABILITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("N1_UE_NETWORK_CAPABILITY", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.58 UE radio capability ID availability
  * O TLV 3 */
-int ogs_nas_eps_decode_ue_radio_capability_id_availability(ogs_nas_ue_radio_capability_id_availability_t *ue_radio_capability_id_availability, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_ue_radio_capability_id_availability(ogs_nas_ue_radio_capability_id_availability_t *ue_radio_capability_id_availability, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_ue_radio_capability_id_availability_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_ue_radio_capability_id_availability_t *)pkbuf->data;
+    source = (ogs_nas_ue_radio_capability_id_availability_t *)data;
 
     ue_radio_capability_id_availability->length = source->length;
     size = ue_radio_capability_id_availability->length + sizeof(ue_radio_capability_id_availability->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*ue_radio_capability_id_availability) < size) return -1;
-    memcpy(ue_radio_capability_id_availability, pkbuf->data - size, size);
+    memcpy(ue_radio_capability_id_availability, data, size);
+
+    ogs_nas_trace_ie("UE_RADIO_CAPABILITY_ID_AVAILABILITY", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_ue_radio_capability_id_availability(ogs_nas_ue_radio_capability_id_availability_t *ue_radio_capability_id_availability, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_ue_radio_capability_id_availability(ue_radio_capability_id_availability, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  UE_RADIO_CAPABILITY_ID_AVAILABILITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3039,42 +4017,55 @@ int ogs_nas_eps_encode_ue_radio_capability_id_availability(ogs_pkbuf_t *pkbuf, o
     ogs_nas_ue_radio_capability_id_availability_t target;
 
     memcpy(&target, ue_radio_capability_id_availability, sizeof(ogs_nas_ue_radio_capability_id_availability_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  UE_RADIO_CAPABILITY_ID_AVAILABILITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("UE_RADIO_CAPABILITY_ID_AVAILABILITY", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.59 UE radio capability ID request
  * O TLV 3 */
-int ogs_nas_eps_decode_ue_radio_capability_id_request(ogs_nas_ue_radio_capability_id_request_t *ue_radio_capability_id_request, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_ue_radio_capability_id_request(ogs_nas_ue_radio_capability_id_request_t *ue_radio_capability_id_request, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_ue_radio_capability_id_request_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_ue_radio_capability_id_request_t *)pkbuf->data;
+    source = (ogs_nas_ue_radio_capability_id_request_t *)data;
 
     ue_radio_capability_id_request->length = source->length;
     size = ue_radio_capability_id_request->length + sizeof(ue_radio_capability_id_request->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*ue_radio_capability_id_request) < size) return -1;
-    memcpy(ue_radio_capability_id_request, pkbuf->data - size, size);
+    memcpy(ue_radio_capability_id_request, data, size);
+
+    ogs_nas_trace_ie("UE_RADIO_CAPABILITY_ID_REQUEST", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_ue_radio_capability_id_request(ogs_nas_ue_radio_capability_id_request_t *ue_radio_capability_id_request, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_ue_radio_capability_id_request(ue_radio_capability_id_request, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  UE_RADIO_CAPABILITY_ID_REQUEST - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3085,42 +4076,55 @@ int ogs_nas_eps_encode_ue_radio_capability_id_request(ogs_pkbuf_t *pkbuf, ogs_na
     ogs_nas_ue_radio_capability_id_request_t target;
 
     memcpy(&target, ue_radio_capability_id_request, sizeof(ogs_nas_ue_radio_capability_id_request_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  UE_RADIO_CAPABILITY_ID_REQUEST - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("UE_RADIO_CAPABILITY_ID_REQUEST", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.6 Daylight saving time
  * O TLV 3 */
-int ogs_nas_eps_decode_daylight_saving_time(ogs_nas_daylight_saving_time_t *daylight_saving_time, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_daylight_saving_time(ogs_nas_daylight_saving_time_t *daylight_saving_time, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_daylight_saving_time_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_daylight_saving_time_t *)pkbuf->data;
+    source = (ogs_nas_daylight_saving_time_t *)data;
 
     daylight_saving_time->length = source->length;
     size = daylight_saving_time->length + sizeof(daylight_saving_time->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*daylight_saving_time) < size) return -1;
-    memcpy(daylight_saving_time, pkbuf->data - size, size);
+    memcpy(daylight_saving_time, data, size);
+
+    ogs_nas_trace_ie("DAYLIGHT_SAVING_TIME", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_daylight_saving_time(ogs_nas_daylight_saving_time_t *daylight_saving_time, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_daylight_saving_time(daylight_saving_time, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  DAYLIGHT_SAVING_TIME - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3131,42 +4135,55 @@ int ogs_nas_eps_encode_daylight_saving_time(ogs_pkbuf_t *pkbuf, ogs_nas_daylight
     ogs_nas_daylight_saving_time_t target;
 
     memcpy(&target, daylight_saving_time, sizeof(ogs_nas_daylight_saving_time_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  DAYLIGHT_SAVING_TIME - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("DAYLIGHT_SAVING_TIME", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.60 UE radio capability ID
  * O TLV 3-n */
-int ogs_nas_eps_decode_ue_radio_capability_id(ogs_nas_ue_radio_capability_id_t *ue_radio_capability_id, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_ue_radio_capability_id(ogs_nas_ue_radio_capability_id_t *ue_radio_capability_id, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_ue_radio_capability_id_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_ue_radio_capability_id_t *)pkbuf->data;
+    source = (ogs_nas_ue_radio_capability_id_t *)data;
 
     ue_radio_capability_id->length = source->length;
     size = ue_radio_capability_id->length + sizeof(ue_radio_capability_id->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*ue_radio_capability_id) < size) return -1;
-    memcpy(ue_radio_capability_id, pkbuf->data - size, size);
+    memcpy(ue_radio_capability_id, data, size);
+
+    ogs_nas_trace_ie("UE_RADIO_CAPABILITY_ID", data, size);
+
+    return size;
+}
 
-    ogs_trace("  UE_RADIO_CAPABILITY_ID - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+int ogs_nas_eps_decode_ue_radio_capability_id(ogs_nas_ue_radio_capability_id_t *ue_radio_capability_id, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_ue_radio_capability_id(ue_radio_capability_id, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3177,30 +4194,43 @@ int ogs_nas_eps_encode_ue_radio_capability_id(ogs_pkbuf_t *pkbuf, ogs_nas_ue_rad
     ogs_nas_ue_radio_capability_id_t target;
 
     memcpy(&target, ue_radio_capability_id, sizeof(ogs_nas_ue_radio_capability_id_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  UE_RADIO_CAPABILITY_ID - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("UE_RADIO_CAPABILITY_ID", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.61 UE radio capability ID deletion indication
  * O TV 1 */
-int ogs_nas_eps_decode_ue_radio_capability_id_deletion_indication(ogs_nas_ue_radio_capability_id_deletion_indication_t *ue_radio_capability_id_deletion_indication, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_ue_radio_capability_id_deletion_indication(ogs_nas_ue_radio_capability_id_deletion_indication_t *ue_radio_capability_id_deletion_indication, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_ue_radio_capability_id_deletion_indication_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(ue_radio_capability_id_deletion_indication, pkbuf->data - size, size);
+    memcpy(ue_radio_capability_id_deletion_indication, data, size);
+
+    ogs_nas_trace_ie("UE_RADIO_CAPABILITY_ID_DELETION_INDICATION", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_ue_radio_capability_id_deletion_indication(ogs_nas_ue_radio_capability_id_deletion_indication_t *ue_radio_capability_id_deletion_indication, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_ue_radio_capability_id_deletion_indication(ue_radio_capability_id_deletion_indication, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  UE_RADIO_CAPABILITY_ID_DELETION_INDICATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3209,42 +4239,55 @@ int ogs_nas_eps_encode_ue_radio_capability_id_deletion_indication(ogs_pkbuf_t *p
 {
     int size = sizeof(ogs_nas_ue_radio_capability_id_deletion_indication_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, ue_radio_capability_id_deletion_indication, size);
 
-    ogs_trace("  UE_RADIO_CAPABILITY_ID_DELETION_INDICATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("UE_RADIO_CAPABILITY_ID_DELETION_INDICATION", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.62 WUS assistance information
  * O TLV 3-n */
-int ogs_nas_eps_decode_wus_assistance_information(ogs_nas_wus_assistance_information_t *wus_assistance_information, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_wus_assistance_information(ogs_nas_wus_assistance_information_t *wus_assistance_information, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_wus_assistance_information_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_wus_assistance_information_t *)pkbuf->data;
+    source = (ogs_nas_wus_assistance_information_t *)data;
 
     wus_assistance_information->length = source->length;
     size = wus_assistance_information->length + sizeof(wus_assistance_information->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*wus_assistance_information) < size) return -1;
-    memcpy(wus_assistance_information, pkbuf->data - size, size);
+    memcpy(wus_assistance_information, data, size);
+
+    ogs_nas_trace_ie("WUS_ASSISTANCE_INFORMATION", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_wus_assistance_information(ogs_nas_wus_assistance_information_t *wus_assistance_information, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_wus_assistance_information(wus_assistance_information, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  WUS_ASSISTANCE_INFORMATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3255,42 +4298,55 @@ int ogs_nas_eps_encode_wus_assistance_information(ogs_pkbuf_t *pkbuf, ogs_nas_wu
     ogs_nas_wus_assistance_information_t target;
 
     memcpy(&target, wus_assistance_information, sizeof(ogs_nas_wus_assistance_information_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  WUS_ASSISTANCE_INFORMATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("WUS_ASSISTANCE_INFORMATION", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.63 NB-S1 DRX parameter
  * O TLV 3 */
-int ogs_nas_eps_decode_nb_s1_drx_parameter(ogs_nas_nb_s1_drx_parameter_t *nb_s1_drx_parameter, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_nb_s1_drx_parameter(ogs_nas_nb_s1_drx_parameter_t *nb_s1_drx_parameter, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_nb_s1_drx_parameter_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_nb_s1_drx_parameter_t *)pkbuf->data;
+    source = (ogs_nas_nb_s1_drx_parameter_t *)data;
 
     nb_s1_drx_parameter->length = source->length;
     size = nb_s1_drx_parameter->length + sizeof(nb_s1_drx_parameter->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*nb_s1_drx_parameter) < size) return -1;
-    memcpy(nb_s1_drx_parameter, pkbuf->data - size, size);
+    memcpy(nb_s1_drx_parameter, data, size);
+
+    ogs_nas_trace_ie("NB_S1_DRX_PARAMETER", data, size);
 
-    ogs_trace("  NB_S1_DRX_PARAMETER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    return size;
+}
+
+int ogs_nas_eps_decode_nb_s1_drx_parameter(ogs_nas_nb_s1_drx_parameter_t *nb_s1_drx_parameter, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_nb_s1_drx_parameter(nb_s1_drx_parameter, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3301,42 +4357,55 @@ int ogs_nas_eps_encode_nb_s1_drx_parameter(ogs_pkbuf_t *pkbuf, ogs_nas_nb_s1_drx
     ogs_nas_nb_s1_drx_parameter_t target;
 
     memcpy(&target, nb_s1_drx_parameter, sizeof(ogs_nas_nb_s1_drx_parameter_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  NB_S1_DRX_PARAMETER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("NB_S1_DRX_PARAMETER", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.64 IMSI offset
  * O TLV 4 */
-int ogs_nas_eps_decode_imsi_offset(ogs_nas_imsi_offset_t *imsi_offset, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_imsi_offset(ogs_nas_imsi_offset_t *imsi_offset, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_imsi_offset_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_imsi_offset_t *)pkbuf->data;
+    source = (ogs_nas_imsi_offset_t *)data;
 
     imsi_offset->length = source->length;
     size = imsi_offset->length + sizeof(imsi_offset->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*imsi_offset) < size) return -1;
-    memcpy(imsi_offset, pkbuf->data - size, size);
+    memcpy(imsi_offset, data, size);
+
+    ogs_nas_trace_ie("IMSI_OFFSET", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_imsi_offset(ogs_nas_imsi_offset_t *imsi_offset, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_imsi_offset(imsi_offset, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  IMSI_OFFSET - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3347,42 +4416,55 @@ int ogs_nas_eps_encode_imsi_offset(ogs_pkbuf_t *pkbuf, ogs_nas_imsi_offset_t *im
     ogs_nas_imsi_offset_t target;
 
     memcpy(&target, imsi_offset, sizeof(ogs_nas_imsi_offset_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  IMSI_OFFSET - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("IMSI_OFFSET", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.65 UE request type
  * O TLV 3 */
-int ogs_nas_eps_decode_ue_request_type(ogs_nas_ue_request_type_t *ue_request_type, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_ue_request_type(ogs_nas_ue_request_type_t *ue_request_type, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_ue_request_type_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_ue_request_type_t *)pkbuf->data;
+    source = (ogs_nas_ue_request_type_t *)data;
 
     ue_request_type->length = source->length;
     size = ue_request_type->length + sizeof(ue_request_type->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*ue_request_type) < size) return -1;
-    memcpy(ue_request_type, pkbuf->data - size, size);
+    memcpy(ue_request_type, data, size);
+
+    ogs_nas_trace_ie("UE_REQUEST_TYPE", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_ue_request_type(ogs_nas_ue_request_type_t *ue_request_type, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_ue_request_type(ue_request_type, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  UE_REQUEST_TYPE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3393,42 +4475,55 @@ int ogs_nas_eps_encode_ue_request_type(ogs_pkbuf_t *pkbuf, ogs_nas_ue_request_ty
     ogs_nas_ue_request_type_t target;
 
     memcpy(&target, ue_request_type, sizeof(ogs_nas_ue_request_type_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  UE_REQUEST_TYPE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("UE_REQUEST_TYPE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.66 Paging restriction
  * O TLV 3-5 */
-int ogs_nas_eps_decode_paging_restriction(ogs_nas_paging_restriction_t *paging_restriction, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_paging_restriction(ogs_nas_paging_restriction_t *paging_restriction, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_paging_restriction_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_paging_restriction_t *)pkbuf->data;
+    source = (ogs_nas_paging_restriction_t *)data;
 
     paging_restriction->length = source->length;
     size = paging_restriction->length + sizeof(paging_restriction->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*paging_restriction) < size) return -1;
-    memcpy(paging_restriction, pkbuf->data - size, size);
+    memcpy(paging_restriction, data, size);
+
+    ogs_nas_trace_ie("PAGING_RESTRICTION", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_paging_restriction(ogs_nas_paging_restriction_t *paging_restriction, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_paging_restriction(paging_restriction, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  PAGING_RESTRICTION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3439,42 +4534,55 @@ int ogs_nas_eps_encode_paging_restriction(ogs_pkbuf_t *pkbuf, ogs_nas_paging_res
     ogs_nas_paging_restriction_t target;
 
     memcpy(&target, paging_restriction, sizeof(ogs_nas_paging_restriction_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  PAGING_RESTRICTION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("PAGING_RESTRICTION", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.67 EPS additional request result
  * O TLV 3 */
-int ogs_nas_eps_decode_eps_additional_request_result(ogs_nas_eps_additional_request_result_t *eps_additional_request_result, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_eps_additional_request_result(ogs_nas_eps_additional_request_result_t *eps_additional_request_result, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_eps_additional_request_result_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_eps_additional_request_result_t *)pkbuf->data;
+    source = (ogs_nas_eps_additional_request_result_t *)data;
 
     eps_additional_request_result->length = source->length;
     size = eps_additional_request_result->length + sizeof(eps_additional_request_result->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*eps_additional_request_result) < size) return -1;
-    memcpy(eps_additional_request_result, pkbuf->data - size, size);
+    memcpy(eps_additional_request_result, data, size);
+
+    ogs_nas_trace_ie("EPS_ADDITIONAL_REQUEST_RESULT", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_eps_additional_request_result(ogs_nas_eps_additional_request_result_t *eps_additional_request_result, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_eps_additional_request_result(eps_additional_request_result, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  EPS_ADDITIONAL_REQUEST_RESULT - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3485,30 +4593,43 @@ int ogs_nas_eps_encode_eps_additional_request_result(ogs_pkbuf_t *pkbuf, ogs_nas
     ogs_nas_eps_additional_request_result_t target;
 
     memcpy(&target, eps_additional_request_result, sizeof(ogs_nas_eps_additional_request_result_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  EPS_ADDITIONAL_REQUEST_RESULT - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("EPS_ADDITIONAL_REQUEST_RESULT", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.7 Detach type
  * M V 1/2 */
-int ogs_nas_eps_decode_detach_type(ogs_nas_detach_type_t *detach_type, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_detach_type(ogs_nas_detach_type_t *detach_type, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_detach_type_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(detach_type, pkbuf->data - size, size);
+    memcpy(detach_type, data, size);
+
+    ogs_nas_trace_ie("DETACH_TYPE", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_detach_type(ogs_nas_detach_type_t *detach_type, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_detach_type(detach_type, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  DETACH_TYPE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3519,30 +4640,43 @@ int ogs_nas_eps_encode_detach_type(ogs_pkbuf_t *pkbuf, ogs_nas_detach_type_t *de
     ogs_nas_detach_type_t target;
 
     memcpy(&target, detach_type, size);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  DETACH_TYPE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("DETACH_TYPE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.8 DRX parameter
  * O TV 3 */
-int ogs_nas_eps_decode_drx_parameter(ogs_nas_drx_parameter_t *drx_parameter, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_drx_parameter(ogs_nas_drx_parameter_t *drx_parameter, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_drx_parameter_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(drx_parameter, pkbuf->data - size, size);
+    memcpy(drx_parameter, data, size);
+
+    ogs_nas_trace_ie("DRX_PARAMETER", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_drx_parameter(ogs_nas_drx_parameter_t *drx_parameter, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_drx_parameter(drx_parameter, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  DRX_PARAMETER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3553,30 +4687,43 @@ int ogs_nas_eps_encode_drx_parameter(ogs_pkbuf_t *pkbuf, ogs_nas_drx_parameter_t
     ogs_nas_drx_parameter_t target;
 
     memcpy(&target, drx_parameter, size);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  DRX_PARAMETER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("DRX_PARAMETER", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.3.9 EMM cause
  * O TV 2 */
-int ogs_nas_eps_decode_emm_cause(ogs_nas_emm_cause_t *emm_cause, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_emm_cause(ogs_nas_emm_cause_t *emm_cause, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_emm_cause_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(emm_cause, pkbuf->data - size, size);
+    memcpy(emm_cause, data, size);
+
+    ogs_nas_trace_ie("EMM_CAUSE", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_emm_cause(ogs_nas_emm_cause_t *emm_cause, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_emm_cause(emm_cause, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  EMM_CAUSE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3587,39 +4734,41 @@ int ogs_nas_eps_encode_emm_cause(ogs_pkbuf_t *pkbuf, ogs_nas_emm_cause_t *emm_ca
     ogs_nas_emm_cause_t target;
 
     memcpy(&target, emm_cause, size);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  EMM_CAUSE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("EMM_CAUSE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.4.1 Access point name
  * M LV 2-101 */
-int ogs_nas_eps_decode_access_point_name(ogs_nas_access_point_name_t *access_point_name, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_access_point_name(ogs_nas_access_point_name_t *access_point_name, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_access_point_name_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_access_point_name_t *)pkbuf->data;
+    source = (ogs_nas_access_point_name_t *)data;
 
     access_point_name->length = source->length;
     size = access_point_name->length + sizeof(access_point_name->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*access_point_name) < size) return -1;
-    memcpy(access_point_name, pkbuf->data - size, size);
+    memcpy(access_point_name, data, size);
 
     {
         char apn[OGS_MAX_APN_LEN+1];
@@ -3631,8 +4780,19 @@ int ogs_nas_eps_decode_access_point_name(ogs_nas_access_point_name_t *access_poi
         }
     }
 
-    ogs_trace("  ACCESS_POINT_NAME - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("ACCESS_POINT_NAME", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_access_point_name(ogs_nas_access_point_name_t *access_point_name, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_access_point_name(access_point_name, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3646,42 +4806,55 @@ int ogs_nas_eps_encode_access_point_name(ogs_pkbuf_t *pkbuf, ogs_nas_access_poin
     target.length = ogs_fqdn_build(target.apn, access_point_name->apn, access_point_name->length);
     size = target.length + sizeof(target.length);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  ACCESS_POINT_NAME - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("ACCESS_POINT_NAME", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.4.11 Protocol configuration options
  * O TLV 3-253 */
-int ogs_nas_eps_decode_protocol_configuration_options(ogs_nas_protocol_configuration_options_t *protocol_configuration_options, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_protocol_configuration_options(ogs_nas_protocol_configuration_options_t *protocol_configuration_options, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_protocol_configuration_options_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_protocol_configuration_options_t *)pkbuf->data;
+    source = (ogs_nas_protocol_configuration_options_t *)data;
 
     protocol_configuration_options->length = source->length;
     size = protocol_configuration_options->length + sizeof(protocol_configuration_options->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*protocol_configuration_options) < size) return -1;
-    memcpy(protocol_configuration_options, pkbuf->data - size, size);
+    memcpy(protocol_configuration_options, data, size);
 
-    ogs_trace("  PROTOCOL_CONFIGURATION_OPTIONS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("PROTOCOL_CONFIGURATION_OPTIONS", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_protocol_configuration_options(ogs_nas_protocol_configuration_options_t *protocol_configuration_options, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_protocol_configuration_options(protocol_configuration_options, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3692,42 +4865,55 @@ int ogs_nas_eps_encode_protocol_configuration_options(ogs_pkbuf_t *pkbuf, ogs_na
     ogs_nas_protocol_configuration_options_t target;
 
     memcpy(&target, protocol_configuration_options, sizeof(ogs_nas_protocol_configuration_options_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  PROTOCOL_CONFIGURATION_OPTIONS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("PROTOCOL_CONFIGURATION_OPTIONS", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.4.12 Quality of service
  * O TLV 14-22 */
-int ogs_nas_eps_decode_quality_of_service(ogs_nas_quality_of_service_t *quality_of_service, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_quality_of_service(ogs_nas_quality_of_service_t *quality_of_service, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_quality_of_service_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_quality_of_service_t *)pkbuf->data;
+    source = (ogs_nas_quality_of_service_t *)data;
 
     quality_of_service->length = source->length;
     size = quality_of_service->length + sizeof(quality_of_service->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*quality_of_service) < size) return -1;
-    memcpy(quality_of_service, pkbuf->data - size, size);
+    memcpy(quality_of_service, data, size);
+
+    ogs_nas_trace_ie("QUALITY_OF_SERVICE", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_quality_of_service(ogs_nas_quality_of_service_t *quality_of_service, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_quality_of_service(quality_of_service, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  QUALITY_OF_SERVICE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3738,30 +4924,43 @@ int ogs_nas_eps_encode_quality_of_service(ogs_pkbuf_t *pkbuf, ogs_nas_quality_of
     ogs_nas_quality_of_service_t target;
 
     memcpy(&target, quality_of_service, sizeof(ogs_nas_quality_of_service_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  QUALITY_OF_SERVICE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("QUALITY_OF_SERVICE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.4.13 Radio priority
  * O TV 1 */
-int ogs_nas_eps_decode_radio_priority(ogs_nas_radio_priority_t *radio_priority, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_radio_priority(ogs_nas_radio_priority_t *radio_priority, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_radio_priority_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(radio_priority, pkbuf->data - size, size);
+    memcpy(radio_priority, data, size);
+
+    ogs_nas_trace_ie("RADIO_PRIORITY", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_radio_priority(ogs_nas_radio_priority_t *radio_priority, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_radio_priority(radio_priority, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  RADIO_PRIORITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3770,42 +4969,55 @@ int ogs_nas_eps_encode_radio_priority(ogs_pkbuf_t *pkbuf, ogs_nas_radio_priority
 {
     int size = sizeof(ogs_nas_radio_priority_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, radio_priority, size);
 
-    ogs_trace("  RADIO_PRIORITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("RADIO_PRIORITY", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.4.13A Re-attempt indicator
  * O TLV 3 */
-int ogs_nas_eps_decode_re_attempt_indicator(ogs_nas_re_attempt_indicator_t *re_attempt_indicator, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_re_attempt_indicator(ogs_nas_re_attempt_indicator_t *re_attempt_indicator, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_re_attempt_indicator_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_re_attempt_indicator_t *)pkbuf->data;
+    source = (ogs_nas_re_attempt_indicator_t *)data;
 
     re_attempt_indicator->length = source->length;
     size = re_attempt_indicator->length + sizeof(re_attempt_indicator->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*re_attempt_indicator) < size) return -1;
-    memcpy(re_attempt_indicator, pkbuf->data - size, size);
+    memcpy(re_attempt_indicator, data, size);
+
+    ogs_nas_trace_ie("RE_ATTEMPT_INDICATOR", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_re_attempt_indicator(ogs_nas_re_attempt_indicator_t *re_attempt_indicator, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_re_attempt_indicator(re_attempt_indicator, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  RE_ATTEMPT_INDICATOR - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3816,30 +5028,43 @@ int ogs_nas_eps_encode_re_attempt_indicator(ogs_pkbuf_t *pkbuf, ogs_nas_re_attem
     ogs_nas_re_attempt_indicator_t target;
 
     memcpy(&target, re_attempt_indicator, sizeof(ogs_nas_re_attempt_indicator_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  RE_ATTEMPT_INDICATOR - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("RE_ATTEMPT_INDICATOR", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.4.14 Request type
  * M V 1/2 */
-int ogs_nas_eps_decode_request_type(ogs_nas_request_type_t *request_type, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_request_type(ogs_nas_request_type_t *request_type, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_request_type_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(request_type, pkbuf->data - size, size);
+    memcpy(request_type, data, size);
+
+    ogs_nas_trace_ie("REQUEST_TYPE", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_request_type(ogs_nas_request_type_t *request_type, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_request_type(request_type, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  REQUEST_TYPE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3850,42 +5075,55 @@ int ogs_nas_eps_encode_request_type(ogs_pkbuf_t *pkbuf, ogs_nas_request_type_t *
     ogs_nas_request_type_t target;
 
     memcpy(&target, request_type, size);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  REQUEST_TYPE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("REQUEST_TYPE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.4.15 Traffic flow aggregate description
  * M LV 2-256 */
-int ogs_nas_eps_decode_traffic_flow_aggregate_description(ogs_nas_traffic_flow_aggregate_description_t *traffic_flow_aggregate_description, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_traffic_flow_aggregate_description(ogs_nas_traffic_flow_aggregate_description_t *traffic_flow_aggregate_description, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_traffic_flow_aggregate_description_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_traffic_flow_aggregate_description_t *)pkbuf->data;
+    source = (ogs_nas_traffic_flow_aggregate_description_t *)data;
 
     traffic_flow_aggregate_description->length = source->length;
     size = traffic_flow_aggregate_description->length + sizeof(traffic_flow_aggregate_description->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*traffic_flow_aggregate_description) < size) return -1;
-    memcpy(traffic_flow_aggregate_description, pkbuf->data - size, size);
+    memcpy(traffic_flow_aggregate_description, data, size);
+
+    ogs_nas_trace_ie("TRAFFIC_FLOW_AGGREGATE_DESCRIPTION", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_traffic_flow_aggregate_description(ogs_nas_traffic_flow_aggregate_description_t *traffic_flow_aggregate_description, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_traffic_flow_aggregate_description(traffic_flow_aggregate_description, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  TRAFFIC_FLOW_AGGREGATE_DESCRIPTION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3896,42 +5134,55 @@ int ogs_nas_eps_encode_traffic_flow_aggregate_description(ogs_pkbuf_t *pkbuf, og
     ogs_nas_traffic_flow_aggregate_description_t target;
 
     memcpy(&target, traffic_flow_aggregate_description, sizeof(ogs_nas_traffic_flow_aggregate_description_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  TRAFFIC_FLOW_AGGREGATE_DESCRIPTION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("TRAFFIC_FLOW_AGGREGATE_DESCRIPTION", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.4.16 Traffic flow template
  * M LV 2-256 */
-int ogs_nas_eps_decode_traffic_flow_template(ogs_nas_traffic_flow_template_t *traffic_flow_template, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_traffic_flow_template(ogs_nas_traffic_flow_template_t *traffic_flow_template, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_traffic_flow_template_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_traffic_flow_template_t *)pkbuf->data;
+    source = (ogs_nas_traffic_flow_template_t *)data;
 
     traffic_flow_template->length = source->length;
     size = traffic_flow_template->length + sizeof(traffic_flow_template->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*traffic_flow_template) < size) return -1;
-    memcpy(traffic_flow_template, pkbuf->data - size, size);
+    memcpy(traffic_flow_template, data, size);
+
+    ogs_nas_trace_ie("TRAFFIC_FLOW_TEMPLATE", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_traffic_flow_template(ogs_nas_traffic_flow_template_t *traffic_flow_template, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_traffic_flow_template(traffic_flow_template, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  TRAFFIC_FLOW_TEMPLATE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3942,42 +5193,55 @@ int ogs_nas_eps_encode_traffic_flow_template(ogs_pkbuf_t *pkbuf, ogs_nas_traffic
     ogs_nas_traffic_flow_template_t target;
 
     memcpy(&target, traffic_flow_template, sizeof(ogs_nas_traffic_flow_template_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  TRAFFIC_FLOW_TEMPLATE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("TRAFFIC_FLOW_TEMPLATE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.4.17 Transaction identifier
  * O TLV 3-4 */
-int ogs_nas_eps_decode_transaction_identifier(ogs_nas_transaction_identifier_t *transaction_identifier, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_transaction_identifier(ogs_nas_transaction_identifier_t *transaction_identifier, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_transaction_identifier_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_transaction_identifier_t *)pkbuf->data;
+    source = (ogs_nas_transaction_identifier_t *)data;
 
     transaction_identifier->length = source->length;
     size = transaction_identifier->length + sizeof(transaction_identifier->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*transaction_identifier) < size) return -1;
-    memcpy(transaction_identifier, pkbuf->data - size, size);
+    memcpy(transaction_identifier, data, size);
+
+    ogs_nas_trace_ie("TRANSACTION_IDENTIFIER", data, size);
 
-    ogs_trace("  TRANSACTION_IDENTIFIER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    return size;
+}
+
+int ogs_nas_eps_decode_transaction_identifier(ogs_nas_transaction_identifier_t *transaction_identifier, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_transaction_identifier(transaction_identifier, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -3988,30 +5252,43 @@ int ogs_nas_eps_encode_transaction_identifier(ogs_pkbuf_t *pkbuf, ogs_nas_transa
     ogs_nas_transaction_identifier_t target;
 
     memcpy(&target, transaction_identifier, sizeof(ogs_nas_transaction_identifier_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  TRANSACTION_IDENTIFIER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("TRANSACTION_IDENTIFIER", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.4.18 WLAN offload acceptability
  * O TV 1 */
-int ogs_nas_eps_decode_wlan_offload_acceptability(ogs_nas_wlan_offload_acceptability_t *wlan_offload_acceptability, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_wlan_offload_acceptability(ogs_nas_wlan_offload_acceptability_t *wlan_offload_acceptability, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_wlan_offload_acceptability_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(wlan_offload_acceptability, pkbuf->data - size, size);
+    memcpy(wlan_offload_acceptability, data, size);
+
+    ogs_nas_trace_ie("WLAN_OFFLOAD_ACCEPTABILITY", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_wlan_offload_acceptability(ogs_nas_wlan_offload_acceptability_t *wlan_offload_acceptability, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_wlan_offload_acceptability(wlan_offload_acceptability, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  WLAN_OFFLOAD_ACCEPTABILITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -4020,42 +5297,55 @@ int ogs_nas_eps_encode_wlan_offload_acceptability(ogs_pkbuf_t *pkbuf, ogs_nas_wl
 {
     int size = sizeof(ogs_nas_wlan_offload_acceptability_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, wlan_offload_acceptability, size);
 
-    ogs_trace("  WLAN_OFFLOAD_ACCEPTABILITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("WLAN_OFFLOAD_ACCEPTABILITY", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.4.19 NBIFOM container
  * O TLV 3-257 */
-int ogs_nas_eps_decode_nbifom_container(ogs_nas_nbifom_container_t *nbifom_container, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_nbifom_container(ogs_nas_nbifom_container_t *nbifom_container, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_nbifom_container_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_nbifom_container_t *)pkbuf->data;
+    source = (ogs_nas_nbifom_container_t *)data;
 
     nbifom_container->length = source->length;
     size = nbifom_container->length + sizeof(nbifom_container->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*nbifom_container) < size) return -1;
-    memcpy(nbifom_container, pkbuf->data - size, size);
+    memcpy(nbifom_container, data, size);
+
+    ogs_nas_trace_ie("NBIFOM_CONTAINER", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_nbifom_container(ogs_nas_nbifom_container_t *nbifom_container, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_nbifom_container(nbifom_container, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  NBIFOM_CONTAINER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -4066,42 +5356,55 @@ int ogs_nas_eps_encode_nbifom_container(ogs_pkbuf_t *pkbuf, ogs_nas_nbifom_conta
     ogs_nas_nbifom_container_t target;
 
     memcpy(&target, nbifom_container, sizeof(ogs_nas_nbifom_container_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  NBIFOM_CONTAINER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("NBIFOM_CONTAINER", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.4.2 APN aggregate maximum bit rate
  * O TLV 4-8 */
-int ogs_nas_eps_decode_apn_aggregate_maximum_bit_rate(ogs_nas_apn_aggregate_maximum_bit_rate_t *apn_aggregate_maximum_bit_rate, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_apn_aggregate_maximum_bit_rate(ogs_nas_apn_aggregate_maximum_bit_rate_t *apn_aggregate_maximum_bit_rate, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_apn_aggregate_maximum_bit_rate_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_apn_aggregate_maximum_bit_rate_t *)pkbuf->data;
+    source = (ogs_nas_apn_aggregate_maximum_bit_rate_t *)data;
 
     apn_aggregate_maximum_bit_rate->length = source->length;
     size = apn_aggregate_maximum_bit_rate->length + sizeof(apn_aggregate_maximum_bit_rate->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*apn_aggregate_maximum_bit_rate) < size) return -1;
-    memcpy(apn_aggregate_maximum_bit_rate, pkbuf->data - size, size);
+    memcpy(apn_aggregate_maximum_bit_rate, data, size);
+
+    ogs_nas_trace_ie("APN_AGGREGATE_MAXIMUM_BIT_RATE", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_apn_aggregate_maximum_bit_rate(ogs_nas_apn_aggregate_maximum_bit_rate_t *apn_aggregate_maximum_bit_rate, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_apn_aggregate_maximum_bit_rate(apn_aggregate_maximum_bit_rate, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  APN_AGGREGATE_MAXIMUM_BIT_RATE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -4112,44 +5415,57 @@ int ogs_nas_eps_encode_apn_aggregate_maximum_bit_rate(ogs_pkbuf_t *pkbuf, ogs_na
     ogs_nas_apn_aggregate_maximum_bit_rate_t target;
 
     memcpy(&target, apn_aggregate_maximum_bit_rate, sizeof(ogs_nas_apn_aggregate_maximum_bit_rate_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  APN_AGGREGATE_MAXIMUM_BIT_RATE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("APN_AGGREGATE_MAXIMUM_BIT_RATE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.4.22 Header compression configuration
  * O TLV 5-257 */
-int ogs_nas_eps_decode_header_compression_configuration(ogs_nas_header_compression_configuration_t *header_compression_configuration, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_header_compression_configuration(ogs_nas_header_compression_configuration_t *header_compression_configuration, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_header_compression_configuration_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_header_compression_configuration_t *)pkbuf->data;
+    source = (ogs_nas_header_compression_configuration_t *)data;
 
     header_compression_configuration->length = source->length;
     size = header_compression_configuration->length + sizeof(header_compression_configuration->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    if (sizeof(*header_compression_configuration) < size) return -1;
-    memcpy(header_compression_configuration, pkbuf->data - size, size);
+    if (sizeof(*header_compression_configuration) < size) return -1;
+    memcpy(header_compression_configuration, data, size);
+
+    header_compression_configuration->max_cid = be16toh(header_compression_configuration->max_cid);
+
+    ogs_nas_trace_ie("HEADER_COMPRESSION_CONFIGURATION", data, size);
+
+    return size;
+}
 
-    header_compression_configuration->max_cid = be16toh(header_compression_configuration->max_cid);
+int ogs_nas_eps_decode_header_compression_configuration(ogs_nas_header_compression_configuration_t *header_compression_configuration, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_header_compression_configuration(header_compression_configuration, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  HEADER_COMPRESSION_CONFIGURATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -4162,30 +5478,43 @@ int ogs_nas_eps_encode_header_compression_configuration(ogs_pkbuf_t *pkbuf, ogs_
     memcpy(&target, header_compression_configuration, sizeof(ogs_nas_header_compression_configuration_t));
     target.max_cid = htobe16(header_compression_configuration->max_cid);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  HEADER_COMPRESSION_CONFIGURATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("HEADER_COMPRESSION_CONFIGURATION", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.4.23 Control plane only indication
  * O TV 1 */
-int ogs_nas_eps_decode_control_plane_only_indication(ogs_nas_control_plane_only_indication_t *control_plane_only_indication, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_control_plane_only_indication(ogs_nas_control_plane_only_indication_t *control_plane_only_indication, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_control_plane_only_indication_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(control_plane_only_indication, pkbuf->data - size, size);
+    memcpy(control_plane_only_indication, data, size);
 
-    ogs_trace("  CONTROL_PLANE_ONLY_INDICATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("CONTROL_PLANE_ONLY_INDICATION", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_control_plane_only_indication(ogs_nas_control_plane_only_indication_t *control_plane_only_indication, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_control_plane_only_indication(control_plane_only_indication, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -4194,41 +5523,54 @@ int ogs_nas_eps_encode_control_plane_only_indication(ogs_pkbuf_t *pkbuf, ogs_nas
 {
     int size = sizeof(ogs_nas_control_plane_only_indication_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, control_plane_only_indication, size);
 
-    ogs_trace("  CONTROL_PLANE_ONLY_INDICATION - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("CONTROL_PLANE_ONLY_INDICATION", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.4.26 Extended protocol configuration options
  * O TLV-E 4-65538 */
-int ogs_nas_eps_decode_extended_protocol_configuration_options(ogs_nas_extended_protocol_configuration_options_t *extended_protocol_configuration_options, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_extended_protocol_configuration_options(ogs_nas_extended_protocol_configuration_options_t *extended_protocol_configuration_options, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_extended_protocol_configuration_options_t *source = NULL;
 
-    if (pkbuf->len < 2) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 2) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_extended_protocol_configuration_options_t *)pkbuf->data;
+    source = (ogs_nas_extended_protocol_configuration_options_t *)data;
 
     extended_protocol_configuration_options->length = be16toh(source->length);
     size = extended_protocol_configuration_options->length + sizeof(extended_protocol_configuration_options->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    extended_protocol_configuration_options->buffer = pkbuf->data - size + sizeof(extended_protocol_configuration_options->length);
+    extended_protocol_configuration_options->buffer = data + sizeof(extended_protocol_configuration_options->length);
+
+    ogs_nas_trace_ie("EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS", extended_protocol_configuration_options->buffer, extended_protocol_configuration_options->length);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_extended_protocol_configuration_options(ogs_nas_extended_protocol_configuration_options_t *extended_protocol_configuration_options, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_extended_protocol_configuration_options(extended_protocol_configuration_options, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, (void*)extended_protocol_configuration_options->buffer, extended_protocol_configuration_options->length);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -4242,47 +5584,63 @@ int ogs_nas_eps_encode_extended_protocol_configuration_options(ogs_pkbuf_t *pkbu
     ogs_assert(extended_protocol_configuration_options->buffer);
 
     size = sizeof(extended_protocol_configuration_options->length);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     target = htobe16(extended_protocol_configuration_options->length);
     memcpy(pkbuf->data - size, &target, size);
 
     size = extended_protocol_configuration_options->length;
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, extended_protocol_configuration_options->buffer, size);
 
-    ogs_trace("  EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("EXTENDED_PROTOCOL_CONFIGURATION_OPTIONS", pkbuf->data - size, size);
 
     return extended_protocol_configuration_options->length + sizeof(extended_protocol_configuration_options->length);
 }
 
 /* 9.9.4.27 Header compression configuration status
  * O TLV 4 */
-int ogs_nas_eps_decode_header_compression_configuration_status(ogs_nas_header_compression_configuration_status_t *header_compression_configuration_status, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_header_compression_configuration_status(ogs_nas_header_compression_configuration_status_t *header_compression_configuration_status, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_header_compression_configuration_status_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_header_compression_configuration_status_t *)pkbuf->data;
+    source = (ogs_nas_header_compression_configuration_status_t *)data;
 
     header_compression_configuration_status->length = source->length;
     size = header_compression_configuration_status->length + sizeof(header_compression_configuration_status->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*header_compression_configuration_status) < size) return -1;
-    memcpy(header_compression_configuration_status, pkbuf->data - size, size);
+    memcpy(header_compression_configuration_status, data, size);
+
+    ogs_nas_trace_ie("HEADER_COMPRESSION_CONFIGURATION_STATUS", data, size);
 
-    ogs_trace("  HEADER_COMPRESSION_CONFIGURATION_STATUS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    return size;
+}
+
+int ogs_nas_eps_decode_header_compression_configuration_status(ogs_nas_header_compression_configuration_status_t *header_compression_configuration_status, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_header_compression_configuration_status(header_compression_configuration_status, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -4293,42 +5651,55 @@ int ogs_nas_eps_encode_header_compression_configuration_status(ogs_pkbuf_t *pkbu
     ogs_nas_header_compression_configuration_status_t target;
 
     memcpy(&target, header_compression_configuration_status, sizeof(ogs_nas_header_compression_configuration_status_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  HEADER_COMPRESSION_CONFIGURATION_STATUS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("HEADER_COMPRESSION_CONFIGURATION_STATUS", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.4.28 Serving PLMN rate control
  * O TLV 4 */
-int ogs_nas_eps_decode_serving_plmn_rate_control(ogs_nas_serving_plmn_rate_control_t *serving_plmn_rate_control, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_serving_plmn_rate_control(ogs_nas_serving_plmn_rate_control_t *serving_plmn_rate_control, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_serving_plmn_rate_control_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_serving_plmn_rate_control_t *)pkbuf->data;
+    source = (ogs_nas_serving_plmn_rate_control_t *)data;
 
     serving_plmn_rate_control->length = source->length;
     size = serving_plmn_rate_control->length + sizeof(serving_plmn_rate_control->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*serving_plmn_rate_control) < size) return -1;
-    memcpy(serving_plmn_rate_control, pkbuf->data - size, size);
+    memcpy(serving_plmn_rate_control, data, size);
+
+    ogs_nas_trace_ie("SERVING_PLMN_RATE_CONTROL", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_serving_plmn_rate_control(ogs_nas_serving_plmn_rate_control_t *serving_plmn_rate_control, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_serving_plmn_rate_control(serving_plmn_rate_control, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  SERVING_PLMN_RATE_CONTROL - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -4339,42 +5710,55 @@ int ogs_nas_eps_encode_serving_plmn_rate_control(ogs_pkbuf_t *pkbuf, ogs_nas_ser
     ogs_nas_serving_plmn_rate_control_t target;
 
     memcpy(&target, serving_plmn_rate_control, sizeof(ogs_nas_serving_plmn_rate_control_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  SERVING_PLMN_RATE_CONTROL - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("SERVING_PLMN_RATE_CONTROL", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.4.29 Extended APN aggregate maximum bit rate
  * O TLV 8 */
-int ogs_nas_eps_decode_extended_apn_aggregate_maximum_bit_rate(ogs_nas_extended_apn_aggregate_maximum_bit_rate_t *extended_apn_aggregate_maximum_bit_rate, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_extended_apn_aggregate_maximum_bit_rate(ogs_nas_extended_apn_aggregate_maximum_bit_rate_t *extended_apn_aggregate_maximum_bit_rate, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_extended_apn_aggregate_maximum_bit_rate_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_extended_apn_aggregate_maximum_bit_rate_t *)pkbuf->data;
+    source = (ogs_nas_extended_apn_aggregate_maximum_bit_rate_t *)data;
 
     extended_apn_aggregate_maximum_bit_rate->length = source->length;
     size = extended_apn_aggregate_maximum_bit_rate->length + sizeof(extended_apn_aggregate_maximum_bit_rate->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*extended_apn_aggregate_maximum_bit_rate) < size) return -1;
-    memcpy(extended_apn_aggregate_maximum_bit_rate, pkbuf->data - size, size);
+    memcpy(extended_apn_aggregate_maximum_bit_rate, data, size);
+
+    ogs_nas_trace_ie("EXTENDED_APN_AGGREGATE_MAXIMUM_BIT_RATE", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_extended_apn_aggregate_maximum_bit_rate(ogs_nas_extended_apn_aggregate_maximum_bit_rate_t *extended_apn_aggregate_maximum_bit_rate, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_extended_apn_aggregate_maximum_bit_rate(extended_apn_aggregate_maximum_bit_rate, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  EXTENDED_APN_AGGREGATE_MAXIMUM_BIT_RATE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -4385,30 +5769,43 @@ int ogs_nas_eps_encode_extended_apn_aggregate_maximum_bit_rate(ogs_pkbuf_t *pkbu
     ogs_nas_extended_apn_aggregate_maximum_bit_rate_t target;
 
     memcpy(&target, extended_apn_aggregate_maximum_bit_rate, sizeof(ogs_nas_extended_apn_aggregate_maximum_bit_rate_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  EXTENDED_APN_AGGREGATE_MAXIMUM_BIT_RATE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("EXTENDED_APN_AGGREGATE_MAXIMUM_BIT_RATE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.4.2A Connectivity type
  * O TV 1 */
-int ogs_nas_eps_decode_connectivity_type(ogs_nas_connectivity_type_t *connectivity_type, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_connectivity_type(ogs_nas_connectivity_type_t *connectivity_type, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_connectivity_type_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(connectivity_type, pkbuf->data - size, size);
+    memcpy(connectivity_type, data, size);
+
+    ogs_nas_trace_ie("CONNECTIVITY_TYPE", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_connectivity_type(ogs_nas_connectivity_type_t *connectivity_type, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_connectivity_type(connectivity_type, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  CONNECTIVITY_TYPE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -4417,42 +5814,55 @@ int ogs_nas_eps_encode_connectivity_type(ogs_pkbuf_t *pkbuf, ogs_nas_connectivit
 {
     int size = sizeof(ogs_nas_connectivity_type_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, connectivity_type, size);
 
-    ogs_trace("  CONNECTIVITY_TYPE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("CONNECTIVITY_TYPE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.4.3 EPS quality of service
  * M LV 2-14 */
-int ogs_nas_eps_decode_eps_quality_of_service(ogs_nas_eps_quality_of_service_t *eps_quality_of_service, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_eps_quality_of_service(ogs_nas_eps_quality_of_service_t *eps_quality_of_service, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_eps_quality_of_service_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_eps_quality_of_service_t *)pkbuf->data;
+    source = (ogs_nas_eps_quality_of_service_t *)data;
 
     eps_quality_of_service->length = source->length;
     size = eps_quality_of_service->length + sizeof(eps_quality_of_service->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*eps_quality_of_service) < size) return -1;
-    memcpy(eps_quality_of_service, pkbuf->data - size, size);
+    memcpy(eps_quality_of_service, data, size);
+
+    ogs_nas_trace_ie("EPS_QUALITY_OF_SERVICE", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_eps_quality_of_service(ogs_nas_eps_quality_of_service_t *eps_quality_of_service, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_eps_quality_of_service(eps_quality_of_service, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  EPS_QUALITY_OF_SERVICE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -4463,42 +5873,55 @@ int ogs_nas_eps_encode_eps_quality_of_service(ogs_pkbuf_t *pkbuf, ogs_nas_eps_qu
     ogs_nas_eps_quality_of_service_t target;
 
     memcpy(&target, eps_quality_of_service, sizeof(ogs_nas_eps_quality_of_service_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  EPS_QUALITY_OF_SERVICE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("EPS_QUALITY_OF_SERVICE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.4.30 Extended quality of service
  * O TLV 12 */
-int ogs_nas_eps_decode_extended_quality_of_service(ogs_nas_extended_quality_of_service_t *extended_quality_of_service, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_extended_quality_of_service(ogs_nas_extended_quality_of_service_t *extended_quality_of_service, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_extended_quality_of_service_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_extended_quality_of_service_t *)pkbuf->data;
+    source = (ogs_nas_extended_quality_of_service_t *)data;
 
     extended_quality_of_service->length = source->length;
     size = extended_quality_of_service->length + sizeof(extended_quality_of_service->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*extended_quality_of_service) < size) return -1;
-    memcpy(extended_quality_of_service, pkbuf->data - size, size);
+    memcpy(extended_quality_of_service, data, size);
+
+    ogs_nas_trace_ie("EXTENDED_QUALITY_OF_SERVICE", data, size);
+
+    return size;
+}
 
-    ogs_trace("  EXTENDED_QUALITY_OF_SERVICE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+int ogs_nas_eps_decode_extended_quality_of_service(ogs_nas_extended_quality_of_service_t *extended_quality_of_service, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_extended_quality_of_service(extended_quality_of_service, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -4509,30 +5932,43 @@ int ogs_nas_eps_encode_extended_quality_of_service(ogs_pkbuf_t *pkbuf, ogs_nas_e
     ogs_nas_extended_quality_of_service_t target;
 
     memcpy(&target, extended_quality_of_service, sizeof(ogs_nas_extended_quality_of_service_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  EXTENDED_QUALITY_OF_SERVICE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("EXTENDED_QUALITY_OF_SERVICE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.4.4 ESM cause
  * O TV 2 */
-int ogs_nas_eps_decode_esm_cause(ogs_nas_esm_cause_t *esm_cause, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_esm_cause(ogs_nas_esm_cause_t *esm_cause, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_esm_cause_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(esm_cause, pkbuf->data - size, size);
+    memcpy(esm_cause, data, size);
+
+    ogs_nas_trace_ie("ESM_CAUSE", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_esm_cause(ogs_nas_esm_cause_t *esm_cause, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_esm_cause(esm_cause, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  ESM_CAUSE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -4543,30 +5979,43 @@ int ogs_nas_eps_encode_esm_cause(ogs_pkbuf_t *pkbuf, ogs_nas_esm_cause_t *esm_ca
     ogs_nas_esm_cause_t target;
 
     memcpy(&target, esm_cause, size);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  ESM_CAUSE - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("ESM_CAUSE", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.4.5 ESM information transfer flag
  * O TV 1 */
-int ogs_nas_eps_decode_esm_information_transfer_flag(ogs_nas_esm_information_transfer_flag_t *esm_information_transfer_flag, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_esm_information_transfer_flag(ogs_nas_esm_information_transfer_flag_t *esm_information_transfer_flag, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_esm_information_transfer_flag_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(esm_information_transfer_flag, pkbuf->data - size, size);
+    memcpy(esm_information_transfer_flag, data, size);
+
+    ogs_nas_trace_ie("ESM_INFORMATION_TRANSFER_FLAG", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_esm_information_transfer_flag(ogs_nas_esm_information_transfer_flag_t *esm_information_transfer_flag, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_esm_information_transfer_flag(esm_information_transfer_flag, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  ESM_INFORMATION_TRANSFER_FLAG - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -4575,30 +6024,43 @@ int ogs_nas_eps_encode_esm_information_transfer_flag(ogs_pkbuf_t *pkbuf, ogs_nas
 {
     int size = sizeof(ogs_nas_esm_information_transfer_flag_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, esm_information_transfer_flag, size);
 
-    ogs_trace("  ESM_INFORMATION_TRANSFER_FLAG - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("ESM_INFORMATION_TRANSFER_FLAG", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.4.6 Linked EPS bearer identity
  * M V 1/2 */
-int ogs_nas_eps_decode_linked_eps_bearer_identity(ogs_nas_linked_eps_bearer_identity_t *linked_eps_bearer_identity, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_linked_eps_bearer_identity(ogs_nas_linked_eps_bearer_identity_t *linked_eps_bearer_identity, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_linked_eps_bearer_identity_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(linked_eps_bearer_identity, pkbuf->data - size, size);
+    memcpy(linked_eps_bearer_identity, data, size);
+
+    ogs_nas_trace_ie("LINKED_EPS_BEARER_IDENTITY", data, size);
 
-    ogs_trace("  LINKED_EPS_BEARER_IDENTITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    return size;
+}
+
+int ogs_nas_eps_decode_linked_eps_bearer_identity(ogs_nas_linked_eps_bearer_identity_t *linked_eps_bearer_identity, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_linked_eps_bearer_identity(linked_eps_bearer_identity, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -4609,30 +6071,43 @@ int ogs_nas_eps_encode_linked_eps_bearer_identity(ogs_pkbuf_t *pkbuf, ogs_nas_li
     ogs_nas_linked_eps_bearer_identity_t target;
 
     memcpy(&target, linked_eps_bearer_identity, size);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  LINKED_EPS_BEARER_IDENTITY - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("LINKED_EPS_BEARER_IDENTITY", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.4.7 LLC service access point identifier
  * O TV 2 */
-int ogs_nas_eps_decode_llc_service_access_point_identifier(ogs_nas_llc_service_access_point_identifier_t *llc_service_access_point_identifier, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_llc_service_access_point_identifier(ogs_nas_llc_service_access_point_identifier_t *llc_service_access_point_identifier, unsigned char *data, int len)
 {
     int size = sizeof(ogs_nas_llc_service_access_point_identifier_t);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
-    memcpy(llc_service_access_point_identifier, pkbuf->data - size, size);
+    memcpy(llc_service_access_point_identifier, data, size);
 
-    ogs_trace("  LLC_SERVICE_ACCESS_POINT_IDENTIFIER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("LLC_SERVICE_ACCESS_POINT_IDENTIFIER", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_llc_service_access_point_identifier(ogs_nas_llc_service_access_point_identifier_t *llc_service_access_point_identifier, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_llc_service_access_point_identifier(llc_service_access_point_identifier, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -4643,42 +6118,55 @@ int ogs_nas_eps_encode_llc_service_access_point_identifier(ogs_pkbuf_t *pkbuf, o
     ogs_nas_llc_service_access_point_identifier_t target;
 
     memcpy(&target, llc_service_access_point_identifier, size);
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  LLC_SERVICE_ACCESS_POINT_IDENTIFIER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("LLC_SERVICE_ACCESS_POINT_IDENTIFIER", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.4.8 Packet flow Identifier
  * O TLV 3 */
-int ogs_nas_eps_decode_packet_flow_identifier(ogs_nas_packet_flow_identifier_t *packet_flow_identifier, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_packet_flow_identifier(ogs_nas_packet_flow_identifier_t *packet_flow_identifier, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_packet_flow_identifier_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_packet_flow_identifier_t *)pkbuf->data;
+    source = (ogs_nas_packet_flow_identifier_t *)data;
 
     packet_flow_identifier->length = source->length;
     size = packet_flow_identifier->length + sizeof(packet_flow_identifier->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*packet_flow_identifier) < size) return -1;
-    memcpy(packet_flow_identifier, pkbuf->data - size, size);
+    memcpy(packet_flow_identifier, data, size);
+
+    ogs_nas_trace_ie("PACKET_FLOW_IDENTIFIER", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_packet_flow_identifier(ogs_nas_packet_flow_identifier_t *packet_flow_identifier, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_packet_flow_identifier(packet_flow_identifier, pkbuf->data, pkbuf->len);
 
-    ogs_trace("  PACKET_FLOW_IDENTIFIER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    if (size < 0)
+        return size;
+
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -4689,42 +6177,55 @@ int ogs_nas_eps_encode_packet_flow_identifier(ogs_pkbuf_t *pkbuf, ogs_nas_packet
     ogs_nas_packet_flow_identifier_t target;
 
     memcpy(&target, packet_flow_identifier, sizeof(ogs_nas_packet_flow_identifier_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  PACKET_FLOW_IDENTIFIER - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("PACKET_FLOW_IDENTIFIER", pkbuf->data - size, size);
 
     return size;
 }
 
 /* 9.9.4.9 PDN address
  * M LV 6-14 */
-int ogs_nas_eps_decode_pdn_address(ogs_nas_pdn_address_t *pdn_address, ogs_pkbuf_t *pkbuf)
+int ogs_nas_eps_read_pdn_address(ogs_nas_pdn_address_t *pdn_address, unsigned char *data, int len)
 {
     int size = 0;
     ogs_nas_pdn_address_t *source = NULL;
 
-    if (pkbuf->len < 1) {
-       ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+    if (len < 1) {
+       ogs_error("Not enough data [len:%d]", len);
        return -1;
     }
 
-    source = (ogs_nas_pdn_address_t *)pkbuf->data;
+    source = (ogs_nas_pdn_address_t *)data;
 
     pdn_address->length = source->length;
     size = pdn_address->length + sizeof(pdn_address->length);
 
-    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+    if (len < size) {
+       ogs_error("Not enough data [size:%d len:%d]", (int)size, len);
        return -1;
     }
 
     if (sizeof(*pdn_address) < size) return -1;
-    memcpy(pdn_address, pkbuf->data - size, size);
+    memcpy(pdn_address, data, size);
+
+    ogs_nas_trace_ie("PDN_ADDRESS", data, size);
+
+    return size;
+}
+
+int ogs_nas_eps_decode_pdn_address(ogs_nas_pdn_address_t *pdn_address, ogs_pkbuf_t *pkbuf)
+{
+    int size = ogs_nas_eps_read_pdn_address(pdn_address, pkbuf->data, pkbuf->len);
+
+    if (size < 0)
+        return size;
 
-    ogs_trace("  PDN_ADDRESS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
 
     return size;
 }
@@ -4735,11 +6236,13 @@ int ogs_nas_eps_encode_pdn_address(ogs_pkbuf_t *pkbuf, ogs_nas_pdn_address_t *pd
     ogs_nas_pdn_address_t target;
 
     memcpy(&target, pdn_address, sizeof(ogs_nas_pdn_address_t));
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &target, size);
 
-    ogs_trace("  PDN_ADDRESS - ");
-    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);
+    ogs_nas_trace_ie("PDN_ADDRESS", pkbuf->data - size, size);
 
     return size;
 }
@@ -28,8 +28,8 @@
 /*******************************************************************************
  * This file had been created by nas-message.py script v0.1.0
  * Please do not modify this file but regenerate it via script.
- * Created on: 2024-01-21 18:50:03.400537 by acetcom
- * from 24301-h90.docx
+ * Created from 24301-h90.docx
+ * (sha256: 1acc20b2dabf84bff1965c46a7d926753c0e7fde48d8126faa12e06d66167125)
  ******************************************************************************/
 
 #if !defined(OGS_NAS_INSIDE) && !defined(OGS_NAS_COMPILATION)
@@ -45,6 +45,121 @@ extern "C" {
 
 int ogs_nas_eps_encode_optional_type(ogs_pkbuf_t *pkbuf, uint8_t type);
 
+int ogs_nas_eps_read_additional_information(ogs_nas_additional_information_t *additional_information, unsigned char *data, int len);
+int ogs_nas_eps_read_device_properties(ogs_nas_device_properties_t *device_properties, unsigned char *data, int len);
+int ogs_nas_eps_read_eps_bearer_context_status(ogs_nas_eps_bearer_context_status_t *eps_bearer_context_status, unsigned char *data, int len);
+int ogs_nas_eps_read_supported_codec_list(ogs_nas_supported_codec_list_t *supported_codec_list, unsigned char *data, int len);
+int ogs_nas_eps_read_location_area_identification(ogs_nas_location_area_identification_t *location_area_identification, unsigned char *data, int len);
+int ogs_nas_eps_read_mobile_identity(ogs_nas_mobile_identity_t *mobile_identity, unsigned char *data, int len);
+int ogs_nas_eps_read_mobile_station_classmark_2(ogs_nas_mobile_station_classmark_2_t *mobile_station_classmark_2, unsigned char *data, int len);
+int ogs_nas_eps_read_mobile_station_classmark_3(ogs_nas_mobile_station_classmark_3_t *mobile_station_classmark_3, unsigned char *data, int len);
+int ogs_nas_eps_read_plmn_list(ogs_nas_plmn_list_t *plmn_list, unsigned char *data, int len);
+int ogs_nas_eps_read_additional_update_result(ogs_nas_additional_update_result_t *additional_update_result, unsigned char *data, int len);
+int ogs_nas_eps_read_additional_update_type(ogs_nas_additional_update_type_t *additional_update_type, unsigned char *data, int len);
+int ogs_nas_eps_read_authentication_failure_parameter(ogs_nas_authentication_failure_parameter_t *authentication_failure_parameter, unsigned char *data, int len);
+int ogs_nas_eps_read_eps_attach_result(ogs_nas_eps_attach_result_t *eps_attach_result, unsigned char *data, int len);
+int ogs_nas_eps_read_eps_attach_type(ogs_nas_eps_attach_type_t *eps_attach_type, unsigned char *data, int len);
+int ogs_nas_eps_read_eps_mobile_identity(ogs_nas_eps_mobile_identity_t *eps_mobile_identity, unsigned char *data, int len);
+int ogs_nas_eps_read_eps_network_feature_support(ogs_nas_eps_network_feature_support_t *eps_network_feature_support, unsigned char *data, int len);
+int ogs_nas_eps_read_eps_update_result(ogs_nas_eps_update_result_t *eps_update_result, unsigned char *data, int len);
+int ogs_nas_eps_read_eps_update_type(ogs_nas_eps_update_type_t *eps_update_type, unsigned char *data, int len);
+int ogs_nas_eps_read_esm_message_container(ogs_nas_esm_message_container_t *esm_message_container, unsigned char *data, int len);
+int ogs_nas_eps_read_gprs_timer(ogs_nas_gprs_timer_t *gprs_timer, unsigned char *data, int len);
+int ogs_nas_eps_read_gprs_timer_2(ogs_nas_gprs_timer_2_t *gprs_timer_2, unsigned char *data, int len);
+int ogs_nas_eps_read_gprs_timer_3(ogs_nas_gprs_timer_3_t *gprs_timer_3, unsigned char *data, int len);
+int ogs_nas_eps_read_identity_type_2(ogs_nas_identity_type_2_t *identity_type_2, unsigned char *data, int len);
+int ogs_nas_eps_read_imeisv_request(ogs_nas_imeisv_request_t *imeisv_request, unsigned char *data, int len);
+int ogs_nas_eps_read_ksi_and_sequence_number(ogs_nas_ksi_and_sequence_number_t *ksi_and_sequence_number, unsigned char *data, int len);
+int ogs_nas_eps_read_authentication_parameter_autn(ogs_nas_authentication_parameter_autn_t *authentication_parameter_autn, unsigned char *data, int len);
+int ogs_nas_eps_read_ms_network_capability(ogs_nas_ms_network_capability_t *ms_network_capability, unsigned char *data, int len);
+int ogs_nas_eps_read_ms_network_feature_support(ogs_nas_ms_network_feature_support_t *ms_network_feature_support, unsigned char *data, int len);
+int ogs_nas_eps_read_key_set_identifier(ogs_nas_key_set_identifier_t *key_set_identifier, unsigned char *data, int len);
+int ogs_nas_eps_read_eps_message_container(ogs_nas_eps_message_container_t *eps_message_container, unsigned char *data, int len);
+int ogs_nas_eps_read_security_algorithms(ogs_nas_security_algorithms_t *security_algorithms, unsigned char *data, int len);
+int ogs_nas_eps_read_network_name(ogs_nas_network_name_t *network_name, unsigned char *data, int len);
+int ogs_nas_eps_read_network_resource_identifier_container(ogs_nas_network_resource_identifier_container_t *network_resource_identifier_container, unsigned char *data, int len);
+int ogs_nas_eps_read_nonce(ogs_nas_nonce_t *nonce, unsigned char *data, int len);
+int ogs_nas_eps_read_paging_identity(ogs_nas_paging_identity_t *paging_identity, unsigned char *data, int len);
+int ogs_nas_eps_read_p_tmsi_signature(ogs_nas_p_tmsi_signature_t *p_tmsi_signature, unsigned char *data, int len);
+int ogs_nas_eps_read_extended_emm_cause(ogs_nas_extended_emm_cause_t *extended_emm_cause, unsigned char *data, int len);
+int ogs_nas_eps_read_service_type(ogs_nas_service_type_t *service_type, unsigned char *data, int len);
+int ogs_nas_eps_read_short_mac(ogs_nas_short_mac_t *short_mac, unsigned char *data, int len);
+int ogs_nas_eps_read_time_zone(ogs_nas_time_zone_t *time_zone, unsigned char *data, int len);
+int ogs_nas_eps_read_authentication_parameter_rand(ogs_nas_authentication_parameter_rand_t *authentication_parameter_rand, unsigned char *data, int len);
+int ogs_nas_eps_read_time_zone_and_time(ogs_nas_time_zone_and_time_t *time_zone_and_time, unsigned char *data, int len);
+int ogs_nas_eps_read_tmsi_status(ogs_nas_tmsi_status_t *tmsi_status, unsigned char *data, int len);
+int ogs_nas_eps_read_tracking_area_identity(ogs_nas_tracking_area_identity_t *tracking_area_identity, unsigned char *data, int len);
+int ogs_nas_eps_read_tracking_area_identity_list(ogs_nas_tracking_area_identity_list_t *tracking_area_identity_list, unsigned char *data, int len);
+int ogs_nas_eps_read_ue_network_capability(ogs_nas_ue_network_capability_t *ue_network_capability, unsigned char *data, int len);
+int ogs_nas_eps_read_ue_radio_capability_information_update_needed(ogs_nas_ue_radio_capability_information_update_needed_t *ue_radio_capability_information_update_needed, unsigned char *data, int len);
+int ogs_nas_eps_read_ue_security_capability(ogs_nas_ue_security_capability_t *ue_security_capability, unsigned char *data, int len);
+int ogs_nas_eps_read_emergency_number_list(ogs_nas_emergency_number_list_t *emergency_number_list, unsigned char *data, int len);
+int ogs_nas_eps_read_extended_emergency_number_list(ogs_nas_extended_emergency_number_list_t *extended_emergency_number_list, unsigned char *data, int len);
+int ogs_nas_eps_read_cli(ogs_nas_cli_t *cli, unsigned char *data, int len);
+int ogs_nas_eps_read_ss_code(ogs_nas_ss_code_t *ss_code, unsigned char *data, int len);
+int ogs_nas_eps_read_authentication_response_parameter(ogs_nas_authentication_response_parameter_t *authentication_response_parameter, unsigned char *data, int len);
+int ogs_nas_eps_read_lcs_indicator(ogs_nas_lcs_indicator_t *lcs_indicator, unsigned char *data, int len);
+int ogs_nas_eps_read_lcs_client_identity(ogs_nas_lcs_client_identity_t *lcs_client_identity, unsigned char *data, int len);
+int ogs_nas_eps_read_generic_message_container_type(ogs_nas_generic_message_container_type_t *generic_message_container_type, unsigned char *data, int len);
+int ogs_nas_eps_read_generic_message_container(ogs_nas_generic_message_container_t *generic_message_container, unsigned char *data, int len);
+int ogs_nas_eps_read_voice_domain_preference_and_ue_usage_setting(ogs_nas_voice_domain_preference_and_ue_usage_setting_t *voice_domain_preference_and_ue_usage_setting, unsigned char *data, int len);
+int ogs_nas_eps_read_guti_type(ogs_nas_guti_type_t *guti_type, unsigned char *data, int len);
+int ogs_nas_eps_read_extended_drx_parameters(ogs_nas_extended_drx_parameters_t *extended_drx_parameters, unsigned char *data, int len);
+int ogs_nas_eps_read_dcn_id(ogs_nas_dcn_id_t *dcn_id, unsigned char *data, int len);
+int ogs_nas_eps_read_non__nw_provided_policies(ogs_nas_non__nw_provided_policies_t *non__nw_provided_policies, unsigned char *data, int len);
+int ogs_nas_eps_read_sms_services_status(ogs_nas_sms_services_status_t *sms_services_status, unsigned char *data, int len);
+int ogs_nas_eps_read_ciphering_key_sequence_number(ogs_nas_ciphering_key_sequence_number_t *ciphering_key_sequence_number, unsigned char *data, int len);
+int ogs_nas_eps_read_csfb_response(ogs_nas_csfb_response_t *csfb_response, unsigned char *data, int len);
+int ogs_nas_eps_read_hashmme(ogs_nas_hashmme_t *hashmme, unsigned char *data, int len);
+int ogs_nas_eps_read_replayed_nas_message_container(ogs_nas_replayed_nas_message_container_t *replayed_nas_message_container, unsigned char *data, int len);
+int ogs_nas_eps_read_network_policy(ogs_nas_network_policy_t *network_policy, unsigned char *data, int len);
+int ogs_nas_eps_read_ue_additional_security_capability(ogs_nas_ue_additional_security_capability_t *ue_additional_security_capability, unsigned char *data, int len);
+int ogs_nas_eps_read_ue_status(ogs_nas_ue_status_t *ue_status, unsigned char *data, int len);
+int ogs_nas_eps_read_additional_information_requested(ogs_nas_additional_information_requested_t *additional_information_requested, unsigned char *data, int len);
+int ogs_nas_eps_read_ciphering_key_data(ogs_nas_ciphering_key_data_t *ciphering_key_data, unsigned char *data, int len);
+int ogs_nas_eps_read_n1_ue_network_capability(ogs_nas_n1_ue_network_capability_t *n1_ue_network_capability, unsigned char *data, int len);
+int ogs_nas_eps_read_ue_radio_capability_id_availability(ogs_nas_ue_radio_capability_id_availability_t *ue_radio_capability_id_availability, unsigned char *data, int len);
+int ogs_nas_eps_read_ue_radio_capability_id_request(ogs_nas_ue_radio_capability_id_request_t *ue_radio_capability_id_request, unsigned char *data, int len);
+int ogs_nas_eps_read_daylight_saving_time(ogs_nas_daylight_saving_time_t *daylight_saving_time, unsigned char *data, int len);
+int ogs_nas_eps_read_ue_radio_capability_id(ogs_nas_ue_radio_capability_id_t *ue_radio_capability_id, unsigned char *data, int len);
+int ogs_nas_eps_read_ue_radio_capability_id_deletion_indication(ogs_nas_ue_radio_capability_id_deletion_indication_t *ue_radio_capability_id_deletion_indication, unsigned char *data, int len);
+int ogs_nas_eps_read_wus_assistance_information(ogs_nas_wus_assistance_information_t *wus_assistance_information, unsigned char *data, int len);
+int ogs_nas_eps_read_nb_s1_drx_parameter(ogs_nas_nb_s1_drx_parameter_t *nb_s1_drx_parameter, unsigned char *data, int len);
+int ogs_nas_eps_read_imsi_offset(ogs_nas_imsi_offset_t *imsi_offset, unsigned char *data, int len);
+int ogs_nas_eps_read_ue_request_type(ogs_nas_ue_request_type_t *ue_request_type, unsigned char *data, int len);
+int ogs_nas_eps_read_paging_restriction(ogs_nas_paging_restriction_t *paging_restriction, unsigned char *data, int len);
+int ogs_nas_eps_read_eps_additional_request_result(ogs_nas_eps_additional_request_result_t *eps_additional_request_result, unsigned char *data, int len);
+int ogs_nas_eps_read_detach_type(ogs_nas_detach_type_t *detach_type, unsigned char *data, int len);
+int ogs_nas_eps_read_drx_parameter(ogs_nas_drx_parameter_t *drx_parameter, unsigned char *data, int len);
+int ogs_nas_eps_read_emm_cause(ogs_nas_emm_cause_t *emm_cause, unsigned char *data, int len);
+int ogs_nas_eps_read_access_point_name(ogs_nas_access_point_name_t *access_point_name, unsigned char *data, int len);
+int ogs_nas_eps_read_protocol_configuration_options(ogs_nas_protocol_configuration_options_t *protocol_configuration_options, unsigned char *data, int len);
+int ogs_nas_eps_read_quality_of_service(ogs_nas_quality_of_service_t *quality_of_service, unsigned char *data, int len);
+int ogs_nas_eps_read_radio_priority(ogs_nas_radio_priority_t *radio_priority, unsigned char *data, int len);
+int ogs_nas_eps_read_re_attempt_indicator(ogs_nas_re_attempt_indicator_t *re_attempt_indicator, unsigned char *data, int len);
+int ogs_nas_eps_read_request_type(ogs_nas_request_type_t *request_type, unsigned char *data, int len);
+int ogs_nas_eps_read_traffic_flow_aggregate_description(ogs_nas_traffic_flow_aggregate_description_t *traffic_flow_aggregate_description, unsigned char *data, int len);
+int ogs_nas_eps_read_traffic_flow_template(ogs_nas_traffic_flow_template_t *traffic_flow_template, unsigned char *data, int len);
+int ogs_nas_eps_read_transaction_identifier(ogs_nas_transaction_identifier_t *transaction_identifier, unsigned char *data, int len);
+int ogs_nas_eps_read_wlan_offload_acceptability(ogs_nas_wlan_offload_acceptability_t *wlan_offload_acceptability, unsigned char *data, int len);
+int ogs_nas_eps_read_nbifom_container(ogs_nas_nbifom_container_t *nbifom_container, unsigned char *data, int len);
+int ogs_nas_eps_read_apn_aggregate_maximum_bit_rate(ogs_nas_apn_aggregate_maximum_bit_rate_t *apn_aggregate_maximum_bit_rate, unsigned char *data, int len);
+int ogs_nas_eps_read_header_compression_configuration(ogs_nas_header_compression_configuration_t *header_compression_configuration, unsigned char *data, int len);
+int ogs_nas_eps_read_control_plane_only_indication(ogs_nas_control_plane_only_indication_t *control_plane_only_indication, unsigned char *data, int len);
+int ogs_nas_eps_read_extended_protocol_configuration_options(ogs_nas_extended_protocol_configuration_options_t *extended_protocol_configuration_options, unsigned char *data, int len);
+int ogs_nas_eps_read_header_compression_configuration_status(ogs_nas_header_compression_configuration_status_t *header_compression_configuration_status, unsigned char *data, int len);
+int ogs_nas_eps_read_serving_plmn_rate_control(ogs_nas_serving_plmn_rate_control_t *serving_plmn_rate_control, unsigned char *data, int len);
+int ogs_nas_eps_read_extended_apn_aggregate_maximum_bit_rate(ogs_nas_extended_apn_aggregate_maximum_bit_rate_t *extended_apn_aggregate_maximum_bit_rate, unsigned char *data, int len);
+int ogs_nas_eps_read_connectivity_type(ogs_nas_connectivity_type_t *connectivity_type, unsigned char *data, int len);
+int ogs_nas_eps_read_eps_quality_of_service(ogs_nas_eps_quality_of_service_t *eps_quality_of_service, unsigned char *data, int len);
+int ogs_nas_eps_read_extended_quality_of_service(ogs_nas_extended_quality_of_service_t *extended_quality_of_service, unsigned char *data, int len);
+int ogs_nas_eps_read_esm_cause(ogs_nas_esm_cause_t *esm_cause, unsigned char *data, int len);
+int ogs_nas_eps_read_esm_information_transfer_flag(ogs_nas_esm_information_transfer_flag_t *esm_information_transfer_flag, unsigned char *data, int len);
+int ogs_nas_eps_read_linked_eps_bearer_identity(ogs_nas_linked_eps_bearer_identity_t *linked_eps_bearer_identity, unsigned char *data, int len);
+int ogs_nas_eps_read_llc_service_access_point_identifier(ogs_nas_llc_service_access_point_identifier_t *llc_service_access_point_identifier, unsigned char *data, int len);
+int ogs_nas_eps_read_packet_flow_identifier(ogs_nas_packet_flow_identifier_t *packet_flow_identifier, unsigned char *data, int len);
+int ogs_nas_eps_read_pdn_address(ogs_nas_pdn_address_t *pdn_address, unsigned char *data, int len);
+
 int ogs_nas_eps_decode_additional_information(ogs_nas_additional_information_t *additional_information, ogs_pkbuf_t *pkbuf);
 int ogs_nas_eps_decode_device_properties(ogs_nas_device_properties_t *device_properties, ogs_pkbuf_t *pkbuf);
 int ogs_nas_eps_decode_eps_bearer_context_status(ogs_nas_eps_bearer_context_status_t *eps_bearer_context_status, ogs_pkbuf_t *pkbuf);
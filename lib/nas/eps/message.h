@@ -28,8 +28,8 @@
 /*******************************************************************************
  * This file had been created by nas-message.py script v0.1.0
  * Please do not modify this file but regenerate it via script.
- * Created on: 2024-01-21 18:50:03.409367 by acetcom
- * from 24301-h90.docx
+ * Created from 24301-h90.docx
+ * (sha256: 1acc20b2dabf84bff1965c46a7d926753c0e7fde48d8126faa12e06d66167125)
  ******************************************************************************/
 
 #if !defined(OGS_NAS_INSIDE) && !defined(OGS_NAS_COMPILATION)
@@ -1645,6 +1645,20 @@ int ogs_nas_emm_decode(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf);
 int ogs_nas_esm_decode(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf);
 ogs_pkbuf_t *ogs_nas_eps_plain_encode(ogs_nas_eps_message_t *message);
 
+/*
+ * Encode the message in the tailroom of a pkbuf of the caller, past the
+ * octets it already holds, and return the number of octets encoded.
+ * The headroom is left alone for the security header. If the tailroom
+ * cannot hold the message, OGS_ERROR is returned and the pkbuf is left
+ * as it was.
+ */
+int ogs_nas_emm_encode_to(
+        ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf);
+int ogs_nas_esm_encode_to(
+        ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf);
+int ogs_nas_eps_plain_encode_to(
+        ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf);
+
 #ifdef __cplusplus
 }
 #endif
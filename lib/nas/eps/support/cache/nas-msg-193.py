@@ -1,21 +0,0 @@
-ies = []
-ies.append({ "iei" : "", "value" : "EPS QoS", "type" : "EPS quality of service", "reference" : "9.9.4.3", "presence" : "M", "format" : "LV", "length" : "2-14"})
-ies.append({ "iei" : "", "value" : "Access point name", "type" : "Access point name", "reference" : "9.9.4.1", "presence" : "M", "format" : "LV", "length" : "2-101"})
-ies.append({ "iei" : "", "value" : "PDN address", "type" : "PDN address", "reference" : "9.9.4.9", "presence" : "M", "format" : "LV", "length" : "6-14"})
-ies.append({ "iei" : "5D", "value" : "Transaction identifier", "type" : "Transaction identifier", "reference" : "9.9.4.17", "presence" : "O", "format" : "TLV", "length" : "3-4"})
-ies.append({ "iei" : "30", "value" : "Negotiated QoS", "type" : "Quality of service", "reference" : "9.9.4.12", "presence" : "O", "format" : "TLV", "length" : "14-22"})
-ies.append({ "iei" : "32", "value" : "Negotiated LLC SAPI", "type" : "LLC service access point identifier", "reference" : "9.9.4.7", "presence" : "O", "format" : "TV", "length" : "2"})
-ies.append({ "iei" : "8-", "value" : "Radio priority", "type" : "Radio priority", "reference" : "9.9.4.13", "presence" : "O", "format" : "TV", "length" : "1"})
-ies.append({ "iei" : "34", "value" : "Packet flow Identifier", "type" : "Packet flow Identifier", "reference" : "9.9.4.8", "presence" : "O", "format" : "TLV", "length" : "3"})
-ies.append({ "iei" : "5E", "value" : "APN-AMBR", "type" : "APN aggregate maximum bit rate", "reference" : "9.9.4.2", "presence" : "O", "format" : "TLV", "length" : "4-8"})
-ies.append({ "iei" : "58", "value" : "ESM cause", "type" : "ESM cause", "reference" : "9.9.4.4", "presence" : "O", "format" : "TV", "length" : "2"})
-ies.append({ "iei" : "27", "value" : "Protocol configuration options", "type" : "Protocol configuration options", "reference" : "9.9.4.11", "presence" : "O", "format" : "TLV", "length" : "3-253"})
-ies.append({ "iei" : "B-", "value" : "Connectivity type", "type" : "Connectivity type", "reference" : "9.9.4.2A", "presence" : "O", "format" : "TV", "length" : "1"})
-ies.append({ "iei" : "C-", "value" : "WLAN offload indication", "type" : "WLAN offload acceptability", "reference" : "9.9.4.18", "presence" : "O", "format" : "TV", "length" : "1"})
-ies.append({ "iei" : "33", "value" : "NBIFOM container", "type" : "NBIFOM container", "reference" : "9.9.4.19", "presence" : "O", "format" : "TLV", "length" : "3-257"})
-ies.append({ "iei" : "66", "value" : "Header compression configuration", "type" : "Header compression configuration", "reference" : "9.9.4.22", "presence" : "O", "format" : "TLV", "length" : "5-257"})
-ies.append({ "iei" : "9-", "value" : "Control plane only indication", "type" : "Control plane only indication", "reference" : "9.9.4.23", "presence" : "O", "format" : "TV", "length" : "1"})
-ies.append({ "iei" : "7B", "value" : "Extended protocol configuration options", "type" : "Extended protocol configuration options", "reference" : "9.9.4.26", "presence" : "O", "format" : "TLV-E", "length" : "4-65538"})
-ies.append({ "iei" : "6E", "value" : "Serving PLMN rate control", "type" : "Serving PLMN rate control", "reference" : "9.9.4.28", "presence" : "O", "format" : "TLV", "length" : "4"})
-ies.append({ "iei" : "5F", "value" : "Extended APN-AMBR", "type" : "Extended APN aggregate maximum bit rate", "reference" : "9.9.4.29", "presence" : "O", "format" : "TLV", "length" : "8"})
-msg_list[key]["ies"] = ies
@@ -1,3 +0,0 @@
-ies = []
-ies.append({ "iei" : "", "value" : "ESM cause", "type" : "ESM cause", "reference" : "9.9.4.4", "presence" : "M", "format" : "V", "length" : "1"})
-msg_list[key]["ies"] = ies
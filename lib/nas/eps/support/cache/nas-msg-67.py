@@ -1,3 +0,0 @@
-ies = []
-ies.append({ "iei" : "", "value" : "ESM message container", "type" : "ESM message container", "reference" : "9.9.3.15", "presence" : "M", "format" : "LV-E", "length" : "5-n"})
-msg_list[key]["ies"] = ies
@@ -1,3 +0,0 @@
-ies = []
-ies.append({ "iei" : "", "value" : "Authentication response parameter", "type" : "Authentication response parameter", "reference" : "9.9.3.4", "presence" : "M", "format" : "LV", "length" : "5-17"})
-msg_list[key]["ies"] = ies
@@ -1,3 +0,0 @@
-ies = []
-ies.append({ "iei" : "", "value" : "Identity type", "type" : "Identity type 2", "reference" : "9.9.3.17", "presence" : "M", "format" : "V", "length" : "1/2"})
-msg_list[key]["ies"] = ies
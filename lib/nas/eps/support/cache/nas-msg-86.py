@@ -1,3 +0,0 @@
-ies = []
-ies.append({ "iei" : "", "value" : "Mobile identity", "type" : "Mobile identity", "reference" : "9.9.2.3", "presence" : "M", "format" : "LV", "length" : "4-10"})
-msg_list[key]["ies"] = ies
@@ -1,3 +0,0 @@
-ies = []
-ies.append({ "iei" : "", "value" : "EMM cause", "type" : "EMM cause", "reference" : "9.9.3.9", "presence" : "M", "format" : "V", "length" : "1"})
-msg_list[key]["ies"] = ies
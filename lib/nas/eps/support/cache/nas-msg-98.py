@@ -1,3 +0,0 @@
-ies = []
-ies.append({ "iei" : "", "value" : "NAS message container", "type" : "EPS message container", "reference" : "9.9.3.22", "presence" : "M", "format" : "LV", "length" : "3-252"})
-msg_list[key]["ies"] = ies
@@ -23,11 +23,14 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
 # WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
-from docx import Document
 import re, os, sys, string
-import datetime
 import getopt
-import getpass
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+    '..', '..', '..', 'core', 'support'))
+from ogsgen import SpecIndex, Cache, Output, source_sha256, stamp, \
+    write_bench_prologue, write_bench_nas, write_bench_octets, \
+    write_bench_main, nas_ie_octets, Corpus, VARIANTS, memoize, Profile
 
 version = "0.1.0"
 
@@ -38,7 +41,14 @@ verbosity = 0
 filename = ""
 outdir = './'
 cachedir = './cache/'
-currentdir = './'
+cache_ro = []
+reproducible = False
+depfile = None
+bench = None
+corpus = None
+profiling = False
+pstats = None
+currentdir = os.path.dirname(os.path.abspath(__file__)) + '/'
 
 FAIL = '\033[91m'
 INFO = '\033[93m'
@@ -60,7 +70,6 @@ def write_file(f, string):
     d_print(string)
 
 def output_header_to_file(f):
-    now = datetime.datetime.now()
     f.write("""/*
  * The MIT License
  *
@@ -92,7 +101,7 @@ def output_header_to_file(f):
     f.write("/*******************************************************************************\n")
     f.write(" * This file had been created by nas-message.py script v%s\n" % (version))
     f.write(" * Please do not modify this file but regenerate it via script.\n")
-    f.write(" * Created on: %s by %s\n * from %s\n" % (str(now), getpass.getuser(), filename))
+    f.write(stamp(filename, reproducible))
     f.write(" ******************************************************************************/\n\n")
 
 def usage():
@@ -103,39 +112,73 @@ def usage():
     print("-f [file] Input file to parse")
     print("-o [dir]  Output files to given directory")
     print("-c [dir]  Cache files to given directory")
+    print("-C [dir]  Also read cache files from dir, never writing there")
+    print("-r        Reproducible output (no date and user in headers)")
+    print("-M [file] Write the files read to a Makefile depfile")
+    print("-B [file] Write a C program benchmarking the codec of each message")
+    print("-F [file] Write a seed corpus of the messages for the fuzzers (.zip)")
+    print("-t        Report the time and peak memory of each phase")
+    print("-T [file] Write a cProfile of the run to file (pstats)")
     print("-h        Print this help and return")
 
+@memoize
 def v_upper(v):
     return re.sub('_TO_UE', '', re.sub('_FROM_UE', '', re.sub('3GPP', '', re.sub('\'', '_', re.sub('/', '_', re.sub('-', '_', re.sub(' ', '_', v)))).upper())))
 
+@memoize
 def v_lower(v):
     return re.sub('3gpp', '', re.sub('\'', '_', re.sub('/', '_', re.sub('-', '_', re.sub(' ', '_', v)))).lower())
 
 def get_cells(cells):
-    iei = cells[0].text
-    value = cells[1].text.encode('ascii', 'ignore').decode('utf-8')
+    iei = cells[0]
+    value = cells[1].encode('ascii', 'ignore').decode('utf-8')
     value = re.sub("\s*$", "", re.sub("\s*\n*\s*\([^\)]*\)*", "", re.sub("\"|'s", "", value)))
-    type = re.sub("^NAS ", "", re.sub("'s", "", re.sub('\s*\n\s*[a-zA-Z0-9.]*', '', cells[2].text)))
+    type = re.sub("^NAS ", "", re.sub("'s", "", re.sub('\s*\n\s*[a-zA-Z0-9.]*', '', cells[2])))
     if type == "message container":
         type = "EPS message container"
-    reference = re.sub('[a-zA-Z0-9\'\-\s]*\n\s*', '', cells[2].text)
-    presence = cells[3].text
-    format = cells[4].text
-    length = cells[5].text
+    reference = re.sub('[a-zA-Z0-9\'\-\s]*\n\s*', '', cells[2])
+    presence = cells[3]
+    format = cells[4]
+    length = cells[5]
 
     return { "iei" : iei, "value" : value, "type" : type, "reference" : reference, "presence" : presence, "format" : format, "length" : length }
 
-def write_cells_to_file(name, cells):
-    write_file(f, name + ".append({ \"iei\" : \"" + cells["iei"] + \
-        "\", \"value\" : \"" + cells["value"] + \
-        "\", \"type\" : \"" + cells["type"] + \
-        "\", \"reference\" : \"" + cells["reference"] + \
-        "\", \"presence\" : \"" + cells["presence"] + \
-        "\", \"format\" : \"" + cells["format"] + \
-        "\", \"length\" : \"" + cells["length"] + "\"})\n")
+def extract_msg_ies(table):
+    tables = [{ "index" : table }]
+
+    ies = []
+    table = spec.table(table)
+
+    start_row = 0
+    for start_row, row in enumerate(table):
+        cells = get_cells(row);
+        if cells["type"].find('Message type') != -1:
+            break
+        if cells["type"].find('KSI and sequence number') != -1:
+            start_row -= 1
+            break
+
+    assert start_row <= 4, "Can't find message type"
+
+    half_length = True;
+    for row in table[start_row+1:]:
+        cells = get_cells(row)
+        if cells is None:
+            continue
+
+        if cells["length"] == "1/2":
+            if half_length is True:
+                half_length = False;
+            else:
+                half_length = True;
+                continue;
+
+        ies.append(cells)
+
+    return ies, tables
 
 try:
-    opts, args = getopt.getopt(sys.argv[1:], "df:ho:c:", ["debug", "file", "help", "output", "cache"])
+    opts, args = getopt.getopt(sys.argv[1:], "df:hro:c:C:M:B:F:tT:", ["debug", "file=", "help", "output=", "cache=", "readonly-cache=", "reproducible", "depfile=", "bench=", "corpus=", "profile", "pstats="])
 except getopt.GetoptError as err:
     # print help information and exit:
     usage()
@@ -151,13 +194,44 @@ for o, a in opts:
         if outdir.rfind('/') != len(outdir):
             outdir += '/'
     if o in ("-c", "--cache"):
-        cache = a
+        cachedir = a
         if cachedir.rfind('/') != len(cachedir):
             cachedir += '/'
+    if o in ("-C", "--readonly-cache"):
+        cache_ro.append(a)
+    if o in ("-r", "--reproducible"):
+        reproducible = True
+    if o in ("-M", "--depfile"):
+        depfile = a
+    if o in ("-B", "--bench"):
+        bench = a
+    if o in ("-F", "--corpus"):
+        corpus = a
+    if o in ("-t", "--profile"):
+        profiling = True
+    if o in ("-T", "--pstats"):
+        pstats = a
     if o in ("-h", "--help"):
         usage()
         sys.exit(2)
 
+if os.path.isfile(filename) and os.access(filename, os.R_OK):
+    file = open(filename, 'r')
+else:
+    d_error("Cannot find file : " + filename)
+
+spec = SpecIndex(filename)
+
+cache = Cache(cachedir, filename, "nas-message.py v%s" % version,
+        source_sha256(get_cells, extract_msg_ies),
+        readonly=cache_ro)
+
+profile = Profile(profiling, pstats)
+spec.load = profile.wrap('docx', spec.load)
+cache.load = profile.wrap('cache', cache.load)
+cache.store = profile.wrap('cache', cache.store)
+get_cells = profile.wrap('get_cells', get_cells)
+
 # Message Type List
 msg_list["ATTACH REQUEST"] = { "type" : "65" }
 msg_list["ATTACH ACCEPT"]= { "type" : "66" }
@@ -277,49 +351,9 @@ for key in msg_list.keys():
         continue;
 
     d_info("[" + key + "]")
-    cachefile = cachedir + "nas-msg-" + msg_list[key]["type"] + ".py"
-    if os.path.isfile(cachefile) and os.access(cachefile, os.R_OK):
-        exec(open(cachefile).read())
-        print("Read from " + cachefile)
-    else:
-        document = Document(filename)
-        f = open(cachefile, 'w') 
-
-        ies = []
-        write_file(f, "ies = []\n")
-        table = document.tables[msg_list[key]["table"]]
-
-        start_row = 0
-        for start_row, row in enumerate(table.rows):
-            cells = get_cells(row.cells);
-            if cells["type"].find('Message type') != -1:
-                break
-            if cells["type"].find('KSI and sequence number') != -1:
-                start_row -= 1
-                break
-
-        assert start_row <= 4, "Can't find message type"
-
-        half_length = True;
-        for row in table.rows[start_row+1:]:
-            cells = get_cells(row.cells)
-            if cells is None:
-                continue
-
-            if cells["length"] == "1/2":
-                if half_length is True:
-                    half_length = False;
-                else:
-                    half_length = True;
-                    continue;
-
-            ies.append(cells)
-            write_cells_to_file("ies", cells)
-
-        msg_list[key]["ies"] = ies
-        write_file(f, "msg_list[key][\"ies\"] = ies\n")
-
-        f.close()
+    msg_list[key]["ies"] = cache.fetch(
+            "nas-msg-" + msg_list[key]["type"], extract_msg_ies,
+            table=msg_list[key]["table"])
 
 
 tmp = [(k, v["type"]) for k, v in msg_list.items()]
@@ -341,13 +375,18 @@ for (k, v) in sorted_msg_list:
 d_info("[Type List]")
 typefile = currentdir + "type-list.py"
 if os.path.isfile(typefile) and os.access(typefile, os.R_OK):
+    profile.enter('cache')
     exec(open(typefile).read())
     print("Read from " + typefile)
+    profile.enter('extract')
 
 tmp = [(k, v["reference"]) for k, v in type_list.items()]
 sorted_type_list = sorted(tmp, key=lambda tup: tup[1])
 
-f = open(outdir + 'ies.h', 'w')
+profile.enter('emit')
+output = Output()
+
+f = output.open(outdir + 'ies.h')
 output_header_to_file(f)
 f.write("""#if !defined(OGS_NAS_INSIDE) && !defined(OGS_NAS_COMPILATION)
 #error "This header cannot be included directly."
@@ -364,6 +403,10 @@ int ogs_nas_eps_encode_optional_type(ogs_pkbuf_t *pkbuf, uint8_t type);
 
 """)
 
+for (k, v) in sorted_type_list:
+    f.write("int ogs_nas_eps_read_%s(ogs_nas_%s_t *%s, unsigned char *data, int len);\n" % (v_lower(k), v_lower(k), v_lower(k)))
+f.write("\n")
+
 for (k, v) in sorted_type_list:
     f.write("int ogs_nas_eps_decode_%s(ogs_nas_%s_t *%s, ogs_pkbuf_t *pkbuf);\n" % (v_lower(k), v_lower(k), v_lower(k)))
 f.write("\n")
@@ -382,7 +425,19 @@ f.write("""#ifdef __cplusplus
 """)
 f.close()
 
-f = open(outdir + 'ies.c', 'w')
+# ogs_nas_eps_decode_<type>(), pulling from the pkbuf what
+# ogs_nas_eps_read_<type>() took
+def write_decode(f, k):
+    f.write("int ogs_nas_eps_decode_%s(ogs_nas_%s_t *%s, ogs_pkbuf_t *pkbuf)\n" % (v_lower(k), v_lower(k), v_lower(k)))
+    f.write("{\n")
+    f.write("    int size = ogs_nas_eps_read_%s(%s, pkbuf->data, pkbuf->len);\n\n" % (v_lower(k), v_lower(k)))
+    f.write("    if (size < 0)\n")
+    f.write("        return size;\n\n")
+    f.write("    ogs_assert(ogs_pkbuf_pull(pkbuf, size));\n\n")
+    f.write("    return size;\n")
+    f.write("}\n\n")
+
+f = output.open(outdir + 'ies.c')
 output_header_to_file(f)
 f.write("""#include "ogs-nas-eps.h"
 
@@ -390,7 +445,10 @@ int ogs_nas_eps_encode_optional_type(ogs_pkbuf_t *pkbuf, uint8_t type)
 {
     int size = sizeof(uint8_t);
 
-    ogs_assert(ogs_pkbuf_pull(pkbuf, size));
+    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
+       ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
+       return -1;
+    }
     memcpy(pkbuf->data - size, &type, size);
 
     return size;
@@ -402,45 +460,47 @@ for (k, v) in sorted_type_list:
     f.write("/* %s %s\n" % (type_list[k]["reference"], k))
     f.write(" * %s %s %s */\n" % (type_list[k]["presence"], type_list[k]["format"], type_list[k]["length"]))
     if (type_list[k]["format"] == "TV" or type_list[k]["format"] == "T") and type_list[k]["length"] == "1":
-        f.write("int ogs_nas_eps_decode_%s(ogs_nas_%s_t *%s, ogs_pkbuf_t *pkbuf)\n" % (v_lower(k), v_lower(k), v_lower(k)))
+        f.write("int ogs_nas_eps_read_%s(ogs_nas_%s_t *%s, unsigned char *data, int len)\n" % (v_lower(k), v_lower(k), v_lower(k)))
         f.write("{\n")
         f.write("    int size = sizeof(ogs_nas_%s_t);\n\n" % v_lower(k))
-        f.write("    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {\n")
-        f.write("       ogs_error(\"ogs_pkbuf_pull() failed [size:%d]\", (int)size);\n")
+        f.write("    if (len < size) {\n")
+        f.write("       ogs_error(\"Not enough data [size:%d len:%d]\", (int)size, len);\n")
         f.write("       return -1;\n")
         f.write("    }\n\n")
-        f.write("    memcpy(%s, pkbuf->data - size, size);\n\n" % v_lower(k))
-        f.write("    ogs_trace(\"  %s - \");\n" % v_upper(k))
-        f.write("    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);\n\n");
+        f.write("    memcpy(%s, data, size);\n\n" % v_lower(k))
+        f.write("    ogs_nas_trace_ie(\"%s\", data, size);\n\n" % v_upper(k))
         f.write("    return size;\n")
         f.write("}\n\n")
+        write_decode(f, k)
         f.write("int ogs_nas_eps_encode_%s(ogs_pkbuf_t *pkbuf, ogs_nas_%s_t *%s)\n" % (v_lower(k), v_lower(k), v_lower(k)))
         f.write("{\n")
         f.write("    int size = sizeof(ogs_nas_%s_t);\n\n" % v_lower(k))
-        f.write("    ogs_assert(ogs_pkbuf_pull(pkbuf, size));\n")
+        f.write("    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {\n")
+        f.write("       ogs_error(\"ogs_pkbuf_pull() failed [size:%d]\", (int)size);\n")
+        f.write("       return -1;\n")
+        f.write("    }\n")
         f.write("    memcpy(pkbuf->data - size, %s, size);\n\n" % v_lower(k))
-        f.write("    ogs_trace(\"  %s - \");\n" % v_upper(k))
-        f.write("    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);\n\n");
+        f.write("    ogs_nas_trace_ie(\"%s\", pkbuf->data - size, size);\n\n" % v_upper(k))
         f.write("    return size;\n")
         f.write("}\n\n")
     elif type_list[k]["format"] == "TV" or type_list[k]["format"] == "V":
-        f.write("int ogs_nas_eps_decode_%s(ogs_nas_%s_t *%s, ogs_pkbuf_t *pkbuf)\n" % (v_lower(k), v_lower(k), v_lower(k)))
+        f.write("int ogs_nas_eps_read_%s(ogs_nas_%s_t *%s, unsigned char *data, int len)\n" % (v_lower(k), v_lower(k), v_lower(k)))
         f.write("{\n")
         if type_list[k]["length"] == "4":
             f.write("    int size = 3;\n\n")
         else:
             f.write("    int size = sizeof(ogs_nas_%s_t);\n\n" % v_lower(k))
-        f.write("    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {\n")
-        f.write("       ogs_error(\"ogs_pkbuf_pull() failed [size:%d]\", (int)size);\n")
+        f.write("    if (len < size) {\n")
+        f.write("       ogs_error(\"Not enough data [size:%d len:%d]\", (int)size, len);\n")
         f.write("       return -1;\n")
         f.write("    }\n\n")
-        f.write("    memcpy(%s, pkbuf->data - size, size);\n\n" % v_lower(k))
+        f.write("    memcpy(%s, data, size);\n\n" % v_lower(k))
         if "decode" in type_list[k]:
             f.write("%s" % type_list[k]["decode"])
-        f.write("    ogs_trace(\"  %s - \");\n" % v_upper(k))
-        f.write("    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);\n\n");
+        f.write("    ogs_nas_trace_ie(\"%s\", data, size);\n\n" % v_upper(k))
         f.write("    return size;\n")
         f.write("}\n\n")
+        write_decode(f, k)
         f.write("int ogs_nas_eps_encode_%s(ogs_pkbuf_t *pkbuf, ogs_nas_%s_t *%s)\n" % (v_lower(k), v_lower(k), v_lower(k)))
         f.write("{\n")
         if type_list[k]["length"] == "4":
@@ -451,33 +511,35 @@ for (k, v) in sorted_type_list:
         f.write("    memcpy(&target, %s, size);\n" % v_lower(k))
         if "encode" in type_list[k]:
             f.write("%s" % type_list[k]["encode"])
-        f.write("    ogs_assert(ogs_pkbuf_pull(pkbuf, size));\n")
+        f.write("    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {\n")
+        f.write("       ogs_error(\"ogs_pkbuf_pull() failed [size:%d]\", (int)size);\n")
+        f.write("       return -1;\n")
+        f.write("    }\n")
         f.write("    memcpy(pkbuf->data - size, &target, size);\n\n")
-        f.write("    ogs_trace(\"  %s - \");\n" % v_upper(k))
-        f.write("    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);\n\n");
+        f.write("    ogs_nas_trace_ie(\"%s\", pkbuf->data - size, size);\n\n" % v_upper(k))
         f.write("    return size;\n")
         f.write("}\n\n")
     elif type_list[k]["format"] == "LV-E" or type_list[k]["format"] == "TLV-E":
-        f.write("int ogs_nas_eps_decode_%s(ogs_nas_%s_t *%s, ogs_pkbuf_t *pkbuf)\n" % (v_lower(k), v_lower(k), v_lower(k)))
+        f.write("int ogs_nas_eps_read_%s(ogs_nas_%s_t *%s, unsigned char *data, int len)\n" % (v_lower(k), v_lower(k), v_lower(k)))
         f.write("{\n")
         f.write("    int size = 0;\n")
         f.write("    ogs_nas_%s_t *source = NULL;\n\n" % v_lower(k))
-        f.write("    if (pkbuf->len < 2) {\n")
-        f.write("       ogs_error(\"Not enough pkbuf [len:%d]\", pkbuf->len);\n")
+        f.write("    if (len < 2) {\n")
+        f.write("       ogs_error(\"Not enough data [len:%d]\", len);\n")
         f.write("       return -1;\n")
         f.write("    }\n\n")
-        f.write("    source = (ogs_nas_%s_t *)pkbuf->data;\n\n" % v_lower(k))
+        f.write("    source = (ogs_nas_%s_t *)data;\n\n" % v_lower(k))
         f.write("    %s->length = be16toh(source->length);\n" % v_lower(k))
         f.write("    size = %s->length + sizeof(%s->length);\n\n" % (v_lower(k), v_lower(k)))
-        f.write("    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {\n")
-        f.write("       ogs_error(\"ogs_pkbuf_pull() failed [size:%d]\", (int)size);\n")
+        f.write("    if (len < size) {\n")
+        f.write("       ogs_error(\"Not enough data [size:%d len:%d]\", (int)size, len);\n")
         f.write("       return -1;\n")
         f.write("    }\n\n")
-        f.write("    %s->buffer = pkbuf->data - size + sizeof(%s->length);\n\n" % (v_lower(k), v_lower(k)))
-        f.write("    ogs_trace(\"  %s - \");\n" % v_upper(k))
-        f.write("    ogs_log_hexdump(OGS_LOG_TRACE, (void*)%s->buffer, %s->length);\n\n" % (v_lower(k), v_lower(k)));
+        f.write("    %s->buffer = data + sizeof(%s->length);\n\n" % (v_lower(k), v_lower(k)))
+        f.write("    ogs_nas_trace_ie(\"%s\", %s->buffer, %s->length);\n\n" % (v_upper(k), v_lower(k), v_lower(k)))
         f.write("    return size;\n")
         f.write("}\n\n")
+        write_decode(f, k)
         f.write("int ogs_nas_eps_encode_%s(ogs_pkbuf_t *pkbuf, ogs_nas_%s_t *%s)\n" % (v_lower(k), v_lower(k), v_lower(k)))
         f.write("{\n")
         f.write("    int size = 0;\n")
@@ -485,40 +547,45 @@ for (k, v) in sorted_type_list:
         f.write("    ogs_assert(%s);\n" % v_lower(k))
         f.write("    ogs_assert(%s->buffer);\n\n" % v_lower(k))
         f.write("    size = sizeof(%s->length);\n" % v_lower(k))
-        f.write("    ogs_assert(ogs_pkbuf_pull(pkbuf, size));\n")
+        f.write("    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {\n")
+        f.write("       ogs_error(\"ogs_pkbuf_pull() failed [size:%d]\", (int)size);\n")
+        f.write("       return -1;\n")
+        f.write("    }\n")
         f.write("    target = htobe16(%s->length);\n" % v_lower(k))
         f.write("    memcpy(pkbuf->data - size, &target, size);\n\n")
         f.write("    size = %s->length;\n" % v_lower(k))
-        f.write("    ogs_assert(ogs_pkbuf_pull(pkbuf, size));\n")
+        f.write("    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {\n")
+        f.write("       ogs_error(\"ogs_pkbuf_pull() failed [size:%d]\", (int)size);\n")
+        f.write("       return -1;\n")
+        f.write("    }\n")
         f.write("    memcpy(pkbuf->data - size, %s->buffer, size);\n\n" % v_lower(k))
-        f.write("    ogs_trace(\"  %s - \");\n" % v_upper(k))
-        f.write("    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);\n\n");
+        f.write("    ogs_nas_trace_ie(\"%s\", pkbuf->data - size, size);\n\n" % v_upper(k))
         f.write("    return %s->length + sizeof(%s->length);\n" % (v_lower(k), v_lower(k)))
         f.write("}\n\n");
     else:
-        f.write("int ogs_nas_eps_decode_%s(ogs_nas_%s_t *%s, ogs_pkbuf_t *pkbuf)\n" % (v_lower(k), v_lower(k), v_lower(k)))
+        f.write("int ogs_nas_eps_read_%s(ogs_nas_%s_t *%s, unsigned char *data, int len)\n" % (v_lower(k), v_lower(k), v_lower(k)))
         f.write("{\n")
         f.write("    int size = 0;\n")
         f.write("    ogs_nas_%s_t *source = NULL;\n\n" % v_lower(k))
-        f.write("    if (pkbuf->len < 1) {\n")
-        f.write("       ogs_error(\"Not enough pkbuf [len:%d]\", pkbuf->len);\n")
+        f.write("    if (len < 1) {\n")
+        f.write("       ogs_error(\"Not enough data [len:%d]\", len);\n")
         f.write("       return -1;\n")
         f.write("    }\n\n")
-        f.write("    source = (ogs_nas_%s_t *)pkbuf->data;\n\n" % v_lower(k))
+        f.write("    source = (ogs_nas_%s_t *)data;\n\n" % v_lower(k))
         f.write("    %s->length = source->length;\n" % v_lower(k))
         f.write("    size = %s->length + sizeof(%s->length);\n\n" % (v_lower(k), v_lower(k)))
-        f.write("    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {\n")
-        f.write("       ogs_error(\"ogs_pkbuf_pull() failed [size:%d]\", (int)size);\n")
+        f.write("    if (len < size) {\n")
+        f.write("       ogs_error(\"Not enough data [size:%d len:%d]\", (int)size, len);\n")
         f.write("       return -1;\n")
         f.write("    }\n\n")
         f.write("    if (sizeof(*%s) < size) return -1;\n" % v_lower(k))
-        f.write("    memcpy(%s, pkbuf->data - size, size);\n\n" % v_lower(k))
+        f.write("    memcpy(%s, data, size);\n\n" % v_lower(k))
         if "decode" in type_list[k]:
             f.write("%s" % type_list[k]["decode"])
-        f.write("    ogs_trace(\"  %s - \");\n" % v_upper(k))
-        f.write("    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);\n\n");
+        f.write("    ogs_nas_trace_ie(\"%s\", data, size);\n\n" % v_upper(k))
         f.write("    return size;\n")
         f.write("}\n\n")
+        write_decode(f, k)
         f.write("int ogs_nas_eps_encode_%s(ogs_pkbuf_t *pkbuf, ogs_nas_%s_t *%s)\n" % (v_lower(k), v_lower(k), v_lower(k)))
         f.write("{\n")
         f.write("    int size = %s->length + sizeof(%s->length);\n" % (v_lower(k), v_lower(k)))
@@ -526,15 +593,17 @@ for (k, v) in sorted_type_list:
         f.write("    memcpy(&target, %s, sizeof(ogs_nas_%s_t));\n" % (v_lower(k), v_lower(k)))
         if "encode" in type_list[k]:
             f.write("%s" % type_list[k]["encode"])
-        f.write("    ogs_assert(ogs_pkbuf_pull(pkbuf, size));\n")
+        f.write("    if (ogs_pkbuf_pull(pkbuf, size) == NULL) {\n")
+        f.write("       ogs_error(\"ogs_pkbuf_pull() failed [size:%d]\", (int)size);\n")
+        f.write("       return -1;\n")
+        f.write("    }\n")
         f.write("    memcpy(pkbuf->data - size, &target, size);\n\n")
-        f.write("    ogs_trace(\"  %s - \");\n" % v_upper(k))
-        f.write("    ogs_log_hexdump(OGS_LOG_TRACE, pkbuf->data - size, size);\n\n");
+        f.write("    ogs_nas_trace_ie(\"%s\", pkbuf->data - size, size);\n\n" % v_upper(k))
         f.write("    return size;\n")
         f.write("}\n\n");
 f.close()
 
-f = open(outdir + 'message.h', 'w')
+f = output.open(outdir + 'message.h')
 output_header_to_file(f)
 f.write("""#if !defined(OGS_NAS_INSIDE) && !defined(OGS_NAS_COMPILATION)
 #error "This header cannot be included directly."
@@ -659,6 +728,20 @@ int ogs_nas_emm_decode(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf);
 int ogs_nas_esm_decode(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf);
 ogs_pkbuf_t *ogs_nas_eps_plain_encode(ogs_nas_eps_message_t *message);
 
+/*
+ * Encode the message in the tailroom of a pkbuf of the caller, past the
+ * octets it already holds, and return the number of octets encoded.
+ * The headroom is left alone for the security header. If the tailroom
+ * cannot hold the message, OGS_ERROR is returned and the pkbuf is left
+ * as it was.
+ */
+int ogs_nas_emm_encode_to(
+        ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf);
+int ogs_nas_esm_encode_to(
+        ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf);
+int ogs_nas_eps_plain_encode_to(
+        ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf);
+
 #ifdef __cplusplus
 }
 #endif
@@ -670,7 +753,7 @@ f.close()
 
 
 
-f = open(outdir + 'decoder.c', 'w')
+f = output.open(outdir + 'decoder.c')
 output_header_to_file(f)
 f.write("""#include "ogs-nas-eps.h"
 
@@ -694,14 +777,16 @@ for (k, v) in sorted_msg_list:
         f.write("    ogs_nas_eps_%s_t *%s = &message->emm.%s;\n" % (v_lower(k), v_lower(k), v_lower(k)))
     else:
         f.write("    ogs_nas_eps_%s_t *%s = &message->esm.%s;\n" % (v_lower(k), v_lower(k), v_lower(k)))
+    f.write("    unsigned char *data = pkbuf->data;\n")
+    f.write("    int len = pkbuf->len;\n")
     f.write("    int decoded = 0;\n")
     f.write("    int size = 0;\n\n")
     f.write("    ogs_trace(\"[NAS] Decode %s\\n\");\n\n" % v_upper(k))
 
     for ie in [ies for ies in msg_list[k]["ies"] if ies["presence"] == "M"]:
-        f.write("    size = ogs_nas_eps_decode_%s(&%s->%s, pkbuf);\n" % (v_lower(ie["type"]), v_lower(k), v_lower(ie["value"])))
+        f.write("    size = ogs_nas_eps_read_%s(&%s->%s, data + decoded, len - decoded);\n" % (v_lower(ie["type"]), v_lower(k), v_lower(ie["value"])))
         f.write("    if (size < 0) {\n")
-        f.write("        ogs_error(\"ogs_nas_eps_decode_%s() failed\");\n" % v_lower(ie["type"]))
+        f.write("        ogs_error(\"ogs_nas_eps_read_%s() failed\");\n" % v_lower(ie["type"]))
         f.write("        return size;\n")
         f.write("    }\n\n")
         f.write("    decoded += size;\n\n")
@@ -709,28 +794,21 @@ for (k, v) in sorted_msg_list:
     optional_fields = False;
     for ie in [ies for ies in msg_list[k]["ies"] if ies["presence"] != "M"]:
         if optional_fields is False:
-            f.write("""    while (pkbuf->len > 0) {
-        uint8_t *buffer = pkbuf->data;
+            f.write("""    while (decoded < len) {
+        uint8_t *buffer = data + decoded;
         uint8_t type = (*buffer) >= 0x80 ? ((*buffer) & 0xf0) : (*buffer);
 
-        size = sizeof(uint8_t);
-        if (ogs_pkbuf_pull(pkbuf, size) == NULL) {
-           ogs_error("ogs_pkbuf_pull() failed [size:%d]", (int)size);
-           return OGS_ERROR;
-        }
-        decoded += size;
-
         switch (type) {
 """)
             optional_fields = True;
 
         f.write("        case OGS_NAS_EPS_%s_%s_TYPE:\n" % (v_upper(k), v_upper(ie["value"])))
-        if (ie["format"] == "TV" or ie["format"] == "T") and ie["length"] == "1":
-            f.write("            decoded--;\n")
-            f.write("            ogs_assert(ogs_pkbuf_push(pkbuf, 1));\n")
-        f.write("            size = ogs_nas_eps_decode_%s(&%s->%s, pkbuf);\n" % (v_lower(ie["type"]), v_lower(k), v_lower(ie["value"])))
+        # The IEI of a type 1 IE is the upper half of its value
+        if not ((ie["format"] == "TV" or ie["format"] == "T") and ie["length"] == "1"):
+            f.write("            decoded++;\n")
+        f.write("            size = ogs_nas_eps_read_%s(&%s->%s, data + decoded, len - decoded);\n" % (v_lower(ie["type"]), v_lower(k), v_lower(ie["value"])))
         f.write("            if (size < 0) {\n")
-        f.write("               ogs_error(\"ogs_nas_eps_decode_%s() failed\");\n" % v_lower(ie["type"]))
+        f.write("               ogs_error(\"ogs_nas_eps_read_%s() failed\");\n" % v_lower(ie["type"]))
         f.write("               return size;\n")
         f.write("            }\n\n")
         f.write("            %s->presencemask |= OGS_NAS_EPS_%s_%s_PRESENT;\n" % (v_lower(k), v_upper(k), v_upper(ie["value"])))
@@ -740,12 +818,15 @@ for (k, v) in sorted_msg_list:
     if [ies for ies in msg_list[k]["ies"] if ies["presence"] != "M"]:
         f.write("""        default:
             ogs_warn("Unknown type(0x%x) or not implemented\\n", type);
+            decoded++;
             break;
         }
     }
 
 """)
-    f.write("""    return decoded;
+    f.write("""    ogs_assert(ogs_pkbuf_pull(pkbuf, decoded));
+
+    return decoded;
 }
 
 """)
@@ -857,7 +938,7 @@ f.write("""    default:
 
 f.close()
 
-f = open(outdir + 'encoder.c', 'w')
+f = output.open(outdir + 'encoder.c')
 output_header_to_file(f)
 f.write("""#include "ogs-nas-eps.h"
 
@@ -887,7 +968,10 @@ for (k, v) in sorted_msg_list:
 
     for ie in [ies for ies in msg_list[k]["ies"] if ies["presence"] == "M"]:
         f.write("    size = ogs_nas_eps_encode_%s(pkbuf, &%s->%s);\n" % (v_lower(ie["type"]), v_lower(k), v_lower(ie["value"])))
-        f.write("    ogs_assert(size >= 0);\n")
+        f.write("    if (size < 0) {\n")
+        f.write("        ogs_error(\"ogs_nas_eps_encode_%s() failed\");\n" % v_lower(ie["type"]))
+        f.write("        return size;\n")
+        f.write("    }\n")
         f.write("    encoded += size;\n\n")
 
     for ie in [ies for ies in msg_list[k]["ies"] if ies["presence"] != "M"]:
@@ -898,10 +982,16 @@ for (k, v) in sorted_msg_list:
             f.write("        %s->%s.type = OGS_NAS_EPS_%s_%s_TYPE;\n\n" % (get_value(k), get_value(ie["value"]), v_upper(k), v_upper(ie["value"])))
         else:
             f.write("        size = ogs_nas_eps_encode_optional_type(pkbuf, OGS_NAS_EPS_%s_%s_TYPE);\n" % (v_upper(k), v_upper(ie["value"])))
-            f.write("        ogs_assert(size >= 0);\n")
+            f.write("        if (size < 0) {\n")
+            f.write("            ogs_error(\"ogs_nas_eps_encode_optional_type() failed\");\n")
+            f.write("            return size;\n")
+            f.write("        }\n")
             f.write("        encoded += size;\n\n")
         f.write("        size = ogs_nas_eps_encode_%s(pkbuf, &%s->%s);\n" % (v_lower(ie["type"]), v_lower(k), v_lower(ie["value"])))
-        f.write("        ogs_assert(size >= 0);\n")
+        f.write("        if (size < 0) {\n")
+        f.write("            ogs_error(\"ogs_nas_eps_encode_%s() failed\");\n" % v_lower(ie["type"]))
+        f.write("            return size;\n")
+        f.write("        }\n")
         f.write("        encoded += size;\n")
         f.write("    }\n\n")
 
@@ -911,23 +1001,27 @@ for (k, v) in sorted_msg_list:
 """)
 
 
-f.write("""ogs_pkbuf_t *ogs_nas_emm_encode(ogs_nas_eps_message_t *message)
+f.write("""int ogs_nas_emm_encode_to(
+        ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
 {
-    ogs_pkbuf_t *pkbuf = NULL;
     int size = 0;
     int encoded = 0;
+    int len = 0;
+    int headroom = 0;
 
     ogs_assert(message);
+    ogs_assert(pkbuf);
 
-    /* The Packet Buffer(ogs_pkbuf_t) for NAS message MUST make a HEADROOM.
-     * When calculating AES_CMAC, we need to use the headroom of the packet. */
-    pkbuf = ogs_pkbuf_alloc(NULL, OGS_MAX_SDU_LEN);
-    if (!pkbuf) {
-        ogs_error("ogs_pkbuf_alloc() failed");
-        return NULL;
+    if (ogs_pkbuf_tailroom(pkbuf) < sizeof(ogs_nas_emm_header_t)) {
+        ogs_error("Not enough tailroom [%d]", ogs_pkbuf_tailroom(pkbuf));
+        return OGS_ERROR;
     }
-    ogs_pkbuf_reserve(pkbuf, OGS_NAS_HEADROOM);
-    ogs_pkbuf_put(pkbuf, OGS_MAX_SDU_LEN-OGS_NAS_HEADROOM);
+
+    /* The message follows the octets already in the pkbuf */
+    len = pkbuf->len;
+    headroom = ogs_pkbuf_headroom(pkbuf);
+    ogs_pkbuf_put(pkbuf, ogs_pkbuf_tailroom(pkbuf));
+    ogs_assert(ogs_pkbuf_pull(pkbuf, len));
 
     size = sizeof(ogs_nas_emm_header_t);
     ogs_assert(ogs_pkbuf_pull(pkbuf, size));
@@ -940,9 +1034,6 @@ f.write("""ogs_pkbuf_t *ogs_nas_emm_encode(ogs_nas_eps_message_t *message)
         ogs_assert(ogs_pkbuf_push(pkbuf, 1));
         encoded -= 1;
         size = ogs_nas_eps_encode_service_request(pkbuf, message);
-        ogs_assert(size >= 0);
-        encoded += size;
-
         goto out;
     }
 
@@ -956,32 +1047,38 @@ for (k, v) in sorted_msg_list:
         f.write("    case OGS_NAS_EPS_%s:\n" % v_upper(k))
         if len(msg_list[k]["ies"]) != 0:
             f.write("        size = ogs_nas_eps_encode_%s(pkbuf, message);\n" % v_lower(k))
-            f.write("        ogs_assert(size >= 0);\n")
-            f.write("        encoded += size;\n")
+        else:
+            f.write("        size = 0;\n")
         f.write("        break;\n")
 
 f.write("""    default:
         ogs_error("Unknown message type (0x%x) or not implemented", 
                message->emm.h.message_type);
-        ogs_pkbuf_free(pkbuf);
-        return NULL;
+        ogs_assert(ogs_pkbuf_push(pkbuf, len + encoded));
+        ogs_pkbuf_trim(pkbuf, len);
+        return OGS_ERROR;
     }
 
 out:
-    ogs_assert(ogs_pkbuf_push(pkbuf, encoded));
+    /* An IE found no room in the tailroom */
+    if (size < 0) {
+        ogs_assert(ogs_pkbuf_push(pkbuf,
+                    ogs_pkbuf_headroom(pkbuf) - headroom));
+        ogs_pkbuf_trim(pkbuf, len);
+        return OGS_ERROR;
+    }
+    encoded += size;
 
-    pkbuf->len = encoded;
+    ogs_assert(ogs_pkbuf_push(pkbuf, len + encoded));
 
-    return pkbuf;
-}
+    ogs_pkbuf_trim(pkbuf, len + encoded);
 
-""")
+    return encoded;
+}
 
-f.write("""ogs_pkbuf_t *ogs_nas_esm_encode(ogs_nas_eps_message_t *message)
+ogs_pkbuf_t *ogs_nas_emm_encode(ogs_nas_eps_message_t *message)
 {
     ogs_pkbuf_t *pkbuf = NULL;
-    int size = 0;
-    int encoded = 0;
 
     ogs_assert(message);
 
@@ -993,7 +1090,38 @@ f.write("""ogs_pkbuf_t *ogs_nas_esm_encode(ogs_nas_eps_message_t *message)
         return NULL;
     }
     ogs_pkbuf_reserve(pkbuf, OGS_NAS_HEADROOM);
-    ogs_pkbuf_put(pkbuf, OGS_MAX_SDU_LEN-OGS_NAS_HEADROOM);
+
+    if (ogs_nas_emm_encode_to(message, pkbuf) < 0) {
+        ogs_pkbuf_free(pkbuf);
+        return NULL;
+    }
+
+    return pkbuf;
+}
+
+""")
+
+f.write("""int ogs_nas_esm_encode_to(
+        ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
+{
+    int size = 0;
+    int encoded = 0;
+    int len = 0;
+    int headroom = 0;
+
+    ogs_assert(message);
+    ogs_assert(pkbuf);
+
+    if (ogs_pkbuf_tailroom(pkbuf) < sizeof(ogs_nas_esm_header_t)) {
+        ogs_error("Not enough tailroom [%d]", ogs_pkbuf_tailroom(pkbuf));
+        return OGS_ERROR;
+    }
+
+    /* The message follows the octets already in the pkbuf */
+    len = pkbuf->len;
+    headroom = ogs_pkbuf_headroom(pkbuf);
+    ogs_pkbuf_put(pkbuf, ogs_pkbuf_tailroom(pkbuf));
+    ogs_assert(ogs_pkbuf_pull(pkbuf, len));
 
     size = sizeof(ogs_nas_esm_header_t);
     ogs_assert(ogs_pkbuf_pull(pkbuf, size));
@@ -1010,19 +1138,52 @@ for (k, v) in sorted_msg_list:
         f.write("    case OGS_NAS_EPS_%s:\n" % v_upper(k))
         if len(msg_list[k]["ies"]) != 0:
             f.write("        size = ogs_nas_eps_encode_%s(pkbuf, message);\n" % v_lower(k))
-            f.write("        ogs_assert(size >= 0);\n")
-            f.write("        encoded += size;\n")
+        else:
+            f.write("        size = 0;\n")
         f.write("        break;\n")
 
 f.write("""   default:
         ogs_error("Unknown message type (0x%x) or not implemented", 
                 message->esm.h.message_type);
-        ogs_pkbuf_free(pkbuf);
+        ogs_assert(ogs_pkbuf_push(pkbuf, len + encoded));
+        ogs_pkbuf_trim(pkbuf, len);
+        return OGS_ERROR;
+    }
+
+    /* An IE found no room in the tailroom */
+    if (size < 0) {
+        ogs_assert(ogs_pkbuf_push(pkbuf,
+                    ogs_pkbuf_headroom(pkbuf) - headroom));
+        ogs_pkbuf_trim(pkbuf, len);
+        return OGS_ERROR;
+    }
+    encoded += size;
+
+    ogs_assert(ogs_pkbuf_push(pkbuf, len + encoded));
+    ogs_pkbuf_trim(pkbuf, len + encoded);
+
+    return encoded;
+}
+
+ogs_pkbuf_t *ogs_nas_esm_encode(ogs_nas_eps_message_t *message)
+{
+    ogs_pkbuf_t *pkbuf = NULL;
+
+    ogs_assert(message);
+
+    /* The Packet Buffer(ogs_pkbuf_t) for NAS message MUST make a HEADROOM.
+     * When calculating AES_CMAC, we need to use the headroom of the packet. */
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_MAX_SDU_LEN);
+    if (!pkbuf) {
+        ogs_error("ogs_pkbuf_alloc() failed");
         return NULL;
     }
+    ogs_pkbuf_reserve(pkbuf, OGS_NAS_HEADROOM);
 
-    ogs_assert(ogs_pkbuf_push(pkbuf, encoded));
-    pkbuf->len = encoded;
+    if (ogs_nas_esm_encode_to(message, pkbuf) < 0) {
+        ogs_pkbuf_free(pkbuf);
+        return NULL;
+    }
 
     return pkbuf;
 }
@@ -1043,7 +1204,90 @@ ogs_pkbuf_t *ogs_nas_eps_plain_encode(ogs_nas_eps_message_t *message)
 
     return NULL;
 }
+
+int ogs_nas_eps_plain_encode_to(
+        ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf)
+{
+    ogs_assert(message);
+
+    ogs_assert(message->emm.h.protocol_discriminator ==
+            message->esm.h.protocol_discriminator);
+
+    if (message->emm.h.protocol_discriminator == 
+            OGS_NAS_PROTOCOL_DISCRIMINATOR_EMM)
+        return ogs_nas_emm_encode_to(message, pkbuf);
+    else if (message->emm.h.protocol_discriminator == 
+            OGS_NAS_PROTOCOL_DISCRIMINATOR_ESM)
+        return ogs_nas_esm_encode_to(message, pkbuf);
+
+    return OGS_ERROR;
+}
 """)
 
 f.close()
 
+# The message with its header and the IEs 'ies', each of them of its
+# minimum length and holding zeros
+def message_octets(k, v, ies):
+    if float(msg_list[k]["type"]) < 192:
+        octets = [0x07, int(float(v))]
+    else:
+        octets = [0x52, 0x01, int(float(v))]
+    for ie in ies:
+        octets += nas_ie_octets(ie)
+    return octets
+
+if bench is not None:
+    f = output.open(bench)
+    output_header_to_file(f)
+    write_bench_prologue(f, "NAS EPS", ["ogs-nas-eps.h"])
+    write_bench_nas(f, "ogs_nas_eps_message_t", "ogs_nas_eps_plain_encode")
+    f.write("static const bench_message_t bench_messages[] = {\n")
+    for (k, v) in sorted_msg_list:
+        if len(msg_list[k].get("ies", [])) == 0:
+            continue
+        # Only the variants both decoded and encoded by a single type
+        if k.find("TO UE") != -1 or k.find("FROM UE") != -1 or \
+                k == "SERVICE REQUEST":
+            continue
+        octets = message_octets(k, v, msg_list[k]["ies"])
+        if float(msg_list[k]["type"]) < 192:
+            decode = "ogs_nas_emm_decode"
+        else:
+            decode = "ogs_nas_esm_decode"
+        f.write("    { \"%s\",\n" % k)
+        write_bench_octets(f, octets)
+        f.write("        %d, %s, NULL },\n" % (len(octets), decode))
+    f.write("};\n\n")
+    # Some IEs log the zeros they hold as errors on every decode
+    write_bench_main(f, """    ogs_log_install_domain(&__ogs_nas_domain, "nas", OGS_LOG_FATAL);
+""", "bench_messages")
+    f.close()
+
+if corpus is not None:
+    seeds = Corpus("nas-eps")
+    for (k, v) in sorted_msg_list:
+        if "ies" not in msg_list[k]:
+            continue
+        # What the network decodes; SERVICE REQUEST has no message type
+        if k.find("TO UE") != -1 or k == "SERVICE REQUEST":
+            continue
+        variants = {}
+        for variant in VARIANTS:
+            # No IE of a NAS message repeats, "max" is the same as "all"
+            octets = message_octets(k, v, [ie for ie in msg_list[k]["ies"]
+                if variant != "mandatory" or ie["presence"] == "M"])
+            if octets in variants.values():
+                continue
+            variants[variant] = octets
+            seeds.add(v_lower(k), variant, octets)
+    seeds.write(output, corpus)
+
+if depfile is not None:
+    inputs = [filename] + cache.files
+    if os.path.isfile(typefile):
+        inputs.append(typefile)
+    output.write_depfile(depfile, inputs)
+
+output.summary()
+profile.report()
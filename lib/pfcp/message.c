@@ -20,8 +20,8 @@
 /*******************************************************************************
  * This file had been created by pfcp-tlv.py script v0.1.0
  * Please do not modify this file but regenerate it via script.
- * Created on: 2024-10-20 22:37:02.550243 by acetcom
- * from 29244-h71-modified.docx
+ * Created from 29244-h71-modified.docx
+ * (sha256: 6c94e2b5b45cdb1370a468345443ff773a37662de002639cf6a33bb64fd7c166)
  ******************************************************************************/
 
 #include "ogs-pfcp.h"
@@ -34,7 +34,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_cause =
     1,
     0,
     sizeof(ogs_pfcp_tlv_cause_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_source_interface =
@@ -45,7 +47,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_source_interface =
     1,
     0,
     sizeof(ogs_pfcp_tlv_source_interface_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_f_teid =
@@ -56,7 +60,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_f_teid =
     0,
     0,
     sizeof(ogs_pfcp_tlv_f_teid_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_network_instance =
@@ -67,7 +73,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_network_instance =
     0,
     0,
     sizeof(ogs_pfcp_tlv_network_instance_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_sdf_filter =
@@ -78,7 +86,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_sdf_filter =
     0,
     0,
     sizeof(ogs_pfcp_tlv_sdf_filter_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_application_id =
@@ -89,7 +99,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_application_id =
     0,
     0,
     sizeof(ogs_pfcp_tlv_application_id_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_gate_status =
@@ -100,7 +112,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_gate_status =
     1,
     0,
     sizeof(ogs_pfcp_tlv_gate_status_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_mbr =
@@ -111,7 +125,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_mbr =
     0,
     0,
     sizeof(ogs_pfcp_tlv_mbr_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_gbr =
@@ -122,7 +138,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_gbr =
     0,
     0,
     sizeof(ogs_pfcp_tlv_gbr_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_qer_correlation_id =
@@ -133,7 +151,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_qer_correlation_id =
     4,
     0,
     sizeof(ogs_pfcp_tlv_qer_correlation_id_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_precedence =
@@ -144,7 +164,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_precedence =
     4,
     0,
     sizeof(ogs_pfcp_tlv_precedence_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_transport_level_marking =
@@ -155,7 +177,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_transport_level_marking =
     0,
     0,
     sizeof(ogs_pfcp_tlv_transport_level_marking_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_volume_threshold =
@@ -166,7 +190,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_volume_threshold =
     0,
     0,
     sizeof(ogs_pfcp_tlv_volume_threshold_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_time_threshold =
@@ -177,7 +203,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_time_threshold =
     4,
     0,
     sizeof(ogs_pfcp_tlv_time_threshold_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_monitoring_time =
@@ -188,7 +216,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_monitoring_time =
     0,
     0,
     sizeof(ogs_pfcp_tlv_monitoring_time_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_subsequent_volume_threshold =
@@ -199,7 +229,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_subsequent_volume_threshold =
     0,
     0,
     sizeof(ogs_pfcp_tlv_subsequent_volume_threshold_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_subsequent_time_threshold =
@@ -210,7 +242,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_subsequent_time_threshold =
     0,
     0,
     sizeof(ogs_pfcp_tlv_subsequent_time_threshold_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_inactivity_detection_time =
@@ -221,7 +255,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_inactivity_detection_time =
     0,
     0,
     sizeof(ogs_pfcp_tlv_inactivity_detection_time_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_reporting_triggers =
@@ -232,7 +268,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_reporting_triggers =
     3,
     0,
     sizeof(ogs_pfcp_tlv_reporting_triggers_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_redirect_information =
@@ -243,7 +281,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_redirect_information =
     0,
     0,
     sizeof(ogs_pfcp_tlv_redirect_information_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_report_type =
@@ -254,7 +294,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_report_type =
     1,
     0,
     sizeof(ogs_pfcp_tlv_report_type_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_offending_ie =
@@ -265,7 +307,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_offending_ie =
     2,
     0,
     sizeof(ogs_pfcp_tlv_offending_ie_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_forwarding_policy =
@@ -276,7 +320,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_forwarding_policy =
     0,
     0,
     sizeof(ogs_pfcp_tlv_forwarding_policy_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_destination_interface =
@@ -287,7 +333,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_destination_interface =
     1,
     0,
     sizeof(ogs_pfcp_tlv_destination_interface_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_up_function_features =
@@ -298,7 +346,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_up_function_features =
     0,
     0,
     sizeof(ogs_pfcp_tlv_up_function_features_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_apply_action =
@@ -309,7 +359,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_apply_action =
     2,
     0,
     sizeof(ogs_pfcp_tlv_apply_action_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_downlink_data_service_information =
@@ -320,7 +372,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_downlink_data_service_information =
     0,
     0,
     sizeof(ogs_pfcp_tlv_downlink_data_service_information_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_downlink_data_notification_delay =
@@ -331,7 +385,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_downlink_data_notification_delay =
     0,
     0,
     sizeof(ogs_pfcp_tlv_downlink_data_notification_delay_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_dl_buffering_duration =
@@ -342,7 +398,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_dl_buffering_duration =
     0,
     0,
     sizeof(ogs_pfcp_tlv_dl_buffering_duration_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_dl_buffering_suggested_packet_count =
@@ -353,7 +411,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_dl_buffering_suggested_packet_count =
     0,
     0,
     sizeof(ogs_pfcp_tlv_dl_buffering_suggested_packet_count_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_pfcpsmreq_flags =
@@ -364,7 +424,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_pfcpsmreq_flags =
     1,
     0,
     sizeof(ogs_pfcp_tlv_pfcpsmreq_flags_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_pfcpsrrsp_flags =
@@ -375,7 +437,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_pfcpsrrsp_flags =
     1,
     0,
     sizeof(ogs_pfcp_tlv_pfcpsrrsp_flags_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_sequence_number =
@@ -386,7 +450,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_sequence_number =
     0,
     0,
     sizeof(ogs_pfcp_tlv_sequence_number_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_metric =
@@ -397,7 +463,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_metric =
     0,
     0,
     sizeof(ogs_pfcp_tlv_metric_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_timer =
@@ -408,7 +476,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_timer =
     0,
     0,
     sizeof(ogs_pfcp_tlv_timer_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_pdr_id =
@@ -419,7 +489,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_pdr_id =
     2,
     0,
     sizeof(ogs_pfcp_tlv_pdr_id_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_f_seid =
@@ -430,7 +502,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_f_seid =
     0,
     0,
     sizeof(ogs_pfcp_tlv_f_seid_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_node_id =
@@ -441,7 +515,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_node_id =
     0,
     0,
     sizeof(ogs_pfcp_tlv_node_id_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_pfd_contents =
@@ -452,7 +528,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_pfd_contents =
     0,
     0,
     sizeof(ogs_pfcp_tlv_pfd_contents_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_measurement_method =
@@ -463,7 +541,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_measurement_method =
     1,
     0,
     sizeof(ogs_pfcp_tlv_measurement_method_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_usage_report_trigger =
@@ -474,7 +554,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_usage_report_trigger =
     3,
     0,
     sizeof(ogs_pfcp_tlv_usage_report_trigger_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_measurement_period =
@@ -485,7 +567,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_measurement_period =
     4,
     0,
     sizeof(ogs_pfcp_tlv_measurement_period_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_fq_csid =
@@ -496,7 +580,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_fq_csid =
     0,
     0,
     sizeof(ogs_pfcp_tlv_fq_csid_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_volume_measurement =
@@ -507,7 +593,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_volume_measurement =
     0,
     0,
     sizeof(ogs_pfcp_tlv_volume_measurement_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_duration_measurement =
@@ -518,7 +606,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_duration_measurement =
     4,
     0,
     sizeof(ogs_pfcp_tlv_duration_measurement_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_time_of_first_packet =
@@ -529,7 +619,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_time_of_first_packet =
     4,
     0,
     sizeof(ogs_pfcp_tlv_time_of_first_packet_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_time_of_last_packet =
@@ -540,7 +632,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_time_of_last_packet =
     4,
     0,
     sizeof(ogs_pfcp_tlv_time_of_last_packet_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_quota_holding_time =
@@ -551,7 +645,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_quota_holding_time =
     4,
     0,
     sizeof(ogs_pfcp_tlv_quota_holding_time_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_dropped_dl_traffic_threshold =
@@ -562,7 +658,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_dropped_dl_traffic_threshold =
     0,
     0,
     sizeof(ogs_pfcp_tlv_dropped_dl_traffic_threshold_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_volume_quota =
@@ -573,7 +671,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_volume_quota =
     0,
     0,
     sizeof(ogs_pfcp_tlv_volume_quota_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_time_quota =
@@ -584,7 +684,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_time_quota =
     4,
     0,
     sizeof(ogs_pfcp_tlv_time_quota_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_start_time =
@@ -595,7 +697,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_start_time =
     4,
     0,
     sizeof(ogs_pfcp_tlv_start_time_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_end_time =
@@ -606,7 +710,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_end_time =
     4,
     0,
     sizeof(ogs_pfcp_tlv_end_time_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_urr_id =
@@ -617,7 +723,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_urr_id =
     4,
     0,
     sizeof(ogs_pfcp_tlv_urr_id_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_linked_urr_id =
@@ -628,7 +736,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_linked_urr_id =
     0,
     0,
     sizeof(ogs_pfcp_tlv_linked_urr_id_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_outer_header_creation =
@@ -639,7 +749,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_outer_header_creation =
     0,
     0,
     sizeof(ogs_pfcp_tlv_outer_header_creation_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_bar_id =
@@ -650,7 +762,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_bar_id =
     1,
     0,
     sizeof(ogs_pfcp_tlv_bar_id_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_cp_function_features =
@@ -661,7 +775,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_cp_function_features =
     1,
     0,
     sizeof(ogs_pfcp_tlv_cp_function_features_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_usage_information =
@@ -672,7 +788,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_usage_information =
     0,
     0,
     sizeof(ogs_pfcp_tlv_usage_information_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_application_instance_id =
@@ -683,7 +801,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_application_instance_id =
     0,
     0,
     sizeof(ogs_pfcp_tlv_application_instance_id_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_flow_information =
@@ -694,7 +814,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_flow_information =
     0,
     0,
     sizeof(ogs_pfcp_tlv_flow_information_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_ue_ip_address =
@@ -705,7 +827,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_ue_ip_address =
     0,
     0,
     sizeof(ogs_pfcp_tlv_ue_ip_address_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_packet_rate =
@@ -716,7 +840,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_packet_rate =
     0,
     0,
     sizeof(ogs_pfcp_tlv_packet_rate_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_outer_header_removal =
@@ -727,7 +853,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_outer_header_removal =
     0,
     0,
     sizeof(ogs_pfcp_tlv_outer_header_removal_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_recovery_time_stamp =
@@ -738,7 +866,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_recovery_time_stamp =
     4,
     0,
     sizeof(ogs_pfcp_tlv_recovery_time_stamp_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_dl_flow_level_marking =
@@ -749,7 +879,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_dl_flow_level_marking =
     0,
     0,
     sizeof(ogs_pfcp_tlv_dl_flow_level_marking_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_header_enrichment =
@@ -760,7 +892,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_header_enrichment =
     0,
     0,
     sizeof(ogs_pfcp_tlv_header_enrichment_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_measurement_information =
@@ -771,7 +905,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_measurement_information =
     0,
     0,
     sizeof(ogs_pfcp_tlv_measurement_information_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_node_report_type =
@@ -782,7 +918,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_node_report_type =
     0,
     0,
     sizeof(ogs_pfcp_tlv_node_report_type_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_remote_gtp_u_peer =
@@ -793,7 +931,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_remote_gtp_u_peer =
     0,
     0,
     sizeof(ogs_pfcp_tlv_remote_gtp_u_peer_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_ur_seqn =
@@ -804,7 +944,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_ur_seqn =
     4,
     0,
     sizeof(ogs_pfcp_tlv_ur_seqn_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_activate_predefined_rules =
@@ -815,7 +957,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_activate_predefined_rules =
     0,
     0,
     sizeof(ogs_pfcp_tlv_activate_predefined_rules_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_deactivate_predefined_rules =
@@ -826,7 +970,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_deactivate_predefined_rules =
     0,
     0,
     sizeof(ogs_pfcp_tlv_deactivate_predefined_rules_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_far_id =
@@ -837,7 +983,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_far_id =
     4,
     0,
     sizeof(ogs_pfcp_tlv_far_id_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_qer_id =
@@ -848,7 +996,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_qer_id =
     4,
     0,
     sizeof(ogs_pfcp_tlv_qer_id_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_oci_flags =
@@ -859,7 +1009,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_oci_flags =
     0,
     0,
     sizeof(ogs_pfcp_tlv_oci_flags_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_pfcp_association_release_request =
@@ -870,7 +1022,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_pfcp_association_release_request =
     0,
     0,
     sizeof(ogs_pfcp_tlv_pfcp_association_release_request_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_graceful_release_period =
@@ -881,7 +1035,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_graceful_release_period =
     0,
     0,
     sizeof(ogs_pfcp_tlv_graceful_release_period_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_pdn_type =
@@ -892,7 +1048,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_pdn_type =
     1,
     0,
     sizeof(ogs_pfcp_tlv_pdn_type_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_failed_rule_id =
@@ -903,7 +1061,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_failed_rule_id =
     0,
     0,
     sizeof(ogs_pfcp_tlv_failed_rule_id_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_time_quota_mechanism =
@@ -914,7 +1074,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_time_quota_mechanism =
     0,
     0,
     sizeof(ogs_pfcp_tlv_time_quota_mechanism_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_user_plane_ip_resource_information =
@@ -925,7 +1087,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_user_plane_ip_resource_information =
     0,
     0,
     sizeof(ogs_pfcp_tlv_user_plane_ip_resource_information_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_user_plane_inactivity_timer =
@@ -936,7 +1100,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_user_plane_inactivity_timer =
     0,
     0,
     sizeof(ogs_pfcp_tlv_user_plane_inactivity_timer_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_aggregated_urrs =
@@ -947,7 +1113,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_aggregated_urrs =
     0,
     0,
     sizeof(ogs_pfcp_tlv_aggregated_urrs_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_multiplier =
@@ -958,7 +1126,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_multiplier =
     0,
     0,
     sizeof(ogs_pfcp_tlv_multiplier_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_aggregated_urr_id =
@@ -969,7 +1139,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_aggregated_urr_id =
     0,
     0,
     sizeof(ogs_pfcp_tlv_aggregated_urr_id_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_subsequent_volume_quota =
@@ -980,7 +1152,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_subsequent_volume_quota =
     0,
     0,
     sizeof(ogs_pfcp_tlv_subsequent_volume_quota_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_subsequent_time_quota =
@@ -991,7 +1165,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_subsequent_time_quota =
     0,
     0,
     sizeof(ogs_pfcp_tlv_subsequent_time_quota_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_rqi =
@@ -1002,7 +1178,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_rqi =
     1,
     0,
     sizeof(ogs_pfcp_tlv_rqi_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_qfi =
@@ -1013,7 +1191,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_qfi =
     1,
     0,
     sizeof(ogs_pfcp_tlv_qfi_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_query_urr_reference =
@@ -1024,7 +1204,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_query_urr_reference =
     0,
     0,
     sizeof(ogs_pfcp_tlv_query_urr_reference_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_additional_usage_reports_information =
@@ -1035,7 +1217,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_additional_usage_reports_information =
     0,
     0,
     sizeof(ogs_pfcp_tlv_additional_usage_reports_information_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_update_traffic_endpoint =
@@ -1046,7 +1230,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_update_traffic_endpoint =
     0,
     0,
     sizeof(ogs_pfcp_tlv_update_traffic_endpoint_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_traffic_endpoint_id =
@@ -1057,7 +1243,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_traffic_endpoint_id =
     0,
     0,
     sizeof(ogs_pfcp_tlv_traffic_endpoint_id_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_mac_address =
@@ -1068,7 +1256,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_mac_address =
     0,
     0,
     sizeof(ogs_pfcp_tlv_mac_address_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_c_tag =
@@ -1079,7 +1269,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_c_tag =
     0,
     0,
     sizeof(ogs_pfcp_tlv_c_tag_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_s_tag =
@@ -1090,7 +1282,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_s_tag =
     0,
     0,
     sizeof(ogs_pfcp_tlv_s_tag_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_ethertype =
@@ -1101,7 +1295,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_ethertype =
     0,
     0,
     sizeof(ogs_pfcp_tlv_ethertype_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_proxying =
@@ -1112,7 +1308,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_proxying =
     0,
     0,
     sizeof(ogs_pfcp_tlv_proxying_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_ethernet_filter_id =
@@ -1123,7 +1321,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_ethernet_filter_id =
     0,
     0,
     sizeof(ogs_pfcp_tlv_ethernet_filter_id_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_ethernet_filter_properties =
@@ -1134,7 +1334,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_ethernet_filter_properties =
     0,
     0,
     sizeof(ogs_pfcp_tlv_ethernet_filter_properties_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_suggested_buffering_packets_count =
@@ -1145,7 +1347,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_suggested_buffering_packets_count =
     0,
     0,
     sizeof(ogs_pfcp_tlv_suggested_buffering_packets_count_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_user_id =
@@ -1156,7 +1360,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_user_id =
     0,
     0,
     sizeof(ogs_pfcp_tlv_user_id_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_ethernet_pdu_session_information =
@@ -1167,7 +1373,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_ethernet_pdu_session_information =
     0,
     0,
     sizeof(ogs_pfcp_tlv_ethernet_pdu_session_information_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_mac_addresses_detected =
@@ -1178,7 +1386,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_mac_addresses_detected =
     0,
     0,
     sizeof(ogs_pfcp_tlv_mac_addresses_detected_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_mac_addresses_removed =
@@ -1189,7 +1399,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_mac_addresses_removed =
     0,
     0,
     sizeof(ogs_pfcp_tlv_mac_addresses_removed_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_ethernet_inactivity_timer =
@@ -1200,7 +1412,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_ethernet_inactivity_timer =
     0,
     0,
     sizeof(ogs_pfcp_tlv_ethernet_inactivity_timer_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_additional_monitoring_time =
@@ -1211,7 +1425,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_additional_monitoring_time =
     0,
     0,
     sizeof(ogs_pfcp_tlv_additional_monitoring_time_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_event_quota =
@@ -1222,7 +1438,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_event_quota =
     4,
     0,
     sizeof(ogs_pfcp_tlv_event_quota_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_event_threshold =
@@ -1233,7 +1451,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_event_threshold =
     4,
     0,
     sizeof(ogs_pfcp_tlv_event_threshold_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_subsequent_event_quota =
@@ -1244,7 +1464,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_subsequent_event_quota =
     0,
     0,
     sizeof(ogs_pfcp_tlv_subsequent_event_quota_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_subsequent_event_threshold =
@@ -1255,7 +1477,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_subsequent_event_threshold =
     0,
     0,
     sizeof(ogs_pfcp_tlv_subsequent_event_threshold_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_trace_information =
@@ -1266,7 +1490,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_trace_information =
     0,
     0,
     sizeof(ogs_pfcp_tlv_trace_information_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_framed_route =
@@ -1277,7 +1503,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_framed_route =
     0,
     0,
     sizeof(ogs_pfcp_tlv_framed_route_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_framed_routing =
@@ -1288,7 +1516,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_framed_routing =
     0,
     0,
     sizeof(ogs_pfcp_tlv_framed_routing_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_framed_ipv6_route =
@@ -1299,7 +1529,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_framed_ipv6_route =
     0,
     0,
     sizeof(ogs_pfcp_tlv_framed_ipv6_route_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_time_stamp =
@@ -1310,7 +1542,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_time_stamp =
     0,
     0,
     sizeof(ogs_pfcp_tlv_time_stamp_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_averaging_window =
@@ -1321,7 +1555,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_averaging_window =
     4,
     0,
     sizeof(ogs_pfcp_tlv_averaging_window_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_paging_policy_indicator =
@@ -1332,7 +1568,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_paging_policy_indicator =
     1,
     0,
     sizeof(ogs_pfcp_tlv_paging_policy_indicator_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_apn_dnn =
@@ -1343,7 +1581,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_apn_dnn =
     0,
     0,
     sizeof(ogs_pfcp_tlv_apn_dnn_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc__interface_type =
@@ -1354,7 +1594,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc__interface_type =
     1,
     0,
     sizeof(ogs_pfcp_tlv__interface_type_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_pfcpsrreq_flags =
@@ -1365,7 +1607,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_pfcpsrreq_flags =
     1,
     0,
     sizeof(ogs_pfcp_tlv_pfcpsrreq_flags_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_pfcpaureq_flags =
@@ -1376,7 +1620,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_pfcpaureq_flags =
     1,
     0,
     sizeof(ogs_pfcp_tlv_pfcpaureq_flags_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_activation_time =
@@ -1387,7 +1633,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_activation_time =
     0,
     0,
     sizeof(ogs_pfcp_tlv_activation_time_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_deactivation_time =
@@ -1398,7 +1646,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_deactivation_time =
     0,
     0,
     sizeof(ogs_pfcp_tlv_deactivation_time_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_mar_id =
@@ -1409,7 +1659,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_mar_id =
     0,
     0,
     sizeof(ogs_pfcp_tlv_mar_id_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_steering_functionality =
@@ -1420,7 +1672,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_steering_functionality =
     0,
     0,
     sizeof(ogs_pfcp_tlv_steering_functionality_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_steering_mode =
@@ -1431,7 +1685,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_steering_mode =
     0,
     0,
     sizeof(ogs_pfcp_tlv_steering_mode_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_weight =
@@ -1442,7 +1698,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_weight =
     0,
     0,
     sizeof(ogs_pfcp_tlv_weight_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_priority =
@@ -1453,7 +1711,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_priority =
     0,
     0,
     sizeof(ogs_pfcp_tlv_priority_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_ue_ip_address_pool_identity =
@@ -1464,7 +1724,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_ue_ip_address_pool_identity =
     0,
     0,
     sizeof(ogs_pfcp_tlv_ue_ip_address_pool_identity_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_alternative_smf_ip_address =
@@ -1475,7 +1737,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_alternative_smf_ip_address =
     0,
     0,
     sizeof(ogs_pfcp_tlv_alternative_smf_ip_address_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_packet_replication_and_detection_carry_on_information =
@@ -1486,7 +1750,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_packet_replication_and_detection_carry_on_infor
     0,
     0,
     sizeof(ogs_pfcp_tlv_packet_replication_and_detection_carry_on_information_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_smf_set_id =
@@ -1497,7 +1763,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_smf_set_id =
     0,
     0,
     sizeof(ogs_pfcp_tlv_smf_set_id_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_quota_validity_time =
@@ -1508,7 +1776,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_quota_validity_time =
     4,
     0,
     sizeof(ogs_pfcp_tlv_quota_validity_time_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_number_of_reports =
@@ -1519,7 +1789,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_number_of_reports =
     0,
     0,
     sizeof(ogs_pfcp_tlv_number_of_reports_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_pfcpasrsp_flags =
@@ -1530,7 +1802,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_pfcpasrsp_flags =
     0,
     0,
     sizeof(ogs_pfcp_tlv_pfcpasrsp_flags_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_cp_pfcp_entity_ip_address =
@@ -1541,7 +1815,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_cp_pfcp_entity_ip_address =
     0,
     0,
     sizeof(ogs_pfcp_tlv_cp_pfcp_entity_ip_address_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_pfcpsereq_flags =
@@ -1552,7 +1828,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_pfcpsereq_flags =
     1,
     0,
     sizeof(ogs_pfcp_tlv_pfcpsereq_flags_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_ip_multicast_address =
@@ -1563,7 +1841,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_ip_multicast_address =
     0,
     0,
     sizeof(ogs_pfcp_tlv_ip_multicast_address_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_source_ip_address =
@@ -1574,7 +1854,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_source_ip_address =
     0,
     0,
     sizeof(ogs_pfcp_tlv_source_ip_address_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_packet_rate_status =
@@ -1585,7 +1867,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_packet_rate_status =
     0,
     0,
     sizeof(ogs_pfcp_tlv_packet_rate_status_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_create_bridge_info_for_tsc =
@@ -1596,7 +1880,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_create_bridge_info_for_tsc =
     0,
     0,
     sizeof(ogs_pfcp_tlv_create_bridge_info_for_tsc_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_ds_tt_port_number =
@@ -1607,7 +1893,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_ds_tt_port_number =
     0,
     0,
     sizeof(ogs_pfcp_tlv_ds_tt_port_number_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_nw_tt_port_number =
@@ -1618,7 +1906,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_nw_tt_port_number =
     0,
     0,
     sizeof(ogs_pfcp_tlv_nw_tt_port_number_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_fivegs_user_plane_node =
@@ -1629,7 +1919,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_fivegs_user_plane_node =
     0,
     0,
     sizeof(ogs_pfcp_tlv_fivegs_user_plane_node_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_port_management_information_container =
@@ -1640,7 +1932,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_port_management_information_container =
     0,
     0,
     sizeof(ogs_pfcp_tlv_port_management_information_container_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_requested_clock_drift_information =
@@ -1651,7 +1945,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_requested_clock_drift_information =
     0,
     0,
     sizeof(ogs_pfcp_tlv_requested_clock_drift_information_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_time_domain_number =
@@ -1662,7 +1958,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_time_domain_number =
     0,
     0,
     sizeof(ogs_pfcp_tlv_time_domain_number_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_time_offset_threshold =
@@ -1673,7 +1971,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_time_offset_threshold =
     0,
     0,
     sizeof(ogs_pfcp_tlv_time_offset_threshold_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_cumulative_rateratio_threshold =
@@ -1684,7 +1984,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_cumulative_rateratio_threshold =
     0,
     0,
     sizeof(ogs_pfcp_tlv_cumulative_rateratio_threshold_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_time_offset_measurement =
@@ -1695,7 +1997,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_time_offset_measurement =
     0,
     0,
     sizeof(ogs_pfcp_tlv_time_offset_measurement_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_cumulative_rateratio_measurement =
@@ -1706,7 +2010,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_cumulative_rateratio_measurement =
     0,
     0,
     sizeof(ogs_pfcp_tlv_cumulative_rateratio_measurement_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_srr_id =
@@ -1717,7 +2023,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_srr_id =
     0,
     0,
     sizeof(ogs_pfcp_tlv_srr_id_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_access_availability_control_information =
@@ -1728,7 +2036,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_access_availability_control_information =
     0,
     0,
     sizeof(ogs_pfcp_tlv_access_availability_control_information_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_requested_access_availability_information =
@@ -1739,7 +2049,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_requested_access_availability_information =
     0,
     0,
     sizeof(ogs_pfcp_tlv_requested_access_availability_information_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_access_availability_information =
@@ -1750,7 +2062,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_access_availability_information =
     0,
     0,
     sizeof(ogs_pfcp_tlv_access_availability_information_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_mptcp_control_information =
@@ -1761,7 +2075,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_mptcp_control_information =
     0,
     0,
     sizeof(ogs_pfcp_tlv_mptcp_control_information_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_atsss_ll_control_information =
@@ -1772,7 +2088,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_atsss_ll_control_information =
     0,
     0,
     sizeof(ogs_pfcp_tlv_atsss_ll_control_information_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_pmf_control_information =
@@ -1783,7 +2101,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_pmf_control_information =
     0,
     0,
     sizeof(ogs_pfcp_tlv_pmf_control_information_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_mptcp_address_information =
@@ -1794,7 +2114,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_mptcp_address_information =
     0,
     0,
     sizeof(ogs_pfcp_tlv_mptcp_address_information_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_ue_link_specific_ip_address =
@@ -1805,7 +2127,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_ue_link_specific_ip_address =
     0,
     0,
     sizeof(ogs_pfcp_tlv_ue_link_specific_ip_address_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_pmf_address_information =
@@ -1816,7 +2140,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_pmf_address_information =
     0,
     0,
     sizeof(ogs_pfcp_tlv_pmf_address_information_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_atsss_ll_information =
@@ -1827,7 +2153,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_atsss_ll_information =
     0,
     0,
     sizeof(ogs_pfcp_tlv_atsss_ll_information_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_data_network_access_identifier =
@@ -1838,7 +2166,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_data_network_access_identifier =
     0,
     0,
     sizeof(ogs_pfcp_tlv_data_network_access_identifier_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_average_packet_delay =
@@ -1849,7 +2179,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_average_packet_delay =
     0,
     0,
     sizeof(ogs_pfcp_tlv_average_packet_delay_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_minimum_packet_delay =
@@ -1860,7 +2192,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_minimum_packet_delay =
     0,
     0,
     sizeof(ogs_pfcp_tlv_minimum_packet_delay_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_maximum_packet_delay =
@@ -1871,7 +2205,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_maximum_packet_delay =
     0,
     0,
     sizeof(ogs_pfcp_tlv_maximum_packet_delay_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_qos_report_trigger =
@@ -1882,7 +2218,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_qos_report_trigger =
     0,
     0,
     sizeof(ogs_pfcp_tlv_qos_report_trigger_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_gtp_u_path_qos_control_information =
@@ -1893,7 +2231,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_gtp_u_path_qos_control_information =
     0,
     0,
     sizeof(ogs_pfcp_tlv_gtp_u_path_qos_control_information_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_gtp_u_path_interface_type =
@@ -1904,7 +2244,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_gtp_u_path_interface_type =
     0,
     0,
     sizeof(ogs_pfcp_tlv_gtp_u_path_interface_type_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_qos_monitoring_per_qos_flow_control_information =
@@ -1915,7 +2257,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_qos_monitoring_per_qos_flow_control_information
     0,
     0,
     sizeof(ogs_pfcp_tlv_qos_monitoring_per_qos_flow_control_information_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_requested_qos_monitoring =
@@ -1926,7 +2270,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_requested_qos_monitoring =
     0,
     0,
     sizeof(ogs_pfcp_tlv_requested_qos_monitoring_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_reporting_frequency =
@@ -1937,7 +2283,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_reporting_frequency =
     0,
     0,
     sizeof(ogs_pfcp_tlv_reporting_frequency_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_packet_delay_thresholds =
@@ -1948,7 +2296,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_packet_delay_thresholds =
     0,
     0,
     sizeof(ogs_pfcp_tlv_packet_delay_thresholds_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_minimum_wait_time =
@@ -1959,7 +2309,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_minimum_wait_time =
     0,
     0,
     sizeof(ogs_pfcp_tlv_minimum_wait_time_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_qos_monitoring_measurement =
@@ -1970,7 +2322,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_qos_monitoring_measurement =
     0,
     0,
     sizeof(ogs_pfcp_tlv_qos_monitoring_measurement_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_mt_edt_control_information =
@@ -1981,7 +2335,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_mt_edt_control_information =
     0,
     0,
     sizeof(ogs_pfcp_tlv_mt_edt_control_information_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_dl_data_packets_size =
@@ -1992,7 +2348,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_dl_data_packets_size =
     0,
     0,
     sizeof(ogs_pfcp_tlv_dl_data_packets_size_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_qer_control_indications =
@@ -2003,7 +2361,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_qer_control_indications =
     0,
     0,
     sizeof(ogs_pfcp_tlv_qer_control_indications_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_nf_instance_id =
@@ -2014,7 +2374,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_nf_instance_id =
     0,
     0,
     sizeof(ogs_pfcp_tlv_nf_instance_id_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_s_nssai =
@@ -2025,7 +2387,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_s_nssai =
     0,
     0,
     sizeof(ogs_pfcp_tlv_s_nssai_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_ip_version =
@@ -2036,7 +2400,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_ip_version =
     0,
     0,
     sizeof(ogs_pfcp_tlv_ip_version_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_pfcpasreq_flags =
@@ -2047,7 +2413,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_pfcpasreq_flags =
     0,
     0,
     sizeof(ogs_pfcp_tlv_pfcpasreq_flags_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_data_status =
@@ -2058,7 +2426,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_data_status =
     1,
     0,
     sizeof(ogs_pfcp_tlv_data_status_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_rds_configuration_information =
@@ -2069,7 +2439,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_rds_configuration_information =
     0,
     0,
     sizeof(ogs_pfcp_tlv_rds_configuration_information_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_mptcp_applicable_indication =
@@ -2080,7 +2452,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_mptcp_applicable_indication =
     0,
     0,
     sizeof(ogs_pfcp_tlv_mptcp_applicable_indication_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_bridge_management_information_container =
@@ -2091,7 +2465,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_bridge_management_information_container =
     0,
     0,
     sizeof(ogs_pfcp_tlv_bridge_management_information_container_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_number_of_ue_ip_addresses =
@@ -2102,7 +2478,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_number_of_ue_ip_addresses =
     0,
     0,
     sizeof(ogs_pfcp_tlv_number_of_ue_ip_addresses_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_validity_timer =
@@ -2113,7 +2491,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_validity_timer =
     0,
     0,
     sizeof(ogs_pfcp_tlv_validity_timer_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_spare =
@@ -2124,7 +2504,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_spare =
     0,
     0,
     sizeof(ogs_pfcp_tlv_spare_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_offending_ie_information =
@@ -2135,7 +2517,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_offending_ie_information =
     0,
     0,
     sizeof(ogs_pfcp_tlv_offending_ie_information_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_rat_type =
@@ -2146,7 +2530,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_rat_type =
     0,
     0,
     sizeof(ogs_pfcp_tlv_rat_type_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_l2tp_user_authentication_ie =
@@ -2157,7 +2543,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_l2tp_user_authentication_ie =
     0,
     0,
     sizeof(ogs_pfcp_tlv_l2tp_user_authentication_ie_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_lns_address =
@@ -2168,7 +2556,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_lns_address =
     0,
     0,
     sizeof(ogs_pfcp_tlv_lns_address_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_tunnel_preference =
@@ -2179,7 +2569,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_tunnel_preference =
     0,
     0,
     sizeof(ogs_pfcp_tlv_tunnel_preference_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_calling_number =
@@ -2190,7 +2582,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_calling_number =
     0,
     0,
     sizeof(ogs_pfcp_tlv_calling_number_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_called_number =
@@ -2201,7 +2595,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_called_number =
     0,
     0,
     sizeof(ogs_pfcp_tlv_called_number_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_l2tp_session_indications =
@@ -2212,7 +2608,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_l2tp_session_indications =
     0,
     0,
     sizeof(ogs_pfcp_tlv_l2tp_session_indications_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_dns_server_address =
@@ -2223,7 +2621,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_dns_server_address =
     0,
     0,
     sizeof(ogs_pfcp_tlv_dns_server_address_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_nbns_server_address =
@@ -2234,7 +2634,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_nbns_server_address =
     0,
     0,
     sizeof(ogs_pfcp_tlv_nbns_server_address_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_maximum_receive_unit =
@@ -2245,7 +2647,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_maximum_receive_unit =
     0,
     0,
     sizeof(ogs_pfcp_tlv_maximum_receive_unit_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_thresholds =
@@ -2256,7 +2660,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_thresholds =
     0,
     0,
     sizeof(ogs_pfcp_tlv_thresholds_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_steering_mode_indicator =
@@ -2267,7 +2673,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_steering_mode_indicator =
     0,
     0,
     sizeof(ogs_pfcp_tlv_steering_mode_indicator_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_group_id =
@@ -2278,7 +2686,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_group_id =
     0,
     0,
     sizeof(ogs_pfcp_tlv_group_id_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_cp_ip_address =
@@ -2289,7 +2699,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_cp_ip_address =
     0,
     0,
     sizeof(ogs_pfcp_tlv_cp_ip_address_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_ip_address_and_port_number_replacement =
@@ -2300,7 +2712,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_ip_address_and_port_number_replacement =
     0,
     0,
     sizeof(ogs_pfcp_tlv_ip_address_and_port_number_replacement_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_dns_query_filter =
@@ -2311,7 +2725,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_dns_query_filter =
     0,
     0,
     sizeof(ogs_pfcp_tlv_dns_query_filter_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_direct_reporting_information =
@@ -2322,7 +2738,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_direct_reporting_information =
     0,
     0,
     sizeof(ogs_pfcp_tlv_direct_reporting_information_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_event_notification_uri =
@@ -2333,7 +2751,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_event_notification_uri =
     0,
     0,
     sizeof(ogs_pfcp_tlv_event_notification_uri_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_notification_correlation_id =
@@ -2344,7 +2764,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_notification_correlation_id =
     0,
     0,
     sizeof(ogs_pfcp_tlv_notification_correlation_id_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_reporting_flags =
@@ -2355,7 +2777,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_reporting_flags =
     0,
     0,
     sizeof(ogs_pfcp_tlv_reporting_flags_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_predefined_rules_name =
@@ -2366,7 +2790,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_predefined_rules_name =
     0,
     0,
     sizeof(ogs_pfcp_tlv_predefined_rules_name_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_remove_mbs_unicast_parameters =
@@ -2377,7 +2803,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_remove_mbs_unicast_parameters =
     0,
     0,
     sizeof(ogs_pfcp_tlv_remove_mbs_unicast_parameters_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_mbs_session_identifier =
@@ -2388,7 +2816,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_mbs_session_identifier =
     0,
     0,
     sizeof(ogs_pfcp_tlv_mbs_session_identifier_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_multicast_transport_information =
@@ -2399,7 +2829,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_multicast_transport_information =
     0,
     0,
     sizeof(ogs_pfcp_tlv_multicast_transport_information_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_mbsn4mbreq_flags =
@@ -2410,7 +2842,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_mbsn4mbreq_flags =
     0,
     0,
     sizeof(ogs_pfcp_tlv_mbsn4mbreq_flags_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_local_ingress_tunnel =
@@ -2421,7 +2855,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_local_ingress_tunnel =
     0,
     0,
     sizeof(ogs_pfcp_tlv_local_ingress_tunnel_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_mbs_unicast_parameters_id =
@@ -2432,7 +2868,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_mbs_unicast_parameters_id =
     0,
     0,
     sizeof(ogs_pfcp_tlv_mbs_unicast_parameters_id_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_mbsn4resp_flags =
@@ -2443,7 +2881,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_mbsn4resp_flags =
     0,
     0,
     sizeof(ogs_pfcp_tlv_mbsn4resp_flags_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_tunnel_password =
@@ -2454,7 +2894,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_tunnel_password =
     0,
     0,
     sizeof(ogs_pfcp_tlv_tunnel_password_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_area_session_id =
@@ -2465,7 +2907,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_area_session_id =
     0,
     0,
     sizeof(ogs_pfcp_tlv_area_session_id_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_peer_up_restart_report =
@@ -2476,7 +2920,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_peer_up_restart_report =
     0,
     0,
     sizeof(ogs_pfcp_tlv_peer_up_restart_report_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_dscp_to_ppi_mapping_information =
@@ -2487,7 +2933,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_dscp_to_ppi_mapping_information =
     0,
     0,
     sizeof(ogs_pfcp_tlv_dscp_to_ppi_mapping_information_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_pfcpsdrsp_flags =
@@ -2498,7 +2946,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_pfcpsdrsp_flags =
     0,
     0,
     sizeof(ogs_pfcp_tlv_pfcpsdrsp_flags_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_qer_indications =
@@ -2509,7 +2959,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_qer_indications =
     0,
     0,
     sizeof(ogs_pfcp_tlv_qer_indications_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_vendor_specific_node_report_type =
@@ -2520,7 +2972,9 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_vendor_specific_node_report_type =
     0,
     0,
     sizeof(ogs_pfcp_tlv_vendor_specific_node_report_type_t),
-    { NULL }
+    { NULL },
+    NULL,
+    NULL
 };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_configured_time_domain =
@@ -2531,8 +2985,31 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_configured_time_domain =
     0,
     0,
     sizeof(ogs_pfcp_tlv_configured_time_domain_t),
-    { NULL }
-};
+    { NULL },
+    NULL,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_ethernet_packet_filter_slot[16] = {
+    [0] = { OGS_PFCP_SDF_FILTER_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_pfcp_tlv_ethernet_packet_filter_t, sdf_filter) - sizeof(ogs_tlv_presence_t) },
+    [1] = { 0, 0, 0, 8, 7,
+        offsetof(ogs_pfcp_tlv_ethernet_packet_filter_t, sdf_filter) + sizeof(ogs_pfcp_tlv_sdf_filter_t) - sizeof(ogs_tlv_presence_t) },
+    [3] = { OGS_PFCP_ETHERNET_FILTER_PROPERTIES_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_ethernet_packet_filter_t, ethernet_filter_properties) - sizeof(ogs_tlv_presence_t) },
+    [6] = { OGS_PFCP_C_TAG_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_tlv_ethernet_packet_filter_t, c_tag) - sizeof(ogs_tlv_presence_t) },
+    [8] = { OGS_PFCP_ETHERTYPE_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_ethernet_packet_filter_t, ethertype) - sizeof(ogs_tlv_presence_t) },
+    [10] = { OGS_PFCP_ETHERNET_FILTER_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_ethernet_packet_filter_t, ethernet_filter_id) - sizeof(ogs_tlv_presence_t) },
+    [13] = { OGS_PFCP_MAC_ADDRESS_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_ethernet_packet_filter_t, mac_address) - sizeof(ogs_tlv_presence_t) },
+    [15] = { OGS_PFCP_S_TAG_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_pfcp_tlv_ethernet_packet_filter_t, s_tag) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_ethernet_packet_filter = {
+    15, 8, ogs_pfcp_tlv_index_ethernet_packet_filter_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_ethernet_packet_filter =
 {
@@ -2552,8 +3029,19 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_ethernet_packet_filter =
         &ogs_pfcp_tlv_desc_sdf_filter,
         &ogs_tlv_desc_more8,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_ethernet_packet_filter,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_redundant_transmission_parameters_slot[4] = {
+    [1] = { OGS_PFCP_F_TEID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_redundant_transmission_parameters_t, local_f_teid_for_redundant_transmission) - sizeof(ogs_tlv_presence_t) },
+    [2] = { OGS_PFCP_NETWORK_INSTANCE_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_redundant_transmission_parameters_t, network_instance_for_redundant_transmission) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_redundant_transmission_parameters = {
+    3, 2, ogs_pfcp_tlv_index_redundant_transmission_parameters_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_redundant_transmission_parameters =
 {
@@ -2567,8 +3055,19 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_redundant_transmission_parameters =
         &ogs_pfcp_tlv_desc_f_teid,
         &ogs_pfcp_tlv_desc_network_instance,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_redundant_transmission_parameters,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_ip_multicast_addressing_info_within_pfcp_session_establishment_request_slot[4] = {
+    [0] = { OGS_PFCP_SOURCE_IP_ADDRESS_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_ip_multicast_addressing_info_within_pfcp_session_establishment_request_t, source_ip_address) - sizeof(ogs_tlv_presence_t) },
+    [3] = { OGS_PFCP_IP_MULTICAST_ADDRESS_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_ip_multicast_addressing_info_within_pfcp_session_establishment_request_t, ip_multicast_address) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_ip_multicast_addressing_info_within_pfcp_session_establishment_request = {
+    3, 2, ogs_pfcp_tlv_index_ip_multicast_addressing_info_within_pfcp_session_establishment_request_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_ip_multicast_addressing_info_within_pfcp_session_establishment_request =
 {
@@ -2582,8 +3081,61 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_ip_multicast_addressing_info_within_pfcp_sessio
         &ogs_pfcp_tlv_desc_ip_multicast_address,
         &ogs_pfcp_tlv_desc_source_ip_address,
         NULL,
-    }
-};
+    },
+    &ogs_pfcp_tlv_index_ip_multicast_addressing_info_within_pfcp_session_establishment_request,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_pdi_slot[64] = {
+    [0] = { 0, 0, 0, 9, 8,
+        offsetof(ogs_pfcp_tlv_pdi_t, sdf_filter) + sizeof(ogs_pfcp_tlv_sdf_filter_t) - sizeof(ogs_tlv_presence_t) },
+    [1] = { 0, 0, 1, 15, 8,
+        offsetof(ogs_pfcp_tlv_pdi_t, framed_route) + sizeof(ogs_pfcp_tlv_framed_route_t) - sizeof(ogs_tlv_presence_t) },
+    [2] = { 0, 0, 2, 18, 8,
+        offsetof(ogs_pfcp_tlv_pdi_t, framed_ipv6_route) + sizeof(ogs_pfcp_tlv_framed_ipv6_route_t) - sizeof(ogs_tlv_presence_t) },
+    [9] = { OGS_PFCP_MBS_SESSION_IDENTIFIER_TYPE, 0, 0, 22, 19,
+        offsetof(ogs_pfcp_tlv_pdi_t, mbs_session_identifier) - sizeof(ogs_tlv_presence_t) },
+    [10] = { OGS_PFCP_FRAMED_ROUTING_TYPE, 0, 0, 16, 14,
+        offsetof(ogs_pfcp_tlv_pdi_t, framed_routing) - sizeof(ogs_tlv_presence_t) },
+    [11] = { OGS_PFCP_TRAFFIC_ENDPOINT_ID_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_pfcp_tlv_pdi_t, traffic_endpoint_id) - sizeof(ogs_tlv_presence_t) },
+    [13] = { OGS_PFCP_F_TEID_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_pdi_t, local_f_teid) - sizeof(ogs_tlv_presence_t) },
+    [20] = { OGS_PFCP_LOCAL_INGRESS_TUNNEL_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_pdi_t, local_ingress_tunnel) - sizeof(ogs_tlv_presence_t) },
+    [21] = { OGS_PFCP_UE_IP_ADDRESS_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_pfcp_tlv_pdi_t, ue_ip_address) - sizeof(ogs_tlv_presence_t) },
+    [24] = { OGS_PFCP_APPLICATION_ID_TYPE, 0, 0, 10, 9,
+        offsetof(ogs_pfcp_tlv_pdi_t, application_id) - sizeof(ogs_tlv_presence_t) },
+    [28] = { OGS_PFCP_QFI_TYPE, 0, 0, 13, 12,
+        offsetof(ogs_pfcp_tlv_pdi_t, qfi) - sizeof(ogs_tlv_presence_t) },
+    [29] = { OGS_PFCP_IP_MULTICAST_ADDRESSING_INFO_WITHIN_PFCP_SESSION_ESTABLISHMENT_REQUEST_TYPE, 0, 0, 20, 17,
+        offsetof(ogs_pfcp_tlv_pdi_t, ip_multicast_addressing_info) - sizeof(ogs_tlv_presence_t) },
+    [30] = { OGS_PFCP_ETHERNET_PDU_SESSION_INFORMATION_TYPE, 0, 0, 11, 10,
+        offsetof(ogs_pfcp_tlv_pdi_t, ethernet_pdu_session_information) - sizeof(ogs_tlv_presence_t) },
+    [32] = { OGS_PFCP__INTERFACE_TYPE_TYPE, 0, 0, 19, 16,
+        offsetof(ogs_pfcp_tlv_pdi_t, source_interface_type) - sizeof(ogs_tlv_presence_t) },
+    [35] = { OGS_PFCP_FRAMED_IPV6_ROUTE_TYPE, 0, 0, 17, 15,
+        offsetof(ogs_pfcp_tlv_pdi_t, framed_ipv6_route) - sizeof(ogs_tlv_presence_t) },
+    [36] = { OGS_PFCP_ETHERNET_PACKET_FILTER_TYPE, 0, 0, 12, 11,
+        offsetof(ogs_pfcp_tlv_pdi_t, ethernet_packet_filter) - sizeof(ogs_tlv_presence_t) },
+    [38] = { OGS_PFCP_NETWORK_INSTANCE_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_pdi_t, network_instance) - sizeof(ogs_tlv_presence_t) },
+    [39] = { OGS_PFCP_REDUNDANT_TRANSMISSION_PARAMETERS_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_tlv_pdi_t, redundant_transmission_detection_parameters) - sizeof(ogs_tlv_presence_t) },
+    [42] = { OGS_PFCP_AREA_SESSION_ID_TYPE, 0, 0, 23, 20,
+        offsetof(ogs_pfcp_tlv_pdi_t, area_session_id) - sizeof(ogs_tlv_presence_t) },
+    [49] = { OGS_PFCP_FRAMED_ROUTE_TYPE, 0, 0, 14, 13,
+        offsetof(ogs_pfcp_tlv_pdi_t, framed_route) - sizeof(ogs_tlv_presence_t) },
+    [52] = { OGS_PFCP_SOURCE_INTERFACE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_pdi_t, source_interface) - sizeof(ogs_tlv_presence_t) },
+    [54] = { OGS_PFCP_DNS_QUERY_FILTER_TYPE, 0, 0, 21, 18,
+        offsetof(ogs_pfcp_tlv_pdi_t, dns_query_filter) - sizeof(ogs_tlv_presence_t) },
+    [63] = { OGS_PFCP_SDF_FILTER_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_pfcp_tlv_pdi_t, sdf_filter) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_pdi = {
+    63, 21, ogs_pfcp_tlv_index_pdi_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_pdi =
 {
@@ -2618,8 +3170,19 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_pdi =
         &ogs_pfcp_tlv_desc_mbs_session_identifier,
         &ogs_pfcp_tlv_desc_area_session_id,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_pdi,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_transport_delay_reporting_slot[4] = {
+    [2] = { OGS_PFCP_TRANSPORT_LEVEL_MARKING_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_transport_delay_reporting_t, dscp) - sizeof(ogs_tlv_presence_t) },
+    [3] = { OGS_PFCP_REMOTE_GTP_U_PEER_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_transport_delay_reporting_t, preceding_ul_gtp_u_peer) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_transport_delay_reporting = {
+    3, 2, ogs_pfcp_tlv_index_transport_delay_reporting_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_transport_delay_reporting =
 {
@@ -2633,8 +3196,51 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_transport_delay_reporting =
         &ogs_pfcp_tlv_desc_remote_gtp_u_peer,
         &ogs_pfcp_tlv_desc_transport_level_marking,
         NULL,
-    }
-};
+    },
+    &ogs_pfcp_tlv_index_transport_delay_reporting,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_create_pdr_slot[64] = {
+    [0] = { 0, 0, 0, 7, 6,
+        offsetof(ogs_pfcp_tlv_create_pdr_t, urr_id) + sizeof(ogs_pfcp_tlv_urr_id_t) - sizeof(ogs_tlv_presence_t) },
+    [4] = { OGS_PFCP_DEACTIVATION_TIME_TYPE, 0, 0, 11, 10,
+        offsetof(ogs_pfcp_tlv_create_pdr_t, deactivation_time) - sizeof(ogs_tlv_presence_t) },
+    [7] = { OGS_PFCP_OUTER_HEADER_REMOVAL_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_create_pdr_t, outer_header_removal) - sizeof(ogs_tlv_presence_t) },
+    [12] = { OGS_PFCP_FAR_ID_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_tlv_create_pdr_t, far_id) - sizeof(ogs_tlv_presence_t) },
+    [21] = { OGS_PFCP_PRECEDENCE_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_create_pdr_t, precedence) - sizeof(ogs_tlv_presence_t) },
+    [22] = { OGS_PFCP_UE_IP_ADDRESS_TYPE, 0, 0, 15, 14,
+        offsetof(ogs_pfcp_tlv_create_pdr_t, ue_ip_address_pool_identity) - sizeof(ogs_tlv_presence_t) },
+    [26] = { OGS_PFCP_ACTIVATE_PREDEFINED_RULES_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_pfcp_tlv_create_pdr_t, activate_predefined_rules) - sizeof(ogs_tlv_presence_t) },
+    [27] = { OGS_PFCP_MAR_ID_TYPE, 0, 0, 12, 11,
+        offsetof(ogs_pfcp_tlv_create_pdr_t, mar_id) - sizeof(ogs_tlv_presence_t) },
+    [28] = { OGS_PFCP_IP_MULTICAST_ADDRESSING_INFO_WITHIN_PFCP_SESSION_ESTABLISHMENT_REQUEST_TYPE, 0, 0, 14, 13,
+        offsetof(ogs_pfcp_tlv_create_pdr_t, ip_multicast_addressing_info) - sizeof(ogs_tlv_presence_t) },
+    [29] = { OGS_PFCP_RAT_TYPE_TYPE, 0, 0, 18, 17,
+        offsetof(ogs_pfcp_tlv_create_pdr_t, rat_type) - sizeof(ogs_tlv_presence_t) },
+    [33] = { OGS_PFCP_MPTCP_APPLICABLE_INDICATION_TYPE, 0, 0, 16, 15,
+        offsetof(ogs_pfcp_tlv_create_pdr_t, mptcp_applicable_indication) - sizeof(ogs_tlv_presence_t) },
+    [37] = { OGS_PFCP_QER_ID_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_pfcp_tlv_create_pdr_t, qer_id) - sizeof(ogs_tlv_presence_t) },
+    [41] = { OGS_PFCP_URR_ID_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_pfcp_tlv_create_pdr_t, urr_id) - sizeof(ogs_tlv_presence_t) },
+    [43] = { OGS_PFCP_ACTIVATION_TIME_TYPE, 0, 0, 10, 9,
+        offsetof(ogs_pfcp_tlv_create_pdr_t, activation_time) - sizeof(ogs_tlv_presence_t) },
+    [50] = { OGS_PFCP_PDI_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_create_pdr_t, pdi) - sizeof(ogs_tlv_presence_t) },
+    [55] = { OGS_PFCP_TRANSPORT_DELAY_REPORTING_TYPE, 0, 0, 17, 16,
+        offsetof(ogs_pfcp_tlv_create_pdr_t, transport_delay_reporting) - sizeof(ogs_tlv_presence_t) },
+    [56] = { OGS_PFCP_PDR_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_create_pdr_t, pdr_id) - sizeof(ogs_tlv_presence_t) },
+    [59] = { OGS_PFCP_PACKET_REPLICATION_AND_DETECTION_CARRY_ON_INFORMATION_TYPE, 0, 0, 13, 12,
+        offsetof(ogs_pfcp_tlv_create_pdr_t, packet_replication_and_detection_carry_on_information) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_create_pdr = {
+    63, 18, ogs_pfcp_tlv_index_create_pdr_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_create_pdr =
 {
@@ -2664,8 +3270,39 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_create_pdr =
         &ogs_pfcp_tlv_desc_transport_delay_reporting,
         &ogs_pfcp_tlv_desc_rat_type,
         NULL,
-    }
-};
+    },
+    &ogs_pfcp_tlv_index_create_pdr,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_forwarding_parameters_slot[32] = {
+    [0] = { OGS_PFCP__INTERFACE_TYPE_TYPE, 0, 0, 10, 9,
+        offsetof(ogs_pfcp_tlv_forwarding_parameters_t, destination_interface_type) - sizeof(ogs_tlv_presence_t) },
+    [1] = { OGS_PFCP_FORWARDING_POLICY_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_pfcp_tlv_forwarding_parameters_t, forwarding_policy) - sizeof(ogs_tlv_presence_t) },
+    [2] = { OGS_PFCP_PROXYING_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_pfcp_tlv_forwarding_parameters_t, proxying) - sizeof(ogs_tlv_presence_t) },
+    [6] = { OGS_PFCP_NETWORK_INSTANCE_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_forwarding_parameters_t, network_instance) - sizeof(ogs_tlv_presence_t) },
+    [8] = { OGS_PFCP_DATA_NETWORK_ACCESS_IDENTIFIER_TYPE, 0, 0, 11, 10,
+        offsetof(ogs_pfcp_tlv_forwarding_parameters_t, data_network_access_identifier) - sizeof(ogs_tlv_presence_t) },
+    [11] = { OGS_PFCP_TRAFFIC_ENDPOINT_ID_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_pfcp_tlv_forwarding_parameters_t, linked_traffic_endpoint_id) - sizeof(ogs_tlv_presence_t) },
+    [14] = { OGS_PFCP_TRANSPORT_LEVEL_MARKING_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_tlv_forwarding_parameters_t, transport_level_marking) - sizeof(ogs_tlv_presence_t) },
+    [18] = { OGS_PFCP_HEADER_ENRICHMENT_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_pfcp_tlv_forwarding_parameters_t, header_enrichment) - sizeof(ogs_tlv_presence_t) },
+    [20] = { OGS_PFCP_OUTER_HEADER_CREATION_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_forwarding_parameters_t, outer_header_creation) - sizeof(ogs_tlv_presence_t) },
+    [22] = { OGS_PFCP_REDIRECT_INFORMATION_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_forwarding_parameters_t, redirect_information) - sizeof(ogs_tlv_presence_t) },
+    [26] = { OGS_PFCP_DESTINATION_INTERFACE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_forwarding_parameters_t, destination_interface) - sizeof(ogs_tlv_presence_t) },
+    [29] = { OGS_PFCP_IP_ADDRESS_AND_PORT_NUMBER_REPLACEMENT_TYPE, 0, 0, 12, 11,
+        offsetof(ogs_pfcp_tlv_forwarding_parameters_t, ip_address_and_port_number_replacement) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_forwarding_parameters = {
+    31, 12, ogs_pfcp_tlv_index_forwarding_parameters_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_forwarding_parameters =
 {
@@ -2689,8 +3326,23 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_forwarding_parameters =
         &ogs_pfcp_tlv_desc_data_network_access_identifier,
         &ogs_pfcp_tlv_desc_ip_address_and_port_number_replacement,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_forwarding_parameters,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_duplicating_parameters_slot[8] = {
+    [1] = { OGS_PFCP_FORWARDING_POLICY_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_duplicating_parameters_t, forwarding_policy) - sizeof(ogs_tlv_presence_t) },
+    [2] = { OGS_PFCP_DESTINATION_INTERFACE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_duplicating_parameters_t, destination_interface) - sizeof(ogs_tlv_presence_t) },
+    [4] = { OGS_PFCP_OUTER_HEADER_CREATION_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_duplicating_parameters_t, outer_header_creation) - sizeof(ogs_tlv_presence_t) },
+    [6] = { OGS_PFCP_TRANSPORT_LEVEL_MARKING_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_duplicating_parameters_t, transport_level_marking) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_duplicating_parameters = {
+    7, 4, ogs_pfcp_tlv_index_duplicating_parameters_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_duplicating_parameters =
 {
@@ -2706,9 +3358,20 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_duplicating_parameters =
         &ogs_pfcp_tlv_desc_transport_level_marking,
         &ogs_pfcp_tlv_desc_forwarding_policy,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_duplicating_parameters,
+    NULL
 };
 
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_redundant_transmission_forwarding_parameters_slot[4] = {
+    [0] = { OGS_PFCP_OUTER_HEADER_CREATION_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_redundant_transmission_forwarding_parameters_t, outer_header_creation) - sizeof(ogs_tlv_presence_t) },
+    [2] = { OGS_PFCP_NETWORK_INSTANCE_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_redundant_transmission_forwarding_parameters_t, network_instance_for_redundant_transmission) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_redundant_transmission_forwarding_parameters = {
+    3, 2, ogs_pfcp_tlv_index_redundant_transmission_forwarding_parameters_slot };
+
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_redundant_transmission_forwarding_parameters =
 {
     OGS_TLV_COMPOUND,
@@ -2721,8 +3384,25 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_redundant_transmission_forwarding_parameters =
         &ogs_pfcp_tlv_desc_outer_header_creation,
         &ogs_pfcp_tlv_desc_network_instance,
         NULL,
-    }
-};
+    },
+    &ogs_pfcp_tlv_index_redundant_transmission_forwarding_parameters,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_mbs_multicast_parameters_slot[16] = {
+    [0] = { OGS_PFCP__INTERFACE_TYPE_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_tlv_mbs_multicast_parameters_t, destination_interface_type) - sizeof(ogs_tlv_presence_t) },
+    [4] = { OGS_PFCP_OUTER_HEADER_CREATION_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_mbs_multicast_parameters_t, outer_header_creation) - sizeof(ogs_tlv_presence_t) },
+    [6] = { OGS_PFCP_NETWORK_INSTANCE_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_mbs_multicast_parameters_t, network_instance) - sizeof(ogs_tlv_presence_t) },
+    [10] = { OGS_PFCP_DESTINATION_INTERFACE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_mbs_multicast_parameters_t, destination_interface) - sizeof(ogs_tlv_presence_t) },
+    [14] = { OGS_PFCP_TRANSPORT_LEVEL_MARKING_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_mbs_multicast_parameters_t, transport_level_marking) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_mbs_multicast_parameters = {
+    15, 5, ogs_pfcp_tlv_index_mbs_multicast_parameters_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_mbs_multicast_parameters =
 {
@@ -2739,8 +3419,27 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_mbs_multicast_parameters =
         &ogs_pfcp_tlv_desc_transport_level_marking,
         &ogs_pfcp_tlv_desc__interface_type,
         NULL,
-    }
-};
+    },
+    &ogs_pfcp_tlv_index_mbs_multicast_parameters,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_add_mbs_unicast_parameters_slot[16] = {
+    [0] = { OGS_PFCP__INTERFACE_TYPE_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_pfcp_tlv_add_mbs_unicast_parameters_t, destination_interface_type) - sizeof(ogs_tlv_presence_t) },
+    [4] = { OGS_PFCP_OUTER_HEADER_CREATION_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_add_mbs_unicast_parameters_t, outer_header_creation) - sizeof(ogs_tlv_presence_t) },
+    [6] = { OGS_PFCP_NETWORK_INSTANCE_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_add_mbs_unicast_parameters_t, network_instance) - sizeof(ogs_tlv_presence_t) },
+    [10] = { OGS_PFCP_DESTINATION_INTERFACE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_add_mbs_unicast_parameters_t, destination_interface) - sizeof(ogs_tlv_presence_t) },
+    [13] = { OGS_PFCP_MBS_UNICAST_PARAMETERS_ID_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_add_mbs_unicast_parameters_t, mbs_unicast_parameters_id) - sizeof(ogs_tlv_presence_t) },
+    [14] = { OGS_PFCP_TRANSPORT_LEVEL_MARKING_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_tlv_add_mbs_unicast_parameters_t, transport_level_marking) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_add_mbs_unicast_parameters = {
+    15, 6, ogs_pfcp_tlv_index_add_mbs_unicast_parameters_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_add_mbs_unicast_parameters =
 {
@@ -2758,8 +3457,31 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_add_mbs_unicast_parameters =
         &ogs_pfcp_tlv_desc_transport_level_marking,
         &ogs_pfcp_tlv_desc__interface_type,
         NULL,
-    }
-};
+    },
+    &ogs_pfcp_tlv_index_add_mbs_unicast_parameters,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_create_far_slot[16] = {
+    [0] = { OGS_PFCP_ADD_MBS_UNICAST_PARAMETERS_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_pfcp_tlv_create_far_t, add_mbs_unicast_parameters) - sizeof(ogs_tlv_presence_t) },
+    [4] = { OGS_PFCP_FORWARDING_PARAMETERS_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_create_far_t, forwarding_parameters) - sizeof(ogs_tlv_presence_t) },
+    [5] = { OGS_PFCP_MBS_MULTICAST_PARAMETERS_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_pfcp_tlv_create_far_t, mbs_multicast_parameters) - sizeof(ogs_tlv_presence_t) },
+    [8] = { OGS_PFCP_BAR_ID_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_tlv_create_far_t, bar_id) - sizeof(ogs_tlv_presence_t) },
+    [12] = { OGS_PFCP_FAR_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_create_far_t, far_id) - sizeof(ogs_tlv_presence_t) },
+    [13] = { OGS_PFCP_APPLY_ACTION_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_create_far_t, apply_action) - sizeof(ogs_tlv_presence_t) },
+    [14] = { OGS_PFCP_DUPLICATING_PARAMETERS_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_create_far_t, duplicating_parameters) - sizeof(ogs_tlv_presence_t) },
+    [15] = { OGS_PFCP_REDUNDANT_TRANSMISSION_FORWARDING_PARAMETERS_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_pfcp_tlv_create_far_t, redundant_transmission_forwarding_parameters) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_create_far = {
+    15, 8, ogs_pfcp_tlv_index_create_far_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_create_far =
 {
@@ -2779,8 +3501,39 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_create_far =
         &ogs_pfcp_tlv_desc_mbs_multicast_parameters,
         &ogs_pfcp_tlv_desc_add_mbs_unicast_parameters,
         NULL,
-    }
-};
+    },
+    &ogs_pfcp_tlv_index_create_far,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_update_forwarding_parameters_slot[32] = {
+    [0] = { OGS_PFCP__INTERFACE_TYPE_TYPE, 0, 0, 10, 9,
+        offsetof(ogs_pfcp_tlv_update_forwarding_parameters_t, destination_interface_type) - sizeof(ogs_tlv_presence_t) },
+    [1] = { OGS_PFCP_FORWARDING_POLICY_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_pfcp_tlv_update_forwarding_parameters_t, forwarding_policy) - sizeof(ogs_tlv_presence_t) },
+    [6] = { OGS_PFCP_NETWORK_INSTANCE_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_update_forwarding_parameters_t, network_instance) - sizeof(ogs_tlv_presence_t) },
+    [8] = { OGS_PFCP_DATA_NETWORK_ACCESS_IDENTIFIER_TYPE, 0, 0, 11, 10,
+        offsetof(ogs_pfcp_tlv_update_forwarding_parameters_t, data_network_access_identifier) - sizeof(ogs_tlv_presence_t) },
+    [9] = { OGS_PFCP_PFCPSMREQ_FLAGS_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_pfcp_tlv_update_forwarding_parameters_t, pfcpsmreq_flags) - sizeof(ogs_tlv_presence_t) },
+    [11] = { OGS_PFCP_TRAFFIC_ENDPOINT_ID_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_pfcp_tlv_update_forwarding_parameters_t, linked_traffic_endpoint_id) - sizeof(ogs_tlv_presence_t) },
+    [14] = { OGS_PFCP_TRANSPORT_LEVEL_MARKING_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_tlv_update_forwarding_parameters_t, transport_level_marking) - sizeof(ogs_tlv_presence_t) },
+    [18] = { OGS_PFCP_HEADER_ENRICHMENT_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_pfcp_tlv_update_forwarding_parameters_t, header_enrichment) - sizeof(ogs_tlv_presence_t) },
+    [20] = { OGS_PFCP_OUTER_HEADER_CREATION_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_update_forwarding_parameters_t, outer_header_creation) - sizeof(ogs_tlv_presence_t) },
+    [22] = { OGS_PFCP_REDIRECT_INFORMATION_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_update_forwarding_parameters_t, redirect_information) - sizeof(ogs_tlv_presence_t) },
+    [26] = { OGS_PFCP_DESTINATION_INTERFACE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_update_forwarding_parameters_t, destination_interface) - sizeof(ogs_tlv_presence_t) },
+    [29] = { OGS_PFCP_IP_ADDRESS_AND_PORT_NUMBER_REPLACEMENT_TYPE, 0, 0, 12, 11,
+        offsetof(ogs_pfcp_tlv_update_forwarding_parameters_t, ip_address_and_port_number_replacement) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_update_forwarding_parameters = {
+    31, 12, ogs_pfcp_tlv_index_update_forwarding_parameters_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_update_forwarding_parameters =
 {
@@ -2804,8 +3557,23 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_update_forwarding_parameters =
         &ogs_pfcp_tlv_desc_data_network_access_identifier,
         &ogs_pfcp_tlv_desc_ip_address_and_port_number_replacement,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_update_forwarding_parameters,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_update_duplicating_parameters_slot[8] = {
+    [1] = { OGS_PFCP_FORWARDING_POLICY_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_update_duplicating_parameters_t, forwarding_policy) - sizeof(ogs_tlv_presence_t) },
+    [2] = { OGS_PFCP_DESTINATION_INTERFACE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_update_duplicating_parameters_t, destination_interface) - sizeof(ogs_tlv_presence_t) },
+    [4] = { OGS_PFCP_OUTER_HEADER_CREATION_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_update_duplicating_parameters_t, outer_header_creation) - sizeof(ogs_tlv_presence_t) },
+    [6] = { OGS_PFCP_TRANSPORT_LEVEL_MARKING_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_update_duplicating_parameters_t, transport_level_marking) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_update_duplicating_parameters = {
+    7, 4, ogs_pfcp_tlv_index_update_duplicating_parameters_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_update_duplicating_parameters =
 {
@@ -2821,8 +3589,31 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_update_duplicating_parameters =
         &ogs_pfcp_tlv_desc_transport_level_marking,
         &ogs_pfcp_tlv_desc_forwarding_policy,
         NULL,
-    }
-};
+    },
+    &ogs_pfcp_tlv_index_update_duplicating_parameters,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_update_far_slot[16] = {
+    [0] = { OGS_PFCP_REMOVE_MBS_UNICAST_PARAMETERS_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_pfcp_tlv_update_far_t, remove_mbs_unicast_parameters) - sizeof(ogs_tlv_presence_t) },
+    [1] = { OGS_PFCP_UPDATE_DUPLICATING_PARAMETERS_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_update_far_t, update_duplicating_parameters) - sizeof(ogs_tlv_presence_t) },
+    [3] = { OGS_PFCP_UPDATE_FORWARDING_PARAMETERS_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_update_far_t, update_forwarding_parameters) - sizeof(ogs_tlv_presence_t) },
+    [8] = { OGS_PFCP_BAR_ID_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_pfcp_tlv_update_far_t, bar_id) - sizeof(ogs_tlv_presence_t) },
+    [12] = { OGS_PFCP_FAR_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_update_far_t, far_id) - sizeof(ogs_tlv_presence_t) },
+    [13] = { OGS_PFCP_APPLY_ACTION_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_update_far_t, apply_action) - sizeof(ogs_tlv_presence_t) },
+    [14] = { OGS_PFCP_REDUNDANT_TRANSMISSION_FORWARDING_PARAMETERS_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_tlv_update_far_t, redundant_transmission_forwarding_parameters) - sizeof(ogs_tlv_presence_t) },
+    [15] = { OGS_PFCP_ADD_MBS_UNICAST_PARAMETERS_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_pfcp_tlv_update_far_t, add_mbs_unicast_parameters) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_update_far = {
+    15, 8, ogs_pfcp_tlv_index_update_far_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_update_far =
 {
@@ -2842,9 +3633,18 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_update_far =
         &ogs_pfcp_tlv_desc_add_mbs_unicast_parameters,
         &ogs_pfcp_tlv_desc_remove_mbs_unicast_parameters,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_update_far,
+    NULL
 };
 
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_pfd_context_slot[2] = {
+    [1] = { OGS_PFCP_PFD_CONTENTS_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_pfd_context_t, pfd_contents) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_pfd_context = {
+    1, 1, ogs_pfcp_tlv_index_pfd_context_slot };
+
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_pfd_context =
 {
     OGS_TLV_COMPOUND,
@@ -2856,8 +3656,19 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_pfd_context =
     {
         &ogs_pfcp_tlv_desc_pfd_contents,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_pfd_context,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_application_id_s_pfds_slot[4] = {
+    [0] = { OGS_PFCP_APPLICATION_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_application_id_s_pfds_t, application_id) - sizeof(ogs_tlv_presence_t) },
+    [3] = { OGS_PFCP_PFD_CONTEXT_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_application_id_s_pfds_t, pfd_context) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_application_id_s_pfds = {
+    3, 2, ogs_pfcp_tlv_index_application_id_s_pfds_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_application_id_s_pfds =
 {
@@ -2871,8 +3682,19 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_application_id_s_pfds =
         &ogs_pfcp_tlv_desc_application_id,
         &ogs_pfcp_tlv_desc_pfd_context,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_application_id_s_pfds,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_ethernet_traffic_information_slot[4] = {
+    [0] = { OGS_PFCP_MAC_ADDRESSES_DETECTED_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_ethernet_traffic_information_t, mac_addresses_detected) - sizeof(ogs_tlv_presence_t) },
+    [1] = { OGS_PFCP_MAC_ADDRESSES_REMOVED_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_ethernet_traffic_information_t, mac_addresses_removed) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_ethernet_traffic_information = {
+    3, 2, ogs_pfcp_tlv_index_ethernet_traffic_information_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_ethernet_traffic_information =
 {
@@ -2886,8 +3708,27 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_ethernet_traffic_information =
         &ogs_pfcp_tlv_desc_mac_addresses_detected,
         &ogs_pfcp_tlv_desc_mac_addresses_removed,
         NULL,
-    }
-};
+    },
+    &ogs_pfcp_tlv_index_ethernet_traffic_information,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index__access_forwarding_action_information_slot[16] = {
+    [0] = { 0, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_tlv__access_forwarding_action_information_t, urr_id) + sizeof(ogs_pfcp_tlv_urr_id_t) - sizeof(ogs_tlv_presence_t) },
+    [5] = { OGS_PFCP_WEIGHT_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv__access_forwarding_action_information_t, weight) - sizeof(ogs_tlv_presence_t) },
+    [9] = { OGS_PFCP_URR_ID_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv__access_forwarding_action_information_t, urr_id) - sizeof(ogs_tlv_presence_t) },
+    [11] = { OGS_PFCP_RAT_TYPE_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_pfcp_tlv__access_forwarding_action_information_t, rat_type) - sizeof(ogs_tlv_presence_t) },
+    [12] = { OGS_PFCP_FAR_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv__access_forwarding_action_information_t, far_id) - sizeof(ogs_tlv_presence_t) },
+    [14] = { OGS_PFCP_PRIORITY_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv__access_forwarding_action_information_t, priority) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index__access_forwarding_action_information = {
+    15, 6, ogs_pfcp_tlv_index__access_forwarding_action_information_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc__access_forwarding_action_information =
 {
@@ -2905,8 +3746,27 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc__access_forwarding_action_information =
         &ogs_tlv_desc_more8,
         &ogs_pfcp_tlv_desc_rat_type,
         NULL,
-    }
-};
+    },
+    &ogs_pfcp_tlv_index__access_forwarding_action_information,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_non__access_forwarding_action_information_slot[16] = {
+    [0] = { 0, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_tlv_non__access_forwarding_action_information_t, urr_id) + sizeof(ogs_pfcp_tlv_urr_id_t) - sizeof(ogs_tlv_presence_t) },
+    [5] = { OGS_PFCP_WEIGHT_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_non__access_forwarding_action_information_t, weight) - sizeof(ogs_tlv_presence_t) },
+    [9] = { OGS_PFCP_URR_ID_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_non__access_forwarding_action_information_t, urr_id) - sizeof(ogs_tlv_presence_t) },
+    [11] = { OGS_PFCP_RAT_TYPE_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_pfcp_tlv_non__access_forwarding_action_information_t, rat_type) - sizeof(ogs_tlv_presence_t) },
+    [12] = { OGS_PFCP_FAR_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_non__access_forwarding_action_information_t, far_id) - sizeof(ogs_tlv_presence_t) },
+    [14] = { OGS_PFCP_PRIORITY_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_non__access_forwarding_action_information_t, priority) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_non__access_forwarding_action_information = {
+    15, 6, ogs_pfcp_tlv_index_non__access_forwarding_action_information_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_non__access_forwarding_action_information =
 {
@@ -2924,8 +3784,25 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_non__access_forwarding_action_information =
         &ogs_tlv_desc_more8,
         &ogs_pfcp_tlv_desc_rat_type,
         NULL,
-    }
-};
+    },
+    &ogs_pfcp_tlv_index_non__access_forwarding_action_information,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_update__access_forwarding_action_information_slot[16] = {
+    [5] = { OGS_PFCP_WEIGHT_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_update__access_forwarding_action_information_t, weight) - sizeof(ogs_tlv_presence_t) },
+    [9] = { OGS_PFCP_URR_ID_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_update__access_forwarding_action_information_t, urr_id) - sizeof(ogs_tlv_presence_t) },
+    [11] = { OGS_PFCP_RAT_TYPE_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_tlv_update__access_forwarding_action_information_t, rat_type) - sizeof(ogs_tlv_presence_t) },
+    [12] = { OGS_PFCP_FAR_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_update__access_forwarding_action_information_t, far_id) - sizeof(ogs_tlv_presence_t) },
+    [14] = { OGS_PFCP_PRIORITY_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_update__access_forwarding_action_information_t, priority) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_update__access_forwarding_action_information = {
+    15, 5, ogs_pfcp_tlv_index_update__access_forwarding_action_information_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_update__access_forwarding_action_information =
 {
@@ -2942,8 +3819,25 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_update__access_forwarding_action_information =
         &ogs_pfcp_tlv_desc_urr_id,
         &ogs_pfcp_tlv_desc_rat_type,
         NULL,
-    }
-};
+    },
+    &ogs_pfcp_tlv_index_update__access_forwarding_action_information,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_update_non__access_forwarding_action_information_slot[16] = {
+    [5] = { OGS_PFCP_WEIGHT_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_update_non__access_forwarding_action_information_t, weight) - sizeof(ogs_tlv_presence_t) },
+    [9] = { OGS_PFCP_URR_ID_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_update_non__access_forwarding_action_information_t, urr_id) - sizeof(ogs_tlv_presence_t) },
+    [11] = { OGS_PFCP_RAT_TYPE_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_tlv_update_non__access_forwarding_action_information_t, rat_type) - sizeof(ogs_tlv_presence_t) },
+    [12] = { OGS_PFCP_FAR_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_update_non__access_forwarding_action_information_t, far_id) - sizeof(ogs_tlv_presence_t) },
+    [14] = { OGS_PFCP_PRIORITY_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_update_non__access_forwarding_action_information_t, priority) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_update_non__access_forwarding_action_information = {
+    15, 5, ogs_pfcp_tlv_index_update_non__access_forwarding_action_information_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_update_non__access_forwarding_action_information =
 {
@@ -2960,8 +3854,17 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_update_non__access_forwarding_action_informatio
         &ogs_pfcp_tlv_desc_urr_id,
         &ogs_pfcp_tlv_desc_rat_type,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_update_non__access_forwarding_action_information,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_access_availability_report_slot[2] = {
+    [1] = { OGS_PFCP_ACCESS_AVAILABILITY_INFORMATION_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_access_availability_report_t, access_availability_information) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_access_availability_report = {
+    1, 1, ogs_pfcp_tlv_index_access_availability_report_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_access_availability_report =
 {
@@ -2974,9 +3877,24 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_access_availability_report =
     {
         &ogs_pfcp_tlv_desc_access_availability_information,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_access_availability_report,
+    NULL
 };
 
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_qos_monitoring_report_slot[8] = {
+    [0] = { OGS_PFCP_QOS_MONITORING_MEASUREMENT_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_qos_monitoring_report_t, qos_monitoring_measurement) - sizeof(ogs_tlv_presence_t) },
+    [3] = { OGS_PFCP_START_TIME_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_qos_monitoring_report_t, start_time) - sizeof(ogs_tlv_presence_t) },
+    [4] = { OGS_PFCP_QFI_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_qos_monitoring_report_t, qfi) - sizeof(ogs_tlv_presence_t) },
+    [5] = { OGS_PFCP_TIME_STAMP_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_qos_monitoring_report_t, time_stamp) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_qos_monitoring_report = {
+    7, 4, ogs_pfcp_tlv_index_qos_monitoring_report_slot };
+
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_qos_monitoring_report =
 {
     OGS_TLV_COMPOUND,
@@ -2991,8 +3909,19 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_qos_monitoring_report =
         &ogs_pfcp_tlv_desc_time_stamp,
         &ogs_pfcp_tlv_desc_start_time,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_qos_monitoring_report,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_mptcp_parameters_slot[4] = {
+    [0] = { OGS_PFCP_MPTCP_ADDRESS_INFORMATION_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_mptcp_parameters_t, mptcp_address_information) - sizeof(ogs_tlv_presence_t) },
+    [1] = { OGS_PFCP_UE_LINK_SPECIFIC_IP_ADDRESS_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_mptcp_parameters_t, ue_link_specific_ip_address) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_mptcp_parameters = {
+    3, 2, ogs_pfcp_tlv_index_mptcp_parameters_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_mptcp_parameters =
 {
@@ -3006,8 +3935,17 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_mptcp_parameters =
         &ogs_pfcp_tlv_desc_mptcp_address_information,
         &ogs_pfcp_tlv_desc_ue_link_specific_ip_address,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_mptcp_parameters,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_atsss_ll_parameters_slot[2] = {
+    [1] = { OGS_PFCP_ATSSS_LL_INFORMATION_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_atsss_ll_parameters_t, atsss_ll_information) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_atsss_ll_parameters = {
+    1, 1, ogs_pfcp_tlv_index_atsss_ll_parameters_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_atsss_ll_parameters =
 {
@@ -3020,8 +3958,19 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_atsss_ll_parameters =
     {
         &ogs_pfcp_tlv_desc_atsss_ll_information,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_atsss_ll_parameters,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_pmf_parameters_slot[4] = {
+    [0] = { OGS_PFCP_QFI_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_pmf_parameters_t, qos_flow_identifier) - sizeof(ogs_tlv_presence_t) },
+    [2] = { OGS_PFCP_PMF_ADDRESS_INFORMATION_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_pmf_parameters_t, pmf_address_information) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_pmf_parameters = {
+    3, 2, ogs_pfcp_tlv_index_pmf_parameters_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_pmf_parameters =
 {
@@ -3035,9 +3984,20 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_pmf_parameters =
         &ogs_pfcp_tlv_desc_pmf_address_information,
         &ogs_pfcp_tlv_desc_qfi,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_pmf_parameters,
+    NULL
 };
 
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_join_ip_multicast_information_ie_within_usage_report_slot[4] = {
+    [0] = { OGS_PFCP_SOURCE_IP_ADDRESS_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_join_ip_multicast_information_ie_within_usage_report_t, source_ip_address) - sizeof(ogs_tlv_presence_t) },
+    [3] = { OGS_PFCP_IP_MULTICAST_ADDRESS_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_join_ip_multicast_information_ie_within_usage_report_t, ip_multicast_address) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_join_ip_multicast_information_ie_within_usage_report = {
+    3, 2, ogs_pfcp_tlv_index_join_ip_multicast_information_ie_within_usage_report_slot };
+
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_join_ip_multicast_information_ie_within_usage_report =
 {
     OGS_TLV_COMPOUND,
@@ -3050,8 +4010,19 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_join_ip_multicast_information_ie_within_usage_r
         &ogs_pfcp_tlv_desc_ip_multicast_address,
         &ogs_pfcp_tlv_desc_source_ip_address,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_join_ip_multicast_information_ie_within_usage_report,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_leave_ip_multicast_information_ie_within_usage_report_slot[4] = {
+    [0] = { OGS_PFCP_SOURCE_IP_ADDRESS_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_leave_ip_multicast_information_ie_within_usage_report_t, source_ip_address) - sizeof(ogs_tlv_presence_t) },
+    [3] = { OGS_PFCP_IP_MULTICAST_ADDRESS_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_leave_ip_multicast_information_ie_within_usage_report_t, ip_multicast_address) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_leave_ip_multicast_information_ie_within_usage_report = {
+    3, 2, ogs_pfcp_tlv_index_leave_ip_multicast_information_ie_within_usage_report_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_leave_ip_multicast_information_ie_within_usage_report =
 {
@@ -3065,8 +4036,81 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_leave_ip_multicast_information_ie_within_usage_
         &ogs_pfcp_tlv_desc_ip_multicast_address,
         &ogs_pfcp_tlv_desc_source_ip_address,
         NULL,
-    }
-};
+    },
+    &ogs_pfcp_tlv_index_leave_ip_multicast_information_ie_within_usage_report,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_create_urr_slot[128] = {
+    [0] = { OGS_PFCP_SDF_FILTER_TYPE, 0, 0, 31, 30,
+        offsetof(ogs_pfcp_tlv_create_urr_t, exempted_sdf_filter_for_quota_action) - sizeof(ogs_tlv_presence_t) },
+    [1] = { 0, 0, 0, 32, 31,
+        offsetof(ogs_pfcp_tlv_create_urr_t, exempted_sdf_filter_for_quota_action) + sizeof(ogs_pfcp_tlv_sdf_filter_t) - sizeof(ogs_tlv_presence_t) },
+    [2] = { OGS_PFCP_LINKED_URR_ID_TYPE, 0, 0, 22, 21,
+        offsetof(ogs_pfcp_tlv_create_urr_t, linked_urr_id) - sizeof(ogs_tlv_presence_t) },
+    [4] = { OGS_PFCP_INACTIVITY_DETECTION_TIME_TYPE, 0, 0, 21, 20,
+        offsetof(ogs_pfcp_tlv_create_urr_t, inactivity_detection_time) - sizeof(ogs_tlv_presence_t) },
+    [6] = { OGS_PFCP_AGGREGATED_URRS_TYPE, 0, 0, 25, 24,
+        offsetof(ogs_pfcp_tlv_create_urr_t, aggregated_urrs) - sizeof(ogs_tlv_presence_t) },
+    [8] = { OGS_PFCP_DROPPED_DL_TRAFFIC_THRESHOLD_TYPE, 0, 0, 12, 11,
+        offsetof(ogs_pfcp_tlv_create_urr_t, dropped_dl_traffic_threshold) - sizeof(ogs_tlv_presence_t) },
+    [12] = { OGS_PFCP_FAR_ID_TYPE, 0, 0, 26, 25,
+        offsetof(ogs_pfcp_tlv_create_urr_t, far_id_for_quota_action) - sizeof(ogs_tlv_presence_t) },
+    [14] = { OGS_PFCP_MEASUREMENT_METHOD_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_create_urr_t, measurement_method) - sizeof(ogs_tlv_presence_t) },
+    [17] = { OGS_PFCP_SUBSEQUENT_VOLUME_QUOTA_TYPE, 0, 0, 17, 16,
+        offsetof(ogs_pfcp_tlv_create_urr_t, subsequent_volume_quota) - sizeof(ogs_tlv_presence_t) },
+    [27] = { OGS_PFCP_ADDITIONAL_MONITORING_TIME_TYPE, 0, 0, 28, 27,
+        offsetof(ogs_pfcp_tlv_create_urr_t, additional_monitoring_time) - sizeof(ogs_tlv_presence_t) },
+    [32] = { OGS_PFCP_TIME_THRESHOLD_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_pfcp_tlv_create_urr_t, time_threshold) - sizeof(ogs_tlv_presence_t) },
+    [38] = { OGS_PFCP_SUBSEQUENT_EVENT_QUOTA_TYPE, 0, 0, 20, 19,
+        offsetof(ogs_pfcp_tlv_create_urr_t, subsequent_event_quota) - sizeof(ogs_tlv_presence_t) },
+    [41] = { OGS_PFCP_URR_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_create_urr_t, urr_id) - sizeof(ogs_tlv_presence_t) },
+    [43] = { OGS_PFCP_SUBSEQUENT_TIME_THRESHOLD_TYPE, 0, 0, 16, 15,
+        offsetof(ogs_pfcp_tlv_create_urr_t, subsequent_time_threshold) - sizeof(ogs_tlv_presence_t) },
+    [45] = { OGS_PFCP_USER_PLANE_INACTIVITY_TIMER_TYPE, 0, 0, 33, 32,
+        offsetof(ogs_pfcp_tlv_create_urr_t, user_plane_inactivity_timer) - sizeof(ogs_tlv_presence_t) },
+    [47] = { OGS_PFCP_QUOTA_HOLDING_TIME_TYPE, 0, 0, 11, 10,
+        offsetof(ogs_pfcp_tlv_create_urr_t, quota_holding_time) - sizeof(ogs_tlv_presence_t) },
+    [58] = { OGS_PFCP_TIME_QUOTA_TYPE, 0, 0, 10, 9,
+        offsetof(ogs_pfcp_tlv_create_urr_t, time_quota) - sizeof(ogs_tlv_presence_t) },
+    [64] = { OGS_PFCP_MEASUREMENT_PERIOD_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_create_urr_t, measurement_period) - sizeof(ogs_tlv_presence_t) },
+    [66] = { OGS_PFCP_ETHERNET_INACTIVITY_TIMER_TYPE, 0, 0, 27, 26,
+        offsetof(ogs_pfcp_tlv_create_urr_t, ethernet_inactivity_timer) - sizeof(ogs_tlv_presence_t) },
+    [68] = { OGS_PFCP_MEASUREMENT_INFORMATION_TYPE, 0, 0, 23, 22,
+        offsetof(ogs_pfcp_tlv_create_urr_t, measurement_information) - sizeof(ogs_tlv_presence_t) },
+    [70] = { OGS_PFCP_NUMBER_OF_REPORTS_TYPE, 0, 0, 29, 28,
+        offsetof(ogs_pfcp_tlv_create_urr_t, number_of_reports) - sizeof(ogs_tlv_presence_t) },
+    [71] = { OGS_PFCP_VOLUME_THRESHOLD_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_tlv_create_urr_t, volume_threshold) - sizeof(ogs_tlv_presence_t) },
+    [77] = { OGS_PFCP_EVENT_THRESHOLD_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_pfcp_tlv_create_urr_t, event_threshold) - sizeof(ogs_tlv_presence_t) },
+    [82] = { OGS_PFCP_SUBSEQUENT_VOLUME_THRESHOLD_TYPE, 0, 0, 15, 14,
+        offsetof(ogs_pfcp_tlv_create_urr_t, subsequent_volume_threshold) - sizeof(ogs_tlv_presence_t) },
+    [88] = { OGS_PFCP_APPLICATION_ID_TYPE, 0, 0, 30, 29,
+        offsetof(ogs_pfcp_tlv_create_urr_t, exempted_application_id_for_quota_action) - sizeof(ogs_tlv_presence_t) },
+    [93] = { OGS_PFCP_REPORTING_TRIGGERS_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_create_urr_t, reporting_triggers) - sizeof(ogs_tlv_presence_t) },
+    [97] = { OGS_PFCP_VOLUME_QUOTA_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_pfcp_tlv_create_urr_t, volume_quota) - sizeof(ogs_tlv_presence_t) },
+    [106] = { OGS_PFCP_SUBSEQUENT_TIME_QUOTA_TYPE, 0, 0, 18, 17,
+        offsetof(ogs_pfcp_tlv_create_urr_t, subsequent_time_quota) - sizeof(ogs_tlv_presence_t) },
+    [109] = { OGS_PFCP_QUOTA_VALIDITY_TIME_TYPE, 0, 0, 13, 12,
+        offsetof(ogs_pfcp_tlv_create_urr_t, quota_validity_time) - sizeof(ogs_tlv_presence_t) },
+    [116] = { OGS_PFCP_EVENT_QUOTA_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_pfcp_tlv_create_urr_t, event_quota) - sizeof(ogs_tlv_presence_t) },
+    [121] = { OGS_PFCP_MONITORING_TIME_TYPE, 0, 0, 14, 13,
+        offsetof(ogs_pfcp_tlv_create_urr_t, monitoring_time) - sizeof(ogs_tlv_presence_t) },
+    [123] = { OGS_PFCP_TIME_QUOTA_MECHANISM_TYPE, 0, 0, 24, 23,
+        offsetof(ogs_pfcp_tlv_create_urr_t, time_quota_mechanism) - sizeof(ogs_tlv_presence_t) },
+    [127] = { OGS_PFCP_SUBSEQUENT_EVENT_THRESHOLD_TYPE, 0, 0, 19, 18,
+        offsetof(ogs_pfcp_tlv_create_urr_t, subsequent_event_threshold) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_create_urr = {
+    127, 33, ogs_pfcp_tlv_index_create_urr_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_create_urr =
 {
@@ -3111,8 +4155,43 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_create_urr =
         &ogs_tlv_desc_more8,
         &ogs_pfcp_tlv_desc_user_plane_inactivity_timer,
         NULL,
-    }
-};
+    },
+    &ogs_pfcp_tlv_index_create_urr,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_create_qer_slot[32] = {
+    [3] = { OGS_PFCP_GBR_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_tlv_create_qer_t, guaranteed_bitrate) - sizeof(ogs_tlv_presence_t) },
+    [4] = { OGS_PFCP_RQI_TYPE, 0, 0, 10, 9,
+        offsetof(ogs_pfcp_tlv_create_qer_t, reflective_qos) - sizeof(ogs_tlv_presence_t) },
+    [5] = { OGS_PFCP_QER_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_create_qer_t, qer_id) - sizeof(ogs_tlv_presence_t) },
+    [6] = { OGS_PFCP_QER_CONTROL_INDICATIONS_TYPE, 0, 0, 13, 12,
+        offsetof(ogs_pfcp_tlv_create_qer_t, qer_control_indications) - sizeof(ogs_tlv_presence_t) },
+    [7] = { OGS_PFCP_QER_INDICATIONS_TYPE, 0, 0, 14, 13,
+        offsetof(ogs_pfcp_tlv_create_qer_t, qer_indications) - sizeof(ogs_tlv_presence_t) },
+    [10] = { OGS_PFCP_MBR_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_create_qer_t, maximum_bitrate) - sizeof(ogs_tlv_presence_t) },
+    [14] = { OGS_PFCP_PACKET_RATE_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_pfcp_tlv_create_qer_t, packet_rate) - sizeof(ogs_tlv_presence_t) },
+    [15] = { OGS_PFCP_PAGING_POLICY_INDICATOR_TYPE, 0, 0, 11, 10,
+        offsetof(ogs_pfcp_tlv_create_qer_t, paging_policy_indicator) - sizeof(ogs_tlv_presence_t) },
+    [17] = { OGS_PFCP_GATE_STATUS_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_create_qer_t, gate_status) - sizeof(ogs_tlv_presence_t) },
+    [21] = { OGS_PFCP_AVERAGING_WINDOW_TYPE, 0, 0, 12, 11,
+        offsetof(ogs_pfcp_tlv_create_qer_t, averaging_window) - sizeof(ogs_tlv_presence_t) },
+    [25] = { OGS_PFCP_PACKET_RATE_STATUS_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_pfcp_tlv_create_qer_t, packet_rate_status) - sizeof(ogs_tlv_presence_t) },
+    [26] = { OGS_PFCP_DL_FLOW_LEVEL_MARKING_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_pfcp_tlv_create_qer_t, dl_flow_level_marking) - sizeof(ogs_tlv_presence_t) },
+    [28] = { OGS_PFCP_QER_CORRELATION_ID_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_create_qer_t, qer_correlation_id) - sizeof(ogs_tlv_presence_t) },
+    [29] = { OGS_PFCP_QFI_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_pfcp_tlv_create_qer_t, qos_flow_identifier) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_create_qer = {
+    31, 14, ogs_pfcp_tlv_index_create_qer_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_create_qer =
 {
@@ -3138,8 +4217,25 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_create_qer =
         &ogs_pfcp_tlv_desc_qer_control_indications,
         &ogs_pfcp_tlv_desc_qer_indications,
         NULL,
-    }
-};
+    },
+    &ogs_pfcp_tlv_index_create_qer,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_created_pdr_slot[16] = {
+    [4] = { OGS_PFCP_LOCAL_INGRESS_TUNNEL_TYPE, 0, 0, 5, 3,
+        offsetof(ogs_pfcp_tlv_created_pdr_t, local_ingress_tunnel) - sizeof(ogs_tlv_presence_t) },
+    [5] = { OGS_PFCP_UE_IP_ADDRESS_TYPE, 0, 0, 4, 2,
+        offsetof(ogs_pfcp_tlv_created_pdr_t, ue_ip_address) - sizeof(ogs_tlv_presence_t) },
+    [8] = { OGS_PFCP_PDR_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_created_pdr_t, pdr_id) - sizeof(ogs_tlv_presence_t) },
+    [13] = { OGS_PFCP_F_TEID_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_created_pdr_t, local_f_teid) - sizeof(ogs_tlv_presence_t) },
+    [14] = { OGS_PFCP_F_TEID_TYPE, 0, 1, 3, 1,
+        offsetof(ogs_pfcp_tlv_created_pdr_t, local_f_teid_for_redundant_transmission) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_created_pdr = {
+    15, 4, ogs_pfcp_tlv_index_created_pdr_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_created_pdr =
 {
@@ -3156,8 +4252,43 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_created_pdr =
         &ogs_pfcp_tlv_desc_ue_ip_address,
         &ogs_pfcp_tlv_desc_local_ingress_tunnel,
         NULL,
-    }
-};
+    },
+    &ogs_pfcp_tlv_index_created_pdr,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_update_pdr_slot[32] = {
+    [4] = { OGS_PFCP_DEACTIVATION_TIME_TYPE, 0, 0, 11, 10,
+        offsetof(ogs_pfcp_tlv_update_pdr_t, deactivation_time) - sizeof(ogs_tlv_presence_t) },
+    [5] = { OGS_PFCP_QER_ID_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_pfcp_tlv_update_pdr_t, qer_id) - sizeof(ogs_tlv_presence_t) },
+    [7] = { OGS_PFCP_OUTER_HEADER_REMOVAL_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_update_pdr_t, outer_header_removal) - sizeof(ogs_tlv_presence_t) },
+    [9] = { OGS_PFCP_URR_ID_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_pfcp_tlv_update_pdr_t, urr_id) - sizeof(ogs_tlv_presence_t) },
+    [11] = { OGS_PFCP_ACTIVATION_TIME_TYPE, 0, 0, 10, 9,
+        offsetof(ogs_pfcp_tlv_update_pdr_t, activation_time) - sizeof(ogs_tlv_presence_t) },
+    [12] = { OGS_PFCP_FAR_ID_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_tlv_update_pdr_t, far_id) - sizeof(ogs_tlv_presence_t) },
+    [18] = { OGS_PFCP_PDI_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_update_pdr_t, pdi) - sizeof(ogs_tlv_presence_t) },
+    [19] = { OGS_PFCP_DEACTIVATE_PREDEFINED_RULES_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_pfcp_tlv_update_pdr_t, deactivate_predefined_rules) - sizeof(ogs_tlv_presence_t) },
+    [21] = { OGS_PFCP_PRECEDENCE_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_update_pdr_t, precedence) - sizeof(ogs_tlv_presence_t) },
+    [23] = { OGS_PFCP_TRANSPORT_DELAY_REPORTING_TYPE, 0, 0, 13, 12,
+        offsetof(ogs_pfcp_tlv_update_pdr_t, transport_delay_reporting) - sizeof(ogs_tlv_presence_t) },
+    [24] = { OGS_PFCP_PDR_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_update_pdr_t, pdr_id) - sizeof(ogs_tlv_presence_t) },
+    [26] = { OGS_PFCP_ACTIVATE_PREDEFINED_RULES_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_pfcp_tlv_update_pdr_t, activate_predefined_rules) - sizeof(ogs_tlv_presence_t) },
+    [27] = { OGS_PFCP_RAT_TYPE_TYPE, 0, 0, 14, 13,
+        offsetof(ogs_pfcp_tlv_update_pdr_t, rat_type) - sizeof(ogs_tlv_presence_t) },
+    [28] = { OGS_PFCP_IP_MULTICAST_ADDRESSING_INFO_WITHIN_PFCP_SESSION_ESTABLISHMENT_REQUEST_TYPE, 0, 0, 12, 11,
+        offsetof(ogs_pfcp_tlv_update_pdr_t, ip_multicast_addressing_info) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_update_pdr = {
+    31, 14, ogs_pfcp_tlv_index_update_pdr_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_update_pdr =
 {
@@ -3183,8 +4314,25 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_update_pdr =
         &ogs_pfcp_tlv_desc_transport_delay_reporting,
         &ogs_pfcp_tlv_desc_rat_type,
         NULL,
-    }
-};
+    },
+    &ogs_pfcp_tlv_index_update_pdr,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_update_bar_pfcp_session_report_response_slot[16] = {
+    [0] = { OGS_PFCP_DL_BUFFERING_SUGGESTED_PACKET_COUNT_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_update_bar_pfcp_session_report_response_t, dl_buffering_suggested_packet_count) - sizeof(ogs_tlv_presence_t) },
+    [7] = { OGS_PFCP_DL_BUFFERING_DURATION_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_update_bar_pfcp_session_report_response_t, dl_buffering_duration) - sizeof(ogs_tlv_presence_t) },
+    [8] = { OGS_PFCP_BAR_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_update_bar_pfcp_session_report_response_t, bar_id) - sizeof(ogs_tlv_presence_t) },
+    [12] = { OGS_PFCP_SUGGESTED_BUFFERING_PACKETS_COUNT_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_tlv_update_bar_pfcp_session_report_response_t, suggested_buffering_packets_count) - sizeof(ogs_tlv_presence_t) },
+    [14] = { OGS_PFCP_DOWNLINK_DATA_NOTIFICATION_DELAY_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_update_bar_pfcp_session_report_response_t, downlink_data_notification_delay) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_update_bar_pfcp_session_report_response = {
+    15, 5, ogs_pfcp_tlv_index_update_bar_pfcp_session_report_response_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_update_bar_pfcp_session_report_response =
 {
@@ -3201,8 +4349,81 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_update_bar_pfcp_session_report_response =
         &ogs_pfcp_tlv_desc_dl_buffering_suggested_packet_count,
         &ogs_pfcp_tlv_desc_suggested_buffering_packets_count,
         NULL,
-    }
-};
+    },
+    &ogs_pfcp_tlv_index_update_bar_pfcp_session_report_response,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_update_urr_slot[128] = {
+    [0] = { OGS_PFCP_SDF_FILTER_TYPE, 0, 0, 31, 30,
+        offsetof(ogs_pfcp_tlv_update_urr_t, exempted_sdf_filter_for_quota_action) - sizeof(ogs_tlv_presence_t) },
+    [1] = { 0, 0, 0, 32, 31,
+        offsetof(ogs_pfcp_tlv_update_urr_t, exempted_sdf_filter_for_quota_action) + sizeof(ogs_pfcp_tlv_sdf_filter_t) - sizeof(ogs_tlv_presence_t) },
+    [2] = { OGS_PFCP_LINKED_URR_ID_TYPE, 0, 0, 22, 21,
+        offsetof(ogs_pfcp_tlv_update_urr_t, linked_urr_id) - sizeof(ogs_tlv_presence_t) },
+    [4] = { OGS_PFCP_INACTIVITY_DETECTION_TIME_TYPE, 0, 0, 21, 20,
+        offsetof(ogs_pfcp_tlv_update_urr_t, inactivity_detection_time) - sizeof(ogs_tlv_presence_t) },
+    [6] = { OGS_PFCP_AGGREGATED_URRS_TYPE, 0, 0, 25, 24,
+        offsetof(ogs_pfcp_tlv_update_urr_t, aggregated_urrs) - sizeof(ogs_tlv_presence_t) },
+    [8] = { OGS_PFCP_DROPPED_DL_TRAFFIC_THRESHOLD_TYPE, 0, 0, 12, 11,
+        offsetof(ogs_pfcp_tlv_update_urr_t, dropped_dl_traffic_threshold) - sizeof(ogs_tlv_presence_t) },
+    [12] = { OGS_PFCP_FAR_ID_TYPE, 0, 0, 26, 25,
+        offsetof(ogs_pfcp_tlv_update_urr_t, far_id_for_quota_action) - sizeof(ogs_tlv_presence_t) },
+    [14] = { OGS_PFCP_MEASUREMENT_METHOD_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_update_urr_t, measurement_method) - sizeof(ogs_tlv_presence_t) },
+    [17] = { OGS_PFCP_SUBSEQUENT_VOLUME_QUOTA_TYPE, 0, 0, 17, 16,
+        offsetof(ogs_pfcp_tlv_update_urr_t, subsequent_volume_quota) - sizeof(ogs_tlv_presence_t) },
+    [27] = { OGS_PFCP_ADDITIONAL_MONITORING_TIME_TYPE, 0, 0, 28, 27,
+        offsetof(ogs_pfcp_tlv_update_urr_t, additional_monitoring_time) - sizeof(ogs_tlv_presence_t) },
+    [32] = { OGS_PFCP_TIME_THRESHOLD_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_pfcp_tlv_update_urr_t, time_threshold) - sizeof(ogs_tlv_presence_t) },
+    [38] = { OGS_PFCP_SUBSEQUENT_EVENT_QUOTA_TYPE, 0, 0, 20, 19,
+        offsetof(ogs_pfcp_tlv_update_urr_t, subsequent_event_quota) - sizeof(ogs_tlv_presence_t) },
+    [41] = { OGS_PFCP_URR_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_update_urr_t, urr_id) - sizeof(ogs_tlv_presence_t) },
+    [43] = { OGS_PFCP_SUBSEQUENT_TIME_THRESHOLD_TYPE, 0, 0, 16, 15,
+        offsetof(ogs_pfcp_tlv_update_urr_t, subsequent_time_threshold) - sizeof(ogs_tlv_presence_t) },
+    [45] = { OGS_PFCP_USER_PLANE_INACTIVITY_TIMER_TYPE, 0, 0, 33, 32,
+        offsetof(ogs_pfcp_tlv_update_urr_t, user_plane_inactivity_timer) - sizeof(ogs_tlv_presence_t) },
+    [47] = { OGS_PFCP_QUOTA_HOLDING_TIME_TYPE, 0, 0, 11, 10,
+        offsetof(ogs_pfcp_tlv_update_urr_t, quota_holding_time) - sizeof(ogs_tlv_presence_t) },
+    [58] = { OGS_PFCP_TIME_QUOTA_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_pfcp_tlv_update_urr_t, time_quota) - sizeof(ogs_tlv_presence_t) },
+    [64] = { OGS_PFCP_MEASUREMENT_PERIOD_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_update_urr_t, measurement_period) - sizeof(ogs_tlv_presence_t) },
+    [66] = { OGS_PFCP_ETHERNET_INACTIVITY_TIMER_TYPE, 0, 0, 27, 26,
+        offsetof(ogs_pfcp_tlv_update_urr_t, ethernet_inactivity_timer) - sizeof(ogs_tlv_presence_t) },
+    [68] = { OGS_PFCP_MEASUREMENT_INFORMATION_TYPE, 0, 0, 23, 22,
+        offsetof(ogs_pfcp_tlv_update_urr_t, measurement_information) - sizeof(ogs_tlv_presence_t) },
+    [70] = { OGS_PFCP_NUMBER_OF_REPORTS_TYPE, 0, 0, 29, 28,
+        offsetof(ogs_pfcp_tlv_update_urr_t, number_of_reports) - sizeof(ogs_tlv_presence_t) },
+    [71] = { OGS_PFCP_VOLUME_THRESHOLD_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_tlv_update_urr_t, volume_threshold) - sizeof(ogs_tlv_presence_t) },
+    [77] = { OGS_PFCP_EVENT_THRESHOLD_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_pfcp_tlv_update_urr_t, event_threshold) - sizeof(ogs_tlv_presence_t) },
+    [82] = { OGS_PFCP_SUBSEQUENT_VOLUME_THRESHOLD_TYPE, 0, 0, 15, 14,
+        offsetof(ogs_pfcp_tlv_update_urr_t, subsequent_volume_threshold) - sizeof(ogs_tlv_presence_t) },
+    [88] = { OGS_PFCP_APPLICATION_ID_TYPE, 0, 0, 30, 29,
+        offsetof(ogs_pfcp_tlv_update_urr_t, exempted_application_id_for_quota_action) - sizeof(ogs_tlv_presence_t) },
+    [93] = { OGS_PFCP_REPORTING_TRIGGERS_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_update_urr_t, reporting_triggers) - sizeof(ogs_tlv_presence_t) },
+    [97] = { OGS_PFCP_VOLUME_QUOTA_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_pfcp_tlv_update_urr_t, volume_quota) - sizeof(ogs_tlv_presence_t) },
+    [106] = { OGS_PFCP_SUBSEQUENT_TIME_QUOTA_TYPE, 0, 0, 18, 17,
+        offsetof(ogs_pfcp_tlv_update_urr_t, subsequent_time_quota) - sizeof(ogs_tlv_presence_t) },
+    [109] = { OGS_PFCP_QUOTA_VALIDITY_TIME_TYPE, 0, 0, 13, 12,
+        offsetof(ogs_pfcp_tlv_update_urr_t, quota_validity_time) - sizeof(ogs_tlv_presence_t) },
+    [116] = { OGS_PFCP_EVENT_QUOTA_TYPE, 0, 0, 10, 9,
+        offsetof(ogs_pfcp_tlv_update_urr_t, event_quota) - sizeof(ogs_tlv_presence_t) },
+    [121] = { OGS_PFCP_MONITORING_TIME_TYPE, 0, 0, 14, 13,
+        offsetof(ogs_pfcp_tlv_update_urr_t, monitoring_time) - sizeof(ogs_tlv_presence_t) },
+    [123] = { OGS_PFCP_TIME_QUOTA_MECHANISM_TYPE, 0, 0, 24, 23,
+        offsetof(ogs_pfcp_tlv_update_urr_t, time_quota_mechanism) - sizeof(ogs_tlv_presence_t) },
+    [127] = { OGS_PFCP_SUBSEQUENT_EVENT_THRESHOLD_TYPE, 0, 0, 19, 18,
+        offsetof(ogs_pfcp_tlv_update_urr_t, subsequent_event_threshold) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_update_urr = {
+    127, 33, ogs_pfcp_tlv_index_update_urr_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_update_urr =
 {
@@ -3247,8 +4468,39 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_update_urr =
         &ogs_tlv_desc_more8,
         &ogs_pfcp_tlv_desc_user_plane_inactivity_timer,
         NULL,
-    }
-};
+    },
+    &ogs_pfcp_tlv_index_update_urr,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_update_qer_slot[32] = {
+    [3] = { OGS_PFCP_GBR_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_tlv_update_qer_t, guaranteed_bitrate) - sizeof(ogs_tlv_presence_t) },
+    [4] = { OGS_PFCP_RQI_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_pfcp_tlv_update_qer_t, reflective_qos) - sizeof(ogs_tlv_presence_t) },
+    [5] = { OGS_PFCP_QER_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_update_qer_t, qer_id) - sizeof(ogs_tlv_presence_t) },
+    [6] = { OGS_PFCP_QER_CONTROL_INDICATIONS_TYPE, 0, 0, 12, 11,
+        offsetof(ogs_pfcp_tlv_update_qer_t, qer_control_indications) - sizeof(ogs_tlv_presence_t) },
+    [10] = { OGS_PFCP_MBR_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_update_qer_t, maximum_bitrate) - sizeof(ogs_tlv_presence_t) },
+    [14] = { OGS_PFCP_PACKET_RATE_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_pfcp_tlv_update_qer_t, packet_rate) - sizeof(ogs_tlv_presence_t) },
+    [15] = { OGS_PFCP_PAGING_POLICY_INDICATOR_TYPE, 0, 0, 10, 9,
+        offsetof(ogs_pfcp_tlv_update_qer_t, paging_policy_indicator) - sizeof(ogs_tlv_presence_t) },
+    [17] = { OGS_PFCP_GATE_STATUS_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_update_qer_t, gate_status) - sizeof(ogs_tlv_presence_t) },
+    [21] = { OGS_PFCP_AVERAGING_WINDOW_TYPE, 0, 0, 11, 10,
+        offsetof(ogs_pfcp_tlv_update_qer_t, averaging_window) - sizeof(ogs_tlv_presence_t) },
+    [25] = { OGS_PFCP_DL_FLOW_LEVEL_MARKING_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_pfcp_tlv_update_qer_t, dl_flow_level_marking) - sizeof(ogs_tlv_presence_t) },
+    [28] = { OGS_PFCP_QER_CORRELATION_ID_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_update_qer_t, qer_correlation_id) - sizeof(ogs_tlv_presence_t) },
+    [29] = { OGS_PFCP_QFI_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_pfcp_tlv_update_qer_t, qos_flow_identifier) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_update_qer = {
+    31, 12, ogs_pfcp_tlv_index_update_qer_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_update_qer =
 {
@@ -3272,9 +4524,18 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_update_qer =
         &ogs_pfcp_tlv_desc_averaging_window,
         &ogs_pfcp_tlv_desc_qer_control_indications,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_update_qer,
+    NULL
 };
 
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_remove_pdr_slot[2] = {
+    [0] = { OGS_PFCP_PDR_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_remove_pdr_t, pdr_id) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_remove_pdr = {
+    1, 1, ogs_pfcp_tlv_index_remove_pdr_slot };
+
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_remove_pdr =
 {
     OGS_TLV_COMPOUND,
@@ -3286,8 +4547,17 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_remove_pdr =
     {
         &ogs_pfcp_tlv_desc_pdr_id,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_remove_pdr,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_remove_far_slot[2] = {
+    [0] = { OGS_PFCP_FAR_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_remove_far_t, far_id) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_remove_far = {
+    1, 1, ogs_pfcp_tlv_index_remove_far_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_remove_far =
 {
@@ -3300,8 +4570,17 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_remove_far =
     {
         &ogs_pfcp_tlv_desc_far_id,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_remove_far,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_remove_urr_slot[2] = {
+    [1] = { OGS_PFCP_URR_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_remove_urr_t, urr_id) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_remove_urr = {
+    1, 1, ogs_pfcp_tlv_index_remove_urr_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_remove_urr =
 {
@@ -3314,8 +4593,17 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_remove_urr =
     {
         &ogs_pfcp_tlv_desc_urr_id,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_remove_urr,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_remove_qer_slot[2] = {
+    [1] = { OGS_PFCP_QER_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_remove_qer_t, qer_id) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_remove_qer = {
+    1, 1, ogs_pfcp_tlv_index_remove_qer_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_remove_qer =
 {
@@ -3328,9 +4616,20 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_remove_qer =
     {
         &ogs_pfcp_tlv_desc_qer_id,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_remove_qer,
+    NULL
 };
 
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_load_control_information_slot[4] = {
+    [0] = { OGS_PFCP_SEQUENCE_NUMBER_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_load_control_information_t, load_control_sequence_number) - sizeof(ogs_tlv_presence_t) },
+    [1] = { OGS_PFCP_METRIC_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_load_control_information_t, load_metric) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_load_control_information = {
+    3, 2, ogs_pfcp_tlv_index_load_control_information_slot };
+
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_load_control_information =
 {
     OGS_TLV_COMPOUND,
@@ -3343,8 +4642,23 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_load_control_information =
         &ogs_pfcp_tlv_desc_sequence_number,
         &ogs_pfcp_tlv_desc_metric,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_load_control_information,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_overload_control_information_slot[8] = {
+    [4] = { OGS_PFCP_SEQUENCE_NUMBER_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_overload_control_information_t, overload_control_sequence_number) - sizeof(ogs_tlv_presence_t) },
+    [5] = { OGS_PFCP_METRIC_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_overload_control_information_t, overload_reduction_metric) - sizeof(ogs_tlv_presence_t) },
+    [6] = { OGS_PFCP_OCI_FLAGS_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_overload_control_information_t, overload_control_information_flags) - sizeof(ogs_tlv_presence_t) },
+    [7] = { OGS_PFCP_TIMER_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_overload_control_information_t, period_of_validity) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_overload_control_information = {
+    7, 4, ogs_pfcp_tlv_index_overload_control_information_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_overload_control_information =
 {
@@ -3360,8 +4674,23 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_overload_control_information =
         &ogs_pfcp_tlv_desc_timer,
         &ogs_pfcp_tlv_desc_oci_flags,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_overload_control_information,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_application_detection_information_slot[8] = {
+    [0] = { OGS_PFCP_APPLICATION_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_application_detection_information_t, application_id) - sizeof(ogs_tlv_presence_t) },
+    [1] = { OGS_PFCP_PDR_ID_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_application_detection_information_t, pdr_id) - sizeof(ogs_tlv_presence_t) },
+    [3] = { OGS_PFCP_APPLICATION_INSTANCE_ID_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_application_detection_information_t, application_instance_id) - sizeof(ogs_tlv_presence_t) },
+    [4] = { OGS_PFCP_FLOW_INFORMATION_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_application_detection_information_t, flow_information) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_application_detection_information = {
+    7, 4, ogs_pfcp_tlv_index_application_detection_information_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_application_detection_information =
 {
@@ -3377,8 +4706,17 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_application_detection_information =
         &ogs_pfcp_tlv_desc_flow_information,
         &ogs_pfcp_tlv_desc_pdr_id,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_application_detection_information,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_query_urr_slot[2] = {
+    [1] = { OGS_PFCP_URR_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_query_urr_t, urr_id) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_query_urr = {
+    1, 1, ogs_pfcp_tlv_index_query_urr_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_query_urr =
 {
@@ -3391,8 +4729,39 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_query_urr =
     {
         &ogs_pfcp_tlv_desc_urr_id,
         NULL,
-    }
-};
+    },
+    &ogs_pfcp_tlv_index_query_urr,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_usage_report_session_modification_response_slot[32] = {
+    [7] = { OGS_PFCP_USAGE_REPORT_TRIGGER_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_usage_report_session_modification_response_t, usage_report_trigger) - sizeof(ogs_tlv_presence_t) },
+    [8] = { OGS_PFCP_UR_SEQN_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_usage_report_session_modification_response_t, ur_seqn) - sizeof(ogs_tlv_presence_t) },
+    [9] = { OGS_PFCP_URR_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_usage_report_session_modification_response_t, urr_id) - sizeof(ogs_tlv_presence_t) },
+    [10] = { OGS_PFCP_USAGE_INFORMATION_TYPE, 0, 0, 10, 9,
+        offsetof(ogs_pfcp_tlv_usage_report_session_modification_response_t, usage_information) - sizeof(ogs_tlv_presence_t) },
+    [11] = { OGS_PFCP_DURATION_MEASUREMENT_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_pfcp_tlv_usage_report_session_modification_response_t, duration_measurement) - sizeof(ogs_tlv_presence_t) },
+    [12] = { OGS_PFCP_END_TIME_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_tlv_usage_report_session_modification_response_t, end_time) - sizeof(ogs_tlv_presence_t) },
+    [18] = { OGS_PFCP_VOLUME_MEASUREMENT_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_pfcp_tlv_usage_report_session_modification_response_t, volume_measurement) - sizeof(ogs_tlv_presence_t) },
+    [19] = { OGS_PFCP_START_TIME_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_usage_report_session_modification_response_t, start_time) - sizeof(ogs_tlv_presence_t) },
+    [21] = { OGS_PFCP_QUERY_URR_REFERENCE_TYPE, 0, 0, 11, 10,
+        offsetof(ogs_pfcp_tlv_usage_report_session_modification_response_t, query_urr_reference) - sizeof(ogs_tlv_presence_t) },
+    [22] = { OGS_PFCP_TIME_OF_LAST_PACKET_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_pfcp_tlv_usage_report_session_modification_response_t, time_of_last_packet) - sizeof(ogs_tlv_presence_t) },
+    [23] = { OGS_PFCP_ETHERNET_TRAFFIC_INFORMATION_TYPE, 0, 0, 12, 11,
+        offsetof(ogs_pfcp_tlv_usage_report_session_modification_response_t, ethernet_traffic_information) - sizeof(ogs_tlv_presence_t) },
+    [29] = { OGS_PFCP_TIME_OF_FIRST_PACKET_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_pfcp_tlv_usage_report_session_modification_response_t, time_of_first_packet) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_usage_report_session_modification_response = {
+    31, 12, ogs_pfcp_tlv_index_usage_report_session_modification_response_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_usage_report_session_modification_response =
 {
@@ -3416,8 +4785,37 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_usage_report_session_modification_response =
         &ogs_pfcp_tlv_desc_query_urr_reference,
         &ogs_pfcp_tlv_desc_ethernet_traffic_information,
         NULL,
-    }
-};
+    },
+    &ogs_pfcp_tlv_index_usage_report_session_modification_response,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_usage_report_session_deletion_response_slot[32] = {
+    [7] = { OGS_PFCP_USAGE_REPORT_TRIGGER_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_usage_report_session_deletion_response_t, usage_report_trigger) - sizeof(ogs_tlv_presence_t) },
+    [8] = { OGS_PFCP_UR_SEQN_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_usage_report_session_deletion_response_t, ur_seqn) - sizeof(ogs_tlv_presence_t) },
+    [9] = { OGS_PFCP_URR_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_usage_report_session_deletion_response_t, urr_id) - sizeof(ogs_tlv_presence_t) },
+    [10] = { OGS_PFCP_USAGE_INFORMATION_TYPE, 0, 0, 10, 9,
+        offsetof(ogs_pfcp_tlv_usage_report_session_deletion_response_t, usage_information) - sizeof(ogs_tlv_presence_t) },
+    [11] = { OGS_PFCP_DURATION_MEASUREMENT_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_pfcp_tlv_usage_report_session_deletion_response_t, duration_measurement) - sizeof(ogs_tlv_presence_t) },
+    [12] = { OGS_PFCP_END_TIME_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_tlv_usage_report_session_deletion_response_t, end_time) - sizeof(ogs_tlv_presence_t) },
+    [18] = { OGS_PFCP_VOLUME_MEASUREMENT_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_pfcp_tlv_usage_report_session_deletion_response_t, volume_measurement) - sizeof(ogs_tlv_presence_t) },
+    [19] = { OGS_PFCP_START_TIME_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_usage_report_session_deletion_response_t, start_time) - sizeof(ogs_tlv_presence_t) },
+    [22] = { OGS_PFCP_TIME_OF_LAST_PACKET_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_pfcp_tlv_usage_report_session_deletion_response_t, time_of_last_packet) - sizeof(ogs_tlv_presence_t) },
+    [23] = { OGS_PFCP_ETHERNET_TRAFFIC_INFORMATION_TYPE, 0, 0, 11, 10,
+        offsetof(ogs_pfcp_tlv_usage_report_session_deletion_response_t, ethernet_traffic_information) - sizeof(ogs_tlv_presence_t) },
+    [29] = { OGS_PFCP_TIME_OF_FIRST_PACKET_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_pfcp_tlv_usage_report_session_deletion_response_t, time_of_first_packet) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_usage_report_session_deletion_response = {
+    31, 11, ogs_pfcp_tlv_index_usage_report_session_deletion_response_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_usage_report_session_deletion_response =
 {
@@ -3440,8 +4838,53 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_usage_report_session_deletion_response =
         &ogs_pfcp_tlv_desc_usage_information,
         &ogs_pfcp_tlv_desc_ethernet_traffic_information,
         NULL,
-    }
-};
+    },
+    &ogs_pfcp_tlv_index_usage_report_session_deletion_response,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_usage_report_session_report_request_slot[64] = {
+    [10] = { OGS_PFCP_USAGE_INFORMATION_TYPE, 0, 0, 13, 12,
+        offsetof(ogs_pfcp_tlv_usage_report_session_report_request_t, usage_information) - sizeof(ogs_tlv_presence_t) },
+    [11] = { OGS_PFCP_DURATION_MEASUREMENT_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_pfcp_tlv_usage_report_session_report_request_t, duration_measurement) - sizeof(ogs_tlv_presence_t) },
+    [14] = { OGS_PFCP_LEAVE_IP_MULTICAST_INFORMATION_IE_WITHIN_USAGE_REPORT_TYPE, 0, 0, 18, 17,
+        offsetof(ogs_pfcp_tlv_usage_report_session_report_request_t, leave_ip_muticast_information) - sizeof(ogs_tlv_presence_t) },
+    [19] = { OGS_PFCP_START_TIME_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_usage_report_session_report_request_t, start_time) - sizeof(ogs_tlv_presence_t) },
+    [21] = { OGS_PFCP_UE_IP_ADDRESS_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_pfcp_tlv_usage_report_session_report_request_t, ue_ip_address) - sizeof(ogs_tlv_presence_t) },
+    [22] = { OGS_PFCP_TIME_OF_LAST_PACKET_TYPE, 0, 0, 12, 11,
+        offsetof(ogs_pfcp_tlv_usage_report_session_report_request_t, time_of_last_packet) - sizeof(ogs_tlv_presence_t) },
+    [36] = { OGS_PFCP_APPLICATION_DETECTION_INFORMATION_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_pfcp_tlv_usage_report_session_report_request_t, application_detection_information) - sizeof(ogs_tlv_presence_t) },
+    [38] = { OGS_PFCP_NETWORK_INSTANCE_TYPE, 0, 0, 10, 9,
+        offsetof(ogs_pfcp_tlv_usage_report_session_report_request_t, network_instance) - sizeof(ogs_tlv_presence_t) },
+    [39] = { OGS_PFCP_USAGE_REPORT_TRIGGER_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_usage_report_session_report_request_t, usage_report_trigger) - sizeof(ogs_tlv_presence_t) },
+    [40] = { OGS_PFCP_UR_SEQN_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_usage_report_session_report_request_t, ur_seqn) - sizeof(ogs_tlv_presence_t) },
+    [41] = { OGS_PFCP_URR_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_usage_report_session_report_request_t, urr_id) - sizeof(ogs_tlv_presence_t) },
+    [44] = { OGS_PFCP_END_TIME_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_tlv_usage_report_session_report_request_t, end_time) - sizeof(ogs_tlv_presence_t) },
+    [50] = { OGS_PFCP_VOLUME_MEASUREMENT_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_pfcp_tlv_usage_report_session_report_request_t, volume_measurement) - sizeof(ogs_tlv_presence_t) },
+    [51] = { OGS_PFCP_PREDEFINED_RULES_NAME_TYPE, 0, 0, 19, 18,
+        offsetof(ogs_pfcp_tlv_usage_report_session_report_request_t, predefined_rules_name) - sizeof(ogs_tlv_presence_t) },
+    [53] = { OGS_PFCP_QUERY_URR_REFERENCE_TYPE, 0, 0, 14, 13,
+        offsetof(ogs_pfcp_tlv_usage_report_session_report_request_t, query_urr_reference) - sizeof(ogs_tlv_presence_t) },
+    [54] = { OGS_PFCP_JOIN_IP_MULTICAST_INFORMATION_IE_WITHIN_USAGE_REPORT_TYPE, 0, 0, 17, 16,
+        offsetof(ogs_pfcp_tlv_usage_report_session_report_request_t, join_ip_muticast_information) - sizeof(ogs_tlv_presence_t) },
+    [55] = { OGS_PFCP_ETHERNET_TRAFFIC_INFORMATION_TYPE, 0, 0, 16, 15,
+        offsetof(ogs_pfcp_tlv_usage_report_session_report_request_t, ethernet_traffic_information) - sizeof(ogs_tlv_presence_t) },
+    [60] = { OGS_PFCP_TIME_STAMP_TYPE, 0, 0, 15, 14,
+        offsetof(ogs_pfcp_tlv_usage_report_session_report_request_t, event_time_stamp) - sizeof(ogs_tlv_presence_t) },
+    [61] = { OGS_PFCP_TIME_OF_FIRST_PACKET_TYPE, 0, 0, 11, 10,
+        offsetof(ogs_pfcp_tlv_usage_report_session_report_request_t, time_of_first_packet) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_usage_report_session_report_request = {
+    63, 19, ogs_pfcp_tlv_index_usage_report_session_report_request_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_usage_report_session_report_request =
 {
@@ -3472,8 +4915,23 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_usage_report_session_report_request =
         &ogs_pfcp_tlv_desc_leave_ip_multicast_information_ie_within_usage_report,
         &ogs_pfcp_tlv_desc_predefined_rules_name,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_usage_report_session_report_request,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_downlink_data_report_slot[8] = {
+    [0] = { OGS_PFCP_PDR_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_downlink_data_report_t, pdr_id) - sizeof(ogs_tlv_presence_t) },
+    [2] = { OGS_PFCP_DL_DATA_PACKETS_SIZE_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_downlink_data_report_t, dl_data_packets_size) - sizeof(ogs_tlv_presence_t) },
+    [4] = { OGS_PFCP_DATA_STATUS_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_downlink_data_report_t, dl_data_status) - sizeof(ogs_tlv_presence_t) },
+    [5] = { OGS_PFCP_DOWNLINK_DATA_SERVICE_INFORMATION_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_downlink_data_report_t, downlink_data_service_information) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_downlink_data_report = {
+    7, 4, ogs_pfcp_tlv_index_downlink_data_report_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_downlink_data_report =
 {
@@ -3489,8 +4947,23 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_downlink_data_report =
         &ogs_pfcp_tlv_desc_dl_data_packets_size,
         &ogs_pfcp_tlv_desc_data_status,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_downlink_data_report,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_create_bar_slot[8] = {
+    [0] = { OGS_PFCP_BAR_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_create_bar_t, bar_id) - sizeof(ogs_tlv_presence_t) },
+    [1] = { OGS_PFCP_MT_EDT_CONTROL_INFORMATION_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_create_bar_t, mt_edt_control_information) - sizeof(ogs_tlv_presence_t) },
+    [4] = { OGS_PFCP_SUGGESTED_BUFFERING_PACKETS_COUNT_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_create_bar_t, suggested_buffering_packets_count) - sizeof(ogs_tlv_presence_t) },
+    [6] = { OGS_PFCP_DOWNLINK_DATA_NOTIFICATION_DELAY_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_create_bar_t, downlink_data_notification_delay) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_create_bar = {
+    7, 4, ogs_pfcp_tlv_index_create_bar_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_create_bar =
 {
@@ -3506,9 +4979,24 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_create_bar =
         &ogs_pfcp_tlv_desc_suggested_buffering_packets_count,
         &ogs_pfcp_tlv_desc_mt_edt_control_information,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_create_bar,
+    NULL
 };
 
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_update_bar_session_modification_request_slot[8] = {
+    [0] = { OGS_PFCP_BAR_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_update_bar_session_modification_request_t, bar_id) - sizeof(ogs_tlv_presence_t) },
+    [1] = { OGS_PFCP_MT_EDT_CONTROL_INFORMATION_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_update_bar_session_modification_request_t, mt_edt_control_information) - sizeof(ogs_tlv_presence_t) },
+    [4] = { OGS_PFCP_SUGGESTED_BUFFERING_PACKETS_COUNT_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_update_bar_session_modification_request_t, suggested_buffering_packets_count) - sizeof(ogs_tlv_presence_t) },
+    [6] = { OGS_PFCP_DOWNLINK_DATA_NOTIFICATION_DELAY_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_update_bar_session_modification_request_t, downlink_data_notification_delay) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_update_bar_session_modification_request = {
+    7, 4, ogs_pfcp_tlv_index_update_bar_session_modification_request_slot };
+
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_update_bar_session_modification_request =
 {
     OGS_TLV_COMPOUND,
@@ -3523,8 +5011,17 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_update_bar_session_modification_request =
         &ogs_pfcp_tlv_desc_suggested_buffering_packets_count,
         &ogs_pfcp_tlv_desc_mt_edt_control_information,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_update_bar_session_modification_request,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_remove_bar_slot[2] = {
+    [0] = { OGS_PFCP_BAR_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_remove_bar_t, bar_id) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_remove_bar = {
+    1, 1, ogs_pfcp_tlv_index_remove_bar_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_remove_bar =
 {
@@ -3537,8 +5034,17 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_remove_bar =
     {
         &ogs_pfcp_tlv_desc_bar_id,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_remove_bar,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_error_indication_report_slot[2] = {
+    [1] = { OGS_PFCP_F_TEID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_error_indication_report_t, remote_f_teid) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_error_indication_report = {
+    1, 1, ogs_pfcp_tlv_index_error_indication_report_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_error_indication_report =
 {
@@ -3551,8 +5057,17 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_error_indication_report =
     {
         &ogs_pfcp_tlv_desc_f_teid,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_error_indication_report,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_user_plane_path_failure_report_slot[2] = {
+    [1] = { OGS_PFCP_REMOTE_GTP_U_PEER_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_user_plane_path_failure_report_t, remote_gtp_u_peer) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_user_plane_path_failure_report = {
+    1, 1, ogs_pfcp_tlv_index_user_plane_path_failure_report_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_user_plane_path_failure_report =
 {
@@ -3565,8 +5080,51 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_user_plane_path_failure_report =
     {
         &ogs_pfcp_tlv_desc_remote_gtp_u_peer,
         NULL,
-    }
-};
+    },
+    &ogs_pfcp_tlv_index_user_plane_path_failure_report,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_create_traffic_endpoint_slot[64] = {
+    [0] = { 0, 0, 0, 8, 7,
+        offsetof(ogs_pfcp_tlv_create_traffic_endpoint_t, framed_route) + sizeof(ogs_pfcp_tlv_framed_route_t) - sizeof(ogs_tlv_presence_t) },
+    [1] = { 0, 0, 1, 11, 7,
+        offsetof(ogs_pfcp_tlv_create_traffic_endpoint_t, framed_ipv6_route) + sizeof(ogs_pfcp_tlv_framed_ipv6_route_t) - sizeof(ogs_tlv_presence_t) },
+    [9] = { OGS_PFCP_MBS_SESSION_IDENTIFIER_TYPE, 0, 0, 16, 14,
+        offsetof(ogs_pfcp_tlv_create_traffic_endpoint_t, mbs_session_identifier) - sizeof(ogs_tlv_presence_t) },
+    [10] = { OGS_PFCP_FRAMED_ROUTING_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_pfcp_tlv_create_traffic_endpoint_t, framed_routing) - sizeof(ogs_tlv_presence_t) },
+    [11] = { OGS_PFCP_TRAFFIC_ENDPOINT_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_create_traffic_endpoint_t, traffic_endpoint_id) - sizeof(ogs_tlv_presence_t) },
+    [13] = { OGS_PFCP_F_TEID_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_create_traffic_endpoint_t, local_f_teid) - sizeof(ogs_tlv_presence_t) },
+    [20] = { OGS_PFCP_LOCAL_INGRESS_TUNNEL_TYPE, 0, 0, 14, 12,
+        offsetof(ogs_pfcp_tlv_create_traffic_endpoint_t, local_ingress_tunnel) - sizeof(ogs_tlv_presence_t) },
+    [21] = { OGS_PFCP_UE_IP_ADDRESS_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_tlv_create_traffic_endpoint_t, ue_ip_address) - sizeof(ogs_tlv_presence_t) },
+    [27] = { OGS_PFCP_RAT_TYPE_TYPE, 0, 0, 18, 16,
+        offsetof(ogs_pfcp_tlv_create_traffic_endpoint_t, rat_type) - sizeof(ogs_tlv_presence_t) },
+    [28] = { OGS_PFCP_QFI_TYPE, 0, 0, 12, 10,
+        offsetof(ogs_pfcp_tlv_create_traffic_endpoint_t, qfi) - sizeof(ogs_tlv_presence_t) },
+    [29] = { OGS_PFCP_IP_MULTICAST_ADDRESSING_INFO_WITHIN_PFCP_SESSION_ESTABLISHMENT_REQUEST_TYPE, 0, 0, 15, 13,
+        offsetof(ogs_pfcp_tlv_create_traffic_endpoint_t, ip_multicast_addressing_info) - sizeof(ogs_tlv_presence_t) },
+    [30] = { OGS_PFCP_ETHERNET_PDU_SESSION_INFORMATION_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_pfcp_tlv_create_traffic_endpoint_t, ethernet_pdu_session_information) - sizeof(ogs_tlv_presence_t) },
+    [32] = { OGS_PFCP__INTERFACE_TYPE_TYPE, 0, 0, 13, 11,
+        offsetof(ogs_pfcp_tlv_create_traffic_endpoint_t, source_interface_type) - sizeof(ogs_tlv_presence_t) },
+    [35] = { OGS_PFCP_FRAMED_IPV6_ROUTE_TYPE, 0, 0, 10, 9,
+        offsetof(ogs_pfcp_tlv_create_traffic_endpoint_t, framed_ipv6_route) - sizeof(ogs_tlv_presence_t) },
+    [38] = { OGS_PFCP_NETWORK_INSTANCE_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_create_traffic_endpoint_t, network_instance) - sizeof(ogs_tlv_presence_t) },
+    [39] = { OGS_PFCP_REDUNDANT_TRANSMISSION_PARAMETERS_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_create_traffic_endpoint_t, redundant_transmission_detection_parameters) - sizeof(ogs_tlv_presence_t) },
+    [42] = { OGS_PFCP_AREA_SESSION_ID_TYPE, 0, 0, 17, 15,
+        offsetof(ogs_pfcp_tlv_create_traffic_endpoint_t, area_session_id) - sizeof(ogs_tlv_presence_t) },
+    [49] = { OGS_PFCP_FRAMED_ROUTE_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_pfcp_tlv_create_traffic_endpoint_t, framed_route) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_create_traffic_endpoint = {
+    63, 17, ogs_pfcp_tlv_index_create_traffic_endpoint_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_create_traffic_endpoint =
 {
@@ -3596,8 +5154,25 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_create_traffic_endpoint =
         &ogs_pfcp_tlv_desc_area_session_id,
         &ogs_pfcp_tlv_desc_rat_type,
         NULL,
-    }
-};
+    },
+    &ogs_pfcp_tlv_index_create_traffic_endpoint,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_created_traffic_endpoint_slot[16] = {
+    [4] = { OGS_PFCP_LOCAL_INGRESS_TUNNEL_TYPE, 0, 0, 5, 3,
+        offsetof(ogs_pfcp_tlv_created_traffic_endpoint_t, local_ingress_tunnel) - sizeof(ogs_tlv_presence_t) },
+    [5] = { OGS_PFCP_UE_IP_ADDRESS_TYPE, 0, 0, 4, 2,
+        offsetof(ogs_pfcp_tlv_created_traffic_endpoint_t, ue_ip_address) - sizeof(ogs_tlv_presence_t) },
+    [11] = { OGS_PFCP_TRAFFIC_ENDPOINT_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_created_traffic_endpoint_t, traffic_endpoint_id) - sizeof(ogs_tlv_presence_t) },
+    [13] = { OGS_PFCP_F_TEID_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_created_traffic_endpoint_t, local_f_teid) - sizeof(ogs_tlv_presence_t) },
+    [14] = { OGS_PFCP_F_TEID_TYPE, 0, 1, 3, 1,
+        offsetof(ogs_pfcp_tlv_created_traffic_endpoint_t, local_f_teid_for_redundant_transmission) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_created_traffic_endpoint = {
+    15, 4, ogs_pfcp_tlv_index_created_traffic_endpoint_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_created_traffic_endpoint =
 {
@@ -3614,9 +5189,18 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_created_traffic_endpoint =
         &ogs_pfcp_tlv_desc_ue_ip_address,
         &ogs_pfcp_tlv_desc_local_ingress_tunnel,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_created_traffic_endpoint,
+    NULL
 };
 
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_remove_traffic_endpoint_slot[2] = {
+    [1] = { OGS_PFCP_TRAFFIC_ENDPOINT_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_remove_traffic_endpoint_t, traffic_endpoint_id) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_remove_traffic_endpoint = {
+    1, 1, ogs_pfcp_tlv_index_remove_traffic_endpoint_slot };
+
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_remove_traffic_endpoint =
 {
     OGS_TLV_COMPOUND,
@@ -3628,8 +5212,29 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_remove_traffic_endpoint =
     {
         &ogs_pfcp_tlv_desc_traffic_endpoint_id,
         NULL,
-    }
-};
+    },
+    &ogs_pfcp_tlv_index_remove_traffic_endpoint,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_create_mar_slot[16] = {
+    [0] = { OGS_PFCP_THRESHOLDS_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_pfcp_tlv_create_mar_t, threshold_values) - sizeof(ogs_tlv_presence_t) },
+    [3] = { OGS_PFCP_STEERING_FUNCTIONALITY_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_create_mar_t, steering_functionality) - sizeof(ogs_tlv_presence_t) },
+    [6] = { OGS_PFCP__ACCESS_FORWARDING_ACTION_INFORMATION_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_create_mar_t, _access_forwarding_action_information) - sizeof(ogs_tlv_presence_t) },
+    [9] = { OGS_PFCP_STEERING_MODE_INDICATOR_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_pfcp_tlv_create_mar_t, steering_mode_indicator) - sizeof(ogs_tlv_presence_t) },
+    [10] = { OGS_PFCP_MAR_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_create_mar_t, mar_id) - sizeof(ogs_tlv_presence_t) },
+    [12] = { OGS_PFCP_STEERING_MODE_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_create_mar_t, steering_mode) - sizeof(ogs_tlv_presence_t) },
+    [15] = { OGS_PFCP_NON__ACCESS_FORWARDING_ACTION_INFORMATION_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_tlv_create_mar_t, non__access_forwarding_action_information) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_create_mar = {
+    15, 7, ogs_pfcp_tlv_index_create_mar_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_create_mar =
 {
@@ -3648,8 +5253,17 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_create_mar =
         &ogs_pfcp_tlv_desc_thresholds,
         &ogs_pfcp_tlv_desc_steering_mode_indicator,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_create_mar,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_remove_mar_slot[2] = {
+    [0] = { OGS_PFCP_MAR_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_remove_mar_t, mar_id) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_remove_mar = {
+    1, 1, ogs_pfcp_tlv_index_remove_mar_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_remove_mar =
 {
@@ -3662,8 +5276,33 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_remove_mar =
     {
         &ogs_pfcp_tlv_desc_mar_id,
         NULL,
-    }
-};
+    },
+    &ogs_pfcp_tlv_index_remove_mar,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_update_mar_slot[32] = {
+    [0] = { OGS_PFCP_THRESHOLDS_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_pfcp_tlv_update_mar_t, threshold_values) - sizeof(ogs_tlv_presence_t) },
+    [12] = { OGS_PFCP_STEERING_MODE_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_update_mar_t, steering_mode) - sizeof(ogs_tlv_presence_t) },
+    [15] = { OGS_PFCP_NON__ACCESS_FORWARDING_ACTION_INFORMATION_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_pfcp_tlv_update_mar_t, non__access_forwarding_action_information) - sizeof(ogs_tlv_presence_t) },
+    [16] = { OGS_PFCP_UPDATE_NON__ACCESS_FORWARDING_ACTION_INFORMATION_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_tlv_update_mar_t, update_non__access_forwarding_action_information) - sizeof(ogs_tlv_presence_t) },
+    [19] = { OGS_PFCP_STEERING_FUNCTIONALITY_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_update_mar_t, steering_functionality) - sizeof(ogs_tlv_presence_t) },
+    [22] = { OGS_PFCP__ACCESS_FORWARDING_ACTION_INFORMATION_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_pfcp_tlv_update_mar_t, _access_forwarding_action_information) - sizeof(ogs_tlv_presence_t) },
+    [23] = { OGS_PFCP_UPDATE__ACCESS_FORWARDING_ACTION_INFORMATION_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_update_mar_t, update__access_forwarding_action_information) - sizeof(ogs_tlv_presence_t) },
+    [25] = { OGS_PFCP_STEERING_MODE_INDICATOR_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_pfcp_tlv_update_mar_t, steering_mode_indicator) - sizeof(ogs_tlv_presence_t) },
+    [26] = { OGS_PFCP_MAR_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_update_mar_t, mar_id) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_update_mar = {
+    31, 9, ogs_pfcp_tlv_index_update_mar_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_update_mar =
 {
@@ -3684,8 +5323,17 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_update_mar =
         &ogs_pfcp_tlv_desc_thresholds,
         &ogs_pfcp_tlv_desc_steering_mode_indicator,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_update_mar,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_pfcp_session_retention_information_within_pfcp_association_setup_request_slot[2] = {
+    [1] = { OGS_PFCP_CP_PFCP_ENTITY_IP_ADDRESS_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_pfcp_session_retention_information_within_pfcp_association_setup_request_t, cp_pfcp_entity_ip_address) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_pfcp_session_retention_information_within_pfcp_association_setup_request = {
+    1, 1, ogs_pfcp_tlv_index_pfcp_session_retention_information_within_pfcp_association_setup_request_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_pfcp_session_retention_information_within_pfcp_association_setup_request =
 {
@@ -3698,8 +5346,17 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_pfcp_session_retention_information_within_pfcp_
     {
         &ogs_pfcp_tlv_desc_cp_pfcp_entity_ip_address,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_pfcp_session_retention_information_within_pfcp_association_setup_request,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_user_plane_path_recovery_report_slot[2] = {
+    [1] = { OGS_PFCP_REMOTE_GTP_U_PEER_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_user_plane_path_recovery_report_t, remote_gtp_u_peer) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_user_plane_path_recovery_report = {
+    1, 1, ogs_pfcp_tlv_index_user_plane_path_recovery_report_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_user_plane_path_recovery_report =
 {
@@ -3712,9 +5369,20 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_user_plane_path_recovery_report =
     {
         &ogs_pfcp_tlv_desc_remote_gtp_u_peer,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_user_plane_path_recovery_report,
+    NULL
 };
 
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_created_bridge_info_for_tsc_slot[4] = {
+    [0] = { OGS_PFCP_DS_TT_PORT_NUMBER_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_created_bridge_info_for_tsc_t, ds_tt_port_number) - sizeof(ogs_tlv_presence_t) },
+    [2] = { OGS_PFCP_FiveGS_USER_PLANE_NODE_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_created_bridge_info_for_tsc_t, fivegs_user_plane_node) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_created_bridge_info_for_tsc = {
+    3, 2, ogs_pfcp_tlv_index_created_bridge_info_for_tsc_slot };
+
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_created_bridge_info_for_tsc =
 {
     OGS_TLV_COMPOUND,
@@ -3727,8 +5395,21 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_created_bridge_info_for_tsc =
         &ogs_pfcp_tlv_desc_ds_tt_port_number,
         &ogs_pfcp_tlv_desc_fivegs_user_plane_node,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_created_bridge_info_for_tsc,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_tsc_management_information_ie_within_pfcp_session_modification_request_slot[8] = {
+    [2] = { OGS_PFCP_PORT_MANAGEMENT_INFORMATION_CONTAINER_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_tsc_management_information_ie_within_pfcp_session_modification_request_t, port_management_information_container) - sizeof(ogs_tlv_presence_t) },
+    [3] = { OGS_PFCP_BRIDGE_MANAGEMENT_INFORMATION_CONTAINER_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_tsc_management_information_ie_within_pfcp_session_modification_request_t, user_plane_node_management_information_container) - sizeof(ogs_tlv_presence_t) },
+    [5] = { OGS_PFCP_NW_TT_PORT_NUMBER_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_tsc_management_information_ie_within_pfcp_session_modification_request_t, nw_tt_port_number) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_tsc_management_information_ie_within_pfcp_session_modification_request = {
+    7, 3, ogs_pfcp_tlv_index_tsc_management_information_ie_within_pfcp_session_modification_request_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_tsc_management_information_ie_within_pfcp_session_modification_request =
 {
@@ -3743,8 +5424,21 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_tsc_management_information_ie_within_pfcp_sessi
         &ogs_pfcp_tlv_desc_bridge_management_information_container,
         &ogs_pfcp_tlv_desc_nw_tt_port_number,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_tsc_management_information_ie_within_pfcp_session_modification_request,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_tsc_management_information_ie_within_pfcp_session_modification_response_slot[8] = {
+    [2] = { OGS_PFCP_PORT_MANAGEMENT_INFORMATION_CONTAINER_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_tsc_management_information_ie_within_pfcp_session_modification_response_t, port_management_information_container) - sizeof(ogs_tlv_presence_t) },
+    [3] = { OGS_PFCP_BRIDGE_MANAGEMENT_INFORMATION_CONTAINER_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_tsc_management_information_ie_within_pfcp_session_modification_response_t, user_plane_node_management_information_container) - sizeof(ogs_tlv_presence_t) },
+    [5] = { OGS_PFCP_NW_TT_PORT_NUMBER_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_tsc_management_information_ie_within_pfcp_session_modification_response_t, nw_tt_port_number) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_tsc_management_information_ie_within_pfcp_session_modification_response = {
+    7, 3, ogs_pfcp_tlv_index_tsc_management_information_ie_within_pfcp_session_modification_response_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_tsc_management_information_ie_within_pfcp_session_modification_response =
 {
@@ -3759,8 +5453,21 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_tsc_management_information_ie_within_pfcp_sessi
         &ogs_pfcp_tlv_desc_bridge_management_information_container,
         &ogs_pfcp_tlv_desc_nw_tt_port_number,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_tsc_management_information_ie_within_pfcp_session_modification_response,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_tsc_management_information_ie_within_pfcp_session_report_request_slot[8] = {
+    [2] = { OGS_PFCP_PORT_MANAGEMENT_INFORMATION_CONTAINER_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_tsc_management_information_ie_within_pfcp_session_report_request_t, port_management_information_container) - sizeof(ogs_tlv_presence_t) },
+    [3] = { OGS_PFCP_BRIDGE_MANAGEMENT_INFORMATION_CONTAINER_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_tsc_management_information_ie_within_pfcp_session_report_request_t, user_plane_node_management_information_container) - sizeof(ogs_tlv_presence_t) },
+    [5] = { OGS_PFCP_NW_TT_PORT_NUMBER_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_tsc_management_information_ie_within_pfcp_session_report_request_t, nw_tt_port_number) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_tsc_management_information_ie_within_pfcp_session_report_request = {
+    7, 3, ogs_pfcp_tlv_index_tsc_management_information_ie_within_pfcp_session_report_request_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_tsc_management_information_ie_within_pfcp_session_report_request =
 {
@@ -3775,8 +5482,25 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_tsc_management_information_ie_within_pfcp_sessi
         &ogs_pfcp_tlv_desc_bridge_management_information_container,
         &ogs_pfcp_tlv_desc_nw_tt_port_number,
         NULL,
-    }
-};
+    },
+    &ogs_pfcp_tlv_index_tsc_management_information_ie_within_pfcp_session_report_request,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_clock_drift_control_information_slot[16] = {
+    [0] = { OGS_PFCP_CUMULATIVE_RATERATIO_THRESHOLD_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_tlv_clock_drift_control_information_t, cumulative_rateratio_threshold) - sizeof(ogs_tlv_presence_t) },
+    [7] = { OGS_PFCP_TIME_OFFSET_THRESHOLD_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_clock_drift_control_information_t, time_offset_threshold) - sizeof(ogs_tlv_presence_t) },
+    [9] = { OGS_PFCP_CONFIGURED_TIME_DOMAIN_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_clock_drift_control_information_t, configured_time_domain) - sizeof(ogs_tlv_presence_t) },
+    [12] = { OGS_PFCP_REQUESTED_CLOCK_DRIFT_INFORMATION_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_clock_drift_control_information_t, requested_clock_drift_information) - sizeof(ogs_tlv_presence_t) },
+    [14] = { OGS_PFCP_TIME_DOMAIN_NUMBER_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_clock_drift_control_information_t, time_domain_number) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_clock_drift_control_information = {
+    15, 5, ogs_pfcp_tlv_index_clock_drift_control_information_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_clock_drift_control_information =
 {
@@ -3793,8 +5517,29 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_clock_drift_control_information =
         &ogs_pfcp_tlv_desc_time_offset_threshold,
         &ogs_pfcp_tlv_desc_cumulative_rateratio_threshold,
         NULL,
-    }
-};
+    },
+    &ogs_pfcp_tlv_index_clock_drift_control_information,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_clock_drift_report_slot[16] = {
+    [2] = { OGS_PFCP_CUMULATIVE_RATERATIO_MEASUREMENT_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_clock_drift_report_t, cumulative_rateratio_measurement) - sizeof(ogs_tlv_presence_t) },
+    [6] = { OGS_PFCP_NETWORK_INSTANCE_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_tlv_clock_drift_report_t, network_instance) - sizeof(ogs_tlv_presence_t) },
+    [7] = { OGS_PFCP_APN_DNN_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_pfcp_tlv_clock_drift_report_t, apn_dnn) - sizeof(ogs_tlv_presence_t) },
+    [9] = { OGS_PFCP_TIME_OFFSET_MEASUREMENT_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_clock_drift_report_t, time_offset_measurement) - sizeof(ogs_tlv_presence_t) },
+    [10] = { OGS_PFCP_S_NSSAI_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_pfcp_tlv_clock_drift_report_t, s_nssai) - sizeof(ogs_tlv_presence_t) },
+    [12] = { OGS_PFCP_TIME_STAMP_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_clock_drift_report_t, time_stamp) - sizeof(ogs_tlv_presence_t) },
+    [14] = { OGS_PFCP_TIME_DOMAIN_NUMBER_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_clock_drift_report_t, time_domain_number) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_clock_drift_report = {
+    15, 7, ogs_pfcp_tlv_index_clock_drift_report_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_clock_drift_report =
 {
@@ -3813,9 +5558,18 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_clock_drift_report =
         &ogs_pfcp_tlv_desc_apn_dnn,
         &ogs_pfcp_tlv_desc_s_nssai,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_clock_drift_report,
+    NULL
 };
 
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_remove_srr_slot[2] = {
+    [1] = { OGS_PFCP_SRR_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_remove_srr_t, srr_id) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_remove_srr = {
+    1, 1, ogs_pfcp_tlv_index_remove_srr_slot };
+
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_remove_srr =
 {
     OGS_TLV_COMPOUND,
@@ -3827,8 +5581,23 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_remove_srr =
     {
         &ogs_pfcp_tlv_desc_srr_id,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_remove_srr,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_create_srr_slot[8] = {
+    [0] = { OGS_PFCP_ACCESS_AVAILABILITY_CONTROL_INFORMATION_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_create_srr_t, access_availability_control_information) - sizeof(ogs_tlv_presence_t) },
+    [1] = { OGS_PFCP_DIRECT_REPORTING_INFORMATION_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_create_srr_t, direct_reporting_information) - sizeof(ogs_tlv_presence_t) },
+    [2] = { OGS_PFCP_QOS_MONITORING_PER_QOS_FLOW_CONTROL_INFORMATION_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_create_srr_t, qos_monitoring_per_qos_flow_control_information) - sizeof(ogs_tlv_presence_t) },
+    [7] = { OGS_PFCP_SRR_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_create_srr_t, srr_id) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_create_srr = {
+    7, 4, ogs_pfcp_tlv_index_create_srr_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_create_srr =
 {
@@ -3844,8 +5613,23 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_create_srr =
         &ogs_pfcp_tlv_desc_qos_monitoring_per_qos_flow_control_information,
         &ogs_pfcp_tlv_desc_direct_reporting_information,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_create_srr,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_update_srr_slot[8] = {
+    [0] = { OGS_PFCP_ACCESS_AVAILABILITY_CONTROL_INFORMATION_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_update_srr_t, access_availability_control_information) - sizeof(ogs_tlv_presence_t) },
+    [1] = { OGS_PFCP_DIRECT_REPORTING_INFORMATION_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_update_srr_t, direct_reporting_information) - sizeof(ogs_tlv_presence_t) },
+    [2] = { OGS_PFCP_QOS_MONITORING_PER_QOS_FLOW_CONTROL_INFORMATION_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_update_srr_t, qos_monitoring_per_qos_flow_control_information) - sizeof(ogs_tlv_presence_t) },
+    [7] = { OGS_PFCP_SRR_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_update_srr_t, srr_id) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_update_srr = {
+    7, 4, ogs_pfcp_tlv_index_update_srr_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_update_srr =
 {
@@ -3861,8 +5645,21 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_update_srr =
         &ogs_pfcp_tlv_desc_qos_monitoring_per_qos_flow_control_information,
         &ogs_pfcp_tlv_desc_direct_reporting_information,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_update_srr,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_session_report_slot[8] = {
+    [0] = { OGS_PFCP_QOS_MONITORING_REPORT_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_session_report_t, qos_monitoring_report) - sizeof(ogs_tlv_presence_t) },
+    [2] = { OGS_PFCP_ACCESS_AVAILABILITY_REPORT_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_session_report_t, access_availability_report) - sizeof(ogs_tlv_presence_t) },
+    [7] = { OGS_PFCP_SRR_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_session_report_t, srr_id) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_session_report = {
+    7, 3, ogs_pfcp_tlv_index_session_report_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_session_report =
 {
@@ -3877,9 +5674,22 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_session_report =
         &ogs_pfcp_tlv_desc_access_availability_report,
         &ogs_pfcp_tlv_desc_qos_monitoring_report,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_session_report,
+    NULL
 };
 
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_provide_atsss_control_information_slot[8] = {
+    [0] = { OGS_PFCP_PMF_CONTROL_INFORMATION_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_provide_atsss_control_information_t, pmf_control_information) - sizeof(ogs_tlv_presence_t) },
+    [6] = { OGS_PFCP_MPTCP_CONTROL_INFORMATION_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_provide_atsss_control_information_t, mptcp_control_information) - sizeof(ogs_tlv_presence_t) },
+    [7] = { OGS_PFCP_ATSSS_LL_CONTROL_INFORMATION_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_provide_atsss_control_information_t, atsss_ll_control_information) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_provide_atsss_control_information = {
+    7, 3, ogs_pfcp_tlv_index_provide_atsss_control_information_slot };
+
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_provide_atsss_control_information =
 {
     OGS_TLV_COMPOUND,
@@ -3893,8 +5703,21 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_provide_atsss_control_information =
         &ogs_pfcp_tlv_desc_atsss_ll_control_information,
         &ogs_pfcp_tlv_desc_pmf_control_information,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_provide_atsss_control_information,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_atsss_control_parameters_slot[8] = {
+    [1] = { OGS_PFCP_MPTCP_PARAMETERS_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_atsss_control_parameters_t, mptcp_parameters) - sizeof(ogs_tlv_presence_t) },
+    [2] = { OGS_PFCP_ATSSS_LL_PARAMETERS_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_atsss_control_parameters_t, atsss_ll_parameters) - sizeof(ogs_tlv_presence_t) },
+    [3] = { OGS_PFCP_PMF_PARAMETERS_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_atsss_control_parameters_t, pmf_parameters) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_atsss_control_parameters = {
+    7, 3, ogs_pfcp_tlv_index_atsss_control_parameters_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_atsss_control_parameters =
 {
@@ -3909,8 +5732,23 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_atsss_control_parameters =
         &ogs_pfcp_tlv_desc_atsss_ll_parameters,
         &ogs_pfcp_tlv_desc_pmf_parameters,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_atsss_control_parameters,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_ue_ip_address_pool_information_slot[8] = {
+    [1] = { OGS_PFCP_S_NSSAI_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_ue_ip_address_pool_information_t, s_nssai) - sizeof(ogs_tlv_presence_t) },
+    [2] = { OGS_PFCP_IP_VERSION_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_ue_ip_address_pool_information_t, ip_version) - sizeof(ogs_tlv_presence_t) },
+    [5] = { OGS_PFCP_UE_IP_ADDRESS_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_ue_ip_address_pool_information_t, ue_ip_address_pool_identity) - sizeof(ogs_tlv_presence_t) },
+    [6] = { OGS_PFCP_NETWORK_INSTANCE_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_ue_ip_address_pool_information_t, network_instance) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_ue_ip_address_pool_information = {
+    7, 4, ogs_pfcp_tlv_index_ue_ip_address_pool_information_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_ue_ip_address_pool_information =
 {
@@ -3926,8 +5764,33 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_ue_ip_address_pool_information =
         &ogs_pfcp_tlv_desc_s_nssai,
         &ogs_pfcp_tlv_desc_ip_version,
         NULL,
-    }
-};
+    },
+    &ogs_pfcp_tlv_index_ue_ip_address_pool_information,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_gtp_u_path_qos_report_pfcp_node_report_request_slot[32] = {
+    [0] = { OGS_PFCP_MEASUREMENT_PERIOD_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_tlv_gtp_u_path_qos_report_pfcp_node_report_request_t, measurement_period) - sizeof(ogs_tlv_presence_t) },
+    [5] = { OGS_PFCP_QOS_REPORT_TRIGGER_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_gtp_u_path_qos_report_pfcp_node_report_request_t, qos_report_trigger) - sizeof(ogs_tlv_presence_t) },
+    [9] = { OGS_PFCP_GTP_U_PATH_INTERFACE_TYPE_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_gtp_u_path_qos_report_pfcp_node_report_request_t, gtp_u_path_interface_type) - sizeof(ogs_tlv_presence_t) },
+    [12] = { OGS_PFCP_MAXIMUM_PACKET_DELAY_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_pfcp_tlv_gtp_u_path_qos_report_pfcp_node_report_request_t, maximum_packet_delay_threshold) - sizeof(ogs_tlv_presence_t) },
+    [14] = { OGS_PFCP_TRANSPORT_LEVEL_MARKING_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_gtp_u_path_qos_report_pfcp_node_report_request_t, dscp) - sizeof(ogs_tlv_presence_t) },
+    [15] = { OGS_PFCP_REMOTE_GTP_U_PEER_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_gtp_u_path_qos_report_pfcp_node_report_request_t, remote_gtp_u_peer) - sizeof(ogs_tlv_presence_t) },
+    [19] = { OGS_PFCP_MINIMUM_PACKET_DELAY_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_pfcp_tlv_gtp_u_path_qos_report_pfcp_node_report_request_t, minimum_packet_delay_threshold) - sizeof(ogs_tlv_presence_t) },
+    [26] = { OGS_PFCP_AVERAGE_PACKET_DELAY_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_pfcp_tlv_gtp_u_path_qos_report_pfcp_node_report_request_t, average_packet_delay_threshold) - sizeof(ogs_tlv_presence_t) },
+    [31] = { OGS_PFCP_TIMER_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_pfcp_tlv_gtp_u_path_qos_report_pfcp_node_report_request_t, minimum_waiting_time) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_gtp_u_path_qos_report_pfcp_node_report_request = {
+    31, 9, ogs_pfcp_tlv_index_gtp_u_path_qos_report_pfcp_node_report_request_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_gtp_u_path_qos_report_pfcp_node_report_request =
 {
@@ -3948,8 +5811,23 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_gtp_u_path_qos_report_pfcp_node_report_request
         &ogs_pfcp_tlv_desc_maximum_packet_delay,
         &ogs_pfcp_tlv_desc_timer,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_gtp_u_path_qos_report_pfcp_node_report_request,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_qos_information_in_gtp_u_path_qos_report_slot[8] = {
+    [2] = { OGS_PFCP_AVERAGE_PACKET_DELAY_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_qos_information_in_gtp_u_path_qos_report_t, average_packet_delay) - sizeof(ogs_tlv_presence_t) },
+    [3] = { OGS_PFCP_MINIMUM_PACKET_DELAY_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_qos_information_in_gtp_u_path_qos_report_t, minimum_packet_delay) - sizeof(ogs_tlv_presence_t) },
+    [4] = { OGS_PFCP_MAXIMUM_PACKET_DELAY_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_qos_information_in_gtp_u_path_qos_report_t, maximum_packet_delay) - sizeof(ogs_tlv_presence_t) },
+    [6] = { OGS_PFCP_TRANSPORT_LEVEL_MARKING_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_qos_information_in_gtp_u_path_qos_report_t, dscp) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_qos_information_in_gtp_u_path_qos_report = {
+    7, 4, ogs_pfcp_tlv_index_qos_information_in_gtp_u_path_qos_report_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_qos_information_in_gtp_u_path_qos_report =
 {
@@ -3965,8 +5843,19 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_qos_information_in_gtp_u_path_qos_report =
         &ogs_pfcp_tlv_desc_maximum_packet_delay,
         &ogs_pfcp_tlv_desc_transport_level_marking,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_qos_information_in_gtp_u_path_qos_report,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_packet_rate_status_report_slot[4] = {
+    [1] = { OGS_PFCP_QER_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_packet_rate_status_report_t, qer_id) - sizeof(ogs_tlv_presence_t) },
+    [2] = { OGS_PFCP_PACKET_RATE_STATUS_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_packet_rate_status_report_t, packet_rate_status) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_packet_rate_status_report = {
+    3, 2, ogs_pfcp_tlv_index_packet_rate_status_report_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_packet_rate_status_report =
 {
@@ -3980,8 +5869,17 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_packet_rate_status_report =
         &ogs_pfcp_tlv_desc_qer_id,
         &ogs_pfcp_tlv_desc_packet_rate_status,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_packet_rate_status_report,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_ethernet_context_information_slot[2] = {
+    [0] = { OGS_PFCP_MAC_ADDRESSES_DETECTED_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_ethernet_context_information_t, mac_addresses_detected) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_ethernet_context_information = {
+    1, 1, ogs_pfcp_tlv_index_ethernet_context_information_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_ethernet_context_information =
 {
@@ -3994,9 +5892,24 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_ethernet_context_information =
     {
         &ogs_pfcp_tlv_desc_mac_addresses_detected,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_ethernet_context_information,
+    NULL
 };
 
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_updated_pdr_slot[8] = {
+    [0] = { OGS_PFCP_PDR_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_updated_pdr_t, pdr_id) - sizeof(ogs_tlv_presence_t) },
+    [5] = { OGS_PFCP_F_TEID_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_updated_pdr_t, local_f_teid_for_redundant_transmission) - sizeof(ogs_tlv_presence_t) },
+    [6] = { OGS_PFCP_F_TEID_TYPE, 0, 1, 3, 1,
+        offsetof(ogs_pfcp_tlv_updated_pdr_t, local_f_teid) - sizeof(ogs_tlv_presence_t) },
+    [7] = { OGS_PFCP_UE_IP_ADDRESS_TYPE, 0, 0, 4, 2,
+        offsetof(ogs_pfcp_tlv_updated_pdr_t, ue_ip_address) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_updated_pdr = {
+    7, 3, ogs_pfcp_tlv_index_updated_pdr_slot };
+
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_updated_pdr =
 {
     OGS_TLV_COMPOUND,
@@ -4011,8 +5924,17 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_updated_pdr =
         &ogs_pfcp_tlv_desc_f_teid,
         &ogs_pfcp_tlv_desc_ue_ip_address,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_updated_pdr,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_provide_rds_configuration_information_slot[2] = {
+    [0] = { OGS_PFCP_RDS_CONFIGURATION_INFORMATION_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_provide_rds_configuration_information_t, rds_configuration_information) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_provide_rds_configuration_information = {
+    1, 1, ogs_pfcp_tlv_index_provide_rds_configuration_information_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_provide_rds_configuration_information =
 {
@@ -4025,8 +5947,17 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_provide_rds_configuration_information =
     {
         &ogs_pfcp_tlv_desc_rds_configuration_information,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_provide_rds_configuration_information,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_query_packet_rate_status_ie_within_pfcp_session_modification_request_slot[2] = {
+    [1] = { OGS_PFCP_QER_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_query_packet_rate_status_ie_within_pfcp_session_modification_request_t, qer_id) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_query_packet_rate_status_ie_within_pfcp_session_modification_request = {
+    1, 1, ogs_pfcp_tlv_index_query_packet_rate_status_ie_within_pfcp_session_modification_request_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_query_packet_rate_status_ie_within_pfcp_session_modification_request =
 {
@@ -4039,8 +5970,19 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_query_packet_rate_status_ie_within_pfcp_session
     {
         &ogs_pfcp_tlv_desc_qer_id,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_query_packet_rate_status_ie_within_pfcp_session_modification_request,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_packet_rate_status_report_ie_within_pfcp_session_modification_response_slot[4] = {
+    [1] = { OGS_PFCP_QER_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_packet_rate_status_report_ie_within_pfcp_session_modification_response_t, qer_id) - sizeof(ogs_tlv_presence_t) },
+    [2] = { OGS_PFCP_PACKET_RATE_STATUS_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_packet_rate_status_report_ie_within_pfcp_session_modification_response_t, packet_rate_status) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_packet_rate_status_report_ie_within_pfcp_session_modification_response = {
+    3, 2, ogs_pfcp_tlv_index_packet_rate_status_report_ie_within_pfcp_session_modification_response_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_packet_rate_status_report_ie_within_pfcp_session_modification_response =
 {
@@ -4054,8 +5996,29 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_packet_rate_status_report_ie_within_pfcp_sessio
         &ogs_pfcp_tlv_desc_qer_id,
         &ogs_pfcp_tlv_desc_packet_rate_status,
         NULL,
-    }
-};
+    },
+    &ogs_pfcp_tlv_index_packet_rate_status_report_ie_within_pfcp_session_modification_response,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_ue_ip_address_usage_information_slot[16] = {
+    [4] = { OGS_PFCP_SEQUENCE_NUMBER_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_ue_ip_address_usage_information_t, ue_ip_address_usage_sequence_number) - sizeof(ogs_tlv_presence_t) },
+    [5] = { OGS_PFCP_VALIDITY_TIMER_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_ue_ip_address_usage_information_t, validity_timer) - sizeof(ogs_tlv_presence_t) },
+    [6] = { OGS_PFCP_NETWORK_INSTANCE_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_tlv_ue_ip_address_usage_information_t, network_instance) - sizeof(ogs_tlv_presence_t) },
+    [7] = { OGS_PFCP_UE_IP_ADDRESS_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_pfcp_tlv_ue_ip_address_usage_information_t, ue_ip_address_pool_id) - sizeof(ogs_tlv_presence_t) },
+    [9] = { OGS_PFCP_S_NSSAI_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_pfcp_tlv_ue_ip_address_usage_information_t, s_nssai) - sizeof(ogs_tlv_presence_t) },
+    [12] = { OGS_PFCP_NUMBER_OF_UE_IP_ADDRESSES_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_ue_ip_address_usage_information_t, number_of_ue_ip_addresses) - sizeof(ogs_tlv_presence_t) },
+    [13] = { OGS_PFCP_METRIC_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_ue_ip_address_usage_information_t, ue_ip_address_usage_metric) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_ue_ip_address_usage_information = {
+    15, 7, ogs_pfcp_tlv_index_ue_ip_address_usage_information_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_ue_ip_address_usage_information =
 {
@@ -4074,8 +6037,21 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_ue_ip_address_usage_information =
         &ogs_pfcp_tlv_desc_ue_ip_address,
         &ogs_pfcp_tlv_desc_s_nssai,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_ue_ip_address_usage_information,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_partial_failure_information_slot[8] = {
+    [2] = { OGS_PFCP_FAILED_RULE_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_partial_failure_information_t, failed_rule_id) - sizeof(ogs_tlv_presence_t) },
+    [3] = { OGS_PFCP_CAUSE_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_partial_failure_information_t, failure_cause) - sizeof(ogs_tlv_presence_t) },
+    [4] = { OGS_PFCP_OFFENDING_IE_INFORMATION_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_partial_failure_information_t, offending_ie_information) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_partial_failure_information = {
+    7, 3, ogs_pfcp_tlv_index_partial_failure_information_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_partial_failure_information =
 {
@@ -4090,8 +6066,21 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_partial_failure_information =
         &ogs_pfcp_tlv_desc_cause,
         &ogs_pfcp_tlv_desc_offending_ie_information,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_partial_failure_information,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_l2tp_tunnel_information_slot[8] = {
+    [0] = { OGS_PFCP_LNS_ADDRESS_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_l2tp_tunnel_information_t, lns_address) - sizeof(ogs_tlv_presence_t) },
+    [1] = { OGS_PFCP_TUNNEL_PASSWORD_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_l2tp_tunnel_information_t, tunnel_password) - sizeof(ogs_tlv_presence_t) },
+    [2] = { OGS_PFCP_TUNNEL_PREFERENCE_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_l2tp_tunnel_information_t, tunnel_preference) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_l2tp_tunnel_information = {
+    7, 3, ogs_pfcp_tlv_index_l2tp_tunnel_information_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_l2tp_tunnel_information =
 {
@@ -4106,8 +6095,25 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_l2tp_tunnel_information =
         &ogs_pfcp_tlv_desc_tunnel_password,
         &ogs_pfcp_tlv_desc_tunnel_preference,
         NULL,
-    }
-};
+    },
+    &ogs_pfcp_tlv_index_l2tp_tunnel_information,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_l2tp_session_information_slot[16] = {
+    [3] = { OGS_PFCP_CALLED_NUMBER_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_l2tp_session_information_t, called_number) - sizeof(ogs_tlv_presence_t) },
+    [6] = { OGS_PFCP_L2TP_USER_AUTHENTICATION_IE_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_tlv_l2tp_session_information_t, l2tp_user_authentication) - sizeof(ogs_tlv_presence_t) },
+    [7] = { OGS_PFCP_MAXIMUM_RECEIVE_UNIT_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_l2tp_session_information_t, maximum_receive_unit) - sizeof(ogs_tlv_presence_t) },
+    [10] = { OGS_PFCP_CALLING_NUMBER_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_l2tp_session_information_t, calling_number) - sizeof(ogs_tlv_presence_t) },
+    [12] = { OGS_PFCP_L2TP_SESSION_INDICATIONS_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_l2tp_session_information_t, l2tp_session_indications) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_l2tp_session_information = {
+    15, 5, ogs_pfcp_tlv_index_l2tp_session_information_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_l2tp_session_information =
 {
@@ -4124,8 +6130,21 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_l2tp_session_information =
         &ogs_pfcp_tlv_desc_l2tp_session_indications,
         &ogs_pfcp_tlv_desc_l2tp_user_authentication_ie,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_l2tp_session_information,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_created_l2tp_session_slot[8] = {
+    [0] = { OGS_PFCP_LNS_ADDRESS_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_created_l2tp_session_t, lns_address) - sizeof(ogs_tlv_presence_t) },
+    [5] = { OGS_PFCP_DNS_SERVER_ADDRESS_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_created_l2tp_session_t, dns_server_address) - sizeof(ogs_tlv_presence_t) },
+    [6] = { OGS_PFCP_NBNS_SERVER_ADDRESS_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_created_l2tp_session_t, nbns_server_address) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_created_l2tp_session = {
+    7, 3, ogs_pfcp_tlv_index_created_l2tp_session_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_created_l2tp_session =
 {
@@ -4140,8 +6159,23 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_created_l2tp_session =
         &ogs_pfcp_tlv_desc_nbns_server_address,
         &ogs_pfcp_tlv_desc_lns_address,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_created_l2tp_session,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_pfcp_session_change_info_slot[8] = {
+    [1] = { OGS_PFCP_FQ_CSID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_pfcp_session_change_info_t, pgw_c_smf_fq_csid) - sizeof(ogs_tlv_presence_t) },
+    [2] = { OGS_PFCP_ALTERNATIVE_SMF_IP_ADDRESS_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_pfcp_session_change_info_t, alternative_smf_pgw_c_ip_address) - sizeof(ogs_tlv_presence_t) },
+    [3] = { OGS_PFCP_GROUP_ID_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_pfcp_session_change_info_t, group_id) - sizeof(ogs_tlv_presence_t) },
+    [4] = { OGS_PFCP_CP_IP_ADDRESS_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_pfcp_session_change_info_t, cp_ip_address) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_pfcp_session_change_info = {
+    7, 4, ogs_pfcp_tlv_index_pfcp_session_change_info_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_pfcp_session_change_info =
 {
@@ -4157,9 +6191,24 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_pfcp_session_change_info =
         &ogs_pfcp_tlv_desc_cp_ip_address,
         &ogs_pfcp_tlv_desc_alternative_smf_ip_address,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_pfcp_session_change_info,
+    NULL
 };
 
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_mbs_session_n4mb_control_information_slot[8] = {
+    [1] = { OGS_PFCP_MBS_SESSION_IDENTIFIER_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_mbs_session_n4mb_control_information_t, mbs_session_identifier) - sizeof(ogs_tlv_presence_t) },
+    [2] = { OGS_PFCP_AREA_SESSION_ID_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_mbs_session_n4mb_control_information_t, area_session_id) - sizeof(ogs_tlv_presence_t) },
+    [3] = { OGS_PFCP_MBSN4MBREQ_FLAGS_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_mbs_session_n4mb_control_information_t, mbsn4mbreq_flags) - sizeof(ogs_tlv_presence_t) },
+    [4] = { OGS_PFCP_MULTICAST_TRANSPORT_INFORMATION_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_mbs_session_n4mb_control_information_t, multicast_transport_information_for_n3mb_and_or_n19mb) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_mbs_session_n4mb_control_information = {
+    7, 4, ogs_pfcp_tlv_index_mbs_session_n4mb_control_information_slot };
+
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_mbs_session_n4mb_control_information =
 {
     OGS_TLV_COMPOUND,
@@ -4174,8 +6223,17 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_mbs_session_n4mb_control_information =
         &ogs_pfcp_tlv_desc_mbsn4mbreq_flags,
         &ogs_pfcp_tlv_desc_multicast_transport_information,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_mbs_session_n4mb_control_information,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_mbs_session_n4mb_information_slot[2] = {
+    [0] = { OGS_PFCP_MULTICAST_TRANSPORT_INFORMATION_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_mbs_session_n4mb_information_t, multicast_transport_information) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_mbs_session_n4mb_information = {
+    1, 1, ogs_pfcp_tlv_index_mbs_session_n4mb_information_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_mbs_session_n4mb_information =
 {
@@ -4188,8 +6246,21 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_mbs_session_n4mb_information =
     {
         &ogs_pfcp_tlv_desc_multicast_transport_information,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_mbs_session_n4mb_information,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_mbs_session_n4_control_information_slot[8] = {
+    [1] = { OGS_PFCP_MBS_SESSION_IDENTIFIER_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_mbs_session_n4_control_information_t, mbs_session_identifier) - sizeof(ogs_tlv_presence_t) },
+    [2] = { OGS_PFCP_AREA_SESSION_ID_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_mbs_session_n4_control_information_t, area_session_id) - sizeof(ogs_tlv_presence_t) },
+    [3] = { OGS_PFCP_MULTICAST_TRANSPORT_INFORMATION_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_mbs_session_n4_control_information_t, multicast_transport_information) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_mbs_session_n4_control_information = {
+    7, 3, ogs_pfcp_tlv_index_mbs_session_n4_control_information_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_mbs_session_n4_control_information =
 {
@@ -4204,8 +6275,23 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_mbs_session_n4_control_information =
         &ogs_pfcp_tlv_desc_area_session_id,
         &ogs_pfcp_tlv_desc_multicast_transport_information,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_mbs_session_n4_control_information,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_mbs_session_n4_information_slot[8] = {
+    [0] = { OGS_PFCP_MBSN4RESP_FLAGS_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_tlv_mbs_session_n4_information_t, mbsn4resp_flags) - sizeof(ogs_tlv_presence_t) },
+    [1] = { OGS_PFCP_MBS_SESSION_IDENTIFIER_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_mbs_session_n4_information_t, mbs_session_identifier) - sizeof(ogs_tlv_presence_t) },
+    [2] = { OGS_PFCP_AREA_SESSION_ID_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_mbs_session_n4_information_t, area_session_id) - sizeof(ogs_tlv_presence_t) },
+    [5] = { OGS_PFCP_F_TEID_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_tlv_mbs_session_n4_information_t, n19mb_dl_tunnel_id) - sizeof(ogs_tlv_presence_t) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_mbs_session_n4_information = {
+    7, 4, ogs_pfcp_tlv_index_mbs_session_n4_information_slot };
 
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_mbs_session_n4_information =
 {
@@ -4221,9 +6307,20 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_mbs_session_n4_information =
         &ogs_pfcp_tlv_desc_f_teid,
         &ogs_pfcp_tlv_desc_mbsn4resp_flags,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_mbs_session_n4_information,
+    NULL
 };
 
+static const ogs_tlv_desc_slot_t ogs_pfcp_tlv_index_dscp_to_ppi_control_information_slot[4] = {
+    [0] = { OGS_PFCP_QFI_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_tlv_dscp_to_ppi_control_information_t, qfi) - sizeof(ogs_tlv_presence_t) },
+    [1] = { OGS_PFCP_DSCP_TO_PPI_MAPPING_INFORMATION_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_tlv_dscp_to_ppi_control_information_t, dscp_to_ppi_mapping_information) - sizeof(ogs_tlv_presence_t) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_tlv_index_dscp_to_ppi_control_information = {
+    3, 2, ogs_pfcp_tlv_index_dscp_to_ppi_control_information_slot };
+
 ogs_tlv_desc_t ogs_pfcp_tlv_desc_dscp_to_ppi_control_information =
 {
     OGS_TLV_COMPOUND,
@@ -4236,8 +6333,19 @@ ogs_tlv_desc_t ogs_pfcp_tlv_desc_dscp_to_ppi_control_information =
         &ogs_pfcp_tlv_desc_dscp_to_ppi_mapping_information,
         &ogs_pfcp_tlv_desc_qfi,
         NULL,
-    }
+    },
+    &ogs_pfcp_tlv_index_dscp_to_ppi_control_information,
+    NULL
+};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_msg_index_pfcp_heartbeat_request_slot[4] = {
+    [0] = { OGS_PFCP_RECOVERY_TIME_STAMP_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_heartbeat_request_t, recovery_time_stamp) },
+    [1] = { OGS_PFCP_SOURCE_IP_ADDRESS_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_heartbeat_request_t, source_ip_address) },
 };
+static const ogs_tlv_desc_index_t ogs_pfcp_msg_index_pfcp_heartbeat_request = {
+    3, 2, ogs_pfcp_msg_index_pfcp_heartbeat_request_slot };
 
 ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_heartbeat_request =
 {
@@ -4247,7 +6355,14 @@ ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_heartbeat_request =
         &ogs_pfcp_tlv_desc_recovery_time_stamp,
         &ogs_pfcp_tlv_desc_source_ip_address,
     NULL,
-}};
+}, &ogs_pfcp_msg_index_pfcp_heartbeat_request, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_msg_index_pfcp_heartbeat_response_slot[2] = {
+    [0] = { OGS_PFCP_RECOVERY_TIME_STAMP_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_heartbeat_response_t, recovery_time_stamp) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_msg_index_pfcp_heartbeat_response = {
+    1, 1, ogs_pfcp_msg_index_pfcp_heartbeat_response_slot };
 
 ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_heartbeat_response =
 {
@@ -4256,7 +6371,16 @@ ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_heartbeat_response =
     0, 0, 0, 0, {
         &ogs_pfcp_tlv_desc_recovery_time_stamp,
     NULL,
-}};
+}, &ogs_pfcp_msg_index_pfcp_heartbeat_response, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_msg_index_pfcp_pfd_management_request_slot[4] = {
+    [0] = { OGS_PFCP_NODE_ID_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_pfd_management_request_t, node_id) },
+    [2] = { OGS_PFCP_APPLICATION_ID_S_PFDS_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_pfd_management_request_t, application_id_s_pfds) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_msg_index_pfcp_pfd_management_request = {
+    3, 2, ogs_pfcp_msg_index_pfcp_pfd_management_request_slot };
 
 ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_pfd_management_request =
 {
@@ -4266,7 +6390,18 @@ ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_pfd_management_request =
         &ogs_pfcp_tlv_desc_application_id_s_pfds,
         &ogs_pfcp_tlv_desc_node_id,
     NULL,
-}};
+}, &ogs_pfcp_msg_index_pfcp_pfd_management_request, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_msg_index_pfcp_pfd_management_response_slot[8] = {
+    [0] = { OGS_PFCP_OFFENDING_IE_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_pfd_management_response_t, offending_ie) },
+    [3] = { OGS_PFCP_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_pfd_management_response_t, cause) },
+    [4] = { OGS_PFCP_NODE_ID_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_pfd_management_response_t, node_id) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_msg_index_pfcp_pfd_management_response = {
+    7, 3, ogs_pfcp_msg_index_pfcp_pfd_management_response_slot };
 
 ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_pfd_management_response =
 {
@@ -4277,7 +6412,40 @@ ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_pfd_management_response =
         &ogs_pfcp_tlv_desc_offending_ie,
         &ogs_pfcp_tlv_desc_node_id,
     NULL,
-}};
+}, &ogs_pfcp_msg_index_pfcp_pfd_management_response, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_msg_index_pfcp_association_setup_request_slot[32] = {
+    [0] = { OGS_PFCP_RECOVERY_TIME_STAMP_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_association_setup_request_t, recovery_time_stamp) },
+    [1] = { 0, 0, 0, 6, 5,
+        offsetof(ogs_pfcp_association_setup_request_t, user_plane_ip_resource_information) + sizeof(ogs_pfcp_tlv_user_plane_ip_resource_information_t) },
+    [2] = { OGS_PFCP_ALTERNATIVE_SMF_IP_ADDRESS_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_pfcp_association_setup_request_t, alternative_smf_ip_address) },
+    [11] = { OGS_PFCP_PFCPASREQ_FLAGS_TYPE, 0, 0, 14, 13,
+        offsetof(ogs_pfcp_association_setup_request_t, pfcpasreq_flags) },
+    [17] = { OGS_PFCP_CP_FUNCTION_FEATURES_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_association_setup_request_t, cp_function_features) },
+    [19] = { OGS_PFCP_UP_FUNCTION_FEATURES_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_association_setup_request_t, up_function_features) },
+    [20] = { OGS_PFCP_USER_PLANE_IP_RESOURCE_INFORMATION_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_association_setup_request_t, user_plane_ip_resource_information) },
+    [21] = { OGS_PFCP_SMF_SET_ID_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_pfcp_association_setup_request_t, smf_set_id) },
+    [22] = { OGS_PFCP_UE_IP_ADDRESS_TYPE, 0, 0, 10, 9,
+        offsetof(ogs_pfcp_association_setup_request_t, ue_ip_address_pool_information) },
+    [23] = { OGS_PFCP_CLOCK_DRIFT_CONTROL_INFORMATION_TYPE, 0, 0, 12, 11,
+        offsetof(ogs_pfcp_association_setup_request_t, clock_drift_control_information) },
+    [24] = { OGS_PFCP_NF_INSTANCE_ID_TYPE, 0, 0, 13, 12,
+        offsetof(ogs_pfcp_association_setup_request_t, upf_instance_id) },
+    [28] = { OGS_PFCP_NODE_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_association_setup_request_t, node_id) },
+    [30] = { OGS_PFCP_GTP_U_PATH_QOS_CONTROL_INFORMATION_TYPE, 0, 0, 11, 10,
+        offsetof(ogs_pfcp_association_setup_request_t, gtp_u_path_qos_control_information) },
+    [31] = { OGS_PFCP_PFCP_SESSION_RETENTION_INFORMATION_WITHIN_PFCP_ASSOCIATION_SETUP_REQUEST_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_pfcp_association_setup_request_t, pfcp_session_retention_information) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_msg_index_pfcp_association_setup_request = {
+    31, 14, ogs_pfcp_msg_index_pfcp_association_setup_request_slot };
 
 ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_association_setup_request =
 {
@@ -4299,7 +6467,40 @@ ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_association_setup_request =
         &ogs_pfcp_tlv_desc_nf_instance_id,
         &ogs_pfcp_tlv_desc_pfcpasreq_flags,
     NULL,
-}};
+}, &ogs_pfcp_msg_index_pfcp_association_setup_request, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_msg_index_pfcp_association_setup_response_slot[32] = {
+    [0] = { OGS_PFCP_RECOVERY_TIME_STAMP_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_association_setup_response_t, recovery_time_stamp) },
+    [1] = { 0, 0, 0, 7, 6,
+        offsetof(ogs_pfcp_association_setup_response_t, user_plane_ip_resource_information) + sizeof(ogs_pfcp_tlv_user_plane_ip_resource_information_t) },
+    [2] = { OGS_PFCP_ALTERNATIVE_SMF_IP_ADDRESS_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_pfcp_association_setup_response_t, alternative_smf_ip_address) },
+    [17] = { OGS_PFCP_CP_FUNCTION_FEATURES_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_association_setup_response_t, cp_function_features) },
+    [19] = { OGS_PFCP_UP_FUNCTION_FEATURES_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_association_setup_response_t, up_function_features) },
+    [20] = { OGS_PFCP_USER_PLANE_IP_RESOURCE_INFORMATION_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_pfcp_association_setup_response_t, user_plane_ip_resource_information) },
+    [21] = { OGS_PFCP_SMF_SET_ID_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_pfcp_association_setup_response_t, smf_set_id) },
+    [22] = { OGS_PFCP_CLOCK_DRIFT_CONTROL_INFORMATION_TYPE, 0, 0, 11, 10,
+        offsetof(ogs_pfcp_association_setup_response_t, clock_drift_control_information) },
+    [23] = { OGS_PFCP_UE_IP_ADDRESS_TYPE, 0, 0, 12, 11,
+        offsetof(ogs_pfcp_association_setup_response_t, ue_ip_address_pool_information) },
+    [24] = { OGS_PFCP_PFCPASRSP_FLAGS_TYPE, 0, 0, 10, 9,
+        offsetof(ogs_pfcp_association_setup_response_t, pfcpasrsp_flags) },
+    [25] = { OGS_PFCP_NF_INSTANCE_ID_TYPE, 0, 0, 14, 13,
+        offsetof(ogs_pfcp_association_setup_response_t, upf_instance_id) },
+    [27] = { OGS_PFCP_CAUSE_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_association_setup_response_t, cause) },
+    [28] = { OGS_PFCP_NODE_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_association_setup_response_t, node_id) },
+    [30] = { OGS_PFCP_GTP_U_PATH_QOS_CONTROL_INFORMATION_TYPE, 0, 0, 13, 12,
+        offsetof(ogs_pfcp_association_setup_response_t, gtp_u_path_qos_control_information) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_msg_index_pfcp_association_setup_response = {
+    31, 14, ogs_pfcp_msg_index_pfcp_association_setup_response_slot };
 
 ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_association_setup_response =
 {
@@ -4321,7 +6522,40 @@ ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_association_setup_response =
         &ogs_pfcp_tlv_desc_gtp_u_path_qos_control_information,
         &ogs_pfcp_tlv_desc_nf_instance_id,
     NULL,
-}};
+}, &ogs_pfcp_msg_index_pfcp_association_setup_response, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_msg_index_pfcp_association_update_request_slot[32] = {
+    [0] = { 0, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_association_update_request_t, user_plane_ip_resource_information) + sizeof(ogs_pfcp_tlv_user_plane_ip_resource_information_t) },
+    [2] = { OGS_PFCP_ALTERNATIVE_SMF_IP_ADDRESS_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_pfcp_association_update_request_t, alternative_smf_ip_address) },
+    [16] = { OGS_PFCP_GRACEFUL_RELEASE_PERIOD_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_pfcp_association_update_request_t, graceful_release_period) },
+    [17] = { OGS_PFCP_CP_FUNCTION_FEATURES_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_association_update_request_t, cp_function_features) },
+    [18] = { OGS_PFCP_PFCPAUREQ_FLAGS_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_pfcp_association_update_request_t, pfcpaureq_flags) },
+    [19] = { OGS_PFCP_UP_FUNCTION_FEATURES_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_association_update_request_t, up_function_features) },
+    [20] = { OGS_PFCP_USER_PLANE_IP_RESOURCE_INFORMATION_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_association_update_request_t, user_plane_ip_resource_information) },
+    [21] = { OGS_PFCP_SMF_SET_ID_TYPE, 0, 0, 10, 9,
+        offsetof(ogs_pfcp_association_update_request_t, smf_set_id) },
+    [22] = { OGS_PFCP_CLOCK_DRIFT_CONTROL_INFORMATION_TYPE, 0, 0, 11, 10,
+        offsetof(ogs_pfcp_association_update_request_t, clock_drift_control_information) },
+    [23] = { OGS_PFCP_PFCP_ASSOCIATION_RELEASE_REQUEST_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_pfcp_association_update_request_t, pfcp_association_release_request) },
+    [24] = { OGS_PFCP_UE_IP_ADDRESS_TYPE, 0, 0, 12, 11,
+        offsetof(ogs_pfcp_association_update_request_t, ue_ip_address_pool_information) },
+    [25] = { OGS_PFCP_UE_IP_ADDRESS_USAGE_INFORMATION_TYPE, 0, 0, 14, 13,
+        offsetof(ogs_pfcp_association_update_request_t, ue_ip_address_usage_information) },
+    [28] = { OGS_PFCP_NODE_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_association_update_request_t, node_id) },
+    [30] = { OGS_PFCP_GTP_U_PATH_QOS_CONTROL_INFORMATION_TYPE, 0, 0, 13, 12,
+        offsetof(ogs_pfcp_association_update_request_t, gtp_u_path_qos_control_information) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_msg_index_pfcp_association_update_request = {
+    31, 14, ogs_pfcp_msg_index_pfcp_association_update_request_slot };
 
 ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_association_update_request =
 {
@@ -4343,7 +6577,26 @@ ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_association_update_request =
         &ogs_pfcp_tlv_desc_gtp_u_path_qos_control_information,
         &ogs_pfcp_tlv_desc_ue_ip_address_usage_information,
     NULL,
-}};
+}, &ogs_pfcp_msg_index_pfcp_association_update_request, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_msg_index_pfcp_association_update_response_slot[16] = {
+    [0] = { 0, 0, 0, 6, 5,
+        offsetof(ogs_pfcp_association_update_response_t, user_plane_ip_resource_information) + sizeof(ogs_pfcp_tlv_user_plane_ip_resource_information_t) },
+    [1] = { OGS_PFCP_CP_FUNCTION_FEATURES_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_association_update_response_t, cp_function_features) },
+    [3] = { OGS_PFCP_UP_FUNCTION_FEATURES_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_association_update_response_t, up_function_features) },
+    [4] = { OGS_PFCP_USER_PLANE_IP_RESOURCE_INFORMATION_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_association_update_response_t, user_plane_ip_resource_information) },
+    [5] = { OGS_PFCP_UE_IP_ADDRESS_USAGE_INFORMATION_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_pfcp_association_update_response_t, ue_ip_address_usage_information) },
+    [11] = { OGS_PFCP_CAUSE_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_association_update_response_t, cause) },
+    [12] = { OGS_PFCP_NODE_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_association_update_response_t, node_id) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_msg_index_pfcp_association_update_response = {
+    15, 7, ogs_pfcp_msg_index_pfcp_association_update_response_slot };
 
 ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_association_update_response =
 {
@@ -4358,7 +6611,14 @@ ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_association_update_response =
         &ogs_tlv_desc_more4,
         &ogs_pfcp_tlv_desc_ue_ip_address_usage_information,
     NULL,
-}};
+}, &ogs_pfcp_msg_index_pfcp_association_update_response, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_msg_index_pfcp_association_release_request_slot[2] = {
+    [0] = { OGS_PFCP_NODE_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_association_release_request_t, node_id) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_msg_index_pfcp_association_release_request = {
+    1, 1, ogs_pfcp_msg_index_pfcp_association_release_request_slot };
 
 ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_association_release_request =
 {
@@ -4367,7 +6627,16 @@ ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_association_release_request =
     0, 0, 0, 0, {
         &ogs_pfcp_tlv_desc_node_id,
     NULL,
-}};
+}, &ogs_pfcp_msg_index_pfcp_association_release_request, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_msg_index_pfcp_association_release_response_slot[4] = {
+    [0] = { OGS_PFCP_NODE_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_association_release_response_t, node_id) },
+    [3] = { OGS_PFCP_CAUSE_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_association_release_response_t, cause) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_msg_index_pfcp_association_release_response = {
+    3, 2, ogs_pfcp_msg_index_pfcp_association_release_response_slot };
 
 ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_association_release_response =
 {
@@ -4377,7 +6646,7 @@ ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_association_release_response =
         &ogs_pfcp_tlv_desc_node_id,
         &ogs_pfcp_tlv_desc_cause,
     NULL,
-}};
+}, &ogs_pfcp_msg_index_pfcp_association_release_response, NULL};
 
 ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_version_not_supported_response =
 {
@@ -4385,7 +6654,28 @@ ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_version_not_supported_response =
     "PFCP Version Not Supported Response",
     0, 0, 0, 0, {
     NULL,
-}};
+}, NULL, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_msg_index_pfcp_node_report_request_slot[16] = {
+    [0] = { OGS_PFCP_VENDOR_SPECIFIC_NODE_REPORT_TYPE_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_node_report_request_t, vendor_specific_node_report_type) },
+    [3] = { OGS_PFCP_USER_PLANE_PATH_RECOVERY_REPORT_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_node_report_request_t, user_plane_path_recovery_report) },
+    [4] = { OGS_PFCP_PEER_UP_RESTART_REPORT_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_pfcp_node_report_request_t, peer_up_restart_report) },
+    [5] = { OGS_PFCP_CLOCK_DRIFT_REPORT_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_pfcp_node_report_request_t, clock_drift_report) },
+    [6] = { OGS_PFCP_USER_PLANE_PATH_FAILURE_REPORT_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_node_report_request_t, user_plane_path_failure_report) },
+    [7] = { OGS_PFCP_GTP_U_PATH_QOS_REPORT_PFCP_NODE_REPORT_REQUEST_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_pfcp_node_report_request_t, gtp_u_path_qos_report) },
+    [12] = { OGS_PFCP_NODE_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_node_report_request_t, node_id) },
+    [13] = { OGS_PFCP_NODE_REPORT_TYPE_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_node_report_request_t, node_report_type) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_msg_index_pfcp_node_report_request = {
+    15, 8, ogs_pfcp_msg_index_pfcp_node_report_request_slot };
 
 ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_node_report_request =
 {
@@ -4401,7 +6691,18 @@ ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_node_report_request =
         &ogs_pfcp_tlv_desc_gtp_u_path_qos_report_pfcp_node_report_request,
         &ogs_pfcp_tlv_desc_peer_up_restart_report,
     NULL,
-}};
+}, &ogs_pfcp_msg_index_pfcp_node_report_request, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_msg_index_pfcp_node_report_response_slot[8] = {
+    [0] = { OGS_PFCP_OFFENDING_IE_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_node_report_response_t, offending_ie) },
+    [3] = { OGS_PFCP_CAUSE_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_node_report_response_t, cause) },
+    [4] = { OGS_PFCP_NODE_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_node_report_response_t, node_id) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_msg_index_pfcp_node_report_response = {
+    7, 3, ogs_pfcp_msg_index_pfcp_node_report_response_slot };
 
 ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_node_report_response =
 {
@@ -4412,7 +6713,26 @@ ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_node_report_response =
         &ogs_pfcp_tlv_desc_cause,
         &ogs_pfcp_tlv_desc_offending_ie,
     NULL,
-}};
+}, &ogs_pfcp_msg_index_pfcp_node_report_response, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_msg_index_pfcp_session_set_deletion_request_slot[16] = {
+    [9] = { OGS_PFCP_FQ_CSID_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_session_set_deletion_request_t, sgw_c_fq_csid) },
+    [10] = { OGS_PFCP_FQ_CSID_TYPE, 0, 1, 3, 1,
+        offsetof(ogs_pfcp_session_set_deletion_request_t, pgw_c_smf_fq_csid) },
+    [11] = { OGS_PFCP_FQ_CSID_TYPE, 0, 2, 4, 1,
+        offsetof(ogs_pfcp_session_set_deletion_request_t, pgw_u_sgw_u__upf_fq_csid) },
+    [12] = { OGS_PFCP_NODE_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_session_set_deletion_request_t, node_id) },
+    [13] = { OGS_PFCP_FQ_CSID_TYPE, 0, 3, 5, 1,
+        offsetof(ogs_pfcp_session_set_deletion_request_t, twan_fq_csid) },
+    [14] = { OGS_PFCP_FQ_CSID_TYPE, 0, 4, 6, 1,
+        offsetof(ogs_pfcp_session_set_deletion_request_t, epdg_fq_csid) },
+    [15] = { OGS_PFCP_FQ_CSID_TYPE, 0, 5, 7, 1,
+        offsetof(ogs_pfcp_session_set_deletion_request_t, mme_fq_csid) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_msg_index_pfcp_session_set_deletion_request = {
+    15, 2, ogs_pfcp_msg_index_pfcp_session_set_deletion_request_slot };
 
 ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_session_set_deletion_request =
 {
@@ -4427,7 +6747,18 @@ ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_session_set_deletion_request =
         &ogs_pfcp_tlv_desc_fq_csid,
         &ogs_pfcp_tlv_desc_fq_csid,
     NULL,
-}};
+}, &ogs_pfcp_msg_index_pfcp_session_set_deletion_request, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_msg_index_pfcp_session_set_deletion_response_slot[8] = {
+    [0] = { OGS_PFCP_OFFENDING_IE_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_session_set_deletion_response_t, offending_ie) },
+    [3] = { OGS_PFCP_CAUSE_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_session_set_deletion_response_t, cause) },
+    [4] = { OGS_PFCP_NODE_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_session_set_deletion_response_t, node_id) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_msg_index_pfcp_session_set_deletion_response = {
+    7, 3, ogs_pfcp_msg_index_pfcp_session_set_deletion_response_slot };
 
 ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_session_set_deletion_response =
 {
@@ -4438,7 +6769,16 @@ ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_session_set_deletion_response =
         &ogs_pfcp_tlv_desc_cause,
         &ogs_pfcp_tlv_desc_offending_ie,
     NULL,
-}};
+}, &ogs_pfcp_msg_index_pfcp_session_set_deletion_response, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_msg_index_pfcp_session_set_modification_request_slot[4] = {
+    [0] = { OGS_PFCP_NODE_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_session_set_modification_request_t, node_id) },
+    [2] = { OGS_PFCP_PFCP_SESSION_CHANGE_INFO_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_session_set_modification_request_t, pfcp_session_change_info) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_msg_index_pfcp_session_set_modification_request = {
+    3, 2, ogs_pfcp_msg_index_pfcp_session_set_modification_request_slot };
 
 ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_session_set_modification_request =
 {
@@ -4448,7 +6788,18 @@ ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_session_set_modification_request =
         &ogs_pfcp_tlv_desc_node_id,
         &ogs_pfcp_tlv_desc_pfcp_session_change_info,
     NULL,
-}};
+}, &ogs_pfcp_msg_index_pfcp_session_set_modification_request, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_msg_index_pfcp_session_set_modification_response_slot[8] = {
+    [0] = { OGS_PFCP_OFFENDING_IE_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_session_set_modification_response_t, offending_ie) },
+    [3] = { OGS_PFCP_CAUSE_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_session_set_modification_response_t, cause) },
+    [4] = { OGS_PFCP_NODE_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_session_set_modification_response_t, node_id) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_msg_index_pfcp_session_set_modification_response = {
+    7, 3, ogs_pfcp_msg_index_pfcp_session_set_modification_response_slot };
 
 ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_session_set_modification_response =
 {
@@ -4459,7 +6810,86 @@ ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_session_set_modification_response =
         &ogs_pfcp_tlv_desc_cause,
         &ogs_pfcp_tlv_desc_offending_ie,
     NULL,
-}};
+}, &ogs_pfcp_msg_index_pfcp_session_set_modification_response, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_msg_index_pfcp_session_establishment_request_slot[128] = {
+    [0] = { 0, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_session_establishment_request_t, create_pdr) + sizeof(ogs_pfcp_tlv_create_pdr_t) },
+    [1] = { 0, 0, 1, 6, 3,
+        offsetof(ogs_pfcp_session_establishment_request_t, create_far) + sizeof(ogs_pfcp_tlv_create_far_t) },
+    [2] = { 0, 0, 2, 8, 3,
+        offsetof(ogs_pfcp_session_establishment_request_t, create_urr) + sizeof(ogs_pfcp_tlv_create_urr_t) },
+    [3] = { 0, 0, 3, 10, 3,
+        offsetof(ogs_pfcp_session_establishment_request_t, create_qer) + sizeof(ogs_pfcp_tlv_create_qer_t) },
+    [5] = { OGS_PFCP_USER_ID_TYPE, 0, 0, 20, 12,
+        offsetof(ogs_pfcp_session_establishment_request_t, user_id) },
+    [11] = { OGS_PFCP_CREATE_FAR_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_session_establishment_request_t, create_far) },
+    [13] = { OGS_PFCP_CREATE_BAR_TYPE, 0, 0, 11, 7,
+        offsetof(ogs_pfcp_session_establishment_request_t, create_bar) },
+    [22] = { OGS_PFCP_CREATE_URR_TYPE, 0, 0, 7, 5,
+        offsetof(ogs_pfcp_session_establishment_request_t, create_urr) },
+    [25] = { OGS_PFCP_FQ_CSID_TYPE, 0, 0, 14, 10,
+        offsetof(ogs_pfcp_session_establishment_request_t, sgw_c_fq_csid) },
+    [26] = { OGS_PFCP_FQ_CSID_TYPE, 0, 1, 15, 10,
+        offsetof(ogs_pfcp_session_establishment_request_t, mme_fq_csid) },
+    [27] = { OGS_PFCP_FQ_CSID_TYPE, 0, 2, 16, 10,
+        offsetof(ogs_pfcp_session_establishment_request_t, pgw_c_smf_fq_csid) },
+    [28] = { OGS_PFCP_FQ_CSID_TYPE, 0, 3, 17, 10,
+        offsetof(ogs_pfcp_session_establishment_request_t, epdg_fq_csid) },
+    [29] = { OGS_PFCP_FQ_CSID_TYPE, 0, 4, 18, 10,
+        offsetof(ogs_pfcp_session_establishment_request_t, twan_fq_csid) },
+    [30] = { OGS_PFCP_RAT_TYPE_TYPE, 0, 0, 31, 23,
+        offsetof(ogs_pfcp_session_establishment_request_t, rat_type) },
+    [39] = { OGS_PFCP_CREATE_TRAFFIC_ENDPOINT_TYPE, 0, 0, 12, 8,
+        offsetof(ogs_pfcp_session_establishment_request_t, create_traffic_endpoint) },
+    [42] = { OGS_PFCP_PFCPSEREQ_FLAGS_TYPE, 0, 0, 24, 16,
+        offsetof(ogs_pfcp_session_establishment_request_t, pfcpsereq_flags) },
+    [43] = { OGS_PFCP_GROUP_ID_TYPE, 0, 0, 34, 26,
+        offsetof(ogs_pfcp_session_establishment_request_t, group_id) },
+    [45] = { OGS_PFCP_USER_PLANE_INACTIVITY_TIMER_TYPE, 0, 0, 19, 11,
+        offsetof(ogs_pfcp_session_establishment_request_t, user_plane_inactivity_timer) },
+    [52] = { OGS_PFCP_CREATE_SRR_TYPE, 0, 0, 26, 18,
+        offsetof(ogs_pfcp_session_establishment_request_t, create_srr) },
+    [61] = { OGS_PFCP_PROVIDE_RDS_CONFIGURATION_INFORMATION_TYPE, 0, 0, 30, 22,
+        offsetof(ogs_pfcp_session_establishment_request_t, provide_rds_configuration_information) },
+    [70] = { OGS_PFCP_MBS_SESSION_N4_CONTROL_INFORMATION_TYPE, 0, 0, 36, 28,
+        offsetof(ogs_pfcp_session_establishment_request_t, mbs_session_n4_control_information) },
+    [71] = { OGS_PFCP_APN_DNN_TYPE, 0, 0, 22, 14,
+        offsetof(ogs_pfcp_session_establishment_request_t, apn_dnn) },
+    [73] = { OGS_PFCP_PDN_TYPE_TYPE, 0, 0, 13, 9,
+        offsetof(ogs_pfcp_session_establishment_request_t, pdn_type) },
+    [76] = { OGS_PFCP_MBS_SESSION_N4MB_CONTROL_INFORMATION_TYPE, 0, 0, 35, 27,
+        offsetof(ogs_pfcp_session_establishment_request_t, mbs_session_n4mb_control_information) },
+    [77] = { OGS_PFCP_L2TP_SESSION_INFORMATION_TYPE, 0, 0, 33, 25,
+        offsetof(ogs_pfcp_session_establishment_request_t, l2tp_session_information) },
+    [81] = { OGS_PFCP_F_SEID_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_session_establishment_request_t, cp_f_seid) },
+    [88] = { OGS_PFCP_TRACE_INFORMATION_TYPE, 0, 0, 21, 13,
+        offsetof(ogs_pfcp_session_establishment_request_t, trace_information) },
+    [89] = { OGS_PFCP_CREATE_PDR_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_session_establishment_request_t, create_pdr) },
+    [90] = { OGS_PFCP_S_NSSAI_TYPE, 0, 0, 29, 21,
+        offsetof(ogs_pfcp_session_establishment_request_t, s_nssai) },
+    [92] = { OGS_PFCP_NODE_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_session_establishment_request_t, node_id) },
+    [93] = { OGS_PFCP_CREATE_MAR_TYPE, 0, 0, 23, 15,
+        offsetof(ogs_pfcp_session_establishment_request_t, create_mar) },
+    [94] = { OGS_PFCP_DSCP_TO_PPI_CONTROL_INFORMATION_TYPE, 0, 0, 37, 29,
+        offsetof(ogs_pfcp_session_establishment_request_t, dscp_to_ppi_control_information) },
+    [96] = { OGS_PFCP_RECOVERY_TIME_STAMP_TYPE, 0, 0, 28, 20,
+        offsetof(ogs_pfcp_session_establishment_request_t, recovery_time_stamp) },
+    [111] = { OGS_PFCP_CREATE_QER_TYPE, 0, 0, 9, 6,
+        offsetof(ogs_pfcp_session_establishment_request_t, create_qer) },
+    [114] = { OGS_PFCP_CREATE_BRIDGE_INFO_FOR_TSC_TYPE, 0, 0, 25, 17,
+        offsetof(ogs_pfcp_session_establishment_request_t, create_bridge_info_for_tsc) },
+    [116] = { OGS_PFCP_L2TP_TUNNEL_INFORMATION_TYPE, 0, 0, 32, 24,
+        offsetof(ogs_pfcp_session_establishment_request_t, l2tp_tunnel_information) },
+    [124] = { OGS_PFCP_PROVIDE_ATSSS_CONTROL_INFORMATION_TYPE, 0, 0, 27, 19,
+        offsetof(ogs_pfcp_session_establishment_request_t, provide_atsss_control_information) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_msg_index_pfcp_session_establishment_request = {
+    127, 30, ogs_pfcp_msg_index_pfcp_session_establishment_request_slot };
 
 ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_session_establishment_request =
 {
@@ -4504,7 +6934,48 @@ ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_session_establishment_request =
         &ogs_pfcp_tlv_desc_mbs_session_n4_control_information,
         &ogs_pfcp_tlv_desc_dscp_to_ppi_control_information,
     NULL,
-}};
+}, &ogs_pfcp_msg_index_pfcp_session_establishment_request, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_msg_index_pfcp_session_establishment_response_slot[64] = {
+    [0] = { 0, 0, 0, 6, 5,
+        offsetof(ogs_pfcp_session_establishment_response_t, created_pdr) + sizeof(ogs_pfcp_tlv_created_pdr_t) },
+    [1] = { OGS_PFCP_CREATED_TRAFFIC_ENDPOINT_TYPE, 0, 0, 11, 10,
+        offsetof(ogs_pfcp_session_establishment_response_t, created_traffic_endpoint) },
+    [6] = { OGS_PFCP_OVERLOAD_CONTROL_INFORMATION_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_pfcp_session_establishment_response_t, overload_control_information) },
+    [8] = { OGS_PFCP_CREATED_PDR_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_session_establishment_response_t, created_pdr) },
+    [11] = { OGS_PFCP_CREATED_BRIDGE_INFO_FOR_TSC_TYPE, 0, 0, 12, 11,
+        offsetof(ogs_pfcp_session_establishment_response_t, created_bridge_info_for_tsc) },
+    [16] = { OGS_PFCP_PARTIAL_FAILURE_INFORMATION_TYPE, 0, 0, 15, 14,
+        offsetof(ogs_pfcp_session_establishment_response_t, partial_failure_information) },
+    [17] = { OGS_PFCP_F_SEID_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_session_establishment_response_t, up_f_seid) },
+    [21] = { OGS_PFCP_ATSSS_CONTROL_PARAMETERS_TYPE, 0, 0, 13, 12,
+        offsetof(ogs_pfcp_session_establishment_response_t, atsss_control_parameters) },
+    [22] = { OGS_PFCP_RDS_CONFIGURATION_INFORMATION_TYPE, 0, 0, 14, 13,
+        offsetof(ogs_pfcp_session_establishment_response_t, rds_configuration_information) },
+    [23] = { OGS_PFCP_MBS_SESSION_N4MB_INFORMATION_TYPE, 0, 0, 17, 16,
+        offsetof(ogs_pfcp_session_establishment_response_t, mbs_session_n4mb_information) },
+    [25] = { OGS_PFCP_FQ_CSID_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_pfcp_session_establishment_response_t, pgw_u_sgw_u__upf_fq_csid) },
+    [27] = { OGS_PFCP_CAUSE_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_session_establishment_response_t, cause) },
+    [28] = { OGS_PFCP_NODE_ID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_session_establishment_response_t, node_id) },
+    [31] = { OGS_PFCP_MBS_SESSION_N4_INFORMATION_TYPE, 0, 0, 18, 17,
+        offsetof(ogs_pfcp_session_establishment_response_t, mbs_session_n4_information) },
+    [34] = { OGS_PFCP_FAILED_RULE_ID_TYPE, 0, 0, 10, 9,
+        offsetof(ogs_pfcp_session_establishment_response_t, failed_rule_id) },
+    [40] = { OGS_PFCP_OFFENDING_IE_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_session_establishment_response_t, offending_ie) },
+    [59] = { OGS_PFCP_LOAD_CONTROL_INFORMATION_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_pfcp_session_establishment_response_t, load_control_information) },
+    [63] = { OGS_PFCP_CREATED_L2TP_SESSION_TYPE, 0, 0, 16, 15,
+        offsetof(ogs_pfcp_session_establishment_response_t, created_l2tp_session) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_msg_index_pfcp_session_establishment_response = {
+    63, 18, ogs_pfcp_msg_index_pfcp_session_establishment_response_slot };
 
 ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_session_establishment_response =
 {
@@ -4530,7 +7001,128 @@ ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_session_establishment_response =
         &ogs_pfcp_tlv_desc_mbs_session_n4mb_information,
         &ogs_pfcp_tlv_desc_mbs_session_n4_information,
     NULL,
-}};
+}, &ogs_pfcp_msg_index_pfcp_session_establishment_response, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_msg_index_pfcp_session_modification_request_slot[128] = {
+    [0] = { 0, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_session_modification_request_t, remove_pdr) + sizeof(ogs_pfcp_tlv_remove_pdr_t) },
+    [1] = { 0, 0, 1, 5, 2,
+        offsetof(ogs_pfcp_session_modification_request_t, remove_far) + sizeof(ogs_pfcp_tlv_remove_far_t) },
+    [2] = { 0, 0, 2, 7, 2,
+        offsetof(ogs_pfcp_session_modification_request_t, remove_urr) + sizeof(ogs_pfcp_tlv_remove_urr_t) },
+    [3] = { 0, 0, 3, 9, 2,
+        offsetof(ogs_pfcp_session_modification_request_t, remove_qer) + sizeof(ogs_pfcp_tlv_remove_qer_t) },
+    [4] = { 0, 0, 4, 13, 2,
+        offsetof(ogs_pfcp_session_modification_request_t, create_pdr) + sizeof(ogs_pfcp_tlv_create_pdr_t) },
+    [5] = { 0, 0, 5, 15, 2,
+        offsetof(ogs_pfcp_session_modification_request_t, create_far) + sizeof(ogs_pfcp_tlv_create_far_t) },
+    [6] = { 0, 0, 6, 17, 2,
+        offsetof(ogs_pfcp_session_modification_request_t, create_urr) + sizeof(ogs_pfcp_tlv_create_urr_t) },
+    [7] = { 0, 0, 7, 19, 2,
+        offsetof(ogs_pfcp_session_modification_request_t, create_qer) + sizeof(ogs_pfcp_tlv_create_qer_t) },
+    [8] = { 0, 0, 8, 23, 2,
+        offsetof(ogs_pfcp_session_modification_request_t, update_pdr) + sizeof(ogs_pfcp_tlv_update_pdr_t) },
+    [9] = { 0, 0, 9, 25, 2,
+        offsetof(ogs_pfcp_session_modification_request_t, update_far) + sizeof(ogs_pfcp_tlv_update_far_t) },
+    [10] = { OGS_PFCP_UPDATE_URR_TYPE, 0, 0, 26, 16,
+        offsetof(ogs_pfcp_session_modification_request_t, update_urr) },
+    [11] = { OGS_PFCP_CREATE_FAR_TYPE, 0, 0, 14, 9,
+        offsetof(ogs_pfcp_session_modification_request_t, create_far) },
+    [12] = { 0, 0, 10, 27, 2,
+        offsetof(ogs_pfcp_session_modification_request_t, update_urr) + sizeof(ogs_pfcp_tlv_update_urr_t) },
+    [13] = { OGS_PFCP_CREATE_BAR_TYPE, 0, 0, 20, 12,
+        offsetof(ogs_pfcp_session_modification_request_t, create_bar) },
+    [14] = { 0, 0, 11, 29, 2,
+        offsetof(ogs_pfcp_session_modification_request_t, update_qer) + sizeof(ogs_pfcp_tlv_update_qer_t) },
+    [15] = { OGS_PFCP_PFCPSMREQ_FLAGS_TYPE, 0, 0, 32, 20,
+        offsetof(ogs_pfcp_session_modification_request_t, pfcpsmreq_flags) },
+    [16] = { OGS_PFCP_REMOVE_FAR_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_session_modification_request_t, remove_far) },
+    [17] = { OGS_PFCP_UPDATE_SRR_TYPE, 0, 0, 49, 33,
+        offsetof(ogs_pfcp_session_modification_request_t, update_srr) },
+    [22] = { OGS_PFCP_CREATE_URR_TYPE, 0, 0, 16, 10,
+        offsetof(ogs_pfcp_session_modification_request_t, create_urr) },
+    [25] = { OGS_PFCP_FQ_CSID_TYPE, 0, 0, 34, 22,
+        offsetof(ogs_pfcp_session_modification_request_t, pgw_c_smf_fq_csid) },
+    [26] = { OGS_PFCP_FQ_CSID_TYPE, 0, 1, 35, 22,
+        offsetof(ogs_pfcp_session_modification_request_t, sgw_c_fq_csid) },
+    [27] = { OGS_PFCP_FQ_CSID_TYPE, 0, 2, 36, 22,
+        offsetof(ogs_pfcp_session_modification_request_t, mme_fq_csid) },
+    [28] = { OGS_PFCP_FQ_CSID_TYPE, 0, 3, 37, 22,
+        offsetof(ogs_pfcp_session_modification_request_t, epdg_fq_csid) },
+    [29] = { OGS_PFCP_FQ_CSID_TYPE, 0, 4, 38, 22,
+        offsetof(ogs_pfcp_session_modification_request_t, twan_fq_csid) },
+    [30] = { OGS_PFCP_RAT_TYPE_TYPE, 0, 0, 55, 39,
+        offsetof(ogs_pfcp_session_modification_request_t, rat_type) },
+    [33] = { OGS_PFCP_UPDATE_PDR_TYPE, 0, 0, 22, 14,
+        offsetof(ogs_pfcp_session_modification_request_t, update_pdr) },
+    [35] = { OGS_PFCP_ACCESS_AVAILABILITY_INFORMATION_TYPE, 0, 0, 52, 36,
+        offsetof(ogs_pfcp_session_modification_request_t, access_availability_information) },
+    [39] = { OGS_PFCP_CREATE_TRAFFIC_ENDPOINT_TYPE, 0, 0, 21, 13,
+        offsetof(ogs_pfcp_session_modification_request_t, create_traffic_endpoint) },
+    [43] = { OGS_PFCP_GROUP_ID_TYPE, 0, 0, 56, 40,
+        offsetof(ogs_pfcp_session_modification_request_t, group_id) },
+    [45] = { OGS_PFCP_USER_PLANE_INACTIVITY_TIMER_TYPE, 0, 0, 39, 23,
+        offsetof(ogs_pfcp_session_modification_request_t, user_plane_inactivity_timer) },
+    [47] = { OGS_PFCP_TSC_MANAGEMENT_INFORMATION_IE_WITHIN_PFCP_SESSION_MODIFICATION_REQUEST_TYPE, 0, 0, 46, 30,
+        offsetof(ogs_pfcp_session_modification_request_t, tsc_management_information) },
+    [50] = { OGS_PFCP_REMOVE_TRAFFIC_ENDPOINT_TYPE, 0, 0, 11, 7,
+        offsetof(ogs_pfcp_session_modification_request_t, remove_traffic_endpoint) },
+    [52] = { OGS_PFCP_CREATE_SRR_TYPE, 0, 0, 48, 32,
+        offsetof(ogs_pfcp_session_modification_request_t, create_srr) },
+    [55] = { OGS_PFCP_REMOVE_PDR_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_session_modification_request_t, remove_pdr) },
+    [63] = { OGS_PFCP_REMOVE_BAR_TYPE, 0, 0, 10, 6,
+        offsetof(ogs_pfcp_session_modification_request_t, remove_bar) },
+    [65] = { OGS_PFCP_UPDATE_MAR_TYPE, 0, 0, 43, 27,
+        offsetof(ogs_pfcp_session_modification_request_t, update_mar) },
+    [66] = { OGS_PFCP_REMOVE_QER_TYPE, 0, 0, 8, 5,
+        offsetof(ogs_pfcp_session_modification_request_t, remove_qer) },
+    [69] = { OGS_PFCP_QUERY_URR_TYPE, 0, 0, 33, 21,
+        offsetof(ogs_pfcp_session_modification_request_t, query_urr) },
+    [70] = { OGS_PFCP_MBS_SESSION_N4_CONTROL_INFORMATION_TYPE, 0, 0, 57, 41,
+        offsetof(ogs_pfcp_session_modification_request_t, mbs_session_n4_control_information) },
+    [78] = { OGS_PFCP_ETHERNET_CONTEXT_INFORMATION_TYPE, 0, 0, 51, 35,
+        offsetof(ogs_pfcp_session_modification_request_t, ethernet_context_information) },
+    [81] = { OGS_PFCP_F_SEID_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_session_modification_request_t, cp_f_seid) },
+    [88] = { OGS_PFCP_TRACE_INFORMATION_TYPE, 0, 0, 41, 25,
+        offsetof(ogs_pfcp_session_modification_request_t, trace_information) },
+    [89] = { OGS_PFCP_CREATE_PDR_TYPE, 0, 0, 12, 8,
+        offsetof(ogs_pfcp_session_modification_request_t, create_pdr) },
+    [90] = { OGS_PFCP_UPDATE_TRAFFIC_ENDPOINT_TYPE, 0, 0, 31, 19,
+        offsetof(ogs_pfcp_session_modification_request_t, update_traffic_endpoint) },
+    [91] = { OGS_PFCP_REMOVE_SRR_TYPE, 0, 0, 47, 31,
+        offsetof(ogs_pfcp_session_modification_request_t, remove_srr) },
+    [92] = { OGS_PFCP_NODE_ID_TYPE, 0, 0, 45, 29,
+        offsetof(ogs_pfcp_session_modification_request_t, node_id) },
+    [93] = { OGS_PFCP_CREATE_MAR_TYPE, 0, 0, 44, 28,
+        offsetof(ogs_pfcp_session_modification_request_t, create_mar) },
+    [94] = { OGS_PFCP_UPDATE_QER_TYPE, 0, 0, 28, 17,
+        offsetof(ogs_pfcp_session_modification_request_t, update_qer) },
+    [95] = { OGS_PFCP_S_NSSAI_TYPE, 0, 0, 54, 38,
+        offsetof(ogs_pfcp_session_modification_request_t, s_nssai) },
+    [96] = { OGS_PFCP_DSCP_TO_PPI_CONTROL_INFORMATION_TYPE, 0, 0, 58, 42,
+        offsetof(ogs_pfcp_session_modification_request_t, dscp_to_ppi_control_information) },
+    [102] = { OGS_PFCP_UPDATE_BAR_SESSION_MODIFICATION_REQUEST_TYPE, 0, 0, 30, 18,
+        offsetof(ogs_pfcp_session_modification_request_t, update_bar) },
+    [104] = { OGS_PFCP_REMOVE_MAR_TYPE, 0, 0, 42, 26,
+        offsetof(ogs_pfcp_session_modification_request_t, remove_mar) },
+    [105] = { OGS_PFCP_REMOVE_URR_TYPE, 0, 0, 6, 4,
+        offsetof(ogs_pfcp_session_modification_request_t, remove_urr) },
+    [111] = { OGS_PFCP_CREATE_QER_TYPE, 0, 0, 18, 11,
+        offsetof(ogs_pfcp_session_modification_request_t, create_qer) },
+    [112] = { OGS_PFCP_QUERY_PACKET_RATE_STATUS_IE_WITHIN_PFCP_SESSION_MODIFICATION_REQUEST_TYPE, 0, 0, 53, 37,
+        offsetof(ogs_pfcp_session_modification_request_t, query_packet_rate_status) },
+    [117] = { OGS_PFCP_QUERY_URR_REFERENCE_TYPE, 0, 0, 40, 24,
+        offsetof(ogs_pfcp_session_modification_request_t, query_urr_reference) },
+    [122] = { OGS_PFCP_UPDATE_FAR_TYPE, 0, 0, 24, 15,
+        offsetof(ogs_pfcp_session_modification_request_t, update_far) },
+    [124] = { OGS_PFCP_PROVIDE_ATSSS_CONTROL_INFORMATION_TYPE, 0, 0, 50, 34,
+        offsetof(ogs_pfcp_session_modification_request_t, provide_atsss_control_information) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_msg_index_pfcp_session_modification_request = {
+    127, 43, ogs_pfcp_msg_index_pfcp_session_modification_request_slot };
 
 ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_session_modification_request =
 {
@@ -4596,7 +7188,46 @@ ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_session_modification_request =
         &ogs_pfcp_tlv_desc_mbs_session_n4_control_information,
         &ogs_pfcp_tlv_desc_dscp_to_ppi_control_information,
     NULL,
-}};
+}, &ogs_pfcp_msg_index_pfcp_session_modification_request, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_msg_index_pfcp_session_modification_response_slot[64] = {
+    [0] = { 0, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_session_modification_response_t, created_pdr) + sizeof(ogs_pfcp_tlv_created_pdr_t) },
+    [1] = { 0, 0, 1, 8, 3,
+        offsetof(ogs_pfcp_session_modification_response_t, usage_report) + sizeof(ogs_pfcp_tlv_usage_report_session_modification_response_t) },
+    [2] = { OGS_PFCP_CREATED_TRAFFIC_ENDPOINT_TYPE, 0, 0, 11, 9,
+        offsetof(ogs_pfcp_session_modification_response_t, created_updated_traffic_endpoint) },
+    [3] = { OGS_PFCP_UPDATED_PDR_TYPE, 0, 0, 14, 12,
+        offsetof(ogs_pfcp_session_modification_response_t, updated_pdr) },
+    [6] = { OGS_PFCP_OVERLOAD_CONTROL_INFORMATION_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_pfcp_session_modification_response_t, overload_control_information) },
+    [8] = { OGS_PFCP_CREATED_PDR_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_session_modification_response_t, created_pdr) },
+    [14] = { OGS_PFCP_ADDITIONAL_USAGE_REPORTS_INFORMATION_TYPE, 0, 0, 10, 8,
+        offsetof(ogs_pfcp_session_modification_response_t, additional_usage_reports_information) },
+    [16] = { OGS_PFCP_PARTIAL_FAILURE_INFORMATION_TYPE, 0, 0, 16, 14,
+        offsetof(ogs_pfcp_session_modification_response_t, partial_failure_information) },
+    [21] = { OGS_PFCP_ATSSS_CONTROL_PARAMETERS_TYPE, 0, 0, 13, 11,
+        offsetof(ogs_pfcp_session_modification_response_t, atsss_control_parameters) },
+    [27] = { OGS_PFCP_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_session_modification_response_t, cause) },
+    [28] = { OGS_PFCP_PACKET_RATE_STATUS_REPORT_TYPE, 0, 0, 15, 13,
+        offsetof(ogs_pfcp_session_modification_response_t, packet_rate_status_report) },
+    [30] = { OGS_PFCP_USAGE_REPORT_SESSION_MODIFICATION_RESPONSE_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_pfcp_session_modification_response_t, usage_report) },
+    [31] = { OGS_PFCP_MBS_SESSION_N4_INFORMATION_TYPE, 0, 0, 17, 15,
+        offsetof(ogs_pfcp_session_modification_response_t, mbs_session_n4_information) },
+    [34] = { OGS_PFCP_FAILED_RULE_ID_TYPE, 0, 0, 9, 7,
+        offsetof(ogs_pfcp_session_modification_response_t, failed_rule_id) },
+    [40] = { OGS_PFCP_OFFENDING_IE_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_session_modification_response_t, offending_ie) },
+    [47] = { OGS_PFCP_TSC_MANAGEMENT_INFORMATION_IE_WITHIN_PFCP_SESSION_MODIFICATION_REQUEST_TYPE, 0, 0, 12, 10,
+        offsetof(ogs_pfcp_session_modification_response_t, tsc_management_information) },
+    [59] = { OGS_PFCP_LOAD_CONTROL_INFORMATION_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_session_modification_response_t, load_control_information) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_msg_index_pfcp_session_modification_response = {
+    63, 16, ogs_pfcp_msg_index_pfcp_session_modification_response_slot };
 
 ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_session_modification_response =
 {
@@ -4621,7 +7252,7 @@ ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_session_modification_response =
         &ogs_pfcp_tlv_desc_partial_failure_information,
         &ogs_pfcp_tlv_desc_mbs_session_n4_information,
     NULL,
-}};
+}, &ogs_pfcp_msg_index_pfcp_session_modification_response, NULL};
 
 ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_session_deletion_request =
 {
@@ -4629,7 +7260,34 @@ ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_session_deletion_request =
     "PFCP Session Deletion Request",
     0, 0, 0, 0, {
     NULL,
-}};
+}, NULL, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_msg_index_pfcp_session_deletion_response_slot[32] = {
+    [0] = { 0, 0, 0, 6, 5,
+        offsetof(ogs_pfcp_session_deletion_response_t, usage_report) + sizeof(ogs_pfcp_tlv_usage_report_session_deletion_response_t) },
+    [6] = { OGS_PFCP_OVERLOAD_CONTROL_INFORMATION_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_session_deletion_response_t, overload_control_information) },
+    [7] = { OGS_PFCP_SESSION_REPORT_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_pfcp_session_deletion_response_t, session_report) },
+    [8] = { OGS_PFCP_OFFENDING_IE_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_session_deletion_response_t, offending_ie) },
+    [14] = { OGS_PFCP_ADDITIONAL_USAGE_REPORTS_INFORMATION_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_pfcp_session_deletion_response_t, additional_usage_reports_information) },
+    [15] = { OGS_PFCP_PFCPSDRSP_FLAGS_TYPE, 0, 0, 11, 10,
+        offsetof(ogs_pfcp_session_deletion_response_t, pfcpsdrsp_flags) },
+    [23] = { OGS_PFCP_USAGE_REPORT_SESSION_DELETION_RESPONSE_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_session_deletion_response_t, usage_report) },
+    [27] = { OGS_PFCP_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_session_deletion_response_t, cause) },
+    [28] = { OGS_PFCP_LOAD_CONTROL_INFORMATION_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_session_deletion_response_t, load_control_information) },
+    [29] = { OGS_PFCP_PACKET_RATE_STATUS_REPORT_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_pfcp_session_deletion_response_t, packet_rate_status_report) },
+    [31] = { OGS_PFCP_MBS_SESSION_N4_INFORMATION_TYPE, 0, 0, 10, 9,
+        offsetof(ogs_pfcp_session_deletion_response_t, mbs_session_n4_information) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_msg_index_pfcp_session_deletion_response = {
+    31, 11, ogs_pfcp_msg_index_pfcp_session_deletion_response_slot };
 
 ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_session_deletion_response =
 {
@@ -4648,7 +7306,40 @@ ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_session_deletion_response =
         &ogs_pfcp_tlv_desc_mbs_session_n4_information,
         &ogs_pfcp_tlv_desc_pfcpsdrsp_flags,
     NULL,
-}};
+}, &ogs_pfcp_msg_index_pfcp_session_deletion_response, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_msg_index_pfcp_session_report_request_slot[32] = {
+    [0] = { 0, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_session_report_request_t, usage_report) + sizeof(ogs_pfcp_tlv_usage_report_session_report_request_t) },
+    [6] = { OGS_PFCP_OVERLOAD_CONTROL_INFORMATION_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_pfcp_session_report_request_t, overload_control_information) },
+    [7] = { OGS_PFCP_SESSION_REPORT_TYPE, 0, 0, 13, 12,
+        offsetof(ogs_pfcp_session_report_request_t, session_report) },
+    [11] = { OGS_PFCP_ERROR_INDICATION_REPORT_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_session_report_request_t, error_indication_report) },
+    [14] = { OGS_PFCP_ADDITIONAL_USAGE_REPORTS_INFORMATION_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_pfcp_session_report_request_t, additional_usage_reports_information) },
+    [15] = { OGS_PFCP_REPORT_TYPE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_session_report_request_t, report_type) },
+    [16] = { OGS_PFCP_USAGE_REPORT_SESSION_REPORT_REQUEST_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_session_report_request_t, usage_report) },
+    [17] = { OGS_PFCP_F_SEID_TYPE, 0, 0, 10, 9,
+        offsetof(ogs_pfcp_session_report_request_t, old_cp_f_seid) },
+    [18] = { OGS_PFCP_TSC_MANAGEMENT_INFORMATION_IE_WITHIN_PFCP_SESSION_MODIFICATION_REQUEST_TYPE, 0, 0, 12, 11,
+        offsetof(ogs_pfcp_session_report_request_t, tsc_management_information) },
+    [25] = { OGS_PFCP_PFCPSRREQ_FLAGS_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_pfcp_session_report_request_t, pfcpsrreq_flags) },
+    [27] = { OGS_PFCP_DOWNLINK_DATA_REPORT_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_session_report_request_t, downlink_data_report) },
+    [28] = { OGS_PFCP_LOAD_CONTROL_INFORMATION_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_pfcp_session_report_request_t, load_control_information) },
+    [29] = { OGS_PFCP_PACKET_RATE_STATUS_REPORT_TYPE, 0, 0, 11, 10,
+        offsetof(ogs_pfcp_session_report_request_t, packet_rate_status_report) },
+    [30] = { OGS_PFCP_CAUSE_TYPE, 0, 0, 14, 13,
+        offsetof(ogs_pfcp_session_report_request_t, cause) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_msg_index_pfcp_session_report_request = {
+    31, 14, ogs_pfcp_msg_index_pfcp_session_report_request_slot };
 
 ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_session_report_request =
 {
@@ -4670,7 +7361,32 @@ ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_session_report_request =
         &ogs_pfcp_tlv_desc_session_report,
         &ogs_pfcp_tlv_desc_cause,
     NULL,
-}};
+}, &ogs_pfcp_msg_index_pfcp_session_report_request, NULL};
+
+static const ogs_tlv_desc_slot_t ogs_pfcp_msg_index_pfcp_session_report_response_slot[32] = {
+    [2] = { OGS_PFCP_PFCPSRRSP_FLAGS_TYPE, 0, 0, 4, 3,
+        offsetof(ogs_pfcp_session_report_response_t, pfcpsrrsp_flags) },
+    [3] = { OGS_PFCP_ALTERNATIVE_SMF_IP_ADDRESS_TYPE, 0, 0, 7, 6,
+        offsetof(ogs_pfcp_session_report_response_t, alternative_smf_ip_address) },
+    [8] = { OGS_PFCP_OFFENDING_IE_TYPE, 0, 0, 2, 1,
+        offsetof(ogs_pfcp_session_report_response_t, offending_ie) },
+    [11] = { OGS_PFCP_GROUP_ID_TYPE, 0, 0, 9, 8,
+        offsetof(ogs_pfcp_session_report_response_t, group_id) },
+    [12] = { OGS_PFCP_UPDATE_BAR_PFCP_SESSION_REPORT_RESPONSE_TYPE, 0, 0, 3, 2,
+        offsetof(ogs_pfcp_session_report_response_t, update_bar) },
+    [13] = { OGS_PFCP_F_TEID_TYPE, 0, 0, 6, 5,
+        offsetof(ogs_pfcp_session_report_response_t, n4_u_f_teid) },
+    [17] = { OGS_PFCP_F_SEID_TYPE, 0, 0, 5, 4,
+        offsetof(ogs_pfcp_session_report_response_t, cp_f_seid) },
+    [25] = { OGS_PFCP_FQ_CSID_TYPE, 0, 0, 8, 7,
+        offsetof(ogs_pfcp_session_report_response_t, pgw_c_smf_fq_csid) },
+    [27] = { OGS_PFCP_CAUSE_TYPE, 0, 0, 1, 0,
+        offsetof(ogs_pfcp_session_report_response_t, cause) },
+    [28] = { OGS_PFCP_NODE_ID_TYPE, 0, 0, 10, 9,
+        offsetof(ogs_pfcp_session_report_response_t, node_id) },
+};
+static const ogs_tlv_desc_index_t ogs_pfcp_msg_index_pfcp_session_report_response = {
+    31, 10, ogs_pfcp_msg_index_pfcp_session_report_response_slot };
 
 ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_session_report_response =
 {
@@ -4688,8 +7404,67 @@ ogs_tlv_desc_t ogs_pfcp_msg_desc_pfcp_session_report_response =
         &ogs_pfcp_tlv_desc_group_id,
         &ogs_pfcp_tlv_desc_node_id,
     NULL,
-}};
-
+}, &ogs_pfcp_msg_index_pfcp_session_report_response, NULL};
+
+
+/* Size of the union member for the message type, 0 if it has none */
+static size_t pfcp_message_size(uint8_t type)
+{
+    switch(type) {
+    case OGS_PFCP_HEARTBEAT_REQUEST_TYPE:
+        return sizeof(ogs_pfcp_heartbeat_request_t);
+    case OGS_PFCP_HEARTBEAT_RESPONSE_TYPE:
+        return sizeof(ogs_pfcp_heartbeat_response_t);
+    case OGS_PFCP_PFD_MANAGEMENT_REQUEST_TYPE:
+        return sizeof(ogs_pfcp_pfd_management_request_t);
+    case OGS_PFCP_PFD_MANAGEMENT_RESPONSE_TYPE:
+        return sizeof(ogs_pfcp_pfd_management_response_t);
+    case OGS_PFCP_ASSOCIATION_SETUP_REQUEST_TYPE:
+        return sizeof(ogs_pfcp_association_setup_request_t);
+    case OGS_PFCP_ASSOCIATION_SETUP_RESPONSE_TYPE:
+        return sizeof(ogs_pfcp_association_setup_response_t);
+    case OGS_PFCP_ASSOCIATION_UPDATE_REQUEST_TYPE:
+        return sizeof(ogs_pfcp_association_update_request_t);
+    case OGS_PFCP_ASSOCIATION_UPDATE_RESPONSE_TYPE:
+        return sizeof(ogs_pfcp_association_update_response_t);
+    case OGS_PFCP_ASSOCIATION_RELEASE_REQUEST_TYPE:
+        return sizeof(ogs_pfcp_association_release_request_t);
+    case OGS_PFCP_ASSOCIATION_RELEASE_RESPONSE_TYPE:
+        return sizeof(ogs_pfcp_association_release_response_t);
+    case OGS_PFCP_VERSION_NOT_SUPPORTED_RESPONSE_TYPE:
+        return sizeof(ogs_pfcp_version_not_supported_response_t);
+    case OGS_PFCP_NODE_REPORT_REQUEST_TYPE:
+        return sizeof(ogs_pfcp_node_report_request_t);
+    case OGS_PFCP_NODE_REPORT_RESPONSE_TYPE:
+        return sizeof(ogs_pfcp_node_report_response_t);
+    case OGS_PFCP_SESSION_SET_DELETION_REQUEST_TYPE:
+        return sizeof(ogs_pfcp_session_set_deletion_request_t);
+    case OGS_PFCP_SESSION_SET_DELETION_RESPONSE_TYPE:
+        return sizeof(ogs_pfcp_session_set_deletion_response_t);
+    case OGS_PFCP_SESSION_SET_MODIFICATION_REQUEST_TYPE:
+        return sizeof(ogs_pfcp_session_set_modification_request_t);
+    case OGS_PFCP_SESSION_SET_MODIFICATION_RESPONSE_TYPE:
+        return sizeof(ogs_pfcp_session_set_modification_response_t);
+    case OGS_PFCP_SESSION_ESTABLISHMENT_REQUEST_TYPE:
+        return sizeof(ogs_pfcp_session_establishment_request_t);
+    case OGS_PFCP_SESSION_ESTABLISHMENT_RESPONSE_TYPE:
+        return sizeof(ogs_pfcp_session_establishment_response_t);
+    case OGS_PFCP_SESSION_MODIFICATION_REQUEST_TYPE:
+        return sizeof(ogs_pfcp_session_modification_request_t);
+    case OGS_PFCP_SESSION_MODIFICATION_RESPONSE_TYPE:
+        return sizeof(ogs_pfcp_session_modification_response_t);
+    case OGS_PFCP_SESSION_DELETION_REQUEST_TYPE:
+        return sizeof(ogs_pfcp_session_deletion_request_t);
+    case OGS_PFCP_SESSION_DELETION_RESPONSE_TYPE:
+        return sizeof(ogs_pfcp_session_deletion_response_t);
+    case OGS_PFCP_SESSION_REPORT_REQUEST_TYPE:
+        return sizeof(ogs_pfcp_session_report_request_t);
+    case OGS_PFCP_SESSION_REPORT_RESPONSE_TYPE:
+        return sizeof(ogs_pfcp_session_report_response_t);
+    default:
+        return 0;
+    }
+}
 
 ogs_pfcp_message_t *ogs_pfcp_parse_msg(ogs_pkbuf_t *pkbuf)
 {
@@ -4705,12 +7480,17 @@ ogs_pfcp_message_t *ogs_pfcp_parse_msg(ogs_pkbuf_t *pkbuf)
     h = (ogs_pfcp_header_t *)pkbuf->data;
     ogs_assert(h);
 
-    pfcp_message = ogs_calloc(1, sizeof(*pfcp_message));
+    pfcp_message = ogs_malloc(sizeof(*pfcp_message));
     if (!pfcp_message) {
         ogs_error("No memory");
         return NULL;
     }
 
+    /* Clear the header and the message of this type, not the whole union */
+    memset(pfcp_message, 0,
+            offsetof(ogs_pfcp_message_t, pfcp_heartbeat_request) +
+            pfcp_message_size(h->type));
+
     if (h->seid_presence)
         size = OGS_PFCP_HEADER_LEN;
     else
@@ -4735,13 +7515,13 @@ ogs_pfcp_message_t *ogs_pfcp_parse_msg(ogs_pkbuf_t *pkbuf)
     switch(pfcp_message->h.type)
     {
         case OGS_PFCP_HEARTBEAT_REQUEST_TYPE:
-            rv = ogs_tlv_parse_msg(&pfcp_message->pfcp_heartbeat_request,
-                    &ogs_pfcp_msg_desc_pfcp_heartbeat_request, pkbuf, OGS_TLV_MODE_T2_L2);
+            rv = ogs_pfcp_parse_heartbeat_request_direct(
+                    &pfcp_message->pfcp_heartbeat_request, pkbuf);
             ogs_expect(rv == OGS_OK);
             break;
         case OGS_PFCP_HEARTBEAT_RESPONSE_TYPE:
-            rv = ogs_tlv_parse_msg(&pfcp_message->pfcp_heartbeat_response,
-                    &ogs_pfcp_msg_desc_pfcp_heartbeat_response, pkbuf, OGS_TLV_MODE_T2_L2);
+            rv = ogs_pfcp_parse_heartbeat_response_direct(
+                    &pfcp_message->pfcp_heartbeat_response, pkbuf);
             ogs_expect(rv == OGS_OK);
             break;
         case OGS_PFCP_PFD_MANAGEMENT_REQUEST_TYPE:
@@ -4817,23 +7597,23 @@ ogs_pfcp_message_t *ogs_pfcp_parse_msg(ogs_pkbuf_t *pkbuf)
             ogs_expect(rv == OGS_OK);
             break;
         case OGS_PFCP_SESSION_ESTABLISHMENT_REQUEST_TYPE:
-            rv = ogs_tlv_parse_msg(&pfcp_message->pfcp_session_establishment_request,
-                    &ogs_pfcp_msg_desc_pfcp_session_establishment_request, pkbuf, OGS_TLV_MODE_T2_L2);
+            rv = ogs_pfcp_parse_session_establishment_request_direct(
+                    &pfcp_message->pfcp_session_establishment_request, pkbuf);
             ogs_expect(rv == OGS_OK);
             break;
         case OGS_PFCP_SESSION_ESTABLISHMENT_RESPONSE_TYPE:
-            rv = ogs_tlv_parse_msg(&pfcp_message->pfcp_session_establishment_response,
-                    &ogs_pfcp_msg_desc_pfcp_session_establishment_response, pkbuf, OGS_TLV_MODE_T2_L2);
+            rv = ogs_pfcp_parse_session_establishment_response_direct(
+                    &pfcp_message->pfcp_session_establishment_response, pkbuf);
             ogs_expect(rv == OGS_OK);
             break;
         case OGS_PFCP_SESSION_MODIFICATION_REQUEST_TYPE:
-            rv = ogs_tlv_parse_msg(&pfcp_message->pfcp_session_modification_request,
-                    &ogs_pfcp_msg_desc_pfcp_session_modification_request, pkbuf, OGS_TLV_MODE_T2_L2);
+            rv = ogs_pfcp_parse_session_modification_request_direct(
+                    &pfcp_message->pfcp_session_modification_request, pkbuf);
             ogs_expect(rv == OGS_OK);
             break;
         case OGS_PFCP_SESSION_MODIFICATION_RESPONSE_TYPE:
-            rv = ogs_tlv_parse_msg(&pfcp_message->pfcp_session_modification_response,
-                    &ogs_pfcp_msg_desc_pfcp_session_modification_response, pkbuf, OGS_TLV_MODE_T2_L2);
+            rv = ogs_pfcp_parse_session_modification_response_direct(
+                    &pfcp_message->pfcp_session_modification_response, pkbuf);
             ogs_expect(rv == OGS_OK);
             break;
         case OGS_PFCP_SESSION_DELETION_REQUEST_TYPE:
@@ -4844,13 +7624,13 @@ ogs_pfcp_message_t *ogs_pfcp_parse_msg(ogs_pkbuf_t *pkbuf)
             ogs_expect(rv == OGS_OK);
             break;
         case OGS_PFCP_SESSION_REPORT_REQUEST_TYPE:
-            rv = ogs_tlv_parse_msg(&pfcp_message->pfcp_session_report_request,
-                    &ogs_pfcp_msg_desc_pfcp_session_report_request, pkbuf, OGS_TLV_MODE_T2_L2);
+            rv = ogs_pfcp_parse_session_report_request_direct(
+                    &pfcp_message->pfcp_session_report_request, pkbuf);
             ogs_expect(rv == OGS_OK);
             break;
         case OGS_PFCP_SESSION_REPORT_RESPONSE_TYPE:
-            rv = ogs_tlv_parse_msg(&pfcp_message->pfcp_session_report_response,
-                    &ogs_pfcp_msg_desc_pfcp_session_report_response, pkbuf, OGS_TLV_MODE_T2_L2);
+            rv = ogs_pfcp_parse_session_report_response_direct(
+                    &pfcp_message->pfcp_session_report_response, pkbuf);
             ogs_expect(rv == OGS_OK);
             break;
         default:
@@ -4987,3 +7767,17480 @@ ogs_pkbuf_t *ogs_pfcp_build_msg(ogs_pfcp_message_t *pfcp_message)
     return pkbuf;
 }
 
+static uint8_t *pfcp_put_header(uint8_t *pos, uint16_t type, uint16_t length)
+{
+    *(pos++) = (type >> 8) & 0xFF;
+    *(pos++) = type & 0xFF;
+    *(pos++) = (length >> 8) & 0xFF;
+    *(pos++) = length & 0xFF;
+
+    return pos;
+}
+
+static uint8_t *pfcp_put_uint8(uint8_t *pos, uint16_t type, ogs_tlv_uint8_t *v)
+{
+    pos = pfcp_put_header(pos, type, 1);
+    *(pos++) = v->u8;
+
+    return pos;
+}
+
+static uint8_t *pfcp_put_uint16(
+        uint8_t *pos, uint16_t type, ogs_tlv_uint16_t *v)
+{
+    pos = pfcp_put_header(pos, type, 2);
+    *(pos++) = (v->u16 >> 8) & 0xFF;
+    *(pos++) = v->u16 & 0xFF;
+
+    return pos;
+}
+
+static uint8_t *pfcp_put_uint24(
+        uint8_t *pos, uint16_t type, ogs_tlv_uint24_t *v)
+{
+    pos = pfcp_put_header(pos, type, 3);
+    *(pos++) = (v->u24 >> 16) & 0xFF;
+    *(pos++) = (v->u24 >> 8) & 0xFF;
+    *(pos++) = v->u24 & 0xFF;
+
+    return pos;
+}
+
+static uint8_t *pfcp_put_uint32(
+        uint8_t *pos, uint16_t type, ogs_tlv_uint32_t *v)
+{
+    pos = pfcp_put_header(pos, type, 4);
+    *(pos++) = (v->u32 >> 24) & 0xFF;
+    *(pos++) = (v->u32 >> 16) & 0xFF;
+    *(pos++) = (v->u32 >> 8) & 0xFF;
+    *(pos++) = v->u32 & 0xFF;
+
+    return pos;
+}
+
+static int pfcp_length_octet(ogs_tlv_octet_t *v, ogs_tlv_desc_t *desc)
+{
+    if (v->len == 0) {
+        ogs_error("No TLV length - [%s] T:%d I:%d (vsz=%d)",
+                desc->name, desc->type, desc->instance, desc->vsize);
+        return OGS_ERROR;
+    }
+
+    return 4 + v->len;
+}
+
+static uint8_t *pfcp_put_octet(uint8_t *pos, uint16_t type, ogs_tlv_octet_t *v)
+{
+    pos = pfcp_put_header(pos, type, v->len);
+    memcpy(pos, v->data, v->len);
+
+    return pos + v->len;
+}
+
+static int pfcp_length_ethernet_packet_filter(ogs_pfcp_tlv_ethernet_packet_filter_t *v);
+static uint8_t *pfcp_put_ethernet_packet_filter(uint8_t *pos, ogs_pfcp_tlv_ethernet_packet_filter_t *v);
+static int pfcp_length_redundant_transmission_parameters(ogs_pfcp_tlv_redundant_transmission_parameters_t *v);
+static uint8_t *pfcp_put_redundant_transmission_parameters(uint8_t *pos, ogs_pfcp_tlv_redundant_transmission_parameters_t *v);
+static int pfcp_length_ip_multicast_addressing_info_within_pfcp_session_establishment_request(ogs_pfcp_tlv_ip_multicast_addressing_info_within_pfcp_session_establishment_request_t *v);
+static uint8_t *pfcp_put_ip_multicast_addressing_info_within_pfcp_session_establishment_request(uint8_t *pos, ogs_pfcp_tlv_ip_multicast_addressing_info_within_pfcp_session_establishment_request_t *v);
+static int pfcp_length_pdi(ogs_pfcp_tlv_pdi_t *v);
+static uint8_t *pfcp_put_pdi(uint8_t *pos, ogs_pfcp_tlv_pdi_t *v);
+static int pfcp_length_transport_delay_reporting(ogs_pfcp_tlv_transport_delay_reporting_t *v);
+static uint8_t *pfcp_put_transport_delay_reporting(uint8_t *pos, ogs_pfcp_tlv_transport_delay_reporting_t *v);
+static int pfcp_length_create_pdr(ogs_pfcp_tlv_create_pdr_t *v);
+static uint8_t *pfcp_put_create_pdr(uint8_t *pos, ogs_pfcp_tlv_create_pdr_t *v);
+static int pfcp_length_forwarding_parameters(ogs_pfcp_tlv_forwarding_parameters_t *v);
+static uint8_t *pfcp_put_forwarding_parameters(uint8_t *pos, ogs_pfcp_tlv_forwarding_parameters_t *v);
+static int pfcp_length_duplicating_parameters(ogs_pfcp_tlv_duplicating_parameters_t *v);
+static uint8_t *pfcp_put_duplicating_parameters(uint8_t *pos, ogs_pfcp_tlv_duplicating_parameters_t *v);
+static int pfcp_length_redundant_transmission_forwarding_parameters(ogs_pfcp_tlv_redundant_transmission_forwarding_parameters_t *v);
+static uint8_t *pfcp_put_redundant_transmission_forwarding_parameters(uint8_t *pos, ogs_pfcp_tlv_redundant_transmission_forwarding_parameters_t *v);
+static int pfcp_length_mbs_multicast_parameters(ogs_pfcp_tlv_mbs_multicast_parameters_t *v);
+static uint8_t *pfcp_put_mbs_multicast_parameters(uint8_t *pos, ogs_pfcp_tlv_mbs_multicast_parameters_t *v);
+static int pfcp_length_add_mbs_unicast_parameters(ogs_pfcp_tlv_add_mbs_unicast_parameters_t *v);
+static uint8_t *pfcp_put_add_mbs_unicast_parameters(uint8_t *pos, ogs_pfcp_tlv_add_mbs_unicast_parameters_t *v);
+static int pfcp_length_create_far(ogs_pfcp_tlv_create_far_t *v);
+static uint8_t *pfcp_put_create_far(uint8_t *pos, ogs_pfcp_tlv_create_far_t *v);
+static int pfcp_length_update_forwarding_parameters(ogs_pfcp_tlv_update_forwarding_parameters_t *v);
+static uint8_t *pfcp_put_update_forwarding_parameters(uint8_t *pos, ogs_pfcp_tlv_update_forwarding_parameters_t *v);
+static int pfcp_length_update_duplicating_parameters(ogs_pfcp_tlv_update_duplicating_parameters_t *v);
+static uint8_t *pfcp_put_update_duplicating_parameters(uint8_t *pos, ogs_pfcp_tlv_update_duplicating_parameters_t *v);
+static int pfcp_length_update_far(ogs_pfcp_tlv_update_far_t *v);
+static uint8_t *pfcp_put_update_far(uint8_t *pos, ogs_pfcp_tlv_update_far_t *v);
+static int pfcp_length_pfd_context(ogs_pfcp_tlv_pfd_context_t *v);
+static uint8_t *pfcp_put_pfd_context(uint8_t *pos, ogs_pfcp_tlv_pfd_context_t *v);
+static int pfcp_length_application_id_s_pfds(ogs_pfcp_tlv_application_id_s_pfds_t *v);
+static uint8_t *pfcp_put_application_id_s_pfds(uint8_t *pos, ogs_pfcp_tlv_application_id_s_pfds_t *v);
+static int pfcp_length_ethernet_traffic_information(ogs_pfcp_tlv_ethernet_traffic_information_t *v);
+static uint8_t *pfcp_put_ethernet_traffic_information(uint8_t *pos, ogs_pfcp_tlv_ethernet_traffic_information_t *v);
+static int pfcp_length__access_forwarding_action_information(ogs_pfcp_tlv__access_forwarding_action_information_t *v);
+static uint8_t *pfcp_put__access_forwarding_action_information(uint8_t *pos, ogs_pfcp_tlv__access_forwarding_action_information_t *v);
+static int pfcp_length_non__access_forwarding_action_information(ogs_pfcp_tlv_non__access_forwarding_action_information_t *v);
+static uint8_t *pfcp_put_non__access_forwarding_action_information(uint8_t *pos, ogs_pfcp_tlv_non__access_forwarding_action_information_t *v);
+static int pfcp_length_update__access_forwarding_action_information(ogs_pfcp_tlv_update__access_forwarding_action_information_t *v);
+static uint8_t *pfcp_put_update__access_forwarding_action_information(uint8_t *pos, ogs_pfcp_tlv_update__access_forwarding_action_information_t *v);
+static int pfcp_length_update_non__access_forwarding_action_information(ogs_pfcp_tlv_update_non__access_forwarding_action_information_t *v);
+static uint8_t *pfcp_put_update_non__access_forwarding_action_information(uint8_t *pos, ogs_pfcp_tlv_update_non__access_forwarding_action_information_t *v);
+static int pfcp_length_access_availability_report(ogs_pfcp_tlv_access_availability_report_t *v);
+static uint8_t *pfcp_put_access_availability_report(uint8_t *pos, ogs_pfcp_tlv_access_availability_report_t *v);
+static int pfcp_length_qos_monitoring_report(ogs_pfcp_tlv_qos_monitoring_report_t *v);
+static uint8_t *pfcp_put_qos_monitoring_report(uint8_t *pos, ogs_pfcp_tlv_qos_monitoring_report_t *v);
+static int pfcp_length_mptcp_parameters(ogs_pfcp_tlv_mptcp_parameters_t *v);
+static uint8_t *pfcp_put_mptcp_parameters(uint8_t *pos, ogs_pfcp_tlv_mptcp_parameters_t *v);
+static int pfcp_length_atsss_ll_parameters(ogs_pfcp_tlv_atsss_ll_parameters_t *v);
+static uint8_t *pfcp_put_atsss_ll_parameters(uint8_t *pos, ogs_pfcp_tlv_atsss_ll_parameters_t *v);
+static int pfcp_length_pmf_parameters(ogs_pfcp_tlv_pmf_parameters_t *v);
+static uint8_t *pfcp_put_pmf_parameters(uint8_t *pos, ogs_pfcp_tlv_pmf_parameters_t *v);
+static int pfcp_length_join_ip_multicast_information_ie_within_usage_report(ogs_pfcp_tlv_join_ip_multicast_information_ie_within_usage_report_t *v);
+static uint8_t *pfcp_put_join_ip_multicast_information_ie_within_usage_report(uint8_t *pos, ogs_pfcp_tlv_join_ip_multicast_information_ie_within_usage_report_t *v);
+static int pfcp_length_leave_ip_multicast_information_ie_within_usage_report(ogs_pfcp_tlv_leave_ip_multicast_information_ie_within_usage_report_t *v);
+static uint8_t *pfcp_put_leave_ip_multicast_information_ie_within_usage_report(uint8_t *pos, ogs_pfcp_tlv_leave_ip_multicast_information_ie_within_usage_report_t *v);
+static int pfcp_length_create_urr(ogs_pfcp_tlv_create_urr_t *v);
+static uint8_t *pfcp_put_create_urr(uint8_t *pos, ogs_pfcp_tlv_create_urr_t *v);
+static int pfcp_length_create_qer(ogs_pfcp_tlv_create_qer_t *v);
+static uint8_t *pfcp_put_create_qer(uint8_t *pos, ogs_pfcp_tlv_create_qer_t *v);
+static int pfcp_length_created_pdr(ogs_pfcp_tlv_created_pdr_t *v);
+static uint8_t *pfcp_put_created_pdr(uint8_t *pos, ogs_pfcp_tlv_created_pdr_t *v);
+static int pfcp_length_update_pdr(ogs_pfcp_tlv_update_pdr_t *v);
+static uint8_t *pfcp_put_update_pdr(uint8_t *pos, ogs_pfcp_tlv_update_pdr_t *v);
+static int pfcp_length_update_bar_pfcp_session_report_response(ogs_pfcp_tlv_update_bar_pfcp_session_report_response_t *v);
+static uint8_t *pfcp_put_update_bar_pfcp_session_report_response(uint8_t *pos, ogs_pfcp_tlv_update_bar_pfcp_session_report_response_t *v);
+static int pfcp_length_update_urr(ogs_pfcp_tlv_update_urr_t *v);
+static uint8_t *pfcp_put_update_urr(uint8_t *pos, ogs_pfcp_tlv_update_urr_t *v);
+static int pfcp_length_update_qer(ogs_pfcp_tlv_update_qer_t *v);
+static uint8_t *pfcp_put_update_qer(uint8_t *pos, ogs_pfcp_tlv_update_qer_t *v);
+static int pfcp_length_remove_pdr(ogs_pfcp_tlv_remove_pdr_t *v);
+static uint8_t *pfcp_put_remove_pdr(uint8_t *pos, ogs_pfcp_tlv_remove_pdr_t *v);
+static int pfcp_length_remove_far(ogs_pfcp_tlv_remove_far_t *v);
+static uint8_t *pfcp_put_remove_far(uint8_t *pos, ogs_pfcp_tlv_remove_far_t *v);
+static int pfcp_length_remove_urr(ogs_pfcp_tlv_remove_urr_t *v);
+static uint8_t *pfcp_put_remove_urr(uint8_t *pos, ogs_pfcp_tlv_remove_urr_t *v);
+static int pfcp_length_remove_qer(ogs_pfcp_tlv_remove_qer_t *v);
+static uint8_t *pfcp_put_remove_qer(uint8_t *pos, ogs_pfcp_tlv_remove_qer_t *v);
+static int pfcp_length_load_control_information(ogs_pfcp_tlv_load_control_information_t *v);
+static uint8_t *pfcp_put_load_control_information(uint8_t *pos, ogs_pfcp_tlv_load_control_information_t *v);
+static int pfcp_length_overload_control_information(ogs_pfcp_tlv_overload_control_information_t *v);
+static uint8_t *pfcp_put_overload_control_information(uint8_t *pos, ogs_pfcp_tlv_overload_control_information_t *v);
+static int pfcp_length_application_detection_information(ogs_pfcp_tlv_application_detection_information_t *v);
+static uint8_t *pfcp_put_application_detection_information(uint8_t *pos, ogs_pfcp_tlv_application_detection_information_t *v);
+static int pfcp_length_query_urr(ogs_pfcp_tlv_query_urr_t *v);
+static uint8_t *pfcp_put_query_urr(uint8_t *pos, ogs_pfcp_tlv_query_urr_t *v);
+static int pfcp_length_usage_report_session_modification_response(ogs_pfcp_tlv_usage_report_session_modification_response_t *v);
+static uint8_t *pfcp_put_usage_report_session_modification_response(uint8_t *pos, ogs_pfcp_tlv_usage_report_session_modification_response_t *v);
+static int pfcp_length_usage_report_session_deletion_response(ogs_pfcp_tlv_usage_report_session_deletion_response_t *v);
+static uint8_t *pfcp_put_usage_report_session_deletion_response(uint8_t *pos, ogs_pfcp_tlv_usage_report_session_deletion_response_t *v);
+static int pfcp_length_usage_report_session_report_request(ogs_pfcp_tlv_usage_report_session_report_request_t *v);
+static uint8_t *pfcp_put_usage_report_session_report_request(uint8_t *pos, ogs_pfcp_tlv_usage_report_session_report_request_t *v);
+static int pfcp_length_downlink_data_report(ogs_pfcp_tlv_downlink_data_report_t *v);
+static uint8_t *pfcp_put_downlink_data_report(uint8_t *pos, ogs_pfcp_tlv_downlink_data_report_t *v);
+static int pfcp_length_create_bar(ogs_pfcp_tlv_create_bar_t *v);
+static uint8_t *pfcp_put_create_bar(uint8_t *pos, ogs_pfcp_tlv_create_bar_t *v);
+static int pfcp_length_update_bar_session_modification_request(ogs_pfcp_tlv_update_bar_session_modification_request_t *v);
+static uint8_t *pfcp_put_update_bar_session_modification_request(uint8_t *pos, ogs_pfcp_tlv_update_bar_session_modification_request_t *v);
+static int pfcp_length_remove_bar(ogs_pfcp_tlv_remove_bar_t *v);
+static uint8_t *pfcp_put_remove_bar(uint8_t *pos, ogs_pfcp_tlv_remove_bar_t *v);
+static int pfcp_length_error_indication_report(ogs_pfcp_tlv_error_indication_report_t *v);
+static uint8_t *pfcp_put_error_indication_report(uint8_t *pos, ogs_pfcp_tlv_error_indication_report_t *v);
+static int pfcp_length_user_plane_path_failure_report(ogs_pfcp_tlv_user_plane_path_failure_report_t *v);
+static uint8_t *pfcp_put_user_plane_path_failure_report(uint8_t *pos, ogs_pfcp_tlv_user_plane_path_failure_report_t *v);
+static int pfcp_length_create_traffic_endpoint(ogs_pfcp_tlv_create_traffic_endpoint_t *v);
+static uint8_t *pfcp_put_create_traffic_endpoint(uint8_t *pos, ogs_pfcp_tlv_create_traffic_endpoint_t *v);
+static int pfcp_length_created_traffic_endpoint(ogs_pfcp_tlv_created_traffic_endpoint_t *v);
+static uint8_t *pfcp_put_created_traffic_endpoint(uint8_t *pos, ogs_pfcp_tlv_created_traffic_endpoint_t *v);
+static int pfcp_length_remove_traffic_endpoint(ogs_pfcp_tlv_remove_traffic_endpoint_t *v);
+static uint8_t *pfcp_put_remove_traffic_endpoint(uint8_t *pos, ogs_pfcp_tlv_remove_traffic_endpoint_t *v);
+static int pfcp_length_create_mar(ogs_pfcp_tlv_create_mar_t *v);
+static uint8_t *pfcp_put_create_mar(uint8_t *pos, ogs_pfcp_tlv_create_mar_t *v);
+static int pfcp_length_remove_mar(ogs_pfcp_tlv_remove_mar_t *v);
+static uint8_t *pfcp_put_remove_mar(uint8_t *pos, ogs_pfcp_tlv_remove_mar_t *v);
+static int pfcp_length_update_mar(ogs_pfcp_tlv_update_mar_t *v);
+static uint8_t *pfcp_put_update_mar(uint8_t *pos, ogs_pfcp_tlv_update_mar_t *v);
+static int pfcp_length_pfcp_session_retention_information_within_pfcp_association_setup_request(ogs_pfcp_tlv_pfcp_session_retention_information_within_pfcp_association_setup_request_t *v);
+static uint8_t *pfcp_put_pfcp_session_retention_information_within_pfcp_association_setup_request(uint8_t *pos, ogs_pfcp_tlv_pfcp_session_retention_information_within_pfcp_association_setup_request_t *v);
+static int pfcp_length_user_plane_path_recovery_report(ogs_pfcp_tlv_user_plane_path_recovery_report_t *v);
+static uint8_t *pfcp_put_user_plane_path_recovery_report(uint8_t *pos, ogs_pfcp_tlv_user_plane_path_recovery_report_t *v);
+static int pfcp_length_created_bridge_info_for_tsc(ogs_pfcp_tlv_created_bridge_info_for_tsc_t *v);
+static uint8_t *pfcp_put_created_bridge_info_for_tsc(uint8_t *pos, ogs_pfcp_tlv_created_bridge_info_for_tsc_t *v);
+static int pfcp_length_tsc_management_information_ie_within_pfcp_session_modification_request(ogs_pfcp_tlv_tsc_management_information_ie_within_pfcp_session_modification_request_t *v);
+static uint8_t *pfcp_put_tsc_management_information_ie_within_pfcp_session_modification_request(uint8_t *pos, ogs_pfcp_tlv_tsc_management_information_ie_within_pfcp_session_modification_request_t *v);
+static int pfcp_length_clock_drift_control_information(ogs_pfcp_tlv_clock_drift_control_information_t *v);
+static uint8_t *pfcp_put_clock_drift_control_information(uint8_t *pos, ogs_pfcp_tlv_clock_drift_control_information_t *v);
+static int pfcp_length_clock_drift_report(ogs_pfcp_tlv_clock_drift_report_t *v);
+static uint8_t *pfcp_put_clock_drift_report(uint8_t *pos, ogs_pfcp_tlv_clock_drift_report_t *v);
+static int pfcp_length_remove_srr(ogs_pfcp_tlv_remove_srr_t *v);
+static uint8_t *pfcp_put_remove_srr(uint8_t *pos, ogs_pfcp_tlv_remove_srr_t *v);
+static int pfcp_length_create_srr(ogs_pfcp_tlv_create_srr_t *v);
+static uint8_t *pfcp_put_create_srr(uint8_t *pos, ogs_pfcp_tlv_create_srr_t *v);
+static int pfcp_length_update_srr(ogs_pfcp_tlv_update_srr_t *v);
+static uint8_t *pfcp_put_update_srr(uint8_t *pos, ogs_pfcp_tlv_update_srr_t *v);
+static int pfcp_length_session_report(ogs_pfcp_tlv_session_report_t *v);
+static uint8_t *pfcp_put_session_report(uint8_t *pos, ogs_pfcp_tlv_session_report_t *v);
+static int pfcp_length_provide_atsss_control_information(ogs_pfcp_tlv_provide_atsss_control_information_t *v);
+static uint8_t *pfcp_put_provide_atsss_control_information(uint8_t *pos, ogs_pfcp_tlv_provide_atsss_control_information_t *v);
+static int pfcp_length_atsss_control_parameters(ogs_pfcp_tlv_atsss_control_parameters_t *v);
+static uint8_t *pfcp_put_atsss_control_parameters(uint8_t *pos, ogs_pfcp_tlv_atsss_control_parameters_t *v);
+static int pfcp_length_gtp_u_path_qos_report_pfcp_node_report_request(ogs_pfcp_tlv_gtp_u_path_qos_report_pfcp_node_report_request_t *v);
+static uint8_t *pfcp_put_gtp_u_path_qos_report_pfcp_node_report_request(uint8_t *pos, ogs_pfcp_tlv_gtp_u_path_qos_report_pfcp_node_report_request_t *v);
+static int pfcp_length_packet_rate_status_report(ogs_pfcp_tlv_packet_rate_status_report_t *v);
+static uint8_t *pfcp_put_packet_rate_status_report(uint8_t *pos, ogs_pfcp_tlv_packet_rate_status_report_t *v);
+static int pfcp_length_ethernet_context_information(ogs_pfcp_tlv_ethernet_context_information_t *v);
+static uint8_t *pfcp_put_ethernet_context_information(uint8_t *pos, ogs_pfcp_tlv_ethernet_context_information_t *v);
+static int pfcp_length_updated_pdr(ogs_pfcp_tlv_updated_pdr_t *v);
+static uint8_t *pfcp_put_updated_pdr(uint8_t *pos, ogs_pfcp_tlv_updated_pdr_t *v);
+static int pfcp_length_provide_rds_configuration_information(ogs_pfcp_tlv_provide_rds_configuration_information_t *v);
+static uint8_t *pfcp_put_provide_rds_configuration_information(uint8_t *pos, ogs_pfcp_tlv_provide_rds_configuration_information_t *v);
+static int pfcp_length_query_packet_rate_status_ie_within_pfcp_session_modification_request(ogs_pfcp_tlv_query_packet_rate_status_ie_within_pfcp_session_modification_request_t *v);
+static uint8_t *pfcp_put_query_packet_rate_status_ie_within_pfcp_session_modification_request(uint8_t *pos, ogs_pfcp_tlv_query_packet_rate_status_ie_within_pfcp_session_modification_request_t *v);
+static int pfcp_length_ue_ip_address_usage_information(ogs_pfcp_tlv_ue_ip_address_usage_information_t *v);
+static uint8_t *pfcp_put_ue_ip_address_usage_information(uint8_t *pos, ogs_pfcp_tlv_ue_ip_address_usage_information_t *v);
+static int pfcp_length_partial_failure_information(ogs_pfcp_tlv_partial_failure_information_t *v);
+static uint8_t *pfcp_put_partial_failure_information(uint8_t *pos, ogs_pfcp_tlv_partial_failure_information_t *v);
+static int pfcp_length_l2tp_tunnel_information(ogs_pfcp_tlv_l2tp_tunnel_information_t *v);
+static uint8_t *pfcp_put_l2tp_tunnel_information(uint8_t *pos, ogs_pfcp_tlv_l2tp_tunnel_information_t *v);
+static int pfcp_length_l2tp_session_information(ogs_pfcp_tlv_l2tp_session_information_t *v);
+static uint8_t *pfcp_put_l2tp_session_information(uint8_t *pos, ogs_pfcp_tlv_l2tp_session_information_t *v);
+static int pfcp_length_created_l2tp_session(ogs_pfcp_tlv_created_l2tp_session_t *v);
+static uint8_t *pfcp_put_created_l2tp_session(uint8_t *pos, ogs_pfcp_tlv_created_l2tp_session_t *v);
+static int pfcp_length_pfcp_session_change_info(ogs_pfcp_tlv_pfcp_session_change_info_t *v);
+static uint8_t *pfcp_put_pfcp_session_change_info(uint8_t *pos, ogs_pfcp_tlv_pfcp_session_change_info_t *v);
+static int pfcp_length_mbs_session_n4mb_control_information(ogs_pfcp_tlv_mbs_session_n4mb_control_information_t *v);
+static uint8_t *pfcp_put_mbs_session_n4mb_control_information(uint8_t *pos, ogs_pfcp_tlv_mbs_session_n4mb_control_information_t *v);
+static int pfcp_length_mbs_session_n4mb_information(ogs_pfcp_tlv_mbs_session_n4mb_information_t *v);
+static uint8_t *pfcp_put_mbs_session_n4mb_information(uint8_t *pos, ogs_pfcp_tlv_mbs_session_n4mb_information_t *v);
+static int pfcp_length_mbs_session_n4_control_information(ogs_pfcp_tlv_mbs_session_n4_control_information_t *v);
+static uint8_t *pfcp_put_mbs_session_n4_control_information(uint8_t *pos, ogs_pfcp_tlv_mbs_session_n4_control_information_t *v);
+static int pfcp_length_mbs_session_n4_information(ogs_pfcp_tlv_mbs_session_n4_information_t *v);
+static uint8_t *pfcp_put_mbs_session_n4_information(uint8_t *pos, ogs_pfcp_tlv_mbs_session_n4_information_t *v);
+static int pfcp_length_dscp_to_ppi_control_information(ogs_pfcp_tlv_dscp_to_ppi_control_information_t *v);
+static uint8_t *pfcp_put_dscp_to_ppi_control_information(uint8_t *pos, ogs_pfcp_tlv_dscp_to_ppi_control_information_t *v);
+
+static int pfcp_length_ethernet_packet_filter(ogs_pfcp_tlv_ethernet_packet_filter_t *v)
+{
+    int i, length = 0, r;
+
+    if (v->ethernet_filter_id.presence) {
+        r = pfcp_length_octet(&v->ethernet_filter_id, &ogs_pfcp_tlv_desc_ethernet_filter_id);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->ethernet_filter_properties.presence) {
+        r = pfcp_length_octet(&v->ethernet_filter_properties, &ogs_pfcp_tlv_desc_ethernet_filter_properties);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->mac_address.presence) {
+        r = pfcp_length_octet(&v->mac_address, &ogs_pfcp_tlv_desc_mac_address);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->ethertype.presence) {
+        r = pfcp_length_octet(&v->ethertype, &ogs_pfcp_tlv_desc_ethertype);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->c_tag.presence) {
+        r = pfcp_length_octet(&v->c_tag, &ogs_pfcp_tlv_desc_c_tag);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->s_tag.presence) {
+        r = pfcp_length_octet(&v->s_tag, &ogs_pfcp_tlv_desc_s_tag);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    for (i = 0; i < 8 && v->sdf_filter[i].presence; i++) {
+        r = pfcp_length_octet(&v->sdf_filter[i], &ogs_pfcp_tlv_desc_sdf_filter);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Ethernet Packet Filter]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_ethernet_packet_filter(uint8_t *pos, ogs_pfcp_tlv_ethernet_packet_filter_t *v)
+{
+    uint8_t *header = pos;
+    int i;
+
+    pos += 4;
+    if (v->ethernet_filter_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_ETHERNET_FILTER_ID_TYPE, &v->ethernet_filter_id);
+    }
+    if (v->ethernet_filter_properties.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_ETHERNET_FILTER_PROPERTIES_TYPE, &v->ethernet_filter_properties);
+    }
+    if (v->mac_address.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_MAC_ADDRESS_TYPE, &v->mac_address);
+    }
+    if (v->ethertype.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_ETHERTYPE_TYPE, &v->ethertype);
+    }
+    if (v->c_tag.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_C_TAG_TYPE, &v->c_tag);
+    }
+    if (v->s_tag.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_S_TAG_TYPE, &v->s_tag);
+    }
+    for (i = 0; i < 8 && v->sdf_filter[i].presence; i++) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_SDF_FILTER_TYPE, &v->sdf_filter[i]);
+    }
+    pfcp_put_header(header, OGS_PFCP_ETHERNET_PACKET_FILTER_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_redundant_transmission_parameters(ogs_pfcp_tlv_redundant_transmission_parameters_t *v)
+{
+    int length = 0, r;
+
+    if (v->local_f_teid_for_redundant_transmission.presence) {
+        r = pfcp_length_octet(&v->local_f_teid_for_redundant_transmission, &ogs_pfcp_tlv_desc_f_teid);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->network_instance_for_redundant_transmission.presence) {
+        r = pfcp_length_octet(&v->network_instance_for_redundant_transmission, &ogs_pfcp_tlv_desc_network_instance);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Redundant Transmission Parameters]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_redundant_transmission_parameters(uint8_t *pos, ogs_pfcp_tlv_redundant_transmission_parameters_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->local_f_teid_for_redundant_transmission.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_F_TEID_TYPE, &v->local_f_teid_for_redundant_transmission);
+    }
+    if (v->network_instance_for_redundant_transmission.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_NETWORK_INSTANCE_TYPE, &v->network_instance_for_redundant_transmission);
+    }
+    pfcp_put_header(header, OGS_PFCP_REDUNDANT_TRANSMISSION_PARAMETERS_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_ip_multicast_addressing_info_within_pfcp_session_establishment_request(ogs_pfcp_tlv_ip_multicast_addressing_info_within_pfcp_session_establishment_request_t *v)
+{
+    int length = 0, r;
+
+    if (v->ip_multicast_address.presence) {
+        r = pfcp_length_octet(&v->ip_multicast_address, &ogs_pfcp_tlv_desc_ip_multicast_address);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->source_ip_address.presence) {
+        r = pfcp_length_octet(&v->source_ip_address, &ogs_pfcp_tlv_desc_source_ip_address);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [IP Multicast Addressing Info within PFCP Session Establishment Request]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_ip_multicast_addressing_info_within_pfcp_session_establishment_request(uint8_t *pos, ogs_pfcp_tlv_ip_multicast_addressing_info_within_pfcp_session_establishment_request_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->ip_multicast_address.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_IP_MULTICAST_ADDRESS_TYPE, &v->ip_multicast_address);
+    }
+    if (v->source_ip_address.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_SOURCE_IP_ADDRESS_TYPE, &v->source_ip_address);
+    }
+    pfcp_put_header(header, OGS_PFCP_IP_MULTICAST_ADDRESSING_INFO_WITHIN_PFCP_SESSION_ESTABLISHMENT_REQUEST_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_pdi(ogs_pfcp_tlv_pdi_t *v)
+{
+    int i, length = 0, r;
+
+    if (v->source_interface.presence) {
+        length += 5;
+    }
+    if (v->local_f_teid.presence) {
+        r = pfcp_length_octet(&v->local_f_teid, &ogs_pfcp_tlv_desc_f_teid);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->local_ingress_tunnel.presence) {
+        r = pfcp_length_octet(&v->local_ingress_tunnel, &ogs_pfcp_tlv_desc_local_ingress_tunnel);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->network_instance.presence) {
+        r = pfcp_length_octet(&v->network_instance, &ogs_pfcp_tlv_desc_network_instance);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->redundant_transmission_detection_parameters.presence) {
+        r = pfcp_length_redundant_transmission_parameters(&v->redundant_transmission_detection_parameters);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->ue_ip_address.presence) {
+        r = pfcp_length_octet(&v->ue_ip_address, &ogs_pfcp_tlv_desc_ue_ip_address);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->traffic_endpoint_id.presence) {
+        r = pfcp_length_octet(&v->traffic_endpoint_id, &ogs_pfcp_tlv_desc_traffic_endpoint_id);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    for (i = 0; i < 8 && v->sdf_filter[i].presence; i++) {
+        r = pfcp_length_octet(&v->sdf_filter[i], &ogs_pfcp_tlv_desc_sdf_filter);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->application_id.presence) {
+        r = pfcp_length_octet(&v->application_id, &ogs_pfcp_tlv_desc_application_id);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->ethernet_pdu_session_information.presence) {
+        r = pfcp_length_octet(&v->ethernet_pdu_session_information, &ogs_pfcp_tlv_desc_ethernet_pdu_session_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->ethernet_packet_filter.presence) {
+        r = pfcp_length_ethernet_packet_filter(&v->ethernet_packet_filter);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->qfi.presence) {
+        length += 5;
+    }
+    for (i = 0; i < 8 && v->framed_route[i].presence; i++) {
+        r = pfcp_length_octet(&v->framed_route[i], &ogs_pfcp_tlv_desc_framed_route);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->framed_routing.presence) {
+        r = pfcp_length_octet(&v->framed_routing, &ogs_pfcp_tlv_desc_framed_routing);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    for (i = 0; i < 8 && v->framed_ipv6_route[i].presence; i++) {
+        r = pfcp_length_octet(&v->framed_ipv6_route[i], &ogs_pfcp_tlv_desc_framed_ipv6_route);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->source_interface_type.presence) {
+        length += 5;
+    }
+    if (v->ip_multicast_addressing_info.presence) {
+        r = pfcp_length_ip_multicast_addressing_info_within_pfcp_session_establishment_request(&v->ip_multicast_addressing_info);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->dns_query_filter.presence) {
+        r = pfcp_length_octet(&v->dns_query_filter, &ogs_pfcp_tlv_desc_dns_query_filter);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->mbs_session_identifier.presence) {
+        r = pfcp_length_octet(&v->mbs_session_identifier, &ogs_pfcp_tlv_desc_mbs_session_identifier);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->area_session_id.presence) {
+        r = pfcp_length_octet(&v->area_session_id, &ogs_pfcp_tlv_desc_area_session_id);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [PDI]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_pdi(uint8_t *pos, ogs_pfcp_tlv_pdi_t *v)
+{
+    uint8_t *header = pos;
+    int i;
+
+    pos += 4;
+    if (v->source_interface.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_SOURCE_INTERFACE_TYPE, &v->source_interface);
+    }
+    if (v->local_f_teid.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_F_TEID_TYPE, &v->local_f_teid);
+    }
+    if (v->local_ingress_tunnel.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_LOCAL_INGRESS_TUNNEL_TYPE, &v->local_ingress_tunnel);
+    }
+    if (v->network_instance.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_NETWORK_INSTANCE_TYPE, &v->network_instance);
+    }
+    if (v->redundant_transmission_detection_parameters.presence) {
+        pos = pfcp_put_redundant_transmission_parameters(pos, &v->redundant_transmission_detection_parameters);
+    }
+    if (v->ue_ip_address.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_UE_IP_ADDRESS_TYPE, &v->ue_ip_address);
+    }
+    if (v->traffic_endpoint_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_TRAFFIC_ENDPOINT_ID_TYPE, &v->traffic_endpoint_id);
+    }
+    for (i = 0; i < 8 && v->sdf_filter[i].presence; i++) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_SDF_FILTER_TYPE, &v->sdf_filter[i]);
+    }
+    if (v->application_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_APPLICATION_ID_TYPE, &v->application_id);
+    }
+    if (v->ethernet_pdu_session_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_ETHERNET_PDU_SESSION_INFORMATION_TYPE, &v->ethernet_pdu_session_information);
+    }
+    if (v->ethernet_packet_filter.presence) {
+        pos = pfcp_put_ethernet_packet_filter(pos, &v->ethernet_packet_filter);
+    }
+    if (v->qfi.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_QFI_TYPE, &v->qfi);
+    }
+    for (i = 0; i < 8 && v->framed_route[i].presence; i++) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_FRAMED_ROUTE_TYPE, &v->framed_route[i]);
+    }
+    if (v->framed_routing.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_FRAMED_ROUTING_TYPE, &v->framed_routing);
+    }
+    for (i = 0; i < 8 && v->framed_ipv6_route[i].presence; i++) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_FRAMED_IPV6_ROUTE_TYPE, &v->framed_ipv6_route[i]);
+    }
+    if (v->source_interface_type.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP__INTERFACE_TYPE_TYPE, &v->source_interface_type);
+    }
+    if (v->ip_multicast_addressing_info.presence) {
+        pos = pfcp_put_ip_multicast_addressing_info_within_pfcp_session_establishment_request(pos, &v->ip_multicast_addressing_info);
+    }
+    if (v->dns_query_filter.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_DNS_QUERY_FILTER_TYPE, &v->dns_query_filter);
+    }
+    if (v->mbs_session_identifier.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_MBS_SESSION_IDENTIFIER_TYPE, &v->mbs_session_identifier);
+    }
+    if (v->area_session_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_AREA_SESSION_ID_TYPE, &v->area_session_id);
+    }
+    pfcp_put_header(header, OGS_PFCP_PDI_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_transport_delay_reporting(ogs_pfcp_tlv_transport_delay_reporting_t *v)
+{
+    int length = 0, r;
+
+    if (v->preceding_ul_gtp_u_peer.presence) {
+        r = pfcp_length_octet(&v->preceding_ul_gtp_u_peer, &ogs_pfcp_tlv_desc_remote_gtp_u_peer);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->dscp.presence) {
+        r = pfcp_length_octet(&v->dscp, &ogs_pfcp_tlv_desc_transport_level_marking);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Transport Delay Reporting]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_transport_delay_reporting(uint8_t *pos, ogs_pfcp_tlv_transport_delay_reporting_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->preceding_ul_gtp_u_peer.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_REMOTE_GTP_U_PEER_TYPE, &v->preceding_ul_gtp_u_peer);
+    }
+    if (v->dscp.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_TRANSPORT_LEVEL_MARKING_TYPE, &v->dscp);
+    }
+    pfcp_put_header(header, OGS_PFCP_TRANSPORT_DELAY_REPORTING_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_create_pdr(ogs_pfcp_tlv_create_pdr_t *v)
+{
+    int i, length = 0, r;
+
+    if (v->pdr_id.presence) {
+        length += 6;
+    }
+    if (v->precedence.presence) {
+        length += 8;
+    }
+    if (v->pdi.presence) {
+        r = pfcp_length_pdi(&v->pdi);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->outer_header_removal.presence) {
+        r = pfcp_length_octet(&v->outer_header_removal, &ogs_pfcp_tlv_desc_outer_header_removal);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->far_id.presence) {
+        length += 8;
+    }
+    for (i = 0; i < 8 && v->urr_id[i].presence; i++) {
+        length += 8;
+    }
+    if (v->qer_id.presence) {
+        length += 8;
+    }
+    if (v->activate_predefined_rules.presence) {
+        r = pfcp_length_octet(&v->activate_predefined_rules, &ogs_pfcp_tlv_desc_activate_predefined_rules);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->activation_time.presence) {
+        r = pfcp_length_octet(&v->activation_time, &ogs_pfcp_tlv_desc_activation_time);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->deactivation_time.presence) {
+        r = pfcp_length_octet(&v->deactivation_time, &ogs_pfcp_tlv_desc_deactivation_time);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->mar_id.presence) {
+        r = pfcp_length_octet(&v->mar_id, &ogs_pfcp_tlv_desc_mar_id);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->packet_replication_and_detection_carry_on_information.presence) {
+        r = pfcp_length_octet(&v->packet_replication_and_detection_carry_on_information, &ogs_pfcp_tlv_desc_packet_replication_and_detection_carry_on_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->ip_multicast_addressing_info.presence) {
+        r = pfcp_length_ip_multicast_addressing_info_within_pfcp_session_establishment_request(&v->ip_multicast_addressing_info);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->ue_ip_address_pool_identity.presence) {
+        r = pfcp_length_octet(&v->ue_ip_address_pool_identity, &ogs_pfcp_tlv_desc_ue_ip_address);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->mptcp_applicable_indication.presence) {
+        r = pfcp_length_octet(&v->mptcp_applicable_indication, &ogs_pfcp_tlv_desc_mptcp_applicable_indication);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->transport_delay_reporting.presence) {
+        r = pfcp_length_transport_delay_reporting(&v->transport_delay_reporting);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->rat_type.presence) {
+        r = pfcp_length_octet(&v->rat_type, &ogs_pfcp_tlv_desc_rat_type);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Create PDR]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_create_pdr(uint8_t *pos, ogs_pfcp_tlv_create_pdr_t *v)
+{
+    uint8_t *header = pos;
+    int i;
+
+    pos += 4;
+    if (v->pdr_id.presence) {
+        pos = pfcp_put_uint16(pos, OGS_PFCP_PDR_ID_TYPE, &v->pdr_id);
+    }
+    if (v->precedence.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_PRECEDENCE_TYPE, &v->precedence);
+    }
+    if (v->pdi.presence) {
+        pos = pfcp_put_pdi(pos, &v->pdi);
+    }
+    if (v->outer_header_removal.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_OUTER_HEADER_REMOVAL_TYPE, &v->outer_header_removal);
+    }
+    if (v->far_id.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_FAR_ID_TYPE, &v->far_id);
+    }
+    for (i = 0; i < 8 && v->urr_id[i].presence; i++) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_URR_ID_TYPE, &v->urr_id[i]);
+    }
+    if (v->qer_id.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_QER_ID_TYPE, &v->qer_id);
+    }
+    if (v->activate_predefined_rules.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_ACTIVATE_PREDEFINED_RULES_TYPE, &v->activate_predefined_rules);
+    }
+    if (v->activation_time.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_ACTIVATION_TIME_TYPE, &v->activation_time);
+    }
+    if (v->deactivation_time.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_DEACTIVATION_TIME_TYPE, &v->deactivation_time);
+    }
+    if (v->mar_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_MAR_ID_TYPE, &v->mar_id);
+    }
+    if (v->packet_replication_and_detection_carry_on_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_PACKET_REPLICATION_AND_DETECTION_CARRY_ON_INFORMATION_TYPE, &v->packet_replication_and_detection_carry_on_information);
+    }
+    if (v->ip_multicast_addressing_info.presence) {
+        pos = pfcp_put_ip_multicast_addressing_info_within_pfcp_session_establishment_request(pos, &v->ip_multicast_addressing_info);
+    }
+    if (v->ue_ip_address_pool_identity.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_UE_IP_ADDRESS_TYPE, &v->ue_ip_address_pool_identity);
+    }
+    if (v->mptcp_applicable_indication.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_MPTCP_APPLICABLE_INDICATION_TYPE, &v->mptcp_applicable_indication);
+    }
+    if (v->transport_delay_reporting.presence) {
+        pos = pfcp_put_transport_delay_reporting(pos, &v->transport_delay_reporting);
+    }
+    if (v->rat_type.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_RAT_TYPE_TYPE, &v->rat_type);
+    }
+    pfcp_put_header(header, OGS_PFCP_CREATE_PDR_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_forwarding_parameters(ogs_pfcp_tlv_forwarding_parameters_t *v)
+{
+    int length = 0, r;
+
+    if (v->destination_interface.presence) {
+        length += 5;
+    }
+    if (v->network_instance.presence) {
+        r = pfcp_length_octet(&v->network_instance, &ogs_pfcp_tlv_desc_network_instance);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->redirect_information.presence) {
+        r = pfcp_length_octet(&v->redirect_information, &ogs_pfcp_tlv_desc_redirect_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->outer_header_creation.presence) {
+        r = pfcp_length_octet(&v->outer_header_creation, &ogs_pfcp_tlv_desc_outer_header_creation);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->transport_level_marking.presence) {
+        r = pfcp_length_octet(&v->transport_level_marking, &ogs_pfcp_tlv_desc_transport_level_marking);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->forwarding_policy.presence) {
+        r = pfcp_length_octet(&v->forwarding_policy, &ogs_pfcp_tlv_desc_forwarding_policy);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->header_enrichment.presence) {
+        r = pfcp_length_octet(&v->header_enrichment, &ogs_pfcp_tlv_desc_header_enrichment);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->linked_traffic_endpoint_id.presence) {
+        r = pfcp_length_octet(&v->linked_traffic_endpoint_id, &ogs_pfcp_tlv_desc_traffic_endpoint_id);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->proxying.presence) {
+        r = pfcp_length_octet(&v->proxying, &ogs_pfcp_tlv_desc_proxying);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->destination_interface_type.presence) {
+        length += 5;
+    }
+    if (v->data_network_access_identifier.presence) {
+        r = pfcp_length_octet(&v->data_network_access_identifier, &ogs_pfcp_tlv_desc_data_network_access_identifier);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->ip_address_and_port_number_replacement.presence) {
+        r = pfcp_length_octet(&v->ip_address_and_port_number_replacement, &ogs_pfcp_tlv_desc_ip_address_and_port_number_replacement);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Forwarding Parameters]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_forwarding_parameters(uint8_t *pos, ogs_pfcp_tlv_forwarding_parameters_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->destination_interface.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_DESTINATION_INTERFACE_TYPE, &v->destination_interface);
+    }
+    if (v->network_instance.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_NETWORK_INSTANCE_TYPE, &v->network_instance);
+    }
+    if (v->redirect_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_REDIRECT_INFORMATION_TYPE, &v->redirect_information);
+    }
+    if (v->outer_header_creation.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_OUTER_HEADER_CREATION_TYPE, &v->outer_header_creation);
+    }
+    if (v->transport_level_marking.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_TRANSPORT_LEVEL_MARKING_TYPE, &v->transport_level_marking);
+    }
+    if (v->forwarding_policy.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_FORWARDING_POLICY_TYPE, &v->forwarding_policy);
+    }
+    if (v->header_enrichment.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_HEADER_ENRICHMENT_TYPE, &v->header_enrichment);
+    }
+    if (v->linked_traffic_endpoint_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_TRAFFIC_ENDPOINT_ID_TYPE, &v->linked_traffic_endpoint_id);
+    }
+    if (v->proxying.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_PROXYING_TYPE, &v->proxying);
+    }
+    if (v->destination_interface_type.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP__INTERFACE_TYPE_TYPE, &v->destination_interface_type);
+    }
+    if (v->data_network_access_identifier.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_DATA_NETWORK_ACCESS_IDENTIFIER_TYPE, &v->data_network_access_identifier);
+    }
+    if (v->ip_address_and_port_number_replacement.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_IP_ADDRESS_AND_PORT_NUMBER_REPLACEMENT_TYPE, &v->ip_address_and_port_number_replacement);
+    }
+    pfcp_put_header(header, OGS_PFCP_FORWARDING_PARAMETERS_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_duplicating_parameters(ogs_pfcp_tlv_duplicating_parameters_t *v)
+{
+    int length = 0, r;
+
+    if (v->destination_interface.presence) {
+        length += 5;
+    }
+    if (v->outer_header_creation.presence) {
+        r = pfcp_length_octet(&v->outer_header_creation, &ogs_pfcp_tlv_desc_outer_header_creation);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->transport_level_marking.presence) {
+        r = pfcp_length_octet(&v->transport_level_marking, &ogs_pfcp_tlv_desc_transport_level_marking);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->forwarding_policy.presence) {
+        r = pfcp_length_octet(&v->forwarding_policy, &ogs_pfcp_tlv_desc_forwarding_policy);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Duplicating Parameters]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_duplicating_parameters(uint8_t *pos, ogs_pfcp_tlv_duplicating_parameters_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->destination_interface.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_DESTINATION_INTERFACE_TYPE, &v->destination_interface);
+    }
+    if (v->outer_header_creation.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_OUTER_HEADER_CREATION_TYPE, &v->outer_header_creation);
+    }
+    if (v->transport_level_marking.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_TRANSPORT_LEVEL_MARKING_TYPE, &v->transport_level_marking);
+    }
+    if (v->forwarding_policy.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_FORWARDING_POLICY_TYPE, &v->forwarding_policy);
+    }
+    pfcp_put_header(header, OGS_PFCP_DUPLICATING_PARAMETERS_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_redundant_transmission_forwarding_parameters(ogs_pfcp_tlv_redundant_transmission_forwarding_parameters_t *v)
+{
+    int length = 0, r;
+
+    if (v->outer_header_creation.presence) {
+        r = pfcp_length_octet(&v->outer_header_creation, &ogs_pfcp_tlv_desc_outer_header_creation);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->network_instance_for_redundant_transmission.presence) {
+        r = pfcp_length_octet(&v->network_instance_for_redundant_transmission, &ogs_pfcp_tlv_desc_network_instance);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Redundant Transmission Forwarding Parameters]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_redundant_transmission_forwarding_parameters(uint8_t *pos, ogs_pfcp_tlv_redundant_transmission_forwarding_parameters_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->outer_header_creation.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_OUTER_HEADER_CREATION_TYPE, &v->outer_header_creation);
+    }
+    if (v->network_instance_for_redundant_transmission.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_NETWORK_INSTANCE_TYPE, &v->network_instance_for_redundant_transmission);
+    }
+    pfcp_put_header(header, OGS_PFCP_REDUNDANT_TRANSMISSION_FORWARDING_PARAMETERS_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_mbs_multicast_parameters(ogs_pfcp_tlv_mbs_multicast_parameters_t *v)
+{
+    int length = 0, r;
+
+    if (v->destination_interface.presence) {
+        length += 5;
+    }
+    if (v->network_instance.presence) {
+        r = pfcp_length_octet(&v->network_instance, &ogs_pfcp_tlv_desc_network_instance);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->outer_header_creation.presence) {
+        r = pfcp_length_octet(&v->outer_header_creation, &ogs_pfcp_tlv_desc_outer_header_creation);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->transport_level_marking.presence) {
+        r = pfcp_length_octet(&v->transport_level_marking, &ogs_pfcp_tlv_desc_transport_level_marking);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->destination_interface_type.presence) {
+        length += 5;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [MBS Multicast Parameters]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_mbs_multicast_parameters(uint8_t *pos, ogs_pfcp_tlv_mbs_multicast_parameters_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->destination_interface.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_DESTINATION_INTERFACE_TYPE, &v->destination_interface);
+    }
+    if (v->network_instance.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_NETWORK_INSTANCE_TYPE, &v->network_instance);
+    }
+    if (v->outer_header_creation.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_OUTER_HEADER_CREATION_TYPE, &v->outer_header_creation);
+    }
+    if (v->transport_level_marking.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_TRANSPORT_LEVEL_MARKING_TYPE, &v->transport_level_marking);
+    }
+    if (v->destination_interface_type.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP__INTERFACE_TYPE_TYPE, &v->destination_interface_type);
+    }
+    pfcp_put_header(header, OGS_PFCP_MBS_MULTICAST_PARAMETERS_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_add_mbs_unicast_parameters(ogs_pfcp_tlv_add_mbs_unicast_parameters_t *v)
+{
+    int length = 0, r;
+
+    if (v->destination_interface.presence) {
+        length += 5;
+    }
+    if (v->mbs_unicast_parameters_id.presence) {
+        r = pfcp_length_octet(&v->mbs_unicast_parameters_id, &ogs_pfcp_tlv_desc_mbs_unicast_parameters_id);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->network_instance.presence) {
+        r = pfcp_length_octet(&v->network_instance, &ogs_pfcp_tlv_desc_network_instance);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->outer_header_creation.presence) {
+        r = pfcp_length_octet(&v->outer_header_creation, &ogs_pfcp_tlv_desc_outer_header_creation);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->transport_level_marking.presence) {
+        r = pfcp_length_octet(&v->transport_level_marking, &ogs_pfcp_tlv_desc_transport_level_marking);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->destination_interface_type.presence) {
+        length += 5;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Add MBS Unicast Parameters]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_add_mbs_unicast_parameters(uint8_t *pos, ogs_pfcp_tlv_add_mbs_unicast_parameters_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->destination_interface.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_DESTINATION_INTERFACE_TYPE, &v->destination_interface);
+    }
+    if (v->mbs_unicast_parameters_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_MBS_UNICAST_PARAMETERS_ID_TYPE, &v->mbs_unicast_parameters_id);
+    }
+    if (v->network_instance.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_NETWORK_INSTANCE_TYPE, &v->network_instance);
+    }
+    if (v->outer_header_creation.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_OUTER_HEADER_CREATION_TYPE, &v->outer_header_creation);
+    }
+    if (v->transport_level_marking.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_TRANSPORT_LEVEL_MARKING_TYPE, &v->transport_level_marking);
+    }
+    if (v->destination_interface_type.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP__INTERFACE_TYPE_TYPE, &v->destination_interface_type);
+    }
+    pfcp_put_header(header, OGS_PFCP_ADD_MBS_UNICAST_PARAMETERS_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_create_far(ogs_pfcp_tlv_create_far_t *v)
+{
+    int length = 0, r;
+
+    if (v->far_id.presence) {
+        length += 8;
+    }
+    if (v->apply_action.presence) {
+        length += 6;
+    }
+    if (v->forwarding_parameters.presence) {
+        r = pfcp_length_forwarding_parameters(&v->forwarding_parameters);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->duplicating_parameters.presence) {
+        r = pfcp_length_duplicating_parameters(&v->duplicating_parameters);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->bar_id.presence) {
+        length += 5;
+    }
+    if (v->redundant_transmission_forwarding_parameters.presence) {
+        r = pfcp_length_redundant_transmission_forwarding_parameters(&v->redundant_transmission_forwarding_parameters);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->mbs_multicast_parameters.presence) {
+        r = pfcp_length_mbs_multicast_parameters(&v->mbs_multicast_parameters);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->add_mbs_unicast_parameters.presence) {
+        r = pfcp_length_add_mbs_unicast_parameters(&v->add_mbs_unicast_parameters);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Create FAR]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_create_far(uint8_t *pos, ogs_pfcp_tlv_create_far_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->far_id.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_FAR_ID_TYPE, &v->far_id);
+    }
+    if (v->apply_action.presence) {
+        pos = pfcp_put_uint16(pos, OGS_PFCP_APPLY_ACTION_TYPE, &v->apply_action);
+    }
+    if (v->forwarding_parameters.presence) {
+        pos = pfcp_put_forwarding_parameters(pos, &v->forwarding_parameters);
+    }
+    if (v->duplicating_parameters.presence) {
+        pos = pfcp_put_duplicating_parameters(pos, &v->duplicating_parameters);
+    }
+    if (v->bar_id.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_BAR_ID_TYPE, &v->bar_id);
+    }
+    if (v->redundant_transmission_forwarding_parameters.presence) {
+        pos = pfcp_put_redundant_transmission_forwarding_parameters(pos, &v->redundant_transmission_forwarding_parameters);
+    }
+    if (v->mbs_multicast_parameters.presence) {
+        pos = pfcp_put_mbs_multicast_parameters(pos, &v->mbs_multicast_parameters);
+    }
+    if (v->add_mbs_unicast_parameters.presence) {
+        pos = pfcp_put_add_mbs_unicast_parameters(pos, &v->add_mbs_unicast_parameters);
+    }
+    pfcp_put_header(header, OGS_PFCP_CREATE_FAR_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_update_forwarding_parameters(ogs_pfcp_tlv_update_forwarding_parameters_t *v)
+{
+    int length = 0, r;
+
+    if (v->destination_interface.presence) {
+        length += 5;
+    }
+    if (v->network_instance.presence) {
+        r = pfcp_length_octet(&v->network_instance, &ogs_pfcp_tlv_desc_network_instance);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->redirect_information.presence) {
+        r = pfcp_length_octet(&v->redirect_information, &ogs_pfcp_tlv_desc_redirect_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->outer_header_creation.presence) {
+        r = pfcp_length_octet(&v->outer_header_creation, &ogs_pfcp_tlv_desc_outer_header_creation);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->transport_level_marking.presence) {
+        r = pfcp_length_octet(&v->transport_level_marking, &ogs_pfcp_tlv_desc_transport_level_marking);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->forwarding_policy.presence) {
+        r = pfcp_length_octet(&v->forwarding_policy, &ogs_pfcp_tlv_desc_forwarding_policy);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->header_enrichment.presence) {
+        r = pfcp_length_octet(&v->header_enrichment, &ogs_pfcp_tlv_desc_header_enrichment);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->pfcpsmreq_flags.presence) {
+        length += 5;
+    }
+    if (v->linked_traffic_endpoint_id.presence) {
+        r = pfcp_length_octet(&v->linked_traffic_endpoint_id, &ogs_pfcp_tlv_desc_traffic_endpoint_id);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->destination_interface_type.presence) {
+        length += 5;
+    }
+    if (v->data_network_access_identifier.presence) {
+        r = pfcp_length_octet(&v->data_network_access_identifier, &ogs_pfcp_tlv_desc_data_network_access_identifier);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->ip_address_and_port_number_replacement.presence) {
+        r = pfcp_length_octet(&v->ip_address_and_port_number_replacement, &ogs_pfcp_tlv_desc_ip_address_and_port_number_replacement);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Update Forwarding Parameters]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_update_forwarding_parameters(uint8_t *pos, ogs_pfcp_tlv_update_forwarding_parameters_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->destination_interface.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_DESTINATION_INTERFACE_TYPE, &v->destination_interface);
+    }
+    if (v->network_instance.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_NETWORK_INSTANCE_TYPE, &v->network_instance);
+    }
+    if (v->redirect_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_REDIRECT_INFORMATION_TYPE, &v->redirect_information);
+    }
+    if (v->outer_header_creation.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_OUTER_HEADER_CREATION_TYPE, &v->outer_header_creation);
+    }
+    if (v->transport_level_marking.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_TRANSPORT_LEVEL_MARKING_TYPE, &v->transport_level_marking);
+    }
+    if (v->forwarding_policy.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_FORWARDING_POLICY_TYPE, &v->forwarding_policy);
+    }
+    if (v->header_enrichment.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_HEADER_ENRICHMENT_TYPE, &v->header_enrichment);
+    }
+    if (v->pfcpsmreq_flags.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_PFCPSMREQ_FLAGS_TYPE, &v->pfcpsmreq_flags);
+    }
+    if (v->linked_traffic_endpoint_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_TRAFFIC_ENDPOINT_ID_TYPE, &v->linked_traffic_endpoint_id);
+    }
+    if (v->destination_interface_type.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP__INTERFACE_TYPE_TYPE, &v->destination_interface_type);
+    }
+    if (v->data_network_access_identifier.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_DATA_NETWORK_ACCESS_IDENTIFIER_TYPE, &v->data_network_access_identifier);
+    }
+    if (v->ip_address_and_port_number_replacement.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_IP_ADDRESS_AND_PORT_NUMBER_REPLACEMENT_TYPE, &v->ip_address_and_port_number_replacement);
+    }
+    pfcp_put_header(header, OGS_PFCP_UPDATE_FORWARDING_PARAMETERS_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_update_duplicating_parameters(ogs_pfcp_tlv_update_duplicating_parameters_t *v)
+{
+    int length = 0, r;
+
+    if (v->destination_interface.presence) {
+        length += 5;
+    }
+    if (v->outer_header_creation.presence) {
+        r = pfcp_length_octet(&v->outer_header_creation, &ogs_pfcp_tlv_desc_outer_header_creation);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->transport_level_marking.presence) {
+        r = pfcp_length_octet(&v->transport_level_marking, &ogs_pfcp_tlv_desc_transport_level_marking);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->forwarding_policy.presence) {
+        r = pfcp_length_octet(&v->forwarding_policy, &ogs_pfcp_tlv_desc_forwarding_policy);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Update Duplicating Parameters]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_update_duplicating_parameters(uint8_t *pos, ogs_pfcp_tlv_update_duplicating_parameters_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->destination_interface.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_DESTINATION_INTERFACE_TYPE, &v->destination_interface);
+    }
+    if (v->outer_header_creation.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_OUTER_HEADER_CREATION_TYPE, &v->outer_header_creation);
+    }
+    if (v->transport_level_marking.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_TRANSPORT_LEVEL_MARKING_TYPE, &v->transport_level_marking);
+    }
+    if (v->forwarding_policy.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_FORWARDING_POLICY_TYPE, &v->forwarding_policy);
+    }
+    pfcp_put_header(header, OGS_PFCP_UPDATE_DUPLICATING_PARAMETERS_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_update_far(ogs_pfcp_tlv_update_far_t *v)
+{
+    int length = 0, r;
+
+    if (v->far_id.presence) {
+        length += 8;
+    }
+    if (v->apply_action.presence) {
+        length += 6;
+    }
+    if (v->update_forwarding_parameters.presence) {
+        r = pfcp_length_update_forwarding_parameters(&v->update_forwarding_parameters);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->update_duplicating_parameters.presence) {
+        r = pfcp_length_update_duplicating_parameters(&v->update_duplicating_parameters);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->redundant_transmission_forwarding_parameters.presence) {
+        r = pfcp_length_redundant_transmission_forwarding_parameters(&v->redundant_transmission_forwarding_parameters);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->bar_id.presence) {
+        length += 5;
+    }
+    if (v->add_mbs_unicast_parameters.presence) {
+        r = pfcp_length_add_mbs_unicast_parameters(&v->add_mbs_unicast_parameters);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->remove_mbs_unicast_parameters.presence) {
+        r = pfcp_length_octet(&v->remove_mbs_unicast_parameters, &ogs_pfcp_tlv_desc_remove_mbs_unicast_parameters);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Update FAR]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_update_far(uint8_t *pos, ogs_pfcp_tlv_update_far_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->far_id.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_FAR_ID_TYPE, &v->far_id);
+    }
+    if (v->apply_action.presence) {
+        pos = pfcp_put_uint16(pos, OGS_PFCP_APPLY_ACTION_TYPE, &v->apply_action);
+    }
+    if (v->update_forwarding_parameters.presence) {
+        pos = pfcp_put_update_forwarding_parameters(pos, &v->update_forwarding_parameters);
+    }
+    if (v->update_duplicating_parameters.presence) {
+        pos = pfcp_put_update_duplicating_parameters(pos, &v->update_duplicating_parameters);
+    }
+    if (v->redundant_transmission_forwarding_parameters.presence) {
+        pos = pfcp_put_redundant_transmission_forwarding_parameters(pos, &v->redundant_transmission_forwarding_parameters);
+    }
+    if (v->bar_id.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_BAR_ID_TYPE, &v->bar_id);
+    }
+    if (v->add_mbs_unicast_parameters.presence) {
+        pos = pfcp_put_add_mbs_unicast_parameters(pos, &v->add_mbs_unicast_parameters);
+    }
+    if (v->remove_mbs_unicast_parameters.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_REMOVE_MBS_UNICAST_PARAMETERS_TYPE, &v->remove_mbs_unicast_parameters);
+    }
+    pfcp_put_header(header, OGS_PFCP_UPDATE_FAR_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_pfd_context(ogs_pfcp_tlv_pfd_context_t *v)
+{
+    int length = 0, r;
+
+    if (v->pfd_contents.presence) {
+        r = pfcp_length_octet(&v->pfd_contents, &ogs_pfcp_tlv_desc_pfd_contents);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [PFD context]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_pfd_context(uint8_t *pos, ogs_pfcp_tlv_pfd_context_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->pfd_contents.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_PFD_CONTENTS_TYPE, &v->pfd_contents);
+    }
+    pfcp_put_header(header, OGS_PFCP_PFD_CONTEXT_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_application_id_s_pfds(ogs_pfcp_tlv_application_id_s_pfds_t *v)
+{
+    int length = 0, r;
+
+    if (v->application_id.presence) {
+        r = pfcp_length_octet(&v->application_id, &ogs_pfcp_tlv_desc_application_id);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->pfd_context.presence) {
+        r = pfcp_length_pfd_context(&v->pfd_context);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Application ID's PFDs]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_application_id_s_pfds(uint8_t *pos, ogs_pfcp_tlv_application_id_s_pfds_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->application_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_APPLICATION_ID_TYPE, &v->application_id);
+    }
+    if (v->pfd_context.presence) {
+        pos = pfcp_put_pfd_context(pos, &v->pfd_context);
+    }
+    pfcp_put_header(header, OGS_PFCP_APPLICATION_ID_S_PFDS_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_ethernet_traffic_information(ogs_pfcp_tlv_ethernet_traffic_information_t *v)
+{
+    int length = 0, r;
+
+    if (v->mac_addresses_detected.presence) {
+        r = pfcp_length_octet(&v->mac_addresses_detected, &ogs_pfcp_tlv_desc_mac_addresses_detected);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->mac_addresses_removed.presence) {
+        r = pfcp_length_octet(&v->mac_addresses_removed, &ogs_pfcp_tlv_desc_mac_addresses_removed);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Ethernet Traffic Information]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_ethernet_traffic_information(uint8_t *pos, ogs_pfcp_tlv_ethernet_traffic_information_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->mac_addresses_detected.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_MAC_ADDRESSES_DETECTED_TYPE, &v->mac_addresses_detected);
+    }
+    if (v->mac_addresses_removed.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_MAC_ADDRESSES_REMOVED_TYPE, &v->mac_addresses_removed);
+    }
+    pfcp_put_header(header, OGS_PFCP_ETHERNET_TRAFFIC_INFORMATION_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length__access_forwarding_action_information(ogs_pfcp_tlv__access_forwarding_action_information_t *v)
+{
+    int i, length = 0, r;
+
+    if (v->far_id.presence) {
+        length += 8;
+    }
+    if (v->weight.presence) {
+        r = pfcp_length_octet(&v->weight, &ogs_pfcp_tlv_desc_weight);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->priority.presence) {
+        r = pfcp_length_octet(&v->priority, &ogs_pfcp_tlv_desc_priority);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    for (i = 0; i < 8 && v->urr_id[i].presence; i++) {
+        length += 8;
+    }
+    if (v->rat_type.presence) {
+        r = pfcp_length_octet(&v->rat_type, &ogs_pfcp_tlv_desc_rat_type);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [3GPP Access Forwarding Action Information]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put__access_forwarding_action_information(uint8_t *pos, ogs_pfcp_tlv__access_forwarding_action_information_t *v)
+{
+    uint8_t *header = pos;
+    int i;
+
+    pos += 4;
+    if (v->far_id.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_FAR_ID_TYPE, &v->far_id);
+    }
+    if (v->weight.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_WEIGHT_TYPE, &v->weight);
+    }
+    if (v->priority.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_PRIORITY_TYPE, &v->priority);
+    }
+    for (i = 0; i < 8 && v->urr_id[i].presence; i++) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_URR_ID_TYPE, &v->urr_id[i]);
+    }
+    if (v->rat_type.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_RAT_TYPE_TYPE, &v->rat_type);
+    }
+    pfcp_put_header(header, OGS_PFCP__ACCESS_FORWARDING_ACTION_INFORMATION_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_non__access_forwarding_action_information(ogs_pfcp_tlv_non__access_forwarding_action_information_t *v)
+{
+    int i, length = 0, r;
+
+    if (v->far_id.presence) {
+        length += 8;
+    }
+    if (v->weight.presence) {
+        r = pfcp_length_octet(&v->weight, &ogs_pfcp_tlv_desc_weight);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->priority.presence) {
+        r = pfcp_length_octet(&v->priority, &ogs_pfcp_tlv_desc_priority);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    for (i = 0; i < 8 && v->urr_id[i].presence; i++) {
+        length += 8;
+    }
+    if (v->rat_type.presence) {
+        r = pfcp_length_octet(&v->rat_type, &ogs_pfcp_tlv_desc_rat_type);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Non-3GPP Access Forwarding Action Information]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_non__access_forwarding_action_information(uint8_t *pos, ogs_pfcp_tlv_non__access_forwarding_action_information_t *v)
+{
+    uint8_t *header = pos;
+    int i;
+
+    pos += 4;
+    if (v->far_id.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_FAR_ID_TYPE, &v->far_id);
+    }
+    if (v->weight.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_WEIGHT_TYPE, &v->weight);
+    }
+    if (v->priority.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_PRIORITY_TYPE, &v->priority);
+    }
+    for (i = 0; i < 8 && v->urr_id[i].presence; i++) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_URR_ID_TYPE, &v->urr_id[i]);
+    }
+    if (v->rat_type.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_RAT_TYPE_TYPE, &v->rat_type);
+    }
+    pfcp_put_header(header, OGS_PFCP_NON__ACCESS_FORWARDING_ACTION_INFORMATION_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_update__access_forwarding_action_information(ogs_pfcp_tlv_update__access_forwarding_action_information_t *v)
+{
+    int length = 0, r;
+
+    if (v->far_id.presence) {
+        length += 8;
+    }
+    if (v->weight.presence) {
+        r = pfcp_length_octet(&v->weight, &ogs_pfcp_tlv_desc_weight);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->priority.presence) {
+        r = pfcp_length_octet(&v->priority, &ogs_pfcp_tlv_desc_priority);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->urr_id.presence) {
+        length += 8;
+    }
+    if (v->rat_type.presence) {
+        r = pfcp_length_octet(&v->rat_type, &ogs_pfcp_tlv_desc_rat_type);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Update 3GPP Access Forwarding Action Information]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_update__access_forwarding_action_information(uint8_t *pos, ogs_pfcp_tlv_update__access_forwarding_action_information_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->far_id.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_FAR_ID_TYPE, &v->far_id);
+    }
+    if (v->weight.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_WEIGHT_TYPE, &v->weight);
+    }
+    if (v->priority.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_PRIORITY_TYPE, &v->priority);
+    }
+    if (v->urr_id.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_URR_ID_TYPE, &v->urr_id);
+    }
+    if (v->rat_type.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_RAT_TYPE_TYPE, &v->rat_type);
+    }
+    pfcp_put_header(header, OGS_PFCP_UPDATE__ACCESS_FORWARDING_ACTION_INFORMATION_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_update_non__access_forwarding_action_information(ogs_pfcp_tlv_update_non__access_forwarding_action_information_t *v)
+{
+    int length = 0, r;
+
+    if (v->far_id.presence) {
+        length += 8;
+    }
+    if (v->weight.presence) {
+        r = pfcp_length_octet(&v->weight, &ogs_pfcp_tlv_desc_weight);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->priority.presence) {
+        r = pfcp_length_octet(&v->priority, &ogs_pfcp_tlv_desc_priority);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->urr_id.presence) {
+        length += 8;
+    }
+    if (v->rat_type.presence) {
+        r = pfcp_length_octet(&v->rat_type, &ogs_pfcp_tlv_desc_rat_type);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Update Non-3GPP Access Forwarding Action Information]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_update_non__access_forwarding_action_information(uint8_t *pos, ogs_pfcp_tlv_update_non__access_forwarding_action_information_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->far_id.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_FAR_ID_TYPE, &v->far_id);
+    }
+    if (v->weight.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_WEIGHT_TYPE, &v->weight);
+    }
+    if (v->priority.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_PRIORITY_TYPE, &v->priority);
+    }
+    if (v->urr_id.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_URR_ID_TYPE, &v->urr_id);
+    }
+    if (v->rat_type.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_RAT_TYPE_TYPE, &v->rat_type);
+    }
+    pfcp_put_header(header, OGS_PFCP_UPDATE_NON__ACCESS_FORWARDING_ACTION_INFORMATION_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_access_availability_report(ogs_pfcp_tlv_access_availability_report_t *v)
+{
+    int length = 0, r;
+
+    if (v->access_availability_information.presence) {
+        r = pfcp_length_octet(&v->access_availability_information, &ogs_pfcp_tlv_desc_access_availability_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Access Availability Report]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_access_availability_report(uint8_t *pos, ogs_pfcp_tlv_access_availability_report_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->access_availability_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_ACCESS_AVAILABILITY_INFORMATION_TYPE, &v->access_availability_information);
+    }
+    pfcp_put_header(header, OGS_PFCP_ACCESS_AVAILABILITY_REPORT_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_qos_monitoring_report(ogs_pfcp_tlv_qos_monitoring_report_t *v)
+{
+    int length = 0, r;
+
+    if (v->qfi.presence) {
+        length += 5;
+    }
+    if (v->qos_monitoring_measurement.presence) {
+        r = pfcp_length_octet(&v->qos_monitoring_measurement, &ogs_pfcp_tlv_desc_qos_monitoring_measurement);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->time_stamp.presence) {
+        r = pfcp_length_octet(&v->time_stamp, &ogs_pfcp_tlv_desc_time_stamp);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->start_time.presence) {
+        length += 8;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [QoS Monitoring Report]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_qos_monitoring_report(uint8_t *pos, ogs_pfcp_tlv_qos_monitoring_report_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->qfi.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_QFI_TYPE, &v->qfi);
+    }
+    if (v->qos_monitoring_measurement.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_QOS_MONITORING_MEASUREMENT_TYPE, &v->qos_monitoring_measurement);
+    }
+    if (v->time_stamp.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_TIME_STAMP_TYPE, &v->time_stamp);
+    }
+    if (v->start_time.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_START_TIME_TYPE, &v->start_time);
+    }
+    pfcp_put_header(header, OGS_PFCP_QOS_MONITORING_REPORT_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_mptcp_parameters(ogs_pfcp_tlv_mptcp_parameters_t *v)
+{
+    int length = 0, r;
+
+    if (v->mptcp_address_information.presence) {
+        r = pfcp_length_octet(&v->mptcp_address_information, &ogs_pfcp_tlv_desc_mptcp_address_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->ue_link_specific_ip_address.presence) {
+        r = pfcp_length_octet(&v->ue_link_specific_ip_address, &ogs_pfcp_tlv_desc_ue_link_specific_ip_address);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [MPTCP Parameters]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_mptcp_parameters(uint8_t *pos, ogs_pfcp_tlv_mptcp_parameters_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->mptcp_address_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_MPTCP_ADDRESS_INFORMATION_TYPE, &v->mptcp_address_information);
+    }
+    if (v->ue_link_specific_ip_address.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_UE_LINK_SPECIFIC_IP_ADDRESS_TYPE, &v->ue_link_specific_ip_address);
+    }
+    pfcp_put_header(header, OGS_PFCP_MPTCP_PARAMETERS_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_atsss_ll_parameters(ogs_pfcp_tlv_atsss_ll_parameters_t *v)
+{
+    int length = 0, r;
+
+    if (v->atsss_ll_information.presence) {
+        r = pfcp_length_octet(&v->atsss_ll_information, &ogs_pfcp_tlv_desc_atsss_ll_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [ATSSS-LL Parameters]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_atsss_ll_parameters(uint8_t *pos, ogs_pfcp_tlv_atsss_ll_parameters_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->atsss_ll_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_ATSSS_LL_INFORMATION_TYPE, &v->atsss_ll_information);
+    }
+    pfcp_put_header(header, OGS_PFCP_ATSSS_LL_PARAMETERS_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_pmf_parameters(ogs_pfcp_tlv_pmf_parameters_t *v)
+{
+    int length = 0, r;
+
+    if (v->pmf_address_information.presence) {
+        r = pfcp_length_octet(&v->pmf_address_information, &ogs_pfcp_tlv_desc_pmf_address_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->qos_flow_identifier.presence) {
+        length += 5;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [PMF Parameters]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_pmf_parameters(uint8_t *pos, ogs_pfcp_tlv_pmf_parameters_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->pmf_address_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_PMF_ADDRESS_INFORMATION_TYPE, &v->pmf_address_information);
+    }
+    if (v->qos_flow_identifier.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_QFI_TYPE, &v->qos_flow_identifier);
+    }
+    pfcp_put_header(header, OGS_PFCP_PMF_PARAMETERS_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_join_ip_multicast_information_ie_within_usage_report(ogs_pfcp_tlv_join_ip_multicast_information_ie_within_usage_report_t *v)
+{
+    int length = 0, r;
+
+    if (v->ip_multicast_address.presence) {
+        r = pfcp_length_octet(&v->ip_multicast_address, &ogs_pfcp_tlv_desc_ip_multicast_address);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->source_ip_address.presence) {
+        r = pfcp_length_octet(&v->source_ip_address, &ogs_pfcp_tlv_desc_source_ip_address);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Join IP Multicast Information IE within Usage Report]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_join_ip_multicast_information_ie_within_usage_report(uint8_t *pos, ogs_pfcp_tlv_join_ip_multicast_information_ie_within_usage_report_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->ip_multicast_address.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_IP_MULTICAST_ADDRESS_TYPE, &v->ip_multicast_address);
+    }
+    if (v->source_ip_address.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_SOURCE_IP_ADDRESS_TYPE, &v->source_ip_address);
+    }
+    pfcp_put_header(header, OGS_PFCP_JOIN_IP_MULTICAST_INFORMATION_IE_WITHIN_USAGE_REPORT_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_leave_ip_multicast_information_ie_within_usage_report(ogs_pfcp_tlv_leave_ip_multicast_information_ie_within_usage_report_t *v)
+{
+    int length = 0, r;
+
+    if (v->ip_multicast_address.presence) {
+        r = pfcp_length_octet(&v->ip_multicast_address, &ogs_pfcp_tlv_desc_ip_multicast_address);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->source_ip_address.presence) {
+        r = pfcp_length_octet(&v->source_ip_address, &ogs_pfcp_tlv_desc_source_ip_address);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Leave IP Multicast Information IE within Usage Report]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_leave_ip_multicast_information_ie_within_usage_report(uint8_t *pos, ogs_pfcp_tlv_leave_ip_multicast_information_ie_within_usage_report_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->ip_multicast_address.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_IP_MULTICAST_ADDRESS_TYPE, &v->ip_multicast_address);
+    }
+    if (v->source_ip_address.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_SOURCE_IP_ADDRESS_TYPE, &v->source_ip_address);
+    }
+    pfcp_put_header(header, OGS_PFCP_LEAVE_IP_MULTICAST_INFORMATION_IE_WITHIN_USAGE_REPORT_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_create_urr(ogs_pfcp_tlv_create_urr_t *v)
+{
+    int i, length = 0, r;
+
+    if (v->urr_id.presence) {
+        length += 8;
+    }
+    if (v->measurement_method.presence) {
+        length += 5;
+    }
+    if (v->reporting_triggers.presence) {
+        length += 7;
+    }
+    if (v->measurement_period.presence) {
+        length += 8;
+    }
+    if (v->volume_threshold.presence) {
+        r = pfcp_length_octet(&v->volume_threshold, &ogs_pfcp_tlv_desc_volume_threshold);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->volume_quota.presence) {
+        r = pfcp_length_octet(&v->volume_quota, &ogs_pfcp_tlv_desc_volume_quota);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->event_threshold.presence) {
+        length += 8;
+    }
+    if (v->event_quota.presence) {
+        length += 8;
+    }
+    if (v->time_threshold.presence) {
+        length += 8;
+    }
+    if (v->time_quota.presence) {
+        length += 8;
+    }
+    if (v->quota_holding_time.presence) {
+        length += 8;
+    }
+    if (v->dropped_dl_traffic_threshold.presence) {
+        r = pfcp_length_octet(&v->dropped_dl_traffic_threshold, &ogs_pfcp_tlv_desc_dropped_dl_traffic_threshold);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->quota_validity_time.presence) {
+        length += 8;
+    }
+    if (v->monitoring_time.presence) {
+        r = pfcp_length_octet(&v->monitoring_time, &ogs_pfcp_tlv_desc_monitoring_time);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->subsequent_volume_threshold.presence) {
+        r = pfcp_length_octet(&v->subsequent_volume_threshold, &ogs_pfcp_tlv_desc_subsequent_volume_threshold);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->subsequent_time_threshold.presence) {
+        r = pfcp_length_octet(&v->subsequent_time_threshold, &ogs_pfcp_tlv_desc_subsequent_time_threshold);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->subsequent_volume_quota.presence) {
+        r = pfcp_length_octet(&v->subsequent_volume_quota, &ogs_pfcp_tlv_desc_subsequent_volume_quota);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->subsequent_time_quota.presence) {
+        r = pfcp_length_octet(&v->subsequent_time_quota, &ogs_pfcp_tlv_desc_subsequent_time_quota);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->subsequent_event_threshold.presence) {
+        r = pfcp_length_octet(&v->subsequent_event_threshold, &ogs_pfcp_tlv_desc_subsequent_event_threshold);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->subsequent_event_quota.presence) {
+        r = pfcp_length_octet(&v->subsequent_event_quota, &ogs_pfcp_tlv_desc_subsequent_event_quota);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->inactivity_detection_time.presence) {
+        r = pfcp_length_octet(&v->inactivity_detection_time, &ogs_pfcp_tlv_desc_inactivity_detection_time);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->linked_urr_id.presence) {
+        r = pfcp_length_octet(&v->linked_urr_id, &ogs_pfcp_tlv_desc_linked_urr_id);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->measurement_information.presence) {
+        r = pfcp_length_octet(&v->measurement_information, &ogs_pfcp_tlv_desc_measurement_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->time_quota_mechanism.presence) {
+        r = pfcp_length_octet(&v->time_quota_mechanism, &ogs_pfcp_tlv_desc_time_quota_mechanism);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->aggregated_urrs.presence) {
+        r = pfcp_length_octet(&v->aggregated_urrs, &ogs_pfcp_tlv_desc_aggregated_urrs);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->far_id_for_quota_action.presence) {
+        length += 8;
+    }
+    if (v->ethernet_inactivity_timer.presence) {
+        r = pfcp_length_octet(&v->ethernet_inactivity_timer, &ogs_pfcp_tlv_desc_ethernet_inactivity_timer);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->additional_monitoring_time.presence) {
+        r = pfcp_length_octet(&v->additional_monitoring_time, &ogs_pfcp_tlv_desc_additional_monitoring_time);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->number_of_reports.presence) {
+        r = pfcp_length_octet(&v->number_of_reports, &ogs_pfcp_tlv_desc_number_of_reports);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->exempted_application_id_for_quota_action.presence) {
+        r = pfcp_length_octet(&v->exempted_application_id_for_quota_action, &ogs_pfcp_tlv_desc_application_id);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    for (i = 0; i < 8 && v->exempted_sdf_filter_for_quota_action[i].presence; i++) {
+        r = pfcp_length_octet(&v->exempted_sdf_filter_for_quota_action[i], &ogs_pfcp_tlv_desc_sdf_filter);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->user_plane_inactivity_timer.presence) {
+        r = pfcp_length_octet(&v->user_plane_inactivity_timer, &ogs_pfcp_tlv_desc_user_plane_inactivity_timer);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Create URR]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_create_urr(uint8_t *pos, ogs_pfcp_tlv_create_urr_t *v)
+{
+    uint8_t *header = pos;
+    int i;
+
+    pos += 4;
+    if (v->urr_id.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_URR_ID_TYPE, &v->urr_id);
+    }
+    if (v->measurement_method.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_MEASUREMENT_METHOD_TYPE, &v->measurement_method);
+    }
+    if (v->reporting_triggers.presence) {
+        pos = pfcp_put_uint24(pos, OGS_PFCP_REPORTING_TRIGGERS_TYPE, &v->reporting_triggers);
+    }
+    if (v->measurement_period.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_MEASUREMENT_PERIOD_TYPE, &v->measurement_period);
+    }
+    if (v->volume_threshold.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_VOLUME_THRESHOLD_TYPE, &v->volume_threshold);
+    }
+    if (v->volume_quota.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_VOLUME_QUOTA_TYPE, &v->volume_quota);
+    }
+    if (v->event_threshold.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_EVENT_THRESHOLD_TYPE, &v->event_threshold);
+    }
+    if (v->event_quota.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_EVENT_QUOTA_TYPE, &v->event_quota);
+    }
+    if (v->time_threshold.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_TIME_THRESHOLD_TYPE, &v->time_threshold);
+    }
+    if (v->time_quota.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_TIME_QUOTA_TYPE, &v->time_quota);
+    }
+    if (v->quota_holding_time.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_QUOTA_HOLDING_TIME_TYPE, &v->quota_holding_time);
+    }
+    if (v->dropped_dl_traffic_threshold.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_DROPPED_DL_TRAFFIC_THRESHOLD_TYPE, &v->dropped_dl_traffic_threshold);
+    }
+    if (v->quota_validity_time.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_QUOTA_VALIDITY_TIME_TYPE, &v->quota_validity_time);
+    }
+    if (v->monitoring_time.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_MONITORING_TIME_TYPE, &v->monitoring_time);
+    }
+    if (v->subsequent_volume_threshold.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_SUBSEQUENT_VOLUME_THRESHOLD_TYPE, &v->subsequent_volume_threshold);
+    }
+    if (v->subsequent_time_threshold.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_SUBSEQUENT_TIME_THRESHOLD_TYPE, &v->subsequent_time_threshold);
+    }
+    if (v->subsequent_volume_quota.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_SUBSEQUENT_VOLUME_QUOTA_TYPE, &v->subsequent_volume_quota);
+    }
+    if (v->subsequent_time_quota.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_SUBSEQUENT_TIME_QUOTA_TYPE, &v->subsequent_time_quota);
+    }
+    if (v->subsequent_event_threshold.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_SUBSEQUENT_EVENT_THRESHOLD_TYPE, &v->subsequent_event_threshold);
+    }
+    if (v->subsequent_event_quota.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_SUBSEQUENT_EVENT_QUOTA_TYPE, &v->subsequent_event_quota);
+    }
+    if (v->inactivity_detection_time.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_INACTIVITY_DETECTION_TIME_TYPE, &v->inactivity_detection_time);
+    }
+    if (v->linked_urr_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_LINKED_URR_ID_TYPE, &v->linked_urr_id);
+    }
+    if (v->measurement_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_MEASUREMENT_INFORMATION_TYPE, &v->measurement_information);
+    }
+    if (v->time_quota_mechanism.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_TIME_QUOTA_MECHANISM_TYPE, &v->time_quota_mechanism);
+    }
+    if (v->aggregated_urrs.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_AGGREGATED_URRS_TYPE, &v->aggregated_urrs);
+    }
+    if (v->far_id_for_quota_action.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_FAR_ID_TYPE, &v->far_id_for_quota_action);
+    }
+    if (v->ethernet_inactivity_timer.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_ETHERNET_INACTIVITY_TIMER_TYPE, &v->ethernet_inactivity_timer);
+    }
+    if (v->additional_monitoring_time.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_ADDITIONAL_MONITORING_TIME_TYPE, &v->additional_monitoring_time);
+    }
+    if (v->number_of_reports.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_NUMBER_OF_REPORTS_TYPE, &v->number_of_reports);
+    }
+    if (v->exempted_application_id_for_quota_action.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_APPLICATION_ID_TYPE, &v->exempted_application_id_for_quota_action);
+    }
+    for (i = 0; i < 8 && v->exempted_sdf_filter_for_quota_action[i].presence; i++) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_SDF_FILTER_TYPE, &v->exempted_sdf_filter_for_quota_action[i]);
+    }
+    if (v->user_plane_inactivity_timer.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_USER_PLANE_INACTIVITY_TIMER_TYPE, &v->user_plane_inactivity_timer);
+    }
+    pfcp_put_header(header, OGS_PFCP_CREATE_URR_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_create_qer(ogs_pfcp_tlv_create_qer_t *v)
+{
+    int length = 0, r;
+
+    if (v->qer_id.presence) {
+        length += 8;
+    }
+    if (v->qer_correlation_id.presence) {
+        length += 8;
+    }
+    if (v->gate_status.presence) {
+        length += 5;
+    }
+    if (v->maximum_bitrate.presence) {
+        r = pfcp_length_octet(&v->maximum_bitrate, &ogs_pfcp_tlv_desc_mbr);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->guaranteed_bitrate.presence) {
+        r = pfcp_length_octet(&v->guaranteed_bitrate, &ogs_pfcp_tlv_desc_gbr);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->packet_rate.presence) {
+        r = pfcp_length_octet(&v->packet_rate, &ogs_pfcp_tlv_desc_packet_rate);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->packet_rate_status.presence) {
+        r = pfcp_length_octet(&v->packet_rate_status, &ogs_pfcp_tlv_desc_packet_rate_status);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->dl_flow_level_marking.presence) {
+        r = pfcp_length_octet(&v->dl_flow_level_marking, &ogs_pfcp_tlv_desc_dl_flow_level_marking);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->qos_flow_identifier.presence) {
+        length += 5;
+    }
+    if (v->reflective_qos.presence) {
+        length += 5;
+    }
+    if (v->paging_policy_indicator.presence) {
+        length += 5;
+    }
+    if (v->averaging_window.presence) {
+        length += 8;
+    }
+    if (v->qer_control_indications.presence) {
+        r = pfcp_length_octet(&v->qer_control_indications, &ogs_pfcp_tlv_desc_qer_control_indications);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->qer_indications.presence) {
+        r = pfcp_length_octet(&v->qer_indications, &ogs_pfcp_tlv_desc_qer_indications);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Create QER]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_create_qer(uint8_t *pos, ogs_pfcp_tlv_create_qer_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->qer_id.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_QER_ID_TYPE, &v->qer_id);
+    }
+    if (v->qer_correlation_id.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_QER_CORRELATION_ID_TYPE, &v->qer_correlation_id);
+    }
+    if (v->gate_status.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_GATE_STATUS_TYPE, &v->gate_status);
+    }
+    if (v->maximum_bitrate.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_MBR_TYPE, &v->maximum_bitrate);
+    }
+    if (v->guaranteed_bitrate.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_GBR_TYPE, &v->guaranteed_bitrate);
+    }
+    if (v->packet_rate.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_PACKET_RATE_TYPE, &v->packet_rate);
+    }
+    if (v->packet_rate_status.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_PACKET_RATE_STATUS_TYPE, &v->packet_rate_status);
+    }
+    if (v->dl_flow_level_marking.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_DL_FLOW_LEVEL_MARKING_TYPE, &v->dl_flow_level_marking);
+    }
+    if (v->qos_flow_identifier.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_QFI_TYPE, &v->qos_flow_identifier);
+    }
+    if (v->reflective_qos.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_RQI_TYPE, &v->reflective_qos);
+    }
+    if (v->paging_policy_indicator.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_PAGING_POLICY_INDICATOR_TYPE, &v->paging_policy_indicator);
+    }
+    if (v->averaging_window.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_AVERAGING_WINDOW_TYPE, &v->averaging_window);
+    }
+    if (v->qer_control_indications.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_QER_CONTROL_INDICATIONS_TYPE, &v->qer_control_indications);
+    }
+    if (v->qer_indications.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_QER_INDICATIONS_TYPE, &v->qer_indications);
+    }
+    pfcp_put_header(header, OGS_PFCP_CREATE_QER_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_created_pdr(ogs_pfcp_tlv_created_pdr_t *v)
+{
+    int length = 0, r;
+
+    if (v->pdr_id.presence) {
+        length += 6;
+    }
+    if (v->local_f_teid.presence) {
+        r = pfcp_length_octet(&v->local_f_teid, &ogs_pfcp_tlv_desc_f_teid);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->local_f_teid_for_redundant_transmission.presence) {
+        r = pfcp_length_octet(&v->local_f_teid_for_redundant_transmission, &ogs_pfcp_tlv_desc_f_teid);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->ue_ip_address.presence) {
+        r = pfcp_length_octet(&v->ue_ip_address, &ogs_pfcp_tlv_desc_ue_ip_address);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->local_ingress_tunnel.presence) {
+        r = pfcp_length_octet(&v->local_ingress_tunnel, &ogs_pfcp_tlv_desc_local_ingress_tunnel);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Created PDR]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_created_pdr(uint8_t *pos, ogs_pfcp_tlv_created_pdr_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->pdr_id.presence) {
+        pos = pfcp_put_uint16(pos, OGS_PFCP_PDR_ID_TYPE, &v->pdr_id);
+    }
+    if (v->local_f_teid.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_F_TEID_TYPE, &v->local_f_teid);
+    }
+    if (v->local_f_teid_for_redundant_transmission.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_F_TEID_TYPE, &v->local_f_teid_for_redundant_transmission);
+    }
+    if (v->ue_ip_address.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_UE_IP_ADDRESS_TYPE, &v->ue_ip_address);
+    }
+    if (v->local_ingress_tunnel.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_LOCAL_INGRESS_TUNNEL_TYPE, &v->local_ingress_tunnel);
+    }
+    pfcp_put_header(header, OGS_PFCP_CREATED_PDR_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_update_pdr(ogs_pfcp_tlv_update_pdr_t *v)
+{
+    int length = 0, r;
+
+    if (v->pdr_id.presence) {
+        length += 6;
+    }
+    if (v->outer_header_removal.presence) {
+        r = pfcp_length_octet(&v->outer_header_removal, &ogs_pfcp_tlv_desc_outer_header_removal);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->precedence.presence) {
+        length += 8;
+    }
+    if (v->pdi.presence) {
+        r = pfcp_length_pdi(&v->pdi);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->far_id.presence) {
+        length += 8;
+    }
+    if (v->urr_id.presence) {
+        length += 8;
+    }
+    if (v->qer_id.presence) {
+        length += 8;
+    }
+    if (v->activate_predefined_rules.presence) {
+        r = pfcp_length_octet(&v->activate_predefined_rules, &ogs_pfcp_tlv_desc_activate_predefined_rules);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->deactivate_predefined_rules.presence) {
+        r = pfcp_length_octet(&v->deactivate_predefined_rules, &ogs_pfcp_tlv_desc_deactivate_predefined_rules);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->activation_time.presence) {
+        r = pfcp_length_octet(&v->activation_time, &ogs_pfcp_tlv_desc_activation_time);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->deactivation_time.presence) {
+        r = pfcp_length_octet(&v->deactivation_time, &ogs_pfcp_tlv_desc_deactivation_time);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->ip_multicast_addressing_info.presence) {
+        r = pfcp_length_ip_multicast_addressing_info_within_pfcp_session_establishment_request(&v->ip_multicast_addressing_info);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->transport_delay_reporting.presence) {
+        r = pfcp_length_transport_delay_reporting(&v->transport_delay_reporting);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->rat_type.presence) {
+        r = pfcp_length_octet(&v->rat_type, &ogs_pfcp_tlv_desc_rat_type);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Update PDR]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_update_pdr(uint8_t *pos, ogs_pfcp_tlv_update_pdr_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->pdr_id.presence) {
+        pos = pfcp_put_uint16(pos, OGS_PFCP_PDR_ID_TYPE, &v->pdr_id);
+    }
+    if (v->outer_header_removal.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_OUTER_HEADER_REMOVAL_TYPE, &v->outer_header_removal);
+    }
+    if (v->precedence.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_PRECEDENCE_TYPE, &v->precedence);
+    }
+    if (v->pdi.presence) {
+        pos = pfcp_put_pdi(pos, &v->pdi);
+    }
+    if (v->far_id.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_FAR_ID_TYPE, &v->far_id);
+    }
+    if (v->urr_id.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_URR_ID_TYPE, &v->urr_id);
+    }
+    if (v->qer_id.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_QER_ID_TYPE, &v->qer_id);
+    }
+    if (v->activate_predefined_rules.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_ACTIVATE_PREDEFINED_RULES_TYPE, &v->activate_predefined_rules);
+    }
+    if (v->deactivate_predefined_rules.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_DEACTIVATE_PREDEFINED_RULES_TYPE, &v->deactivate_predefined_rules);
+    }
+    if (v->activation_time.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_ACTIVATION_TIME_TYPE, &v->activation_time);
+    }
+    if (v->deactivation_time.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_DEACTIVATION_TIME_TYPE, &v->deactivation_time);
+    }
+    if (v->ip_multicast_addressing_info.presence) {
+        pos = pfcp_put_ip_multicast_addressing_info_within_pfcp_session_establishment_request(pos, &v->ip_multicast_addressing_info);
+    }
+    if (v->transport_delay_reporting.presence) {
+        pos = pfcp_put_transport_delay_reporting(pos, &v->transport_delay_reporting);
+    }
+    if (v->rat_type.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_RAT_TYPE_TYPE, &v->rat_type);
+    }
+    pfcp_put_header(header, OGS_PFCP_UPDATE_PDR_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_update_bar_pfcp_session_report_response(ogs_pfcp_tlv_update_bar_pfcp_session_report_response_t *v)
+{
+    int length = 0, r;
+
+    if (v->bar_id.presence) {
+        length += 5;
+    }
+    if (v->downlink_data_notification_delay.presence) {
+        r = pfcp_length_octet(&v->downlink_data_notification_delay, &ogs_pfcp_tlv_desc_downlink_data_notification_delay);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->dl_buffering_duration.presence) {
+        r = pfcp_length_octet(&v->dl_buffering_duration, &ogs_pfcp_tlv_desc_dl_buffering_duration);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->dl_buffering_suggested_packet_count.presence) {
+        r = pfcp_length_octet(&v->dl_buffering_suggested_packet_count, &ogs_pfcp_tlv_desc_dl_buffering_suggested_packet_count);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->suggested_buffering_packets_count.presence) {
+        r = pfcp_length_octet(&v->suggested_buffering_packets_count, &ogs_pfcp_tlv_desc_suggested_buffering_packets_count);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Update BAR PFCP Session Report Response]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_update_bar_pfcp_session_report_response(uint8_t *pos, ogs_pfcp_tlv_update_bar_pfcp_session_report_response_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->bar_id.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_BAR_ID_TYPE, &v->bar_id);
+    }
+    if (v->downlink_data_notification_delay.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_DOWNLINK_DATA_NOTIFICATION_DELAY_TYPE, &v->downlink_data_notification_delay);
+    }
+    if (v->dl_buffering_duration.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_DL_BUFFERING_DURATION_TYPE, &v->dl_buffering_duration);
+    }
+    if (v->dl_buffering_suggested_packet_count.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_DL_BUFFERING_SUGGESTED_PACKET_COUNT_TYPE, &v->dl_buffering_suggested_packet_count);
+    }
+    if (v->suggested_buffering_packets_count.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_SUGGESTED_BUFFERING_PACKETS_COUNT_TYPE, &v->suggested_buffering_packets_count);
+    }
+    pfcp_put_header(header, OGS_PFCP_UPDATE_BAR_PFCP_SESSION_REPORT_RESPONSE_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_update_urr(ogs_pfcp_tlv_update_urr_t *v)
+{
+    int i, length = 0, r;
+
+    if (v->urr_id.presence) {
+        length += 8;
+    }
+    if (v->measurement_method.presence) {
+        length += 5;
+    }
+    if (v->reporting_triggers.presence) {
+        length += 7;
+    }
+    if (v->measurement_period.presence) {
+        length += 8;
+    }
+    if (v->volume_threshold.presence) {
+        r = pfcp_length_octet(&v->volume_threshold, &ogs_pfcp_tlv_desc_volume_threshold);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->volume_quota.presence) {
+        r = pfcp_length_octet(&v->volume_quota, &ogs_pfcp_tlv_desc_volume_quota);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->time_threshold.presence) {
+        length += 8;
+    }
+    if (v->time_quota.presence) {
+        length += 8;
+    }
+    if (v->event_threshold.presence) {
+        length += 8;
+    }
+    if (v->event_quota.presence) {
+        length += 8;
+    }
+    if (v->quota_holding_time.presence) {
+        length += 8;
+    }
+    if (v->dropped_dl_traffic_threshold.presence) {
+        r = pfcp_length_octet(&v->dropped_dl_traffic_threshold, &ogs_pfcp_tlv_desc_dropped_dl_traffic_threshold);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->quota_validity_time.presence) {
+        length += 8;
+    }
+    if (v->monitoring_time.presence) {
+        r = pfcp_length_octet(&v->monitoring_time, &ogs_pfcp_tlv_desc_monitoring_time);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->subsequent_volume_threshold.presence) {
+        r = pfcp_length_octet(&v->subsequent_volume_threshold, &ogs_pfcp_tlv_desc_subsequent_volume_threshold);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->subsequent_time_threshold.presence) {
+        r = pfcp_length_octet(&v->subsequent_time_threshold, &ogs_pfcp_tlv_desc_subsequent_time_threshold);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->subsequent_volume_quota.presence) {
+        r = pfcp_length_octet(&v->subsequent_volume_quota, &ogs_pfcp_tlv_desc_subsequent_volume_quota);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->subsequent_time_quota.presence) {
+        r = pfcp_length_octet(&v->subsequent_time_quota, &ogs_pfcp_tlv_desc_subsequent_time_quota);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->subsequent_event_threshold.presence) {
+        r = pfcp_length_octet(&v->subsequent_event_threshold, &ogs_pfcp_tlv_desc_subsequent_event_threshold);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->subsequent_event_quota.presence) {
+        r = pfcp_length_octet(&v->subsequent_event_quota, &ogs_pfcp_tlv_desc_subsequent_event_quota);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->inactivity_detection_time.presence) {
+        r = pfcp_length_octet(&v->inactivity_detection_time, &ogs_pfcp_tlv_desc_inactivity_detection_time);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->linked_urr_id.presence) {
+        r = pfcp_length_octet(&v->linked_urr_id, &ogs_pfcp_tlv_desc_linked_urr_id);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->measurement_information.presence) {
+        r = pfcp_length_octet(&v->measurement_information, &ogs_pfcp_tlv_desc_measurement_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->time_quota_mechanism.presence) {
+        r = pfcp_length_octet(&v->time_quota_mechanism, &ogs_pfcp_tlv_desc_time_quota_mechanism);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->aggregated_urrs.presence) {
+        r = pfcp_length_octet(&v->aggregated_urrs, &ogs_pfcp_tlv_desc_aggregated_urrs);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->far_id_for_quota_action.presence) {
+        length += 8;
+    }
+    if (v->ethernet_inactivity_timer.presence) {
+        r = pfcp_length_octet(&v->ethernet_inactivity_timer, &ogs_pfcp_tlv_desc_ethernet_inactivity_timer);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->additional_monitoring_time.presence) {
+        r = pfcp_length_octet(&v->additional_monitoring_time, &ogs_pfcp_tlv_desc_additional_monitoring_time);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->number_of_reports.presence) {
+        r = pfcp_length_octet(&v->number_of_reports, &ogs_pfcp_tlv_desc_number_of_reports);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->exempted_application_id_for_quota_action.presence) {
+        r = pfcp_length_octet(&v->exempted_application_id_for_quota_action, &ogs_pfcp_tlv_desc_application_id);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    for (i = 0; i < 8 && v->exempted_sdf_filter_for_quota_action[i].presence; i++) {
+        r = pfcp_length_octet(&v->exempted_sdf_filter_for_quota_action[i], &ogs_pfcp_tlv_desc_sdf_filter);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->user_plane_inactivity_timer.presence) {
+        r = pfcp_length_octet(&v->user_plane_inactivity_timer, &ogs_pfcp_tlv_desc_user_plane_inactivity_timer);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Update URR]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_update_urr(uint8_t *pos, ogs_pfcp_tlv_update_urr_t *v)
+{
+    uint8_t *header = pos;
+    int i;
+
+    pos += 4;
+    if (v->urr_id.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_URR_ID_TYPE, &v->urr_id);
+    }
+    if (v->measurement_method.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_MEASUREMENT_METHOD_TYPE, &v->measurement_method);
+    }
+    if (v->reporting_triggers.presence) {
+        pos = pfcp_put_uint24(pos, OGS_PFCP_REPORTING_TRIGGERS_TYPE, &v->reporting_triggers);
+    }
+    if (v->measurement_period.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_MEASUREMENT_PERIOD_TYPE, &v->measurement_period);
+    }
+    if (v->volume_threshold.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_VOLUME_THRESHOLD_TYPE, &v->volume_threshold);
+    }
+    if (v->volume_quota.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_VOLUME_QUOTA_TYPE, &v->volume_quota);
+    }
+    if (v->time_threshold.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_TIME_THRESHOLD_TYPE, &v->time_threshold);
+    }
+    if (v->time_quota.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_TIME_QUOTA_TYPE, &v->time_quota);
+    }
+    if (v->event_threshold.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_EVENT_THRESHOLD_TYPE, &v->event_threshold);
+    }
+    if (v->event_quota.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_EVENT_QUOTA_TYPE, &v->event_quota);
+    }
+    if (v->quota_holding_time.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_QUOTA_HOLDING_TIME_TYPE, &v->quota_holding_time);
+    }
+    if (v->dropped_dl_traffic_threshold.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_DROPPED_DL_TRAFFIC_THRESHOLD_TYPE, &v->dropped_dl_traffic_threshold);
+    }
+    if (v->quota_validity_time.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_QUOTA_VALIDITY_TIME_TYPE, &v->quota_validity_time);
+    }
+    if (v->monitoring_time.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_MONITORING_TIME_TYPE, &v->monitoring_time);
+    }
+    if (v->subsequent_volume_threshold.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_SUBSEQUENT_VOLUME_THRESHOLD_TYPE, &v->subsequent_volume_threshold);
+    }
+    if (v->subsequent_time_threshold.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_SUBSEQUENT_TIME_THRESHOLD_TYPE, &v->subsequent_time_threshold);
+    }
+    if (v->subsequent_volume_quota.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_SUBSEQUENT_VOLUME_QUOTA_TYPE, &v->subsequent_volume_quota);
+    }
+    if (v->subsequent_time_quota.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_SUBSEQUENT_TIME_QUOTA_TYPE, &v->subsequent_time_quota);
+    }
+    if (v->subsequent_event_threshold.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_SUBSEQUENT_EVENT_THRESHOLD_TYPE, &v->subsequent_event_threshold);
+    }
+    if (v->subsequent_event_quota.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_SUBSEQUENT_EVENT_QUOTA_TYPE, &v->subsequent_event_quota);
+    }
+    if (v->inactivity_detection_time.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_INACTIVITY_DETECTION_TIME_TYPE, &v->inactivity_detection_time);
+    }
+    if (v->linked_urr_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_LINKED_URR_ID_TYPE, &v->linked_urr_id);
+    }
+    if (v->measurement_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_MEASUREMENT_INFORMATION_TYPE, &v->measurement_information);
+    }
+    if (v->time_quota_mechanism.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_TIME_QUOTA_MECHANISM_TYPE, &v->time_quota_mechanism);
+    }
+    if (v->aggregated_urrs.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_AGGREGATED_URRS_TYPE, &v->aggregated_urrs);
+    }
+    if (v->far_id_for_quota_action.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_FAR_ID_TYPE, &v->far_id_for_quota_action);
+    }
+    if (v->ethernet_inactivity_timer.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_ETHERNET_INACTIVITY_TIMER_TYPE, &v->ethernet_inactivity_timer);
+    }
+    if (v->additional_monitoring_time.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_ADDITIONAL_MONITORING_TIME_TYPE, &v->additional_monitoring_time);
+    }
+    if (v->number_of_reports.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_NUMBER_OF_REPORTS_TYPE, &v->number_of_reports);
+    }
+    if (v->exempted_application_id_for_quota_action.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_APPLICATION_ID_TYPE, &v->exempted_application_id_for_quota_action);
+    }
+    for (i = 0; i < 8 && v->exempted_sdf_filter_for_quota_action[i].presence; i++) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_SDF_FILTER_TYPE, &v->exempted_sdf_filter_for_quota_action[i]);
+    }
+    if (v->user_plane_inactivity_timer.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_USER_PLANE_INACTIVITY_TIMER_TYPE, &v->user_plane_inactivity_timer);
+    }
+    pfcp_put_header(header, OGS_PFCP_UPDATE_URR_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_update_qer(ogs_pfcp_tlv_update_qer_t *v)
+{
+    int length = 0, r;
+
+    if (v->qer_id.presence) {
+        length += 8;
+    }
+    if (v->qer_correlation_id.presence) {
+        length += 8;
+    }
+    if (v->gate_status.presence) {
+        length += 5;
+    }
+    if (v->maximum_bitrate.presence) {
+        r = pfcp_length_octet(&v->maximum_bitrate, &ogs_pfcp_tlv_desc_mbr);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->guaranteed_bitrate.presence) {
+        r = pfcp_length_octet(&v->guaranteed_bitrate, &ogs_pfcp_tlv_desc_gbr);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->packet_rate.presence) {
+        r = pfcp_length_octet(&v->packet_rate, &ogs_pfcp_tlv_desc_packet_rate);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->dl_flow_level_marking.presence) {
+        r = pfcp_length_octet(&v->dl_flow_level_marking, &ogs_pfcp_tlv_desc_dl_flow_level_marking);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->qos_flow_identifier.presence) {
+        length += 5;
+    }
+    if (v->reflective_qos.presence) {
+        length += 5;
+    }
+    if (v->paging_policy_indicator.presence) {
+        length += 5;
+    }
+    if (v->averaging_window.presence) {
+        length += 8;
+    }
+    if (v->qer_control_indications.presence) {
+        r = pfcp_length_octet(&v->qer_control_indications, &ogs_pfcp_tlv_desc_qer_control_indications);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Update QER]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_update_qer(uint8_t *pos, ogs_pfcp_tlv_update_qer_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->qer_id.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_QER_ID_TYPE, &v->qer_id);
+    }
+    if (v->qer_correlation_id.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_QER_CORRELATION_ID_TYPE, &v->qer_correlation_id);
+    }
+    if (v->gate_status.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_GATE_STATUS_TYPE, &v->gate_status);
+    }
+    if (v->maximum_bitrate.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_MBR_TYPE, &v->maximum_bitrate);
+    }
+    if (v->guaranteed_bitrate.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_GBR_TYPE, &v->guaranteed_bitrate);
+    }
+    if (v->packet_rate.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_PACKET_RATE_TYPE, &v->packet_rate);
+    }
+    if (v->dl_flow_level_marking.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_DL_FLOW_LEVEL_MARKING_TYPE, &v->dl_flow_level_marking);
+    }
+    if (v->qos_flow_identifier.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_QFI_TYPE, &v->qos_flow_identifier);
+    }
+    if (v->reflective_qos.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_RQI_TYPE, &v->reflective_qos);
+    }
+    if (v->paging_policy_indicator.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_PAGING_POLICY_INDICATOR_TYPE, &v->paging_policy_indicator);
+    }
+    if (v->averaging_window.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_AVERAGING_WINDOW_TYPE, &v->averaging_window);
+    }
+    if (v->qer_control_indications.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_QER_CONTROL_INDICATIONS_TYPE, &v->qer_control_indications);
+    }
+    pfcp_put_header(header, OGS_PFCP_UPDATE_QER_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_remove_pdr(ogs_pfcp_tlv_remove_pdr_t *v)
+{
+    int length = 0;
+
+    if (v->pdr_id.presence) {
+        length += 6;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Remove PDR]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_remove_pdr(uint8_t *pos, ogs_pfcp_tlv_remove_pdr_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->pdr_id.presence) {
+        pos = pfcp_put_uint16(pos, OGS_PFCP_PDR_ID_TYPE, &v->pdr_id);
+    }
+    pfcp_put_header(header, OGS_PFCP_REMOVE_PDR_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_remove_far(ogs_pfcp_tlv_remove_far_t *v)
+{
+    int length = 0;
+
+    if (v->far_id.presence) {
+        length += 8;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Remove FAR]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_remove_far(uint8_t *pos, ogs_pfcp_tlv_remove_far_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->far_id.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_FAR_ID_TYPE, &v->far_id);
+    }
+    pfcp_put_header(header, OGS_PFCP_REMOVE_FAR_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_remove_urr(ogs_pfcp_tlv_remove_urr_t *v)
+{
+    int length = 0;
+
+    if (v->urr_id.presence) {
+        length += 8;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Remove URR]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_remove_urr(uint8_t *pos, ogs_pfcp_tlv_remove_urr_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->urr_id.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_URR_ID_TYPE, &v->urr_id);
+    }
+    pfcp_put_header(header, OGS_PFCP_REMOVE_URR_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_remove_qer(ogs_pfcp_tlv_remove_qer_t *v)
+{
+    int length = 0;
+
+    if (v->qer_id.presence) {
+        length += 8;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Remove QER]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_remove_qer(uint8_t *pos, ogs_pfcp_tlv_remove_qer_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->qer_id.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_QER_ID_TYPE, &v->qer_id);
+    }
+    pfcp_put_header(header, OGS_PFCP_REMOVE_QER_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_load_control_information(ogs_pfcp_tlv_load_control_information_t *v)
+{
+    int length = 0, r;
+
+    if (v->load_control_sequence_number.presence) {
+        r = pfcp_length_octet(&v->load_control_sequence_number, &ogs_pfcp_tlv_desc_sequence_number);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->load_metric.presence) {
+        r = pfcp_length_octet(&v->load_metric, &ogs_pfcp_tlv_desc_metric);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Load Control Information]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_load_control_information(uint8_t *pos, ogs_pfcp_tlv_load_control_information_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->load_control_sequence_number.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_SEQUENCE_NUMBER_TYPE, &v->load_control_sequence_number);
+    }
+    if (v->load_metric.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_METRIC_TYPE, &v->load_metric);
+    }
+    pfcp_put_header(header, OGS_PFCP_LOAD_CONTROL_INFORMATION_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_overload_control_information(ogs_pfcp_tlv_overload_control_information_t *v)
+{
+    int length = 0, r;
+
+    if (v->overload_control_sequence_number.presence) {
+        r = pfcp_length_octet(&v->overload_control_sequence_number, &ogs_pfcp_tlv_desc_sequence_number);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->overload_reduction_metric.presence) {
+        r = pfcp_length_octet(&v->overload_reduction_metric, &ogs_pfcp_tlv_desc_metric);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->period_of_validity.presence) {
+        r = pfcp_length_octet(&v->period_of_validity, &ogs_pfcp_tlv_desc_timer);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->overload_control_information_flags.presence) {
+        r = pfcp_length_octet(&v->overload_control_information_flags, &ogs_pfcp_tlv_desc_oci_flags);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Overload Control Information]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_overload_control_information(uint8_t *pos, ogs_pfcp_tlv_overload_control_information_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->overload_control_sequence_number.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_SEQUENCE_NUMBER_TYPE, &v->overload_control_sequence_number);
+    }
+    if (v->overload_reduction_metric.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_METRIC_TYPE, &v->overload_reduction_metric);
+    }
+    if (v->period_of_validity.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_TIMER_TYPE, &v->period_of_validity);
+    }
+    if (v->overload_control_information_flags.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_OCI_FLAGS_TYPE, &v->overload_control_information_flags);
+    }
+    pfcp_put_header(header, OGS_PFCP_OVERLOAD_CONTROL_INFORMATION_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_application_detection_information(ogs_pfcp_tlv_application_detection_information_t *v)
+{
+    int length = 0, r;
+
+    if (v->application_id.presence) {
+        r = pfcp_length_octet(&v->application_id, &ogs_pfcp_tlv_desc_application_id);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->application_instance_id.presence) {
+        r = pfcp_length_octet(&v->application_instance_id, &ogs_pfcp_tlv_desc_application_instance_id);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->flow_information.presence) {
+        r = pfcp_length_octet(&v->flow_information, &ogs_pfcp_tlv_desc_flow_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->pdr_id.presence) {
+        length += 6;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Application Detection Information]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_application_detection_information(uint8_t *pos, ogs_pfcp_tlv_application_detection_information_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->application_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_APPLICATION_ID_TYPE, &v->application_id);
+    }
+    if (v->application_instance_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_APPLICATION_INSTANCE_ID_TYPE, &v->application_instance_id);
+    }
+    if (v->flow_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_FLOW_INFORMATION_TYPE, &v->flow_information);
+    }
+    if (v->pdr_id.presence) {
+        pos = pfcp_put_uint16(pos, OGS_PFCP_PDR_ID_TYPE, &v->pdr_id);
+    }
+    pfcp_put_header(header, OGS_PFCP_APPLICATION_DETECTION_INFORMATION_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_query_urr(ogs_pfcp_tlv_query_urr_t *v)
+{
+    int length = 0;
+
+    if (v->urr_id.presence) {
+        length += 8;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Query URR]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_query_urr(uint8_t *pos, ogs_pfcp_tlv_query_urr_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->urr_id.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_URR_ID_TYPE, &v->urr_id);
+    }
+    pfcp_put_header(header, OGS_PFCP_QUERY_URR_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_usage_report_session_modification_response(ogs_pfcp_tlv_usage_report_session_modification_response_t *v)
+{
+    int length = 0, r;
+
+    if (v->urr_id.presence) {
+        length += 8;
+    }
+    if (v->ur_seqn.presence) {
+        length += 8;
+    }
+    if (v->usage_report_trigger.presence) {
+        length += 7;
+    }
+    if (v->start_time.presence) {
+        length += 8;
+    }
+    if (v->end_time.presence) {
+        length += 8;
+    }
+    if (v->volume_measurement.presence) {
+        r = pfcp_length_octet(&v->volume_measurement, &ogs_pfcp_tlv_desc_volume_measurement);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->duration_measurement.presence) {
+        length += 8;
+    }
+    if (v->time_of_first_packet.presence) {
+        length += 8;
+    }
+    if (v->time_of_last_packet.presence) {
+        length += 8;
+    }
+    if (v->usage_information.presence) {
+        r = pfcp_length_octet(&v->usage_information, &ogs_pfcp_tlv_desc_usage_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->query_urr_reference.presence) {
+        r = pfcp_length_octet(&v->query_urr_reference, &ogs_pfcp_tlv_desc_query_urr_reference);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->ethernet_traffic_information.presence) {
+        r = pfcp_length_ethernet_traffic_information(&v->ethernet_traffic_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Usage Report Session Modification Response]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_usage_report_session_modification_response(uint8_t *pos, ogs_pfcp_tlv_usage_report_session_modification_response_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->urr_id.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_URR_ID_TYPE, &v->urr_id);
+    }
+    if (v->ur_seqn.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_UR_SEQN_TYPE, &v->ur_seqn);
+    }
+    if (v->usage_report_trigger.presence) {
+        pos = pfcp_put_uint24(pos, OGS_PFCP_USAGE_REPORT_TRIGGER_TYPE, &v->usage_report_trigger);
+    }
+    if (v->start_time.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_START_TIME_TYPE, &v->start_time);
+    }
+    if (v->end_time.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_END_TIME_TYPE, &v->end_time);
+    }
+    if (v->volume_measurement.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_VOLUME_MEASUREMENT_TYPE, &v->volume_measurement);
+    }
+    if (v->duration_measurement.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_DURATION_MEASUREMENT_TYPE, &v->duration_measurement);
+    }
+    if (v->time_of_first_packet.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_TIME_OF_FIRST_PACKET_TYPE, &v->time_of_first_packet);
+    }
+    if (v->time_of_last_packet.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_TIME_OF_LAST_PACKET_TYPE, &v->time_of_last_packet);
+    }
+    if (v->usage_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_USAGE_INFORMATION_TYPE, &v->usage_information);
+    }
+    if (v->query_urr_reference.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_QUERY_URR_REFERENCE_TYPE, &v->query_urr_reference);
+    }
+    if (v->ethernet_traffic_information.presence) {
+        pos = pfcp_put_ethernet_traffic_information(pos, &v->ethernet_traffic_information);
+    }
+    pfcp_put_header(header, OGS_PFCP_USAGE_REPORT_SESSION_MODIFICATION_RESPONSE_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_usage_report_session_deletion_response(ogs_pfcp_tlv_usage_report_session_deletion_response_t *v)
+{
+    int length = 0, r;
+
+    if (v->urr_id.presence) {
+        length += 8;
+    }
+    if (v->ur_seqn.presence) {
+        length += 8;
+    }
+    if (v->usage_report_trigger.presence) {
+        length += 7;
+    }
+    if (v->start_time.presence) {
+        length += 8;
+    }
+    if (v->end_time.presence) {
+        length += 8;
+    }
+    if (v->volume_measurement.presence) {
+        r = pfcp_length_octet(&v->volume_measurement, &ogs_pfcp_tlv_desc_volume_measurement);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->duration_measurement.presence) {
+        length += 8;
+    }
+    if (v->time_of_first_packet.presence) {
+        length += 8;
+    }
+    if (v->time_of_last_packet.presence) {
+        length += 8;
+    }
+    if (v->usage_information.presence) {
+        r = pfcp_length_octet(&v->usage_information, &ogs_pfcp_tlv_desc_usage_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->ethernet_traffic_information.presence) {
+        r = pfcp_length_ethernet_traffic_information(&v->ethernet_traffic_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Usage Report Session Deletion Response]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_usage_report_session_deletion_response(uint8_t *pos, ogs_pfcp_tlv_usage_report_session_deletion_response_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->urr_id.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_URR_ID_TYPE, &v->urr_id);
+    }
+    if (v->ur_seqn.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_UR_SEQN_TYPE, &v->ur_seqn);
+    }
+    if (v->usage_report_trigger.presence) {
+        pos = pfcp_put_uint24(pos, OGS_PFCP_USAGE_REPORT_TRIGGER_TYPE, &v->usage_report_trigger);
+    }
+    if (v->start_time.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_START_TIME_TYPE, &v->start_time);
+    }
+    if (v->end_time.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_END_TIME_TYPE, &v->end_time);
+    }
+    if (v->volume_measurement.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_VOLUME_MEASUREMENT_TYPE, &v->volume_measurement);
+    }
+    if (v->duration_measurement.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_DURATION_MEASUREMENT_TYPE, &v->duration_measurement);
+    }
+    if (v->time_of_first_packet.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_TIME_OF_FIRST_PACKET_TYPE, &v->time_of_first_packet);
+    }
+    if (v->time_of_last_packet.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_TIME_OF_LAST_PACKET_TYPE, &v->time_of_last_packet);
+    }
+    if (v->usage_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_USAGE_INFORMATION_TYPE, &v->usage_information);
+    }
+    if (v->ethernet_traffic_information.presence) {
+        pos = pfcp_put_ethernet_traffic_information(pos, &v->ethernet_traffic_information);
+    }
+    pfcp_put_header(header, OGS_PFCP_USAGE_REPORT_SESSION_DELETION_RESPONSE_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_usage_report_session_report_request(ogs_pfcp_tlv_usage_report_session_report_request_t *v)
+{
+    int length = 0, r;
+
+    if (v->urr_id.presence) {
+        length += 8;
+    }
+    if (v->ur_seqn.presence) {
+        length += 8;
+    }
+    if (v->usage_report_trigger.presence) {
+        length += 7;
+    }
+    if (v->start_time.presence) {
+        length += 8;
+    }
+    if (v->end_time.presence) {
+        length += 8;
+    }
+    if (v->volume_measurement.presence) {
+        r = pfcp_length_octet(&v->volume_measurement, &ogs_pfcp_tlv_desc_volume_measurement);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->duration_measurement.presence) {
+        length += 8;
+    }
+    if (v->application_detection_information.presence) {
+        r = pfcp_length_application_detection_information(&v->application_detection_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->ue_ip_address.presence) {
+        r = pfcp_length_octet(&v->ue_ip_address, &ogs_pfcp_tlv_desc_ue_ip_address);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->network_instance.presence) {
+        r = pfcp_length_octet(&v->network_instance, &ogs_pfcp_tlv_desc_network_instance);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->time_of_first_packet.presence) {
+        length += 8;
+    }
+    if (v->time_of_last_packet.presence) {
+        length += 8;
+    }
+    if (v->usage_information.presence) {
+        r = pfcp_length_octet(&v->usage_information, &ogs_pfcp_tlv_desc_usage_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->query_urr_reference.presence) {
+        r = pfcp_length_octet(&v->query_urr_reference, &ogs_pfcp_tlv_desc_query_urr_reference);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->event_time_stamp.presence) {
+        r = pfcp_length_octet(&v->event_time_stamp, &ogs_pfcp_tlv_desc_time_stamp);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->ethernet_traffic_information.presence) {
+        r = pfcp_length_ethernet_traffic_information(&v->ethernet_traffic_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->join_ip_muticast_information.presence) {
+        r = pfcp_length_join_ip_multicast_information_ie_within_usage_report(&v->join_ip_muticast_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->leave_ip_muticast_information.presence) {
+        r = pfcp_length_leave_ip_multicast_information_ie_within_usage_report(&v->leave_ip_muticast_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->predefined_rules_name.presence) {
+        r = pfcp_length_octet(&v->predefined_rules_name, &ogs_pfcp_tlv_desc_predefined_rules_name);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Usage Report Session Report Request]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_usage_report_session_report_request(uint8_t *pos, ogs_pfcp_tlv_usage_report_session_report_request_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->urr_id.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_URR_ID_TYPE, &v->urr_id);
+    }
+    if (v->ur_seqn.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_UR_SEQN_TYPE, &v->ur_seqn);
+    }
+    if (v->usage_report_trigger.presence) {
+        pos = pfcp_put_uint24(pos, OGS_PFCP_USAGE_REPORT_TRIGGER_TYPE, &v->usage_report_trigger);
+    }
+    if (v->start_time.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_START_TIME_TYPE, &v->start_time);
+    }
+    if (v->end_time.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_END_TIME_TYPE, &v->end_time);
+    }
+    if (v->volume_measurement.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_VOLUME_MEASUREMENT_TYPE, &v->volume_measurement);
+    }
+    if (v->duration_measurement.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_DURATION_MEASUREMENT_TYPE, &v->duration_measurement);
+    }
+    if (v->application_detection_information.presence) {
+        pos = pfcp_put_application_detection_information(pos, &v->application_detection_information);
+    }
+    if (v->ue_ip_address.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_UE_IP_ADDRESS_TYPE, &v->ue_ip_address);
+    }
+    if (v->network_instance.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_NETWORK_INSTANCE_TYPE, &v->network_instance);
+    }
+    if (v->time_of_first_packet.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_TIME_OF_FIRST_PACKET_TYPE, &v->time_of_first_packet);
+    }
+    if (v->time_of_last_packet.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_TIME_OF_LAST_PACKET_TYPE, &v->time_of_last_packet);
+    }
+    if (v->usage_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_USAGE_INFORMATION_TYPE, &v->usage_information);
+    }
+    if (v->query_urr_reference.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_QUERY_URR_REFERENCE_TYPE, &v->query_urr_reference);
+    }
+    if (v->event_time_stamp.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_TIME_STAMP_TYPE, &v->event_time_stamp);
+    }
+    if (v->ethernet_traffic_information.presence) {
+        pos = pfcp_put_ethernet_traffic_information(pos, &v->ethernet_traffic_information);
+    }
+    if (v->join_ip_muticast_information.presence) {
+        pos = pfcp_put_join_ip_multicast_information_ie_within_usage_report(pos, &v->join_ip_muticast_information);
+    }
+    if (v->leave_ip_muticast_information.presence) {
+        pos = pfcp_put_leave_ip_multicast_information_ie_within_usage_report(pos, &v->leave_ip_muticast_information);
+    }
+    if (v->predefined_rules_name.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_PREDEFINED_RULES_NAME_TYPE, &v->predefined_rules_name);
+    }
+    pfcp_put_header(header, OGS_PFCP_USAGE_REPORT_SESSION_REPORT_REQUEST_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_downlink_data_report(ogs_pfcp_tlv_downlink_data_report_t *v)
+{
+    int length = 0, r;
+
+    if (v->pdr_id.presence) {
+        length += 6;
+    }
+    if (v->downlink_data_service_information.presence) {
+        r = pfcp_length_octet(&v->downlink_data_service_information, &ogs_pfcp_tlv_desc_downlink_data_service_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->dl_data_packets_size.presence) {
+        r = pfcp_length_octet(&v->dl_data_packets_size, &ogs_pfcp_tlv_desc_dl_data_packets_size);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->dl_data_status.presence) {
+        length += 5;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Downlink Data Report]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_downlink_data_report(uint8_t *pos, ogs_pfcp_tlv_downlink_data_report_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->pdr_id.presence) {
+        pos = pfcp_put_uint16(pos, OGS_PFCP_PDR_ID_TYPE, &v->pdr_id);
+    }
+    if (v->downlink_data_service_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_DOWNLINK_DATA_SERVICE_INFORMATION_TYPE, &v->downlink_data_service_information);
+    }
+    if (v->dl_data_packets_size.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_DL_DATA_PACKETS_SIZE_TYPE, &v->dl_data_packets_size);
+    }
+    if (v->dl_data_status.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_DATA_STATUS_TYPE, &v->dl_data_status);
+    }
+    pfcp_put_header(header, OGS_PFCP_DOWNLINK_DATA_REPORT_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_create_bar(ogs_pfcp_tlv_create_bar_t *v)
+{
+    int length = 0, r;
+
+    if (v->bar_id.presence) {
+        length += 5;
+    }
+    if (v->downlink_data_notification_delay.presence) {
+        r = pfcp_length_octet(&v->downlink_data_notification_delay, &ogs_pfcp_tlv_desc_downlink_data_notification_delay);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->suggested_buffering_packets_count.presence) {
+        r = pfcp_length_octet(&v->suggested_buffering_packets_count, &ogs_pfcp_tlv_desc_suggested_buffering_packets_count);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->mt_edt_control_information.presence) {
+        r = pfcp_length_octet(&v->mt_edt_control_information, &ogs_pfcp_tlv_desc_mt_edt_control_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Create BAR]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_create_bar(uint8_t *pos, ogs_pfcp_tlv_create_bar_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->bar_id.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_BAR_ID_TYPE, &v->bar_id);
+    }
+    if (v->downlink_data_notification_delay.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_DOWNLINK_DATA_NOTIFICATION_DELAY_TYPE, &v->downlink_data_notification_delay);
+    }
+    if (v->suggested_buffering_packets_count.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_SUGGESTED_BUFFERING_PACKETS_COUNT_TYPE, &v->suggested_buffering_packets_count);
+    }
+    if (v->mt_edt_control_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_MT_EDT_CONTROL_INFORMATION_TYPE, &v->mt_edt_control_information);
+    }
+    pfcp_put_header(header, OGS_PFCP_CREATE_BAR_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_update_bar_session_modification_request(ogs_pfcp_tlv_update_bar_session_modification_request_t *v)
+{
+    int length = 0, r;
+
+    if (v->bar_id.presence) {
+        length += 5;
+    }
+    if (v->downlink_data_notification_delay.presence) {
+        r = pfcp_length_octet(&v->downlink_data_notification_delay, &ogs_pfcp_tlv_desc_downlink_data_notification_delay);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->suggested_buffering_packets_count.presence) {
+        r = pfcp_length_octet(&v->suggested_buffering_packets_count, &ogs_pfcp_tlv_desc_suggested_buffering_packets_count);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->mt_edt_control_information.presence) {
+        r = pfcp_length_octet(&v->mt_edt_control_information, &ogs_pfcp_tlv_desc_mt_edt_control_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Update BAR Session Modification Request]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_update_bar_session_modification_request(uint8_t *pos, ogs_pfcp_tlv_update_bar_session_modification_request_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->bar_id.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_BAR_ID_TYPE, &v->bar_id);
+    }
+    if (v->downlink_data_notification_delay.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_DOWNLINK_DATA_NOTIFICATION_DELAY_TYPE, &v->downlink_data_notification_delay);
+    }
+    if (v->suggested_buffering_packets_count.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_SUGGESTED_BUFFERING_PACKETS_COUNT_TYPE, &v->suggested_buffering_packets_count);
+    }
+    if (v->mt_edt_control_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_MT_EDT_CONTROL_INFORMATION_TYPE, &v->mt_edt_control_information);
+    }
+    pfcp_put_header(header, OGS_PFCP_UPDATE_BAR_SESSION_MODIFICATION_REQUEST_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_remove_bar(ogs_pfcp_tlv_remove_bar_t *v)
+{
+    int length = 0;
+
+    if (v->bar_id.presence) {
+        length += 5;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Remove BAR]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_remove_bar(uint8_t *pos, ogs_pfcp_tlv_remove_bar_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->bar_id.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_BAR_ID_TYPE, &v->bar_id);
+    }
+    pfcp_put_header(header, OGS_PFCP_REMOVE_BAR_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_error_indication_report(ogs_pfcp_tlv_error_indication_report_t *v)
+{
+    int length = 0, r;
+
+    if (v->remote_f_teid.presence) {
+        r = pfcp_length_octet(&v->remote_f_teid, &ogs_pfcp_tlv_desc_f_teid);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Error Indication Report]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_error_indication_report(uint8_t *pos, ogs_pfcp_tlv_error_indication_report_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->remote_f_teid.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_F_TEID_TYPE, &v->remote_f_teid);
+    }
+    pfcp_put_header(header, OGS_PFCP_ERROR_INDICATION_REPORT_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_user_plane_path_failure_report(ogs_pfcp_tlv_user_plane_path_failure_report_t *v)
+{
+    int length = 0, r;
+
+    if (v->remote_gtp_u_peer.presence) {
+        r = pfcp_length_octet(&v->remote_gtp_u_peer, &ogs_pfcp_tlv_desc_remote_gtp_u_peer);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [User Plane Path Failure Report]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_user_plane_path_failure_report(uint8_t *pos, ogs_pfcp_tlv_user_plane_path_failure_report_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->remote_gtp_u_peer.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_REMOTE_GTP_U_PEER_TYPE, &v->remote_gtp_u_peer);
+    }
+    pfcp_put_header(header, OGS_PFCP_USER_PLANE_PATH_FAILURE_REPORT_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_create_traffic_endpoint(ogs_pfcp_tlv_create_traffic_endpoint_t *v)
+{
+    int i, length = 0, r;
+
+    if (v->traffic_endpoint_id.presence) {
+        r = pfcp_length_octet(&v->traffic_endpoint_id, &ogs_pfcp_tlv_desc_traffic_endpoint_id);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->local_f_teid.presence) {
+        r = pfcp_length_octet(&v->local_f_teid, &ogs_pfcp_tlv_desc_f_teid);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->network_instance.presence) {
+        r = pfcp_length_octet(&v->network_instance, &ogs_pfcp_tlv_desc_network_instance);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->redundant_transmission_detection_parameters.presence) {
+        r = pfcp_length_redundant_transmission_parameters(&v->redundant_transmission_detection_parameters);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->ue_ip_address.presence) {
+        r = pfcp_length_octet(&v->ue_ip_address, &ogs_pfcp_tlv_desc_ue_ip_address);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->ethernet_pdu_session_information.presence) {
+        r = pfcp_length_octet(&v->ethernet_pdu_session_information, &ogs_pfcp_tlv_desc_ethernet_pdu_session_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    for (i = 0; i < 8 && v->framed_route[i].presence; i++) {
+        r = pfcp_length_octet(&v->framed_route[i], &ogs_pfcp_tlv_desc_framed_route);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->framed_routing.presence) {
+        r = pfcp_length_octet(&v->framed_routing, &ogs_pfcp_tlv_desc_framed_routing);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    for (i = 0; i < 8 && v->framed_ipv6_route[i].presence; i++) {
+        r = pfcp_length_octet(&v->framed_ipv6_route[i], &ogs_pfcp_tlv_desc_framed_ipv6_route);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->qfi.presence) {
+        length += 5;
+    }
+    if (v->source_interface_type.presence) {
+        length += 5;
+    }
+    if (v->local_ingress_tunnel.presence) {
+        r = pfcp_length_octet(&v->local_ingress_tunnel, &ogs_pfcp_tlv_desc_local_ingress_tunnel);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->ip_multicast_addressing_info.presence) {
+        r = pfcp_length_ip_multicast_addressing_info_within_pfcp_session_establishment_request(&v->ip_multicast_addressing_info);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->mbs_session_identifier.presence) {
+        r = pfcp_length_octet(&v->mbs_session_identifier, &ogs_pfcp_tlv_desc_mbs_session_identifier);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->area_session_id.presence) {
+        r = pfcp_length_octet(&v->area_session_id, &ogs_pfcp_tlv_desc_area_session_id);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->rat_type.presence) {
+        r = pfcp_length_octet(&v->rat_type, &ogs_pfcp_tlv_desc_rat_type);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Create Traffic Endpoint]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_create_traffic_endpoint(uint8_t *pos, ogs_pfcp_tlv_create_traffic_endpoint_t *v)
+{
+    uint8_t *header = pos;
+    int i;
+
+    pos += 4;
+    if (v->traffic_endpoint_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_TRAFFIC_ENDPOINT_ID_TYPE, &v->traffic_endpoint_id);
+    }
+    if (v->local_f_teid.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_F_TEID_TYPE, &v->local_f_teid);
+    }
+    if (v->network_instance.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_NETWORK_INSTANCE_TYPE, &v->network_instance);
+    }
+    if (v->redundant_transmission_detection_parameters.presence) {
+        pos = pfcp_put_redundant_transmission_parameters(pos, &v->redundant_transmission_detection_parameters);
+    }
+    if (v->ue_ip_address.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_UE_IP_ADDRESS_TYPE, &v->ue_ip_address);
+    }
+    if (v->ethernet_pdu_session_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_ETHERNET_PDU_SESSION_INFORMATION_TYPE, &v->ethernet_pdu_session_information);
+    }
+    for (i = 0; i < 8 && v->framed_route[i].presence; i++) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_FRAMED_ROUTE_TYPE, &v->framed_route[i]);
+    }
+    if (v->framed_routing.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_FRAMED_ROUTING_TYPE, &v->framed_routing);
+    }
+    for (i = 0; i < 8 && v->framed_ipv6_route[i].presence; i++) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_FRAMED_IPV6_ROUTE_TYPE, &v->framed_ipv6_route[i]);
+    }
+    if (v->qfi.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_QFI_TYPE, &v->qfi);
+    }
+    if (v->source_interface_type.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP__INTERFACE_TYPE_TYPE, &v->source_interface_type);
+    }
+    if (v->local_ingress_tunnel.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_LOCAL_INGRESS_TUNNEL_TYPE, &v->local_ingress_tunnel);
+    }
+    if (v->ip_multicast_addressing_info.presence) {
+        pos = pfcp_put_ip_multicast_addressing_info_within_pfcp_session_establishment_request(pos, &v->ip_multicast_addressing_info);
+    }
+    if (v->mbs_session_identifier.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_MBS_SESSION_IDENTIFIER_TYPE, &v->mbs_session_identifier);
+    }
+    if (v->area_session_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_AREA_SESSION_ID_TYPE, &v->area_session_id);
+    }
+    if (v->rat_type.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_RAT_TYPE_TYPE, &v->rat_type);
+    }
+    pfcp_put_header(header, OGS_PFCP_CREATE_TRAFFIC_ENDPOINT_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_created_traffic_endpoint(ogs_pfcp_tlv_created_traffic_endpoint_t *v)
+{
+    int length = 0, r;
+
+    if (v->traffic_endpoint_id.presence) {
+        r = pfcp_length_octet(&v->traffic_endpoint_id, &ogs_pfcp_tlv_desc_traffic_endpoint_id);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->local_f_teid.presence) {
+        r = pfcp_length_octet(&v->local_f_teid, &ogs_pfcp_tlv_desc_f_teid);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->local_f_teid_for_redundant_transmission.presence) {
+        r = pfcp_length_octet(&v->local_f_teid_for_redundant_transmission, &ogs_pfcp_tlv_desc_f_teid);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->ue_ip_address.presence) {
+        r = pfcp_length_octet(&v->ue_ip_address, &ogs_pfcp_tlv_desc_ue_ip_address);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->local_ingress_tunnel.presence) {
+        r = pfcp_length_octet(&v->local_ingress_tunnel, &ogs_pfcp_tlv_desc_local_ingress_tunnel);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Created Traffic Endpoint]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_created_traffic_endpoint(uint8_t *pos, ogs_pfcp_tlv_created_traffic_endpoint_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->traffic_endpoint_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_TRAFFIC_ENDPOINT_ID_TYPE, &v->traffic_endpoint_id);
+    }
+    if (v->local_f_teid.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_F_TEID_TYPE, &v->local_f_teid);
+    }
+    if (v->local_f_teid_for_redundant_transmission.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_F_TEID_TYPE, &v->local_f_teid_for_redundant_transmission);
+    }
+    if (v->ue_ip_address.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_UE_IP_ADDRESS_TYPE, &v->ue_ip_address);
+    }
+    if (v->local_ingress_tunnel.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_LOCAL_INGRESS_TUNNEL_TYPE, &v->local_ingress_tunnel);
+    }
+    pfcp_put_header(header, OGS_PFCP_CREATED_TRAFFIC_ENDPOINT_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_remove_traffic_endpoint(ogs_pfcp_tlv_remove_traffic_endpoint_t *v)
+{
+    int length = 0, r;
+
+    if (v->traffic_endpoint_id.presence) {
+        r = pfcp_length_octet(&v->traffic_endpoint_id, &ogs_pfcp_tlv_desc_traffic_endpoint_id);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Remove Traffic Endpoint]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_remove_traffic_endpoint(uint8_t *pos, ogs_pfcp_tlv_remove_traffic_endpoint_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->traffic_endpoint_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_TRAFFIC_ENDPOINT_ID_TYPE, &v->traffic_endpoint_id);
+    }
+    pfcp_put_header(header, OGS_PFCP_REMOVE_TRAFFIC_ENDPOINT_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_create_mar(ogs_pfcp_tlv_create_mar_t *v)
+{
+    int length = 0, r;
+
+    if (v->mar_id.presence) {
+        r = pfcp_length_octet(&v->mar_id, &ogs_pfcp_tlv_desc_mar_id);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->steering_functionality.presence) {
+        r = pfcp_length_octet(&v->steering_functionality, &ogs_pfcp_tlv_desc_steering_functionality);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->steering_mode.presence) {
+        r = pfcp_length_octet(&v->steering_mode, &ogs_pfcp_tlv_desc_steering_mode);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->_access_forwarding_action_information.presence) {
+        r = pfcp_length__access_forwarding_action_information(&v->_access_forwarding_action_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->non__access_forwarding_action_information.presence) {
+        r = pfcp_length_non__access_forwarding_action_information(&v->non__access_forwarding_action_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->threshold_values.presence) {
+        r = pfcp_length_octet(&v->threshold_values, &ogs_pfcp_tlv_desc_thresholds);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->steering_mode_indicator.presence) {
+        r = pfcp_length_octet(&v->steering_mode_indicator, &ogs_pfcp_tlv_desc_steering_mode_indicator);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Create MAR]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_create_mar(uint8_t *pos, ogs_pfcp_tlv_create_mar_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->mar_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_MAR_ID_TYPE, &v->mar_id);
+    }
+    if (v->steering_functionality.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_STEERING_FUNCTIONALITY_TYPE, &v->steering_functionality);
+    }
+    if (v->steering_mode.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_STEERING_MODE_TYPE, &v->steering_mode);
+    }
+    if (v->_access_forwarding_action_information.presence) {
+        pos = pfcp_put__access_forwarding_action_information(pos, &v->_access_forwarding_action_information);
+    }
+    if (v->non__access_forwarding_action_information.presence) {
+        pos = pfcp_put_non__access_forwarding_action_information(pos, &v->non__access_forwarding_action_information);
+    }
+    if (v->threshold_values.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_THRESHOLDS_TYPE, &v->threshold_values);
+    }
+    if (v->steering_mode_indicator.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_STEERING_MODE_INDICATOR_TYPE, &v->steering_mode_indicator);
+    }
+    pfcp_put_header(header, OGS_PFCP_CREATE_MAR_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_remove_mar(ogs_pfcp_tlv_remove_mar_t *v)
+{
+    int length = 0, r;
+
+    if (v->mar_id.presence) {
+        r = pfcp_length_octet(&v->mar_id, &ogs_pfcp_tlv_desc_mar_id);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Remove MAR]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_remove_mar(uint8_t *pos, ogs_pfcp_tlv_remove_mar_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->mar_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_MAR_ID_TYPE, &v->mar_id);
+    }
+    pfcp_put_header(header, OGS_PFCP_REMOVE_MAR_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_update_mar(ogs_pfcp_tlv_update_mar_t *v)
+{
+    int length = 0, r;
+
+    if (v->mar_id.presence) {
+        r = pfcp_length_octet(&v->mar_id, &ogs_pfcp_tlv_desc_mar_id);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->steering_functionality.presence) {
+        r = pfcp_length_octet(&v->steering_functionality, &ogs_pfcp_tlv_desc_steering_functionality);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->steering_mode.presence) {
+        r = pfcp_length_octet(&v->steering_mode, &ogs_pfcp_tlv_desc_steering_mode);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->update__access_forwarding_action_information.presence) {
+        r = pfcp_length_update__access_forwarding_action_information(&v->update__access_forwarding_action_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->update_non__access_forwarding_action_information.presence) {
+        r = pfcp_length_update_non__access_forwarding_action_information(&v->update_non__access_forwarding_action_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->_access_forwarding_action_information.presence) {
+        r = pfcp_length__access_forwarding_action_information(&v->_access_forwarding_action_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->non__access_forwarding_action_information.presence) {
+        r = pfcp_length_non__access_forwarding_action_information(&v->non__access_forwarding_action_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->threshold_values.presence) {
+        r = pfcp_length_octet(&v->threshold_values, &ogs_pfcp_tlv_desc_thresholds);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->steering_mode_indicator.presence) {
+        r = pfcp_length_octet(&v->steering_mode_indicator, &ogs_pfcp_tlv_desc_steering_mode_indicator);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Update MAR]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_update_mar(uint8_t *pos, ogs_pfcp_tlv_update_mar_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->mar_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_MAR_ID_TYPE, &v->mar_id);
+    }
+    if (v->steering_functionality.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_STEERING_FUNCTIONALITY_TYPE, &v->steering_functionality);
+    }
+    if (v->steering_mode.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_STEERING_MODE_TYPE, &v->steering_mode);
+    }
+    if (v->update__access_forwarding_action_information.presence) {
+        pos = pfcp_put_update__access_forwarding_action_information(pos, &v->update__access_forwarding_action_information);
+    }
+    if (v->update_non__access_forwarding_action_information.presence) {
+        pos = pfcp_put_update_non__access_forwarding_action_information(pos, &v->update_non__access_forwarding_action_information);
+    }
+    if (v->_access_forwarding_action_information.presence) {
+        pos = pfcp_put__access_forwarding_action_information(pos, &v->_access_forwarding_action_information);
+    }
+    if (v->non__access_forwarding_action_information.presence) {
+        pos = pfcp_put_non__access_forwarding_action_information(pos, &v->non__access_forwarding_action_information);
+    }
+    if (v->threshold_values.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_THRESHOLDS_TYPE, &v->threshold_values);
+    }
+    if (v->steering_mode_indicator.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_STEERING_MODE_INDICATOR_TYPE, &v->steering_mode_indicator);
+    }
+    pfcp_put_header(header, OGS_PFCP_UPDATE_MAR_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_pfcp_session_retention_information_within_pfcp_association_setup_request(ogs_pfcp_tlv_pfcp_session_retention_information_within_pfcp_association_setup_request_t *v)
+{
+    int length = 0, r;
+
+    if (v->cp_pfcp_entity_ip_address.presence) {
+        r = pfcp_length_octet(&v->cp_pfcp_entity_ip_address, &ogs_pfcp_tlv_desc_cp_pfcp_entity_ip_address);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [PFCP Session Retention Information within PFCP Association Setup Request]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_pfcp_session_retention_information_within_pfcp_association_setup_request(uint8_t *pos, ogs_pfcp_tlv_pfcp_session_retention_information_within_pfcp_association_setup_request_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->cp_pfcp_entity_ip_address.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_CP_PFCP_ENTITY_IP_ADDRESS_TYPE, &v->cp_pfcp_entity_ip_address);
+    }
+    pfcp_put_header(header, OGS_PFCP_PFCP_SESSION_RETENTION_INFORMATION_WITHIN_PFCP_ASSOCIATION_SETUP_REQUEST_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_user_plane_path_recovery_report(ogs_pfcp_tlv_user_plane_path_recovery_report_t *v)
+{
+    int length = 0, r;
+
+    if (v->remote_gtp_u_peer.presence) {
+        r = pfcp_length_octet(&v->remote_gtp_u_peer, &ogs_pfcp_tlv_desc_remote_gtp_u_peer);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [User Plane Path Recovery Report]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_user_plane_path_recovery_report(uint8_t *pos, ogs_pfcp_tlv_user_plane_path_recovery_report_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->remote_gtp_u_peer.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_REMOTE_GTP_U_PEER_TYPE, &v->remote_gtp_u_peer);
+    }
+    pfcp_put_header(header, OGS_PFCP_USER_PLANE_PATH_RECOVERY_REPORT_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_created_bridge_info_for_tsc(ogs_pfcp_tlv_created_bridge_info_for_tsc_t *v)
+{
+    int length = 0, r;
+
+    if (v->ds_tt_port_number.presence) {
+        r = pfcp_length_octet(&v->ds_tt_port_number, &ogs_pfcp_tlv_desc_ds_tt_port_number);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->fivegs_user_plane_node.presence) {
+        r = pfcp_length_octet(&v->fivegs_user_plane_node, &ogs_pfcp_tlv_desc_fivegs_user_plane_node);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Created Bridge Info for TSC]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_created_bridge_info_for_tsc(uint8_t *pos, ogs_pfcp_tlv_created_bridge_info_for_tsc_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->ds_tt_port_number.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_DS_TT_PORT_NUMBER_TYPE, &v->ds_tt_port_number);
+    }
+    if (v->fivegs_user_plane_node.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_FiveGS_USER_PLANE_NODE_TYPE, &v->fivegs_user_plane_node);
+    }
+    pfcp_put_header(header, OGS_PFCP_CREATED_BRIDGE_INFO_FOR_TSC_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_tsc_management_information_ie_within_pfcp_session_modification_request(ogs_pfcp_tlv_tsc_management_information_ie_within_pfcp_session_modification_request_t *v)
+{
+    int length = 0, r;
+
+    if (v->port_management_information_container.presence) {
+        r = pfcp_length_octet(&v->port_management_information_container, &ogs_pfcp_tlv_desc_port_management_information_container);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->user_plane_node_management_information_container.presence) {
+        r = pfcp_length_octet(&v->user_plane_node_management_information_container, &ogs_pfcp_tlv_desc_bridge_management_information_container);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->nw_tt_port_number.presence) {
+        r = pfcp_length_octet(&v->nw_tt_port_number, &ogs_pfcp_tlv_desc_nw_tt_port_number);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [TSC Management Information IE within PFCP Session Modification Request]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_tsc_management_information_ie_within_pfcp_session_modification_request(uint8_t *pos, ogs_pfcp_tlv_tsc_management_information_ie_within_pfcp_session_modification_request_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->port_management_information_container.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_PORT_MANAGEMENT_INFORMATION_CONTAINER_TYPE, &v->port_management_information_container);
+    }
+    if (v->user_plane_node_management_information_container.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_BRIDGE_MANAGEMENT_INFORMATION_CONTAINER_TYPE, &v->user_plane_node_management_information_container);
+    }
+    if (v->nw_tt_port_number.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_NW_TT_PORT_NUMBER_TYPE, &v->nw_tt_port_number);
+    }
+    pfcp_put_header(header, OGS_PFCP_TSC_MANAGEMENT_INFORMATION_IE_WITHIN_PFCP_SESSION_MODIFICATION_REQUEST_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_clock_drift_control_information(ogs_pfcp_tlv_clock_drift_control_information_t *v)
+{
+    int length = 0, r;
+
+    if (v->requested_clock_drift_information.presence) {
+        r = pfcp_length_octet(&v->requested_clock_drift_information, &ogs_pfcp_tlv_desc_requested_clock_drift_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->time_domain_number.presence) {
+        r = pfcp_length_octet(&v->time_domain_number, &ogs_pfcp_tlv_desc_time_domain_number);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->configured_time_domain.presence) {
+        r = pfcp_length_octet(&v->configured_time_domain, &ogs_pfcp_tlv_desc_configured_time_domain);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->time_offset_threshold.presence) {
+        r = pfcp_length_octet(&v->time_offset_threshold, &ogs_pfcp_tlv_desc_time_offset_threshold);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->cumulative_rateratio_threshold.presence) {
+        r = pfcp_length_octet(&v->cumulative_rateratio_threshold, &ogs_pfcp_tlv_desc_cumulative_rateratio_threshold);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Clock Drift Control Information]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_clock_drift_control_information(uint8_t *pos, ogs_pfcp_tlv_clock_drift_control_information_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->requested_clock_drift_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_REQUESTED_CLOCK_DRIFT_INFORMATION_TYPE, &v->requested_clock_drift_information);
+    }
+    if (v->time_domain_number.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_TIME_DOMAIN_NUMBER_TYPE, &v->time_domain_number);
+    }
+    if (v->configured_time_domain.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_CONFIGURED_TIME_DOMAIN_TYPE, &v->configured_time_domain);
+    }
+    if (v->time_offset_threshold.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_TIME_OFFSET_THRESHOLD_TYPE, &v->time_offset_threshold);
+    }
+    if (v->cumulative_rateratio_threshold.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_CUMULATIVE_RATERATIO_THRESHOLD_TYPE, &v->cumulative_rateratio_threshold);
+    }
+    pfcp_put_header(header, OGS_PFCP_CLOCK_DRIFT_CONTROL_INFORMATION_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_clock_drift_report(ogs_pfcp_tlv_clock_drift_report_t *v)
+{
+    int length = 0, r;
+
+    if (v->time_domain_number.presence) {
+        r = pfcp_length_octet(&v->time_domain_number, &ogs_pfcp_tlv_desc_time_domain_number);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->time_offset_measurement.presence) {
+        r = pfcp_length_octet(&v->time_offset_measurement, &ogs_pfcp_tlv_desc_time_offset_measurement);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->cumulative_rateratio_measurement.presence) {
+        r = pfcp_length_octet(&v->cumulative_rateratio_measurement, &ogs_pfcp_tlv_desc_cumulative_rateratio_measurement);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->time_stamp.presence) {
+        r = pfcp_length_octet(&v->time_stamp, &ogs_pfcp_tlv_desc_time_stamp);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->network_instance.presence) {
+        r = pfcp_length_octet(&v->network_instance, &ogs_pfcp_tlv_desc_network_instance);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->apn_dnn.presence) {
+        r = pfcp_length_octet(&v->apn_dnn, &ogs_pfcp_tlv_desc_apn_dnn);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->s_nssai.presence) {
+        r = pfcp_length_octet(&v->s_nssai, &ogs_pfcp_tlv_desc_s_nssai);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Clock Drift Report]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_clock_drift_report(uint8_t *pos, ogs_pfcp_tlv_clock_drift_report_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->time_domain_number.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_TIME_DOMAIN_NUMBER_TYPE, &v->time_domain_number);
+    }
+    if (v->time_offset_measurement.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_TIME_OFFSET_MEASUREMENT_TYPE, &v->time_offset_measurement);
+    }
+    if (v->cumulative_rateratio_measurement.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_CUMULATIVE_RATERATIO_MEASUREMENT_TYPE, &v->cumulative_rateratio_measurement);
+    }
+    if (v->time_stamp.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_TIME_STAMP_TYPE, &v->time_stamp);
+    }
+    if (v->network_instance.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_NETWORK_INSTANCE_TYPE, &v->network_instance);
+    }
+    if (v->apn_dnn.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_APN_DNN_TYPE, &v->apn_dnn);
+    }
+    if (v->s_nssai.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_S_NSSAI_TYPE, &v->s_nssai);
+    }
+    pfcp_put_header(header, OGS_PFCP_CLOCK_DRIFT_REPORT_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_remove_srr(ogs_pfcp_tlv_remove_srr_t *v)
+{
+    int length = 0, r;
+
+    if (v->srr_id.presence) {
+        r = pfcp_length_octet(&v->srr_id, &ogs_pfcp_tlv_desc_srr_id);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Remove SRR]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_remove_srr(uint8_t *pos, ogs_pfcp_tlv_remove_srr_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->srr_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_SRR_ID_TYPE, &v->srr_id);
+    }
+    pfcp_put_header(header, OGS_PFCP_REMOVE_SRR_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_create_srr(ogs_pfcp_tlv_create_srr_t *v)
+{
+    int length = 0, r;
+
+    if (v->srr_id.presence) {
+        r = pfcp_length_octet(&v->srr_id, &ogs_pfcp_tlv_desc_srr_id);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->access_availability_control_information.presence) {
+        r = pfcp_length_octet(&v->access_availability_control_information, &ogs_pfcp_tlv_desc_access_availability_control_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->qos_monitoring_per_qos_flow_control_information.presence) {
+        r = pfcp_length_octet(&v->qos_monitoring_per_qos_flow_control_information, &ogs_pfcp_tlv_desc_qos_monitoring_per_qos_flow_control_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->direct_reporting_information.presence) {
+        r = pfcp_length_octet(&v->direct_reporting_information, &ogs_pfcp_tlv_desc_direct_reporting_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Create SRR]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_create_srr(uint8_t *pos, ogs_pfcp_tlv_create_srr_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->srr_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_SRR_ID_TYPE, &v->srr_id);
+    }
+    if (v->access_availability_control_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_ACCESS_AVAILABILITY_CONTROL_INFORMATION_TYPE, &v->access_availability_control_information);
+    }
+    if (v->qos_monitoring_per_qos_flow_control_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_QOS_MONITORING_PER_QOS_FLOW_CONTROL_INFORMATION_TYPE, &v->qos_monitoring_per_qos_flow_control_information);
+    }
+    if (v->direct_reporting_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_DIRECT_REPORTING_INFORMATION_TYPE, &v->direct_reporting_information);
+    }
+    pfcp_put_header(header, OGS_PFCP_CREATE_SRR_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_update_srr(ogs_pfcp_tlv_update_srr_t *v)
+{
+    int length = 0, r;
+
+    if (v->srr_id.presence) {
+        r = pfcp_length_octet(&v->srr_id, &ogs_pfcp_tlv_desc_srr_id);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->access_availability_control_information.presence) {
+        r = pfcp_length_octet(&v->access_availability_control_information, &ogs_pfcp_tlv_desc_access_availability_control_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->qos_monitoring_per_qos_flow_control_information.presence) {
+        r = pfcp_length_octet(&v->qos_monitoring_per_qos_flow_control_information, &ogs_pfcp_tlv_desc_qos_monitoring_per_qos_flow_control_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->direct_reporting_information.presence) {
+        r = pfcp_length_octet(&v->direct_reporting_information, &ogs_pfcp_tlv_desc_direct_reporting_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Update SRR]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_update_srr(uint8_t *pos, ogs_pfcp_tlv_update_srr_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->srr_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_SRR_ID_TYPE, &v->srr_id);
+    }
+    if (v->access_availability_control_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_ACCESS_AVAILABILITY_CONTROL_INFORMATION_TYPE, &v->access_availability_control_information);
+    }
+    if (v->qos_monitoring_per_qos_flow_control_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_QOS_MONITORING_PER_QOS_FLOW_CONTROL_INFORMATION_TYPE, &v->qos_monitoring_per_qos_flow_control_information);
+    }
+    if (v->direct_reporting_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_DIRECT_REPORTING_INFORMATION_TYPE, &v->direct_reporting_information);
+    }
+    pfcp_put_header(header, OGS_PFCP_UPDATE_SRR_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_session_report(ogs_pfcp_tlv_session_report_t *v)
+{
+    int length = 0, r;
+
+    if (v->srr_id.presence) {
+        r = pfcp_length_octet(&v->srr_id, &ogs_pfcp_tlv_desc_srr_id);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->access_availability_report.presence) {
+        r = pfcp_length_access_availability_report(&v->access_availability_report);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->qos_monitoring_report.presence) {
+        r = pfcp_length_qos_monitoring_report(&v->qos_monitoring_report);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Session Report]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_session_report(uint8_t *pos, ogs_pfcp_tlv_session_report_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->srr_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_SRR_ID_TYPE, &v->srr_id);
+    }
+    if (v->access_availability_report.presence) {
+        pos = pfcp_put_access_availability_report(pos, &v->access_availability_report);
+    }
+    if (v->qos_monitoring_report.presence) {
+        pos = pfcp_put_qos_monitoring_report(pos, &v->qos_monitoring_report);
+    }
+    pfcp_put_header(header, OGS_PFCP_SESSION_REPORT_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_provide_atsss_control_information(ogs_pfcp_tlv_provide_atsss_control_information_t *v)
+{
+    int length = 0, r;
+
+    if (v->mptcp_control_information.presence) {
+        r = pfcp_length_octet(&v->mptcp_control_information, &ogs_pfcp_tlv_desc_mptcp_control_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->atsss_ll_control_information.presence) {
+        r = pfcp_length_octet(&v->atsss_ll_control_information, &ogs_pfcp_tlv_desc_atsss_ll_control_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->pmf_control_information.presence) {
+        r = pfcp_length_octet(&v->pmf_control_information, &ogs_pfcp_tlv_desc_pmf_control_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Provide ATSSS Control Information]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_provide_atsss_control_information(uint8_t *pos, ogs_pfcp_tlv_provide_atsss_control_information_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->mptcp_control_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_MPTCP_CONTROL_INFORMATION_TYPE, &v->mptcp_control_information);
+    }
+    if (v->atsss_ll_control_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_ATSSS_LL_CONTROL_INFORMATION_TYPE, &v->atsss_ll_control_information);
+    }
+    if (v->pmf_control_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_PMF_CONTROL_INFORMATION_TYPE, &v->pmf_control_information);
+    }
+    pfcp_put_header(header, OGS_PFCP_PROVIDE_ATSSS_CONTROL_INFORMATION_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_atsss_control_parameters(ogs_pfcp_tlv_atsss_control_parameters_t *v)
+{
+    int length = 0, r;
+
+    if (v->mptcp_parameters.presence) {
+        r = pfcp_length_mptcp_parameters(&v->mptcp_parameters);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->atsss_ll_parameters.presence) {
+        r = pfcp_length_atsss_ll_parameters(&v->atsss_ll_parameters);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->pmf_parameters.presence) {
+        r = pfcp_length_pmf_parameters(&v->pmf_parameters);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [ATSSS Control Parameters]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_atsss_control_parameters(uint8_t *pos, ogs_pfcp_tlv_atsss_control_parameters_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->mptcp_parameters.presence) {
+        pos = pfcp_put_mptcp_parameters(pos, &v->mptcp_parameters);
+    }
+    if (v->atsss_ll_parameters.presence) {
+        pos = pfcp_put_atsss_ll_parameters(pos, &v->atsss_ll_parameters);
+    }
+    if (v->pmf_parameters.presence) {
+        pos = pfcp_put_pmf_parameters(pos, &v->pmf_parameters);
+    }
+    pfcp_put_header(header, OGS_PFCP_ATSSS_CONTROL_PARAMETERS_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_gtp_u_path_qos_report_pfcp_node_report_request(ogs_pfcp_tlv_gtp_u_path_qos_report_pfcp_node_report_request_t *v)
+{
+    int length = 0, r;
+
+    if (v->remote_gtp_u_peer.presence) {
+        r = pfcp_length_octet(&v->remote_gtp_u_peer, &ogs_pfcp_tlv_desc_remote_gtp_u_peer);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->gtp_u_path_interface_type.presence) {
+        r = pfcp_length_octet(&v->gtp_u_path_interface_type, &ogs_pfcp_tlv_desc_gtp_u_path_interface_type);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->qos_report_trigger.presence) {
+        r = pfcp_length_octet(&v->qos_report_trigger, &ogs_pfcp_tlv_desc_qos_report_trigger);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->dscp.presence) {
+        r = pfcp_length_octet(&v->dscp, &ogs_pfcp_tlv_desc_transport_level_marking);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->measurement_period.presence) {
+        length += 8;
+    }
+    if (v->average_packet_delay_threshold.presence) {
+        r = pfcp_length_octet(&v->average_packet_delay_threshold, &ogs_pfcp_tlv_desc_average_packet_delay);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->minimum_packet_delay_threshold.presence) {
+        r = pfcp_length_octet(&v->minimum_packet_delay_threshold, &ogs_pfcp_tlv_desc_minimum_packet_delay);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->maximum_packet_delay_threshold.presence) {
+        r = pfcp_length_octet(&v->maximum_packet_delay_threshold, &ogs_pfcp_tlv_desc_maximum_packet_delay);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->minimum_waiting_time.presence) {
+        r = pfcp_length_octet(&v->minimum_waiting_time, &ogs_pfcp_tlv_desc_timer);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [GTP-U Path QoS Report PFCP Node Report Request]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_gtp_u_path_qos_report_pfcp_node_report_request(uint8_t *pos, ogs_pfcp_tlv_gtp_u_path_qos_report_pfcp_node_report_request_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->remote_gtp_u_peer.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_REMOTE_GTP_U_PEER_TYPE, &v->remote_gtp_u_peer);
+    }
+    if (v->gtp_u_path_interface_type.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_GTP_U_PATH_INTERFACE_TYPE_TYPE, &v->gtp_u_path_interface_type);
+    }
+    if (v->qos_report_trigger.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_QOS_REPORT_TRIGGER_TYPE, &v->qos_report_trigger);
+    }
+    if (v->dscp.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_TRANSPORT_LEVEL_MARKING_TYPE, &v->dscp);
+    }
+    if (v->measurement_period.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_MEASUREMENT_PERIOD_TYPE, &v->measurement_period);
+    }
+    if (v->average_packet_delay_threshold.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_AVERAGE_PACKET_DELAY_TYPE, &v->average_packet_delay_threshold);
+    }
+    if (v->minimum_packet_delay_threshold.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_MINIMUM_PACKET_DELAY_TYPE, &v->minimum_packet_delay_threshold);
+    }
+    if (v->maximum_packet_delay_threshold.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_MAXIMUM_PACKET_DELAY_TYPE, &v->maximum_packet_delay_threshold);
+    }
+    if (v->minimum_waiting_time.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_TIMER_TYPE, &v->minimum_waiting_time);
+    }
+    pfcp_put_header(header, OGS_PFCP_GTP_U_PATH_QOS_REPORT_PFCP_NODE_REPORT_REQUEST_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_packet_rate_status_report(ogs_pfcp_tlv_packet_rate_status_report_t *v)
+{
+    int length = 0, r;
+
+    if (v->qer_id.presence) {
+        length += 8;
+    }
+    if (v->packet_rate_status.presence) {
+        r = pfcp_length_octet(&v->packet_rate_status, &ogs_pfcp_tlv_desc_packet_rate_status);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Packet Rate Status Report]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_packet_rate_status_report(uint8_t *pos, ogs_pfcp_tlv_packet_rate_status_report_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->qer_id.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_QER_ID_TYPE, &v->qer_id);
+    }
+    if (v->packet_rate_status.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_PACKET_RATE_STATUS_TYPE, &v->packet_rate_status);
+    }
+    pfcp_put_header(header, OGS_PFCP_PACKET_RATE_STATUS_REPORT_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_ethernet_context_information(ogs_pfcp_tlv_ethernet_context_information_t *v)
+{
+    int length = 0, r;
+
+    if (v->mac_addresses_detected.presence) {
+        r = pfcp_length_octet(&v->mac_addresses_detected, &ogs_pfcp_tlv_desc_mac_addresses_detected);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Ethernet Context Information]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_ethernet_context_information(uint8_t *pos, ogs_pfcp_tlv_ethernet_context_information_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->mac_addresses_detected.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_MAC_ADDRESSES_DETECTED_TYPE, &v->mac_addresses_detected);
+    }
+    pfcp_put_header(header, OGS_PFCP_ETHERNET_CONTEXT_INFORMATION_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_updated_pdr(ogs_pfcp_tlv_updated_pdr_t *v)
+{
+    int length = 0, r;
+
+    if (v->pdr_id.presence) {
+        length += 6;
+    }
+    if (v->local_f_teid_for_redundant_transmission.presence) {
+        r = pfcp_length_octet(&v->local_f_teid_for_redundant_transmission, &ogs_pfcp_tlv_desc_f_teid);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->local_f_teid.presence) {
+        r = pfcp_length_octet(&v->local_f_teid, &ogs_pfcp_tlv_desc_f_teid);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->ue_ip_address.presence) {
+        r = pfcp_length_octet(&v->ue_ip_address, &ogs_pfcp_tlv_desc_ue_ip_address);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Updated PDR]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_updated_pdr(uint8_t *pos, ogs_pfcp_tlv_updated_pdr_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->pdr_id.presence) {
+        pos = pfcp_put_uint16(pos, OGS_PFCP_PDR_ID_TYPE, &v->pdr_id);
+    }
+    if (v->local_f_teid_for_redundant_transmission.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_F_TEID_TYPE, &v->local_f_teid_for_redundant_transmission);
+    }
+    if (v->local_f_teid.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_F_TEID_TYPE, &v->local_f_teid);
+    }
+    if (v->ue_ip_address.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_UE_IP_ADDRESS_TYPE, &v->ue_ip_address);
+    }
+    pfcp_put_header(header, OGS_PFCP_UPDATED_PDR_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_provide_rds_configuration_information(ogs_pfcp_tlv_provide_rds_configuration_information_t *v)
+{
+    int length = 0, r;
+
+    if (v->rds_configuration_information.presence) {
+        r = pfcp_length_octet(&v->rds_configuration_information, &ogs_pfcp_tlv_desc_rds_configuration_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Provide RDS Configuration Information]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_provide_rds_configuration_information(uint8_t *pos, ogs_pfcp_tlv_provide_rds_configuration_information_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->rds_configuration_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_RDS_CONFIGURATION_INFORMATION_TYPE, &v->rds_configuration_information);
+    }
+    pfcp_put_header(header, OGS_PFCP_PROVIDE_RDS_CONFIGURATION_INFORMATION_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_query_packet_rate_status_ie_within_pfcp_session_modification_request(ogs_pfcp_tlv_query_packet_rate_status_ie_within_pfcp_session_modification_request_t *v)
+{
+    int length = 0;
+
+    if (v->qer_id.presence) {
+        length += 8;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Query Packet Rate Status IE within PFCP Session Modification Request]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_query_packet_rate_status_ie_within_pfcp_session_modification_request(uint8_t *pos, ogs_pfcp_tlv_query_packet_rate_status_ie_within_pfcp_session_modification_request_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->qer_id.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_QER_ID_TYPE, &v->qer_id);
+    }
+    pfcp_put_header(header, OGS_PFCP_QUERY_PACKET_RATE_STATUS_IE_WITHIN_PFCP_SESSION_MODIFICATION_REQUEST_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_ue_ip_address_usage_information(ogs_pfcp_tlv_ue_ip_address_usage_information_t *v)
+{
+    int length = 0, r;
+
+    if (v->ue_ip_address_usage_sequence_number.presence) {
+        r = pfcp_length_octet(&v->ue_ip_address_usage_sequence_number, &ogs_pfcp_tlv_desc_sequence_number);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->ue_ip_address_usage_metric.presence) {
+        r = pfcp_length_octet(&v->ue_ip_address_usage_metric, &ogs_pfcp_tlv_desc_metric);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->validity_timer.presence) {
+        r = pfcp_length_octet(&v->validity_timer, &ogs_pfcp_tlv_desc_validity_timer);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->number_of_ue_ip_addresses.presence) {
+        r = pfcp_length_octet(&v->number_of_ue_ip_addresses, &ogs_pfcp_tlv_desc_number_of_ue_ip_addresses);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->network_instance.presence) {
+        r = pfcp_length_octet(&v->network_instance, &ogs_pfcp_tlv_desc_network_instance);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->ue_ip_address_pool_id.presence) {
+        r = pfcp_length_octet(&v->ue_ip_address_pool_id, &ogs_pfcp_tlv_desc_ue_ip_address);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->s_nssai.presence) {
+        r = pfcp_length_octet(&v->s_nssai, &ogs_pfcp_tlv_desc_s_nssai);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [UE IP Address Usage Information]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_ue_ip_address_usage_information(uint8_t *pos, ogs_pfcp_tlv_ue_ip_address_usage_information_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->ue_ip_address_usage_sequence_number.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_SEQUENCE_NUMBER_TYPE, &v->ue_ip_address_usage_sequence_number);
+    }
+    if (v->ue_ip_address_usage_metric.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_METRIC_TYPE, &v->ue_ip_address_usage_metric);
+    }
+    if (v->validity_timer.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_VALIDITY_TIMER_TYPE, &v->validity_timer);
+    }
+    if (v->number_of_ue_ip_addresses.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_NUMBER_OF_UE_IP_ADDRESSES_TYPE, &v->number_of_ue_ip_addresses);
+    }
+    if (v->network_instance.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_NETWORK_INSTANCE_TYPE, &v->network_instance);
+    }
+    if (v->ue_ip_address_pool_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_UE_IP_ADDRESS_TYPE, &v->ue_ip_address_pool_id);
+    }
+    if (v->s_nssai.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_S_NSSAI_TYPE, &v->s_nssai);
+    }
+    pfcp_put_header(header, OGS_PFCP_UE_IP_ADDRESS_USAGE_INFORMATION_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_partial_failure_information(ogs_pfcp_tlv_partial_failure_information_t *v)
+{
+    int length = 0, r;
+
+    if (v->failed_rule_id.presence) {
+        r = pfcp_length_octet(&v->failed_rule_id, &ogs_pfcp_tlv_desc_failed_rule_id);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->failure_cause.presence) {
+        length += 5;
+    }
+    if (v->offending_ie_information.presence) {
+        r = pfcp_length_octet(&v->offending_ie_information, &ogs_pfcp_tlv_desc_offending_ie_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Partial Failure Information]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_partial_failure_information(uint8_t *pos, ogs_pfcp_tlv_partial_failure_information_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->failed_rule_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_FAILED_RULE_ID_TYPE, &v->failed_rule_id);
+    }
+    if (v->failure_cause.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_CAUSE_TYPE, &v->failure_cause);
+    }
+    if (v->offending_ie_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_OFFENDING_IE_INFORMATION_TYPE, &v->offending_ie_information);
+    }
+    pfcp_put_header(header, OGS_PFCP_PARTIAL_FAILURE_INFORMATION_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_l2tp_tunnel_information(ogs_pfcp_tlv_l2tp_tunnel_information_t *v)
+{
+    int length = 0, r;
+
+    if (v->lns_address.presence) {
+        r = pfcp_length_octet(&v->lns_address, &ogs_pfcp_tlv_desc_lns_address);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->tunnel_password.presence) {
+        r = pfcp_length_octet(&v->tunnel_password, &ogs_pfcp_tlv_desc_tunnel_password);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->tunnel_preference.presence) {
+        r = pfcp_length_octet(&v->tunnel_preference, &ogs_pfcp_tlv_desc_tunnel_preference);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [L2TP Tunnel Information]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_l2tp_tunnel_information(uint8_t *pos, ogs_pfcp_tlv_l2tp_tunnel_information_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->lns_address.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_LNS_ADDRESS_TYPE, &v->lns_address);
+    }
+    if (v->tunnel_password.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_TUNNEL_PASSWORD_TYPE, &v->tunnel_password);
+    }
+    if (v->tunnel_preference.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_TUNNEL_PREFERENCE_TYPE, &v->tunnel_preference);
+    }
+    pfcp_put_header(header, OGS_PFCP_L2TP_TUNNEL_INFORMATION_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_l2tp_session_information(ogs_pfcp_tlv_l2tp_session_information_t *v)
+{
+    int length = 0, r;
+
+    if (v->calling_number.presence) {
+        r = pfcp_length_octet(&v->calling_number, &ogs_pfcp_tlv_desc_calling_number);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->called_number.presence) {
+        r = pfcp_length_octet(&v->called_number, &ogs_pfcp_tlv_desc_called_number);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->maximum_receive_unit.presence) {
+        r = pfcp_length_octet(&v->maximum_receive_unit, &ogs_pfcp_tlv_desc_maximum_receive_unit);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->l2tp_session_indications.presence) {
+        r = pfcp_length_octet(&v->l2tp_session_indications, &ogs_pfcp_tlv_desc_l2tp_session_indications);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->l2tp_user_authentication.presence) {
+        r = pfcp_length_octet(&v->l2tp_user_authentication, &ogs_pfcp_tlv_desc_l2tp_user_authentication_ie);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [L2TP Session Information]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_l2tp_session_information(uint8_t *pos, ogs_pfcp_tlv_l2tp_session_information_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->calling_number.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_CALLING_NUMBER_TYPE, &v->calling_number);
+    }
+    if (v->called_number.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_CALLED_NUMBER_TYPE, &v->called_number);
+    }
+    if (v->maximum_receive_unit.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_MAXIMUM_RECEIVE_UNIT_TYPE, &v->maximum_receive_unit);
+    }
+    if (v->l2tp_session_indications.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_L2TP_SESSION_INDICATIONS_TYPE, &v->l2tp_session_indications);
+    }
+    if (v->l2tp_user_authentication.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_L2TP_USER_AUTHENTICATION_IE_TYPE, &v->l2tp_user_authentication);
+    }
+    pfcp_put_header(header, OGS_PFCP_L2TP_SESSION_INFORMATION_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_created_l2tp_session(ogs_pfcp_tlv_created_l2tp_session_t *v)
+{
+    int length = 0, r;
+
+    if (v->dns_server_address.presence) {
+        r = pfcp_length_octet(&v->dns_server_address, &ogs_pfcp_tlv_desc_dns_server_address);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->nbns_server_address.presence) {
+        r = pfcp_length_octet(&v->nbns_server_address, &ogs_pfcp_tlv_desc_nbns_server_address);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->lns_address.presence) {
+        r = pfcp_length_octet(&v->lns_address, &ogs_pfcp_tlv_desc_lns_address);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [Created L2TP Session]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_created_l2tp_session(uint8_t *pos, ogs_pfcp_tlv_created_l2tp_session_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->dns_server_address.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_DNS_SERVER_ADDRESS_TYPE, &v->dns_server_address);
+    }
+    if (v->nbns_server_address.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_NBNS_SERVER_ADDRESS_TYPE, &v->nbns_server_address);
+    }
+    if (v->lns_address.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_LNS_ADDRESS_TYPE, &v->lns_address);
+    }
+    pfcp_put_header(header, OGS_PFCP_CREATED_L2TP_SESSION_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_pfcp_session_change_info(ogs_pfcp_tlv_pfcp_session_change_info_t *v)
+{
+    int length = 0, r;
+
+    if (v->pgw_c_smf_fq_csid.presence) {
+        r = pfcp_length_octet(&v->pgw_c_smf_fq_csid, &ogs_pfcp_tlv_desc_fq_csid);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->group_id.presence) {
+        r = pfcp_length_octet(&v->group_id, &ogs_pfcp_tlv_desc_group_id);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->cp_ip_address.presence) {
+        r = pfcp_length_octet(&v->cp_ip_address, &ogs_pfcp_tlv_desc_cp_ip_address);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->alternative_smf_pgw_c_ip_address.presence) {
+        r = pfcp_length_octet(&v->alternative_smf_pgw_c_ip_address, &ogs_pfcp_tlv_desc_alternative_smf_ip_address);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [PFCP Session Change Info]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_pfcp_session_change_info(uint8_t *pos, ogs_pfcp_tlv_pfcp_session_change_info_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->pgw_c_smf_fq_csid.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_FQ_CSID_TYPE, &v->pgw_c_smf_fq_csid);
+    }
+    if (v->group_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_GROUP_ID_TYPE, &v->group_id);
+    }
+    if (v->cp_ip_address.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_CP_IP_ADDRESS_TYPE, &v->cp_ip_address);
+    }
+    if (v->alternative_smf_pgw_c_ip_address.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_ALTERNATIVE_SMF_IP_ADDRESS_TYPE, &v->alternative_smf_pgw_c_ip_address);
+    }
+    pfcp_put_header(header, OGS_PFCP_PFCP_SESSION_CHANGE_INFO_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_mbs_session_n4mb_control_information(ogs_pfcp_tlv_mbs_session_n4mb_control_information_t *v)
+{
+    int length = 0, r;
+
+    if (v->mbs_session_identifier.presence) {
+        r = pfcp_length_octet(&v->mbs_session_identifier, &ogs_pfcp_tlv_desc_mbs_session_identifier);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->area_session_id.presence) {
+        r = pfcp_length_octet(&v->area_session_id, &ogs_pfcp_tlv_desc_area_session_id);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->mbsn4mbreq_flags.presence) {
+        r = pfcp_length_octet(&v->mbsn4mbreq_flags, &ogs_pfcp_tlv_desc_mbsn4mbreq_flags);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->multicast_transport_information_for_n3mb_and_or_n19mb.presence) {
+        r = pfcp_length_octet(&v->multicast_transport_information_for_n3mb_and_or_n19mb, &ogs_pfcp_tlv_desc_multicast_transport_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [MBS Session N4mb Control Information]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_mbs_session_n4mb_control_information(uint8_t *pos, ogs_pfcp_tlv_mbs_session_n4mb_control_information_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->mbs_session_identifier.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_MBS_SESSION_IDENTIFIER_TYPE, &v->mbs_session_identifier);
+    }
+    if (v->area_session_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_AREA_SESSION_ID_TYPE, &v->area_session_id);
+    }
+    if (v->mbsn4mbreq_flags.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_MBSN4MBREQ_FLAGS_TYPE, &v->mbsn4mbreq_flags);
+    }
+    if (v->multicast_transport_information_for_n3mb_and_or_n19mb.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_MULTICAST_TRANSPORT_INFORMATION_TYPE, &v->multicast_transport_information_for_n3mb_and_or_n19mb);
+    }
+    pfcp_put_header(header, OGS_PFCP_MBS_SESSION_N4MB_CONTROL_INFORMATION_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_mbs_session_n4mb_information(ogs_pfcp_tlv_mbs_session_n4mb_information_t *v)
+{
+    int length = 0, r;
+
+    if (v->multicast_transport_information.presence) {
+        r = pfcp_length_octet(&v->multicast_transport_information, &ogs_pfcp_tlv_desc_multicast_transport_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [MBS Session N4mb Information]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_mbs_session_n4mb_information(uint8_t *pos, ogs_pfcp_tlv_mbs_session_n4mb_information_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->multicast_transport_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_MULTICAST_TRANSPORT_INFORMATION_TYPE, &v->multicast_transport_information);
+    }
+    pfcp_put_header(header, OGS_PFCP_MBS_SESSION_N4MB_INFORMATION_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_mbs_session_n4_control_information(ogs_pfcp_tlv_mbs_session_n4_control_information_t *v)
+{
+    int length = 0, r;
+
+    if (v->mbs_session_identifier.presence) {
+        r = pfcp_length_octet(&v->mbs_session_identifier, &ogs_pfcp_tlv_desc_mbs_session_identifier);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->area_session_id.presence) {
+        r = pfcp_length_octet(&v->area_session_id, &ogs_pfcp_tlv_desc_area_session_id);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->multicast_transport_information.presence) {
+        r = pfcp_length_octet(&v->multicast_transport_information, &ogs_pfcp_tlv_desc_multicast_transport_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [MBS Session N4 Control Information]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_mbs_session_n4_control_information(uint8_t *pos, ogs_pfcp_tlv_mbs_session_n4_control_information_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->mbs_session_identifier.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_MBS_SESSION_IDENTIFIER_TYPE, &v->mbs_session_identifier);
+    }
+    if (v->area_session_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_AREA_SESSION_ID_TYPE, &v->area_session_id);
+    }
+    if (v->multicast_transport_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_MULTICAST_TRANSPORT_INFORMATION_TYPE, &v->multicast_transport_information);
+    }
+    pfcp_put_header(header, OGS_PFCP_MBS_SESSION_N4_CONTROL_INFORMATION_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_mbs_session_n4_information(ogs_pfcp_tlv_mbs_session_n4_information_t *v)
+{
+    int length = 0, r;
+
+    if (v->mbs_session_identifier.presence) {
+        r = pfcp_length_octet(&v->mbs_session_identifier, &ogs_pfcp_tlv_desc_mbs_session_identifier);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->area_session_id.presence) {
+        r = pfcp_length_octet(&v->area_session_id, &ogs_pfcp_tlv_desc_area_session_id);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->n19mb_dl_tunnel_id.presence) {
+        r = pfcp_length_octet(&v->n19mb_dl_tunnel_id, &ogs_pfcp_tlv_desc_f_teid);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->mbsn4resp_flags.presence) {
+        r = pfcp_length_octet(&v->mbsn4resp_flags, &ogs_pfcp_tlv_desc_mbsn4resp_flags);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [MBS Session N4 Information]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_mbs_session_n4_information(uint8_t *pos, ogs_pfcp_tlv_mbs_session_n4_information_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->mbs_session_identifier.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_MBS_SESSION_IDENTIFIER_TYPE, &v->mbs_session_identifier);
+    }
+    if (v->area_session_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_AREA_SESSION_ID_TYPE, &v->area_session_id);
+    }
+    if (v->n19mb_dl_tunnel_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_F_TEID_TYPE, &v->n19mb_dl_tunnel_id);
+    }
+    if (v->mbsn4resp_flags.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_MBSN4RESP_FLAGS_TYPE, &v->mbsn4resp_flags);
+    }
+    pfcp_put_header(header, OGS_PFCP_MBS_SESSION_N4_INFORMATION_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+static int pfcp_length_dscp_to_ppi_control_information(ogs_pfcp_tlv_dscp_to_ppi_control_information_t *v)
+{
+    int length = 0, r;
+
+    if (v->dscp_to_ppi_mapping_information.presence) {
+        r = pfcp_length_octet(&v->dscp_to_ppi_mapping_information, &ogs_pfcp_tlv_desc_dscp_to_ppi_mapping_information);
+        if (r < 0)
+            return OGS_ERROR;
+        length += r;
+    }
+    if (v->qfi.presence) {
+        length += 5;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [DSCP to PPI Control Information]");
+        return OGS_ERROR;
+    }
+
+    return 4 + length;
+}
+
+static uint8_t *pfcp_put_dscp_to_ppi_control_information(uint8_t *pos, ogs_pfcp_tlv_dscp_to_ppi_control_information_t *v)
+{
+    uint8_t *header = pos;
+
+    pos += 4;
+    if (v->dscp_to_ppi_mapping_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_DSCP_TO_PPI_MAPPING_INFORMATION_TYPE, &v->dscp_to_ppi_mapping_information);
+    }
+    if (v->qfi.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_QFI_TYPE, &v->qfi);
+    }
+    pfcp_put_header(header, OGS_PFCP_DSCP_TO_PPI_CONTROL_INFORMATION_TYPE, pos - header - 4);
+
+    return pos;
+}
+
+ogs_pkbuf_t *ogs_pfcp_build_heartbeat_request_direct(ogs_pfcp_heartbeat_request_t *v)
+{
+    ogs_pkbuf_t *pkbuf = NULL;
+    uint8_t *pos = NULL;
+    int length = 0, r;
+
+    ogs_assert(v);
+
+    if (v->recovery_time_stamp.presence) {
+        length += 8;
+    }
+    if (v->source_ip_address.presence) {
+        r = pfcp_length_octet(&v->source_ip_address, &ogs_pfcp_tlv_desc_source_ip_address);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [PFCP Heartbeat Request]");
+        return NULL;
+    }
+
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_TLV_MAX_HEADROOM+length);
+    if (!pkbuf) {
+        ogs_error("ogs_pkbuf_alloc() failed");
+        return NULL;
+    }
+    ogs_pkbuf_reserve(pkbuf, OGS_TLV_MAX_HEADROOM);
+    pos = ogs_pkbuf_put(pkbuf, length);
+
+    if (v->recovery_time_stamp.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_RECOVERY_TIME_STAMP_TYPE, &v->recovery_time_stamp);
+    }
+    if (v->source_ip_address.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_SOURCE_IP_ADDRESS_TYPE, &v->source_ip_address);
+    }
+    ogs_assert(pos == pkbuf->tail);
+
+    return pkbuf;
+}
+
+ogs_pkbuf_t *ogs_pfcp_build_heartbeat_response_direct(ogs_pfcp_heartbeat_response_t *v)
+{
+    ogs_pkbuf_t *pkbuf = NULL;
+    uint8_t *pos = NULL;
+    int length = 0;
+
+    ogs_assert(v);
+
+    if (v->recovery_time_stamp.presence) {
+        length += 8;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [PFCP Heartbeat Response]");
+        return NULL;
+    }
+
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_TLV_MAX_HEADROOM+length);
+    if (!pkbuf) {
+        ogs_error("ogs_pkbuf_alloc() failed");
+        return NULL;
+    }
+    ogs_pkbuf_reserve(pkbuf, OGS_TLV_MAX_HEADROOM);
+    pos = ogs_pkbuf_put(pkbuf, length);
+
+    if (v->recovery_time_stamp.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_RECOVERY_TIME_STAMP_TYPE, &v->recovery_time_stamp);
+    }
+    ogs_assert(pos == pkbuf->tail);
+
+    return pkbuf;
+}
+
+ogs_pkbuf_t *ogs_pfcp_build_pfd_management_request_direct(ogs_pfcp_pfd_management_request_t *v)
+{
+    ogs_pkbuf_t *pkbuf = NULL;
+    uint8_t *pos = NULL;
+    int length = 0, r;
+
+    ogs_assert(v);
+
+    if (v->application_id_s_pfds.presence) {
+        r = pfcp_length_application_id_s_pfds(&v->application_id_s_pfds);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->node_id.presence) {
+        r = pfcp_length_octet(&v->node_id, &ogs_pfcp_tlv_desc_node_id);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [PFCP PFD Management Request]");
+        return NULL;
+    }
+
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_TLV_MAX_HEADROOM+length);
+    if (!pkbuf) {
+        ogs_error("ogs_pkbuf_alloc() failed");
+        return NULL;
+    }
+    ogs_pkbuf_reserve(pkbuf, OGS_TLV_MAX_HEADROOM);
+    pos = ogs_pkbuf_put(pkbuf, length);
+
+    if (v->application_id_s_pfds.presence) {
+        pos = pfcp_put_application_id_s_pfds(pos, &v->application_id_s_pfds);
+    }
+    if (v->node_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_NODE_ID_TYPE, &v->node_id);
+    }
+    ogs_assert(pos == pkbuf->tail);
+
+    return pkbuf;
+}
+
+ogs_pkbuf_t *ogs_pfcp_build_pfd_management_response_direct(ogs_pfcp_pfd_management_response_t *v)
+{
+    ogs_pkbuf_t *pkbuf = NULL;
+    uint8_t *pos = NULL;
+    int length = 0, r;
+
+    ogs_assert(v);
+
+    if (v->cause.presence) {
+        length += 5;
+    }
+    if (v->offending_ie.presence) {
+        length += 6;
+    }
+    if (v->node_id.presence) {
+        r = pfcp_length_octet(&v->node_id, &ogs_pfcp_tlv_desc_node_id);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [PFCP PFD Management Response]");
+        return NULL;
+    }
+
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_TLV_MAX_HEADROOM+length);
+    if (!pkbuf) {
+        ogs_error("ogs_pkbuf_alloc() failed");
+        return NULL;
+    }
+    ogs_pkbuf_reserve(pkbuf, OGS_TLV_MAX_HEADROOM);
+    pos = ogs_pkbuf_put(pkbuf, length);
+
+    if (v->cause.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_CAUSE_TYPE, &v->cause);
+    }
+    if (v->offending_ie.presence) {
+        pos = pfcp_put_uint16(pos, OGS_PFCP_OFFENDING_IE_TYPE, &v->offending_ie);
+    }
+    if (v->node_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_NODE_ID_TYPE, &v->node_id);
+    }
+    ogs_assert(pos == pkbuf->tail);
+
+    return pkbuf;
+}
+
+ogs_pkbuf_t *ogs_pfcp_build_association_setup_request_direct(ogs_pfcp_association_setup_request_t *v)
+{
+    ogs_pkbuf_t *pkbuf = NULL;
+    uint8_t *pos = NULL;
+    int i, length = 0, r;
+
+    ogs_assert(v);
+
+    if (v->node_id.presence) {
+        r = pfcp_length_octet(&v->node_id, &ogs_pfcp_tlv_desc_node_id);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->recovery_time_stamp.presence) {
+        length += 8;
+    }
+    if (v->up_function_features.presence) {
+        r = pfcp_length_octet(&v->up_function_features, &ogs_pfcp_tlv_desc_up_function_features);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->cp_function_features.presence) {
+        length += 5;
+    }
+    for (i = 0; i < 4 && v->user_plane_ip_resource_information[i].presence; i++) {
+        r = pfcp_length_octet(&v->user_plane_ip_resource_information[i], &ogs_pfcp_tlv_desc_user_plane_ip_resource_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->alternative_smf_ip_address.presence) {
+        r = pfcp_length_octet(&v->alternative_smf_ip_address, &ogs_pfcp_tlv_desc_alternative_smf_ip_address);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->smf_set_id.presence) {
+        r = pfcp_length_octet(&v->smf_set_id, &ogs_pfcp_tlv_desc_smf_set_id);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->pfcp_session_retention_information.presence) {
+        r = pfcp_length_pfcp_session_retention_information_within_pfcp_association_setup_request(&v->pfcp_session_retention_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->ue_ip_address_pool_information.presence) {
+        r = pfcp_length_octet(&v->ue_ip_address_pool_information, &ogs_pfcp_tlv_desc_ue_ip_address);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->gtp_u_path_qos_control_information.presence) {
+        r = pfcp_length_octet(&v->gtp_u_path_qos_control_information, &ogs_pfcp_tlv_desc_gtp_u_path_qos_control_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->clock_drift_control_information.presence) {
+        r = pfcp_length_clock_drift_control_information(&v->clock_drift_control_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->upf_instance_id.presence) {
+        r = pfcp_length_octet(&v->upf_instance_id, &ogs_pfcp_tlv_desc_nf_instance_id);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->pfcpasreq_flags.presence) {
+        r = pfcp_length_octet(&v->pfcpasreq_flags, &ogs_pfcp_tlv_desc_pfcpasreq_flags);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [PFCP Association Setup Request]");
+        return NULL;
+    }
+
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_TLV_MAX_HEADROOM+length);
+    if (!pkbuf) {
+        ogs_error("ogs_pkbuf_alloc() failed");
+        return NULL;
+    }
+    ogs_pkbuf_reserve(pkbuf, OGS_TLV_MAX_HEADROOM);
+    pos = ogs_pkbuf_put(pkbuf, length);
+
+    if (v->node_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_NODE_ID_TYPE, &v->node_id);
+    }
+    if (v->recovery_time_stamp.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_RECOVERY_TIME_STAMP_TYPE, &v->recovery_time_stamp);
+    }
+    if (v->up_function_features.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_UP_FUNCTION_FEATURES_TYPE, &v->up_function_features);
+    }
+    if (v->cp_function_features.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_CP_FUNCTION_FEATURES_TYPE, &v->cp_function_features);
+    }
+    for (i = 0; i < 4 && v->user_plane_ip_resource_information[i].presence; i++) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_USER_PLANE_IP_RESOURCE_INFORMATION_TYPE, &v->user_plane_ip_resource_information[i]);
+    }
+    if (v->alternative_smf_ip_address.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_ALTERNATIVE_SMF_IP_ADDRESS_TYPE, &v->alternative_smf_ip_address);
+    }
+    if (v->smf_set_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_SMF_SET_ID_TYPE, &v->smf_set_id);
+    }
+    if (v->pfcp_session_retention_information.presence) {
+        pos = pfcp_put_pfcp_session_retention_information_within_pfcp_association_setup_request(pos, &v->pfcp_session_retention_information);
+    }
+    if (v->ue_ip_address_pool_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_UE_IP_ADDRESS_TYPE, &v->ue_ip_address_pool_information);
+    }
+    if (v->gtp_u_path_qos_control_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_GTP_U_PATH_QOS_CONTROL_INFORMATION_TYPE, &v->gtp_u_path_qos_control_information);
+    }
+    if (v->clock_drift_control_information.presence) {
+        pos = pfcp_put_clock_drift_control_information(pos, &v->clock_drift_control_information);
+    }
+    if (v->upf_instance_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_NF_INSTANCE_ID_TYPE, &v->upf_instance_id);
+    }
+    if (v->pfcpasreq_flags.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_PFCPASREQ_FLAGS_TYPE, &v->pfcpasreq_flags);
+    }
+    ogs_assert(pos == pkbuf->tail);
+
+    return pkbuf;
+}
+
+ogs_pkbuf_t *ogs_pfcp_build_association_setup_response_direct(ogs_pfcp_association_setup_response_t *v)
+{
+    ogs_pkbuf_t *pkbuf = NULL;
+    uint8_t *pos = NULL;
+    int i, length = 0, r;
+
+    ogs_assert(v);
+
+    if (v->node_id.presence) {
+        r = pfcp_length_octet(&v->node_id, &ogs_pfcp_tlv_desc_node_id);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->cause.presence) {
+        length += 5;
+    }
+    if (v->recovery_time_stamp.presence) {
+        length += 8;
+    }
+    if (v->up_function_features.presence) {
+        r = pfcp_length_octet(&v->up_function_features, &ogs_pfcp_tlv_desc_up_function_features);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->cp_function_features.presence) {
+        length += 5;
+    }
+    for (i = 0; i < 4 && v->user_plane_ip_resource_information[i].presence; i++) {
+        r = pfcp_length_octet(&v->user_plane_ip_resource_information[i], &ogs_pfcp_tlv_desc_user_plane_ip_resource_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->alternative_smf_ip_address.presence) {
+        r = pfcp_length_octet(&v->alternative_smf_ip_address, &ogs_pfcp_tlv_desc_alternative_smf_ip_address);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->smf_set_id.presence) {
+        r = pfcp_length_octet(&v->smf_set_id, &ogs_pfcp_tlv_desc_smf_set_id);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->pfcpasrsp_flags.presence) {
+        r = pfcp_length_octet(&v->pfcpasrsp_flags, &ogs_pfcp_tlv_desc_pfcpasrsp_flags);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->clock_drift_control_information.presence) {
+        r = pfcp_length_clock_drift_control_information(&v->clock_drift_control_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->ue_ip_address_pool_information.presence) {
+        r = pfcp_length_octet(&v->ue_ip_address_pool_information, &ogs_pfcp_tlv_desc_ue_ip_address);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->gtp_u_path_qos_control_information.presence) {
+        r = pfcp_length_octet(&v->gtp_u_path_qos_control_information, &ogs_pfcp_tlv_desc_gtp_u_path_qos_control_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->upf_instance_id.presence) {
+        r = pfcp_length_octet(&v->upf_instance_id, &ogs_pfcp_tlv_desc_nf_instance_id);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [PFCP Association Setup Response]");
+        return NULL;
+    }
+
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_TLV_MAX_HEADROOM+length);
+    if (!pkbuf) {
+        ogs_error("ogs_pkbuf_alloc() failed");
+        return NULL;
+    }
+    ogs_pkbuf_reserve(pkbuf, OGS_TLV_MAX_HEADROOM);
+    pos = ogs_pkbuf_put(pkbuf, length);
+
+    if (v->node_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_NODE_ID_TYPE, &v->node_id);
+    }
+    if (v->cause.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_CAUSE_TYPE, &v->cause);
+    }
+    if (v->recovery_time_stamp.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_RECOVERY_TIME_STAMP_TYPE, &v->recovery_time_stamp);
+    }
+    if (v->up_function_features.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_UP_FUNCTION_FEATURES_TYPE, &v->up_function_features);
+    }
+    if (v->cp_function_features.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_CP_FUNCTION_FEATURES_TYPE, &v->cp_function_features);
+    }
+    for (i = 0; i < 4 && v->user_plane_ip_resource_information[i].presence; i++) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_USER_PLANE_IP_RESOURCE_INFORMATION_TYPE, &v->user_plane_ip_resource_information[i]);
+    }
+    if (v->alternative_smf_ip_address.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_ALTERNATIVE_SMF_IP_ADDRESS_TYPE, &v->alternative_smf_ip_address);
+    }
+    if (v->smf_set_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_SMF_SET_ID_TYPE, &v->smf_set_id);
+    }
+    if (v->pfcpasrsp_flags.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_PFCPASRSP_FLAGS_TYPE, &v->pfcpasrsp_flags);
+    }
+    if (v->clock_drift_control_information.presence) {
+        pos = pfcp_put_clock_drift_control_information(pos, &v->clock_drift_control_information);
+    }
+    if (v->ue_ip_address_pool_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_UE_IP_ADDRESS_TYPE, &v->ue_ip_address_pool_information);
+    }
+    if (v->gtp_u_path_qos_control_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_GTP_U_PATH_QOS_CONTROL_INFORMATION_TYPE, &v->gtp_u_path_qos_control_information);
+    }
+    if (v->upf_instance_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_NF_INSTANCE_ID_TYPE, &v->upf_instance_id);
+    }
+    ogs_assert(pos == pkbuf->tail);
+
+    return pkbuf;
+}
+
+ogs_pkbuf_t *ogs_pfcp_build_association_update_request_direct(ogs_pfcp_association_update_request_t *v)
+{
+    ogs_pkbuf_t *pkbuf = NULL;
+    uint8_t *pos = NULL;
+    int i, length = 0, r;
+
+    ogs_assert(v);
+
+    if (v->node_id.presence) {
+        r = pfcp_length_octet(&v->node_id, &ogs_pfcp_tlv_desc_node_id);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->up_function_features.presence) {
+        r = pfcp_length_octet(&v->up_function_features, &ogs_pfcp_tlv_desc_up_function_features);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->cp_function_features.presence) {
+        length += 5;
+    }
+    for (i = 0; i < 4 && v->user_plane_ip_resource_information[i].presence; i++) {
+        r = pfcp_length_octet(&v->user_plane_ip_resource_information[i], &ogs_pfcp_tlv_desc_user_plane_ip_resource_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->pfcp_association_release_request.presence) {
+        r = pfcp_length_octet(&v->pfcp_association_release_request, &ogs_pfcp_tlv_desc_pfcp_association_release_request);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->graceful_release_period.presence) {
+        r = pfcp_length_octet(&v->graceful_release_period, &ogs_pfcp_tlv_desc_graceful_release_period);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->pfcpaureq_flags.presence) {
+        length += 5;
+    }
+    if (v->alternative_smf_ip_address.presence) {
+        r = pfcp_length_octet(&v->alternative_smf_ip_address, &ogs_pfcp_tlv_desc_alternative_smf_ip_address);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->smf_set_id.presence) {
+        r = pfcp_length_octet(&v->smf_set_id, &ogs_pfcp_tlv_desc_smf_set_id);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->clock_drift_control_information.presence) {
+        r = pfcp_length_clock_drift_control_information(&v->clock_drift_control_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->ue_ip_address_pool_information.presence) {
+        r = pfcp_length_octet(&v->ue_ip_address_pool_information, &ogs_pfcp_tlv_desc_ue_ip_address);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->gtp_u_path_qos_control_information.presence) {
+        r = pfcp_length_octet(&v->gtp_u_path_qos_control_information, &ogs_pfcp_tlv_desc_gtp_u_path_qos_control_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->ue_ip_address_usage_information.presence) {
+        r = pfcp_length_ue_ip_address_usage_information(&v->ue_ip_address_usage_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [PFCP Association Update Request]");
+        return NULL;
+    }
+
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_TLV_MAX_HEADROOM+length);
+    if (!pkbuf) {
+        ogs_error("ogs_pkbuf_alloc() failed");
+        return NULL;
+    }
+    ogs_pkbuf_reserve(pkbuf, OGS_TLV_MAX_HEADROOM);
+    pos = ogs_pkbuf_put(pkbuf, length);
+
+    if (v->node_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_NODE_ID_TYPE, &v->node_id);
+    }
+    if (v->up_function_features.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_UP_FUNCTION_FEATURES_TYPE, &v->up_function_features);
+    }
+    if (v->cp_function_features.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_CP_FUNCTION_FEATURES_TYPE, &v->cp_function_features);
+    }
+    for (i = 0; i < 4 && v->user_plane_ip_resource_information[i].presence; i++) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_USER_PLANE_IP_RESOURCE_INFORMATION_TYPE, &v->user_plane_ip_resource_information[i]);
+    }
+    if (v->pfcp_association_release_request.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_PFCP_ASSOCIATION_RELEASE_REQUEST_TYPE, &v->pfcp_association_release_request);
+    }
+    if (v->graceful_release_period.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_GRACEFUL_RELEASE_PERIOD_TYPE, &v->graceful_release_period);
+    }
+    if (v->pfcpaureq_flags.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_PFCPAUREQ_FLAGS_TYPE, &v->pfcpaureq_flags);
+    }
+    if (v->alternative_smf_ip_address.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_ALTERNATIVE_SMF_IP_ADDRESS_TYPE, &v->alternative_smf_ip_address);
+    }
+    if (v->smf_set_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_SMF_SET_ID_TYPE, &v->smf_set_id);
+    }
+    if (v->clock_drift_control_information.presence) {
+        pos = pfcp_put_clock_drift_control_information(pos, &v->clock_drift_control_information);
+    }
+    if (v->ue_ip_address_pool_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_UE_IP_ADDRESS_TYPE, &v->ue_ip_address_pool_information);
+    }
+    if (v->gtp_u_path_qos_control_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_GTP_U_PATH_QOS_CONTROL_INFORMATION_TYPE, &v->gtp_u_path_qos_control_information);
+    }
+    if (v->ue_ip_address_usage_information.presence) {
+        pos = pfcp_put_ue_ip_address_usage_information(pos, &v->ue_ip_address_usage_information);
+    }
+    ogs_assert(pos == pkbuf->tail);
+
+    return pkbuf;
+}
+
+ogs_pkbuf_t *ogs_pfcp_build_association_update_response_direct(ogs_pfcp_association_update_response_t *v)
+{
+    ogs_pkbuf_t *pkbuf = NULL;
+    uint8_t *pos = NULL;
+    int i, length = 0, r;
+
+    ogs_assert(v);
+
+    if (v->node_id.presence) {
+        r = pfcp_length_octet(&v->node_id, &ogs_pfcp_tlv_desc_node_id);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->cause.presence) {
+        length += 5;
+    }
+    if (v->up_function_features.presence) {
+        r = pfcp_length_octet(&v->up_function_features, &ogs_pfcp_tlv_desc_up_function_features);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->cp_function_features.presence) {
+        length += 5;
+    }
+    for (i = 0; i < 4 && v->user_plane_ip_resource_information[i].presence; i++) {
+        r = pfcp_length_octet(&v->user_plane_ip_resource_information[i], &ogs_pfcp_tlv_desc_user_plane_ip_resource_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->ue_ip_address_usage_information.presence) {
+        r = pfcp_length_ue_ip_address_usage_information(&v->ue_ip_address_usage_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [PFCP Association Update Response]");
+        return NULL;
+    }
+
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_TLV_MAX_HEADROOM+length);
+    if (!pkbuf) {
+        ogs_error("ogs_pkbuf_alloc() failed");
+        return NULL;
+    }
+    ogs_pkbuf_reserve(pkbuf, OGS_TLV_MAX_HEADROOM);
+    pos = ogs_pkbuf_put(pkbuf, length);
+
+    if (v->node_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_NODE_ID_TYPE, &v->node_id);
+    }
+    if (v->cause.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_CAUSE_TYPE, &v->cause);
+    }
+    if (v->up_function_features.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_UP_FUNCTION_FEATURES_TYPE, &v->up_function_features);
+    }
+    if (v->cp_function_features.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_CP_FUNCTION_FEATURES_TYPE, &v->cp_function_features);
+    }
+    for (i = 0; i < 4 && v->user_plane_ip_resource_information[i].presence; i++) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_USER_PLANE_IP_RESOURCE_INFORMATION_TYPE, &v->user_plane_ip_resource_information[i]);
+    }
+    if (v->ue_ip_address_usage_information.presence) {
+        pos = pfcp_put_ue_ip_address_usage_information(pos, &v->ue_ip_address_usage_information);
+    }
+    ogs_assert(pos == pkbuf->tail);
+
+    return pkbuf;
+}
+
+ogs_pkbuf_t *ogs_pfcp_build_association_release_request_direct(ogs_pfcp_association_release_request_t *v)
+{
+    ogs_pkbuf_t *pkbuf = NULL;
+    uint8_t *pos = NULL;
+    int length = 0, r;
+
+    ogs_assert(v);
+
+    if (v->node_id.presence) {
+        r = pfcp_length_octet(&v->node_id, &ogs_pfcp_tlv_desc_node_id);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [PFCP Association Release Request]");
+        return NULL;
+    }
+
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_TLV_MAX_HEADROOM+length);
+    if (!pkbuf) {
+        ogs_error("ogs_pkbuf_alloc() failed");
+        return NULL;
+    }
+    ogs_pkbuf_reserve(pkbuf, OGS_TLV_MAX_HEADROOM);
+    pos = ogs_pkbuf_put(pkbuf, length);
+
+    if (v->node_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_NODE_ID_TYPE, &v->node_id);
+    }
+    ogs_assert(pos == pkbuf->tail);
+
+    return pkbuf;
+}
+
+ogs_pkbuf_t *ogs_pfcp_build_association_release_response_direct(ogs_pfcp_association_release_response_t *v)
+{
+    ogs_pkbuf_t *pkbuf = NULL;
+    uint8_t *pos = NULL;
+    int length = 0, r;
+
+    ogs_assert(v);
+
+    if (v->node_id.presence) {
+        r = pfcp_length_octet(&v->node_id, &ogs_pfcp_tlv_desc_node_id);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->cause.presence) {
+        length += 5;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [PFCP Association Release Response]");
+        return NULL;
+    }
+
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_TLV_MAX_HEADROOM+length);
+    if (!pkbuf) {
+        ogs_error("ogs_pkbuf_alloc() failed");
+        return NULL;
+    }
+    ogs_pkbuf_reserve(pkbuf, OGS_TLV_MAX_HEADROOM);
+    pos = ogs_pkbuf_put(pkbuf, length);
+
+    if (v->node_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_NODE_ID_TYPE, &v->node_id);
+    }
+    if (v->cause.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_CAUSE_TYPE, &v->cause);
+    }
+    ogs_assert(pos == pkbuf->tail);
+
+    return pkbuf;
+}
+
+ogs_pkbuf_t *ogs_pfcp_build_version_not_supported_response_direct(ogs_pfcp_version_not_supported_response_t *v)
+{
+    ogs_pkbuf_t *pkbuf = NULL;
+    uint8_t *pos = NULL;
+    int length = 0;
+
+    ogs_assert(v);
+
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_TLV_MAX_HEADROOM+length);
+    if (!pkbuf) {
+        ogs_error("ogs_pkbuf_alloc() failed");
+        return NULL;
+    }
+    ogs_pkbuf_reserve(pkbuf, OGS_TLV_MAX_HEADROOM);
+    pos = ogs_pkbuf_put(pkbuf, length);
+
+    ogs_assert(pos == pkbuf->tail);
+
+    return pkbuf;
+}
+
+ogs_pkbuf_t *ogs_pfcp_build_node_report_request_direct(ogs_pfcp_node_report_request_t *v)
+{
+    ogs_pkbuf_t *pkbuf = NULL;
+    uint8_t *pos = NULL;
+    int length = 0, r;
+
+    ogs_assert(v);
+
+    if (v->node_id.presence) {
+        r = pfcp_length_octet(&v->node_id, &ogs_pfcp_tlv_desc_node_id);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->node_report_type.presence) {
+        r = pfcp_length_octet(&v->node_report_type, &ogs_pfcp_tlv_desc_node_report_type);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->vendor_specific_node_report_type.presence) {
+        r = pfcp_length_octet(&v->vendor_specific_node_report_type, &ogs_pfcp_tlv_desc_vendor_specific_node_report_type);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->user_plane_path_failure_report.presence) {
+        r = pfcp_length_user_plane_path_failure_report(&v->user_plane_path_failure_report);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->user_plane_path_recovery_report.presence) {
+        r = pfcp_length_user_plane_path_recovery_report(&v->user_plane_path_recovery_report);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->clock_drift_report.presence) {
+        r = pfcp_length_clock_drift_report(&v->clock_drift_report);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->gtp_u_path_qos_report.presence) {
+        r = pfcp_length_gtp_u_path_qos_report_pfcp_node_report_request(&v->gtp_u_path_qos_report);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->peer_up_restart_report.presence) {
+        r = pfcp_length_octet(&v->peer_up_restart_report, &ogs_pfcp_tlv_desc_peer_up_restart_report);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [PFCP Node Report Request]");
+        return NULL;
+    }
+
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_TLV_MAX_HEADROOM+length);
+    if (!pkbuf) {
+        ogs_error("ogs_pkbuf_alloc() failed");
+        return NULL;
+    }
+    ogs_pkbuf_reserve(pkbuf, OGS_TLV_MAX_HEADROOM);
+    pos = ogs_pkbuf_put(pkbuf, length);
+
+    if (v->node_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_NODE_ID_TYPE, &v->node_id);
+    }
+    if (v->node_report_type.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_NODE_REPORT_TYPE_TYPE, &v->node_report_type);
+    }
+    if (v->vendor_specific_node_report_type.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_VENDOR_SPECIFIC_NODE_REPORT_TYPE_TYPE, &v->vendor_specific_node_report_type);
+    }
+    if (v->user_plane_path_failure_report.presence) {
+        pos = pfcp_put_user_plane_path_failure_report(pos, &v->user_plane_path_failure_report);
+    }
+    if (v->user_plane_path_recovery_report.presence) {
+        pos = pfcp_put_user_plane_path_recovery_report(pos, &v->user_plane_path_recovery_report);
+    }
+    if (v->clock_drift_report.presence) {
+        pos = pfcp_put_clock_drift_report(pos, &v->clock_drift_report);
+    }
+    if (v->gtp_u_path_qos_report.presence) {
+        pos = pfcp_put_gtp_u_path_qos_report_pfcp_node_report_request(pos, &v->gtp_u_path_qos_report);
+    }
+    if (v->peer_up_restart_report.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_PEER_UP_RESTART_REPORT_TYPE, &v->peer_up_restart_report);
+    }
+    ogs_assert(pos == pkbuf->tail);
+
+    return pkbuf;
+}
+
+ogs_pkbuf_t *ogs_pfcp_build_node_report_response_direct(ogs_pfcp_node_report_response_t *v)
+{
+    ogs_pkbuf_t *pkbuf = NULL;
+    uint8_t *pos = NULL;
+    int length = 0, r;
+
+    ogs_assert(v);
+
+    if (v->node_id.presence) {
+        r = pfcp_length_octet(&v->node_id, &ogs_pfcp_tlv_desc_node_id);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->cause.presence) {
+        length += 5;
+    }
+    if (v->offending_ie.presence) {
+        length += 6;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [PFCP Node Report Response]");
+        return NULL;
+    }
+
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_TLV_MAX_HEADROOM+length);
+    if (!pkbuf) {
+        ogs_error("ogs_pkbuf_alloc() failed");
+        return NULL;
+    }
+    ogs_pkbuf_reserve(pkbuf, OGS_TLV_MAX_HEADROOM);
+    pos = ogs_pkbuf_put(pkbuf, length);
+
+    if (v->node_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_NODE_ID_TYPE, &v->node_id);
+    }
+    if (v->cause.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_CAUSE_TYPE, &v->cause);
+    }
+    if (v->offending_ie.presence) {
+        pos = pfcp_put_uint16(pos, OGS_PFCP_OFFENDING_IE_TYPE, &v->offending_ie);
+    }
+    ogs_assert(pos == pkbuf->tail);
+
+    return pkbuf;
+}
+
+ogs_pkbuf_t *ogs_pfcp_build_session_set_deletion_request_direct(ogs_pfcp_session_set_deletion_request_t *v)
+{
+    ogs_pkbuf_t *pkbuf = NULL;
+    uint8_t *pos = NULL;
+    int length = 0, r;
+
+    ogs_assert(v);
+
+    if (v->node_id.presence) {
+        r = pfcp_length_octet(&v->node_id, &ogs_pfcp_tlv_desc_node_id);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->sgw_c_fq_csid.presence) {
+        r = pfcp_length_octet(&v->sgw_c_fq_csid, &ogs_pfcp_tlv_desc_fq_csid);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->pgw_c_smf_fq_csid.presence) {
+        r = pfcp_length_octet(&v->pgw_c_smf_fq_csid, &ogs_pfcp_tlv_desc_fq_csid);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->pgw_u_sgw_u__upf_fq_csid.presence) {
+        r = pfcp_length_octet(&v->pgw_u_sgw_u__upf_fq_csid, &ogs_pfcp_tlv_desc_fq_csid);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->twan_fq_csid.presence) {
+        r = pfcp_length_octet(&v->twan_fq_csid, &ogs_pfcp_tlv_desc_fq_csid);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->epdg_fq_csid.presence) {
+        r = pfcp_length_octet(&v->epdg_fq_csid, &ogs_pfcp_tlv_desc_fq_csid);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->mme_fq_csid.presence) {
+        r = pfcp_length_octet(&v->mme_fq_csid, &ogs_pfcp_tlv_desc_fq_csid);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [PFCP Session Set Deletion Request]");
+        return NULL;
+    }
+
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_TLV_MAX_HEADROOM+length);
+    if (!pkbuf) {
+        ogs_error("ogs_pkbuf_alloc() failed");
+        return NULL;
+    }
+    ogs_pkbuf_reserve(pkbuf, OGS_TLV_MAX_HEADROOM);
+    pos = ogs_pkbuf_put(pkbuf, length);
+
+    if (v->node_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_NODE_ID_TYPE, &v->node_id);
+    }
+    if (v->sgw_c_fq_csid.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_FQ_CSID_TYPE, &v->sgw_c_fq_csid);
+    }
+    if (v->pgw_c_smf_fq_csid.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_FQ_CSID_TYPE, &v->pgw_c_smf_fq_csid);
+    }
+    if (v->pgw_u_sgw_u__upf_fq_csid.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_FQ_CSID_TYPE, &v->pgw_u_sgw_u__upf_fq_csid);
+    }
+    if (v->twan_fq_csid.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_FQ_CSID_TYPE, &v->twan_fq_csid);
+    }
+    if (v->epdg_fq_csid.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_FQ_CSID_TYPE, &v->epdg_fq_csid);
+    }
+    if (v->mme_fq_csid.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_FQ_CSID_TYPE, &v->mme_fq_csid);
+    }
+    ogs_assert(pos == pkbuf->tail);
+
+    return pkbuf;
+}
+
+ogs_pkbuf_t *ogs_pfcp_build_session_set_deletion_response_direct(ogs_pfcp_session_set_deletion_response_t *v)
+{
+    ogs_pkbuf_t *pkbuf = NULL;
+    uint8_t *pos = NULL;
+    int length = 0, r;
+
+    ogs_assert(v);
+
+    if (v->node_id.presence) {
+        r = pfcp_length_octet(&v->node_id, &ogs_pfcp_tlv_desc_node_id);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->cause.presence) {
+        length += 5;
+    }
+    if (v->offending_ie.presence) {
+        length += 6;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [PFCP Session Set Deletion Response]");
+        return NULL;
+    }
+
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_TLV_MAX_HEADROOM+length);
+    if (!pkbuf) {
+        ogs_error("ogs_pkbuf_alloc() failed");
+        return NULL;
+    }
+    ogs_pkbuf_reserve(pkbuf, OGS_TLV_MAX_HEADROOM);
+    pos = ogs_pkbuf_put(pkbuf, length);
+
+    if (v->node_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_NODE_ID_TYPE, &v->node_id);
+    }
+    if (v->cause.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_CAUSE_TYPE, &v->cause);
+    }
+    if (v->offending_ie.presence) {
+        pos = pfcp_put_uint16(pos, OGS_PFCP_OFFENDING_IE_TYPE, &v->offending_ie);
+    }
+    ogs_assert(pos == pkbuf->tail);
+
+    return pkbuf;
+}
+
+ogs_pkbuf_t *ogs_pfcp_build_session_set_modification_request_direct(ogs_pfcp_session_set_modification_request_t *v)
+{
+    ogs_pkbuf_t *pkbuf = NULL;
+    uint8_t *pos = NULL;
+    int length = 0, r;
+
+    ogs_assert(v);
+
+    if (v->node_id.presence) {
+        r = pfcp_length_octet(&v->node_id, &ogs_pfcp_tlv_desc_node_id);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->pfcp_session_change_info.presence) {
+        r = pfcp_length_pfcp_session_change_info(&v->pfcp_session_change_info);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [PFCP Session Set Modification Request]");
+        return NULL;
+    }
+
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_TLV_MAX_HEADROOM+length);
+    if (!pkbuf) {
+        ogs_error("ogs_pkbuf_alloc() failed");
+        return NULL;
+    }
+    ogs_pkbuf_reserve(pkbuf, OGS_TLV_MAX_HEADROOM);
+    pos = ogs_pkbuf_put(pkbuf, length);
+
+    if (v->node_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_NODE_ID_TYPE, &v->node_id);
+    }
+    if (v->pfcp_session_change_info.presence) {
+        pos = pfcp_put_pfcp_session_change_info(pos, &v->pfcp_session_change_info);
+    }
+    ogs_assert(pos == pkbuf->tail);
+
+    return pkbuf;
+}
+
+ogs_pkbuf_t *ogs_pfcp_build_session_set_modification_response_direct(ogs_pfcp_session_set_modification_response_t *v)
+{
+    ogs_pkbuf_t *pkbuf = NULL;
+    uint8_t *pos = NULL;
+    int length = 0, r;
+
+    ogs_assert(v);
+
+    if (v->node_id.presence) {
+        r = pfcp_length_octet(&v->node_id, &ogs_pfcp_tlv_desc_node_id);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->cause.presence) {
+        length += 5;
+    }
+    if (v->offending_ie.presence) {
+        length += 6;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [PFCP Session Set Modification Response]");
+        return NULL;
+    }
+
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_TLV_MAX_HEADROOM+length);
+    if (!pkbuf) {
+        ogs_error("ogs_pkbuf_alloc() failed");
+        return NULL;
+    }
+    ogs_pkbuf_reserve(pkbuf, OGS_TLV_MAX_HEADROOM);
+    pos = ogs_pkbuf_put(pkbuf, length);
+
+    if (v->node_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_NODE_ID_TYPE, &v->node_id);
+    }
+    if (v->cause.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_CAUSE_TYPE, &v->cause);
+    }
+    if (v->offending_ie.presence) {
+        pos = pfcp_put_uint16(pos, OGS_PFCP_OFFENDING_IE_TYPE, &v->offending_ie);
+    }
+    ogs_assert(pos == pkbuf->tail);
+
+    return pkbuf;
+}
+
+ogs_pkbuf_t *ogs_pfcp_build_session_establishment_request_direct(ogs_pfcp_session_establishment_request_t *v)
+{
+    ogs_pkbuf_t *pkbuf = NULL;
+    uint8_t *pos = NULL;
+    int i, length = 0, r;
+
+    ogs_assert(v);
+
+    if (v->node_id.presence) {
+        r = pfcp_length_octet(&v->node_id, &ogs_pfcp_tlv_desc_node_id);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->cp_f_seid.presence) {
+        r = pfcp_length_octet(&v->cp_f_seid, &ogs_pfcp_tlv_desc_f_seid);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    for (i = 0; i < 16 && v->create_pdr[i].presence; i++) {
+        r = pfcp_length_create_pdr(&v->create_pdr[i]);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    for (i = 0; i < 16 && v->create_far[i].presence; i++) {
+        r = pfcp_length_create_far(&v->create_far[i]);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    for (i = 0; i < 16 && v->create_urr[i].presence; i++) {
+        r = pfcp_length_create_urr(&v->create_urr[i]);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    for (i = 0; i < 4 && v->create_qer[i].presence; i++) {
+        r = pfcp_length_create_qer(&v->create_qer[i]);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->create_bar.presence) {
+        r = pfcp_length_create_bar(&v->create_bar);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->create_traffic_endpoint.presence) {
+        r = pfcp_length_create_traffic_endpoint(&v->create_traffic_endpoint);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->pdn_type.presence) {
+        length += 5;
+    }
+    if (v->sgw_c_fq_csid.presence) {
+        r = pfcp_length_octet(&v->sgw_c_fq_csid, &ogs_pfcp_tlv_desc_fq_csid);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->mme_fq_csid.presence) {
+        r = pfcp_length_octet(&v->mme_fq_csid, &ogs_pfcp_tlv_desc_fq_csid);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->pgw_c_smf_fq_csid.presence) {
+        r = pfcp_length_octet(&v->pgw_c_smf_fq_csid, &ogs_pfcp_tlv_desc_fq_csid);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->epdg_fq_csid.presence) {
+        r = pfcp_length_octet(&v->epdg_fq_csid, &ogs_pfcp_tlv_desc_fq_csid);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->twan_fq_csid.presence) {
+        r = pfcp_length_octet(&v->twan_fq_csid, &ogs_pfcp_tlv_desc_fq_csid);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->user_plane_inactivity_timer.presence) {
+        r = pfcp_length_octet(&v->user_plane_inactivity_timer, &ogs_pfcp_tlv_desc_user_plane_inactivity_timer);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->user_id.presence) {
+        r = pfcp_length_octet(&v->user_id, &ogs_pfcp_tlv_desc_user_id);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->trace_information.presence) {
+        r = pfcp_length_octet(&v->trace_information, &ogs_pfcp_tlv_desc_trace_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->apn_dnn.presence) {
+        r = pfcp_length_octet(&v->apn_dnn, &ogs_pfcp_tlv_desc_apn_dnn);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->create_mar.presence) {
+        r = pfcp_length_create_mar(&v->create_mar);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->pfcpsereq_flags.presence) {
+        length += 5;
+    }
+    if (v->create_bridge_info_for_tsc.presence) {
+        r = pfcp_length_octet(&v->create_bridge_info_for_tsc, &ogs_pfcp_tlv_desc_create_bridge_info_for_tsc);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->create_srr.presence) {
+        r = pfcp_length_create_srr(&v->create_srr);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->provide_atsss_control_information.presence) {
+        r = pfcp_length_provide_atsss_control_information(&v->provide_atsss_control_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->recovery_time_stamp.presence) {
+        length += 8;
+    }
+    if (v->s_nssai.presence) {
+        r = pfcp_length_octet(&v->s_nssai, &ogs_pfcp_tlv_desc_s_nssai);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->provide_rds_configuration_information.presence) {
+        r = pfcp_length_provide_rds_configuration_information(&v->provide_rds_configuration_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->rat_type.presence) {
+        r = pfcp_length_octet(&v->rat_type, &ogs_pfcp_tlv_desc_rat_type);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->l2tp_tunnel_information.presence) {
+        r = pfcp_length_l2tp_tunnel_information(&v->l2tp_tunnel_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->l2tp_session_information.presence) {
+        r = pfcp_length_l2tp_session_information(&v->l2tp_session_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->group_id.presence) {
+        r = pfcp_length_octet(&v->group_id, &ogs_pfcp_tlv_desc_group_id);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->mbs_session_n4mb_control_information.presence) {
+        r = pfcp_length_mbs_session_n4mb_control_information(&v->mbs_session_n4mb_control_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->mbs_session_n4_control_information.presence) {
+        r = pfcp_length_mbs_session_n4_control_information(&v->mbs_session_n4_control_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->dscp_to_ppi_control_information.presence) {
+        r = pfcp_length_dscp_to_ppi_control_information(&v->dscp_to_ppi_control_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [PFCP Session Establishment Request]");
+        return NULL;
+    }
+
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_TLV_MAX_HEADROOM+length);
+    if (!pkbuf) {
+        ogs_error("ogs_pkbuf_alloc() failed");
+        return NULL;
+    }
+    ogs_pkbuf_reserve(pkbuf, OGS_TLV_MAX_HEADROOM);
+    pos = ogs_pkbuf_put(pkbuf, length);
+
+    if (v->node_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_NODE_ID_TYPE, &v->node_id);
+    }
+    if (v->cp_f_seid.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_F_SEID_TYPE, &v->cp_f_seid);
+    }
+    for (i = 0; i < 16 && v->create_pdr[i].presence; i++) {
+        pos = pfcp_put_create_pdr(pos, &v->create_pdr[i]);
+    }
+    for (i = 0; i < 16 && v->create_far[i].presence; i++) {
+        pos = pfcp_put_create_far(pos, &v->create_far[i]);
+    }
+    for (i = 0; i < 16 && v->create_urr[i].presence; i++) {
+        pos = pfcp_put_create_urr(pos, &v->create_urr[i]);
+    }
+    for (i = 0; i < 4 && v->create_qer[i].presence; i++) {
+        pos = pfcp_put_create_qer(pos, &v->create_qer[i]);
+    }
+    if (v->create_bar.presence) {
+        pos = pfcp_put_create_bar(pos, &v->create_bar);
+    }
+    if (v->create_traffic_endpoint.presence) {
+        pos = pfcp_put_create_traffic_endpoint(pos, &v->create_traffic_endpoint);
+    }
+    if (v->pdn_type.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_PDN_TYPE_TYPE, &v->pdn_type);
+    }
+    if (v->sgw_c_fq_csid.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_FQ_CSID_TYPE, &v->sgw_c_fq_csid);
+    }
+    if (v->mme_fq_csid.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_FQ_CSID_TYPE, &v->mme_fq_csid);
+    }
+    if (v->pgw_c_smf_fq_csid.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_FQ_CSID_TYPE, &v->pgw_c_smf_fq_csid);
+    }
+    if (v->epdg_fq_csid.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_FQ_CSID_TYPE, &v->epdg_fq_csid);
+    }
+    if (v->twan_fq_csid.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_FQ_CSID_TYPE, &v->twan_fq_csid);
+    }
+    if (v->user_plane_inactivity_timer.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_USER_PLANE_INACTIVITY_TIMER_TYPE, &v->user_plane_inactivity_timer);
+    }
+    if (v->user_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_USER_ID_TYPE, &v->user_id);
+    }
+    if (v->trace_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_TRACE_INFORMATION_TYPE, &v->trace_information);
+    }
+    if (v->apn_dnn.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_APN_DNN_TYPE, &v->apn_dnn);
+    }
+    if (v->create_mar.presence) {
+        pos = pfcp_put_create_mar(pos, &v->create_mar);
+    }
+    if (v->pfcpsereq_flags.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_PFCPSEREQ_FLAGS_TYPE, &v->pfcpsereq_flags);
+    }
+    if (v->create_bridge_info_for_tsc.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_CREATE_BRIDGE_INFO_FOR_TSC_TYPE, &v->create_bridge_info_for_tsc);
+    }
+    if (v->create_srr.presence) {
+        pos = pfcp_put_create_srr(pos, &v->create_srr);
+    }
+    if (v->provide_atsss_control_information.presence) {
+        pos = pfcp_put_provide_atsss_control_information(pos, &v->provide_atsss_control_information);
+    }
+    if (v->recovery_time_stamp.presence) {
+        pos = pfcp_put_uint32(pos, OGS_PFCP_RECOVERY_TIME_STAMP_TYPE, &v->recovery_time_stamp);
+    }
+    if (v->s_nssai.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_S_NSSAI_TYPE, &v->s_nssai);
+    }
+    if (v->provide_rds_configuration_information.presence) {
+        pos = pfcp_put_provide_rds_configuration_information(pos, &v->provide_rds_configuration_information);
+    }
+    if (v->rat_type.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_RAT_TYPE_TYPE, &v->rat_type);
+    }
+    if (v->l2tp_tunnel_information.presence) {
+        pos = pfcp_put_l2tp_tunnel_information(pos, &v->l2tp_tunnel_information);
+    }
+    if (v->l2tp_session_information.presence) {
+        pos = pfcp_put_l2tp_session_information(pos, &v->l2tp_session_information);
+    }
+    if (v->group_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_GROUP_ID_TYPE, &v->group_id);
+    }
+    if (v->mbs_session_n4mb_control_information.presence) {
+        pos = pfcp_put_mbs_session_n4mb_control_information(pos, &v->mbs_session_n4mb_control_information);
+    }
+    if (v->mbs_session_n4_control_information.presence) {
+        pos = pfcp_put_mbs_session_n4_control_information(pos, &v->mbs_session_n4_control_information);
+    }
+    if (v->dscp_to_ppi_control_information.presence) {
+        pos = pfcp_put_dscp_to_ppi_control_information(pos, &v->dscp_to_ppi_control_information);
+    }
+    ogs_assert(pos == pkbuf->tail);
+
+    return pkbuf;
+}
+
+ogs_pkbuf_t *ogs_pfcp_build_session_establishment_response_direct(ogs_pfcp_session_establishment_response_t *v)
+{
+    ogs_pkbuf_t *pkbuf = NULL;
+    uint8_t *pos = NULL;
+    int i, length = 0, r;
+
+    ogs_assert(v);
+
+    if (v->node_id.presence) {
+        r = pfcp_length_octet(&v->node_id, &ogs_pfcp_tlv_desc_node_id);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->cause.presence) {
+        length += 5;
+    }
+    if (v->offending_ie.presence) {
+        length += 6;
+    }
+    if (v->up_f_seid.presence) {
+        r = pfcp_length_octet(&v->up_f_seid, &ogs_pfcp_tlv_desc_f_seid);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    for (i = 0; i < 16 && v->created_pdr[i].presence; i++) {
+        r = pfcp_length_created_pdr(&v->created_pdr[i]);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->load_control_information.presence) {
+        r = pfcp_length_load_control_information(&v->load_control_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->overload_control_information.presence) {
+        r = pfcp_length_overload_control_information(&v->overload_control_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->pgw_u_sgw_u__upf_fq_csid.presence) {
+        r = pfcp_length_octet(&v->pgw_u_sgw_u__upf_fq_csid, &ogs_pfcp_tlv_desc_fq_csid);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->failed_rule_id.presence) {
+        r = pfcp_length_octet(&v->failed_rule_id, &ogs_pfcp_tlv_desc_failed_rule_id);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->created_traffic_endpoint.presence) {
+        r = pfcp_length_created_traffic_endpoint(&v->created_traffic_endpoint);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->created_bridge_info_for_tsc.presence) {
+        r = pfcp_length_created_bridge_info_for_tsc(&v->created_bridge_info_for_tsc);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->atsss_control_parameters.presence) {
+        r = pfcp_length_atsss_control_parameters(&v->atsss_control_parameters);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->rds_configuration_information.presence) {
+        r = pfcp_length_octet(&v->rds_configuration_information, &ogs_pfcp_tlv_desc_rds_configuration_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->partial_failure_information.presence) {
+        r = pfcp_length_partial_failure_information(&v->partial_failure_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->created_l2tp_session.presence) {
+        r = pfcp_length_created_l2tp_session(&v->created_l2tp_session);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->mbs_session_n4mb_information.presence) {
+        r = pfcp_length_mbs_session_n4mb_information(&v->mbs_session_n4mb_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->mbs_session_n4_information.presence) {
+        r = pfcp_length_mbs_session_n4_information(&v->mbs_session_n4_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [PFCP Session Establishment Response]");
+        return NULL;
+    }
+
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_TLV_MAX_HEADROOM+length);
+    if (!pkbuf) {
+        ogs_error("ogs_pkbuf_alloc() failed");
+        return NULL;
+    }
+    ogs_pkbuf_reserve(pkbuf, OGS_TLV_MAX_HEADROOM);
+    pos = ogs_pkbuf_put(pkbuf, length);
+
+    if (v->node_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_NODE_ID_TYPE, &v->node_id);
+    }
+    if (v->cause.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_CAUSE_TYPE, &v->cause);
+    }
+    if (v->offending_ie.presence) {
+        pos = pfcp_put_uint16(pos, OGS_PFCP_OFFENDING_IE_TYPE, &v->offending_ie);
+    }
+    if (v->up_f_seid.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_F_SEID_TYPE, &v->up_f_seid);
+    }
+    for (i = 0; i < 16 && v->created_pdr[i].presence; i++) {
+        pos = pfcp_put_created_pdr(pos, &v->created_pdr[i]);
+    }
+    if (v->load_control_information.presence) {
+        pos = pfcp_put_load_control_information(pos, &v->load_control_information);
+    }
+    if (v->overload_control_information.presence) {
+        pos = pfcp_put_overload_control_information(pos, &v->overload_control_information);
+    }
+    if (v->pgw_u_sgw_u__upf_fq_csid.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_FQ_CSID_TYPE, &v->pgw_u_sgw_u__upf_fq_csid);
+    }
+    if (v->failed_rule_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_FAILED_RULE_ID_TYPE, &v->failed_rule_id);
+    }
+    if (v->created_traffic_endpoint.presence) {
+        pos = pfcp_put_created_traffic_endpoint(pos, &v->created_traffic_endpoint);
+    }
+    if (v->created_bridge_info_for_tsc.presence) {
+        pos = pfcp_put_created_bridge_info_for_tsc(pos, &v->created_bridge_info_for_tsc);
+    }
+    if (v->atsss_control_parameters.presence) {
+        pos = pfcp_put_atsss_control_parameters(pos, &v->atsss_control_parameters);
+    }
+    if (v->rds_configuration_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_RDS_CONFIGURATION_INFORMATION_TYPE, &v->rds_configuration_information);
+    }
+    if (v->partial_failure_information.presence) {
+        pos = pfcp_put_partial_failure_information(pos, &v->partial_failure_information);
+    }
+    if (v->created_l2tp_session.presence) {
+        pos = pfcp_put_created_l2tp_session(pos, &v->created_l2tp_session);
+    }
+    if (v->mbs_session_n4mb_information.presence) {
+        pos = pfcp_put_mbs_session_n4mb_information(pos, &v->mbs_session_n4mb_information);
+    }
+    if (v->mbs_session_n4_information.presence) {
+        pos = pfcp_put_mbs_session_n4_information(pos, &v->mbs_session_n4_information);
+    }
+    ogs_assert(pos == pkbuf->tail);
+
+    return pkbuf;
+}
+
+ogs_pkbuf_t *ogs_pfcp_build_session_modification_request_direct(ogs_pfcp_session_modification_request_t *v)
+{
+    ogs_pkbuf_t *pkbuf = NULL;
+    uint8_t *pos = NULL;
+    int i, length = 0, r;
+
+    ogs_assert(v);
+
+    if (v->cp_f_seid.presence) {
+        r = pfcp_length_octet(&v->cp_f_seid, &ogs_pfcp_tlv_desc_f_seid);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    for (i = 0; i < 16 && v->remove_pdr[i].presence; i++) {
+        r = pfcp_length_remove_pdr(&v->remove_pdr[i]);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    for (i = 0; i < 16 && v->remove_far[i].presence; i++) {
+        r = pfcp_length_remove_far(&v->remove_far[i]);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    for (i = 0; i < 16 && v->remove_urr[i].presence; i++) {
+        r = pfcp_length_remove_urr(&v->remove_urr[i]);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    for (i = 0; i < 4 && v->remove_qer[i].presence; i++) {
+        r = pfcp_length_remove_qer(&v->remove_qer[i]);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->remove_bar.presence) {
+        r = pfcp_length_remove_bar(&v->remove_bar);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->remove_traffic_endpoint.presence) {
+        r = pfcp_length_remove_traffic_endpoint(&v->remove_traffic_endpoint);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    for (i = 0; i < 16 && v->create_pdr[i].presence; i++) {
+        r = pfcp_length_create_pdr(&v->create_pdr[i]);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    for (i = 0; i < 16 && v->create_far[i].presence; i++) {
+        r = pfcp_length_create_far(&v->create_far[i]);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    for (i = 0; i < 16 && v->create_urr[i].presence; i++) {
+        r = pfcp_length_create_urr(&v->create_urr[i]);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    for (i = 0; i < 4 && v->create_qer[i].presence; i++) {
+        r = pfcp_length_create_qer(&v->create_qer[i]);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->create_bar.presence) {
+        r = pfcp_length_create_bar(&v->create_bar);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->create_traffic_endpoint.presence) {
+        r = pfcp_length_create_traffic_endpoint(&v->create_traffic_endpoint);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    for (i = 0; i < 16 && v->update_pdr[i].presence; i++) {
+        r = pfcp_length_update_pdr(&v->update_pdr[i]);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    for (i = 0; i < 16 && v->update_far[i].presence; i++) {
+        r = pfcp_length_update_far(&v->update_far[i]);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    for (i = 0; i < 16 && v->update_urr[i].presence; i++) {
+        r = pfcp_length_update_urr(&v->update_urr[i]);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    for (i = 0; i < 4 && v->update_qer[i].presence; i++) {
+        r = pfcp_length_update_qer(&v->update_qer[i]);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->update_bar.presence) {
+        r = pfcp_length_update_bar_session_modification_request(&v->update_bar);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->update_traffic_endpoint.presence) {
+        r = pfcp_length_octet(&v->update_traffic_endpoint, &ogs_pfcp_tlv_desc_update_traffic_endpoint);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->pfcpsmreq_flags.presence) {
+        length += 5;
+    }
+    if (v->query_urr.presence) {
+        r = pfcp_length_query_urr(&v->query_urr);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->pgw_c_smf_fq_csid.presence) {
+        r = pfcp_length_octet(&v->pgw_c_smf_fq_csid, &ogs_pfcp_tlv_desc_fq_csid);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->sgw_c_fq_csid.presence) {
+        r = pfcp_length_octet(&v->sgw_c_fq_csid, &ogs_pfcp_tlv_desc_fq_csid);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->mme_fq_csid.presence) {
+        r = pfcp_length_octet(&v->mme_fq_csid, &ogs_pfcp_tlv_desc_fq_csid);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->epdg_fq_csid.presence) {
+        r = pfcp_length_octet(&v->epdg_fq_csid, &ogs_pfcp_tlv_desc_fq_csid);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->twan_fq_csid.presence) {
+        r = pfcp_length_octet(&v->twan_fq_csid, &ogs_pfcp_tlv_desc_fq_csid);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->user_plane_inactivity_timer.presence) {
+        r = pfcp_length_octet(&v->user_plane_inactivity_timer, &ogs_pfcp_tlv_desc_user_plane_inactivity_timer);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->query_urr_reference.presence) {
+        r = pfcp_length_octet(&v->query_urr_reference, &ogs_pfcp_tlv_desc_query_urr_reference);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->trace_information.presence) {
+        r = pfcp_length_octet(&v->trace_information, &ogs_pfcp_tlv_desc_trace_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->remove_mar.presence) {
+        r = pfcp_length_remove_mar(&v->remove_mar);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->update_mar.presence) {
+        r = pfcp_length_update_mar(&v->update_mar);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->create_mar.presence) {
+        r = pfcp_length_create_mar(&v->create_mar);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->node_id.presence) {
+        r = pfcp_length_octet(&v->node_id, &ogs_pfcp_tlv_desc_node_id);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->tsc_management_information.presence) {
+        r = pfcp_length_tsc_management_information_ie_within_pfcp_session_modification_request(&v->tsc_management_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->remove_srr.presence) {
+        r = pfcp_length_remove_srr(&v->remove_srr);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->create_srr.presence) {
+        r = pfcp_length_create_srr(&v->create_srr);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->update_srr.presence) {
+        r = pfcp_length_update_srr(&v->update_srr);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->provide_atsss_control_information.presence) {
+        r = pfcp_length_provide_atsss_control_information(&v->provide_atsss_control_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->ethernet_context_information.presence) {
+        r = pfcp_length_ethernet_context_information(&v->ethernet_context_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->access_availability_information.presence) {
+        r = pfcp_length_octet(&v->access_availability_information, &ogs_pfcp_tlv_desc_access_availability_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->query_packet_rate_status.presence) {
+        r = pfcp_length_query_packet_rate_status_ie_within_pfcp_session_modification_request(&v->query_packet_rate_status);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->s_nssai.presence) {
+        r = pfcp_length_octet(&v->s_nssai, &ogs_pfcp_tlv_desc_s_nssai);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->rat_type.presence) {
+        r = pfcp_length_octet(&v->rat_type, &ogs_pfcp_tlv_desc_rat_type);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->group_id.presence) {
+        r = pfcp_length_octet(&v->group_id, &ogs_pfcp_tlv_desc_group_id);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->mbs_session_n4_control_information.presence) {
+        r = pfcp_length_mbs_session_n4_control_information(&v->mbs_session_n4_control_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->dscp_to_ppi_control_information.presence) {
+        r = pfcp_length_dscp_to_ppi_control_information(&v->dscp_to_ppi_control_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [PFCP Session Modification Request]");
+        return NULL;
+    }
+
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_TLV_MAX_HEADROOM+length);
+    if (!pkbuf) {
+        ogs_error("ogs_pkbuf_alloc() failed");
+        return NULL;
+    }
+    ogs_pkbuf_reserve(pkbuf, OGS_TLV_MAX_HEADROOM);
+    pos = ogs_pkbuf_put(pkbuf, length);
+
+    if (v->cp_f_seid.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_F_SEID_TYPE, &v->cp_f_seid);
+    }
+    for (i = 0; i < 16 && v->remove_pdr[i].presence; i++) {
+        pos = pfcp_put_remove_pdr(pos, &v->remove_pdr[i]);
+    }
+    for (i = 0; i < 16 && v->remove_far[i].presence; i++) {
+        pos = pfcp_put_remove_far(pos, &v->remove_far[i]);
+    }
+    for (i = 0; i < 16 && v->remove_urr[i].presence; i++) {
+        pos = pfcp_put_remove_urr(pos, &v->remove_urr[i]);
+    }
+    for (i = 0; i < 4 && v->remove_qer[i].presence; i++) {
+        pos = pfcp_put_remove_qer(pos, &v->remove_qer[i]);
+    }
+    if (v->remove_bar.presence) {
+        pos = pfcp_put_remove_bar(pos, &v->remove_bar);
+    }
+    if (v->remove_traffic_endpoint.presence) {
+        pos = pfcp_put_remove_traffic_endpoint(pos, &v->remove_traffic_endpoint);
+    }
+    for (i = 0; i < 16 && v->create_pdr[i].presence; i++) {
+        pos = pfcp_put_create_pdr(pos, &v->create_pdr[i]);
+    }
+    for (i = 0; i < 16 && v->create_far[i].presence; i++) {
+        pos = pfcp_put_create_far(pos, &v->create_far[i]);
+    }
+    for (i = 0; i < 16 && v->create_urr[i].presence; i++) {
+        pos = pfcp_put_create_urr(pos, &v->create_urr[i]);
+    }
+    for (i = 0; i < 4 && v->create_qer[i].presence; i++) {
+        pos = pfcp_put_create_qer(pos, &v->create_qer[i]);
+    }
+    if (v->create_bar.presence) {
+        pos = pfcp_put_create_bar(pos, &v->create_bar);
+    }
+    if (v->create_traffic_endpoint.presence) {
+        pos = pfcp_put_create_traffic_endpoint(pos, &v->create_traffic_endpoint);
+    }
+    for (i = 0; i < 16 && v->update_pdr[i].presence; i++) {
+        pos = pfcp_put_update_pdr(pos, &v->update_pdr[i]);
+    }
+    for (i = 0; i < 16 && v->update_far[i].presence; i++) {
+        pos = pfcp_put_update_far(pos, &v->update_far[i]);
+    }
+    for (i = 0; i < 16 && v->update_urr[i].presence; i++) {
+        pos = pfcp_put_update_urr(pos, &v->update_urr[i]);
+    }
+    for (i = 0; i < 4 && v->update_qer[i].presence; i++) {
+        pos = pfcp_put_update_qer(pos, &v->update_qer[i]);
+    }
+    if (v->update_bar.presence) {
+        pos = pfcp_put_update_bar_session_modification_request(pos, &v->update_bar);
+    }
+    if (v->update_traffic_endpoint.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_UPDATE_TRAFFIC_ENDPOINT_TYPE, &v->update_traffic_endpoint);
+    }
+    if (v->pfcpsmreq_flags.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_PFCPSMREQ_FLAGS_TYPE, &v->pfcpsmreq_flags);
+    }
+    if (v->query_urr.presence) {
+        pos = pfcp_put_query_urr(pos, &v->query_urr);
+    }
+    if (v->pgw_c_smf_fq_csid.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_FQ_CSID_TYPE, &v->pgw_c_smf_fq_csid);
+    }
+    if (v->sgw_c_fq_csid.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_FQ_CSID_TYPE, &v->sgw_c_fq_csid);
+    }
+    if (v->mme_fq_csid.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_FQ_CSID_TYPE, &v->mme_fq_csid);
+    }
+    if (v->epdg_fq_csid.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_FQ_CSID_TYPE, &v->epdg_fq_csid);
+    }
+    if (v->twan_fq_csid.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_FQ_CSID_TYPE, &v->twan_fq_csid);
+    }
+    if (v->user_plane_inactivity_timer.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_USER_PLANE_INACTIVITY_TIMER_TYPE, &v->user_plane_inactivity_timer);
+    }
+    if (v->query_urr_reference.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_QUERY_URR_REFERENCE_TYPE, &v->query_urr_reference);
+    }
+    if (v->trace_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_TRACE_INFORMATION_TYPE, &v->trace_information);
+    }
+    if (v->remove_mar.presence) {
+        pos = pfcp_put_remove_mar(pos, &v->remove_mar);
+    }
+    if (v->update_mar.presence) {
+        pos = pfcp_put_update_mar(pos, &v->update_mar);
+    }
+    if (v->create_mar.presence) {
+        pos = pfcp_put_create_mar(pos, &v->create_mar);
+    }
+    if (v->node_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_NODE_ID_TYPE, &v->node_id);
+    }
+    if (v->tsc_management_information.presence) {
+        pos = pfcp_put_tsc_management_information_ie_within_pfcp_session_modification_request(pos, &v->tsc_management_information);
+    }
+    if (v->remove_srr.presence) {
+        pos = pfcp_put_remove_srr(pos, &v->remove_srr);
+    }
+    if (v->create_srr.presence) {
+        pos = pfcp_put_create_srr(pos, &v->create_srr);
+    }
+    if (v->update_srr.presence) {
+        pos = pfcp_put_update_srr(pos, &v->update_srr);
+    }
+    if (v->provide_atsss_control_information.presence) {
+        pos = pfcp_put_provide_atsss_control_information(pos, &v->provide_atsss_control_information);
+    }
+    if (v->ethernet_context_information.presence) {
+        pos = pfcp_put_ethernet_context_information(pos, &v->ethernet_context_information);
+    }
+    if (v->access_availability_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_ACCESS_AVAILABILITY_INFORMATION_TYPE, &v->access_availability_information);
+    }
+    if (v->query_packet_rate_status.presence) {
+        pos = pfcp_put_query_packet_rate_status_ie_within_pfcp_session_modification_request(pos, &v->query_packet_rate_status);
+    }
+    if (v->s_nssai.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_S_NSSAI_TYPE, &v->s_nssai);
+    }
+    if (v->rat_type.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_RAT_TYPE_TYPE, &v->rat_type);
+    }
+    if (v->group_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_GROUP_ID_TYPE, &v->group_id);
+    }
+    if (v->mbs_session_n4_control_information.presence) {
+        pos = pfcp_put_mbs_session_n4_control_information(pos, &v->mbs_session_n4_control_information);
+    }
+    if (v->dscp_to_ppi_control_information.presence) {
+        pos = pfcp_put_dscp_to_ppi_control_information(pos, &v->dscp_to_ppi_control_information);
+    }
+    ogs_assert(pos == pkbuf->tail);
+
+    return pkbuf;
+}
+
+ogs_pkbuf_t *ogs_pfcp_build_session_modification_response_direct(ogs_pfcp_session_modification_response_t *v)
+{
+    ogs_pkbuf_t *pkbuf = NULL;
+    uint8_t *pos = NULL;
+    int i, length = 0, r;
+
+    ogs_assert(v);
+
+    if (v->cause.presence) {
+        length += 5;
+    }
+    if (v->offending_ie.presence) {
+        length += 6;
+    }
+    for (i = 0; i < 16 && v->created_pdr[i].presence; i++) {
+        r = pfcp_length_created_pdr(&v->created_pdr[i]);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->load_control_information.presence) {
+        r = pfcp_length_load_control_information(&v->load_control_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->overload_control_information.presence) {
+        r = pfcp_length_overload_control_information(&v->overload_control_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    for (i = 0; i < 8 && v->usage_report[i].presence; i++) {
+        r = pfcp_length_usage_report_session_modification_response(&v->usage_report[i]);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->failed_rule_id.presence) {
+        r = pfcp_length_octet(&v->failed_rule_id, &ogs_pfcp_tlv_desc_failed_rule_id);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->additional_usage_reports_information.presence) {
+        r = pfcp_length_octet(&v->additional_usage_reports_information, &ogs_pfcp_tlv_desc_additional_usage_reports_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->created_updated_traffic_endpoint.presence) {
+        r = pfcp_length_created_traffic_endpoint(&v->created_updated_traffic_endpoint);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->tsc_management_information.presence) {
+        r = pfcp_length_tsc_management_information_ie_within_pfcp_session_modification_request(&v->tsc_management_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->atsss_control_parameters.presence) {
+        r = pfcp_length_atsss_control_parameters(&v->atsss_control_parameters);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->updated_pdr.presence) {
+        r = pfcp_length_updated_pdr(&v->updated_pdr);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->packet_rate_status_report.presence) {
+        r = pfcp_length_packet_rate_status_report(&v->packet_rate_status_report);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->partial_failure_information.presence) {
+        r = pfcp_length_partial_failure_information(&v->partial_failure_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->mbs_session_n4_information.presence) {
+        r = pfcp_length_mbs_session_n4_information(&v->mbs_session_n4_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [PFCP Session Modification Response]");
+        return NULL;
+    }
+
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_TLV_MAX_HEADROOM+length);
+    if (!pkbuf) {
+        ogs_error("ogs_pkbuf_alloc() failed");
+        return NULL;
+    }
+    ogs_pkbuf_reserve(pkbuf, OGS_TLV_MAX_HEADROOM);
+    pos = ogs_pkbuf_put(pkbuf, length);
+
+    if (v->cause.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_CAUSE_TYPE, &v->cause);
+    }
+    if (v->offending_ie.presence) {
+        pos = pfcp_put_uint16(pos, OGS_PFCP_OFFENDING_IE_TYPE, &v->offending_ie);
+    }
+    for (i = 0; i < 16 && v->created_pdr[i].presence; i++) {
+        pos = pfcp_put_created_pdr(pos, &v->created_pdr[i]);
+    }
+    if (v->load_control_information.presence) {
+        pos = pfcp_put_load_control_information(pos, &v->load_control_information);
+    }
+    if (v->overload_control_information.presence) {
+        pos = pfcp_put_overload_control_information(pos, &v->overload_control_information);
+    }
+    for (i = 0; i < 8 && v->usage_report[i].presence; i++) {
+        pos = pfcp_put_usage_report_session_modification_response(pos, &v->usage_report[i]);
+    }
+    if (v->failed_rule_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_FAILED_RULE_ID_TYPE, &v->failed_rule_id);
+    }
+    if (v->additional_usage_reports_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_ADDITIONAL_USAGE_REPORTS_INFORMATION_TYPE, &v->additional_usage_reports_information);
+    }
+    if (v->created_updated_traffic_endpoint.presence) {
+        pos = pfcp_put_created_traffic_endpoint(pos, &v->created_updated_traffic_endpoint);
+    }
+    if (v->tsc_management_information.presence) {
+        pos = pfcp_put_tsc_management_information_ie_within_pfcp_session_modification_request(pos, &v->tsc_management_information);
+    }
+    if (v->atsss_control_parameters.presence) {
+        pos = pfcp_put_atsss_control_parameters(pos, &v->atsss_control_parameters);
+    }
+    if (v->updated_pdr.presence) {
+        pos = pfcp_put_updated_pdr(pos, &v->updated_pdr);
+    }
+    if (v->packet_rate_status_report.presence) {
+        pos = pfcp_put_packet_rate_status_report(pos, &v->packet_rate_status_report);
+    }
+    if (v->partial_failure_information.presence) {
+        pos = pfcp_put_partial_failure_information(pos, &v->partial_failure_information);
+    }
+    if (v->mbs_session_n4_information.presence) {
+        pos = pfcp_put_mbs_session_n4_information(pos, &v->mbs_session_n4_information);
+    }
+    ogs_assert(pos == pkbuf->tail);
+
+    return pkbuf;
+}
+
+ogs_pkbuf_t *ogs_pfcp_build_session_deletion_request_direct(ogs_pfcp_session_deletion_request_t *v)
+{
+    ogs_pkbuf_t *pkbuf = NULL;
+    uint8_t *pos = NULL;
+    int length = 0;
+
+    ogs_assert(v);
+
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_TLV_MAX_HEADROOM+length);
+    if (!pkbuf) {
+        ogs_error("ogs_pkbuf_alloc() failed");
+        return NULL;
+    }
+    ogs_pkbuf_reserve(pkbuf, OGS_TLV_MAX_HEADROOM);
+    pos = ogs_pkbuf_put(pkbuf, length);
+
+    ogs_assert(pos == pkbuf->tail);
+
+    return pkbuf;
+}
+
+ogs_pkbuf_t *ogs_pfcp_build_session_deletion_response_direct(ogs_pfcp_session_deletion_response_t *v)
+{
+    ogs_pkbuf_t *pkbuf = NULL;
+    uint8_t *pos = NULL;
+    int i, length = 0, r;
+
+    ogs_assert(v);
+
+    if (v->cause.presence) {
+        length += 5;
+    }
+    if (v->offending_ie.presence) {
+        length += 6;
+    }
+    if (v->load_control_information.presence) {
+        r = pfcp_length_load_control_information(&v->load_control_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->overload_control_information.presence) {
+        r = pfcp_length_overload_control_information(&v->overload_control_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    for (i = 0; i < 8 && v->usage_report[i].presence; i++) {
+        r = pfcp_length_usage_report_session_deletion_response(&v->usage_report[i]);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->additional_usage_reports_information.presence) {
+        r = pfcp_length_octet(&v->additional_usage_reports_information, &ogs_pfcp_tlv_desc_additional_usage_reports_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->packet_rate_status_report.presence) {
+        r = pfcp_length_packet_rate_status_report(&v->packet_rate_status_report);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->session_report.presence) {
+        r = pfcp_length_session_report(&v->session_report);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->mbs_session_n4_information.presence) {
+        r = pfcp_length_mbs_session_n4_information(&v->mbs_session_n4_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->pfcpsdrsp_flags.presence) {
+        r = pfcp_length_octet(&v->pfcpsdrsp_flags, &ogs_pfcp_tlv_desc_pfcpsdrsp_flags);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [PFCP Session Deletion Response]");
+        return NULL;
+    }
+
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_TLV_MAX_HEADROOM+length);
+    if (!pkbuf) {
+        ogs_error("ogs_pkbuf_alloc() failed");
+        return NULL;
+    }
+    ogs_pkbuf_reserve(pkbuf, OGS_TLV_MAX_HEADROOM);
+    pos = ogs_pkbuf_put(pkbuf, length);
+
+    if (v->cause.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_CAUSE_TYPE, &v->cause);
+    }
+    if (v->offending_ie.presence) {
+        pos = pfcp_put_uint16(pos, OGS_PFCP_OFFENDING_IE_TYPE, &v->offending_ie);
+    }
+    if (v->load_control_information.presence) {
+        pos = pfcp_put_load_control_information(pos, &v->load_control_information);
+    }
+    if (v->overload_control_information.presence) {
+        pos = pfcp_put_overload_control_information(pos, &v->overload_control_information);
+    }
+    for (i = 0; i < 8 && v->usage_report[i].presence; i++) {
+        pos = pfcp_put_usage_report_session_deletion_response(pos, &v->usage_report[i]);
+    }
+    if (v->additional_usage_reports_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_ADDITIONAL_USAGE_REPORTS_INFORMATION_TYPE, &v->additional_usage_reports_information);
+    }
+    if (v->packet_rate_status_report.presence) {
+        pos = pfcp_put_packet_rate_status_report(pos, &v->packet_rate_status_report);
+    }
+    if (v->session_report.presence) {
+        pos = pfcp_put_session_report(pos, &v->session_report);
+    }
+    if (v->mbs_session_n4_information.presence) {
+        pos = pfcp_put_mbs_session_n4_information(pos, &v->mbs_session_n4_information);
+    }
+    if (v->pfcpsdrsp_flags.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_PFCPSDRSP_FLAGS_TYPE, &v->pfcpsdrsp_flags);
+    }
+    ogs_assert(pos == pkbuf->tail);
+
+    return pkbuf;
+}
+
+ogs_pkbuf_t *ogs_pfcp_build_session_report_request_direct(ogs_pfcp_session_report_request_t *v)
+{
+    ogs_pkbuf_t *pkbuf = NULL;
+    uint8_t *pos = NULL;
+    int i, length = 0, r;
+
+    ogs_assert(v);
+
+    if (v->report_type.presence) {
+        length += 5;
+    }
+    if (v->downlink_data_report.presence) {
+        r = pfcp_length_downlink_data_report(&v->downlink_data_report);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    for (i = 0; i < 8 && v->usage_report[i].presence; i++) {
+        r = pfcp_length_usage_report_session_report_request(&v->usage_report[i]);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->error_indication_report.presence) {
+        r = pfcp_length_error_indication_report(&v->error_indication_report);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->load_control_information.presence) {
+        r = pfcp_length_load_control_information(&v->load_control_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->overload_control_information.presence) {
+        r = pfcp_length_overload_control_information(&v->overload_control_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->additional_usage_reports_information.presence) {
+        r = pfcp_length_octet(&v->additional_usage_reports_information, &ogs_pfcp_tlv_desc_additional_usage_reports_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->pfcpsrreq_flags.presence) {
+        length += 5;
+    }
+    if (v->old_cp_f_seid.presence) {
+        r = pfcp_length_octet(&v->old_cp_f_seid, &ogs_pfcp_tlv_desc_f_seid);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->packet_rate_status_report.presence) {
+        r = pfcp_length_packet_rate_status_report(&v->packet_rate_status_report);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->tsc_management_information.presence) {
+        r = pfcp_length_tsc_management_information_ie_within_pfcp_session_modification_request(&v->tsc_management_information);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->session_report.presence) {
+        r = pfcp_length_session_report(&v->session_report);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->cause.presence) {
+        length += 5;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [PFCP Session Report Request]");
+        return NULL;
+    }
+
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_TLV_MAX_HEADROOM+length);
+    if (!pkbuf) {
+        ogs_error("ogs_pkbuf_alloc() failed");
+        return NULL;
+    }
+    ogs_pkbuf_reserve(pkbuf, OGS_TLV_MAX_HEADROOM);
+    pos = ogs_pkbuf_put(pkbuf, length);
+
+    if (v->report_type.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_REPORT_TYPE_TYPE, &v->report_type);
+    }
+    if (v->downlink_data_report.presence) {
+        pos = pfcp_put_downlink_data_report(pos, &v->downlink_data_report);
+    }
+    for (i = 0; i < 8 && v->usage_report[i].presence; i++) {
+        pos = pfcp_put_usage_report_session_report_request(pos, &v->usage_report[i]);
+    }
+    if (v->error_indication_report.presence) {
+        pos = pfcp_put_error_indication_report(pos, &v->error_indication_report);
+    }
+    if (v->load_control_information.presence) {
+        pos = pfcp_put_load_control_information(pos, &v->load_control_information);
+    }
+    if (v->overload_control_information.presence) {
+        pos = pfcp_put_overload_control_information(pos, &v->overload_control_information);
+    }
+    if (v->additional_usage_reports_information.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_ADDITIONAL_USAGE_REPORTS_INFORMATION_TYPE, &v->additional_usage_reports_information);
+    }
+    if (v->pfcpsrreq_flags.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_PFCPSRREQ_FLAGS_TYPE, &v->pfcpsrreq_flags);
+    }
+    if (v->old_cp_f_seid.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_F_SEID_TYPE, &v->old_cp_f_seid);
+    }
+    if (v->packet_rate_status_report.presence) {
+        pos = pfcp_put_packet_rate_status_report(pos, &v->packet_rate_status_report);
+    }
+    if (v->tsc_management_information.presence) {
+        pos = pfcp_put_tsc_management_information_ie_within_pfcp_session_modification_request(pos, &v->tsc_management_information);
+    }
+    if (v->session_report.presence) {
+        pos = pfcp_put_session_report(pos, &v->session_report);
+    }
+    if (v->cause.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_CAUSE_TYPE, &v->cause);
+    }
+    ogs_assert(pos == pkbuf->tail);
+
+    return pkbuf;
+}
+
+ogs_pkbuf_t *ogs_pfcp_build_session_report_response_direct(ogs_pfcp_session_report_response_t *v)
+{
+    ogs_pkbuf_t *pkbuf = NULL;
+    uint8_t *pos = NULL;
+    int length = 0, r;
+
+    ogs_assert(v);
+
+    if (v->cause.presence) {
+        length += 5;
+    }
+    if (v->offending_ie.presence) {
+        length += 6;
+    }
+    if (v->update_bar.presence) {
+        r = pfcp_length_update_bar_pfcp_session_report_response(&v->update_bar);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->pfcpsrrsp_flags.presence) {
+        length += 5;
+    }
+    if (v->cp_f_seid.presence) {
+        r = pfcp_length_octet(&v->cp_f_seid, &ogs_pfcp_tlv_desc_f_seid);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->n4_u_f_teid.presence) {
+        r = pfcp_length_octet(&v->n4_u_f_teid, &ogs_pfcp_tlv_desc_f_teid);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->alternative_smf_ip_address.presence) {
+        r = pfcp_length_octet(&v->alternative_smf_ip_address, &ogs_pfcp_tlv_desc_alternative_smf_ip_address);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->pgw_c_smf_fq_csid.presence) {
+        r = pfcp_length_octet(&v->pgw_c_smf_fq_csid, &ogs_pfcp_tlv_desc_fq_csid);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->group_id.presence) {
+        r = pfcp_length_octet(&v->group_id, &ogs_pfcp_tlv_desc_group_id);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+    if (v->node_id.presence) {
+        r = pfcp_length_octet(&v->node_id, &ogs_pfcp_tlv_desc_node_id);
+        if (r < 0)
+            return NULL;
+        length += r;
+    }
+
+    if (length == 0) {
+        ogs_error("No IE in [PFCP Session Report Response]");
+        return NULL;
+    }
+
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_TLV_MAX_HEADROOM+length);
+    if (!pkbuf) {
+        ogs_error("ogs_pkbuf_alloc() failed");
+        return NULL;
+    }
+    ogs_pkbuf_reserve(pkbuf, OGS_TLV_MAX_HEADROOM);
+    pos = ogs_pkbuf_put(pkbuf, length);
+
+    if (v->cause.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_CAUSE_TYPE, &v->cause);
+    }
+    if (v->offending_ie.presence) {
+        pos = pfcp_put_uint16(pos, OGS_PFCP_OFFENDING_IE_TYPE, &v->offending_ie);
+    }
+    if (v->update_bar.presence) {
+        pos = pfcp_put_update_bar_pfcp_session_report_response(pos, &v->update_bar);
+    }
+    if (v->pfcpsrrsp_flags.presence) {
+        pos = pfcp_put_uint8(pos, OGS_PFCP_PFCPSRRSP_FLAGS_TYPE, &v->pfcpsrrsp_flags);
+    }
+    if (v->cp_f_seid.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_F_SEID_TYPE, &v->cp_f_seid);
+    }
+    if (v->n4_u_f_teid.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_F_TEID_TYPE, &v->n4_u_f_teid);
+    }
+    if (v->alternative_smf_ip_address.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_ALTERNATIVE_SMF_IP_ADDRESS_TYPE, &v->alternative_smf_ip_address);
+    }
+    if (v->pgw_c_smf_fq_csid.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_FQ_CSID_TYPE, &v->pgw_c_smf_fq_csid);
+    }
+    if (v->group_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_GROUP_ID_TYPE, &v->group_id);
+    }
+    if (v->node_id.presence) {
+        pos = pfcp_put_octet(pos, OGS_PFCP_NODE_ID_TYPE, &v->node_id);
+    }
+    ogs_assert(pos == pkbuf->tail);
+
+    return pkbuf;
+}
+
+ogs_pkbuf_t *ogs_pfcp_build_msg_direct(ogs_pfcp_message_t *pfcp_message)
+{
+    ogs_pkbuf_t *pkbuf = NULL;
+
+    ogs_assert(pfcp_message);
+    switch(pfcp_message->h.type)
+    {
+        case OGS_PFCP_HEARTBEAT_REQUEST_TYPE:
+            pkbuf = ogs_pfcp_build_heartbeat_request_direct(
+                    &pfcp_message->pfcp_heartbeat_request);
+            break;
+        case OGS_PFCP_HEARTBEAT_RESPONSE_TYPE:
+            pkbuf = ogs_pfcp_build_heartbeat_response_direct(
+                    &pfcp_message->pfcp_heartbeat_response);
+            break;
+        case OGS_PFCP_PFD_MANAGEMENT_REQUEST_TYPE:
+            pkbuf = ogs_pfcp_build_pfd_management_request_direct(
+                    &pfcp_message->pfcp_pfd_management_request);
+            break;
+        case OGS_PFCP_PFD_MANAGEMENT_RESPONSE_TYPE:
+            pkbuf = ogs_pfcp_build_pfd_management_response_direct(
+                    &pfcp_message->pfcp_pfd_management_response);
+            break;
+        case OGS_PFCP_ASSOCIATION_SETUP_REQUEST_TYPE:
+            pkbuf = ogs_pfcp_build_association_setup_request_direct(
+                    &pfcp_message->pfcp_association_setup_request);
+            break;
+        case OGS_PFCP_ASSOCIATION_SETUP_RESPONSE_TYPE:
+            pkbuf = ogs_pfcp_build_association_setup_response_direct(
+                    &pfcp_message->pfcp_association_setup_response);
+            break;
+        case OGS_PFCP_ASSOCIATION_UPDATE_REQUEST_TYPE:
+            pkbuf = ogs_pfcp_build_association_update_request_direct(
+                    &pfcp_message->pfcp_association_update_request);
+            break;
+        case OGS_PFCP_ASSOCIATION_UPDATE_RESPONSE_TYPE:
+            pkbuf = ogs_pfcp_build_association_update_response_direct(
+                    &pfcp_message->pfcp_association_update_response);
+            break;
+        case OGS_PFCP_ASSOCIATION_RELEASE_REQUEST_TYPE:
+            pkbuf = ogs_pfcp_build_association_release_request_direct(
+                    &pfcp_message->pfcp_association_release_request);
+            break;
+        case OGS_PFCP_ASSOCIATION_RELEASE_RESPONSE_TYPE:
+            pkbuf = ogs_pfcp_build_association_release_response_direct(
+                    &pfcp_message->pfcp_association_release_response);
+            break;
+        case OGS_PFCP_VERSION_NOT_SUPPORTED_RESPONSE_TYPE:
+            pkbuf = ogs_pfcp_build_version_not_supported_response_direct(
+                    &pfcp_message->pfcp_version_not_supported_response);
+            break;
+        case OGS_PFCP_NODE_REPORT_REQUEST_TYPE:
+            pkbuf = ogs_pfcp_build_node_report_request_direct(
+                    &pfcp_message->pfcp_node_report_request);
+            break;
+        case OGS_PFCP_NODE_REPORT_RESPONSE_TYPE:
+            pkbuf = ogs_pfcp_build_node_report_response_direct(
+                    &pfcp_message->pfcp_node_report_response);
+            break;
+        case OGS_PFCP_SESSION_SET_DELETION_REQUEST_TYPE:
+            pkbuf = ogs_pfcp_build_session_set_deletion_request_direct(
+                    &pfcp_message->pfcp_session_set_deletion_request);
+            break;
+        case OGS_PFCP_SESSION_SET_DELETION_RESPONSE_TYPE:
+            pkbuf = ogs_pfcp_build_session_set_deletion_response_direct(
+                    &pfcp_message->pfcp_session_set_deletion_response);
+            break;
+        case OGS_PFCP_SESSION_SET_MODIFICATION_REQUEST_TYPE:
+            pkbuf = ogs_pfcp_build_session_set_modification_request_direct(
+                    &pfcp_message->pfcp_session_set_modification_request);
+            break;
+        case OGS_PFCP_SESSION_SET_MODIFICATION_RESPONSE_TYPE:
+            pkbuf = ogs_pfcp_build_session_set_modification_response_direct(
+                    &pfcp_message->pfcp_session_set_modification_response);
+            break;
+        case OGS_PFCP_SESSION_ESTABLISHMENT_REQUEST_TYPE:
+            pkbuf = ogs_pfcp_build_session_establishment_request_direct(
+                    &pfcp_message->pfcp_session_establishment_request);
+            break;
+        case OGS_PFCP_SESSION_ESTABLISHMENT_RESPONSE_TYPE:
+            pkbuf = ogs_pfcp_build_session_establishment_response_direct(
+                    &pfcp_message->pfcp_session_establishment_response);
+            break;
+        case OGS_PFCP_SESSION_MODIFICATION_REQUEST_TYPE:
+            pkbuf = ogs_pfcp_build_session_modification_request_direct(
+                    &pfcp_message->pfcp_session_modification_request);
+            break;
+        case OGS_PFCP_SESSION_MODIFICATION_RESPONSE_TYPE:
+            pkbuf = ogs_pfcp_build_session_modification_response_direct(
+                    &pfcp_message->pfcp_session_modification_response);
+            break;
+        case OGS_PFCP_SESSION_DELETION_REQUEST_TYPE:
+            pkbuf = ogs_pfcp_build_session_deletion_request_direct(
+                    &pfcp_message->pfcp_session_deletion_request);
+            break;
+        case OGS_PFCP_SESSION_DELETION_RESPONSE_TYPE:
+            pkbuf = ogs_pfcp_build_session_deletion_response_direct(
+                    &pfcp_message->pfcp_session_deletion_response);
+            break;
+        case OGS_PFCP_SESSION_REPORT_REQUEST_TYPE:
+            pkbuf = ogs_pfcp_build_session_report_request_direct(
+                    &pfcp_message->pfcp_session_report_request);
+            break;
+        case OGS_PFCP_SESSION_REPORT_RESPONSE_TYPE:
+            pkbuf = ogs_pfcp_build_session_report_response_direct(
+                    &pfcp_message->pfcp_session_report_response);
+            break;
+        default:
+            ogs_warn("Not implemented(type:%d)", pfcp_message->h.type);
+            break;
+    }
+
+    return pkbuf;
+}
+
+static uint8_t *pfcp_get_element(
+        uint8_t *pos, uint8_t *end, uint16_t *type, uint16_t *length)
+{
+    if (end - pos < 4)
+        return NULL;
+
+    *type = (pos[0] << 8) | pos[1];
+    *length = (pos[2] << 8) | pos[3];
+    if (end - pos - 4 < *length)
+        return NULL;
+
+    return pos + 4;
+}
+
+/*
+ * The integer parsers follow tlv_parse_leaf(): a value shorter than
+ * the integer is accepted and the missing octets are read past it.
+ */
+static int pfcp_parse_uint8(ogs_tlv_uint8_t *v, uint8_t *value, uint16_t length)
+{
+    if (length != 1) {
+        ogs_error("Invalid TLV length %d. It should be 1", length);
+        return OGS_ERROR;
+    }
+    v->u8 = value[0];
+    v->presence = 1;
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_uint16(
+        ogs_tlv_uint16_t *v, uint8_t *value, uint16_t length)
+{
+    if (length < 1 || length > 2) {
+        ogs_error("Invalid TLV length %d.", length);
+        return OGS_ERROR;
+    }
+    v->u16 = (value[0] << 8) | value[1];
+    v->presence = 1;
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_uint24(
+        ogs_tlv_uint24_t *v, uint8_t *value, uint16_t length)
+{
+    if (length < 1 || length > 3) {
+        ogs_error("Invalid TLV length %d.", length);
+        return OGS_ERROR;
+    }
+    v->u24 = (value[0] << 16) | (value[1] << 8) | value[2];
+    v->presence = 1;
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_uint32(
+        ogs_tlv_uint32_t *v, uint8_t *value, uint16_t length)
+{
+    if (length < 1 || length > 4) {
+        ogs_error("Invalid TLV length %d.", length);
+        return OGS_ERROR;
+    }
+    v->u32 = ((uint32_t)value[0] << 24) | (value[1] << 16) |
+        (value[2] << 8) | value[3];
+    v->presence = 1;
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_octet(ogs_tlv_octet_t *v, uint8_t *value, uint16_t length)
+{
+    v->data = value;
+    v->len = length;
+    v->presence = 1;
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_ethernet_packet_filter(
+        ogs_pfcp_tlv_ethernet_packet_filter_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_redundant_transmission_parameters(
+        ogs_pfcp_tlv_redundant_transmission_parameters_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_ip_multicast_addressing_info_within_pfcp_session_establishment_request(
+        ogs_pfcp_tlv_ip_multicast_addressing_info_within_pfcp_session_establishment_request_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_pdi(
+        ogs_pfcp_tlv_pdi_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_transport_delay_reporting(
+        ogs_pfcp_tlv_transport_delay_reporting_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_create_pdr(
+        ogs_pfcp_tlv_create_pdr_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_forwarding_parameters(
+        ogs_pfcp_tlv_forwarding_parameters_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_duplicating_parameters(
+        ogs_pfcp_tlv_duplicating_parameters_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_redundant_transmission_forwarding_parameters(
+        ogs_pfcp_tlv_redundant_transmission_forwarding_parameters_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_mbs_multicast_parameters(
+        ogs_pfcp_tlv_mbs_multicast_parameters_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_add_mbs_unicast_parameters(
+        ogs_pfcp_tlv_add_mbs_unicast_parameters_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_create_far(
+        ogs_pfcp_tlv_create_far_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_update_forwarding_parameters(
+        ogs_pfcp_tlv_update_forwarding_parameters_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_update_duplicating_parameters(
+        ogs_pfcp_tlv_update_duplicating_parameters_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_update_far(
+        ogs_pfcp_tlv_update_far_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_ethernet_traffic_information(
+        ogs_pfcp_tlv_ethernet_traffic_information_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse__access_forwarding_action_information(
+        ogs_pfcp_tlv__access_forwarding_action_information_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_non__access_forwarding_action_information(
+        ogs_pfcp_tlv_non__access_forwarding_action_information_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_update__access_forwarding_action_information(
+        ogs_pfcp_tlv_update__access_forwarding_action_information_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_update_non__access_forwarding_action_information(
+        ogs_pfcp_tlv_update_non__access_forwarding_action_information_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_access_availability_report(
+        ogs_pfcp_tlv_access_availability_report_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_qos_monitoring_report(
+        ogs_pfcp_tlv_qos_monitoring_report_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_mptcp_parameters(
+        ogs_pfcp_tlv_mptcp_parameters_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_atsss_ll_parameters(
+        ogs_pfcp_tlv_atsss_ll_parameters_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_pmf_parameters(
+        ogs_pfcp_tlv_pmf_parameters_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_join_ip_multicast_information_ie_within_usage_report(
+        ogs_pfcp_tlv_join_ip_multicast_information_ie_within_usage_report_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_leave_ip_multicast_information_ie_within_usage_report(
+        ogs_pfcp_tlv_leave_ip_multicast_information_ie_within_usage_report_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_create_urr(
+        ogs_pfcp_tlv_create_urr_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_create_qer(
+        ogs_pfcp_tlv_create_qer_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_created_pdr(
+        ogs_pfcp_tlv_created_pdr_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_update_pdr(
+        ogs_pfcp_tlv_update_pdr_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_update_bar_pfcp_session_report_response(
+        ogs_pfcp_tlv_update_bar_pfcp_session_report_response_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_update_urr(
+        ogs_pfcp_tlv_update_urr_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_update_qer(
+        ogs_pfcp_tlv_update_qer_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_remove_pdr(
+        ogs_pfcp_tlv_remove_pdr_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_remove_far(
+        ogs_pfcp_tlv_remove_far_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_remove_urr(
+        ogs_pfcp_tlv_remove_urr_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_remove_qer(
+        ogs_pfcp_tlv_remove_qer_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_load_control_information(
+        ogs_pfcp_tlv_load_control_information_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_overload_control_information(
+        ogs_pfcp_tlv_overload_control_information_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_application_detection_information(
+        ogs_pfcp_tlv_application_detection_information_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_query_urr(
+        ogs_pfcp_tlv_query_urr_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_usage_report_session_modification_response(
+        ogs_pfcp_tlv_usage_report_session_modification_response_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_usage_report_session_report_request(
+        ogs_pfcp_tlv_usage_report_session_report_request_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_downlink_data_report(
+        ogs_pfcp_tlv_downlink_data_report_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_create_bar(
+        ogs_pfcp_tlv_create_bar_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_update_bar_session_modification_request(
+        ogs_pfcp_tlv_update_bar_session_modification_request_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_remove_bar(
+        ogs_pfcp_tlv_remove_bar_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_error_indication_report(
+        ogs_pfcp_tlv_error_indication_report_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_create_traffic_endpoint(
+        ogs_pfcp_tlv_create_traffic_endpoint_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_created_traffic_endpoint(
+        ogs_pfcp_tlv_created_traffic_endpoint_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_remove_traffic_endpoint(
+        ogs_pfcp_tlv_remove_traffic_endpoint_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_create_mar(
+        ogs_pfcp_tlv_create_mar_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_remove_mar(
+        ogs_pfcp_tlv_remove_mar_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_update_mar(
+        ogs_pfcp_tlv_update_mar_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_created_bridge_info_for_tsc(
+        ogs_pfcp_tlv_created_bridge_info_for_tsc_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_tsc_management_information_ie_within_pfcp_session_modification_request(
+        ogs_pfcp_tlv_tsc_management_information_ie_within_pfcp_session_modification_request_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_remove_srr(
+        ogs_pfcp_tlv_remove_srr_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_create_srr(
+        ogs_pfcp_tlv_create_srr_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_update_srr(
+        ogs_pfcp_tlv_update_srr_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_session_report(
+        ogs_pfcp_tlv_session_report_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_provide_atsss_control_information(
+        ogs_pfcp_tlv_provide_atsss_control_information_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_atsss_control_parameters(
+        ogs_pfcp_tlv_atsss_control_parameters_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_packet_rate_status_report(
+        ogs_pfcp_tlv_packet_rate_status_report_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_ethernet_context_information(
+        ogs_pfcp_tlv_ethernet_context_information_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_updated_pdr(
+        ogs_pfcp_tlv_updated_pdr_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_provide_rds_configuration_information(
+        ogs_pfcp_tlv_provide_rds_configuration_information_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_query_packet_rate_status_ie_within_pfcp_session_modification_request(
+        ogs_pfcp_tlv_query_packet_rate_status_ie_within_pfcp_session_modification_request_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_partial_failure_information(
+        ogs_pfcp_tlv_partial_failure_information_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_l2tp_tunnel_information(
+        ogs_pfcp_tlv_l2tp_tunnel_information_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_l2tp_session_information(
+        ogs_pfcp_tlv_l2tp_session_information_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_created_l2tp_session(
+        ogs_pfcp_tlv_created_l2tp_session_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_mbs_session_n4mb_control_information(
+        ogs_pfcp_tlv_mbs_session_n4mb_control_information_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_mbs_session_n4mb_information(
+        ogs_pfcp_tlv_mbs_session_n4mb_information_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_mbs_session_n4_control_information(
+        ogs_pfcp_tlv_mbs_session_n4_control_information_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_mbs_session_n4_information(
+        ogs_pfcp_tlv_mbs_session_n4_information_t *v, uint8_t *pos, uint32_t size);
+static int pfcp_parse_dscp_to_ppi_control_information(
+        ogs_pfcp_tlv_dscp_to_ppi_control_information_t *v, uint8_t *pos, uint32_t size);
+
+static int pfcp_parse_ethernet_packet_filter(
+        ogs_pfcp_tlv_ethernet_packet_filter_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+    int i;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Ethernet Packet Filter] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_ETHERNET_FILTER_ID_TYPE:
+            if (!v->ethernet_filter_id.presence) {
+                if (pfcp_parse_octet(&v->ethernet_filter_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_ETHERNET_FILTER_PROPERTIES_TYPE:
+            if (!v->ethernet_filter_properties.presence) {
+                if (pfcp_parse_octet(&v->ethernet_filter_properties, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_MAC_ADDRESS_TYPE:
+            if (!v->mac_address.presence) {
+                if (pfcp_parse_octet(&v->mac_address, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_ETHERTYPE_TYPE:
+            if (!v->ethertype.presence) {
+                if (pfcp_parse_octet(&v->ethertype, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_C_TAG_TYPE:
+            if (!v->c_tag.presence) {
+                if (pfcp_parse_octet(&v->c_tag, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_S_TAG_TYPE:
+            if (!v->s_tag.presence) {
+                if (pfcp_parse_octet(&v->s_tag, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_SDF_FILTER_TYPE:
+            for (i = 0; i < 8 && v->sdf_filter[i].presence; i++);
+            if (i == 8) {
+                ogs_fatal("Multiple of the same type TLV need more room");
+                break;
+            }
+            if (pfcp_parse_octet(&v->sdf_filter[i], value, length) != OGS_OK)
+                return OGS_ERROR;
+            break;
+        case 0:
+            /* ogs_tlv_parse_msg() takes it for an ogs_tlv_desc_more */
+            ogs_error("Unknown type[%d]", OGS_TLV_MORE);
+            return OGS_ERROR;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_redundant_transmission_parameters(
+        ogs_pfcp_tlv_redundant_transmission_parameters_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Redundant Transmission Parameters] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_F_TEID_TYPE:
+            if (!v->local_f_teid_for_redundant_transmission.presence) {
+                if (pfcp_parse_octet(&v->local_f_teid_for_redundant_transmission, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_NETWORK_INSTANCE_TYPE:
+            if (!v->network_instance_for_redundant_transmission.presence) {
+                if (pfcp_parse_octet(&v->network_instance_for_redundant_transmission, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_ip_multicast_addressing_info_within_pfcp_session_establishment_request(
+        ogs_pfcp_tlv_ip_multicast_addressing_info_within_pfcp_session_establishment_request_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [IP Multicast Addressing Info within PFCP Session Establishment Request] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_IP_MULTICAST_ADDRESS_TYPE:
+            if (!v->ip_multicast_address.presence) {
+                if (pfcp_parse_octet(&v->ip_multicast_address, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_SOURCE_IP_ADDRESS_TYPE:
+            if (!v->source_ip_address.presence) {
+                if (pfcp_parse_octet(&v->source_ip_address, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_pdi(
+        ogs_pfcp_tlv_pdi_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+    int i;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [PDI] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_SOURCE_INTERFACE_TYPE:
+            if (!v->source_interface.presence) {
+                if (pfcp_parse_uint8(&v->source_interface, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_F_TEID_TYPE:
+            if (!v->local_f_teid.presence) {
+                if (pfcp_parse_octet(&v->local_f_teid, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_LOCAL_INGRESS_TUNNEL_TYPE:
+            if (!v->local_ingress_tunnel.presence) {
+                if (pfcp_parse_octet(&v->local_ingress_tunnel, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_NETWORK_INSTANCE_TYPE:
+            if (!v->network_instance.presence) {
+                if (pfcp_parse_octet(&v->network_instance, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_REDUNDANT_TRANSMISSION_PARAMETERS_TYPE:
+            if (!v->redundant_transmission_detection_parameters.presence) {
+                if (pfcp_parse_redundant_transmission_parameters(&v->redundant_transmission_detection_parameters, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->redundant_transmission_detection_parameters.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_UE_IP_ADDRESS_TYPE:
+            if (!v->ue_ip_address.presence) {
+                if (pfcp_parse_octet(&v->ue_ip_address, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_TRAFFIC_ENDPOINT_ID_TYPE:
+            if (!v->traffic_endpoint_id.presence) {
+                if (pfcp_parse_octet(&v->traffic_endpoint_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_SDF_FILTER_TYPE:
+            for (i = 0; i < 8 && v->sdf_filter[i].presence; i++);
+            if (i == 8) {
+                ogs_fatal("Multiple of the same type TLV need more room");
+                break;
+            }
+            if (pfcp_parse_octet(&v->sdf_filter[i], value, length) != OGS_OK)
+                return OGS_ERROR;
+            break;
+        case OGS_PFCP_APPLICATION_ID_TYPE:
+            if (!v->application_id.presence) {
+                if (pfcp_parse_octet(&v->application_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_ETHERNET_PDU_SESSION_INFORMATION_TYPE:
+            if (!v->ethernet_pdu_session_information.presence) {
+                if (pfcp_parse_octet(&v->ethernet_pdu_session_information, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_ETHERNET_PACKET_FILTER_TYPE:
+            if (!v->ethernet_packet_filter.presence) {
+                if (pfcp_parse_ethernet_packet_filter(&v->ethernet_packet_filter, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->ethernet_packet_filter.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_QFI_TYPE:
+            if (!v->qfi.presence) {
+                if (pfcp_parse_uint8(&v->qfi, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_FRAMED_ROUTE_TYPE:
+            for (i = 0; i < 8 && v->framed_route[i].presence; i++);
+            if (i == 8) {
+                ogs_fatal("Multiple of the same type TLV need more room");
+                break;
+            }
+            if (pfcp_parse_octet(&v->framed_route[i], value, length) != OGS_OK)
+                return OGS_ERROR;
+            break;
+        case OGS_PFCP_FRAMED_ROUTING_TYPE:
+            if (!v->framed_routing.presence) {
+                if (pfcp_parse_octet(&v->framed_routing, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_FRAMED_IPV6_ROUTE_TYPE:
+            for (i = 0; i < 8 && v->framed_ipv6_route[i].presence; i++);
+            if (i == 8) {
+                ogs_fatal("Multiple of the same type TLV need more room");
+                break;
+            }
+            if (pfcp_parse_octet(&v->framed_ipv6_route[i], value, length) != OGS_OK)
+                return OGS_ERROR;
+            break;
+        case OGS_PFCP__INTERFACE_TYPE_TYPE:
+            if (!v->source_interface_type.presence) {
+                if (pfcp_parse_uint8(&v->source_interface_type, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_IP_MULTICAST_ADDRESSING_INFO_WITHIN_PFCP_SESSION_ESTABLISHMENT_REQUEST_TYPE:
+            if (!v->ip_multicast_addressing_info.presence) {
+                if (pfcp_parse_ip_multicast_addressing_info_within_pfcp_session_establishment_request(&v->ip_multicast_addressing_info, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->ip_multicast_addressing_info.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_DNS_QUERY_FILTER_TYPE:
+            if (!v->dns_query_filter.presence) {
+                if (pfcp_parse_octet(&v->dns_query_filter, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_MBS_SESSION_IDENTIFIER_TYPE:
+            if (!v->mbs_session_identifier.presence) {
+                if (pfcp_parse_octet(&v->mbs_session_identifier, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_AREA_SESSION_ID_TYPE:
+            if (!v->area_session_id.presence) {
+                if (pfcp_parse_octet(&v->area_session_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case 0:
+            /* ogs_tlv_parse_msg() takes it for an ogs_tlv_desc_more */
+            ogs_error("Unknown type[%d]", OGS_TLV_MORE);
+            return OGS_ERROR;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_transport_delay_reporting(
+        ogs_pfcp_tlv_transport_delay_reporting_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Transport Delay Reporting] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_REMOTE_GTP_U_PEER_TYPE:
+            if (!v->preceding_ul_gtp_u_peer.presence) {
+                if (pfcp_parse_octet(&v->preceding_ul_gtp_u_peer, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_TRANSPORT_LEVEL_MARKING_TYPE:
+            if (!v->dscp.presence) {
+                if (pfcp_parse_octet(&v->dscp, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_create_pdr(
+        ogs_pfcp_tlv_create_pdr_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+    int i;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Create PDR] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_PDR_ID_TYPE:
+            if (!v->pdr_id.presence) {
+                if (pfcp_parse_uint16(&v->pdr_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_PRECEDENCE_TYPE:
+            if (!v->precedence.presence) {
+                if (pfcp_parse_uint32(&v->precedence, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_PDI_TYPE:
+            if (!v->pdi.presence) {
+                if (pfcp_parse_pdi(&v->pdi, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->pdi.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_OUTER_HEADER_REMOVAL_TYPE:
+            if (!v->outer_header_removal.presence) {
+                if (pfcp_parse_octet(&v->outer_header_removal, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_FAR_ID_TYPE:
+            if (!v->far_id.presence) {
+                if (pfcp_parse_uint32(&v->far_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_URR_ID_TYPE:
+            for (i = 0; i < 8 && v->urr_id[i].presence; i++);
+            if (i == 8) {
+                ogs_fatal("Multiple of the same type TLV need more room");
+                break;
+            }
+            if (pfcp_parse_uint32(&v->urr_id[i], value, length) != OGS_OK)
+                return OGS_ERROR;
+            break;
+        case OGS_PFCP_QER_ID_TYPE:
+            if (!v->qer_id.presence) {
+                if (pfcp_parse_uint32(&v->qer_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_ACTIVATE_PREDEFINED_RULES_TYPE:
+            if (!v->activate_predefined_rules.presence) {
+                if (pfcp_parse_octet(&v->activate_predefined_rules, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_ACTIVATION_TIME_TYPE:
+            if (!v->activation_time.presence) {
+                if (pfcp_parse_octet(&v->activation_time, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_DEACTIVATION_TIME_TYPE:
+            if (!v->deactivation_time.presence) {
+                if (pfcp_parse_octet(&v->deactivation_time, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_MAR_ID_TYPE:
+            if (!v->mar_id.presence) {
+                if (pfcp_parse_octet(&v->mar_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_PACKET_REPLICATION_AND_DETECTION_CARRY_ON_INFORMATION_TYPE:
+            if (!v->packet_replication_and_detection_carry_on_information.presence) {
+                if (pfcp_parse_octet(&v->packet_replication_and_detection_carry_on_information, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_IP_MULTICAST_ADDRESSING_INFO_WITHIN_PFCP_SESSION_ESTABLISHMENT_REQUEST_TYPE:
+            if (!v->ip_multicast_addressing_info.presence) {
+                if (pfcp_parse_ip_multicast_addressing_info_within_pfcp_session_establishment_request(&v->ip_multicast_addressing_info, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->ip_multicast_addressing_info.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_UE_IP_ADDRESS_TYPE:
+            if (!v->ue_ip_address_pool_identity.presence) {
+                if (pfcp_parse_octet(&v->ue_ip_address_pool_identity, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_MPTCP_APPLICABLE_INDICATION_TYPE:
+            if (!v->mptcp_applicable_indication.presence) {
+                if (pfcp_parse_octet(&v->mptcp_applicable_indication, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_TRANSPORT_DELAY_REPORTING_TYPE:
+            if (!v->transport_delay_reporting.presence) {
+                if (pfcp_parse_transport_delay_reporting(&v->transport_delay_reporting, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->transport_delay_reporting.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_RAT_TYPE_TYPE:
+            if (!v->rat_type.presence) {
+                if (pfcp_parse_octet(&v->rat_type, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case 0:
+            /* ogs_tlv_parse_msg() takes it for an ogs_tlv_desc_more */
+            ogs_error("Unknown type[%d]", OGS_TLV_MORE);
+            return OGS_ERROR;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_forwarding_parameters(
+        ogs_pfcp_tlv_forwarding_parameters_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Forwarding Parameters] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_DESTINATION_INTERFACE_TYPE:
+            if (!v->destination_interface.presence) {
+                if (pfcp_parse_uint8(&v->destination_interface, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_NETWORK_INSTANCE_TYPE:
+            if (!v->network_instance.presence) {
+                if (pfcp_parse_octet(&v->network_instance, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_REDIRECT_INFORMATION_TYPE:
+            if (!v->redirect_information.presence) {
+                if (pfcp_parse_octet(&v->redirect_information, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_OUTER_HEADER_CREATION_TYPE:
+            if (!v->outer_header_creation.presence) {
+                if (pfcp_parse_octet(&v->outer_header_creation, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_TRANSPORT_LEVEL_MARKING_TYPE:
+            if (!v->transport_level_marking.presence) {
+                if (pfcp_parse_octet(&v->transport_level_marking, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_FORWARDING_POLICY_TYPE:
+            if (!v->forwarding_policy.presence) {
+                if (pfcp_parse_octet(&v->forwarding_policy, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_HEADER_ENRICHMENT_TYPE:
+            if (!v->header_enrichment.presence) {
+                if (pfcp_parse_octet(&v->header_enrichment, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_TRAFFIC_ENDPOINT_ID_TYPE:
+            if (!v->linked_traffic_endpoint_id.presence) {
+                if (pfcp_parse_octet(&v->linked_traffic_endpoint_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_PROXYING_TYPE:
+            if (!v->proxying.presence) {
+                if (pfcp_parse_octet(&v->proxying, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP__INTERFACE_TYPE_TYPE:
+            if (!v->destination_interface_type.presence) {
+                if (pfcp_parse_uint8(&v->destination_interface_type, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_DATA_NETWORK_ACCESS_IDENTIFIER_TYPE:
+            if (!v->data_network_access_identifier.presence) {
+                if (pfcp_parse_octet(&v->data_network_access_identifier, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_IP_ADDRESS_AND_PORT_NUMBER_REPLACEMENT_TYPE:
+            if (!v->ip_address_and_port_number_replacement.presence) {
+                if (pfcp_parse_octet(&v->ip_address_and_port_number_replacement, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_duplicating_parameters(
+        ogs_pfcp_tlv_duplicating_parameters_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Duplicating Parameters] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_DESTINATION_INTERFACE_TYPE:
+            if (!v->destination_interface.presence) {
+                if (pfcp_parse_uint8(&v->destination_interface, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_OUTER_HEADER_CREATION_TYPE:
+            if (!v->outer_header_creation.presence) {
+                if (pfcp_parse_octet(&v->outer_header_creation, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_TRANSPORT_LEVEL_MARKING_TYPE:
+            if (!v->transport_level_marking.presence) {
+                if (pfcp_parse_octet(&v->transport_level_marking, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_FORWARDING_POLICY_TYPE:
+            if (!v->forwarding_policy.presence) {
+                if (pfcp_parse_octet(&v->forwarding_policy, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_redundant_transmission_forwarding_parameters(
+        ogs_pfcp_tlv_redundant_transmission_forwarding_parameters_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Redundant Transmission Forwarding Parameters] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_OUTER_HEADER_CREATION_TYPE:
+            if (!v->outer_header_creation.presence) {
+                if (pfcp_parse_octet(&v->outer_header_creation, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_NETWORK_INSTANCE_TYPE:
+            if (!v->network_instance_for_redundant_transmission.presence) {
+                if (pfcp_parse_octet(&v->network_instance_for_redundant_transmission, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_mbs_multicast_parameters(
+        ogs_pfcp_tlv_mbs_multicast_parameters_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [MBS Multicast Parameters] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_DESTINATION_INTERFACE_TYPE:
+            if (!v->destination_interface.presence) {
+                if (pfcp_parse_uint8(&v->destination_interface, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_NETWORK_INSTANCE_TYPE:
+            if (!v->network_instance.presence) {
+                if (pfcp_parse_octet(&v->network_instance, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_OUTER_HEADER_CREATION_TYPE:
+            if (!v->outer_header_creation.presence) {
+                if (pfcp_parse_octet(&v->outer_header_creation, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_TRANSPORT_LEVEL_MARKING_TYPE:
+            if (!v->transport_level_marking.presence) {
+                if (pfcp_parse_octet(&v->transport_level_marking, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP__INTERFACE_TYPE_TYPE:
+            if (!v->destination_interface_type.presence) {
+                if (pfcp_parse_uint8(&v->destination_interface_type, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_add_mbs_unicast_parameters(
+        ogs_pfcp_tlv_add_mbs_unicast_parameters_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Add MBS Unicast Parameters] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_DESTINATION_INTERFACE_TYPE:
+            if (!v->destination_interface.presence) {
+                if (pfcp_parse_uint8(&v->destination_interface, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_MBS_UNICAST_PARAMETERS_ID_TYPE:
+            if (!v->mbs_unicast_parameters_id.presence) {
+                if (pfcp_parse_octet(&v->mbs_unicast_parameters_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_NETWORK_INSTANCE_TYPE:
+            if (!v->network_instance.presence) {
+                if (pfcp_parse_octet(&v->network_instance, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_OUTER_HEADER_CREATION_TYPE:
+            if (!v->outer_header_creation.presence) {
+                if (pfcp_parse_octet(&v->outer_header_creation, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_TRANSPORT_LEVEL_MARKING_TYPE:
+            if (!v->transport_level_marking.presence) {
+                if (pfcp_parse_octet(&v->transport_level_marking, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP__INTERFACE_TYPE_TYPE:
+            if (!v->destination_interface_type.presence) {
+                if (pfcp_parse_uint8(&v->destination_interface_type, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_create_far(
+        ogs_pfcp_tlv_create_far_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Create FAR] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_FAR_ID_TYPE:
+            if (!v->far_id.presence) {
+                if (pfcp_parse_uint32(&v->far_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_APPLY_ACTION_TYPE:
+            if (!v->apply_action.presence) {
+                if (pfcp_parse_uint16(&v->apply_action, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_FORWARDING_PARAMETERS_TYPE:
+            if (!v->forwarding_parameters.presence) {
+                if (pfcp_parse_forwarding_parameters(&v->forwarding_parameters, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->forwarding_parameters.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_DUPLICATING_PARAMETERS_TYPE:
+            if (!v->duplicating_parameters.presence) {
+                if (pfcp_parse_duplicating_parameters(&v->duplicating_parameters, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->duplicating_parameters.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_BAR_ID_TYPE:
+            if (!v->bar_id.presence) {
+                if (pfcp_parse_uint8(&v->bar_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_REDUNDANT_TRANSMISSION_FORWARDING_PARAMETERS_TYPE:
+            if (!v->redundant_transmission_forwarding_parameters.presence) {
+                if (pfcp_parse_redundant_transmission_forwarding_parameters(&v->redundant_transmission_forwarding_parameters, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->redundant_transmission_forwarding_parameters.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_MBS_MULTICAST_PARAMETERS_TYPE:
+            if (!v->mbs_multicast_parameters.presence) {
+                if (pfcp_parse_mbs_multicast_parameters(&v->mbs_multicast_parameters, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->mbs_multicast_parameters.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_ADD_MBS_UNICAST_PARAMETERS_TYPE:
+            if (!v->add_mbs_unicast_parameters.presence) {
+                if (pfcp_parse_add_mbs_unicast_parameters(&v->add_mbs_unicast_parameters, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->add_mbs_unicast_parameters.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_update_forwarding_parameters(
+        ogs_pfcp_tlv_update_forwarding_parameters_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Update Forwarding Parameters] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_DESTINATION_INTERFACE_TYPE:
+            if (!v->destination_interface.presence) {
+                if (pfcp_parse_uint8(&v->destination_interface, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_NETWORK_INSTANCE_TYPE:
+            if (!v->network_instance.presence) {
+                if (pfcp_parse_octet(&v->network_instance, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_REDIRECT_INFORMATION_TYPE:
+            if (!v->redirect_information.presence) {
+                if (pfcp_parse_octet(&v->redirect_information, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_OUTER_HEADER_CREATION_TYPE:
+            if (!v->outer_header_creation.presence) {
+                if (pfcp_parse_octet(&v->outer_header_creation, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_TRANSPORT_LEVEL_MARKING_TYPE:
+            if (!v->transport_level_marking.presence) {
+                if (pfcp_parse_octet(&v->transport_level_marking, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_FORWARDING_POLICY_TYPE:
+            if (!v->forwarding_policy.presence) {
+                if (pfcp_parse_octet(&v->forwarding_policy, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_HEADER_ENRICHMENT_TYPE:
+            if (!v->header_enrichment.presence) {
+                if (pfcp_parse_octet(&v->header_enrichment, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_PFCPSMREQ_FLAGS_TYPE:
+            if (!v->pfcpsmreq_flags.presence) {
+                if (pfcp_parse_uint8(&v->pfcpsmreq_flags, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_TRAFFIC_ENDPOINT_ID_TYPE:
+            if (!v->linked_traffic_endpoint_id.presence) {
+                if (pfcp_parse_octet(&v->linked_traffic_endpoint_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP__INTERFACE_TYPE_TYPE:
+            if (!v->destination_interface_type.presence) {
+                if (pfcp_parse_uint8(&v->destination_interface_type, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_DATA_NETWORK_ACCESS_IDENTIFIER_TYPE:
+            if (!v->data_network_access_identifier.presence) {
+                if (pfcp_parse_octet(&v->data_network_access_identifier, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_IP_ADDRESS_AND_PORT_NUMBER_REPLACEMENT_TYPE:
+            if (!v->ip_address_and_port_number_replacement.presence) {
+                if (pfcp_parse_octet(&v->ip_address_and_port_number_replacement, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_update_duplicating_parameters(
+        ogs_pfcp_tlv_update_duplicating_parameters_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Update Duplicating Parameters] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_DESTINATION_INTERFACE_TYPE:
+            if (!v->destination_interface.presence) {
+                if (pfcp_parse_uint8(&v->destination_interface, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_OUTER_HEADER_CREATION_TYPE:
+            if (!v->outer_header_creation.presence) {
+                if (pfcp_parse_octet(&v->outer_header_creation, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_TRANSPORT_LEVEL_MARKING_TYPE:
+            if (!v->transport_level_marking.presence) {
+                if (pfcp_parse_octet(&v->transport_level_marking, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_FORWARDING_POLICY_TYPE:
+            if (!v->forwarding_policy.presence) {
+                if (pfcp_parse_octet(&v->forwarding_policy, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_update_far(
+        ogs_pfcp_tlv_update_far_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Update FAR] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_FAR_ID_TYPE:
+            if (!v->far_id.presence) {
+                if (pfcp_parse_uint32(&v->far_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_APPLY_ACTION_TYPE:
+            if (!v->apply_action.presence) {
+                if (pfcp_parse_uint16(&v->apply_action, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_UPDATE_FORWARDING_PARAMETERS_TYPE:
+            if (!v->update_forwarding_parameters.presence) {
+                if (pfcp_parse_update_forwarding_parameters(&v->update_forwarding_parameters, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->update_forwarding_parameters.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_UPDATE_DUPLICATING_PARAMETERS_TYPE:
+            if (!v->update_duplicating_parameters.presence) {
+                if (pfcp_parse_update_duplicating_parameters(&v->update_duplicating_parameters, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->update_duplicating_parameters.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_REDUNDANT_TRANSMISSION_FORWARDING_PARAMETERS_TYPE:
+            if (!v->redundant_transmission_forwarding_parameters.presence) {
+                if (pfcp_parse_redundant_transmission_forwarding_parameters(&v->redundant_transmission_forwarding_parameters, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->redundant_transmission_forwarding_parameters.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_BAR_ID_TYPE:
+            if (!v->bar_id.presence) {
+                if (pfcp_parse_uint8(&v->bar_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_ADD_MBS_UNICAST_PARAMETERS_TYPE:
+            if (!v->add_mbs_unicast_parameters.presence) {
+                if (pfcp_parse_add_mbs_unicast_parameters(&v->add_mbs_unicast_parameters, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->add_mbs_unicast_parameters.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_REMOVE_MBS_UNICAST_PARAMETERS_TYPE:
+            if (!v->remove_mbs_unicast_parameters.presence) {
+                if (pfcp_parse_octet(&v->remove_mbs_unicast_parameters, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_ethernet_traffic_information(
+        ogs_pfcp_tlv_ethernet_traffic_information_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Ethernet Traffic Information] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_MAC_ADDRESSES_DETECTED_TYPE:
+            if (!v->mac_addresses_detected.presence) {
+                if (pfcp_parse_octet(&v->mac_addresses_detected, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_MAC_ADDRESSES_REMOVED_TYPE:
+            if (!v->mac_addresses_removed.presence) {
+                if (pfcp_parse_octet(&v->mac_addresses_removed, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse__access_forwarding_action_information(
+        ogs_pfcp_tlv__access_forwarding_action_information_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+    int i;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [3GPP Access Forwarding Action Information] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_FAR_ID_TYPE:
+            if (!v->far_id.presence) {
+                if (pfcp_parse_uint32(&v->far_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_WEIGHT_TYPE:
+            if (!v->weight.presence) {
+                if (pfcp_parse_octet(&v->weight, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_PRIORITY_TYPE:
+            if (!v->priority.presence) {
+                if (pfcp_parse_octet(&v->priority, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_URR_ID_TYPE:
+            for (i = 0; i < 8 && v->urr_id[i].presence; i++);
+            if (i == 8) {
+                ogs_fatal("Multiple of the same type TLV need more room");
+                break;
+            }
+            if (pfcp_parse_uint32(&v->urr_id[i], value, length) != OGS_OK)
+                return OGS_ERROR;
+            break;
+        case OGS_PFCP_RAT_TYPE_TYPE:
+            if (!v->rat_type.presence) {
+                if (pfcp_parse_octet(&v->rat_type, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case 0:
+            /* ogs_tlv_parse_msg() takes it for an ogs_tlv_desc_more */
+            ogs_error("Unknown type[%d]", OGS_TLV_MORE);
+            return OGS_ERROR;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_non__access_forwarding_action_information(
+        ogs_pfcp_tlv_non__access_forwarding_action_information_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+    int i;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Non-3GPP Access Forwarding Action Information] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_FAR_ID_TYPE:
+            if (!v->far_id.presence) {
+                if (pfcp_parse_uint32(&v->far_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_WEIGHT_TYPE:
+            if (!v->weight.presence) {
+                if (pfcp_parse_octet(&v->weight, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_PRIORITY_TYPE:
+            if (!v->priority.presence) {
+                if (pfcp_parse_octet(&v->priority, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_URR_ID_TYPE:
+            for (i = 0; i < 8 && v->urr_id[i].presence; i++);
+            if (i == 8) {
+                ogs_fatal("Multiple of the same type TLV need more room");
+                break;
+            }
+            if (pfcp_parse_uint32(&v->urr_id[i], value, length) != OGS_OK)
+                return OGS_ERROR;
+            break;
+        case OGS_PFCP_RAT_TYPE_TYPE:
+            if (!v->rat_type.presence) {
+                if (pfcp_parse_octet(&v->rat_type, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case 0:
+            /* ogs_tlv_parse_msg() takes it for an ogs_tlv_desc_more */
+            ogs_error("Unknown type[%d]", OGS_TLV_MORE);
+            return OGS_ERROR;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_update__access_forwarding_action_information(
+        ogs_pfcp_tlv_update__access_forwarding_action_information_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Update 3GPP Access Forwarding Action Information] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_FAR_ID_TYPE:
+            if (!v->far_id.presence) {
+                if (pfcp_parse_uint32(&v->far_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_WEIGHT_TYPE:
+            if (!v->weight.presence) {
+                if (pfcp_parse_octet(&v->weight, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_PRIORITY_TYPE:
+            if (!v->priority.presence) {
+                if (pfcp_parse_octet(&v->priority, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_URR_ID_TYPE:
+            if (!v->urr_id.presence) {
+                if (pfcp_parse_uint32(&v->urr_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_RAT_TYPE_TYPE:
+            if (!v->rat_type.presence) {
+                if (pfcp_parse_octet(&v->rat_type, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_update_non__access_forwarding_action_information(
+        ogs_pfcp_tlv_update_non__access_forwarding_action_information_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Update Non-3GPP Access Forwarding Action Information] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_FAR_ID_TYPE:
+            if (!v->far_id.presence) {
+                if (pfcp_parse_uint32(&v->far_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_WEIGHT_TYPE:
+            if (!v->weight.presence) {
+                if (pfcp_parse_octet(&v->weight, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_PRIORITY_TYPE:
+            if (!v->priority.presence) {
+                if (pfcp_parse_octet(&v->priority, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_URR_ID_TYPE:
+            if (!v->urr_id.presence) {
+                if (pfcp_parse_uint32(&v->urr_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_RAT_TYPE_TYPE:
+            if (!v->rat_type.presence) {
+                if (pfcp_parse_octet(&v->rat_type, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_access_availability_report(
+        ogs_pfcp_tlv_access_availability_report_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Access Availability Report] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_ACCESS_AVAILABILITY_INFORMATION_TYPE:
+            if (!v->access_availability_information.presence) {
+                if (pfcp_parse_octet(&v->access_availability_information, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_qos_monitoring_report(
+        ogs_pfcp_tlv_qos_monitoring_report_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [QoS Monitoring Report] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_QFI_TYPE:
+            if (!v->qfi.presence) {
+                if (pfcp_parse_uint8(&v->qfi, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_QOS_MONITORING_MEASUREMENT_TYPE:
+            if (!v->qos_monitoring_measurement.presence) {
+                if (pfcp_parse_octet(&v->qos_monitoring_measurement, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_TIME_STAMP_TYPE:
+            if (!v->time_stamp.presence) {
+                if (pfcp_parse_octet(&v->time_stamp, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_START_TIME_TYPE:
+            if (!v->start_time.presence) {
+                if (pfcp_parse_uint32(&v->start_time, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_mptcp_parameters(
+        ogs_pfcp_tlv_mptcp_parameters_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [MPTCP Parameters] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_MPTCP_ADDRESS_INFORMATION_TYPE:
+            if (!v->mptcp_address_information.presence) {
+                if (pfcp_parse_octet(&v->mptcp_address_information, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_UE_LINK_SPECIFIC_IP_ADDRESS_TYPE:
+            if (!v->ue_link_specific_ip_address.presence) {
+                if (pfcp_parse_octet(&v->ue_link_specific_ip_address, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_atsss_ll_parameters(
+        ogs_pfcp_tlv_atsss_ll_parameters_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [ATSSS-LL Parameters] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_ATSSS_LL_INFORMATION_TYPE:
+            if (!v->atsss_ll_information.presence) {
+                if (pfcp_parse_octet(&v->atsss_ll_information, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_pmf_parameters(
+        ogs_pfcp_tlv_pmf_parameters_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [PMF Parameters] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_PMF_ADDRESS_INFORMATION_TYPE:
+            if (!v->pmf_address_information.presence) {
+                if (pfcp_parse_octet(&v->pmf_address_information, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_QFI_TYPE:
+            if (!v->qos_flow_identifier.presence) {
+                if (pfcp_parse_uint8(&v->qos_flow_identifier, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_join_ip_multicast_information_ie_within_usage_report(
+        ogs_pfcp_tlv_join_ip_multicast_information_ie_within_usage_report_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Join IP Multicast Information IE within Usage Report] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_IP_MULTICAST_ADDRESS_TYPE:
+            if (!v->ip_multicast_address.presence) {
+                if (pfcp_parse_octet(&v->ip_multicast_address, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_SOURCE_IP_ADDRESS_TYPE:
+            if (!v->source_ip_address.presence) {
+                if (pfcp_parse_octet(&v->source_ip_address, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_leave_ip_multicast_information_ie_within_usage_report(
+        ogs_pfcp_tlv_leave_ip_multicast_information_ie_within_usage_report_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Leave IP Multicast Information IE within Usage Report] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_IP_MULTICAST_ADDRESS_TYPE:
+            if (!v->ip_multicast_address.presence) {
+                if (pfcp_parse_octet(&v->ip_multicast_address, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_SOURCE_IP_ADDRESS_TYPE:
+            if (!v->source_ip_address.presence) {
+                if (pfcp_parse_octet(&v->source_ip_address, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_create_urr(
+        ogs_pfcp_tlv_create_urr_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+    int i;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Create URR] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_URR_ID_TYPE:
+            if (!v->urr_id.presence) {
+                if (pfcp_parse_uint32(&v->urr_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_MEASUREMENT_METHOD_TYPE:
+            if (!v->measurement_method.presence) {
+                if (pfcp_parse_uint8(&v->measurement_method, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_REPORTING_TRIGGERS_TYPE:
+            if (!v->reporting_triggers.presence) {
+                if (pfcp_parse_uint24(&v->reporting_triggers, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_MEASUREMENT_PERIOD_TYPE:
+            if (!v->measurement_period.presence) {
+                if (pfcp_parse_uint32(&v->measurement_period, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_VOLUME_THRESHOLD_TYPE:
+            if (!v->volume_threshold.presence) {
+                if (pfcp_parse_octet(&v->volume_threshold, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_VOLUME_QUOTA_TYPE:
+            if (!v->volume_quota.presence) {
+                if (pfcp_parse_octet(&v->volume_quota, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_EVENT_THRESHOLD_TYPE:
+            if (!v->event_threshold.presence) {
+                if (pfcp_parse_uint32(&v->event_threshold, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_EVENT_QUOTA_TYPE:
+            if (!v->event_quota.presence) {
+                if (pfcp_parse_uint32(&v->event_quota, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_TIME_THRESHOLD_TYPE:
+            if (!v->time_threshold.presence) {
+                if (pfcp_parse_uint32(&v->time_threshold, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_TIME_QUOTA_TYPE:
+            if (!v->time_quota.presence) {
+                if (pfcp_parse_uint32(&v->time_quota, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_QUOTA_HOLDING_TIME_TYPE:
+            if (!v->quota_holding_time.presence) {
+                if (pfcp_parse_uint32(&v->quota_holding_time, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_DROPPED_DL_TRAFFIC_THRESHOLD_TYPE:
+            if (!v->dropped_dl_traffic_threshold.presence) {
+                if (pfcp_parse_octet(&v->dropped_dl_traffic_threshold, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_QUOTA_VALIDITY_TIME_TYPE:
+            if (!v->quota_validity_time.presence) {
+                if (pfcp_parse_uint32(&v->quota_validity_time, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_MONITORING_TIME_TYPE:
+            if (!v->monitoring_time.presence) {
+                if (pfcp_parse_octet(&v->monitoring_time, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_SUBSEQUENT_VOLUME_THRESHOLD_TYPE:
+            if (!v->subsequent_volume_threshold.presence) {
+                if (pfcp_parse_octet(&v->subsequent_volume_threshold, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_SUBSEQUENT_TIME_THRESHOLD_TYPE:
+            if (!v->subsequent_time_threshold.presence) {
+                if (pfcp_parse_octet(&v->subsequent_time_threshold, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_SUBSEQUENT_VOLUME_QUOTA_TYPE:
+            if (!v->subsequent_volume_quota.presence) {
+                if (pfcp_parse_octet(&v->subsequent_volume_quota, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_SUBSEQUENT_TIME_QUOTA_TYPE:
+            if (!v->subsequent_time_quota.presence) {
+                if (pfcp_parse_octet(&v->subsequent_time_quota, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_SUBSEQUENT_EVENT_THRESHOLD_TYPE:
+            if (!v->subsequent_event_threshold.presence) {
+                if (pfcp_parse_octet(&v->subsequent_event_threshold, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_SUBSEQUENT_EVENT_QUOTA_TYPE:
+            if (!v->subsequent_event_quota.presence) {
+                if (pfcp_parse_octet(&v->subsequent_event_quota, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_INACTIVITY_DETECTION_TIME_TYPE:
+            if (!v->inactivity_detection_time.presence) {
+                if (pfcp_parse_octet(&v->inactivity_detection_time, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_LINKED_URR_ID_TYPE:
+            if (!v->linked_urr_id.presence) {
+                if (pfcp_parse_octet(&v->linked_urr_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_MEASUREMENT_INFORMATION_TYPE:
+            if (!v->measurement_information.presence) {
+                if (pfcp_parse_octet(&v->measurement_information, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_TIME_QUOTA_MECHANISM_TYPE:
+            if (!v->time_quota_mechanism.presence) {
+                if (pfcp_parse_octet(&v->time_quota_mechanism, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_AGGREGATED_URRS_TYPE:
+            if (!v->aggregated_urrs.presence) {
+                if (pfcp_parse_octet(&v->aggregated_urrs, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_FAR_ID_TYPE:
+            if (!v->far_id_for_quota_action.presence) {
+                if (pfcp_parse_uint32(&v->far_id_for_quota_action, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_ETHERNET_INACTIVITY_TIMER_TYPE:
+            if (!v->ethernet_inactivity_timer.presence) {
+                if (pfcp_parse_octet(&v->ethernet_inactivity_timer, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_ADDITIONAL_MONITORING_TIME_TYPE:
+            if (!v->additional_monitoring_time.presence) {
+                if (pfcp_parse_octet(&v->additional_monitoring_time, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_NUMBER_OF_REPORTS_TYPE:
+            if (!v->number_of_reports.presence) {
+                if (pfcp_parse_octet(&v->number_of_reports, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_APPLICATION_ID_TYPE:
+            if (!v->exempted_application_id_for_quota_action.presence) {
+                if (pfcp_parse_octet(&v->exempted_application_id_for_quota_action, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_SDF_FILTER_TYPE:
+            for (i = 0; i < 8 && v->exempted_sdf_filter_for_quota_action[i].presence; i++);
+            if (i == 8) {
+                ogs_fatal("Multiple of the same type TLV need more room");
+                break;
+            }
+            if (pfcp_parse_octet(&v->exempted_sdf_filter_for_quota_action[i], value, length) != OGS_OK)
+                return OGS_ERROR;
+            break;
+        case OGS_PFCP_USER_PLANE_INACTIVITY_TIMER_TYPE:
+            if (!v->user_plane_inactivity_timer.presence) {
+                if (pfcp_parse_octet(&v->user_plane_inactivity_timer, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case 0:
+            /* ogs_tlv_parse_msg() takes it for an ogs_tlv_desc_more */
+            ogs_error("Unknown type[%d]", OGS_TLV_MORE);
+            return OGS_ERROR;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_create_qer(
+        ogs_pfcp_tlv_create_qer_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Create QER] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_QER_ID_TYPE:
+            if (!v->qer_id.presence) {
+                if (pfcp_parse_uint32(&v->qer_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_QER_CORRELATION_ID_TYPE:
+            if (!v->qer_correlation_id.presence) {
+                if (pfcp_parse_uint32(&v->qer_correlation_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_GATE_STATUS_TYPE:
+            if (!v->gate_status.presence) {
+                if (pfcp_parse_uint8(&v->gate_status, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_MBR_TYPE:
+            if (!v->maximum_bitrate.presence) {
+                if (pfcp_parse_octet(&v->maximum_bitrate, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_GBR_TYPE:
+            if (!v->guaranteed_bitrate.presence) {
+                if (pfcp_parse_octet(&v->guaranteed_bitrate, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_PACKET_RATE_TYPE:
+            if (!v->packet_rate.presence) {
+                if (pfcp_parse_octet(&v->packet_rate, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_PACKET_RATE_STATUS_TYPE:
+            if (!v->packet_rate_status.presence) {
+                if (pfcp_parse_octet(&v->packet_rate_status, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_DL_FLOW_LEVEL_MARKING_TYPE:
+            if (!v->dl_flow_level_marking.presence) {
+                if (pfcp_parse_octet(&v->dl_flow_level_marking, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_QFI_TYPE:
+            if (!v->qos_flow_identifier.presence) {
+                if (pfcp_parse_uint8(&v->qos_flow_identifier, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_RQI_TYPE:
+            if (!v->reflective_qos.presence) {
+                if (pfcp_parse_uint8(&v->reflective_qos, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_PAGING_POLICY_INDICATOR_TYPE:
+            if (!v->paging_policy_indicator.presence) {
+                if (pfcp_parse_uint8(&v->paging_policy_indicator, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_AVERAGING_WINDOW_TYPE:
+            if (!v->averaging_window.presence) {
+                if (pfcp_parse_uint32(&v->averaging_window, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_QER_CONTROL_INDICATIONS_TYPE:
+            if (!v->qer_control_indications.presence) {
+                if (pfcp_parse_octet(&v->qer_control_indications, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_QER_INDICATIONS_TYPE:
+            if (!v->qer_indications.presence) {
+                if (pfcp_parse_octet(&v->qer_indications, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_created_pdr(
+        ogs_pfcp_tlv_created_pdr_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Created PDR] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_PDR_ID_TYPE:
+            if (!v->pdr_id.presence) {
+                if (pfcp_parse_uint16(&v->pdr_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_F_TEID_TYPE:
+            if (!v->local_f_teid.presence) {
+                if (pfcp_parse_octet(&v->local_f_teid, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else if (!v->local_f_teid_for_redundant_transmission.presence) {
+                if (pfcp_parse_octet(&v->local_f_teid_for_redundant_transmission, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_UE_IP_ADDRESS_TYPE:
+            if (!v->ue_ip_address.presence) {
+                if (pfcp_parse_octet(&v->ue_ip_address, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_LOCAL_INGRESS_TUNNEL_TYPE:
+            if (!v->local_ingress_tunnel.presence) {
+                if (pfcp_parse_octet(&v->local_ingress_tunnel, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_update_pdr(
+        ogs_pfcp_tlv_update_pdr_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Update PDR] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_PDR_ID_TYPE:
+            if (!v->pdr_id.presence) {
+                if (pfcp_parse_uint16(&v->pdr_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_OUTER_HEADER_REMOVAL_TYPE:
+            if (!v->outer_header_removal.presence) {
+                if (pfcp_parse_octet(&v->outer_header_removal, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_PRECEDENCE_TYPE:
+            if (!v->precedence.presence) {
+                if (pfcp_parse_uint32(&v->precedence, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_PDI_TYPE:
+            if (!v->pdi.presence) {
+                if (pfcp_parse_pdi(&v->pdi, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->pdi.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_FAR_ID_TYPE:
+            if (!v->far_id.presence) {
+                if (pfcp_parse_uint32(&v->far_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_URR_ID_TYPE:
+            if (!v->urr_id.presence) {
+                if (pfcp_parse_uint32(&v->urr_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_QER_ID_TYPE:
+            if (!v->qer_id.presence) {
+                if (pfcp_parse_uint32(&v->qer_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_ACTIVATE_PREDEFINED_RULES_TYPE:
+            if (!v->activate_predefined_rules.presence) {
+                if (pfcp_parse_octet(&v->activate_predefined_rules, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_DEACTIVATE_PREDEFINED_RULES_TYPE:
+            if (!v->deactivate_predefined_rules.presence) {
+                if (pfcp_parse_octet(&v->deactivate_predefined_rules, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_ACTIVATION_TIME_TYPE:
+            if (!v->activation_time.presence) {
+                if (pfcp_parse_octet(&v->activation_time, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_DEACTIVATION_TIME_TYPE:
+            if (!v->deactivation_time.presence) {
+                if (pfcp_parse_octet(&v->deactivation_time, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_IP_MULTICAST_ADDRESSING_INFO_WITHIN_PFCP_SESSION_ESTABLISHMENT_REQUEST_TYPE:
+            if (!v->ip_multicast_addressing_info.presence) {
+                if (pfcp_parse_ip_multicast_addressing_info_within_pfcp_session_establishment_request(&v->ip_multicast_addressing_info, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->ip_multicast_addressing_info.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_TRANSPORT_DELAY_REPORTING_TYPE:
+            if (!v->transport_delay_reporting.presence) {
+                if (pfcp_parse_transport_delay_reporting(&v->transport_delay_reporting, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->transport_delay_reporting.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_RAT_TYPE_TYPE:
+            if (!v->rat_type.presence) {
+                if (pfcp_parse_octet(&v->rat_type, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_update_bar_pfcp_session_report_response(
+        ogs_pfcp_tlv_update_bar_pfcp_session_report_response_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Update BAR PFCP Session Report Response] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_BAR_ID_TYPE:
+            if (!v->bar_id.presence) {
+                if (pfcp_parse_uint8(&v->bar_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_DOWNLINK_DATA_NOTIFICATION_DELAY_TYPE:
+            if (!v->downlink_data_notification_delay.presence) {
+                if (pfcp_parse_octet(&v->downlink_data_notification_delay, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_DL_BUFFERING_DURATION_TYPE:
+            if (!v->dl_buffering_duration.presence) {
+                if (pfcp_parse_octet(&v->dl_buffering_duration, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_DL_BUFFERING_SUGGESTED_PACKET_COUNT_TYPE:
+            if (!v->dl_buffering_suggested_packet_count.presence) {
+                if (pfcp_parse_octet(&v->dl_buffering_suggested_packet_count, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_SUGGESTED_BUFFERING_PACKETS_COUNT_TYPE:
+            if (!v->suggested_buffering_packets_count.presence) {
+                if (pfcp_parse_octet(&v->suggested_buffering_packets_count, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_update_urr(
+        ogs_pfcp_tlv_update_urr_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+    int i;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Update URR] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_URR_ID_TYPE:
+            if (!v->urr_id.presence) {
+                if (pfcp_parse_uint32(&v->urr_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_MEASUREMENT_METHOD_TYPE:
+            if (!v->measurement_method.presence) {
+                if (pfcp_parse_uint8(&v->measurement_method, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_REPORTING_TRIGGERS_TYPE:
+            if (!v->reporting_triggers.presence) {
+                if (pfcp_parse_uint24(&v->reporting_triggers, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_MEASUREMENT_PERIOD_TYPE:
+            if (!v->measurement_period.presence) {
+                if (pfcp_parse_uint32(&v->measurement_period, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_VOLUME_THRESHOLD_TYPE:
+            if (!v->volume_threshold.presence) {
+                if (pfcp_parse_octet(&v->volume_threshold, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_VOLUME_QUOTA_TYPE:
+            if (!v->volume_quota.presence) {
+                if (pfcp_parse_octet(&v->volume_quota, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_TIME_THRESHOLD_TYPE:
+            if (!v->time_threshold.presence) {
+                if (pfcp_parse_uint32(&v->time_threshold, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_TIME_QUOTA_TYPE:
+            if (!v->time_quota.presence) {
+                if (pfcp_parse_uint32(&v->time_quota, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_EVENT_THRESHOLD_TYPE:
+            if (!v->event_threshold.presence) {
+                if (pfcp_parse_uint32(&v->event_threshold, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_EVENT_QUOTA_TYPE:
+            if (!v->event_quota.presence) {
+                if (pfcp_parse_uint32(&v->event_quota, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_QUOTA_HOLDING_TIME_TYPE:
+            if (!v->quota_holding_time.presence) {
+                if (pfcp_parse_uint32(&v->quota_holding_time, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_DROPPED_DL_TRAFFIC_THRESHOLD_TYPE:
+            if (!v->dropped_dl_traffic_threshold.presence) {
+                if (pfcp_parse_octet(&v->dropped_dl_traffic_threshold, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_QUOTA_VALIDITY_TIME_TYPE:
+            if (!v->quota_validity_time.presence) {
+                if (pfcp_parse_uint32(&v->quota_validity_time, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_MONITORING_TIME_TYPE:
+            if (!v->monitoring_time.presence) {
+                if (pfcp_parse_octet(&v->monitoring_time, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_SUBSEQUENT_VOLUME_THRESHOLD_TYPE:
+            if (!v->subsequent_volume_threshold.presence) {
+                if (pfcp_parse_octet(&v->subsequent_volume_threshold, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_SUBSEQUENT_TIME_THRESHOLD_TYPE:
+            if (!v->subsequent_time_threshold.presence) {
+                if (pfcp_parse_octet(&v->subsequent_time_threshold, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_SUBSEQUENT_VOLUME_QUOTA_TYPE:
+            if (!v->subsequent_volume_quota.presence) {
+                if (pfcp_parse_octet(&v->subsequent_volume_quota, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_SUBSEQUENT_TIME_QUOTA_TYPE:
+            if (!v->subsequent_time_quota.presence) {
+                if (pfcp_parse_octet(&v->subsequent_time_quota, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_SUBSEQUENT_EVENT_THRESHOLD_TYPE:
+            if (!v->subsequent_event_threshold.presence) {
+                if (pfcp_parse_octet(&v->subsequent_event_threshold, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_SUBSEQUENT_EVENT_QUOTA_TYPE:
+            if (!v->subsequent_event_quota.presence) {
+                if (pfcp_parse_octet(&v->subsequent_event_quota, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_INACTIVITY_DETECTION_TIME_TYPE:
+            if (!v->inactivity_detection_time.presence) {
+                if (pfcp_parse_octet(&v->inactivity_detection_time, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_LINKED_URR_ID_TYPE:
+            if (!v->linked_urr_id.presence) {
+                if (pfcp_parse_octet(&v->linked_urr_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_MEASUREMENT_INFORMATION_TYPE:
+            if (!v->measurement_information.presence) {
+                if (pfcp_parse_octet(&v->measurement_information, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_TIME_QUOTA_MECHANISM_TYPE:
+            if (!v->time_quota_mechanism.presence) {
+                if (pfcp_parse_octet(&v->time_quota_mechanism, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_AGGREGATED_URRS_TYPE:
+            if (!v->aggregated_urrs.presence) {
+                if (pfcp_parse_octet(&v->aggregated_urrs, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_FAR_ID_TYPE:
+            if (!v->far_id_for_quota_action.presence) {
+                if (pfcp_parse_uint32(&v->far_id_for_quota_action, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_ETHERNET_INACTIVITY_TIMER_TYPE:
+            if (!v->ethernet_inactivity_timer.presence) {
+                if (pfcp_parse_octet(&v->ethernet_inactivity_timer, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_ADDITIONAL_MONITORING_TIME_TYPE:
+            if (!v->additional_monitoring_time.presence) {
+                if (pfcp_parse_octet(&v->additional_monitoring_time, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_NUMBER_OF_REPORTS_TYPE:
+            if (!v->number_of_reports.presence) {
+                if (pfcp_parse_octet(&v->number_of_reports, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_APPLICATION_ID_TYPE:
+            if (!v->exempted_application_id_for_quota_action.presence) {
+                if (pfcp_parse_octet(&v->exempted_application_id_for_quota_action, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_SDF_FILTER_TYPE:
+            for (i = 0; i < 8 && v->exempted_sdf_filter_for_quota_action[i].presence; i++);
+            if (i == 8) {
+                ogs_fatal("Multiple of the same type TLV need more room");
+                break;
+            }
+            if (pfcp_parse_octet(&v->exempted_sdf_filter_for_quota_action[i], value, length) != OGS_OK)
+                return OGS_ERROR;
+            break;
+        case OGS_PFCP_USER_PLANE_INACTIVITY_TIMER_TYPE:
+            if (!v->user_plane_inactivity_timer.presence) {
+                if (pfcp_parse_octet(&v->user_plane_inactivity_timer, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case 0:
+            /* ogs_tlv_parse_msg() takes it for an ogs_tlv_desc_more */
+            ogs_error("Unknown type[%d]", OGS_TLV_MORE);
+            return OGS_ERROR;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_update_qer(
+        ogs_pfcp_tlv_update_qer_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Update QER] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_QER_ID_TYPE:
+            if (!v->qer_id.presence) {
+                if (pfcp_parse_uint32(&v->qer_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_QER_CORRELATION_ID_TYPE:
+            if (!v->qer_correlation_id.presence) {
+                if (pfcp_parse_uint32(&v->qer_correlation_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_GATE_STATUS_TYPE:
+            if (!v->gate_status.presence) {
+                if (pfcp_parse_uint8(&v->gate_status, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_MBR_TYPE:
+            if (!v->maximum_bitrate.presence) {
+                if (pfcp_parse_octet(&v->maximum_bitrate, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_GBR_TYPE:
+            if (!v->guaranteed_bitrate.presence) {
+                if (pfcp_parse_octet(&v->guaranteed_bitrate, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_PACKET_RATE_TYPE:
+            if (!v->packet_rate.presence) {
+                if (pfcp_parse_octet(&v->packet_rate, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_DL_FLOW_LEVEL_MARKING_TYPE:
+            if (!v->dl_flow_level_marking.presence) {
+                if (pfcp_parse_octet(&v->dl_flow_level_marking, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_QFI_TYPE:
+            if (!v->qos_flow_identifier.presence) {
+                if (pfcp_parse_uint8(&v->qos_flow_identifier, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_RQI_TYPE:
+            if (!v->reflective_qos.presence) {
+                if (pfcp_parse_uint8(&v->reflective_qos, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_PAGING_POLICY_INDICATOR_TYPE:
+            if (!v->paging_policy_indicator.presence) {
+                if (pfcp_parse_uint8(&v->paging_policy_indicator, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_AVERAGING_WINDOW_TYPE:
+            if (!v->averaging_window.presence) {
+                if (pfcp_parse_uint32(&v->averaging_window, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_QER_CONTROL_INDICATIONS_TYPE:
+            if (!v->qer_control_indications.presence) {
+                if (pfcp_parse_octet(&v->qer_control_indications, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_remove_pdr(
+        ogs_pfcp_tlv_remove_pdr_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Remove PDR] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_PDR_ID_TYPE:
+            if (!v->pdr_id.presence) {
+                if (pfcp_parse_uint16(&v->pdr_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_remove_far(
+        ogs_pfcp_tlv_remove_far_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Remove FAR] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_FAR_ID_TYPE:
+            if (!v->far_id.presence) {
+                if (pfcp_parse_uint32(&v->far_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_remove_urr(
+        ogs_pfcp_tlv_remove_urr_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Remove URR] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_URR_ID_TYPE:
+            if (!v->urr_id.presence) {
+                if (pfcp_parse_uint32(&v->urr_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_remove_qer(
+        ogs_pfcp_tlv_remove_qer_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Remove QER] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_QER_ID_TYPE:
+            if (!v->qer_id.presence) {
+                if (pfcp_parse_uint32(&v->qer_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_load_control_information(
+        ogs_pfcp_tlv_load_control_information_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Load Control Information] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_SEQUENCE_NUMBER_TYPE:
+            if (!v->load_control_sequence_number.presence) {
+                if (pfcp_parse_octet(&v->load_control_sequence_number, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_METRIC_TYPE:
+            if (!v->load_metric.presence) {
+                if (pfcp_parse_octet(&v->load_metric, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_overload_control_information(
+        ogs_pfcp_tlv_overload_control_information_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Overload Control Information] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_SEQUENCE_NUMBER_TYPE:
+            if (!v->overload_control_sequence_number.presence) {
+                if (pfcp_parse_octet(&v->overload_control_sequence_number, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_METRIC_TYPE:
+            if (!v->overload_reduction_metric.presence) {
+                if (pfcp_parse_octet(&v->overload_reduction_metric, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_TIMER_TYPE:
+            if (!v->period_of_validity.presence) {
+                if (pfcp_parse_octet(&v->period_of_validity, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_OCI_FLAGS_TYPE:
+            if (!v->overload_control_information_flags.presence) {
+                if (pfcp_parse_octet(&v->overload_control_information_flags, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_application_detection_information(
+        ogs_pfcp_tlv_application_detection_information_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Application Detection Information] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_APPLICATION_ID_TYPE:
+            if (!v->application_id.presence) {
+                if (pfcp_parse_octet(&v->application_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_APPLICATION_INSTANCE_ID_TYPE:
+            if (!v->application_instance_id.presence) {
+                if (pfcp_parse_octet(&v->application_instance_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_FLOW_INFORMATION_TYPE:
+            if (!v->flow_information.presence) {
+                if (pfcp_parse_octet(&v->flow_information, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_PDR_ID_TYPE:
+            if (!v->pdr_id.presence) {
+                if (pfcp_parse_uint16(&v->pdr_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_query_urr(
+        ogs_pfcp_tlv_query_urr_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Query URR] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_URR_ID_TYPE:
+            if (!v->urr_id.presence) {
+                if (pfcp_parse_uint32(&v->urr_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_usage_report_session_modification_response(
+        ogs_pfcp_tlv_usage_report_session_modification_response_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Usage Report Session Modification Response] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_URR_ID_TYPE:
+            if (!v->urr_id.presence) {
+                if (pfcp_parse_uint32(&v->urr_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_UR_SEQN_TYPE:
+            if (!v->ur_seqn.presence) {
+                if (pfcp_parse_uint32(&v->ur_seqn, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_USAGE_REPORT_TRIGGER_TYPE:
+            if (!v->usage_report_trigger.presence) {
+                if (pfcp_parse_uint24(&v->usage_report_trigger, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_START_TIME_TYPE:
+            if (!v->start_time.presence) {
+                if (pfcp_parse_uint32(&v->start_time, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_END_TIME_TYPE:
+            if (!v->end_time.presence) {
+                if (pfcp_parse_uint32(&v->end_time, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_VOLUME_MEASUREMENT_TYPE:
+            if (!v->volume_measurement.presence) {
+                if (pfcp_parse_octet(&v->volume_measurement, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_DURATION_MEASUREMENT_TYPE:
+            if (!v->duration_measurement.presence) {
+                if (pfcp_parse_uint32(&v->duration_measurement, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_TIME_OF_FIRST_PACKET_TYPE:
+            if (!v->time_of_first_packet.presence) {
+                if (pfcp_parse_uint32(&v->time_of_first_packet, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_TIME_OF_LAST_PACKET_TYPE:
+            if (!v->time_of_last_packet.presence) {
+                if (pfcp_parse_uint32(&v->time_of_last_packet, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_USAGE_INFORMATION_TYPE:
+            if (!v->usage_information.presence) {
+                if (pfcp_parse_octet(&v->usage_information, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_QUERY_URR_REFERENCE_TYPE:
+            if (!v->query_urr_reference.presence) {
+                if (pfcp_parse_octet(&v->query_urr_reference, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_ETHERNET_TRAFFIC_INFORMATION_TYPE:
+            if (!v->ethernet_traffic_information.presence) {
+                if (pfcp_parse_ethernet_traffic_information(&v->ethernet_traffic_information, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->ethernet_traffic_information.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_usage_report_session_report_request(
+        ogs_pfcp_tlv_usage_report_session_report_request_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Usage Report Session Report Request] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_URR_ID_TYPE:
+            if (!v->urr_id.presence) {
+                if (pfcp_parse_uint32(&v->urr_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_UR_SEQN_TYPE:
+            if (!v->ur_seqn.presence) {
+                if (pfcp_parse_uint32(&v->ur_seqn, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_USAGE_REPORT_TRIGGER_TYPE:
+            if (!v->usage_report_trigger.presence) {
+                if (pfcp_parse_uint24(&v->usage_report_trigger, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_START_TIME_TYPE:
+            if (!v->start_time.presence) {
+                if (pfcp_parse_uint32(&v->start_time, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_END_TIME_TYPE:
+            if (!v->end_time.presence) {
+                if (pfcp_parse_uint32(&v->end_time, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_VOLUME_MEASUREMENT_TYPE:
+            if (!v->volume_measurement.presence) {
+                if (pfcp_parse_octet(&v->volume_measurement, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_DURATION_MEASUREMENT_TYPE:
+            if (!v->duration_measurement.presence) {
+                if (pfcp_parse_uint32(&v->duration_measurement, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_APPLICATION_DETECTION_INFORMATION_TYPE:
+            if (!v->application_detection_information.presence) {
+                if (pfcp_parse_application_detection_information(&v->application_detection_information, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->application_detection_information.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_UE_IP_ADDRESS_TYPE:
+            if (!v->ue_ip_address.presence) {
+                if (pfcp_parse_octet(&v->ue_ip_address, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_NETWORK_INSTANCE_TYPE:
+            if (!v->network_instance.presence) {
+                if (pfcp_parse_octet(&v->network_instance, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_TIME_OF_FIRST_PACKET_TYPE:
+            if (!v->time_of_first_packet.presence) {
+                if (pfcp_parse_uint32(&v->time_of_first_packet, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_TIME_OF_LAST_PACKET_TYPE:
+            if (!v->time_of_last_packet.presence) {
+                if (pfcp_parse_uint32(&v->time_of_last_packet, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_USAGE_INFORMATION_TYPE:
+            if (!v->usage_information.presence) {
+                if (pfcp_parse_octet(&v->usage_information, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_QUERY_URR_REFERENCE_TYPE:
+            if (!v->query_urr_reference.presence) {
+                if (pfcp_parse_octet(&v->query_urr_reference, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_TIME_STAMP_TYPE:
+            if (!v->event_time_stamp.presence) {
+                if (pfcp_parse_octet(&v->event_time_stamp, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_ETHERNET_TRAFFIC_INFORMATION_TYPE:
+            if (!v->ethernet_traffic_information.presence) {
+                if (pfcp_parse_ethernet_traffic_information(&v->ethernet_traffic_information, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->ethernet_traffic_information.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_JOIN_IP_MULTICAST_INFORMATION_IE_WITHIN_USAGE_REPORT_TYPE:
+            if (!v->join_ip_muticast_information.presence) {
+                if (pfcp_parse_join_ip_multicast_information_ie_within_usage_report(&v->join_ip_muticast_information, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->join_ip_muticast_information.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_LEAVE_IP_MULTICAST_INFORMATION_IE_WITHIN_USAGE_REPORT_TYPE:
+            if (!v->leave_ip_muticast_information.presence) {
+                if (pfcp_parse_leave_ip_multicast_information_ie_within_usage_report(&v->leave_ip_muticast_information, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->leave_ip_muticast_information.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_PREDEFINED_RULES_NAME_TYPE:
+            if (!v->predefined_rules_name.presence) {
+                if (pfcp_parse_octet(&v->predefined_rules_name, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_downlink_data_report(
+        ogs_pfcp_tlv_downlink_data_report_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Downlink Data Report] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_PDR_ID_TYPE:
+            if (!v->pdr_id.presence) {
+                if (pfcp_parse_uint16(&v->pdr_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_DOWNLINK_DATA_SERVICE_INFORMATION_TYPE:
+            if (!v->downlink_data_service_information.presence) {
+                if (pfcp_parse_octet(&v->downlink_data_service_information, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_DL_DATA_PACKETS_SIZE_TYPE:
+            if (!v->dl_data_packets_size.presence) {
+                if (pfcp_parse_octet(&v->dl_data_packets_size, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_DATA_STATUS_TYPE:
+            if (!v->dl_data_status.presence) {
+                if (pfcp_parse_uint8(&v->dl_data_status, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_create_bar(
+        ogs_pfcp_tlv_create_bar_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Create BAR] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_BAR_ID_TYPE:
+            if (!v->bar_id.presence) {
+                if (pfcp_parse_uint8(&v->bar_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_DOWNLINK_DATA_NOTIFICATION_DELAY_TYPE:
+            if (!v->downlink_data_notification_delay.presence) {
+                if (pfcp_parse_octet(&v->downlink_data_notification_delay, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_SUGGESTED_BUFFERING_PACKETS_COUNT_TYPE:
+            if (!v->suggested_buffering_packets_count.presence) {
+                if (pfcp_parse_octet(&v->suggested_buffering_packets_count, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_MT_EDT_CONTROL_INFORMATION_TYPE:
+            if (!v->mt_edt_control_information.presence) {
+                if (pfcp_parse_octet(&v->mt_edt_control_information, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_update_bar_session_modification_request(
+        ogs_pfcp_tlv_update_bar_session_modification_request_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Update BAR Session Modification Request] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_BAR_ID_TYPE:
+            if (!v->bar_id.presence) {
+                if (pfcp_parse_uint8(&v->bar_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_DOWNLINK_DATA_NOTIFICATION_DELAY_TYPE:
+            if (!v->downlink_data_notification_delay.presence) {
+                if (pfcp_parse_octet(&v->downlink_data_notification_delay, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_SUGGESTED_BUFFERING_PACKETS_COUNT_TYPE:
+            if (!v->suggested_buffering_packets_count.presence) {
+                if (pfcp_parse_octet(&v->suggested_buffering_packets_count, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_MT_EDT_CONTROL_INFORMATION_TYPE:
+            if (!v->mt_edt_control_information.presence) {
+                if (pfcp_parse_octet(&v->mt_edt_control_information, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_remove_bar(
+        ogs_pfcp_tlv_remove_bar_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Remove BAR] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_BAR_ID_TYPE:
+            if (!v->bar_id.presence) {
+                if (pfcp_parse_uint8(&v->bar_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_error_indication_report(
+        ogs_pfcp_tlv_error_indication_report_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Error Indication Report] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_F_TEID_TYPE:
+            if (!v->remote_f_teid.presence) {
+                if (pfcp_parse_octet(&v->remote_f_teid, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_create_traffic_endpoint(
+        ogs_pfcp_tlv_create_traffic_endpoint_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+    int i;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Create Traffic Endpoint] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_TRAFFIC_ENDPOINT_ID_TYPE:
+            if (!v->traffic_endpoint_id.presence) {
+                if (pfcp_parse_octet(&v->traffic_endpoint_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_F_TEID_TYPE:
+            if (!v->local_f_teid.presence) {
+                if (pfcp_parse_octet(&v->local_f_teid, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_NETWORK_INSTANCE_TYPE:
+            if (!v->network_instance.presence) {
+                if (pfcp_parse_octet(&v->network_instance, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_REDUNDANT_TRANSMISSION_PARAMETERS_TYPE:
+            if (!v->redundant_transmission_detection_parameters.presence) {
+                if (pfcp_parse_redundant_transmission_parameters(&v->redundant_transmission_detection_parameters, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->redundant_transmission_detection_parameters.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_UE_IP_ADDRESS_TYPE:
+            if (!v->ue_ip_address.presence) {
+                if (pfcp_parse_octet(&v->ue_ip_address, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_ETHERNET_PDU_SESSION_INFORMATION_TYPE:
+            if (!v->ethernet_pdu_session_information.presence) {
+                if (pfcp_parse_octet(&v->ethernet_pdu_session_information, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_FRAMED_ROUTE_TYPE:
+            for (i = 0; i < 8 && v->framed_route[i].presence; i++);
+            if (i == 8) {
+                ogs_fatal("Multiple of the same type TLV need more room");
+                break;
+            }
+            if (pfcp_parse_octet(&v->framed_route[i], value, length) != OGS_OK)
+                return OGS_ERROR;
+            break;
+        case OGS_PFCP_FRAMED_ROUTING_TYPE:
+            if (!v->framed_routing.presence) {
+                if (pfcp_parse_octet(&v->framed_routing, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_FRAMED_IPV6_ROUTE_TYPE:
+            for (i = 0; i < 8 && v->framed_ipv6_route[i].presence; i++);
+            if (i == 8) {
+                ogs_fatal("Multiple of the same type TLV need more room");
+                break;
+            }
+            if (pfcp_parse_octet(&v->framed_ipv6_route[i], value, length) != OGS_OK)
+                return OGS_ERROR;
+            break;
+        case OGS_PFCP_QFI_TYPE:
+            if (!v->qfi.presence) {
+                if (pfcp_parse_uint8(&v->qfi, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP__INTERFACE_TYPE_TYPE:
+            if (!v->source_interface_type.presence) {
+                if (pfcp_parse_uint8(&v->source_interface_type, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_LOCAL_INGRESS_TUNNEL_TYPE:
+            if (!v->local_ingress_tunnel.presence) {
+                if (pfcp_parse_octet(&v->local_ingress_tunnel, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_IP_MULTICAST_ADDRESSING_INFO_WITHIN_PFCP_SESSION_ESTABLISHMENT_REQUEST_TYPE:
+            if (!v->ip_multicast_addressing_info.presence) {
+                if (pfcp_parse_ip_multicast_addressing_info_within_pfcp_session_establishment_request(&v->ip_multicast_addressing_info, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->ip_multicast_addressing_info.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_MBS_SESSION_IDENTIFIER_TYPE:
+            if (!v->mbs_session_identifier.presence) {
+                if (pfcp_parse_octet(&v->mbs_session_identifier, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_AREA_SESSION_ID_TYPE:
+            if (!v->area_session_id.presence) {
+                if (pfcp_parse_octet(&v->area_session_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_RAT_TYPE_TYPE:
+            if (!v->rat_type.presence) {
+                if (pfcp_parse_octet(&v->rat_type, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case 0:
+            /* ogs_tlv_parse_msg() takes it for an ogs_tlv_desc_more */
+            ogs_error("Unknown type[%d]", OGS_TLV_MORE);
+            return OGS_ERROR;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_created_traffic_endpoint(
+        ogs_pfcp_tlv_created_traffic_endpoint_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Created Traffic Endpoint] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_TRAFFIC_ENDPOINT_ID_TYPE:
+            if (!v->traffic_endpoint_id.presence) {
+                if (pfcp_parse_octet(&v->traffic_endpoint_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_F_TEID_TYPE:
+            if (!v->local_f_teid.presence) {
+                if (pfcp_parse_octet(&v->local_f_teid, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else if (!v->local_f_teid_for_redundant_transmission.presence) {
+                if (pfcp_parse_octet(&v->local_f_teid_for_redundant_transmission, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_UE_IP_ADDRESS_TYPE:
+            if (!v->ue_ip_address.presence) {
+                if (pfcp_parse_octet(&v->ue_ip_address, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_LOCAL_INGRESS_TUNNEL_TYPE:
+            if (!v->local_ingress_tunnel.presence) {
+                if (pfcp_parse_octet(&v->local_ingress_tunnel, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_remove_traffic_endpoint(
+        ogs_pfcp_tlv_remove_traffic_endpoint_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Remove Traffic Endpoint] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_TRAFFIC_ENDPOINT_ID_TYPE:
+            if (!v->traffic_endpoint_id.presence) {
+                if (pfcp_parse_octet(&v->traffic_endpoint_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_create_mar(
+        ogs_pfcp_tlv_create_mar_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Create MAR] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_MAR_ID_TYPE:
+            if (!v->mar_id.presence) {
+                if (pfcp_parse_octet(&v->mar_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_STEERING_FUNCTIONALITY_TYPE:
+            if (!v->steering_functionality.presence) {
+                if (pfcp_parse_octet(&v->steering_functionality, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_STEERING_MODE_TYPE:
+            if (!v->steering_mode.presence) {
+                if (pfcp_parse_octet(&v->steering_mode, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP__ACCESS_FORWARDING_ACTION_INFORMATION_TYPE:
+            if (!v->_access_forwarding_action_information.presence) {
+                if (pfcp_parse__access_forwarding_action_information(&v->_access_forwarding_action_information, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->_access_forwarding_action_information.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_NON__ACCESS_FORWARDING_ACTION_INFORMATION_TYPE:
+            if (!v->non__access_forwarding_action_information.presence) {
+                if (pfcp_parse_non__access_forwarding_action_information(&v->non__access_forwarding_action_information, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->non__access_forwarding_action_information.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_THRESHOLDS_TYPE:
+            if (!v->threshold_values.presence) {
+                if (pfcp_parse_octet(&v->threshold_values, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_STEERING_MODE_INDICATOR_TYPE:
+            if (!v->steering_mode_indicator.presence) {
+                if (pfcp_parse_octet(&v->steering_mode_indicator, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_remove_mar(
+        ogs_pfcp_tlv_remove_mar_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Remove MAR] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_MAR_ID_TYPE:
+            if (!v->mar_id.presence) {
+                if (pfcp_parse_octet(&v->mar_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_update_mar(
+        ogs_pfcp_tlv_update_mar_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Update MAR] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_MAR_ID_TYPE:
+            if (!v->mar_id.presence) {
+                if (pfcp_parse_octet(&v->mar_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_STEERING_FUNCTIONALITY_TYPE:
+            if (!v->steering_functionality.presence) {
+                if (pfcp_parse_octet(&v->steering_functionality, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_STEERING_MODE_TYPE:
+            if (!v->steering_mode.presence) {
+                if (pfcp_parse_octet(&v->steering_mode, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_UPDATE__ACCESS_FORWARDING_ACTION_INFORMATION_TYPE:
+            if (!v->update__access_forwarding_action_information.presence) {
+                if (pfcp_parse_update__access_forwarding_action_information(&v->update__access_forwarding_action_information, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->update__access_forwarding_action_information.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_UPDATE_NON__ACCESS_FORWARDING_ACTION_INFORMATION_TYPE:
+            if (!v->update_non__access_forwarding_action_information.presence) {
+                if (pfcp_parse_update_non__access_forwarding_action_information(&v->update_non__access_forwarding_action_information, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->update_non__access_forwarding_action_information.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP__ACCESS_FORWARDING_ACTION_INFORMATION_TYPE:
+            if (!v->_access_forwarding_action_information.presence) {
+                if (pfcp_parse__access_forwarding_action_information(&v->_access_forwarding_action_information, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->_access_forwarding_action_information.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_NON__ACCESS_FORWARDING_ACTION_INFORMATION_TYPE:
+            if (!v->non__access_forwarding_action_information.presence) {
+                if (pfcp_parse_non__access_forwarding_action_information(&v->non__access_forwarding_action_information, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->non__access_forwarding_action_information.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_THRESHOLDS_TYPE:
+            if (!v->threshold_values.presence) {
+                if (pfcp_parse_octet(&v->threshold_values, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_STEERING_MODE_INDICATOR_TYPE:
+            if (!v->steering_mode_indicator.presence) {
+                if (pfcp_parse_octet(&v->steering_mode_indicator, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_created_bridge_info_for_tsc(
+        ogs_pfcp_tlv_created_bridge_info_for_tsc_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Created Bridge Info for TSC] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_DS_TT_PORT_NUMBER_TYPE:
+            if (!v->ds_tt_port_number.presence) {
+                if (pfcp_parse_octet(&v->ds_tt_port_number, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_FiveGS_USER_PLANE_NODE_TYPE:
+            if (!v->fivegs_user_plane_node.presence) {
+                if (pfcp_parse_octet(&v->fivegs_user_plane_node, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_tsc_management_information_ie_within_pfcp_session_modification_request(
+        ogs_pfcp_tlv_tsc_management_information_ie_within_pfcp_session_modification_request_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [TSC Management Information IE within PFCP Session Modification Request] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_PORT_MANAGEMENT_INFORMATION_CONTAINER_TYPE:
+            if (!v->port_management_information_container.presence) {
+                if (pfcp_parse_octet(&v->port_management_information_container, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_BRIDGE_MANAGEMENT_INFORMATION_CONTAINER_TYPE:
+            if (!v->user_plane_node_management_information_container.presence) {
+                if (pfcp_parse_octet(&v->user_plane_node_management_information_container, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_NW_TT_PORT_NUMBER_TYPE:
+            if (!v->nw_tt_port_number.presence) {
+                if (pfcp_parse_octet(&v->nw_tt_port_number, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_remove_srr(
+        ogs_pfcp_tlv_remove_srr_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Remove SRR] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_SRR_ID_TYPE:
+            if (!v->srr_id.presence) {
+                if (pfcp_parse_octet(&v->srr_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_create_srr(
+        ogs_pfcp_tlv_create_srr_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Create SRR] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_SRR_ID_TYPE:
+            if (!v->srr_id.presence) {
+                if (pfcp_parse_octet(&v->srr_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_ACCESS_AVAILABILITY_CONTROL_INFORMATION_TYPE:
+            if (!v->access_availability_control_information.presence) {
+                if (pfcp_parse_octet(&v->access_availability_control_information, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_QOS_MONITORING_PER_QOS_FLOW_CONTROL_INFORMATION_TYPE:
+            if (!v->qos_monitoring_per_qos_flow_control_information.presence) {
+                if (pfcp_parse_octet(&v->qos_monitoring_per_qos_flow_control_information, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_DIRECT_REPORTING_INFORMATION_TYPE:
+            if (!v->direct_reporting_information.presence) {
+                if (pfcp_parse_octet(&v->direct_reporting_information, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_update_srr(
+        ogs_pfcp_tlv_update_srr_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Update SRR] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_SRR_ID_TYPE:
+            if (!v->srr_id.presence) {
+                if (pfcp_parse_octet(&v->srr_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_ACCESS_AVAILABILITY_CONTROL_INFORMATION_TYPE:
+            if (!v->access_availability_control_information.presence) {
+                if (pfcp_parse_octet(&v->access_availability_control_information, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_QOS_MONITORING_PER_QOS_FLOW_CONTROL_INFORMATION_TYPE:
+            if (!v->qos_monitoring_per_qos_flow_control_information.presence) {
+                if (pfcp_parse_octet(&v->qos_monitoring_per_qos_flow_control_information, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_DIRECT_REPORTING_INFORMATION_TYPE:
+            if (!v->direct_reporting_information.presence) {
+                if (pfcp_parse_octet(&v->direct_reporting_information, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_session_report(
+        ogs_pfcp_tlv_session_report_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Session Report] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_SRR_ID_TYPE:
+            if (!v->srr_id.presence) {
+                if (pfcp_parse_octet(&v->srr_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_ACCESS_AVAILABILITY_REPORT_TYPE:
+            if (!v->access_availability_report.presence) {
+                if (pfcp_parse_access_availability_report(&v->access_availability_report, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->access_availability_report.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_QOS_MONITORING_REPORT_TYPE:
+            if (!v->qos_monitoring_report.presence) {
+                if (pfcp_parse_qos_monitoring_report(&v->qos_monitoring_report, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->qos_monitoring_report.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_provide_atsss_control_information(
+        ogs_pfcp_tlv_provide_atsss_control_information_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Provide ATSSS Control Information] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_MPTCP_CONTROL_INFORMATION_TYPE:
+            if (!v->mptcp_control_information.presence) {
+                if (pfcp_parse_octet(&v->mptcp_control_information, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_ATSSS_LL_CONTROL_INFORMATION_TYPE:
+            if (!v->atsss_ll_control_information.presence) {
+                if (pfcp_parse_octet(&v->atsss_ll_control_information, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_PMF_CONTROL_INFORMATION_TYPE:
+            if (!v->pmf_control_information.presence) {
+                if (pfcp_parse_octet(&v->pmf_control_information, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_atsss_control_parameters(
+        ogs_pfcp_tlv_atsss_control_parameters_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [ATSSS Control Parameters] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_MPTCP_PARAMETERS_TYPE:
+            if (!v->mptcp_parameters.presence) {
+                if (pfcp_parse_mptcp_parameters(&v->mptcp_parameters, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->mptcp_parameters.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_ATSSS_LL_PARAMETERS_TYPE:
+            if (!v->atsss_ll_parameters.presence) {
+                if (pfcp_parse_atsss_ll_parameters(&v->atsss_ll_parameters, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->atsss_ll_parameters.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_PMF_PARAMETERS_TYPE:
+            if (!v->pmf_parameters.presence) {
+                if (pfcp_parse_pmf_parameters(&v->pmf_parameters, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->pmf_parameters.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_packet_rate_status_report(
+        ogs_pfcp_tlv_packet_rate_status_report_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Packet Rate Status Report] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_QER_ID_TYPE:
+            if (!v->qer_id.presence) {
+                if (pfcp_parse_uint32(&v->qer_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_PACKET_RATE_STATUS_TYPE:
+            if (!v->packet_rate_status.presence) {
+                if (pfcp_parse_octet(&v->packet_rate_status, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_ethernet_context_information(
+        ogs_pfcp_tlv_ethernet_context_information_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Ethernet Context Information] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_MAC_ADDRESSES_DETECTED_TYPE:
+            if (!v->mac_addresses_detected.presence) {
+                if (pfcp_parse_octet(&v->mac_addresses_detected, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_updated_pdr(
+        ogs_pfcp_tlv_updated_pdr_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Updated PDR] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_PDR_ID_TYPE:
+            if (!v->pdr_id.presence) {
+                if (pfcp_parse_uint16(&v->pdr_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_F_TEID_TYPE:
+            if (!v->local_f_teid_for_redundant_transmission.presence) {
+                if (pfcp_parse_octet(&v->local_f_teid_for_redundant_transmission, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else if (!v->local_f_teid.presence) {
+                if (pfcp_parse_octet(&v->local_f_teid, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_UE_IP_ADDRESS_TYPE:
+            if (!v->ue_ip_address.presence) {
+                if (pfcp_parse_octet(&v->ue_ip_address, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_provide_rds_configuration_information(
+        ogs_pfcp_tlv_provide_rds_configuration_information_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Provide RDS Configuration Information] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_RDS_CONFIGURATION_INFORMATION_TYPE:
+            if (!v->rds_configuration_information.presence) {
+                if (pfcp_parse_octet(&v->rds_configuration_information, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_query_packet_rate_status_ie_within_pfcp_session_modification_request(
+        ogs_pfcp_tlv_query_packet_rate_status_ie_within_pfcp_session_modification_request_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Query Packet Rate Status IE within PFCP Session Modification Request] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_QER_ID_TYPE:
+            if (!v->qer_id.presence) {
+                if (pfcp_parse_uint32(&v->qer_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_partial_failure_information(
+        ogs_pfcp_tlv_partial_failure_information_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Partial Failure Information] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_FAILED_RULE_ID_TYPE:
+            if (!v->failed_rule_id.presence) {
+                if (pfcp_parse_octet(&v->failed_rule_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_CAUSE_TYPE:
+            if (!v->failure_cause.presence) {
+                if (pfcp_parse_uint8(&v->failure_cause, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_OFFENDING_IE_INFORMATION_TYPE:
+            if (!v->offending_ie_information.presence) {
+                if (pfcp_parse_octet(&v->offending_ie_information, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_l2tp_tunnel_information(
+        ogs_pfcp_tlv_l2tp_tunnel_information_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [L2TP Tunnel Information] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_LNS_ADDRESS_TYPE:
+            if (!v->lns_address.presence) {
+                if (pfcp_parse_octet(&v->lns_address, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_TUNNEL_PASSWORD_TYPE:
+            if (!v->tunnel_password.presence) {
+                if (pfcp_parse_octet(&v->tunnel_password, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_TUNNEL_PREFERENCE_TYPE:
+            if (!v->tunnel_preference.presence) {
+                if (pfcp_parse_octet(&v->tunnel_preference, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_l2tp_session_information(
+        ogs_pfcp_tlv_l2tp_session_information_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [L2TP Session Information] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_CALLING_NUMBER_TYPE:
+            if (!v->calling_number.presence) {
+                if (pfcp_parse_octet(&v->calling_number, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_CALLED_NUMBER_TYPE:
+            if (!v->called_number.presence) {
+                if (pfcp_parse_octet(&v->called_number, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_MAXIMUM_RECEIVE_UNIT_TYPE:
+            if (!v->maximum_receive_unit.presence) {
+                if (pfcp_parse_octet(&v->maximum_receive_unit, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_L2TP_SESSION_INDICATIONS_TYPE:
+            if (!v->l2tp_session_indications.presence) {
+                if (pfcp_parse_octet(&v->l2tp_session_indications, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_L2TP_USER_AUTHENTICATION_IE_TYPE:
+            if (!v->l2tp_user_authentication.presence) {
+                if (pfcp_parse_octet(&v->l2tp_user_authentication, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_created_l2tp_session(
+        ogs_pfcp_tlv_created_l2tp_session_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [Created L2TP Session] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_DNS_SERVER_ADDRESS_TYPE:
+            if (!v->dns_server_address.presence) {
+                if (pfcp_parse_octet(&v->dns_server_address, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_NBNS_SERVER_ADDRESS_TYPE:
+            if (!v->nbns_server_address.presence) {
+                if (pfcp_parse_octet(&v->nbns_server_address, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_LNS_ADDRESS_TYPE:
+            if (!v->lns_address.presence) {
+                if (pfcp_parse_octet(&v->lns_address, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_mbs_session_n4mb_control_information(
+        ogs_pfcp_tlv_mbs_session_n4mb_control_information_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [MBS Session N4mb Control Information] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_MBS_SESSION_IDENTIFIER_TYPE:
+            if (!v->mbs_session_identifier.presence) {
+                if (pfcp_parse_octet(&v->mbs_session_identifier, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_AREA_SESSION_ID_TYPE:
+            if (!v->area_session_id.presence) {
+                if (pfcp_parse_octet(&v->area_session_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_MBSN4MBREQ_FLAGS_TYPE:
+            if (!v->mbsn4mbreq_flags.presence) {
+                if (pfcp_parse_octet(&v->mbsn4mbreq_flags, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_MULTICAST_TRANSPORT_INFORMATION_TYPE:
+            if (!v->multicast_transport_information_for_n3mb_and_or_n19mb.presence) {
+                if (pfcp_parse_octet(&v->multicast_transport_information_for_n3mb_and_or_n19mb, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_mbs_session_n4mb_information(
+        ogs_pfcp_tlv_mbs_session_n4mb_information_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [MBS Session N4mb Information] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_MULTICAST_TRANSPORT_INFORMATION_TYPE:
+            if (!v->multicast_transport_information.presence) {
+                if (pfcp_parse_octet(&v->multicast_transport_information, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_mbs_session_n4_control_information(
+        ogs_pfcp_tlv_mbs_session_n4_control_information_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [MBS Session N4 Control Information] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_MBS_SESSION_IDENTIFIER_TYPE:
+            if (!v->mbs_session_identifier.presence) {
+                if (pfcp_parse_octet(&v->mbs_session_identifier, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_AREA_SESSION_ID_TYPE:
+            if (!v->area_session_id.presence) {
+                if (pfcp_parse_octet(&v->area_session_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_MULTICAST_TRANSPORT_INFORMATION_TYPE:
+            if (!v->multicast_transport_information.presence) {
+                if (pfcp_parse_octet(&v->multicast_transport_information, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_mbs_session_n4_information(
+        ogs_pfcp_tlv_mbs_session_n4_information_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [MBS Session N4 Information] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_MBS_SESSION_IDENTIFIER_TYPE:
+            if (!v->mbs_session_identifier.presence) {
+                if (pfcp_parse_octet(&v->mbs_session_identifier, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_AREA_SESSION_ID_TYPE:
+            if (!v->area_session_id.presence) {
+                if (pfcp_parse_octet(&v->area_session_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_F_TEID_TYPE:
+            if (!v->n19mb_dl_tunnel_id.presence) {
+                if (pfcp_parse_octet(&v->n19mb_dl_tunnel_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_MBSN4RESP_FLAGS_TYPE:
+            if (!v->mbsn4resp_flags.presence) {
+                if (pfcp_parse_octet(&v->mbsn4resp_flags, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_dscp_to_ppi_control_information(
+        ogs_pfcp_tlv_dscp_to_ppi_control_information_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [DSCP to PPI Control Information] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_DSCP_TO_PPI_MAPPING_INFORMATION_TYPE:
+            if (!v->dscp_to_ppi_mapping_information.presence) {
+                if (pfcp_parse_octet(&v->dscp_to_ppi_mapping_information, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_QFI_TYPE:
+            if (!v->qfi.presence) {
+                if (pfcp_parse_uint8(&v->qfi, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_heartbeat_request(
+        ogs_pfcp_heartbeat_request_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [PFCP Heartbeat Request] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_RECOVERY_TIME_STAMP_TYPE:
+            if (!v->recovery_time_stamp.presence) {
+                if (pfcp_parse_uint32(&v->recovery_time_stamp, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_SOURCE_IP_ADDRESS_TYPE:
+            if (!v->source_ip_address.presence) {
+                if (pfcp_parse_octet(&v->source_ip_address, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+int ogs_pfcp_parse_heartbeat_request_direct(ogs_pfcp_heartbeat_request_t *v, ogs_pkbuf_t *pkbuf)
+{
+    ogs_assert(v);
+    ogs_assert(pkbuf);
+
+    return pfcp_parse_heartbeat_request(v, pkbuf->data, pkbuf->len);
+}
+
+static int pfcp_parse_heartbeat_response(
+        ogs_pfcp_heartbeat_response_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [PFCP Heartbeat Response] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_RECOVERY_TIME_STAMP_TYPE:
+            if (!v->recovery_time_stamp.presence) {
+                if (pfcp_parse_uint32(&v->recovery_time_stamp, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+int ogs_pfcp_parse_heartbeat_response_direct(ogs_pfcp_heartbeat_response_t *v, ogs_pkbuf_t *pkbuf)
+{
+    ogs_assert(v);
+    ogs_assert(pkbuf);
+
+    return pfcp_parse_heartbeat_response(v, pkbuf->data, pkbuf->len);
+}
+
+static int pfcp_parse_session_establishment_request(
+        ogs_pfcp_session_establishment_request_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+    int i;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [PFCP Session Establishment Request] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_NODE_ID_TYPE:
+            if (!v->node_id.presence) {
+                if (pfcp_parse_octet(&v->node_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_F_SEID_TYPE:
+            if (!v->cp_f_seid.presence) {
+                if (pfcp_parse_octet(&v->cp_f_seid, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_CREATE_PDR_TYPE:
+            for (i = 0; i < 16 && v->create_pdr[i].presence; i++);
+            if (i == 16) {
+                ogs_fatal("Multiple of the same type TLV need more room");
+                break;
+            }
+            if (pfcp_parse_create_pdr(&v->create_pdr[i], value, length) != OGS_OK) {
+                ogs_error("Can't parse compound TLV");
+                return OGS_ERROR;
+            }
+            v->create_pdr[i].presence = 1;
+            break;
+        case OGS_PFCP_CREATE_FAR_TYPE:
+            for (i = 0; i < 16 && v->create_far[i].presence; i++);
+            if (i == 16) {
+                ogs_fatal("Multiple of the same type TLV need more room");
+                break;
+            }
+            if (pfcp_parse_create_far(&v->create_far[i], value, length) != OGS_OK) {
+                ogs_error("Can't parse compound TLV");
+                return OGS_ERROR;
+            }
+            v->create_far[i].presence = 1;
+            break;
+        case OGS_PFCP_CREATE_URR_TYPE:
+            for (i = 0; i < 16 && v->create_urr[i].presence; i++);
+            if (i == 16) {
+                ogs_fatal("Multiple of the same type TLV need more room");
+                break;
+            }
+            if (pfcp_parse_create_urr(&v->create_urr[i], value, length) != OGS_OK) {
+                ogs_error("Can't parse compound TLV");
+                return OGS_ERROR;
+            }
+            v->create_urr[i].presence = 1;
+            break;
+        case OGS_PFCP_CREATE_QER_TYPE:
+            for (i = 0; i < 4 && v->create_qer[i].presence; i++);
+            if (i == 4) {
+                ogs_fatal("Multiple of the same type TLV need more room");
+                break;
+            }
+            if (pfcp_parse_create_qer(&v->create_qer[i], value, length) != OGS_OK) {
+                ogs_error("Can't parse compound TLV");
+                return OGS_ERROR;
+            }
+            v->create_qer[i].presence = 1;
+            break;
+        case OGS_PFCP_CREATE_BAR_TYPE:
+            if (!v->create_bar.presence) {
+                if (pfcp_parse_create_bar(&v->create_bar, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->create_bar.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_CREATE_TRAFFIC_ENDPOINT_TYPE:
+            if (!v->create_traffic_endpoint.presence) {
+                if (pfcp_parse_create_traffic_endpoint(&v->create_traffic_endpoint, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->create_traffic_endpoint.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_PDN_TYPE_TYPE:
+            if (!v->pdn_type.presence) {
+                if (pfcp_parse_uint8(&v->pdn_type, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_FQ_CSID_TYPE:
+            if (!v->sgw_c_fq_csid.presence) {
+                if (pfcp_parse_octet(&v->sgw_c_fq_csid, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else if (!v->mme_fq_csid.presence) {
+                if (pfcp_parse_octet(&v->mme_fq_csid, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else if (!v->pgw_c_smf_fq_csid.presence) {
+                if (pfcp_parse_octet(&v->pgw_c_smf_fq_csid, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else if (!v->epdg_fq_csid.presence) {
+                if (pfcp_parse_octet(&v->epdg_fq_csid, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else if (!v->twan_fq_csid.presence) {
+                if (pfcp_parse_octet(&v->twan_fq_csid, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_USER_PLANE_INACTIVITY_TIMER_TYPE:
+            if (!v->user_plane_inactivity_timer.presence) {
+                if (pfcp_parse_octet(&v->user_plane_inactivity_timer, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_USER_ID_TYPE:
+            if (!v->user_id.presence) {
+                if (pfcp_parse_octet(&v->user_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_TRACE_INFORMATION_TYPE:
+            if (!v->trace_information.presence) {
+                if (pfcp_parse_octet(&v->trace_information, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_APN_DNN_TYPE:
+            if (!v->apn_dnn.presence) {
+                if (pfcp_parse_octet(&v->apn_dnn, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_CREATE_MAR_TYPE:
+            if (!v->create_mar.presence) {
+                if (pfcp_parse_create_mar(&v->create_mar, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->create_mar.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_PFCPSEREQ_FLAGS_TYPE:
+            if (!v->pfcpsereq_flags.presence) {
+                if (pfcp_parse_uint8(&v->pfcpsereq_flags, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_CREATE_BRIDGE_INFO_FOR_TSC_TYPE:
+            if (!v->create_bridge_info_for_tsc.presence) {
+                if (pfcp_parse_octet(&v->create_bridge_info_for_tsc, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_CREATE_SRR_TYPE:
+            if (!v->create_srr.presence) {
+                if (pfcp_parse_create_srr(&v->create_srr, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->create_srr.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_PROVIDE_ATSSS_CONTROL_INFORMATION_TYPE:
+            if (!v->provide_atsss_control_information.presence) {
+                if (pfcp_parse_provide_atsss_control_information(&v->provide_atsss_control_information, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->provide_atsss_control_information.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_RECOVERY_TIME_STAMP_TYPE:
+            if (!v->recovery_time_stamp.presence) {
+                if (pfcp_parse_uint32(&v->recovery_time_stamp, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_S_NSSAI_TYPE:
+            if (!v->s_nssai.presence) {
+                if (pfcp_parse_octet(&v->s_nssai, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_PROVIDE_RDS_CONFIGURATION_INFORMATION_TYPE:
+            if (!v->provide_rds_configuration_information.presence) {
+                if (pfcp_parse_provide_rds_configuration_information(&v->provide_rds_configuration_information, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->provide_rds_configuration_information.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_RAT_TYPE_TYPE:
+            if (!v->rat_type.presence) {
+                if (pfcp_parse_octet(&v->rat_type, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_L2TP_TUNNEL_INFORMATION_TYPE:
+            if (!v->l2tp_tunnel_information.presence) {
+                if (pfcp_parse_l2tp_tunnel_information(&v->l2tp_tunnel_information, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->l2tp_tunnel_information.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_L2TP_SESSION_INFORMATION_TYPE:
+            if (!v->l2tp_session_information.presence) {
+                if (pfcp_parse_l2tp_session_information(&v->l2tp_session_information, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->l2tp_session_information.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_GROUP_ID_TYPE:
+            if (!v->group_id.presence) {
+                if (pfcp_parse_octet(&v->group_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_MBS_SESSION_N4MB_CONTROL_INFORMATION_TYPE:
+            if (!v->mbs_session_n4mb_control_information.presence) {
+                if (pfcp_parse_mbs_session_n4mb_control_information(&v->mbs_session_n4mb_control_information, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->mbs_session_n4mb_control_information.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_MBS_SESSION_N4_CONTROL_INFORMATION_TYPE:
+            if (!v->mbs_session_n4_control_information.presence) {
+                if (pfcp_parse_mbs_session_n4_control_information(&v->mbs_session_n4_control_information, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->mbs_session_n4_control_information.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_DSCP_TO_PPI_CONTROL_INFORMATION_TYPE:
+            if (!v->dscp_to_ppi_control_information.presence) {
+                if (pfcp_parse_dscp_to_ppi_control_information(&v->dscp_to_ppi_control_information, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->dscp_to_ppi_control_information.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case 0:
+            /* ogs_tlv_parse_msg() takes it for an ogs_tlv_desc_more */
+            ogs_error("Unknown type[%d]", OGS_TLV_MORE);
+            return OGS_ERROR;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+int ogs_pfcp_parse_session_establishment_request_direct(ogs_pfcp_session_establishment_request_t *v, ogs_pkbuf_t *pkbuf)
+{
+    ogs_assert(v);
+    ogs_assert(pkbuf);
+
+    return pfcp_parse_session_establishment_request(v, pkbuf->data, pkbuf->len);
+}
+
+static int pfcp_parse_session_establishment_response(
+        ogs_pfcp_session_establishment_response_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+    int i;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [PFCP Session Establishment Response] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_NODE_ID_TYPE:
+            if (!v->node_id.presence) {
+                if (pfcp_parse_octet(&v->node_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_CAUSE_TYPE:
+            if (!v->cause.presence) {
+                if (pfcp_parse_uint8(&v->cause, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_OFFENDING_IE_TYPE:
+            if (!v->offending_ie.presence) {
+                if (pfcp_parse_uint16(&v->offending_ie, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_F_SEID_TYPE:
+            if (!v->up_f_seid.presence) {
+                if (pfcp_parse_octet(&v->up_f_seid, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_CREATED_PDR_TYPE:
+            for (i = 0; i < 16 && v->created_pdr[i].presence; i++);
+            if (i == 16) {
+                ogs_fatal("Multiple of the same type TLV need more room");
+                break;
+            }
+            if (pfcp_parse_created_pdr(&v->created_pdr[i], value, length) != OGS_OK) {
+                ogs_error("Can't parse compound TLV");
+                return OGS_ERROR;
+            }
+            v->created_pdr[i].presence = 1;
+            break;
+        case OGS_PFCP_LOAD_CONTROL_INFORMATION_TYPE:
+            if (!v->load_control_information.presence) {
+                if (pfcp_parse_load_control_information(&v->load_control_information, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->load_control_information.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_OVERLOAD_CONTROL_INFORMATION_TYPE:
+            if (!v->overload_control_information.presence) {
+                if (pfcp_parse_overload_control_information(&v->overload_control_information, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->overload_control_information.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_FQ_CSID_TYPE:
+            if (!v->pgw_u_sgw_u__upf_fq_csid.presence) {
+                if (pfcp_parse_octet(&v->pgw_u_sgw_u__upf_fq_csid, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_FAILED_RULE_ID_TYPE:
+            if (!v->failed_rule_id.presence) {
+                if (pfcp_parse_octet(&v->failed_rule_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_CREATED_TRAFFIC_ENDPOINT_TYPE:
+            if (!v->created_traffic_endpoint.presence) {
+                if (pfcp_parse_created_traffic_endpoint(&v->created_traffic_endpoint, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->created_traffic_endpoint.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_CREATED_BRIDGE_INFO_FOR_TSC_TYPE:
+            if (!v->created_bridge_info_for_tsc.presence) {
+                if (pfcp_parse_created_bridge_info_for_tsc(&v->created_bridge_info_for_tsc, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->created_bridge_info_for_tsc.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_ATSSS_CONTROL_PARAMETERS_TYPE:
+            if (!v->atsss_control_parameters.presence) {
+                if (pfcp_parse_atsss_control_parameters(&v->atsss_control_parameters, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->atsss_control_parameters.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_RDS_CONFIGURATION_INFORMATION_TYPE:
+            if (!v->rds_configuration_information.presence) {
+                if (pfcp_parse_octet(&v->rds_configuration_information, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_PARTIAL_FAILURE_INFORMATION_TYPE:
+            if (!v->partial_failure_information.presence) {
+                if (pfcp_parse_partial_failure_information(&v->partial_failure_information, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->partial_failure_information.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_CREATED_L2TP_SESSION_TYPE:
+            if (!v->created_l2tp_session.presence) {
+                if (pfcp_parse_created_l2tp_session(&v->created_l2tp_session, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->created_l2tp_session.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_MBS_SESSION_N4MB_INFORMATION_TYPE:
+            if (!v->mbs_session_n4mb_information.presence) {
+                if (pfcp_parse_mbs_session_n4mb_information(&v->mbs_session_n4mb_information, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->mbs_session_n4mb_information.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_MBS_SESSION_N4_INFORMATION_TYPE:
+            if (!v->mbs_session_n4_information.presence) {
+                if (pfcp_parse_mbs_session_n4_information(&v->mbs_session_n4_information, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->mbs_session_n4_information.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case 0:
+            /* ogs_tlv_parse_msg() takes it for an ogs_tlv_desc_more */
+            ogs_error("Unknown type[%d]", OGS_TLV_MORE);
+            return OGS_ERROR;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+int ogs_pfcp_parse_session_establishment_response_direct(ogs_pfcp_session_establishment_response_t *v, ogs_pkbuf_t *pkbuf)
+{
+    ogs_assert(v);
+    ogs_assert(pkbuf);
+
+    return pfcp_parse_session_establishment_response(v, pkbuf->data, pkbuf->len);
+}
+
+static int pfcp_parse_session_modification_request(
+        ogs_pfcp_session_modification_request_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+    int i;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [PFCP Session Modification Request] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_F_SEID_TYPE:
+            if (!v->cp_f_seid.presence) {
+                if (pfcp_parse_octet(&v->cp_f_seid, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_REMOVE_PDR_TYPE:
+            for (i = 0; i < 16 && v->remove_pdr[i].presence; i++);
+            if (i == 16) {
+                ogs_fatal("Multiple of the same type TLV need more room");
+                break;
+            }
+            if (pfcp_parse_remove_pdr(&v->remove_pdr[i], value, length) != OGS_OK) {
+                ogs_error("Can't parse compound TLV");
+                return OGS_ERROR;
+            }
+            v->remove_pdr[i].presence = 1;
+            break;
+        case OGS_PFCP_REMOVE_FAR_TYPE:
+            for (i = 0; i < 16 && v->remove_far[i].presence; i++);
+            if (i == 16) {
+                ogs_fatal("Multiple of the same type TLV need more room");
+                break;
+            }
+            if (pfcp_parse_remove_far(&v->remove_far[i], value, length) != OGS_OK) {
+                ogs_error("Can't parse compound TLV");
+                return OGS_ERROR;
+            }
+            v->remove_far[i].presence = 1;
+            break;
+        case OGS_PFCP_REMOVE_URR_TYPE:
+            for (i = 0; i < 16 && v->remove_urr[i].presence; i++);
+            if (i == 16) {
+                ogs_fatal("Multiple of the same type TLV need more room");
+                break;
+            }
+            if (pfcp_parse_remove_urr(&v->remove_urr[i], value, length) != OGS_OK) {
+                ogs_error("Can't parse compound TLV");
+                return OGS_ERROR;
+            }
+            v->remove_urr[i].presence = 1;
+            break;
+        case OGS_PFCP_REMOVE_QER_TYPE:
+            for (i = 0; i < 4 && v->remove_qer[i].presence; i++);
+            if (i == 4) {
+                ogs_fatal("Multiple of the same type TLV need more room");
+                break;
+            }
+            if (pfcp_parse_remove_qer(&v->remove_qer[i], value, length) != OGS_OK) {
+                ogs_error("Can't parse compound TLV");
+                return OGS_ERROR;
+            }
+            v->remove_qer[i].presence = 1;
+            break;
+        case OGS_PFCP_REMOVE_BAR_TYPE:
+            if (!v->remove_bar.presence) {
+                if (pfcp_parse_remove_bar(&v->remove_bar, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->remove_bar.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_REMOVE_TRAFFIC_ENDPOINT_TYPE:
+            if (!v->remove_traffic_endpoint.presence) {
+                if (pfcp_parse_remove_traffic_endpoint(&v->remove_traffic_endpoint, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->remove_traffic_endpoint.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_CREATE_PDR_TYPE:
+            for (i = 0; i < 16 && v->create_pdr[i].presence; i++);
+            if (i == 16) {
+                ogs_fatal("Multiple of the same type TLV need more room");
+                break;
+            }
+            if (pfcp_parse_create_pdr(&v->create_pdr[i], value, length) != OGS_OK) {
+                ogs_error("Can't parse compound TLV");
+                return OGS_ERROR;
+            }
+            v->create_pdr[i].presence = 1;
+            break;
+        case OGS_PFCP_CREATE_FAR_TYPE:
+            for (i = 0; i < 16 && v->create_far[i].presence; i++);
+            if (i == 16) {
+                ogs_fatal("Multiple of the same type TLV need more room");
+                break;
+            }
+            if (pfcp_parse_create_far(&v->create_far[i], value, length) != OGS_OK) {
+                ogs_error("Can't parse compound TLV");
+                return OGS_ERROR;
+            }
+            v->create_far[i].presence = 1;
+            break;
+        case OGS_PFCP_CREATE_URR_TYPE:
+            for (i = 0; i < 16 && v->create_urr[i].presence; i++);
+            if (i == 16) {
+                ogs_fatal("Multiple of the same type TLV need more room");
+                break;
+            }
+            if (pfcp_parse_create_urr(&v->create_urr[i], value, length) != OGS_OK) {
+                ogs_error("Can't parse compound TLV");
+                return OGS_ERROR;
+            }
+            v->create_urr[i].presence = 1;
+            break;
+        case OGS_PFCP_CREATE_QER_TYPE:
+            for (i = 0; i < 4 && v->create_qer[i].presence; i++);
+            if (i == 4) {
+                ogs_fatal("Multiple of the same type TLV need more room");
+                break;
+            }
+            if (pfcp_parse_create_qer(&v->create_qer[i], value, length) != OGS_OK) {
+                ogs_error("Can't parse compound TLV");
+                return OGS_ERROR;
+            }
+            v->create_qer[i].presence = 1;
+            break;
+        case OGS_PFCP_CREATE_BAR_TYPE:
+            if (!v->create_bar.presence) {
+                if (pfcp_parse_create_bar(&v->create_bar, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->create_bar.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_CREATE_TRAFFIC_ENDPOINT_TYPE:
+            if (!v->create_traffic_endpoint.presence) {
+                if (pfcp_parse_create_traffic_endpoint(&v->create_traffic_endpoint, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->create_traffic_endpoint.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_UPDATE_PDR_TYPE:
+            for (i = 0; i < 16 && v->update_pdr[i].presence; i++);
+            if (i == 16) {
+                ogs_fatal("Multiple of the same type TLV need more room");
+                break;
+            }
+            if (pfcp_parse_update_pdr(&v->update_pdr[i], value, length) != OGS_OK) {
+                ogs_error("Can't parse compound TLV");
+                return OGS_ERROR;
+            }
+            v->update_pdr[i].presence = 1;
+            break;
+        case OGS_PFCP_UPDATE_FAR_TYPE:
+            for (i = 0; i < 16 && v->update_far[i].presence; i++);
+            if (i == 16) {
+                ogs_fatal("Multiple of the same type TLV need more room");
+                break;
+            }
+            if (pfcp_parse_update_far(&v->update_far[i], value, length) != OGS_OK) {
+                ogs_error("Can't parse compound TLV");
+                return OGS_ERROR;
+            }
+            v->update_far[i].presence = 1;
+            break;
+        case OGS_PFCP_UPDATE_URR_TYPE:
+            for (i = 0; i < 16 && v->update_urr[i].presence; i++);
+            if (i == 16) {
+                ogs_fatal("Multiple of the same type TLV need more room");
+                break;
+            }
+            if (pfcp_parse_update_urr(&v->update_urr[i], value, length) != OGS_OK) {
+                ogs_error("Can't parse compound TLV");
+                return OGS_ERROR;
+            }
+            v->update_urr[i].presence = 1;
+            break;
+        case OGS_PFCP_UPDATE_QER_TYPE:
+            for (i = 0; i < 4 && v->update_qer[i].presence; i++);
+            if (i == 4) {
+                ogs_fatal("Multiple of the same type TLV need more room");
+                break;
+            }
+            if (pfcp_parse_update_qer(&v->update_qer[i], value, length) != OGS_OK) {
+                ogs_error("Can't parse compound TLV");
+                return OGS_ERROR;
+            }
+            v->update_qer[i].presence = 1;
+            break;
+        case OGS_PFCP_UPDATE_BAR_SESSION_MODIFICATION_REQUEST_TYPE:
+            if (!v->update_bar.presence) {
+                if (pfcp_parse_update_bar_session_modification_request(&v->update_bar, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->update_bar.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_UPDATE_TRAFFIC_ENDPOINT_TYPE:
+            if (!v->update_traffic_endpoint.presence) {
+                if (pfcp_parse_octet(&v->update_traffic_endpoint, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_PFCPSMREQ_FLAGS_TYPE:
+            if (!v->pfcpsmreq_flags.presence) {
+                if (pfcp_parse_uint8(&v->pfcpsmreq_flags, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_QUERY_URR_TYPE:
+            if (!v->query_urr.presence) {
+                if (pfcp_parse_query_urr(&v->query_urr, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->query_urr.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_FQ_CSID_TYPE:
+            if (!v->pgw_c_smf_fq_csid.presence) {
+                if (pfcp_parse_octet(&v->pgw_c_smf_fq_csid, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else if (!v->sgw_c_fq_csid.presence) {
+                if (pfcp_parse_octet(&v->sgw_c_fq_csid, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else if (!v->mme_fq_csid.presence) {
+                if (pfcp_parse_octet(&v->mme_fq_csid, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else if (!v->epdg_fq_csid.presence) {
+                if (pfcp_parse_octet(&v->epdg_fq_csid, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else if (!v->twan_fq_csid.presence) {
+                if (pfcp_parse_octet(&v->twan_fq_csid, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_USER_PLANE_INACTIVITY_TIMER_TYPE:
+            if (!v->user_plane_inactivity_timer.presence) {
+                if (pfcp_parse_octet(&v->user_plane_inactivity_timer, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_QUERY_URR_REFERENCE_TYPE:
+            if (!v->query_urr_reference.presence) {
+                if (pfcp_parse_octet(&v->query_urr_reference, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_TRACE_INFORMATION_TYPE:
+            if (!v->trace_information.presence) {
+                if (pfcp_parse_octet(&v->trace_information, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_REMOVE_MAR_TYPE:
+            if (!v->remove_mar.presence) {
+                if (pfcp_parse_remove_mar(&v->remove_mar, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->remove_mar.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_UPDATE_MAR_TYPE:
+            if (!v->update_mar.presence) {
+                if (pfcp_parse_update_mar(&v->update_mar, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->update_mar.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_CREATE_MAR_TYPE:
+            if (!v->create_mar.presence) {
+                if (pfcp_parse_create_mar(&v->create_mar, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->create_mar.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_NODE_ID_TYPE:
+            if (!v->node_id.presence) {
+                if (pfcp_parse_octet(&v->node_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_TSC_MANAGEMENT_INFORMATION_IE_WITHIN_PFCP_SESSION_MODIFICATION_REQUEST_TYPE:
+            if (!v->tsc_management_information.presence) {
+                if (pfcp_parse_tsc_management_information_ie_within_pfcp_session_modification_request(&v->tsc_management_information, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->tsc_management_information.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_REMOVE_SRR_TYPE:
+            if (!v->remove_srr.presence) {
+                if (pfcp_parse_remove_srr(&v->remove_srr, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->remove_srr.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_CREATE_SRR_TYPE:
+            if (!v->create_srr.presence) {
+                if (pfcp_parse_create_srr(&v->create_srr, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->create_srr.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_UPDATE_SRR_TYPE:
+            if (!v->update_srr.presence) {
+                if (pfcp_parse_update_srr(&v->update_srr, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->update_srr.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_PROVIDE_ATSSS_CONTROL_INFORMATION_TYPE:
+            if (!v->provide_atsss_control_information.presence) {
+                if (pfcp_parse_provide_atsss_control_information(&v->provide_atsss_control_information, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->provide_atsss_control_information.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_ETHERNET_CONTEXT_INFORMATION_TYPE:
+            if (!v->ethernet_context_information.presence) {
+                if (pfcp_parse_ethernet_context_information(&v->ethernet_context_information, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->ethernet_context_information.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_ACCESS_AVAILABILITY_INFORMATION_TYPE:
+            if (!v->access_availability_information.presence) {
+                if (pfcp_parse_octet(&v->access_availability_information, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_QUERY_PACKET_RATE_STATUS_IE_WITHIN_PFCP_SESSION_MODIFICATION_REQUEST_TYPE:
+            if (!v->query_packet_rate_status.presence) {
+                if (pfcp_parse_query_packet_rate_status_ie_within_pfcp_session_modification_request(&v->query_packet_rate_status, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->query_packet_rate_status.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_S_NSSAI_TYPE:
+            if (!v->s_nssai.presence) {
+                if (pfcp_parse_octet(&v->s_nssai, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_RAT_TYPE_TYPE:
+            if (!v->rat_type.presence) {
+                if (pfcp_parse_octet(&v->rat_type, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_GROUP_ID_TYPE:
+            if (!v->group_id.presence) {
+                if (pfcp_parse_octet(&v->group_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_MBS_SESSION_N4_CONTROL_INFORMATION_TYPE:
+            if (!v->mbs_session_n4_control_information.presence) {
+                if (pfcp_parse_mbs_session_n4_control_information(&v->mbs_session_n4_control_information, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->mbs_session_n4_control_information.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_DSCP_TO_PPI_CONTROL_INFORMATION_TYPE:
+            if (!v->dscp_to_ppi_control_information.presence) {
+                if (pfcp_parse_dscp_to_ppi_control_information(&v->dscp_to_ppi_control_information, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->dscp_to_ppi_control_information.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case 0:
+            /* ogs_tlv_parse_msg() takes it for an ogs_tlv_desc_more */
+            ogs_error("Unknown type[%d]", OGS_TLV_MORE);
+            return OGS_ERROR;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+int ogs_pfcp_parse_session_modification_request_direct(ogs_pfcp_session_modification_request_t *v, ogs_pkbuf_t *pkbuf)
+{
+    ogs_assert(v);
+    ogs_assert(pkbuf);
+
+    return pfcp_parse_session_modification_request(v, pkbuf->data, pkbuf->len);
+}
+
+static int pfcp_parse_session_modification_response(
+        ogs_pfcp_session_modification_response_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+    int i;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [PFCP Session Modification Response] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_CAUSE_TYPE:
+            if (!v->cause.presence) {
+                if (pfcp_parse_uint8(&v->cause, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_OFFENDING_IE_TYPE:
+            if (!v->offending_ie.presence) {
+                if (pfcp_parse_uint16(&v->offending_ie, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_CREATED_PDR_TYPE:
+            for (i = 0; i < 16 && v->created_pdr[i].presence; i++);
+            if (i == 16) {
+                ogs_fatal("Multiple of the same type TLV need more room");
+                break;
+            }
+            if (pfcp_parse_created_pdr(&v->created_pdr[i], value, length) != OGS_OK) {
+                ogs_error("Can't parse compound TLV");
+                return OGS_ERROR;
+            }
+            v->created_pdr[i].presence = 1;
+            break;
+        case OGS_PFCP_LOAD_CONTROL_INFORMATION_TYPE:
+            if (!v->load_control_information.presence) {
+                if (pfcp_parse_load_control_information(&v->load_control_information, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->load_control_information.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_OVERLOAD_CONTROL_INFORMATION_TYPE:
+            if (!v->overload_control_information.presence) {
+                if (pfcp_parse_overload_control_information(&v->overload_control_information, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->overload_control_information.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_USAGE_REPORT_SESSION_MODIFICATION_RESPONSE_TYPE:
+            for (i = 0; i < 8 && v->usage_report[i].presence; i++);
+            if (i == 8) {
+                ogs_fatal("Multiple of the same type TLV need more room");
+                break;
+            }
+            if (pfcp_parse_usage_report_session_modification_response(&v->usage_report[i], value, length) != OGS_OK) {
+                ogs_error("Can't parse compound TLV");
+                return OGS_ERROR;
+            }
+            v->usage_report[i].presence = 1;
+            break;
+        case OGS_PFCP_FAILED_RULE_ID_TYPE:
+            if (!v->failed_rule_id.presence) {
+                if (pfcp_parse_octet(&v->failed_rule_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_ADDITIONAL_USAGE_REPORTS_INFORMATION_TYPE:
+            if (!v->additional_usage_reports_information.presence) {
+                if (pfcp_parse_octet(&v->additional_usage_reports_information, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_CREATED_TRAFFIC_ENDPOINT_TYPE:
+            if (!v->created_updated_traffic_endpoint.presence) {
+                if (pfcp_parse_created_traffic_endpoint(&v->created_updated_traffic_endpoint, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->created_updated_traffic_endpoint.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_TSC_MANAGEMENT_INFORMATION_IE_WITHIN_PFCP_SESSION_MODIFICATION_REQUEST_TYPE:
+            if (!v->tsc_management_information.presence) {
+                if (pfcp_parse_tsc_management_information_ie_within_pfcp_session_modification_request(&v->tsc_management_information, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->tsc_management_information.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_ATSSS_CONTROL_PARAMETERS_TYPE:
+            if (!v->atsss_control_parameters.presence) {
+                if (pfcp_parse_atsss_control_parameters(&v->atsss_control_parameters, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->atsss_control_parameters.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_UPDATED_PDR_TYPE:
+            if (!v->updated_pdr.presence) {
+                if (pfcp_parse_updated_pdr(&v->updated_pdr, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->updated_pdr.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_PACKET_RATE_STATUS_REPORT_TYPE:
+            if (!v->packet_rate_status_report.presence) {
+                if (pfcp_parse_packet_rate_status_report(&v->packet_rate_status_report, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->packet_rate_status_report.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_PARTIAL_FAILURE_INFORMATION_TYPE:
+            if (!v->partial_failure_information.presence) {
+                if (pfcp_parse_partial_failure_information(&v->partial_failure_information, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->partial_failure_information.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_MBS_SESSION_N4_INFORMATION_TYPE:
+            if (!v->mbs_session_n4_information.presence) {
+                if (pfcp_parse_mbs_session_n4_information(&v->mbs_session_n4_information, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->mbs_session_n4_information.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case 0:
+            /* ogs_tlv_parse_msg() takes it for an ogs_tlv_desc_more */
+            ogs_error("Unknown type[%d]", OGS_TLV_MORE);
+            return OGS_ERROR;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+int ogs_pfcp_parse_session_modification_response_direct(ogs_pfcp_session_modification_response_t *v, ogs_pkbuf_t *pkbuf)
+{
+    ogs_assert(v);
+    ogs_assert(pkbuf);
+
+    return pfcp_parse_session_modification_response(v, pkbuf->data, pkbuf->len);
+}
+
+static int pfcp_parse_session_report_request(
+        ogs_pfcp_session_report_request_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+    int i;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [PFCP Session Report Request] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_REPORT_TYPE_TYPE:
+            if (!v->report_type.presence) {
+                if (pfcp_parse_uint8(&v->report_type, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_DOWNLINK_DATA_REPORT_TYPE:
+            if (!v->downlink_data_report.presence) {
+                if (pfcp_parse_downlink_data_report(&v->downlink_data_report, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->downlink_data_report.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_USAGE_REPORT_SESSION_REPORT_REQUEST_TYPE:
+            for (i = 0; i < 8 && v->usage_report[i].presence; i++);
+            if (i == 8) {
+                ogs_fatal("Multiple of the same type TLV need more room");
+                break;
+            }
+            if (pfcp_parse_usage_report_session_report_request(&v->usage_report[i], value, length) != OGS_OK) {
+                ogs_error("Can't parse compound TLV");
+                return OGS_ERROR;
+            }
+            v->usage_report[i].presence = 1;
+            break;
+        case OGS_PFCP_ERROR_INDICATION_REPORT_TYPE:
+            if (!v->error_indication_report.presence) {
+                if (pfcp_parse_error_indication_report(&v->error_indication_report, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->error_indication_report.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_LOAD_CONTROL_INFORMATION_TYPE:
+            if (!v->load_control_information.presence) {
+                if (pfcp_parse_load_control_information(&v->load_control_information, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->load_control_information.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_OVERLOAD_CONTROL_INFORMATION_TYPE:
+            if (!v->overload_control_information.presence) {
+                if (pfcp_parse_overload_control_information(&v->overload_control_information, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->overload_control_information.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_ADDITIONAL_USAGE_REPORTS_INFORMATION_TYPE:
+            if (!v->additional_usage_reports_information.presence) {
+                if (pfcp_parse_octet(&v->additional_usage_reports_information, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_PFCPSRREQ_FLAGS_TYPE:
+            if (!v->pfcpsrreq_flags.presence) {
+                if (pfcp_parse_uint8(&v->pfcpsrreq_flags, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_F_SEID_TYPE:
+            if (!v->old_cp_f_seid.presence) {
+                if (pfcp_parse_octet(&v->old_cp_f_seid, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_PACKET_RATE_STATUS_REPORT_TYPE:
+            if (!v->packet_rate_status_report.presence) {
+                if (pfcp_parse_packet_rate_status_report(&v->packet_rate_status_report, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->packet_rate_status_report.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_TSC_MANAGEMENT_INFORMATION_IE_WITHIN_PFCP_SESSION_MODIFICATION_REQUEST_TYPE:
+            if (!v->tsc_management_information.presence) {
+                if (pfcp_parse_tsc_management_information_ie_within_pfcp_session_modification_request(&v->tsc_management_information, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->tsc_management_information.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_SESSION_REPORT_TYPE:
+            if (!v->session_report.presence) {
+                if (pfcp_parse_session_report(&v->session_report, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->session_report.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_CAUSE_TYPE:
+            if (!v->cause.presence) {
+                if (pfcp_parse_uint8(&v->cause, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case 0:
+            /* ogs_tlv_parse_msg() takes it for an ogs_tlv_desc_more */
+            ogs_error("Unknown type[%d]", OGS_TLV_MORE);
+            return OGS_ERROR;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+int ogs_pfcp_parse_session_report_request_direct(ogs_pfcp_session_report_request_t *v, ogs_pkbuf_t *pkbuf)
+{
+    ogs_assert(v);
+    ogs_assert(pkbuf);
+
+    return pfcp_parse_session_report_request(v, pkbuf->data, pkbuf->len);
+}
+
+static int pfcp_parse_session_report_response(
+        ogs_pfcp_session_report_response_t *v, uint8_t *pos, uint32_t size)
+{
+    uint8_t *end = pos + size, *value = NULL;
+    uint16_t type, length;
+
+    do {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't parse TLV in [PFCP Session Report Response] [LEN:%d]", size);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        switch (type) {
+        case OGS_PFCP_CAUSE_TYPE:
+            if (!v->cause.presence) {
+                if (pfcp_parse_uint8(&v->cause, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_OFFENDING_IE_TYPE:
+            if (!v->offending_ie.presence) {
+                if (pfcp_parse_uint16(&v->offending_ie, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_UPDATE_BAR_PFCP_SESSION_REPORT_RESPONSE_TYPE:
+            if (!v->update_bar.presence) {
+                if (pfcp_parse_update_bar_pfcp_session_report_response(&v->update_bar, value, length) != OGS_OK) {
+                    ogs_error("Can't parse compound TLV");
+                    return OGS_ERROR;
+                }
+                v->update_bar.presence = 1;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_PFCPSRRSP_FLAGS_TYPE:
+            if (!v->pfcpsrrsp_flags.presence) {
+                if (pfcp_parse_uint8(&v->pfcpsrrsp_flags, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_F_SEID_TYPE:
+            if (!v->cp_f_seid.presence) {
+                if (pfcp_parse_octet(&v->cp_f_seid, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_F_TEID_TYPE:
+            if (!v->n4_u_f_teid.presence) {
+                if (pfcp_parse_octet(&v->n4_u_f_teid, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_ALTERNATIVE_SMF_IP_ADDRESS_TYPE:
+            if (!v->alternative_smf_ip_address.presence) {
+                if (pfcp_parse_octet(&v->alternative_smf_ip_address, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_FQ_CSID_TYPE:
+            if (!v->pgw_c_smf_fq_csid.presence) {
+                if (pfcp_parse_octet(&v->pgw_c_smf_fq_csid, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_GROUP_ID_TYPE:
+            if (!v->group_id.presence) {
+                if (pfcp_parse_octet(&v->group_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        case OGS_PFCP_NODE_ID_TYPE:
+            if (!v->node_id.presence) {
+                if (pfcp_parse_octet(&v->node_id, value, length) != OGS_OK)
+                    return OGS_ERROR;
+            } else {
+                ogs_warn("Unknown TLV type [%d]", type);
+            }
+            break;
+        default:
+            ogs_warn("Unknown TLV type [%d]", type);
+            break;
+        }
+    } while (pos < end);
+
+    return OGS_OK;
+}
+
+int ogs_pfcp_parse_session_report_response_direct(ogs_pfcp_session_report_response_t *v, ogs_pkbuf_t *pkbuf)
+{
+    ogs_assert(v);
+    ogs_assert(pkbuf);
+
+    return pfcp_parse_session_report_response(v, pkbuf->data, pkbuf->len);
+}
+
+static int pfcp_peek_header(ogs_pkbuf_t *pkbuf)
+{
+    ogs_pfcp_header_t *h = (ogs_pfcp_header_t *)pkbuf->data;
+    uint16_t size = 0;
+
+    if (pkbuf->len < OGS_PFCP_HEADER_LEN-OGS_PFCP_SEID_LEN) {
+        ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+        return OGS_ERROR;
+    }
+
+    if (h->seid_presence)
+        size = OGS_PFCP_HEADER_LEN;
+    else
+        size = OGS_PFCP_HEADER_LEN-OGS_PFCP_SEID_LEN;
+
+    if (pkbuf->len < size) {
+        ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+        return OGS_ERROR;
+    }
+
+    return size;
+}
+
+int ogs_pfcp_peek(ogs_pkbuf_t *pkbuf, uint8_t *type, uint64_t *seid)
+{
+    ogs_pfcp_header_t *h = NULL;
+
+    ogs_assert(pkbuf);
+
+    if (pfcp_peek_header(pkbuf) < 0)
+        return OGS_ERROR;
+
+    h = (ogs_pfcp_header_t *)pkbuf->data;
+    if (type)
+        *type = h->type;
+    if (seid)
+        *seid = h->seid_presence ? be64toh(h->seid) : 0;
+
+    return OGS_OK;
+}
+
+int ogs_pfcp_peek_ies(ogs_pkbuf_t *pkbuf, ogs_pfcp_peek_t *ies, int num)
+{
+    uint8_t *pos = NULL, *end = NULL, *value = NULL;
+    uint16_t type, length;
+    int size, found = 0, i;
+
+    ogs_assert(pkbuf);
+    ogs_assert(ies);
+
+    for (i = 0; i < num; i++)
+        ies[i].offset = -1;
+
+    size = pfcp_peek_header(pkbuf);
+    if (size < 0)
+        return OGS_ERROR;
+
+    pos = pkbuf->data + size;
+    end = pkbuf->data + pkbuf->len;
+    while (pos < end && found < num) {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't peek TLV [LEN:%d]", pkbuf->len);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        for (i = 0; i < num; i++) {
+            if (ies[i].type == type && ies[i].offset < 0) {
+                ies[i].offset = value - pkbuf->data;
+                ies[i].length = length;
+                found++;
+                break;
+            }
+        }
+    }
+
+    return found;
+}
+
+int ogs_pfcp_peek_create_pdr(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_CREATE_PDR_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_create_far(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_CREATE_FAR_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_create_urr(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_CREATE_URR_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_create_qer(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_CREATE_QER_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_created_pdr(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_CREATED_PDR_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_update_pdr(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_UPDATE_PDR_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_update_far(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_UPDATE_FAR_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_update_bar_pfcp_session_report_response(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_UPDATE_BAR_PFCP_SESSION_REPORT_RESPONSE_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_update_urr(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_UPDATE_URR_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_update_qer(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_UPDATE_QER_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_remove_pdr(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_REMOVE_PDR_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_remove_far(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_REMOVE_FAR_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_remove_urr(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_REMOVE_URR_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_remove_qer(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_REMOVE_QER_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_cause(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_CAUSE_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_f_teid(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_F_TEID_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_report_type(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_REPORT_TYPE_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_offending_ie(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_OFFENDING_IE_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_up_function_features(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_UP_FUNCTION_FEATURES_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_pfcpsmreq_flags(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_PFCPSMREQ_FLAGS_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_pfcpsrrsp_flags(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_PFCPSRRSP_FLAGS_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_load_control_information(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_LOAD_CONTROL_INFORMATION_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_overload_control_information(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_OVERLOAD_CONTROL_INFORMATION_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_f_seid(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_F_SEID_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_application_id_s_pfds(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_APPLICATION_ID_S_PFDS_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_node_id(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_NODE_ID_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_fq_csid(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_FQ_CSID_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_query_urr(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_QUERY_URR_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_usage_report_session_modification_response(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_USAGE_REPORT_SESSION_MODIFICATION_RESPONSE_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_usage_report_session_deletion_response(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_USAGE_REPORT_SESSION_DELETION_RESPONSE_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_usage_report_session_report_request(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_USAGE_REPORT_SESSION_REPORT_REQUEST_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_downlink_data_report(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_DOWNLINK_DATA_REPORT_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_create_bar(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_CREATE_BAR_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_update_bar_session_modification_request(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_UPDATE_BAR_SESSION_MODIFICATION_REQUEST_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_remove_bar(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_REMOVE_BAR_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_cp_function_features(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_CP_FUNCTION_FEATURES_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_ue_ip_address(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_UE_IP_ADDRESS_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_recovery_time_stamp(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_RECOVERY_TIME_STAMP_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_error_indication_report(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_ERROR_INDICATION_REPORT_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_node_report_type(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_NODE_REPORT_TYPE_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_user_plane_path_failure_report(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_USER_PLANE_PATH_FAILURE_REPORT_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_pfcp_association_release_request(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_PFCP_ASSOCIATION_RELEASE_REQUEST_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_graceful_release_period(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_GRACEFUL_RELEASE_PERIOD_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_pdn_type(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_PDN_TYPE_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_failed_rule_id(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_FAILED_RULE_ID_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_user_plane_ip_resource_information(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_USER_PLANE_IP_RESOURCE_INFORMATION_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_user_plane_inactivity_timer(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_USER_PLANE_INACTIVITY_TIMER_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_query_urr_reference(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_QUERY_URR_REFERENCE_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_additional_usage_reports_information(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_ADDITIONAL_USAGE_REPORTS_INFORMATION_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_create_traffic_endpoint(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_CREATE_TRAFFIC_ENDPOINT_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_created_traffic_endpoint(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_CREATED_TRAFFIC_ENDPOINT_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_update_traffic_endpoint(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_UPDATE_TRAFFIC_ENDPOINT_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_remove_traffic_endpoint(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_REMOVE_TRAFFIC_ENDPOINT_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_user_id(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_USER_ID_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_trace_information(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_TRACE_INFORMATION_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_apn_dnn(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_APN_DNN_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_pfcpsrreq_flags(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_PFCPSRREQ_FLAGS_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_pfcpaureq_flags(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_PFCPAUREQ_FLAGS_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_create_mar(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_CREATE_MAR_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_remove_mar(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_REMOVE_MAR_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_update_mar(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_UPDATE_MAR_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_alternative_smf_ip_address(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_ALTERNATIVE_SMF_IP_ADDRESS_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_smf_set_id(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_SMF_SET_ID_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_pfcp_session_retention_information_within_pfcp_association_setup_request(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_PFCP_SESSION_RETENTION_INFORMATION_WITHIN_PFCP_ASSOCIATION_SETUP_REQUEST_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_pfcpasrsp_flags(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_PFCPASRSP_FLAGS_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_pfcpsereq_flags(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_PFCPSEREQ_FLAGS_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_user_plane_path_recovery_report(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_USER_PLANE_PATH_RECOVERY_REPORT_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_source_ip_address(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_SOURCE_IP_ADDRESS_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_create_bridge_info_for_tsc(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_CREATE_BRIDGE_INFO_FOR_TSC_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_created_bridge_info_for_tsc(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_CREATED_BRIDGE_INFO_FOR_TSC_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_tsc_management_information_ie_within_pfcp_session_modification_request(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_TSC_MANAGEMENT_INFORMATION_IE_WITHIN_PFCP_SESSION_MODIFICATION_REQUEST_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_clock_drift_control_information(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_CLOCK_DRIFT_CONTROL_INFORMATION_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_clock_drift_report(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_CLOCK_DRIFT_REPORT_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_remove_srr(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_REMOVE_SRR_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_create_srr(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_CREATE_SRR_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_update_srr(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_UPDATE_SRR_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_session_report(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_SESSION_REPORT_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_access_availability_information(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_ACCESS_AVAILABILITY_INFORMATION_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_provide_atsss_control_information(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_PROVIDE_ATSSS_CONTROL_INFORMATION_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_atsss_control_parameters(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_ATSSS_CONTROL_PARAMETERS_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_gtp_u_path_qos_control_information(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_GTP_U_PATH_QOS_CONTROL_INFORMATION_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_gtp_u_path_qos_report_pfcp_node_report_request(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_GTP_U_PATH_QOS_REPORT_PFCP_NODE_REPORT_REQUEST_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_packet_rate_status_report(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_PACKET_RATE_STATUS_REPORT_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_nf_instance_id(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_NF_INSTANCE_ID_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_ethernet_context_information(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_ETHERNET_CONTEXT_INFORMATION_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_updated_pdr(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_UPDATED_PDR_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_s_nssai(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_S_NSSAI_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_pfcpasreq_flags(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_PFCPASREQ_FLAGS_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_provide_rds_configuration_information(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_PROVIDE_RDS_CONFIGURATION_INFORMATION_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_rds_configuration_information(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_RDS_CONFIGURATION_INFORMATION_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_query_packet_rate_status_ie_within_pfcp_session_modification_request(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_QUERY_PACKET_RATE_STATUS_IE_WITHIN_PFCP_SESSION_MODIFICATION_REQUEST_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_ue_ip_address_usage_information(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_UE_IP_ADDRESS_USAGE_INFORMATION_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_partial_failure_information(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_PARTIAL_FAILURE_INFORMATION_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_rat_type(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_RAT_TYPE_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_l2tp_tunnel_information(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_L2TP_TUNNEL_INFORMATION_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_l2tp_session_information(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_L2TP_SESSION_INFORMATION_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_created_l2tp_session(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_CREATED_L2TP_SESSION_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_pfcp_session_change_info(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_PFCP_SESSION_CHANGE_INFO_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_group_id(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_GROUP_ID_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_mbs_session_n4mb_control_information(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_MBS_SESSION_N4MB_CONTROL_INFORMATION_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_mbs_session_n4mb_information(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_MBS_SESSION_N4MB_INFORMATION_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_mbs_session_n4_control_information(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_MBS_SESSION_N4_CONTROL_INFORMATION_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_mbs_session_n4_information(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_MBS_SESSION_N4_INFORMATION_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_peer_up_restart_report(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_PEER_UP_RESTART_REPORT_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_dscp_to_ppi_control_information(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_DSCP_TO_PPI_CONTROL_INFORMATION_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_pfcpsdrsp_flags(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_PFCPSDRSP_FLAGS_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
+int ogs_pfcp_peek_vendor_specific_node_report_type(ogs_pkbuf_t *pkbuf, uint16_t *length)
+{
+    ogs_pfcp_peek_t ie = { OGS_PFCP_VENDOR_SPECIFIC_NODE_REPORT_TYPE_TYPE, 0, -1 };
+
+    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)
+        return OGS_ERROR;
+
+    if (length)
+        *length = ie.length;
+
+    return ie.offset;
+}
+
@@ -20,8 +20,8 @@
 /*******************************************************************************
  * This file had been created by pfcp-tlv.py script v0.1.0
  * Please do not modify this file but regenerate it via script.
- * Created on: 2024-10-20 22:37:02.530796 by acetcom
- * from 29244-h71-modified.docx
+ * Created from 29244-h71-modified.docx
+ * (sha256: 6c94e2b5b45cdb1370a468345443ff773a37662de002639cf6a33bb64fd7c166)
  ******************************************************************************/
 
 #if !defined(OGS_PFCP_INSIDE) && !defined(OGS_PFCP_COMPILATION)
@@ -2154,6 +2154,64 @@ typedef struct ogs_pfcp_session_report_response_s {
     ogs_pfcp_tlv_node_id_t node_id;
 } ogs_pfcp_session_report_response_t;
 
+/*
+ * The most ogs_tlv_t nodes a message takes from the pool of
+ * ogs_tlv_get() to be parsed or built, and how deep its IEs nest.
+ * The direct parsers and builders take none.
+ */
+#define OGS_PFCP_HEARTBEAT_REQUEST_MAX_TLV 2
+#define OGS_PFCP_HEARTBEAT_REQUEST_MAX_TLV_DEPTH 1
+#define OGS_PFCP_HEARTBEAT_RESPONSE_MAX_TLV 1
+#define OGS_PFCP_HEARTBEAT_RESPONSE_MAX_TLV_DEPTH 1
+#define OGS_PFCP_PFD_MANAGEMENT_REQUEST_MAX_TLV 5
+#define OGS_PFCP_PFD_MANAGEMENT_REQUEST_MAX_TLV_DEPTH 3
+#define OGS_PFCP_PFD_MANAGEMENT_RESPONSE_MAX_TLV 3
+#define OGS_PFCP_PFD_MANAGEMENT_RESPONSE_MAX_TLV_DEPTH 1
+#define OGS_PFCP_ASSOCIATION_SETUP_REQUEST_MAX_TLV 22
+#define OGS_PFCP_ASSOCIATION_SETUP_REQUEST_MAX_TLV_DEPTH 2
+#define OGS_PFCP_ASSOCIATION_SETUP_RESPONSE_MAX_TLV 21
+#define OGS_PFCP_ASSOCIATION_SETUP_RESPONSE_MAX_TLV_DEPTH 2
+#define OGS_PFCP_ASSOCIATION_UPDATE_REQUEST_MAX_TLV 28
+#define OGS_PFCP_ASSOCIATION_UPDATE_REQUEST_MAX_TLV_DEPTH 2
+#define OGS_PFCP_ASSOCIATION_UPDATE_RESPONSE_MAX_TLV 16
+#define OGS_PFCP_ASSOCIATION_UPDATE_RESPONSE_MAX_TLV_DEPTH 2
+#define OGS_PFCP_ASSOCIATION_RELEASE_REQUEST_MAX_TLV 1
+#define OGS_PFCP_ASSOCIATION_RELEASE_REQUEST_MAX_TLV_DEPTH 1
+#define OGS_PFCP_ASSOCIATION_RELEASE_RESPONSE_MAX_TLV 2
+#define OGS_PFCP_ASSOCIATION_RELEASE_RESPONSE_MAX_TLV_DEPTH 1
+#define OGS_PFCP_VERSION_NOT_SUPPORTED_RESPONSE_MAX_TLV 0
+#define OGS_PFCP_VERSION_NOT_SUPPORTED_RESPONSE_MAX_TLV_DEPTH 0
+#define OGS_PFCP_NODE_REPORT_REQUEST_MAX_TLV 26
+#define OGS_PFCP_NODE_REPORT_REQUEST_MAX_TLV_DEPTH 2
+#define OGS_PFCP_NODE_REPORT_RESPONSE_MAX_TLV 3
+#define OGS_PFCP_NODE_REPORT_RESPONSE_MAX_TLV_DEPTH 1
+#define OGS_PFCP_SESSION_SET_DELETION_REQUEST_MAX_TLV 7
+#define OGS_PFCP_SESSION_SET_DELETION_REQUEST_MAX_TLV_DEPTH 1
+#define OGS_PFCP_SESSION_SET_DELETION_RESPONSE_MAX_TLV 3
+#define OGS_PFCP_SESSION_SET_DELETION_RESPONSE_MAX_TLV_DEPTH 1
+#define OGS_PFCP_SESSION_SET_MODIFICATION_REQUEST_MAX_TLV 6
+#define OGS_PFCP_SESSION_SET_MODIFICATION_REQUEST_MAX_TLV_DEPTH 2
+#define OGS_PFCP_SESSION_SET_MODIFICATION_RESPONSE_MAX_TLV 3
+#define OGS_PFCP_SESSION_SET_MODIFICATION_RESPONSE_MAX_TLV_DEPTH 1
+#define OGS_PFCP_SESSION_ESTABLISHMENT_REQUEST_MAX_TLV 2839
+#define OGS_PFCP_SESSION_ESTABLISHMENT_REQUEST_MAX_TLV_DEPTH 4
+#define OGS_PFCP_SESSION_ESTABLISHMENT_RESPONSE_MAX_TLV 144
+#define OGS_PFCP_SESSION_ESTABLISHMENT_RESPONSE_MAX_TLV_DEPTH 3
+#define OGS_PFCP_SESSION_MODIFICATION_REQUEST_MAX_TLV 5464
+#define OGS_PFCP_SESSION_MODIFICATION_REQUEST_MAX_TLV_DEPTH 4
+#define OGS_PFCP_SESSION_MODIFICATION_RESPONSE_MAX_TLV 264
+#define OGS_PFCP_SESSION_MODIFICATION_RESPONSE_MAX_TLV_DEPTH 3
+#define OGS_PFCP_SESSION_DELETION_REQUEST_MAX_TLV 0
+#define OGS_PFCP_SESSION_DELETION_REQUEST_MAX_TLV_DEPTH 0
+#define OGS_PFCP_SESSION_DELETION_RESPONSE_MAX_TLV 141
+#define OGS_PFCP_SESSION_DELETION_RESPONSE_MAX_TLV_DEPTH 3
+#define OGS_PFCP_SESSION_REPORT_REQUEST_MAX_TLV 276
+#define OGS_PFCP_SESSION_REPORT_REQUEST_MAX_TLV_DEPTH 3
+#define OGS_PFCP_SESSION_REPORT_RESPONSE_MAX_TLV 15
+#define OGS_PFCP_SESSION_REPORT_RESPONSE_MAX_TLV_DEPTH 2
+#define OGS_PFCP_MAX_TLV 5464
+#define OGS_PFCP_MAX_TLV_DEPTH 4
+
 typedef struct ogs_pfcp_message_s {
    ogs_pfcp_header_t h;
    union {
@@ -2189,6 +2247,177 @@ ogs_pfcp_message_t *ogs_pfcp_parse_msg(ogs_pkbuf_t *pkbuf);
 void ogs_pfcp_message_free(ogs_pfcp_message_t *pfcp_message);
 ogs_pkbuf_t *ogs_pfcp_build_msg(ogs_pfcp_message_t *pfcp_message);
 
+/*
+ * Same encoding as ogs_pfcp_build_msg(), written straight into the pkbuf
+ * from the layout of each message instead of through an ogs_tlv_t tree.
+ * The message is left as it is (ogs_pfcp_build_msg() byte-swaps it).
+ */
+ogs_pkbuf_t *ogs_pfcp_build_msg_direct(ogs_pfcp_message_t *pfcp_message);
+ogs_pkbuf_t *ogs_pfcp_build_heartbeat_request_direct(ogs_pfcp_heartbeat_request_t *msg);
+ogs_pkbuf_t *ogs_pfcp_build_heartbeat_response_direct(ogs_pfcp_heartbeat_response_t *msg);
+ogs_pkbuf_t *ogs_pfcp_build_pfd_management_request_direct(ogs_pfcp_pfd_management_request_t *msg);
+ogs_pkbuf_t *ogs_pfcp_build_pfd_management_response_direct(ogs_pfcp_pfd_management_response_t *msg);
+ogs_pkbuf_t *ogs_pfcp_build_association_setup_request_direct(ogs_pfcp_association_setup_request_t *msg);
+ogs_pkbuf_t *ogs_pfcp_build_association_setup_response_direct(ogs_pfcp_association_setup_response_t *msg);
+ogs_pkbuf_t *ogs_pfcp_build_association_update_request_direct(ogs_pfcp_association_update_request_t *msg);
+ogs_pkbuf_t *ogs_pfcp_build_association_update_response_direct(ogs_pfcp_association_update_response_t *msg);
+ogs_pkbuf_t *ogs_pfcp_build_association_release_request_direct(ogs_pfcp_association_release_request_t *msg);
+ogs_pkbuf_t *ogs_pfcp_build_association_release_response_direct(ogs_pfcp_association_release_response_t *msg);
+ogs_pkbuf_t *ogs_pfcp_build_version_not_supported_response_direct(ogs_pfcp_version_not_supported_response_t *msg);
+ogs_pkbuf_t *ogs_pfcp_build_node_report_request_direct(ogs_pfcp_node_report_request_t *msg);
+ogs_pkbuf_t *ogs_pfcp_build_node_report_response_direct(ogs_pfcp_node_report_response_t *msg);
+ogs_pkbuf_t *ogs_pfcp_build_session_set_deletion_request_direct(ogs_pfcp_session_set_deletion_request_t *msg);
+ogs_pkbuf_t *ogs_pfcp_build_session_set_deletion_response_direct(ogs_pfcp_session_set_deletion_response_t *msg);
+ogs_pkbuf_t *ogs_pfcp_build_session_set_modification_request_direct(ogs_pfcp_session_set_modification_request_t *msg);
+ogs_pkbuf_t *ogs_pfcp_build_session_set_modification_response_direct(ogs_pfcp_session_set_modification_response_t *msg);
+ogs_pkbuf_t *ogs_pfcp_build_session_establishment_request_direct(ogs_pfcp_session_establishment_request_t *msg);
+ogs_pkbuf_t *ogs_pfcp_build_session_establishment_response_direct(ogs_pfcp_session_establishment_response_t *msg);
+ogs_pkbuf_t *ogs_pfcp_build_session_modification_request_direct(ogs_pfcp_session_modification_request_t *msg);
+ogs_pkbuf_t *ogs_pfcp_build_session_modification_response_direct(ogs_pfcp_session_modification_response_t *msg);
+ogs_pkbuf_t *ogs_pfcp_build_session_deletion_request_direct(ogs_pfcp_session_deletion_request_t *msg);
+ogs_pkbuf_t *ogs_pfcp_build_session_deletion_response_direct(ogs_pfcp_session_deletion_response_t *msg);
+ogs_pkbuf_t *ogs_pfcp_build_session_report_request_direct(ogs_pfcp_session_report_request_t *msg);
+ogs_pkbuf_t *ogs_pfcp_build_session_report_response_direct(ogs_pfcp_session_report_response_t *msg);
+
+/*
+ * Single pass parsers for the busiest messages, filling the message in
+ * place without an ogs_tlv_t tree. ogs_pfcp_parse_msg() uses them for
+ * these types and falls back to ogs_tlv_parse_msg() for the others.
+ */
+int ogs_pfcp_parse_heartbeat_request_direct(ogs_pfcp_heartbeat_request_t *msg, ogs_pkbuf_t *pkbuf);
+int ogs_pfcp_parse_heartbeat_response_direct(ogs_pfcp_heartbeat_response_t *msg, ogs_pkbuf_t *pkbuf);
+int ogs_pfcp_parse_session_establishment_request_direct(ogs_pfcp_session_establishment_request_t *msg, ogs_pkbuf_t *pkbuf);
+int ogs_pfcp_parse_session_establishment_response_direct(ogs_pfcp_session_establishment_response_t *msg, ogs_pkbuf_t *pkbuf);
+int ogs_pfcp_parse_session_modification_request_direct(ogs_pfcp_session_modification_request_t *msg, ogs_pkbuf_t *pkbuf);
+int ogs_pfcp_parse_session_modification_response_direct(ogs_pfcp_session_modification_response_t *msg, ogs_pkbuf_t *pkbuf);
+int ogs_pfcp_parse_session_report_request_direct(ogs_pfcp_session_report_request_t *msg, ogs_pkbuf_t *pkbuf);
+int ogs_pfcp_parse_session_report_response_direct(ogs_pfcp_session_report_response_t *msg, ogs_pkbuf_t *pkbuf);
+
+/*
+ * Look at a message before ogs_pfcp_parse_msg(), e.g. to route or drop it.
+ * ogs_pfcp_peek() checks the header and gets the message type and the SEID
+ * (0 without one). ogs_pfcp_peek_ies() walks the top-level IEs once and
+ * sets the offset in the pkbuf and the length of each requested type,
+ * leaving -1 for the absent ones; an IE requested twice gets its first and
+ * second instances. It returns how many were found. ogs_pfcp_peek_<ie>()
+ * returns the offset of a single IE, or OGS_ERROR if it is absent.
+ */
+typedef struct ogs_pfcp_peek_s {
+    uint16_t type;
+    uint16_t length;
+    int offset;
+} ogs_pfcp_peek_t;
+
+int ogs_pfcp_peek(ogs_pkbuf_t *pkbuf, uint8_t *type, uint64_t *seid);
+int ogs_pfcp_peek_ies(ogs_pkbuf_t *pkbuf, ogs_pfcp_peek_t *ies, int num);
+int ogs_pfcp_peek_create_pdr(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_create_far(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_create_urr(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_create_qer(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_created_pdr(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_update_pdr(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_update_far(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_update_bar_pfcp_session_report_response(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_update_urr(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_update_qer(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_remove_pdr(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_remove_far(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_remove_urr(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_remove_qer(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_cause(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_f_teid(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_report_type(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_offending_ie(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_up_function_features(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_pfcpsmreq_flags(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_pfcpsrrsp_flags(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_load_control_information(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_overload_control_information(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_f_seid(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_application_id_s_pfds(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_node_id(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_fq_csid(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_query_urr(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_usage_report_session_modification_response(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_usage_report_session_deletion_response(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_usage_report_session_report_request(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_downlink_data_report(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_create_bar(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_update_bar_session_modification_request(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_remove_bar(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_cp_function_features(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_ue_ip_address(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_recovery_time_stamp(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_error_indication_report(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_node_report_type(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_user_plane_path_failure_report(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_pfcp_association_release_request(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_graceful_release_period(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_pdn_type(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_failed_rule_id(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_user_plane_ip_resource_information(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_user_plane_inactivity_timer(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_query_urr_reference(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_additional_usage_reports_information(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_create_traffic_endpoint(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_created_traffic_endpoint(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_update_traffic_endpoint(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_remove_traffic_endpoint(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_user_id(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_trace_information(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_apn_dnn(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_pfcpsrreq_flags(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_pfcpaureq_flags(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_create_mar(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_remove_mar(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_update_mar(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_alternative_smf_ip_address(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_smf_set_id(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_pfcp_session_retention_information_within_pfcp_association_setup_request(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_pfcpasrsp_flags(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_pfcpsereq_flags(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_user_plane_path_recovery_report(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_source_ip_address(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_create_bridge_info_for_tsc(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_created_bridge_info_for_tsc(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_tsc_management_information_ie_within_pfcp_session_modification_request(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_clock_drift_control_information(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_clock_drift_report(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_remove_srr(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_create_srr(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_update_srr(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_session_report(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_access_availability_information(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_provide_atsss_control_information(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_atsss_control_parameters(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_gtp_u_path_qos_control_information(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_gtp_u_path_qos_report_pfcp_node_report_request(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_packet_rate_status_report(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_nf_instance_id(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_ethernet_context_information(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_updated_pdr(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_s_nssai(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_pfcpasreq_flags(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_provide_rds_configuration_information(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_rds_configuration_information(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_query_packet_rate_status_ie_within_pfcp_session_modification_request(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_ue_ip_address_usage_information(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_partial_failure_information(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_rat_type(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_l2tp_tunnel_information(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_l2tp_session_information(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_created_l2tp_session(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_pfcp_session_change_info(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_group_id(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_mbs_session_n4mb_control_information(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_mbs_session_n4mb_information(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_mbs_session_n4_control_information(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_mbs_session_n4_information(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_peer_up_restart_report(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_dscp_to_ppi_control_information(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_pfcpsdrsp_flags(ogs_pkbuf_t *pkbuf, uint16_t *length);
+int ogs_pfcp_peek_vendor_specific_node_report_type(ogs_pkbuf_t *pkbuf, uint16_t *length);
+
 #ifdef __cplusplus
 }
 #endif
@@ -1,10 +0,0 @@
-ies = []
-ies.append({ "ie_type" : "Node ID", "ie_value" : "Node ID", "presence" : "M", "tlv_more" : "0", "comment" : "This IE shall contain the unique identifier of the sending Node."})
-ies.append({ "ie_type" : "Node Report Type", "ie_value" : "Node Report Type", "presence" : "M", "tlv_more" : "0", "comment" : "This IE shall indicate the type of the report."})
-ies.append({ "ie_type" : "Vendor-Specific Node Report Type", "ie_value" : "Vendor-Specific Node Report Type", "presence" : "C", "tlv_more" : "0", "comment" : "This IE shall be present if the Node Report Type IE indicates a Vendor-Specific Report. When present, this IE shall indicate the type of the Vendor-Specific Report."})
-ies.append({ "ie_type" : "User Plane Path Failure Report", "ie_value" : "User Plane Path Failure Report", "presence" : "C", "tlv_more" : "0", "comment" : "This IE shall be present if the Node Report Type indicates a User Plane Path Failure Report."})
-ies.append({ "ie_type" : "User Plane Path Recovery Report", "ie_value" : "User Plane Path Recovery Report", "presence" : "C", "tlv_more" : "0", "comment" : "This IE shall be present if the Node Report Type indicates a User Plane Path Recovery Report."})
-ies.append({ "ie_type" : "Clock Drift Report", "ie_value" : "Clock Drift Report", "presence" : "C", "tlv_more" : "0", "comment" : "This IE shall be present if the Node Report Type indicates a Clock Drift Report.More than one IE with this type may be included to send Clock Drift Reports for different Time Domain Numbers."})
-ies.append({ "ie_type" : "GTP-U Path QoS Report PFCP Node Report Request", "ie_value" : "GTP-U Path QoS Report", "presence" : "C", "tlv_more" : "0", "comment" : "This IE shall be present if the Node Report Type indicates a GTP-U Path QoS Report.More than one IE with this type may be included to represent multiple remote GTP-U peers for which QoS information is reported."})
-ies.append({ "ie_type" : "Peer UP Restart Report", "ie_value" : "Peer UP Restart Report", "presence" : "C", "tlv_more" : "0", "comment" : "This IE shall be present if the Node Report Type Indicates a Peer GTP-U entity has restarted as specified in clause20.3.4a of 3GPPTS23.007[24] and in clause5.5 of 3GPPTS23.527[40]."})
-msg_list[key]["ies"] = ies
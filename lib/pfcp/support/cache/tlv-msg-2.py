@@ -1,3 +0,0 @@
-ies = []
-ies.append({ "ie_type" : "Recovery Time Stamp", "ie_value" : "Recovery Time Stamp", "presence" : "M", "tlv_more" : "0", "comment" : "This IE shall contain the time stamp when the PFCP entity was started see clause19A of 3GPPTS23.007[24]."})
-msg_list[key]["ies"] = ies
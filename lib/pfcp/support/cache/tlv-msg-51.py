@@ -1,20 +0,0 @@
-ies = []
-ies.append({ "ie_type" : "Node ID", "ie_value" : "Node ID", "presence" : "M", "tlv_more" : "0", "comment" : "This IE shall contain the unique identifier of the sending Node."})
-ies.append({ "ie_type" : "Cause", "ie_value" : "Cause", "presence" : "M", "tlv_more" : "0", "comment" : "This IE shall indicate the acceptance, partial acceptance or rejection of the corresponding request message."})
-ies.append({ "ie_type" : "Offending IE", "ie_value" : "Offending IE", "presence" : "C", "tlv_more" : "0", "comment" : "This IE shall be included if the rejection is due to a conditional or mandatory IE missing or faulty."})
-ies.append({ "ie_type" : "F-SEID", "ie_value" : "UP F-SEID", "presence" : "C", "tlv_more" : "0", "comment" : "This IE shall be present if the cause is set to Request accepted (success). When present, it shall contain the unique identifier allocated by the UP function identifying the session."})
-type_list["Created PDR"]["max_tlv_more"] = "15"
-ies.append({ "ie_type" : "Created PDR", "ie_value" : "Created PDR", "presence" : "C", "tlv_more" : "15", "comment" : "This IE shall be present if the cause is set to success and the UP function was requested to allocate a local F-TEID or a UE IP address/prefix for the PDR.When present, this IE shall contain the PDR information associated to the PFCP session. There may be several instances of this IE.See table 7.5.3.2-1."})
-ies.append({ "ie_type" : "Load Control Information", "ie_value" : "Load Control Information", "presence" : "O", "tlv_more" : "0", "comment" : "The UP function may include this IE if it supports the load control feature and the feature is activated in the network.See Table 7.5.3.3-1."})
-ies.append({ "ie_type" : "Overload Control Information", "ie_value" : "Overload Control Information", "presence" : "O", "tlv_more" : "0", "comment" : "During an overload condition, the UP function may include this IE if it supports the overload control feature and the feature is activated in the network.See Table 7.5.3.4-1."})
-ies.append({ "ie_type" : "FQ-CSID", "ie_value" : "PGW-U/SGW-U /UPF FQ-CSID", "presence" : "C", "tlv_more" : "0", "comment" : "This IE shall be included according to the requirements in clause23 of 3GPPTS23.007[24] and clause4.6 of 3GPPTS23.527[40]."})
-ies.append({ "ie_type" : "Failed Rule ID", "ie_value" : "Failed Rule ID", "presence" : "C", "tlv_more" : "0", "comment" : "This IE shall be included if the Cause IE indicates a rejection due to a rule creation or modification failure. "})
-ies.append({ "ie_type" : "Created Traffic Endpoint", "ie_value" : "Created Traffic Endpoint", "presence" : "C", "tlv_more" : "0", "comment" : "This IE shall be present if the cause is set to success and the UP function was requested to allocate a local F-TEID or a UE IP address/prefix in a Create Traffic Endpoint IE. When present, it shall contain the local F-TEID or UE IP address/prefix to be used for this Traffic Endpoint.There may be several instances of this IE."})
-ies.append({ "ie_type" : "Created Bridge Info for TSC", "ie_value" : "Created Bridge Info for TSC", "presence" : "C", "tlv_more" : "0", "comment" : "This IE shall be present if the UPF was requested to provide Bridge information for TSC in the PFCP Session Establishment Request. When present, it shall contain the Bridge information for TSC for the PFCP session.See Table 7.5.3.6-1."})
-ies.append({ "ie_type" : "ATSSS Control Parameters", "ie_value" : "ATSSS Control Parameters", "presence" : "C", "tlv_more" : "0", "comment" : "This IE shall be present if ATSSS functionality is required in the request message and the UPF allocates the resources and parameters corresponding to the required ATSSS functionality.See Table7.5.3.7-1."})
-ies.append({ "ie_type" : "RDS Configuration Information", "ie_value" : "RDS configuration information", "presence" : "O", "tlv_more" : "0", "comment" : "When present, this IE shall contain the RDS configuration information the UP function supported for this PFCP session."})
-ies.append({ "ie_type" : "Partial Failure Information", "ie_value" : "Partial Failure Information", "presence" : "C", "tlv_more" : "0", "comment" : "This IE shall be present if the Cause IE indicates partial acceptance of the request to provide failure information related to a failed rule. See Table7.5.3.1-2.Several IEs within the same IE type may be present to report failures to apply multiple rules."})
-ies.append({ "ie_type" : "Created L2TP Session", "ie_value" : "Created L2TP Session", "presence" : "O", "tlv_more" : "0", "comment" : "This IE may be present to include information for the Created L2TP session if the Cause IE indicates a success."})
-ies.append({ "ie_type" : "MBS Session N4mb Information", "ie_value" : "MBS Session N4mb Information", "presence" : "C", "tlv_more" : "0", "comment" : "This IE shall be present if any IE in this grouped IE needs to be included."})
-ies.append({ "ie_type" : "MBS Session N4 Information", "ie_value" : "MBS Session N4 Information", "presence" : "C", "tlv_more" : "0", "comment" : "This IE shall be included if any IE in this grouped IE needs to be included as specified in clause5.34.1.Several IE with the same IE type may be present to contain N4 Information for several MBS Sessions respectively."})
-msg_list[key]["ies"] = ies
@@ -1,25 +0,0 @@
-msg_list["PFCP Heartbeat Request"] = { "type" : "1" }
-msg_list["PFCP Heartbeat Response"] = { "type" : "2" }
-msg_list["PFCP PFD Management Request"] = { "type" : "3" }
-msg_list["PFCP PFD Management Response"] = { "type" : "4" }
-msg_list["PFCP Association Setup Request"] = { "type" : "5" }
-msg_list["PFCP Association Setup Response"] = { "type" : "6" }
-msg_list["PFCP Association Update Request"] = { "type" : "7" }
-msg_list["PFCP Association Update Response"] = { "type" : "8" }
-msg_list["PFCP Association Release Request"] = { "type" : "9" }
-msg_list["PFCP Association Release Response"] = { "type" : "10" }
-msg_list["PFCP Version Not Supported Response"] = { "type" : "11" }
-msg_list["PFCP Node Report Request"] = { "type" : "12" }
-msg_list["PFCP Node Report Response"] = { "type" : "13" }
-msg_list["PFCP Session Set Deletion Request"] = { "type" : "14" }
-msg_list["PFCP Session Set Deletion Response"] = { "type" : "15" }
-msg_list["PFCP Session Set Modification Request"] = { "type" : "16" }
-msg_list["PFCP Session Set Modification Response"] = { "type" : "17" }
-msg_list["PFCP Session Establishment Request"] = { "type" : "50" }
-msg_list["PFCP Session Establishment Response"] = { "type" : "51" }
-msg_list["PFCP Session Modification Request"] = { "type" : "52" }
-msg_list["PFCP Session Modification Response"] = { "type" : "53" }
-msg_list["PFCP Session Deletion Request"] = { "type" : "54" }
-msg_list["PFCP Session Deletion Response"] = { "type" : "55" }
-msg_list["PFCP Session Report Request"] = { "type" : "56" }
-msg_list["PFCP Session Report Response"] = { "type" : "57" }
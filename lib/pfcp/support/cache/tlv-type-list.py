@@ -1,321 +0,0 @@
-type_list["Create PDR"] = { "type" : "1", "max_tlv_more" : "0" }
-type_list["PDI"] = { "type" : "2", "max_tlv_more" : "0" }
-type_list["Create FAR"] = { "type" : "3", "max_tlv_more" : "0" }
-type_list["Forwarding Parameters"] = { "type" : "4", "max_tlv_more" : "0" }
-type_list["Duplicating Parameters"] = { "type" : "5", "max_tlv_more" : "0" }
-type_list["Create URR"] = { "type" : "6", "max_tlv_more" : "0" }
-type_list["Create QER"] = { "type" : "7", "max_tlv_more" : "0" }
-type_list["Created PDR"] = { "type" : "8", "max_tlv_more" : "0" }
-type_list["Update PDR"] = { "type" : "9", "max_tlv_more" : "0" }
-type_list["Update FAR"] = { "type" : "10", "max_tlv_more" : "0" }
-type_list["Update Forwarding Parameters"] = { "type" : "11", "max_tlv_more" : "0" }
-type_list["Update BAR PFCP Session Report Response"] = { "type" : "12", "max_tlv_more" : "0" }
-type_list["Update URR"] = { "type" : "13", "max_tlv_more" : "0" }
-type_list["Update QER"] = { "type" : "14", "max_tlv_more" : "0" }
-type_list["Remove PDR"] = { "type" : "15", "max_tlv_more" : "0" }
-type_list["Remove FAR"] = { "type" : "16", "max_tlv_more" : "0" }
-type_list["Remove URR"] = { "type" : "17", "max_tlv_more" : "0" }
-type_list["Remove QER"] = { "type" : "18", "max_tlv_more" : "0" }
-type_list["Cause"] = { "type" : "19", "max_tlv_more" : "0" }
-type_list["Source Interface"] = { "type" : "20", "max_tlv_more" : "0" }
-type_list["F-TEID"] = { "type" : "21", "max_tlv_more" : "0" }
-type_list["Network Instance"] = { "type" : "22", "max_tlv_more" : "0" }
-type_list["SDF Filter"] = { "type" : "23", "max_tlv_more" : "0" }
-type_list["Application ID"] = { "type" : "24", "max_tlv_more" : "0" }
-type_list["Gate Status"] = { "type" : "25", "max_tlv_more" : "0" }
-type_list["MBR"] = { "type" : "26", "max_tlv_more" : "0" }
-type_list["GBR"] = { "type" : "27", "max_tlv_more" : "0" }
-type_list["QER Correlation ID"] = { "type" : "28", "max_tlv_more" : "0" }
-type_list["Precedence"] = { "type" : "29", "max_tlv_more" : "0" }
-type_list["Transport Level Marking"] = { "type" : "30", "max_tlv_more" : "0" }
-type_list["Volume Threshold"] = { "type" : "31", "max_tlv_more" : "0" }
-type_list["Time Threshold"] = { "type" : "32", "max_tlv_more" : "0" }
-type_list["Monitoring Time"] = { "type" : "33", "max_tlv_more" : "0" }
-type_list["Subsequent Volume Threshold"] = { "type" : "34", "max_tlv_more" : "0" }
-type_list["Subsequent Time Threshold"] = { "type" : "35", "max_tlv_more" : "0" }
-type_list["Inactivity Detection Time"] = { "type" : "36", "max_tlv_more" : "0" }
-type_list["Reporting Triggers"] = { "type" : "37", "max_tlv_more" : "0" }
-type_list["Redirect Information"] = { "type" : "38", "max_tlv_more" : "0" }
-type_list["Report Type"] = { "type" : "39", "max_tlv_more" : "0" }
-type_list["Offending IE"] = { "type" : "40", "max_tlv_more" : "0" }
-type_list["Forwarding Policy"] = { "type" : "41", "max_tlv_more" : "0" }
-type_list["Destination Interface"] = { "type" : "42", "max_tlv_more" : "0" }
-type_list["UP Function Features"] = { "type" : "43", "max_tlv_more" : "0" }
-type_list["Apply Action"] = { "type" : "44", "max_tlv_more" : "0" }
-type_list["Downlink Data Service Information"] = { "type" : "45", "max_tlv_more" : "0" }
-type_list["Downlink Data Notification Delay"] = { "type" : "46", "max_tlv_more" : "0" }
-type_list["DL Buffering Duration"] = { "type" : "47", "max_tlv_more" : "0" }
-type_list["DL Buffering Suggested Packet Count"] = { "type" : "48", "max_tlv_more" : "0" }
-type_list["PFCPSMReq-Flags"] = { "type" : "49", "max_tlv_more" : "0" }
-type_list["PFCPSRRsp-Flags"] = { "type" : "50", "max_tlv_more" : "0" }
-type_list["Load Control Information"] = { "type" : "51", "max_tlv_more" : "0" }
-type_list["Sequence Number"] = { "type" : "52", "max_tlv_more" : "0" }
-type_list["Metric"] = { "type" : "53", "max_tlv_more" : "0" }
-type_list["Overload Control Information"] = { "type" : "54", "max_tlv_more" : "0" }
-type_list["Timer"] = { "type" : "55", "max_tlv_more" : "0" }
-type_list["PDR ID"] = { "type" : "56", "max_tlv_more" : "0" }
-type_list["F-SEID"] = { "type" : "57", "max_tlv_more" : "0" }
-type_list["Application ID's PFDs"] = { "type" : "58", "max_tlv_more" : "0" }
-type_list["PFD context"] = { "type" : "59", "max_tlv_more" : "0" }
-type_list["Node ID"] = { "type" : "60", "max_tlv_more" : "0" }
-type_list["PFD contents"] = { "type" : "61", "max_tlv_more" : "0" }
-type_list["Measurement Method"] = { "type" : "62", "max_tlv_more" : "0" }
-type_list["Usage Report Trigger"] = { "type" : "63", "max_tlv_more" : "0" }
-type_list["Measurement Period"] = { "type" : "64", "max_tlv_more" : "0" }
-type_list["FQ-CSID"] = { "type" : "65", "max_tlv_more" : "0" }
-type_list["Volume Measurement"] = { "type" : "66", "max_tlv_more" : "0" }
-type_list["Duration Measurement"] = { "type" : "67", "max_tlv_more" : "0" }
-type_list["Application Detection Information"] = { "type" : "68", "max_tlv_more" : "0" }
-type_list["Time of First Packet"] = { "type" : "69", "max_tlv_more" : "0" }
-type_list["Time of Last Packet"] = { "type" : "70", "max_tlv_more" : "0" }
-type_list["Quota Holding Time"] = { "type" : "71", "max_tlv_more" : "0" }
-type_list["Dropped DL Traffic Threshold"] = { "type" : "72", "max_tlv_more" : "0" }
-type_list["Volume Quota"] = { "type" : "73", "max_tlv_more" : "0" }
-type_list["Time Quota"] = { "type" : "74", "max_tlv_more" : "0" }
-type_list["Start Time"] = { "type" : "75", "max_tlv_more" : "0" }
-type_list["End Time"] = { "type" : "76", "max_tlv_more" : "0" }
-type_list["Query URR"] = { "type" : "77", "max_tlv_more" : "0" }
-type_list["Usage Report Session Modification Response"] = { "type" : "78", "max_tlv_more" : "0" }
-type_list["Usage Report Session Deletion Response"] = { "type" : "79", "max_tlv_more" : "0" }
-type_list["Usage Report Session Report Request"] = { "type" : "80", "max_tlv_more" : "0" }
-type_list["URR ID"] = { "type" : "81", "max_tlv_more" : "0" }
-type_list["Linked URR ID"] = { "type" : "82", "max_tlv_more" : "0" }
-type_list["Downlink Data Report"] = { "type" : "83", "max_tlv_more" : "0" }
-type_list["Outer Header Creation"] = { "type" : "84", "max_tlv_more" : "0" }
-type_list["Create BAR"] = { "type" : "85", "max_tlv_more" : "0" }
-type_list["Update BAR Session Modification Request"] = { "type" : "86", "max_tlv_more" : "0" }
-type_list["Remove BAR"] = { "type" : "87", "max_tlv_more" : "0" }
-type_list["BAR ID"] = { "type" : "88", "max_tlv_more" : "0" }
-type_list["CP Function Features"] = { "type" : "89", "max_tlv_more" : "0" }
-type_list["Usage Information"] = { "type" : "90", "max_tlv_more" : "0" }
-type_list["Application Instance ID"] = { "type" : "91", "max_tlv_more" : "0" }
-type_list["Flow Information"] = { "type" : "92", "max_tlv_more" : "0" }
-type_list["UE IP Address"] = { "type" : "93", "max_tlv_more" : "0" }
-type_list["Packet Rate"] = { "type" : "94", "max_tlv_more" : "0" }
-type_list["Outer Header Removal"] = { "type" : "95", "max_tlv_more" : "0" }
-type_list["Recovery Time Stamp"] = { "type" : "96", "max_tlv_more" : "0" }
-type_list["DL Flow Level Marking"] = { "type" : "97", "max_tlv_more" : "0" }
-type_list["Header Enrichment"] = { "type" : "98", "max_tlv_more" : "0" }
-type_list["Error Indication Report"] = { "type" : "99", "max_tlv_more" : "0" }
-type_list["Measurement Information"] = { "type" : "100", "max_tlv_more" : "0" }
-type_list["Node Report Type"] = { "type" : "101", "max_tlv_more" : "0" }
-type_list["User Plane Path Failure Report"] = { "type" : "102", "max_tlv_more" : "0" }
-type_list["Remote GTP-U Peer"] = { "type" : "103", "max_tlv_more" : "0" }
-type_list["UR-SEQN"] = { "type" : "104", "max_tlv_more" : "0" }
-type_list["Update Duplicating Parameters"] = { "type" : "105", "max_tlv_more" : "0" }
-type_list["Activate Predefined Rules"] = { "type" : "106", "max_tlv_more" : "0" }
-type_list["Deactivate Predefined Rules"] = { "type" : "107", "max_tlv_more" : "0" }
-type_list["FAR ID"] = { "type" : "108", "max_tlv_more" : "0" }
-type_list["QER ID"] = { "type" : "109", "max_tlv_more" : "0" }
-type_list["OCI Flags"] = { "type" : "110", "max_tlv_more" : "0" }
-type_list["PFCP Association Release Request"] = { "type" : "111", "max_tlv_more" : "0" }
-type_list["Graceful Release Period"] = { "type" : "112", "max_tlv_more" : "0" }
-type_list["PDN Type"] = { "type" : "113", "max_tlv_more" : "0" }
-type_list["Failed Rule ID"] = { "type" : "114", "max_tlv_more" : "0" }
-type_list["Time Quota Mechanism"] = { "type" : "115", "max_tlv_more" : "0" }
-type_list["User Plane IP Resource Information"] = { "type" : "116", "max_tlv_more" : "0" }
-type_list["User Plane Inactivity Timer"] = { "type" : "117", "max_tlv_more" : "0" }
-type_list["Aggregated URRs"] = { "type" : "118", "max_tlv_more" : "0" }
-type_list["Multiplier"] = { "type" : "119", "max_tlv_more" : "0" }
-type_list["Aggregated URR ID"] = { "type" : "120", "max_tlv_more" : "0" }
-type_list["Subsequent Volume Quota"] = { "type" : "121", "max_tlv_more" : "0" }
-type_list["Subsequent Time Quota"] = { "type" : "122", "max_tlv_more" : "0" }
-type_list["RQI"] = { "type" : "123", "max_tlv_more" : "0" }
-type_list["QFI"] = { "type" : "124", "max_tlv_more" : "0" }
-type_list["Query URR Reference"] = { "type" : "125", "max_tlv_more" : "0" }
-type_list["Additional Usage Reports Information"] = { "type" : "126", "max_tlv_more" : "0" }
-type_list["Create Traffic Endpoint"] = { "type" : "127", "max_tlv_more" : "0" }
-type_list["Created Traffic Endpoint"] = { "type" : "128", "max_tlv_more" : "0" }
-type_list["Update Traffic Endpoint"] = { "type" : "129", "max_tlv_more" : "0" }
-type_list["Remove Traffic Endpoint"] = { "type" : "130", "max_tlv_more" : "0" }
-type_list["Traffic Endpoint ID"] = { "type" : "131", "max_tlv_more" : "0" }
-type_list["Ethernet Packet Filter"] = { "type" : "132", "max_tlv_more" : "0" }
-type_list["MAC address"] = { "type" : "133", "max_tlv_more" : "0" }
-type_list["C-TAG"] = { "type" : "134", "max_tlv_more" : "0" }
-type_list["S-TAG"] = { "type" : "135", "max_tlv_more" : "0" }
-type_list["Ethertype"] = { "type" : "136", "max_tlv_more" : "0" }
-type_list["Proxying"] = { "type" : "137", "max_tlv_more" : "0" }
-type_list["Ethernet Filter ID"] = { "type" : "138", "max_tlv_more" : "0" }
-type_list["Ethernet Filter Properties"] = { "type" : "139", "max_tlv_more" : "0" }
-type_list["Suggested Buffering Packets Count"] = { "type" : "140", "max_tlv_more" : "0" }
-type_list["User ID"] = { "type" : "141", "max_tlv_more" : "0" }
-type_list["Ethernet PDU Session Information"] = { "type" : "142", "max_tlv_more" : "0" }
-type_list["Ethernet Traffic Information"] = { "type" : "143", "max_tlv_more" : "0" }
-type_list["MAC Addresses Detected"] = { "type" : "144", "max_tlv_more" : "0" }
-type_list["MAC Addresses Removed"] = { "type" : "145", "max_tlv_more" : "0" }
-type_list["Ethernet Inactivity Timer"] = { "type" : "146", "max_tlv_more" : "0" }
-type_list["Additional Monitoring Time"] = { "type" : "147", "max_tlv_more" : "0" }
-type_list["Event Quota"] = { "type" : "148", "max_tlv_more" : "0" }
-type_list["Event Threshold"] = { "type" : "149", "max_tlv_more" : "0" }
-type_list["Subsequent Event Quota"] = { "type" : "150", "max_tlv_more" : "0" }
-type_list["Subsequent Event Threshold"] = { "type" : "151", "max_tlv_more" : "0" }
-type_list["Trace Information"] = { "type" : "152", "max_tlv_more" : "0" }
-type_list["Framed-Route"] = { "type" : "153", "max_tlv_more" : "0" }
-type_list["Framed-Routing"] = { "type" : "154", "max_tlv_more" : "0" }
-type_list["Framed-IPv6-Route"] = { "type" : "155", "max_tlv_more" : "0" }
-type_list["Time Stamp"] = { "type" : "156", "max_tlv_more" : "0" }
-type_list["Averaging Window"] = { "type" : "157", "max_tlv_more" : "0" }
-type_list["Paging Policy Indicator"] = { "type" : "158", "max_tlv_more" : "0" }
-type_list["APN/DNN"] = { "type" : "159", "max_tlv_more" : "0" }
-type_list["3GPP Interface Type"] = { "type" : "160", "max_tlv_more" : "0" }
-type_list["PFCPSRReq-Flags"] = { "type" : "161", "max_tlv_more" : "0" }
-type_list["PFCPAUReq-Flags"] = { "type" : "162", "max_tlv_more" : "0" }
-type_list["Activation Time"] = { "type" : "163", "max_tlv_more" : "0" }
-type_list["Deactivation Time"] = { "type" : "164", "max_tlv_more" : "0" }
-type_list["Create MAR"] = { "type" : "165", "max_tlv_more" : "0" }
-type_list["3GPP Access Forwarding Action Information"] = { "type" : "166", "max_tlv_more" : "0" }
-type_list["Non-3GPP Access Forwarding Action Information"] = { "type" : "167", "max_tlv_more" : "0" }
-type_list["Remove MAR"] = { "type" : "168", "max_tlv_more" : "0" }
-type_list["Update MAR"] = { "type" : "169", "max_tlv_more" : "0" }
-type_list["MAR ID"] = { "type" : "170", "max_tlv_more" : "0" }
-type_list["Steering Functionality"] = { "type" : "171", "max_tlv_more" : "0" }
-type_list["Steering Mode"] = { "type" : "172", "max_tlv_more" : "0" }
-type_list["Weight"] = { "type" : "173", "max_tlv_more" : "0" }
-type_list["Priority"] = { "type" : "174", "max_tlv_more" : "0" }
-type_list["Update 3GPP Access Forwarding Action Information"] = { "type" : "175", "max_tlv_more" : "0" }
-type_list["Update Non-3GPP Access Forwarding Action Information"] = { "type" : "176", "max_tlv_more" : "0" }
-type_list["UE IP address Pool Identity"] = { "type" : "177", "max_tlv_more" : "0" }
-type_list["Alternative SMF IP Address"] = { "type" : "178", "max_tlv_more" : "0" }
-type_list["Packet Replication and Detection Carry-On Information"] = { "type" : "179", "max_tlv_more" : "0" }
-type_list["SMF Set ID"] = { "type" : "180", "max_tlv_more" : "0" }
-type_list["Quota Validity Time"] = { "type" : "181", "max_tlv_more" : "0" }
-type_list["Number of Reports"] = { "type" : "182", "max_tlv_more" : "0" }
-type_list["PFCP Session Retention Information within PFCP Association Setup Request"] = { "type" : "183", "max_tlv_more" : "0" }
-type_list["PFCPASRsp-Flags"] = { "type" : "184", "max_tlv_more" : "0" }
-type_list["CP PFCP Entity IP Address"] = { "type" : "185", "max_tlv_more" : "0" }
-type_list["PFCPSEReq-Flags"] = { "type" : "186", "max_tlv_more" : "0" }
-type_list["User Plane Path Recovery Report"] = { "type" : "187", "max_tlv_more" : "0" }
-type_list["IP Multicast Addressing Info within PFCP Session Establishment Request"] = { "type" : "188", "max_tlv_more" : "0" }
-type_list["Join IP Multicast Information IE within Usage Report"] = { "type" : "189", "max_tlv_more" : "0" }
-type_list["Leave IP Multicast Information IE within Usage Report"] = { "type" : "190", "max_tlv_more" : "0" }
-type_list["IP Multicast Address"] = { "type" : "191", "max_tlv_more" : "0" }
-type_list["Source IP Address"] = { "type" : "192", "max_tlv_more" : "0" }
-type_list["Packet Rate Status"] = { "type" : "193", "max_tlv_more" : "0" }
-type_list["Create Bridge Info for TSC"] = { "type" : "194", "max_tlv_more" : "0" }
-type_list["Created Bridge Info for TSC"] = { "type" : "195", "max_tlv_more" : "0" }
-type_list["DS-TT Port Number"] = { "type" : "196", "max_tlv_more" : "0" }
-type_list["NW-TT Port Number"] = { "type" : "197", "max_tlv_more" : "0" }
-type_list["5GS User Plane Node"] = { "type" : "198", "max_tlv_more" : "0" }
-type_list["TSC Management Information IE within PFCP Session Modification Request"] = { "type" : "199", "max_tlv_more" : "0" }
-type_list["TSC Management Information IE within PFCP Session Modification Response"] = { "type" : "200", "max_tlv_more" : "0" }
-type_list["TSC Management Information IE within PFCP Session Report Request"] = { "type" : "201", "max_tlv_more" : "0" }
-type_list["Port Management Information Container"] = { "type" : "202", "max_tlv_more" : "0" }
-type_list["Clock Drift Control Information"] = { "type" : "203", "max_tlv_more" : "0" }
-type_list["Requested Clock Drift Information"] = { "type" : "204", "max_tlv_more" : "0" }
-type_list["Clock Drift Report"] = { "type" : "205", "max_tlv_more" : "0" }
-type_list["Time Domain Number"] = { "type" : "206", "max_tlv_more" : "0" }
-type_list["Time Offset Threshold"] = { "type" : "207", "max_tlv_more" : "0" }
-type_list["Cumulative rateRatio Threshold"] = { "type" : "208", "max_tlv_more" : "0" }
-type_list["Time Offset Measurement"] = { "type" : "209", "max_tlv_more" : "0" }
-type_list["Cumulative rateRatio Measurement"] = { "type" : "210", "max_tlv_more" : "0" }
-type_list["Remove SRR"] = { "type" : "211", "max_tlv_more" : "0" }
-type_list["Create SRR"] = { "type" : "212", "max_tlv_more" : "0" }
-type_list["Update SRR"] = { "type" : "213", "max_tlv_more" : "0" }
-type_list["Session Report"] = { "type" : "214", "max_tlv_more" : "0" }
-type_list["SRR ID"] = { "type" : "215", "max_tlv_more" : "0" }
-type_list["Access Availability Control Information"] = { "type" : "216", "max_tlv_more" : "0" }
-type_list["Requested Access Availability Information"] = { "type" : "217", "max_tlv_more" : "0" }
-type_list["Access Availability Report"] = { "type" : "218", "max_tlv_more" : "0" }
-type_list["Access Availability Information"] = { "type" : "219", "max_tlv_more" : "0" }
-type_list["Provide ATSSS Control Information"] = { "type" : "220", "max_tlv_more" : "0" }
-type_list["ATSSS Control Parameters"] = { "type" : "221", "max_tlv_more" : "0" }
-type_list["MPTCP Control Information"] = { "type" : "222", "max_tlv_more" : "0" }
-type_list["ATSSS-LL Control Information"] = { "type" : "223", "max_tlv_more" : "0" }
-type_list["PMF Control Information"] = { "type" : "224", "max_tlv_more" : "0" }
-type_list["MPTCP Parameters"] = { "type" : "225", "max_tlv_more" : "0" }
-type_list["ATSSS-LL Parameters"] = { "type" : "226", "max_tlv_more" : "0" }
-type_list["PMF Parameters"] = { "type" : "227", "max_tlv_more" : "0" }
-type_list["MPTCP Address Information"] = { "type" : "228", "max_tlv_more" : "0" }
-type_list["UE Link-Specific IP Address"] = { "type" : "229", "max_tlv_more" : "0" }
-type_list["PMF Address Information"] = { "type" : "230", "max_tlv_more" : "0" }
-type_list["ATSSS-LL Information"] = { "type" : "231", "max_tlv_more" : "0" }
-type_list["Data Network Access Identifier"] = { "type" : "232", "max_tlv_more" : "0" }
-type_list["UE IP address Pool Information"] = { "type" : "233", "max_tlv_more" : "0" }
-type_list["Average Packet Delay"] = { "type" : "234", "max_tlv_more" : "0" }
-type_list["Minimum Packet Delay"] = { "type" : "235", "max_tlv_more" : "0" }
-type_list["Maximum Packet Delay"] = { "type" : "236", "max_tlv_more" : "0" }
-type_list["QoS Report Trigger"] = { "type" : "237", "max_tlv_more" : "0" }
-type_list["GTP-U Path QoS Control Information"] = { "type" : "238", "max_tlv_more" : "0" }
-type_list["GTP-U Path QoS Report PFCP Node Report Request"] = { "type" : "239", "max_tlv_more" : "0" }
-type_list["QoS Information in GTP-U Path QoS Report"] = { "type" : "240", "max_tlv_more" : "0" }
-type_list["GTP-U Path Interface Type"] = { "type" : "241", "max_tlv_more" : "0" }
-type_list["QoS Monitoring per QoS flow Control Information"] = { "type" : "242", "max_tlv_more" : "0" }
-type_list["Requested QoS Monitoring"] = { "type" : "243", "max_tlv_more" : "0" }
-type_list["Reporting Frequency"] = { "type" : "244", "max_tlv_more" : "0" }
-type_list["Packet Delay Thresholds"] = { "type" : "245", "max_tlv_more" : "0" }
-type_list["Minimum Wait Time"] = { "type" : "246", "max_tlv_more" : "0" }
-type_list["QoS Monitoring Report"] = { "type" : "247", "max_tlv_more" : "0" }
-type_list["QoS Monitoring Measurement"] = { "type" : "248", "max_tlv_more" : "0" }
-type_list["MT-EDT Control Information"] = { "type" : "249", "max_tlv_more" : "0" }
-type_list["DL Data Packets Size"] = { "type" : "250", "max_tlv_more" : "0" }
-type_list["QER Control Indications"] = { "type" : "251", "max_tlv_more" : "0" }
-type_list["Packet Rate Status Report"] = { "type" : "252", "max_tlv_more" : "0" }
-type_list["NF Instance ID"] = { "type" : "253", "max_tlv_more" : "0" }
-type_list["Ethernet Context Information"] = { "type" : "254", "max_tlv_more" : "0" }
-type_list["Redundant Transmission Parameters"] = { "type" : "255", "max_tlv_more" : "0" }
-type_list["Updated PDR"] = { "type" : "256", "max_tlv_more" : "0" }
-type_list["S-NSSAI"] = { "type" : "257", "max_tlv_more" : "0" }
-type_list["IP version"] = { "type" : "258", "max_tlv_more" : "0" }
-type_list["PFCPASReq-Flags"] = { "type" : "259", "max_tlv_more" : "0" }
-type_list["Data Status"] = { "type" : "260", "max_tlv_more" : "0" }
-type_list["Provide RDS Configuration Information"] = { "type" : "261", "max_tlv_more" : "0" }
-type_list["RDS Configuration Information"] = { "type" : "262", "max_tlv_more" : "0" }
-type_list["Query Packet Rate Status IE within PFCP Session Modification Request"] = { "type" : "263", "max_tlv_more" : "0" }
-type_list["Packet Rate Status Report IE within PFCP Session Modification Response"] = { "type" : "264", "max_tlv_more" : "0" }
-type_list["MPTCP Applicable Indication"] = { "type" : "265", "max_tlv_more" : "0" }
-type_list["Bridge Management Information Container"] = { "type" : "266", "max_tlv_more" : "0" }
-type_list["UE IP Address Usage Information"] = { "type" : "267", "max_tlv_more" : "0" }
-type_list["Number of UE IP Addresses"] = { "type" : "268", "max_tlv_more" : "0" }
-type_list["Validity Timer"] = { "type" : "269", "max_tlv_more" : "0" }
-type_list["Redundant Transmission Forwarding Parameters"] = { "type" : "270", "max_tlv_more" : "0" }
-type_list["Transport Delay Reporting"] = { "type" : "271", "max_tlv_more" : "0" }
-type_list["Partial Failure Information"] = { "type" : "272", "max_tlv_more" : "0" }
-type_list["Spare"] = { "type" : "273", "max_tlv_more" : "0" }
-type_list["Offending IE Information"] = { "type" : "274", "max_tlv_more" : "0" }
-type_list["RAT Type"] = { "type" : "275", "max_tlv_more" : "0" }
-type_list["L2TP Tunnel Information"] = { "type" : "276", "max_tlv_more" : "0" }
-type_list["L2TP Session Information"] = { "type" : "277", "max_tlv_more" : "0" }
-type_list["L2TP User Authentication IE"] = { "type" : "278", "max_tlv_more" : "0" }
-type_list["Created L2TP Session"] = { "type" : "279", "max_tlv_more" : "0" }
-type_list["LNS Address"] = { "type" : "280", "max_tlv_more" : "0" }
-type_list["Tunnel Preference"] = { "type" : "281", "max_tlv_more" : "0" }
-type_list["Calling Number"] = { "type" : "282", "max_tlv_more" : "0" }
-type_list["Called Number"] = { "type" : "283", "max_tlv_more" : "0" }
-type_list["L2TP Session Indications"] = { "type" : "284", "max_tlv_more" : "0" }
-type_list["DNS Server Address"] = { "type" : "285", "max_tlv_more" : "0" }
-type_list["NBNS Server Address"] = { "type" : "286", "max_tlv_more" : "0" }
-type_list["Maximum Receive Unit"] = { "type" : "287", "max_tlv_more" : "0" }
-type_list["Thresholds"] = { "type" : "288", "max_tlv_more" : "0" }
-type_list["Steering Mode Indicator"] = { "type" : "289", "max_tlv_more" : "0" }
-type_list["PFCP Session Change Info"] = { "type" : "290", "max_tlv_more" : "0" }
-type_list["Group ID"] = { "type" : "291", "max_tlv_more" : "0" }
-type_list["CP IP Address"] = { "type" : "292", "max_tlv_more" : "0" }
-type_list["IP Address and Port number Replacement"] = { "type" : "293", "max_tlv_more" : "0" }
-type_list["DNS Query Filter"] = { "type" : "294", "max_tlv_more" : "0" }
-type_list["Direct Reporting Information"] = { "type" : "295", "max_tlv_more" : "0" }
-type_list["Event Notification URI"] = { "type" : "296", "max_tlv_more" : "0" }
-type_list["Notification Correlation ID"] = { "type" : "297", "max_tlv_more" : "0" }
-type_list["Reporting Flags"] = { "type" : "298", "max_tlv_more" : "0" }
-type_list["Predefined Rules Name"] = { "type" : "299", "max_tlv_more" : "0" }
-type_list["MBS Session N4mb Control Information"] = { "type" : "300", "max_tlv_more" : "0" }
-type_list["MBS Multicast Parameters"] = { "type" : "301", "max_tlv_more" : "0" }
-type_list["Add MBS Unicast Parameters"] = { "type" : "302", "max_tlv_more" : "0" }
-type_list["MBS Session N4mb Information"] = { "type" : "303", "max_tlv_more" : "0" }
-type_list["Remove MBS Unicast Parameters"] = { "type" : "304", "max_tlv_more" : "0" }
-type_list["MBS Session Identifier"] = { "type" : "305", "max_tlv_more" : "0" }
-type_list["Multicast Transport Information"] = { "type" : "306", "max_tlv_more" : "0" }
-type_list["MBSN4mbReq-Flags"] = { "type" : "307", "max_tlv_more" : "0" }
-type_list["Local Ingress Tunnel"] = { "type" : "308", "max_tlv_more" : "0" }
-type_list["MBS Unicast Parameters ID"] = { "type" : "309", "max_tlv_more" : "0" }
-type_list["MBS Session N4 Control Information"] = { "type" : "310", "max_tlv_more" : "0" }
-type_list["MBS Session N4 Information"] = { "type" : "311", "max_tlv_more" : "0" }
-type_list["MBSN4Resp-Flags"] = { "type" : "312", "max_tlv_more" : "0" }
-type_list["Tunnel Password"] = { "type" : "313", "max_tlv_more" : "0" }
-type_list["Area Session ID"] = { "type" : "314", "max_tlv_more" : "0" }
-type_list["Peer UP Restart Report"] = { "type" : "315", "max_tlv_more" : "0" }
-type_list["DSCP to PPI Control Information"] = { "type" : "316", "max_tlv_more" : "0" }
-type_list["DSCP to PPI Mapping Information"] = { "type" : "317", "max_tlv_more" : "0" }
-type_list["PFCPSDRsp-Flags"] = { "type" : "318", "max_tlv_more" : "0" }
-type_list["QER Indications"] = { "type" : "319", "max_tlv_more" : "0" }
-type_list["Vendor-Specific Node Report Type"] = { "type" : "320", "max_tlv_more" : "0" }
-type_list["Configured Time Domain"] = { "type" : "321", "max_tlv_more" : "0" }
@@ -15,11 +15,14 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from docx import Document
 import re, os, sys, string
-import datetime
 import getopt
-import getpass
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+    '..', '..', 'core', 'support'))
+from ogsgen import SpecIndex, Cache, Output, source_sha256, stamp, \
+    write_desc_index, write_size_report, write_bench_prologue, \
+    write_bench_tlv, write_bench_main, Corpus, VARIANTS, tlv_octets, memoize, Profile
 
 version = "0.1.0"
 
@@ -31,6 +34,16 @@ verbosity = 0
 filename = ""
 outdir = './'
 cachedir = './cache/'
+cache_ro = []
+reproducible = False
+depfile = None
+jobs = 1
+hot = "1,2,50,51,52,53,56,57"
+sizes = None
+bench = None
+corpus = None
+profiling = False
+pstats = None
 
 FAIL = '\033[91m'
 INFO = '\033[93m'
@@ -52,7 +65,6 @@ def write_file(f, string):
     d_print(string)
 
 def output_header_to_file(f):
-    now = datetime.datetime.now()
     f.write("""/*
  * Copyright (C) 2019-2023 by Sukchan Lee <acetcom@gmail.com>
  *
@@ -76,7 +88,7 @@ def output_header_to_file(f):
     f.write("/*******************************************************************************\n")
     f.write(" * This file had been created by pfcp-tlv.py script v%s\n" % (version))
     f.write(" * Please do not modify this file but regenerate it via script.\n")
-    f.write(" * Created on: %s by %s\n * from %s\n" % (str(now), getpass.getuser(), filename))
+    f.write(stamp(filename, reproducible))
     f.write(" ******************************************************************************/\n\n")
 
 def usage():
@@ -87,22 +99,34 @@ def usage():
     print("-f [file] Input file to parse")
     print("-o [dir]  Output files to given directory")
     print("-c [dir]  Cache files to given directory")
+    print("-C [dir]  Also read cache files from dir, never writing there")
+    print("-r        Reproducible output (no date and user in headers)")
+    print("-M [file] Write the files read to a Makefile depfile")
+    print("-j [num]  Extract message tables with num processes")
+    print("-H [list] Message types with a specialized parser (default: %s)" % (hot))
+    print("-S [file] Write a C program reporting the size of the structures")
+    print("-B [file] Write a C program benchmarking the codec of each message")
+    print("-F [file] Write a seed corpus of the messages for the fuzzers (.zip)")
+    print("-t        Report the time and peak memory of each phase")
+    print("-T [file] Write a cProfile of the run to file (pstats)")
     print("-h        Print this help and return")
 
+@memoize
 def v_upper(v):
     return re.sub('5GS', 'FiveGS', re.sub('3GPP', '', re.sub('\'', '_', re.sub('/', '_', re.sub('-', '_', re.sub(' ', '_', v)))).upper()))
 
+@memoize
 def v_lower(v):
     return re.sub('5gs', 'fivegs', re.sub('3gpp', '', re.sub('\'', '_', re.sub('/', '_', re.sub('-', '_', re.sub(' ', '_', v)))).lower()))
 
 def get_cells(cells):
-    note = cells[0].text
+    note = cells[0]
     if note.find('NOTE') != -1:
         return None
-    comment = cells[2].text.encode('ascii', 'ignore').decode('utf-8')
+    comment = cells[2].encode('ascii', 'ignore').decode('utf-8')
     comment = re.sub('\n|\"|\'|\\\\', '', comment);
     #print(comment)
-    ie_type = re.sub('\s*$', '', re.sub('\'\s*\n*\s*\(NOTE.*\)*', '', cells[-1].text))
+    ie_type = re.sub('\s*$', '', re.sub('\'\s*\n*\s*\(NOTE.*\)*', '', cells[-1]))
 
     #if ie_type.find('Usage Report') != -1:
     if ie_type == 'Usage Report':
@@ -171,9 +195,9 @@ def get_cells(cells):
         ie_type = 'Query Packet Rate Status IE within PFCP Session Modification Request'
     if ie_type not in type_list.keys():
         assert False, "Unknown IE type : [" \
-                + cells[-1].text + "]" + "(" + ie_type + ")"
-    presence = cells[1].text
-    ie_value = re.sub('\s*\n*\s*\([^\)]*\)*', '', cells[0].text)
+                + cells[-1] + "]" + "(" + ie_type + ")"
+    presence = cells[1]
+    ie_value = re.sub('\s*\n*\s*\([^\)]*\)*', '', cells[0])
     ie_value = re.sub('\n', '', ie_value)
     if ie_value[len(ie_value)-1] == ' ':
         ie_value = ie_value[:len(ie_value)-1]
@@ -201,21 +225,168 @@ def get_cells(cells):
     if ie_type == 'URR ID' and comment.find('Several IEs within the same IE type may be present') != -1:
         tlv_more = "7"
 
-    if int(tlv_more) > int(type_list[ie_type]["max_tlv_more"]):
-        type_list[ie_type]["max_tlv_more"] = tlv_more
-        write_file(f, "type_list[\"" + ie_type + "\"][\"max_tlv_more\"] = \"" + tlv_more + "\"\n")
-
     return { "ie_type" : ie_type, "ie_value" : ie_value, "presence" : presence, "tlv_more" : tlv_more, "comment" : comment }
 
-def write_cells_to_file(name, cells):
-    write_file(f, name + ".append({ \"ie_type\" : \"" + cells["ie_type"] + \
-        "\", \"ie_value\" : \"" + cells["ie_value"] + \
-        "\", \"presence\" : \"" + cells["presence"] + \
-        "\", \"tlv_more\" : \"" + cells["tlv_more"] + \
-        "\", \"comment\" : \"" + cells["comment"] + "\"})\n")
+def update_max_tlv_more(ies):
+    for ie in ies:
+        if int(ie["tlv_more"]) > int(type_list[ie["ie_type"]]["max_tlv_more"]):
+            type_list[ie["ie_type"]]["max_tlv_more"] = ie["tlv_more"]
+
+def extract_msg_list():
+    msg_list = {}
+    tables = []
+
+    i, msg_table = spec.find_table('Message Type value')
+    tables.append({ "index" : i })
+    d_print("Table Index = %d\n" % i)
+
+    for row in msg_table[2:-3]:
+        key = row[1]
+        type = row[0]
+        if type.isdigit() is False:
+            continue
+        if key.find('Reserved') != -1:
+            continue
+        key = re.sub('\s*\n*\s*\([^\)]*\)*', '', key)
+        key = re.sub('\n', '', key)
+        msg_list[key] = { "type": type }
+
+    return msg_list, tables
+
+def extract_type_list():
+    type_list = {}
+    tables = []
+
+    i, ie_table = spec.find_table('IE Type value')
+    tables.append({ "index" : i })
+    d_print("Table Index = %d\n" % i)
+
+    for row in ie_table[1:]:
+        key = row[1]
+        type = row[0]
+        if type.isdigit() is False:
+            continue
+        if key.find('Reserved') != -1:
+            continue
+        key = re.sub('\(', '', key)
+        key = re.sub('\)', '', key)
+        key = re.sub('\s*$', '', key)
+
+        type_list[key] = { "type": type , "max_tlv_more" : "0" }
+
+    return type_list, tables
+
+def extract_group_list():
+    group_list = {}
+    tables = []
+
+    for i, table in enumerate(spec.tables):
+        header = spec.header(i)
+        if header is None:
+            continue
+        if header[0].find('Octet') != -1 and \
+           header[1].find('Outer Header to be created') == -1:
+
+            num = 0;
+            if len(header) > 2 and header[2].find('IE Type') != -1:
+                num = 2
+            elif len(header) > 3 and header[3].find('IE Type') != -1:
+                num = 3
+            elif len(header) > 4 and header[4].find('IE Type') != -1:
+                num = 4
+
+            if num == 0:
+                continue;
+
+            d_print("Table Index = %d[%d:%s]\n" % (i, num, header[num]))
+
+            if len(re.findall('\d+', header[num])) == 0:
+                continue;
+            ie_type = re.findall('\d+', header[num])[-1]
+            ie_name = re.sub('\s*IE Type.*', '', header[num])
+
+            d_print("TYPE:%s NAME:%s\n" % (ie_type, ie_name))
+
+            # SKIP Access Forwarding Action Information
+            if (int(ie_type) == 78):
+                ie_name =  "Usage Report Session Modification Response"
+            elif (int(ie_type) == 79):
+                ie_name =  "Usage Report Session Deletion Response"
+            elif (int(ie_type) == 80):
+                ie_name =  "Usage Report Session Report Request"
+            elif (int(ie_type) == 86):
+                ie_name =  "Update BAR Session Modification Request"
+            elif (int(ie_type) == 12):
+                ie_name =  "Update BAR PFCP Session Report Response"
+            elif (int(ie_type) == 183):
+                ie_name =  "PFCP Session Retention Information within PFCP Association Setup Request"
+            elif (int(ie_type) == 188):
+                ie_name =  "IP Multicast Addressing Info within PFCP Session Establishment Request"
+            elif (int(ie_type) == 189):
+                ie_name =  "Join IP Multicast Information IE within Usage Report"
+            elif (int(ie_type) == 190):
+                ie_name =  "Leave IP Multicast Information IE within Usage Report"
+            elif (int(ie_type) == 199):
+                ie_name =  "TSC Management Information IE within PFCP Session Modification Request"
+            elif (int(ie_type) == 200):
+                ie_name =  "TSC Management Information IE within PFCP Session Modification Response"
+            elif (int(ie_type) == 201):
+                ie_name =  "TSC Management Information IE within PFCP Session Report Request"
+            elif (int(ie_type) == 239):
+                ie_name =  "GTP-U Path QoS Report PFCP Node Report Request"
+            elif (int(ie_type) == 240):
+                ie_name =  "QoS Information in GTP-U Path QoS Report"
+            elif (int(ie_type) == 255):
+                ie_name =  "Redundant Transmission Parameters"
+            elif (int(ie_type) == 263):
+                ie_name =  "Query Packet Rate Status IE within PFCP Session Modification Request"
+            elif (int(ie_type) == 264):
+                ie_name =  "Packet Rate Status Report IE within PFCP Session Modification Response"
+
+            if ie_name.find('Non-3GPP Access Forwarding Action Information') != -1:
+                ie_idx = str(int(ie_type)+100)
+                group_list[ie_name] = { "index" : ie_idx, "type" : ie_type, "ies" : ies }
+                continue
+
+            if ie_name not in group_list.keys():
+                tables.append({ "index" : i, "heading" : header[num] })
+                ies = []
+                for row in table[4:]:
+                    cells = get_cells(row)
+                    if cells is None:
+                        continue
+
+                    ies.append(cells)
+
+                ie_idx = str(int(ie_type)+100)
+                group_list[ie_name] = { "index" : ie_idx, "type" : ie_type, "ies" : ies }
+
+    return group_list, tables
+
+def extract_msg_ies(key, table):
+    tables = [{ "index" : table }]
+    table = spec.table(table)
+#    if key.find('Association') != -1:
+#        start_i = 1
+#    elif key.find('Heartbeat') != -1:
+#        start_i = 1
+#    else:
+#        start_i = 2
+    start_i = 2
+
+    ies = []
+    if key != "PFCP Session Deletion Request" and key != "PFCP Version Not Supported Response":
+        for row in table[start_i:]:
+            cells = get_cells(row)
+            if cells is None:
+                continue
+
+            ies.append(cells)
+
+    return ies, tables
 
 try:
-    opts, args = getopt.getopt(sys.argv[1:], "df:ho:c:", ["debug", "file", "help", "output", "cache"])
+    opts, args = getopt.getopt(sys.argv[1:], "df:hro:c:C:j:M:H:S:B:F:tT:", ["debug", "file=", "help", "output=", "cache=", "readonly-cache=", "jobs=", "reproducible", "depfile=", "hot=", "sizes=", "bench=", "corpus=", "profile", "pstats="])
 except getopt.GetoptError as err:
     # print help information and exit:
     usage()
@@ -234,6 +405,26 @@ for o, a in opts:
         cachedir = a
         if cachedir.rfind('/') != len(cachedir):
             cachedir += '/'
+    if o in ("-C", "--readonly-cache"):
+        cache_ro.append(a)
+    if o in ("-j", "--jobs"):
+        jobs = int(a)
+    if o in ("-r", "--reproducible"):
+        reproducible = True
+    if o in ("-M", "--depfile"):
+        depfile = a
+    if o in ("-H", "--hot"):
+        hot = a
+    if o in ("-S", "--sizes"):
+        sizes = a
+    if o in ("-B", "--bench"):
+        bench = a
+    if o in ("-F", "--corpus"):
+        corpus = a
+    if o in ("-t", "--profile"):
+        profiling = True
+    if o in ("-T", "--pstats"):
+        pstats = a
     if o in ("-h", "--help"):
         usage()
         sys.exit(2)
@@ -243,172 +434,29 @@ if os.path.isfile(filename) and os.access(filename, os.R_OK):
 else:
     d_error("Cannot find file : " + filename)
 
-d_info("[Message List]")
-cachefile = cachedir + 'tlv-msg-list.py'
-if os.path.isfile(cachefile) and os.access(cachefile, os.R_OK):
-    exec(open(cachefile).read())
-    print("Read from " + cachefile)
-else:
-    document = Document(filename)
-    f = open(cachefile, 'w')
-
-    msg_table = ""
-    for i, table in enumerate(document.tables):
-        try:
-            cell = table.rows[0].cells[0]
-        except:
-            continue;
-        else:
-            if cell.text.find('Message Type value') != -1:
-                msg_table = table
-                d_print("Table Index = %d\n" % i)
+spec = SpecIndex(filename)
 
-    for row in msg_table.rows[2:-3]:
-        key = row.cells[1].text
-        type = row.cells[0].text
-        if type.isdigit() is False:
-            continue
-        if key.find('Reserved') != -1:
-            continue
-        key = re.sub('\s*\n*\s*\([^\)]*\)*', '', key)
-        key = re.sub('\n', '', key)
-        msg_list[key] = { "type": type }
-        write_file(f, "msg_list[\"" + key + "\"] = { \"type\" : \"" + type + "\" }\n")
-    f.close()
+cache = Cache(cachedir, filename, "pfcp-tlv.py v%s" % version,
+        source_sha256(get_cells, extract_msg_list, extract_type_list,
+            extract_group_list, extract_msg_ies),
+        readonly=cache_ro)
 
-d_info("[IE Type List]")
-cachefile = cachedir + 'tlv-type-list.py'
-if os.path.isfile(cachefile) and os.access(cachefile, os.R_OK):
-    exec(open(cachefile).read())
-    print("Read from " + cachefile)
-else:
-    document = Document(filename)
-    f = open(cachefile, 'w')
-
-    ie_table = ""
-    for i, table in enumerate(document.tables):
-        try:
-            cell = table.rows[0].cells[0]
-        except:
-            pass
-        else:
-            if cell.text.find('IE Type value') != -1:
-                ie_table = table
-                d_print("Table Index = %d\n" % i)
+profile = Profile(profiling, pstats)
+spec.load = profile.wrap('docx', spec.load)
+cache.load = profile.wrap('cache', cache.load)
+cache.store = profile.wrap('cache', cache.store)
+get_cells = profile.wrap('get_cells', get_cells)
 
-    for row in ie_table.rows[1:]:
-        key = row.cells[1].text
-        type = row.cells[0].text
-        if type.isdigit() is False:
-            continue
-        if key.find('Reserved') != -1:
-            continue
-        key = re.sub('\(', '', key)
-        key = re.sub('\)', '', key)
-        key = re.sub('\s*$', '', key)
+d_info("[Message List]")
+msg_list.update(cache.fetch('tlv-msg-list', extract_msg_list))
 
-        type_list[key] = { "type": type , "max_tlv_more" : "0" }
-        write_file(f, "type_list[\"" + key + "\"] = { \"type\" : \"" + type)
-        write_file(f, "\", \"max_tlv_more\" : \"0\" }\n")
-    f.close()
+d_info("[IE Type List]")
+type_list.update(cache.fetch('tlv-type-list', extract_type_list))
 
 d_info("[Group IE List]")
-cachefile = cachedir + 'tlv-group-list.py'
-if os.path.isfile(cachefile) and os.access(cachefile, os.R_OK):
-    exec(open(cachefile).read())
-    print("Read from " + cachefile)
-else:
-    document = Document(filename)
-    f = open(cachefile, 'w')
-
-    for i, table in enumerate(document.tables):
-        try:
-            cell = table.rows[0].cells[0]
-        except:
-            pass
-        else:
-            if cell.text.find('Octet') != -1 and \
-               table.rows[0].cells[1].text.find('Outer Header to be created') == -1:
-
-                num = 0;
-                if len(table.rows[0].cells) > 2 and table.rows[0].cells[2].text.find('IE Type') != -1:
-                    num = 2
-                elif len(table.rows[0].cells) > 3 and table.rows[0].cells[3].text.find('IE Type') != -1:
-                    num = 3
-                elif len(table.rows[0].cells) > 4 and table.rows[0].cells[4].text.find('IE Type') != -1:
-                    num = 4
-
-                if num == 0:
-                    continue;
-
-                row = table.rows[0];
-
-                d_print("Table Index = %d[%d:%s]\n" % (i, num, row.cells[num].text))
-
-                if len(re.findall('\d+', row.cells[num].text)) == 0:
-                    continue;
-                ie_type = re.findall('\d+', row.cells[num].text)[-1]
-                ie_name = re.sub('\s*IE Type.*', '', row.cells[num].text)
-
-                d_print("TYPE:%s NAME:%s\n" % (ie_type, ie_name))
-
-                # SKIP Access Forwarding Action Information
-                if (int(ie_type) == 78):
-                    ie_name =  "Usage Report Session Modification Response"
-                elif (int(ie_type) == 79):
-                    ie_name =  "Usage Report Session Deletion Response"
-                elif (int(ie_type) == 80):
-                    ie_name =  "Usage Report Session Report Request"
-                elif (int(ie_type) == 86):
-                    ie_name =  "Update BAR Session Modification Request"
-                elif (int(ie_type) == 12):
-                    ie_name =  "Update BAR PFCP Session Report Response"
-                elif (int(ie_type) == 183):
-                    ie_name =  "PFCP Session Retention Information within PFCP Association Setup Request"
-                elif (int(ie_type) == 188):
-                    ie_name =  "IP Multicast Addressing Info within PFCP Session Establishment Request"
-                elif (int(ie_type) == 189):
-                    ie_name =  "Join IP Multicast Information IE within Usage Report"
-                elif (int(ie_type) == 190):
-                    ie_name =  "Leave IP Multicast Information IE within Usage Report"
-                elif (int(ie_type) == 199):
-                    ie_name =  "TSC Management Information IE within PFCP Session Modification Request"
-                elif (int(ie_type) == 200):
-                    ie_name =  "TSC Management Information IE within PFCP Session Modification Response"
-                elif (int(ie_type) == 201):
-                    ie_name =  "TSC Management Information IE within PFCP Session Report Request"
-                elif (int(ie_type) == 239):
-                    ie_name =  "GTP-U Path QoS Report PFCP Node Report Request"
-                elif (int(ie_type) == 240):
-                    ie_name =  "QoS Information in GTP-U Path QoS Report"
-                elif (int(ie_type) == 255):
-                    ie_name =  "Redundant Transmission Parameters"
-                elif (int(ie_type) == 263):
-                    ie_name =  "Query Packet Rate Status IE within PFCP Session Modification Request"
-                elif (int(ie_type) == 264):
-                    ie_name =  "Packet Rate Status Report IE within PFCP Session Modification Response"
-
-                if ie_name.find('Non-3GPP Access Forwarding Action Information') != -1:
-                    ie_idx = str(int(ie_type)+100)
-                    group_list[ie_name] = { "index" : ie_idx, "type" : ie_type, "ies" : ies }
-                    write_file(f, "group_list[\"" + ie_name + "\"] = { \"index\" : \"" + ie_idx + "\", \"type\" : \"" + ie_type + "\", \"ies\" : ies }\n")
-                    continue
-
-                if ie_name not in group_list.keys():
-                    ies = []
-                    write_file(f, "ies = []\n")
-                    for row in table.rows[4:]:
-                        cells = get_cells(row.cells)
-                        if cells is None:
-                            continue
-
-                        ies.append(cells)
-                        write_cells_to_file("ies", cells)
-
-                    ie_idx = str(int(ie_type)+100)
-                    group_list[ie_name] = { "index" : ie_idx, "type" : ie_type, "ies" : ies }
-                    write_file(f, "group_list[\"" + ie_name + "\"] = { \"index\" : \"" + ie_idx + "\", \"type\" : \"" + ie_type + "\", \"ies\" : ies }\n")
-    f.close()
+group_list.update(cache.fetch('tlv-group-list', extract_group_list))
+for k, v in group_list.items():
+    update_max_tlv_more(v["ies"])
 
 msg_list["PFCP Heartbeat Request"]["table"] = 9
 msg_list["PFCP Heartbeat Response"]["table"] = 10
@@ -436,47 +484,14 @@ msg_list["PFCP Session Deletion Response"]["table"] = 118
 msg_list["PFCP Session Report Request"]["table"] = 121
 msg_list["PFCP Session Report Response"]["table"] = 133
 
-for key in msg_list.keys():
-    if "table" in msg_list[key].keys():
-        d_info("[" + key + "]")
-        cachefile = cachedir + "tlv-msg-" + msg_list[key]["type"] + ".py"
-        if os.path.isfile(cachefile) and os.access(cachefile, os.R_OK):
-            exec(open(cachefile).read())
-            print("Read from " + cachefile)
-        else:
-            document = Document(filename)
-            f = open(cachefile, 'w')
-
-            table = document.tables[msg_list[key]["table"]]
-#            if key.find('Association') != -1:
-#                start_i = 1
-#            elif key.find('Heartbeat') != -1:
-#                start_i = 1
-#            else:
-#                start_i = 2
-            start_i = 2
-
-            ies = []
-            write_file(f, "ies = []\n")
-            if key != "PFCP Session Deletion Request" and key != "PFCP Version Not Supported Response":
-                for row in table.rows[start_i:]:
-                    cells = get_cells(row.cells)
-                    if cells is None:
-                        continue
-
-                    item = {
-                        "ie_type" : cells["ie_type"],
-                        "ie_value" : cells["ie_value"],
-                        "presence" : cells["presence"],
-                        "tlv_more" : cells["tlv_more"],
-                        "comment" : cells["comment"]
-                        }
-                    ies.append(item)
-                    write_cells_to_file("ies", item)
-
-            msg_list[key]["ies"] = ies
-            write_file(f, "msg_list[key][\"ies\"] = ies\n")
-            f.close()
+msg_keys = [key for key in msg_list.keys() if "table" in msg_list[key].keys()]
+d_info("[Message Tables]")
+msg_ies = cache.fetch_many(
+        [("tlv-msg-" + msg_list[key]["type"], { "key" : key, "table" : msg_list[key]["table"] })
+            for key in msg_keys], extract_msg_ies, jobs, spec.load)
+for key, ies in zip(msg_keys, msg_ies):
+    msg_list[key]["ies"] = ies
+    update_max_tlv_more(ies)
 
 type_list["Cause"]["size"] = 1                              # Type 19
 type_list["Source Interface"]["size"] = 1                   # Type 20
@@ -523,7 +538,10 @@ type_list["Quota Validity Time"]["size"] = 4                # Type 181
 type_list["PFCPSEReq-Flags"]["size"] = 1                    # Type 186
 type_list["Data Status"]["size"] = 1                        # Type 260
 
-f = open(outdir + 'message.h', 'w')
+profile.enter('emit')
+output = Output()
+
+f = output.open(outdir + 'message.h')
 output_header_to_file(f)
 f.write("""#if !defined(OGS_PFCP_INSIDE) && !defined(OGS_PFCP_COMPILATION)
 #error "This header cannot be included directly."
@@ -705,6 +723,66 @@ for (k, v) in sorted_msg_list:
         f.write("} ogs_" + v_lower(k) + "_t;\n")
         f.write("\n")
 
+def direct_builder(k):
+    assert k.startswith("PFCP "), "Unexpected message name = %s" % k
+    return "ogs_pfcp_build_%s_direct" % v_lower(k[5:])
+
+def direct_parser(k):
+    assert k.startswith("PFCP "), "Unexpected message name = %s" % k
+    return "ogs_pfcp_parse_%s_direct" % v_lower(k[5:])
+
+# The ogs_tlv_t nodes ogs_tlv_parse_msg() or ogs_tlv_build_msg() take from
+# the pool when every IE of the structure is present, and the depth of
+# the IEs
+def tlv_nodes(ies_list):
+    count = 0
+    depth = 0
+    for ies in ies_list:
+        n = 1
+        if type_list[ies["ie_type"]]["max_tlv_more"] != "0" and ies["tlv_more"] != "0":
+            n = int(ies["tlv_more"]) + 1
+        if ies["ie_type"] in group_list.keys():
+            (c, d) = tlv_nodes(group_list[ies["ie_type"]]["ies"])
+        else:
+            (c, d) = (0, 0)
+        count += n * (1 + c)
+        depth = max(depth, 1 + d)
+    return (count, depth)
+
+f.write("""/*
+ * The most ogs_tlv_t nodes a message takes from the pool of
+ * ogs_tlv_get() to be parsed or built, and how deep its IEs nest.
+ * The direct parsers and builders take none.
+ */
+""")
+max_tlv = (0, 0)
+for (k, v) in sorted_msg_list:
+    if "ies" in msg_list[k]:
+        (count, depth) = tlv_nodes(msg_list[k]["ies"])
+        f.write("#define OGS_%s_MAX_TLV %d\n" % (v_upper(k), count))
+        f.write("#define OGS_%s_MAX_TLV_DEPTH %d\n" % (v_upper(k), depth))
+        max_tlv = (max(max_tlv[0], count), max(max_tlv[1], depth))
+f.write("#define OGS_PFCP_MAX_TLV %d\n" % max_tlv[0])
+f.write("#define OGS_PFCP_MAX_TLV_DEPTH %d\n" % max_tlv[1])
+f.write("\n")
+
+hot_msg_list = []
+for t in [t for t in hot.split(",") if t.strip()]:
+    found = [(k, v) for (k, v) in sorted_msg_list if int(v) == int(t)]
+    if len(found) == 0:
+        d_error("Unknown message type : " + t)
+    if len(msg_list[found[0][0]].get("ies", [])) != 0:
+        hot_msg_list += found
+hot_msg_list.sort(key=lambda tup: int(tup[1]))
+hot_msgs = [k for (k, v) in hot_msg_list]
+
+# The IEs a message can carry at its top level
+peek_types = set()
+for (k, v) in sorted_msg_list:
+    for ies in msg_list[k].get("ies", []):
+        peek_types.add(ies["ie_type"])
+peek_type_list = [(k, v) for (k, v) in sorted_type_list if k in peek_types]
+
 f.write("typedef struct ogs_pfcp_message_s {\n")
 f.write("   ogs_pfcp_header_t h;\n")
 f.write("   union {\n")
@@ -718,6 +796,50 @@ f.write("""ogs_pfcp_message_t *ogs_pfcp_parse_msg(ogs_pkbuf_t *pkbuf);
 void ogs_pfcp_message_free(ogs_pfcp_message_t *pfcp_message);
 ogs_pkbuf_t *ogs_pfcp_build_msg(ogs_pfcp_message_t *pfcp_message);
 
+/*
+ * Same encoding as ogs_pfcp_build_msg(), written straight into the pkbuf
+ * from the layout of each message instead of through an ogs_tlv_t tree.
+ * The message is left as it is (ogs_pfcp_build_msg() byte-swaps it).
+ */
+ogs_pkbuf_t *ogs_pfcp_build_msg_direct(ogs_pfcp_message_t *pfcp_message);
+""")
+for (k, v) in sorted_msg_list:
+    if "ies" in msg_list[k]:
+        f.write("ogs_pkbuf_t *%s(ogs_%s_t *msg);\n" %
+                (direct_builder(k), v_lower(k)))
+f.write("""
+/*
+ * Single pass parsers for the busiest messages, filling the message in
+ * place without an ogs_tlv_t tree. ogs_pfcp_parse_msg() uses them for
+ * these types and falls back to ogs_tlv_parse_msg() for the others.
+ */
+""")
+for (k, v) in hot_msg_list:
+    f.write("int %s(ogs_%s_t *msg, ogs_pkbuf_t *pkbuf);\n" %
+            (direct_parser(k), v_lower(k)))
+f.write("""
+/*
+ * Look at a message before ogs_pfcp_parse_msg(), e.g. to route or drop it.
+ * ogs_pfcp_peek() checks the header and gets the message type and the SEID
+ * (0 without one). ogs_pfcp_peek_ies() walks the top-level IEs once and
+ * sets the offset in the pkbuf and the length of each requested type,
+ * leaving -1 for the absent ones; an IE requested twice gets its first and
+ * second instances. It returns how many were found. ogs_pfcp_peek_<ie>()
+ * returns the offset of a single IE, or OGS_ERROR if it is absent.
+ */
+typedef struct ogs_pfcp_peek_s {
+    uint16_t type;
+    uint16_t length;
+    int offset;
+} ogs_pfcp_peek_t;
+
+int ogs_pfcp_peek(ogs_pkbuf_t *pkbuf, uint8_t *type, uint64_t *seid);
+int ogs_pfcp_peek_ies(ogs_pkbuf_t *pkbuf, ogs_pfcp_peek_t *ies, int num);
+""")
+for (k, v) in peek_type_list:
+    f.write("int ogs_pfcp_peek_%s(ogs_pkbuf_t *pkbuf, uint16_t *length);\n" %
+            v_lower(k))
+f.write("""
 #ifdef __cplusplus
 }
 #endif
@@ -726,7 +848,7 @@ ogs_pkbuf_t *ogs_pfcp_build_msg(ogs_pfcp_message_t *pfcp_message);
 """)
 f.close()
 
-f = open(outdir + 'message.c', 'w')
+f = output.open(outdir + 'message.c')
 output_header_to_file(f)
 f.write("""#include "ogs-pfcp.h"
 
@@ -758,10 +880,26 @@ for (k, v) in sorted_type_list:
         f.write("    0,\n")
     f.write("    0,\n")
     f.write("    sizeof(ogs_pfcp_tlv_%s_t),\n" % v_lower(k))
-    f.write("    { NULL }\n")
+    f.write("    { NULL },\n")
+    f.write("    NULL,\n")
+    f.write("    NULL\n")
     f.write("};\n\n")
 
+def desc_index_children(struct, base, ies_list):
+    children = []
+    for ies in ies_list:
+        member = "offsetof(%s, %s)" % (struct, v_lower(ies["ie_value"]))
+        children.append((int(type_list[ies["ie_type"]]["type"]),
+            "OGS_PFCP_%s_TYPE" % v_upper(ies["ie_type"]), 0, member + base))
+        if type_list[ies["ie_type"]]["max_tlv_more"] != "0" and ies["tlv_more"] != "0":
+            children.append((0, "0", 0, "%s + sizeof(ogs_pfcp_tlv_%s_t)%s" %
+                (member, v_lower(ies["ie_type"]), base)))
+    return children
+
 for (k, v) in sorted_group_list:
+    index = write_desc_index(f, "ogs_pfcp_tlv_index_%s" % v_lower(k),
+            desc_index_children("ogs_pfcp_tlv_%s_t" % v_lower(k),
+                " - sizeof(ogs_tlv_presence_t)", group_list[k]["ies"]))
     f.write("ogs_tlv_desc_t ogs_pfcp_tlv_desc_%s =\n" % v_lower(k))
     f.write("{\n")
     f.write("    OGS_TLV_COMPOUND,\n")
@@ -776,11 +914,16 @@ for (k, v) in sorted_group_list:
         if type_list[ies["ie_type"]]["max_tlv_more"] != "0" and ies["tlv_more"] != "0":
             f.write("        &ogs_tlv_desc_more" + str(int(ies["tlv_more"])+1) + ",\n")
     f.write("        NULL,\n")
-    f.write("    }\n")
+    f.write("    },\n")
+    f.write("    %s,\n" % index)
+    f.write("    NULL\n")
     f.write("};\n\n")
 
 for (k, v) in sorted_msg_list:
     if "ies" in msg_list[k]:
+        index = write_desc_index(f, "ogs_pfcp_msg_index_%s" % v_lower(k),
+                desc_index_children("ogs_%s_t" % v_lower(k), "",
+                    msg_list[k]["ies"]))
         f.write("ogs_tlv_desc_t ogs_pfcp_msg_desc_%s =\n" % v_lower(k))
         f.write("{\n")
         f.write("    OGS_TLV_MESSAGE,\n")
@@ -791,9 +934,26 @@ for (k, v) in sorted_msg_list:
             if type_list[ies["ie_type"]]["max_tlv_more"] != "0" and ies["tlv_more"] != "0":
                 f.write("        &ogs_tlv_desc_more" + str(int(ies["tlv_more"])+1) + ",\n")
         f.write("    NULL,\n")
-        f.write("}};\n\n")
+        f.write("}, %s, NULL};\n\n" % index)
 f.write("\n")
 
+first = [k for (k, v) in sorted_msg_list if "ies" in msg_list[k]][0]
+f.write("""/* Size of the union member for the message type, 0 if it has none */
+static size_t pfcp_message_size(uint8_t type)
+{
+    switch(type) {
+""")
+for (k, v) in sorted_msg_list:
+    if "ies" in msg_list[k]:
+        f.write("    case OGS_%s_TYPE:\n" % v_upper(k))
+        f.write("        return sizeof(ogs_%s_t);\n" % v_lower(k))
+f.write("""    default:
+        return 0;
+    }
+}
+
+""")
+
 f.write("""ogs_pfcp_message_t *ogs_pfcp_parse_msg(ogs_pkbuf_t *pkbuf)
 {
     int rv = OGS_ERROR;
@@ -808,12 +968,18 @@ f.write("""ogs_pfcp_message_t *ogs_pfcp_parse_msg(ogs_pkbuf_t *pkbuf)
     h = (ogs_pfcp_header_t *)pkbuf->data;
     ogs_assert(h);
 
-    pfcp_message = ogs_calloc(1, sizeof(*pfcp_message));
+    pfcp_message = ogs_malloc(sizeof(*pfcp_message));
     if (!pfcp_message) {
         ogs_error("No memory");
         return NULL;
     }
 
+    /* Clear the header and the message of this type, not the whole union */
+    memset(pfcp_message, 0,
+            offsetof(ogs_pfcp_message_t, %s) +
+            pfcp_message_size(h->type));
+""" % v_lower(first))
+f.write("""
     if (h->seid_presence)
         size = OGS_PFCP_HEADER_LEN;
     else
@@ -841,7 +1007,11 @@ f.write("""ogs_pfcp_message_t *ogs_pfcp_parse_msg(ogs_pkbuf_t *pkbuf)
 for (k, v) in sorted_msg_list:
     if "ies" in msg_list[k]:
         f.write("        case OGS_%s_TYPE:\n" % v_upper(k))
-        if k != "PFCP Session Deletion Request" and k != "PFCP Version Not Supported Response":
+        if k in hot_msgs:
+            f.write("            rv = %s(\n" % direct_parser(k))
+            f.write("                    &pfcp_message->%s, pkbuf);\n" % v_lower(k))
+            f.write("            ogs_expect(rv == OGS_OK);\n")
+        elif k != "PFCP Session Deletion Request" and k != "PFCP Version Not Supported Response":
             f.write("            rv = ogs_tlv_parse_msg(&pfcp_message->%s,\n" % v_lower(k))
             f.write("                    &ogs_pfcp_msg_desc_%s, pkbuf, OGS_TLV_MODE_T2_L2);\n" % v_lower(k))
             f.write("            ogs_expect(rv == OGS_OK);\n")
@@ -890,6 +1060,639 @@ f.write("""        default:
 }
 """)
 
+f.write("""
+static uint8_t *pfcp_put_header(uint8_t *pos, uint16_t type, uint16_t length)
+{
+    *(pos++) = (type >> 8) & 0xFF;
+    *(pos++) = type & 0xFF;
+    *(pos++) = (length >> 8) & 0xFF;
+    *(pos++) = length & 0xFF;
+
+    return pos;
+}
+
+static uint8_t *pfcp_put_uint8(uint8_t *pos, uint16_t type, ogs_tlv_uint8_t *v)
+{
+    pos = pfcp_put_header(pos, type, 1);
+    *(pos++) = v->u8;
+
+    return pos;
+}
+
+static uint8_t *pfcp_put_uint16(
+        uint8_t *pos, uint16_t type, ogs_tlv_uint16_t *v)
+{
+    pos = pfcp_put_header(pos, type, 2);
+    *(pos++) = (v->u16 >> 8) & 0xFF;
+    *(pos++) = v->u16 & 0xFF;
+
+    return pos;
+}
+
+static uint8_t *pfcp_put_uint24(
+        uint8_t *pos, uint16_t type, ogs_tlv_uint24_t *v)
+{
+    pos = pfcp_put_header(pos, type, 3);
+    *(pos++) = (v->u24 >> 16) & 0xFF;
+    *(pos++) = (v->u24 >> 8) & 0xFF;
+    *(pos++) = v->u24 & 0xFF;
+
+    return pos;
+}
+
+static uint8_t *pfcp_put_uint32(
+        uint8_t *pos, uint16_t type, ogs_tlv_uint32_t *v)
+{
+    pos = pfcp_put_header(pos, type, 4);
+    *(pos++) = (v->u32 >> 24) & 0xFF;
+    *(pos++) = (v->u32 >> 16) & 0xFF;
+    *(pos++) = (v->u32 >> 8) & 0xFF;
+    *(pos++) = v->u32 & 0xFF;
+
+    return pos;
+}
+
+static int pfcp_length_octet(ogs_tlv_octet_t *v, ogs_tlv_desc_t *desc)
+{
+    if (v->len == 0) {
+        ogs_error("No TLV length - [%s] T:%d I:%d (vsz=%d)",
+                desc->name, desc->type, desc->instance, desc->vsize);
+        return OGS_ERROR;
+    }
+
+    return 4 + v->len;
+}
+
+static uint8_t *pfcp_put_octet(uint8_t *pos, uint16_t type, ogs_tlv_octet_t *v)
+{
+    pos = pfcp_put_header(pos, type, v->len);
+    memcpy(pos, v->data, v->len);
+
+    return pos + v->len;
+}
+
+""")
+
+# Code of the direct builders for the IEs of a group or a message. Every
+# length function fails on what ogs_tlv_build_msg() would reject (an
+# empty octet string, a group with no IE), so that nothing can go wrong
+# once the pkbuf is allocated.
+def direct_ies(ies_list, indent, what):
+    code = ""
+    for ies in ies_list:
+        ie_type = ies["ie_type"]
+        member = "v->" + v_lower(ies["ie_value"])
+        more = type_list[ie_type]["max_tlv_more"] != "0" and ies["tlv_more"] != "0"
+        if more:
+            code += indent + "for (i = 0; i < %d && %s[i].presence; i++) {\n" % \
+                    (int(ies["tlv_more"]) + 1, member)
+            member += "[i]"
+        else:
+            code += indent + "if (%s.presence) {\n" % member
+        code += what(ie_type, member, indent + "    ")
+        code += indent + "}\n"
+    return code
+
+def direct_length(ie_type, member, indent, error="OGS_ERROR"):
+    if ie_type in group_list.keys():
+        return indent + "r = pfcp_length_%s(&%s);\n" % (v_lower(ie_type), member) + \
+               indent + "if (r < 0)\n" + \
+               indent + "    return %s;\n" % error + \
+               indent + "length += r;\n"
+    if "size" in type_list[ie_type]:
+        return indent + "length += %d;\n" % (4 + type_list[ie_type]["size"])
+    return indent + "r = pfcp_length_octet(&%s, &ogs_pfcp_tlv_desc_%s);\n" % \
+                (member, v_lower(ie_type)) + \
+           indent + "if (r < 0)\n" + \
+           indent + "    return %s;\n" % error + \
+           indent + "length += r;\n"
+
+def direct_put(ie_type, member, indent):
+    if ie_type in group_list.keys():
+        return indent + "pos = pfcp_put_%s(pos, &%s);\n" % (v_lower(ie_type), member)
+    if "size" in type_list[ie_type]:
+        put = "pfcp_put_uint%d" % (type_list[ie_type]["size"] * 8)
+    else:
+        put = "pfcp_put_octet"
+    return indent + "pos = %s(pos, OGS_PFCP_%s_TYPE, &%s);\n" % \
+            (put, v_upper(ie_type), member)
+
+def direct_locals(ies_list, length):
+    names = []
+    if any(type_list[ies["ie_type"]]["max_tlv_more"] != "0" and ies["tlv_more"] != "0"
+            for ies in ies_list):
+        names.append("i")
+    if length:
+        names.append("length = 0")
+        if any(ies["ie_type"] in group_list.keys() or not "size" in type_list[ies["ie_type"]]
+                for ies in ies_list):
+            names.append("r")
+    if len(names) == 0:
+        return ""
+    return "    int %s;\n\n" % ", ".join(names)
+
+# Only the groups some message can carry
+direct_groups = set()
+def direct_add_groups(ies_list):
+    for ies in ies_list:
+        if ies["ie_type"] in group_list.keys() and \
+                ies["ie_type"] not in direct_groups:
+            direct_groups.add(ies["ie_type"])
+            direct_add_groups(group_list[ies["ie_type"]]["ies"])
+for (k, v) in sorted_msg_list:
+    if "ies" in msg_list[k]:
+        direct_add_groups(msg_list[k]["ies"])
+sorted_direct_group_list = [(k, v) for (k, v) in sorted_group_list if k in direct_groups]
+
+for (k, v) in sorted_direct_group_list:
+    f.write("static int pfcp_length_%s(ogs_pfcp_tlv_%s_t *v);\n" % (v_lower(k), v_lower(k)))
+    f.write("static uint8_t *pfcp_put_%s(uint8_t *pos, ogs_pfcp_tlv_%s_t *v);\n" % (v_lower(k), v_lower(k)))
+f.write("\n")
+
+for (k, v) in sorted_direct_group_list:
+    ies_list = group_list[k]["ies"]
+    f.write("static int pfcp_length_%s(ogs_pfcp_tlv_%s_t *v)\n" % (v_lower(k), v_lower(k)))
+    f.write("{\n")
+    f.write(direct_locals(ies_list, True))
+    f.write(direct_ies(ies_list, "    ", direct_length))
+    f.write("\n")
+    f.write("    if (length == 0) {\n")
+    f.write("        ogs_error(\"No IE in [%s]\");\n" % k)
+    f.write("        return OGS_ERROR;\n")
+    f.write("    }\n")
+    f.write("\n")
+    f.write("    return 4 + length;\n")
+    f.write("}\n\n")
+
+    f.write("static uint8_t *pfcp_put_%s(uint8_t *pos, ogs_pfcp_tlv_%s_t *v)\n" % (v_lower(k), v_lower(k)))
+    f.write("{\n")
+    f.write("    uint8_t *header = pos;\n")
+    f.write(direct_locals(ies_list, False) or "\n")
+    f.write("    pos += 4;\n")
+    f.write(direct_ies(ies_list, "    ", direct_put))
+    f.write("    pfcp_put_header(header, OGS_PFCP_%s_TYPE, pos - header - 4);\n" % v_upper(k))
+    f.write("\n")
+    f.write("    return pos;\n")
+    f.write("}\n\n")
+
+for (k, v) in sorted_msg_list:
+    if "ies" in msg_list[k]:
+        ies_list = msg_list[k]["ies"]
+        f.write("ogs_pkbuf_t *%s(ogs_%s_t *v)\n" % (direct_builder(k), v_lower(k)))
+        f.write("{\n")
+        f.write("    ogs_pkbuf_t *pkbuf = NULL;\n")
+        f.write("    uint8_t *pos = NULL;\n")
+        f.write(direct_locals(ies_list, True) or "\n")
+        f.write("    ogs_assert(v);\n")
+        f.write("\n")
+        f.write(direct_ies(ies_list, "    ",
+            lambda ie_type, member, indent:
+                direct_length(ie_type, member, indent, "NULL")))
+        if len(ies_list):
+            f.write("\n")
+            f.write("    if (length == 0) {\n")
+            f.write("        ogs_error(\"No IE in [%s]\");\n" % k)
+            f.write("        return NULL;\n")
+            f.write("    }\n")
+            f.write("\n")
+        f.write("    pkbuf = ogs_pkbuf_alloc(NULL, OGS_TLV_MAX_HEADROOM+length);\n")
+        f.write("    if (!pkbuf) {\n")
+        f.write("        ogs_error(\"ogs_pkbuf_alloc() failed\");\n")
+        f.write("        return NULL;\n")
+        f.write("    }\n")
+        f.write("    ogs_pkbuf_reserve(pkbuf, OGS_TLV_MAX_HEADROOM);\n")
+        f.write("    pos = ogs_pkbuf_put(pkbuf, length);\n")
+        f.write("\n")
+        f.write(direct_ies(ies_list, "    ", direct_put))
+        f.write("    ogs_assert(pos == pkbuf->tail);\n")
+        f.write("\n")
+        f.write("    return pkbuf;\n")
+        f.write("}\n\n")
+
+f.write("""ogs_pkbuf_t *ogs_pfcp_build_msg_direct(ogs_pfcp_message_t *pfcp_message)
+{
+    ogs_pkbuf_t *pkbuf = NULL;
+
+    ogs_assert(pfcp_message);
+    switch(pfcp_message->h.type)
+    {
+""")
+for (k, v) in sorted_msg_list:
+    if "ies" in msg_list[k]:
+        f.write("        case OGS_%s_TYPE:\n" % v_upper(k))
+        f.write("            pkbuf = %s(\n" % direct_builder(k))
+        f.write("                    &pfcp_message->%s);\n" % v_lower(k))
+        f.write("            break;\n")
+f.write("""        default:
+            ogs_warn("Not implemented(type:%d)", pfcp_message->h.type);
+            break;
+    }
+
+    return pkbuf;
+}
+""")
+
+f.write("""
+static uint8_t *pfcp_get_element(
+        uint8_t *pos, uint8_t *end, uint16_t *type, uint16_t *length)
+{
+    if (end - pos < 4)
+        return NULL;
+
+    *type = (pos[0] << 8) | pos[1];
+    *length = (pos[2] << 8) | pos[3];
+    if (end - pos - 4 < *length)
+        return NULL;
+
+    return pos + 4;
+}
+
+/*
+ * The integer parsers follow tlv_parse_leaf(): a value shorter than
+ * the integer is accepted and the missing octets are read past it.
+ */
+static int pfcp_parse_uint8(ogs_tlv_uint8_t *v, uint8_t *value, uint16_t length)
+{
+    if (length != 1) {
+        ogs_error("Invalid TLV length %d. It should be 1", length);
+        return OGS_ERROR;
+    }
+    v->u8 = value[0];
+    v->presence = 1;
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_uint16(
+        ogs_tlv_uint16_t *v, uint8_t *value, uint16_t length)
+{
+    if (length < 1 || length > 2) {
+        ogs_error("Invalid TLV length %d.", length);
+        return OGS_ERROR;
+    }
+    v->u16 = (value[0] << 8) | value[1];
+    v->presence = 1;
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_uint24(
+        ogs_tlv_uint24_t *v, uint8_t *value, uint16_t length)
+{
+    if (length < 1 || length > 3) {
+        ogs_error("Invalid TLV length %d.", length);
+        return OGS_ERROR;
+    }
+    v->u24 = (value[0] << 16) | (value[1] << 8) | value[2];
+    v->presence = 1;
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_uint32(
+        ogs_tlv_uint32_t *v, uint8_t *value, uint16_t length)
+{
+    if (length < 1 || length > 4) {
+        ogs_error("Invalid TLV length %d.", length);
+        return OGS_ERROR;
+    }
+    v->u32 = ((uint32_t)value[0] << 24) | (value[1] << 16) |
+        (value[2] << 8) | value[3];
+    v->presence = 1;
+
+    return OGS_OK;
+}
+
+static int pfcp_parse_octet(ogs_tlv_octet_t *v, uint8_t *value, uint16_t length)
+{
+    v->data = value;
+    v->len = length;
+    v->presence = 1;
+
+    return OGS_OK;
+}
+
+""")
+
+# Code of the parser for one IE into the given member
+def parse_member(ie_type, member, indent):
+    if ie_type in group_list.keys():
+        return indent + "if (pfcp_parse_%s(&%s, value, length) != OGS_OK) {\n" % \
+                    (v_lower(ie_type), member) + \
+               indent + "    ogs_error(\"Can't parse compound TLV\");\n" + \
+               indent + "    return OGS_ERROR;\n" + \
+               indent + "}\n" + \
+               indent + "%s.presence = 1;\n" % member
+    if "size" in type_list[ie_type]:
+        parse = "pfcp_parse_uint%d" % (type_list[ie_type]["size"] * 8)
+    else:
+        parse = "pfcp_parse_octet"
+    return indent + "if (%s(&%s, value, length) != OGS_OK)\n" % (parse, member) + \
+           indent + "    return OGS_ERROR;\n"
+
+# The body of a parser for the IEs of a group or a message. As with the
+# position counting of tlv_parse_compound(), the n-th IE of a type goes
+# to the n-th member of that type, and once a member with more than one
+# instance is reached, all the following IEs go to its first free one.
+def parse_ies(name, ies_list):
+    cases = []
+    for ies in ies_list:
+        t = int(type_list[ies["ie_type"]]["type"])
+        for case in cases:
+            if case[0] == t:
+                case[2].append(ies)
+                break
+        else:
+            cases.append((t, ies["ie_type"], [ies]))
+    more = any(type_list[ies["ie_type"]]["max_tlv_more"] != "0" and ies["tlv_more"] != "0"
+            for ies in ies_list)
+
+    code = "    uint8_t *end = pos + size, *value = NULL;\n"
+    code += "    uint16_t type, length;\n"
+    if more:
+        code += "    int i;\n"
+    code += "\n"
+    code += "    do {\n"
+    code += "        value = pfcp_get_element(pos, end, &type, &length);\n"
+    code += "        if (!value) {\n"
+    code += "            ogs_error(\"Can't parse TLV in [%s] [LEN:%%d]\", size);\n" % name
+    code += "            return OGS_ERROR;\n"
+    code += "        }\n"
+    code += "        pos = value + length;\n"
+    code += "\n"
+    code += "        switch (type) {\n"
+    for (t, ie_type, members) in cases:
+        code += "        case OGS_PFCP_%s_TYPE:\n" % v_upper(ie_type)
+        indent = "            "
+        for (i, ies) in enumerate(members):
+            member = "v->" + v_lower(ies["ie_value"])
+            if type_list[ies["ie_type"]]["max_tlv_more"] != "0" and ies["tlv_more"] != "0":
+                n = int(ies["tlv_more"]) + 1
+                if i != 0:
+                    code += indent[:-4] + "} else {\n"
+                code += indent + "for (i = 0; i < %d && %s[i].presence; i++);\n" % (n, member)
+                code += indent + "if (i == %d) {\n" % n
+                code += indent + "    ogs_fatal(\"Multiple of the same type TLV need more room\");\n"
+                code += indent + "    break;\n"
+                code += indent + "}\n"
+                code += parse_member(ies["ie_type"], member + "[i]", indent)
+                if i != 0:
+                    code += indent[:-4] + "}\n"
+                break
+            code += indent + "%sif (!%s.presence) {\n" % \
+                    ("} else " if i != 0 else "", member)
+            code += parse_member(ies["ie_type"], member, indent + "    ")
+        else:
+            code += indent + "} else {\n"
+            code += indent + "    ogs_warn(\"Unknown TLV type [%d]\", type);\n"
+            code += indent + "}\n"
+        code += "            break;\n"
+    if more:
+        code += "        case 0:\n"
+        code += "            /* ogs_tlv_parse_msg() takes it for an ogs_tlv_desc_more */\n"
+        code += "            ogs_error(\"Unknown type[%d]\", OGS_TLV_MORE);\n"
+        code += "            return OGS_ERROR;\n"
+    code += "        default:\n"
+    code += "            ogs_warn(\"Unknown TLV type [%d]\", type);\n"
+    code += "            break;\n"
+    code += "        }\n"
+    code += "    } while (pos < end);\n"
+    code += "\n"
+    code += "    return OGS_OK;\n"
+    return code
+
+# Only the groups the specialized messages can carry
+hot_groups = set()
+def hot_add_groups(ies_list):
+    for ies in ies_list:
+        if ies["ie_type"] in group_list.keys() and \
+                ies["ie_type"] not in hot_groups:
+            hot_groups.add(ies["ie_type"])
+            hot_add_groups(group_list[ies["ie_type"]]["ies"])
+for k in hot_msgs:
+    hot_add_groups(msg_list[k]["ies"])
+sorted_hot_group_list = [(k, v) for (k, v) in sorted_group_list if k in hot_groups]
+
+for (k, v) in sorted_hot_group_list:
+    f.write("static int pfcp_parse_%s(\n" % v_lower(k))
+    f.write("        ogs_pfcp_tlv_%s_t *v, uint8_t *pos, uint32_t size);\n" % v_lower(k))
 f.write("\n")
 
+for (k, v) in sorted_hot_group_list:
+    f.write("static int pfcp_parse_%s(\n" % v_lower(k))
+    f.write("        ogs_pfcp_tlv_%s_t *v, uint8_t *pos, uint32_t size)\n" % v_lower(k))
+    f.write("{\n")
+    f.write(parse_ies(k, group_list[k]["ies"]))
+    f.write("}\n\n")
+
+for (k, v) in hot_msg_list:
+    assert k[5:] not in group_list.keys(), "Duplicated name = %s" % k
+    f.write("static int pfcp_parse_%s(\n" % v_lower(k[5:]))
+    f.write("        ogs_%s_t *v, uint8_t *pos, uint32_t size)\n" % v_lower(k))
+    f.write("{\n")
+    f.write(parse_ies(k, msg_list[k]["ies"]))
+    f.write("}\n\n")
+
+    f.write("int %s(ogs_%s_t *v, ogs_pkbuf_t *pkbuf)\n" % (direct_parser(k), v_lower(k)))
+    f.write("{\n")
+    f.write("    ogs_assert(v);\n")
+    f.write("    ogs_assert(pkbuf);\n")
+    f.write("\n")
+    f.write("    return pfcp_parse_%s(v, pkbuf->data, pkbuf->len);\n" % v_lower(k[5:]))
+    f.write("}\n\n")
+
+f.write("""static int pfcp_peek_header(ogs_pkbuf_t *pkbuf)
+{
+    ogs_pfcp_header_t *h = (ogs_pfcp_header_t *)pkbuf->data;
+    uint16_t size = 0;
+
+    if (pkbuf->len < OGS_PFCP_HEADER_LEN-OGS_PFCP_SEID_LEN) {
+        ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+        return OGS_ERROR;
+    }
+
+    if (h->seid_presence)
+        size = OGS_PFCP_HEADER_LEN;
+    else
+        size = OGS_PFCP_HEADER_LEN-OGS_PFCP_SEID_LEN;
+
+    if (pkbuf->len < size) {
+        ogs_error("Not enough pkbuf [len:%d]", pkbuf->len);
+        return OGS_ERROR;
+    }
+
+    return size;
+}
+
+int ogs_pfcp_peek(ogs_pkbuf_t *pkbuf, uint8_t *type, uint64_t *seid)
+{
+    ogs_pfcp_header_t *h = NULL;
+
+    ogs_assert(pkbuf);
+
+    if (pfcp_peek_header(pkbuf) < 0)
+        return OGS_ERROR;
+
+    h = (ogs_pfcp_header_t *)pkbuf->data;
+    if (type)
+        *type = h->type;
+    if (seid)
+        *seid = h->seid_presence ? be64toh(h->seid) : 0;
+
+    return OGS_OK;
+}
+
+int ogs_pfcp_peek_ies(ogs_pkbuf_t *pkbuf, ogs_pfcp_peek_t *ies, int num)
+{
+    uint8_t *pos = NULL, *end = NULL, *value = NULL;
+    uint16_t type, length;
+    int size, found = 0, i;
+
+    ogs_assert(pkbuf);
+    ogs_assert(ies);
+
+    for (i = 0; i < num; i++)
+        ies[i].offset = -1;
+
+    size = pfcp_peek_header(pkbuf);
+    if (size < 0)
+        return OGS_ERROR;
+
+    pos = pkbuf->data + size;
+    end = pkbuf->data + pkbuf->len;
+    while (pos < end && found < num) {
+        value = pfcp_get_element(pos, end, &type, &length);
+        if (!value) {
+            ogs_error("Can't peek TLV [LEN:%d]", pkbuf->len);
+            return OGS_ERROR;
+        }
+        pos = value + length;
+
+        for (i = 0; i < num; i++) {
+            if (ies[i].type == type && ies[i].offset < 0) {
+                ies[i].offset = value - pkbuf->data;
+                ies[i].length = length;
+                found++;
+                break;
+            }
+        }
+    }
+
+    return found;
+}
+
+""")
+
+for (k, v) in peek_type_list:
+    f.write("int ogs_pfcp_peek_%s(ogs_pkbuf_t *pkbuf, uint16_t *length)\n" % v_lower(k))
+    f.write("{\n")
+    f.write("    ogs_pfcp_peek_t ie = { OGS_PFCP_%s_TYPE, 0, -1 };\n" % v_upper(k))
+    f.write("\n")
+    f.write("    if (ogs_pfcp_peek_ies(pkbuf, &ie, 1) != 1)\n")
+    f.write("        return OGS_ERROR;\n")
+    f.write("\n")
+    f.write("    if (length)\n")
+    f.write("        *length = ie.length;\n")
+    f.write("\n")
+    f.write("    return ie.offset;\n")
+    f.write("}\n\n")
+
 f.close()
+
+if sizes is not None:
+    structs = []
+    for (k, v) in sorted_group_list:
+        structs.append(("ogs_pfcp_tlv_%s_t" % v_lower(k), ["presence"] +
+            [v_lower(ies["ie_value"]) for ies in group_list[k]["ies"]]))
+    for (k, v) in sorted_msg_list:
+        if "ies" in msg_list[k]:
+            structs.append(("ogs_%s_t" % v_lower(k),
+                [v_lower(ies["ie_value"]) for ies in msg_list[k]["ies"]]))
+    f = output.open(sizes)
+    output_header_to_file(f)
+    write_size_report(f, ["ogs-pfcp.h"], structs,
+            ("ogs_pfcp_message_t", v_lower(first)))
+    f.close()
+
+if bench is not None:
+    f = output.open(bench)
+    output_header_to_file(f)
+    write_bench_prologue(f, "PFCP", ["ogs-pfcp.h", "unit/tlv-message.h"])
+    write_bench_tlv(f, "ogs_pfcp_message_t", "OGS_TLV_MODE_T2_L2",
+            "ogs_tlv_parse_msg")
+    # The direct paths, called through the types of bench_message_t
+    for (k, v) in sorted_msg_list:
+        if len(msg_list[k].get("ies", [])) == 0:
+            continue
+        f.write("static ogs_pkbuf_t *bench_build_%s(void *msg)\n" % v_lower(k))
+        f.write("{\n")
+        f.write("    return %s(msg);\n" % direct_builder(k))
+        f.write("}\n\n")
+        if k in hot_msgs:
+            f.write("static int bench_parse_%s(void *msg, ogs_pkbuf_t *pkbuf)\n" % v_lower(k))
+            f.write("{\n")
+            f.write("    return %s(msg, pkbuf);\n" % direct_parser(k))
+            f.write("}\n\n")
+
+    f.write("static const bench_message_t bench_messages[] = {\n")
+    for (k, v) in sorted_msg_list:
+        if len(msg_list[k].get("ies", [])) == 0:
+            continue
+        f.write("    { \"%s\", &ogs_pfcp_msg_desc_%s,\n" % (k, v_lower(k)))
+        f.write("        sizeof(ogs_%s_t),\n" % v_lower(k))
+        f.write("        bench_build_%s,\n" % v_lower(k))
+        if k in hot_msgs:
+            f.write("        bench_parse_%s },\n" % v_lower(k))
+        else:
+            f.write("        NULL },\n")
+    f.write("};\n\n")
+    write_bench_main(f, """    ogs_log_install_domain(&__ogs_pfcp_domain, "pfcp", OGS_LOG_ERROR);
+""", "bench_messages")
+    f.close()
+
+if corpus is not None:
+    def corpus_ies(ies_list, variant):
+        octets = []
+        for ies in ies_list:
+            if variant == "mandatory" and ies["presence"] != "M":
+                continue
+            t = ies["ie_type"]
+            if t in group_list.keys():
+                # Repeating inside the groups too would outgrow the TLV pool
+                value = corpus_ies(group_list[t]["ies"],
+                        "all" if variant == "max" else variant)
+            elif "size" in type_list[t]:
+                value = [0] * type_list[t]["size"]
+            else:
+                value = [0]
+            n = 1
+            if variant == "max" and type_list[t]["max_tlv_more"] != "0":
+                n = int(ies["tlv_more"]) + 1
+            octets += tlv_octets("T2_L2", int(type_list[t]["type"]), value) * n
+        return octets
+
+    seeds = Corpus("pfcp")
+    for (k, v) in sorted_msg_list:
+        if "ies" not in msg_list[k]:
+            continue
+        variants = {}
+        for variant in VARIANTS:
+            octets = corpus_ies(msg_list[k]["ies"], variant)
+            if octets in variants.values():
+                continue
+            variants[variant] = octets
+            # Sequence number 1, a SEID of 0 in the session messages
+            if int(v) >= 50:
+                header = [0x21, int(v), 0, 0] + [0] * 8 + [0, 0, 1, 0]
+            else:
+                header = [0x20, int(v), 0, 0] + [0, 0, 1, 0]
+            length = len(header) + len(octets) - 4
+            header[2:4] = [length >> 8, length & 0xff]
+            seeds.add(v_lower(k[5:]), variant, header + octets)
+    seeds.write(output, corpus)
+
+if depfile is not None:
+    output.write_depfile(depfile, [filename] + cache.files)
+
+output.summary()
+profile.report()
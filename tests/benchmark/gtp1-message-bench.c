@@ -0,0 +1,253 @@
+/*
+ * Copyright (C) 2019 by Sukchan Lee <acetcom@gmail.com>
+ * Copyright (C) 2022 by sysmocom - s.f.m.c. GmbH <info@sysmocom.de>
+ * Copyright (C) 2023 by Sukchan Lee <acetcom@gmail.com>
+ *
+ * This file is part of Open5GS.
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Affero General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+/*******************************************************************************
+ * This file had been created by gtp1-tlv.py script v0.1.0
+ * Please do not modify this file but regenerate it via script.
+ * Created from 29060-h40.docx
+ * (sha256: 63ee8f5056967e44969eb0b779cb1d26605c9454573d362e6b8a7c65532b4127)
+ ******************************************************************************/
+
+/*
+ * Encode and decode cost of each GTPv1-C message, all of its IEs present.
+ *
+ *   <this program> [iterations] > gtpv1-c.csv
+ */
+
+#include "ogs-gtp.h"
+#include "unit/tlv-message.h"
+
+#define DEFAULT_ITERATIONS 10000
+
+static int iterations = DEFAULT_ITERATIONS;
+
+static void bench_report(const char *message, const char *path,
+        const char *operation, int octets, ogs_time_t start, ogs_time_t stop)
+{
+    double ns = (double)(stop - start) * 1000 / iterations;
+
+    printf("GTPv1-C,%s,%s,%s,%d,%d,%.1f,%.0f\n", message, path, operation,
+            octets, iterations, ns, ns > 0 ? 1e9 / ns : 0);
+}
+
+/* Every IE present, the first one of those that repeat */
+static const test_tlv_fill_t bench_fill = {
+    .one_in = 1, .more = 1, .depth = 8, .octets = 8, .random = false,
+};
+
+typedef struct bench_message_s {
+    const char *name;
+    const ogs_tlv_desc_t *desc;
+    size_t size;
+    /* Specialized paths, if any */
+    ogs_pkbuf_t *(*build)(void *msg);
+    int (*parse)(void *msg, ogs_pkbuf_t *pkbuf);
+} bench_message_t;
+
+static ogs_gtp1_message_t bench_msg, bench_parsed;
+
+static void bench_message(const bench_message_t *b)
+{
+    ogs_pkbuf_t *pkbuf = NULL;
+    ogs_time_t start;
+    int i, octets;
+
+    memset(&bench_msg, 0, b->size);
+    test_tlv_message_fill(b->desc, &bench_msg, &bench_fill);
+
+    /* The wire format decoded below */
+    pkbuf = ogs_tlv_build_msg(b->desc, &bench_msg, OGS_TLV_MODE_T1_L2);
+    ogs_assert(pkbuf);
+    octets = pkbuf->len;
+
+    start = ogs_get_monotonic_time();
+    for (i = 0; i < iterations; i++)
+        ogs_pkbuf_free(ogs_tlv_build_msg(b->desc, &bench_msg, OGS_TLV_MODE_T1_L2));
+    bench_report(b->name, "generic", "encode", octets,
+            start, ogs_get_monotonic_time());
+
+    start = ogs_get_monotonic_time();
+    for (i = 0; i < iterations; i++) {
+        memset(&bench_parsed, 0, b->size);
+        ogs_assert(ogs_tlv_parse_msg_desc(&bench_parsed, b->desc, pkbuf, OGS_TLV_MODE_T1_L2) == OGS_OK);
+    }
+    bench_report(b->name, "generic", "decode", octets,
+            start, ogs_get_monotonic_time());
+
+    if (b->build) {
+        start = ogs_get_monotonic_time();
+        for (i = 0; i < iterations; i++)
+            ogs_pkbuf_free(b->build(&bench_msg));
+        bench_report(b->name, "direct", "encode", octets,
+                start, ogs_get_monotonic_time());
+    }
+
+    if (b->parse) {
+        start = ogs_get_monotonic_time();
+        for (i = 0; i < iterations; i++) {
+            memset(&bench_parsed, 0, b->size);
+            ogs_assert(b->parse(&bench_parsed, pkbuf) == OGS_OK);
+        }
+        bench_report(b->name, "direct", "decode", octets,
+                start, ogs_get_monotonic_time());
+    }
+
+    ogs_pkbuf_free(pkbuf);
+}
+
+static const bench_message_t bench_messages[] = {
+    { "Echo Response", &ogs_gtp1_tlv_desc_echo_response,
+        sizeof(ogs_gtp1_echo_response_t), NULL, NULL },
+    { "Create PDP Context Request", &ogs_gtp1_tlv_desc_create_pdp_context_request,
+        sizeof(ogs_gtp1_create_pdp_context_request_t), NULL, NULL },
+    { "Create PDP Context Response", &ogs_gtp1_tlv_desc_create_pdp_context_response,
+        sizeof(ogs_gtp1_create_pdp_context_response_t), NULL, NULL },
+    { "Update PDP Context Request", &ogs_gtp1_tlv_desc_update_pdp_context_request,
+        sizeof(ogs_gtp1_update_pdp_context_request_t), NULL, NULL },
+    { "Update PDP Context Response", &ogs_gtp1_tlv_desc_update_pdp_context_response,
+        sizeof(ogs_gtp1_update_pdp_context_response_t), NULL, NULL },
+    { "Delete PDP Context Request", &ogs_gtp1_tlv_desc_delete_pdp_context_request,
+        sizeof(ogs_gtp1_delete_pdp_context_request_t), NULL, NULL },
+    { "Delete PDP Context Response", &ogs_gtp1_tlv_desc_delete_pdp_context_response,
+        sizeof(ogs_gtp1_delete_pdp_context_response_t), NULL, NULL },
+    { "Initiate PDP Context Activation Request", &ogs_gtp1_tlv_desc_initiate_pdp_context_activation_request,
+        sizeof(ogs_gtp1_initiate_pdp_context_activation_request_t), NULL, NULL },
+    { "Initiate PDP Context Activation Response", &ogs_gtp1_tlv_desc_initiate_pdp_context_activation_response,
+        sizeof(ogs_gtp1_initiate_pdp_context_activation_response_t), NULL, NULL },
+    { "PDU Notification Request", &ogs_gtp1_tlv_desc_pdu_notification_request,
+        sizeof(ogs_gtp1_pdu_notification_request_t), NULL, NULL },
+    { "PDU Notification Response", &ogs_gtp1_tlv_desc_pdu_notification_response,
+        sizeof(ogs_gtp1_pdu_notification_response_t), NULL, NULL },
+    { "PDU Notification Reject Request", &ogs_gtp1_tlv_desc_pdu_notification_reject_request,
+        sizeof(ogs_gtp1_pdu_notification_reject_request_t), NULL, NULL },
+    { "PDU Notification Reject Response", &ogs_gtp1_tlv_desc_pdu_notification_reject_response,
+        sizeof(ogs_gtp1_pdu_notification_reject_response_t), NULL, NULL },
+    { "Supported Extension Headers Notification", &ogs_gtp1_tlv_desc_supported_extension_headers_notification,
+        sizeof(ogs_gtp1_supported_extension_headers_notification_t), NULL, NULL },
+    { "Send Routeing Information for GPRS Request", &ogs_gtp1_tlv_desc_send_routeing_information_for_gprs_request,
+        sizeof(ogs_gtp1_send_routeing_information_for_gprs_request_t), NULL, NULL },
+    { "Send Routeing Information for GPRS Response", &ogs_gtp1_tlv_desc_send_routeing_information_for_gprs_response,
+        sizeof(ogs_gtp1_send_routeing_information_for_gprs_response_t), NULL, NULL },
+    { "Failure Report Request", &ogs_gtp1_tlv_desc_failure_report_request,
+        sizeof(ogs_gtp1_failure_report_request_t), NULL, NULL },
+    { "Failure Report Response", &ogs_gtp1_tlv_desc_failure_report_response,
+        sizeof(ogs_gtp1_failure_report_response_t), NULL, NULL },
+    { "Note MS GPRS Present Request", &ogs_gtp1_tlv_desc_note_ms_gprs_present_request,
+        sizeof(ogs_gtp1_note_ms_gprs_present_request_t), NULL, NULL },
+    { "Note MS GPRS Present Response", &ogs_gtp1_tlv_desc_note_ms_gprs_present_response,
+        sizeof(ogs_gtp1_note_ms_gprs_present_response_t), NULL, NULL },
+    { "Identification Request", &ogs_gtp1_tlv_desc_identification_request,
+        sizeof(ogs_gtp1_identification_request_t), NULL, NULL },
+    { "Identification Response", &ogs_gtp1_tlv_desc_identification_response,
+        sizeof(ogs_gtp1_identification_response_t), NULL, NULL },
+    { "SGSN Context Request", &ogs_gtp1_tlv_desc_sgsn_context_request,
+        sizeof(ogs_gtp1_sgsn_context_request_t), NULL, NULL },
+    { "SGSN Context Response", &ogs_gtp1_tlv_desc_sgsn_context_response,
+        sizeof(ogs_gtp1_sgsn_context_response_t), NULL, NULL },
+    { "SGSN Context Acknowledge", &ogs_gtp1_tlv_desc_sgsn_context_acknowledge,
+        sizeof(ogs_gtp1_sgsn_context_acknowledge_t), NULL, NULL },
+    { "Forward Relocation Request", &ogs_gtp1_tlv_desc_forward_relocation_request,
+        sizeof(ogs_gtp1_forward_relocation_request_t), NULL, NULL },
+    { "Forward Relocation Response", &ogs_gtp1_tlv_desc_forward_relocation_response,
+        sizeof(ogs_gtp1_forward_relocation_response_t), NULL, NULL },
+    { "Relocation Cancel Request", &ogs_gtp1_tlv_desc_relocation_cancel_request,
+        sizeof(ogs_gtp1_relocation_cancel_request_t), NULL, NULL },
+    { "Relocation Cancel Response", &ogs_gtp1_tlv_desc_relocation_cancel_response,
+        sizeof(ogs_gtp1_relocation_cancel_response_t), NULL, NULL },
+    { "Forward SRNS Context", &ogs_gtp1_tlv_desc_forward_srns_context,
+        sizeof(ogs_gtp1_forward_srns_context_t), NULL, NULL },
+    { "Forward Relocation Complete Acknowledge", &ogs_gtp1_tlv_desc_forward_relocation_complete_acknowledge,
+        sizeof(ogs_gtp1_forward_relocation_complete_acknowledge_t), NULL, NULL },
+    { "Forward SRNS Context Acknowledge", &ogs_gtp1_tlv_desc_forward_srns_context_acknowledge,
+        sizeof(ogs_gtp1_forward_srns_context_acknowledge_t), NULL, NULL },
+    { "UE Registration Query Request", &ogs_gtp1_tlv_desc_ue_registration_query_request,
+        sizeof(ogs_gtp1_ue_registration_query_request_t), NULL, NULL },
+    { "UE Registration Query Response", &ogs_gtp1_tlv_desc_ue_registration_query_response,
+        sizeof(ogs_gtp1_ue_registration_query_response_t), NULL, NULL },
+    { "RAN Information Relay", &ogs_gtp1_tlv_desc_ran_information_relay,
+        sizeof(ogs_gtp1_ran_information_relay_t), NULL, NULL },
+    { "MBMS Notification Request", &ogs_gtp1_tlv_desc_mbms_notification_request,
+        sizeof(ogs_gtp1_mbms_notification_request_t), NULL, NULL },
+    { "MBMS Notification Response", &ogs_gtp1_tlv_desc_mbms_notification_response,
+        sizeof(ogs_gtp1_mbms_notification_response_t), NULL, NULL },
+    { "MBMS Notification Reject Request", &ogs_gtp1_tlv_desc_mbms_notification_reject_request,
+        sizeof(ogs_gtp1_mbms_notification_reject_request_t), NULL, NULL },
+    { "MBMS Notification Reject Response", &ogs_gtp1_tlv_desc_mbms_notification_reject_response,
+        sizeof(ogs_gtp1_mbms_notification_reject_response_t), NULL, NULL },
+    { "Create MBMS Context Request", &ogs_gtp1_tlv_desc_create_mbms_context_request,
+        sizeof(ogs_gtp1_create_mbms_context_request_t), NULL, NULL },
+    { "Create MBMS Context Response", &ogs_gtp1_tlv_desc_create_mbms_context_response,
+        sizeof(ogs_gtp1_create_mbms_context_response_t), NULL, NULL },
+    { "Update MBMS Context Request", &ogs_gtp1_tlv_desc_update_mbms_context_request,
+        sizeof(ogs_gtp1_update_mbms_context_request_t), NULL, NULL },
+    { "Update MBMS Context Response", &ogs_gtp1_tlv_desc_update_mbms_context_response,
+        sizeof(ogs_gtp1_update_mbms_context_response_t), NULL, NULL },
+    { "Delete MBMS Context Request", &ogs_gtp1_tlv_desc_delete_mbms_context_request,
+        sizeof(ogs_gtp1_delete_mbms_context_request_t), NULL, NULL },
+    { "Delete MBMS Context Response", &ogs_gtp1_tlv_desc_delete_mbms_context_response,
+        sizeof(ogs_gtp1_delete_mbms_context_response_t), NULL, NULL },
+    { "MBMS Registration Request", &ogs_gtp1_tlv_desc_mbms_registration_request,
+        sizeof(ogs_gtp1_mbms_registration_request_t), NULL, NULL },
+    { "MBMS Registration Response", &ogs_gtp1_tlv_desc_mbms_registration_response,
+        sizeof(ogs_gtp1_mbms_registration_response_t), NULL, NULL },
+    { "MBMS De-Registration Request", &ogs_gtp1_tlv_desc_mbms_de_registration_request,
+        sizeof(ogs_gtp1_mbms_de_registration_request_t), NULL, NULL },
+    { "MBMS De-Registration Response", &ogs_gtp1_tlv_desc_mbms_de_registration_response,
+        sizeof(ogs_gtp1_mbms_de_registration_response_t), NULL, NULL },
+    { "MBMS Session Start Request", &ogs_gtp1_tlv_desc_mbms_session_start_request,
+        sizeof(ogs_gtp1_mbms_session_start_request_t), NULL, NULL },
+    { "MBMS Session Start Response", &ogs_gtp1_tlv_desc_mbms_session_start_response,
+        sizeof(ogs_gtp1_mbms_session_start_response_t), NULL, NULL },
+    { "MBMS Session Stop Request", &ogs_gtp1_tlv_desc_mbms_session_stop_request,
+        sizeof(ogs_gtp1_mbms_session_stop_request_t), NULL, NULL },
+    { "MBMS Session Stop Response", &ogs_gtp1_tlv_desc_mbms_session_stop_response,
+        sizeof(ogs_gtp1_mbms_session_stop_response_t), NULL, NULL },
+    { "MBMS Session Update Request", &ogs_gtp1_tlv_desc_mbms_session_update_request,
+        sizeof(ogs_gtp1_mbms_session_update_request_t), NULL, NULL },
+    { "MBMS Session Update Response", &ogs_gtp1_tlv_desc_mbms_session_update_response,
+        sizeof(ogs_gtp1_mbms_session_update_response_t), NULL, NULL },
+};
+
+int main(int argc, const char *const argv[])
+{
+    int i;
+
+    if (argc > 1)
+        iterations = atoi(argv[1]);
+    if (iterations <= 0) {
+        fprintf(stderr, "Usage: %s [iterations]\n", argv[0]);
+        return EXIT_FAILURE;
+    }
+
+    /* A TLV node for each IE of the largest messages */
+    ogs_core()->tlv.pool = 65536;
+    ogs_core_initialize();
+    ogs_log_install_domain(&__ogs_gtp_domain, "gtp", OGS_LOG_ERROR);
+
+    printf("protocol,message,path,operation,octets,iterations,"
+            "ns_per_op,ops_per_sec\n");
+    for (i = 0; i < OGS_ARRAY_SIZE(bench_messages); i++)
+        bench_message(&bench_messages[i]);
+
+    ogs_core_terminate();
+
+    return EXIT_SUCCESS;
+}
@@ -0,0 +1,201 @@
+/*
+ * Copyright (C) 2019-2023 by Sukchan Lee <acetcom@gmail.com>
+ *
+ * This file is part of Open5GS.
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Affero General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+/*******************************************************************************
+ * This file had been created by gtp-tlv.py script v0.1.0
+ * Please do not modify this file but regenerate it via script.
+ * Created from 29274-h70.docx
+ * (sha256: 38b0693c737614cdfb2703dfce9dd5e6507890243a899399d1f0f0ea4a093a3a)
+ ******************************************************************************/
+
+/*
+ * Encode and decode cost of each GTPv2-C message, all of its IEs present.
+ *
+ *   <this program> [iterations] > gtpv2-c.csv
+ */
+
+#include "ogs-gtp.h"
+#include "unit/tlv-message.h"
+
+#define DEFAULT_ITERATIONS 10000
+
+static int iterations = DEFAULT_ITERATIONS;
+
+static void bench_report(const char *message, const char *path,
+        const char *operation, int octets, ogs_time_t start, ogs_time_t stop)
+{
+    double ns = (double)(stop - start) * 1000 / iterations;
+
+    printf("GTPv2-C,%s,%s,%s,%d,%d,%.1f,%.0f\n", message, path, operation,
+            octets, iterations, ns, ns > 0 ? 1e9 / ns : 0);
+}
+
+/* Every IE present, the first one of those that repeat */
+static const test_tlv_fill_t bench_fill = {
+    .one_in = 1, .more = 1, .depth = 8, .octets = 8, .random = false,
+};
+
+typedef struct bench_message_s {
+    const char *name;
+    const ogs_tlv_desc_t *desc;
+    size_t size;
+    /* Specialized paths, if any */
+    ogs_pkbuf_t *(*build)(void *msg);
+    int (*parse)(void *msg, ogs_pkbuf_t *pkbuf);
+} bench_message_t;
+
+static ogs_gtp2_message_t bench_msg, bench_parsed;
+
+static void bench_message(const bench_message_t *b)
+{
+    ogs_pkbuf_t *pkbuf = NULL;
+    ogs_time_t start;
+    int i, octets;
+
+    memset(&bench_msg, 0, b->size);
+    test_tlv_message_fill(b->desc, &bench_msg, &bench_fill);
+
+    /* The wire format decoded below */
+    pkbuf = ogs_tlv_build_msg(b->desc, &bench_msg, OGS_TLV_MODE_T1_L2_I1);
+    ogs_assert(pkbuf);
+    octets = pkbuf->len;
+
+    start = ogs_get_monotonic_time();
+    for (i = 0; i < iterations; i++)
+        ogs_pkbuf_free(ogs_tlv_build_msg(b->desc, &bench_msg, OGS_TLV_MODE_T1_L2_I1));
+    bench_report(b->name, "generic", "encode", octets,
+            start, ogs_get_monotonic_time());
+
+    start = ogs_get_monotonic_time();
+    for (i = 0; i < iterations; i++) {
+        memset(&bench_parsed, 0, b->size);
+        ogs_assert(ogs_tlv_parse_msg(&bench_parsed, b->desc, pkbuf, OGS_TLV_MODE_T1_L2_I1) == OGS_OK);
+    }
+    bench_report(b->name, "generic", "decode", octets,
+            start, ogs_get_monotonic_time());
+
+    if (b->build) {
+        start = ogs_get_monotonic_time();
+        for (i = 0; i < iterations; i++)
+            ogs_pkbuf_free(b->build(&bench_msg));
+        bench_report(b->name, "direct", "encode", octets,
+                start, ogs_get_monotonic_time());
+    }
+
+    if (b->parse) {
+        start = ogs_get_monotonic_time();
+        for (i = 0; i < iterations; i++) {
+            memset(&bench_parsed, 0, b->size);
+            ogs_assert(b->parse(&bench_parsed, pkbuf) == OGS_OK);
+        }
+        bench_report(b->name, "direct", "decode", octets,
+                start, ogs_get_monotonic_time());
+    }
+
+    ogs_pkbuf_free(pkbuf);
+}
+
+static const bench_message_t bench_messages[] = {
+    { "Echo Request", &ogs_gtp2_tlv_desc_echo_request,
+        sizeof(ogs_gtp2_echo_request_t), NULL, NULL },
+    { "Echo Response", &ogs_gtp2_tlv_desc_echo_response,
+        sizeof(ogs_gtp2_echo_response_t), NULL, NULL },
+    { "Create Session Request", &ogs_gtp2_tlv_desc_create_session_request,
+        sizeof(ogs_gtp2_create_session_request_t), NULL, NULL },
+    { "Create Session Response", &ogs_gtp2_tlv_desc_create_session_response,
+        sizeof(ogs_gtp2_create_session_response_t), NULL, NULL },
+    { "Modify Bearer Request", &ogs_gtp2_tlv_desc_modify_bearer_request,
+        sizeof(ogs_gtp2_modify_bearer_request_t), NULL, NULL },
+    { "Modify Bearer Response", &ogs_gtp2_tlv_desc_modify_bearer_response,
+        sizeof(ogs_gtp2_modify_bearer_response_t), NULL, NULL },
+    { "Delete Session Request", &ogs_gtp2_tlv_desc_delete_session_request,
+        sizeof(ogs_gtp2_delete_session_request_t), NULL, NULL },
+    { "Delete Session Response", &ogs_gtp2_tlv_desc_delete_session_response,
+        sizeof(ogs_gtp2_delete_session_response_t), NULL, NULL },
+    { "Modify Bearer Command", &ogs_gtp2_tlv_desc_modify_bearer_command,
+        sizeof(ogs_gtp2_modify_bearer_command_t), NULL, NULL },
+    { "Modify Bearer Failure Indication", &ogs_gtp2_tlv_desc_modify_bearer_failure_indication,
+        sizeof(ogs_gtp2_modify_bearer_failure_indication_t), NULL, NULL },
+    { "Delete Bearer Command", &ogs_gtp2_tlv_desc_delete_bearer_command,
+        sizeof(ogs_gtp2_delete_bearer_command_t), NULL, NULL },
+    { "Delete Bearer Failure Indication", &ogs_gtp2_tlv_desc_delete_bearer_failure_indication,
+        sizeof(ogs_gtp2_delete_bearer_failure_indication_t), NULL, NULL },
+    { "Bearer Resource Command", &ogs_gtp2_tlv_desc_bearer_resource_command,
+        sizeof(ogs_gtp2_bearer_resource_command_t), NULL, NULL },
+    { "Bearer Resource Failure Indication", &ogs_gtp2_tlv_desc_bearer_resource_failure_indication,
+        sizeof(ogs_gtp2_bearer_resource_failure_indication_t), NULL, NULL },
+    { "Downlink Data Notification Failure Indication", &ogs_gtp2_tlv_desc_downlink_data_notification_failure_indication,
+        sizeof(ogs_gtp2_downlink_data_notification_failure_indication_t), NULL, NULL },
+    { "Create Bearer Request", &ogs_gtp2_tlv_desc_create_bearer_request,
+        sizeof(ogs_gtp2_create_bearer_request_t), NULL, NULL },
+    { "Create Bearer Response", &ogs_gtp2_tlv_desc_create_bearer_response,
+        sizeof(ogs_gtp2_create_bearer_response_t), NULL, NULL },
+    { "Update Bearer Request", &ogs_gtp2_tlv_desc_update_bearer_request,
+        sizeof(ogs_gtp2_update_bearer_request_t), NULL, NULL },
+    { "Update Bearer Response", &ogs_gtp2_tlv_desc_update_bearer_response,
+        sizeof(ogs_gtp2_update_bearer_response_t), NULL, NULL },
+    { "Delete Bearer Request", &ogs_gtp2_tlv_desc_delete_bearer_request,
+        sizeof(ogs_gtp2_delete_bearer_request_t), NULL, NULL },
+    { "Delete Bearer Response", &ogs_gtp2_tlv_desc_delete_bearer_response,
+        sizeof(ogs_gtp2_delete_bearer_response_t), NULL, NULL },
+    { "Create Indirect Data Forwarding Tunnel Request", &ogs_gtp2_tlv_desc_create_indirect_data_forwarding_tunnel_request,
+        sizeof(ogs_gtp2_create_indirect_data_forwarding_tunnel_request_t), NULL, NULL },
+    { "Create Indirect Data Forwarding Tunnel Response", &ogs_gtp2_tlv_desc_create_indirect_data_forwarding_tunnel_response,
+        sizeof(ogs_gtp2_create_indirect_data_forwarding_tunnel_response_t), NULL, NULL },
+    { "Delete Indirect Data Forwarding Tunnel Response", &ogs_gtp2_tlv_desc_delete_indirect_data_forwarding_tunnel_response,
+        sizeof(ogs_gtp2_delete_indirect_data_forwarding_tunnel_response_t), NULL, NULL },
+    { "Release Access Bearers Request", &ogs_gtp2_tlv_desc_release_access_bearers_request,
+        sizeof(ogs_gtp2_release_access_bearers_request_t), NULL, NULL },
+    { "Release Access Bearers Response", &ogs_gtp2_tlv_desc_release_access_bearers_response,
+        sizeof(ogs_gtp2_release_access_bearers_response_t), NULL, NULL },
+    { "Downlink Data Notification", &ogs_gtp2_tlv_desc_downlink_data_notification,
+        sizeof(ogs_gtp2_downlink_data_notification_t), NULL, NULL },
+    { "Downlink Data Notification Acknowledge", &ogs_gtp2_tlv_desc_downlink_data_notification_acknowledge,
+        sizeof(ogs_gtp2_downlink_data_notification_acknowledge_t), NULL, NULL },
+    { "Modify Access Bearers Request", &ogs_gtp2_tlv_desc_modify_access_bearers_request,
+        sizeof(ogs_gtp2_modify_access_bearers_request_t), NULL, NULL },
+    { "Modify Access Bearers Response", &ogs_gtp2_tlv_desc_modify_access_bearers_response,
+        sizeof(ogs_gtp2_modify_access_bearers_response_t), NULL, NULL },
+};
+
+int main(int argc, const char *const argv[])
+{
+    int i;
+
+    if (argc > 1)
+        iterations = atoi(argv[1]);
+    if (iterations <= 0) {
+        fprintf(stderr, "Usage: %s [iterations]\n", argv[0]);
+        return EXIT_FAILURE;
+    }
+
+    /* A TLV node for each IE of the largest messages */
+    ogs_core()->tlv.pool = 65536;
+    ogs_core_initialize();
+    ogs_log_install_domain(&__ogs_gtp_domain, "gtp", OGS_LOG_ERROR);
+
+    printf("protocol,message,path,operation,octets,iterations,"
+            "ns_per_op,ops_per_sec\n");
+    for (i = 0; i < OGS_ARRAY_SIZE(bench_messages); i++)
+        bench_message(&bench_messages[i]);
+
+    ogs_core_terminate();
+
+    return EXIT_SUCCESS;
+}
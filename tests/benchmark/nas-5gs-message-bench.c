@@ -0,0 +1,340 @@
+/*
+ * The MIT License
+ *
+ * Copyright (C) 2019-2023 by Sukchan Lee <acetcom@gmail.com>
+ *
+ * This file is part of Open5GS.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining
+ * a copy of this software and associated documentation files (the
+ * "Software"), to deal in the Software without restriction, including
+ * without limitation the rights to use, copy, modify, merge, publish,
+ * distribute, sublicense, and/or sell copies of the Software, and to
+ * permit persons to whom the Software is furnished to do so, subject to
+ * the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be
+ * included in all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+ * EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+ * MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+ * LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+ * OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+ * WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+/*******************************************************************************
+ * This file had been created by nas-message.py script v0.2.0
+ * Please do not modify this file but regenerate it via script.
+ * Created from 24501-h90.docx
+ * (sha256: 934e13e03cc23a890da2448bd91bac0d11d7f538d814a725666f5c9be66f7b96)
+ ******************************************************************************/
+
+/*
+ * Encode and decode cost of each NAS 5GS message, all of its IEs present.
+ *
+ *   <this program> [iterations] > nas-5gs.csv
+ */
+
+#include "ogs-nas-5gs.h"
+
+#define DEFAULT_ITERATIONS 10000
+
+static int iterations = DEFAULT_ITERATIONS;
+
+static void bench_report(const char *message, const char *path,
+        const char *operation, int octets, ogs_time_t start, ogs_time_t stop)
+{
+    double ns = (double)(stop - start) * 1000 / iterations;
+
+    printf("NAS 5GS,%s,%s,%s,%d,%d,%.1f,%.0f\n", message, path, operation,
+            octets, iterations, ns, ns > 0 ? 1e9 / ns : 0);
+}
+
+typedef struct bench_message_s {
+    const char *name;
+    const char *payload;
+    int len;
+    int (*decode)(ogs_nas_5gs_message_t *message, ogs_pkbuf_t *pkbuf);
+    /* Specialized path, if any */
+    int (*lazy)(ogs_pkbuf_t *pkbuf);
+} bench_message_t;
+
+static ogs_nas_5gs_message_t bench_msg;
+
+static void bench_message(const bench_message_t *b)
+{
+    ogs_pkbuf_t *pkbuf = NULL;
+    ogs_time_t start;
+    int i;
+
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_MAX_SDU_LEN);
+    ogs_assert(pkbuf);
+    ogs_pkbuf_put_data(pkbuf, b->payload, b->len);
+
+    if (b->decode(&bench_msg, pkbuf) != OGS_OK) {
+        fprintf(stderr, "%s: cannot be decoded\n", b->name);
+        ogs_pkbuf_free(pkbuf);
+        return;
+    }
+
+    start = ogs_get_monotonic_time();
+    for (i = 0; i < iterations; i++)
+        ogs_pkbuf_free(ogs_nas_5gs_plain_encode(&bench_msg));
+    bench_report(b->name, "generic", "encode", b->len,
+            start, ogs_get_monotonic_time());
+
+    start = ogs_get_monotonic_time();
+    for (i = 0; i < iterations; i++)
+        ogs_assert(b->decode(&bench_msg, pkbuf) == OGS_OK);
+    bench_report(b->name, "generic", "decode", b->len,
+            start, ogs_get_monotonic_time());
+
+    if (b->lazy) {
+        start = ogs_get_monotonic_time();
+        for (i = 0; i < iterations; i++)
+            ogs_assert(b->lazy(pkbuf) == OGS_OK);
+        bench_report(b->name, "lazy", "decode", b->len,
+                start, ogs_get_monotonic_time());
+    }
+
+    ogs_pkbuf_free(pkbuf);
+}
+
+static ogs_nas_5gs_registration_request_lazy_t bench_registration_request;
+
+static int bench_registration_request_lazy(ogs_pkbuf_t *pkbuf)
+{
+    return ogs_nas_5gs_decode_registration_request_lazy(&bench_registration_request, pkbuf);
+}
+
+static const bench_message_t bench_messages[] = {
+    { "REGISTRATION REQUEST",
+        "\x7e\x00\x41\x00\x00\x04\x00\x00\x00\x00\xc0\x10\x01\x00\x2e\x02"
+        "\x00\x00\x2f\x02\x00\x00\x52\x00\x00\x00\x00\x00\x00\x17\x02\x00"
+        "\x00\x40\x02\x00\x00\x50\x02\x00\x00\xb0\x2b\x01\x00\x77\x00\x0b"
+        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x25\x02\x00\x00\x18"
+        "\x01\x00\x51\x01\x00\x70\x00\x01\x00\x74\x00\x00\x80\x7b\x00\x01"
+        "\x00\x90\x53\x01\x00\x41\x03\x00\x00\x00\x42\x03\x00\x00\x00\x71"
+        "\x00\x01\x00\x60\x02\x00\x00\x6e\x01\x00\x6a\x01\x00\x67\x01\x00"
+        "\x35\x01\x00\x48\x01\x00\x1a\x01\x00\xa0\x30\x01\x00\x29\x01\x00"
+        "\x28\x01\x00\x72\x00\x03\x00\x00\x00\x32\x06\x00\x00\x00\x00\x00"
+        "\x00\x16\x03\x00\x00\x00\x2a\x01\x00\x3b\x01\x00",
+        156, ogs_nas_5gmm_decode, bench_registration_request_lazy },
+    { "REGISTRATION ACCEPT",
+        "\x7e\x00\x42\x01\x00\x77\x00\x0b\x00\x00\x00\x00\x00\x00\x00\x00"
+        "\x00\x00\x00\x4a\x03\x00\x00\x00\x54\x07\x00\x00\x00\x00\x00\x00"
+        "\x00\x15\x02\x00\x00\x11\x02\x00\x00\x31\x02\x00\x00\x21\x01\x00"
+        "\x50\x02\x00\x00\x26\x02\x00\x00\x72\x00\x02\x00\x00\x79\x00\x09"
+        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb0\x90\x27\x04\x00\x00\x00"
+        "\x00\x5e\x01\x00\x5d\x01\x00\x16\x01\x00\x34\x03\x00\x00\x00\x7a"
+        "\x00\x04\x00\x00\x00\x00\x73\x00\x11\x00\x00\x00\x00\x00\x00\x00"
+        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x78\x00\x04\x00\x00\x00"
+        "\x00\xa0\x76\x00\x00\x51\x01\x00\xd0\x60\x02\x00\x00\x6e\x01\x00"
+        "\x6c\x01\x00\x6b\x01\x00\x6a\x01\x00\x67\x01\x00\xe0\x39\x02\x00"
+        "\x00\x74\x00\x1f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+        "\x00\x00\x00\x75\x00\x00\x1b\x01\x00\x1c\x01\x00\x29\x01\x00\x68"
+        "\x03\x00\x00\x00\x7b\x00\x03\x00\x00\x00\x33\x01\x00\x34\x01\x00"
+        "\x70\x00\x04\x00\x00\x00\x00\x14\x02\x00\x00\x2c\x02\x00\x00\x13"
+        "\x00\x1d\x07\x00\x00\x00\x00\x00\x00\x00\x1e\x07\x00\x00\x00\x00"
+        "\x00\x00\x00\x71\x00\x00\x7c\x00\x06\x00\x00\x00\x00\x00\x00",
+        271, ogs_nas_5gmm_decode, NULL },
+    { "REGISTRATION COMPLETE",
+        "\x7e\x00\x43\x73\x00\x11\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+        "\x00\x00\x00\x00\x00\x00\x00",
+        23, ogs_nas_5gmm_decode, NULL },
+    { "REGISTRATION REJECT",
+        "\x7e\x00\x44\x00\x5f\x01\x00\x16\x01\x00\x78\x00\x04\x00\x00\x00"
+        "\x00\x69\x02\x00\x00\x75\x00\x00\x68\x03\x00\x00\x00\x2c\x02\x00"
+        "\x00\x71\x00\x00\x3a\x01\x00\x1d\x07\x00\x00\x00\x00\x00\x00\x00"
+        "\x1e\x07\x00\x00\x00\x00\x00\x00\x00",
+        57, ogs_nas_5gmm_decode, NULL },
+    { "DEREGISTRATION REQUEST FROM UE",
+        "\x7e\x00\x45\x00\x00\x04\x00\x00\x00\x00",
+        10, ogs_nas_5gmm_decode, NULL },
+    { "DEREGISTRATION REQUEST TO UE",
+        "\x7e\x00\x47\x00\x58\x00\x5f\x01\x00\x6d\x02\x00\x00\x75\x00\x00"
+        "\x68\x03\x00\x00\x00\x2c\x02\x00\x00\x71\x00\x00\x3a\x01\x00\x1d"
+        "\x07\x00\x00\x00\x00\x00\x00\x00\x1e\x07\x00\x00\x00\x00\x00\x00"
+        "\x00",
+        49, ogs_nas_5gmm_decode, NULL },
+    { "SERVICE REQUEST",
+        "\x7e\x00\x4c\x00\x00\x07\x00\x00\x00\x00\x00\x00\x00\x40\x02\x00"
+        "\x00\x50\x02\x00\x00\x25\x02\x00\x00\x71\x00\x01\x00\x29\x01\x00"
+        "\x28\x01\x00",
+        35, ogs_nas_5gmm_decode, NULL },
+    { "SERVICE REJECT",
+        "\x7e\x00\x4d\x00\x50\x02\x00\x00\x5f\x01\x00\x78\x00\x04\x00\x00"
+        "\x00\x00\x6b\x01\x00\x75\x00\x00\x2c\x02\x00\x00\x71\x00\x00\x3a"
+        "\x01\x00\x1d\x07\x00\x00\x00\x00\x00\x00\x00\x1e\x07\x00\x00\x00"
+        "\x00\x00\x00\x00",
+        52, ogs_nas_5gmm_decode, NULL },
+    { "SERVICE ACCEPT",
+        "\x7e\x00\x4e\x50\x02\x00\x00\x26\x02\x00\x00\x72\x00\x02\x00\x00"
+        "\x78\x00\x04\x00\x00\x00\x00\x6b\x01\x00\x34\x01\x00\x1d\x07\x00"
+        "\x00\x00\x00\x00\x00\x00\x1e\x07\x00\x00\x00\x00\x00\x00\x00",
+        47, ogs_nas_5gmm_decode, NULL },
+    { "CONFIGURATION UPDATE COMMAND",
+        "\x7e\x00\x54\xd0\x77\x00\x0b\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+        "\x00\x00\x54\x07\x00\x00\x00\x00\x00\x00\x00\x15\x02\x00\x00\x27"
+        "\x04\x00\x00\x00\x00\x43\x01\x00\x45\x01\x00\x46\x00\x47\x00\x00"
+        "\x00\x00\x00\x00\x00\x49\x01\x00\x79\x00\x00\xb0\x90\x31\x02\x00"
+        "\x00\x11\x02\x00\x00\x76\x00\x00\xf0\x6c\x01\x00\x75\x00\x00\x67"
+        "\x01\x00\xa0\x44\x01\x00\x1b\x01\x00\xc0\x68\x03\x00\x00\x00\x72"
+        "\x00\x03\x00\x00\x00\x70\x00\x04\x00\x00\x00\x00\x14\x02\x00\x00"
+        "\x2c\x02\x00\x00\x13\x00\x71\x00\x00\x1f\x01\x00\x73\x00\x06\x00"
+        "\x00\x00\x00\x00\x00\xe0",
+        134, ogs_nas_5gmm_decode, NULL },
+    { "AUTHENTICATION REQUEST",
+        "\x7e\x00\x56\x00\x02\x00\x00\x21\x00\x00\x00\x00\x00\x00\x00\x00"
+        "\x00\x00\x00\x00\x00\x00\x00\x00\x20\x10\x00\x00\x00\x00\x00\x00"
+        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x78\x00\x04\x00\x00\x00"
+        "\x00",
+        49, ogs_nas_5gmm_decode, NULL },
+    { "AUTHENTICATION RESPONSE",
+        "\x7e\x00\x57\x2d\x10\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+        "\x00\x00\x00\x00\x00\x78\x00\x04\x00\x00\x00\x00",
+        28, ogs_nas_5gmm_decode, NULL },
+    { "AUTHENTICATION REJECT",
+        "\x7e\x00\x58\x78\x00\x04\x00\x00\x00\x00",
+        10, ogs_nas_5gmm_decode, NULL },
+    { "AUTHENTICATION FAILURE",
+        "\x7e\x00\x59\x00\x30\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+        "\x00\x00\x00\x00",
+        20, ogs_nas_5gmm_decode, NULL },
+    { "AUTHENTICATION RESULT",
+        "\x7e\x00\x5a\x00\x00\x04\x00\x00\x00\x00\x38\x02\x00\x00",
+        14, ogs_nas_5gmm_decode, NULL },
+    { "IDENTITY REQUEST",
+        "\x7e\x00\x5b\x00",
+        4, ogs_nas_5gmm_decode, NULL },
+    { "IDENTITY RESPONSE",
+        "\x7e\x00\x5c\x00\x01\x00",
+        6, ogs_nas_5gmm_decode, NULL },
+    { "SECURITY MODE COMMAND",
+        "\x7e\x00\x5d\x00\x00\x02\x00\x00\xe0\x57\x00\x36\x01\x00\x78\x00"
+        "\x04\x00\x00\x00\x00\x38\x02\x00\x00\x19\x02\x00\x00",
+        29, ogs_nas_5gmm_decode, NULL },
+    { "SECURITY MODE COMPLETE",
+        "\x7e\x00\x5e\x77\x00\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\x71"
+        "\x00\x01\x00\x78\x00\x04\x00\x00\x00\x00",
+        26, ogs_nas_5gmm_decode, NULL },
+    { "SECURITY MODE REJECT",
+        "\x7e\x00\x5f\x00",
+        4, ogs_nas_5gmm_decode, NULL },
+    { "5GMM STATUS",
+        "\x7e\x00\x64\x00",
+        4, ogs_nas_5gmm_decode, NULL },
+    { "NOTIFICATION",
+        "\x7e\x00\x65\x00",
+        4, ogs_nas_5gmm_decode, NULL },
+    { "NOTIFICATION RESPONSE",
+        "\x7e\x00\x66\x50\x02\x00\x00",
+        7, ogs_nas_5gmm_decode, NULL },
+    { "UL NAS TRANSPORT",
+        "\x7e\x00\x67\x00\x00\x01\x00\x12\x00\x59\x00\x80\x22\x01\x00\x25"
+        "\x01\x00\x24\x01\x00\xa0\xf0",
+        23, ogs_nas_5gmm_decode, NULL },
+    { "DL NAS TRANSPORT",
+        "\x7e\x00\x68\x00\x00\x01\x00\x12\x00\x24\x01\x00\x58\x00\x37\x01"
+        "\x00\x3a\x01\x00",
+        20, ogs_nas_5gmm_decode, NULL },
+    { "PDU SESSION ESTABLISHMENT REQUEST",
+        "\x2e\x01\x01\xc1\x00\x00\x90\xa0\x28\x01\x00\x55\x00\x00\xb0\x39"
+        "\x01\x00\x7b\x00\x01\x00\x66\x03\x00\x00\x00\x6e\x06\x00\x00\x00"
+        "\x00\x00\x00\x6f\x08\x00\x00\x00\x00\x00\x00\x00\x00\x74\x00\x05"
+        "\x00\x00\x00\x00\x00\x1f\x01\x00\x29\x09\x00\x00\x00\x00\x00\x00"
+        "\x00\x00\x00\x72\x00\x03\x00\x00\x00\x70\x00\x05\x00\x00\x00\x00"
+        "\x00\x34\x01\x00\x35\x01\x00",
+        87, ogs_nas_5gsm_decode, NULL },
+    { "PDU SESSION ESTABLISHMENT ACCEPT",
+        "\x2e\x01\x01\xc2\x00\x00\x04\x00\x00\x00\x00\x06\x00\x00\x00\x00"
+        "\x00\x00\x59\x00\x29\x05\x00\x00\x00\x00\x00\x56\x00\x22\x01\x00"
+        "\x80\x75\x00\x04\x00\x00\x00\x00\x78\x00\x04\x00\x00\x00\x00\x79"
+        "\x00\x03\x00\x00\x00\x7b\x00\x01\x00\x25\x01\x00\x17\x01\x00\x18"
+        "\x02\x00\x00\x77\x00\x00\xc0\x66\x03\x00\x00\x00\x1f\x01\x00\x72"
+        "\x00\x03\x00\x00\x00\x71\x00\x06\x00\x00\x00\x00\x00\x00",
+        94, ogs_nas_5gsm_decode, NULL },
+    { "PDU SESSION ESTABLISHMENT REJECT",
+        "\x2e\x01\x01\xc3\x00\x37\x01\x00\xf0\x78\x00\x04\x00\x00\x00\x00"
+        "\x61\x01\x00\x7b\x00\x01\x00\x1d\x01\x00\x72\x00\x03\x00\x00\x00",
+        32, ogs_nas_5gsm_decode, NULL },
+    { "PDU SESSION AUTHENTICATION COMMAND",
+        "\x2e\x01\x01\xc5\x00\x04\x00\x00\x00\x00\x7b\x00\x01\x00",
+        14, ogs_nas_5gsm_decode, NULL },
+    { "PDU SESSION AUTHENTICATION COMPLETE",
+        "\x2e\x01\x01\xc6\x00\x04\x00\x00\x00\x00\x7b\x00\x01\x00",
+        14, ogs_nas_5gsm_decode, NULL },
+    { "PDU SESSION AUTHENTICATION RESULT",
+        "\x2e\x01\x01\xc7\x78\x00\x04\x00\x00\x00\x00\x7b\x00\x01\x00",
+        15, ogs_nas_5gsm_decode, NULL },
+    { "PDU SESSION MODIFICATION REQUEST",
+        "\x2e\x01\x01\xc9\x28\x01\x00\x59\x00\x55\x00\x00\xb0\x13\x00\x00"
+        "\x7a\x00\x04\x00\x00\x00\x00\x79\x00\x03\x00\x00\x00\x75\x00\x04"
+        "\x00\x00\x00\x00\x7b\x00\x01\x00\x74\x00\x01\x00\x66\x03\x00\x00"
+        "\x00\x1f\x01\x00\x70\x00\x05\x00\x00\x00\x00\x00\x72\x00\x03\x00"
+        "\x00\x00",
+        66, ogs_nas_5gsm_decode, NULL },
+    { "PDU SESSION MODIFICATION REJECT",
+        "\x2e\x01\x01\xca\x00\x37\x01\x00\x61\x01\x00\x7b\x00\x01\x00\x1d"
+        "\x01\x00",
+        18, ogs_nas_5gsm_decode, NULL },
+    { "PDU SESSION MODIFICATION COMMAND",
+        "\x2e\x01\x01\xcb\x59\x00\x2a\x06\x00\x00\x00\x00\x00\x00\x56\x00"
+        "\x80\x7a\x00\x04\x00\x00\x00\x00\x75\x00\x04\x00\x00\x00\x00\x79"
+        "\x00\x03\x00\x00\x00\x7b\x00\x01\x00\x77\x00\x00\x66\x03\x00\x00"
+        "\x00\x74\x00\x01\x00\x1e\x02\x00\x00\x1f\x01\x00\x71\x00\x06\x00"
+        "\x00\x00\x00\x00\x00\x72\x00\x03\x00\x00\x00",
+        75, ogs_nas_5gsm_decode, NULL },
+    { "PDU SESSION MODIFICATION COMPLETE",
+        "\x2e\x01\x01\xcc\x7b\x00\x01\x00\x74\x00\x01\x00",
+        12, ogs_nas_5gsm_decode, NULL },
+    { "PDU SESSION MODIFICATION COMMAND REJECT",
+        "\x2e\x01\x01\xcd\x00\x7b\x00\x01\x00",
+        9, ogs_nas_5gsm_decode, NULL },
+    { "PDU SESSION RELEASE REQUEST",
+        "\x2e\x01\x01\xd1\x59\x00\x7b\x00\x01\x00",
+        10, ogs_nas_5gsm_decode, NULL },
+    { "PDU SESSION RELEASE REJECT",
+        "\x2e\x01\x01\xd2\x00\x7b\x00\x01\x00",
+        9, ogs_nas_5gsm_decode, NULL },
+    { "PDU SESSION RELEASE COMMAND",
+        "\x2e\x01\x01\xd3\x00\x37\x01\x00\x78\x00\x04\x00\x00\x00\x00\x61"
+        "\x01\x00\x7b\x00\x01\x00\xd0\x72\x00\x03\x00\x00\x00",
+        29, ogs_nas_5gsm_decode, NULL },
+    { "PDU SESSION RELEASE COMPLETE",
+        "\x2e\x01\x01\xd4\x59\x00\x7b\x00\x01\x00",
+        10, ogs_nas_5gsm_decode, NULL },
+    { "5GSM STATUS",
+        "\x2e\x01\x01\xd6\x00",
+        5, ogs_nas_5gsm_decode, NULL },
+};
+
+int main(int argc, const char *const argv[])
+{
+    int i;
+
+    if (argc > 1)
+        iterations = atoi(argv[1]);
+    if (iterations <= 0) {
+        fprintf(stderr, "Usage: %s [iterations]\n", argv[0]);
+        return EXIT_FAILURE;
+    }
+
+    /* A TLV node for each IE of the largest messages */
+    ogs_core()->tlv.pool = 65536;
+    ogs_core_initialize();
+    ogs_log_install_domain(&__ogs_nas_domain, "nas", OGS_LOG_FATAL);
+
+    printf("protocol,message,path,operation,octets,iterations,"
+            "ns_per_op,ops_per_sec\n");
+    for (i = 0; i < OGS_ARRAY_SIZE(bench_messages); i++)
+        bench_message(&bench_messages[i]);
+
+    ogs_core_terminate();
+
+    return EXIT_SUCCESS;
+}
@@ -0,0 +1,336 @@
+/*
+ * The MIT License
+ *
+ * Copyright (C) 2019-2023 by Sukchan Lee <acetcom@gmail.com>
+ *
+ * This file is part of Open5GS.
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining
+ * a copy of this software and associated documentation files (the
+ * "Software"), to deal in the Software without restriction, including
+ * without limitation the rights to use, copy, modify, merge, publish,
+ * distribute, sublicense, and/or sell copies of the Software, and to
+ * permit persons to whom the Software is furnished to do so, subject to
+ * the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be
+ * included in all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+ * EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+ * MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+ * NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+ * LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+ * OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+ * WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+ */
+
+/*******************************************************************************
+ * This file had been created by nas-message.py script v0.1.0
+ * Please do not modify this file but regenerate it via script.
+ * Created from 24301-h90.docx
+ * (sha256: 1acc20b2dabf84bff1965c46a7d926753c0e7fde48d8126faa12e06d66167125)
+ ******************************************************************************/
+
+/*
+ * Encode and decode cost of each NAS EPS message, all of its IEs present.
+ *
+ *   <this program> [iterations] > nas-eps.csv
+ */
+
+#include "ogs-nas-eps.h"
+
+#define DEFAULT_ITERATIONS 10000
+
+static int iterations = DEFAULT_ITERATIONS;
+
+static void bench_report(const char *message, const char *path,
+        const char *operation, int octets, ogs_time_t start, ogs_time_t stop)
+{
+    double ns = (double)(stop - start) * 1000 / iterations;
+
+    printf("NAS EPS,%s,%s,%s,%d,%d,%.1f,%.0f\n", message, path, operation,
+            octets, iterations, ns, ns > 0 ? 1e9 / ns : 0);
+}
+
+typedef struct bench_message_s {
+    const char *name;
+    const char *payload;
+    int len;
+    int (*decode)(ogs_nas_eps_message_t *message, ogs_pkbuf_t *pkbuf);
+    /* Specialized path, if any */
+    int (*lazy)(ogs_pkbuf_t *pkbuf);
+} bench_message_t;
+
+static ogs_nas_eps_message_t bench_msg;
+
+static void bench_message(const bench_message_t *b)
+{
+    ogs_pkbuf_t *pkbuf = NULL;
+    ogs_time_t start;
+    int i;
+
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_MAX_SDU_LEN);
+    ogs_assert(pkbuf);
+    ogs_pkbuf_put_data(pkbuf, b->payload, b->len);
+
+    if (b->decode(&bench_msg, pkbuf) != OGS_OK) {
+        fprintf(stderr, "%s: cannot be decoded\n", b->name);
+        ogs_pkbuf_free(pkbuf);
+        return;
+    }
+
+    start = ogs_get_monotonic_time();
+    for (i = 0; i < iterations; i++)
+        ogs_pkbuf_free(ogs_nas_eps_plain_encode(&bench_msg));
+    bench_report(b->name, "generic", "encode", b->len,
+            start, ogs_get_monotonic_time());
+
+    start = ogs_get_monotonic_time();
+    for (i = 0; i < iterations; i++)
+        ogs_assert(b->decode(&bench_msg, pkbuf) == OGS_OK);
+    bench_report(b->name, "generic", "decode", b->len,
+            start, ogs_get_monotonic_time());
+
+    if (b->lazy) {
+        start = ogs_get_monotonic_time();
+        for (i = 0; i < iterations; i++)
+            ogs_assert(b->lazy(pkbuf) == OGS_OK);
+        bench_report(b->name, "lazy", "decode", b->len,
+                start, ogs_get_monotonic_time());
+    }
+
+    ogs_pkbuf_free(pkbuf);
+}
+
+static const bench_message_t bench_messages[] = {
+    { "ATTACH REQUEST",
+        "\x07\x41\x00\x04\x00\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00"
+        "\x19\x00\x00\x00\x50\x0b\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+        "\x00\x52\x00\x00\x00\x00\x00\x5c\x00\x00\x31\x02\x00\x00\x13\x00"
+        "\x00\x00\x00\x00\x90\x11\x03\x00\x00\x00\x20\x00\x40\x03\x00\x00"
+        "\x00\xf0\x5d\x01\x00\xd0\xe0\xc0\x10\x02\x00\x00\x6a\x01\x00\x5e"
+        "\x01\x00\x6e\x01\x00\x6f\x04\x00\x00\x00\x00\x6d\x01\x00\x17\x00"
+        "\x32\x01\x00\x34\x01\x00\x35\x01\x00\x36\x01\x00\x38\x02\x00\x00",
+        112, ogs_nas_emm_decode, NULL },
+    { "ATTACH ACCEPT",
+        "\x07\x42\x00\x00\x06\x00\x00\x00\x00\x00\x00\x00\x03\x00\x00\x00"
+        "\x50\x0b\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x13\x00\x00"
+        "\x00\x00\x00\x23\x05\x00\x00\x00\x00\x00\x53\x00\x17\x00\x59\x00"
+        "\x4a\x03\x00\x00\x00\x34\x03\x00\x00\x00\x64\x01\x00\xf0\x5e\x01"
+        "\x00\x6a\x01\x00\x6e\x01\x00\x65\x02\x00\x00\xe0\xd0\x6b\x01\x00"
+        "\xc0\x6c\x01\x00\x7a\x00\x04\x00\x00\x00\x00\x7c\x00\x20\x00\x00"
+        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x66\x01"
+        "\x00\xb0\x35\x01\x00\x36\x01\x00\x38\x02\x00\x00\x1d\x06\x00\x00"
+        "\x00\x00\x00\x00\x1e\x06\x00\x00\x00\x00\x00\x00",
+        156, ogs_nas_emm_decode, NULL },
+    { "ATTACH COMPLETE",
+        "\x07\x43\x00\x03\x00\x00\x00",
+        7, ogs_nas_emm_decode, NULL },
+    { "ATTACH REJECT",
+        "\x07\x44\x00\x78\x00\x03\x00\x00\x00\x5f\x01\x00\x16\x01\x00\xa0"
+        "\x1c\x01\x00\x1d\x06\x00\x00\x00\x00\x00\x00\x1e\x06\x00\x00\x00"
+        "\x00\x00\x00",
+        35, ogs_nas_emm_decode, NULL },
+    { "TRACKING AREA UPDATE REQUEST",
+        "\x07\x48\x00\x0b\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb0"
+        "\x80\x19\x00\x00\x00\x50\x0b\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+        "\x00\x00\x55\x00\x00\x00\x00\x58\x02\x00\x00\x52\x00\x00\x00\x00"
+        "\x00\x5c\x00\x00\xa0\x57\x02\x00\x00\x31\x02\x00\x00\x13\x00\x00"
+        "\x00\x00\x00\x90\x11\x03\x00\x00\x00\x20\x00\x40\x03\x00\x00\x00"
+        "\xf0\x5d\x01\x00\xe0\xd0\xc0\x10\x02\x00\x00\x6a\x01\x00\x5e\x01"
+        "\x00\x6e\x01\x00\x6f\x04\x00\x00\x00\x00\x6d\x01\x00\x17\x00\x32"
+        "\x01\x00\x34\x01\x00\x35\x01\x00\x36\x01\x00\x38\x02\x00\x00\x29"
+        "\x01\x00\x28\x01\x00",
+        133, ogs_nas_emm_decode, NULL },
+    { "TRACKING AREA UPDATE ACCEPT",
+        "\x07\x49\x00\x5a\x00\x50\x0b\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+        "\x00\x00\x54\x06\x00\x00\x00\x00\x00\x00\x57\x02\x00\x00\x13\x00"
+        "\x00\x00\x00\x00\x23\x05\x00\x00\x00\x00\x00\x53\x00\x17\x00\x59"
+        "\x00\x4a\x03\x00\x00\x00\x34\x03\x00\x00\x00\x64\x01\x00\xf0\x5e"
+        "\x01\x00\x6a\x01\x00\x6e\x01\x00\x68\x02\x00\x00\x65\x02\x00\x00"
+        "\xe0\xd0\x6b\x01\x00\xc0\x6c\x01\x00\x7a\x00\x04\x00\x00\x00\x00"
+        "\x7c\x00\x20\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+        "\x00\x00\x00\x66\x01\x00\xb0\x35\x01\x00\x36\x01\x00\x38\x02\x00"
+        "\x00\x37\x01\x00\x1d\x06\x00\x00\x00\x00\x00\x00\x1e\x06\x00\x00"
+        "\x00\x00\x00\x00",
+        164, ogs_nas_emm_decode, NULL },
+    { "TRACKING AREA UPDATE REJECT",
+        "\x07\x4b\x00\x5f\x01\x00\xa0\x1c\x01\x00\x1d\x07\x00\x00\x00\x00"
+        "\x00\x00\x00\x1e\x07\x00\x00\x00\x00\x00\x00\x00",
+        28, ogs_nas_emm_decode, NULL },
+    { "EXTENDED SERVICE REQUEST",
+        "\x07\x4c\x00\x05\x00\x00\x00\x00\x00\xb0\x57\x02\x00\x00\xd0\x29"
+        "\x01\x00\x28\x01\x00",
+        21, ogs_nas_emm_decode, NULL },
+    { "SERVICE REJECT",
+        "\x07\x4e\x00\x5b\x00\x5f\x01\x00\x6b\x01\x00\x1c\x01\x00\x1d\x07"
+        "\x00\x00\x00\x00\x00\x00\x00\x1e\x07\x00\x00\x00\x00\x00\x00\x00",
+        32, ogs_nas_emm_decode, NULL },
+    { "GUTI REALLOCATION COMMAND",
+        "\x07\x50\x0b\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x54\x06"
+        "\x00\x00\x00\x00\x00\x00\x65\x02\x00\x00\x66\x01\x00\xb0",
+        30, ogs_nas_emm_decode, NULL },
+    { "AUTHENTICATION REQUEST",
+        "\x07\x52\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+        "\x00\x00\x00\x10\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+        "\x00\x00\x00\x00",
+        36, ogs_nas_emm_decode, NULL },
+    { "AUTHENTICATION RESPONSE",
+        "\x07\x53\x04\x00\x00\x00\x00",
+        7, ogs_nas_emm_decode, NULL },
+    { "IDENTITY REQUEST",
+        "\x07\x55\x00",
+        3, ogs_nas_emm_decode, NULL },
+    { "IDENTITY RESPONSE",
+        "\x07\x56\x03\x00\x00\x00",
+        6, ogs_nas_emm_decode, NULL },
+    { "AUTHENTICATION FAILURE",
+        "\x07\x5c\x00\x30\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+        "\x00\x00\x00",
+        19, ogs_nas_emm_decode, NULL },
+    { "SECURITY MODE COMMAND",
+        "\x07\x5d\x00\x00\x02\x00\x00\xc0\x55\x00\x00\x00\x00\x56\x00\x00"
+        "\x00\x00\x4f\x08\x00\x00\x00\x00\x00\x00\x00\x00\x6f\x04\x00\x00"
+        "\x00\x00\x37\x01\x00",
+        37, ogs_nas_emm_decode, NULL },
+    { "SECURITY MODE COMPLETE",
+        "\x07\x5e\x23\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\x79\x00\x00"
+        "\x66\x01\x00",
+        19, ogs_nas_emm_decode, NULL },
+    { "SECURITY MODE REJECT",
+        "\x07\x5f\x00",
+        3, ogs_nas_emm_decode, NULL },
+    { "EMM STATUS",
+        "\x07\x60\x00",
+        3, ogs_nas_emm_decode, NULL },
+    { "EMM INFORMATION",
+        "\x07\x61\x43\x01\x00\x45\x01\x00\x46\x00\x47\x00\x00\x00\x00\x00"
+        "\x00\x00\x49\x01\x00",
+        21, ogs_nas_emm_decode, NULL },
+    { "DOWNLINK NAS TRANSPORT",
+        "\x07\x62\x02\x00\x00",
+        5, ogs_nas_emm_decode, NULL },
+    { "UPLINK NAS TRANSPORT",
+        "\x07\x63\x02\x00\x00",
+        5, ogs_nas_emm_decode, NULL },
+    { "CS SERVICE NOTIFICATION",
+        "\x07\x64\x00\x60\x01\x00\x61\x00\x62\x00\x63\x01\x00",
+        13, ogs_nas_emm_decode, NULL },
+    { "UPLINK GENERIC NAS TRANSPORT",
+        "\x07\x65\x00\x00\x01\x00\x65\x01\x00",
+        9, ogs_nas_emm_decode, NULL },
+    { "DOWNLINK GENERIC NAS TRANSPORT",
+        "\x07\x68\x00\x00\x01\x00\x65\x01\x00",
+        9, ogs_nas_emm_decode, NULL },
+    { "ACTIVATE DEFAULT EPS BEARER CONTEXT REQUEST",
+        "\x52\x01\xc1\x01\x00\x01\x00\x05\x00\x00\x00\x00\x00\x5d\x01\x00"
+        "\x30\x0c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x32\x00"
+        "\x80\x34\x01\x00\x5e\x02\x00\x00\x58\x00\x27\x01\x00\xb0\xc0\x33"
+        "\x01\x00\x66\x03\x00\x00\x00\x90\x7b\x00\x01\x00\x6e\x02\x00\x00"
+        "\x5f\x06\x00\x00\x00\x00\x00\x00",
+        72, ogs_nas_esm_decode, NULL },
+    { "ACTIVATE DEFAULT EPS BEARER CONTEXT ACCEPT",
+        "\x52\x01\xc2\x27\x01\x00\x7b\x00\x01\x00",
+        10, ogs_nas_esm_decode, NULL },
+    { "ACTIVATE DEFAULT EPS BEARER CONTEXT REJECT",
+        "\x52\x01\xc3\x00\x27\x01\x00\x7b\x00\x01\x00",
+        11, ogs_nas_esm_decode, NULL },
+    { "ACTIVATE DEDICATED EPS BEARER CONTEXT REQUEST",
+        "\x52\x01\xc5\x00\x01\x00\x01\x00\x5d\x01\x00\x30\x0c\x00\x00\x00"
+        "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x32\x00\x80\x34\x01\x00\x27"
+        "\x01\x00\xc0\x33\x01\x00\x7b\x00\x01\x00\x5c\x0a\x00\x00\x00\x00"
+        "\x00\x00\x00\x00\x00\x00",
+        54, ogs_nas_esm_decode, NULL },
+    { "ACTIVATE DEDICATED EPS BEARER CONTEXT ACCEPT",
+        "\x52\x01\xc6\x27\x01\x00\x33\x01\x00\x7b\x00\x01\x00",
+        13, ogs_nas_esm_decode, NULL },
+    { "ACTIVATE DEDICATED EPS BEARER CONTEXT REJECT",
+        "\x52\x01\xc7\x00\x27\x01\x00\x33\x01\x00\x7b\x00\x01\x00",
+        14, ogs_nas_esm_decode, NULL },
+    { "MODIFY EPS BEARER CONTEXT REQUEST",
+        "\x52\x01\xc9\x5b\x01\x00\x36\x01\x00\x30\x0c\x00\x00\x00\x00\x00"
+        "\x00\x00\x00\x00\x00\x00\x00\x32\x00\x80\x34\x01\x00\x5e\x02\x00"
+        "\x00\x27\x01\x00\xc0\x33\x01\x00\x66\x03\x00\x00\x00\x7b\x00\x01"
+        "\x00\x5f\x06\x00\x00\x00\x00\x00\x00\x5c\x0a\x00\x00\x00\x00\x00"
+        "\x00\x00\x00\x00\x00",
+        69, ogs_nas_esm_decode, NULL },
+    { "MODIFY EPS BEARER CONTEXT ACCEPT",
+        "\x52\x01\xca\x27\x01\x00\x33\x01\x00\x7b\x00\x01\x00",
+        13, ogs_nas_esm_decode, NULL },
+    { "MODIFY EPS BEARER CONTEXT REJECT",
+        "\x52\x01\xcb\x00\x27\x01\x00\x33\x01\x00\x7b\x00\x01\x00",
+        14, ogs_nas_esm_decode, NULL },
+    { "DEACTIVATE EPS BEARER CONTEXT REQUEST",
+        "\x52\x01\xcd\x00\x27\x01\x00\x37\x01\x00\xc0\x33\x01\x00\x7b\x00"
+        "\x01\x00",
+        18, ogs_nas_esm_decode, NULL },
+    { "DEACTIVATE EPS BEARER CONTEXT ACCEPT",
+        "\x52\x01\xce\x27\x01\x00\x7b\x00\x01\x00",
+        10, ogs_nas_esm_decode, NULL },
+    { "PDN CONNECTIVITY REQUEST",
+        "\x52\x01\xd0\x00\xd0\x28\x01\x00\x27\x01\x00\xc0\x33\x01\x00\x66"
+        "\x03\x00\x00\x00\x7b\x00\x01\x00",
+        24, ogs_nas_esm_decode, NULL },
+    { "PDN CONNECTIVITY REJECT",
+        "\x52\x01\xd1\x00\x27\x01\x00\x37\x01\x00\x6b\x01\x00\x33\x01\x00"
+        "\x7b\x00\x01\x00",
+        20, ogs_nas_esm_decode, NULL },
+    { "PDN DISCONNECT REQUEST",
+        "\x52\x01\xd2\x00\x27\x01\x00\x7b\x00\x01\x00",
+        11, ogs_nas_esm_decode, NULL },
+    { "PDN DISCONNECT REJECT",
+        "\x52\x01\xd3\x00\x27\x01\x00\x7b\x00\x01\x00",
+        11, ogs_nas_esm_decode, NULL },
+    { "BEARER RESOURCE ALLOCATION REQUEST",
+        "\x52\x01\xd4\x00\x01\x00\x01\x00\x27\x01\x00\xc0\x33\x01\x00\x7b"
+        "\x00\x01\x00\x5c\x0a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00",
+        31, ogs_nas_esm_decode, NULL },
+    { "BEARER RESOURCE ALLOCATION REJECT",
+        "\x52\x01\xd5\x00\x27\x01\x00\x37\x01\x00\x6b\x01\x00\x33\x01\x00"
+        "\x7b\x00\x01\x00",
+        20, ogs_nas_esm_decode, NULL },
+    { "BEARER RESOURCE MODIFICATION REQUEST",
+        "\x52\x01\xd6\x00\x01\x00\x5b\x01\x00\x58\x00\x27\x01\x00\xc0\x33"
+        "\x01\x00\x66\x03\x00\x00\x00\x7b\x00\x01\x00\x5c\x0a\x00\x00\x00"
+        "\x00\x00\x00\x00\x00\x00\x00",
+        39, ogs_nas_esm_decode, NULL },
+    { "BEARER RESOURCE MODIFICATION REJECT",
+        "\x52\x01\xd7\x00\x27\x01\x00\x37\x01\x00\x6b\x01\x00\x33\x01\x00"
+        "\x7b\x00\x01\x00",
+        20, ogs_nas_esm_decode, NULL },
+    { "ESM INFORMATION RESPONSE",
+        "\x52\x01\xda\x28\x01\x00\x27\x01\x00\x7b\x00\x01\x00",
+        13, ogs_nas_esm_decode, NULL },
+    { "ESM STATUS",
+        "\x52\x01\xe8\x00",
+        4, ogs_nas_esm_decode, NULL },
+};
+
+int main(int argc, const char *const argv[])
+{
+    int i;
+
+    if (argc > 1)
+        iterations = atoi(argv[1]);
+    if (iterations <= 0) {
+        fprintf(stderr, "Usage: %s [iterations]\n", argv[0]);
+        return EXIT_FAILURE;
+    }
+
+    /* A TLV node for each IE of the largest messages */
+    ogs_core()->tlv.pool = 65536;
+    ogs_core_initialize();
+    ogs_log_install_domain(&__ogs_nas_domain, "nas", OGS_LOG_FATAL);
+
+    printf("protocol,message,path,operation,octets,iterations,"
+            "ns_per_op,ops_per_sec\n");
+    for (i = 0; i < OGS_ARRAY_SIZE(bench_messages); i++)
+        bench_message(&bench_messages[i]);
+
+    ogs_core_terminate();
+
+    return EXIT_SUCCESS;
+}
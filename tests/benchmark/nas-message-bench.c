@@ -0,0 +1,153 @@
+/*
+ * Copyright (C) 2026 by Sukchan Lee <acetcom@gmail.com>
+ *
+ * This file is part of Open5GS.
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Affero General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+/*
+ * Per-message decode cost of the NAS codecs.
+ *
+ * Build once with the default flags and once with -DOGS_NAS_NO_TRACE
+ * (or buildtype=release) to compare the cost of the per-IE trace.
+ *
+ *   nas-message-bench [iterations]
+ */
+
+#include "ogs-nas-eps.h"
+#include "ogs-nas-5gs.h"
+
+#define DEFAULT_ITERATIONS 1000000
+
+static ogs_pkbuf_t *bench_pkbuf(const char *payload)
+{
+    ogs_pkbuf_t *pkbuf;
+    char hexbuf[OGS_HUGE_LEN];
+    int len = strlen(payload) / 2;
+
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_MAX_SDU_LEN);
+    ogs_assert(pkbuf);
+    ogs_pkbuf_put_data(pkbuf,
+            ogs_hex_from_string(payload, hexbuf, sizeof(hexbuf)), len);
+
+    return pkbuf;
+}
+
+static void bench_report(const char *name,
+        int iterations, ogs_time_t start, ogs_time_t stop)
+{
+    printf("%-32s %10d %10.1f ns/msg\n", name, iterations,
+            (double)(stop - start) * 1000 / iterations);
+}
+
+static void bench_nas_eps(int iterations)
+{
+    /* Attach Request */
+    const char *payload =
+        "0741020bf600f110000201030003e605"
+        "f07000001000050215d011d15200f110"
+        "30395c0a003103e5e0349011035758a6"
+        "5d0100e0c1";
+
+    ogs_nas_eps_message_t message;
+    ogs_pkbuf_t *pkbuf;
+    ogs_time_t start;
+    int i;
+
+    pkbuf = bench_pkbuf(payload);
+
+    start = ogs_get_monotonic_time();
+    for (i = 0; i < iterations; i++)
+        ogs_assert(ogs_nas_emm_decode(&message, pkbuf) == OGS_OK);
+    bench_report("EPS Attach Request", iterations,
+            start, ogs_get_monotonic_time());
+
+    ogs_pkbuf_free(pkbuf);
+}
+
+static void bench_nas_5gs(int iterations)
+{
+    /* Registration Request */
+    const char *payload =
+        "7e004179000d0100f110000000000000"
+        "0000102e04f0f0f0f0c12f0201014002"
+        "00207100037e0041";
+
+    ogs_nas_5gs_message_t message;
+    ogs_pkbuf_t *pkbuf;
+    ogs_time_t start;
+    int i;
+
+    pkbuf = bench_pkbuf(payload);
+
+    start = ogs_get_monotonic_time();
+    for (i = 0; i < iterations; i++)
+        ogs_assert(ogs_nas_5gmm_decode(&message, pkbuf) == OGS_OK);
+    bench_report("5GS Registration Request", iterations,
+            start, ogs_get_monotonic_time());
+
+    ogs_pkbuf_free(pkbuf);
+}
+
+static void bench_nas_5gs_lazy(int iterations)
+{
+    /* Registration Request, of which only one optional IE is looked at */
+    const char *payload =
+        "7e004179000d0100f110000000000000"
+        "0000102e04f0f0f0f0c12f0201014002"
+        "00207100037e0041";
+
+    ogs_nas_5gs_registration_request_lazy_t lazy;
+    ogs_pkbuf_t *pkbuf;
+    ogs_time_t start;
+    int i;
+
+    pkbuf = bench_pkbuf(payload);
+
+    start = ogs_get_monotonic_time();
+    for (i = 0; i < iterations; i++) {
+        ogs_assert(ogs_nas_5gs_decode_registration_request_lazy(
+                    &lazy, pkbuf) == OGS_OK);
+        ogs_assert(ogs_nas_5gs_registration_request_ue_security_capability(
+                    &lazy));
+    }
+    bench_report("5GS Registration Request (lazy)", iterations,
+            start, ogs_get_monotonic_time());
+
+    ogs_pkbuf_free(pkbuf);
+}
+
+int main(int argc, const char *const argv[])
+{
+    int iterations = DEFAULT_ITERATIONS;
+
+    if (argc > 1)
+        iterations = atoi(argv[1]);
+    if (iterations <= 0) {
+        fprintf(stderr, "Usage: %s [iterations]\n", argv[0]);
+        return EXIT_FAILURE;
+    }
+
+    ogs_core_initialize();
+    ogs_log_install_domain(&__ogs_nas_domain, "nas", ogs_core()->log.level);
+
+    bench_nas_eps(iterations);
+    bench_nas_5gs(iterations);
+    bench_nas_5gs_lazy(iterations);
+
+    ogs_core_terminate();
+
+    return EXIT_SUCCESS;
+}
@@ -0,0 +1,388 @@
+/*
+ * Copyright (C) 2019-2023 by Sukchan Lee <acetcom@gmail.com>
+ *
+ * This file is part of Open5GS.
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Affero General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+/*******************************************************************************
+ * This file had been created by pfcp-tlv.py script v0.1.0
+ * Please do not modify this file but regenerate it via script.
+ * Created from 29244-h71-modified.docx
+ * (sha256: 6c94e2b5b45cdb1370a468345443ff773a37662de002639cf6a33bb64fd7c166)
+ ******************************************************************************/
+
+/*
+ * Encode and decode cost of each PFCP message, all of its IEs present.
+ *
+ *   <this program> [iterations] > pfcp.csv
+ */
+
+#include "ogs-pfcp.h"
+#include "unit/tlv-message.h"
+
+#define DEFAULT_ITERATIONS 10000
+
+static int iterations = DEFAULT_ITERATIONS;
+
+static void bench_report(const char *message, const char *path,
+        const char *operation, int octets, ogs_time_t start, ogs_time_t stop)
+{
+    double ns = (double)(stop - start) * 1000 / iterations;
+
+    printf("PFCP,%s,%s,%s,%d,%d,%.1f,%.0f\n", message, path, operation,
+            octets, iterations, ns, ns > 0 ? 1e9 / ns : 0);
+}
+
+/* Every IE present, the first one of those that repeat */
+static const test_tlv_fill_t bench_fill = {
+    .one_in = 1, .more = 1, .depth = 8, .octets = 8, .random = false,
+};
+
+typedef struct bench_message_s {
+    const char *name;
+    const ogs_tlv_desc_t *desc;
+    size_t size;
+    /* Specialized paths, if any */
+    ogs_pkbuf_t *(*build)(void *msg);
+    int (*parse)(void *msg, ogs_pkbuf_t *pkbuf);
+} bench_message_t;
+
+static ogs_pfcp_message_t bench_msg, bench_parsed;
+
+static void bench_message(const bench_message_t *b)
+{
+    ogs_pkbuf_t *pkbuf = NULL;
+    ogs_time_t start;
+    int i, octets;
+
+    memset(&bench_msg, 0, b->size);
+    test_tlv_message_fill(b->desc, &bench_msg, &bench_fill);
+
+    /* The wire format decoded below */
+    pkbuf = ogs_tlv_build_msg(b->desc, &bench_msg, OGS_TLV_MODE_T2_L2);
+    ogs_assert(pkbuf);
+    octets = pkbuf->len;
+
+    start = ogs_get_monotonic_time();
+    for (i = 0; i < iterations; i++)
+        ogs_pkbuf_free(ogs_tlv_build_msg(b->desc, &bench_msg, OGS_TLV_MODE_T2_L2));
+    bench_report(b->name, "generic", "encode", octets,
+            start, ogs_get_monotonic_time());
+
+    start = ogs_get_monotonic_time();
+    for (i = 0; i < iterations; i++) {
+        memset(&bench_parsed, 0, b->size);
+        ogs_assert(ogs_tlv_parse_msg(&bench_parsed, b->desc, pkbuf, OGS_TLV_MODE_T2_L2) == OGS_OK);
+    }
+    bench_report(b->name, "generic", "decode", octets,
+            start, ogs_get_monotonic_time());
+
+    if (b->build) {
+        start = ogs_get_monotonic_time();
+        for (i = 0; i < iterations; i++)
+            ogs_pkbuf_free(b->build(&bench_msg));
+        bench_report(b->name, "direct", "encode", octets,
+                start, ogs_get_monotonic_time());
+    }
+
+    if (b->parse) {
+        start = ogs_get_monotonic_time();
+        for (i = 0; i < iterations; i++) {
+            memset(&bench_parsed, 0, b->size);
+            ogs_assert(b->parse(&bench_parsed, pkbuf) == OGS_OK);
+        }
+        bench_report(b->name, "direct", "decode", octets,
+                start, ogs_get_monotonic_time());
+    }
+
+    ogs_pkbuf_free(pkbuf);
+}
+
+static ogs_pkbuf_t *bench_build_pfcp_heartbeat_request(void *msg)
+{
+    return ogs_pfcp_build_heartbeat_request_direct(msg);
+}
+
+static int bench_parse_pfcp_heartbeat_request(void *msg, ogs_pkbuf_t *pkbuf)
+{
+    return ogs_pfcp_parse_heartbeat_request_direct(msg, pkbuf);
+}
+
+static ogs_pkbuf_t *bench_build_pfcp_heartbeat_response(void *msg)
+{
+    return ogs_pfcp_build_heartbeat_response_direct(msg);
+}
+
+static int bench_parse_pfcp_heartbeat_response(void *msg, ogs_pkbuf_t *pkbuf)
+{
+    return ogs_pfcp_parse_heartbeat_response_direct(msg, pkbuf);
+}
+
+static ogs_pkbuf_t *bench_build_pfcp_pfd_management_request(void *msg)
+{
+    return ogs_pfcp_build_pfd_management_request_direct(msg);
+}
+
+static ogs_pkbuf_t *bench_build_pfcp_pfd_management_response(void *msg)
+{
+    return ogs_pfcp_build_pfd_management_response_direct(msg);
+}
+
+static ogs_pkbuf_t *bench_build_pfcp_association_setup_request(void *msg)
+{
+    return ogs_pfcp_build_association_setup_request_direct(msg);
+}
+
+static ogs_pkbuf_t *bench_build_pfcp_association_setup_response(void *msg)
+{
+    return ogs_pfcp_build_association_setup_response_direct(msg);
+}
+
+static ogs_pkbuf_t *bench_build_pfcp_association_update_request(void *msg)
+{
+    return ogs_pfcp_build_association_update_request_direct(msg);
+}
+
+static ogs_pkbuf_t *bench_build_pfcp_association_update_response(void *msg)
+{
+    return ogs_pfcp_build_association_update_response_direct(msg);
+}
+
+static ogs_pkbuf_t *bench_build_pfcp_association_release_request(void *msg)
+{
+    return ogs_pfcp_build_association_release_request_direct(msg);
+}
+
+static ogs_pkbuf_t *bench_build_pfcp_association_release_response(void *msg)
+{
+    return ogs_pfcp_build_association_release_response_direct(msg);
+}
+
+static ogs_pkbuf_t *bench_build_pfcp_node_report_request(void *msg)
+{
+    return ogs_pfcp_build_node_report_request_direct(msg);
+}
+
+static ogs_pkbuf_t *bench_build_pfcp_node_report_response(void *msg)
+{
+    return ogs_pfcp_build_node_report_response_direct(msg);
+}
+
+static ogs_pkbuf_t *bench_build_pfcp_session_set_deletion_request(void *msg)
+{
+    return ogs_pfcp_build_session_set_deletion_request_direct(msg);
+}
+
+static ogs_pkbuf_t *bench_build_pfcp_session_set_deletion_response(void *msg)
+{
+    return ogs_pfcp_build_session_set_deletion_response_direct(msg);
+}
+
+static ogs_pkbuf_t *bench_build_pfcp_session_set_modification_request(void *msg)
+{
+    return ogs_pfcp_build_session_set_modification_request_direct(msg);
+}
+
+static ogs_pkbuf_t *bench_build_pfcp_session_set_modification_response(void *msg)
+{
+    return ogs_pfcp_build_session_set_modification_response_direct(msg);
+}
+
+static ogs_pkbuf_t *bench_build_pfcp_session_establishment_request(void *msg)
+{
+    return ogs_pfcp_build_session_establishment_request_direct(msg);
+}
+
+static int bench_parse_pfcp_session_establishment_request(void *msg, ogs_pkbuf_t *pkbuf)
+{
+    return ogs_pfcp_parse_session_establishment_request_direct(msg, pkbuf);
+}
+
+static ogs_pkbuf_t *bench_build_pfcp_session_establishment_response(void *msg)
+{
+    return ogs_pfcp_build_session_establishment_response_direct(msg);
+}
+
+static int bench_parse_pfcp_session_establishment_response(void *msg, ogs_pkbuf_t *pkbuf)
+{
+    return ogs_pfcp_parse_session_establishment_response_direct(msg, pkbuf);
+}
+
+static ogs_pkbuf_t *bench_build_pfcp_session_modification_request(void *msg)
+{
+    return ogs_pfcp_build_session_modification_request_direct(msg);
+}
+
+static int bench_parse_pfcp_session_modification_request(void *msg, ogs_pkbuf_t *pkbuf)
+{
+    return ogs_pfcp_parse_session_modification_request_direct(msg, pkbuf);
+}
+
+static ogs_pkbuf_t *bench_build_pfcp_session_modification_response(void *msg)
+{
+    return ogs_pfcp_build_session_modification_response_direct(msg);
+}
+
+static int bench_parse_pfcp_session_modification_response(void *msg, ogs_pkbuf_t *pkbuf)
+{
+    return ogs_pfcp_parse_session_modification_response_direct(msg, pkbuf);
+}
+
+static ogs_pkbuf_t *bench_build_pfcp_session_deletion_response(void *msg)
+{
+    return ogs_pfcp_build_session_deletion_response_direct(msg);
+}
+
+static ogs_pkbuf_t *bench_build_pfcp_session_report_request(void *msg)
+{
+    return ogs_pfcp_build_session_report_request_direct(msg);
+}
+
+static int bench_parse_pfcp_session_report_request(void *msg, ogs_pkbuf_t *pkbuf)
+{
+    return ogs_pfcp_parse_session_report_request_direct(msg, pkbuf);
+}
+
+static ogs_pkbuf_t *bench_build_pfcp_session_report_response(void *msg)
+{
+    return ogs_pfcp_build_session_report_response_direct(msg);
+}
+
+static int bench_parse_pfcp_session_report_response(void *msg, ogs_pkbuf_t *pkbuf)
+{
+    return ogs_pfcp_parse_session_report_response_direct(msg, pkbuf);
+}
+
+static const bench_message_t bench_messages[] = {
+    { "PFCP Heartbeat Request", &ogs_pfcp_msg_desc_pfcp_heartbeat_request,
+        sizeof(ogs_pfcp_heartbeat_request_t),
+        bench_build_pfcp_heartbeat_request,
+        bench_parse_pfcp_heartbeat_request },
+    { "PFCP Heartbeat Response", &ogs_pfcp_msg_desc_pfcp_heartbeat_response,
+        sizeof(ogs_pfcp_heartbeat_response_t),
+        bench_build_pfcp_heartbeat_response,
+        bench_parse_pfcp_heartbeat_response },
+    { "PFCP PFD Management Request", &ogs_pfcp_msg_desc_pfcp_pfd_management_request,
+        sizeof(ogs_pfcp_pfd_management_request_t),
+        bench_build_pfcp_pfd_management_request,
+        NULL },
+    { "PFCP PFD Management Response", &ogs_pfcp_msg_desc_pfcp_pfd_management_response,
+        sizeof(ogs_pfcp_pfd_management_response_t),
+        bench_build_pfcp_pfd_management_response,
+        NULL },
+    { "PFCP Association Setup Request", &ogs_pfcp_msg_desc_pfcp_association_setup_request,
+        sizeof(ogs_pfcp_association_setup_request_t),
+        bench_build_pfcp_association_setup_request,
+        NULL },
+    { "PFCP Association Setup Response", &ogs_pfcp_msg_desc_pfcp_association_setup_response,
+        sizeof(ogs_pfcp_association_setup_response_t),
+        bench_build_pfcp_association_setup_response,
+        NULL },
+    { "PFCP Association Update Request", &ogs_pfcp_msg_desc_pfcp_association_update_request,
+        sizeof(ogs_pfcp_association_update_request_t),
+        bench_build_pfcp_association_update_request,
+        NULL },
+    { "PFCP Association Update Response", &ogs_pfcp_msg_desc_pfcp_association_update_response,
+        sizeof(ogs_pfcp_association_update_response_t),
+        bench_build_pfcp_association_update_response,
+        NULL },
+    { "PFCP Association Release Request", &ogs_pfcp_msg_desc_pfcp_association_release_request,
+        sizeof(ogs_pfcp_association_release_request_t),
+        bench_build_pfcp_association_release_request,
+        NULL },
+    { "PFCP Association Release Response", &ogs_pfcp_msg_desc_pfcp_association_release_response,
+        sizeof(ogs_pfcp_association_release_response_t),
+        bench_build_pfcp_association_release_response,
+        NULL },
+    { "PFCP Node Report Request", &ogs_pfcp_msg_desc_pfcp_node_report_request,
+        sizeof(ogs_pfcp_node_report_request_t),
+        bench_build_pfcp_node_report_request,
+        NULL },
+    { "PFCP Node Report Response", &ogs_pfcp_msg_desc_pfcp_node_report_response,
+        sizeof(ogs_pfcp_node_report_response_t),
+        bench_build_pfcp_node_report_response,
+        NULL },
+    { "PFCP Session Set Deletion Request", &ogs_pfcp_msg_desc_pfcp_session_set_deletion_request,
+        sizeof(ogs_pfcp_session_set_deletion_request_t),
+        bench_build_pfcp_session_set_deletion_request,
+        NULL },
+    { "PFCP Session Set Deletion Response", &ogs_pfcp_msg_desc_pfcp_session_set_deletion_response,
+        sizeof(ogs_pfcp_session_set_deletion_response_t),
+        bench_build_pfcp_session_set_deletion_response,
+        NULL },
+    { "PFCP Session Set Modification Request", &ogs_pfcp_msg_desc_pfcp_session_set_modification_request,
+        sizeof(ogs_pfcp_session_set_modification_request_t),
+        bench_build_pfcp_session_set_modification_request,
+        NULL },
+    { "PFCP Session Set Modification Response", &ogs_pfcp_msg_desc_pfcp_session_set_modification_response,
+        sizeof(ogs_pfcp_session_set_modification_response_t),
+        bench_build_pfcp_session_set_modification_response,
+        NULL },
+    { "PFCP Session Establishment Request", &ogs_pfcp_msg_desc_pfcp_session_establishment_request,
+        sizeof(ogs_pfcp_session_establishment_request_t),
+        bench_build_pfcp_session_establishment_request,
+        bench_parse_pfcp_session_establishment_request },
+    { "PFCP Session Establishment Response", &ogs_pfcp_msg_desc_pfcp_session_establishment_response,
+        sizeof(ogs_pfcp_session_establishment_response_t),
+        bench_build_pfcp_session_establishment_response,
+        bench_parse_pfcp_session_establishment_response },
+    { "PFCP Session Modification Request", &ogs_pfcp_msg_desc_pfcp_session_modification_request,
+        sizeof(ogs_pfcp_session_modification_request_t),
+        bench_build_pfcp_session_modification_request,
+        bench_parse_pfcp_session_modification_request },
+    { "PFCP Session Modification Response", &ogs_pfcp_msg_desc_pfcp_session_modification_response,
+        sizeof(ogs_pfcp_session_modification_response_t),
+        bench_build_pfcp_session_modification_response,
+        bench_parse_pfcp_session_modification_response },
+    { "PFCP Session Deletion Response", &ogs_pfcp_msg_desc_pfcp_session_deletion_response,
+        sizeof(ogs_pfcp_session_deletion_response_t),
+        bench_build_pfcp_session_deletion_response,
+        NULL },
+    { "PFCP Session Report Request", &ogs_pfcp_msg_desc_pfcp_session_report_request,
+        sizeof(ogs_pfcp_session_report_request_t),
+        bench_build_pfcp_session_report_request,
+        bench_parse_pfcp_session_report_request },
+    { "PFCP Session Report Response", &ogs_pfcp_msg_desc_pfcp_session_report_response,
+        sizeof(ogs_pfcp_session_report_response_t),
+        bench_build_pfcp_session_report_response,
+        bench_parse_pfcp_session_report_response },
+};
+
+int main(int argc, const char *const argv[])
+{
+    int i;
+
+    if (argc > 1)
+        iterations = atoi(argv[1]);
+    if (iterations <= 0) {
+        fprintf(stderr, "Usage: %s [iterations]\n", argv[0]);
+        return EXIT_FAILURE;
+    }
+
+    /* A TLV node for each IE of the largest messages */
+    ogs_core()->tlv.pool = 65536;
+    ogs_core_initialize();
+    ogs_log_install_domain(&__ogs_pfcp_domain, "pfcp", OGS_LOG_ERROR);
+
+    printf("protocol,message,path,operation,octets,iterations,"
+            "ns_per_op,ops_per_sec\n");
+    for (i = 0; i < OGS_ARRAY_SIZE(bench_messages); i++)
+        bench_message(&bench_messages[i]);
+
+    ogs_core_terminate();
+
+    return EXIT_SUCCESS;
+}
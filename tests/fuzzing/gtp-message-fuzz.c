@@ -24,7 +24,7 @@
 #include "ogs-gtp.h"
 
 #define kMinInputLength 5
-#define kMaxInputLength 1024
+#define kMaxInputLength OGS_MAX_SDU_LEN
 
 extern int LLVMFuzzerTestOneInput(const uint8_t *Data, size_t Size) 
 { /* open5gs/tests/non3gpp/gtp-path.c */
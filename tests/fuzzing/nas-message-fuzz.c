@@ -49,7 +49,10 @@ extern int LLVMFuzzerTestOneInput(const uint8_t *Data, size_t Size)
 
     ogs_pkbuf_put_data(pkbuf, Data, Size);
 
-    result = ogs_nas_emm_decode(&message, pkbuf);
+    if ((Data[0] & 0x0f) == OGS_NAS_PROTOCOL_DISCRIMINATOR_ESM)
+        result = ogs_nas_esm_decode(&message, pkbuf);
+    else
+        result = ogs_nas_emm_decode(&message, pkbuf);
 
     ogs_pkbuf_free(pkbuf);
 
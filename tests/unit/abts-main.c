@@ -24,6 +24,7 @@ extern int __ogs_s1ap_domain;
 extern int __ogs_ngap_domain;
 extern int __ogs_nas_domain;
 extern int __ogs_gtp_domain;
+extern int __ogs_pfcp_domain;
 extern int __ogs_sbi_domain;
 
 void ogs_sbi_message_init(int num_of_request_pool, int num_of_response_pool);
@@ -32,7 +33,9 @@ void ogs_sbi_message_final(void);
 abts_suite *test_proto_message(abts_suite *suite);
 abts_suite *test_s1ap_message(abts_suite *suite);
 abts_suite *test_nas_message(abts_suite *suite);
+abts_suite *test_nas_5gs_message(abts_suite *suite);
 abts_suite *test_gtp_message(abts_suite *suite);
+abts_suite *test_pfcp_message(abts_suite *suite);
 abts_suite *test_ngap_message(abts_suite *suite);
 abts_suite *test_sbi_message(abts_suite *suite);
 abts_suite *test_security(abts_suite *suite);
@@ -44,7 +47,9 @@ const struct testlist {
     {test_proto_message},
     {test_s1ap_message},
     {test_nas_message},
+    {test_nas_5gs_message},
     {test_gtp_message},
+    {test_pfcp_message},
     {test_ngap_message},
     {test_sbi_message},
     {test_security},
@@ -106,6 +111,7 @@ int main(int argc, const char *const argv[])
     ogs_log_install_domain(&__ogs_ngap_domain, "ngap", OGS_LOG_ERROR);
     ogs_log_install_domain(&__ogs_nas_domain, "nas", OGS_LOG_ERROR);
     ogs_log_install_domain(&__ogs_gtp_domain, "gtp", OGS_LOG_ERROR);
+    ogs_log_install_domain(&__ogs_pfcp_domain, "pfcp", OGS_LOG_ERROR);
     ogs_log_install_domain(&__ogs_sbi_domain, "sbi", OGS_LOG_ERROR);
 
     atexit(terminate);
@@ -20,6 +20,8 @@
 #include "ogs-gtp.h"
 #include "core/abts.h"
 
+#include "tlv-message.h"
+
 static void gtp_message_test1(abts_case *tc, void *data)
 {
     int rv;
@@ -313,11 +315,108 @@ static void gtp_message_test1(abts_case *tc, void *data)
     ogs_pkbuf_free(pkbuf);
 }
 
+static void gtp_message_test2(abts_case *tc, void *data)
+{
+    const ogs_tlv_desc_t *desc = &ogs_gtp2_tlv_desc_create_session_request;
+
+    /* Both F-TEIDs share one descriptor, the message gives the instance */
+    ABTS_PTR_EQUAL(tc, &ogs_gtp2_tlv_desc_f_teid, desc->child_descs[7]);
+    ABTS_PTR_EQUAL(tc, &ogs_gtp2_tlv_desc_f_teid, desc->child_descs[8]);
+    ABTS_PTR_NOTNULL(tc, desc->child_instance);
+    ABTS_INT_EQUAL(tc, 0, desc->child_instance[7]);
+    ABTS_INT_EQUAL(tc, 1, desc->child_instance[8]);
+}
+
+static void gtp_message_test3(abts_case *tc, void *data)
+{
+    /* Create Session Request with an IMSI and two F-TEIDs */
+    const char *_payload =
+        "4820002e12345678 00000100"
+        "0100080055153011 340010f4"
+        "570009008a800000 840a32360a"
+        "5700090187000000 000a323625";
+    char hexbuf[OGS_HUGE_LEN];
+
+    ogs_gtp2_peek_t ies[3];
+    ogs_pkbuf_t *pkbuf = NULL;
+    uint8_t type = 0;
+    uint32_t teid = 0;
+    uint16_t length = 0;
+
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_MAX_SDU_LEN);
+    ogs_assert(pkbuf);
+    ogs_pkbuf_put_data(pkbuf,
+            ogs_hex_from_string(_payload, hexbuf, sizeof(hexbuf)), 50);
+
+    ABTS_INT_EQUAL(tc, OGS_OK, ogs_gtp2_peek(pkbuf, &type, &teid));
+    ABTS_INT_EQUAL(tc, OGS_GTP2_CREATE_SESSION_REQUEST_TYPE, type);
+    ABTS_INT_EQUAL(tc, 0x12345678, teid);
+
+    ABTS_INT_EQUAL(tc, 16, ogs_gtp2_peek_imsi(pkbuf, 0, &length));
+    ABTS_INT_EQUAL(tc, 8, length);
+    ABTS_INT_EQUAL(tc, 41, ogs_gtp2_peek_f_teid(pkbuf, 1, &length));
+    ABTS_INT_EQUAL(tc, 9, length);
+    ABTS_INT_EQUAL(tc, 0x87, pkbuf->data[41]);
+    ABTS_INT_EQUAL(tc, OGS_ERROR, ogs_gtp2_peek_f_teid(pkbuf, 2, &length));
+
+    ies[0].type = OGS_GTP2_F_TEID_TYPE;
+    ies[0].instance = 0;
+    ies[1].type = OGS_GTP2_MSISDN_TYPE;
+    ies[1].instance = 0;
+    ies[2].type = OGS_GTP2_F_TEID_TYPE;
+    ies[2].instance = 1;
+    ABTS_INT_EQUAL(tc, 2, ogs_gtp2_peek_ies(pkbuf, ies, 3));
+    ABTS_INT_EQUAL(tc, 28, ies[0].offset);
+    ABTS_INT_EQUAL(tc, 0x8a, pkbuf->data[ies[0].offset]);
+    ABTS_INT_EQUAL(tc, -1, ies[1].offset);
+    ABTS_INT_EQUAL(tc, 41, ies[2].offset);
+
+    /* Truncated */
+    ogs_pkbuf_trim(pkbuf, 49);
+    ABTS_INT_EQUAL(tc, OGS_ERROR, ogs_gtp2_peek_ies(pkbuf, ies, 3));
+    ogs_pkbuf_trim(pkbuf, 11);
+    ABTS_INT_EQUAL(tc, OGS_ERROR, ogs_gtp2_peek(pkbuf, &type, &teid));
+
+    ogs_pkbuf_free(pkbuf);
+}
+
+static void gtp_message_test4(abts_case *tc, void *data)
+{
+    struct {
+        const ogs_tlv_desc_t *desc;
+        size_t size;
+        int max;
+    } max[] = {
+#define MAX(__mSG, __MSG) \
+        { &ogs_gtp2_tlv_desc_##__mSG, \
+            sizeof(ogs_gtp2_##__mSG##_t), OGS_GTP2_##__MSG##_MAX_TLV }
+        MAX(echo_request, ECHO_REQUEST),
+        MAX(create_session_request, CREATE_SESSION_REQUEST),
+        MAX(create_session_response, CREATE_SESSION_RESPONSE),
+        MAX(modify_bearer_request, MODIFY_BEARER_REQUEST),
+        MAX(create_bearer_request, CREATE_BEARER_REQUEST),
+        MAX(delete_session_request, DELETE_SESSION_REQUEST),
+#undef MAX
+    };
+    int i;
+
+    /* With every IE, a message takes exactly MAX_TLV nodes */
+    for (i = 0; i < OGS_ARRAY_SIZE(max); i++) {
+        ABTS_INT_EQUAL(tc, OGS_OK, test_tlv_message_build_parse(
+                max[i].desc, max[i].size, OGS_TLV_MODE_T1_L2_I1, max[i].max));
+        ABTS_TRUE(tc, test_tlv_message_build_exhausts(
+                max[i].desc, max[i].size, OGS_TLV_MODE_T1_L2_I1, max[i].max - 1));
+    }
+}
+
 abts_suite *test_gtp_message(abts_suite *suite)
 {
     suite = ADD_SUITE(suite)
 
     abts_run_test(suite, gtp_message_test1, NULL);
+    abts_run_test(suite, gtp_message_test2, NULL);
+    abts_run_test(suite, gtp_message_test3, NULL);
+    abts_run_test(suite, gtp_message_test4, NULL);
 
     return suite;
 }
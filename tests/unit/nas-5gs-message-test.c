@@ -0,0 +1,374 @@
+/*
+ * Copyright (C) 2026 by Sukchan Lee <acetcom@gmail.com>
+ *
+ * This file is part of Open5GS.
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Affero General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+#include "ogs-nas-5gs.h"
+#include "core/abts.h"
+
+static void ogs_nas_5gs_message_test1(abts_case *tc, void *data)
+{
+    /* Registration Accept */
+    ogs_nas_5gs_message_t message;
+    ogs_nas_5gs_registration_accept_t *registration_accept =
+        &message.gmm.registration_accept;
+    ogs_nas_5gs_mobile_identity_guti_t mobile_identity_guti;
+    uint8_t tai_list[] = { 0x00, 0x00, 0xf1, 0x10, 0x00, 0x00, 0x01 };
+    uint8_t allowed_nssai[] = { 0x01, 0x01 };
+    ogs_pkbuf_t *pkbuf = NULL;
+    int size;
+
+    memset(&message, 0, sizeof(message));
+    message.gmm.h.extended_protocol_discriminator =
+        OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GMM;
+    message.gmm.h.message_type = OGS_NAS_5GS_REGISTRATION_ACCEPT;
+
+    registration_accept->registration_result.length = 1;
+    registration_accept->registration_result.value =
+        OGS_NAS_5GS_REGISTRATION_TYPE_INITIAL;
+
+    memset(&mobile_identity_guti, 0, sizeof(mobile_identity_guti));
+    registration_accept->presencemask |=
+        OGS_NAS_5GS_REGISTRATION_ACCEPT_5G_GUTI_PRESENT;
+    registration_accept->guti.length = sizeof(mobile_identity_guti);
+    registration_accept->guti.buffer = &mobile_identity_guti;
+
+    registration_accept->presencemask |=
+        OGS_NAS_5GS_REGISTRATION_ACCEPT_TAI_LIST_PRESENT;
+    registration_accept->tai_list.length = sizeof(tai_list);
+    memcpy(registration_accept->tai_list.buffer, tai_list, sizeof(tai_list));
+
+    registration_accept->presencemask |=
+        OGS_NAS_5GS_REGISTRATION_ACCEPT_ALLOWED_NSSAI_PRESENT;
+    registration_accept->allowed_nssai.length = sizeof(allowed_nssai);
+    memcpy(registration_accept->allowed_nssai.buffer,
+            allowed_nssai, sizeof(allowed_nssai));
+
+    registration_accept->presencemask |=
+        OGS_NAS_5GS_REGISTRATION_ACCEPT_MICO_INDICATION_PRESENT;
+
+    registration_accept->presencemask |=
+        OGS_NAS_5GS_REGISTRATION_ACCEPT_T3512_VALUE_PRESENT;
+    registration_accept->t3512_value.length = 1;
+
+    /* 3 + 2 + (1+2+11) + (1+1+7) + (1+1+2) + 1 + (1+1+1) */
+    size = ogs_nas_5gs_registration_accept_encoded_size(&message);
+    ABTS_INT_EQUAL(tc, 36, size);
+    ABTS_INT_EQUAL(tc, size, ogs_nas_5gmm_encoded_size(&message));
+
+    pkbuf = ogs_nas_5gmm_encode(&message);
+    ABTS_PTR_NOTNULL(tc, pkbuf);
+    ABTS_INT_EQUAL(tc, size, pkbuf->len);
+    ABTS_INT_EQUAL(tc, OGS_NAS_HEADROOM, pkbuf->data - pkbuf->head);
+
+    ogs_pkbuf_free(pkbuf);
+}
+
+static void ogs_nas_5gs_message_test2(abts_case *tc, void *data)
+{
+    /* PDU Session Establishment Accept */
+    ogs_nas_5gs_message_t message;
+    ogs_nas_5gs_pdu_session_establishment_accept_t
+        *pdu_session_establishment_accept =
+            &message.gsm.pdu_session_establishment_accept;
+    uint8_t qos_rules[] = { 0x01, 0x00, 0x06, 0x31, 0x31, 0x01, 0x01, 0xff, 0x01 };
+    ogs_pkbuf_t *pkbuf = NULL;
+    int size;
+
+    memset(&message, 0, sizeof(message));
+    message.gsm.h.extended_protocol_discriminator =
+        OGS_NAS_EXTENDED_PROTOCOL_DISCRIMINATOR_5GSM;
+    message.gsm.h.pdu_session_identity = 1;
+    message.gsm.h.message_type = OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_ACCEPT;
+
+    pdu_session_establishment_accept->selected_pdu_session_type.value =
+        OGS_PDU_SESSION_TYPE_IPV4;
+    pdu_session_establishment_accept->authorized_qos_rules.length =
+        sizeof(qos_rules);
+    pdu_session_establishment_accept->authorized_qos_rules.buffer = qos_rules;
+    pdu_session_establishment_accept->session_ambr.length = 6;
+
+    /* 4 + 1 + (2+9) + (1+6) */
+    size = ogs_nas_5gsm_encoded_size(&message);
+    ABTS_INT_EQUAL(tc, 23, size);
+
+    pkbuf = ogs_nas_5gsm_encode(&message);
+    ABTS_PTR_NOTNULL(tc, pkbuf);
+    ABTS_INT_EQUAL(tc, size, pkbuf->len);
+    ABTS_INT_EQUAL(tc, OGS_NAS_HEADROOM, pkbuf->data - pkbuf->head);
+
+    ogs_pkbuf_free(pkbuf);
+
+    /* The DNN is encoded with the length octet of its first label */
+    pdu_session_establishment_accept->presencemask |=
+        OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_ACCEPT_DNN_PRESENT;
+    pdu_session_establishment_accept->dnn.length = 8;
+    ogs_cpystrn(pdu_session_establishment_accept->dnn.value, "internet",
+            sizeof(pdu_session_establishment_accept->dnn.value));
+
+    /* 23 + (1+1+9) */
+    size = ogs_nas_5gsm_encoded_size(&message);
+    ABTS_INT_EQUAL(tc, 34, size);
+
+    pkbuf = ogs_nas_5gsm_encode(&message);
+    ABTS_PTR_NOTNULL(tc, pkbuf);
+    ABTS_INT_EQUAL(tc, size, pkbuf->len);
+
+    ogs_pkbuf_free(pkbuf);
+
+    /* An IE finding no room fails, as a short encoded_size() would */
+    pkbuf = ogs_pkbuf_alloc(NULL, 10);
+    ogs_assert(pkbuf);
+    ogs_pkbuf_put(pkbuf, 9);
+    ABTS_INT_EQUAL(tc, -1, ogs_nas_5gs_encode_dnn(
+                pkbuf, &pdu_session_establishment_accept->dnn));
+    ABTS_INT_EQUAL(tc, 9, pkbuf->len);
+
+    ogs_pkbuf_free(pkbuf);
+
+    /* Unknown message type */
+    message.gsm.h.message_type = 0;
+    ABTS_INT_EQUAL(tc, OGS_ERROR, ogs_nas_5gsm_encoded_size(&message));
+    ABTS_PTR_EQUAL(tc, NULL, ogs_nas_5gsm_encode(&message));
+}
+
+static void ogs_nas_5gs_message_test3(abts_case *tc, void *data)
+{
+    /* PDU Session Establishment Request */
+    const char *payload = "2e0101c1ffff39050102030405";
+
+    ogs_nas_5gs_message_t message;
+    ogs_nas_5gs_pdu_session_establishment_request_t
+        *pdu_session_establishment_request =
+            &message.gsm.pdu_session_establishment_request;
+    ogs_nas_sm_pdu_dn_request_container_t *sm_pdu_dn_request_container =
+        &pdu_session_establishment_request->sm_pdu_dn_request_container;
+    ogs_pkbuf_t *pkbuf = NULL, *encoded = NULL;
+    char hexbuf[OGS_HUGE_LEN];
+    int rv;
+
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_MAX_SDU_LEN);
+    ogs_assert(pkbuf);
+    ogs_pkbuf_put_data(pkbuf,
+            ogs_hex_from_string(payload, hexbuf, sizeof(hexbuf)), 13);
+
+    rv = ogs_nas_5gsm_decode(&message, pkbuf);
+    ABTS_INT_EQUAL(tc, OGS_OK, rv);
+    ABTS_TRUE(tc, pdu_session_establishment_request->presencemask &
+        OGS_NAS_5GS_PDU_SESSION_ESTABLISHMENT_REQUEST_SM_PDU_DN_REQUEST_CONTAINER_PRESENT);
+
+    /* The container is not copied out of the pkbuf */
+    ABTS_INT_EQUAL(tc, 5, sm_pdu_dn_request_container->length);
+    ABTS_PTR_EQUAL(tc, pkbuf->data + 8, sm_pdu_dn_request_container->buffer);
+
+    encoded = ogs_nas_5gsm_encode(&message);
+    ABTS_PTR_NOTNULL(tc, encoded);
+    ABTS_INT_EQUAL(tc, pkbuf->len, encoded->len);
+    ABTS_TRUE(tc, memcmp(pkbuf->data, encoded->data, pkbuf->len) == 0);
+
+    ogs_pkbuf_free(encoded);
+    ogs_pkbuf_free(pkbuf);
+}
+
+static void ogs_nas_5gs_message_test4(abts_case *tc, void *data)
+{
+    /* Registration Request */
+    const char *payload =
+        "7e004179000d0100f110000000000000"
+        "0000102e04f0f0f0f0c12f0201014002"
+        "00207100037e0041";
+
+    ogs_nas_5gs_message_t message;
+    ogs_nas_5gs_registration_request_lazy_t lazy;
+    ogs_nas_ue_security_capability_t *ue_security_capability = NULL;
+    ogs_nas_message_container_t *nas_message_container = NULL;
+    ogs_pkbuf_t *pkbuf = NULL;
+    char hexbuf[OGS_HUGE_LEN];
+    int rv;
+
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_MAX_SDU_LEN);
+    ogs_assert(pkbuf);
+    ogs_pkbuf_put_data(pkbuf,
+            ogs_hex_from_string(payload, hexbuf, sizeof(hexbuf)), 40);
+
+    rv = ogs_nas_5gmm_decode(&message, pkbuf);
+    ABTS_INT_EQUAL(tc, OGS_OK, rv);
+
+    rv = ogs_nas_5gs_decode_registration_request_lazy(&lazy, pkbuf);
+    ABTS_INT_EQUAL(tc, OGS_OK, rv);
+    ABTS_INT_EQUAL(tc, 40, pkbuf->len);
+    ABTS_INT_EQUAL(tc, OGS_NAS_5GS_REGISTRATION_REQUEST, lazy.h.message_type);
+    ABTS_TRUE(tc, lazy.registration_request.presencemask ==
+            message.gmm.registration_request.presencemask);
+    ABTS_TRUE(tc, lazy.decodedmask == 0);
+
+    /* Absent */
+    ABTS_PTR_EQUAL(tc, NULL,
+            ogs_nas_5gs_registration_request_last_visited_registered_tai(
+                &lazy));
+
+    /* Decoded on first access only */
+    ue_security_capability =
+        ogs_nas_5gs_registration_request_ue_security_capability(&lazy);
+    ABTS_PTR_NOTNULL(tc, ue_security_capability);
+    ABTS_INT_EQUAL(tc, 4, ue_security_capability->length);
+    ABTS_TRUE(tc, lazy.decodedmask ==
+            OGS_NAS_5GS_REGISTRATION_REQUEST_UE_SECURITY_CAPABILITY_PRESENT);
+    ABTS_PTR_EQUAL(tc, ue_security_capability,
+        ogs_nas_5gs_registration_request_ue_security_capability(&lazy));
+
+    nas_message_container =
+        ogs_nas_5gs_registration_request_nas_message_container(&lazy);
+    ABTS_PTR_NOTNULL(tc, nas_message_container);
+    ABTS_INT_EQUAL(tc, 3, nas_message_container->length);
+    ABTS_PTR_EQUAL(tc, pkbuf->data + 37, nas_message_container->buffer);
+
+    ABTS_PTR_NOTNULL(tc,
+        ogs_nas_5gs_registration_request_non_current_native_nas_key_set_identifier(&lazy));
+    ABTS_PTR_NOTNULL(tc,
+        ogs_nas_5gs_registration_request_requested_nssai(&lazy));
+    ABTS_PTR_NOTNULL(tc,
+        ogs_nas_5gs_registration_request_uplink_data_status(&lazy));
+
+    /* Same as the eager decoder once every IE has been looked at */
+    ABTS_TRUE(tc, lazy.decodedmask == lazy.registration_request.presencemask);
+    ABTS_TRUE(tc, memcmp(&lazy.registration_request,
+            &message.gmm.registration_request,
+            sizeof(lazy.registration_request)) == 0);
+
+    /* Not a Registration Request */
+    pkbuf->data[2] = OGS_NAS_5GS_REGISTRATION_ACCEPT;
+    rv = ogs_nas_5gs_decode_registration_request_lazy(&lazy, pkbuf);
+    ABTS_INT_EQUAL(tc, OGS_ERROR, rv);
+    ABTS_INT_EQUAL(tc, 40, pkbuf->len);
+
+    /* Truncated optional IE */
+    pkbuf->data[2] = OGS_NAS_5GS_REGISTRATION_REQUEST;
+    ogs_pkbuf_trim(pkbuf, 39);
+    rv = ogs_nas_5gs_decode_registration_request_lazy(&lazy, pkbuf);
+    ABTS_INT_EQUAL(tc, OGS_ERROR, rv);
+    ABTS_INT_EQUAL(tc, 39, pkbuf->len);
+
+    ogs_pkbuf_free(pkbuf);
+}
+
+static void ogs_nas_5gs_message_test5(abts_case *tc, void *data)
+{
+    /* Registration Request */
+    const char *payload =
+        "7e004179000d0100f110000000000000"
+        "0000102e04f0f0f0f0c12f0201014002"
+        "00207100037e0041";
+
+    ogs_nas_5gs_message_t message;
+    size_t end = offsetof(ogs_nas_5gs_message_t, gmm.registration_request) +
+        sizeof(ogs_nas_5gs_registration_request_t);
+    ogs_pkbuf_t *pkbuf = NULL;
+    char hexbuf[OGS_HUGE_LEN];
+    int rv;
+
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_MAX_SDU_LEN);
+    ogs_assert(pkbuf);
+    ogs_pkbuf_put_data(pkbuf,
+            ogs_hex_from_string(payload, hexbuf, sizeof(hexbuf)), 40);
+
+    /* Only the registration request is cleared, not the whole union */
+    memset(&message, 0xff, sizeof(message));
+    rv = ogs_nas_5gmm_decode(&message, pkbuf);
+    ABTS_INT_EQUAL(tc, OGS_OK, rv);
+    ABTS_INT_EQUAL(tc, OGS_NAS_5GS_REGISTRATION_REQUEST,
+            message.gmm.h.message_type);
+    ABTS_TRUE(tc, message.gmm.registration_request.presencemask ==
+            (OGS_NAS_5GS_REGISTRATION_REQUEST_NON_CURRENT_NATIVE_NAS_KEY_SET_IDENTIFIER_PRESENT|
+             OGS_NAS_5GS_REGISTRATION_REQUEST_UE_SECURITY_CAPABILITY_PRESENT|
+             OGS_NAS_5GS_REGISTRATION_REQUEST_REQUESTED_NSSAI_PRESENT|
+             OGS_NAS_5GS_REGISTRATION_REQUEST_UPLINK_DATA_STATUS_PRESENT|
+             OGS_NAS_5GS_REGISTRATION_REQUEST_NAS_MESSAGE_CONTAINER_PRESENT));
+    ABTS_INT_EQUAL(tc, 0,
+            message.gmm.registration_request.pdu_session_status.length);
+    ABTS_TRUE(tc, end < sizeof(message));
+    ABTS_INT_EQUAL(tc, 0xff, ((uint8_t *)&message)[end]);
+    ABTS_INT_EQUAL(tc, 0xff, ((uint8_t *)&message)[sizeof(message)-1]);
+
+    ogs_pkbuf_free(pkbuf);
+}
+
+static void ogs_nas_5gs_message_test6(abts_case *tc, void *data)
+{
+    /* Registration Request */
+    const char *payload =
+        "7e004179000d0100f110000000000000"
+        "0000102e04f0f0f0f0c12f0201014002"
+        "00207100037e0041";
+
+    ogs_nas_5gs_message_t message;
+    ogs_pkbuf_t *pkbuf = NULL, *plain = NULL, *target = NULL;
+    char hexbuf[OGS_HUGE_LEN];
+    int rv;
+
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_MAX_SDU_LEN);
+    ogs_assert(pkbuf);
+    ogs_pkbuf_put_data(pkbuf,
+            ogs_hex_from_string(payload, hexbuf, sizeof(hexbuf)), 40);
+
+    rv = ogs_nas_5gmm_decode(&message, pkbuf);
+    ABTS_INT_EQUAL(tc, OGS_OK, rv);
+
+    plain = ogs_nas_5gs_plain_encode(&message);
+    ABTS_PTR_NOTNULL(tc, plain);
+
+    /* Past the octets of the caller, the headroom left alone */
+    target = ogs_pkbuf_alloc(NULL, OGS_NAS_HEADROOM+2+plain->len);
+    ogs_assert(target);
+    ogs_pkbuf_reserve(target, OGS_NAS_HEADROOM);
+    ogs_pkbuf_put_u16(target, 0xabcd);
+
+    rv = ogs_nas_5gs_plain_encode_to(&message, target);
+    ABTS_INT_EQUAL(tc, plain->len, rv);
+    ABTS_INT_EQUAL(tc, 2+plain->len, target->len);
+    ABTS_INT_EQUAL(tc, OGS_NAS_HEADROOM, ogs_pkbuf_headroom(target));
+    ABTS_INT_EQUAL(tc, 0, ogs_pkbuf_tailroom(target));
+    ABTS_INT_EQUAL(tc, 0xab, target->data[0]);
+    ABTS_INT_EQUAL(tc, 0xcd, target->data[1]);
+    ABTS_TRUE(tc, memcmp(plain->data, target->data+2, plain->len) == 0);
+
+    /* Not enough tailroom */
+    ogs_pkbuf_trim(target, 3);
+    rv = ogs_nas_5gs_plain_encode_to(&message, target);
+    ABTS_INT_EQUAL(tc, OGS_ERROR, rv);
+    ABTS_INT_EQUAL(tc, 3, target->len);
+
+    ogs_pkbuf_free(target);
+    ogs_pkbuf_free(plain);
+
+    /* The decoded IEs point into it */
+    ogs_pkbuf_free(pkbuf);
+}
+
+abts_suite *test_nas_5gs_message(abts_suite *suite)
+{
+    suite = ADD_SUITE(suite)
+
+    abts_run_test(suite, ogs_nas_5gs_message_test1, NULL);
+    abts_run_test(suite, ogs_nas_5gs_message_test2, NULL);
+    abts_run_test(suite, ogs_nas_5gs_message_test3, NULL);
+    abts_run_test(suite, ogs_nas_5gs_message_test4, NULL);
+    abts_run_test(suite, ogs_nas_5gs_message_test5, NULL);
+    abts_run_test(suite, ogs_nas_5gs_message_test6, NULL);
+
+    return suite;
+}
@@ -479,6 +479,62 @@ static void ogs_nas_eps_message_test9(abts_case *tc, void *data)
     ogs_log_install_domain(&__ogs_nas_domain, "nas", OGS_LOG_ERROR);
 }
 
+static void ogs_nas_eps_message_test10(abts_case *tc, void *data)
+{
+    /* Attach Reject */
+    const char *payload = "074411";
+    char buffer[3];
+
+    ogs_nas_eps_message_t message;
+    ogs_nas_eps_attach_reject_t *attach_reject = &message.emm.attach_reject;
+
+    ogs_pkbuf_t *pkbuf = NULL;
+    int rv;
+
+    memset(&message, 0, sizeof(message));
+    message.emm.h.protocol_discriminator = OGS_NAS_PROTOCOL_DISCRIMINATOR_EMM;
+    message.emm.h.message_type = OGS_NAS_EPS_ATTACH_REJECT;
+    attach_reject->emm_cause = OGS_NAS_EMM_CAUSE_NETWORK_FAILURE;
+
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_MAX_SDU_LEN);
+    ogs_assert(pkbuf);
+    ogs_pkbuf_reserve(pkbuf, OGS_NAS_HEADROOM);
+    ogs_pkbuf_put_u8(pkbuf, 0xab);
+
+    rv = ogs_nas_eps_plain_encode_to(&message, pkbuf);
+    ABTS_INT_EQUAL(tc, sizeof(buffer), rv);
+    ABTS_INT_EQUAL(tc, 1+sizeof(buffer), pkbuf->len);
+    ABTS_INT_EQUAL(tc, OGS_NAS_HEADROOM, ogs_pkbuf_headroom(pkbuf));
+    ABTS_PTR_EQUAL(tc, pkbuf->data+pkbuf->len, pkbuf->tail);
+    ABTS_INT_EQUAL(tc, 0xab, pkbuf->data[0]);
+    ABTS_TRUE(tc, memcmp(ogs_hex_from_string(payload, buffer, sizeof(buffer)),
+            pkbuf->data+1, sizeof(buffer)) == 0);
+
+    ogs_pkbuf_free(pkbuf);
+
+    /* Room for the header, not for the EMM cause */
+    pkbuf = ogs_pkbuf_alloc(NULL, OGS_NAS_HEADROOM+1+2);
+    ogs_assert(pkbuf);
+    ogs_pkbuf_reserve(pkbuf, OGS_NAS_HEADROOM);
+    ogs_pkbuf_put_u8(pkbuf, 0xab);
+
+    rv = ogs_nas_eps_plain_encode_to(&message, pkbuf);
+    ABTS_INT_EQUAL(tc, OGS_ERROR, rv);
+    ABTS_INT_EQUAL(tc, 1, pkbuf->len);
+    ABTS_INT_EQUAL(tc, OGS_NAS_HEADROOM, ogs_pkbuf_headroom(pkbuf));
+    ABTS_INT_EQUAL(tc, 2, ogs_pkbuf_tailroom(pkbuf));
+    ABTS_INT_EQUAL(tc, 0xab, pkbuf->data[0]);
+
+    /* Not even for the header */
+    ogs_pkbuf_put_u8(pkbuf, 0xcd);
+
+    rv = ogs_nas_eps_plain_encode_to(&message, pkbuf);
+    ABTS_INT_EQUAL(tc, OGS_ERROR, rv);
+    ABTS_INT_EQUAL(tc, 2, pkbuf->len);
+
+    ogs_pkbuf_free(pkbuf);
+}
+
 abts_suite *test_nas_message(abts_suite *suite)
 {
     suite = ADD_SUITE(suite)
@@ -496,6 +552,7 @@ abts_suite *test_nas_message(abts_suite *suite)
     abts_run_test(suite, ogs_nas_eps_message_test7, NULL);
     abts_run_test(suite, ogs_nas_eps_message_test8, NULL);
     abts_run_test(suite, ogs_nas_eps_message_test9, NULL);
+    abts_run_test(suite, ogs_nas_eps_message_test10, NULL);
 
     return suite;
 }
@@ -0,0 +1,343 @@
+/*
+ * Copyright (C) 2026 by Sukchan Lee <acetcom@gmail.com>
+ *
+ * This file is part of Open5GS.
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Affero General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+#include "ogs-pfcp.h"
+#include "core/abts.h"
+
+#include "tlv-message.h"
+
+#define NUM_OF_RULE 4
+
+static void session_modification_request(
+        ogs_pfcp_session_modification_request_t *req)
+{
+    int i;
+
+    memset(req, 0, sizeof(*req));
+
+    for (i = 0; i < NUM_OF_RULE; i++) {
+        ogs_pfcp_tlv_create_pdr_t *pdr = &req->create_pdr[i];
+        ogs_pfcp_tlv_create_far_t *far = &req->create_far[i];
+
+        pdr->presence = 1;
+        pdr->pdr_id.presence = 1;
+        pdr->pdr_id.u16 = i + 1;
+        pdr->precedence.presence = 1;
+        pdr->precedence.u32 = 0x01000000 + i;
+        pdr->pdi.presence = 1;
+        pdr->pdi.source_interface.presence = 1;
+        pdr->pdi.source_interface.u8 = OGS_PFCP_INTERFACE_CORE;
+        pdr->pdi.network_instance.presence = 1;
+        pdr->pdi.network_instance.data = (uint8_t *)"\x08internet";
+        pdr->pdi.network_instance.len = 9;
+        pdr->far_id.presence = 1;
+        pdr->far_id.u32 = i + 1;
+        pdr->urr_id[0].presence = 1;
+        pdr->urr_id[0].u32 = 1;
+        pdr->urr_id[1].presence = 1;
+        pdr->urr_id[1].u32 = 2;
+
+        far->presence = 1;
+        far->far_id.presence = 1;
+        far->far_id.u32 = i + 1;
+        far->apply_action.presence = 1;
+        far->apply_action.u16 = OGS_PFCP_APPLY_ACTION_FORW;
+        far->forwarding_parameters.presence = 1;
+        far->forwarding_parameters.destination_interface.presence = 1;
+        far->forwarding_parameters.destination_interface.u8 =
+            OGS_PFCP_INTERFACE_ACCESS;
+    }
+
+    req->remove_pdr[0].presence = 1;
+    req->remove_pdr[0].pdr_id.presence = 1;
+    req->remove_pdr[0].pdr_id.u16 = 0x1234;
+
+    req->pfcpsmreq_flags.presence = 1;
+    req->pfcpsmreq_flags.u8 = 0x02;
+}
+
+static void pfcp_message_test1(abts_case *tc, void *data)
+{
+    int rv;
+    ogs_pfcp_session_modification_request_t req;
+    ogs_pkbuf_t *pkbuf = NULL, *direct = NULL;
+
+    session_modification_request(&req);
+    direct = ogs_pfcp_build_session_modification_request_direct(&req);
+    ABTS_PTR_NOTNULL(tc, direct);
+
+    /* ogs_pfcp_build_msg() byte-swaps the message, so it is built again */
+    session_modification_request(&req);
+    pkbuf = ogs_tlv_build_msg(&ogs_pfcp_msg_desc_pfcp_session_modification_request,
+            &req, OGS_TLV_MODE_T2_L2);
+    ABTS_PTR_NOTNULL(tc, pkbuf);
+
+    ABTS_INT_EQUAL(tc, pkbuf->len, direct->len);
+    ABTS_INT_EQUAL(tc, 0, memcmp(pkbuf->data, direct->data, pkbuf->len));
+    ABTS_INT_EQUAL(tc, OGS_TLV_MAX_HEADROOM, direct->data - direct->head);
+
+    memset(&req, 0, sizeof(req));
+    rv = ogs_tlv_parse_msg(&req,
+            &ogs_pfcp_msg_desc_pfcp_session_modification_request,
+            direct, OGS_TLV_MODE_T2_L2);
+    ABTS_INT_EQUAL(tc, OGS_OK, rv);
+    ABTS_INT_EQUAL(tc, 1, req.create_pdr[3].presence);
+    ABTS_INT_EQUAL(tc, 4, req.create_pdr[3].pdr_id.u16);
+    ABTS_INT_EQUAL(tc, 1, req.create_pdr[3].urr_id[1].presence);
+    ABTS_INT_EQUAL(tc, 9, req.create_pdr[3].pdi.network_instance.len);
+    ABTS_INT_EQUAL(tc, 0, req.create_pdr[4].presence);
+    ABTS_INT_EQUAL(tc, OGS_PFCP_INTERFACE_ACCESS,
+            req.create_far[0].forwarding_parameters.destination_interface.u8);
+    ABTS_INT_EQUAL(tc, 0x1234, req.remove_pdr[0].pdr_id.u16);
+    ABTS_INT_EQUAL(tc, 0x02, req.pfcpsmreq_flags.u8);
+
+    ogs_pkbuf_free(pkbuf);
+    ogs_pkbuf_free(direct);
+}
+
+static void pfcp_message_test2(abts_case *tc, void *data)
+{
+    ogs_pfcp_session_modification_request_t req;
+    ogs_pkbuf_t *pkbuf = NULL;
+
+    /* An octet string without length */
+    session_modification_request(&req);
+    req.create_pdr[2].pdi.network_instance.len = 0;
+    pkbuf = ogs_pfcp_build_session_modification_request_direct(&req);
+    ABTS_PTR_EQUAL(tc, NULL, pkbuf);
+
+    /* A group without any IE */
+    session_modification_request(&req);
+    memset(&req.create_far[1].forwarding_parameters, 0,
+            sizeof(req.create_far[1].forwarding_parameters));
+    req.create_far[1].forwarding_parameters.presence = 1;
+    pkbuf = ogs_pfcp_build_session_modification_request_direct(&req);
+    ABTS_PTR_EQUAL(tc, NULL, pkbuf);
+
+    /* A message without any IE */
+    memset(&req, 0, sizeof(req));
+    pkbuf = ogs_pfcp_build_session_modification_request_direct(&req);
+    ABTS_PTR_EQUAL(tc, NULL, pkbuf);
+}
+
+/* A random subset of the IEs, compound IEs three levels deep at most */
+static const test_tlv_fill_t pfcp_message_random = {
+    .one_in = 3, .more = 0, .depth = 3, .octets = 16, .random = true,
+};
+
+/* The direct parsers of the busiest messages, called through one type */
+#define PARSE_DIRECT(__mSG) \
+static int pfcp_parse_##__mSG(void *msg, ogs_pkbuf_t *pkbuf) \
+{ \
+    return ogs_pfcp_parse_##__mSG##_direct(msg, pkbuf); \
+}
+PARSE_DIRECT(heartbeat_request)
+PARSE_DIRECT(heartbeat_response)
+PARSE_DIRECT(session_establishment_request)
+PARSE_DIRECT(session_establishment_response)
+PARSE_DIRECT(session_modification_request)
+PARSE_DIRECT(session_modification_response)
+PARSE_DIRECT(session_report_request)
+PARSE_DIRECT(session_report_response)
+#undef PARSE_DIRECT
+
+static void pfcp_message_test3(abts_case *tc, void *data)
+{
+    struct {
+        const ogs_tlv_desc_t *desc;
+        int (*parse)(void *msg, ogs_pkbuf_t *pkbuf);
+    } hot[] = {
+#define HOT(__mSG) \
+        { &ogs_pfcp_msg_desc_pfcp_##__mSG, pfcp_parse_##__mSG }
+        HOT(heartbeat_request),
+        HOT(heartbeat_response),
+        HOT(session_establishment_request),
+        HOT(session_establishment_response),
+        HOT(session_modification_request),
+        HOT(session_modification_response),
+        HOT(session_report_request),
+        HOT(session_report_response),
+#undef HOT
+    };
+    ogs_pfcp_message_t *generic = NULL, *direct = NULL;
+    int domain[] = {
+        ogs_log_get_domain_id("core"), __ogs_tlv_domain, __ogs_pfcp_domain,
+    };
+    ogs_log_level_e level[OGS_ARRAY_SIZE(domain)];
+    ogs_pkbuf_t *pkbuf = NULL;
+    int i, j, n, rv;
+
+    generic = ogs_calloc(1, sizeof(*generic));
+    ogs_assert(generic);
+    direct = ogs_calloc(1, sizeof(*direct));
+    ogs_assert(direct);
+
+    /* Every truncated or corrupted message would be logged */
+    for (i = 0; i < OGS_ARRAY_SIZE(domain); i++) {
+        level[i] = ogs_log_get_domain_level(domain[i]);
+        ogs_log_set_domain_level(domain[i], OGS_LOG_NONE);
+    }
+
+    for (i = 0; i < OGS_ARRAY_SIZE(hot); i++) {
+        for (n = 0; n < 4096; n++) {
+            memset(generic, 0, sizeof(*generic));
+            if (test_tlv_message_fill(
+                    hot[i].desc, generic, &pfcp_message_random) == 0)
+                continue;
+
+            pkbuf = ogs_tlv_build_msg(hot[i].desc, generic, OGS_TLV_MODE_T2_L2);
+            ABTS_PTR_NOTNULL(tc, pkbuf);
+
+            /* As built, then truncated and with a corrupted octet */
+            for (j = 0; j < 3; j++) {
+                if (j == 1)
+                    ogs_pkbuf_trim(pkbuf, pkbuf->len - 1);
+                if (j == 2)
+                    pkbuf->data[test_tlv_rand() % pkbuf->len] ^= 0x10;
+
+                memset(generic, 0, sizeof(*generic));
+                memset(direct, 0, sizeof(*direct));
+
+                rv = ogs_tlv_parse_msg(
+                        generic, hot[i].desc, pkbuf, OGS_TLV_MODE_T2_L2);
+                if (j == 0)
+                    ABTS_INT_EQUAL(tc, OGS_OK, rv);
+                ABTS_INT_EQUAL(tc, rv, hot[i].parse(direct, pkbuf));
+                if (rv == OGS_OK)
+                    ABTS_INT_EQUAL(tc, 0,
+                            memcmp(generic, direct, sizeof(*generic)));
+            }
+
+            ogs_pkbuf_free(pkbuf);
+        }
+    }
+
+    for (i = 0; i < OGS_ARRAY_SIZE(domain); i++)
+        ogs_log_set_domain_level(domain[i], level[i]);
+
+    ogs_free(generic);
+    ogs_free(direct);
+}
+
+static void pfcp_message_test4(abts_case *tc, void *data)
+{
+    ogs_pfcp_session_modification_request_t req;
+    ogs_pfcp_header_t h;
+    ogs_pfcp_peek_t ies[4];
+    ogs_pkbuf_t *pkbuf = NULL;
+    uint8_t type = 0;
+    uint64_t seid = 0;
+    uint16_t length = 0;
+    int offset;
+
+    session_modification_request(&req);
+    pkbuf = ogs_pfcp_build_session_modification_request_direct(&req);
+    ABTS_PTR_NOTNULL(tc, pkbuf);
+
+    memset(&h, 0, sizeof(h));
+    h.version = 1;
+    h.seid_presence = 1;
+    h.type = OGS_PFCP_SESSION_MODIFICATION_REQUEST_TYPE;
+    h.length = htobe16(pkbuf->len + OGS_PFCP_HEADER_LEN - 4);
+    h.seid = htobe64(0x1122334455667788ULL);
+    ogs_assert(ogs_pkbuf_push(pkbuf, OGS_PFCP_HEADER_LEN));
+    memcpy(pkbuf->data, &h, OGS_PFCP_HEADER_LEN);
+
+    ABTS_INT_EQUAL(tc, OGS_OK, ogs_pfcp_peek(pkbuf, &type, &seid));
+    ABTS_INT_EQUAL(tc, OGS_PFCP_SESSION_MODIFICATION_REQUEST_TYPE, type);
+    ABTS_TRUE(tc, seid == 0x1122334455667788ULL);
+
+    /* Remove PDR holds a PDR ID of 0x1234 */
+    offset = ogs_pfcp_peek_remove_pdr(pkbuf, &length);
+    ABTS_TRUE(tc, offset > OGS_PFCP_HEADER_LEN);
+    ABTS_INT_EQUAL(tc, 6, length);
+    ABTS_INT_EQUAL(tc, OGS_PFCP_REMOVE_PDR_TYPE,
+            (pkbuf->data[offset-4] << 8) | pkbuf->data[offset-3]);
+    ABTS_INT_EQUAL(tc, 0x12, pkbuf->data[offset+4]);
+    ABTS_INT_EQUAL(tc, 0x34, pkbuf->data[offset+5]);
+
+    offset = ogs_pfcp_peek_pfcpsmreq_flags(pkbuf, &length);
+    ABTS_INT_EQUAL(tc, 1, length);
+    ABTS_INT_EQUAL(tc, 0x02, pkbuf->data[offset]);
+
+    ABTS_INT_EQUAL(tc, OGS_ERROR, ogs_pfcp_peek_node_id(pkbuf, &length));
+
+    /* The first and the second Create PDR, all in one walk */
+    ies[0].type = OGS_PFCP_CREATE_PDR_TYPE;
+    ies[1].type = OGS_PFCP_CREATE_PDR_TYPE;
+    ies[2].type = OGS_PFCP_NODE_ID_TYPE;
+    ies[3].type = OGS_PFCP_PFCPSMREQ_FLAGS_TYPE;
+    ABTS_INT_EQUAL(tc, 3, ogs_pfcp_peek_ies(pkbuf, ies, 4));
+    ABTS_INT_EQUAL(tc,
+            ogs_pfcp_peek_create_pdr(pkbuf, &length), ies[0].offset);
+    ABTS_INT_EQUAL(tc, length, ies[0].length);
+    ABTS_TRUE(tc, ies[1].offset >= ies[0].offset + ies[0].length + 4);
+    ABTS_INT_EQUAL(tc, -1, ies[2].offset);
+    ABTS_INT_EQUAL(tc, 0x02, pkbuf->data[ies[3].offset]);
+
+    /* Truncated */
+    ogs_pkbuf_trim(pkbuf, pkbuf->len - 1);
+    ABTS_INT_EQUAL(tc, OGS_ERROR, ogs_pfcp_peek_ies(pkbuf, ies, 4));
+    ogs_pkbuf_trim(pkbuf, 8);
+    ABTS_INT_EQUAL(tc, OGS_ERROR, ogs_pfcp_peek(pkbuf, &type, &seid));
+
+    ogs_pkbuf_free(pkbuf);
+}
+
+static void pfcp_message_test5(abts_case *tc, void *data)
+{
+    struct {
+        const ogs_tlv_desc_t *desc;
+        size_t size;
+        int max;
+    } max[] = {
+#define MAX(__mSG, __MSG) \
+        { &ogs_pfcp_msg_desc_pfcp_##__mSG, \
+            sizeof(ogs_pfcp_##__mSG##_t), OGS_PFCP_##__MSG##_MAX_TLV }
+        MAX(heartbeat_request, HEARTBEAT_REQUEST),
+        MAX(association_setup_request, ASSOCIATION_SETUP_REQUEST),
+        MAX(session_establishment_request, SESSION_ESTABLISHMENT_REQUEST),
+        MAX(session_modification_request, SESSION_MODIFICATION_REQUEST),
+        MAX(session_report_request, SESSION_REPORT_REQUEST),
+        MAX(session_deletion_response, SESSION_DELETION_RESPONSE),
+#undef MAX
+    };
+    int i;
+
+    /* With every IE, a message takes exactly MAX_TLV nodes */
+    for (i = 0; i < OGS_ARRAY_SIZE(max); i++) {
+        ABTS_INT_EQUAL(tc, OGS_OK, test_tlv_message_build_parse(
+                max[i].desc, max[i].size, OGS_TLV_MODE_T2_L2, max[i].max));
+        ABTS_TRUE(tc, test_tlv_message_build_exhausts(
+                max[i].desc, max[i].size, OGS_TLV_MODE_T2_L2, max[i].max - 1));
+    }
+}
+
+abts_suite *test_pfcp_message(abts_suite *suite)
+{
+    suite = ADD_SUITE(suite)
+
+    abts_run_test(suite, pfcp_message_test1, NULL);
+    abts_run_test(suite, pfcp_message_test2, NULL);
+    abts_run_test(suite, pfcp_message_test3, NULL);
+    abts_run_test(suite, pfcp_message_test4, NULL);
+    abts_run_test(suite, pfcp_message_test5, NULL);
+
+    return suite;
+}
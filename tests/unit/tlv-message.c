@@ -0,0 +1,326 @@
+/*
+ * Copyright (C) 2026 by Sukchan Lee <acetcom@gmail.com>
+ *
+ * This file is part of Open5GS.
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Affero General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+
+#include <fcntl.h>
+#include <limits.h>
+#include <unistd.h>
+#include <sys/wait.h>
+
+#include "tlv-message.h"
+
+static uint32_t tlv_message_seed = 1;
+static uint8_t tlv_message_octet[256];
+
+/* Every IE, each as many times as it may repeat */
+static const test_tlv_fill_t tlv_message_every = {
+    .one_in = 1, .more = 0, .depth = INT_MAX, .octets = 1, .random = false,
+};
+
+uint32_t test_tlv_rand(void)
+{
+    tlv_message_seed = tlv_message_seed * 1103515245 + 12345;
+    return tlv_message_seed >> 8;
+}
+
+static uint32_t tlv_message_value(const test_tlv_fill_t *fill)
+{
+    return fill->random ? test_tlv_rand() : 1;
+}
+
+static int tlv_message_fill(const ogs_tlv_desc_t *parent, uint8_t *p,
+        const test_tlv_fill_t *fill, int depth)
+{
+    const ogs_tlv_desc_t *desc = NULL, *next_desc = NULL;
+    ogs_tlv_octet_t *octet = NULL;
+    int i, j, n, count = 0;
+
+    for (i = 0; (desc = parent->child_descs[i]) != NULL; i++) {
+        next_desc = parent->child_descs[i+1];
+        n = 1;
+        if (next_desc && next_desc->ctype == OGS_TLV_MORE) {
+            n = next_desc->length;
+            i++;
+        }
+
+        for (j = 0; j < n && (fill->more == 0 || j < fill->more); j++) {
+            uint8_t *v = p + desc->vsize * j;
+
+            if (fill->one_in > 1 && test_tlv_rand() % fill->one_in != 0)
+                break;
+
+            /* A compound IE is there only with an IE of its own */
+            if (desc->ctype == OGS_TLV_COMPOUND &&
+                (depth >= fill->depth ||
+                 tlv_message_fill(desc, v + sizeof(ogs_tlv_presence_t),
+                     fill, depth + 1) == 0))
+                break;
+
+            switch (desc->ctype) {
+            case OGS_TLV_UINT8:
+            case OGS_TLV_INT8:
+            case OGS_TV_UINT8:
+            case OGS_TV_INT8:
+                ((ogs_tlv_uint8_t *)v)->u8 = tlv_message_value(fill);
+                break;
+            case OGS_TLV_UINT16:
+            case OGS_TLV_INT16:
+            case OGS_TV_UINT16:
+            case OGS_TV_INT16:
+                ((ogs_tlv_uint16_t *)v)->u16 = tlv_message_value(fill);
+                break;
+            case OGS_TLV_UINT24:
+            case OGS_TLV_INT24:
+            case OGS_TV_UINT24:
+            case OGS_TV_INT24:
+                ((ogs_tlv_uint24_t *)v)->u24 =
+                    tlv_message_value(fill) & 0xffffff;
+                break;
+            case OGS_TLV_UINT32:
+            case OGS_TLV_INT32:
+            case OGS_TV_UINT32:
+            case OGS_TV_INT32:
+                ((ogs_tlv_uint32_t *)v)->u32 = tlv_message_value(fill);
+                break;
+            case OGS_TLV_FIXED_STR:
+            case OGS_TV_FIXED_STR:
+                ogs_assert(desc->length <= sizeof(tlv_message_octet));
+                octet = (ogs_tlv_octet_t *)v;
+                octet->data = tlv_message_octet;
+                octet->len = desc->length;
+                break;
+            case OGS_TLV_VAR_STR:
+                ogs_assert(fill->octets > 0 &&
+                        fill->octets <= (int)sizeof(tlv_message_octet));
+                octet = (ogs_tlv_octet_t *)v;
+                octet->data = tlv_message_octet;
+                octet->len = fill->random ?
+                    1 + test_tlv_rand() % fill->octets : fill->octets;
+                break;
+            case OGS_TLV_NULL:
+            case OGS_TV_NULL:
+            case OGS_TLV_COMPOUND:
+                break;
+            default:
+                ogs_assert_if_reached();
+            }
+
+            *(ogs_tlv_presence_t *)v = 1;
+            count++;
+        }
+
+        p += desc->vsize * n;
+    }
+
+    return count;
+}
+
+/*
+ * Set the IEs of the message of 'desc' in 'msg' as 'fill' says. The number
+ * of IEs set at the top of the message.
+ */
+int test_tlv_message_fill(const ogs_tlv_desc_t *desc, void *msg,
+        const test_tlv_fill_t *fill)
+{
+    int i;
+
+    ogs_assert(desc);
+    ogs_assert(msg);
+    ogs_assert(fill);
+    ogs_assert(fill->one_in > 0);
+
+    for (i = 0; i < sizeof(tlv_message_octet); i++)
+        tlv_message_octet[i] = i;
+
+    return tlv_message_fill(desc, msg, fill, 0);
+}
+
+/* Whether the IEs of 'parent' in 'a' and 'b' are the same */
+static bool tlv_message_equal(
+        const ogs_tlv_desc_t *parent, uint8_t *a, uint8_t *b)
+{
+    const ogs_tlv_desc_t *desc = NULL, *next_desc = NULL;
+    int i, j, n;
+
+    for (i = 0; (desc = parent->child_descs[i]) != NULL; i++) {
+        next_desc = parent->child_descs[i+1];
+        n = 1;
+        if (next_desc && next_desc->ctype == OGS_TLV_MORE) {
+            n = next_desc->length;
+            i++;
+        }
+
+        for (j = 0; j < n; j++) {
+            uint8_t *u = a + desc->vsize * j;
+            uint8_t *v = b + desc->vsize * j;
+
+            if (*(ogs_tlv_presence_t *)u != *(ogs_tlv_presence_t *)v)
+                return false;
+            if (*(ogs_tlv_presence_t *)u == 0)
+                continue;
+
+            switch (desc->ctype) {
+            case OGS_TLV_UINT8:
+            case OGS_TLV_INT8:
+            case OGS_TV_UINT8:
+            case OGS_TV_INT8:
+                if (((ogs_tlv_uint8_t *)u)->u8 != ((ogs_tlv_uint8_t *)v)->u8)
+                    return false;
+                break;
+            case OGS_TLV_UINT16:
+            case OGS_TLV_INT16:
+            case OGS_TV_UINT16:
+            case OGS_TV_INT16:
+                if (((ogs_tlv_uint16_t *)u)->u16 !=
+                        ((ogs_tlv_uint16_t *)v)->u16)
+                    return false;
+                break;
+            case OGS_TLV_UINT24:
+            case OGS_TLV_INT24:
+            case OGS_TV_UINT24:
+            case OGS_TV_INT24:
+                if (((ogs_tlv_uint24_t *)u)->u24 !=
+                        ((ogs_tlv_uint24_t *)v)->u24)
+                    return false;
+                break;
+            case OGS_TLV_UINT32:
+            case OGS_TLV_INT32:
+            case OGS_TV_UINT32:
+            case OGS_TV_INT32:
+                if (((ogs_tlv_uint32_t *)u)->u32 !=
+                        ((ogs_tlv_uint32_t *)v)->u32)
+                    return false;
+                break;
+            case OGS_TLV_FIXED_STR:
+            case OGS_TV_FIXED_STR:
+            case OGS_TLV_VAR_STR:
+                if (((ogs_tlv_octet_t *)u)->len != ((ogs_tlv_octet_t *)v)->len ||
+                    memcmp(((ogs_tlv_octet_t *)u)->data,
+                        ((ogs_tlv_octet_t *)v)->data,
+                        ((ogs_tlv_octet_t *)u)->len) != 0)
+                    return false;
+                break;
+            case OGS_TLV_NULL:
+            case OGS_TV_NULL:
+                break;
+            case OGS_TLV_COMPOUND:
+                if (tlv_message_equal(desc,
+                        u + sizeof(ogs_tlv_presence_t),
+                        v + sizeof(ogs_tlv_presence_t)) == false)
+                    return false;
+                break;
+            default:
+                ogs_assert_if_reached();
+            }
+        }
+
+        a += desc->vsize * n;
+        b += desc->vsize * n;
+    }
+
+    return true;
+}
+
+/* Take the ogs_tlv_t nodes from a pool of 'pool' nodes from now on */
+static int tlv_message_pool(int pool)
+{
+    int size_of_pool = ogs_core()->tlv.pool;
+
+    ogs_tlv_final();
+    ogs_core()->tlv.pool = pool;
+    ogs_tlv_init();
+
+    return size_of_pool;
+}
+
+/*
+ * Build the message of 'desc' with every IE and parse it back, taking
+ * the ogs_tlv_t nodes from a pool of 'pool' nodes. OGS_OK if the parsed
+ * message is the one that was built.
+ */
+int test_tlv_message_build_parse(const ogs_tlv_desc_t *desc,
+        size_t size, uint8_t mode, int pool)
+{
+    uint8_t *msg = NULL, *parsed = NULL;
+    ogs_pkbuf_t *pkbuf = NULL;
+    int rv = OGS_ERROR, size_of_pool;
+
+    msg = ogs_calloc(1, size);
+    ogs_assert(msg);
+    parsed = ogs_calloc(1, size);
+    ogs_assert(parsed);
+
+    test_tlv_message_fill(desc, msg, &tlv_message_every);
+
+    size_of_pool = tlv_message_pool(pool);
+
+    pkbuf = ogs_tlv_build_msg(desc, msg, mode);
+    if (pkbuf) {
+        /* ogs_tlv_build_msg() byte-swaps the message, so it is set again */
+        test_tlv_message_fill(desc, msg, &tlv_message_every);
+
+        rv = ogs_tlv_parse_msg(parsed, desc, pkbuf, mode);
+        if (rv == OGS_OK && tlv_message_equal(desc, msg, parsed) == false)
+            rv = OGS_ERROR;
+        ogs_pkbuf_free(pkbuf);
+    }
+
+    tlv_message_pool(size_of_pool);
+
+    ogs_free(msg);
+    ogs_free(parsed);
+
+    return rv;
+}
+
+/*
+ * Whether building the message of 'desc' with every IE runs out of a pool
+ * of 'pool' nodes. The pool running dry is an assertion, so the message
+ * is built in a child process.
+ */
+bool test_tlv_message_build_exhausts(const ogs_tlv_desc_t *desc,
+        size_t size, uint8_t mode, int pool)
+{
+    uint8_t *msg = NULL;
+    pid_t pid;
+    int status, null;
+
+    pid = fork();
+    ogs_assert(pid >= 0);
+
+    if (pid == 0) {
+        /* Quiet the assertion of the child */
+        null = open("/dev/null", O_WRONLY);
+        if (null >= 0) {
+            dup2(null, STDOUT_FILENO);
+            dup2(null, STDERR_FILENO);
+        }
+
+        msg = ogs_calloc(1, size);
+        ogs_assert(msg);
+        test_tlv_message_fill(desc, msg, &tlv_message_every);
+
+        tlv_message_pool(pool);
+        _exit(ogs_tlv_build_msg(desc, msg, mode) ? 0 : 1);
+    }
+
+    ogs_assert(waitpid(pid, &status, 0) == pid);
+
+    return !WIFEXITED(status) || WEXITSTATUS(status) != 0;
+}
@@ -0,0 +1,51 @@
+/*
+ * Copyright (C) 2026 by Sukchan Lee <acetcom@gmail.com>
+ *
+ * This file is part of Open5GS.
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU Affero General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <https://www.gnu.org/licenses/>.
+ */
+
+
+#ifndef TEST_UNIT_TLV_MESSAGE_H
+#define TEST_UNIT_TLV_MESSAGE_H
+
+#include "ogs-core.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+typedef struct test_tlv_fill_s {
+    int one_in;     /* An IE is there one time in 'one_in', 1 for always */
+    int more;       /* At most 'more' of an IE that repeats, 0 for all */
+    int depth;      /* Levels of compound IEs, at most */
+    int octets;     /* Length of a variable octet string */
+    bool random;    /* Random values and lengths of 1 to 'octets', else 1 */
+} test_tlv_fill_t;
+
+uint32_t test_tlv_rand(void);
+int test_tlv_message_fill(const ogs_tlv_desc_t *desc, void *msg,
+        const test_tlv_fill_t *fill);
+
+int test_tlv_message_build_parse(const ogs_tlv_desc_t *desc,
+        size_t size, uint8_t mode, int pool);
+bool test_tlv_message_build_exhausts(const ogs_tlv_desc_t *desc,
+        size_t size, uint8_t mode, int pool);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif /* TEST_UNIT_TLV_MESSAGE_H */